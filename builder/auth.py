@@ -1,12 +1,24 @@
 import base64
 import json
+import os
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from loguru import logger
 
 from dy_apis.douyin_api import DouyinAPI
 from utils.dy_util import trans_cookies, generate_msToken
+from utils.http_util import HttpTransport, get_transport
+from utils.rate_util import RESPONSE_OK, RESPONSE_VERIFY
 
 
 class DouyinAuth:
-    def __init__(self):
+    def __init__(self, transport: HttpTransport = None):
+        # 接口请求走的连接池, 默认和其他账号共用一个, cookie 每次请求单独传入
+        self.transport = transport or get_transport()
         self.cookie = None
         self.cookie_str = None
         self.private_key = None
@@ -16,6 +28,9 @@ class DouyinAuth:
         self.ree_public_key = None
         self.uid = None
         self.msToken = None
+        # 从 AuthPool 租用时指向所属的账号池, 请求结果会回报给账号池
+        self.pool = None
+        self.name = None
 
     def perepare_auth(self, cookieStr: str, web_protect_: str = "", keys_: str = ""):
         self.cookie = trans_cookies(cookieStr)
@@ -38,3 +53,236 @@ class DouyinAuth:
         if self.uid is None:
             self.uid = DouyinAPI.get_my_uid(self)
         return self.uid
+
+
+class _Account:
+    def __init__(self, auth: DouyinAuth, history: int):
+        self.auth = auth
+        self.leases = 0
+        self.requests = deque()
+        self.outcomes = deque(maxlen=history)
+        self.total = 0
+        self.errors = 0
+        self.verifies = 0
+        self.cooldown_until = 0.0
+        self.retired_at = None
+
+    def rate(self, state: str) -> float:
+        if not self.outcomes:
+            return 0.0
+        return sum(1 for o in self.outcomes if o == state) / len(self.outcomes)
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return sum(1 for o in self.outcomes if o != RESPONSE_OK) / len(self.outcomes)
+
+
+class AuthPool:
+    """
+    多账号池: 从文件或目录加载多组 cookie, 每次请求租用一个账号.
+    每个账号在 window 秒内最多发 budget 次请求, 用完后冷却到窗口滑过; 出现验证码后冷却 verify_cooldown 秒;
+    最近 history 次请求的错误率或验证码比例过高时移出轮换, revive_after 秒后清空记录重新试用.
+    用法:
+        pool = AuthPool.from_path('cookies.txt')
+        with pool.lease() as auth:
+            work = DouyinAPI.get_work_info(auth, url)
+    """
+
+    def __init__(self, auths, budget: int = None, window: float = None, concurrency: int = 1,
+                 verify_cooldown: float = None, history: int = 50, min_samples: int = 10,
+                 max_error_rate: float = 0.5, max_verify_rate: float = 0.2, revive_after: float = None):
+        """
+        :param auths: DouyinAuth 列表.
+        :param budget: 每个账号在 window 秒内的请求数上限, 默认 DY_AUTH_BUDGET 或 600.
+        :param window: 统计请求数的时间窗口(秒), 默认 DY_AUTH_WINDOW 或 3600.
+        :param concurrency: 一个账号同时被租用的次数上限.
+        :param verify_cooldown: 出现验证码后的冷却时间(秒), 默认 DY_AUTH_VERIFY_COOLDOWN 或 600.
+        :param history: 计算错误率时看最近多少次请求.
+        :param min_samples: 至少有多少次请求才判断账号是否健康.
+        :param max_error_rate: 错误率(含验证码)超过该值时移出轮换.
+        :param max_verify_rate: 验证码比例超过该值时移出轮换.
+        :param revive_after: 移出轮换多少秒后重新试用, 默认 DY_AUTH_REVIVE 或 1800, 0 表示不再使用.
+        """
+        self.budget = budget or int(os.getenv('DY_AUTH_BUDGET', '600'))
+        self.window = window or float(os.getenv('DY_AUTH_WINDOW', '3600'))
+        self.concurrency = concurrency
+        self.verify_cooldown = verify_cooldown if verify_cooldown is not None else \
+            float(os.getenv('DY_AUTH_VERIFY_COOLDOWN', '600'))
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.max_verify_rate = max_verify_rate
+        self.revive_after = revive_after if revive_after is not None else float(os.getenv('DY_AUTH_REVIVE', '1800'))
+        self._accounts = {}
+        self._cond = threading.Condition()
+        for auth in auths:
+            auth.pool = self
+            self._accounts[id(auth)] = _Account(auth, history)
+        if not self._accounts:
+            raise ValueError('账号池为空')
+
+    @staticmethod
+    def read_cookies(path: str) -> list:
+        """
+        读取 cookie 文件或目录, 每行一组 cookie, 空行和 # 开头的行跳过; 目录下的文件按文件名顺序读取.
+        :param path: 文件或目录路径.
+        :return: [(名称, cookie 字符串)].
+        """
+        if os.path.isdir(path):
+            files = [os.path.join(path, name) for name in sorted(os.listdir(path)) if not name.startswith('.')]
+            files = [f for f in files if os.path.isfile(f)]
+        else:
+            files = [path]
+        cookies = []
+        for file in files:
+            with open(file, encoding='utf-8') as f:
+                for lineno, line in enumerate(f, 1):
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        cookies.append((f'{os.path.basename(file)}:{lineno}', line))
+        return cookies
+
+    @classmethod
+    def from_path(cls, path: str, **kwargs) -> 'AuthPool':
+        """
+        :param path: cookie 文件或目录, 格式见 read_cookies.
+        :param kwargs: 传给 AuthPool 的参数.
+        """
+        auths = []
+        for name, cookie_str in cls.read_cookies(path):
+            auth = DouyinAuth()
+            auth.perepare_auth(cookie_str, "", "")
+            auth.name = name
+            auths.append(auth)
+        logger.info(f'从 {path} 加载了 {len(auths)} 个账号')
+        return cls(auths, **kwargs)
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def _available(self, account: _Account, now: float) -> float:
+        # 返回 0 表示可以租用, 否则返回最早可用的时间, None 表示不会再可用
+        if account.retired_at is not None:
+            if not self.revive_after:
+                return None
+            revive_at = account.retired_at + self.revive_after
+            if now < revive_at:
+                return revive_at
+            account.retired_at = None
+            account.outcomes.clear()
+            logger.info(f'账号 {account.auth.name} 重新加入轮换')
+        while account.requests and account.requests[0] <= now - self.window:
+            account.requests.popleft()
+        ready = account.cooldown_until
+        if len(account.requests) >= self.budget:
+            ready = max(ready, account.requests[len(account.requests) - self.budget] + self.window)
+        if ready > now:
+            return ready
+        return 0 if account.leases < self.concurrency else None
+
+    def acquire(self, timeout: float = None) -> DouyinAuth:
+        """
+        租用一个账号, 优先选租用数和窗口内请求数最少的账号, 没有可用账号时等待.
+        :param timeout: 最长等待时间(秒), None 表示一直等.
+        :return: DouyinAuth, 用完后调用 release.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                best, wake = None, None
+                for account in self._accounts.values():
+                    ready = self._available(account, now)
+                    if ready == 0:
+                        if best is None or (account.leases, len(account.requests)) < \
+                                (best.leases, len(best.requests)):
+                            best = account
+                    elif ready is not None:
+                        wake = ready if wake is None else min(wake, ready)
+                if best is not None:
+                    best.leases += 1
+                    return best.auth
+                if wake is None and not any(a.leases for a in self._accounts.values()):
+                    raise RuntimeError('账号池里的账号都已移出轮换')
+                if deadline is not None:
+                    if now >= deadline:
+                        raise TimeoutError('账号池没有可用账号')
+                    wake = deadline if wake is None else min(wake, deadline)
+                self._cond.wait(None if wake is None else max(wake - now, 0.01))
+
+    def release(self, auth: DouyinAuth):
+        with self._cond:
+            self._accounts[id(auth)].leases -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self, timeout: float = None):
+        auth = self.acquire(timeout)
+        try:
+            yield auth
+        finally:
+            self.release(auth)
+
+    def report(self, auth: DouyinAuth, state: str):
+        """
+        记录一次请求结果, DouyinAPI 发送请求后自动调用.
+        :param auth: 发送请求的账号.
+        :param state: rate_util.classify_response 的结果.
+        """
+        with self._cond:
+            account = self._accounts.get(id(auth))
+            if account is None:
+                return
+            now = time.monotonic()
+            account.requests.append(now)
+            account.outcomes.append(state)
+            account.total += 1
+            if state == RESPONSE_VERIFY:
+                account.verifies += 1
+                account.cooldown_until = max(account.cooldown_until, now + self.verify_cooldown)
+                logger.warning(f'账号 {auth.name} 出现验证码, 冷却 {self.verify_cooldown:.0f} 秒')
+            elif state != RESPONSE_OK:
+                account.errors += 1
+            if account.retired_at is None and len(account.outcomes) >= self.min_samples and \
+                    (account.error_rate() > self.max_error_rate or
+                     account.rate(RESPONSE_VERIFY) > self.max_verify_rate):
+                account.retired_at = now
+                logger.warning(f'账号 {auth.name} 错误率 {account.error_rate():.0%}, '
+                               f'验证码比例 {account.rate(RESPONSE_VERIFY):.0%}, 移出轮换')
+            self._cond.notify()
+
+    def call(self, func, *args, timeout: float = None, **kwargs):
+        """
+        租用一个账号调用 func(auth, *args, **kwargs), 例如 pool.call(DouyinAPI.get_work_info, url).
+        """
+        with self.lease(timeout) as auth:
+            return func(auth, *args, **kwargs)
+
+    def map(self, func, items, workers: int = None) -> list:
+        """
+        并发处理 items, 每个元素租用一个账号调用 func(auth, item), 并发数默认为账号数乘以 concurrency.
+        :return: 和 items 顺序一致的结果列表.
+        """
+        workers = workers or len(self._accounts) * self.concurrency
+        with ThreadPoolExecutor(workers, thread_name_prefix='dy-auth') as executor:
+            return list(executor.map(lambda item: self.call(func, item), items))
+
+    def stats(self) -> dict:
+        """
+        :return: 每个账号的租用数、窗口内请求数、总请求数、错误数、验证码次数、最近错误率、冷却剩余秒数和是否在轮换中.
+        """
+        with self._cond:
+            now = time.monotonic()
+            return {
+                str(a.auth.name or account_id): {
+                    'leases': a.leases,
+                    'window_requests': sum(1 for t in a.requests if t > now - self.window),
+                    'total': a.total,
+                    'errors': a.errors,
+                    'verifies': a.verifies,
+                    'error_rate': round(a.error_rate(), 3),
+                    'cooldown': round(max(0.0, a.cooldown_until - now), 1),
+                    'active': a.retired_at is None,
+                }
+                for account_id, a in self._accounts.items()
+            }
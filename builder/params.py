@@ -1,10 +1,51 @@
+from urllib.parse import quote
+
 from builder.header import HeaderBuilder
 from utils.dy_util import generate_webid, generate_msToken, splice_url, generate_a_bogus, generate_fake_webid
 
 
+class ParamsTemplate:
+    """
+    接口参数模板, 值为 None 的是每次请求时填入的动态参数, 其余固定参数在创建时就编码好.
+    渲染时只编码动态参数, 拼接结果和 splice_url 一致.
+    """
+
+    def __init__(self, *items):
+        """
+        :param items: 按发送顺序排列的 (参数名, 值).
+        """
+        self.items = items
+        self.dynamic = tuple(key for key, value in items if value is None)
+        self.keys = frozenset(key for key, _ in items)
+        # segments[i] 是第 i 个动态参数前面的固定部分, 最后一段是结尾的固定部分
+        self.segments = []
+        pending = ''
+        for index, (key, value) in enumerate(items):
+            prefix = '&' if index else ''
+            if value is None:
+                self.segments.append(pending + prefix + key + '=')
+                pending = ''
+            else:
+                pending += prefix + key + '=' + quote(str(value))
+        self.segments.append(pending)
+
+    def render(self, values: dict) -> str:
+        parts = []
+        for segment, key in zip(self.segments, self.dynamic):
+            value = values.get(key)
+            parts.append(segment)
+            parts.append('' if value is None else quote(str(value)))
+        parts.append(self.segments[-1])
+        return ''.join(parts)
+
+
 class Params:
-    def __init__(self):
+    def __init__(self, template: ParamsTemplate = None):
+        """
+        :param template: 接口参数模板, 传入时只需要 add_param 动态参数, get 返回编码好的 query 字符串.
+        """
         self.params = {}
+        self.template = template
 
     def with_platform(self):
         params = {
@@ -47,7 +88,8 @@ class Params:
         return self
 
     def with_a_bogus(self, data=None):
-        query = splice_url(self.get())
+        # 用模板时签名的 query 和实际发送的完全一致
+        query = self.get() if self.template is not None else splice_url(self.get())
         if data is not None:
             data = splice_url(data)
         else:
@@ -66,7 +108,11 @@ class Params:
         return self
 
     def get(self):
-        return self.params
+        if self.template is None:
+            return self.params
+        query = self.template.render(self.params)
+        extra = {key: value for key, value in self.params.items() if key not in self.template.keys}
+        return query + '&' + splice_url(extra) if extra else query
 
     def sort(self):
         order = ['device_platform', 'aid', 'channel', 'publish_video_strategy_type', 'source', 'sec_user_id',
@@ -86,3 +132,39 @@ class Params:
     def toString(self):
         # 按url参数格式拼接参数
         return "&".join([f"{k}={v}" for k, v in self.params.items()])
+
+
+if __name__ == '__main__':
+    # python -m builder.params
+    # 对比逐个 add_param + splice_url + requests 编码 与 模板渲染 组装一次 query 的耗时, 不含签名
+    import timeit
+    from urllib.parse import urlencode
+    from builder.templates import GET_USER_WORK_INFO
+
+    dynamic = {'sec_user_id': 'MS4wLjABAAAAO3Xfv1Mfo1vkDmjWYVnKeVdvGSyvqTu9vbOCsvTvrc8', 'max_cursor': '1718000000000',
+               'need_time_list': '0', 'webid': '7380289843612304937', 'verifyFp': 'verify_lx9yj2hn_NuZMF3Kq',
+               'fp': 'verify_lx9yj2hn_NuZMF3Kq', 'msToken': generate_msToken()}
+
+    def build_dict():
+        params = Params()
+        for key, value in GET_USER_WORK_INFO.items:
+            params.add_param(key, dynamic[key] if value is None else value)
+        query = splice_url(params.get())
+        params.add_param('a_bogus', 'x')
+        return query, urlencode(params.get())
+
+    def build_template():
+        params = Params(GET_USER_WORK_INFO)
+        for key in GET_USER_WORK_INFO.dynamic:
+            params.add_param(key, dynamic[key])
+        query = params.get()
+        params.add_param('a_bogus', 'x')
+        return query, params.get()
+
+    assert build_dict()[0] == build_template()[0]
+    number = 20000
+    old = timeit.timeit(build_dict, number=number) / number * 1e6
+    new = timeit.timeit(build_template, number=number) / number * 1e6
+    print(f'add_param + splice_url + urlencode: {old:.1f} us/次')
+    print(f'ParamsTemplate:                     {new:.1f} us/次')
+    print(f'每次请求节省 {old - new:.1f} us ({(1 - new / old) * 100:.0f}%)')
@@ -0,0 +1,762 @@
+"""
+各接口的参数模板, 值为 None 的参数在请求时填入, 顺序即发送顺序.
+"""
+from builder.params import ParamsTemplate
+
+
+# DouyinAPI.get_user_work_info /aweme/v1/web/aweme/post/
+GET_USER_WORK_INFO = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("sec_user_id", None),
+    ("max_cursor", None),
+    ("locate_query", "false"),
+    ("show_live_replay_strategy", "1"),
+    ("need_time_list", None),
+    ("time_list_query", "0"),
+    ("whale_cut_token", ""),
+    ("cut_version", "1"),
+    ("count", "18"),
+    ("publish_video_strategy_type", "2"),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "290100"),
+    ("version_name", "29.1.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "100"),
+    ("webid", None),
+    ("verifyFp", None),
+    ("fp", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_work_info /aweme/v1/web/aweme/detail/
+GET_WORK_INFO = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("aweme_id", None),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "190500"),
+    ("version_name", "19.5.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "4.75"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "150"),
+    ("webid", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_work_out_comment /aweme/v1/web/comment/list/
+GET_WORK_OUT_COMMENT = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("aweme_id", None),
+    ("cursor", None),
+    ("count", "5"),
+    ("item_type", "0"),
+    ("whale_cut_token", ""),
+    ("cut_version", "1"),
+    ("rcFT", ""),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "0"),
+    ("webid", None),
+    ("verifyFp", None),
+    ("fp", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_work_inner_comment /aweme/v1/web/comment/list/reply/
+GET_WORK_INNER_COMMENT = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("item_id", None),
+    ("comment_id", None),
+    ("cut_version", "1"),
+    ("cursor", None),
+    ("count", None),
+    ("item_type", "0"),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "0"),
+    ("webid", None),
+    ("verifyFp", None),
+    ("fp", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_user_info /aweme/v1/web/user/profile/other/
+GET_USER_INFO = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("publish_video_strategy_type", "2"),
+    ("source", "channel_pc_web"),
+    ("sec_user_id", None),
+    ("personal_center_strategy", "1"),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "100"),
+    ("webid", None),
+    ("msToken", None),
+    ("verifyFp", None),
+    ("fp", None),
+)
+
+# DouyinAPI.search_general_work /aweme/v1/web/general/search/single/
+SEARCH_GENERAL_WORK = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("search_channel", "aweme_general"),
+    ("enable_history", "1"),
+    ("filter_selected", None),
+    ("keyword", None),
+    ("search_source", "tab_search"),
+    ("query_correct_type", "1"),
+    ("is_filter_search", "1"),
+    ("from_group_id", ""),
+    ("offset", None),
+    ("count", "25"),
+    ("need_filter_settings", None),
+    ("list_type", "single"),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "190600"),
+    ("version_name", "19.6.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "50"),
+    ("webid", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.search_user /aweme/v1/web/discover/search
+SEARCH_USER = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("search_channel", "aweme_user_web"),
+    ("search_filter_value", None),
+    ("keyword", None),
+    ("search_source", "switch_tab"),
+    ("query_correct_type", "1"),
+    ("is_filter_search", "1"),
+    ("offset", None),
+    ("count", None),
+    ("need_filter_settings", None),
+    ("list_type", "single"),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "150"),
+    ("webid", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.search_live /aweme/v1/web/live/search/
+SEARCH_LIVE = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("search_channel", "aweme_live"),
+    ("keyword", None),
+    ("search_source", "normal_search"),
+    ("query_correct_type", "1"),
+    ("is_filter_search", "0"),
+    ("from_group_id", ""),
+    ("offset", None),
+    ("count", None),
+    ("need_filter_settings", None),
+    ("list_type", "single"),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "50"),
+    ("webid", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_user_favorite /aweme/v1/web/aweme/favorite/
+GET_USER_FAVORITE = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("sec_user_id", "MS4wLjABAAAA99bTJ_GOw3odYmsXOe7i7xuEv0iQf2X_Kg_VUyVP0U8"),
+    ("max_cursor", None),
+    ("min_cursor", "0"),
+    ("whale_cut_token", ""),
+    ("cut_version", "1"),
+    ("count", None),
+    ("publish_video_strategy_type", "2"),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "100"),
+    ("webid", None),
+    ("verifyFp", None),
+    ("fp", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_my_uid /aweme/v1/web/query/user/
+GET_MY_UID = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("pc_client_type", "1"),
+    ("update_version_code", "170400"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "100"),
+    ("webid", None),
+    ("msToken", None),
+    ("verifyFp", None),
+    ("fp", None),
+)
+
+# DouyinAPI.get_live_production /live/promotions/page/
+GET_LIVE_PRODUCTION = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("room_id", None),
+    ("author_id", None),
+    ("offset", None),
+    ("limit", "20"),
+    ("pc_client_type", "1"),
+    ("version_code", "210800"),
+    ("version_name", "21.8.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "2560"),
+    ("screen_height", "1440"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "121.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "121.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "20"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "50"),
+    ("webid", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_live_production_detail /ecom/product/detail/saas/pc/
+GET_LIVE_PRODUCTION_DETAIL = ParamsTemplate(
+    ("is_h5", "1"),
+    ("origin_type", "638301"),
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("pc_client_type", "1"),
+    ("update_version_code", "170400"),
+    ("version_code", ""),
+    ("version_name", ""),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "1.7"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "200"),
+    ("webid", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.collect_aweme /aweme/v1/web/aweme/collect/
+COLLECT_AWEME = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("pc_client_type", "1"),
+    ("update_version_code", "170400"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "50"),
+    ("webid", None),
+    ("verifyFp", None),
+    ("fp", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.move_collect_aweme /aweme/v1/web/collects/video/move/
+MOVE_COLLECT_AWEME = ParamsTemplate(
+    ("aid", "6383"),
+    ("browser_language", "zh-CN"),
+    ("browser_name", "Edge"),
+    ("browser_online", "true"),
+    ("browser_platform", "Win32"),
+    ("browser_version", "125.0.0.0"),
+    ("channel", "channel_pc_web"),
+    ("collects_name", None),
+    ("cookie_enabled", "true"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("device_platform", "webapp"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("item_ids", None),
+    ("item_type", "2"),
+    ("move_collects_list", None),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("pc_client_type", "1"),
+    ("platform", "PC"),
+    ("round_trip_time", "50"),
+    ("screen_height", "960"),
+    ("screen_width", "1707"),
+    ("to_collects_id", None),
+    ("update_collects_sort", "true"),
+    ("update_version_code", "170400"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("webid", None),
+    ("verifyFp", None),
+    ("fp", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.remove_collect_aweme /aweme/v1/web/collects/video/move/
+REMOVE_COLLECT_AWEME = ParamsTemplate(
+    ("aid", "6383"),
+    ("browser_language", "zh-CN"),
+    ("browser_name", "Edge"),
+    ("browser_online", "true"),
+    ("browser_platform", "Win32"),
+    ("browser_version", "125.0.0.0"),
+    ("channel", "channel_pc_web"),
+    ("collects_name", None),
+    ("cookie_enabled", "true"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("device_platform", "webapp"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("from_collects_id", None),
+    ("item_ids", None),
+    ("item_type", "2"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("pc_client_type", "1"),
+    ("platform", "PC"),
+    ("round_trip_time", "50"),
+    ("screen_height", "960"),
+    ("screen_width", "1707"),
+    ("update_version_code", "170400"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("webid", None),
+    ("verifyFp", None),
+    ("fp", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_collect_list /aweme/v1/web/collects/list/
+GET_COLLECT_LIST = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("cursor", "0"),
+    ("count", "20"),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "5.95"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "200"),
+    ("webid", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_user_follower_list /aweme/v1/web/user/follower/list/
+GET_USER_FOLLOWER_LIST = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("user_id", None),
+    ("sec_user_id", None),
+    ("offset", "0"),
+    ("min_time", "0"),
+    ("max_time", None),
+    ("count", None),
+    ("source_type", None),
+    ("gps_access", "0"),
+    ("address_book_access", "0"),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "150"),
+    ("webid", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_user_following_list /aweme/v1/web/user/following/list/
+GET_USER_FOLLOWING_LIST = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("user_id", None),
+    ("sec_user_id", None),
+    ("offset", "0"),
+    ("min_time", "0"),
+    ("max_time", None),
+    ("count", None),
+    ("source_type", None),
+    ("gps_access", "0"),
+    ("address_book_access", "0"),
+    ("is_top", "1"),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "150"),
+    ("webid", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_notice_list /aweme/v1/web/notice/
+GET_NOTICE_LIST = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("is_new_notice", "1"),
+    ("is_mark_read", "1"),
+    ("notice_group", None),
+    ("count", None),
+    ("min_time", None),
+    ("max_time", None),
+    ("update_version_code", "170400"),
+    ("pc_client_type", "1"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "50"),
+    ("webid", None),
+    ("msToken", None),
+)
+
+# DouyinAPI.get_feed /aweme/v1/web/module/feed/
+GET_FEED = ParamsTemplate(
+    ("device_platform", "webapp"),
+    ("aid", "6383"),
+    ("channel", "channel_pc_web"),
+    ("module_id", "3003101"),
+    ("count", None),
+    ("filterGids", ""),
+    ("presented_ids", ""),
+    ("refresh_index", None),
+    ("refer_id", ""),
+    ("refer_type", "10"),
+    ('awemePcRecRawData', '{"is_client":false}'),
+    ("Seo-Flag", "0"),
+    ("install_time", "1715480185"),
+    ("pc_client_type", "1"),
+    ("update_version_code", "170400"),
+    ("version_code", "170400"),
+    ("version_name", "17.4.0"),
+    ("cookie_enabled", "true"),
+    ("screen_width", "1707"),
+    ("screen_height", "960"),
+    ("browser_language", "zh-CN"),
+    ("browser_platform", "Win32"),
+    ("browser_name", "Edge"),
+    ("browser_version", "125.0.0.0"),
+    ("browser_online", "true"),
+    ("engine_name", "Blink"),
+    ("engine_version", "125.0.0.0"),
+    ("os_name", "Windows"),
+    ("os_version", "10"),
+    ("cpu_core_num", "32"),
+    ("device_memory", "8"),
+    ("platform", "PC"),
+    ("downlink", "10"),
+    ("effective_type", "4g"),
+    ("round_trip_time", "100"),
+    ("webid", None),
+    ("msToken", None),
+)
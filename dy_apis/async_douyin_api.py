@@ -0,0 +1,326 @@
+import copy
+import json
+import time
+import asyncio
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+from requests.cookies import RequestsCookieJar
+from yarl import URL
+
+from dy_apis.douyin_api import DouyinAPI, ApiRequest, Page, coalesce_enabled, _cacheable, _flights
+from utils.cache_util import get_response_cache
+from utils.proxy_util import resolve_proxy
+from utils.rate_util import get_rate_limiter, endpoint_key, account_key, expects_json, classify_response, RESPONSE_OK
+
+
+class AsyncResponse:
+    """
+    读完的 aiohttp 响应, 提供接口方法解析时用到的 requests.Response 属性.
+    """
+
+    def __init__(self, status_code: int, headers, content: bytes, cookies: RequestsCookieJar, encoding: str = None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.cookies = cookies
+        self.encoding = encoding or 'utf-8'
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def _step(steps, value):
+    # 生成器走一步, StopIteration 不能穿过 run_in_executor, 这里转成返回值
+    try:
+        return False, steps.send(value)
+    except StopIteration as e:
+        return True, e.value
+
+
+class AsyncPageIterator:
+    """
+    PageIterator 的异步版本, async for 逐条迭代, 每次只请求下一页; 游标属性和断点提交方式和 PageIterator 一致.
+    """
+
+    def __init__(self, api, steps, proxies=None, checkpoint=None):
+        self._api = api
+        self._steps = steps
+        self._proxies = proxies
+        self._checkpoint = checkpoint
+        self._items = iter(())
+        self._done = checkpoint is not None and not checkpoint.has_more
+        self.page = None
+
+    @property
+    def cursor(self):
+        return None if self.page is None else self.page.cursor
+
+    @property
+    def next_cursor(self):
+        return None if self.page is None else self.page.next_cursor
+
+    @property
+    def has_more(self) -> bool:
+        return not self._done and (self.page is None or self.page.has_more)
+
+    async def next_page(self):
+        """
+        请求下一页.
+        :return: Page, 没有下一页时返回 None.
+        """
+        if self._done:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._checkpoint is not None and self.page is not None:
+            await loop.run_in_executor(self._api._executor, self._checkpoint.commit, self.page)
+        done, value = await loop.run_in_executor(self._api._executor, _step, self._steps, None)
+        while not done and not isinstance(value, Page):
+            response = await self._api.send(value, self._proxies)
+            done, value = await loop.run_in_executor(self._api._executor, _step, self._steps, response)
+        if done:
+            self._done = True
+            self._items = iter(())
+            if self._checkpoint is not None:
+                await loop.run_in_executor(self._api._executor, self._checkpoint.finish)
+            return None
+        self.page = value
+        self._items = iter(value.items)
+        return value
+
+    async def pages(self):
+        """
+        逐页迭代.
+        """
+        while True:
+            page = await self.next_page()
+            if page is None:
+                return
+            yield page
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            for item in self._items:
+                return item
+            if await self.next_page() is None:
+                raise StopAsyncIteration
+
+    def close(self):
+        self._done = True
+        self._steps.close()
+
+
+class AsyncDouyinAPI:
+    """
+    DouyinAPI 的 asyncio 版本, 方法和参数与 DouyinAPI 一一对应, 调用时 await 即可.
+    参数组装和签名复用 DouyinAPI 的接口生成器, 放在线程池里执行; 请求通过 aiohttp 连接池发送, 不阻塞事件循环.
+    用法:
+        async with AsyncDouyinAPI() as api:
+            work = await api.get_work_info(auth, url)
+    """
+
+    def __init__(self, limit: int = 500, limit_per_host: int = 100, timeout: float = 30, build_workers: int = 32):
+        """
+        :param limit: 连接池总连接数.
+        :param limit_per_host: 每个 host 的连接数.
+        :param timeout: 默认请求超时时间(秒).
+        :param build_workers: 组装参数和签名的线程数.
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(build_workers, thread_name_prefix='dy-build')
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            # cookie 每次请求单独传入, 响应里的 set-cookie 不写回会话
+            self._session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+        return self._session
+
+    async def send(self, request: ApiRequest, proxies=None) -> AsyncResponse:
+        """
+        发送一次请求, 参数按 requests 的习惯传入, 和同步版本共用限速器和代理池.
+        aiohttp 只支持 http 代理, 请求 https 地址时走代理的 CONNECT 隧道.
+        """
+        kwargs = dict(request.kwargs)
+        url = request.url
+        limiter = get_rate_limiter()
+        endpoint = endpoint_key(url)
+        account = account_key(request.auth)
+        await limiter.acquire_async(endpoint, account)
+        proxy, proxies = resolve_proxy(proxies, account)
+        params = kwargs.pop('params', None)
+        if params:
+            # 模板参数已经是编码好的字符串; 字典和 requests 一样用 urlencode 编码并跳过 None
+            if isinstance(params, str):
+                query = params
+            else:
+                query = urllib.parse.urlencode([(k, v) for k, v in params.items() if v is not None], doseq=True)
+            url += ('&' if '?' in url else '?') + query
+        headers = dict(kwargs.pop('headers', None) or {})
+        cookies = kwargs.pop('cookies', None)
+        if cookies:
+            headers['cookie'] = '; '.join(f'{k}={v}' for k, v in cookies.items())
+        verify = kwargs.pop('verify', False)
+        timeout = kwargs.pop('timeout', None) or self.timeout
+        if isinstance(timeout, tuple):
+            timeout = aiohttp.ClientTimeout(connect=timeout[0], sock_read=timeout[1])
+        else:
+            timeout = aiohttp.ClientTimeout(total=timeout)
+        start = time.monotonic()
+        try:
+            async with self._get_session().request(request.method, URL(url, encoded=True), headers=headers,
+                                                   ssl=None if verify else False, timeout=timeout,
+                                                   data=kwargs.pop('data', None),
+                                                   proxy=(proxies or {}).get('https')) as resp:
+                content = await resp.read()
+        except Exception:
+            if proxy is not None:
+                proxy.on_failure()
+            raise
+        state = classify_response(resp.status, resp.headers, content, expects_json(request.url))
+        limiter.feedback(endpoint, state == RESPONSE_OK)
+        if proxy is not None:
+            proxy.feedback(state, time.monotonic() - start)
+        if getattr(request.auth, 'pool', None) is not None:
+            request.auth.pool.report(request.auth, state)
+        jar = RequestsCookieJar()
+        for name, morsel in resp.cookies.items():
+            jar.set(name, morsel.value, domain=morsel['domain'], path=morsel['path'] or '/')
+        return AsyncResponse(resp.status, resp.headers, content, jar, resp.charset)
+
+    async def run(self, steps, proxies=None):
+        """
+        驱动 DouyinAPI 的接口生成器: 组装参数和解析在线程池里执行, 请求在事件循环里发送.
+        """
+        loop = asyncio.get_running_loop()
+        done, value = await loop.run_in_executor(self._executor, _step, steps, None)
+        while not done:
+            response = await self.send(value, proxies)
+            done, value = await loop.run_in_executor(self._executor, _step, steps, response)
+        return value
+
+    async def iter_work_all_comment(self, auth, url: str, workers: int = 8, proxies=None):
+        """
+        DouyinAPI.iter_work_all_comment 的异步版本, 最多 workers 条一级评论同时获取二级评论.
+        :return: 异步生成器, 逐条返回 (一级评论, 二级评论列表).
+        """
+        results = asyncio.Queue()
+        slots = asyncio.Semaphore(workers)
+        tasks = set()
+        done = object()
+
+        async def fetch_replies(comment):
+            try:
+                replies = [reply async for reply in self.iter_work_inner_comment(auth, comment, proxies=proxies)]
+                await results.put((comment, replies, None))
+            except Exception as e:
+                await results.put((comment, None, e))
+            finally:
+                slots.release()
+
+        async def produce():
+            count = 0
+            try:
+                async for comment in self.iter_work_out_comment(auth, url, proxies=proxies):
+                    if comment['reply_comment_total'] > 0:
+                        await slots.acquire()
+                        task = asyncio.create_task(fetch_replies(comment))
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                    else:
+                        await results.put((comment, [], None))
+                    count += 1
+            except Exception as e:
+                await results.put((None, None, e))
+            finally:
+                await results.put((done, count, None))
+
+        producer = asyncio.create_task(produce())
+        received, total = 0, None
+        try:
+            while total is None or received < total:
+                comment, replies, error = await results.get()
+                if error is not None:
+                    raise error
+                if comment is done:
+                    total = replies
+                    continue
+                received += 1
+                yield comment, replies
+        finally:
+            producer.cancel()
+            for task in list(tasks):
+                task.cancel()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+def _async_method(name):
+    sync_method = getattr(DouyinAPI, name)
+    steps = sync_method.steps
+
+    async def method(self, *args, proxies=None, use_cache=True, **kwargs):
+        loop = asyncio.get_running_loop()
+        cache = get_response_cache() if sync_method.cache_ttl > 0 else None
+        key = sync_method.key(*args, **kwargs) if sync_method.coalesce or cache is not None else None
+        if cache is not None and use_cache:
+            # 读写缓存会访问 SQLite, 放在线程池里执行
+            value = await loop.run_in_executor(self._executor, cache.get, key)
+            if value is not None:
+                return value
+        if sync_method.coalesce and coalesce_enabled():
+            # 和同步版本共用合并计数, 只合并同一个事件循环里的调用
+            value, shared = await _flights.do_async(key, lambda: self.run(steps(*args, **kwargs), proxies))
+            value = copy.deepcopy(value) if shared else value
+        else:
+            value = await self.run(steps(*args, **kwargs), proxies)
+        if cache is not None and _cacheable(value):
+            await loop.run_in_executor(self._executor, cache.set, key, value, sync_method.cache_ttl)
+        return value
+
+    method.__name__ = name
+    method.__qualname__ = f'AsyncDouyinAPI.{name}'
+    method.__doc__ = steps.__doc__
+    return method
+
+
+def _async_pager(name):
+    sync_method = getattr(DouyinAPI, name)
+    steps = sync_method.steps
+
+    def method(self, *args, proxies=None, checkpoint=None, **kwargs):
+        return AsyncPageIterator(self, sync_method.steps_from(checkpoint, *args, **kwargs), proxies, checkpoint)
+
+    method.__name__ = name
+    method.__qualname__ = f'AsyncDouyinAPI.{name}'
+    method.__doc__ = steps.__doc__
+    return method
+
+
+# 每个 DouyinAPI 接口都生成一个同名的 async 方法, iter_xxx 翻页接口返回 AsyncPageIterator
+for _name in list(vars(DouyinAPI)):
+    _method = getattr(DouyinAPI, _name)
+    if getattr(_method, 'pager', False):
+        setattr(AsyncDouyinAPI, _name, _async_pager(_name))
+    elif hasattr(_method, 'steps'):
+        setattr(AsyncDouyinAPI, _name, _async_method(_name))
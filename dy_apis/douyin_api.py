@@ -1,51 +1,403 @@
+import copy
+import inspect
 import json
+import functools
+import hashlib
+import os
+import queue
 import random
+import threading
 import re
 import time
 import urllib
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
-requests.packages.urllib3.disable_warnings()
 from bs4 import BeautifulSoup
 
 import static.Response_pb2 as ResponseProto
+from builder import templates
 from builder.header import HeaderBuilder, HeaderType
 from builder.params import Params
 from builder.proto import ProtoBuilder
-from utils.dy_util import splice_url, generate_a_bogus, generate_msToken, trans_cookies
+from utils.cache_util import SingleFlight, get_response_cache
+from utils.dy_util import splice_url, generate_a_bogus, generate_msToken, trans_cookies, check_csrf_response
+from utils.http_util import get_transport
+from utils.proxy_util import resolve_proxy
+from utils.sync_util import get_sync_state
+from utils.rate_util import get_rate_limiter, endpoint_key, account_key, expects_json, classify_response, RESPONSE_OK
 
 
+class ApiRequest:
+    """
+    接口方法 yield 出来的一次待发送请求, 参数和 requests.request 一致.
+    """
+
+    def __init__(self, auth, method: str, url: str, **kwargs):
+        self.auth = auth
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+
+
+class Page:
+    """
+    翻页接口生成器 yield 出来的一页数据.
+    """
+
+    def __init__(self, items: list, cursor, next_cursor, has_more: bool):
+        """
+        :param items: 这一页的条目.
+        :param cursor: 请求这一页用的游标.
+        :param next_cursor: 下一页的游标, 从这里继续可以接着上次往后翻.
+        :param has_more: 是否还有下一页.
+        """
+        self.items = items
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+        self.has_more = has_more
+
+
+def collect_pages(pages, num: int = None, checkpoint=None, until=None):
+    """
+    把翻页生成器的各页合并成一个列表, 请求原样交给外层发送.
+    :param pages: iter_xxx.steps_from(checkpoint, ...) 生成器.
+    :param num: 最多取多少条, 够了就不再请求下一页.
+    :param checkpoint: checkpoint_util.Checkpoint, 每取到一页就提交, 重启后先取回已提交的条目再接着翻.
+    :param until: 传入条目返回 True 时停止, 这一条及之后的条目不再返回, 也不再请求下一页.
+    :return: 条目列表.
+    """
+    items = checkpoint.items() if checkpoint is not None else []
+    if checkpoint is not None and (not checkpoint.has_more or num is not None and len(items) >= num):
+        pages.close()
+        return items if num is None else items[:num]
+    try:
+        value = next(pages)
+        while True:
+            if isinstance(value, Page):
+                if checkpoint is not None:
+                    checkpoint.commit(value)
+                for index, item in enumerate(value.items):
+                    if until is not None and until(item):
+                        pages.close()
+                        items.extend(value.items[:index])
+                        return items if num is None else items[:num]
+                items.extend(value.items)
+                if num is not None and len(items) >= num:
+                    pages.close()
+                    return items[:num]
+                value = next(pages)
+            else:
+                value = pages.send((yield value))
+    except StopIteration:
+        if checkpoint is not None:
+            checkpoint.finish()
+        return items
+
+
+class PageIterator:
+    """
+    iter_xxx 接口的返回值, 逐条迭代, 每次只请求下一页.
+    cursor 是当前这一页的游标, next_cursor 是下一页的游标, 中途停下后可以从 next_cursor 接着翻.
+    传入 checkpoint 时, 一页的条目全部取走后才提交这一页, 重启后从最后提交的一页之后继续.
+    """
+
+    def __init__(self, steps, proxies=None, checkpoint=None):
+        self._steps = steps
+        self._proxies = proxies
+        self._checkpoint = checkpoint
+        self._items = iter(())
+        self._done = checkpoint is not None and not checkpoint.has_more
+        self.page = None
+
+    @property
+    def cursor(self):
+        return None if self.page is None else self.page.cursor
+
+    @property
+    def next_cursor(self):
+        return None if self.page is None else self.page.next_cursor
+
+    @property
+    def has_more(self) -> bool:
+        return not self._done and (self.page is None or self.page.has_more)
+
+    def next_page(self):
+        """
+        请求下一页.
+        :return: Page, 没有下一页时返回 None.
+        """
+        if self._done:
+            return None
+        if self._checkpoint is not None and self.page is not None:
+            self._checkpoint.commit(self.page)
+        try:
+            value = next(self._steps)
+            while isinstance(value, ApiRequest):
+                response = DouyinAPI._send(value.auth, value.method, value.url, proxies=self._proxies, **value.kwargs)
+                value = self._steps.send(response)
+        except StopIteration:
+            self._done = True
+            self._items = iter(())
+            if self._checkpoint is not None:
+                self._checkpoint.finish()
+            return None
+        self.page = value
+        self._items = iter(value.items)
+        return value
+
+    def pages(self):
+        """
+        逐页迭代.
+        """
+        while True:
+            page = self.next_page()
+            if page is None:
+                return
+            yield page
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            for item in self._items:
+                return item
+            if self.next_page() is None:
+                raise StopIteration
+
+    def close(self):
+        self._done = True
+        self._steps.close()
+
+
+# 合并同时进行的相同接口调用, DY_COALESCE=0 时关闭
+_flights = SingleFlight()
+# 每次请求都会变的参数, 不参与合并 key
+VOLATILE_PARAMS = ('msToken', 'a_bogus', 'verifyFp', 'fp', 'webid')
+# 二级评论每页条数, 翻页时取接口接受的最大值以减少请求次数
+REPLY_PAGE_SIZE = os.getenv('DY_REPLY_PAGE_SIZE', '20')
+
+
+def coalesce_enabled() -> bool:
+    return os.getenv('DY_COALESCE', '1') != '0'
+
+
+def coalesce_stats() -> dict:
+    return _flights.stats()
+
+
+def _call_key(func, signature, args, kwargs, per_account=False):
+    # 接口名加上除 auth 以外的参数, 参数按名字归一化, 位置参数和关键字参数写法不同也能合并;
+    # 结果和账号有关的接口再加上账号的摘要, 不同账号不会拿到彼此的结果, 也不会把 sessionid 原样写进 key
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    items = list(bound.arguments.items())
+    arguments = dict(items[1:])
+    for name, param in signature.parameters.items():
+        if param.kind == inspect.Parameter.VAR_KEYWORD and name in arguments:
+            extra = {k: v for k, v in arguments.pop(name).items() if k not in VOLATILE_PARAMS}
+            arguments.update(extra)
+    key = func.__name__ + json.dumps(arguments, sort_keys=True, ensure_ascii=False, default=str)
+    if per_account:
+        account = account_key(items[0][1]) if items else None
+        key += '@' + hashlib.sha256(str(account).encode('utf-8')).hexdigest()[:16]
+    return key
+
+
+def pager(func=None, *, cursor=None):
+    """
+    翻页接口写成生成器: 请求时 yield ApiRequest, 拿到一页后 yield Page.
+    直接调用返回 PageIterator, 逐页请求; 生成器本身挂在 steps 上, 供 collect_pages 合并和 AsyncDouyinAPI 异步迭代.
+    cursor 是游标参数名, 游标由多个值组成时传参数名元组; steps_from(checkpoint, ...) 从断点的下一页开始.
+    调用时可以传入 checkpoint, 见 PageIterator.
+    """
+    if func is None:
+        return functools.partial(pager, cursor=cursor)
+
+    def steps_from(checkpoint, *args, **kwargs):
+        if checkpoint is not None and checkpoint.next_cursor is not None:
+            if isinstance(cursor, tuple):
+                kwargs.update(zip(cursor, checkpoint.next_cursor))
+            else:
+                kwargs[cursor] = checkpoint.next_cursor
+        return func(*args, **kwargs)
+
+    @functools.wraps(func)
+    def wrapper(*args, proxies=None, checkpoint=None, **kwargs):
+        return PageIterator(steps_from(checkpoint, *args, **kwargs), proxies, checkpoint)
+
+    wrapper.steps = func
+    wrapper.steps_from = steps_from
+    wrapper.pager = True
+    return wrapper
+
+
+def _cacheable(value) -> bool:
+    # 只缓存正常返回的结果
+    return isinstance(value, dict) and value.get('status_code', 0) == 0
+
+
+def endpoint(func=None, *, coalesce: bool = False, cache_ttl: float = 0, per_account: bool = False):
+    """
+    接口方法写成生成器: 组装好参数后 yield ApiRequest 拿到响应, 再 return 解析结果.
+    直接调用时在这里同步发送; 生成器本身挂在 steps 上, 供 AsyncDouyinAPI 在事件循环里发送,
+    翻页方法用 yield from DouyinAPI.xxx.steps(...) 调用单页接口.
+    调用时可以额外传入 proxies, 该次调用的所有请求都走指定的代理, 见 proxy_util.resolve_proxy.
+    coalesce=True 的接口参数相同的并发调用合并成一次请求, 等待方拿到结果的副本; 默认不区分账号,
+    结果带有调用账号的数据(cookie、观看者 ID、点赞关注状态等)时加 per_account=True, 只合并同一账号的调用.
+    cache_ttl 大于 0 的接口把结果写入 cache_util.get_response_cache, 有效期可用 DY_CACHE_TTL_<方法名大写> 覆盖,
+    缓存会落盘并被之后的进程读取, 带 cookie 等凭据的结果不要缓存;
+    调用时传入 use_cache=False 跳过读取缓存, 结果仍会写入.
+    """
+    if func is None:
+        return functools.partial(endpoint, coalesce=coalesce, cache_ttl=cache_ttl, per_account=per_account)
+    signature = inspect.signature(func)
+    cache_ttl = float(os.getenv(f'DY_CACHE_TTL_{func.__name__.upper()}', cache_ttl))
+
+    def run(args, kwargs, proxies):
+        steps = func(*args, **kwargs)
+        try:
+            request = next(steps)
+            while True:
+                response = DouyinAPI._send(request.auth, request.method, request.url, proxies=proxies,
+                                           **request.kwargs)
+                request = steps.send(response)
+        except StopIteration as e:
+            return e.value
+
+    @functools.wraps(func)
+    def wrapper(*args, proxies=None, use_cache=True, **kwargs):
+        cache = get_response_cache() if cache_ttl > 0 else None
+        key = wrapper.key(*args, **kwargs) if coalesce or cache is not None else None
+        if cache is not None and use_cache:
+            value = cache.get(key)
+            if value is not None:
+                return value
+        if coalesce and coalesce_enabled():
+            value, shared = _flights.do(key, lambda: run(args, kwargs, proxies))
+            value = copy.deepcopy(value) if shared else value
+        else:
+            value = run(args, kwargs, proxies)
+        if cache is not None and _cacheable(value):
+            cache.set(key, value, cache_ttl)
+        return value
+
+    wrapper.steps = func
+    wrapper.coalesce = coalesce
+    wrapper.cache_ttl = cache_ttl
+    wrapper.per_account = per_account
+    wrapper.key = lambda *args, **kwargs: _call_key(func, signature, args, kwargs, per_account)
+    return wrapper
+
 
 class DouyinAPI:
     douyin_url = 'https://www.douyin.com'
     live_url = 'https://live.douyin.com'
     creator = "https://creator.douyin.com"
 
+    @staticmethod
+    def _send(auth, method: str, url: str, proxies=None, **kwargs):
+        """
+        所有接口请求的出口, 复用 auth 持有的连接池, 按接口和账号限速, 并根据响应调整接口速率和账号池里的账号状态.
+        :param auth: DouyinAuth object.
+        :param method: 请求方法.
+        :param url: 请求地址.
+        :param proxies: 指定的代理, 为空时使用默认代理池里分配给该账号的代理.
+        :return: requests.Response.
+        """
+        transport = getattr(auth, 'transport', None) or get_transport()
+        limiter = get_rate_limiter()
+        endpoint = endpoint_key(url)
+        account = account_key(auth)
+        limiter.acquire(endpoint, account)
+        proxy, kwargs['proxies'] = resolve_proxy(proxies, account)
+        start = time.monotonic()
+        try:
+            response = transport.request(method, url, **kwargs)
+        except Exception:
+            if proxy is not None:
+                proxy.on_failure()
+            raise
+        state = classify_response(response.status_code, response.headers, response.content, expects_json(url))
+        limiter.feedback(endpoint, state == RESPONSE_OK)
+        if proxy is not None:
+            proxy.feedback(state, time.monotonic() - start)
+        if getattr(auth, 'pool', None) is not None:
+            auth.pool.report(auth, state)
+        return response
 
     @staticmethod
-    def get_user_all_work_info(auth, user_url: str, **kwargs) -> list:
+    @endpoint(coalesce=True)
+    def get_user_all_work_info(auth, user_url: str, checkpoint=None, **kwargs) -> list:
         """
         获取用户全部作品信息.
         :param auth: DouyinAuth object.
         :param user_url: 用户主页URL.
+        :param checkpoint: checkpoint_util.Checkpoint, 中断后用同一个断点重新调用会从最后提交的一页继续.
         :return: 全部作品信息.
         """
-        max_cursor = "0"
-        work_list = []
+        pages = DouyinAPI.iter_user_work_info.steps_from(checkpoint, auth, user_url)
+        return (yield from collect_pages(pages, checkpoint=checkpoint))
+
+    @staticmethod
+    @endpoint
+    def sync_user_work_info(auth, user_url: str, state=None, recent_days: float = None, record: bool = True,
+                            **kwargs) -> tuple:
+        """
+        增量获取用户作品: 从最新的作品往后翻, 遇到已经见过且早于最近 recent_days 天的作品就停止, 置顶作品不算.
+        最近 recent_days 天内的作品即使见过也会重新获取, 用来更新点赞评论等计数. 第一次同步时取全部作品.
+        :param auth: DouyinAuth object.
+        :param user_url: 用户主页URL.
+        :param state: sync_util.SyncState, 默认 get_sync_state().
+        :param recent_days: 重新获取的时间窗口(天), 默认 DY_SYNC_RECENT_DAYS 或 3.
+        :param record: 是否立即把取到的作品记入 state; 需要处理完再记录时传 False, 之后调用 state.record.
+        :return: (新作品列表, 重新获取的已知作品列表).
+        """
+        state = state or get_sync_state()
+        sec_uid = user_url.split("/")[-1].split("?")[0]
+        if recent_days is None:
+            recent_days = float(os.getenv('DY_SYNC_RECENT_DAYS', '3'))
+        cutoff = time.time() - recent_days * 86400
+        seen = state.seen(sec_uid)
+        last_create_time = state.last_create_time(sec_uid)
+
+        def reached_known(work):
+            if work.get('is_top') or work.get('create_time', 0) >= cutoff:
+                return False
+            return str(work['aweme_id']) in seen or \
+                last_create_time is not None and work.get('create_time', 0) <= last_create_time
+
+        works = yield from collect_pages(DouyinAPI.iter_user_work_info.steps(auth, user_url), until=reached_known)
+        if record:
+            state.record(sec_uid, works)
+        new_works = [w for w in works if str(w['aweme_id']) not in seen]
+        known_works = [w for w in works if str(w['aweme_id']) in seen]
+        return new_works, known_works
+
+    @staticmethod
+    @pager(cursor='max_cursor')
+    def iter_user_work_info(auth, user_url: str, max_cursor: str = '0'):
+        """
+        逐页获取用户作品.
+        :param auth: DouyinAuth object.
+        :param user_url: 用户主页URL.
+        :param max_cursor: 从哪个游标开始, 默认第一页.
+        :return: PageIterator, 逐条返回作品信息.
+        """
         while True:
-            res_json = DouyinAPI.get_user_work_info(auth, user_url, max_cursor)
+            res_json = yield from DouyinAPI.get_user_work_info.steps(auth, user_url, max_cursor)
             if "aweme_list" not in res_json.keys():
                 break
-            works = res_json["aweme_list"]
-            max_cursor = str(res_json["max_cursor"])
-            work_list.extend(works)
+            next_cursor = str(res_json["max_cursor"])
+            yield Page(res_json["aweme_list"], max_cursor, next_cursor, res_json["has_more"] == 1)
+            max_cursor = next_cursor
             if res_json["has_more"] != 1:
                 break
-        return work_list
 
 
     @staticmethod
+    @endpoint(coalesce=True)
     def get_user_work_info(auth, user_url: str, max_cursor, **kwargs) -> dict:
         """
         获取用户作品信息.
@@ -58,53 +410,22 @@ class DouyinAPI:
         user_id = user_url.split("/")[-1].split("?")[0]
         headers = HeaderBuilder().build(HeaderType.GET)
         headers.set_referer(user_url)
-        params = Params()
-        params.add_param("device_platform", 'webapp')
-        params.add_param("aid", '6383')
-        params.add_param("channel", 'channel_pc_web')
+        params = Params(templates.GET_USER_WORK_INFO)
         params.add_param("sec_user_id", user_id)
         params.add_param("max_cursor", max_cursor)
-        params.add_param("locate_query", 'false')
-        params.add_param("show_live_replay_strategy", '1')
         params.add_param("need_time_list", '1' if max_cursor == '0' else '0')
-        params.add_param("time_list_query", '0')
-        params.add_param("whale_cut_token", '')
-        params.add_param("cut_version", '1')
-        params.add_param("count", '18')
-        params.add_param("publish_video_strategy_type", '2')
-        params.add_param("update_version_code", '170400')
-        params.add_param("pc_client_type", '1')
-        params.add_param("version_code", '290100')
-        params.add_param("version_name", '29.1.0')
-        params.add_param("cookie_enabled", 'true')
-        params.add_param("screen_width", '1707')
-        params.add_param("screen_height", '960')
-        params.add_param("browser_language", 'zh-CN')
-        params.add_param("browser_platform", 'Win32')
-        params.add_param("browser_name", 'Edge')
-        params.add_param("browser_version", '125.0.0.0')
-        params.add_param("browser_online", 'true')
-        params.add_param("engine_name", 'Blink')
-        params.add_param("engine_version", '125.0.0.0')
-        params.add_param("os_name", 'Windows')
-        params.add_param("os_version", '10')
-        params.add_param("cpu_core_num", '32')
-        params.add_param("device_memory", '8')
-        params.add_param("platform", 'PC')
-        params.add_param("downlink", '10')
-        params.add_param("effective_type", '4g')
-        params.add_param("round_trip_time", '100')
         params.with_web_id(auth, user_url)
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
         params.add_param("msToken",
                          auth.msToken)
         params.with_a_bogus()
-        resp = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
-                            params=params.get(), verify=False)
+        resp = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
+                                params=params.get(), verify=False)
         return json.loads(resp.text)
 
     @staticmethod
+    @endpoint(coalesce=True, cache_ttl=21600, per_account=True)
     def get_work_info(auth, url: str) -> dict:
         """
         获取作品信息.
@@ -120,44 +441,20 @@ class DouyinAPI:
             url = f'https://www.douyin.com/video/{aweme_id}'
         headers = HeaderBuilder().build(HeaderType.GET)
         headers.set_referer(url)
-        params = Params()
-        params.add_param("device_platform", "webapp")
-        params.add_param("aid", "6383")
-        params.add_param("channel", "channel_pc_web")
+        params = Params(templates.GET_WORK_INFO)
         params.add_param("aweme_id", aweme_id)
-        params.add_param("update_version_code", "170400")
-        params.add_param("pc_client_type", "1")
-        params.add_param("version_code", "190500")
-        params.add_param("version_name", "19.5.0")
-        params.add_param("cookie_enabled", "true")
-        params.add_param("screen_width", "1707")
-        params.add_param("screen_height", "960")
-        params.add_param("browser_language", "zh-CN")
-        params.add_param("browser_platform", "Win32")
-        params.add_param("browser_name", "Edge")
-        params.add_param("browser_version", "125.0.0.0")
-        params.add_param("browser_online", "true")
-        params.add_param("engine_name", "Blink")
-        params.add_param("engine_version", "125.0.0.0")
-        params.add_param("os_name", "Windows")
-        params.add_param("os_version", "10")
-        params.add_param("cpu_core_num", "32")
-        params.add_param("device_memory", "8")
-        params.add_param("platform", "PC")
-        params.add_param("downlink", "4.75")
-        params.add_param("effective_type", "4g")
-        params.add_param("round_trip_time", "150")
         params.with_web_id(auth, url)
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
-        resp = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
-                            params=params.get(), verify=False)
+        resp = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
+                                params=params.get(), verify=False)
         resp_json = json.loads(resp.text)
         return resp_json
 
     @staticmethod
+    @endpoint(coalesce=True)
     def get_work_out_comment(auth, url: str, cursor: str = '0', **kwargs) -> dict:
         """
         获取作品的全部一级评论.
@@ -174,71 +471,55 @@ class DouyinAPI:
             url = f'https://www.douyin.com/video/{aweme_id}'
         headers = HeaderBuilder().build(HeaderType.GET)
         headers.set_referer(url)
-        params = Params()
-        params.add_param("device_platform", "webapp")
-        params.add_param("aid", "6383")
-        params.add_param("channel", "channel_pc_web")
+        params = Params(templates.GET_WORK_OUT_COMMENT)
         params.add_param("aweme_id", aweme_id)
         params.add_param("cursor", cursor)
-        params.add_param("count", "5")
-        params.add_param("item_type", "0")
-        params.add_param("whale_cut_token", "")
-        params.add_param("cut_version", "1")
-        params.add_param("rcFT", "")
-        params.add_param("update_version_code", "170400")
-        params.add_param("pc_client_type", "1")
-        params.add_param("version_code", "170400")
-        params.add_param("version_name", "17.4.0")
-        params.add_param("cookie_enabled", "true")
-        params.add_param("screen_width", "1707")
-        params.add_param("screen_height", "960")
-        params.add_param("browser_language", "zh-CN")
-        params.add_param("browser_platform", "Win32")
-        params.add_param("browser_name", "Edge")
-        params.add_param("browser_version", "125.0.0.0")
-        params.add_param("browser_online", "true")
-        params.add_param("engine_name", "Blink")
-        params.add_param("engine_version", "125.0.0.0")
-        params.add_param("os_name", "Windows")
-        params.add_param("os_version", "10")
-        params.add_param("cpu_core_num", "32")
-        params.add_param("device_memory", "8")
-        params.add_param("platform", "PC")
-        params.add_param("downlink", "10")
-        params.add_param("effective_type", "4g")
-        params.add_param("round_trip_time", "0")
         params.with_web_id(auth, url)
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
-        resp = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
-                            params=params.get(), verify=False)
+        resp = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
+                                params=params.get(), verify=False)
         resp_json = json.loads(resp.text)
         return resp_json
 
     @staticmethod
-    def get_work_all_out_comment(auth, url: str, **kwargs) -> list:
+    @endpoint(coalesce=True)
+    def get_work_all_out_comment(auth, url: str, checkpoint=None, **kwargs) -> list:
         """
         获取作品全部一级评论.
         :param auth: DouyinAuth object.
         :param url: 作品URL.
+        :param checkpoint: checkpoint_util.Checkpoint, 中断后用同一个断点重新调用会从最后提交的一页继续.
         :return:
         """
-        cursor = "0"
-        comment_list = []
+        pages = DouyinAPI.iter_work_out_comment.steps_from(checkpoint, auth, url)
+        return (yield from collect_pages(pages, checkpoint=checkpoint))
+
+    @staticmethod
+    @pager(cursor='cursor')
+    def iter_work_out_comment(auth, url: str, cursor: str = '0'):
+        """
+        逐页获取作品一级评论.
+        :param auth: DouyinAuth object.
+        :param url: 作品URL.
+        :param cursor: 从哪个游标开始, 默认第一页.
+        :return: PageIterator, 逐条返回一级评论.
+        """
         while True:
-            res_json = DouyinAPI.get_work_out_comment(auth, url, cursor)
+            res_json = yield from DouyinAPI.get_work_out_comment.steps(auth, url, cursor)
             comments = res_json["comments"]
-            cursor = str(res_json["cursor"])
             if comments is None or len(comments) == 0:
                 break
-            comment_list.extend(comments)
+            next_cursor = str(res_json["cursor"])
+            yield Page(comments, cursor, next_cursor, res_json["has_more"] == 1)
+            cursor = next_cursor
             if res_json["has_more"] != 1:
                 break
-        return comment_list
 
     @staticmethod
+    @endpoint(coalesce=True)
     def get_work_inner_comment(auth, comment: dict, cursor: str, count: str = '3', **kwargs):
         """
         获取作品评论的二级评论.
@@ -254,86 +535,142 @@ class DouyinAPI:
         headers = HeaderBuilder().build(HeaderType.GET)
         refer = f'https://www.douyin.com/video/{aweme_id}'
         headers.set_referer(refer)
-        params = Params()
-        params.add_param("device_platform", "webapp")
-        params.add_param("aid", "6383")
-        params.add_param("channel", "channel_pc_web")
+        params = Params(templates.GET_WORK_INNER_COMMENT)
         params.add_param("item_id", aweme_id)
         params.add_param("comment_id", comment_id)
-        params.add_param("cut_version", "1")
         params.add_param("cursor", cursor)
         params.add_param("count", count)
-        params.add_param("item_type", "0")
-        params.add_param("update_version_code", "170400")
-        params.add_param("pc_client_type", "1")
-        params.add_param("version_code", "170400")
-        params.add_param("version_name", "17.4.0")
-        params.add_param("cookie_enabled", "true")
-        params.add_param("screen_width", "1707")
-        params.add_param("screen_height", "960")
-        params.add_param("browser_language", "zh-CN")
-        params.add_param("browser_platform", "Win32")
-        params.add_param("browser_name", "Edge")
-        params.add_param("browser_version", "125.0.0.0")
-        params.add_param("browser_online", "true")
-        params.add_param("engine_name", "Blink")
-        params.add_param("engine_version", "125.0.0.0")
-        params.add_param("os_name", "Windows")
-        params.add_param("os_version", "10")
-        params.add_param("cpu_core_num", "32")
-        params.add_param("device_memory", "8")
-        params.add_param("platform", "PC")
-        params.add_param("downlink", "10")
-        params.add_param("effective_type", "4g")
-        params.add_param("round_trip_time", "0")
         params.with_web_id(auth, refer)
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
-        resp = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
-                            params=params.get(), verify=False)
+        resp = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
+                                params=params.get(), verify=False)
         resp_json = json.loads(resp.text)
         return resp_json
 
     @staticmethod
-    def get_work_all_inner_comment(auth, comment: dict, **kwargs) -> list:
+    @endpoint(coalesce=True)
+    def get_work_all_inner_comment(auth, comment: dict, checkpoint=None, **kwargs) -> list:
         """
         获取作品评论的全部二级评论.
         :param auth: DouyinAuth object.
         :param comment: 一级评论信息.
+        :param checkpoint: checkpoint_util.Checkpoint, 中断后用同一个断点重新调用会从最后提交的一页继续.
         :return: 二级评论列表.
         """
-        cursor = "0"
-        count = '5'
-        comment_list = []
+        pages = DouyinAPI.iter_work_inner_comment.steps_from(checkpoint, auth, comment)
+        return (yield from collect_pages(pages, checkpoint=checkpoint))
+
+    @staticmethod
+    @pager(cursor='cursor')
+    def iter_work_inner_comment(auth, comment: dict, cursor: str = '0', count: str = REPLY_PAGE_SIZE):
+        """
+        逐页获取作品评论的二级评论.
+        :param auth: DouyinAuth object.
+        :param comment: 一级评论信息.
+        :param cursor: 从哪个游标开始, 默认第一页.
+        :param count: 每页数量.
+        :return: PageIterator, 逐条返回二级评论.
+        """
         while True:
-            res_json = DouyinAPI.get_work_inner_comment(auth, comment, cursor, count)
+            res_json = yield from DouyinAPI.get_work_inner_comment.steps(auth, comment, cursor, count)
             comments = res_json["comments"]
-            cursor = str(res_json["cursor"])
-            if type(comments) is list and len(comments) > 0:
-                comment_list.extend(comments)
+            next_cursor = str(res_json["cursor"])
+            yield Page(comments if type(comments) is list else [], cursor, next_cursor, res_json["has_more"] == 1)
+            cursor = next_cursor
             if res_json["has_more"] != 1:
                 break
-        return comment_list
 
     @staticmethod
-    def get_work_all_comment(auth, url: str, **kwargs):
+    @endpoint(coalesce=True)
+    def get_work_all_comment(auth, url: str, checkpoint=None, **kwargs):
         """
-        获取作品全部评论.
+        获取作品全部评论, 逐条顺序请求二级评论; 评论多时用 iter_work_all_comment 并发获取.
         :param auth: DouyinAuth object.
         :param url: 作品URL.
+        :param checkpoint: checkpoint_util.Checkpoint, 记录一级评论翻到的页和已取完的二级评论, 重启后跳过已完成的部分.
         :return: 全部评论列表.
         """
-        out_comment_list = DouyinAPI.get_work_all_out_comment(auth, url)
+        out_comment_list = yield from DouyinAPI.get_work_all_out_comment.steps(auth, url, checkpoint=checkpoint)
         for comment in out_comment_list:
             comment['reply_comment'] = []
             if comment['reply_comment_total'] > 0:
-                inner_comment_list = DouyinAPI.get_work_all_inner_comment(auth, comment)
+                if checkpoint is not None and checkpoint.is_persisted(comment['cid']):
+                    inner_comment_list = checkpoint.persisted(comment['cid'])
+                else:
+                    inner_comment_list = yield from DouyinAPI.get_work_all_inner_comment.steps(auth, comment)
+                    if checkpoint is not None:
+                        checkpoint.persist(comment['cid'], inner_comment_list)
                 comment['reply_comment'] = inner_comment_list
         return out_comment_list
 
     @staticmethod
+    def iter_work_all_comment(auth, url: str, workers: int = 8, proxies=None):
+        """
+        并发获取作品全部评论: 一级评论边翻页边把二级评论分给线程池, 每条一级评论的二级评论由一个线程按顺序翻完,
+        哪条先取完先返回哪条, 返回顺序和一级评论顺序不一定一致. 中途停止迭代时不再提交新的任务.
+        :param auth: DouyinAuth object.
+        :param url: 作品URL.
+        :param workers: 同时获取二级评论的线程数, 也是排队等待的一级评论数上限.
+        :param proxies: 代理, 见 proxy_util.resolve_proxy.
+        :return: 生成器, 逐条返回 (一级评论, 二级评论列表).
+        """
+        results = queue.Queue()
+        slots = threading.Semaphore(workers)
+        stopped = threading.Event()
+        done = object()
+
+        def fetch_replies(comment):
+            try:
+                replies = list(DouyinAPI.iter_work_inner_comment(auth, comment, proxies=proxies))
+                results.put((comment, replies, None))
+            except Exception as e:
+                results.put((comment, None, e))
+            finally:
+                slots.release()
+
+        def produce():
+            count = 0
+            try:
+                for comment in DouyinAPI.iter_work_out_comment(auth, url, proxies=proxies):
+                    if comment['reply_comment_total'] > 0:
+                        # 线程池满时暂停翻页, 排队的一级评论数不超过 workers
+                        while not slots.acquire(timeout=0.5):
+                            if stopped.is_set():
+                                return
+                        if stopped.is_set():
+                            return
+                        executor.submit(fetch_replies, comment)
+                    else:
+                        results.put((comment, [], None))
+                    count += 1
+            except Exception as e:
+                results.put((None, None, e))
+            finally:
+                results.put((done, count, None))
+
+        executor = ThreadPoolExecutor(workers, thread_name_prefix='dy-reply')
+        producer = threading.Thread(target=produce, name='dy-comment-pages', daemon=True)
+        producer.start()
+        received, total = 0, None
+        try:
+            while total is None or received < total:
+                comment, replies, error = results.get()
+                if error is not None:
+                    raise error
+                if comment is done:
+                    total = replies
+                    continue
+                received += 1
+                yield comment, replies
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    @endpoint(coalesce=True, cache_ttl=21600, per_account=True)
     def get_user_info(auth, user_url: str, **kwargs) -> dict:
         """
         获取用户信息.
@@ -345,46 +682,19 @@ class DouyinAPI:
         user_id = user_url.split("/")[-1].split("?")[0]
         headers = HeaderBuilder().build(HeaderType.GET)
         headers.set_referer(user_url)
-        params = Params()
-        params.add_param("device_platform", 'webapp')
-        params.add_param("aid", '6383')
-        params.add_param("channel", 'channel_pc_web')
-        params.add_param("publish_video_strategy_type", '2')
-        params.add_param("source", 'channel_pc_web')
+        params = Params(templates.GET_USER_INFO)
         params.add_param("sec_user_id", user_id)
-        params.add_param("personal_center_strategy", '1')
-        params.add_param("update_version_code", '170400')
-        params.add_param("pc_client_type", '1')
-        params.add_param("version_code", '170400')
-        params.add_param("version_name", '17.4.0')
-        params.add_param("cookie_enabled", 'true')
-        params.add_param("screen_width", '1707')
-        params.add_param("screen_height", '960')
-        params.add_param("browser_language", 'zh-CN')
-        params.add_param("browser_platform", 'Win32')
-        params.add_param("browser_name", 'Edge')
-        params.add_param("browser_version", '125.0.0.0')
-        params.add_param("browser_online", 'true')
-        params.add_param("engine_name", 'Blink')
-        params.add_param("engine_version", '125.0.0.0')
-        params.add_param("os_name", 'Windows')
-        params.add_param("os_version", '10')
-        params.add_param("cpu_core_num", '32')
-        params.add_param("device_memory", '8')
-        params.add_param("platform", 'PC')
-        params.add_param("downlink", '10')
-        params.add_param("effective_type", '4g')
-        params.add_param("round_trip_time", '100')
         params.with_web_id(auth, user_url)
         params.add_param("msToken", auth.msToken)
         params.add_param('verifyFp', auth.cookie['s_v_web_id'])
         params.add_param('fp', auth.cookie['s_v_web_id'])
         params.with_a_bogus()
-        resp = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
-                            params=params.get(), verify=False)
+        resp = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
+                                params=params.get(), verify=False)
         return json.loads(resp.text)
 
     @staticmethod
+    @endpoint(coalesce=True)
     def search_general_work(auth, query: str, sort_type: str = '0', publish_time: str = '0', offset: str = '0',
                             filter_duration="", search_range="", content_type="", **kwargs):
         """
@@ -403,56 +713,24 @@ class DouyinAPI:
         headers = HeaderBuilder().build(HeaderType.GET)
         refer = f'https://www.douyin.com/search/{urllib.parse.quote(query)}?aid={uuid.uuid4()}&type=general'
         headers.set_referer(refer)
-        params = Params()
-        params.add_param("device_platform", "webapp")
-        params.add_param("aid", "6383")
-        params.add_param("channel", "channel_pc_web")
-        params.add_param("search_channel", "aweme_general")
-        params.add_param("enable_history", "1")
+        params = Params(templates.SEARCH_GENERAL_WORK)
         params.add_param("filter_selected", r'{"sort_type":"%s","publish_time":"%s","filter_duration":"%s",'
                                             r'"search_range":"%s","content_type":"%s"}' % (sort_type, publish_time,
                                                                                            filter_duration,
                                                                                            search_range, content_type))
         params.add_param("keyword", query)
-        params.add_param("search_source", "tab_search")
-        params.add_param("query_correct_type", "1")
-        params.add_param("is_filter_search", "1")
-        params.add_param("from_group_id", "")
         params.add_param("offset", offset)
-        params.add_param("count", '25')
         params.add_param("need_filter_settings", '1' if offset == '0' else '0')
-        params.add_param("list_type", "single")
-        params.add_param("update_version_code", "170400")
-        params.add_param("pc_client_type", "1")
-        params.add_param("version_code", "190600")
-        params.add_param("version_name", "19.6.0")
-        params.add_param("cookie_enabled", "true")
-        params.add_param("screen_width", "1707")
-        params.add_param("screen_height", "960")
-        params.add_param("browser_language", "zh-CN")
-        params.add_param("browser_platform", "Win32")
-        params.add_param("browser_name", "Edge")
-        params.add_param("browser_version", "125.0.0.0")
-        params.add_param("browser_online", "true")
-        params.add_param("engine_name", "Blink")
-        params.add_param("engine_version", "125.0.0.0")
-        params.add_param("os_name", "Windows")
-        params.add_param("os_version", "10")
-        params.add_param("cpu_core_num", "32")
-        params.add_param("device_memory", "8")
-        params.add_param("platform", "PC")
-        params.add_param("downlink", "10")
-        params.add_param("effective_type", "4g")
-        params.add_param("round_trip_time", "50")
         params.with_web_id(auth, refer)
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
-        resp = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
-                            params=params.get(), verify=False)
+        resp = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
+                                params=params.get(), verify=False)
         return json.loads(resp.text)
 
     @staticmethod
-    def search_some_general_work(auth, query: str, num: int, sort_type: str, publish_time: str, filter_duration="", search_range="", content_type="", **kwargs) -> list:
+    @endpoint(coalesce=True)
+    def search_some_general_work(auth, query: str, num: int, sort_type: str, publish_time: str, filter_duration="", search_range="", content_type="", checkpoint=None, **kwargs) -> list:
         """
         搜索指定数量综合频道作品.
         :param auth: DouyinAuth object.
@@ -463,47 +741,68 @@ class DouyinAPI:
         :param filter_duration: 视频时长 空字符串 不限, 0-1 一分钟内, 1-5 1-5分钟内, 5-10000 5分钟以上
         :param search_range: 搜索范围 0 不限, 1 最近看过, 2 还未看过, 3 关注的人
         :param content_type: 内容形式 0 不限, 1 视频, 2 图文
+        :param checkpoint: checkpoint_util.Checkpoint, 中断后用同一个断点重新调用会从最后提交的一页继续.
         :return: 作品列表.
         """
-        offset = "0"
-        work_list = []
+        pages = DouyinAPI.iter_search_general_work.steps_from(checkpoint, auth, query, sort_type, publish_time,
+                                                              filter_duration, search_range, content_type)
+        return (yield from collect_pages(pages, num, checkpoint=checkpoint))
+
+    @staticmethod
+    @pager(cursor='offset')
+    def iter_search_general_work(auth, query: str, sort_type: str = '0', publish_time: str = '0', filter_duration="",
+                                 search_range="", content_type="", offset: str = '0'):
+        """
+        逐页搜索综合频道作品, 参数见 search_some_general_work.
+        :param offset: 从哪个偏移量开始, 默认第一页.
+        :return: PageIterator, 逐条返回搜索结果.
+        """
         while True:
-            res_json = DouyinAPI.search_general_work(auth, query, sort_type, publish_time, offset,
-                                                     filter_duration, search_range, content_type)
+            res_json = yield from DouyinAPI.search_general_work.steps(auth, query, sort_type, publish_time, offset,
+                                                                      filter_duration, search_range, content_type)
             works = res_json["data"]
-            work_list.extend(works)
-            if res_json["has_more"] != 1 or len(work_list) >= num:
+            next_offset = str(int(offset) + len(works))
+            yield Page(works, offset, next_offset, res_json["has_more"] == 1)
+            offset = next_offset
+            if res_json["has_more"] != 1:
                 break
-            offset = str(int(offset) + len(works))
-        if len(work_list) > num:
-            work_list = work_list[:num]
-        return work_list
 
     @staticmethod
-    def search_some_user(auth, query: str, num: int, **kwargs) -> list:
+    @endpoint(coalesce=True)
+    def search_some_user(auth, query: str, num: int, checkpoint=None, **kwargs) -> list:
         """
         搜索指定数量用户.
         :param auth: DouyinAuth object.
         :param query: 搜索关键字.
         :param num: 搜索结果数量.
+        :param checkpoint: checkpoint_util.Checkpoint, 中断后用同一个断点重新调用会从最后提交的一页继续.
         :return: 用户列表.
         """
-        offset = "0"
-        count = "25"
-        user_list = []
+        pages = DouyinAPI.iter_search_user.steps_from(checkpoint, auth, query)
+        return (yield from collect_pages(pages, num, checkpoint=checkpoint))
+
+    @staticmethod
+    @pager(cursor='offset')
+    def iter_search_user(auth, query: str, offset: str = '0', count: str = '25'):
+        """
+        逐页搜索用户.
+        :param auth: DouyinAuth object.
+        :param query: 搜索关键字.
+        :param offset: 从哪个偏移量开始, 默认第一页.
+        :param count: 每页数量.
+        :return: PageIterator, 逐条返回用户.
+        """
         while True:
-            res_json = DouyinAPI.search_user(auth, query, offset, count)
-            users = res_json["user_list"]
-            user_list.extend(users)
-            if res_json["has_more"] != 1 or len(user_list) >= num:
+            res_json = yield from DouyinAPI.search_user.steps(auth, query, offset, count)
+            next_offset = str(int(offset) + int(count))
+            yield Page(res_json["user_list"], offset, next_offset, res_json["has_more"] == 1)
+            offset = next_offset
+            if res_json["has_more"] != 1:
                 break
-            offset = str(int(offset) + int(count))
-        if len(user_list) > num:
-            user_list = user_list[:num]
-        return user_list
 
 
     @staticmethod
+    @endpoint(coalesce=True)
     def search_user(auth, query: str, offset: str = '0', num: str = '25', douyin_user_fans="", douyin_user_type="", **kwargs):
         """
         搜索用户.
@@ -519,52 +818,23 @@ class DouyinAPI:
         headers = HeaderBuilder().build(HeaderType.GET)
         refer = f'https://www.douyin.com/search/{urllib.parse.quote(query)}?aid={uuid.uuid4()}&type=general'
         headers.set_referer(refer)
-        params = Params()
-        params.add_param("device_platform", 'webapp')
-        params.add_param("aid", '6383')
-        params.add_param("channel", 'channel_pc_web')
-        params.add_param("search_channel", 'aweme_user_web')
+        params = Params(templates.SEARCH_USER)
         params.add_param("search_filter_value", r'{"douyin_user_fans":["%s"],"douyin_user_type":["%s"]}' % (
             douyin_user_fans, douyin_user_type))
         params.add_param("keyword", query)
-        params.add_param("search_source", 'switch_tab')
-        params.add_param("query_correct_type", '1')
-        params.add_param("is_filter_search", '1')
         # params.add_param("from_group_id", '7378456704385600820')
         params.add_param("offset", offset)
         params.add_param("count", num)
         params.add_param("need_filter_settings", '1' if offset == '0' else '0')
-        params.add_param("list_type", 'single')
-        params.add_param("update_version_code", '170400')
-        params.add_param("pc_client_type", '1')
-        params.add_param("version_code", '170400')
-        params.add_param("version_name", '17.4.0')
-        params.add_param("cookie_enabled", 'true')
-        params.add_param("screen_width", '1707')
-        params.add_param("screen_height", '960')
-        params.add_param("browser_language", 'zh-CN')
-        params.add_param("browser_platform", 'Win32')
-        params.add_param("browser_name", 'Edge')
-        params.add_param("browser_version", '125.0.0.0')
-        params.add_param("browser_online", 'true')
-        params.add_param("engine_name", 'Blink')
-        params.add_param("engine_version", '125.0.0.0')
-        params.add_param("os_name", 'Windows')
-        params.add_param("os_version", '10')
-        params.add_param("cpu_core_num", '32')
-        params.add_param("device_memory", '8')
-        params.add_param("platform", 'PC')
-        params.add_param("downlink", '10')
-        params.add_param("effective_type", '4g')
-        params.add_param("round_trip_time", '150')
         params.with_web_id(auth, refer)
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
-        resp = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
-                            params=params.get(), verify=False)
+        resp = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
+                                params=params.get(), verify=False)
         return resp.json()
 
     @staticmethod
+    @endpoint(coalesce=True)
     def search_live(auth, query: str, offset: str = '0', num: str = '25', **kwargs):
         """
         搜索直播.
@@ -578,73 +848,53 @@ class DouyinAPI:
         headers = HeaderBuilder().build(HeaderType.GET)
         refer = f'https://www.douyin.com/search/{urllib.parse.quote(query)}?aid={uuid.uuid4()}&type=live'
         headers.set_referer(refer)
-        params = Params()
-        params.add_param("device_platform", 'webapp')
-        params.add_param("aid", '6383')
-        params.add_param("channel", 'channel_pc_web')
-        params.add_param("search_channel", 'aweme_live')
+        params = Params(templates.SEARCH_LIVE)
         params.add_param("keyword", query)
-        params.add_param("search_source", 'normal_search')
-        params.add_param("query_correct_type", '1')
-        params.add_param("is_filter_search", '0')
-        params.add_param("from_group_id", '')
         params.add_param("offset", offset)
         params.add_param("count", num)
         params.add_param("need_filter_settings", '1' if offset == '0' else '0')
-        params.add_param("list_type", 'single')
-        params.add_param("update_version_code", '170400')
-        params.add_param("pc_client_type", '1')
-        params.add_param("version_code", '170400')
-        params.add_param("version_name", '17.4.0')
-        params.add_param("cookie_enabled", 'true')
-        params.add_param("screen_width", '1707')
-        params.add_param("screen_height", '960')
-        params.add_param("browser_language", 'zh-CN')
-        params.add_param("browser_platform", 'Win32')
-        params.add_param("browser_name", 'Edge')
-        params.add_param("browser_version", '125.0.0.0')
-        params.add_param("browser_online", 'true')
-        params.add_param("engine_name", 'Blink')
-        params.add_param("engine_version", '125.0.0.0')
-        params.add_param("os_name", 'Windows')
-        params.add_param("os_version", '10')
-        params.add_param("cpu_core_num", '32')
-        params.add_param("device_memory", '8')
-        params.add_param("platform", 'PC')
-        params.add_param("downlink", '10')
-        params.add_param("effective_type", '4g')
-        params.add_param("round_trip_time", '50')
         params.with_web_id(auth, refer)
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
-        resp = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
-                            params=params.get(), verify=False)
+        resp = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), cookies=auth.cookie,
+                                params=params.get(), verify=False)
         return resp.json()
 
     @staticmethod
-    def search_some_live(auth, query: str, num: int, **kwargs) -> list:
+    @endpoint(coalesce=True)
+    def search_some_live(auth, query: str, num: int, checkpoint=None, **kwargs) -> list:
         """
         搜索指定数量直播.
         :param auth: DouyinAuth object.
         :param query:  搜索关键字.
         :param num:  搜索数量.
+        :param checkpoint: checkpoint_util.Checkpoint, 中断后用同一个断点重新调用会从最后提交的一页继续.
         :return: 直播列表.
         """
-        offset = "0"
-        count = "25"
-        live_list = []
+        pages = DouyinAPI.iter_search_live.steps_from(checkpoint, auth, query)
+        return (yield from collect_pages(pages, num, checkpoint=checkpoint))
+
+    @staticmethod
+    @pager(cursor='offset')
+    def iter_search_live(auth, query: str, offset: str = '0', count: str = '25'):
+        """
+        逐页搜索直播.
+        :param auth: DouyinAuth object.
+        :param query: 搜索关键字.
+        :param offset: 从哪个偏移量开始, 默认第一页.
+        :param count: 每页数量.
+        :return: PageIterator, 逐条返回直播.
+        """
         while True:
-            res_json = DouyinAPI.search_live(auth, query, offset, count)
-            lives = res_json["data"]
-            live_list.extend(lives)
-            if res_json["has_more"] != 1 or len(live_list) >= num:
+            res_json = yield from DouyinAPI.search_live.steps(auth, query, offset, count)
+            next_offset = str(int(offset) + int(count))
+            yield Page(res_json["data"], offset, next_offset, res_json["has_more"] == 1)
+            offset = next_offset
+            if res_json["has_more"] != 1:
                 break
-            offset = str(int(offset) + int(count))
-        if len(live_list) > num:
-            live_list = live_list[:num]
-        return live_list
 
     @staticmethod
+    @endpoint(coalesce=True)
     def get_user_favorite(auth, sec_id: str, max_cursor: str = '0', num: str = '18', **kwargs):
         """
         获取用户收藏.
@@ -657,52 +907,22 @@ class DouyinAPI:
         headers = HeaderBuilder.build(HeaderType.GET)
         refer = f"https://www.douyin.com/user/{sec_id}?showTab=like"
         headers.set_referer(refer)
-        params = Params()
-        params.add_param("device_platform", 'webapp')
-        params.add_param("aid", '6383')
-        params.add_param("channel", 'channel_pc_web')
-        params.add_param("sec_user_id", 'MS4wLjABAAAA99bTJ_GOw3odYmsXOe7i7xuEv0iQf2X_Kg_VUyVP0U8')
+        params = Params(templates.GET_USER_FAVORITE)
         params.add_param("max_cursor", max_cursor)
-        params.add_param("min_cursor", '0')
-        params.add_param("whale_cut_token", '')
-        params.add_param("cut_version", '1')
         params.add_param("count", num)
-        params.add_param("publish_video_strategy_type", '2')
-        params.add_param("update_version_code", '170400')
-        params.add_param("pc_client_type", '1')
-        params.add_param("version_code", '170400')
-        params.add_param("version_name", '17.4.0')
-        params.add_param("cookie_enabled", 'true')
-        params.add_param("screen_width", '1707')
-        params.add_param("screen_height", '960')
-        params.add_param("browser_language", 'zh-CN')
-        params.add_param("browser_platform", 'Win32')
-        params.add_param("browser_name", 'Edge')
-        params.add_param("browser_version", '125.0.0.0')
-        params.add_param("browser_online", 'true')
-        params.add_param("engine_name", 'Blink')
-        params.add_param("engine_version", '125.0.0.0')
-        params.add_param("os_name", 'Windows')
-        params.add_param("os_version", '10')
-        params.add_param("cpu_core_num", '32')
-        params.add_param("device_memory", '8')
-        params.add_param("platform", 'PC')
-        params.add_param("downlink", '10')
-        params.add_param("effective_type", '4g')
-        params.add_param("round_trip_time", '100')
         params.with_web_id(auth=auth, url=refer)
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
         params.add_param("msToken",
                          auth.msToken)
         params.with_a_bogus()
-        response = requests.get('https://www.douyin.com/aweme/v1/web/aweme/favorite/', params=params.get(),
-                                headers=headers.get(), cookies=auth.cookie,
-                                verify=False)
+        response = yield ApiRequest(auth, 'GET', 'https://www.douyin.com/aweme/v1/web/aweme/favorite/',
+                                    params=params.get(), headers=headers.get(), cookies=auth.cookie, verify=False)
         return response.json()
 
 
     @staticmethod
+    @endpoint
     def get_my_uid(auth, **kwargs) -> int:
         """
         获取自己的用户ID.
@@ -713,18 +933,19 @@ class DouyinAPI:
         headers = HeaderBuilder().build(HeaderType.GET)
         refer = 'https://www.douyin.com/'
         headers.set_header('referer', refer)
-        params = Params()
-        params.with_platform()
+        params = Params(templates.GET_MY_UID)
         params.with_web_id(auth, refer)
         params.with_ms_token()
         params.add_param('verifyFp', auth.cookie['s_v_web_id'])
         params.add_param('fp', auth.cookie['s_v_web_id'])
         params.with_a_bogus()
-        resp = requests.get(url, params=params.get(), verify=False, headers=headers.get(), cookies=auth.cookie)
+        resp = yield ApiRequest(auth, 'GET', url, params=params.get(), verify=False, headers=headers.get(),
+                                cookies=auth.cookie)
         resp_json = json.loads(resp.text)
         return int(resp_json['user_uid'])
 
     @staticmethod
+    @endpoint
     def get_my_sec_uid(auth, **kwargs) -> str:
         """
         获取自己的SECID.
@@ -736,12 +957,13 @@ class DouyinAPI:
         params = {
             "from_tab_name": "main"
         }
-        response = requests.get(url, headers=headers.get(), cookies=auth.cookie, params=params)
+        response = yield ApiRequest(auth, 'GET', url, headers=headers.get(), cookies=auth.cookie, params=params)
         sec_uid = re.findall(r'\\"secUid\\":\\"(.*?)\\"', response.text)[0]
         return sec_uid
 
 
     @staticmethod
+    @endpoint(coalesce=True, per_account=True)
     def get_live_info(auth_, live_id, **kwargs):
         """
         获取直播间信息.
@@ -750,7 +972,7 @@ class DouyinAPI:
         """
         url = "https://live.douyin.com/" + live_id
         headers = HeaderBuilder().build(HeaderType.GET)
-        res = requests.get(url, headers=headers.get(), cookies=auth_.cookie, verify=False)
+        res = yield ApiRequest(auth_, 'GET', url, headers=headers.get(), cookies=auth_.cookie, verify=False)
         ttwid = res.cookies.get_dict()['ttwid']
         soup = BeautifulSoup(res.text, 'html.parser')
         scripts = soup.select('script[nonce]')
@@ -775,6 +997,7 @@ class DouyinAPI:
         return None, None, None
 
     @staticmethod
+    @endpoint(coalesce=True)
     def get_live_production(auth, url: str, room_id: str, author_id: str, offset: str, **kwargs):
         """
         获取直播间的商品信息.
@@ -789,43 +1012,19 @@ class DouyinAPI:
         headers = HeaderBuilder().build(HeaderType.GET)
         headers.set_header("origin", DouyinAPI.live_url)
         headers.set_referer(url)
-        params = Params()
-        params.add_param("device_platform", "webapp")
-        params.add_param("aid", "6383")
-        params.add_param("channel", "channel_pc_web")
+        params = Params(templates.GET_LIVE_PRODUCTION)
         params.add_param("room_id", room_id)
         params.add_param("author_id", author_id)
         params.add_param("offset", offset)
-        params.add_param("limit", "20")
-        params.add_param("pc_client_type", "1")
-        params.add_param("version_code", "210800")
-        params.add_param("version_name", "21.8.0")
-        params.add_param("cookie_enabled", "true")
-        params.add_param("screen_width", "2560")
-        params.add_param("screen_height", "1440")
-        params.add_param("browser_language", "zh-CN")
-        params.add_param("browser_platform", "Win32")
-        params.add_param("browser_name", "Edge")
-        params.add_param("browser_version", "121.0.0.0")
-        params.add_param("browser_online", "true")
-        params.add_param("engine_name", "Blink")
-        params.add_param("engine_version", "121.0.0.0")
-        params.add_param("os_name", "Windows")
-        params.add_param("os_version", "10")
-        params.add_param("cpu_core_num", "20")
-        params.add_param("device_memory", "8")
-        params.add_param("platform", "PC")
-        params.add_param("downlink", "10")
-        params.add_param("effective_type", "4g")
-        params.add_param("round_trip_time", "50")
         params.with_web_id(auth, url)
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
-        res = requests.post(f'{DouyinAPI.live_url}{api}', headers=headers.get(), cookies=auth.cookie,
-                           params=params.get(), verify=False)
+        res = yield ApiRequest(auth, 'POST', f'{DouyinAPI.live_url}{api}', headers=headers.get(), cookies=auth.cookie,
+                               params=params.get(), verify=False)
         return res.json()
 
     @staticmethod
+    @endpoint(coalesce=True)
     def get_all_live_production(auth, url: str, **kwargs):
         """
         获取直播间的所有商品信息.
@@ -833,13 +1032,13 @@ class DouyinAPI:
         :param url: 直播间链接.
         :return:
         """
-        room_info = DouyinAPI.get_live_info(auth, url.split("/")[-1].split("?")[0])
+        room_info = yield from DouyinAPI.get_live_info.steps(auth, url.split("/")[-1].split("?")[0])
         room_id = room_info["room_id"]
         author_id = room_info["author_id"]
         offset = "0"
         production_list = []
         while True:
-            res_json = DouyinAPI.get_live_production(auth, url, room_id, author_id, offset)
+            res_json = yield from DouyinAPI.get_live_production.steps(auth, url, room_id, author_id, offset)
             productions = res_json["promotions"]
             production_list.extend(productions)
             offset = str(res_json["next_offset"])
@@ -848,6 +1047,7 @@ class DouyinAPI:
         return production_list
 
     @staticmethod
+    @endpoint(coalesce=True)
     def get_live_production_detail(auth, url, ec_promotion_id, sec_author_id, live_room_id, **kwargs):
         """
         获取直播间商品详情.
@@ -863,34 +1063,7 @@ class DouyinAPI:
         headers.set_header("origin", DouyinAPI.live_url)
         headers.set_referer(url)
         headers.with_csrf(auth.cookie_str)
-        params = Params()
-        params.add_param("is_h5", "1")
-        params.add_param("origin_type", "638301")
-        params.add_param("device_platform", "webapp")
-        params.add_param("aid", "6383")
-        params.add_param("channel", "channel_pc_web")
-        params.add_param("pc_client_type", "1")
-        params.add_param("update_version_code", "170400")
-        params.add_param("version_code", "")
-        params.add_param("version_name", "")
-        params.add_param("cookie_enabled", "true")
-        params.add_param("screen_width", "1707")
-        params.add_param("screen_height", "960")
-        params.add_param("browser_language", "zh-CN")
-        params.add_param("browser_platform", "Win32")
-        params.add_param("browser_name", "Edge")
-        params.add_param("browser_version", "125.0.0.0")
-        params.add_param("browser_online", "true")
-        params.add_param("engine_name", "Blink")
-        params.add_param("engine_version", "125.0.0.0")
-        params.add_param("os_name", "Windows")
-        params.add_param("os_version", "10")
-        params.add_param("cpu_core_num", "32")
-        params.add_param("device_memory", "8")
-        params.add_param("platform", "PC")
-        params.add_param("downlink", "1.7")
-        params.add_param("effective_type", "4g")
-        params.add_param("round_trip_time", "200")
+        params = Params(templates.GET_LIVE_PRODUCTION_DETAIL)
         params.with_web_id(auth, url)
         params.add_param("msToken", auth.msToken)
         data = {
@@ -906,11 +1079,13 @@ class DouyinAPI:
             "use_new_price": "1"
         }
         params.with_a_bogus(data)
-        res = requests.post(f'{DouyinAPI.live_url}{api}', headers=headers.get(), params=params.get(),
-                            cookies=auth.cookie, data=data, verify=False)
+        res = yield ApiRequest(auth, 'POST', f'{DouyinAPI.live_url}{api}', headers=headers.get(), params=params.get(),
+                               cookies=auth.cookie, data=data, verify=False)
+        check_csrf_response(res, auth.cookie_str)
         return res.json()
 
     @staticmethod
+    @endpoint
     def collect_aweme(auth, aweme_id: str, action: str = '1', **kwargs):
         """
         收藏或取消收藏视频.
@@ -926,32 +1101,7 @@ class DouyinAPI:
         headers.with_bd(api, auth)
         headers.with_csrf(auth.cookie_str)
         headers.set_header("origin", DouyinAPI.douyin_url)
-        params = Params()
-        params.add_param("device_platform", "webapp")
-        params.add_param("aid", "6383")
-        params.add_param("channel", "channel_pc_web")
-        params.add_param("pc_client_type", "1")
-        params.add_param("update_version_code", "170400")
-        params.add_param("version_code", "170400")
-        params.add_param("version_name", "17.4.0")
-        params.add_param("cookie_enabled", "true")
-        params.add_param("screen_width", "1707")
-        params.add_param("screen_height", "960")
-        params.add_param("browser_language", "zh-CN")
-        params.add_param("browser_platform", "Win32")
-        params.add_param("browser_name", "Edge")
-        params.add_param("browser_version", "125.0.0.0")
-        params.add_param("browser_online", "true")
-        params.add_param("engine_name", "Blink")
-        params.add_param("engine_version", "125.0.0.0")
-        params.add_param("os_name", "Windows")
-        params.add_param("os_version", "10")
-        params.add_param("cpu_core_num", "32")
-        params.add_param("device_memory", "8")
-        params.add_param("platform", "PC")
-        params.add_param("downlink", "10")
-        params.add_param("effective_type", "4g")
-        params.add_param("round_trip_time", "50")
+        params = Params(templates.COLLECT_AWEME)
         params.with_web_id(auth, refer)
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
@@ -962,11 +1112,13 @@ class DouyinAPI:
             "aweme_type": "0",
         }
         params.with_a_bogus(data)
-        res = requests.post(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
-                            cookies=auth.cookie, data=data, verify=False)
+        res = yield ApiRequest(auth, 'POST', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
+                               cookies=auth.cookie, data=data, verify=False)
+        check_csrf_response(res, auth.cookie_str)
         return res.json()
 
     @staticmethod
+    @endpoint
     def move_collect_aweme(auth, aweme_id: str, collect_name: str, collect_id: str, **kwargs):
         """
         移动视频到指定收藏夹（需要先收藏视频）
@@ -983,48 +1135,23 @@ class DouyinAPI:
         headers.with_bd(api, auth)
         headers.with_csrf(auth.cookie_str)
         headers.set_header("origin", DouyinAPI.douyin_url)
-        params = Params()
-        params.add_param("aid", "6383")
-        params.add_param("browser_language", "zh-CN")
-        params.add_param("browser_name", "Edge")
-        params.add_param("browser_online", "true")
-        params.add_param("browser_platform", "Win32")
-        params.add_param("browser_version", "125.0.0.0")
-        params.add_param("channel", "channel_pc_web")
+        params = Params(templates.MOVE_COLLECT_AWEME)
         params.add_param("collects_name", collect_name)
-        params.add_param("cookie_enabled", "true")
-        params.add_param("cpu_core_num", "32")
-        params.add_param("device_memory", "8")
-        params.add_param("device_platform", "webapp")
-        params.add_param("downlink", "10")
-        params.add_param("effective_type", "4g")
-        params.add_param("engine_name", "Blink")
-        params.add_param("engine_version", "125.0.0.0")
         params.add_param("item_ids", aweme_id)
-        params.add_param("item_type", "2")
         params.add_param("move_collects_list", collect_id)
-        params.add_param("os_name", "Windows")
-        params.add_param("os_version", "10")
-        params.add_param("pc_client_type", "1")
-        params.add_param("platform", "PC")
-        params.add_param("round_trip_time", "50")
-        params.add_param("screen_height", "960")
-        params.add_param("screen_width", "1707")
         params.add_param("to_collects_id", collect_id)
-        params.add_param("update_collects_sort", "true")
-        params.add_param("update_version_code", "170400")
-        params.add_param("version_code", "170400")
-        params.add_param("version_name", "17.4.0")
         params.with_web_id(auth, refer)
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
-        res = requests.post(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
-                            cookies=auth.cookie, verify=False)
+        res = yield ApiRequest(auth, 'POST', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
+                               cookies=auth.cookie, verify=False)
+        check_csrf_response(res, auth.cookie_str)
         return res.json()
 
     @staticmethod
+    @endpoint
     def remove_collect_aweme(auth, aweme_id: str, collect_name: str, collect_id: str, **kwargs):
         """
         从指定收藏夹中移除视频（需要先收藏视频）
@@ -1041,46 +1168,22 @@ class DouyinAPI:
         headers.with_bd(api, auth)
         headers.with_csrf(auth.cookie_str)
         headers.set_header("origin", DouyinAPI.douyin_url)
-        params = Params()
-        params.add_param("aid", "6383")
-        params.add_param("browser_language", "zh-CN")
-        params.add_param("browser_name", "Edge")
-        params.add_param("browser_online", "true")
-        params.add_param("browser_platform", "Win32")
-        params.add_param("browser_version", "125.0.0.0")
-        params.add_param("channel", "channel_pc_web")
+        params = Params(templates.REMOVE_COLLECT_AWEME)
         params.add_param("collects_name", collect_name)
-        params.add_param("cookie_enabled", "true")
-        params.add_param("cpu_core_num", "32")
-        params.add_param("device_memory", "8")
-        params.add_param("device_platform", "webapp")
-        params.add_param("downlink", "10")
-        params.add_param("effective_type", "4g")
-        params.add_param("engine_name", "Blink")
-        params.add_param("engine_version", "125.0.0.0")
         params.add_param("from_collects_id", collect_id)
         params.add_param("item_ids", aweme_id)
-        params.add_param("item_type", "2")
-        params.add_param("os_name", "Windows")
-        params.add_param("os_version", "10")
-        params.add_param("pc_client_type", "1")
-        params.add_param("platform", "PC")
-        params.add_param("round_trip_time", "50")
-        params.add_param("screen_height", "960")
-        params.add_param("screen_width", "1707")
-        params.add_param("update_version_code", "170400")
-        params.add_param("version_code", "170400")
-        params.add_param("version_name", "17.4.0")
         params.with_web_id(auth, refer)
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
-        res = requests.post(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
-                            cookies=auth.cookie, verify=False)
+        res = yield ApiRequest(auth, 'POST', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
+                               cookies=auth.cookie, verify=False)
+        check_csrf_response(res, auth.cookie_str)
         return res.json()
 
     @staticmethod
+    @endpoint
     def get_collect_list(auth, **kwargs):
         """
         获取我的收藏夹列表
@@ -1091,44 +1194,18 @@ class DouyinAPI:
         headers = HeaderBuilder().build(HeaderType.GET)
         refer = "https://www.douyin.com/?recommend=1"
         headers.set_referer(refer)
-        params = Params()
-        params.add_param("device_platform", "webapp")
-        params.add_param("aid", "6383")
-        params.add_param("channel", "channel_pc_web")
-        params.add_param("cursor", "0")
-        params.add_param("count", "20")
-        params.add_param("update_version_code", "170400")
-        params.add_param("pc_client_type", "1")
-        params.add_param("version_code", "170400")
-        params.add_param("version_name", "17.4.0")
-        params.add_param("cookie_enabled", "true")
-        params.add_param("screen_width", "1707")
-        params.add_param("screen_height", "960")
-        params.add_param("browser_language", "zh-CN")
-        params.add_param("browser_platform", "Win32")
-        params.add_param("browser_name", "Edge")
-        params.add_param("browser_version", "125.0.0.0")
-        params.add_param("browser_online", "true")
-        params.add_param("engine_name", "Blink")
-        params.add_param("engine_version", "125.0.0.0")
-        params.add_param("os_name", "Windows")
-        params.add_param("os_version", "10")
-        params.add_param("cpu_core_num", "32")
-        params.add_param("device_memory", "8")
-        params.add_param("platform", "PC")
-        params.add_param("downlink", "5.95")
-        params.add_param("effective_type", "4g")
-        params.add_param("round_trip_time", "200")
+        params = Params(templates.GET_COLLECT_LIST)
         params.with_web_id(auth, refer)
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
-        res = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
-                           cookies=auth.cookie, verify=False)
+        res = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
+                               cookies=auth.cookie, verify=False)
         return res.json()
 
     @staticmethod
+    @endpoint(coalesce=True)
     def get_user_follower_list(auth, user_id: str, sec_id: str, max_time: str = '0', count: str = '20', **kwargs):
         """
         获取用户的粉丝列表
@@ -1143,75 +1220,57 @@ class DouyinAPI:
         headers = HeaderBuilder().build(HeaderType.GET)
         refer = f"https://www.douyin.com/user/{sec_id}"
         headers.set_referer(refer)
-        params = Params()
-        params.add_param("device_platform", 'webapp')
-        params.add_param("aid", '6383')
-        params.add_param("channel", 'channel_pc_web')
+        params = Params(templates.GET_USER_FOLLOWER_LIST)
         params.add_param("user_id", user_id)
         params.add_param("sec_user_id", sec_id)
-        params.add_param("offset", '0')
-        params.add_param("min_time", '0')
         params.add_param("max_time", max_time)
         params.add_param("count", count)
         params.add_param("source_type", '2' if max_time == '0' else '1')
-        params.add_param("gps_access", '0')
-        params.add_param("address_book_access", '0')
-        params.add_param("update_version_code", '170400')
-        params.add_param("pc_client_type", '1')
-        params.add_param("version_code", '170400')
-        params.add_param("version_name", '17.4.0')
-        params.add_param("cookie_enabled", 'true')
-        params.add_param("screen_width", '1707')
-        params.add_param("screen_height", '960')
-        params.add_param("browser_language", 'zh-CN')
-        params.add_param("browser_platform", 'Win32')
-        params.add_param("browser_name", 'Edge')
-        params.add_param("browser_version", '125.0.0.0')
-        params.add_param("browser_online", 'true')
-        params.add_param("engine_name", 'Blink')
-        params.add_param("engine_version", '125.0.0.0')
-        params.add_param("os_name", 'Windows')
-        params.add_param("os_version", '10')
-        params.add_param("cpu_core_num", '32')
-        params.add_param("device_memory", '8')
-        params.add_param("platform", 'PC')
-        params.add_param("downlink", '10')
-        params.add_param("effective_type", '4g')
-        params.add_param("round_trip_time", '150')
         params.with_web_id(auth, refer)
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
-        res = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
-                           cookies=auth.cookie, verify=False)
+        res = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
+                               cookies=auth.cookie, verify=False)
         return res.json()
 
     @staticmethod
-    def get_some_user_follower_list(auth, user_id: str, sec_id: str, num: int, **kwargs) -> list:
+    @endpoint(coalesce=True)
+    def get_some_user_follower_list(auth, user_id: str, sec_id: str, num: int, checkpoint=None, **kwargs) -> list:
         """
         获取用户的前num个粉丝列表
         :param auth: DouyinAuth object.
         :param user_id: 用户ID.
         :param sec_id: 用户sec_id.
         :param num: 要获取的数量
+        :param checkpoint: checkpoint_util.Checkpoint, 中断后用同一个断点重新调用会从最后提交的一页继续.
         :return: 粉丝列表.
         """
-        max_time = "0"
-        count = "20"
-        follower_list = []
+        pages = DouyinAPI.iter_user_follower_list.steps_from(checkpoint, auth, user_id, sec_id)
+        return (yield from collect_pages(pages, num, checkpoint=checkpoint))
+
+    @staticmethod
+    @pager(cursor='max_time')
+    def iter_user_follower_list(auth, user_id: str, sec_id: str, max_time: str = '0', count: str = '20'):
+        """
+        逐页获取用户的粉丝列表.
+        :param auth: DouyinAuth object.
+        :param user_id: 用户ID.
+        :param sec_id: 用户sec_id.
+        :param max_time: 从哪个时间游标开始, 默认第一页.
+        :param count: 每页数量.
+        :return: PageIterator, 逐条返回粉丝用户.
+        """
         while True:
-            res_json = DouyinAPI.get_user_follower_list(auth, user_id, sec_id, max_time, count)
-            followers = res_json["followers"]
-            follower_list.extend(followers)
-            if res_json["has_more"] != 1 or len(follower_list) >= num:
+            res_json = yield from DouyinAPI.get_user_follower_list.steps(auth, user_id, sec_id, max_time, count)
+            yield Page(res_json["followers"], max_time, res_json.get("min_time"), res_json["has_more"] == 1)
+            max_time = res_json.get("min_time")
+            if res_json["has_more"] != 1:
                 break
-            max_time = res_json["min_time"]
-        if len(follower_list) > num:
-            follower_list = follower_list[:num]
-        return follower_list
 
     @staticmethod
+    @endpoint(coalesce=True)
     def get_user_following_list(auth, user_id: str, sec_id: str, max_time: str = '0', count: str = '20', **kwargs):
         """
         获取用户的关注列表
@@ -1226,76 +1285,57 @@ class DouyinAPI:
         headers = HeaderBuilder().build(HeaderType.GET)
         refer = f"https://www.douyin.com/user/{sec_id}"
         headers.set_referer(refer)
-        params = Params()
-        params.add_param("device_platform", 'webapp')
-        params.add_param("aid", '6383')
-        params.add_param("channel", 'channel_pc_web')
+        params = Params(templates.GET_USER_FOLLOWING_LIST)
         params.add_param("user_id", user_id)
         params.add_param("sec_user_id", sec_id)
-        params.add_param("offset", '0')
-        params.add_param("min_time", '0')
         params.add_param("max_time", max_time)
         params.add_param("count", count)
         params.add_param("source_type", '2' if max_time == '0' else '1')
-        params.add_param("gps_access", '0')
-        params.add_param("address_book_access", '0')
-        params.add_param("is_top", '1')
-        params.add_param("update_version_code", '170400')
-        params.add_param("pc_client_type", '1')
-        params.add_param("version_code", '170400')
-        params.add_param("version_name", '17.4.0')
-        params.add_param("cookie_enabled", 'true')
-        params.add_param("screen_width", '1707')
-        params.add_param("screen_height", '960')
-        params.add_param("browser_language", 'zh-CN')
-        params.add_param("browser_platform", 'Win32')
-        params.add_param("browser_name", 'Edge')
-        params.add_param("browser_version", '125.0.0.0')
-        params.add_param("browser_online", 'true')
-        params.add_param("engine_name", 'Blink')
-        params.add_param("engine_version", '125.0.0.0')
-        params.add_param("os_name", 'Windows')
-        params.add_param("os_version", '10')
-        params.add_param("cpu_core_num", '32')
-        params.add_param("device_memory", '8')
-        params.add_param("platform", 'PC')
-        params.add_param("downlink", '10')
-        params.add_param("effective_type", '4g')
-        params.add_param("round_trip_time", '150')
         params.with_web_id(auth, refer)
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
-        res = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
-                           cookies=auth.cookie, verify=False)
+        res = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
+                               cookies=auth.cookie, verify=False)
         return res.json()
 
     @staticmethod
-    def get_some_user_following_list(auth, user_id: str, sec_id: str, num: int, **kwargs) -> list:
+    @endpoint(coalesce=True)
+    def get_some_user_following_list(auth, user_id: str, sec_id: str, num: int, checkpoint=None, **kwargs) -> list:
         """
         获取用户的前num个关注列表
         :param auth: DouyinAuth object.
         :param user_id: 用户ID.
         :param sec_id: 用户sec_id.
         :param num: 要获取的数量
+        :param checkpoint: checkpoint_util.Checkpoint, 中断后用同一个断点重新调用会从最后提交的一页继续.
         :return: 关注列表.
         """
-        max_time = "0"
-        count = "20"
-        following_list = []
+        pages = DouyinAPI.iter_user_following_list.steps_from(checkpoint, auth, user_id, sec_id)
+        return (yield from collect_pages(pages, num, checkpoint=checkpoint))
+
+    @staticmethod
+    @pager(cursor='max_time')
+    def iter_user_following_list(auth, user_id: str, sec_id: str, max_time: str = '0', count: str = '20'):
+        """
+        逐页获取用户的关注列表.
+        :param auth: DouyinAuth object.
+        :param user_id: 用户ID.
+        :param sec_id: 用户sec_id.
+        :param max_time: 从哪个时间游标开始, 默认第一页.
+        :param count: 每页数量.
+        :return: PageIterator, 逐条返回关注用户.
+        """
         while True:
-            res_json = DouyinAPI.get_user_following_list(auth, user_id, sec_id, max_time, count)
-            followings = res_json["followings"]
-            following_list.extend(followings)
-            if res_json["has_more"] != 1 or len(following_list) >= num:
+            res_json = yield from DouyinAPI.get_user_following_list.steps(auth, user_id, sec_id, max_time, count)
+            yield Page(res_json["followings"], max_time, res_json.get("min_time"), res_json["has_more"] == 1)
+            max_time = res_json.get("min_time")
+            if res_json["has_more"] != 1:
                 break
-            max_time = res_json["min_time"]
-        if len(following_list) > num:
-            following_list = following_list[:num]
-        return following_list
 
     @staticmethod
+    @endpoint
     def get_notice_list(auth, min_time='0', max_time='0', count='10', notice_group='700', **kwargs):
         """
         获得通知
@@ -1310,73 +1350,56 @@ class DouyinAPI:
         headers = HeaderBuilder().build(HeaderType.GET)
         refer = "https://www.douyin.com/?recommend=1"
         headers.set_referer(refer)
-        params = Params()
-        params.add_param("device_platform", 'webapp')
-        params.add_param("aid", '6383')
-        params.add_param("channel", 'channel_pc_web')
-        params.add_param("is_new_notice", '1')
-        params.add_param("is_mark_read", '1')
+        params = Params(templates.GET_NOTICE_LIST)
         params.add_param("notice_group", notice_group)
         params.add_param("count", count)
         params.add_param("min_time", min_time)
         params.add_param("max_time", max_time)
-        params.add_param("update_version_code", '170400')
-        params.add_param("pc_client_type", '1')
-        params.add_param("version_code", '170400')
-        params.add_param("version_name", '17.4.0')
-        params.add_param("cookie_enabled", 'true')
-        params.add_param("screen_width", '1707')
-        params.add_param("screen_height", '960')
-        params.add_param("browser_language", 'zh-CN')
-        params.add_param("browser_platform", 'Win32')
-        params.add_param("browser_name", 'Edge')
-        params.add_param("browser_version", '125.0.0.0')
-        params.add_param("browser_online", 'true')
-        params.add_param("engine_name", 'Blink')
-        params.add_param("engine_version", '125.0.0.0')
-        params.add_param("os_name", 'Windows')
-        params.add_param("os_version", '10')
-        params.add_param("cpu_core_num", '32')
-        params.add_param("device_memory", '8')
-        params.add_param("platform", 'PC')
-        params.add_param("downlink", '10')
-        params.add_param("effective_type", '4g')
-        params.add_param("round_trip_time", '50')
         params.with_web_id(auth, refer)
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
-        res = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
-                           cookies=auth.cookie, verify=False)
+        res = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
+                               cookies=auth.cookie, verify=False)
         return res.json()
 
     @staticmethod
-    def get_some_notice_list(auth, num: int = 20, notice_group='700', **kwargs) -> list:
+    @endpoint
+    def get_some_notice_list(auth, num: int = 20, notice_group='700', checkpoint=None, **kwargs) -> list:
         """
         获得前num条通知
         :param auth: DouyinAuth object.
         :param num: 数量.
         :param notice_group: 消息类型 | 700 全部消息 401 粉丝 601 @我的 2 评论 3 点赞 520 弹幕
+        :param checkpoint: checkpoint_util.Checkpoint, 中断后用同一个断点重新调用会从最后提交的一页继续.
         :return:
         """
-        min_time = "0"
-        max_time = "0"
-        count = "10"
-        notice_list = []
+        pages = DouyinAPI.iter_notice_list.steps_from(checkpoint, auth, notice_group)
+        return (yield from collect_pages(pages, num, checkpoint=checkpoint))
+
+    @staticmethod
+    @pager(cursor=('min_time', 'max_time'))
+    def iter_notice_list(auth, notice_group='700', min_time='0', max_time='0', count='10'):
+        """
+        逐页获取通知.
+        :param auth: DouyinAuth object.
+        :param notice_group: 消息类型, 见 get_some_notice_list.
+        :param min_time: 从哪个时间游标开始, 默认第一页.
+        :param max_time: 从哪个时间游标开始, 默认第一页.
+        :param count: 每页数量.
+        :return: PageIterator, 逐条返回通知, 游标为 (min_time, max_time).
+        """
         while True:
-            res_json = DouyinAPI.get_notice_list(auth, min_time, max_time, count, notice_group)
-            notices = res_json["notice_list_v2"]
-            notice_list.extend(notices)
-            if res_json["has_more"] != 1 or len(notice_list) >= num:
+            res_json = yield from DouyinAPI.get_notice_list.steps(auth, min_time, max_time, count, notice_group)
+            next_cursor = (res_json.get("min_time"), res_json.get("max_time"))
+            yield Page(res_json["notice_list_v2"], (min_time, max_time), next_cursor, res_json["has_more"] == 1)
+            min_time, max_time = next_cursor
+            if res_json["has_more"] != 1:
                 break
-            min_time = res_json["min_time"]
-            max_time = res_json["max_time"]
-        if len(notice_list) > num:
-            notice_list = notice_list[:num]
-        return notice_list
 
     @staticmethod
+    @endpoint
     def get_feed(auth, count='20', refresh_index='2', **kwargs):
         """
         获取首页推荐视频
@@ -1389,50 +1412,17 @@ class DouyinAPI:
         headers = HeaderBuilder().build(HeaderType.GET)
         refer = "https://www.douyin.com/"
         headers.set_referer(refer)
-        params = Params()
-        params.add_param("device_platform", 'webapp')
-        params.add_param("aid", '6383')
-        params.add_param("channel", 'channel_pc_web')
-        params.add_param("module_id", '3003101')
+        params = Params(templates.GET_FEED)
         params.add_param("count", count)
-        params.add_param("filterGids", '')
-        params.add_param("presented_ids", '')
         params.add_param("refresh_index", refresh_index)
-        params.add_param("refer_id", '')
-        params.add_param("refer_type", '10')
-        params.add_param("awemePcRecRawData", '{"is_client":false}')
-        params.add_param("Seo-Flag", '0')
-        params.add_param("install_time", '1715480185')
-        params.add_param("pc_client_type", '1')
-        params.add_param("update_version_code", '170400')
-        params.add_param("version_code", '170400')
-        params.add_param("version_name", '17.4.0')
-        params.add_param("cookie_enabled", 'true')
-        params.add_param("screen_width", '1707')
-        params.add_param("screen_height", '960')
-        params.add_param("browser_language", 'zh-CN')
-        params.add_param("browser_platform", 'Win32')
-        params.add_param("browser_name", 'Edge')
-        params.add_param("browser_version", '125.0.0.0')
-        params.add_param("browser_online", 'true')
-        params.add_param("engine_name", 'Blink')
-        params.add_param("engine_version", '125.0.0.0')
-        params.add_param("os_name", 'Windows')
-        params.add_param("os_version", '10')
-        params.add_param("cpu_core_num", '32')
-        params.add_param("device_memory", '8')
-        params.add_param("platform", 'PC')
-        params.add_param("downlink", '10')
-        params.add_param("effective_type", '4g')
-        params.add_param("round_trip_time", '100')
         params.with_web_id(auth, refer)
         params.add_param("msToken", auth.msToken)
         params.with_a_bogus()
         params.add_param("verifyFp", auth.cookie['s_v_web_id'])
         params.add_param("fp", auth.cookie['s_v_web_id'])
 
-        res = requests.get(f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
-                           cookies=auth.cookie, verify=False)
+        res = yield ApiRequest(auth, 'GET', f'{DouyinAPI.douyin_url}{api}', headers=headers.get(), params=params.get(),
+                               cookies=auth.cookie, verify=False)
         return res.json()
 
 
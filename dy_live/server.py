@@ -1,7 +1,7 @@
 import gzip
 import threading
 import time
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlparse
 
 from websocket._app import WebSocketApp
 
@@ -13,14 +13,19 @@ from dy_apis.douyin_api import DouyinAPI
 from builder.header import HeaderBuilder
 from builder.params import Params
 import utils.common_util as common_util
-from utils.dy_util import generate_signature
+from utils.dy_util import generate_signature, invalidate_signature, confirm_signature
+from utils.proxy_util import resolve_proxy
+from utils.rate_util import account_key
 
 
 class DouyinLive:
-    def __init__(self, live_id, auth_):
+    def __init__(self, live_id, auth_, proxies=None):
         self.auth_ = auth_
+        self.proxies = proxies
         self.live_id = live_id
         self.ws = None
+        self.room_key = None
+        self.opened = False
 
     def ping(self, ws):
         while True:
@@ -34,6 +39,9 @@ class DouyinLive:
                 break
 
     def on_open(self, ws):
+        self.opened = True
+        if self.room_key is not None:
+            confirm_signature(*self.room_key)
         print("\033[32m### opened ###\033[m")
         threading.Thread(target=self.ping, args=(ws,)).start()
 
@@ -94,17 +102,37 @@ class DouyinLive:
         print("### ===error=== ###\033[m")
 
     def on_close(self, ws, close_status_code, close_msg):
+        # 没连上就被关闭, 可能是缓存的签名失效了, 重连时重新签名; 多次失败才重建共用的签名环境
+        if not self.opened and self.room_key is not None:
+            invalidate_signature(*self.room_key)
         # 此处判断是否需要重连 判断直播间是否关闭
         self.start_ws()
         print("\033[31m### closed ###")
         print(f"status_code: {close_status_code}, msg: {close_msg}")
         print("### ===closed=== ###\033[m")
 
+    def ws_proxy_options(self) -> dict:
+        # websocket 和 get_live_info 走同一个代理出口
+        _, proxies = resolve_proxy(self.proxies, account_key(self.auth_))
+        if not proxies:
+            return {}
+        proxy = urlparse(proxies.get('https') or proxies.get('http'))
+        options = {
+            'http_proxy_host': proxy.hostname,
+            'http_proxy_port': proxy.port,
+            'proxy_type': proxy.scheme if proxy.scheme.startswith('socks') else 'http',
+        }
+        if proxy.username:
+            options['http_proxy_auth'] = (proxy.username, proxy.password or '')
+        return options
+
     def start_ws(self):
-        room_info = DouyinAPI.get_live_info(self.auth_, self.live_id)
+        room_info = DouyinAPI.get_live_info(self.auth_, self.live_id, proxies=self.proxies)
         room_id = room_info['room_id']
         user_id = room_info['user_id']
         ttwid = room_info['ttwid']
+        self.room_key = (room_id, user_id)
+        self.opened = False
         params = Params()
         (params
          .add_param('app_name', 'douyin_web')
@@ -157,7 +185,7 @@ class DouyinLive:
             on_open=self.on_open
         )
         try:
-            self.ws.run_forever(origin='https://live.douyin.com')
+            self.ws.run_forever(origin='https://live.douyin.com', **self.ws_proxy_options())
         except Exception as e:
             print(str(e))
             self.ws.close()
@@ -8,7 +8,6 @@ import argparse
 import json
 import time
 import csv
-import pandas as pd
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -466,6 +465,7 @@ class LiveMonitorWithSave(DouyinLive):
                     if field not in row:
                         row[field] = ''
             
+            import pandas as pd
             df = pd.DataFrame(csv_data, columns=fieldnames)
             df.to_excel(self.data_file, index=False, engine='openpyxl')
 
@@ -517,6 +517,7 @@ class LiveMonitorWithSave(DouyinLive):
             {'metric': 'unique_users_count', 'value': len(stats_data['unique_users'])}
         ]
         
+        import pandas as pd
         df = pd.DataFrame(basic_stats)
         df.to_excel(self.stats_file, index=False, engine='openpyxl')
 
@@ -1,56 +1,115 @@
 # coding=utf-8
+import hashlib
+import itertools
 import json
 import os
+from concurrent.futures import Future
 from loguru import logger
 
+from builder.auth import AuthPool
 from dy_apis.douyin_api import DouyinAPI
+from utils.checkpoint_util import Checkpoint
 from utils.common_util import init
-from utils.data_util import handle_work_info, download_work, save_to_xlsx
+from utils.data_util import handle_work_info, save_to_xlsx
+from utils.download_util import get_download_engine, wait_downloads
+from utils.graph_util import GraphCrawler, RELATION_FOLLOWER, RELATION_FOLLOWING
+from utils.sync_util import get_sync_state
 
 
 class Data_Spider():
     def __init__(self):
         self.douyin_apis = DouyinAPI()
 
+    @staticmethod
+    def _checkpoint(job_id: str, resume: bool) -> Checkpoint:
+        # 任务中断后用同一个断点继续, 任务完成后删除; resume=False 时丢弃上次的断点
+        checkpoint = Checkpoint(job_id)
+        if not resume:
+            checkpoint.clear()
+        return checkpoint
+
+    @staticmethod
+    def _download_work(checkpoint: Checkpoint, work_info: dict, base_path: dict, save_choice: str, proxies=None, futures: list = None):
+        # 交给下载引擎后台下载, 完成后记入断点; 已经下载过的作品重启后跳过
+        key = f'download:{work_info["work_id"]}'
+        if checkpoint.is_persisted(key):
+            return
+        future = get_download_engine().submit_work(work_info, base_path['media'], save_choice, proxies)
+        # 记入断点后才算完成, 等待下载的地方返回时断点已经写好
+        persisted = Future()
+
+        def on_done(f):
+            if f.exception() is None:
+                try:
+                    checkpoint.persist(key)
+                except Exception as e:
+                    persisted.set_exception(e)
+                else:
+                    persisted.set_result(f.result())
+            else:
+                persisted.set_exception(f.exception())
+
+        future.add_done_callback(on_done)
+        if futures is not None:
+            futures.append(persisted)
+
     def spider_work(self, auth, work_url: str, proxies=None):
         """
         爬取一个作品的信息
         :param auth : 用户认证信息
         :param work_url: 作品链接
+        :param proxies: 代理, requests 的 proxies 字典、代理地址或 ProxyPool, 为空时使用默认代理池
         :return:
         """
-        res_json = self.douyin_apis.get_work_info(auth, work_url)
+        res_json = self.douyin_apis.get_work_info(auth, work_url, proxies=proxies)
         data = res_json['aweme_detail']
 
         work_info = handle_work_info(data)
         logger.info(f'爬取作品信息 {work_url}')
         return work_info
 
-    def spider_some_work(self, auth, works: list, base_path: dict, save_choice: str, excel_name: str = '', proxies=None):
+    def spider_some_work(self, auth, works: list, base_path: dict, save_choice: str, excel_name: str = '', proxies=None, resume=True):
         """
         爬取一些作品的信息
-        :param auth: 用户认证信息
+        :param auth: 用户认证信息, 传入 AuthPool 时多个账号并发爬取
         :param works: 作品链接列表
         :param base_path: 保存路径
         :param save_choice: 保存方式 all: 保存所有的信息, media: 保存视频和图片（media-video只下载视频, media-image只下载图片，media都下载）, excel: 保存到excel
         :param excel_name: excel文件名
+        :param proxies: 代理
+        :param resume: 是否从上次中断的地方继续
         :return:
         """
         if (save_choice == 'all' or save_choice == 'excel') and excel_name == '':
             raise ValueError('excel_name 不能为空')
-        work_list = []
-        for work_url in works:
-            work_info = self.spider_work(auth, work_url)
-            work_list.append(work_info)
-        for work_info in work_list:
+        checkpoint = self._checkpoint('some_work_' + hashlib.md5('\n'.join(works).encode()).hexdigest(), resume)
+
+        futures = []
+
+        def spider_one(a, work_url):
+            work_info = checkpoint.persisted(work_url)
+            if work_info is None:
+                work_info = self.spider_work(a, work_url, proxies)
+                checkpoint.persist(work_url, work_info)
             if save_choice == 'all' or 'media' in save_choice:
-                download_work(work_info, base_path['media'], save_choice)
+                self._download_work(checkpoint, work_info, base_path, save_choice, proxies, futures)
+            return work_info
+
+        work_list = []
+        if isinstance(auth, AuthPool):
+            work_list = auth.map(spider_one, works)
+        else:
+            for work_url in works:
+                work_info = spider_one(auth, work_url)
+                work_list.append(work_info)
         if save_choice == 'all' or save_choice == 'excel':
             file_path = os.path.abspath(os.path.join(base_path['excel'], f'{excel_name}.xlsx'))
             save_to_xlsx(work_list, file_path)
+        wait_downloads(futures)
+        checkpoint.clear()
 
 
-    def spider_user_all_work(self, auth, user_url: str, base_path: dict, save_choice: str, excel_name: str = '', proxies=None):
+    def spider_user_all_work(self, auth, user_url: str, base_path: dict, save_choice: str, excel_name: str = '', proxies=None, resume=True, incremental=False):
         """
         爬取一个用户的所有作品
         :param auth: 用户认证信息
@@ -59,12 +118,25 @@ class Data_Spider():
         :param save_choice: 保存方式 all: 保存所有的信息, media: 保存视频和图片（media-video只下载视频, media-image只下载图片，media都下载）, excel: 保存到excel
         :param excel_name: excel文件名
         :param proxies: 代理
+        :param resume: 是否从上次中断的地方继续
+        :param incremental: 增量爬取, 只取上次之后的新作品和最近几天的作品(更新计数), 只下载新作品
         :return:
         """
-        user_info = self.douyin_apis.get_user_info(auth, user_url)
-        work_list = self.douyin_apis.get_user_all_work_info(auth, user_url)
+        sec_uid = user_url.split('/')[-1].split('?')[0]
+        checkpoint = self._checkpoint(f'user_works_{sec_uid}', resume)
+        user_info = self.douyin_apis.get_user_info(auth, user_url, proxies=proxies)
+        if incremental:
+            sync_state = get_sync_state()
+            new_list, known_list = self.douyin_apis.sync_user_work_info(auth, user_url, sync_state, record=False, proxies=proxies)
+            work_list = new_list + known_list
+            new_ids = {work['aweme_id'] for work in new_list}
+            logger.info(f'用户 {user_url} 新作品数量: {len(new_list)}, 更新作品数量: {len(known_list)}')
+        else:
+            # 边翻页边下载, 先取回断点里已经提交的作品
+            work_list = itertools.chain(checkpoint.items(), self.douyin_apis.iter_user_work_info(auth, user_url, proxies=proxies, checkpoint=checkpoint))
+            new_ids = None
         work_info_list = []
-        logger.info(f'用户 {user_url} 作品数量: {len(work_list)}')
+        futures = []
         if save_choice == 'all' or save_choice == 'excel':
             excel_name = user_url.split('/')[-1].split('?')[0]
 
@@ -73,13 +145,19 @@ class Data_Spider():
             work_info = handle_work_info(work_info)
             work_info_list.append(work_info)
             logger.info(f'爬取作品信息 {work_info["work_url"]}')
-            if save_choice == 'all' or 'media' in save_choice:
-                download_work(work_info, base_path['media'], save_choice)
+            if (save_choice == 'all' or 'media' in save_choice) and (new_ids is None or work_info['work_id'] in new_ids):
+                self._download_work(checkpoint, work_info, base_path, save_choice, proxies, futures)
+        logger.info(f'用户 {user_url} 作品数量: {len(work_info_list)}')
         if save_choice == 'all' or save_choice == 'excel':
             file_path = os.path.abspath(os.path.join(base_path['excel'], f'{excel_name}.xlsx'))
             save_to_xlsx(work_info_list, file_path)
+        wait_downloads(futures)
+        if incremental:
+            # 下载完成后再记录, 中途失败时下次仍然当作新作品
+            sync_state.record(sec_uid, work_list)
+        checkpoint.clear()
 
-    def spider_some_search_work(self, auth, query: str, require_num: int, base_path: dict, save_choice: str,  sort_type: str, publish_time: str, filter_duration="", search_range="", content_type="",   excel_name: str = '', proxies=None):
+    def spider_some_search_work(self, auth, query: str, require_num: int, base_path: dict, save_choice: str,  sort_type: str, publish_time: str, filter_duration="", search_range="", content_type="",   excel_name: str = '', proxies=None, resume=True):
         """
             :param auth: DouyinAuth object.
             :param query: 搜索关键字.
@@ -92,10 +170,17 @@ class Data_Spider():
             :param search_range: 搜索范围 0 不限, 1 最近看过, 2 还未看过, 3 关注的人
             :param content_type: 内容形式 0 不限, 1 视频, 2 图文
             :param excel_name: excel文件名
+            :param proxies: 代理
+            :param resume: 是否从上次中断的地方继续
         """
         work_info_list = []
-        work_list = self.douyin_apis.search_some_general_work(auth, query, require_num, sort_type, publish_time, filter_duration, search_range, content_type)
-        logger.info(f'搜索关键词 {query} 作品数量: {len(work_list)}')
+        job_id = '_'.join(['search', query, str(require_num), sort_type, publish_time, filter_duration, search_range, content_type])
+        checkpoint = self._checkpoint(job_id, resume)
+        # 边翻页边下载, 先取回断点里已经提交的作品
+        committed = checkpoint.items()[:require_num]
+        pages = self.douyin_apis.iter_search_general_work(auth, query, sort_type, publish_time, filter_duration, search_range, content_type, proxies=proxies, checkpoint=checkpoint)
+        work_list = itertools.chain(committed, itertools.islice(pages, require_num - len(committed)))
+        futures = []
         if save_choice == 'all' or save_choice == 'excel':
             excel_name = query
         for work_info in work_list:
@@ -104,10 +189,33 @@ class Data_Spider():
             work_info = handle_work_info(work_info['aweme_info'])
             work_info_list.append(work_info)
             if save_choice == 'all' or 'media' in save_choice:
-                download_work(work_info, base_path['media'], save_choice)
+                self._download_work(checkpoint, work_info, base_path, save_choice, proxies, futures)
+        pages.close()
+        logger.info(f'搜索关键词 {query} 作品数量: {len(work_info_list)}')
         if save_choice == 'all' or save_choice == 'excel':
             file_path = os.path.abspath(os.path.join(base_path['excel'], f'{excel_name}.xlsx'))
             save_to_xlsx(work_info_list, file_path)
+        wait_downloads(futures)
+        checkpoint.clear()
+
+    def spider_user_graph(self, auth, user_urls: list, max_depth: int = 2, relations=(RELATION_FOLLOWING, RELATION_FOLLOWER), max_per_user: int = None, workers: int = 4, proxies=None):
+        """
+        从种子用户出发爬取关注和粉丝关系图, 结果保存在 DY_GRAPH_PATH(默认 datas/graph.db), 中断后再次调用会接着爬
+        :param auth: 用户认证信息, 也可以是 AuthPool
+        :param user_urls: 种子用户链接列表
+        :param max_depth: 从种子往外展开几层
+        :param relations: 要爬的关系 following: 关注, follower: 粉丝
+        :param max_per_user: 每个用户每种关系最多取多少人
+        :param workers: 同时爬的用户数
+        :param proxies: 代理
+        :return: 用户和边的数量统计
+        """
+        crawler = GraphCrawler(auth, max_depth=max_depth, relations=relations, max_per_user=max_per_user, workers=workers, proxies=proxies)
+        for user_url in user_urls:
+            crawler.add_seed(user_url)
+        stats = crawler.run()
+        logger.info(f'关系图爬取完成: {stats}')
+        return stats
 
 if __name__ == '__main__':
     """
@@ -1,11 +1,19 @@
-function sign(roomId, userId) {
-  const { Script } = require("vm");
-  const { jsdomFromText, browser } = require("sdenv");
-  const signText =
+const signText =
     "LyoqIDEuMC4wLjUzICovCmlmICghd2luZG93LmJ5dGVkX2FjcmF3bGVyKSB7CiAgZnVuY3Rpb24gd18weDI1ZjMoXzB4NTQ1ZDBhLCBfMHhiNzNhYzYpIHsKICAgIHZhciBfMHg0MTczYTkgPSB3XzB4NDJmNSgpOwogICAgcmV0dXJuICgKICAgICAgKHdfMHgyNWYzID0gZnVuY3Rpb24gKF8weDEzODAwMywgXzB4MzVhMzc1KSB7CiAgICAgICAgXzB4MTM4MDAzID0gXzB4MTM4MDAzIC0gKC0weDEgKiAtMHhkMTUgKyAtMHgxMDQ0ICsgMHg0OGQpOwogICAgICAgIHZhciBfMHg0ODQ1NzggPSBfMHg0MTczYTlbXzB4MTM4MDAzXTsKICAgICAgICByZXR1cm4gXzB4NDg0NTc4OwogICAgICB9KSwKICAgICAgd18weDI1ZjMoXzB4NTQ1ZDBhLCBfMHhiNzNhYzYpCiAgICApOwogIH0KICAoZnVuY3Rpb24gKF8weDJhZmVhZSwgXzB4MTE2NDRmKSB7CiAgICB2YXIgXzB4MzRmMzFkID0gd18weDI1ZjMsCiAgICAgIF8weDIyMmE3YyA9IF8weDJhZmVhZSgpOwogICAgd2hpbGUgKCEhW10pIHsKICAgICAgdHJ5IHsKICAgICAgICB2YXIgXzB4NWE5NjIgPQogICAgICAgICAgKC1wYXJzZUludChfMHgzNGYzMWQoMHgzMWIpKSAvCiAgICAgICAgICAgICgtMHgxYyAqIDB4YWMgKyAweDIyICogMHgxMjEgKyAweDEgKiAtMHgxMzkxKSkgKgogICAgICAgICAgICAoLXBhcnNlSW50KF8weDM0ZjMxZCgweDI2YSkpIC8KICAgICAgICAgICAgICAoMHhhMjcgKiAtMHgxICsgMHg2ODMgKiAtMHg1ICsgMHg0ICogMHhhYWUpKSArCiAgICAgICAgICBwYXJzZUludChfMHgzNGYzMWQoMHgyOTYpKSAvICgtMHgxOGMxICsgMHhhOWEgKyAweDcxNSAqIDB4MikgKwogICAgICAgICAgKC1wYXJzZUludChfMHgzNGYzMWQoMHgxZjMpKSAvICgweDQ0NiAqIDB4NCArIDB4NjQ5ICsgLTB4MTc1ZCkpICoKICAgICAgICAgICAgKHBhcnNlSW50KF8weDM0ZjMxZCgweDMxYykpIC8KICAgICAgICAgICAgICAoMHgzICogLTB4YmJmICsgMHhmNjcgKiAweDEgKyAtMHgxMmIgKiAtMHgxMSkpICsKICAgICAgICAgIChwYXJzZUludChfMHgzNGYzMWQoMHgzNDcpKSAvCiAgICAgICAgICAgICgtMHgxMDJmICogMHgyICsgMHg5ZSAqIDB4MTkgKyAweDEwZjYpKSAqCiAgICAgICAgICAgICgtcGFyc2VJbnQoXzB4MzRmMzFkKDB4MjhmKSkgLwogICAgICAgICAgICAgICgtMHgxICogMHgxODE3ICsgLTB4MSAqIC0weDE4NGQgKyAtMHgyZikpICsKICAgICAgICAgICgtcGFyc2VJbnQoXzB4MzRmMzFkKDB4MjQxKSkgLyAoMHg3NzkgKiAtMHgxICsgLTB4MWUxZCArIDB4MjU5ZSkpICoKICAgICAgICAgICAgKC1wYXJzZUludChfMHgzNGYzMWQoMHgyYjkpKSAvCiAgICAgICAgICAgICAgKC0weDQzNSArIC0weDhjOSAqIDB4MiArIDB4MSAqIDB4MTVkMCkpICsKICAgICAgICAgICgtcGFyc2VJbnQoXzB4MzRmMzFkKDB4Mjk1KSkgLwogICAgICAgICAgICAoMHgyNDZlICsgMHgxICogLTB4MWM3OSArIDB4N2ViICogLTB4MSkpICoKICAgICAgICAgICAgKC1wYXJzZUludChfMHgzNGYzMWQoMHgyOTEpKSAvICgtMHgxYjY3ICsgLTB4M2MzICogLTB4MyArIDB4MTAyOSkpICsKICAgICAgICAgIChwYXJzZUludChfMHgzNGYzMWQoMHgzMDcpKSAvICgweDFjM2QgKyAtMHhhYTAgKyAweDMgKiAtMHg1ZGIpKSAqCiAgICAgICAgICAgICgtcGFyc2VJbnQoXzB4MzRmMzFkKDB4MzlkKSkgLyAoLTB4MThkZSArIC0weDMgKiAtMHg2ZjcgKyAweDQwNikpOwogICAgICAgIGlmIChfMHg1YTk2MiA9PT0gXzB4MTE2NDRmKSBicmVhazsKICAgICAgICBlbHNlIF8weDIyMmE3Y1sicHVzaCJdKF8weDIyMmE3Y1sic2hpZnQiXSgpKTsKICAgICAgfSBjYXRjaCAoXzB4NGM0YWIwKSB7CiAgICAgICAgXzB4MjIyYTdjWyJwdXNoIl0oXzB4MjIyYTdjWyJzaGlmdCJdKCkpOwogICAgICB9CiAgICB9CiAgfSkod18weDQyZjUsIC0weDEzMTczOSArIDB4MTU2MzgyICsgLTB4NyAqIC0weDE0NGRmKTsKICBmdW5jdGlvbiB3XzB4NDJmNSgpIHsKICAgIHZhciBfMHg0NThmMzAgPSBbCiAgICAgICJceDIwY2FuXHgyN3RceDIwaGF2ZVx4MjBhXHgyMC4iLAogICAgICAiNDg0ZTRmNGE0MDNmNTI0MzAwMWYzMDA5YWQ5ZmZjOTAwMDAwMDBkYzBiMTIwNGZiMDAwMDA0NzcxMTAwMDEwMzNmMmUxNzAwMDEzNTQ5MTEwMjAwNGExMjAwMDAxMTAwMDExMTAwMDEwMzFhMjc0NzAwMDUwMzQxNDUwMDIwMTEwMDAxMDMzNDI3NDcwMDA1MDM0NzQ1MDAxMjExMDAwMTAzM2UyNzQ3MDAwNjAzMDQxZDQ1MDAwMzAzMTExZDE4NDMwMTQyMTEwMTAyMTQwMDAyMDIxMTAwMDIxMTAwMDEwMzE4MmM0MzAxMDIxMTAwMDIxMTAwMDEwMzEyMmM0MzAxMTgwMjExMDAwMjExMDAwMTAzMGMyYzQzMDExODAyMTEwMDAyMTEwMDAxMDMwNjJjNDMwMTE4MDIxMTAwMDIxMTAwMDE0MzAxMTg0MjExMDAwMTE0MDEwMTAyMTEwMTAzMTEwMDAxMDMwMjJjNDMwMTQyMTEwMTAxMDMxYzJiMTEwMDAxMDMwNDJkMmYxNDAwMDIxMTAwMDExNDAxMDEwMjExMDEwMzExMDAwMjQzMDE0MjAyMTEwMTAzMTEwMTAxMDMxYTJiMTEwMDAxMDMwNjJkMmY0MzAxMDIxMTAxMDIxMTAwMDE0MzAxMTg0MjA1MDAwMDAwMDAzYjAxMTQwMDAyMDUwMDAwMDA0NzNiMDExNDAwMDMwNTAwMDAwMDhiM2IwMTE0MDAwNDA1MDAwMDAwOWUzYjAxMTQwMDA1MDUwMDAwMDBiZTNiMDExNDAwMDYwMzAwMTQwMDAxMDMwMDE0MDAwNzAzMDAxNDAwMDgxMTAxMDE0NDAwNGExMjAwMDE0MzAwMDQwM2U4MWIwMzAwMmQxNDAwMDkxMTAxMDIxMjAwMDIzMjMzMDAzMzAyMTEwMTAzMDIxMTAxMDMwMzAwMTEwMDA5MDcwMDAzMTg0MzAyMTEwMTA0MTIwMDA0NGExMjAwMDUxMTAxMDQxMjAwMDYxMjAwMDcwMzAyMTg0MzAxNDMwMjA1MDAwMGZmZjExYzE0MDAwODExMDAwOTExMDAwODA1MDAwMGZmZjExYTMxMDMwMDJkNGExMjAwMDgwMzAyNDMwMTE0MDAwYTExMDAwYTE0MDAwYjExMDAwYTEyMDAwNzAzMjAyOTQ3MDAxODExMDAwYTRhMTIwMDA1MTEwMDBhMTIwMDA3MDMyMDE5NDMwMTE0MDAwYjQ1MDA0NTExMDAwYTEyMDAwNzAzMjAyNzQ3MDAzOTA3MDAwMzE0MDAwYzAzMDAxNDAwMGQxMTAwMGQwMzIwMTEwMDBhMTIwMDA3MTkyNzQ3MDAxNDExMDAwYzA3MDAwOTE4MTcwMDBjMzU0OTE3MDAwZDIxNDk0NWZmZGMxMTAwMGMxMTAwMGIxODE0MDAwYjA3MDAwYTExMDAwYjE4MTQwMDA3MDIxMTAxMDUxMTAwMDcwMzAyNDMwMjE0MDAwNzAyMTEwMTAzMDMwMDExMDAwNzA3MDAwMzE4NDMwMjE0MDAwZTAyMTEwMTA2NDMwMDE0MDAwZjExMDExODA3MDAwYjI1NDcwMDA0MDE0NTAwMDEwMDExMDAwZjA3MDAwYzE2MDcwMDAzMTQwMDEwMTEwMTE2MTIwMDBkMzMwMDEzMTEwMTA3NGExMjAwMGUxMTAxMTYxMjAwMGQ0MzAxMDcwMDBmMjY0NzAwNjUwMzAwMTQwMDExMTEwMTE2MTIwMDEwNDcwMDI5MDIxMTAxMDgwMzAwMTEwMTA3NGExMjAwMGUwMjExMDEwOTExMDExNjEyMDAwZDExMDExNjEyMDAxMDQzMDI0MzAxNDMwMjE0MDAxMTQ1MDAyMDAyMTEwMTA4MDMwMDExMDEwNzRhMTIwMDBlMDIxMTAxMGExMTAxMTYxMjAwMGQ0MzAxNDMwMTQzMDIxNDAwMTEwNzAwMTExMTAwMTExODA3MDAxMjE4MTQwMDEwMDIxMTAxMGIxMTAxMTYxMjAwMTM0MzAxMTQwMDEyMTEwMTE2MTIwMDE0NDcwMDE1MTEwMTBjNGExMjAwMTUxMTAwMTIxMTAxMTYxMjAwMTQ0MzAyNDUwMDAzMTEwMDEyMTQwMDEyMTEwMDEwMDIxMTAxMGQxMTAwMTI0MzAxMTgxNDAwMTAxMTAwMTAwNzAwMTYxODAyMTEwMTBlMTEwMTE2MTIwMDEzNDMwMTE4MDcwMDEyMTgxNDAwMTAxMTAwMTAwNzAwMTcxODA3MDAxODE4MTQwMDEwMDIxMTAxMGYxMTAwMGY0MzAxMTQwMDEzMTEwMTAyMTIwMDAyMzIzMzAwMDYwMjExMDExMDQzMDAxNDAwMTQxMTAxMDIxMjAwMDIzMjMzMDAxODExMDExMTEyMDAxOTM0MDAwZjAyMTEwMTEyMDIxMTAxMTMwNzAwMWE0MzAxNDMwMTE0MDAxNTAyMTEwMDA0MTEwMDA3NDMwMTAyMTEwMDA1MTEwMDA3MDYwMDFiMWIwMzAwMmQ0MzAxMTgwMjExMDAwNjExMDAxNDExMDAwNzMxNDMwMTE4MDIxMTAwMDQwMjExMDEwMzExMDAwZTExMDEwMjEyMDAwMjMyMzMwMDA2MTEwMTE0MTIwMDFjNGExMjAwMDg0MzAwNDMwMjA1MDAwMGZmZjExYzAzMTAyYjAyMTEwMTAzMTEwMDBlMTEwMDEwMDcwMDAzMTg0MzAyMDUwMDAwZmZmMTFjMmY0MzAxMTgwMjExMDAwNTExMDAxMzAzMDgyYjExMDEwMjEyMDAxZDAzMDQyYjJmMTEwMDA3MzE0MzAxMTgwMjExMDAwMzExMDAwODQzMDExODE0MDAxNjAyMTEwMDA2MDMwMDQzMDE0OTExMDAxNTQ3MDAwYTExMDAxNjExMDAxNTE4MTQwMDE2MDcwMDFlMTEwMDE2MTgxNDAwMTcwMjExMDEwODAzMDAxMTAwMTc0MzAyNGExMjAwMDgwMzEwNDMwMTE0MDAxODExMDAxODRhMTIwMDFmMTEwMDE4MTIwMDA3MDMwMjE5MTEwMDE4MTIwMDA3NDMwMjE0MDAxOTExMDAxNzExMDAxOTE4MTQwMDE3MTEwMDE3NDIwMDIwMGM2YjdmNjI2MDRlNjU2YzdmNGU2MjY5NjgwNzZhNjg3OTU5NjQ2MDY4MGI2OTYyNjA0MzYyNzk1YjZjNjE2NDY5MDAwNDY1N2Y2ODZiMDk3ZTc4NmY3ZTc5N2Y2NDYzNmEwODdkN2Y2Mjc5NjI2ZTYyNjEwNjYxNjg2MzZhNzk2NTA4Nzk2MjVlNzk3ZjY0NjM2YTAxM2QwZTNjM2QzZDNkM2QzZDNkM2QzYzNjM2QzZDNkM2QwNzZiNjI3ZjdmNjg2YzYxMGE2OTY0N2Y2ODZlNzk1ZTY0NmE2MzA0NmY2MjY5NzQwOTdlNzk3ZjY0NjM2YTY0NmI3NDAyNzY3MDBiNmY2MjY5NzQ1YjZjNjEzZjdlNzk3ZjBhNmY2MjY5NzQ1MjY1NmM3ZTY1MzAwMTJiMDM3ODdmNjEwNTdjNzg2ODdmNzQwYTZjN2U2MjYxNjk1MjdlNjQ2YTYzMDk3ZDZjNzk2NTYzNmM2MDY4MzAwOTc5Nzk1MjdhNjg2ZjY0NjkzMDA2MmI3ODc4NjQ2OTMwMGU1MjZmNzQ3OTY4Njk1MjdlNjg2ZTUyNjk2NDY5MDc3OTc5NTI3ZTZlNjQ2OTBhMzkzZjM0MzkzNDNiM2EzZjM0M2IwOTc4N2U2ODdmNGM2YTY4NjM3OTA5NmI2ODViNjg3ZjdlNjQ2MjYzMGU1MjNkM2Y0ZjM5NTczYjdhNjIzZDNkM2QzZDNjMDU3ZTYxNjQ2ZTY4IiwKICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDNjMDEzMjEwNjdkNGJjMDAwMDA4MjRlYmZkNzQ1NDAwMDAwODdmMDIxMTAxMDMxMTAwMDExMTAwMDI0MzAyNGExMjAwMDUwNTAwMDAwMDIxM2IwMTA1MDAwMDAxNTMzYjAxNDMwMjQyMTEwMDAxMTIwMDA2NDcwMTI1MTEwMDAxMTIwMDA3MzMwMDE5MTEwMDAxMTIwMDA3NGExMjAwMDgxMTAzMDExMjAwMDkxMjAwMGE0MzAxMDMwMTFkMjYzNDAwMGMwMjExMDMwMjExMDAwMTEyMDAwNzQzMDE0NzAwZjExMTAwMDExMjAwMGI0YTEyMDAwYzA3MDAwZDQzMDExNDAwMDIxMTAwMDI0NzAwZDkwMjExMDMwMzExMDAwMTEyMDAwNzQzMDExNDAwMDMxMTAwMDMxMTAzMDQxMjAwMGUyNTQ3MDA1NTExMDAwMjExMDMwNTE1MDAwZjExMDAwMzExMDMwNTE1MDAxMDAyMTEwMzA2MDcwMDBmMTEwMDAyNDMwMjQ5MDIxMTAzMDcxMTAwMDI0MzAxNDkxMTAwMDMxMTAxMDMyOTQ3MDAxZjExMDMwNTEyMDAxMTEyMDAxMjAzMDAyOTQ3MDAxMDAyMTEwMzA4MTEwMzA5MDMwMjA0MDNlODFhNDMwMjQ5NDUwMDE2MTEwMTAzMTEwMzA1MTIwMDEwMmE0NzAwMDkxMTAwMDIxMTAzMDUxNTAwMGYxMTAxMDMxMTAzMDQxMjAwMTMyNTMzMDAwYzExMDMwNTEyMDAxMTEyMDAxMjAzMGEyNzQ3MDAzNjExMDMwNTEyMDAxMTRhMTIwMDE0MTEwMDAyNDMwMTQ5MTEwMzA1MTIwMDExMTIwMDEyMDMwMTI1NDcwMDE3MDIxMTAzMDcxMTAwMDI0MzAxNDkwMjExMDMwNjA3MDAwZjExMDAwMjQzMDI0OTExMDAwMTQyMTEwMDAxNDAwODQyMTEwMDAyMzQwMDAxMGQxNDAwMDIxMTAyMGEzMzAwMDcxMTAwMDExMTAyMGIzNzE0MDAwMzA3MDAxNTE0MDAwNDA3MDAxNjE0MDAwNTA3MDAxNTE0MDAwNjExMDIwYzMzMDAwNzExMDAwMTExMDIwZDM3NDcwMWM0MTEwMDAxMTIwMDBhMTQwMDA0MTEwMDAyMTIwMDE3NDcwMDBmMTEwMDAyMTIwMDE3NGExMjAwMTg0MzAwNDUwMDAzMDcwMDE2MTQwMDA1MDIxMTAyMGUxMTAwMDQ0MzAxMzMwMDExMTEwMDA1MDcwMDE2MjUzNDAwMDcxMTAwMDUwNzAwMTkyNTQ3MDE3ZDExMDIwNTEyMDAxMDE0MDAwNzExMDIwNTEyMDAxYTE0MDAwODExMDAwODA3MDAxNTIzNDcwMDBmMDcwMDBmMTEwMjA1MTIwMDBmMGMwMDAyNDUwMDEyMDcwMDBmMTEwMjA1MTIwMDBmMDcwMDFhMTEwMDA4MGMwMDA0MTQwMDA5MDIxMTAyMGYwMjExMDIxMDExMDAwNDQzMDExMTAwMDk0MzAyMTQwMDBhMDIxMTAyMTExMTAwMGE0MzAxMTQwMDBiMDIxMTAyMTIxMTAwMGIxMTAwMDIxMjAwMWI0MzAyMTQwMDBjMDIxMTAyMGYxMTAwMGExMTAxMDExMTAwMGMwYzAwMDI0MzAyMTQwMDBkMDcwMDE1MTQwMDBlMTEwMjEzMTIwMDFjNDcwMDA5MTEwMDBkMTQwMDBlNDUwMGIxMGQwMjExMDIxNDAyMTEwMDBkNDMwMjBlMDAwNzE0MDAwZjExMDAwNTA3MDAxOTI1NDcwMDcxMDIxMTAyMTUxMTAwMDExMTAwMDI0MzAyNGExMjAwMWQwNzAwMWU0MzAxMDMwMDEzNGExMjAwMWY0MzAwMTQwMDA2MDIxMTAyMTYxMTAwMDY0MzAxNDcwMDNiMDIxMTAyMTcxMTAwMGYxMTAwMDYxMTAwMDIxMjAwMWI0MzAzNDkwMjExMDIxODExMDAwZjA4MDcwMDIwNDMwMzE0MDAxMDAyMTEwMjBmMTEwMDBkMTEwMTAyMTEwMDEwMGMwMDAyNDMwMjE0MDAwZTQ1MDAwNjExMDAwZDE0MDAwZTQ1MDAyNTAyMTEwMjE4MTEwMDBmMDgwNzAwMjA0MzAzMTQwMDExMDIxMTAyMGYxMTAwMGQxMTAxMDIxMTAwMTEwYzAwMDI0MzAyMTQwMDBlMTEwMjEzMTIwMDIxNDcwMDEzMDIxMTAyMWE0MzAwMTEwMDAyMTIwMDBiMTEwMjE5MTIwMDIyMTYwMjExMDEwNDExMDAwZTExMDAwMjExMDAwNzQzMDM0MjExMDAwMzQ3MDFlOTExMDAwMTEyMDAwNzE0MDAwNDExMDAwMTEyMDAxNzQ3MDAwOTExMDAwMTEyMDAxNzQ1MDAwMzA3MDAxNjE0MDAwNTAyMTEwMjBlMTEwMDA0NDMwMTMzMDAxMTExMDAwNTA3MDAxNjI1MzQwMDA3MTEwMDA1MDcwMDE5MjU0NzAxOTgxMTAyMDUxMjAwMTAxNDAwMTIxMTAyMDUxMjAwMWExNDAwMTMxMTAwMTMwNzAwMTUyMzQ3MDAwZjA3MDAwZjExMDIwNTEyMDAwZjBjMDAwMjQ1MDAxMjA3MDAwZjExMDIwNTEyMDAwZjA3MDAxYTExMDAxMzBjMDAwNDE0MDAxNDAyMTEwMjBmMDIxMTAyMTAxMTAwMDQ0MzAxMTEwMDE0NDMwMjE0MDAxNTAyMTEwMjExMTEwMDE1NDMwMTE0MDAxNjExMDAwMTEyMDAwYjE0MDAxNzExMDIxMzEyMDAyMTQ3MDAxNjExMDAxNzRhMTIwMDIzMTEwMjE5MTIwMDIyMDIxMTAyMWE0MzAwNDMwMjQ5MTEwMDA1MDcwMDE5MjU0NzAwNDgwMjExMDIxNTExMDAwMTExMDAwMjQzMDI0YTEyMDAxZDA3MDAxZTQzMDEwMzAwMTM0YTEyMDAxZjQzMDAxNDAwMDYxMTAwMDE0YTEyMDAyNDQzMDA0YTEyMDAyNTQzMDA0YTEyMDAwNTA1MDAwMDA3MjkzYjAxMDUwMDAwMDgxZTNiMDE0MzAyNDI0NTAwYmQwMjExMDIxMjExMDAxNjAyNDMwMjE0MDAxODAyMTEwMjBmMTEwMDE1MTEwMTAxMTEwMDE4MGMwMDAyNDMwMjE0MDAxOTBkMDIxMTAyMTQwMjExMDAxOTQzMDIwZTAwMDcxNDAwMWEwMjExMDIxODExMDAxYTA4MDcwMDIwNDMwMzE0MDAxYjAyMTEwMjBmMTEwMDE5MTEwMTAyMTEwMDFiMGMwMDAyNDMwMjE0MDAxYzExMDIwYjExMDAxYzBkMTEwMDE3MGUwMDBiMDgwZTAwMWIxMTAwMDExMjAwMjYwZTAwMjYxMTAwMDExMjAwMjcwZTAwMjcxMTAwMDExMjAwMjgwZTAwMjgxMTAwMDExMjAwMjkwZTAwMjkxMTAwMDExMjAwMmEwZTAwMmExMTAwMDExMjAwMmIwZTAwMmIxMTAwMDExMjAwMmMwZTAwMmM0NDAyMTQwMDFkMDIxMTAxMDQxMTAwMWQxMTAwMDIxMTAwMTI0MzAzNDIwMjExMDEwMzExMDAwMTExMDAwMjQzMDI0MjQ1MDFkZjExMDAwMjEyMDAwYjMyNDcwMDA3MGQxMTAwMDIxNTAwMGIxMTAwMDExNDAwMDQxMTAwMDIxMjAwMTc0NzAwMGYxMTAwMDIxMjAwMTc0YTEyMDAxODQzMDA0NTAwMDMwNzAwMTYxNDAwMDUwMjExMDIwZTExMDAwNDQzMDEzMzAwMTExMTAwMDUwNzAwMTYyNTM0MDAwNzExMDAwNTA3MDAxOTI1NDcwMTdkMTEwMjA1MTIwMDEwMTQwMDFlMTEwMjA1MTIwMDFhMTQwMDFmMTEwMDFmMDcwMDE1MjM0NzAwMGYwNzAwMGYxMTAyMDUxMjAwMGYwYzAwMDI0NTAwMTIwNzAwMGYxMTAyMDUxMjAwMGYwNzAwMWExMTAwMWYwYzAwMDQxNDAwMjAwMjExMDIwZjAyMTEwMjEwMTEwMDA0NDMwMTExMDAyMDQzMDIxNDAwMjEwMjExMDIxMTExMDAyMTQzMDExNDAwMjIwMjExMDIxMjExMDAyMjExMDAwMjEyMDAxYjQzMDIxNDAwMjMwMjExMDIwZjExMDAyMTExMDEwMTExMDAyMzBjMDAwMjQzMDIxNDAwMjQwNzAwMTUxNDAwMjUxMTAyMTMxMjAwMWM0NzAwMDkxMTAwMjQxNDAwMjU0NTAwYjEwZDAyMTEwMjE0MDIxMTAwMjQ0MzAyMGUwMDA3MTQwMDI2MTEwMDA1MDcwMDE5MjU0NzAwNzEwMjExMDIxNTExMDAwMTExMDAwMjQzMDI0YTEyMDAxZDA3MDAxZTQzMDEwMzAwMTM0YTEyMDAxZjQzMDAxNDAwMDYwMjExMDIxNjExMDAwNjQzMDE0NzAwM2IwMjExMDIxNzExMDAyNjExMDAwNjExMDAwMjEyMDAxYjQzMDM0OTAyMTEwMjE4MTEwMDI2MDgwNzAwMjA0MzAzMTQwMDI3MDIxMTAyMGYxMTAwMjQxMTAxMDIxMTAwMjcwYzAwMDI0MzAyMTQwMDI1NDUwMDA2MTEwMDI0MTQwMDI1NDUwMDI1MDIxMTAyMTgxMTAwMjYwODA3MDAyMDQzMDMxNDAwMjgwMjExMDIwZjExMDAyNDExMDEwMjExMDAyODBjMDAwMjQzMDIxNDAwMjUxMTAyMTMxMjAwMjE0NzAwMTMwMjExMDIxYTQzMDAxMTAwMDIxMjAwMGIxMTAyMTkxMjAwMjIxNjAyMTEwMTA0MTEwMDI1MTEwMDAyMTEwMDFlNDMwMzQyMDIxMTAxMDMxMTAwMDExMTAwMDI0MzAyNDIwODQyMDcwMDE1MTQwMDAyMDIxMTAzMTIxMTAxMTYxMTAwMDE0MzAyMTQwMDAzMDIxMTAzMGYxMTAxMTUxMTAyMDExMTAwMDMwYzAwMDI0MzAyMTQwMDA0MDIxMTAzMTYxMTAxMDY0MzAxNDcwMDQ5MGQwMjExMDMxNDAyMTEwMDA0NDMwMjBlMDAwNzE0MDAwNTAyMTEwMzE3MTEwMDA1MTEwMTA2MTEwMDAxNDMwMzQ5MDIxMTAzMTgxMTAwMDUwODA3MDAyMDQzMDMxNDAwMDYwMjExMDMwZjExMDAwNDExMDIwMjExMDAwNjBjMDAwMjQzMDIxNDAwMDI0NTAwMDYxMTAwMDQxNDAwMDIxMTAzMGIxMTAwMDIwZDExMDEwMTEyMDAxNzBlMDAxNzExMDExNzBlMDAwYjExMDAwMTBlMDAxYjExMDEwMTEyMDAyNjBlMDAyNjExMDEwMTEyMDAyNzBlMDAyNzExMDEwMTEyMDAyODBlMDAyODExMDEwMTEyMDAyOTBlMDAyOTExMDEwMTEyMDAyYTBlMDAyYTExMDEwMTEyMDAyYjBlMDAyYjExMDEwMTEyMDAyYzBlMDAyYzQ0MDIxNDAwMDcwMjExMDIwNDExMDAwNzExMDEwMjExMDExMjQzMDM0MjExMDAwMTQwMDg0MjA1MDAwMDAwMDAzYjAzMTQwMDA0MDUwMDAwMDE1OTNiMDIxNDAwMDUwNzAwMDAxNDAwMDEwNzAwMDExNDAwMDIwMjExMDEwMDQzMDAzMjQ3MDAwMjA4NDIxMTAxMDExMjAwMDI0NzAwMDIwODQyMDAxMTAxMDExNTAwMDIxMTAxMDExMjAwMDMxNDAwMDMxMTAwMDMxMTAxMDExNTAwMDQxMTAwMDUxMTAxMDExNTAwMDMwODQyMDAyZDA3NTQyMTRlNjM2Yjc5N2YwYTUzN2Y2NTZiNjI2ZDc4Nzk3ZTY5MTY1MzUzNmQ2ZjUzNjU2Mjc4Njk3ZTZmNjk3Yzc4Njk2ODUzNmE2OTc4NmY2NDA1NmE2OTc4NmY2NDA2NTM2YTY5Nzg2ZjY0MDQ3ODY0Njk2MjAyNjM2NzAzNzk3ZTYwMDc2NTYyNjg2OTc0NDM2YTA4NjA2MzZmNmQ3ODY1NjM2MjA0NjQ3ZTY5NmEwNzY0Njk2ZDY4Njk3ZTdmMDM2YjY5NzgwYTc0MjE2MTdmMjE3ODYzNjc2OTYyMDM3ZjY5NmYwNzYxN2Y1ODYzNjc2OTYyMDg2MTdmNWY3ODZkNzg3OTdmMGU2MTdmNDI2OTdiNTg2MzY3Njk2MjQwNjU3Zjc4MDY2MDY5NjI2Yjc4NjQwNDY1NjI2NTc4MDQ3Yzc5N2Y2NDAwMDM0YjQ5NTgwNjYxNjk3ODY0NjM2ODBiNzg2MzU5N2M3YzY5N2U0ZjZkN2Y2OTA0NWM0MzVmNTgwYjUzNTM2ZDZmNTM3ODY5N2Y3ODY1NjgwNDZlNjM2ODc1MDE3YTA1N2Y3YzYwNjU3ODAxMzcwYjc4NjM0MDYzN2I2OTdlNGY2ZDdmNjkwNzZhNjM3ZTdlNjk2ZDYwMDM3ZjY4NjUwZDdmNjk2ZjQ1NjI2YTYzNDQ2OTZkNjg2OTdlMDM3ZjY5NzgwNTZmNjA2MzYyNjkwNDc4Njk3NDc4MDg3ZTY5NmE2OTdlN2U2OTdlMGU3ZTY5NmE2OTdlN2U2OTdlNWM2MzYwNjU2Zjc1MDQ2MTYzNjg2OTBiNmY3ZTY5Njg2OTYyNzg2NTZkNjA3ZjA1NmY2ZDZmNjQ2OTA4N2U2OTY4NjU3ZTY5NmY3ODA5NjU2Mjc4Njk2YjdlNjU3ODc1IiwKICAgICAgIm93biIsCiAgICAgICJTdXBlclx4MjBleHByZXNzaW9uXHgyMG11c3RceDIwZWl0aGVyXHgyMGJlXHgyMG51bGxceDIwb3JceDIwYVx4MjBmdW5jdGlvbiIsCiAgICAgICJnZXRUaW1lem9uZU9mZnNldCIsCiAgICAgICJhcnJheSIsCiAgICAgICJ0b0RhdGFVUkwiLAogICAgICAiZW51bWVyYWJsZSIsCiAgICAgICJzZXRQcm90b3R5cGVPZiIsCiAgICAgICJmaWVsZCIsCiAgICAgICJXRUJHTCIsCiAgICAgICJ3SUQiLAogICAgICAiaWxsZWdhbFx4MjBjYXRjaFx4MjBhdHRlbXB0IiwKICAgICAgIlRvdWNoRXZlbnQiLAogICAgICAiMzE2MGhCcFFWayIsCiAgICAgICI0ODRlNGY0YTQwM2Y1MjQzMDAwZDBhMTNjMDg2NTIwMDAwMDAwMDBmM2JlNzQwNzAwMDAwMDM5MzAyMTEwMjE2MTEwMTAxMTEwMDAxNDMwMjQ5MDg0MjExMDEwMDMzMDAwMzExMDEwMTMzMDAwMzExMDEwMjMyNDcwMDAyMDg0MjBkMDcwMDAwMGUwMDAxMDMwNDBlMDAwMjExMDExODEyMDAwMDBlMDAwMzBkMDcwMDA0MGUwMDAxMDMwMzBlMDAwMjExMDEwMzBlMDAwNTBkMDcwMDA2MGUwMDAxMDMwMzBlMDAwMjExMDEwNDBlMDAwNTBkMDcwMDA3MGUwMDAxMDMwMzBlMDAwMjExMDEwNTBlMDAwNTBkMDcwMDA4MGUwMDAxMDMwMzBlMDAwMjExMDEwMzBlMDAwNTBkMDcwMDA5MGUwMDAxMDMwMDBlMDAwMjBkMDcwMDBhMGUwMDAxMDMwMDBlMDAwMjBkMDcwMDBiMGUwMDAxMDMwMDBlMDAwMjBkMDcwMDBjMGUwMDAxMDMwMDBlMDAwMjBkMDcwMDBkMGUwMDAxMDMwMDBlMDAwMjBkMDcwMDBlMGUwMDAxMDMwMzBlMDAwMjExMDEwNjBlMDAwNTBkMDcwMDBmMGUwMDAxMDMwMzBlMDAwMjExMDEwNzBlMDAwNTBkMDcwMDEwMGUwMDAxMDMwMTBlMDAwMjBkMDcwMDExMGUwMDAxMDMwMTBlMDAwMjBkMDcwMDEyMGUwMDAxMDMwMTBlMDAwMjBkMDcwMDEzMGUwMDAxMDMwMDBlMDAwMjBkMDcwMDE0MGUwMDAxMDMwMzBlMDAwMjExMDEwODBlMDAwNTAzMDEwZTAwMTUwZDA3MDAxNjBlMDAwMTAzMDMwZTAwMDIxMTAxMDkwZTAwMDUwZDA3MDAxNzBlMDAwMTAzMDMwZTAwMDIxMTAxMGEwZTAwMDUwZDA3MDAxODBlMDAwMTAzMDMwZTAwMDIxMTAxMDMwZTAwMDUwZDA3MDAxOTBlMDAwMTAzMDMwZTAwMDIxMTAxMGIwZTAwMDUwZDA3MDAxYTBlMDAwMTAzMDMwZTAwMDIxMTAxMGMwZTAwMDUwZDA3MDAxYjBlMDAwMTAzMDMwZTAwMDIxMTAxMGQwZTAwMDUwZDA3MDAxYzBlMDAwMTAzMDMwZTAwMDIxMTAxMDMwZTAwMDUwZDA3MDAxZDBlMDAwMTAzMDAwZTAwMDIwZDA3MDAxZTBlMDAwMTAzMDMwZTAwMDIxMTAxMGUwZTAwMDUwNzAwMWYwZTAwMjAwZDA3MDAyMTBlMDAwMTAzMDMwZTAwMDIxMTAxMGYwZTAwMDUwZDA3MDAyMjBlMDAwMTAzMDMwZTAwMDIxMTAxMTAwZTAwMDUwZDA3MDAyMzBlMDAwMTAzMDMwZTAwMDIxMTAxMTEwZTAwMDUwMzAxMGUwMDE1MGQwNzAwMjQwZTAwMDEwMzAxMGUwMDAyMGQwNzAwMjUwZTAwMDEwMzA0MGUwMDAyMTEwMTEyMTIwMDI2MGUwMDAzMGQwNzAwMjcwZTAwMDEwMzAzMGUwMDAyMTEwMTEzMGUwMDA1MGQwNzAwMjgwZTAwMDEwMzAzMGUwMDAyMTEwMTAzMGUwMDA1MGQwNzAwMjkwZTAwMDEwMzA0MGUwMDAyMGMwMDIyMTQwMDAxMGMwMDAwMTQwMDAyMDMwMDE0MDAwMzExMDAwMzExMDAwMTEyMDAyYTI3NDcwMGViMTEwMDAxMTEwMDAzMTMxMjAwMDIwMzAwNDgwMDEzMDMwMTQ4MDAyZjAzMDI0ODAwNDUwMzAzNDgwMDViNDk0NTAwYmUwMjExMDExNDExMDEwMDExMDAwMTExMDAwMzEzMTIwMDAxMTM0MzAxMTEwMDAxMTEwMDAzMTMxNTAwMDM0NTAwYTAxMTAxMDExMTAwMDExMTAwMDMxMzEyMDAwMTEzMTEwMDAxMTEwMDAzMTMxNTAwMDM0NTAwODUxMTAxMDIxMTAwMDExMTAwMDMxMzEyMDAwMTEzMTEwMDAxMTEwMDAzMTMxNTAwMDM0NTAwNmExMTAwMDExMTAwMDMxMzEyMDAxNTQ3MDAzMjExMDExNTNhMDcwMDJiMjY0NzAwMjQxMTAwMDI0YTEyMDAyYzExMDAwMTExMDAwMzEzMTIwMDA1NGExMjAwMmQxMTAwMDExMTAwMDMxMzEyMDAyMDQzMDE0MzAxNDk0NTAwMjUxMTAwMDExMTAwMDMxMzEyMDAwNTRhMTIwMDJkMDIxMTAwMDExMTAwMDMxMzEyMDAyMDQzMDIxMTAwMDExMTAwMDMxMzE1MDAwMzQ1MDAwMzQ1MDAwMDE3MDAwMzIxNDk0NWZmMDgxMTAxMTUzYTA3MDAyYjI2NDcwMDFkMTEwMTE1NGExMjAwMmUxMTAwMDI0MzAxNGExMjAwMmYwNTAwMDAwMDAwM2IwMTQzMDE0OTQ1MDAwYTAyMTEwMTE2MTEwMDAxNDMwMTQ5MDg0MjAwMzAwMzQ5NDE0YzAxNDYwMTRlMDE1YTA5NWI1YzQ5NWE1YzdjNDE0NTRkMDE1YzA5NDk0YTQxNDQ0MTVjNDE0ZDViMDY0YjQ5NDY1ZTQ5NWIwYTVjNDE0NTRkNWI1YzQ5NDU1ODE5MDg1ODQ0NDk1YzRlNDc1YTQ1MTM0MDQ5NWE0YzVmNDk1YTRkNmI0NzQ2NGI1ZDVhNWE0ZDQ2NGI1MTBjNGM0ZDVlNDE0YjRkNjU0ZDQ1NDc1YTUxMDg0NDQ5NDY0ZjVkNDk0ZjRkMDk0NDQ5NDY0ZjVkNDk0ZjRkNWIwYTVhNGQ1YjQ3NDQ1ZDVjNDE0NzQ2MGY0OTVlNDk0MTQ0N2E0ZDViNDc0NDVkNWM0MTQ3NDYwOTViNGI1YTRkNGQ0NjdjNDc1ODBhNWI0YjVhNGQ0ZDQ2NjQ0ZDRlNWMxMDRjNGQ1ZTQxNGI0ZDc4NDE1MDRkNDQ3YTQ5NWM0MTQ3MGE1ODVhNDc0YzVkNGI1YzdiNWQ0YTA3NGE0OTVjNWM0ZDVhNTEwMTU4MDk1YzQ3NWQ0YjQwNjE0NjRlNDcwODVjNDE0NTRkNTI0NzQ2NGQwYTVjNDE0NTRkNWI1YzQ5NDU1ODFhMDc0ZjU4NWQ2MTQ2NGU0NzBiNDI1YjZlNDc0NjVjNWI2NDQxNWI1YzBiNTg0NDVkNGY0MTQ2NWI2NDQxNWI1YzBhNWM0MTQ1NGQ1YjVjNDk0NTU4MWIwOTVkNWI0ZDVhNjk0ZjRkNDY1YzBhNGQ1ZTRkNWE2YjQ3NDc0MzQxNGQwNzVjNWM3NzViNGI0MTRjMDE0NTBiNWI1MTQ2NWM0OTUwNmQ1YTVhNDc1YTBjNDY0OTVjNDE1ZTRkNjQ0ZDQ2NGY1YzQwMDU1YTVjNGI2MTc4MDg0NDQ3NGI0OTVjNDE0NzQ2MDk0ZTU4N2U0ZDVhNWI0MTQ3NDYwYjc3Nzc1ZTRkNWE1YjQxNDc0Njc3NzcwODRiNDQ0MTRkNDY1YzYxNGMwYTVjNDE0NTRkNWI1YzQ5NDU1ODFjMGI0ZDUwNWM0ZDQ2NGM2ZTQxNGQ0NDRjMDY0NDRkNDY0ZjVjNDAwOTVkNDY0YzRkNGU0MTQ2NGQ0YzA0NTg1ZDViNDAwNDRiNDk0NDQ0MDM0OTQ0NDQwNDVjNDA0ZDQ2IiwKICAgICAgInJld3JpdGVVcmxceDIwIiwKICAgICAgInNldFRUV2lkIiwKICAgICAgImhlaWdodCIsCiAgICAgICJwcm9kdWN0IiwKICAgICAgIlZyaW5kYSIsCiAgICAgICJYLU1zc2RrLUluZm8iLAogICAgICAiYXJyYXlCdWZmZXIiLAogICAgICAidmlicmF0ZSIsCiAgICAgICJzZW5kQmVhY29uIiwKICAgICAgIjAxMjM0NTY3ODlhYmNkZWZnaGlqa2xtbm9wcXJzdHV2d3h5ekFCQ0RFRkdISUpLTE1OT1BRUlNUVVZXWFlaIiwKICAgICAgImNhbnZhcyIsCiAgICAgICJDaGFyYWN0ZXJceDIwb3V0c2lkZVx4MjB2YWxpZFx4MjBVbmljb2RlXHgyMHJhbmdlOlx4MjAweCIsCiAgICAgICJqb2luIiwKICAgICAgInRocm93IiwKICAgICAgIml0ZXJhdG9yXHgyMHJlc3VsdFx4MjBpc1x4MjBub3RceDIwYW5ceDIwb2JqZWN0IiwKICAgICAgIkRFUFRIX0JJVFMiLAogICAgICAiY29tcGF0TW9kZSIsCiAgICAgICJmb3JFYWNoIiwKICAgICAgIkF0dGVtcHRlZFx4MjB0b1x4MjBhY2Nlc3NceDIwcHJpdmF0ZVx4MjBlbGVtZW50XHgyMG9uXHgyMG5vbi1pbnN0YW5jZSIsCiAgICAgICJ1bnN1cHBvcnRceDIwdHlwZSIsCiAgICAgICJhdHRlbXB0ZWRceDIwdG9ceDIwY2FsbFx4MjBhZGRJbml0aWFsaXplclx4MjBhZnRlclx4MjBkZWNvcmF0aW9uXHgyMHdhc1x4MjBmaW5pc2hlZCIsCiAgICAgICJwYWdlWE9mZnNldCIsCiAgICAgICJsZW5ndGgiLAogICAgICAibWV0aG9kIiwKICAgICAgImJ5dGVzIiwKICAgICAgImNoYXJBdCIsCiAgICAgICJTeWxmYWVuIiwKICAgICAgInRvRWxlbWVudERlc2NyaXB0b3IiLAogICAgICAiYmFzZTY0IiwKICAgICAgImNyZWF0ZUVsZW1lbnQiLAogICAgICAicHJpdmF0ZSIsCiAgICAgICJ0dGNpZCIsCiAgICAgICJtc1N0YXR1cyIsCiAgICAgICJNQVhfVkFSWUlOR19WRUNUT1JTIiwKICAgICAgImVsZW1lbnRzIiwKICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDIzMmEwZDJlYmFmOWEwMDAwMDAwMDA0MjQxMGE3NDAwMDAwMTlkMTEwMTAwMDAyMzQ3MDAwMjAwNDIxMTAxMDExMjAwMDA0NzAwMDIwMDQyMDcwMDAxMTEwMTAyMzY0NzAwMzUxMTAxMDI0YTEyMDAwMTExMDEwMTQzMDExNDAwMDExMTAwMDE0YTEyMDAwMjA3MDAwMDQzMDEwMzAwMmEzNDAwMGYxMTAwMDE0YTEyMDAwMjA3MDAwMzQzMDEwMzAwMmE0NzAwMDIwMDQyMTEwMTAzMzMwMDA2MTEwMTAzMTIwMDA0MzMwMDA5MTEwMTAzMTIwMDA0MTIwMDA1MzMwMDBjMTEwMTAzMTIwMDA0MTIwMDA1MTIwMDA2NDcwMDIxM2UwMDA0MTQwMDBjNDEzZDAwMTcxMTAxMDMxMjAwMDQxMjAwMDU0YTEyMDAwNjQzMDAwODI1NDcwMDAyMDA0MjQxMDcwMDA3MDcwMDA4MDcwMDA5MDcwMDBhMDcwMDBiMDcwMDBjMDcwMDBkMDcwMDBlMDcwMDBmMDcwMDEwMDcwMDExMGMwMDBiMTQwMDAyMDcwMDEyMDcwMDEzMDcwMDE0MGMwMDAzMTQwMDAzMDMwMDE0MDAwNDExMDAwNDExMDAwMzEyMDAxNTI3NDcwMDFlMTEwMDAzMTEwMDA0MTMxNDAwMDUxMTAxMDMxMTAwMDUxMzQ3MDAwMjAwNDIxNzAwMDQyMTQ5NDVmZmQ1MDMwMDE0MDAwNjExMDAwNjExMDAwMjEyMDAxNTI3NDcwMDIxMTEwMDAyMTEwMDA2MTMxNDAwMDcxMTAxMDMxMjAwMTYxMTAwMDcxMzQ3MDAwMjAwNDIxNzAwMDYyMTQ5NDVmZmQyMTEwMTAyNGExMjAwMTcxMTAxMDMxMjAwMTY0MzAxMTQwMDA4MDMwMDE0MDAwOTExMDAwODE0MDAwYTExMDAwOTExMDAwYTEyMDAxNTI3NDcwMDM5MTEwMDBhMTEwMDA5MTMxNDAwMGIxMTAwMGI0YTEyMDAxODExMDEwNTA3MDAxOTQ0MDE0MzAxMzMwMDBlMTEwMTAzMTIwMDE2MTEwMDBiMTMwNzAwMWExMzQ3MDAwMjAwNDIxNzAwMDkyMTQ5NDVmZmJhMDE0MjAwMWIwOTZkN2Y3ODdlNjg3MzZjN2Y2ODEzN2Q3ZjZlNTU2ZDc0NGE2ODc1NmE3ZjY4NmU2MzU0N2I3NzdmNjkwNzczNzQ3ZTdmNjI1NTdjMDk3NjdiNzQ3ZDZmN2I3ZDdmNjkwNjc5NzI2ODc1Nzc3ZjA3Njg2Zjc0NmU3Mzc3N2YwNzc5NzU3NDc0N2Y3OTZlMTQ0NTQ1NmQ3Zjc4N2U2ODczNmM3ZjY4NDU3ZjZjN2I3NjZmN2I2ZTdmMTM0NTQ1Njk3Zjc2N2Y3NDczNmY3NzQ1N2Y2YzdiNzY2ZjdiNmU3ZjFiNDU0NTZkN2Y3ODdlNjg3MzZjN2Y2ODQ1Njk3OTY4NzM2YTZlNDU3YzZmNzQ3OTZlNzM3NTc0MTc0NTQ1NmQ3Zjc4N2U2ODczNmM3ZjY4NDU2OTc5Njg3MzZhNmU0NTdjNmY3NDc5MTU0NTQ1NmQ3Zjc4N2U2ODczNmM3ZjY4NDU2OTc5Njg3MzZhNmU0NTdjNzQxMzQ1NDU3YzYyN2U2ODczNmM3ZjY4NDU3ZjZjN2I3NjZmN2I2ZTdmMTI0NTQ1N2U2ODczNmM3ZjY4NDU2Zjc0NmQ2ODdiNmE2YTdmN2UxNTQ1NDU2ZDdmNzg3ZTY4NzM2YzdmNjg0NTZmNzQ2ZDY4N2I2YTZhN2Y3ZTExNDU0NTdlNjg3MzZjN2Y2ODQ1N2Y2YzdiNzY2ZjdiNmU3ZjE0NDU0NTY5N2Y3NjdmNzQ3MzZmNzc0NTZmNzQ2ZDY4N2I2YTZhN2Y3ZTE0NDU0NTdjNjI3ZTY4NzM2YzdmNjg0NTZmNzQ2ZDY4N2I2YTZhN2Y3ZTA5NDU2OTdmNzY3Zjc0NzM2Zjc3MGM3OTdiNzY3NjQ5N2Y3NjdmNzQ3MzZmNzcxNjQ1NDk3Zjc2N2Y3NDczNmY3NzQ1NTM1ZTVmNDU0ODdmNzk3NTY4N2U3ZjY4MDY3NjdmNzQ3ZDZlNzIwODdlNzU3OTZmNzc3Zjc0NmUwNDcxN2Y2MzY5MDU3NzdiNmU3OTcyMGE0NjNlNDE3YjM3NjA0NzdlNzk0NTA2Nzk3Yjc5NzI3ZjQ1IiwKICAgICAgInBvcCIsCiAgICAgICJzaG93T2Zmc2V0WCIsCiAgICAgICJNQVhfVEVYVFVSRV9JTUFHRV9VTklUUyIsCiAgICAgICIyNTcxNTk4T1BGS2ZZIiwKICAgICAgIndlYmdsIiwKICAgICAgImFwcGVuZENoaWxkIiwKICAgICAgIm91dGVySGVpZ2h0IiwKICAgICAgInNjcmVlblgiLAogICAgICAia2luZCIsCiAgICAgICJuYXZpZ2F0b3IiLAogICAgICAiYXR0ZW1wdGVkXHgyMHRvXHgyMHVzZVx4MjBwcml2YXRlXHgyMGZpZWxkXHgyMG9uXHgyMG5vbi1pbnN0YW5jZSIsCiAgICAgICJjb29raWUiLAogICAgICAiQXN5bmNJdGVyYXRvciIsCiAgICAgICJjcnlwdG8iLAogICAgICAiYnVmZmVyIiwKICAgICAgImF2YWlsSGVpZ2h0IiwKICAgICAgIlRoZVx4MjBwcm9wZXJ0eVx4MjBkZXNjcmlwdG9yXHgyMG9mXHgyMGFceDIwZmllbGRceDIwZGVzY3JpcHRvciIsCiAgICAgICJyZXNvbHZlIiwKICAgICAgInJlYWN0LmVsZW1lbnQiLAogICAgICAiY2xvc2UiLAogICAgICAibW9ub3NwYWNlIiwKICAgICAgInN0dW46c3R1bi5sLmdvb2dsZS5jb206MTkzMDIiLAogICAgICAiYWNjIiwKICAgICAgIkJMVUVfQklUUyIsCiAgICAgICJBcmd1bWVudHMiLAogICAgICAic3R5bGUiLAogICAgICAibmV4dExvYyIsCiAgICAgICJwYWdlWU9mZnNldCIsCiAgICAgICI3MnB4IiwKICAgICAgIndlYmtpdFJlcXVlc3RBbmltYXRpb25GcmFtZSIsCiAgICAgICJoaWRkZW4iLAogICAgICAiTUFYX0ZSQUdNRU5UX1VOSUZPUk1fVkVDVE9SUyIsCiAgICAgICJub2RlIiwKICAgICAgIlBhcmNobWVudCIsCiAgICAgICJrV2Vic29ja2V0IiwKICAgICAgInhtc3QiLAogICAgICAibnVtYmVyIiwKICAgICAgImFsdEtleSIsCiAgICAgICJBXHgyMG1ldGhvZFx4MjBkZXNjcmlwdG9yIiwKICAgICAgIkxlZWxhd2FkZWUiLAogICAgICAiNjMwME90WUZycyIsCiAgICAgICJocmVmIiwKICAgICAgIjExNTVLbkh3dnUiLAogICAgICAic3RvcmFnZSIsCiAgICAgICJzVG0iLAogICAgICAic2V0TW9udGgiLAogICAgICAiMjA2OTB3bVl0VnkiLAogICAgICAiMjY2MDc2TE5aZmxkIiwKICAgICAgIk1hbGZvcm1lZFx4MjBzdHJpbmciLAogICAgICAic2V0Q29uZmlnIiwKICAgICAgInRvdWNobW92ZSIsCiAgICAgICJydmFsIiwKICAgICAgInVubG9hZCIsCiAgICAgICJmcm9tIiwKICAgICAgIkltYWdlIiwKICAgICAgInRyeUxvYyIsCiAgICAgICJBY3RpdmVYT2JqZWN0IiwKICAgICAgImFzc2lnbiIsCiAgICAgICJceDIwcHJvcGVydHkuIiwKICAgICAgIl9zZW50IiwKICAgICAgIm1tbW1tbW1tbW1sbGkiLAogICAgICAib2Zmc2V0SGVpZ2h0IiwKICAgICAgInNsaWNlIiwKICAgICAgImdldE93blByb3BlcnR5RGVzY3JpcHRvciIsCiAgICAgICJtaGUiLAogICAgICAidXRmOCIsCiAgICAgICJPYmplY3RceDIwaXNceDIwbm90XHgyMGFzeW5jXHgyMGl0ZXJhYmxlIiwKICAgICAgInJlc2V0IiwKICAgICAgInJhdyIsCiAgICAgICJjb25zdHJ1Y3RvciIsCiAgICAgICJhdHRlbXB0ZWRceDIwdG9ceDIwIiwKICAgICAgIkludmFsaWRceDIwYXR0ZW1wdFx4MjB0b1x4MjBpdGVyYXRlXHgyMG5vbi1pdGVyYWJsZVx4MjBpbnN0YW5jZS5ceDBhSW5ceDIwb3JkZXJceDIwdG9ceDIwYmVceDIwaXRlcmFibGUsXHgyMG5vbi1hcnJheVx4MjBvYmplY3RzXHgyMG11c3RceDIwaGF2ZVx4MjBhXHgyMFtTeW1ib2wuaXRlcmF0b3JdKClceDIwbWV0aG9kLiIsCiAgICAgICJpc0FycmF5IiwKICAgICAgImNoYXJnaW5nVGltZSIsCiAgICAgICJfX2F3YWl0IiwKICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDA3MTMzNmJjNjY3NzQ1MDAwMDAwMTYxM2IxMTJiNjAwMDAwMzA5MGI0YTEyMDAwOTExMDIxNjA3MDAwYTA3MDAwYjQ0MDIwNzAwMDE0MzAyNDIwNzAwMDAxNDAwMDExMTAxMTUwODI2MzMwMDA1MTEwMTE1MDIyNjMzMDAwNzExMDExNTA3MDAwMTI2NDcwMDFkM2UwMDBhMTQwMDI5MDcwMDAyMTQwMDAxNDEzZDAwMGQwMjExMDEwMDExMDExNTQzMDExNDAwMDE0MTExMDEwMTMyMzQwMDA2MTEwMTAyMTIwMDAzNDcwMDBiMDAxNDAxMDEwMjExMDEwMzQzMDA0OTAyMTEwMTA0NDMwMDQ5MTEwMTA1MTIwMDA0MTQwMDAyMTEwMTA2MTIwMDA1MTQwMDAzMDMwMjE0MDAwNDExMDAwNDE0MDAwNTAzNDAxNDAwMDYwMjExMDEwMDExMDExNDQzMDExNDAwMDcxMTAxMDc0YTEyMDAwNjAyMTEwMTAwMTEwMTA3NGExMjAwMDYxMTAwMDc0MzAxNDMwMTQzMDExNDAwMDgxMTAxMDc0YTEyMDAwNjAyMTEwMTAwMTEwMTA3NGExMjAwMDYxMTAwMDE0MzAxNDMwMTQzMDExNDAwMDkxMTAxMDgxMjAwMDcxMjAwMDgzMjQ3MDAxMDA1MDAwMDAwMDAzYjAwMTEwMTA4MTIwMDA3MTUwMDA4MTEwMTA5MTIwMDBjMTQwMDBhMTEwMDBhMzMwMDA4MTEwMDBhM2EwNzAwMGQyNTQ3MDAwYzExMDAwYTRhMTIwMDA4NDMwMDE0MDAwYTAyMTEwMTBhMTEwMDAzMTEwMDAyNDMwMjE0MDAwYjAyMTEwMTBiMTEwMDBiMTEwMDBhNDMwMjE0MDAwYzAyMTEwMTBjMTEwMDBjMDcwMDBlNDMwMjE0MDAwZDExMDEwNzRhMTIwMDA2MDIxMTAxMDAxMTAwMGQ0MzAxNDMwMTE0MDAwZTExMDEwZDQ0MDA0YTEyMDAwZjQzMDAwNDAzZTgxYjE0MDAwZjAyMTEwMTBlNDMwMDE0MDAxMDExMDAwNjE0MDAxMTExMDAwMzA0MDEwMDFiMTQwMDEyMTEwMDAzMDQwMTAwMWMxNDAwMTMxMTAwMDIxNDAwMTQxMTAwMDgwMzBlMTMxNDAwMTUxMTAwMDgwMzBmMTMxNDAwMTYxMTAwMDkwMzBlMTMxNDAwMTcxMTAwMDkwMzBmMTMxNDAwMTgxMTAwMGUwMzBlMTMxNDAwMTkxMTAwMGUwMzBmMTMxNDAwMWExMTAwMGYwMzE4MmMwNDAwZmYyZTE0MDAxYjExMDAwZjAzMTAyYzA0MDBmZjJlMTQwMDFjMTEwMDBmMDMwODJjMDQwMGZmMmUxNDAwMWQxMTAwMGYwMzAwMmMwNDAwZmYyZTE0MDAxZTExMDAxMDAzMTgyYzA0MDBmZjJlMTQwMDFmMTEwMDEwMDMxMDJjMDQwMGZmMmUxNDAwMjAxMTAwMTAwMzA4MmMwNDAwZmYyZTE0MDAyMTExMDAxMDAzMDAyYzA0MDBmZjJlMTQwMDIyMTEwMDExMTEwMDEyMzExMTAwMTMzMTExMDAxNDMxMTEwMDE1MzExMTAwMTYzMTExMDAxNzMxMTEwMDE4MzExMTAwMTkzMTExMDAxYTMxMTEwMDFiMzExMTAwMWMzMTExMDAxZDMxMTEwMDFlMzExMTAwMWYzMTExMDAyMDMxMTEwMDIxMzExMTAwMjIzMTE0MDAyMzA0MDBmZjE0MDAyNDAyMTEwMTBmMTEwMDExMTEwMDEzMTEwMDE1MTEwMDE3MTEwMDE5MTEwMDFiMTEwMDFkMTEwMDFmMTEwMDIxMTEwMDIzMTEwMDEyMTEwMDE0MTEwMDE2MTEwMDE4MTEwMDFhMTEwMDFjMTEwMDFlMTEwMDIwMTEwMDIyNDMxMzE0MDAyNTAyMTEwMTBiMDIxMTAxMTAxMTAwMjQ0MzAxMTEwMDI1NDMwMjE0MDAyNjAyMTEwMTExMTEwMDA1MTEwMDI0MTEwMDI2NDMwMzE0MDAyNzAyMTEwMTEyMTEwMDI3MDcwMDEwNDMwMjE0MDAyODExMDAyODQyMDAxMTIwMWM0YzQ5MWM0MDFiMWM0MTQwMWU0ODQ4MWE0YTQ4NGMxZDQxNDA0ODQ4NDE0MTQwMWQxYjFlNDA0YzRhNGYxZDAwMjAxZTFlMWUxZTFlMWUxZTFlMWUxZTFlMWUxZTFlMWUxZTFlMWUxZTFlMWUxZTFlMWUxZTFlMWUxZTFlMWUxZTFlMDEwZTA2MGQxYTFiMTcxYzFkMDcxZDE2MGUxYjE3MWMxZDA2MWMxZDFiMTcxYzFkMDkwODBhMTcwYzE3MGMwMTA4MWQwNDBjMGExMTE1MDcwYTFkMDgxNDE5MWIxZDIxMjYyMzI0MGIyNDBkM2UzZDNlM2UyNDAwMzk0ODI1NTMwNDIzMjQwYjI0MGQzZTNkM2UzZTI0MDAzOTQ4MjU1MzVjMDExZjA5MGQwYjFkMGEzOTFmMWQxNjBjMDYwYjBjMGExMTE2MWYwMjBiNDgwNzFmMWQwYzJjMTExNTFkMDIwYjRhIiwKICAgICAgIkFyaWFsXHgyMEhlYnJldyIsCiAgICAgICJtc1Rva2VuIiwKICAgICAgIkFuXHgyMGVsZW1lbnRceDIwZGVzY3JpcHRvclx4MjdzXHgyMC5wbGFjZW1lbnRceDIwcHJvcGVydHlceDIwbXVzdFx4MjBiZVx4MjBvbmVceDIwb2ZceDIwXHgyMnN0YXRpY1x4MjIsXHgyMFx4MjJwcm90b3R5cGVceDIyXHgyMG9yXHgyMFx4MjJvd25ceDIyLFx4MjBidXRceDIwYVx4MjBkZWNvcmF0b3JceDIwY3JlYXRlZFx4MjBhblx4MjBlbGVtZW50XHgyMGRlc2NyaXB0b3JceDIwd2l0aFx4MjAucGxhY2VtZW50XHgyMFx4MjIiLAogICAgICAidmlzaWJsZSIsCiAgICAgICJkZWNvZGUiLAogICAgICAiY29uY2F0IiwKICAgICAgIjMwNzYyZnZRa0dWIiwKICAgICAgImhhc2giLAogICAgICAiU1RFTkNJTF9CSVRTIiwKICAgICAgImNvbmZpZ3VyYWJsZSIsCiAgICAgICJceDIwcHJpdmF0ZVx4MjBmaWVsZFx4MjBvblx4MjBub24taW5zdGFuY2UiLAogICAgICAiVF9NT1ZFIiwKICAgICAgImNsaWVudFgiLAogICAgICAiaW1hZ2VzIiwKICAgICAgInZlcnNpb24iLAogICAgICAicmVuZGVyZXIiLAogICAgICAicmVtb3ZlSXRlbSIsCiAgICAgICJjYXRjaExvYyIsCiAgICAgICJpbmRleE9mIiwKICAgICAgIm1zSGlkZGVuIiwKICAgICAgImlzVmlldyIsCiAgICAgICJ0b0xvY2FsZVN0cmluZyIsCiAgICAgICJodHRwczovL21zc2RrLmJ5dGVkYW5jZS5jb20iLAogICAgICAiQjRaNndvIiwKICAgICAgImRpc3BhdGNoRXhjZXB0aW9uIiwKICAgICAgIm1zdmlzaWJpbGl0eWNoYW5nZSIsCiAgICAgICJceDIwZGVjb3JhdG9yc1x4MjBtdXN0XHgyMHJldHVyblx4MjBhXHgyMGZ1bmN0aW9uXHgyMG9yXHgyMHZvaWRceDIwMCIsCiAgICAgICJEa2RwZ2g0WktzUUI4MC9NZnZ3MzZYSTFSMjUrV1VBbEVpN05MYm9xWVRPUHV6bUZqSm5yeXg5SFZHY2FTdENlIiwKICAgICAgIkNhbm5vdFx4MjBjb252ZXJ0XHgyMHVuZGVmaW5lZFx4MjBvclx4MjBudWxsXHgyMHRvXHgyMG9iamVjdCIsCiAgICAgICJpbml0aWFsaXplciIsCiAgICAgICJhd3JhcCIsCiAgICAgICJjb250aW51ZSIsCiAgICAgICJtb3VzZWRvd24iLAogICAgICAibW91c2Vtb3ZlIiwKICAgICAgInVwZGF0ZSIsCiAgICAgICJfX2FjX2JsYW5rIiwKICAgICAgIjAxMjM0NTY3ODlhYmNkZWYiLAogICAgICAiZ2V0SXRlbSIsCiAgICAgICJGdXR1cmEiLAogICAgICAiTUFYX1JFTkRFUkJVRkZFUl9TSVpFIiwKICAgICAgIkdQVUlORk8iLAogICAgICAiaG9zdCIsCiAgICAgICI0ODRlNGY0YTQwM2Y1MjQzMDAwMTBhMTEwNmFmYjA2NTAwMDAwMDAwNzlhNjZlYzIwMDAwMDA4YzExMDEwMDEyMDAwMDRhMTIwMDAxNDMwMDE0MDAwMTExMDAwMTRhMTIwMDAyMDcwMDAzNDMwMTAzMDAyYTQ3MDAwMjAxNDIxMTAxMDMwNzAwMDQ0NDAxMTQwMDAyMTEwMTAxMzMwMDA2MTEwMTAxMTIwMDA1MzMwMDA5MTEwMTAxMTIwMDA1MTIwMDA2NDcwMDQxMTEwMTAxMTIwMDA1MTIwMDA2MTQwMDAzMTEwMDAzNGExMjAwMDIwNzAwMDc0MzAxMDMwMDI1MzQwMDBmMTEwMDAzNGExMjAwMDIwNzAwMDg0MzAxMDMwMDI1MzQwMDBjMTEwMDAyNGExMjAwMDkxMTAwMDM0MzAxNDcwMDAyMDA0MjAxNDIwMDBhMDkzYjNkMmIzYzBmMjkyYjIwM2EwYjNhMjEwMjIxMzkyYjNjMGQyZjNkMmIwNzI3MjAyYTJiMzYwMTI4MDgyYjIyMmIyZDNhM2MyMTIwNGExMDI2M2EzYTNlM2Q3MTc0MTI2MTEyNjE2NjE1N2U2Mzc3MTMzNTdmNjI3ZDMzNjYxMjYwMTU3ZTYzNzcxMzM1N2Y2MjdkMzM2NzM1N2QzMzMyMTUyZjYzMjg3ZTYzNzcxMzM1N2Y2MjdhMzM2Njc0MTUyZjYzMjg3ZTYzNzcxMzM1N2Y2MjdhMzM2NzM1NzkzMzY3MDgyMjIxMmQyZjNhMjcyMTIwMDQyNjNjMmIyODA0MjgyNzIyMmIxMDI2M2EzYTNlNzQ2MTYxMjIyMTJkMmYyMjI2MjEzZDNhMDQzYTJiM2QzYSIsCiAgICAgICJCbHVldG9vdGhVVUlEIiwKICAgICAgImRlY29yYXRlQ2xhc3MiLAogICAgICAibW96UlRDUGVlckNvbm5lY3Rpb24iLAogICAgICAiZGVmaW5lQ2xhc3NFbGVtZW50IiwKICAgICAgImNyZWRlbnRpYWxzIiwKICAgICAgIndyaXRhYmxlIiwKICAgICAgInZhbHVlIiwKICAgICAgIldFQktJVF9FWFRfdGV4dHVyZV9maWx0ZXJfYW5pc290cm9waWMiLAogICAgICAiSlNfTUQ1X05PX0FSUkFZX0JVRkZFUiIsCiAgICAgICJNZXRhZGF0YVx4MjBrZXlzXHgyMG11c3RceDIwYmVceDIwc3ltYm9scyxceDIwcmVjZWl2ZWQ6XHgyMCIsCiAgICAgICJnZXRSZWZlcmVyIiwKICAgICAgImluZGV4REIiLAogICAgICAiX19wcm90b19fIiwKICAgICAgIk9iamVjdCIsCiAgICAgICJzcGxpY2UiLAogICAgICAic3ltYm9sIiwKICAgICAgIm9mZnNldFdpZHRoIiwKICAgICAgImV4ZWN1dGluZyIsCiAgICAgICJtb3pCYXR0ZXJ5IiwKICAgICAgIm5vcm1hbCIsCiAgICAgICJrRmFrZU9wZXJhdGlvbnMiLAogICAgICAicmV2ZXJzZSIsCiAgICAgICJmaW5pc2hlciIsCiAgICAgICJjcmVhdGVPZmZlciIsCiAgICAgICJhZGRFdmVudExpc3RlbmVyIiwKICAgICAgIkNhbm5vdFx4MjBjYWxsXHgyMGFceDIwY2xhc3NceDIwYXNceDIwYVx4MjBmdW5jdGlvbiIsCiAgICAgICJceDIwbXVzdFx4MjBiZVx4MjBhXHgyMGZ1bmN0aW9uIiwKICAgICAgImdldENvbnRleHQiLAogICAgICAicmVmZXJyZXIiLAogICAgICAiYWZ0ZXJMb2MiLAogICAgICAiaGFzIiwKICAgICAgInJldHVybiIsCiAgICAgICJrTm9Nb3ZlIiwKICAgICAgIm5ldHNjYXBlIiwKICAgICAgIk1BWF9DVUJFX01BUF9URVhUVVJFX1NJWkUiLAogICAgICAiYmluZCIsCiAgICAgICJ3aWR0aCIsCiAgICAgICJ2YWx1ZU9mIiwKICAgICAgIm9mZiIsCiAgICAgICJKU19NRDVfTk9fQVJSQVlfQlVGRkVSX0lTX1ZJRVciLAogICAgICAiaW5uZXJXaWR0aCIsCiAgICAgICIyNTcyMzJna25kT00iLAogICAgICAibnVsbCIsCiAgICAgICJpc1NlY3VyZUNvbnRleHQiLAogICAgICAicGl4ZWxEZXB0aCIsCiAgICAgICIuaW5pdGlhbGl6ZXJceDIwaGFzXHgyMGJlZW5ceDIwcmVuYW1lZFx4MjB0b1x4MjAuaW5pdFx4MjBhc1x4MjBvZlx4MjBNYXJjaFx4MjAyMDIyIiwKICAgICAgIi93ZWIvcmVwb3J0IiwKICAgICAgInJlbW92ZUNoaWxkIiwKICAgICAgIltvYmplY3RceDIwQm9vbGVhbl0iLAogICAgICAiZ2V0U3VwcG9ydGVkRXh0ZW5zaW9ucyIsCiAgICAgICJlcnJvciIsCiAgICAgICJHZW5lcmF0b3JGdW5jdGlvbiIsCiAgICAgICJtZXNzYWdlIiwKICAgICAgImluaXRpYWxpemVJbnN0YW5jZUVsZW1lbnRzIiwKICAgICAgInN5c3RlbUxhbmd1YWdlIiwKICAgICAgIkFCQ0RFRkdISUpLTE1OT1BRUlNUVVZXWFlaYWJjZGVmZ2hpamtsbW5vcHFyc3R1dnd4eXowMTIzNDU2Nzg5Ky8iLAogICAgICAidHRfd2ViaWQiLAogICAgICAic3FydCIsCiAgICAgICJfX2FjX3JlZmVyZXIiLAogICAgICAiYmxvY2tzIiwKICAgICAgIk1PWl9FWFRfdGV4dHVyZV9maWx0ZXJfYW5pc290cm9waWMiLAogICAgICAiMWhjYkVITCIsCiAgICAgICIzMDgzNTBPeXZFb1YiLAogICAgICAiNDg0ZTRmNGE0MDNmNTI0MzAwM2EyMDE2OTk2N2YxODUwMDAwMDAwMDBiNDljOTNjMDAwMDAwNzYxMTAxMDAxMjAwMDA0YTEyMDAwMTQzMDAxNDAwMDExMTAwMDE0YTEyMDAwMjA3MDAwMzQzMDEwMzAwMmE0NzAwMDIwMTQyMTEwMTAxM2EwNzAwMDQyNjMzMDAxOTExMDEwMjEyMDAwNTEyMDAwNjRhMTIwMDA3MTEwMTAxMTIwMDA4NDMwMTA3MDAwOTI1MzQwMDJiMTEwMTAzM2EwNzAwMDQyNTQ3MDAwNjA3MDAwNDQ1MDAwOTAyMTEwMTA0MTEwMTAzNDMwMTA3MDAwYTI1MzMwMDBhMTEwMTAzMTIwMDBiMDcwMDBjMjU0MjAwMGQwOTI4MmUzODJmMWMzYTM4MzMyOTBiMjkzMjExMzIyYTM4MmYxZTNjMmUzODA3MzQzMzM5MzgyNTEyM2IwODM4MzEzODNlMjkyZjMyMzMwOTI4MzMzOTM4M2IzNDMzMzgzOTA5MmQyZjMyMjkzMjI5MjQyZDM4MDgyOTMyMGUyOTJmMzQzMzNhMDQzZTNjMzEzMTA3MmQyZjMyM2UzODJlMmUxMDA2MzIzZjM3MzgzZTI5N2QyZDJmMzIzZTM4MmUyZTAwMDYzMjNmMzczODNlMjkwNTI5MzQyOTMxMzgwNDMzMzIzOTM4IiwKICAgICAgImZvciIsCiAgICAgICJicmVhayIsCiAgICAgICJjb25zdHJ1Y3QiLAogICAgICAiQ29uc3RhbnRpYSIsCiAgICAgICJ3ZWJraXR2aXNpYmlsaXR5Y2hhbmdlIiwKICAgICAgImFjdGl2ZVN0YXRlIiwKICAgICAgInRvQ2xhc3NEZXNjcmlwdG9yIiwKICAgICAgImxheWVycyIsCiAgICAgICJib2d1c0luZGV4IiwKICAgICAgImFyZyIsCiAgICAgICJzY3JlZW4iLAogICAgICAiYnVmZmVyOCIsCiAgICAgICJnZXRPd25Qcm9wZXJ0eU5hbWVzIiwKICAgICAgImdldCIsCiAgICAgICJwcmV2IiwKICAgICAgImJ1aWxkSUQiLAogICAgICAibGFzdEJ5dGVJbmRleCIsCiAgICAgICJceDI3XHgyMG1ldGhvZCIsCiAgICAgICJCYWRceDIwVVRGLThceDIwZW5jb2RpbmdceDIwMHgiLAogICAgICAiW29iamVjdFx4MjBBcnJheV0iLAogICAgICAiYWRkIiwKICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDAwMjcxOTRmOTY2NjU5MDAwMDAwMDA0NGExNmZlZDAwMDAwMDI3MDcwMDAwMTQwMDAxM2UwMDBhMTQwMDAyMDcwMDAxMTQwMDAxNDEzZDAwMGQwMjExMDEwMDExMDEwMjQzMDExNDAwMDE0MTExMDAwMTQyMDAwMjAwMjAwZDBkMGQwZDBkMGQwZDBkMGQwZDBkMGQwZDBkMGQwZDBkMGQwZDBkMGQwZDBkMGQwZDBkMGQwZDBkMGQwZDBkIiwKICAgICAgImNhbGwiLAogICAgICAiY2hhcmFjdGVyU2V0IiwKICAgICAgImJvZHlWYWwyc3RyIiwKICAgICAgInRyeUVudHJpZXMiLAogICAgICAiXHgyMlx4MjBpc1x4MjByZWFkLW9ubHkiLAogICAgICAidHRfd2ViaWRfdjIiLAogICAgICAibG9jYXRpb25iYXIiLAogICAgICAibWF4VG91Y2hQb2ludHMiLAogICAgICAic3RyaW5nIiwKICAgICAgImFkZEVsZW1lbnRQbGFjZW1lbnQiLAogICAgICAidHJ5XHgyMHN0YXRlbWVudFx4MjB3aXRob3V0XHgyMGNhdGNoXHgyMG9yXHgyMGZpbmFsbHkiLAogICAgICAibW96VmlzaWJpbGl0eVN0YXRlIiwKICAgICAgInNob3dDb2xvciIsCiAgICAgICJuYW1lIiwKICAgICAgInNwbGl0IiwKICAgICAgInhtc3RyIiwKICAgICAgInByb3RvdHlwZSIsCiAgICAgICJBY3JvUERGLlBERi4xIiwKICAgICAgIlR1bmdhIiwKICAgICAgIjQyMTh0REF0SGQiLAogICAgICAiQVZFTklSIiwKICAgICAgImdldE1ldGFkYXRhIiwKICAgICAgInRyYWNrIiwKICAgICAgInRvdWNoRXZlbnQiLAogICAgICAiZGVjb3JhdGVDb25zdHJ1Y3RvciIsCiAgICAgICJub3ciLAogICAgICAiZmFpbGVkXHgyMHRvXHgyMHNldFx4MjBwcm9wZXJ0eSIsCiAgICAgICI0ODRlNGY0YTQwM2Y1MjQzMDAyNjMyMDNlYzc1YTM3NDAwMDAwMDA4MTc3MTg2ODMwMDAwMDMwNTExMDAwMTExMDAwMjJlNDIxMTAxMTUwNzAwMDAxMzAwMjU0NzAwMGEwNzAwMDExMTAxMTUwNzAwMDIxNjBkMDMwMDBlMDAwMzAwMGUwMDA0MGMwMDAwMGUwMDA1MGMwMDAwMGUwMDA2MDEwZTAwMDcwMTBlMDAwMDA3MDAwODBlMDAwMjAxMGUwMDA5MGQwMzA1MDMzYzFhMGUwMDBhMDMwMjBlMDAwYjAzMDUwMzNjMWEwZTAwMGMwZTAwMGQwNzAwMDgwZTAwMGUwMDBlMDAwZjAzMDMwZTAwMTAxNDAwMDExMTAxMDA0YTEyMDAxMTExMDAwMTExMDExNTQzMDI0OTExMDAwMTEyMDAwMzAzMDAyNTM0MDAxNjExMDEwMTRhMTIwMDEyMTEwMDAxMTIwMDAzNDMwMTExMDAwMTEyMDAwMzI2NDcwMDA5MTEwMTAyMDcwMDEzNDQwMTQwMTEwMDAxMTIwMDE0MzMwMDA3MTEwMDAxMTIwMDE1MzI0NzAwMDkxMTAxMDIwNzAwMTY0NDAxNDAxMTAxMDMxMjAwMTc0YTEyMDAxODExMDAwMTEyMDAwMzQzMDE0OTExMDEwNDEyMDAwMzAzMDAyNTQ3MDAwYzExMDAwMTEyMDAwMzExMDEwNDE1MDAwMzExMDAwMTEyMDAwNDMyNDcwMDljMTEwMDAxMTIwMDAyMDcwMDA4MjU0NzAwMDkxMTAxMDIwNzAwMTk0NDAxNDAxMTAwMDExMjAwMDIwNzAwMDEyNDQ3MDAwOTExMDEwMjA3MDAxYTQ0MDE0MDExMDAwMTEyMDAwMjExMDEwNDE1MDAwMjAyMTEwMTA1MTEwMDAxNDMwMTExMDEwNDE1MDAxYjAyMTEwMTA2MTEwMTA3MTEwMDAxMTIwMDEwMDQwM2U4MWE0MzAyNDkxMTAwMDExMjAwMWMwODI2MzMwMDA1MTEwMDAxMDIyNjQ3MDAyZTExMDEwNDEyMDAxZDRhMTIwMDE4MTEwMDAxMTIwMDFjNDMwMTQ5MTEwMTA0MTIwMDFkNGExMjAwMWUwNTAwMDAwMDAwM2IwMjQzMDEzMjMyMTEwMTA0MTUwMDFjMTEwMDAxMTIwMDBkNDcwMGE2MDAxMTAxMDQxNTAwMWYxMTAxMDg0NzAwNjQxMTAwMDExMjAwMGQxMjAwMGEzMzAwMTMxMTAwMDExMjAwMGQxMjAwMGExMTAxMDQxMjAwMGQxMjAwMGEyOTQ3MDAzZjAyMTEwMTA5MTEwMTA4NDMwMTQ5MTEwMTAwNGExMjAwMTEwZDExMDEwNDEyMDAwZDExMDAwMTEyMDAwZDQzMDMxMTAxMDQxNTAwMGQwMjExMDEwYTExMDEwYjExMDEwNDEyMDAwZDEyMDAwYTA0MDNlODFhNDMwMjE0MDEwODQ1MDAzNTExMDEwMDRhMTIwMDExMGQxMTAxMDQxMjAwMGQxMTAwMDExMjAwMGQ0MzAzMTEwMTA0MTUwMDBkMDIxMTAxMGExMTAxMGIxMTAxMDQxMjAwMGQxMjAwMGEwNDAzZTgxYTQzMDIxNDAxMDgxMTAwMDExMjAwMjA0NzAwMWMxMTAwMDExMjAwMjAxMTAxMDQxNTAwMjAwMjExMDEwNjExMDEwYzAzMDUwNDAzZTgxYTQzMDI0OTExMDAwMTBiMTUwMDIxMDIxMTAxMGQ0MzAwNDkwMjExMDEwZTExMDAwMTEyMDAwNTQzMDE0OTAyMTEwMTBmMTEwMDAxMTIwMDA2NDMwMTQ5MDIxMTAxMTA0MzAwNDkxMTAxMTEzMjMzMDAwNjExMDAwMTEyMDAwNzQ3MDAyMDAwMTQwMTExMTEwMDAxMTIwMDA3MTEwMTA0MTUwMDA3MDIxMTAxMDYxMTAxMTIwMzA1MDQwM2U4MWE0MzAyNDkxMTAwMDExMjAwMGY0NzAwMjQxMTAxMDQxMjAwMjIzMjQ3MDAxYTAwMTEwMTA0MTUwMDIyMDIxMTAxMDYxMTAxMTMwMzBhMDQwM2U4MWExMTAwMDE0MzAzNDkwMDExMDEwNDE1MDAyMzA4NDIwMDI0MDM1MDUyNDQwMjU3NWEwNjQ2NTE1MzVkNWI1YTAzNTU1ZDUwMDU1ZDQ3Njc3MDdmMGU1MTVhNTU1NjU4NTE2NDU1NDA1Yzc4NWQ0NzQwMGY0MTQ2NTg2NjUxNDM0NjVkNDA1MTY2NDE1ODUxNDcwMzQ3NTA1ZDAwMDM1MDUxNDIwMzUyNDY1MTBhNDE1YTVkNDA3NTU5NWI0MTVhNDAwODQxNWE1ZDQwNjA1ZDU5NTEwNTQwNDY1NTU3NWYwNDU5NWI1MDUxMDQ0YzRjNTY1MzA0NTA1MDQ2NDAwNjU1NDc0NzVkNTM1YTA1NTI1ODViNWI0NjFlNWI0NDQwNWQ1YjVhMTQ1NTVkNTAxYzdkNWE0MDUxNTM1MTQ2MWQxNDVkNDcxNDVhNTE1MTUwNTE1MDE1MDM1NjViNTEwNzU2NWI1MTdjNWI0NzQwMjQ1NjViNTE3YzViNDc0MDE0NTk0MTQ3NDAxNDU2NTExNDQ0NDY1YjQyNWQ1MDUxNTAxNDVkNWExNDU2NWI1MTE0NTk1YjUwNTEwNzU1NWQ1MDc4NWQ0NzQwMDQ0NDQxNDc1YzBmNDY1MTUzNWQ1YjVhMTQ1ZDQ3MTQ1YTQxNTg1ODE1MTI0NjUxNTM1ZDViNWExNDVkNDcxNDVkNWE0MjU1NTg1ZDUwMTUwYTQ2NTE1MzVkNWI1YTc3NWI1YTUyMDE0MjEwNmI1MTVhNTU1NjU4NTE2NzVkNTM1YTU1NDA0MTQ2NTEwNjQ2NTE1MDQxNTc1MTBiNTE1YTU1NTY1ODUxNjA0NjU1NTc1ZjA0NDQ1MTQ2NTIwNzViNDQ0MDVkNWI1YTQ3MDQ2YjUwNTI0NDBiNWQ1YTVkNDA1ZDU1NTg1ZDRlNTE1MCIsCiAgICAgICJhcHBNaW5vclZlcnNpb24iLAogICAgICAiQXR0ZW1wdGVkXHgyMHRvXHgyMGRlY29yYXRlXHgyMGFceDIwcHVibGljXHgyMG1ldGhvZC9hY2Nlc3Nvclx4MjB0aGF0XHgyMGhhc1x4MjB0aGVceDIwc2FtZVx4MjBuYW1lXHgyMGFzXHgyMGFceDIwcHJldmlvdXNseVx4MjBkZWNvcmF0ZWRceDIwcHVibGljXHgyMG1ldGhvZC9hY2Nlc3Nvci5ceDIwVGhpc1x4MjBpc1x4MjBub3RceDIwY3VycmVudGx5XHgyMHN1cHBvcnRlZFx4MjBieVx4MjB0aGVceDIwZGVjb3JhdG9yc1x4MjBwbHVnaW4uXHgyMFByb3BlcnR5XHgyMG5hbWVceDIwd2FzOlx4MjAiLAogICAgICAiaGV4IiwKICAgICAgImRpc2NoYXJnaW5nVGltZSIsCiAgICAgICJQTFVHSU4iLAogICAgICAiVF9LRVlCT0FSRCIsCiAgICAgICJyZXRfY29kZSIsCiAgICAgICJceDIyLlx4MjBQbGVhc2VceDIwY29uZmlndXJlXHgyMHRoZVx4MjBkeW5hbWljUmVxdWlyZVRhcmdldHNceDIwb3IvYW5kXHgyMGlnbm9yZUR5bmFtaWNSZXF1aXJlc1x4MjBvcHRpb25ceDIwb2ZceDIwQHJvbGx1cC9wbHVnaW4tY29tbW9uanNceDIwYXBwcm9wcmlhdGVseVx4MjBmb3JceDIwdGhpc1x4MjByZXF1aXJlXHgyMGNhbGxceDIwdG9ceDIwd29yay4iLAogICAgICAiQEB0b1ByaW1pdGl2ZVx4MjBtdXN0XHgyMHJldHVyblx4MjBhXHgyMHByaW1pdGl2ZVx4MjB2YWx1ZS4iLAogICAgICAiYmF0dGVyeSIsCiAgICAgICJHZW5lcmF0b3JceDIwaXNceDIwYWxyZWFkeVx4MjBydW5uaW5nIiwKICAgICAgImhlYWRlcnMiLAogICAgICAibWQ1IiwKICAgICAgInNldHRlciIsCiAgICAgICI9O1x4MjBleHBpcmVzPU1vbixceDIwMjBceDIwU2VwXHgyMDIwMTBceDIwMDA6MDA6MDBceDIwVVRDO1x4MjBwYXRoPS87IiwKICAgICAgIl9yYXdfc2VjX2RpZCIsCiAgICAgICJoYXJkd2FyZUNvbmN1cnJlbmN5IiwKICAgICAgInNjcmlwdCIsCiAgICAgICJmb250U2l6ZSIsCiAgICAgICJfYnl0ZWRfc2VjX2RpZCIsCiAgICAgICJrZXlkb3duIiwKICAgICAgIl9fcHJpdmF0ZV8iLAogICAgICAic2NyZWVuWSIsCiAgICAgICJEdXBsaWNhdGVkXHgyMGVsZW1lbnRceDIwKCIsCiAgICAgICI0ODRlNGY0YTQwM2Y1MjQzMDAyMTEyMDk1OTdiY2NjYzAwMDAwNTNhYWU3N2ZiYTYwMDAwMDVlNTBiMTIwMDA5MzI0NzAwNGUwYjEyMDAwYTRhMTIwMDBiMGQwNzAwMDUwZTAwMGMxMTAwMDAwZTAwMGQ0MzAxNDkxMTAyMTYwNzAwMGUwNzAwMGY0NDAyNGExMjAwMTAxMTAwMDE0MzAxNDcwMDFmMTEwMDAyNGExMjAwMTE0MzAwNGExMjAwMTI0MzAwNGExMjAwMTMwNzAwMTQ0MzAxMDMwMDEzMGIxNTAwMTUxMTAxMDU0YTEyMDAxNjBiMTEwMDAwNDMwMjQyMTEwMDAwMGIxNTAwMTcxMTAxMDc0YTEyMDAxNjBiMTEwMDAwNDMwMjQyMGMwMDAwMGIxNTAwMGEwYjEyMDAwYTRhMTIwMDBiMGQwNzAwMDQwZTAwMGMxMTAwMDAwZTAwMGQ0MzAxNDkxMTAwMDE0YTEyMDAxODQzMDAwYjE1MDAxOTExMDAwMjBiMTUwMDFhMTEwMTA0NGExMjAwMTYwYjExMDAwMDQzMDI0MjExMDEwOTRhMTIwMDI0MGIxMjAwMTk0MzAxMDMwMTFkMjYxNDAwMDIwMjExMDIwMTBiMTIwMDFhNDMwMTMzMDAwMzExMDAwMjQ3MDJmZTBiMTIwMDFhNGExMjAwMjQwNzAwMjU0MzAxMDMwMTFkMjk0NzAwMGUxMTAxMDY0YTEyMDAxNjBiMTEwMDAwNDMwMjQyMTEwMDAxMGIxNTAwMjYwYjEyMDAyNzE0MDAwMzBiMTIwMDFiMTQwMDA0MGIxMjAwMWMxNDAwMDUwYjEyMDAxZDE0MDAwNjBiMTIwMDFlMTQwMDA3MGIxMjAwMWYxNDAwMDgwYjEyMDAyMDE0MDAwOTBiMTIwMDIxMTQwMDBhMGQxNDAwMGIwMzAwMTQwMDBjMTEwMDBjMTEwMTA4MTIwMDI4Mjc0NzAwMWYwYjEyMDAyOTExMDEwODExMDAwYzEzMTMxMTAwMGIxMTAxMDgxMTAwMGMxMzE2MTcwMDBjMjE0OTQ1ZmZkNDExMDIwMjEyMDAyYTE0MDAwZDExMDIwMjEyMDAyYjE0MDAwZTExMDAwZTA3MDAyYzIzNDcwMDBmMDcwMDJkMTEwMjAyMTIwMDJkMGMwMDAyNDUwMDEyMDcwMDJkMTEwMjAyMTIwMDJkMDcwMDJiMTEwMDBlMGMwMDA0MTQwMDBmMDIxMTAyMDMwMjExMDIwNDBiMTIwMDFhNDMwMTExMDAwZjQzMDIxNDAwMTAwMjExMDIwNTExMDAxMDQzMDExNDAwMTEwMjExMDIwNjExMDAxMTBiMTIwMDI2NDMwMjE0MDAxMjAyMTEwMjAzMTEwMDEwMTEwMTAxMTEwMDEyMGMwMDAyNDMwMjE0MDAxMzA3MDAyYzE0MDAxNDExMDIwNzEyMDAyZTQ3MDAwOTExMDAxMzE0MDAxNDQ1MDA5MTBkMDIxMTAyMDgwMjExMDAxMzQzMDIwZTAwMmYxNDAwMTUwYjEyMDAxOTA3MDAyMzI1NDcwMDUwMDIxMTAyMDkwYjEyMDAxNTQzMDE0NzAwM2EwMjExMDIwYTExMDAxNTBiMTIwMDE1MGIxMjAwMjY0MzAzNDkwMjExMDIwYjExMDAxNTA4MDcwMDMwNDMwMzE0MDAxNjAyMTEwMjAzMTEwMDEzMTEwMTAyMTEwMDE2MGMwMDAyNDMwMjE0MDAxNDQ1MDAwNjExMDAxMzE0MDAxNDQ1MDAyNTAyMTEwMjBiMTEwMDE1MDgwNzAwMzA0MzAzMTQwMDE3MDIxMTAyMDMxMTAwMTMxMTAxMDIxMTAwMTcwYzAwMDI0MzAyMTQwMDE0MGIxMjAwMGEzMzAwMGYwYjEyMDAwYTAzMDAxMzA3MDAwYzEzMDcwMDA0MjY0NzAwMDIwMjQyMGIxMjAwMGExNDAwMTgwMzAwMTQwMDE5MTEwMDE5MTEwMDE4MTIwMDI4Mjc0NzAwNWQxMTAwMTkwMzAwMjU0NzAwMmQxMTAwMTQxMTAwMTgxMTAwMTkxMzEyMDAwZDAzMDExNjAwMGIxNTAwMDkxMTAxMDQ0YTEyMDAxNjBiMTEwMDE4MTEwMDE5MTMxMjAwMGQ0MzAyNDk0NTAwMWYwYjExMDAxODExMDAxOTEzMDcwMDBjMTMxMzRhMTIwMDE2MGIxMTAwMTgxMTAwMTkxMzEyMDAwZDQzMDI0OTE3MDAxOTIxNDk0NWZmOTYwYjEyMDAxNzQ3MDAxMDBiMTIwMDA3NGExMjAwMTYwYjBiMTIwMDE3NDMwMjQ5MGIwNzAwMGEzOTQ5MTEwMjA3MTIwMDMxNDcwMDE0MGI0YTEyMDAwNTExMDIwYzEyMDAzMjAyMTEwMjBkNDMwMDQzMDI0OTExMDAwMzBiMTUwMDI3MTEwMDA0MGIxNTAwMWIxMTAwMDUwYjE1MDAxYzA1MDAwMDAzZWQzYjAxMGIxNTAwMWQxMTAwMDcwYjE1MDAxZTExMDAwODBiMTUwMDFmMTEwMDA5MGIxNTAwMjAxMTAwMGEwYjE1MDAyMTAzMDAxNDAwMWExMTAwMWExMTAxMDgxMjAwMjgyNzQ3MDAxZjExMDAwYjExMDEwODExMDAxYTEzMTMwYjEyMDAyOTExMDEwODExMDAxYTEzMTYxNzAwMWEyMTQ5NDVmZmQ0MTEwMTA2NGExMjAwMTYwYjExMDAwMDQzMDI0MjAzMDAxNDAwMDIwYjEyMDAzMzM0MDAwNDBiMTIwMDFhMzQwMDAzMDcwMDJjMTQwMDAzMDIxMTAzMGUxMTAwMDM0MzAxNDcwMDA1MDMwMTE0MDAwMjExMDAwMzRhMTIwMDI0MTEwMzAwMTIwMDM0MTIwMDM1NDMwMTAzMDExZDI2NDcwMDA1MDMwMjE0MDAwMjExMDAwMjAzMDAyOTQ3MDBlYTBiNGExMjAwMzYwNzAwMzc0MzAxMTQwMDA0MTEwMDA0NDcwMGQ3MDIxMTAzMGYwYjEyMDAxYTQzMDExNDAwMDUxMTAwMDUxMTAzMTAxMjAwMzgyNTQ3MDA1NTExMDAwNDExMDMwMjE1MDAyZDExMDAwNTExMDMwMjE1MDAyYTAyMTEwMzExMDcwMDJkMTEwMDA0NDMwMjQ5MDIxMTAzMTIxMTAwMDQ0MzAxNDkxMTAwMDUxMTAxMGQyOTQ3MDAxZjExMDMwMjEyMDAzOTEyMDAyODAzMDAyOTQ3MDAxMDAyMTEwMzEzMTEwMzE0MDMwMjA0MDNlODFhNDMwMjQ5NDUwMDE2MTEwMTBkMTEwMzAyMTIwMDJhMmE0NzAwMDkxMTAwMDQxMTAzMDIxNTAwMmQxMTAxMGQxMTAzMTAxMjAwM2EyNTMzMDAwYzExMDMwMjEyMDAzOTEyMDAyODAzMGEyNzQ3MDAzNjExMDMwMjEyMDAzOTRhMTIwMDBiMTEwMDA0NDMwMTQ5MTEwMzAyMTIwMDM5MTIwMDI4MDMwMTI1NDcwMDE3MDIxMTAzMTIxMTAwMDQ0MzAxNDkwMjExMDMxMTA3MDAyZDExMDAwNDQzMDI0OTExMDEwNjQ3MDAwYTAyMTEwMTA2MTEwMDAxNDMwMTQ5MDg0MjA3MDAwMDE0MDAwMTA3MDAwMTE0MDAwMjExMDEwMDEyMDAwMjEyMDAwMzE0MDAwMzExMDAwMzEyMDAwNDE0MDAwNDExMDAwMzEyMDAwNTE0MDAwNTExMDAwMzEyMDAwNjE0MDAwNjExMDAwMzEyMDAwNzE0MDAwNzExMDAwMzEyMDAwODQ3MDAwMjA4NDIwMDExMDAwMzE1MDAwODA1MDAwMDAwMDAzYjAyMTEwMDAzMTUwMDA1MDUwMDAwMDA2NDNiMDAxMTAwMDMxNTAwMDcwNTAwMDAwMDc5M2IwMjExMDAwMzE1MDAwNDA3MDAxYjA3MDAxYzA3MDAxZDA3MDAxZTA3MDAxZjA3MDAyMDA3MDAyMTBjMDAwNzE0MDAwODA3MDAyMjA3MDAyMzBjMDAwMjE0MDAwOTA1MDAwMDAwYmEzYjAxMTEwMDAzMTUwMDA2MDg0MjAwM2IwNzU1MjA0ZjYyNmE3ODdlMGE1MjdlNjQ2YTYzNmM3OTc4N2Y2ODBlNTU0MDQxNDU3OTc5N2Q1ZjY4N2M3ODY4N2U3OTA5N2Q3ZjYyNzk2Mjc5NzQ3ZDY4MDQ2MjdkNjg2MzEwN2U2ODc5NWY2ODdjNzg2ODdlNzk0NTY4NmM2OTY4N2YwNDdlNjg2MzY5MTA2MjdiNjg3ZjdmNjQ2OTY4NDA2NDYwNjg1OTc0N2Q2ODBmNTI2YzZlNTI2NDYzNzk2ODdmNmU2ODdkNzk2ODY5MDU1MjdlNjg2MzY5MTU1MjZmNzQ3OTY4Njk1MjY0NjM3OTY4N2Y2ZTY4N2Q3OTUyNjE2NDdlNzkwNDdkNzg3ZTY1MDQ2Yjc4NjM2ZTA5NmM3ZjZhNzg2MDY4NjM3OTdlMGU1MzZlNjI2Mzc5Njg2Mzc5MjA3OTc0N2Q2ODI5MDE2NDA0Nzk2ODdlNzkwODc5NjI1ZTc5N2Y2NDYzNmEwYjc5NjI0MTYyN2E2ODdmNGU2YzdlNjgwNTdlN2Q2MTY0NzkwMTM2MGU1MjZmNzQ3OTY4Njk1MjZlNjI2Mzc5Njg2Mzc5MDU2YzdkN2Q2MTc0MTU1MjYyN2I2ODdmN2Y2NDY5Njg0MDY0NjA2ODU5NzQ3ZDY4NGM3ZjZhN2UwYjc5NjI1ODdkN2Q2ODdmNGU2YzdlNjgwZDUyNmY3NDc5Njg2OTUyNjA2ODc5NjU2MjY5MGE1MjZmNzQ3OTY4Njk1Mjc4N2Y2MTA3NjI2MzZjNmY2MjdmNzkwNzYyNjM2ODdmN2Y2MjdmMDY2MjYzNjE2MjZjNjkwOTYyNjM2MTYyNmM2OTY4NjM2OTBiNjI2MzYxNjI2YzY5N2U3OTZjN2Y3OTBhNjI2MzdkN2Y2MjZhN2Y2ODdlN2UwOTYyNjM3OTY0NjA2ODYyNzg3OTAzNGE0ODU5MDQ1ZDQyNWU1OTA3NjQ2MzY5Njg3NTQyNmIwYjUyN2U2NDZhNjM2Yzc5Nzg3ZjY4MzAwYjUyNmY3NDc5Njg2OTUyNmY2MjY5NzQxMjYyNjM3ZjY4NmM2OTc0N2U3OTZjNzk2ODZlNjU2YzYzNmE2ODA2NjE2ODYzNmE3OTY1MDY3ODdkNjE2MjZjNjkwODYwN2U1ZTc5NmM3OTc4N2UwYjUyNTI2YzZlNTI3OTY4N2U3OTY0NjkwMDA3NjA3ZTU5NjI2NjY4NjMwMTdiMDM3ODdmNjEwNzZiNjI3ZjdmNjg2YzYxMDM3ZTY5NjQwZDdlNjg2ZTQ0NjM2YjYyNDU2ODZjNjk2ODdmMGI3ZjY4N2U3ZDYyNjM3ZTY4NTg1ZjQxMDg2MTYyNmU2Yzc5NjQ2MjYzMDQ2NTYyN2U3OTExNmE2ODc5NWY2ODdlN2Q2MjYzN2U2ODQ1Njg2YzY5Njg3ZjBhNzUyMDYwN2UyMDc5NjI2NjY4NjMwMzdlNjg2ZTBlNjA3ZTQzNjg3YTU5NjI2NjY4NjM0MTY0N2U3OTA0NjQ2MzY0NzkiLAogICAgICAicm91bmQiLAogICAgICAiaW5uZXJIVE1MIiwKICAgICAgImFwcENvZGVOYW1lIiwKICAgICAgImRlZmluZVByb3BlcnRpZXMiLAogICAgICAiQ291bGRceDIwbm90XHgyMGR5bmFtaWNhbGx5XHgyMHJlcXVpcmVceDIwXHgyMiIsCiAgICAgICJwdXNoIiwKICAgICAgIl9fZGVzdHJPYmoiLAogICAgICAidG9FbGVtZW50RGVzY3JpcHRvcnMiLAogICAgICAiZGVmYXVsdFByb3BzIiwKICAgICAgImZyb21FbGVtZW50RGVzY3JpcHRvciIsCiAgICAgICJkb2N1bWVudE1vZGUiLAogICAgICAiT2JqZWN0LmtleXNceDIwY2FsbGVkXHgyMG9uXHgyMG5vbi1vYmplY3QiLAogICAgICAiV0VCR0xfZGVidWdfcmVuZGVyZXJfaW5mbyIsCiAgICAgICJyZWR1Y2UiLAogICAgICAicmVwbGFjZSIsCiAgICAgICJzZXRVc2VyTW9kZSIsCiAgICAgICJjaGFuZ2VkVG91Y2hlcyIsCiAgICAgICJKU19NRDVfTk9fV0lORE9XIiwKICAgICAgIltvYmplY3RceDIwT2JqZWN0XSIsCiAgICAgICJpdGVtIiwKICAgICAgImJlZm9yZXVubG9hZCIsCiAgICAgICIlMjciLAogICAgICAiZW5hYmxlVHJhY2siLAogICAgICAiZW52Y29kZSIsCiAgICAgICJncHUiLAogICAgICAidWJjb2RlIiwKICAgICAgImdldFBhcmFtZXRlciIsCiAgICAgICJ1bmRlZmluZWQiLAogICAgICAic3RhcnQiLAogICAgICAiaXNHZW5lcmF0b3JGdW5jdGlvbiIsCiAgICAgICJjb21wbGV0aW9uIiwKICAgICAgImdldE93blByb3BlcnR5U3ltYm9scyIsCiAgICAgICJuZXh0IiwKICAgICAgImF2YWlsV2lkdGgiLAogICAgICAidmFsdWVzIiwKICAgICAgIm9zY3B1IiwKICAgICAgIlR3XHgyMENlblx4MjBNVCIsCiAgICAgICJzb3J0IiwKICAgICAgImJsdWV0b290aCIsCiAgICAgICJyZXF1ZXN0TWVkaWFLZXlTeXN0ZW1BY2Nlc3MiLAogICAgICAia2V5Ym9hcmRMaXN0IiwKICAgICAgImtleSIsCiAgICAgICJ3aW5kb3ciLAogICAgICAiVW5maW5pc2hlZFx4MjBVVEYtOFx4MjBvY3RldFx4MjBzZXF1ZW5jZSIsCiAgICAgICJzZXRNZXRhZGF0YSIsCiAgICAgICJzdGF0aWMiLAogICAgICAiZGVidWciLAogICAgICAibGFuZ3VhZ2VzIiwKICAgICAgInRvb2xiYXIiLAogICAgICAibXNEb05vdFRyYWNrIiwKICAgICAgInJlamVjdCIsCiAgICAgICJmaW5pc2hlcnMiLAogICAgICAiMjA4WFpyQk9KIiwKICAgICAgIlVOTUFTS0VEX1JFTkRFUkVSX1dFQkdMIiwKICAgICAgImV4dGVybmFsIiwKICAgICAgInNoYWRvd0JsdXIiLAogICAgICAiUE9TVCIsCiAgICAgICI0ODRlNGY0YTQwM2Y1MjQzMDAzZTBkMjNlNWM1NzkzMTAwMDAwMDYyNDhkMTc0NWMwMDAwMDJjYzBkMTQwMDAxMTEwMjAwMDcwMDAwMTMxNDAwMDIxMTAwMDIwNzAwMDEyNDQ3MDAwYTExMDAwMjExMDAwMTA3MDAwMDE2MTEwMjAwMDcwMDAyMTMxNDAwMDMxMTAwMDMwNzAwMDEyNDQ3MDAwYTExMDAwMzExMDAwMTA3MDAwMzE2MTEwMjAwMDcwMDA0MTMxNDAwMDQxMTAwMDQwNzAwMDEyNDQ3MDAwYTExMDAwNDExMDAwMTA3MDAwNTE2MTEwMDAxNDIwNTAwMDAwMDAwM2IwMDE0MDAwMTAxMTQwMDAyMTEwMTBmMzI0NzAwMDkxMTAxMDExMjAwMDYxNDAxMGYxMTAxMGYxMTAxMDExMjAwMDcyNTQ3MDAwNDAwMTQwMDAyMTEwMTAyNDQwMDRhMTIwMDA4NDMwMDE0MDAwMzBkMTEwMTAwMTIwMDA5NGExMjAwMGEwMzAwNDMwMTBlMDAwYjExMDEwMDEyMDAwYzRhMTIwMDBhMDMwMDQzMDEwZTAwMGQxMTAxMDAxMjAwMGU0YTEyMDAwYTAzMDA0MzAxMGUwMDBmMTEwMTAwMTIwMDEwNGExMjAwMGEwMzAwNDMwMTBlMDAxMTE0MDAwNDExMDAwNDEyMDAwYjEyMDAxMjAzMDAyNTMzMDAwYzExMDAwNDEyMDAwZDEyMDAxMjAzMDAyNTMzMDAwYzExMDAwNDEyMDAwZjEyMDAxMjAzMDAyNTMzMDAwYzExMDAwNDEyMDAxMTEyMDAxMjAzMDAyNTQ3MDAwMjA4NDIxMTAwMDQxMjAwMGIxMjAwMTIwMzEwMWExMTAwMDQxMjAwMGQxMjAwMTIwMzBjMWExODExMDAwNDEyMDAwZjEyMDAxMjAzMDQxYTE4MTEwMDA0MTIwMDExMTIwMDEyMDMwODFhMTgxNDAwMDUxMTAwMDMxMTAxMDMxMjAwMTMxMTAxMDQxMjAwMTQxMjAwMTUwNDAzZTgxYTE4Mjc0NzAwM2ExMTAxMDMxMjAwMTYxMTAxMDQxMjAwMTQxMjAwMTcwNDA0MDAxYTI3NDcwMDIwMTEwMTAzMTIwMDE2MTEwMDA1MTgxMTAxMDMwNzAwMTYzNTQ5MDIxMTAxMDU0MzAwNDkwMDE0MDAwMjQ1MDAwMDQ1MDAxZDExMDAwMzExMDEwMzE1MDAxMzExMDAwNTExMDEwMzE1MDAxNjAyMTEwMTA1NDMwMDQ5MDAxNDAwMDIxMTAwMDI0NzAwZjcwMzAyMTQwMDA2MGQxMTAwMDQwZTAwMTgxMTAwMDYwZTAwMTkxNDAwMDcwZDExMDAwNzA3MDAxYTE2MTEwMTA0MTIwMDFiMTEwMDA3MDcwMDFhMTMwNzAwMWIxNjA3MDAwMTExMDEwMjQ0MDA0YTEyMDAwODQzMDAxODExMDAwNzA3MDAxYTEzMDcwMDFjMTYxMTAxMDAxMjAwMWQxMTAwMDcwNzAwMWExMzA3MDAxZDE2MDMwMDExMDAwNzA3MDAxYTEzMDcwMDFlMTYwZDExMDAwNzA3MDAxZjE2MTEwMTA2NGExMjAwMjAxMTAwMDcwNzAwMWYxMzAyMTEwMDAxNDMwMDQzMDI0OTAyMTEwMTA3MTEwMTA4MTIwMDIxMDIxMTAxMDkxMTAxMGE0YTEyMDAyMjExMDAwNzQzMDExMTAxMGIxMjAwMjM0MzAyNDMwMjE0MDAwODExMDEwNDEyMDAyNDA3MDAyNTEzMTQwMDA5MTEwMDA5MzI0NzAwMDIwODQyMTEwMTBmMTEwMTAxMTIwMDI2MjU0NzAwMTkwMjExMDEwYzExMDAwOTExMDAwODQzMDIxNDAwMGExMTAwMGEzMjQ3MDAwMDQ1MDAwZjAyMTEwMTBkMTEwMDA5MTEwMDA4MGQwMDQzMDQ0OTA4NDIwMDI3MDUyMTIxMjIzYzMxMDAwODIxMjEwYTIyMzAzNzNjMzEwNzIxMjEwMjMwMzcxYzMxMGIyMTIxMGEyMjMwMzczYzMxMGEyMzY3MDkyMTIxMDIzMDM3M2MzMTAzNjcwNzI3MjAzYjNiM2MzYjMyMDUzMzM5MjAyNjNkMDczMjMwMjEwMTNjMzgzMDA4MzgzYTIzMzAxOTNjMjYyMTA2MjYyNTM5M2MzNjMwMDYzNzMwMTgzYTIzMzAwOTM2MzkzYzM2M2UxOTNjMjYyMTA3MzczMDE2MzkzYzM2M2UwYzNlMzAyYzM3M2EzNDI3MzExOTNjMjYyMTBhMzczMDFlMzAyYzM3M2EzNDI3MzEwYjM0MzYyMTNjMjMzMDA2MjEzNDIxMzAwYjIyM2MzYjMxM2EyMjA2MjEzNDIxMzAwNjM5MzAzYjMyMjEzZDAzMjYwMTM4MDUyMTI3MzQzNjNlMDgyMDNiM2MyMTAxM2MzODMwMDMzNDM2MzYwYTIwM2IzYzIxMTQzODNhMjAzYjIxMDgzNzMwM2QzNDIzM2MzYTI3MDczODI2MzIwMTJjMjUzMDAzMjIxYzExMDMzNDNjMzEwOTIxM2MzODMwMjYyMTM0MzgyNTA3MzQzYzMxMTkzYzI2MjEwYjI1MjczYzIzMzQzNjJjMTgzYTMxMzAwNjM2MjAyNjIxM2EzODA2MzQyNjI2M2MzMjNiMGYwMjEwMTcwYTExMTAwMzFjMTYxMDBhMWMxYjEzMWEwOTI2MjEyNzNjM2IzMjNjMzMyYzA0M2YyNjNhM2IwYTI3MzAzMjNjM2EzYjE2M2EzYjMzMDkyNzMwMjUzYTI3MjEwMDI3MzkwNDMwMmQzYzIxIiwKICAgICAgIm1ldGFkYXRhIiwKICAgICAgInByb2R1Y3RTdWIiLAogICAgICAibWFyayIsCiAgICAgICJceDIwaXNceDIwbm90XHgyMGFuXHgyMG9iamVjdC4iLAogICAgICAic3Vic3RyIiwKICAgICAgIkludmFsaWRceDIwYXR0ZW1wdFx4MjB0b1x4MjBzcHJlYWRceDIwbm9uLWl0ZXJhYmxlXHgyMGluc3RhbmNlLlx4MGFJblx4MjBvcmRlclx4MjB0b1x4MjBiZVx4MjBpdGVyYWJsZSxceDIwbm9uLWFycmF5XHgyMG9iamVjdHNceDIwbXVzdFx4MjBoYXZlXHgyMGFceDIwW1N5bWJvbC5pdGVyYXRvcl0oKVx4MjBtZXRob2QuIiwKICAgICAgIkd1bGltIiwKICAgICAgImV4cGVyaW1lbnRhbC13ZWJnbCIsCiAgICAgICJzZXRSZXF1ZXN0SGVhZGVyIiwKICAgICAgImNoYXJnaW5nIiwKICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDMxMDMyNTgxZmFjYTZjMDAwMDAwMDA5MzUwNWQ2MDAwMDAwMWM2MDcwMDAwMTQwMDAxMGQxNDAwMDIwNzAwMDExMTAwMDIwNzAwMDIxNjA3MDAwMzExMDAwMjA3MDAwNDE2MDcwMDA1MTEwMDAyMDcwMDA2MTYxMTAwMDIxMTAxMDIxMzE0MDAwMzA3MDAwNzE0MDAwNDAzMDAxNDAwMDYxMTAxMDExMjAwMDgxMTAwMDYwMzAzMTgyYTQ3MDBiMTExMDEwMTRhMTIwMDA5MTcwMDA2MjE0MzAxMDQwMGZmMmUwMzEwMmIxMTAxMDE0YTEyMDAwOTE3MDAwNjIxNDMwMTA0MDBmZjJlMDMwODJiMmYxMTAxMDE0YTEyMDAwOTE3MDAwNjIxNDMwMTA0MDBmZjJlMmYxNDAwMDUxMTAwMDQxMTAwMDM0YTEyMDAwYTExMDAwNTA1MDBmYzAwMDAyZTAzMTIyYzQzMDExODE3MDAwNDM1NDkxMTAwMDQxMTAwMDM0YTEyMDAwYTExMDAwNTA1MDAwM2YwMDAyZTAzMGMyYzQzMDExODE3MDAwNDM1NDkxMTAwMDQxMTAwMDM0YTEyMDAwYTExMDAwNTA0MGZjMDJlMDMwNjJjNDMwMTE4MTcwMDA0MzU0OTExMDAwNDExMDAwMzRhMTIwMDBhMTEwMDA1MDMzZjJlNDMwMTE4MTcwMDA0MzU0OTQ1ZmYzZjExMDEwMTEyMDAwODExMDAwNjE5MDMwMDI5NDcwMGI0MTEwMTAxNGExMjAwMDkxNzAwMDYyMTQzMDEwNDAwZmYyZTAzMTAyYjExMDEwMTEyMDAwODExMDAwNjI5NDcwMDE2MTEwMTAxNGExMjAwMDkxMTAwMDY0MzAxMDQwMGZmMmUwMzA4MmI0NTAwMDIwMzAwMmYxNDAwMDUxMTAwMDQxMTAwMDM0YTEyMDAwYTExMDAwNTA1MDBmYzAwMDAyZTAzMTIyYzQzMDExODE3MDAwNDM1NDkxMTAwMDQxMTAwMDM0YTEyMDAwYTExMDAwNTA1MDAwM2YwMDAyZTAzMGMyYzQzMDExODE3MDAwNDM1NDkxMTAwMDQxMTAxMDExMjAwMDgxMTAwMDYyOTQ3MDAxNjExMDAwMzRhMTIwMDBhMTEwMDA1MDQwZmMwMmUwMzA2MmM0MzAxNDUwMDAzMTEwMDAxMTgxNzAwMDQzNTQ5MTEwMDA0MTEwMDAxMTgxNzAwMDQzNTQ5MTEwMDA0NDIwMDBiMDExNDQxNjg2YjZhNmQ2YzZmNmU2MTYwNjM2MjY1NjQ2NzY2Nzk3ODdiN2E3ZDdjN2Y3ZTcxNzA3MzQ4NGI0YTRkNGM0ZjRlNDE0MDQzNDI0NTQ0NDc0NjU5NTg1YjVhNWQ1YzVmNWU1MTUwNTMxOTE4MWIxYTFkMWMxZjFlMTExMDAyMDYxNDAyNWExOTQxNmQ0MjRkNTk0ZTQxMWQ3MzYyNWE3ODZiMTExOTA2NjQ0ZjVmNWUxYTFmNzE2MDE4N2IxYjFjMDI3ZTdjNjg0NTZjNDAxZTY3NjU0YjQ2NTg3MDdkNjY3OTVjNTM0NDZmNDM2MzQ3NWI1MDUxMTA2MTdmNmU0YTQ4N2E1ZDZhNGMxNDAyNWExODQxNmQ0MjRkNTk0ZTQxMWQ3MzYyNWE3ODZiMTExOTA2NjQ0ZjVmNWUxYTFmNzE2MDE4N2IxYjFjMDQ3ZTdjNjg0NTZjNDAxZTY3NjU0YjQ2NTg3MDdkNjY3OTVjNTM0NDZmNDM2MzQ3NWI1MDUxMTA2MTdmNmU0YTQ4N2E1ZDZhNGMxNDAyNWExYjAwMDY0NTRjNDc0ZTVkNDEwYTRhNDE0ODViNmE0NjRkNGM2ODVkMDY0YTQxNDg1YjY4NWQiLAogICAgICAidG9TdHJpbmciLAogICAgICAieHh4eHh4eHh4eHh4NHh4eHl4eHh4eHh4eHh4eHh4eHgiLAogICAgICAid2FybiIsCiAgICAgICJwYXJzZSIsCiAgICAgICJzZW50IiwKICAgICAgIml0ZXJhdG9yIiwKICAgICAgIlBERi5QZGZDdHJsLiIsCiAgICAgICJfX2FjX3Rlc3RpZCIsCiAgICAgICJjbGlja0xpc3QiLAogICAgICAiY3JlYXRlIiwKICAgICAgImhhc093blByb3BlcnR5IiwKICAgICAgImluaXQiLAogICAgICAiQW5ceDIwaW5pdGlhbGl6ZXIiLAogICAgICAiY2xpZW50SGVpZ2h0IiwKICAgICAgImV4dHJhcyIsCiAgICAgICJfX2VzTW9kdWxlIiwKICAgICAgInNlc3Npb25TdG9yYWdlIiwKICAgICAgImtLZXlib2FyZEZhc3QiLAogICAgICAiZGV2aWNlUGl4ZWxSYXRpbyIsCiAgICAgICI7XHgyMHBhdGg9LzsiLAogICAgICAibG9jYXRpb24iLAogICAgICAiR1JFRU5fQklUUyIsCiAgICAgICI0ODRlNGY0YTQwM2Y1MjQzMDAxOTJkMTEyNTdhNmZjMDAwMDAwMDAwZDRjZjAwNzUwMDAwMDA2NzAzMDExNDAwMDExMTAxMDA0YTEyMDAwMDExMDEwNjAzMDYyYjExMDAwMTJmNDMwMTE0MDAwMjExMDEwMDRhMTIwMDAwMTEwMTAxNGExMjAwMDExMTAxMDE0YTEyMDAwMjQzMDAwNDAxMDAxYTQzMDE0MzAxMTQwMDAzMDIxMTAxMDIxMTAwMDMxMTAxMDU0MzAyMTQwMDA0MTEwMDAyMTEwMDAzMTgxMTAwMDQxODE0MDAwNTAyMTEwMTAzMTEwMDA1MDcwMDAzNDMwMjQyMDAwNDBjNWY0YjU2NTQ3YTUxNTg0YjdhNTY1ZDVjMDU1ZjU1NTY1NjRiMDY0YjU4NTc1ZDU2NTQwMjRhMDgiLAogICAgICAiQ2FzdGVsbGFyIiwKICAgICAgInRvR01UU3RyaW5nIiwKICAgICAgIm1vekhpZGRlbiIsCiAgICAgICJTZXQiLAogICAgICAiW25hdGl2ZVx4MjBjb2RlXSIsCiAgICAgICJjb21wbGV0ZSIsCiAgICAgICI0ODRlNGY0YTQwM2Y1MjQzMDAxMjI3MGYwYjhhYTMyOTAwMDAwMDAwNWNkZGRhMjcwMDAwMDA4YTAyMTEwMTAwNDMwMDMyNDcwMDdlMTEwMTAxNGExMjAwMDAwNzAwMDE0MzAxMTQwMDAxMTEwMDAxMTIwMDAyNGExMjAwMDM0MzAwNGExMjAwMDQxMTAxMDQwNzAwMDUwNzAwMDY0NDAyMDcwMDA3NDMwMjRhMTIwMDA4MDcwMDA5NDMwMTAzMDAyNzM0MDAyYzExMDEwMjEyMDAwMzRhMTIwMDAzNDMwMDRhMTIwMDA0MTEwMTA0MDcwMDA1MDcwMDA2NDQwMjA3MDAwNzQzMDI0YTEyMDAwODA3MDAwOTQzMDEwMzAwMjczNDAwMTAxMTAxMDIxMjAwMGE0YTEyMDAwMzQzMDAwNzAwMGIyNjQyMDE0MjAwMGMwZDE4MDkxZTFhMGYxZTNlMTcxZTE2MWUxNTBmMDYxODFhMTUwZDFhMDgwOTBmMTQzZjFhMGYxYTJlMjkzNzA4MGYxNDI4MGYwOTEyMTUxYzA3MDkxZTBiMTcxYTE4MWUwMzI3MDg1MTAxMWMwMDA3MTIxNTFmMWUwMzM0MWQwYTE1MWEwZjEyMGQxZTE4MTQxZjFlMDcwYjE3MGUxYzEyMTUwODE0MjAxNDE5MTExZTE4MGY1YjJiMTcwZTFjMTIxNTNhMDkwOTFhMDIyNiIsCiAgICAgICJmaWx0ZXIiLAogICAgICAicnVuQ2xhc3NGaW5pc2hlcnMiLAogICAgICAid2Via2l0VmlzaWJpbGl0eVN0YXRlIiwKICAgICAgIjIuMTEuMCIsCiAgICAgICJceDIwYWZ0ZXJceDIwZGVjb3JhdGlvblx4MjB3YXNceDIwZmluaXNoZWQiLAogICAgICAic3VmZml4ZXMiLAogICAgICAiY29tcGxldGVkIiwKICAgICAgInNyYyIsCiAgICAgICJDYW5ub3RceDIwaW5zdGFudGlhdGVceDIwYW5ceDIwYXJyb3dceDIwZnVuY3Rpb24iLAogICAgICAiZ2V0VGltZSIsCiAgICAgICJyZXN1bHROYW1lIiwKICAgICAgImNoaWxkcmVuIiwKICAgICAgImFjY2Vzc29yLmdldCIsCiAgICAgICI0ODRlNGY0YTQwM2Y1MjQzMDAyNDE1M2M0MDM3ZjAwMDAwMDAwMDA5ZDcyMmMxZTUwMDAwMDBkMjAwMTEwMjA4MTUwMDAyMDg0MjAyMTEwMTAwNDMwMDQ3MDAxYzExMDEwMTRhMTIwMDAwMDcwMDAxNDMwMTE0MDAwMTA1MDAwMDAwMDAzYjAwMTEwMDAxMTUwMDAzMDIxMTAxMDI0MzAwNDcwMDU1M2UwMDJiMTQwMDAyMTEwMDAyMTIwMDA0MTEwMTA0MDcwMDA1MTMyNTMzMDAwYzExMDEwMzEyMDAwNjEyMDAwNzAzMDAyNTQ3MDAwNzAwMTEwMTA4MTUwMDAyNDEzZDAwMjQxMTAxMDMxMjAwMDY0YTEyMDAwODA3MDAwOTA3MDAwYTQzMDI0OTExMDEwMzEyMDAwNjRhMTIwMDBiMDcwMDA5NDMwMTQ5NDEwMjExMDEwNTQzMDA0NzAwMjMxMTAxMDMxMjAwMGMzMjMzMDAwZjExMDEwMzEyMDAwZDM0MDAwNjExMDEwMzEyMDAwZTQ3MDAwNzAwMTEwMTA4MTUwMDAyMTEwMTA2MTIwMDBmMTEwMTA4MTIwMDAyMDMwMjJiMmYxMTAxMDYwNzAwMGYzNTQ5MDg0MjAwMTAwNDYzN2M2OTYyMDQ3ODY5N2Y3ODA5NjU2MjZmNjM2YjYyNjU3ODYzMDc2MzYyNjk3ZTdlNjM3ZTA0NmY2MzY4NjkxMjVkNTk0MzU4NGQ1MzQ5NTQ0ZjQ5NDk0ODQ5NDg1MzQ5NWU1ZTBlN2Y2OTdmN2Y2NTYzNjI1Zjc4NjM3ZTZkNmI2OTA2NjA2OTYyNmI3ODY0MDc3ZjY5Nzg0NTc4Njk2MTEwN2Y2MzYxNjk0NzY5NzU0NDY5N2U2OTRlNzU3ODY5NjgwMDBhN2U2OTYxNjM3YTY5NDU3ODY5NjEwOTY1NjI2ODY5NzQ2OTY4NDg0ZTBjNWM2MzY1NjI3ODY5N2U0OTdhNjk2Mjc4MGU0MTVmNWM2MzY1NjI3ODY5N2U0OTdhNjk2Mjc4MDc2OTYyN2E2ZjYzNjg2OSIsCiAgICAgICJodHRwczovL21zc2RrLmJ5dGVkYW5jZS5jb20vd2Vic2RrL3YxL2dldEluZm8iLAogICAgICAiP3E9IiwKICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDNlMTkzOTBiY2Q0MTc5MDAwMDAwMDA4NGZjMjlmMTAwMDAwMDYxMTEwMTAwMTIwMDAwMzMwMDBkMTEwMTAwMTIwMDAwMTIwMDAxMDcwMDAyMjM0NzAwMDMwMzAxNDIxMTAxMDExMjAwMDMxMTAxMDExMjAwMDQxMjAwMDMyNjQ3MDAwMzAzMDE0MjExMDEwMTEyMDAwNTExMDEwMTEyMDAwNjI2NDcwMDAzMDMwMTQyMTEwMTAxMTIwMDA3MTIwMDA4MTEwMTAyMTIwMDA3MTIwMDA4MjQ0NzAwMDMwMzAxNDIwMzAyNDIwMDA5MGMzMTI1MzYzYTMyMTIzYjMyM2EzMjM5MjMwNzIzMzYzMDE5MzYzYTMyMDYxZTExMDUxNjFhMTIwODNiMzgzNDM2MjMzZTM4MzkwNjI3MzYyNTMyMzkyMzA0MjQzMjNiMzEwMzIzMzgyNzA2MzEyNTM2M2EzMjI0MDYzYjMyMzkzMDIzM2YiLAogICAgICAiZGVmaW5lUHJvcGVydHkiLAogICAgICAiW29iamVjdFx4MjBHZW5lcmF0b3JdIiwKICAgICAgIldpbmdkaW5ncyIsCiAgICAgICJoYXNJbnN0YW5jZSIsCiAgICAgICJTSEFESU5HX0xBTkdVQUdFX1ZFUlNJT04iLAogICAgICAicGxhdGZvcm0iLAogICAgICAiNDg0ZTRmNGE0MDNmNTI0MzAwMDcxNTJjYzJjMWE1M2MwMDAwMDA2MTIzNTQ2Njk3MDAwMDAwN2YxMTAwMDEwNzAwMDIyNTM0MDAwNzExMDAwMTA3MDAwMzI1MzQwMDA3MTEwMDAxMDcwMDA0MjUzNDAwMDcxMTAwMDEwNzAwMDUyNTQ3MDAwMjAwNDIzZTAwMDQxNDAwMDI0MTNkMDAyYjExMDIwMjExMDAwMTEzMzMwMDFiMTEwMjAyMTEwMDAxMTMxMjAwMDYwODI2MzQwMDBjMTEwMjAyMTEwMDAxMTMxMjAwMDcwODI2NDcwMDAyMDA0MjQxMDg0MjExMDEwMTRhMTIwMDAwMTEwMTAyNDMwMTRhMTIwMDAxMDUwMDAwMDAwMDNiMDE0MzAxMTQwMTAwMDg0MjAwMDgxMzcxNzM2MjU5NjE3ODQ2NjQ3OTY2NzM2NDYyNmY1ODc3N2I3MzY1MDQ2NTc5N2I3MzA4NzU3MzcwNDU3ZTc3NjQ2NjA4NTU3MzcwNDU3ZTc3NjQ2NjA1NzM3OTc3NjY3ZjE2NzM3OTQxNzM3NDU0NjQ3OTYxNjU3MzY0NTI3ZjY1NjY3NzYyNzU3ZTczNjQwZjc0N2Y3ODcyNTk3NDdjNzM3NTYyNTc2NTZmNzg3NTBlN2Y2NTUzNTk0MTczNzQ1NDY0Nzk2MTY1NzM2NCIsCiAgICAgICJhc3luY0l0ZXJhdG9yIiwKICAgICAgIm9iamVjdCIsCiAgICAgICJjb2xvckRlcHRoIiwKICAgICAgImtleXMiLAogICAgICAid3JhcHBlZCIsCiAgICAgICJnZXR0ZXIiLAogICAgICAiZmluYWxpemVkIiwKICAgICAgImFsbCIsCiAgICAgICJhcHBOYW1lIiwKICAgICAgInJlZ2lvbkNvbmYiLAogICAgICAiYXBwbGljYXRpb24veC13d3ctZm9ybS11cmxlbmNvZGVkIiwKICAgICAgImF0dGVtcHRlZFx4MjB0b1x4MjBnZXRceDIwcHJpdmF0ZVx4MjBmaWVsZFx4MjBvblx4MjBub24taW5zdGFuY2UiLAogICAgICAiY3JlYXRlRXZlbnQiLAogICAgICAiYm9keSIsCiAgICAgICJ0b0VsZW1lbnRGaW5pc2hlckV4dHJhcyIsCiAgICAgICJvcGVuIiwKICAgICAgImRpc3BsYXlOYW1lIiwKICAgICAgIl91cmxSZXdyaXRlUnVsZXMiLAogICAgICAicmFuZG9tIiwKICAgICAgImZvbnQiLAogICAgICAiNDg0ZTRmNGE0MDNmNTI0MzAwMzEwMzMxOTE1NzZjNDAwMDAwMDAwMDk0MGM1ZWI1MDAwMDAwNTMwMjExMDEwMDQzMDAzMjQ3MDA0NzA3MDAwMDExMDEwMTM2MzIzNDAwMGIxMTAxMDExMjAwMDAxMTAxMDIzNzMyMzQwMDA3MDcwMDAxMTEwMTAzMzYzNDAwMDcwNzAwMDIxMTAxMDMzNjM0MDAwNzA3MDAwMzExMDEwMzM2MzQwMDBmMDcwMDA0MTEwMTAzMzYwNzAwMDUxMTAxMDMzNjI3NDIwMTQyMDAwNjA3N2Q2MTc4NmE2NDYzN2UwODUyN2Q2NTZjNjM3OTYyNjAwYjZlNmM2MTYxNWQ2NTZjNjM3OTYyNjAwYjUyNTI2MzY0NmE2NTc5NjA2YzdmNjgwNTRjNzg2OTY0NjIxODRlNmM2MzdiNmM3ZTVmNjg2MzY5Njg3ZjY0NjM2YTRlNjI2Mzc5Njg3NTc5M2Y0OSIsCiAgICAgICJkaXNjaGFyaW5nVGltZSIsCiAgICAgICJTaW1TdW4tRXh0QiIsCiAgICAgICJmcm9tQ2xhc3NEZXNjcmlwdG9yIiwKICAgICAgInZlcnNpb25zIiwKICAgICAgImNoYXJDb2RlQXQiLAogICAgICAiZmlsbFRleHQiLAogICAgICAiZmV0Y2giLAogICAgICAiZnJlZXplIiwKICAgICAgIkNyZWF0ZVx4MjBXZWJTb2NrZXQiLAogICAgICAid2Via2l0UlRDUGVlckNvbm5lY3Rpb24iLAogICAgICAiZGlnZXN0IiwKICAgICAgImNsYXNzIiwKICAgICAgIk1BWF9WRVJURVhfVU5JRk9STV9WRUNUT1JTIiwKICAgICAgImZpbGVuYW1lIiwKICAgICAgImZpcnN0IiwKICAgICAgInZpc2liaWxpdHljaGFuZ2UiLAogICAgICAiQVx4MjBjbGFzc1x4MjBkZXNjcmlwdG9yIiwKICAgICAgImNsaWVudFdpZHRoIiwKICAgICAgImZyb250aWVyU2lnbiIsCiAgICAgICJtc1Zpc2liaWxpdHlTdGF0ZSIsCiAgICAgICJhbnRpYWxpYXMiLAogICAgICAiNDg0ZTRmNGE0MDNmNTI0MzAwMmEzZDA0ZmEwMzI3MzkwMDAwMDAwMGI5MzE0NWQ3MDAwMDA0MDYxMTAxMDAxMjAwMDA0YTEyMDAwMTQzMDAxNDAwMDExMTAxMDAxMjAwMDI0YTEyMDAwMTQzMDAxNDAwMDIwMzAwMTQwMDAzMDMwMTE0MDAwNDAzMDIxNDAwMDUwMzAzMTQwMDA2MDMwNDE0MDAwNzAzMDUxNDAwMDgxMTAwMDgxNDAwMDkwNzAwMDMxNDAwMGEwNzAwMDQxNDAwMGIwNzAwMDUxNDAwMGMwNzAwMDYxNDAwMGQwNzAwMDcxNDAwMGUwNzAwMDgxNDAwMGYwNzAwMDkxNDAwMTAwNzAwMGExNDAwMTExMTAwMDE0YTEyMDAwYjA3MDAwYzQzMDEwMzAwMmEzNDAwMGYxMTAwMDE0YTEyMDAwYjA3MDAwZDQzMDEwMzAwMmE0NzAwMDkxMTAwMDcxNDAwMDk0NTAwZGUxMTAwMDE0YTEyMDAwYjExMDAwYTQzMDEwMzAwMmE0NzAwMDkxMTAwMDMxNDAwMDk0NTAwYzMxMTAwMDE0YTEyMDAwYjExMDAwYzQzMDEwMzAwMmE0NzAwMDkxMTAwMDQxNDAwMDk0NTAwYTgxMTAwMDE0YTEyMDAwYjExMDAwZDQzMDEwMzAwMmEzNDAwMGYxMTAwMDE0YTEyMDAwYjA3MDAwZTQzMDEwMzAwMmEzNDAwMGYxMTAwMDE0YTEyMDAwYjA3MDAwZjQzMDEwMzAwMmE0NzAwMDkxMTAwMDUxNDAwMDk0NTAwNjkxMTAwMDE0YTEyMDAwYjExMDAwZTQzMDEwMzAwMmEzNDAwMGYxMTAwMDE0YTEyMDAwYjExMDAwZjQzMDEwMzAwMmEzNDAwMGYxMTAwMDE0YTEyMDAwYjExMDAxMDQzMDEwMzAwMmEzNDAwMGYxMTAwMDE0YTEyMDAwYjA3MDAxMDQzMDEwMzAwMmEzNDAwMGYxMTAwMDE0YTEyMDAwYjA3MDAxMTQzMDEwMzAwMmE0NzAwMDkxMTAwMDYxNDAwMDk0NTAwMDYxMTAwMDgxNDAwMDkxMTAwMDI0YTEyMDAwYjExMDAwYjQzMDEwMzAwMmEzMzAwMDcxMTAwMDkxMTAwMDMyNjQ3MDAwNTAwNDI0NTAxMmMxMTAwMDI0YTEyMDAwYjExMDAwZDQzMDEwMzAwMmEzNDAwMGYxMTAwMDI0YTEyMDAwYjExMDAwYzQzMDEwMzAwMmEzNDAwMGYxMTAwMDI0YTEyMDAwYjA3MDAxMjQzMDEwMzAwMmEzMzAwMDcxMTAwMDkxMTAwMDUyNjMzMDAwNzExMDAwOTExMDAwNDI2NDcwMDA1MDA0MjQ1MDBkZDExMDAwMjRhMTIwMDBiMTEwMDExNDMwMTAzMDAyYTM0MDAwZjExMDAwMjRhMTIwMDBiMTEwMDBmNDMwMTAzMDAyYTM0MDAwZjExMDAwMjRhMTIwMDBiMTEwMDEwNDMwMTAzMDAyYTM0MDAwZjExMDAwMjRhMTIwMDBiMTEwMDBlNDMwMTAzMDAyYTMzMDAwNzExMDAwOTExMDAwNzI2MzMwMDA3MTEwMDA5MTEwMDA2MjY0NzAwMDUwMDQyNDUwMDdjMTEwMDAyNGExMjAwMGIxMTAwMGI0MzAxMDMwMDI3MzMwMDBmMTEwMDAyNGExMjAwMGIxMTAwMGQ0MzAxMDMwMDI3MzMwMDBmMTEwMDAyNGExMjAwMGIxMTAwMTE0MzAxMDMwMDI3MzMwMDBmMTEwMDAyNGExMjAwMGIxMTAwMGU0MzAxMDMwMDI3MzMwMDBmMTEwMDAyNGExMjAwMGIxMTAwMGY0MzAxMDMwMDI3MzMwMDBmMTEwMDAyNGExMjAwMGIxMTAwMTA0MzAxMDMwMDI3MTQwMDEyMTEwMDEyMTEwMDA5MTEwMDA4MjUyNjQ3MDAwMjAwNDIwMzAwMTQwMDEzMDMwMTE0MDAxNDAzMDIxNDAwMTUwMzAzMTQwMDE2MDMwNDE0MDAxNzAzMDUxNDAwMTgxMTAwMTgxNDAwMTkxMTAwMDE0YTEyMDAwYjA3MDAxMzQzMDEwMzAwMmE0NzAwMDkxMTAwMTUxNDAwMTk0NTAwOGExMTAwMDE0YTEyMDAwYjA3MDAxNDQzMDEwMzAwMmEzNDAwMGYxMTAwMDE0YTEyMDAwYjA3MDAxNTQzMDEwMzAwMmEzNDAwMGMxMTAwMDE0YTEyMDAwYjA3MDAxNjQzMDE0NzAwMDkxMTAwMTQxNDAwMTk0NTAwNGUxMTAwMDE0YTEyMDAwYjA3MDAxNzQzMDEwMzAwMmE0NzAwMDkxMTAwMTMxNDAwMTk0NTAwMzMxMTAwMDE0YTEyMDAwYjA3MDAxODQzMDEwMzAwMmEzNDAwMGYxMTAwMDE0YTEyMDAwYjA3MDAxOTQzMDEwMzAwMmE0NzAwMDkxMTAwMTcxNDAwMTk0NTAwMDYxMTAwMTgxNDAwMTkwMjExMDEwMTQzMDA0YTEyMDAwMTQzMDAxNDAwMWExMTAwMTkxMTAwMTMyNDMzMDAwNzExMDAxOTExMDAxNDI0MzMwMDIxMTEwMTAyMTIwMDFhMzQwMDE4MTEwMTAwMTIwMDFiNGExMjAwMWM0MzAwNGExMjAwMGIwNzAwMWQ0MzAxMDMwMDJhNDcwMDAyMDA0MjExMDAxOTExMDAxMzI0MzMwMDA3MTEwMDE5MTEwMDE0MjQzMzAwMGYxMTAwMWE0YTEyMDAwYjA3MDAxYTQzMDEwMzAwMmE0NzAwMDIwMDQyMDE0MjAwMWUwOTBiMGQxYjBjM2YxOTFiMTAwYTBiMGExMTMyMTEwOTFiMGMzZDFmMGQxYjA4MGUxMjFmMGExODExMGMxMzA3MDkxNzEwMWExMTA5MGQwMzA5MTcxMDA3MWYxMDFhMGMxMTE3MWEwNTEyMTcxMDBiMDYwNjE3MGUxNjExMTAxYjA0MTcwZTFmMWEwNDE3MGUxMTFhMDMxMzFmMWQwNzE3MTAxYTFiMDYzMTE4MDkxMzFmMWQxNzEwMGExMTBkMTYwYzEzMWYxZDIxMGUxMTA5MWIwYzBlMWQ1NzA0MWQwYzExMGQwMzA2NGY0ZjA1MWQwYzE3MTEwZDA1MTgwNjE3MTEwZDA0MGUxNzE1MWIwODE4MTcwYzFiMTgxMTA2NTEwNjExMGUxYjBjMWY1MTA1NWUxMTBlMGM1MTA1NWUxMTBlMGE1MTA3MWQxNjBjMTExMzFiNTEwODBhMGMxNzFhMWIxMDBhNTEwNDEzMGQxNzFiMDYxZDE2MGMxMTEzMWIwNjA4MWIxMDFhMTEwYzA4MGExMTJkMGEwYzE3MTAxOTA2MzkxMTExMTkxMjFiIiwKICAgICAgInNldFRUV2ViaWQiLAogICAgICAiQnVmZmVyIiwKICAgICAgIl9lbmFibGVQYXRoTGlzdFJlZ2V4IiwKICAgICAgIm91dGVyV2lkdGgiLAogICAgICAidHlwZSIsCiAgICAgICJkZWNvcmF0ZUVsZW1lbnQiLAogICAgICAiNDg0ZTRmNGE0MDNmNTI0MzAwMDQwZTEzMWM4NWQzOTUwMDAwMDY0ZDY2NWVhYWI5MDAwMDA3Y2EwNTAwMDAwMWQwM2IwMDE0MDAwMTA1MDAwMDAzOTUzYjAwMTQwMDAyMDUwMDAwMDQ2YTNiMDAxNDAwMDMxMTAyMDg0NDAwMTQwMDA0MDIxMTAwMDI0MzAwNDkwMjExMDAwMzQzMDA0OTA3MDA0YjA3MDA0YzA3MDA0ZDA3MDA0ZTA3MDA0ZjA3MDA1MDA3MDA1MTA3MDA1MjA3MDA1MzA3MDA1NDA3MDA1NTA3MDA1NjA3MDA1NzA3MDA1ODA3MDA1OTA3MDA1YTA3MDA1YjA3MDA1YzBjMDAxMjE0MDAwNzAyMTEwMjA5MTEwMjAwMTEwMDA3MDMwMDQzMDMxNDAwMDUxMTAwMDUwMjExMDIwOTExMDIwMDA3MDA1ZDEzMDcwMDVlMGMwMDAxMTEwMDA3MTIwMDVmNDMwMzJmMTcwMDA1MzU0OTA3MDA2MDBjMDAwMTE0MDAwODAyMTEwMjA5MTEwMjA2MDcwMDYxMTMxMTAwMDgwMzAwNDMwMzE0MDAwNjBkMTQwMDA5MDIxMTAyMGE0MzAwMTEwMDA5MDcwMDYyMTYwMjExMDIwYjQzMDAxMTAwMDkwNzAwNjMxNjAyMTEwMjBjNDMwMDExMDAwOTA3MDA2NDE2MDcwMDE4MTEwMjA4NDQwMDRhMTIwMDY1NDMwMDE4MTEwMDA5MDcwMDY2MTYxMTAyMGQ0YTEyMDA2NzExMDAwNDRhMTIwMDY4NDMwMDFkMDMzYzFiNDMwMTExMDAwOTA3MDA2OTE2MDIxMTAyMGU0MzAwMTEwMDA5MDcwMDZhMTYwMjExMDIwZjQzMDA0YTEyMDAwODQzMDAxMTAwMDkwNzAwMWQxNjExMDAwNTExMDAwOTA3MDA2YjE2MTEwMDA2MTEwMDA5MDcwMDZjMTYwMjExMDIxMDQzMDAxMTAwMDkwNzAwNmQxNjAyMTEwMDAxNDMwMDExMDAwOTA3MDA2ZTE2MDIxMTAyMTE0MzAwMTEwMDA5MDcwMDZmMTYwMzAxMTQwMDBhMTEwMjEyMTIwMDcwMTEwMDA5MDcwMDcwMTYwMjExMDIxMzA3MDA3MTQzMDExMTAwMDkwNzAwNzIxNjAyMTEwMjEzMDcwMDczNDMwMTExMDAwOTA3MDA3NDE2MTEwMDBhMTEwMDA5MDcwMDc1MTYwMzAwMTEwMDA5MDcwMDc2MTYxMTAyMTQxMjAwNzcxMTAwMDkwNzAwNzcxNjExMDAwOTQyM2UwMDA3MTQwMDBhMDMwMDQyNDEzZDAxYjYwMzAwMTQwMDAxMTEwMzAwMDcwMDAwMTMzNDAwMTQxMTAzMDEwNzAwMDExMzRhMDcwMDAyMTMwNzAwMDM0MzAxMDMwMDJhNDcwMDA2MDcwMDA0NDUwMDAyMDMwMDE0MDAwMjA3MDAwNTExMDMwMjNhMjQ0NzAwMDYwNzAwMDY0NTAwMDIwMzAwMTQwMDAzMTEwMzAzMDcwMDA3MTMwNzAwMDgxMzRhMDcwMDA5MTMxMTAzMDAwNzAwMGExMzQzMDE0YTA3MDAwMjEzMDcwMDBiNDMwMTAzMDAyOTM0MDAyZTExMDMwMDA3MDAwYzEzMzMwMDBiMTEwMzAwMDcwMDBjMTMwNzAwMGQxMzMzMDAxNjA3MDAwZTExMDMwMDA3MDAwYzEzMDcwMDBkMTM0YTA3MDAwODEzNDMwMDI1MzQwMDA3MTEwMzAwMDcwMDBmMTMxNDAwMDQxMTAwMDQ0NzAwMDYwNzAwMTA0NTAwMDIwMzAwMTQwMDA0MTEwMDA0MzMwMDExMTEwMzAxMDcwMDAxMTM0YTA3MDAxMTEzMDcwMDEyNDMwMTQ3MDAwNjA3MDAxMzQ1MDAwMjAzMDAxNDAwMDUxMTAzMDAwNzAwMTQxMzMzMDAwNDExMDAwMjMyNDcwMDA2MDcwMDE1NDUwMDAyMDMwMDE0MDAwNjAyMTEwMzA0NDMwMDE0MDAwNzExMDAwNzMyMzMwMDA3MTEwMzAwMDcwMDE2MTM0NzAwMDYwNzAwMTc0NTAwMDIwMzAwMTQwMDA4MDcwMDE4MTQwMDA5MTEwMDAyNDcwMDBiMTEwMDAxMDMwMTJmMTcwMDAxMzU0OTExMDAwMzQ3MDAwZTExMDAwMTAzMDEwMzAxMmIyZjE3MDAwMTM1NDkxMTAwMDg0NzAwMGUxMTAwMDEwMzAxMDMwMjJiMmYxNzAwMDEzNTQ5MTEwMDA3NDcwMDBlMTEwMDAxMDMwMTAzMDMyYjJmMTcwMDAxMzU0OTExMDAwNjQ3MDAwZTExMDAwMTAzMDEwMzA0MmIyZjE3MDAwMTM1NDkxMTAwMDU0NzAwMGUxMTAwMDEwMzAxMDMwNTJiMmYxNzAwMDEzNTQ5MTEwMDA0NDcwMDBlMTEwMDAxMDMwMTAzMDYyYjJmMTcwMDAxMzU0OTExMDAwMTQyNDEwODQyMTEwMzA1MTIwMDE5MDcwMDFhMTMzMjQ3MDAwYzAzMDAxMTAzMDUxMjAwMTkwNzAwMWExNjNlMDAxMDE0MDAwMzAzMDExMTAzMDUxMjAwMTkwNzAwMWExNjQxM2QwMDQ5MTEwMzAwMDcwMDFiMTM0NzAwM2UxMTAzMDAwNzAwMWIxMzQ0MDAxNDAwMDExMTAzMDY0YTA3MDAxYzEzMDcwMDFkNDMwMTRhMDcwMDFlMTMwNzAwMWY0MzAxMTQwMDAyMDUwMDAwMDQxMDNiMDAxMTAwMDEwNzAwMjMxNjA3MDAyNDExMDAwMTA3MDAyNTE2NDEwODQyM2UwMDEwMTQwMDAyMDMwMTExMDQwNTEyMDAxOTA3MDAxYTE2NDEzZDAwNDIxMTAxMDI0YTA3MDAyMDEzMTEwMTAxMDMwMDAzMDA0MzAzNDkwMzAwMTEwMTAyNGEwNzAwMjExMzAzMDAwMzAwMDMwMTAzMDE0MzA0MDcwMDIyMTMwMzAzMTMyNTE0MDAwMTAzMDIxMTAwMDExODExMDQwNTEyMDAxOTA3MDAxYTE2NDEwODQyMGMwMDAwMTQwMDAxMDcwMDI2MDcwMDI3MDcwMDI4MDcwMDI5MDcwMDJhMDcwMDJiMDcwMDJjMDcwMDJkMDcwMDJlMDcwMDJmMDcwMDMwMDcwMDMxMDcwMDMyMDcwMDMzMDcwMDM0MDcwMDM1MDcwMDM2MDcwMDM3MDcwMDM4MDcwMDM5MGMwMDE0MTQwMDAyMTEwMzAxMDcwMDNhMTMzMjQ3MDAwZTA3MDAzYjExMDMwNTEyMDAxOTA3MDAzYzM1NDIzZTAwMTIxNDAwMDUwNzAwM2QxMTAzMDUxMjAwMTkwNzAwM2MzNTQyNDEzZDAwM2IwNTAwMDAwNTIwM2MwMjE0MDAwMzExMDAwMjRhMDcwMDQ4MTMwNTAwMDAwNWM2M2IwMjQzMDExNDAwMDQxMTAzMDc0YTA3MDA0OTEzMTEwMDA0NDMwMTRhMDcwMDQwMTMwNTAwMDAwNWQzM2IwMDQzMDE0OTQxMDg0MjExMDUwMTA3MDAzYTEzNGEwNzAwM2UxMzBkMTEwMDAxMGUwMDNmNDMwMTRhMDcwMDQwMTMwNTAwMDAwNTUyM2IwMTQzMDE0YTA3MDA0NTEzMDUwMDAwMDU5ZTNiMDE0MzAxNDIxMTAwMDEwNzAwNDExMzA3MDA0MjQ4MDAxMDA3MDA0MzQ4MDAxNjA3MDA0NDQ4MDAxYzQ5NDUwMDI0MDMwMTExMDMwMTExMDEwMjE2NDUwMDIxMDMwMjExMDMwMTExMDEwMjE2NDUwMDE1MDMwMDExMDMwMTExMDEwMjE2NDUwMDA5MDMwNTExMDMwMTExMDEwMjE2MDg0MjAzMDExZDExMDAwMTA3MDA0NjEzNGEwNzAwMDIxMzA3MDA0NzQzMDEyNjQ3MDAwNTAzMDQ0NTAwMDIwMzAzMTEwMzAxMTEwMTAyMTYwODQyMDIxMTAxMDMxMTAwMDExMTAwMDI0MzAyNDIxMTAxMDE0YTA3MDA0YTEzMDcwMDE4NDMwMTExMDQwNTEyMDAxOTA3MDAzYzM1NDIwZDE0MDAwMTExMDIxNDA3MDA3ODEzMTQwMDAyMTEwMDAyMDcwMDE4MjQ0NzAwMGExMTAwMDIxMTAwMDEwNzAwNzgxNjExMDIxNDA3MDA3OTEzMTQwMDAzMTEwMDAzMDcwMDE4MjQ0NzAwMGExMTAwMDMxMTAwMDEwNzAwN2ExNjExMDIxNDA3MDA3YjEzMTQwMDA0MTEwMDA0MDcwMDE4MjQ0NzAwMGExMTAwMDQxMTAwMDEwNzAwN2MxNjExMDAwMTQyMDUwMDAwMDAwMDNiMDAxNDAwMDEwNTAwMDAwNWViM2IwMDE0MDAwMjAyMTEwMTE1NDMwMDQ5MDIxMTAxMTY0MzAwNDkwMjExMDExNzQzMDA0OTAyMTEwMTE4NDMwMDQ5MDIxMTAxMTk0MzAwNDkxMTAxMDM0YTEyMDA3ZDExMDEwNTEyMDAxOTAyMTEwMDAxNDMwMDQzMDI0OTExMDEwMzRhMTIwMDdkMTEwMTA1MTIwMDdlMDIxMTAxMWE0MzAwNDMwMjQ5MTEwMTAzNGExMjAwN2QxMTAxMDUxMjAwN2YwMjExMDExYjQzMDA0MzAyNDkxMTAxMDM0YTEyMDA3ZDExMDEwNTEyMDA4MDAyMTEwMDAyNDMwMDQzMDI0OTExMDExNDEyMDA4MTRhMTIwMDgyMDMwMDQzMDExNDAwMDMwZDExMDAwMzBlMDA4MzE0MDAwNDA3MDA4NDE0MDAwNTAyMTEwMTFjMDIxMTAxMWQxMTAwMDU0MzAxMDMwYTQzMDIxNDAwMDYxMTAwMDY0NzAwMGUxMTAwMDYwMzAxMTgxNzAwMDYzNTQ5NDUwMDA1MDMwMTE0MDAwNjAyMTEwMTFlMTEwMDA1MTEwMDA2NDMwMjQ5MTEwMDA2MTEwMTA1MDcwMDE5MTMwNzAwODUxNjExMDEwMzRhMTIwMDdkMTEwMDA0MTEwMTA1NDMwMjQ5MDIxMTAxMWYxMTAxMjA0YTEyMDA4NjExMDAwNDQzMDExMTAxMjExMjAwODc0MzAyMTQwMDA3MDIxMTAxMjIxMTAxMjMxMjAwODgxMTAwMDc0MzAyMTQwMDA4MTEwMTEyMTIwMDg5MDcwMDhhMTMxNDAwMDkxMTAwMDkzMjQ3MDAwMjA4NDIxMTAxMjQ0NzAwMWIxMTAxMjQ0YTEyMDA0MDAyMTEwMTI1MTEwMDA5MTEwMDA4MGQwMDQzMDQ0MzAxNDk0NTAwMGYwMjExMDEyNTExMDAwOTExMDAwODBkMDA0MzA0NDkwODQyMDA4YjA1MWIwNDExMDYxNTA5MDEwNzExMDYzNTEzMTExYTAwMDcxZDFhMTAxMTBjM2IxMjA1NTQzYjI0MjY1YjA1M2IwNDExMDYxNTA5MDExYTEwMTExMjFkMWExMTEwMDczMjFkMDYxMTEyMWIwYzA5MDQwNjFiMDAxYjAwMGQwNDExMDgwMDFiMjcwMDA2MWQxYTEzMDQxNzE1MTgxODBiM2MyMDM5MzgzMTE4MTExOTExMWEwMDBiMzcxYjFhMDcwMDA2MDExNzAwMWIwNjA2MDcxNTEyMTUwNjFkMTAwNDAxMDcxYzNhMWIwMDFkMTIxZDE3MTUwMDFkMWIxYTIxMmYxYjE2MWUxMTE3MDA1NDI3MTUxMjE1MDYxZDI2MTExOTFiMDAxMTNhMWIwMDFkMTIxZDE3MTUwMDFkMWIxYTI5MGYzNTA0MDQxODExMjQxNTBkMjcxMTA3MDcxZDFiMWEwNjI3MTUxMjE1MDYxZDA1MTkxNTAwMTcxYzA1MzcwNjFkM2IyNzBhMzcxYzA2MWIxOTExNTQzZDNiMjcwNjE3MWMwNjFiMTkxMTA2MzcxYzA2MWIxOTExMGEyNzAwMGQxODExMzkxMTEwMWQxNTA0MzExMDEzMTEwMDAzMDMzZDMwMDQxODFiMTUxMDA1M2QxOTE1MTMxMTBkMTcwNjExMTUwMDExMzExODExMTkxMTFhMDAwNjE3MTUxYTAyMTUwNzBhMTMxMTAwMzcxYjFhMDAxMTBjMDAwMjQ2MTAwOTEwMDYxNTAzM2QxOTE1MTMxMTBjMTMxMTAwM2QxOTE1MTMxMTMwMTUwMDE1MDQxMDE1MDAxNTA2MWIxYTE4MWIxNTEwNGUxMDE1MDAxNTRlMWQxOTE1MTMxMTViMTMxZDEyNGYxNjE1MDcxMTQyNDA1ODI2NDQxODMzM2IzMDE4MWMzNTI1MzUzNjM1M2QzNTM1MzUzNTM1MzUzNTI0NWI1YjViMGQzYzQxMzYzNTMxMzUzNTM1MzUzNTM4MzUzNTM1MzUzNTM1MzYzNTM1MzEzNTM1MzUzZDM2MjYzNTM1NDMwMzA3MDYxNzBiMTMxMTFiMTgxYjE3MTUwMDFkMWIxYTBkMWExYjAwMWQxMjFkMTcxNTAwMWQxYjFhMDcwNDA0MDEwNzFjMDQxOTFkMTAxZDA2MTcxNTE5MTEwNjE1MGExOTFkMTcwNjFiMDQxYzFiMWExMTA3MDcwNDExMTUxZjExMDYwYjEwMTEwMjFkMTcxMTU5MWQxYTEyMWIwZjE2MTUxNzFmMTMwNjFiMDExYTEwNTkwNzBkMWExNzA5MTYxODAxMTEwMDFiMWIwMDFjMTIwNDExMDYwNzFkMDcwMDExMWEwMDU5MDcwMDFiMDYxNTEzMTExNDE1MTkxNjFkMTExYTAwNTkxODFkMTMxYzAwNTkwNzExMWEwNzFiMDYwZDE1MTcxNzExMTgxMTA2MWIxOTExMDAxMTA2MDkxMzBkMDYxYjA3MTcxYjA0MTEwYzE5MTUxMzFhMTEwMDFiMTkxMTAwMTEwNjA5MTcxODFkMDQxNjFiMTUwNjEwMTQxNTE3MTcxMTA3MDcxZDE2MWQxODFkMDAwZDU5MTEwMjExMWEwMDA3MGUxNzE4MWQwNDE2MWIxNTA2MTA1OTA2MTExNTEwMGYxNzE4MWQwNDE2MWIxNTA2MTA1OTAzMDYxZDAwMTEwZjA0MTUwZDE5MTExYTAwNTkxYzE1MWExMDE4MTEwNjBiMDQxMTA2MTkxZDA3MDcxZDFiMWEwNzAxNDIwMzFhMTUwNDAxNDMwNTA1MDExMTA2MGQwNDFhMTUxOTExMDQwMDFjMTExYTA1MDcwMDE1MDAxMTA2MDQwNjFiMTkwNDAwMDcxMzA2MTUxYTAwMTExMDA2MTAxMTFhMWQxMTEwMDUxNzE1MDAxNzFjMDcxOTExMDcwNzE1MTMxMTMwMWQwNzU0MWExYjAwNTQxNTU0MDIxNTE4MWQxMDU0MTExYTAxMTk1NDAyMTUxODAxMTE1NDFiMTI1NDAwMGQwNDExNTQyNDExMDYxOTFkMDcwNzFkMWIxYTNhMTUxOTExMDMxOTE1MDQwMzE1MTgxODA0MWUxYjFkMWEwZTJjMzAxYjE5MTUxZDFhMjYxMTA1MDExMTA3MDAwYjE3MDYxMTE1MDAxMTI0MWIwNDAxMDQxMzA2MTExOTFiMDIxMTMxMDIxMTFhMDAzODFkMDcwMDExMWExMTA2MGQxMzE4MWIxNjE1MTgyNzAwMWIwNjE1MTMxMTBjMWIwNDExMWEzMDE1MDAxNTE2MTUwNzExMDkxZDFhMTAxMTBjMTExMDMwMzYwYjE1MDAwMDE1MTcxYzMxMDIxMTFhMDAwZDM1MTcwMDFkMDIxMTJjM2IxNjFlMTExNzAwMGQxMDFkMDcwNDE1MDAxNzFjMzEwMjExMWEwMDBiMTUxMDEwMzYxMTFjMTUwMjFkMWIwNjEwMTUxMDEwMzEwMjExMWEwMDM4MWQwNzAwMTExYTExMDYwYjEwMTEwMDE1MTcxYzMxMDIxMTFhMDAwOTEyMWQwNjExMzEwMjExMWEwMDEwMzkwMTAwMTUwMDFkMWIxYTNiMTYwNzExMDYwMjExMDYxMzNjMjAzOTM4MzkxMTFhMDEzZDAwMTExOTMxMTgxMTE5MTExYTAwMDkzZDFhMDA0YzM1MDYwNjE1MGQwYjA0MWIwNzAwMzkxMTA3MDcxNTEzMTEwZDA1MDExMTA2MGQyNzExMTgxMTE3MDAxYjA2MGIwNDExMDYxMjFiMDYxOTE1MWExNzExMDMxYTFiMDMwNjE4MTExYTEzMDAxYzBiMTcxYjFhMDAxMTBjMDAzOTExMWEwMTBmMTAxYjE3MDExOTExMWEwMDMxMTgxMTE5MTExYTAwMGMxYTE1MDAxZDAyMTEzODExMWExMzAwMWMwYjFlMDczMjFiMWEwMDA3MzgxZDA3MDAwYjA3MGQxYTAwMTUwYzMxMDYwNjFiMDYwNzEzMTEwMDIwMWQxOTExMDkwMDFkMTkxMTA3MDAxNTE5MDQwNTEyMTgxYjFiMDYxMTEzMTEwMDIwMWQxOTExMGUxYjFhMTEzYjEyMTIwNzExMDAwODAwMWQxOTExMGUxYjFhMTEwNTE5MTUxMzFkMTcwNjAzMjQwNjFiMDQwNzA2MTAyNDA2MWIwNDA3MDMxZTA3MDIwYjE2MDYxYjAzMDcxMTA2MjAwZDA0MTEwNjFkMTIwNjE1MTkxMTAzMTUxZDEwMDUwMDAwMTcxZDEwMDYxNzE4MWQxMTFhMDAwNzAwMDAyYjA3MTcxZDEwMDUwMDFiMWYxMTFhMDcxOTA3MTMyMDBkMDQxMTBiMDQwNjFkMDIxNTE3MGQzOTFiMTAxMTA3MTUxZDEwMzgxZDA3MDAwNTAwMDAwMzFkMTAwODAwMDAyYjAzMTExNjFkMTAwNzAwMDAyMzExMTYzZDEwMGIwMDAwMmIwMzExMTYxZDEwMmIwMjQ2MDkwMDAwMjMxMTE2MWQxMDIyNDYwNjE1MDcwNzFkMTMxYTA3MDQxODAxMTMxZDFhMDcwNjA3MTcwNjExMTExYTA2MTcwMTA3MDAxYjE5MGUxOTA3M2ExMTAzMjAxYjFmMTExYTM4MWQwNzAwMDYwNzA0MTgxZDE3MTEwOTAwMWIxZjExMWEzODFkMDcwMDA0MGMxOTA3MWQwNTFkMWExMDExMGMwOTA3MDAwNjFkMWExMzFkMTIwZDA0MWUwNzFiMWEwZjIzMzEzNjJiMzAzMTIyM2QzNzMxMmIzZDNhMzIzYjBhMDYxMTEzMWQxYjFhMzcxYjFhMTIwOTA2MTEwNDFiMDYwMDIxMDYxOCIsCiAgICAgICJkZXYiLAogICAgICAiW29iamVjdFx4MjBGdW5jdGlvbl0iLAogICAgICAic3Vic3RyaW5nIiwKICAgICAgIl9pbnZva2UiLAogICAgICAiZ2V0QmF0dGVyeSIsCiAgICAgICJib2VIb3N0IiwKICAgICAgImFzZ3ciLAogICAgICAiR2VuZXJhdG9yIiwKICAgICAgImJvZSIsCiAgICAgICJkZWNvcmF0b3JzIiwKICAgICAgImV4cG9ydHMiLAogICAgICAiYWNjZXNzb3IiLAogICAgICAicGx1Z2lucyIsCiAgICAgICJ0aGlzXHgyMGhhc25ceDI3dFx4MjBiZWVuXHgyMGluaXRpYWxpc2VkXHgyMC1ceDIwc3VwZXIoKVx4MjBoYXNuXHgyN3RceDIwYmVlblx4MjBjYWxsZWQiLAogICAgICAiZGVsZWdhdGUiLAogICAgICAiYXR0ZW1wdGVkXHgyMHRvXHgyMHNldFx4MjByZWFkXHgyMG9ubHlceDIwc3RhdGljXHgyMHByaXZhdGVceDIwZmllbGQiLAogICAgICAiY2FsbGJhY2s9IiwKICAgICAgIk1BWF9URVhUVVJFX01BWF9BTklTT1RST1BZX0VYVCIsCiAgICAgICJ0b1N0cmluZ1RhZyIsCiAgICAgICI7XHgyMGV4cGlyZXM9IiwKICAgICAgIm1hdGNoIiwKICAgICAgInJvb3QiLAogICAgICAic2V0SXRlbSIsCiAgICAgICJnZXRDb250ZXh0QXR0cmlidXRlcyIsCiAgICAgICJ3aXRoQ3JlZGVudGlhbHMiLAogICAgICAiQ2xhc3NceDIwXHgyMiIsCiAgICAgICJtb3p2aXNpYmlsaXR5Y2hhbmdlIiwKICAgICAgInVzZXJMYW5ndWFnZSIsCiAgICAgICJjcmVhdGVIYXNoIiwKICAgICAgIm1hcCIsCiAgICAgICJDYW5ub3RceDIwZGVzdHJ1Y3R1cmVceDIwIiwKICAgICAgImhCeXRlcyIsCiAgICAgICJbb2JqZWN0XHgyME51bWJlcl0iLAogICAgICAiZmxvb3IiLAogICAgICAiYWNjZXNzIiwKICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDFhMzMwOWI2MjFjNmEwMDAwMDAwMDA0OGMwZWM3ZjAwMDAwMDY1MGQxNDAwMDExMTAxMDAxMjAwMDA0NzAwMGMxMTAxMDAxMjAwMDAxNDAwMDE0NTAwMDkwMjExMDEwMTQzMDAxNDAwMDExMTAxMDI0YTEyMDAwMTQzMDAxMTAwMDExNTAwMDIwMjExMDEwMzAzMDQ0MzAxMTQwMDAyMTEwMDAyMDIxMTAxMDQwMjExMDEwNTExMDEwNjRhMTIwMDAzMTEwMDAxNDMwMTExMDAwMjQzMDIwNzAwMDQ0MzAyMTgxNDAwMDMxMTAwMDM0MjAwMDUwNzc1NjM2NTZmNjg2MDY5MDM0ODQ5NTEwOTUyNGY0YjQzNTU1MjQ3NGI1NjA5NTU1MjU0NGY0ODQxNGY0MDVmNDA2NzY0NjU2MjYzNjA2MTZlNmY2YzZkNmE2YjY4Njk3Njc3NzQ3NTcyNzM3MDcxN2U3ZjdjNDc0NDQ1NDI0MzQwNDE0ZTRmNGM0ZDRhNGI0ODQ5NTY1NzU0NTU1MjUzNTA1MTVlNWY1YzE2MTcxNDE1MTIxMzEwMTExZTFmMGIwOCIsCiAgICAgICJNQVhfQ09NQklORURfVEVYVFVSRV9JTUFHRV9VTklUUyIsCiAgICAgICJkZWZhdWx0IiwKICAgICAgInB1YmxpYyIsCiAgICAgICJ2ZW5kb3JTdWIiLAogICAgICAidG91Y2hzdGFydCIsCiAgICAgICJnZXRFeHRlbnNpb24iLAogICAgICAiQXBhcmFqaXRhIiwKICAgICAgImZpbmFsaXplIiwKICAgICAgInByb3BlcnR5SXNFbnVtZXJhYmxlIiwKICAgICAgImVuZCIsCiAgICAgICJsb2NhbFN0b3JhZ2UiLAogICAgICAiQEBpdGVyYXRvciIsCiAgICAgICJkZXZpY2VNZW1vcnkiLAogICAgICAia0h0dHAiLAogICAgICAiQEB0b1N0cmluZ1RhZyIsCiAgICAgICJjb29raWVFbmFibGVkIiwKICAgICAgImZyb21DaGFyQ29kZSIsCiAgICAgICJkb25lIiwKICAgICAgInNldCIsCiAgICAgICJjcmVhdGVEYXRhQ2hhbm5lbCIsCiAgICAgICJzdHJpbmdpZnkiLAogICAgICAiYXN5bmMiLAogICAgICAiRGVzY3JpcHRvciIsCiAgICAgICJoYXNoZWQiLAogICAgICAib250b3VjaHN0YXJ0IiwKICAgICAgIm9uaWNlZ2F0aGVyaW5nc3RhdGVjaGFuZ2UiLAogICAgICAiZ2V0T3duUHJvcGVydHlEZXNjcmlwdG9ycyIsCiAgICAgICJ0aGVuIiwKICAgICAgImZ1bmN0aW9uIiwKICAgICAgIkNvcmRpYVVQQyIsCiAgICAgICJUX0NMSUNLIiwKICAgICAgIkVYVF90ZXh0dXJlX2ZpbHRlcl9hbmlzb3Ryb3BpYyIsCiAgICAgICJNU1x4MjBPdXRsb29rIiwKICAgICAgIjgwcFNKU2pLIiwKICAgICAgIkpva2VybWFuIiwKICAgICAgImJ5dGVkX2FjcmF3bGVyIiwKICAgICAgInZpc2liaWxpdHlTdGF0ZSIsCiAgICAgICJzcGFuIiwKICAgICAgImlzV2VibXNzZGsiLAogICAgICAiX193ZWJfaWRvbnRrbm93d2h5aXdyaXRlaXRfXyIsCiAgICAgICJjcHVDbGFzcyIsCiAgICAgICJzZXJpZiIsCiAgICAgICJpbml0aWFsaXplZCIsCiAgICAgICJhY2Nlc3Nvclx4MjBkZWNvcmF0b3JzXHgyMG11c3RceDIwcmV0dXJuXHgyMGFuXHgyMG9iamVjdFx4MjB3aXRoXHgyMGdldCxceDIwc2V0LFx4MjBvclx4MjBpbml0XHgyMHByb3BlcnRpZXNceDIwb3JceDIwdm9pZFx4MjAwIiwKICAgICAgIltvYmplY3RceDIwSFRNTEFsbENvbGxlY3Rpb25dIiwKICAgICAgIkRlY29yYXRpbmdceDIwY2xhc3NceDIwcHJvcGVydHlceDIwZmFpbGVkLlx4MjBQbGVhc2VceDIwZW5zdXJlXHgyMHRoYXRceDIwcHJvcG9zYWwtY2xhc3MtcHJvcGVydGllc1x4MjBpc1x4MjBlbmFibGVkXHgyMGFuZFx4MjBydW5zXHgyMGFmdGVyXHgyMHRoZVx4MjBkZWNvcmF0b3JzXHgyMHRyYW5zZm9ybS4iLAogICAgICAiXHgyN1x4MjB0b1x4MjBiZVx4MjBhXHgyMGZ1bmN0aW9uIiwKICAgICAgIlZFUlNJT04iLAogICAgICAidG9Mb3dlckNhc2UiLAogICAgICAiTUFYX1RFWFRVUkVfU0laRSIsCiAgICAgICJ0cmlnZ2VyVW5sb2FkIiwKICAgICAgIk1BWF9WRVJURVhfVEVYVFVSRV9JTUFHRV9VTklUUyIsCiAgICAgICJlbGVtZW50IiwKICAgICAgImFwcGx5IiwKICAgICAgImRvY3VtZW50IiwKICAgICAgImV4ZWMiLAogICAgICAic2VuZCIsCiAgICAgICIpXHgyMGNhblx4Mjd0XHgyMGJlXHgyMGRlY29yYXRlZC4iLAogICAgICAibWluIiwKICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDI4MTQxMjJkZGQ3OTk1MDAwMDAwOWViMjg1YTFjYjAwMDAwMGU4MTEwMDAxMTQwMDA0MDIxMTAyMDExMTAwMDE0MzAxNDcwMDdjMTEwMjAyMTIwMDA0MTQwMDA1MTEwMDA1MDcwMDA1MjM0NzAwMGYwNzAwMDYxMTAyMDIxMjAwMDYwYzAwMDI0NTAwMTIwNzAwMDYxMTAyMDIxMjAwMDYwNzAwMDQxMTAwMDUwYzAwMDQxNDAwMDYwMjExMDIwMzAyMTEwMjA0MTEwMDAxNDMwMTExMDAwNjQzMDIxNDAwMDcwMjExMDIwNTExMDAwNzQzMDExNDAwMDgwMjExMDIwNjExMDAwODA3MDAwNTQzMDIxNDAwMDkwMjExMDIwMzExMDAwNzExMDEwMTExMDAwOTBjMDAwMjQzMDIxNDAwMDQwMjExMDEwMjExMDAwNDExMDAwMjExMDAwMzQzMDM0MjA1MDAwMDAwMDAzYjAzMTQwMDAzMDcwMDAwMTQwMDAxMTEwMTAwMTIwMDAxMDgyMzM0MDAwNjExMDEwMDEyMDAwMjQ3MDAwMjA4NDIxMTAxMDAxMjAwMDExNDAwMDIxMTAwMDIxMTAxMDAxNTAwMDMwMDExMDEwMDE1MDAwMjExMDAwMzExMDEwMDE1MDAwMTA4NDIwMDA3MDcwZDc4MTczYTMyMjAyNjA0M2EyNTMwM2IxNTBhMGEzNDM2MGEzYzNiMjEzMDI3MzYzMDI1MjEzMDMxMGEzYTI1MzAzYjA1MGEzYTI1MzAzYjBiMGEwYTM0MzYwYTIxMzAyNjIxM2MzMTAwMDczODI2MDEzYTNlMzAzYiIsCiAgICAgICJ2aXZvYnJvd3NlciIsCiAgICAgICJkZXNjcmlwdG9yIiwKICAgICAgImxhbmd1YWdlIiwKICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDAyM2EyNTg2NmEwMTUwMDAwMDAwMDAyYjBhYTAxYjAwMDAwMTU0MTEwMTAwMTIwMDAwNGExMjAwMDE0MzAwMTQwMDAxMTEwMDAxNGExMjAwMDIwNzAwMDM0MzAxMDMwMDJhNDcwMDAyMDE0MjA3MDAwNDE0MDAwMjExMDEwMTNhMDcwMDA0MjU0NzAwMDYwNzAwMDQ0NTAwMDkwMjExMDEwMjExMDEwMTQzMDExMTAwMDIyNTM0MDAwZDExMDEwMTRhMTIwMDA1NDMwMDA3MDAwNjI2MzQwMDE2MTEwMTAzMTIwMDA3MTIwMDA1NGExMjAwMDgxMTAxMDE0MzAxMDcwMDA2MjYzNDAwMWUxMTAxMDQzYTA3MDAwNDI1NDcwMDA2MDcwMDA0NDUwMDA5MDIxMTAxMDIxMTAxMDQ0MzAxMTEwMDAyMjUzNDAwMTUxMTAxMDQ0YTEyMDAwNTQzMDA0YTEyMDAwMjA3MDAwOTQzMDEwMzAwMjczNDAwMWUxMTAxMDAzYTA3MDAwNDI1NDcwMDA2MDcwMDA0NDUwMDA5MDIxMTAxMDIxMTAxMDA0MzAxMTEwMDAyMjUzNDAwMGQxMTAxMDA0YTEyMDAwNTQzMDAwNzAwMGEyNjM0MDAxMjExMDEwMDEyMDAwMDRhMTIwMDAyMDcwMDBiNDMwMTAzMDAyYTM0MDAxZTExMDEwNTNhMDcwMDA0MjU0NzAwMDYwNzAwMDQ0NTAwMDkwMjExMDEwMjExMDEwNTQzMDExMTAwMDIyNTQ3MDAwMjAwNDIwMjExMDEwNjQzMDAzMjQ3MDAzMzExMDEwNzNhMDcwMDA0MjU0NzAwMDYwNzAwMDQ0NTAwMDkwMjExMDEwMjExMDEwNzQzMDExMTAwMDIyNTM0MDAwZDExMDEwNzRhMTIwMDA1NDMwMDA3MDAwYzI2NDcwMDAyMDA0MjAxNDIwMDBkMDk2ZjY5N2Y2ODViN2Q3Zjc0NmUwYjZlNzU1Njc1NmQ3ZjY4NTk3YjY5N2YwNzczNzQ3ZTdmNjI1NTdjMDg3Zjc2N2Y3OTZlNjg3NTc0MDk2Zjc0N2U3ZjdjNzM3NDdmN2UwODZlNzU0OTZlNjg3Mzc0N2QwZjQxNzU3ODcwN2Y3OTZlM2E0ZDczNzQ3ZTc1NmQ0NzA5NmE2ODc1NmU3NTZlNjM2YTdmMDQ3OTdiNzY3NjA4NWU3NTc5NmY3NzdmNzQ2ZTEyNDE3NTc4NzA3Zjc5NmUzYTU0N2I2YzczN2Q3YjZlNzU2ODQ3MDU3MDY5N2U3NTc3MTA0MTc1Nzg3MDdmNzk2ZTNhNTI3MzY5NmU3NTY4NjM0NyIsCiAgICAgICJ2ZW5kb3IiLAogICAgICAibGV2ZWwiLAogICAgICAiYXR0ZW1wdGVkXHgyMHRvXHgyMGNhbGxceDIwIiwKICAgICAgInBsYWNlbWVudCIsCiAgICAgICJKU19NRDVfTk9fTk9ERV9KUyIsCiAgICAgICJpbml0aWFsaXplQ2xhc3NFbGVtZW50cyIsCiAgICAgICJpbmRleGVkREIiLAogICAgICAicGVyZiIsCiAgICAgICJkaXNhbGxvd1Byb3BlcnR5IiwKICAgICAgImxpbWUiLAogICAgICAiNDg0ZTRmNGE0MDNmNTI0MzAwMzQxYjNlMzM2YTc4NTgwMDAwMDAwMGRiZDU5NTFmMDAwMDAxYjUwMTE0MDAwMTExMDEwMDEyMDAwMDAwMjU0NzAwMDcwMDE0MDAwMTQ1MDAxYjExMDEwMDEyMDAwMDAxMjU0NzAwMDcwMTE0MDAwMTQ1MDAwOTAyMTEwMTAxNDMwMDE0MDAwMTBkMDEwZTAwMDEwMTBlMDAwMjAxMGUwMDAzMTEwMDAxMGUwMDA0MDEwZTAwMDUwMTBlMDAwNjAxMGUwMDA3MDEwZTAwMDgwMTBlMDAwOTAxMGUwMDBhMDEwZTAwMGIwMDBlMDAwYzE0MDAwMjAyMTEwMTAyNDMwMDExMDAwMjE1MDAwNTExMDAwMjEyMDAwNTMyNDcwMDVjMDIxMTAxMDMxMTAwMDI0MzAxNDkwMjExMDEwNDExMDAwMjQzMDE0OTAyMTEwMTA1NDMwMDExMDAwMjE1MDAwNzAyMTEwMTA2NDMwMDExMDAwMjE1MDAwODAyMTEwMTA3NDMwMDExMDAwMjE1MDAwOTAyMTEwMTA4NDMwMDExMDAwMjE1MDAwYjAyMTEwMTA5NDMwMDExMDAwMjE1MDAwMzAyMTEwMTBhNDMwMDExMDAwMjE1MDAwMjAzMDAxNDAwMDMxMTAwMDMwMzAxMmYxNzAwMDMzNTQ5MTEwMDAzMTEwMDAyMTIwMDBiMDMwMTJiMmYxNzAwMDMzNTQ5MTEwMDAzMTEwMDAyMTIwMDBhMDMwMjJiMmYxNzAwMDMzNTQ5MTEwMDAzMTEwMDAyMTIwMDA5MDMwMzJiMmYxNzAwMDMzNTQ5MTEwMDAzMTEwMDAyMTIwMDA4MDMwNDJiMmYxNzAwMDMzNTQ5MTEwMDAzMTEwMDAyMTIwMDA3MDMwNTJiMmYxNzAwMDMzNTQ5MTEwMDAzMTEwMDAyMDcwMDA2MTMwMzA2MmIyZjE3MDAwMzM1NDkxMTAwMDMxMTAwMDIxMjAwMDUwMzA3MmIyZjE3MDAwMzM1NDkxMTAwMDMxMTAwMDIwNzAwMDQxMzAzMDgyYjJmMTcwMDAzMzU0OTExMDAwMzExMDAwMjEyMDAwMzAzMDkyYjJmMTcwMDAzMzU0OTExMDAwMzExMDAwMjEyMDAwMjAzMGEyYjJmMTcwMDAzMzU0OTExMDEwYjEyMDAwZDExMDAwMzJmMTEwMTBiMDcwMDBkMzU0OTExMDAwMjQyMDAwZTBlNTQ3YjZhNzk2YTY2NTg3YzYyN2Y2ODYzNDQ2NTBhNmY2Mjc5NmU2ODdmNTg2MjZjNjUwYTY4NjQ2NTc4NjI3ODdmNmU2NTdmMDg2NzY0Njg2YTdmNjI2NDY1MDY3ODdjNjI3ZjY4NjMwMzZmNjQ2NjA4NmY2ZTY5N2U2YzZjNmU3OTA0NjU2NDZmNmUwNzdiNjM2YTY1N2Y2NDY2MDk3YzZlNjk2Zjc5NjI3ZDZlNzkwOTYyNjU2ODY0NmM2NTYyN2Y2NDA0NjM2NDY0NjAwNDdmNmU3ODdmMDc2ZTY1N2Q2ODY0NmY2ZSIsCiAgICAgICJtb3ZlTGlzdCIsCiAgICAgICJNWVJJQURceDIwUFJPIiwKICAgICAgIkFuXHgyMGVsZW1lbnRceDIwZGVzY3JpcHRvciIsCiAgICAgICJmaW5hbGx5TG9jIiwKICAgICAgImhlYWQiLAogICAgICAiaW5uZXJIZWlnaHQiLAogICAgICAiT1JJR0lOOlx4MjAiLAogICAgICAicmVnaW9uIiwKICAgICAgImFkZEluaXRpYWxpemVyIiwKICAgICAgIltvYmplY3RceDIwU2FmYXJpUmVtb3RlTm90aWZpY2F0aW9uXSIsCiAgICAgICJjYW5kaWRhdGUiLAogICAgICAiY29udGVudC10eXBlIiwKICAgICAgInVzZXJBZ2VudCIsCiAgICAgICJ3ZWJraXRIaWRkZW4iLAogICAgICAidGVzdCIsCiAgICAgICJnZXRQcm90b3R5cGVPZiIsCiAgICAgICJzZXREYXRlIiwKICAgICAgInNoaWZ0S2V5IiwKICAgICAgImFjY2Vzc29yLmluaXQiLAogICAgICAiQEBhc3luY0l0ZXJhdG9yIiwKICAgICAgImFjY2Vzc29yLnNldCIsCiAgICBdOwogICAgd18weDQyZjUgPSBmdW5jdGlvbiAoKSB7CiAgICAgIHJldHVybiBfMHg0NThmMzA7CiAgICB9OwogICAgcmV0dXJuIHdfMHg0MmY1KCk7CiAgfQogIGZ1bmN0aW9uIHdfMHg1YzMxNDAoXzB4NDE2NzZhLCBfMHgzZjk1NDgsIF8weDM5YjBiOCkgewogICAgdmFyIF8weDIxNDVkZiA9IHdfMHgyNWYzOwogICAgZnVuY3Rpb24gXzB4NDY3Y2IwKF8weDE3NGUwZCwgXzB4NGVhNzM3KSB7CiAgICAgIHZhciBfMHg1NjllNGMgPSB3XzB4MjVmMywKICAgICAgICBfMHgzZWQ4NjggPSBwYXJzZUludCgKICAgICAgICAgIF8weDE3NGUwZFtfMHg1NjllNGMoMHgyYTUpXSgKICAgICAgICAgICAgXzB4NGVhNzM3LAogICAgICAgICAgICBfMHg0ZWE3MzcgKyAoMHgzMCAqIDB4MWEgKyAweDEgKiAweDE0MjQgKyAtMHhjMiAqIDB4MjEpCiAgICAgICAgICApLAogICAgICAgICAgLTB4MjUzYiArIC0weDFjZTEgKyAtMHg5NzQgKiAtMHg3CiAgICAgICAgKTsKICAgICAgcmV0dXJuIF8weDNlZDg2OCA+Pj4gKDB4MjNjYSArIDB4ODgyICsgMHgyYzQ1ICogLTB4MSkgPT0KICAgICAgICAweDExY2IgKyAtMHg1YzcgKiAweDMgKyAweDIgKiAtMHgzYgogICAgICAgID8gWy0weGMgKiAweDMwMCArIDB4MSAqIDB4MTA2NyArIDB4MTM5YSwgXzB4M2VkODY4XQogICAgICAgIDogXzB4M2VkODY4ID4+PiAoLTB4MyAqIDB4M2I5ICsgMHg0YSAqIDB4NzUgKyAtMHgxNmExKSA9PQogICAgICAgICAgLTB4NzQyICsgLTB4NDI5ICsgMHhiNmQKICAgICAgICA/ICgoXzB4M2VkODY4ID0KICAgICAgICAgICAgKCgtMHgxZWVlICsgMHgxMTc1ICsgMHhkYjgpICYgXzB4M2VkODY4KSA8PAogICAgICAgICAgICAoMHgyICogMHgxMDhkICsgMHgyICogLTB4NWU2ICsgMHgxICogLTB4MTU0NikpLAogICAgICAgICAgWwogICAgICAgICAgICAtMHg5NDkgKyAweGUyZiArIC0weDQgKiAweDEzOSwKICAgICAgICAgICAgKF8weDNlZDg2OCArPSBwYXJzZUludCgKICAgICAgICAgICAgICBfMHgxNzRlMGRbInNsaWNlIl0oCiAgICAgICAgICAgICAgICBfMHg0ZWE3MzcgKyAoMHg1ICogLTB4NjQzICsgLTB4MSAqIDB4OTUgKyAtMHgxZmU2ICogLTB4MSksCiAgICAgICAgICAgICAgICBfMHg0ZWE3MzcgKyAoMHg5YjYgKyAweDggKiAweDI0YSArIC0weDFjMDIpCiAgICAgICAgICAgICAgKSwKICAgICAgICAgICAgICAtMHhhNiAqIDB4MTEgKyAtMHgzZiAqIC0weDEgKyAweDZmICogMHgxOQogICAgICAgICAgICApKSwKICAgICAgICAgIF0pCiAgICAgICAgOiAoKF8weDNlZDg2OCA9CiAgICAgICAgICAgICgoMHgxYWYxICsgMHgxNDQyICsgLTB4OTY0ICogMHg1KSAmIF8weDNlZDg2OCkgPDwKICAgICAgICAgICAgKDB4M2YzICsgLTB4ZDkzICsgMHg5YjApKSwKICAgICAgICAgIFsKICAgICAgICAgICAgLTB4MTMgKiAtMHgxOTIgKyAtMHgxNTg4ICsgMHhjMSAqIC0weGIsCiAgICAgICAgICAgIChfMHgzZWQ4NjggKz0gcGFyc2VJbnQoCiAgICAgICAgICAgICAgXzB4MTc0ZTBkW18weDU2OWU0YygweDJhNSldKAogICAgICAgICAgICAgICAgXzB4NGVhNzM3ICsgKC0weDggKiAweDM5YyArIDB4NTkgKiAweDM1ICsgMHgxICogMHhhNzUpLAogICAgICAgICAgICAgICAgXzB4NGVhNzM3ICsgKDB4MSAqIC0weGFkNiArIC0weDMyNiArIDB4MTYgKiAweGEzKQogICAgICAgICAgICAgICksCiAgICAgICAgICAgICAgMHgyMGIwICsgLTB4N2QgKyAtMHgxYjEgKiAweDEzCiAgICAgICAgICAgICkpLAogICAgICAgICAgXSk7CiAgICB9CiAgICB2YXIgXzB4NDUwYmYxLAogICAgICBfMHg1NWQ3MjkgPSAweDI0MmMgKyAweDE1MGMgKiAweDEgKyAtMHg0ICogMHhlNGUsCiAgICAgIF8weDI2ZjQ1ZiA9IFtdLAogICAgICBfMHg0MDg2MDkgPSBbXSwKICAgICAgXzB4NWUyNTRkID0gcGFyc2VJbnQoCiAgICAgICAgXzB4NDE2NzZhW18weDIxNDVkZigweDJhNSldKAogICAgICAgICAgLTB4NDMgKiAweDdhICsgMHhiYWMgKiAtMHgxICsgMHgyICogMHgxNWNkLAogICAgICAgICAgLTB4MThjNiArIC0weDE1MTUgKyAweDJkZTMKICAgICAgICApLAogICAgICAgIC0weDE3ZTYgKyAweDQgKiAtMHgyNjkgKyAweDFmYSAqIDB4MTEKICAgICAgKSwKICAgICAgXzB4NTY4NDRiID0gcGFyc2VJbnQoCiAgICAgICAgXzB4NDE2NzZhW18weDIxNDVkZigweDJhNSldKAogICAgICAgICAgMHgyNjIgKiAtMHgzICsgMHgxOWUwICsgLTB4MTJiMiwKICAgICAgICAgIDB4NSAqIDB4M2UgKyAweGQgKiAtMHgyZWMgKyAtMHg3MyAqIC0weDUyCiAgICAgICAgKSwKICAgICAgICAweDEgKiAweGQ2OSArIDB4MSAqIDB4YjkgKyAtMHhlMTIKICAgICAgKTsKICAgIGlmICgKICAgICAgLTB4NWVlYzQwYSAqIDB4ZCArIDB4MzUzYjIzNjggKyAweDYwMzMyMDY0ICE9PSBfMHg1ZTI1NGQgfHwKICAgICAgMHg3YjcgKiAweDQ0MjQ1ICsgLTB4NzEyYzcyNzEgKyAweDFjZTliM2FkICogMHg1ICE9PSBfMHg1Njg0NGIKICAgICkKICAgICAgdGhyb3cgbmV3IEVycm9yKF8weDIxNDVkZigweDJhNykpOwogICAgaWYgKAogICAgICAweDIgKiAweGFlMSArIC0weDFlNDcgKyAweDg4NSAhPT0KICAgICAgcGFyc2VJbnQoCiAgICAgICAgXzB4NDE2NzZhW18weDIxNDVkZigweDJhNSldKAogICAgICAgICAgMHgxICogMHg0NSArIDB4MTQ5ICogLTB4MSArIDB4MTE0LAogICAgICAgICAgLTB4MWQ2OSAqIC0weDEgKyAweGY0NyAqIDB4MSArIC0weDJjOWUKICAgICAgICApLAogICAgICAgIC0weDU5ICogMHg0YiArIC0weGZkYiArIC0weGQ3ICogLTB4MzIKICAgICAgKQogICAgKQogICAgICB0aHJvdyBuZXcgRXJyb3IoInZlIik7CiAgICBmb3IgKAogICAgICBfMHg0NTBiZjEgPSAweDIgKiAweGU3ZCArIC0weGRmICogLTB4MTkgKyAweDNkICogLTB4ZDU7CiAgICAgIF8weDQ1MGJmMSA8IC0weDIyZGIgKiAtMHgxICsgLTB4Zjk4ICogLTB4MSArIC0weDEgKiAweDMyNmY7CiAgICAgICsrXzB4NDUwYmYxCiAgICApIHsKICAgICAgXzB4NTVkNzI5ICs9CiAgICAgICAgKCgtMHgxYTcgKiAweDMgKyAweDE3ICogLTB4NDcgKyAweGI1OSkgJgogICAgICAgICAgcGFyc2VJbnQoCiAgICAgICAgICAgIF8weDQxNjc2YVtfMHgyMTQ1ZGYoMHgyYTUpXSgKICAgICAgICAgICAgICAweDc1MSAqIC0weDQgKwogICAgICAgICAgICAgICAgMHgxZCAqIDB4ZmQgKwogICAgICAgICAgICAgICAgMHhiMyArCiAgICAgICAgICAgICAgICAoLTB4NDRiICogMHg3ICsgLTB4MTAwICsgMHgxZjBmKSAqIF8weDQ1MGJmMSwKICAgICAgICAgICAgICAweDggKiAweDNhZSArCiAgICAgICAgICAgICAgICAweDEyOGQgKwogICAgICAgICAgICAgICAgLTB4ZCAqIDB4M2FmICsKICAgICAgICAgICAgICAgICgweDIgKiAtMHg4MGYgKyAtMHhkICogMHgyNGEgKyAweDJkZTIpICogXzB4NDUwYmYxCiAgICAgICAgICAgICksCiAgICAgICAgICAgIC0weDE0ZDYgKyAtMHgyNTUgKyAweDE3M2IKICAgICAgICAgICkpIDw8CiAgICAgICAgKCgtMHgxY2UyICogLTB4MSArIDB4MTFlMyArIC0weDJlYzMpICogXzB4NDUwYmYxKTsKICAgIH0KICAgIHZhciBfMHg1MzdlZmEgPSBwYXJzZUludCgKICAgICAgICBfMHg0MTY3NmFbXzB4MjE0NWRmKDB4MmE1KV0oCiAgICAgICAgICAweDEzICogLTB4MjA5ICsgMHgxMTZiICsgMHhjICogMHgxYzgsCiAgICAgICAgICAtMHgyNmEwICsgMHgxMGQgKiAtMHgxMiArIDB4MzliMgogICAgICAgICksCiAgICAgICAgMHgxNTRlICsgLTB4MjVlICogLTB4ZiArIDB4ZTMgKiAtMHg0MAogICAgICApLAogICAgICBfMHgzZDY2ZDggPQogICAgICAgICgweDFiZGIgKiAweDEgKyAtMHg0ZTkgKiAweDMgKyAtMHhkMWUpICoKICAgICAgICBwYXJzZUludCgKICAgICAgICAgIF8weDQxNjc2YVtfMHgyMTQ1ZGYoMHgyYTUpXSgKICAgICAgICAgICAgLTB4MSAqIC0weDI0ZjUgKyAweDIyNzkgKyAweDY3YSAqIC0weGIsCiAgICAgICAgICAgIC0weDIgKiAtMHgxMDgzICsgLTB4NSAqIDB4MTg1ICsgMHhlZiAqIC0weDFiCiAgICAgICAgICApLAogICAgICAgICAgLTB4ODIgKyAweDhlNiArIDB4NCAqIC0weDIxNQogICAgICAgICk7CiAgICBmb3IgKAogICAgICBfMHg0NTBiZjEgPSAtMHgyNDcxICsgLTB4MTE2ICogLTB4NyArIDB4MWQwZiAqIDB4MTsKICAgICAgXzB4NDUwYmYxIDwgXzB4M2Q2NmQ4ICsgKC0weDFjICogLTB4MTA2ICsgMHgzNzAgKyAtMHg4ICogMHgzZmMpOwogICAgICBfMHg0NTBiZjEgKz0gMHgxM2FjICogMHgxICsgMHg5YmQgKiAweDEgKyAtMHgxICogMHgxZDY3CiAgICApCiAgICAgIF8weDI2ZjQ1ZltfMHgyMTQ1ZGYoMHgzNmUpXSgKICAgICAgICBwYXJzZUludCgKICAgICAgICAgIF8weDQxNjc2YVtfMHgyMTQ1ZGYoMHgyYTUpXSgKICAgICAgICAgICAgXzB4NDUwYmYxLAogICAgICAgICAgICBfMHg0NTBiZjEgKyAoMHg3ICogMHg1MzkgKyAweDNjYiAqIC0weDIgKyAtMHgxICogMHgxY2Y3KQogICAgICAgICAgKSwKICAgICAgICAgIDB4MjNmYyArIC0weGE0NSArIC0weDMgKiAweDg4ZAogICAgICAgICkKICAgICAgKTsKICAgIHZhciBfMHg1MGYwMDEgPSBfMHgzZDY2ZDggKyAoLTB4MTQyOSArIC0weDY5ZCAqIC0weDEgKyAweDM3MSAqIDB4NCksCiAgICAgIF8weDIzZjMyZSA9IHBhcnNlSW50KAogICAgICAgIF8weDQxNjc2YVtfMHgyMTQ1ZGYoMHgyYTUpXSgKICAgICAgICAgIF8weDUwZjAwMSwKICAgICAgICAgIF8weDUwZjAwMSArICgtMHgxNzljICsgLTB4M2YgKyAtMHg2MSAqIC0weDNmKQogICAgICAgICksCiAgICAgICAgLTB4MmEgKiAweDY1ICsgLTB4MjBlNSArIDB4MzE4NwogICAgICApOwogICAgZm9yICgKICAgICAgXzB4NTBmMDAxICs9IC0weDIwYzYgKyAweDMgKiAtMHgxYTUgKyAweDI1YjksCiAgICAgICAgXzB4NDUwYmYxID0gLTB4MiAqIC0weDc2NiArIDB4MTI3ZSArIC0weDIxNGE7CiAgICAgIF8weDQ1MGJmMSA8IF8weDIzZjMyZTsKICAgICAgKytfMHg0NTBiZjEKICAgICkgewogICAgICB2YXIgXzB4MzdhN2MxID0gXzB4NDY3Y2IwKF8weDQxNjc2YSwgXzB4NTBmMDAxKTsKICAgICAgXzB4NTBmMDAxICs9CiAgICAgICAgKDB4Y2ZkICsgMHgzOTkgKiAtMHgzICsgLTB4NyAqIDB4NTApICoKICAgICAgICBfMHgzN2E3YzFbLTB4MTRlZSArIC0weDkxMiArIDB4MWUwMF07CiAgICAgIGZvciAoCiAgICAgICAgdmFyIF8weDEzZDk4OCA9ICIiLCBfMHg0YjBjM2EgPSAtMHgxYmNmICsgMHgxNmNmICsgMHgxMCAqIDB4NTA7CiAgICAgICAgXzB4NGIwYzNhIDwgXzB4MzdhN2MxWy0weDQ3NiAqIDB4MyArIC0weDExMmIgKyAweDIgKiAweGY0N107CiAgICAgICAgKytfMHg0YjBjM2EKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDQ5YWJiNCA9IF8weDQ2N2NiMChfMHg0MTY3NmEsIF8weDUwZjAwMSk7CiAgICAgICAgKF8weDEzZDk4OCArPSBTdHJpbmdbXzB4MjE0NWRmKDB4MWUyKV0oCiAgICAgICAgICBfMHg1NWQ3MjkgXiBfMHg0OWFiYjRbMHgxOGYxICogLTB4MSArIC0weDE3ZTUgKiAweDEgKyAtMHgzMGQ3ICogLTB4MV0KICAgICAgICApKSwKICAgICAgICAgIChfMHg1MGYwMDEgKz0KICAgICAgICAgICAgKDB4MmRkICogLTB4ZCArIC0weDggKiAweDIyNyArIDB4MzY3MykgKgogICAgICAgICAgICBfMHg0OWFiYjRbLTB4ZDkgKyAweDE3MDIgKyAtMHg3NjMgKiAweDNdKTsKICAgICAgfQogICAgICBfMHg0MDg2MDlbInB1c2giXShfMHgxM2Q5ODgpOwogICAgfQogICAgcmV0dXJuICgKICAgICAgKF8weDNmOTU0OFsicCJdID0gbnVsbCksCiAgICAgIChmdW5jdGlvbiBfMHg5NzBlNygKICAgICAgICBfMHgzZTg3YzYsCiAgICAgICAgXzB4NTM2Njg1LAogICAgICAgIF8weGVjZDRlZiwKICAgICAgICBfMHg1YWNmNjcsCiAgICAgICAgXzB4NTYwNjQxCiAgICAgICkgewogICAgICAgIHZhciBfMHgyNjE3MzYgPSBfMHgyMTQ1ZGYsCiAgICAgICAgICBfMHgxZmMxZWQsCiAgICAgICAgICBfMHgyODFlYzAsCiAgICAgICAgICBfMHg1YzBmMzMsCiAgICAgICAgICBfMHhkNTVjODIsCiAgICAgICAgICBfMHgzN2I3MGIsCiAgICAgICAgICBfMHgxMmNkNzIgPSAtKDB4MWJkZCArIC0weDggKiAweDExNiArIC0weDMgKiAweDY2NCksCiAgICAgICAgICBfMHgyN2ZjZjMgPSBbXSwKICAgICAgICAgIF8weDQyZWYxYSA9IFstMHg1ICogLTB4MmI2ICsgMHgxZDZjICsgLTB4MmFmYSwgbnVsbF0sCiAgICAgICAgICBfMHg0MjhjODcgPSBudWxsLAogICAgICAgICAgXzB4NDQ0NGNmID0gW18weDUzNjY4NV07CiAgICAgICAgZm9yICgKICAgICAgICAgIF8weDI4MWVjMCA9IE1hdGhbIm1pbiJdKF8weDUzNjY4NVtfMHgyNjE3MzYoMHgyNTkpXSwgXzB4ZWNkNGVmKSwKICAgICAgICAgICAgXzB4NWMwZjMzID0gLTB4OTBiICsgLTB4MSAqIDB4MWUyZiArIDB4MjczYTsKICAgICAgICAgIF8weDVjMGYzMyA8IF8weDI4MWVjMDsKICAgICAgICAgICsrXzB4NWMwZjMzCiAgICAgICAgKQogICAgICAgICAgXzB4NDQ0NGNmW18weDI2MTczNigweDM2ZSldKF8weDUzNjY4NVtfMHg1YzBmMzNdKTsKICAgICAgICBfMHg0NDQ0Y2ZbInAiXSA9IF8weDVhY2Y2NzsKICAgICAgICBmb3IgKHZhciBfMHg0YjdjY2QgPSBbXTsgOyApCiAgICAgICAgICB0cnkgewogICAgICAgICAgICB2YXIgXzB4NWNkNWI5ID0gXzB4MjZmNDVmW18weDNlODdjNisrXTsKICAgICAgICAgICAgaWYgKF8weDVjZDViOSA8IC0weDc4OCArIDB4MThjNyArIDB4MSAqIC0weDExMTgpIHsKICAgICAgICAgICAgICBpZiAoXzB4NWNkNWI5IDwgMHgyMDhkICsgLTB4MTAzMSArIC0weDEwNDkgKiAweDEpIHsKICAgICAgICAgICAgICAgIGlmIChfMHg1Y2Q1YjkgPCAweDFhMWMgKyAtMHhiZmYgKiAweDMgKyAweDI3YSAqIDB4NCkKICAgICAgICAgICAgICAgICAgXzB4NWNkNWI5IDwgMHgzZWUgKyAweDEgKiAweDIxYzMgKyAtMHgyZTYgKiAweGQKICAgICAgICAgICAgICAgICAgICA/IChfMHgyN2ZjZjNbKytfMHgxMmNkNzJdID0KICAgICAgICAgICAgICAgICAgICAgICAgXzB4NWNkNWI5IDwgLTB4NjEgKiAweDYxICsgMHgxMTE1ICsgMHgxM2FkIHx8CiAgICAgICAgICAgICAgICAgICAgICAgICgtMHgxZCAqIC0weDRmICsgMHgxMWM5ICsgMHgzICogLTB4OGU5ICE9PSBfMHg1Y2Q1YjkgJiYKICAgICAgICAgICAgICAgICAgICAgICAgICBudWxsKSkKICAgICAgICAgICAgICAgICAgICA6IF8weDVjZDViOSA8IC0weDc4MyArIDB4YTBkICsgLTB4Mjg1CiAgICAgICAgICAgICAgICAgICAgPyAtMHhiICogMHgyNGYgKyAweDE0MWEgKyAweDU0ZSA9PT0gXzB4NWNkNWI5CiAgICAgICAgICAgICAgICAgICAgICA/ICgoXzB4MWZjMWVkID0gXzB4MjZmNDVmW18weDNlODdjNisrXSksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyN2ZjZjNbKytfMHgxMmNkNzJdID0KICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MWZjMWVkIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxMmIgKiAweDFmICsgMHg1ICogMHg3MGMgKyAtMHg0NzU5KSkgPj4KICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MzUyICsgMHg3ICogMHg1OGYgKyAtMHgyMzdmKSkpCiAgICAgICAgICAgICAgICAgICAgICA6ICgoXzB4MWZjMWVkID0KICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjZmNDVmW18weDNlODdjNl0gPDwgKDB4YjAyICsgMHgyYWYgKyAtMHhkYTkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjZmNDVmWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4M2U4N2M2ICsgKDB4MjIwZSArIDB4MSAqIC0weDExNzUgKyAtMHgxMDk4KQogICAgICAgICAgICAgICAgICAgICAgICAgIF0pLAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4M2U4N2M2ICs9IC0weDMyNSAqIDB4MyArIDB4YWZlICsgLTB4MThkKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1srK18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgxZmMxZWQgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHhlN2MgKiAtMHgxICsgLTB4ZTE3ICogLTB4MiArIC0weDJhOWEpKSA+PgogICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgyM2FlICogMHgxICsgLTB4MWY4ZiArIC0weDQzNGQgKiAtMHgxKSkpCiAgICAgICAgICAgICAgICAgICAgOiAtMHhhICogMHgxNWMgKyAweDI0YmMgKyAtMHgxICogMHgxNzFmID09PSBfMHg1Y2Q1YjkKICAgICAgICAgICAgICAgICAgICA/ICgoXzB4MWZjMWVkID0KICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgxZmMxZWQgPQogICAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4MWZjMWVkID0gXzB4MjZmNDVmW18weDNlODdjNisrXSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgxZjg3ICsgLTB4ZGE4ICsgMHgyZDM3KSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI2ZjQ1ZltfMHgzZTg3YzYrK10pIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDFkMzIgKyAtMHgyICogMHgxMjQgKyAweDFmODIpKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDI2ZjQ1ZltfMHgzZTg3YzYrK10pLAogICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1srK18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MWZjMWVkIDw8ICgweGMgKiAtMHg4ICsgLTB4MjVmNyArIDB4MjY1ZikpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjZmNDVmW18weDNlODdjNisrXSkpCiAgICAgICAgICAgICAgICAgICAgOiAoKF8weDFmYzFlZCA9CiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyNmY0NWZbXzB4M2U4N2M2XSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICgweDFiZjcgKyAweDRlOSAqIDB4NyArIC0weGM3NiAqIDB4NSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjZmNDVmW18weDNlODdjNiArICgweGJhNyArIC0weDE2MTEgKyAweGE2YildKSwKICAgICAgICAgICAgICAgICAgICAgIChfMHgzZTg3YzYgKz0gMHhhMWUgKyAtMHgxYTIxICsgMHg1NTcgKiAweDMpLAogICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1srK18weDEyY2Q3Ml0gPSArXzB4NDA4NjA5W18weDFmYzFlZF0pKTsKICAgICAgICAgICAgICAgIGVsc2UgewogICAgICAgICAgICAgICAgICBpZiAoXzB4NWNkNWI5IDwgMHgzNjkgKiAtMHg5ICsgMHgyMGRlICsgLTB4MjIwKQogICAgICAgICAgICAgICAgICAgIF8weDVjZDViOSA8IC0weDI2MjYgKyAweDMzNiAqIC0weDUgKyAweDM2M2YKICAgICAgICAgICAgICAgICAgICAgID8gMHgxMmIgKiAtMHgxNSArIC0weDIgKiAtMHgxMWY1ICsgMHg1YWUgKiAtMHgyID09PQogICAgICAgICAgICAgICAgICAgICAgICBfMHg1Y2Q1YjkKICAgICAgICAgICAgICAgICAgICAgICAgPyAoKF8weDFmYzFlZCA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjZmNDVmW18weDNlODdjNl0gPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4OCAqIDB4MiArIDB4MzUgKiAweDE4ICsgLTB4NTAwKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjZmNDVmWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzZTg3YzYgKyAoLTB4MzMwICsgLTB4ZWMgKiAtMHg1ICsgLTB4MTZiKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDNlODdjNiArPSAweDIyNCArIC0weDE5ICogLTB4YjMgKyAtMHgxICogMHgxMzlkKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzWysrXzB4MTJjZDcyXSA9IF8weDQwODYwOVtfMHgxZmMxZWRdKSkKICAgICAgICAgICAgICAgICAgICAgICAgOiAoXzB4MjdmY2YzWysrXzB4MTJjZDcyXSA9IHZvaWQgKAogICAgICAgICAgICAgICAgICAgICAgICAgICAgMHg1ICogMHgxZWYgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgMHgyNDkzICogLTB4MSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHgzNWQgKiAtMHg4CiAgICAgICAgICAgICAgICAgICAgICAgICAgKSkKICAgICAgICAgICAgICAgICAgICAgIDogMHgxYWJiICsgMHgxOTEgKiAweGQgKyAtMHgzICogMHhmYWYgPT09IF8weDVjZDViOQogICAgICAgICAgICAgICAgICAgICAgPyAoXzB4MjdmY2YzWysrXzB4MTJjZDcyXSA9IF8weDU2MDY0MSkKICAgICAgICAgICAgICAgICAgICAgIDogKChfMHgxZmMxZWQgPQogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyNmY0NWZbXzB4M2U4N2M2XSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDIwYjAgKyAtMHgzZGEgKyAweDI0OTIpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjZmNDVmWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4M2U4N2M2ICsgKC0weDEyOWQgKiAweDEgKyAweDEgKiAtMHgyMzE2ICsgMHgzNWI0KQogICAgICAgICAgICAgICAgICAgICAgICAgIF0pLAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4M2U4N2M2ICs9IC0weGNiOCArIDB4MWJiICogLTB4YSArIC0weDIgKiAtMHhmMDQpLAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MTJjZDcyID0KICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxMmNkNzIgLQogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDFmYzFlZCArCiAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4YjMgKiAweDEgKyAtMHgyMDE4ICogMHgxICsgMHgxICogMHgxZjY2KSksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyODFlYzAgPSBfMHgyN2ZjZjNbXzB4MjYxNzM2KDB4MmE1KV0oCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTJjZDcyLAogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyY2Q3MiArIF8weDFmYzFlZAogICAgICAgICAgICAgICAgICAgICAgICApKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1tfMHgxMmNkNzJdID0gXzB4MjgxZWMwKSk7CiAgICAgICAgICAgICAgICAgIGVsc2UgewogICAgICAgICAgICAgICAgICAgIGlmIChfMHg1Y2Q1YjkgPCAweDIgKiAtMHhmMzggKyAweGRkMCArIDB4MTBiMSkKICAgICAgICAgICAgICAgICAgICAgIC0weDE1ZDIgKyAweDI2ZjAgKyAweDExICogLTB4MTAxID09PSBfMHg1Y2Q1YjkKICAgICAgICAgICAgICAgICAgICAgICAgPyAoXzB4MjdmY2YzWysrXzB4MTJjZDcyXSA9IHt9KQogICAgICAgICAgICAgICAgICAgICAgICA6ICgoXzB4MWZjMWVkID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyNmY0NWZbXzB4M2U4N2M2XSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4OWFjICsgMHgxMjAxICogMHgxICsgLTB4ODRkKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjZmNDVmWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzZTg3YzYgKyAoMHgxZWNiICsgLTB4MWJkZCArIDB4NyAqIC0weDZiKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDNlODdjNiArPSAweDZhNCArIC0weDkyMiArIDB4MjgwKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjgxZWMwID0gXzB4NDA4NjA5W18weDFmYzFlZF0pLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHg1YzBmMzMgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml1bXzB4MjgxZWMwXSA9IF8weDVjMGYzMykpOwogICAgICAgICAgICAgICAgICAgIGVsc2UgewogICAgICAgICAgICAgICAgICAgICAgaWYgKDB4MTcgKiAtMHhjMyArIDB4MWRhNSArIDB4MyAqIC0weDQwNSA9PT0gXzB4NWNkNWI5KSB7CiAgICAgICAgICAgICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjgxZWMwID0gXzB4MjZmNDVmW18weDNlODdjNisrXSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDVjMGYzMyA9IF8weDI2ZjQ1ZltfMHgzZTg3YzYrK10sCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHhkNTVjODIgPSBfMHg0NDQ0Y2Y7CiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjgxZWMwID4gLTB4MyAqIDB4NGJhICsgLTB4MTIgKiAweGIxICsgMHgxYWEwOwogICAgICAgICAgICAgICAgICAgICAgICAgIC0tXzB4MjgxZWMwCiAgICAgICAgICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHhkNTVjODIgPSBfMHhkNTVjODJbInAiXTsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjdmY2YzWysrXzB4MTJjZDcyXSA9IF8weGQ1NWM4MltfMHg1YzBmMzNdOwogICAgICAgICAgICAgICAgICAgICAgfSBlbHNlCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgxZmMxZWQgPQogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyNmY0NWZbXzB4M2U4N2M2XSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MTVjMyArIC0weDQ1MyArIC0weDExNjgpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjZmNDVmWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4M2U4N2M2ICsgKC0weDFmM2YgKiAweDEgKyAweDFmNmEgKyAweDYgKiAtMHg3KQogICAgICAgICAgICAgICAgICAgICAgICAgIF0pLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzZTg3YzYgKz0gMHgxICogLTB4MWY0ZSArIC0weDExOGYgKiAweDEgKyAweDMwZGYpLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyODFlYzAgPSBfMHg0MDg2MDlbXzB4MWZjMWVkXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1tfMHgxMmNkNzJdID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI3ZmNmM1tfMHgxMmNkNzJdW18weDI4MWVjMF0pOwogICAgICAgICAgICAgICAgICAgIH0KICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgIH0gZWxzZSB7CiAgICAgICAgICAgICAgICBpZiAoXzB4NWNkNWI5IDwgLTB4ZjVjICsgLTB4NmQ3ICsgMHgxNjRlKSB7CiAgICAgICAgICAgICAgICAgIGlmIChfMHg1Y2Q1YjkgPCAweGM4ICogLTB4MmYgKyAweGVlICogLTB4OSArIC0weGYgKiAtMHgzMDMpIHsKICAgICAgICAgICAgICAgICAgICBpZiAoXzB4NWNkNWI5IDwgMHgxICogLTB4MjQyNiArIDB4MjI0ZSArIDB4MTEgKiAweDFkKSB7CiAgICAgICAgICAgICAgICAgICAgICBpZiAoLTB4YjE1ICsgMHgyZDUgKiAweDEgKyAtMHg4NTMgKiAtMHgxID09PSBfMHg1Y2Q1YjkpCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyODFlYzAgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjdmY2YzW18weDEyY2Q3Ml1bXzB4MjgxZWMwXSk7CiAgICAgICAgICAgICAgICAgICAgICBlbHNlIHsKICAgICAgICAgICAgICAgICAgICAgICAgZm9yICgKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgyODFlYzAgPSBfMHgyNmY0NWZbXzB4M2U4N2M2KytdLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NWMwZjMzID0gXzB4MjZmNDVmW18weDNlODdjNisrXSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weGQ1NWM4MiA9IF8weDQ0NDRjZjsKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgyODFlYzAgPiAweDIgKiAtMHgxMWI4ICsgMHgyNDBhICsgLTB4OWE7CiAgICAgICAgICAgICAgICAgICAgICAgICAgLS1fMHgyODFlYzAKICAgICAgICAgICAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgICAgICAgICAgIF8weGQ1NWM4MiA9IF8weGQ1NWM4MlsicCJdOwogICAgICAgICAgICAgICAgICAgICAgICBfMHhkNTVjODJbXzB4NWMwZjMzXSA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV07CiAgICAgICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICAgICAgfSBlbHNlCiAgICAgICAgICAgICAgICAgICAgICAweDEgKiAweDE3ZjEgKyAweDExNSAqIC0weDkgKyAweDJkMyAqIC0weDUgPT09IF8weDVjZDViOQogICAgICAgICAgICAgICAgICAgICAgICA/ICgoXzB4MWZjMWVkID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyNmY0NWZbXzB4M2U4N2M2XSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxNmZmICsgMHgxNThhICsgLTB4MmM4MSAqIDB4MSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI2ZjQ1ZlsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4M2U4N2M2ICsgKDB4ODhmICogLTB4MyArIDB4MWM4MiArIDB4MTZhICogLTB4MikKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF0pLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzZTg3YzYgKz0gMHgxICogLTB4YTcgKyAweDE4ZDQgKyAweDEgKiAtMHgxODJiKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjgxZWMwID0gXzB4NDA4NjA5W18weDFmYzFlZF0pLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHg1YzBmMzMgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4ZDU1YzgyID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDVjMGYzM1tfMHgyODFlYzBdID0gXzB4ZDU1YzgyKSkKICAgICAgICAgICAgICAgICAgICAgICAgOiAoKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHg1YzBmMzMgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4ZDU1YzgyID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDVjMGYzM1tfMHgyODFlYzBdID0gXzB4ZDU1YzgyKSk7CiAgICAgICAgICAgICAgICAgIH0gZWxzZSB7CiAgICAgICAgICAgICAgICAgICAgaWYgKF8weDVjZDViOSA8IC0weDE5ZjMgKyAweDFjNmIgKyAtMHgyNWYpIHsKICAgICAgICAgICAgICAgICAgICAgIGlmICgKICAgICAgICAgICAgICAgICAgICAgICAgMHgxYiAqIC0weGJkICsgLTB4ODRhICogLTB4MiArIC0weDEyNiAqIC0weDMgPT09CiAgICAgICAgICAgICAgICAgICAgICAgIF8weDVjZDViOQogICAgICAgICAgICAgICAgICAgICAgKSB7CiAgICAgICAgICAgICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjgxZWMwID0gXzB4MjZmNDVmW18weDNlODdjNisrXSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDVjMGYzMyA9IF8weDI2ZjQ1ZltfMHgzZTg3YzYrK10sCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHhkNTVjODIgPSBfMHg0NDQ0Y2YsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHhkNTVjODIgPSBfMHg0NDQ0Y2Y7CiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjgxZWMwID4gMHgzICogLTB4NjVhICsgMHhlMjggKyAweDRlNjsKICAgICAgICAgICAgICAgICAgICAgICAgICAtLV8weDI4MWVjMAogICAgICAgICAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4ZDU1YzgyID0gXzB4ZDU1YzgyWyJwIl07CiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyN2ZjZjNbKytfMHgxMmNkNzJdID0gXzB4ZDU1YzgyKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzWysrXzB4MTJjZDcyXSA9IF8weDVjMGYzMyk7CiAgICAgICAgICAgICAgICAgICAgICB9IGVsc2UKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyN2ZjZjNbXzB4MTJjZDcyXSArPSBfMHgyODFlYzApOwogICAgICAgICAgICAgICAgICAgIH0gZWxzZQogICAgICAgICAgICAgICAgICAgICAgMHg0NGIgKiAtMHg5ICsgMHg2MSAqIC0weGEgKyAtMHgyYTg2ICogLTB4MSA9PT0gXzB4NWNkNWI5CiAgICAgICAgICAgICAgICAgICAgICAgID8gKChfMHgyODFlYzAgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gLT0gXzB4MjgxZWMwKSkKICAgICAgICAgICAgICAgICAgICAgICAgOiAoKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyN2ZjZjNbXzB4MTJjZDcyXSAqPSBfMHgyODFlYzApKTsKICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgfSBlbHNlCiAgICAgICAgICAgICAgICAgIF8weDVjZDViOSA8IDB4MyAqIC0weDdjZSArIDB4OTA3ICogLTB4MSArIC0weDEgKiAtMHgyMDk0CiAgICAgICAgICAgICAgICAgICAgPyBfMHg1Y2Q1YjkgPCAweGE2OCArIC0weGM1ZiArIDB4MjE0CiAgICAgICAgICAgICAgICAgICAgICA/IDB4M2UgKiAtMHg3ZCArIDB4MTNkMSArIDB4YTkwID09PSBfMHg1Y2Q1YjkKICAgICAgICAgICAgICAgICAgICAgICAgPyAoKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyN2ZjZjNbXzB4MTJjZDcyXSAvPSBfMHgyODFlYzApKQogICAgICAgICAgICAgICAgICAgICAgICA6ICgoXzB4MjgxZWMwID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1tfMHgxMmNkNzJdICU9IF8weDI4MWVjMCkpCiAgICAgICAgICAgICAgICAgICAgICA6IC0weDE3MWQgKiAtMHgxICsgLTB4NmEyICogLTB4MyArIC0weDJhZTYgPT09IF8weDVjZDViOQogICAgICAgICAgICAgICAgICAgICAgPyAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPSAtXzB4MjdmY2YzW18weDEyY2Q3Ml0pCiAgICAgICAgICAgICAgICAgICAgICA6ICgoXzB4MjgxZWMwID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHg1YzBmMzMgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1srK18weDEyY2Q3Ml0gPSBfMHg1YzBmMzNbXzB4MjgxZWMwXSsrKSkKICAgICAgICAgICAgICAgICAgICA6IF8weDVjZDViOSA8IDB4MjU2NSArIC0weDIgKiAtMHhkNzYgKyAtMHgxYmMgKiAweDI1CiAgICAgICAgICAgICAgICAgICAgPyAweDk1MSArIDB4MTNkYSArIC0weDFkMDggPT09IF8weDVjZDViOQogICAgICAgICAgICAgICAgICAgICAgPyAoKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pLAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI3ZmNmM1tfMHgxMmNkNzJdID09IF8weDI4MWVjMCkpCiAgICAgICAgICAgICAgICAgICAgICA6ICgoXzB4MjgxZWMwID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyN2ZjZjNbXzB4MTJjZDcyXSA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjdmY2YzW18weDEyY2Q3Ml0gIT0gXzB4MjgxZWMwKSkKICAgICAgICAgICAgICAgICAgICA6IC0weDE0NGMgKiAtMHgxICsgMHhkMDEgKyAtMHgyMTI4ID09PSBfMHg1Y2Q1YjkKICAgICAgICAgICAgICAgICAgICA/ICgoXzB4MjgxZWMwID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgICBfMHgyN2ZjZjNbXzB4MTJjZDcyXSA9PT0gXzB4MjgxZWMwKSkKICAgICAgICAgICAgICAgICAgICA6ICgoXzB4MjgxZWMwID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgICBfMHgyN2ZjZjNbXzB4MTJjZDcyXSAhPT0gXzB4MjgxZWMwKSk7CiAgICAgICAgICAgICAgfQogICAgICAgICAgICB9IGVsc2UgewogICAgICAgICAgICAgIGlmIChfMHg1Y2Q1YjkgPCAtMHgzYmIgKyAweGRiNiArIC0weDljMiAqIDB4MSkKICAgICAgICAgICAgICAgIF8weDVjZDViOSA8IC0weGUxNiArIC0weDIgKiAtMHg0MDkgKyAweDYzMwogICAgICAgICAgICAgICAgICA/IF8weDVjZDViOSA8IDB4MSAqIDB4ZWVhICsgLTB4MyAqIDB4ODYzICsgMHgyYiAqIDB4M2UKICAgICAgICAgICAgICAgICAgICA/IF8weDVjZDViOSA8IC0weDJmICogLTB4MTUgKyAweDE4NSAqIDB4MiArIC0weDM1ZSAqIDB4MgogICAgICAgICAgICAgICAgICAgICAgPyAoKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pLAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI3ZmNmM1tfMHgxMmNkNzJdIDwgXzB4MjgxZWMwKSkKICAgICAgICAgICAgICAgICAgICAgIDogLTB4MjE1MiArIC0weDE4NTMgKyAweDM5Y2UgPT09IF8weDVjZDViOQogICAgICAgICAgICAgICAgICAgICAgPyAoKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pLAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI3ZmNmM1tfMHgxMmNkNzJdID4gXzB4MjgxZWMwKSkKICAgICAgICAgICAgICAgICAgICAgIDogKChfMHgyODFlYzAgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1tfMHgxMmNkNzJdID0KICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgyN2ZjZjNbXzB4MTJjZDcyXSA+PSBfMHgyODFlYzApKQogICAgICAgICAgICAgICAgICAgIDogXzB4NWNkNWI5IDwgMHgzICogLTB4ODIyICsgMHhjNzYgKyAweDFiYiAqIDB4NwogICAgICAgICAgICAgICAgICAgID8gMHgyMGFlICsgLTB4MjFjYSArIC0weDZkICogLTB4MyA9PT0gXzB4NWNkNWI5CiAgICAgICAgICAgICAgICAgICAgICA/ICgoXzB4MjgxZWMwID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyN2ZjZjNbXzB4MTJjZDcyXSA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjdmY2YzW18weDEyY2Q3Ml0gPDwgXzB4MjgxZWMwKSkKICAgICAgICAgICAgICAgICAgICAgIDogKChfMHgyODFlYzAgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1tfMHgxMmNkNzJdID0KICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgyN2ZjZjNbXzB4MTJjZDcyXSA+PiBfMHgyODFlYzApKQogICAgICAgICAgICAgICAgICAgIDogLTB4MTAgKiAweDFhICsgLTB4MTQzMSArIDB4YSAqIDB4MjMzID09PSBfMHg1Y2Q1YjkKICAgICAgICAgICAgICAgICAgICA/ICgoXzB4MjgxZWMwID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgICBfMHgyN2ZjZjNbXzB4MTJjZDcyXSA+Pj4gXzB4MjgxZWMwKSkKICAgICAgICAgICAgICAgICAgICA6ICgoXzB4MjgxZWMwID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPSBfMHgyN2ZjZjNbXzB4MTJjZDcyXSAmIF8weDI4MWVjMCkpCiAgICAgICAgICAgICAgICAgIDogXzB4NWNkNWI5IDwgMHgxICogMHgxY2E3ICsgMHgxZWExICogMHgxICsgLTB4MzFjICogMHgxMwogICAgICAgICAgICAgICAgICA/IF8weDVjZDViOSA8IC0weGE2MyAqIC0weDIgKyAtMHgxMTRkICsgLTB4MSAqIDB4MzQ3CiAgICAgICAgICAgICAgICAgICAgPyAtMHgxMmI1ICsgLTB4MTUzICogMHg0ICsgMHg4ICogMHgzMDYgPT09IF8weDVjZDViOQogICAgICAgICAgICAgICAgICAgICAgPyAoKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pLAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI3ZmNmM1tfMHgxMmNkNzJdIHwgXzB4MjgxZWMwKSkKICAgICAgICAgICAgICAgICAgICAgIDogKChfMHgyODFlYzAgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1tfMHgxMmNkNzJdID0KICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgyN2ZjZjNbXzB4MTJjZDcyXSBeIF8weDI4MWVjMCkpCiAgICAgICAgICAgICAgICAgICAgOiAtMHhhYiArIDB4MTBjMSArIDB4OSAqIC0weDFjNCA9PT0gXzB4NWNkNWI5CiAgICAgICAgICAgICAgICAgICAgPyAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPSAhXzB4MjdmY2YzW18weDEyY2Q3Ml0pCiAgICAgICAgICAgICAgICAgICAgOiAoKF8weDFmYzFlZCA9CiAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4MWZjMWVkID0KICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjZmNDVmW18weDNlODdjNl0gPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDkgKiAtMHhkMCArIC0weDEgKiAtMHhhMDQgKyAweDIgKiAtMHgxNTYpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjZmNDVmWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4M2U4N2M2ICsgKDB4YTZhICsgMHgxMTNjICsgMHgxYmE1ICogLTB4MSkKICAgICAgICAgICAgICAgICAgICAgICAgICBdKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICgweDIgKiAtMHg0MWIgKyAtMHgxYmYxICsgMHg3ZiAqIDB4NDkpKSA+PgogICAgICAgICAgICAgICAgICAgICAgICAoLTB4MWJjMCArIDB4MjMyZSArIC0weDc1ZSkpLAogICAgICAgICAgICAgICAgICAgICAgKF8weDNlODdjNiArPSAtMHg2MiAqIDB4MzEgKyAweDI2YiAqIDB4NyArIDB4MWQ3ICogMHgxKSwKICAgICAgICAgICAgICAgICAgICAgIF8weDI3ZmNmM1tfMHgxMmNkNzJdCiAgICAgICAgICAgICAgICAgICAgICAgID8gLS1fMHgxMmNkNzIKICAgICAgICAgICAgICAgICAgICAgICAgOiAoXzB4M2U4N2M2ICs9IF8weDFmYzFlZCkpCiAgICAgICAgICAgICAgICAgIDogXzB4NWNkNWI5IDwgMHg4ICogMHg0OTMgKyAtMHg2YyAqIDB4NDkgKyAweDFhICogLTB4MzcKICAgICAgICAgICAgICAgICAgPyAtMHgyMSAqIDB4MSArIC0weDMgKiAtMHhjMTkgKyAweDIgKiAtMHgxMWZiID09PSBfMHg1Y2Q1YjkKICAgICAgICAgICAgICAgICAgICA/ICgoXzB4MWZjMWVkID0KICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgxZmMxZWQgPQogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyNmY0NWZbXzB4M2U4N2M2XSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDIgKiAweDExZmYgKyAweDlkMyArIDB4MWEzMykpICsKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgyNmY0NWZbCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzZTg3YzYgKyAoMHgxYmE2ICsgLTB4MTM0ZiAqIC0weDEgKyAtMHgyZWY0KQogICAgICAgICAgICAgICAgICAgICAgICAgIF0pIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MTBkYyAqIC0weDEgKyAtMHgxMTMwICsgMHgyMjFjKSkgPj4KICAgICAgICAgICAgICAgICAgICAgICAgKC0weDUgKiAweDY4NSArIDB4MWEyMyArIDB4Njg2KSksCiAgICAgICAgICAgICAgICAgICAgICAoXzB4M2U4N2M2ICs9IDB4NCAqIDB4ZjkgKyAtMHgyMWM1ICsgMHgxZGUzKSwKICAgICAgICAgICAgICAgICAgICAgIF8weDI3ZmNmM1tfMHgxMmNkNzJdCiAgICAgICAgICAgICAgICAgICAgICAgID8gKF8weDNlODdjNiArPSBfMHgxZmMxZWQpCiAgICAgICAgICAgICAgICAgICAgICAgIDogLS1fMHgxMmNkNzIpCiAgICAgICAgICAgICAgICAgICAgOiAoKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pLAogICAgICAgICAgICAgICAgICAgICAgKChfMHg1YzBmMzMgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKVtfMHgyODFlYzBdID0KICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjdmY2YzW18weDEyY2Q3Ml0pKQogICAgICAgICAgICAgICAgICA6IC0weDUgKiAtMHg2NWMgKyAweDE1ICogMHgxN2IgKyAtMHgzZWFkID09PSBfMHg1Y2Q1YjkKICAgICAgICAgICAgICAgICAgPyAoKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pLAogICAgICAgICAgICAgICAgICAgIChfMHgyN2ZjZjNbXzB4MTJjZDcyXSA9IF8weDI3ZmNmM1tfMHgxMmNkNzJdIGluIF8weDI4MWVjMCkpCiAgICAgICAgICAgICAgICAgIDogKChfMHgyODFlYzAgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgXzB4MjdmY2YzW18weDEyY2Q3Ml0gaW5zdGFuY2VvZiBfMHgyODFlYzApKTsKICAgICAgICAgICAgICBlbHNlIHsKICAgICAgICAgICAgICAgIGlmIChfMHg1Y2Q1YjkgPCAweDUyICsgMHg3ICogMHgxMDIgKyAtMHgyICogMHgzOGYpIHsKICAgICAgICAgICAgICAgICAgaWYgKF8weDVjZDViOSA8IC0weDE4ODcgKyAtMHgzMDMgKyAweDFiYzcpCiAgICAgICAgICAgICAgICAgICAgXzB4NWNkNWI5IDwgMHgyMTMyICsgLTB4NTkyICogMHgyICsgLTB4MTVkMwogICAgICAgICAgICAgICAgICAgICAgPyAtMHgxMzZiICsgLTB4MjFjZCArIDB4MzU3MSAqIDB4MSA9PT0gXzB4NWNkNWI5CiAgICAgICAgICAgICAgICAgICAgICAgID8gKChfMHgyODFlYzAgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4NWMwZjMzID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1srK18weDEyY2Q3Ml0gPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgZGVsZXRlIF8weDVjMGYzM1tfMHgyODFlYzBdKSkKICAgICAgICAgICAgICAgICAgICAgICAgOiAoXzB4MjdmY2YzW18weDEyY2Q3Ml0gPSB0eXBlb2YgXzB4MjdmY2YzW18weDEyY2Q3Ml0pCiAgICAgICAgICAgICAgICAgICAgICA6IDB4ZWVkICogMHgxICsgLTB4YTFlICsgMHgyICogLTB4MjRhID09PSBfMHg1Y2Q1YjkKICAgICAgICAgICAgICAgICAgICAgID8gKChfMHgxZmMxZWQgPSBfMHgyNmY0NWZbXzB4M2U4N2M2KytdKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pLAogICAgICAgICAgICAgICAgICAgICAgICAoKF8weDVjMGYzMyA9IGZ1bmN0aW9uIF8weDNiNzcxMigpIHsKICAgICAgICAgICAgICAgICAgICAgICAgICB2YXIgXzB4Mjk1ZjU4ID0gXzB4M2I3NzEyWyJfdSJdLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjkxMTZhID0gXzB4M2I3NzEyWyJfdiJdOwogICAgICAgICAgICAgICAgICAgICAgICAgIHJldHVybiBfMHgyOTVmNTgoCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgyOTExNmFbMHgyOGMgKiAweDQgKyAtMHg2ICogMHgxZDYgKyAweGQ0XSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIGFyZ3VtZW50cywKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI5MTE2YVsweDFkNzIgKiAweDEgKyAweDdiICogLTB4MWIgKyAtMHgxMDc4XSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI5MTE2YVsweDExZTYgKyAweDFhMWYgKiAtMHgxICsgMHg4M2JdLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgdGhpcwogICAgICAgICAgICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgICAgICAgICAgICAgIH0pWyJfdiJdID0gW18weDI4MWVjMCwgXzB4MWZjMWVkLCBfMHg0NDQ0Y2ZdKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDVjMGYzM1siX3UiXSA9IF8weDk3MGU3KSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1srK18weDEyY2Q3Ml0gPSBfMHg1YzBmMzMpKQogICAgICAgICAgICAgICAgICAgICAgOiAoKF8weDFmYzFlZCA9IF8weDI2ZjQ1ZltfMHgzZTg3YzYrK10pLAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjgxZWMwID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4ZDU1YzgyID0gWwogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHg1YzBmMzMgPSBmdW5jdGlvbiBfMHg0NjUxMjMoKSB7CiAgICAgICAgICAgICAgICAgICAgICAgICAgICB2YXIgXzB4MmY2ZDU3ID0gXzB4NDY1MTIzWyJfdSJdLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOTlhZTEgPSBfMHg0NjUxMjNbIl92Il07CiAgICAgICAgICAgICAgICAgICAgICAgICAgICByZXR1cm4gXzB4MmY2ZDU3KAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOTlhZTFbLTB4MTEzYiArIDB4YiAqIDB4NzEgKyAweGM2MF0sCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIGFyZ3VtZW50cywKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4Mzk5YWUxWzB4YTEzICsgMHgyNGIwICsgLTB4OSAqIDB4NTMyXSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4Mzk5YWUxWzB4MSAqIDB4NDYzICsgLTB4NTYgKiAtMHg0OSArIC0weDFjZTddLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICB0aGlzCiAgICAgICAgICAgICAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgICAgICAgICAgICAgIH0pLAogICAgICAgICAgICAgICAgICAgICAgICBdKVsicCJdID0gXzB4NDQ0NGNmKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDVjMGYzM1siX3YiXSA9IFtfMHgyODFlYzAsIF8weDFmYzFlZCwgXzB4ZDU1YzgyXSksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHg1YzBmMzNbIl91Il0gPSBfMHg5NzBlNyksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyN2ZjZjNbKytfMHgxMmNkNzJdID0gXzB4NWMwZjMzKSk7CiAgICAgICAgICAgICAgICAgIGVsc2UgewogICAgICAgICAgICAgICAgICAgIGlmIChfMHg1Y2Q1YjkgPCAweDYyICogLTB4ZCArIDB4YWUzICsgLTB4NWE5KQogICAgICAgICAgICAgICAgICAgICAgMHg5ZDEgKiAtMHgxICsgMHgyNDI1ICsgLTB4MSAqIDB4MWExNyA9PT0gXzB4NWNkNWI5CiAgICAgICAgICAgICAgICAgICAgICAgID8gKChfMHgxZmMxZWQgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgxZmMxZWQgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjZmNDVmW18weDNlODdjNl0gPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHhkMSAqIDB4MiArIC0weGU1ICogMHg3ICsgMHg0YTkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI2ZjQ1ZlsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzZTg3YzYgKyAoMHgzM2EgKyAtMHhiMTQgKyAweDdkYiAqIDB4MSkKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weGIgKiAtMHhkZSArIDB4MTE5OSArIC0weDFiMTMpKSA+PgogICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weGEzZCArIDB4YyAqIDB4MmFhICsgLTB4MTVhYikpLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzZTg3YzYgKz0gLTB4MmYgKiAweDMgKyAweDIgKiAweDlhMyArIC0weDEyYjcpLAogICAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4MjgxZWMwID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDRiN2NjZFsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NGI3Y2NkWyJsZW5ndGgiXSAtCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4NDI3ICsgMHhhNTQgKyAtMHhkYSAqIDB4MTEpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBdKVsweDVkNCArIDB4MTRmMiArIC0weDRkICogMHg1OV0gPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4M2U4N2M2ICsgXzB4MWZjMWVkKSkKICAgICAgICAgICAgICAgICAgICAgICAgOiAoKF8weDFmYzFlZCA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKF8weDFmYzFlZCA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyNmY0NWZbXzB4M2U4N2M2XSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDM0OSAqIC0weDIgKyAweGE0ICogLTB4MTcgKyAweDE1NTYpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI2ZjQ1ZlsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzZTg3YzYgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDg2ICogLTB4MiArIC0weDFjOSArIC0weGJlICogLTB4MSkKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MTRiZiArIC0weDFhZWMgKyAtMHgxICogLTB4NjNkKSkgPj4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDIgKiAweDE3YiArIC0weDFlM2MgKyAweDFiNTYpKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4M2U4N2M2ICs9IC0weDEgKiAtMHgxMDUyICsgMHgxMCAqIC0weDE3ZSArIDB4NzkwKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjgxZWMwID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDRiN2NjZFsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NGI3Y2NkWyJsZW5ndGgiXSAtCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDFhZDIgKyAweDFiOSAqIDB4MiArIDB4MzkgKiAweDY5KQogICAgICAgICAgICAgICAgICAgICAgICAgICAgXSkgJiYKICAgICAgICAgICAgICAgICAgICAgICAgICAhXzB4MjgxZWMwWy0weDMgKiAweGU4ICsgLTB4NSAqIC0weDE0MiArIC0weDEgKiAweDM5MV0KICAgICAgICAgICAgICAgICAgICAgICAgICAgID8gKChfMHgyODFlYzBbMHgyNSAqIC0weDdhICsgMHgyMWVjICsgLTB4MTA0YV0gPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIDB4N2JmICsgLTB4MyAqIC0weGE0MyArIC0weDI2ODUpLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgyODFlYzBbXzB4MjYxNzM2KDB4MzZlKV0oXzB4M2U4N2M2KSkKICAgICAgICAgICAgICAgICAgICAgICAgICAgIDogXzB4NGI3Y2NkW18weDI2MTczNigweDM2ZSldKFsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHgxZCAqIDB4ODIgKyAtMHgxMWY0ICsgMHgyMGFmLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIDB4MTVhYyArIC0weDM5OSAqIC0weDkgKyAtMHgzNjBkLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDNlODdjNiwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDNlODdjNiArPSBfMHgxZmMxZWQpKTsKICAgICAgICAgICAgICAgICAgICBlbHNlIHsKICAgICAgICAgICAgICAgICAgICAgIGlmICgweDIyNjMgKiAtMHgxICsgLTB4Njg5ICsgMHgyOTJjID09PSBfMHg1Y2Q1YjkpCiAgICAgICAgICAgICAgICAgICAgICAgIHRocm93IChfMHgyODFlYzAgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKTsKICAgICAgICAgICAgICAgICAgICAgIGlmICgKICAgICAgICAgICAgICAgICAgICAgICAgKChfMHg1YzBmMzMgPSAoXzB4MjgxZWMwID0gXzB4NGI3Y2NkWyJwb3AiXSgpKVsKICAgICAgICAgICAgICAgICAgICAgICAgICAweDEgKiAweDZhMSArIDB4MWNlYiArIC0weDIzOGMKICAgICAgICAgICAgICAgICAgICAgICAgXSksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHhkNTVjODIgPSBfMHg0MmVmMWFbLTB4MWI4ICsgMHgxZDI1ICsgLTB4M2ViICogMHg3XSksCiAgICAgICAgICAgICAgICAgICAgICAgIDB4NzUxICogMHgxICsgLTB4YTRiICsgMHg3ICogMHg2ZCA9PT0gXzB4NWMwZjMzKQogICAgICAgICAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgICAgICAgICBfMHgzZTg3YzYgPSBfMHgyODFlYzBbMHgxICogMHg4ZSArIDB4MTI4YyArIC0weDEzMTldOwogICAgICAgICAgICAgICAgICAgICAgZWxzZSB7CiAgICAgICAgICAgICAgICAgICAgICAgIGlmICgweDExZjQgKyAweDMgKiAweDk1ICsgLTB4MTNiMyA9PT0gXzB4NWMwZjMzKSB7CiAgICAgICAgICAgICAgICAgICAgICAgICAgaWYgKC0weDI2MDcgKyAtMHhkYzggKyAtMHgxMTQ1ICogLTB4MyA9PT0gXzB4ZDU1YzgyKQogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4M2U4N2M2ID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjgxZWMwWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDI2MiArIC0weDEyYmYgKiAtMHgyICsgMHgxMyAqIC0weDFkOQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBdOwogICAgICAgICAgICAgICAgICAgICAgICAgIGVsc2UgewogICAgICAgICAgICAgICAgICAgICAgICAgICAgaWYgKAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAweDZkICogMHgyICsgMHgyZmYgKiAtMHg5ICsgMHgxYTFlICE9PQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHhkNTVjODIKICAgICAgICAgICAgICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgdGhyb3cgXzB4NDJlZjFhWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIDB4MyAqIDB4Y2VkICsgMHgxZGQ3ICsgMHgxNmRmICogLTB4MwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBdOwogICAgICAgICAgICAgICAgICAgICAgICAgICAgaWYgKCFfMHg0MjhjODcpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIHJldHVybiBfMHg0MmVmMWFbCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgMHgyMWI3ICsgMHgyMGE1ICogLTB4MSArIC0weDViICogMHgzCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF07CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4M2U4N2M2ID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NDI4Yzg3Wy0weDRiZCArIC0weDMgKiAtMHgzNTMgKyAweDUzYiAqIC0weDFdKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDU2MDY0MSA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NDI4Yzg3WzB4MTQ5ZSArIDB4MSAqIC0weDc1MSArIC0weGQ0Yl0pLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4NDQ0NGNmID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHg0MjhjODdbCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHgyICogMHg5NGQgKyAtMHg3YmYgKiAtMHgxICsgMHgyICogMHg1NmYKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBdKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDRiN2NjZCA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NDI4Yzg3WwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgMHgxNWMzICogMHgxICsgLTB4NCAqIDB4ODJlICsgLTB4MzUgKiAtMHgzNQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF0pLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzWysrXzB4MTJjZDcyXSA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NDJlZjFhWzB4MyAqIDB4YWYzICsgLTB4OTgzICsgLTB4MTc1NV0pLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4NDJlZjFhID0gWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDFjMWMgKyAtMHgxNGMgKiAweDFhICsgMHgzZGQ0LAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIG51bGwsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF0pLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4NDI4Yzg3ID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHg0MjhjODdbMHgxYTMgKyAweDEgKiAtMHgxZTIzICsgMHgxYzgwXSk7CiAgICAgICAgICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgICAgICAgICB9IGVsc2UKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4M2U4N2M2ID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI4MWVjMFstMHgxICogLTB4OTUzICsgMHgxNTkgKiAweDEgKyAtMHhhYWFdKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyODFlYzBbMHgyNmFkICogLTB4MSArIDB4MiAqIC0weGU0YiArIDB4NDM0M10gPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAweDEwMGQgKyAtMHgxOWNjICsgMHg1ICogMHgxZjMpLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NGI3Y2NkW18weDI2MTczNigweDM2ZSldKF8weDI4MWVjMCk7CiAgICAgICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICB9IGVsc2UgewogICAgICAgICAgICAgICAgICBpZiAoXzB4NWNkNWI5IDwgMHgxOTUgKyAtMHgzYiAqIC0weDlkICsgLTB4MyAqIDB4YzdmKSB7CiAgICAgICAgICAgICAgICAgICAgaWYgKF8weDVjZDViOSA8IDB4ZCAqIC0weDEgKyAweDIyOSArIC0weDFkOCkgewogICAgICAgICAgICAgICAgICAgICAgaWYgKC0weDk0OSArIDB4MTNmOCArIC0weGE2ZCA9PT0gXzB4NWNkNWI5KSB7CiAgICAgICAgICAgICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjgxZWMwID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSwgXzB4NWMwZjMzID0gbnVsbDsKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4ZDU1YzgyID0gXzB4NGI3Y2NkW18weDI2MTczNigweDI2NyldKCkpOwoKICAgICAgICAgICAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgICAgICAgICAgIGlmICgKICAgICAgICAgICAgICAgICAgICAgICAgICAgIDB4MWU5NyArIDB4MzEgKiAtMHg1ZSArIC0weGM5NyA9PT0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4ZDU1YzgyWzB4MTUwICsgMHg2ICogMHg2NDUgKyAtMHgyNmVlXSB8fAogICAgICAgICAgICAgICAgICAgICAgICAgICAgMHhiMjkgKiAtMHgzICsgLTB4MzMzICogMHgzICsgMHgyYjE3ID09PQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHhkNTVjODJbMHgxICogLTB4MjJjMiArIC0weDE4N2IgKyAweDNiM2RdCiAgICAgICAgICAgICAgICAgICAgICAgICAgKSB7CiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHg1YzBmMzMgPSBfMHhkNTVjODI7CiAgICAgICAgICAgICAgICAgICAgICAgICAgICBicmVhazsKICAgICAgICAgICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICAgICAgICAgIGlmIChfMHg1YzBmMzMpCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDQyZWYxYSA9IFsKICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDExICogMHgxNGQgKyAweDE0OTIgKiAweDEgKyAweDE4YywKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI4MWVjMCwKICAgICAgICAgICAgICAgICAgICAgICAgICBdKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzZTg3YzYgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHg1YzBmMzNbMHhjMjggKiAtMHgzICsgLTB4OCAqIDB4NGUxICsgMHg0YjgyXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4NWMwZjMzWzB4NTFlICogMHgxICsgMHg3NTUgKiAtMHg1ICsgMHgxZjhiXSA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIDB4MTg3NSAqIDB4MSArIDB4MTQ2ICsgLTB4MTliYiksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHg0YjdjY2RbXzB4MjYxNzM2KDB4MzZlKV0oXzB4NWMwZjMzKTsKICAgICAgICAgICAgICAgICAgICAgICAgZWxzZSB7CiAgICAgICAgICAgICAgICAgICAgICAgICAgaWYgKCFfMHg0MjhjODcpIHJldHVybiBfMHgyODFlYzA7CiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDNlODdjNiA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHg0MjhjODdbMHgxICogMHgxNWJlICsgLTB4MjYzOSArIDB4MTA3Y10pLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDU2MDY0MSA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDQyOGM4N1stMHgxICogMHhlMWUgKyAweDIwNDIgKyAweDIgKiAtMHg5MTFdKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHg0NDQ0Y2YgPSBfMHg0MjhjODdbMHgyNWZkICsgMHgxY2ZlICsgLTB4NDJmOF0pLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDRiN2NjZCA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDQyOGM4N1sweDMgKiAweGE3NiArIDB4MTdjZSArIC0weDM3MmNdKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyN2ZjZjNbKytfMHgxMmNkNzJdID0gXzB4MjgxZWMwKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHg0MmVmMWEgPSBbCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDcgKiAweDRhNiArIC0weDEyZDMgKyAtMHgzICogLTB4MTExZiwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgbnVsbCwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF0pLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDQyOGM4NyA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDQyOGM4N1stMHgyOSAqIDB4MWUgKyAweDlkICogLTB4MmYgKyAweDIxYTFdKTsKICAgICAgICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgICAgICAgfSBlbHNlCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgxMmNkNzIgLT0gXzB4MWZjMWVkID0gXzB4MjZmNDVmW18weDNlODdjNisrXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDVjMGYzMyA9IF8weDI3ZmNmM1sic2xpY2UiXSgKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyY2Q3MiArICgweGY0ZiAqIC0weDEgKyAweDFhZjkgKiAweDEgKyAtMHhiYTkpLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTJjZDcyICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MWZjMWVkICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MjMwICsgMHgxZTE3ICogLTB4MSArIDB4NmZhICogMHg0KQogICAgICAgICAgICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyODFlYzAgPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4ZDU1YzgyID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjgxZWMwWyJfdSJdID09PSBfMHg5NzBlNwogICAgICAgICAgICAgICAgICAgICAgICAgICAgPyAoKF8weDI4MWVjMCA9IF8weDI4MWVjMFsiX3YiXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHg0MjhjODcgPSBbCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NDI4Yzg3LAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDNlODdjNiwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHg1NjA2NDEsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NDQ0NGNmLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDRiN2NjZCwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzZTg3YzYgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI4MWVjMFsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIDB4MTkwYyArIDB4MyAqIDB4ODliICsgMHgzMmRkICogLTB4MQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF0pLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBudWxsID09IF8weGQ1NWM4MiAmJgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHhkNTVjODIgPSAoZnVuY3Rpb24gKCkgewogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgcmV0dXJuIHRoaXM7CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgfSkoKSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHg1NjA2NDEgPSBfMHhkNTVjODIpLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKF8weDQ0NDRjZiA9IFtfMHg1YzBmMzNdWyJjb25jYXQiXShfMHg1YzBmMzMpKVsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgyNjE3MzYoMHgyNTkpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF0gPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIE1hdGhbXzB4MjYxNzM2KDB4MjBjKV0oCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgyODFlYzBbCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDEgKiAweDE3MGIgKyAtMHg5MzYgKyAweDEgKiAweDIwNDIKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF0sCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxZmMxZWQKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICApICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgzICogLTB4NGZhICsgMHgyMWVkICsgLTB4MTJmZSkpLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4NDQ0NGNmWyJwIl0gPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI4MWVjMFsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDE2ICogLTB4MWFmICsgMHgzNWYgKiAweDEgKyAweDI4NjcgKiAtMHgxCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHg0YjdjY2QgPSBbXSkpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICA6IChfMHgyN2ZjZjNbKytfMHgxMmNkNzJdID0gXzB4MjgxZWMwWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI2MTczNigweDIwNykKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXShfMHhkNTVjODIsIF8weDVjMGYzMykpOwogICAgICAgICAgICAgICAgICAgIH0gZWxzZSB7CiAgICAgICAgICAgICAgICAgICAgICBpZiAoMHg2MGEgKyAtMHhmMDUgKiAtMHgxICsgMHgxNGNiICogLTB4MSA9PT0gXzB4NWNkNWI5KSB7CiAgICAgICAgICAgICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MWZjMWVkID0gXzB4MjZmNDVmW18weDNlODdjNisrXSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weGQ1NWM4MiA9IFsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgdm9pZCAoLTB4MWI1ZCArIDB4MjJhMSArIDB4MjZjICogLTB4MyksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBdLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzdiNzBiID0gXzB4MWZjMWVkOwogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDM3YjcwYiA+IDB4MSAqIDB4ZDdlICsgLTB4MjVmMSArIDB4MTg3MzsKICAgICAgICAgICAgICAgICAgICAgICAgICAtLV8weDM3YjcwYgogICAgICAgICAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4ZDU1YzgyW18weDM3YjcwYl0gPSBfMHgyN2ZjZjNbXzB4MTJjZDcyLS1dOwogICAgICAgICAgICAgICAgICAgICAgICAoXzB4NWMwZjMzID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI4MWVjMCA9IEZ1bmN0aW9uWyJiaW5kIl1bXzB4MjYxNzM2KDB4MjA3KV0oCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHg1YzBmMzMsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHhkNTVjODIKICAgICAgICAgICAgICAgICAgICAgICAgICApKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjdmY2YzWysrXzB4MTJjZDcyXSA9IG5ldyBfMHgyODFlYzAoKSk7CiAgICAgICAgICAgICAgICAgICAgICB9IGVsc2UKICAgICAgICAgICAgICAgICAgICAgICAgXzB4M2U4N2M2ICs9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDFmYzFlZCA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKF8weDFmYzFlZCA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyNmY0NWZbXzB4M2U4N2M2XSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDFmNyArIDB4MSAqIC0weDdkMCArIDB4NyAqIDB4ZDcpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI2ZjQ1ZlsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzZTg3YzYgKyAoMHgyNjRhICsgMHhjM2MgKyAtMHgzMjg1KQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBdKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHg0ICogMHgzZWUgKyAweDQ1ICogMHg1MSArIC0weDE1ICogMHgxYzkpKSA+PgogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4NSAqIDB4MTk5ICsgLTB4MjRmICogLTB4MiArIC0weGM4YikpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MWYzICogMHg2ICsgMHgyNGY3ICsgLTB4MTk0Myk7CiAgICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgICB9IGVsc2UKICAgICAgICAgICAgICAgICAgICBfMHg1Y2Q1YjkgPCAtMHg0NWQgKiAtMHgyICsgLTB4MWU1MSArIDB4MTVlMAogICAgICAgICAgICAgICAgICAgICAgPyAweDEyNWIgKyAweDE5OGEgKyAtMHgyYjllID09PSBfMHg1Y2Q1YjkKICAgICAgICAgICAgICAgICAgICAgICAgPyAoKF8weDFmYzFlZCA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKF8weDFmYzFlZCA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyNmY0NWZbXzB4M2U4N2M2XSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgyNjkgKiAtMHhlICsgMHgxICogLTB4MjI1ICsgLTB4MWY5MSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjZmNDVmWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDNlODdjNiArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MjNiZCAqIC0weDEgKyAweDFjZTIgKyAweDEyICogLTB4Mzk3KQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBdKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHhjNjEgKyAtMHgxMzNiICsgMHg2ZWEpKSA+PgogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MTBkYyArIC0weDMwYSAqIDB4MSArIC0weGRjMikpLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzZTg3YzYgKz0gLTB4YzUgKiAtMHg5ICsgLTB4MjUyZiArIDB4MWU0NCksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzItLV0pIHx8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4M2U4N2M2ICs9IF8weDFmYzFlZCkpCiAgICAgICAgICAgICAgICAgICAgICAgIDogKChfMHgxZmMxZWQgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgxZmMxZWQgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjZmNDVmW18weDNlODdjNl0gPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHg1NSAqIDB4MTQgKyAweDEgKiAweDFlMTggKyAtMHgzICogMHhjM2MpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDI2ZjQ1ZlsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzZTg3YzYgKyAoLTB4MjJhMyArIC0weDViZiAqIC0weDIgKyAweDE3MjYpCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF0pIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHg5OGUgKiAweDQgKyAweDhhMSAqIDB4MSArIDB4MWRhNykpID4+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4NzIgKiAtMHgyNiArIDB4MmIgKiAtMHg1MSArIC0weDM0MSkpLAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzZTg3YzYgKz0gMHg0NyAqIDB4MWQgKyAweDEzNyAqIC0weDFkICsgMHgxYjMyKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjgxZWMwID0gXzB4MjdmY2YzW18weDEyY2Q3Mi0tXSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjdmY2YzW18weDEyY2Q3Ml0gPT09IF8weDI4MWVjMCAmJgogICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0tXzB4MTJjZDcyLCAoXzB4M2U4N2M2ICs9IF8weDFmYzFlZCkpKQogICAgICAgICAgICAgICAgICAgICAgOiAtMHhiICogMHgzM2QgKyAweDIzICogLTB4ZjIgKyAweDQ0ZmUgPT09IF8weDVjZDViOQogICAgICAgICAgICAgICAgICAgICAgPyAtLV8weDEyY2Q3MgogICAgICAgICAgICAgICAgICAgICAgOiAoKF8weDI4MWVjMCA9IF8weDI3ZmNmM1tfMHgxMmNkNzJdKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI3ZmNmM1srK18weDEyY2Q3Ml0gPSBfMHgyODFlYzApKTsKICAgICAgICAgICAgICAgIH0KICAgICAgICAgICAgICB9CiAgICAgICAgICAgIH0KICAgICAgICAgIH0gY2F0Y2ggKF8weDExMWVhNCkgewogICAgICAgICAgICBmb3IgKAogICAgICAgICAgICAgIF8weDQyZWYxYSA9IFstMHgzOTIgKiAtMHg0ICsgMHgxYTAgKyAtMHhmZTgsIG51bGxdOwogICAgICAgICAgICAgIChfMHgxZmMxZWQgPSBfMHg0YjdjY2RbXzB4MjYxNzM2KDB4MjY3KV0oKSkgJiYKICAgICAgICAgICAgICAhXzB4MWZjMWVkWzB4MTI2YSArIC0weDEgKiAweDIyN2MgKyAweDEwMTIgKiAweDFdOwoKICAgICAgICAgICAgKTsKICAgICAgICAgICAgaWYgKCFfMHgxZmMxZWQpIHsKICAgICAgICAgICAgICBfMHg0ODliZmI6IGZvciAoOyBfMHg0MjhjODc7ICkgewogICAgICAgICAgICAgICAgZm9yICgKICAgICAgICAgICAgICAgICAgXzB4MjgxZWMwID0gXzB4NDI4Yzg3WzB4MTBkYSAqIC0weDEgKyAtMHg1MzkgKyAweDE2MTcgKiAweDFdOwogICAgICAgICAgICAgICAgICAoXzB4MWZjMWVkID0gXzB4MjgxZWMwW18weDI2MTczNigweDI2NyldKCkpOwoKICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgICAgaWYgKF8weDFmYzFlZFsweGFmNCAqIC0weDIgKyAtMHgyICogMHgxMzJkICsgLTB4MiAqIC0weDFlMjFdKQogICAgICAgICAgICAgICAgICAgIGJyZWFrIF8weDQ4OWJmYjsKICAgICAgICAgICAgICAgIF8weDQyOGM4NyA9IF8weDQyOGM4N1sweDEzODEgKyAweDE5M2UgKyAtMHg0ZiAqIDB4OTFdOwogICAgICAgICAgICAgIH0KICAgICAgICAgICAgICBpZiAoIV8weDQyOGM4NykgdGhyb3cgXzB4MTExZWE0OwogICAgICAgICAgICAgIChfMHgzZTg3YzYgPSBfMHg0MjhjODdbMHhiICogLTB4Mjc3ICsgMHgxNGFjICsgLTB4MjI2ICogLTB4M10pLAogICAgICAgICAgICAgICAgKF8weDU2MDY0MSA9IF8weDQyOGM4N1sweDE1M2UgKyAweDFmZCAqIC0weGYgKyAweDg5N10pLAogICAgICAgICAgICAgICAgKF8weDQ0NDRjZiA9IF8weDQyOGM4N1stMHgxICogLTB4YTJlICsgMHhjZDYgKyAweDMgKiAtMHg3YWJdKSwKICAgICAgICAgICAgICAgIChfMHg0YjdjY2QgPQogICAgICAgICAgICAgICAgICBfMHg0MjhjODdbLTB4MiAqIDB4MTE0NSArIDB4MiAqIDB4MjkzICsgLTB4M2FkICogLTB4OF0pLAogICAgICAgICAgICAgICAgKF8weDQyOGM4NyA9IF8weDQyOGM4N1stMHg4ZTcgKyAweDI0N2YgKyAtMHgxYjk4XSk7CiAgICAgICAgICAgIH0KICAgICAgICAgICAgLTB4ZSAqIDB4Mjc3ICsgLTB4M2RiICsgLTB4NjY1ICogLTB4NiA9PT0KICAgICAgICAgICAgKF8weDI4MWVjMCA9IF8weDFmYzFlZFstMHhlNjUgKyAweDExZDEgKyAtMHgzNmNdKQogICAgICAgICAgICAgID8gKChfMHgzZTg3YzYgPSBfMHgxZmMxZWRbLTB4NyAqIC0weDFjICsgMHgyZmUgKiAweGEgKyAtMHgxZWFlXSksCiAgICAgICAgICAgICAgICAoXzB4MWZjMWVkWzB4M2Y1ICogMHgxICsgMHg5ZTQgKyAweDEgKiAtMHhkZDldID0KICAgICAgICAgICAgICAgICAgLTB4MTYyMiAqIC0weDEgKyAtMHgxICogLTB4MTczNiArIC0weDJkNTgpLAogICAgICAgICAgICAgICAgXzB4NGI3Y2NkWyJwdXNoIl0oXzB4MWZjMWVkKSwKICAgICAgICAgICAgICAgIChfMHgyN2ZjZjNbKytfMHgxMmNkNzJdID0gXzB4MTExZWE0KSkKICAgICAgICAgICAgICA6IDB4MWE1MiArIC0weGZjNCArIDB4MmQgKiAtMHgzYyA9PT0gXzB4MjgxZWMwCiAgICAgICAgICAgICAgPyAoKF8weDNlODdjNiA9IF8weDFmYzFlZFstMHgxOSAqIDB4ZmUgKyAweDFmOTggKyAtMHg2YzhdKSwKICAgICAgICAgICAgICAgIChfMHgxZmMxZWRbMHg1ICogLTB4MzNmICsgMHgxMWQgKiAtMHgxICsgMHgxMTU4XSA9CiAgICAgICAgICAgICAgICAgIDB4M2FjICogMHgxICsgMHgyICogLTB4MTMwMCArIDB4MTUyICogMHgxYSksCiAgICAgICAgICAgICAgICBfMHg0YjdjY2RbInB1c2giXShfMHgxZmMxZWQpLAogICAgICAgICAgICAgICAgKF8weDQyZWYxYSA9IFsweDhmICogMHgxZCArIC0weDFjNGIgKyAweGMxYiwgXzB4MTExZWE0XSkpCiAgICAgICAgICAgICAgOiAoKF8weDNlODdjNiA9CiAgICAgICAgICAgICAgICAgIF8weDFmYzFlZFsweDMxZiAqIC0weDUgKyAtMHhhZTcgKyAtMHgxICogLTB4MWE4NV0pLAogICAgICAgICAgICAgICAgKF8weDFmYzFlZFsweDI3ICogLTB4YjMgKyAtMHgxODYgKiAweGEgKyAweDJhODFdID0KICAgICAgICAgICAgICAgICAgMHhmOSArIDB4MTY0YSArIC0weDE3NDEpLAogICAgICAgICAgICAgICAgXzB4NGI3Y2NkW18weDI2MTczNigweDM2ZSldKF8weDFmYzFlZCksCiAgICAgICAgICAgICAgICAoXzB4MjdmY2YzWysrXzB4MTJjZDcyXSA9IF8weDExMWVhNCkpOwogICAgICAgICAgfQogICAgICB9KShfMHg1MzdlZmEsIFtdLCAtMHgxZSArIDB4MjYzMSArIC0weDI2MTMsIF8weDNmOTU0OCwgXzB4MzliMGI4KQogICAgKTsKICB9CiAgIShmdW5jdGlvbiAoXzB4ZTY3MjEzLCBfMHgxOTkzN2UpIHsKICAgIHZhciBfMHg0MDQ3MmMgPSB3XzB4MjVmMzsKICAgICJvYmplY3QiID09IHR5cGVvZiBleHBvcnRzICYmIF8weDQwNDcyYygweDM4NCkgIT0gdHlwZW9mIG1vZHVsZQogICAgICA/IF8weDE5OTM3ZShleHBvcnRzKQogICAgICA6IF8weDQwNDcyYygweDFlZSkgPT0gdHlwZW9mIGRlZmluZSAmJiBkZWZpbmVbImFtZCJdCiAgICAgID8gZGVmaW5lKFtfMHg0MDQ3MmMoMHgxYjgpXSwgXzB4MTk5MzdlKQogICAgICA6IF8weDE5OTM3ZSgKICAgICAgICAgICgoXzB4ZTY3MjEzID0KICAgICAgICAgICAgXzB4NDA0NzJjKDB4Mzg0KSAhPSB0eXBlb2YgZ2xvYmFsVGhpcwogICAgICAgICAgICAgID8gZ2xvYmFsVGhpcwogICAgICAgICAgICAgIDogXzB4ZTY3MjEzIHx8IHNlbGYpW18weDQwNDcyYygweDFmNSldID0ge30pCiAgICAgICAgKTsKICB9KSh0aGlzLCBmdW5jdGlvbiAoXzB4MWQxOGYyKSB7CiAgICAidXNlIHN0cmljdCI7CiAgICB2YXIgXzB4NTYxMmRlID0gd18weDI1ZjM7CiAgICBmdW5jdGlvbiBfMHgxMzdiYTIoXzB4MzgzYjUxKSB7CiAgICAgIHZhciBfMHgzODI5NDAgPSB3XzB4MjVmMywKICAgICAgICBfMHgyZTIzY2UsCiAgICAgICAgXzB4MmMyMDA0OwogICAgICBmdW5jdGlvbiBfMHgzYTRmM2YoXzB4NWE3MjZlLCBfMHg1MjA3MTgpIHsKICAgICAgICB2YXIgXzB4NDgwNjg2ID0gd18weDI1ZjM7CiAgICAgICAgdHJ5IHsKICAgICAgICAgIHZhciBfMHg0YTgzNDUgPSBfMHgzODNiNTFbXzB4NWE3MjZlXShfMHg1MjA3MTgpLAogICAgICAgICAgICBfMHg4ZDlkMGEgPSBfMHg0YTgzNDVbXzB4NDgwNjg2KDB4MmU0KV0sCiAgICAgICAgICAgIF8weDMyZjUzNCA9IF8weDhkOWQwYSBpbnN0YW5jZW9mIF8weDU5ZDg4NjsKICAgICAgICAgIFByb21pc2VbXzB4NDgwNjg2KDB4Mjc4KV0oXzB4MzJmNTM0ID8gXzB4OGQ5ZDBhWyJ2Il0gOiBfMHg4ZDlkMGEpWwogICAgICAgICAgICBfMHg0ODA2ODYoMHgxZWQpCiAgICAgICAgICBdKAogICAgICAgICAgICBmdW5jdGlvbiAoXzB4NTA0N2JlKSB7CiAgICAgICAgICAgICAgdmFyIF8weDJhN2JmMyA9IF8weDQ4MDY4NjsKICAgICAgICAgICAgICBpZiAoXzB4MzJmNTM0KSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4MWMxNWQ3ID0KICAgICAgICAgICAgICAgICAgInJldHVybiIgPT09IF8weDVhNzI2ZSA/IF8weDJhN2JmMygweDJmZCkgOiBfMHgyYTdiZjMoMHgzODkpOwogICAgICAgICAgICAgICAgaWYgKCFfMHg4ZDlkMGFbImsiXSB8fCBfMHg1MDQ3YmVbImRvbmUiXSkKICAgICAgICAgICAgICAgICAgcmV0dXJuIF8weDNhNGYzZihfMHgxYzE1ZDcsIF8weDUwNDdiZSk7CiAgICAgICAgICAgICAgICBfMHg1MDQ3YmUgPSBfMHgzODNiNTFbXzB4MWMxNWQ3XShfMHg1MDQ3YmUpW18weDJhN2JmMygweDJlNCldOwogICAgICAgICAgICAgIH0KICAgICAgICAgICAgICBfMHgzOTY4MTUoCiAgICAgICAgICAgICAgICBfMHg0YTgzNDVbXzB4MmE3YmYzKDB4MWUzKV0KICAgICAgICAgICAgICAgICAgPyBfMHgyYTdiZjMoMHgyZmQpCiAgICAgICAgICAgICAgICAgIDogXzB4MmE3YmYzKDB4MmYxKSwKICAgICAgICAgICAgICAgIF8weDUwNDdiZQogICAgICAgICAgICAgICk7CiAgICAgICAgICAgIH0sCiAgICAgICAgICAgIGZ1bmN0aW9uIChfMHg1NWMwMDIpIHsKICAgICAgICAgICAgICB2YXIgXzB4MTFiODNlID0gXzB4NDgwNjg2OwogICAgICAgICAgICAgIF8weDNhNGYzZihfMHgxMWI4M2UoMHgyNTApLCBfMHg1NWMwMDIpOwogICAgICAgICAgICB9CiAgICAgICAgICApOwogICAgICAgIH0gY2F0Y2ggKF8weDVlMDdkMSkgewogICAgICAgICAgXzB4Mzk2ODE1KF8weDQ4MDY4NigweDI1MCksIF8weDVlMDdkMSk7CiAgICAgICAgfQogICAgICB9CiAgICAgIGZ1bmN0aW9uIF8weDM5NjgxNShfMHgxODlhOTMsIF8weDI5ODhkMikgewogICAgICAgIHZhciBfMHg1NTc2MTcgPSB3XzB4MjVmMzsKICAgICAgICBzd2l0Y2ggKF8weDE4OWE5MykgewogICAgICAgICAgY2FzZSBfMHg1NTc2MTcoMHgyZmQpOgogICAgICAgICAgICBfMHgyZTIzY2VbXzB4NTU3NjE3KDB4Mjc4KV0oewogICAgICAgICAgICAgIHZhbHVlOiBfMHgyOTg4ZDIsCiAgICAgICAgICAgICAgZG9uZTogISgtMHgyNTJmICsgMHgxYjYwICsgMHg5Y2YpLAogICAgICAgICAgICB9KTsKICAgICAgICAgICAgYnJlYWs7CiAgICAgICAgICBjYXNlICJ0aHJvdyI6CiAgICAgICAgICAgIF8weDJlMjNjZVtfMHg1NTc2MTcoMHgzOWIpXShfMHgyOTg4ZDIpOwogICAgICAgICAgICBicmVhazsKICAgICAgICAgIGRlZmF1bHQ6CiAgICAgICAgICAgIF8weDJlMjNjZVtfMHg1NTc2MTcoMHgyNzgpXSh7CiAgICAgICAgICAgICAgdmFsdWU6IF8weDI5ODhkMiwKICAgICAgICAgICAgICBkb25lOiAhKC0weDE4ZWMgKyAtMHgxMmRjICsgMHgyYmM5KSwKICAgICAgICAgICAgfSk7CiAgICAgICAgfQogICAgICAgIChfMHgyZTIzY2UgPSBfMHgyZTIzY2VbIm5leHQiXSkKICAgICAgICAgID8gXzB4M2E0ZjNmKF8weDJlMjNjZVtfMHg1NTc2MTcoMHgzOTIpXSwgXzB4MmUyM2NlW18weDU1NzYxNygweDMyNyldKQogICAgICAgICAgOiAoXzB4MmMyMDA0ID0gbnVsbCk7CiAgICAgIH0KICAgICAgKHRoaXNbIl9pbnZva2UiXSA9IGZ1bmN0aW9uIChfMHhkMWQyYjgsIF8weDE2OGIwYSkgewogICAgICAgIHJldHVybiBuZXcgUHJvbWlzZShmdW5jdGlvbiAoXzB4MWE5MzlhLCBfMHg5Yjc2MzMpIHsKICAgICAgICAgIHZhciBfMHgxZjc4MDggPSB3XzB4MjVmMywKICAgICAgICAgICAgXzB4MjcwYzc2ID0gewogICAgICAgICAgICAgIGtleTogXzB4ZDFkMmI4LAogICAgICAgICAgICAgIGFyZzogXzB4MTY4YjBhLAogICAgICAgICAgICAgIHJlc29sdmU6IF8weDFhOTM5YSwKICAgICAgICAgICAgICByZWplY3Q6IF8weDliNzYzMywKICAgICAgICAgICAgICBuZXh0OiBudWxsLAogICAgICAgICAgICB9OwogICAgICAgICAgXzB4MmMyMDA0CiAgICAgICAgICAgID8gKF8weDJjMjAwNCA9IF8weDJjMjAwNFtfMHgxZjc4MDgoMHgzODkpXSA9IF8weDI3MGM3NikKICAgICAgICAgICAgOiAoKF8weDJlMjNjZSA9IF8weDJjMjAwNCA9IF8weDI3MGM3NiksCiAgICAgICAgICAgICAgXzB4M2E0ZjNmKF8weGQxZDJiOCwgXzB4MTY4YjBhKSk7CiAgICAgICAgfSk7CiAgICAgIH0pLAogICAgICAgIF8weDM4Mjk0MCgweDFlZSkgIT0gdHlwZW9mIF8weDM4M2I1MVtfMHgzODI5NDAoMHgyZmQpXSAmJgogICAgICAgICAgKHRoaXNbXzB4MzgyOTQwKDB4MmZkKV0gPSB2b2lkICgtMHhlNzMgKyAtMHhlICogMHgyNGIgKyAweDJlOGQpKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDU5ZDg4NihfMHg1M2UzYTgsIF8weDU5NDQ5MikgewogICAgICAodGhpc1sidiJdID0gXzB4NTNlM2E4KSwgKHRoaXNbImsiXSA9IF8weDU5NDQ5Mik7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxZDk4NjcoXzB4Mzg0NjNmLCBfMHg1NTlkMWIsIF8weDFiMmM1NCwgXzB4NTk1NTAxKSB7CiAgICAgIHJldHVybiB7CiAgICAgICAgZ2V0TWV0YWRhdGE6IGZ1bmN0aW9uIChfMHgzOTc4MjMpIHsKICAgICAgICAgIHZhciBfMHgyZDRiNmIgPSB3XzB4MjVmMzsKICAgICAgICAgIF8weDFmY2E0ZihfMHg1OTU1MDEsIF8weDJkNGI2YigweDM0OSkpLCBfMHg1MjVkYzMoXzB4Mzk3ODIzKTsKICAgICAgICAgIHZhciBfMHgxODI5NmYgPSBfMHgzODQ2M2ZbXzB4Mzk3ODIzXTsKICAgICAgICAgIGlmICh2b2lkICgtMHgxNWQxICsgMHg0ZDggKyAtMHhiICogLTB4MThiKSAhPT0gXzB4MTgyOTZmKSB7CiAgICAgICAgICAgIGlmICgtMHgxZmE1ICogLTB4MSArIDB4NmI4ICsgLTB4MjY1YyA9PT0gXzB4NTU5ZDFiKSB7CiAgICAgICAgICAgICAgdmFyIF8weDE5MmYwMCA9IF8weDE4Mjk2ZltfMHgyZDRiNmIoMHgxZDQpXTsKICAgICAgICAgICAgICBpZiAodm9pZCAoLTB4MSAqIDB4NDZkICsgLTB4NzQgKiAweDYgKyAweDFmICogMHgzYikgIT09IF8weDE5MmYwMCkKICAgICAgICAgICAgICAgIHJldHVybiBfMHgxOTJmMDBbXzB4MWIyYzU0XTsKICAgICAgICAgICAgfSBlbHNlIHsKICAgICAgICAgICAgICBpZiAoMHg0MDkgKiAweDggKyAweDUzICogLTB4M2UgKyAtMHhjMmMgPT09IF8weDU1OWQxYikgewogICAgICAgICAgICAgICAgdmFyIF8weDZkM2ZlMSA9IF8weDE4Mjk2ZltfMHgyZDRiNmIoMHgyNjEpXTsKICAgICAgICAgICAgICAgIGlmICh2b2lkICgweDFjN2MgKyAweDhiMCArIC0weDdhICogMHg0ZSkgIT09IF8weDZkM2ZlMSkKICAgICAgICAgICAgICAgICAgcmV0dXJuIF8weDZkM2ZlMVtfMHgyZDRiNmIoMHgzMmIpXShfMHgxYjJjNTQpOwogICAgICAgICAgICAgIH0gZWxzZSB7CiAgICAgICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgICAgIE9iamVjdFtfMHgyZDRiNmIoMHgzYjgpXVtfMHgyZDRiNmIoMHgzMzQpXSgKICAgICAgICAgICAgICAgICAgICBfMHgxODI5NmYsCiAgICAgICAgICAgICAgICAgICAgXzB4MmQ0YjZiKDB4MmFjKQogICAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgICAgIHJldHVybiBfMHgxODI5NmZbXzB4MmQ0YjZiKDB4MmFjKV07CiAgICAgICAgICAgICAgfQogICAgICAgICAgICB9CiAgICAgICAgICB9CiAgICAgICAgfSwKICAgICAgICBzZXRNZXRhZGF0YTogZnVuY3Rpb24gKF8weDNlZTUxOSwgXzB4NGU1M2JhKSB7CiAgICAgICAgICB2YXIgXzB4MjJlMmQxID0gd18weDI1ZjM7CiAgICAgICAgICBfMHgxZmNhNGYoXzB4NTk1NTAxLCBfMHgyMmUyZDEoMHgzOTUpKSwgXzB4NTI1ZGMzKF8weDNlZTUxOSk7CiAgICAgICAgICB2YXIgXzB4MzliNDkwID0gXzB4Mzg0NjNmW18weDNlZTUxOV07CiAgICAgICAgICBpZiAoCiAgICAgICAgICAgICh2b2lkICgweDE4MSAqIC0weDEgKyAweDEwMiAqIDB4OSArIC0weDc5MSkgPT09IF8weDM5YjQ5MCAmJgogICAgICAgICAgICAgIChfMHgzOWI0OTAgPSBfMHgzODQ2M2ZbXzB4M2VlNTE5XSA9IHt9KSwKICAgICAgICAgICAgLTB4OTdlICsgLTB4MzkgKiAtMHgyMiArIDB4MTEgKiAweDFkID09PSBfMHg1NTlkMWIpCiAgICAgICAgICApIHsKICAgICAgICAgICAgdmFyIF8weDM4YzcyMSA9IF8weDM5YjQ5MFtfMHgyMmUyZDEoMHgxZDQpXTsKICAgICAgICAgICAgdm9pZCAoLTB4MmY5ICogLTB4NyArIDB4OGZlICsgLTB4MWRjZCAqIDB4MSkgPT09IF8weDM4YzcyMSAmJgogICAgICAgICAgICAgIChfMHgzOGM3MjEgPSBfMHgzOWI0OTBbXzB4MjJlMmQxKDB4MWQ0KV0gPSB7fSksCiAgICAgICAgICAgICAgKF8weDM4YzcyMVtfMHgxYjJjNTRdID0gXzB4NGU1M2JhKTsKICAgICAgICAgIH0gZWxzZSB7CiAgICAgICAgICAgIGlmICgtMHg0ZGMgKyAweGJiMCArIC0weDZkMiA9PT0gXzB4NTU5ZDFiKSB7CiAgICAgICAgICAgICAgdmFyIF8weDRjYTA4NyA9IF8weDM5YjQ5MFsicHJpdiJdOwogICAgICAgICAgICAgIHZvaWQgKDB4MjkgKiAweGI5ICsgLTB4MjRhICsgLTB4MWI1NykgPT09IF8weDRjYTA4NyAmJgogICAgICAgICAgICAgICAgKF8weDRjYTA4NyA9IF8weDM5YjQ5MFtfMHgyMmUyZDEoMHgyNjEpXSA9IG5ldyBNYXAoKSksCiAgICAgICAgICAgICAgICBfMHg0Y2EwODdbXzB4MjJlMmQxKDB4MWU0KV0oXzB4MWIyYzU0LCBfMHg0ZTUzYmEpOwogICAgICAgICAgICB9IGVsc2UgXzB4MzliNDkwW18weDIyZTJkMSgweDJhYyldID0gXzB4NGU1M2JhOwogICAgICAgICAgfQogICAgICAgIH0sCiAgICAgIH07CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0M2JjZTQoXzB4MjgyNDMxLCBfMHgzMzYyOTcpIHsKICAgICAgdmFyIF8weGQ0YTcwMyA9IHdfMHgyNWYzLAogICAgICAgIF8weDJiNWM0YiA9CiAgICAgICAgICBfMHgyODI0MzFbCiAgICAgICAgICAgIFN5bWJvbFsibWV0YWRhdGEiXSB8fCBTeW1ib2xbXzB4ZDRhNzAzKDB4MzFlKV0oIlN5bWJvbC5tZXRhZGF0YSIpCiAgICAgICAgICBdLAogICAgICAgIF8weDE5MWE3ZSA9IE9iamVjdFtfMHhkNGE3MDMoMHgzODgpXShfMHgzMzYyOTcpOwogICAgICBpZiAoLTB4MjJjZCArIC0weDM3OCArIC0weDY1ICogLTB4NjEgIT09IF8weDE5MWE3ZVtfMHhkNGE3MDMoMHgyNTkpXSkgewogICAgICAgIGZvciAoCiAgICAgICAgICB2YXIgXzB4NDM0MDkzID0gMHgxZDY2ICsgLTB4MiAqIDB4YTAzICsgLTB4OTYwOwogICAgICAgICAgXzB4NDM0MDkzIDwgXzB4MTkxYTdlW18weGQ0YTcwMygweDI1OSldOwogICAgICAgICAgXzB4NDM0MDkzKysKICAgICAgICApIHsKICAgICAgICAgIHZhciBfMHg3MjBlOWEgPSBfMHgxOTFhN2VbXzB4NDM0MDkzXSwKICAgICAgICAgICAgXzB4MTRlMTQ1ID0gXzB4MzM2Mjk3W18weDcyMGU5YV0sCiAgICAgICAgICAgIF8weDI5NjViYyA9IF8weDJiNWM0YiA/IF8weDJiNWM0YltfMHg3MjBlOWFdIDogbnVsbCwKICAgICAgICAgICAgXzB4NTMwYjQzID0gXzB4MTRlMTQ1W18weGQ0YTcwMygweDFkNCldLAogICAgICAgICAgICBfMHgzNmYyYzIgPSBfMHgyOTY1YmMgPyBfMHgyOTY1YmNbXzB4ZDRhNzAzKDB4MWQ0KV0gOiBudWxsOwogICAgICAgICAgXzB4NTMwYjQzICYmCiAgICAgICAgICAgIF8weDM2ZjJjMiAmJgogICAgICAgICAgICBPYmplY3RbInNldFByb3RvdHlwZU9mIl0oXzB4NTMwYjQzLCBfMHgzNmYyYzIpOwogICAgICAgICAgdmFyIF8weDE3MzJiYSA9IF8weDE0ZTE0NVtfMHhkNGE3MDMoMHgyNjEpXTsKICAgICAgICAgIGlmIChfMHgxNzMyYmEpIHsKICAgICAgICAgICAgdmFyIF8weDU1MGM5ZiA9IEFycmF5W18weGQ0YTcwMygweDI5YyldKF8weDE3MzJiYVsidmFsdWVzIl0oKSksCiAgICAgICAgICAgICAgXzB4NWNiNDI2ID0gXzB4Mjk2NWJjID8gXzB4Mjk2NWJjW18weGQ0YTcwMygweDI2MSldIDogbnVsbDsKICAgICAgICAgICAgXzB4NWNiNDI2ICYmIChfMHg1NTBjOWYgPSBfMHg1NTBjOWZbXzB4ZDRhNzAzKDB4MmI4KV0oXzB4NWNiNDI2KSksCiAgICAgICAgICAgICAgKF8weDE0ZTE0NVtfMHhkNGE3MDMoMHgyNjEpXSA9IF8weDU1MGM5Zik7CiAgICAgICAgICB9CiAgICAgICAgICBfMHgyOTY1YmMgJiYgT2JqZWN0W18weGQ0YTcwMygweDIzYildKF8weDE0ZTE0NSwgXzB4Mjk2NWJjKTsKICAgICAgICB9CiAgICAgICAgXzB4MmI1YzRiICYmIE9iamVjdFsic2V0UHJvdG90eXBlT2YiXShfMHgzMzYyOTcsIF8weDJiNWM0YiksCiAgICAgICAgICAoXzB4MjgyNDMxWwogICAgICAgICAgICBTeW1ib2xbXzB4ZDRhNzAzKDB4M2EzKV0gfHwgU3ltYm9sWyJmb3IiXSgiU3ltYm9sLm1ldGFkYXRhIikKICAgICAgICAgIF0gPSBfMHgzMzYyOTcpOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyNmY1YTgoXzB4NGE0NWRhLCBfMHgzY2ZmNTApIHsKICAgICAgcmV0dXJuIGZ1bmN0aW9uIChfMHgzNDYwOTgpIHsKICAgICAgICB2YXIgXzB4MzMyMTFiID0gd18weDI1ZjM7CiAgICAgICAgXzB4MWZjYTRmKF8weDNjZmY1MCwgImFkZEluaXRpYWxpemVyIiksCiAgICAgICAgICBfMHgzY2NjMTYoXzB4MzQ2MDk4LCBfMHgzMzIxMWIoMHgzYmEpKSwKICAgICAgICAgIF8weDRhNDVkYVtfMHgzMzIxMWIoMHgzNmUpXShfMHgzNDYwOTgpOwogICAgICB9OwogICAgfQogICAgZnVuY3Rpb24gXzB4MmJiNThmKAogICAgICBfMHgyNTY4MjksCiAgICAgIF8weDQ4MTI1ZCwKICAgICAgXzB4M2VmMjdjLAogICAgICBfMHgyYTJiZDQsCiAgICAgIF8weDM2ODhkYywKICAgICAgXzB4MzQ4ZTQzLAogICAgICBfMHg1NTlkOTIsCiAgICAgIF8weDVhN2JhNCwKICAgICAgXzB4OWRhMWZlCiAgICApIHsKICAgICAgdmFyIF8weDJhNzljNyA9IHdfMHgyNWYzLAogICAgICAgIF8weDJlMzU3NzsKICAgICAgc3dpdGNoIChfMHgzNDhlNDMpIHsKICAgICAgICBjYXNlIDB4ZjMxICsgLTB4MyAqIDB4MmRkICsgLTB4Njk5OgogICAgICAgICAgXzB4MmUzNTc3ID0gXzB4MmE3OWM3KDB4MWI5KTsKICAgICAgICAgIGJyZWFrOwogICAgICAgIGNhc2UgMHgyNjlkICsgLTB4MTI5MSArIC0weDE0MGE6CiAgICAgICAgICBfMHgyZTM1NzcgPSBfMHgyYTc5YzcoMHgyNWEpOwogICAgICAgICAgYnJlYWs7CiAgICAgICAgY2FzZSAweDI0ZiAqIC0weDkgKyAweDEyYjMgKyAweDIxNzoKICAgICAgICAgIF8weDJlMzU3NyA9IF8weDJhNzljNygweDE4MSk7CiAgICAgICAgICBicmVhazsKICAgICAgICBjYXNlIDB4ZWU5ICsgLTB4ZTNiICogMHgxICsgLTB4YWE6CiAgICAgICAgICBfMHgyZTM1NzcgPSBfMHgyYTc5YzcoMHgzNWQpOwogICAgICAgICAgYnJlYWs7CiAgICAgICAgZGVmYXVsdDoKICAgICAgICAgIF8weDJlMzU3NyA9IF8weDJhNzljNygweDIzYyk7CiAgICAgIH0KICAgICAgdmFyIF8weDEyYTBjMCwKICAgICAgICBfMHg0MzNjMDAsCiAgICAgICAgXzB4MzdmNmE4ID0gewogICAgICAgICAga2luZDogXzB4MmUzNTc3LAogICAgICAgICAgbmFtZTogXzB4NWE3YmE0ID8gIiMiICsgXzB4NDgxMjVkIDogXzB4NDgxMjVkLAogICAgICAgICAgaXNTdGF0aWM6IF8weDU1OWQ5MiwKICAgICAgICAgIGlzUHJpdmF0ZTogXzB4NWE3YmE0LAogICAgICAgIH0sCiAgICAgICAgXzB4NzE3MzFhID0gewogICAgICAgICAgdjogISgtMHgxYjE2ICogLTB4MSArIDB4MSAqIDB4MWZlMSArIC0weDIgKiAweDFkN2IpLAogICAgICAgIH07CiAgICAgIGlmICgKICAgICAgICAoMHgxNWUwICsgLTB4ZGZlICsgLTB4N2UyICE9PSBfMHgzNDhlNDMgJiYKICAgICAgICAgIChfMHgzN2Y2YThbImFkZEluaXRpYWxpemVyIl0gPSBfMHgyNmY1YTgoXzB4MzY4OGRjLCBfMHg3MTczMWEpKSwKICAgICAgICBfMHg1YTdiYTQpCiAgICAgICkgewogICAgICAgIChfMHgxMmEwYzAgPSAtMHgyICogMHhkNjkgKyAweDJhMSAqIDB4MSArIDB4MTgzMyksCiAgICAgICAgICAoXzB4NDMzYzAwID0gU3ltYm9sKF8weDQ4MTI1ZCkpOwogICAgICAgIHZhciBfMHgxODg1N2IgPSB7fTsKICAgICAgICAweDJiICsgMHg5ZWYgKiAweDEgKyAtMHgxICogMHhhMWEgPT09IF8weDM0OGU0MwogICAgICAgICAgPyAoKF8weDE4ODU3YltfMHgyYTc5YzcoMHgzMmIpXSA9IF8weDNlZjI3Y1tfMHgyYTc5YzcoMHgzMmIpXSksCiAgICAgICAgICAgIChfMHgxODg1N2JbInNldCJdID0gXzB4M2VmMjdjWyJzZXQiXSkpCiAgICAgICAgICA6IC0weDIgKiAweGQwNiArIDB4MTgxNiArIDB4MWY4ID09PSBfMHgzNDhlNDMKICAgICAgICAgID8gKF8weDE4ODU3YltfMHgyYTc5YzcoMHgzMmIpXSA9IGZ1bmN0aW9uICgpIHsKICAgICAgICAgICAgICB2YXIgXzB4MTQ2MDRiID0gXzB4MmE3OWM3OwogICAgICAgICAgICAgIHJldHVybiBfMHgzZWYyN2NbXzB4MTQ2MDRiKDB4MmU0KV07CiAgICAgICAgICAgIH0pCiAgICAgICAgICA6ICgoMHg2YmMgKyAweDEgKiAweDIwOTUgKyAweDEwICogLTB4Mjc1ICE9PSBfMHgzNDhlNDMgJiYKICAgICAgICAgICAgICAtMHgxMjA3ICsgMHgzMWYgKyAweDEzICogMHhjOSAhPT0gXzB4MzQ4ZTQzKSB8fAogICAgICAgICAgICAgIChfMHgxODg1N2JbXzB4MmE3OWM3KDB4MzJiKV0gPSBmdW5jdGlvbiAoKSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4MjkwNDIyID0gXzB4MmE3OWM3OwogICAgICAgICAgICAgICAgcmV0dXJuIF8weDNlZjI3Y1tfMHgyOTA0MjIoMHgzMmIpXVtfMHgyOTA0MjIoMHgzMzQpXSh0aGlzKTsKICAgICAgICAgICAgICB9KSwKICAgICAgICAgICAgKDB4MTI5NiArIC0weDE0ODEgKyAweDFlYyAhPT0gXzB4MzQ4ZTQzICYmCiAgICAgICAgICAgICAgLTB4MTg5MiArIC0weGZhNyArIDB4MjgzZCAqIDB4MSAhPT0gXzB4MzQ4ZTQzKSB8fAogICAgICAgICAgICAgIChfMHgxODg1N2JbXzB4MmE3OWM3KDB4MWU0KV0gPSBmdW5jdGlvbiAoXzB4NGUxOGI4KSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4N2U3ODgzID0gXzB4MmE3OWM3OwogICAgICAgICAgICAgICAgXzB4M2VmMjdjWyJzZXQiXVtfMHg3ZTc4ODMoMHgzMzQpXSh0aGlzLCBfMHg0ZTE4YjgpOwogICAgICAgICAgICAgIH0pKSwKICAgICAgICAgIChfMHgzN2Y2YThbXzB4MmE3OWM3KDB4MWQwKV0gPSBfMHgxODg1N2IpOwogICAgICB9IGVsc2UgKF8weDEyYTBjMCA9IDB4Y2EwICogMHgxICsgMHg4MyArIC0weDUyICogMHgyOSksIChfMHg0MzNjMDAgPSBfMHg0ODEyNWQpOwogICAgICB0cnkgewogICAgICAgIHJldHVybiBfMHgyNTY4MjkoCiAgICAgICAgICBfMHg5ZGExZmUsCiAgICAgICAgICBPYmplY3RbXzB4MmE3OWM3KDB4MmEwKV0oCiAgICAgICAgICAgIF8weDM3ZjZhOCwKICAgICAgICAgICAgXzB4MWQ5ODY3KF8weDJhMmJkNCwgXzB4MTJhMGMwLCBfMHg0MzNjMDAsIF8weDcxNzMxYSkKICAgICAgICAgICkKICAgICAgICApOwogICAgICB9IGZpbmFsbHkgewogICAgICAgIF8weDcxNzMxYVsidiJdID0gISgweDZhZCArIC0weDE3YTkgKyAweDEwZmMpOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxZmNhNGYoXzB4MzIyOTgzLCBfMHg1NDQ2NjcpIHsKICAgICAgdmFyIF8weDQzYWNiOSA9IHdfMHgyNWYzOwogICAgICBpZiAoXzB4MzIyOTgzWyJ2Il0pCiAgICAgICAgdGhyb3cgbmV3IEVycm9yKF8weDQzYWNiOSgweDIxNCkgKyBfMHg1NDQ2NjcgKyBfMHg0M2FjYjkoMHgxNjgpKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDUyNWRjMyhfMHgzZWY1NzcpIHsKICAgICAgdmFyIF8weDQyZDllOSA9IHdfMHgyNWYzOwogICAgICBpZiAoXzB4NDJkOWU5KDB4MmVkKSAhPSB0eXBlb2YgXzB4M2VmNTc3KQogICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4NDJkOWU5KDB4MmU3KSArIF8weDNlZjU3Nyk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzY2NjMTYoXzB4NTZjZDA0LCBfMHg1NmFiMjkpIHsKICAgICAgdmFyIF8weDEyZmYwOCA9IHdfMHgyNWYzOwogICAgICBpZiAoImZ1bmN0aW9uIiAhPSB0eXBlb2YgXzB4NTZjZDA0KQogICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4NTZhYjI5ICsgXzB4MTJmZjA4KDB4MmY4KSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzMmRmZDQoXzB4NDM4NjllLCBfMHg0MzQzMDcpIHsKICAgICAgdmFyIF8weDNmYzhiOSA9IHdfMHgyNWYzLAogICAgICAgIF8weGQ3YjAwMiA9IHR5cGVvZiBfMHg0MzQzMDc7CiAgICAgIGlmICgtMHgxMTE2ICsgMHgxODNmICsgMHgyICogLTB4Mzk0ID09PSBfMHg0Mzg2OWUpIHsKICAgICAgICBpZiAoXzB4M2ZjOGI5KDB4MTdkKSAhPT0gXzB4ZDdiMDAyIHx8IG51bGwgPT09IF8weDQzNDMwNykKICAgICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4M2ZjOGI5KDB4MWZkKSk7CiAgICAgICAgdm9pZCAoLTB4MzllICogLTB4OSArIC0weDEgKiAweDEyNDEgKyAtMHg3ICogMHgyMGIpICE9PQogICAgICAgICAgXzB4NDM0MzA3W18weDNmYzhiOSgweDMyYildICYmCiAgICAgICAgICBfMHgzY2NjMTYoXzB4NDM0MzA3W18weDNmYzhiOSgweDMyYildLCBfMHgzZmM4YjkoMHgxNzApKSwKICAgICAgICAgIHZvaWQgKDB4ZWZmICogMHgxICsgMHgyNjczICsgMHgxICogLTB4MzU3MikgIT09CiAgICAgICAgICAgIF8weDQzNDMwN1tfMHgzZmM4YjkoMHgxZTQpXSAmJgogICAgICAgICAgICBfMHgzY2NjMTYoXzB4NDM0MzA3W18weDNmYzhiOSgweDFlNCldLCBfMHgzZmM4YjkoMHgyMzEpKSwKICAgICAgICAgIHZvaWQgKC0weDE1NTggKyAtMHgxYjQxICogMHgxICsgMHg1NyAqIDB4OGYpICE9PSBfMHg0MzQzMDdbImluaXQiXSAmJgogICAgICAgICAgICBfMHgzY2NjMTYoXzB4NDM0MzA3WyJpbml0Il0sIF8weDNmYzhiOSgweDIyZikpLAogICAgICAgICAgdm9pZCAoLTB4MTQ4ZiArIDB4ZmEzICogMHgxICsgMHg0ZWMpICE9PQogICAgICAgICAgICBfMHg0MzQzMDdbXzB4M2ZjOGI5KDB4MmQwKV0gJiYKICAgICAgICAgICAgXzB4M2NjYzE2KF8weDQzNDMwN1tfMHgzZmM4YjkoMHgyZDApXSwgImFjY2Vzc29yLmluaXRpYWxpemVyIik7CiAgICAgIH0gZWxzZSB7CiAgICAgICAgaWYgKF8weDNmYzhiOSgweDFlZSkgIT09IF8weGQ3YjAwMikKICAgICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoCiAgICAgICAgICAgICgweGYxYSArIDB4Y2UgKiAweDFmICsgLTB4MjgwYyA9PT0gXzB4NDM4NjllCiAgICAgICAgICAgICAgPyBfMHgzZmM4YjkoMHgyM2MpCiAgICAgICAgICAgICAgOiAweDI0MjggKyAtMHg2ICogLTB4NjM1ICsgLTB4NDk1YyA9PT0gXzB4NDM4NjllCiAgICAgICAgICAgICAgPyBfMHgzZmM4YjkoMHgxOWMpCiAgICAgICAgICAgICAgOiBfMHgzZmM4YjkoMHgyNWEpKSArIF8weDNmYzhiOSgweDJjZCkKICAgICAgICAgICk7CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDM3MjEyMChfMHg0MGI0NzYpIHsKICAgICAgdmFyIF8weDNlODMwYyA9IHdfMHgyNWYzLAogICAgICAgIF8weDQ5YzViZTsKICAgICAgcmV0dXJuICgKICAgICAgICBudWxsID09IChfMHg0OWM1YmUgPSBfMHg0MGI0NzZbImluaXQiXSkgJiYKICAgICAgICAgIChfMHg0OWM1YmUgPSBfMHg0MGI0NzZbXzB4M2U4MzBjKDB4MmQwKV0pICYmCiAgICAgICAgICBfMHgzZTgzMGMoMHgzODQpICE9IHR5cGVvZiBjb25zb2xlICYmCiAgICAgICAgICBjb25zb2xlW18weDNlODMwYygweDNiMCldKF8weDNlODMwYygweDMwYikpLAogICAgICAgIF8weDQ5YzViZQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4NDgxYmZlKAogICAgICBfMHg0MDAwNmMsCiAgICAgIF8weGRiZDQ0NCwKICAgICAgXzB4MmMyMWRmLAogICAgICBfMHgyYTRjOTgsCiAgICAgIF8weDQzOGI1MiwKICAgICAgXzB4MTNlMzRkLAogICAgICBfMHg1YWU1NDUsCiAgICAgIF8weGE4MTNmMCwKICAgICAgXzB4NGM0YmZlCiAgICApIHsKICAgICAgdmFyIF8weDJlZTJmZSA9IHdfMHgyNWYzLAogICAgICAgIF8weDJmNDQ2MywKICAgICAgICBfMHg0NzBjZTAsCiAgICAgICAgXzB4NWUwMTE5LAogICAgICAgIF8weDJiMjYxYywKICAgICAgICBfMHg1MmM0MGIsCiAgICAgICAgXzB4NGUwMmNmLAogICAgICAgIF8weDFmYTBhZiA9IF8weDJjMjFkZlstMHg5ODcgKyAweDI3ICogLTB4ZGYgKyAtMHg0MCAqIC0weGFlXTsKICAgICAgaWYgKAogICAgICAgIChfMHg1YWU1NDUKICAgICAgICAgID8gKF8weDJmNDQ2MyA9CiAgICAgICAgICAgICAgLTB4YTg5ICogMHgxICsgLTB4ZDcxICsgMHgxN2ZhID09PSBfMHg0MzhiNTIgfHwKICAgICAgICAgICAgICAtMHgyNzIgKiAtMHhkICsgLTB4MWMgKiAweGIyICsgLTB4YzUxID09PSBfMHg0MzhiNTIKICAgICAgICAgICAgICAgID8gewogICAgICAgICAgICAgICAgICAgIGdldDogXzB4MmMyMWRmWzB4ZWZkICsgMHgyMzJiICsgLTB4MzIyNV0sCiAgICAgICAgICAgICAgICAgICAgc2V0OiBfMHgyYzIxZGZbMHgyMWI1ICogLTB4MSArIC0weDEwMTUgKyAweDMxY2VdLAogICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICA6IDB4MTdlZiArIC0weDFkMyArIDB4MTYxOSAqIC0weDEgPT09IF8weDQzOGI1MgogICAgICAgICAgICAgICAgPyB7CiAgICAgICAgICAgICAgICAgICAgZ2V0OiBfMHgyYzIxZGZbLTB4MWU5MiArIDB4ZmYgKiAtMHhlICsgMHgyYzg3XSwKICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgOiAtMHgyMjExICsgMHgxNTY4ICsgMHhjYWQgPT09IF8weDQzOGI1MgogICAgICAgICAgICAgICAgPyB7CiAgICAgICAgICAgICAgICAgICAgc2V0OiBfMHgyYzIxZGZbLTB4Y2QyICsgMHgxMjZlICsgMHgxICogLTB4NTk5XSwKICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgOiB7CiAgICAgICAgICAgICAgICAgICAgdmFsdWU6IF8weDJjMjFkZlsweDIyOTMgKyAtMHgxODE1ICsgLTB4YTdiICogMHgxXSwKICAgICAgICAgICAgICAgICAgfSkKICAgICAgICAgIDogMHgyM2YxICsgLTB4OTNiICogLTB4NCArIDB4MSAqIC0weDQ4ZGQgIT09IF8weDQzOGI1MiAmJgogICAgICAgICAgICAoXzB4MmY0NDYzID0gT2JqZWN0W18weDJlZTJmZSgweDJhNildKF8weGRiZDQ0NCwgXzB4MmE0Yzk4KSksCiAgICAgICAgLTB4OWE1ICsgMHgyY2MgKiAtMHg1ICsgLTB4YiAqIC0weDIyNiA9PT0gXzB4NDM4YjUyCiAgICAgICAgICA/IChfMHg1ZTAxMTkgPSB7CiAgICAgICAgICAgICAgZ2V0OiBfMHgyZjQ0NjNbImdldCJdLAogICAgICAgICAgICAgIHNldDogXzB4MmY0NDYzW18weDJlZTJmZSgweDFlNCldLAogICAgICAgICAgICB9KQogICAgICAgICAgOiAtMHhiNWMgKyAweDIxMGQgKyAtMHgxYWIgKiAweGQgPT09IF8weDQzOGI1MgogICAgICAgICAgPyAoXzB4NWUwMTE5ID0gXzB4MmY0NDYzW18weDJlZTJmZSgweDJlNCldKQogICAgICAgICAgOiAtMHgxMmUyICogLTB4MiArIDB4MSAqIDB4ODE1ICsgLTB4MmRkNiA9PT0gXzB4NDM4YjUyCiAgICAgICAgICA/IChfMHg1ZTAxMTkgPSBfMHgyZjQ0NjNbImdldCJdKQogICAgICAgICAgOiAweDYgKiAweDE4MiArIDB4MTVmZCArIC0weDFmMDUgKiAweDEgPT09IF8weDQzOGI1MiAmJgogICAgICAgICAgICAoXzB4NWUwMTE5ID0gXzB4MmY0NDYzW18weDJlZTJmZSgweDFlNCldKSwKICAgICAgICBfMHgyZWUyZmUoMHgxZWUpID09IHR5cGVvZiBfMHgxZmEwYWYpCiAgICAgICkKICAgICAgICB2b2lkICgweDEyYjMgKiAtMHgyICsgMHgxMjI5ICogMHgxICsgMHgxMzNkKSAhPT0KICAgICAgICAgIChfMHgyYjI2MWMgPSBfMHgyYmI1OGYoCiAgICAgICAgICAgIF8weDFmYTBhZiwKICAgICAgICAgICAgXzB4MmE0Yzk4LAogICAgICAgICAgICBfMHgyZjQ0NjMsCiAgICAgICAgICAgIF8weGE4MTNmMCwKICAgICAgICAgICAgXzB4NGM0YmZlLAogICAgICAgICAgICBfMHg0MzhiNTIsCiAgICAgICAgICAgIF8weDEzZTM0ZCwKICAgICAgICAgICAgXzB4NWFlNTQ1LAogICAgICAgICAgICBfMHg1ZTAxMTkKICAgICAgICAgICkpICYmCiAgICAgICAgICAoXzB4MzJkZmQ0KF8weDQzOGI1MiwgXzB4MmIyNjFjKSwKICAgICAgICAgIC0weDY1NSArIC0weGI3NSArIDB4OSAqIDB4MWZhID09PSBfMHg0MzhiNTIKICAgICAgICAgICAgPyAoXzB4NDcwY2UwID0gXzB4MmIyNjFjKQogICAgICAgICAgICA6IDB4MjIzOSArIC0weDkgKiAtMHg0MmIgKyAtMHg0N2JiID09PSBfMHg0MzhiNTIKICAgICAgICAgICAgPyAoKF8weDQ3MGNlMCA9IF8weDM3MjEyMChfMHgyYjI2MWMpKSwKICAgICAgICAgICAgICAoXzB4NTJjNDBiID0KICAgICAgICAgICAgICAgIF8weDJiMjYxY1tfMHgyZWUyZmUoMHgzMmIpXSB8fCBfMHg1ZTAxMTlbXzB4MmVlMmZlKDB4MzJiKV0pLAogICAgICAgICAgICAgIChfMHg0ZTAyY2YgPSBfMHgyYjI2MWNbInNldCJdIHx8IF8weDVlMDExOVsic2V0Il0pLAogICAgICAgICAgICAgIChfMHg1ZTAxMTkgPSB7CiAgICAgICAgICAgICAgICBnZXQ6IF8weDUyYzQwYiwKICAgICAgICAgICAgICAgIHNldDogXzB4NGUwMmNmLAogICAgICAgICAgICAgIH0pKQogICAgICAgICAgICA6IChfMHg1ZTAxMTkgPSBfMHgyYjI2MWMpKTsKICAgICAgZWxzZQogICAgICAgIGZvciAoCiAgICAgICAgICB2YXIgXzB4NTgwMWM3ID0KICAgICAgICAgICAgXzB4MWZhMGFmWyJsZW5ndGgiXSAtICgweDI0MzUgKyAweDE4ZDAgKyAweDE2ICogLTB4MmM2KTsKICAgICAgICAgIF8weDU4MDFjNyA+PSAweDNhYiArIDB4NThlICogLTB4NiArIDB4MWRhOTsKICAgICAgICAgIF8weDU4MDFjNy0tCiAgICAgICAgKSB7CiAgICAgICAgICB2YXIgXzB4MmM5ZWU1OwogICAgICAgICAgdm9pZCAoMHgxMSAqIC0weDIyICsgLTB4MjkgKiAtMHg0NSArIDB4OGNiICogLTB4MSkgIT09CiAgICAgICAgICAgIChfMHgyYjI2MWMgPSBfMHgyYmI1OGYoCiAgICAgICAgICAgICAgXzB4MWZhMGFmW18weDU4MDFjN10sCiAgICAgICAgICAgICAgXzB4MmE0Yzk4LAogICAgICAgICAgICAgIF8weDJmNDQ2MywKICAgICAgICAgICAgICBfMHhhODEzZjAsCiAgICAgICAgICAgICAgXzB4NGM0YmZlLAogICAgICAgICAgICAgIF8weDQzOGI1MiwKICAgICAgICAgICAgICBfMHgxM2UzNGQsCiAgICAgICAgICAgICAgXzB4NWFlNTQ1LAogICAgICAgICAgICAgIF8weDVlMDExOQogICAgICAgICAgICApKSAmJgogICAgICAgICAgICAoXzB4MzJkZmQ0KF8weDQzOGI1MiwgXzB4MmIyNjFjKSwKICAgICAgICAgICAgLTB4MjIwZSArIDB4MyAqIDB4NGQ1ICsgMHgxMzhmID09PSBfMHg0MzhiNTIKICAgICAgICAgICAgICA/IChfMHgyYzllZTUgPSBfMHgyYjI2MWMpCiAgICAgICAgICAgICAgOiAtMHgyICogLTB4MTI4MSArIDB4NDhmICogMHg3ICsgLTB4NDRlYSA9PT0gXzB4NDM4YjUyCiAgICAgICAgICAgICAgPyAoKF8weDJjOWVlNSA9IF8weDM3MjEyMChfMHgyYjI2MWMpKSwKICAgICAgICAgICAgICAgIChfMHg1MmM0MGIgPQogICAgICAgICAgICAgICAgICBfMHgyYjI2MWNbXzB4MmVlMmZlKDB4MzJiKV0gfHwgXzB4NWUwMTE5W18weDJlZTJmZSgweDMyYildKSwKICAgICAgICAgICAgICAgIChfMHg0ZTAyY2YgPQogICAgICAgICAgICAgICAgICBfMHgyYjI2MWNbXzB4MmVlMmZlKDB4MWU0KV0gfHwgXzB4NWUwMTE5W18weDJlZTJmZSgweDFlNCldKSwKICAgICAgICAgICAgICAgIChfMHg1ZTAxMTkgPSB7CiAgICAgICAgICAgICAgICAgIGdldDogXzB4NTJjNDBiLAogICAgICAgICAgICAgICAgICBzZXQ6IF8weDRlMDJjZiwKICAgICAgICAgICAgICAgIH0pKQogICAgICAgICAgICAgIDogKF8weDVlMDExOSA9IF8weDJiMjYxYyksCiAgICAgICAgICAgIHZvaWQgKDB4MjA0YyArIC0weDI2MTggKyAweDcgKiAweGQ0KSAhPT0gXzB4MmM5ZWU1ICYmCiAgICAgICAgICAgICAgKHZvaWQgKDB4M2IzICogMHg5ICsgLTB4MjcwOSArIDB4NjkgKiAweGUpID09PSBfMHg0NzBjZTAKICAgICAgICAgICAgICAgID8gKF8weDQ3MGNlMCA9IF8weDJjOWVlNSkKICAgICAgICAgICAgICAgIDogXzB4MmVlMmZlKDB4MWVlKSA9PSB0eXBlb2YgXzB4NDcwY2UwCiAgICAgICAgICAgICAgICA/IChfMHg0NzBjZTAgPSBbXzB4NDcwY2UwLCBfMHgyYzllZTVdKQogICAgICAgICAgICAgICAgOiBfMHg0NzBjZTBbInB1c2giXShfMHgyYzllZTUpKSk7CiAgICAgICAgfQogICAgICBpZiAoCiAgICAgICAgLTB4MjM2YyArIDB4YmI4ICsgMHgxN2I0ID09PSBfMHg0MzhiNTIgfHwKICAgICAgICAweDEgKiAweDEzZTUgKyAtMHg3MyAqIC0weGQgKyAtMHgxICogMHgxOWJiID09PSBfMHg0MzhiNTIKICAgICAgKSB7CiAgICAgICAgaWYgKHZvaWQgKDB4MjEzZSArIDB4ZWYgKyAtMHgyMjJkKSA9PT0gXzB4NDcwY2UwKQogICAgICAgICAgXzB4NDcwY2UwID0gZnVuY3Rpb24gKF8weDJmM2E0NywgXzB4Mjk4NzNlKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgyOTg3M2U7CiAgICAgICAgICB9OwogICAgICAgIGVsc2UgewogICAgICAgICAgaWYgKF8weDJlZTJmZSgweDFlZSkgIT0gdHlwZW9mIF8weDQ3MGNlMCkgewogICAgICAgICAgICB2YXIgXzB4NDFkM2IwID0gXzB4NDcwY2UwOwogICAgICAgICAgICBfMHg0NzBjZTAgPSBmdW5jdGlvbiAoXzB4NDM0YjRiLCBfMHg1ZjQ5ZTQpIHsKICAgICAgICAgICAgICB2YXIgXzB4NDYzOTgwID0gXzB4MmVlMmZlOwogICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICB2YXIgXzB4OTlkNmMwID0gXzB4NWY0OWU0LAogICAgICAgICAgICAgICAgICBfMHgyOWJhOTcgPSAtMHgxMjBmICogMHgxICsgMHgxMjQxICsgLTB4MSAqIDB4MzI7CiAgICAgICAgICAgICAgICBfMHgyOWJhOTcgPCBfMHg0MWQzYjBbImxlbmd0aCJdOwogICAgICAgICAgICAgICAgXzB4MjliYTk3KysKICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgICBfMHg5OWQ2YzAgPSBfMHg0MWQzYjBbXzB4MjliYTk3XVtfMHg0NjM5ODAoMHgzMzQpXSgKICAgICAgICAgICAgICAgICAgXzB4NDM0YjRiLAogICAgICAgICAgICAgICAgICBfMHg5OWQ2YzAKICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgICAgcmV0dXJuIF8weDk5ZDZjMDsKICAgICAgICAgICAgfTsKICAgICAgICAgIH0gZWxzZSB7CiAgICAgICAgICAgIHZhciBfMHg1OGMwY2QgPSBfMHg0NzBjZTA7CiAgICAgICAgICAgIF8weDQ3MGNlMCA9IGZ1bmN0aW9uIChfMHgxNWFkODYsIF8weDE4ODVjOCkgewogICAgICAgICAgICAgIHJldHVybiBfMHg1OGMwY2RbImNhbGwiXShfMHgxNWFkODYsIF8weDE4ODVjOCk7CiAgICAgICAgICAgIH07CiAgICAgICAgICB9CiAgICAgICAgfQogICAgICAgIF8weDQwMDA2Y1tfMHgyZWUyZmUoMHgzNmUpXShfMHg0NzBjZTApOwogICAgICB9CiAgICAgIDB4MSAqIC0weDI0MSArIDB4ZjRmICsgLTB4ZDBlICE9PSBfMHg0MzhiNTIgJiYKICAgICAgICAoMHgxICogMHgxMGU3ICsgLTB4NDdjICsgLTB4MiAqIDB4NjM1ID09PSBfMHg0MzhiNTIKICAgICAgICAgID8gKChfMHgyZjQ0NjNbXzB4MmVlMmZlKDB4MzJiKV0gPSBfMHg1ZTAxMTlbXzB4MmVlMmZlKDB4MzJiKV0pLAogICAgICAgICAgICAoXzB4MmY0NDYzW18weDJlZTJmZSgweDFlNCldID0gXzB4NWUwMTE5W18weDJlZTJmZSgweDFlNCldKSkKICAgICAgICAgIDogLTB4NTMgKiAweDZiICsgMHgxNmUgKiAweDggKyAweDE3NDMgPT09IF8weDQzOGI1MgogICAgICAgICAgPyAoXzB4MmY0NDYzW18weDJlZTJmZSgweDJlNCldID0gXzB4NWUwMTE5KQogICAgICAgICAgOiAweDQgKiAtMHg0Y2QgKyAtMHgxICogLTB4MjExYSArIDB4MSAqIC0weGRlMyA9PT0gXzB4NDM4YjUyCiAgICAgICAgICA/IChfMHgyZjQ0NjNbImdldCJdID0gXzB4NWUwMTE5KQogICAgICAgICAgOiAtMHgxZDRiICogMHgxICsgMHgxODUzICsgMHg0ZmMgPT09IF8weDQzOGI1MiAmJgogICAgICAgICAgICAoXzB4MmY0NDYzW18weDJlZTJmZSgweDFlNCldID0gXzB4NWUwMTE5KSwKICAgICAgICBfMHg1YWU1NDUKICAgICAgICAgID8gMHg1ICogLTB4MjggKyAweGNmZCArIC0weGMzNCAqIDB4MSA9PT0gXzB4NDM4YjUyCiAgICAgICAgICAgID8gKF8weDQwMDA2Y1tfMHgyZWUyZmUoMHgzNmUpXShmdW5jdGlvbiAoXzB4MjFhOTdiLCBfMHg1ZWI3OGUpIHsKICAgICAgICAgICAgICAgIHZhciBfMHg0MDg4MGUgPSBfMHgyZWUyZmU7CiAgICAgICAgICAgICAgICByZXR1cm4gXzB4NWUwMTE5W18weDQwODgwZSgweDMyYildW18weDQwODgwZSgweDMzNCldKAogICAgICAgICAgICAgICAgICBfMHgyMWE5N2IsCiAgICAgICAgICAgICAgICAgIF8weDVlYjc4ZQogICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICB9KSwKICAgICAgICAgICAgICBfMHg0MDAwNmNbXzB4MmVlMmZlKDB4MzZlKV0oZnVuY3Rpb24gKF8weDJmYTdkMSwgXzB4MTIwYWIyKSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4MTRiMjJhID0gXzB4MmVlMmZlOwogICAgICAgICAgICAgICAgcmV0dXJuIF8weDVlMDExOVtfMHgxNGIyMmEoMHgxZTQpXVtfMHgxNGIyMmEoMHgzMzQpXSgKICAgICAgICAgICAgICAgICAgXzB4MmZhN2QxLAogICAgICAgICAgICAgICAgICBfMHgxMjBhYjIKICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgICAgfSkpCiAgICAgICAgICAgIDogLTB4NCAqIDB4NjRjICsgLTB4MSAqIDB4ZTU0ICsgMHgxM2MzICogMHgyID09PSBfMHg0MzhiNTIKICAgICAgICAgICAgPyBfMHg0MDAwNmNbInB1c2giXShfMHg1ZTAxMTkpCiAgICAgICAgICAgIDogXzB4NDAwMDZjW18weDJlZTJmZSgweDM2ZSldKGZ1bmN0aW9uIChfMHhjYjA4YWYsIF8weDE1NmRlMSkgewogICAgICAgICAgICAgICAgdmFyIF8weDMyN2VmNCA9IF8weDJlZTJmZTsKICAgICAgICAgICAgICAgIHJldHVybiBfMHg1ZTAxMTlbXzB4MzI3ZWY0KDB4MzM0KV0oXzB4Y2IwOGFmLCBfMHgxNTZkZTEpOwogICAgICAgICAgICAgIH0pCiAgICAgICAgICA6IE9iamVjdFtfMHgyZWUyZmUoMHgxNzUpXShfMHhkYmQ0NDQsIF8weDJhNGM5OCwgXzB4MmY0NDYzKSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHhhNmJjOWUoXzB4NGNlYjJjLCBfMHgxYjk5ZTcsIF8weGE4YWZlYywgXzB4MTlmZGM2LCBfMHg1MDE2MzUpIHsKICAgICAgdmFyIF8weDRjMDUzMiA9IHdfMHgyNWYzOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHhjZDc3ZmEsCiAgICAgICAgICBfMHgyOWQ4ZWUsCiAgICAgICAgICBfMHgxODY1YjAgPSBuZXcgTWFwKCksCiAgICAgICAgICBfMHg0YjkyNzcgPSBuZXcgTWFwKCksCiAgICAgICAgICBfMHhiYjMwODYgPSAweDggKiAweDVlICsgMHgxZjc5ICsgLTB4MTcgKiAweDE3ZjsKICAgICAgICBfMHhiYjMwODYgPCBfMHg1MDE2MzVbXzB4NGMwNTMyKDB4MjU5KV07CiAgICAgICAgXzB4YmIzMDg2KysKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDU4Yzg2NSA9IF8weDUwMTYzNVtfMHhiYjMwODZdOwogICAgICAgIGlmIChBcnJheVsiaXNBcnJheSJdKF8weDU4Yzg2NSkpIHsKICAgICAgICAgIHZhciBfMHgyMDNiMDYsCiAgICAgICAgICAgIF8weDQwNjlhZSwKICAgICAgICAgICAgXzB4NDc5OTI1LAogICAgICAgICAgICBfMHgyY2NmNmUgPSBfMHg1OGM4NjVbLTB4M2Y0ICsgLTB4MWNjNCArIC0weDEgKiAtMHgyMGI5XSwKICAgICAgICAgICAgXzB4MTM4ZjY3ID0gXzB4NThjODY1WzB4MTdiNyArIDB4MSAqIDB4MTUyNSArIC0weDJjZGFdLAogICAgICAgICAgICBfMHhmMDBlNTggPQogICAgICAgICAgICAgIF8weDU4Yzg2NVtfMHg0YzA1MzIoMHgyNTkpXSA+CiAgICAgICAgICAgICAgLTB4OWY1ICsgLTB4ZCAqIC0weDEwMyArIC0weDUgKiAweGEzLAogICAgICAgICAgICBfMHgzNTYzNDQgPSBfMHgyY2NmNmUgPj0gLTB4MTRjYyArIC0weGUwMiArIDB4NmY3ICogMHg1OwogICAgICAgICAgaWYgKAogICAgICAgICAgICAoXzB4MzU2MzQ0CiAgICAgICAgICAgICAgPyAoKF8weDIwM2IwNiA9IF8weDFiOTllNyksCiAgICAgICAgICAgICAgICAoXzB4NDA2OWFlID0gXzB4MTlmZGM2KSwKICAgICAgICAgICAgICAgIDB4NyAqIC0weDNjNyArIC0weDIyNWUgKyAweDNjY2YgIT0KICAgICAgICAgICAgICAgICAgKF8weDJjY2Y2ZSAtPSAtMHhkZiAqIDB4MTcgKyAtMHhiMGMgKyAweDFmMWEpICYmCiAgICAgICAgICAgICAgICAgIChfMHg0Nzk5MjUgPSBfMHgyOWQ4ZWUgPSBfMHgyOWQ4ZWUgfHwgW10pKQogICAgICAgICAgICAgIDogKChfMHgyMDNiMDYgPSBfMHgxYjk5ZTdbXzB4NGMwNTMyKDB4MzQ0KV0pLAogICAgICAgICAgICAgICAgKF8weDQwNjlhZSA9IF8weGE4YWZlYyksCiAgICAgICAgICAgICAgICAtMHhjMGMgKyAweDFhOGUgKyAtMHgyICogMHg3NDEgIT09IF8weDJjY2Y2ZSAmJgogICAgICAgICAgICAgICAgICAoXzB4NDc5OTI1ID0gXzB4Y2Q3N2ZhID0gXzB4Y2Q3N2ZhIHx8IFtdKSksCiAgICAgICAgICAgIC0weDEzNWIgKyAweGJhNiArIC0weDdiNSAqIC0weDEgIT09IF8weDJjY2Y2ZSAmJiAhXzB4ZjAwZTU4KQogICAgICAgICAgKSB7CiAgICAgICAgICAgIHZhciBfMHg1ZWY5ZjUgPSBfMHgzNTYzNDQgPyBfMHg0YjkyNzcgOiBfMHgxODY1YjAsCiAgICAgICAgICAgICAgXzB4NGZmMTYxID0KICAgICAgICAgICAgICAgIF8weDVlZjlmNVtfMHg0YzA1MzIoMHgzMmIpXShfMHgxMzhmNjcpIHx8CiAgICAgICAgICAgICAgICAweDIgKiAweDI3YiArIDB4MTM3ICogMHgxZCArIC0weDI4MzE7CiAgICAgICAgICAgIGlmICgKICAgICAgICAgICAgICAhKC0weGVhNCArIDB4MjE3OCArIDB4OTZhICogLTB4MikgPT09IF8weDRmZjE2MSB8fAogICAgICAgICAgICAgICgtMHgxZGNlICsgMHgyNDVkICsgLTB4MzQ2ICogMHgyID09PSBfMHg0ZmYxNjEgJiYKICAgICAgICAgICAgICAgIC0weDYgKiAtMHgzOGYgKyAtMHg0ICogMHgxNzkgKyAweGY3MiAqIC0weDEgIT09IF8weDJjY2Y2ZSkgfHwKICAgICAgICAgICAgICAoMHgxMjY1ICsgLTB4NDAgKiAweDZhICsgLTB4MjEgKiAtMHgzZiA9PT0gXzB4NGZmMTYxICYmCiAgICAgICAgICAgICAgICAtMHgxNGJmICsgLTB4MWZhNiArIDB4MzQ2OCAhPT0gXzB4MmNjZjZlKQogICAgICAgICAgICApCiAgICAgICAgICAgICAgdGhyb3cgbmV3IEVycm9yKF8weDRjMDUzMigweDM1MSkgKyBfMHgxMzhmNjcpOwogICAgICAgICAgICAhXzB4NGZmMTYxICYmIF8weDJjY2Y2ZSA+IC0weDg5NSAqIDB4MSArIDB4OWZhICsgLTB4MTYzCiAgICAgICAgICAgICAgPyBfMHg1ZWY5ZjVbXzB4NGMwNTMyKDB4MWU0KV0oXzB4MTM4ZjY3LCBfMHgyY2NmNmUpCiAgICAgICAgICAgICAgOiBfMHg1ZWY5ZjVbInNldCJdKAogICAgICAgICAgICAgICAgICBfMHgxMzhmNjcsCiAgICAgICAgICAgICAgICAgICEoLTB4MWEgKiAweDEyICsgMHhhMSAqIDB4MWQgKyAtMHgxMDY5ICogMHgxKQogICAgICAgICAgICAgICAgKTsKICAgICAgICAgIH0KICAgICAgICAgIF8weDQ4MWJmZSgKICAgICAgICAgICAgXzB4NGNlYjJjLAogICAgICAgICAgICBfMHgyMDNiMDYsCiAgICAgICAgICAgIF8weDU4Yzg2NSwKICAgICAgICAgICAgXzB4MTM4ZjY3LAogICAgICAgICAgICBfMHgyY2NmNmUsCiAgICAgICAgICAgIF8weDM1NjM0NCwKICAgICAgICAgICAgXzB4ZjAwZTU4LAogICAgICAgICAgICBfMHg0MDY5YWUsCiAgICAgICAgICAgIF8weDQ3OTkyNQogICAgICAgICAgKTsKICAgICAgICB9CiAgICAgIH0KICAgICAgXzB4MzY1N2UyKF8weDRjZWIyYywgXzB4Y2Q3N2ZhKSwgXzB4MzY1N2UyKF8weDRjZWIyYywgXzB4MjlkOGVlKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDM2NTdlMihfMHgyN2Y3MmMsIF8weDgyMDZlMSkgewogICAgICB2YXIgXzB4NDY5MGYxID0gd18weDI1ZjM7CiAgICAgIF8weDgyMDZlMSAmJgogICAgICAgIF8weDI3ZjcyY1tfMHg0NjkwZjEoMHgzNmUpXShmdW5jdGlvbiAoXzB4NWE0NTlhKSB7CiAgICAgICAgICB2YXIgXzB4MjVkODMyID0gXzB4NDY5MGYxOwogICAgICAgICAgZm9yICgKICAgICAgICAgICAgdmFyIF8weDNhYmU4ZCA9IC0weDJkOCArIC0weDM4YyArIDB4NjY0OwogICAgICAgICAgICBfMHgzYWJlOGQgPCBfMHg4MjA2ZTFbImxlbmd0aCJdOwogICAgICAgICAgICBfMHgzYWJlOGQrKwogICAgICAgICAgKQogICAgICAgICAgICBfMHg4MjA2ZTFbXzB4M2FiZThkXVtfMHgyNWQ4MzIoMHgzMzQpXShfMHg1YTQ1OWEpOwogICAgICAgICAgcmV0dXJuIF8weDVhNDU5YTsKICAgICAgICB9KTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDVmMzY3NihfMHg1YzEzYjUsIF8weDQ3NzllZSwgXzB4MzQ3OWM4LCBfMHgzY2I4NDApIHsKICAgICAgdmFyIF8weDVkZjZmNSA9IHdfMHgyNWYzOwogICAgICBpZiAoXzB4M2NiODQwWyJsZW5ndGgiXSA+IC0weDE3NDQgKyAtMHhmYiAqIDB4ZCArIDB4MjQwMykgewogICAgICAgIGZvciAoCiAgICAgICAgICB2YXIgXzB4M2M0YzIxID0gW10sCiAgICAgICAgICAgIF8weDUwNDQzNiA9IF8weDQ3NzllZSwKICAgICAgICAgICAgXzB4MWI1ZDhiID0gXzB4NDc3OWVlWyJuYW1lIl0sCiAgICAgICAgICAgIF8weDM4Njg5ZCA9CiAgICAgICAgICAgICAgXzB4M2NiODQwW18weDVkZjZmNSgweDI1OSldIC0gKC0weDFmNWUgKyAweDFlMmMgKiAweDEgKyAweDEzMyk7CiAgICAgICAgICBfMHgzODY4OWQgPj0gMHg4NzggKyAtMHgxMjY5ICogMHgyICsgMHgxYzVhOwogICAgICAgICAgXzB4Mzg2ODlkLS0KICAgICAgICApIHsKICAgICAgICAgIHZhciBfMHgyYmJmMzcgPSB7CiAgICAgICAgICAgIHY6ICEoMHgxICogLTB4MTdkYyArIC0weDFmNCAqIC0weDEwICsgLTB4M2QgKiAweDFmKSwKICAgICAgICAgIH07CiAgICAgICAgICB0cnkgewogICAgICAgICAgICB2YXIgXzB4MTc1YTYxID0gT2JqZWN0WyJhc3NpZ24iXSgKICAgICAgICAgICAgICAgIHsKICAgICAgICAgICAgICAgICAga2luZDogXzB4NWRmNmY1KDB4MTljKSwKICAgICAgICAgICAgICAgICAgbmFtZTogXzB4MWI1ZDhiLAogICAgICAgICAgICAgICAgICBhZGRJbml0aWFsaXplcjogXzB4MjZmNWE4KF8weDNjNGMyMSwgXzB4MmJiZjM3KSwKICAgICAgICAgICAgICAgIH0sCiAgICAgICAgICAgICAgICBfMHgxZDk4NjcoCiAgICAgICAgICAgICAgICAgIF8weDM0NzljOCwKICAgICAgICAgICAgICAgICAgLTB4MWRmYSArIC0weDE1MTcgKyAweDMzMTEsCiAgICAgICAgICAgICAgICAgIF8weDFiNWQ4YiwKICAgICAgICAgICAgICAgICAgXzB4MmJiZjM3CiAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgKSwKICAgICAgICAgICAgICBfMHgyM2ZmZjcgPSBfMHgzY2I4NDBbXzB4Mzg2ODlkXShfMHg1MDQ0MzYsIF8weDE3NWE2MSk7CiAgICAgICAgICB9IGZpbmFsbHkgewogICAgICAgICAgICBfMHgyYmJmMzdbInYiXSA9ICEoMHgxICogLTB4MWU1ZCArIC0weGJhNyAqIDB4MiArIDB4MzVhYik7CiAgICAgICAgICB9CiAgICAgICAgICB2b2lkICgtMHgyYmYgKyAtMHgxMDNkICogLTB4MSArIC0weGQ3ZSkgIT09IF8weDIzZmZmNyAmJgogICAgICAgICAgICAoXzB4MzJkZmQ0KDB4Y2YzICsgLTB4OWY4ICsgLTB4MmYxLCBfMHgyM2ZmZjcpLAogICAgICAgICAgICAoXzB4NTA0NDM2ID0gXzB4MjNmZmY3KSk7CiAgICAgICAgfQogICAgICAgIF8weDVjMTNiNVtfMHg1ZGY2ZjUoMHgzNmUpXShfMHg1MDQ0MzYsIGZ1bmN0aW9uICgpIHsKICAgICAgICAgIHZhciBfMHg1MmIxYzAgPSBfMHg1ZGY2ZjU7CiAgICAgICAgICBmb3IgKAogICAgICAgICAgICB2YXIgXzB4NGYwZTk1ID0gMHgxOCAqIDB4NTcgKyAweDlmMiAqIDB4MyArIC0weDI1ZmU7CiAgICAgICAgICAgIF8weDRmMGU5NSA8IF8weDNjNGMyMVtfMHg1MmIxYzAoMHgyNTkpXTsKICAgICAgICAgICAgXzB4NGYwZTk1KysKICAgICAgICAgICkKICAgICAgICAgICAgXzB4M2M0YzIxW18weDRmMGU5NV1bXzB4NTJiMWMwKDB4MzM0KV0oXzB4NTA0NDM2KTsKICAgICAgICB9KTsKICAgICAgfQogICAgfQogICAgZnVuY3Rpb24gXzB4NTFiZTNmKF8weDQ0NzcyZSwgXzB4NTI0M2NhLCBfMHgzOThmYTYpIHsKICAgICAgdmFyIF8weDIzNGE1NCA9IHdfMHgyNWYzLAogICAgICAgIF8weDEzYmE1OSA9IFtdLAogICAgICAgIF8weDNmOGFhOSA9IHt9LAogICAgICAgIF8weDEyOTUwNiA9IHt9OwogICAgICByZXR1cm4gKAogICAgICAgIF8weGE2YmM5ZShfMHgxM2JhNTksIF8weDQ0NzcyZSwgXzB4MTI5NTA2LCBfMHgzZjhhYTksIF8weDUyNDNjYSksCiAgICAgICAgXzB4NDNiY2U0KF8weDQ0NzcyZVtfMHgyMzRhNTQoMHgzNDQpXSwgXzB4MTI5NTA2KSwKICAgICAgICBfMHg1ZjM2NzYoXzB4MTNiYTU5LCBfMHg0NDc3MmUsIF8weDNmOGFhOSwgXzB4Mzk4ZmE2KSwKICAgICAgICBfMHg0M2JjZTQoXzB4NDQ3NzJlLCBfMHgzZjhhYTkpLAogICAgICAgIF8weDEzYmE1OQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MjgxYjNiKCkgewogICAgICBmdW5jdGlvbiBfMHg1NTZhYWMoXzB4ZTZmMDRjLCBfMHgyY2YxNTUpIHsKICAgICAgICByZXR1cm4gZnVuY3Rpb24gKF8weDRlY2MzNykgewogICAgICAgICAgdmFyIF8weDI1M2RhYSA9IHdfMHgyNWYzOwogICAgICAgICAgIShmdW5jdGlvbiAoXzB4MTA5YTgzLCBfMHg1OTkxZmUpIHsKICAgICAgICAgICAgdmFyIF8weDExYTJmYyA9IHdfMHgyNWYzOwogICAgICAgICAgICBpZiAoXzB4MTA5YTgzWyJ2Il0pIHRocm93IG5ldyBFcnJvcihfMHgxMWEyZmMoMHgyNTcpKTsKICAgICAgICAgIH0pKF8weDJjZjE1NSksCiAgICAgICAgICAgIF8weDMwMjBkMihfMHg0ZWNjMzcsIF8weDI1M2RhYSgweDNiYSkpLAogICAgICAgICAgICBfMHhlNmYwNGNbXzB4MjUzZGFhKDB4MzZlKV0oXzB4NGVjYzM3KTsKICAgICAgICB9OwogICAgICB9CiAgICAgIGZ1bmN0aW9uIF8weDE5MzA1MCgKICAgICAgICBfMHhjMDk5NWEsCiAgICAgICAgXzB4M2VlMmJiLAogICAgICAgIF8weDMwZTBiNiwKICAgICAgICBfMHhiYTIwOGMsCiAgICAgICAgXzB4MjYyNjQxLAogICAgICAgIF8weDRmYTAwMSwKICAgICAgICBfMHgxYmIwZDUsCiAgICAgICAgXzB4YTZlNTMxCiAgICAgICkgewogICAgICAgIHZhciBfMHgyMDhiYWMgPSB3XzB4MjVmMywKICAgICAgICAgIF8weDU5ZGM3NzsKICAgICAgICBzd2l0Y2ggKF8weDI2MjY0MSkgewogICAgICAgICAgY2FzZSAweDFhZjYgKyAtMHhkMTMgKyAtMHhkZTI6CiAgICAgICAgICAgIF8weDU5ZGM3NyA9ICJhY2Nlc3NvciI7CiAgICAgICAgICAgIGJyZWFrOwogICAgICAgICAgY2FzZSAweGZkYSArIC0weDc2MCArIC0weDg3ODoKICAgICAgICAgICAgXzB4NTlkYzc3ID0gXzB4MjA4YmFjKDB4MjVhKTsKICAgICAgICAgICAgYnJlYWs7CiAgICAgICAgICBjYXNlIDB4MWEgKiAweGI5ICsgMHhjM2YgKyAtMHgxZjA2OgogICAgICAgICAgICBfMHg1OWRjNzcgPSAiZ2V0dGVyIjsKICAgICAgICAgICAgYnJlYWs7CiAgICAgICAgICBjYXNlIC0weGI0MiAqIDB4MyArIC0weDEyZDkgKyAweDM0YTM6CiAgICAgICAgICAgIF8weDU5ZGM3NyA9ICJzZXR0ZXIiOwogICAgICAgICAgICBicmVhazsKICAgICAgICAgIGRlZmF1bHQ6CiAgICAgICAgICAgIF8weDU5ZGM3NyA9IF8weDIwOGJhYygweDIzYyk7CiAgICAgICAgfQogICAgICAgIHZhciBfMHgxYjE2OWYsCiAgICAgICAgICBfMHgzZmFkNGIsCiAgICAgICAgICBfMHgxMDUwY2IgPSB7CiAgICAgICAgICAgIGtpbmQ6IF8weDU5ZGM3NywKICAgICAgICAgICAgbmFtZTogXzB4MWJiMGQ1ID8gIiMiICsgXzB4M2VlMmJiIDogXzB4M2VlMmJiLAogICAgICAgICAgICBzdGF0aWM6IF8weDRmYTAwMSwKICAgICAgICAgICAgcHJpdmF0ZTogXzB4MWJiMGQ1LAogICAgICAgICAgfSwKICAgICAgICAgIF8weDI1Mjc3MiA9IHsKICAgICAgICAgICAgdjogISgweDUgKiAweDRkNSArIC0weDEgKiAweDFkNmUgKyAweDU0NiksCiAgICAgICAgICB9OwogICAgICAgIC0weDIxZmYgKyAtMHgxMjdhICsgLTB4MzQ3OSAqIC0weDEgIT09IF8weDI2MjY0MSAmJgogICAgICAgICAgKF8weDEwNTBjYlsiYWRkSW5pdGlhbGl6ZXIiXSA9IF8weDU1NmFhYyhfMHhiYTIwOGMsIF8weDI1Mjc3MikpLAogICAgICAgICAgLTB4MmM5ICsgLTB4MjcgKyAweDJmMCA9PT0gXzB4MjYyNjQxCiAgICAgICAgICAgID8gXzB4MWJiMGQ1CiAgICAgICAgICAgICAgPyAoKF8weDFiMTY5ZiA9IF8weDMwZTBiNlsiZ2V0Il0pLAogICAgICAgICAgICAgICAgKF8weDNmYWQ0YiA9IF8weDMwZTBiNltfMHgyMDhiYWMoMHgxZTQpXSkpCiAgICAgICAgICAgICAgOiAoKF8weDFiMTY5ZiA9IGZ1bmN0aW9uICgpIHsKICAgICAgICAgICAgICAgICAgcmV0dXJuIHRoaXNbXzB4M2VlMmJiXTsKICAgICAgICAgICAgICAgIH0pLAogICAgICAgICAgICAgICAgKF8weDNmYWQ0YiA9IGZ1bmN0aW9uIChfMHg0MTc1NTUpIHsKICAgICAgICAgICAgICAgICAgdGhpc1tfMHgzZWUyYmJdID0gXzB4NDE3NTU1OwogICAgICAgICAgICAgICAgfSkpCiAgICAgICAgICAgIDogMHgxICogLTB4MWQ2MSArIC0weDEgKiAweDg0MSArIC0weGM4YyAqIC0weDMgPT09IF8weDI2MjY0MQogICAgICAgICAgICA/IChfMHgxYjE2OWYgPSBmdW5jdGlvbiAoKSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4MTk1ZjliID0gXzB4MjA4YmFjOwogICAgICAgICAgICAgICAgcmV0dXJuIF8weDMwZTBiNltfMHgxOTVmOWIoMHgyZTQpXTsKICAgICAgICAgICAgICB9KQogICAgICAgICAgICA6ICgoMHgxICogLTB4MWU0OSArIDB4MSAqIDB4MWVlZiArIDB4MzcgKiAtMHgzICE9PSBfMHgyNjI2NDEgJiYKICAgICAgICAgICAgICAgIDB4MSAqIDB4MjA0YSArIC0weDEzNyAqIC0weGIgKyAtMHgyZGE0ICE9PSBfMHgyNjI2NDEpIHx8CiAgICAgICAgICAgICAgICAoXzB4MWIxNjlmID0gZnVuY3Rpb24gKCkgewogICAgICAgICAgICAgICAgICB2YXIgXzB4M2FkMTE4ID0gXzB4MjA4YmFjOwogICAgICAgICAgICAgICAgICByZXR1cm4gXzB4MzBlMGI2W18weDNhZDExOCgweDMyYildW18weDNhZDExOCgweDMzNCldKHRoaXMpOwogICAgICAgICAgICAgICAgfSksCiAgICAgICAgICAgICAgKDB4NzI5ICsgLTB4N2FlICsgMHgxICogMHg4NiAhPT0gXzB4MjYyNjQxICYmCiAgICAgICAgICAgICAgICAtMHhhICogLTB4MTYxICsgLTB4NTEyICsgLTB4MiAqIDB4NDVhICE9PSBfMHgyNjI2NDEpIHx8CiAgICAgICAgICAgICAgICAoXzB4M2ZhZDRiID0gZnVuY3Rpb24gKF8weDM3YjUyMikgewogICAgICAgICAgICAgICAgICB2YXIgXzB4NTk5NDE2ID0gXzB4MjA4YmFjOwogICAgICAgICAgICAgICAgICBfMHgzMGUwYjZbXzB4NTk5NDE2KDB4MWU0KV1bImNhbGwiXSh0aGlzLCBfMHgzN2I1MjIpOwogICAgICAgICAgICAgICAgfSkpLAogICAgICAgICAgKF8weDEwNTBjYltfMHgyMDhiYWMoMHgxZDApXSA9CiAgICAgICAgICAgIF8weDFiMTY5ZiAmJiBfMHgzZmFkNGIKICAgICAgICAgICAgICA/IHsKICAgICAgICAgICAgICAgICAgZ2V0OiBfMHgxYjE2OWYsCiAgICAgICAgICAgICAgICAgIHNldDogXzB4M2ZhZDRiLAogICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgIDogXzB4MWIxNjlmCiAgICAgICAgICAgICAgPyB7CiAgICAgICAgICAgICAgICAgIGdldDogXzB4MWIxNjlmLAogICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgIDogewogICAgICAgICAgICAgICAgICBzZXQ6IF8weDNmYWQ0YiwKICAgICAgICAgICAgICAgIH0pOwogICAgICAgIHRyeSB7CiAgICAgICAgICByZXR1cm4gXzB4YzA5OTVhKF8weGE2ZTUzMSwgXzB4MTA1MGNiKTsKICAgICAgICB9IGZpbmFsbHkgewogICAgICAgICAgXzB4MjUyNzcyWyJ2Il0gPSAhKC0weDEgKiAweDFlY2YgKyAweDFjZmMgKyAweDFkMyk7CiAgICAgICAgfQogICAgICB9CiAgICAgIGZ1bmN0aW9uIF8weDMwMjBkMihfMHg1Njg0Y2MsIF8weDUxMmI3NykgewogICAgICAgIHZhciBfMHgzYjdlN2EgPSB3XzB4MjVmMzsKICAgICAgICBpZiAoXzB4M2I3ZTdhKDB4MWVlKSAhPSB0eXBlb2YgXzB4NTY4NGNjKQogICAgICAgICAgdGhyb3cgbmV3IFR5cGVFcnJvcihfMHg1MTJiNzcgKyAiXHgyMG11c3RceDIwYmVceDIwYVx4MjBmdW5jdGlvbiIpOwogICAgICB9CiAgICAgIGZ1bmN0aW9uIF8weDEzZDdkZihfMHgyMjc4N2EsIF8weDRhOGRmZSkgewogICAgICAgIHZhciBfMHg5OTRlZmYgPSB3XzB4MjVmMywKICAgICAgICAgIF8weDc1MWVmZiA9IHR5cGVvZiBfMHg0YThkZmU7CiAgICAgICAgaWYgKC0weDY5MCArIDB4MTMzZiAqIC0weDIgKyAweDJkMGYgPT09IF8weDIyNzg3YSkgewogICAgICAgICAgaWYgKF8weDk5NGVmZigweDE3ZCkgIT09IF8weDc1MWVmZiB8fCBudWxsID09PSBfMHg0YThkZmUpCiAgICAgICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4OTk0ZWZmKDB4MWZkKSk7CiAgICAgICAgICB2b2lkICgtMHgyYWYgKyAweDgzOCArIC0weGQgKiAweDZkKSAhPT0gXzB4NGE4ZGZlW18weDk5NGVmZigweDMyYildICYmCiAgICAgICAgICAgIF8weDMwMjBkMihfMHg0YThkZmVbXzB4OTk0ZWZmKDB4MzJiKV0sIF8weDk5NGVmZigweDE3MCkpLAogICAgICAgICAgICB2b2lkICgweDFiICogLTB4NDMgKyAtMHgyNGM4ICsgMHgyYmQ5KSAhPT0KICAgICAgICAgICAgICBfMHg0YThkZmVbXzB4OTk0ZWZmKDB4MWU0KV0gJiYKICAgICAgICAgICAgICBfMHgzMDIwZDIoXzB4NGE4ZGZlW18weDk5NGVmZigweDFlNCldLCBfMHg5OTRlZmYoMHgyMzEpKSwKICAgICAgICAgICAgdm9pZCAoLTB4MmE0ICsgMHgzNSAqIC0weDFkICsgMHg4YTUpICE9PQogICAgICAgICAgICAgIF8weDRhOGRmZVtfMHg5OTRlZmYoMHgzYjkpXSAmJgogICAgICAgICAgICAgIF8weDMwMjBkMihfMHg0YThkZmVbXzB4OTk0ZWZmKDB4M2I5KV0sIF8weDk5NGVmZigweDIyZikpOwogICAgICAgIH0gZWxzZSB7CiAgICAgICAgICBpZiAoImZ1bmN0aW9uIiAhPT0gXzB4NzUxZWZmKQogICAgICAgICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKAogICAgICAgICAgICAgICgtMHg4MDAgKyAweGQgKiAweDc1ICsgMHgyMGYgPT09IF8weDIyNzg3YQogICAgICAgICAgICAgICAgPyBfMHg5OTRlZmYoMHgyM2MpCiAgICAgICAgICAgICAgICA6IDB4MTNhZCArIDB4MWRiMCArIC0weDMxNTMgPT09IF8weDIyNzg3YQogICAgICAgICAgICAgICAgPyBfMHg5OTRlZmYoMHgxOWMpCiAgICAgICAgICAgICAgICA6IF8weDk5NGVmZigweDI1YSkpICsKICAgICAgICAgICAgICAgICJceDIwZGVjb3JhdG9yc1x4MjBtdXN0XHgyMHJldHVyblx4MjBhXHgyMGZ1bmN0aW9uXHgyMG9yXHgyMHZvaWRceDIwMCIKICAgICAgICAgICAgKTsKICAgICAgICB9CiAgICAgIH0KICAgICAgZnVuY3Rpb24gXzB4MzM0NWFiKAogICAgICAgIF8weGM4Y2FkOCwKICAgICAgICBfMHg1ZDAxNWYsCiAgICAgICAgXzB4MzJmMzNmLAogICAgICAgIF8weDVmNTE2OSwKICAgICAgICBfMHgyMzQ1MWYsCiAgICAgICAgXzB4MjU5NWY4LAogICAgICAgIF8weGI4YmRlZSwKICAgICAgICBfMHgyYzNmYjIKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDFkNzRmNiA9IHdfMHgyNWYzLAogICAgICAgICAgXzB4NTg0ZTMzLAogICAgICAgICAgXzB4MTAzYjE4LAogICAgICAgICAgXzB4NWQ2NTIzLAogICAgICAgICAgXzB4MmQxOGExLAogICAgICAgICAgXzB4MmI5ZmQzLAogICAgICAgICAgXzB4MTE0NzllLAogICAgICAgICAgXzB4NGVmM2Q2ID0gXzB4MzJmMzNmWzB4MjNjMyArIC0weDFhODggKyAweDEgKiAtMHg5M2JdOwogICAgICAgIGlmICgKICAgICAgICAgIChfMHhiOGJkZWUKICAgICAgICAgICAgPyAoXzB4NTg0ZTMzID0KICAgICAgICAgICAgICAgIDB4N2VkICogMHgxICsgMHhhYzkgKyAtMHgxMmI2ID09PSBfMHgyMzQ1MWYgfHwKICAgICAgICAgICAgICAgIDB4NCAqIDB4N2Y1ICsgMHgxMWFiICsgMHg3MTIgKiAtMHg3ID09PSBfMHgyMzQ1MWYKICAgICAgICAgICAgICAgICAgPyB7CiAgICAgICAgICAgICAgICAgICAgICBnZXQ6IF8weDMyZjMzZlsweDI2NWUgKiAweDEgKyAtMHgyM2UxICsgLTB4MSAqIDB4MjdhXSwKICAgICAgICAgICAgICAgICAgICAgIHNldDogXzB4MzJmMzNmWzB4MTA4ZSArIC0weDI1NTEgKyAweDFiICogMHhjNV0sCiAgICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgICA6IDB4MTliYyArIDB4MWMwZCAqIDB4MSArIDB4MzVjNiAqIC0weDEgPT09IF8weDIzNDUxZgogICAgICAgICAgICAgICAgICA/IHsKICAgICAgICAgICAgICAgICAgICAgIGdldDogXzB4MzJmMzNmWy0weDdmZCAqIDB4NCArIDB4MWI2YyArIDB4NDhiXSwKICAgICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICAgIDogMHgxNDlhICsgMHgyNTIyICsgLTB4MzliOCA9PT0gXzB4MjM0NTFmCiAgICAgICAgICAgICAgICAgID8gewogICAgICAgICAgICAgICAgICAgICAgc2V0OiBfMHgzMmYzM2ZbCiAgICAgICAgICAgICAgICAgICAgICAgIC0weDEgKiAweDNhZCArIC0weGI0ZSAqIDB4MiArIC0weDkgKiAtMHgyZWMKICAgICAgICAgICAgICAgICAgICAgIF0sCiAgICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgICA6IHsKICAgICAgICAgICAgICAgICAgICAgIHZhbHVlOiBfMHgzMmYzM2ZbMHgyMWE2ICsgLTB4NyArIC0weDIxOWNdLAogICAgICAgICAgICAgICAgICAgIH0pCiAgICAgICAgICAgIDogMHgxMmFiICogMHgxICsgLTB4MWY0MSArIDB4Yzk2ICE9PSBfMHgyMzQ1MWYgJiYKICAgICAgICAgICAgICAoXzB4NTg0ZTMzID0gT2JqZWN0W18weDFkNzRmNigweDJhNildKF8weDVkMDE1ZiwgXzB4NWY1MTY5KSksCiAgICAgICAgICAweDExICogLTB4ZjcgKyAtMHg0ICogMHg3YmUgKyAweDJmNjAgPT09IF8weDIzNDUxZgogICAgICAgICAgICA/IChfMHg1ZDY1MjMgPSB7CiAgICAgICAgICAgICAgICBnZXQ6IF8weDU4NGUzM1tfMHgxZDc0ZjYoMHgzMmIpXSwKICAgICAgICAgICAgICAgIHNldDogXzB4NTg0ZTMzWyJzZXQiXSwKICAgICAgICAgICAgICB9KQogICAgICAgICAgICA6IDB4MWUzICsgMHgyICogMHgxMWVmICsgLTB4MjViZiA9PT0gXzB4MjM0NTFmCiAgICAgICAgICAgID8gKF8weDVkNjUyMyA9IF8weDU4NGUzM1tfMHgxZDc0ZjYoMHgyZTQpXSkKICAgICAgICAgICAgOiAtMHg2YiArIDB4MWZmOCArIC0weGZjNSAqIDB4MiA9PT0gXzB4MjM0NTFmCiAgICAgICAgICAgID8gKF8weDVkNjUyMyA9IF8weDU4NGUzM1siZ2V0Il0pCiAgICAgICAgICAgIDogMHgyNTc3ICsgLTB4MjI3MiArIC0weDMwMSA9PT0gXzB4MjM0NTFmICYmCiAgICAgICAgICAgICAgKF8weDVkNjUyMyA9IF8weDU4NGUzM1tfMHgxZDc0ZjYoMHgxZTQpXSksCiAgICAgICAgICAiZnVuY3Rpb24iID09IHR5cGVvZiBfMHg0ZWYzZDYpCiAgICAgICAgKQogICAgICAgICAgdm9pZCAoMHgxYmRjICogLTB4MSArIDB4MjM0MyArIC0weDEgKiAweDc2NykgIT09CiAgICAgICAgICAgIChfMHgyZDE4YTEgPSBfMHgxOTMwNTAoCiAgICAgICAgICAgICAgXzB4NGVmM2Q2LAogICAgICAgICAgICAgIF8weDVmNTE2OSwKICAgICAgICAgICAgICBfMHg1ODRlMzMsCiAgICAgICAgICAgICAgXzB4MmMzZmIyLAogICAgICAgICAgICAgIF8weDIzNDUxZiwKICAgICAgICAgICAgICBfMHgyNTk1ZjgsCiAgICAgICAgICAgICAgXzB4YjhiZGVlLAogICAgICAgICAgICAgIF8weDVkNjUyMwogICAgICAgICAgICApKSAmJgogICAgICAgICAgICAoXzB4MTNkN2RmKF8weDIzNDUxZiwgXzB4MmQxOGExKSwKICAgICAgICAgICAgLTB4NSAqIC0weDI3ZSArIDB4NmEgKiAweDFlICsgLTB4MThlMiA9PT0gXzB4MjM0NTFmCiAgICAgICAgICAgICAgPyAoXzB4MTAzYjE4ID0gXzB4MmQxOGExKQogICAgICAgICAgICAgIDogMHgyM2YxICsgLTB4NCAqIDB4OGJiICsgMHgxNCAqIC0weGQgPT09IF8weDIzNDUxZgogICAgICAgICAgICAgID8gKChfMHgxMDNiMTggPSBfMHgyZDE4YTFbImluaXQiXSksCiAgICAgICAgICAgICAgICAoXzB4MmI5ZmQzID0KICAgICAgICAgICAgICAgICAgXzB4MmQxOGExW18weDFkNzRmNigweDMyYildIHx8IF8weDVkNjUyM1tfMHgxZDc0ZjYoMHgzMmIpXSksCiAgICAgICAgICAgICAgICAoXzB4MTE0NzllID0KICAgICAgICAgICAgICAgICAgXzB4MmQxOGExW18weDFkNzRmNigweDFlNCldIHx8IF8weDVkNjUyM1tfMHgxZDc0ZjYoMHgxZTQpXSksCiAgICAgICAgICAgICAgICAoXzB4NWQ2NTIzID0gewogICAgICAgICAgICAgICAgICBnZXQ6IF8weDJiOWZkMywKICAgICAgICAgICAgICAgICAgc2V0OiBfMHgxMTQ3OWUsCiAgICAgICAgICAgICAgICB9KSkKICAgICAgICAgICAgICA6IChfMHg1ZDY1MjMgPSBfMHgyZDE4YTEpKTsKICAgICAgICBlbHNlCiAgICAgICAgICBmb3IgKAogICAgICAgICAgICB2YXIgXzB4NDMyOGZiID0KICAgICAgICAgICAgICBfMHg0ZWYzZDZbXzB4MWQ3NGY2KDB4MjU5KV0gLSAoMHhlMzEgKyAtMHhjNWIgKyAtMHgxZDUpOwogICAgICAgICAgICBfMHg0MzI4ZmIgPj0gMHg4N2EgKyAtMHhmN2MgKyAweDcwMjsKICAgICAgICAgICAgXzB4NDMyOGZiLS0KICAgICAgICAgICkgewogICAgICAgICAgICB2YXIgXzB4NWM0Y2M4OwogICAgICAgICAgICB2b2lkICgweDgzYiArIC0weDhhZiArIDB4NzQpICE9PQogICAgICAgICAgICAgIChfMHgyZDE4YTEgPSBfMHgxOTMwNTAoCiAgICAgICAgICAgICAgICBfMHg0ZWYzZDZbXzB4NDMyOGZiXSwKICAgICAgICAgICAgICAgIF8weDVmNTE2OSwKICAgICAgICAgICAgICAgIF8weDU4NGUzMywKICAgICAgICAgICAgICAgIF8weDJjM2ZiMiwKICAgICAgICAgICAgICAgIF8weDIzNDUxZiwKICAgICAgICAgICAgICAgIF8weDI1OTVmOCwKICAgICAgICAgICAgICAgIF8weGI4YmRlZSwKICAgICAgICAgICAgICAgIF8weDVkNjUyMwogICAgICAgICAgICAgICkpICYmCiAgICAgICAgICAgICAgKF8weDEzZDdkZihfMHgyMzQ1MWYsIF8weDJkMThhMSksCiAgICAgICAgICAgICAgLTB4NCAqIDB4NTExICsgLTB4YzBhICogLTB4MSArIDB4ODNhID09PSBfMHgyMzQ1MWYKICAgICAgICAgICAgICAgID8gKF8weDVjNGNjOCA9IF8weDJkMThhMSkKICAgICAgICAgICAgICAgIDogLTB4MjIgKiAtMHg0ZCArIC0weDEzNWQgKiAtMHgyICsgMHgxMDUxICogLTB4MyA9PT0gXzB4MjM0NTFmCiAgICAgICAgICAgICAgICA/ICgoXzB4NWM0Y2M4ID0gXzB4MmQxOGExW18weDFkNzRmNigweDNiOSldKSwKICAgICAgICAgICAgICAgICAgKF8weDJiOWZkMyA9CiAgICAgICAgICAgICAgICAgICAgXzB4MmQxOGExW18weDFkNzRmNigweDMyYildIHx8IF8weDVkNjUyM1tfMHgxZDc0ZjYoMHgzMmIpXSksCiAgICAgICAgICAgICAgICAgIChfMHgxMTQ3OWUgPQogICAgICAgICAgICAgICAgICAgIF8weDJkMThhMVtfMHgxZDc0ZjYoMHgxZTQpXSB8fCBfMHg1ZDY1MjNbXzB4MWQ3NGY2KDB4MWU0KV0pLAogICAgICAgICAgICAgICAgICAoXzB4NWQ2NTIzID0gewogICAgICAgICAgICAgICAgICAgIGdldDogXzB4MmI5ZmQzLAogICAgICAgICAgICAgICAgICAgIHNldDogXzB4MTE0NzllLAogICAgICAgICAgICAgICAgICB9KSkKICAgICAgICAgICAgICAgIDogKF8weDVkNjUyMyA9IF8weDJkMThhMSksCiAgICAgICAgICAgICAgdm9pZCAoMHgyM2I5ICogMHgxICsgMHgyICogLTB4Y2NiICsgLTB4NSAqIDB4MjA3KSAhPT0gXzB4NWM0Y2M4ICYmCiAgICAgICAgICAgICAgICAodm9pZCAoLTB4MTVhYyArIDB4Mzc2ICsgMHg3ZSAqIDB4MjUpID09PSBfMHgxMDNiMTgKICAgICAgICAgICAgICAgICAgPyAoXzB4MTAzYjE4ID0gXzB4NWM0Y2M4KQogICAgICAgICAgICAgICAgICA6IF8weDFkNzRmNigweDFlZSkgPT0gdHlwZW9mIF8weDEwM2IxOAogICAgICAgICAgICAgICAgICA/IChfMHgxMDNiMTggPSBbXzB4MTAzYjE4LCBfMHg1YzRjYzhdKQogICAgICAgICAgICAgICAgICA6IF8weDEwM2IxOFsicHVzaCJdKF8weDVjNGNjOCkpKTsKICAgICAgICAgIH0KICAgICAgICBpZiAoCiAgICAgICAgICAtMHgxMWEzICsgMHhkICogLTB4MmYyICsgLTB4NjcgKiAtMHg4YiA9PT0gXzB4MjM0NTFmIHx8CiAgICAgICAgICAweGVhYiAqIC0weDEgKyAweDc1MiAqIC0weDEgKyAtMHgxNWZlICogLTB4MSA9PT0gXzB4MjM0NTFmCiAgICAgICAgKSB7CiAgICAgICAgICBpZiAodm9pZCAoLTB4NGE4ICogMHgxICsgMHhmYjAgKyAtMHhiMDgpID09PSBfMHgxMDNiMTgpCiAgICAgICAgICAgIF8weDEwM2IxOCA9IGZ1bmN0aW9uIChfMHgxNjgyZGEsIF8weDU1ZTRkZSkgewogICAgICAgICAgICAgIHJldHVybiBfMHg1NWU0ZGU7CiAgICAgICAgICAgIH07CiAgICAgICAgICBlbHNlIHsKICAgICAgICAgICAgaWYgKF8weDFkNzRmNigweDFlZSkgIT0gdHlwZW9mIF8weDEwM2IxOCkgewogICAgICAgICAgICAgIHZhciBfMHgyNzhhN2MgPSBfMHgxMDNiMTg7CiAgICAgICAgICAgICAgXzB4MTAzYjE4ID0gZnVuY3Rpb24gKF8weDFjMzJhMiwgXzB4NDQyYjM5KSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4NTZjZGUzID0gXzB4MWQ3NGY2OwogICAgICAgICAgICAgICAgZm9yICgKICAgICAgICAgICAgICAgICAgdmFyIF8weDIwMDA0MyA9IF8weDQ0MmIzOSwKICAgICAgICAgICAgICAgICAgICBfMHg1MmVhZWMgPSAweGM4YSArIDB4MjZmNiArIDB4MjAgKiAtMHgxOWM7CiAgICAgICAgICAgICAgICAgIF8weDUyZWFlYyA8IF8weDI3OGE3Y1tfMHg1NmNkZTMoMHgyNTkpXTsKICAgICAgICAgICAgICAgICAgXzB4NTJlYWVjKysKICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgICAgXzB4MjAwMDQzID0gXzB4Mjc4YTdjW18weDUyZWFlY11bImNhbGwiXSgKICAgICAgICAgICAgICAgICAgICBfMHgxYzMyYTIsCiAgICAgICAgICAgICAgICAgICAgXzB4MjAwMDQzCiAgICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgICAgICByZXR1cm4gXzB4MjAwMDQzOwogICAgICAgICAgICAgIH07CiAgICAgICAgICAgIH0gZWxzZSB7CiAgICAgICAgICAgICAgdmFyIF8weDEyMDUzNyA9IF8weDEwM2IxODsKICAgICAgICAgICAgICBfMHgxMDNiMTggPSBmdW5jdGlvbiAoXzB4NWEwYjk5LCBfMHg1MjM5NjYpIHsKICAgICAgICAgICAgICAgIHZhciBfMHgyZGU0OWQgPSBfMHgxZDc0ZjY7CiAgICAgICAgICAgICAgICByZXR1cm4gXzB4MTIwNTM3W18weDJkZTQ5ZCgweDMzNCldKF8weDVhMGI5OSwgXzB4NTIzOTY2KTsKICAgICAgICAgICAgICB9OwogICAgICAgICAgICB9CiAgICAgICAgICB9CiAgICAgICAgICBfMHhjOGNhZDhbInB1c2giXShfMHgxMDNiMTgpOwogICAgICAgIH0KICAgICAgICAweDNhYyAqIC0weDggKyAweDkxNSArIDB4MTQ0YiAhPT0gXzB4MjM0NTFmICYmCiAgICAgICAgICAoLTB4Y2RlICsgLTB4MWYzZiArIDB4MmMxZSA9PT0gXzB4MjM0NTFmCiAgICAgICAgICAgID8gKChfMHg1ODRlMzNbXzB4MWQ3NGY2KDB4MzJiKV0gPSBfMHg1ZDY1MjNbImdldCJdKSwKICAgICAgICAgICAgICAoXzB4NTg0ZTMzW18weDFkNzRmNigweDFlNCldID0gXzB4NWQ2NTIzWyJzZXQiXSkpCiAgICAgICAgICAgIDogLTB4MzEgKiAtMHhjMSArIC0weDEgKiAtMHgyMzg4ICsgLTB4NDg3NyA9PT0gXzB4MjM0NTFmCiAgICAgICAgICAgID8gKF8weDU4NGUzM1tfMHgxZDc0ZjYoMHgyZTQpXSA9IF8weDVkNjUyMykKICAgICAgICAgICAgOiAtMHg0ICogMHg4OTkgKyAweDE5NDQgKyAweDkyMyA9PT0gXzB4MjM0NTFmCiAgICAgICAgICAgID8gKF8weDU4NGUzM1tfMHgxZDc0ZjYoMHgzMmIpXSA9IF8weDVkNjUyMykKICAgICAgICAgICAgOiAtMHg2NGUgKiAweDUgKyAweDE1MmYgKyAweGE1YiA9PT0gXzB4MjM0NTFmICYmCiAgICAgICAgICAgICAgKF8weDU4NGUzM1tfMHgxZDc0ZjYoMHgxZTQpXSA9IF8weDVkNjUyMyksCiAgICAgICAgICBfMHhiOGJkZWUKICAgICAgICAgICAgPyAweDE4NmIgKyAweDMgKiAweDdlOSArIC0weDFlZCAqIDB4MTkgPT09IF8weDIzNDUxZgogICAgICAgICAgICAgID8gKF8weGM4Y2FkOFtfMHgxZDc0ZjYoMHgzNmUpXShmdW5jdGlvbiAoXzB4MWM3NjYzLCBfMHgyMTBlNDkpIHsKICAgICAgICAgICAgICAgICAgdmFyIF8weGIzNTkzMyA9IF8weDFkNzRmNjsKICAgICAgICAgICAgICAgICAgcmV0dXJuIF8weDVkNjUyM1siZ2V0Il1bXzB4YjM1OTMzKDB4MzM0KV0oCiAgICAgICAgICAgICAgICAgICAgXzB4MWM3NjYzLAogICAgICAgICAgICAgICAgICAgIF8weDIxMGU0OQogICAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgICAgfSksCiAgICAgICAgICAgICAgICBfMHhjOGNhZDhbXzB4MWQ3NGY2KDB4MzZlKV0oZnVuY3Rpb24gKF8weDljZTRhMCwgXzB4YTJhNmE1KSB7CiAgICAgICAgICAgICAgICAgIHZhciBfMHg1NDhiZjUgPSBfMHgxZDc0ZjY7CiAgICAgICAgICAgICAgICAgIHJldHVybiBfMHg1ZDY1MjNbXzB4NTQ4YmY1KDB4MWU0KV1bXzB4NTQ4YmY1KDB4MzM0KV0oCiAgICAgICAgICAgICAgICAgICAgXzB4OWNlNGEwLAogICAgICAgICAgICAgICAgICAgIF8weGEyYTZhNQogICAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgICAgfSkpCiAgICAgICAgICAgICAgOiAtMHgyICogMHg5MWQgKyAtMHgyMjZlICsgMHgyODIgKiAweDE1ID09PSBfMHgyMzQ1MWYKICAgICAgICAgICAgICA/IF8weGM4Y2FkOFsicHVzaCJdKF8weDVkNjUyMykKICAgICAgICAgICAgICA6IF8weGM4Y2FkOFtfMHgxZDc0ZjYoMHgzNmUpXShmdW5jdGlvbiAoXzB4NWI5ZTliLCBfMHg0ZWY0OWQpIHsKICAgICAgICAgICAgICAgICAgcmV0dXJuIF8weDVkNjUyM1siY2FsbCJdKF8weDViOWU5YiwgXzB4NGVmNDlkKTsKICAgICAgICAgICAgICAgIH0pCiAgICAgICAgICAgIDogT2JqZWN0W18weDFkNzRmNigweDE3NSldKF8weDVkMDE1ZiwgXzB4NWY1MTY5LCBfMHg1ODRlMzMpKTsKICAgICAgfQogICAgICBmdW5jdGlvbiBfMHhiYmQzOGIoXzB4NDI0NzhlLCBfMHgxZWYzZGIpIHsKICAgICAgICB2YXIgXzB4MTVkOTBhID0gd18weDI1ZjM7CiAgICAgICAgXzB4MWVmM2RiICYmCiAgICAgICAgICBfMHg0MjQ3OGVbXzB4MTVkOTBhKDB4MzZlKV0oZnVuY3Rpb24gKF8weGRmYzQwZSkgewogICAgICAgICAgICB2YXIgXzB4MTA1NDhjID0gXzB4MTVkOTBhOwogICAgICAgICAgICBmb3IgKAogICAgICAgICAgICAgIHZhciBfMHgzZTZmMmMgPSAtMHgzNDkgKiAtMHhhICsgMHhlICogMHg1YiArIC0weDI1ZDQ7CiAgICAgICAgICAgICAgXzB4M2U2ZjJjIDwgXzB4MWVmM2RiW18weDEwNTQ4YygweDI1OSldOwogICAgICAgICAgICAgIF8weDNlNmYyYysrCiAgICAgICAgICAgICkKICAgICAgICAgICAgICBfMHgxZWYzZGJbXzB4M2U2ZjJjXVtfMHgxMDU0OGMoMHgzMzQpXShfMHhkZmM0MGUpOwogICAgICAgICAgICByZXR1cm4gXzB4ZGZjNDBlOwogICAgICAgICAgfSk7CiAgICAgIH0KICAgICAgcmV0dXJuIGZ1bmN0aW9uIChfMHgyMzI3ZjUsIF8weDI4Y2EwNiwgXzB4NTNlZDk5KSB7CiAgICAgICAgdmFyIF8weDI1M2EwNiA9IFtdOwogICAgICAgIHJldHVybiAoCiAgICAgICAgICAoZnVuY3Rpb24gKF8weDE4MTZlNSwgXzB4MjllNDllLCBfMHg0OGNiNDYpIHsKICAgICAgICAgICAgdmFyIF8weDVlZmVmMSA9IHdfMHgyNWYzOwogICAgICAgICAgICBmb3IgKAogICAgICAgICAgICAgIHZhciBfMHg1ODU3YTksCiAgICAgICAgICAgICAgICBfMHg0ODIyMmUsCiAgICAgICAgICAgICAgICBfMHgyZjc5NzkgPSBuZXcgTWFwKCksCiAgICAgICAgICAgICAgICBfMHgyZTczM2UgPSBuZXcgTWFwKCksCiAgICAgICAgICAgICAgICBfMHg0YjZkMWEgPSAweDEgKiAtMHhlYzMgKyAweDEgKiAweDZhMiArIDB4ODIxOwogICAgICAgICAgICAgIF8weDRiNmQxYSA8IF8weDQ4Y2I0NltfMHg1ZWZlZjEoMHgyNTkpXTsKICAgICAgICAgICAgICBfMHg0YjZkMWErKwogICAgICAgICAgICApIHsKICAgICAgICAgICAgICB2YXIgXzB4NThjNmQzID0gXzB4NDhjYjQ2W18weDRiNmQxYV07CiAgICAgICAgICAgICAgaWYgKEFycmF5WyJpc0FycmF5Il0oXzB4NThjNmQzKSkgewogICAgICAgICAgICAgICAgdmFyIF8weDEyNGI2MywKICAgICAgICAgICAgICAgICAgXzB4NDMyNGFhLAogICAgICAgICAgICAgICAgICBfMHg4YzJhMzkgPSBfMHg1OGM2ZDNbLTB4MWQzYSArIC0weDI0ZmYgKyAweDQyM2FdLAogICAgICAgICAgICAgICAgICBfMHg4ZmFiYmQgPQogICAgICAgICAgICAgICAgICAgIF8weDU4YzZkM1sweDFiMTQgKyAtMHgxICogLTB4MWYwYyArIC0weDFkMGYgKiAweDJdLAogICAgICAgICAgICAgICAgICBfMHgyNDlkYTMgPQogICAgICAgICAgICAgICAgICAgIF8weDU4YzZkM1tfMHg1ZWZlZjEoMHgyNTkpXSA+CiAgICAgICAgICAgICAgICAgICAgMHgxICogMHhiNDIgKyAtMHgxYzEgKiAweGUgKyAtMHgxICogLTB4ZDRmLAogICAgICAgICAgICAgICAgICBfMHgxMWQwNGMgPSBfMHg4YzJhMzkgPj0gLTB4MTJiMyAqIDB4MSArIDB4MTBlNiArIDB4MWQyOwogICAgICAgICAgICAgICAgaWYgKAogICAgICAgICAgICAgICAgICAoXzB4MTFkMDRjCiAgICAgICAgICAgICAgICAgICAgPyAoKF8weDEyNGI2MyA9IF8weDI5ZTQ5ZSksCiAgICAgICAgICAgICAgICAgICAgICAtMHgxNWIgKiAtMHg1ICsgMHgzNzMgKyAtMHhhM2EgIT0KICAgICAgICAgICAgICAgICAgICAgICAgKF8weDhjMmEzOSAtPSAtMHgyNGIyICsgLTB4MTJiICogMHgxNyArIDB4M2Y5NCkgJiYKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDQzMjRhYSA9IF8weDQ4MjIyZSA9IF8weDQ4MjIyZSB8fCBbXSkpCiAgICAgICAgICAgICAgICAgICAgOiAoKF8weDEyNGI2MyA9IF8weDI5ZTQ5ZVsicHJvdG90eXBlIl0pLAogICAgICAgICAgICAgICAgICAgICAgMHgxMWZhICsgLTB4MTg1OSArIDB4NjVmICE9PSBfMHg4YzJhMzkgJiYKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDQzMjRhYSA9IF8weDU4NTdhOSA9IF8weDU4NTdhOSB8fCBbXSkpLAogICAgICAgICAgICAgICAgICAtMHgxMWRmICsgLTB4MjA1ZCAqIDB4MSArIDB4MzIzYyAhPT0gXzB4OGMyYTM5ICYmICFfMHgyNDlkYTMpCiAgICAgICAgICAgICAgICApIHsKICAgICAgICAgICAgICAgICAgdmFyIF8weDNlMDc0OCA9IF8weDExZDA0YyA/IF8weDJlNzMzZSA6IF8weDJmNzk3OSwKICAgICAgICAgICAgICAgICAgICBfMHgxNDg3NDkgPQogICAgICAgICAgICAgICAgICAgICAgXzB4M2UwNzQ4W18weDVlZmVmMSgweDMyYildKF8weDhmYWJiZCkgfHwKICAgICAgICAgICAgICAgICAgICAgIDB4NmMwICsgMHg4ZTMgKyAweDEgKiAtMHhmYTM7CiAgICAgICAgICAgICAgICAgIGlmICgKICAgICAgICAgICAgICAgICAgICAhKC0weDI4OCArIC0weDFiOGYgKyAweDFlMTcpID09PSBfMHgxNDg3NDkgfHwKICAgICAgICAgICAgICAgICAgICAoMHhjYWUgKyAtMHg4NGEgKyAtMHg0NjEgPT09IF8weDE0ODc0OSAmJgogICAgICAgICAgICAgICAgICAgICAgMHhlYmMgKyAtMHg2Y2YgKyAtMHg3ZTkgIT09IF8weDhjMmEzOSkgfHwKICAgICAgICAgICAgICAgICAgICAoMHgxMzJkICogMHgyICsgMHgxICogMHg2YWIgKyAtMHgxICogMHgyZDAxID09PSBfMHgxNDg3NDkgJiYKICAgICAgICAgICAgICAgICAgICAgIDB4MjE0NCArIC0weGUxNyAqIC0weDEgKyAtMHgyZjU4ICE9PSBfMHg4YzJhMzkpCiAgICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgICAgICB0aHJvdyBuZXcgRXJyb3IoCiAgICAgICAgICAgICAgICAgICAgICAiQXR0ZW1wdGVkXHgyMHRvXHgyMGRlY29yYXRlXHgyMGFceDIwcHVibGljXHgyMG1ldGhvZC9hY2Nlc3Nvclx4MjB0aGF0XHgyMGhhc1x4MjB0aGVceDIwc2FtZVx4MjBuYW1lXHgyMGFzXHgyMGFceDIwcHJldmlvdXNseVx4MjBkZWNvcmF0ZWRceDIwcHVibGljXHgyMG1ldGhvZC9hY2Nlc3Nvci5ceDIwVGhpc1x4MjBpc1x4MjBub3RceDIwY3VycmVudGx5XHgyMHN1cHBvcnRlZFx4MjBieVx4MjB0aGVceDIwZGVjb3JhdG9yc1x4MjBwbHVnaW4uXHgyMFByb3BlcnR5XHgyMG5hbWVceDIwd2FzOlx4MjAiICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4OGZhYmJkCiAgICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgICAgIV8weDE0ODc0OSAmJgogICAgICAgICAgICAgICAgICBfMHg4YzJhMzkgPiAtMHgyZWEgKiAtMHhjICsgMHgxICogMHgyNGNiICsgMHgxICogLTB4NDdjMQogICAgICAgICAgICAgICAgICAgID8gXzB4M2UwNzQ4W18weDVlZmVmMSgweDFlNCldKF8weDhmYWJiZCwgXzB4OGMyYTM5KQogICAgICAgICAgICAgICAgICAgIDogXzB4M2UwNzQ4W18weDVlZmVmMSgweDFlNCldKAogICAgICAgICAgICAgICAgICAgICAgICBfMHg4ZmFiYmQsCiAgICAgICAgICAgICAgICAgICAgICAgICEoMHhiOWUgKyAtMHhjICogLTB4OWQgKyAtMHgxMmZhKQogICAgICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgIH0KICAgICAgICAgICAgICAgIF8weDMzNDVhYigKICAgICAgICAgICAgICAgICAgXzB4MTgxNmU1LAogICAgICAgICAgICAgICAgICBfMHgxMjRiNjMsCiAgICAgICAgICAgICAgICAgIF8weDU4YzZkMywKICAgICAgICAgICAgICAgICAgXzB4OGZhYmJkLAogICAgICAgICAgICAgICAgICBfMHg4YzJhMzksCiAgICAgICAgICAgICAgICAgIF8weDExZDA0YywKICAgICAgICAgICAgICAgICAgXzB4MjQ5ZGEzLAogICAgICAgICAgICAgICAgICBfMHg0MzI0YWEKICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgICAgfQogICAgICAgICAgICB9CiAgICAgICAgICAgIF8weGJiZDM4YihfMHgxODE2ZTUsIF8weDU4NTdhOSksIF8weGJiZDM4YihfMHgxODE2ZTUsIF8weDQ4MjIyZSk7CiAgICAgICAgICB9KShfMHgyNTNhMDYsIF8weDIzMjdmNSwgXzB4MjhjYTA2KSwKICAgICAgICAgIChmdW5jdGlvbiAoXzB4NTI4ZWEzLCBfMHg0ZjY5NWMsIF8weDE1MjdkZikgewogICAgICAgICAgICB2YXIgXzB4NDM2YzFkID0gd18weDI1ZjM7CiAgICAgICAgICAgIGlmIChfMHgxNTI3ZGZbXzB4NDM2YzFkKDB4MjU5KV0gPiAweGU1ICsgMHgyNjljICsgLTB4Mjc4MSkgewogICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICB2YXIgXzB4NGUwZTFiID0gW10sCiAgICAgICAgICAgICAgICAgIF8weDNlY2E5OSA9IF8weDRmNjk1YywKICAgICAgICAgICAgICAgICAgXzB4NWM2OWQyID0gXzB4NGY2OTVjW18weDQzNmMxZCgweDM0MSldLAogICAgICAgICAgICAgICAgICBfMHgyYWJlYmIgPQogICAgICAgICAgICAgICAgICAgIF8weDE1MjdkZltfMHg0MzZjMWQoMHgyNTkpXSAtCiAgICAgICAgICAgICAgICAgICAgKDB4MSAqIC0weDFjYmUgKyAweGEgKiAtMHgyYmEgKyAweDM4MDMpOwogICAgICAgICAgICAgICAgXzB4MmFiZWJiID49IDB4OGMwICsgLTB4NDRkICogMHg0ICsgMHg4NzQ7CiAgICAgICAgICAgICAgICBfMHgyYWJlYmItLQogICAgICAgICAgICAgICkgewogICAgICAgICAgICAgICAgdmFyIF8weDMwMTIyZSA9IHsKICAgICAgICAgICAgICAgICAgdjogISgweDI2YmIgKyAweDM0YyAqIDB4NyArIDB4MSAqIC0weDNkY2UpLAogICAgICAgICAgICAgICAgfTsKICAgICAgICAgICAgICAgIHRyeSB7CiAgICAgICAgICAgICAgICAgIHZhciBfMHg0NmUwYjEgPSBfMHgxNTI3ZGZbXzB4MmFiZWJiXShfMHgzZWNhOTksIHsKICAgICAgICAgICAgICAgICAgICBraW5kOiBfMHg0MzZjMWQoMHgxOWMpLAogICAgICAgICAgICAgICAgICAgIG5hbWU6IF8weDVjNjlkMiwKICAgICAgICAgICAgICAgICAgICBhZGRJbml0aWFsaXplcjogXzB4NTU2YWFjKF8weDRlMGUxYiwgXzB4MzAxMjJlKSwKICAgICAgICAgICAgICAgICAgfSk7CiAgICAgICAgICAgICAgICB9IGZpbmFsbHkgewogICAgICAgICAgICAgICAgICBfMHgzMDEyMmVbInYiXSA9ICEoMHgxMTRlICsgMHgxZjEgKiAtMHgxICsgMHgxICogLTB4ZjVkKTsKICAgICAgICAgICAgICAgIH0KICAgICAgICAgICAgICAgIHZvaWQgKC0weDEgKiAtMHgxYzQxICsgMHgzOGQgKiAweDEgKyAtMHgxZmNlKSAhPT0gXzB4NDZlMGIxICYmCiAgICAgICAgICAgICAgICAgIChfMHgxM2Q3ZGYoMHgxODAgKyAweDYgKiAtMHgyZiArIC0weDVjLCBfMHg0NmUwYjEpLAogICAgICAgICAgICAgICAgICAoXzB4M2VjYTk5ID0gXzB4NDZlMGIxKSk7CiAgICAgICAgICAgICAgfQogICAgICAgICAgICAgIF8weDUyOGVhM1sicHVzaCJdKF8weDNlY2E5OSwgZnVuY3Rpb24gKCkgewogICAgICAgICAgICAgICAgdmFyIF8weDFlZjBmOCA9IF8weDQzNmMxZDsKICAgICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICAgIHZhciBfMHgzMzdkNTAgPSAweDEgKiAtMHgyMTdkICsgLTB4MWEzNSArIC0weDIgKiAtMHgxZGQ5OwogICAgICAgICAgICAgICAgICBfMHgzMzdkNTAgPCBfMHg0ZTBlMWJbXzB4MWVmMGY4KDB4MjU5KV07CiAgICAgICAgICAgICAgICAgIF8weDMzN2Q1MCsrCiAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgICAgIF8weDRlMGUxYltfMHgzMzdkNTBdWyJjYWxsIl0oXzB4M2VjYTk5KTsKICAgICAgICAgICAgICB9KTsKICAgICAgICAgICAgfQogICAgICAgICAgfSkoXzB4MjUzYTA2LCBfMHgyMzI3ZjUsIF8weDUzZWQ5OSksCiAgICAgICAgICBfMHgyNTNhMDYKICAgICAgICApOwogICAgICB9OwogICAgfQogICAgdmFyIF8weDE1Yjk2MCwgXzB4NTAwZTlmOwogICAgZnVuY3Rpb24gXzB4NGFiMTMzKF8weDUzOGNhYSwgXzB4MWRjYTNhLCBfMHgzNjJjODMpIHsKICAgICAgcmV0dXJuIChfMHgxNWI5NjAgPQogICAgICAgIF8weDE1Yjk2MCB8fCBfMHgyODFiM2IoKSkoXzB4NTM4Y2FhLCBfMHgxZGNhM2EsIF8weDM2MmM4Myk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0NTkxY2QoKSB7CiAgICAgIGZ1bmN0aW9uIF8weDEzNWNlYShfMHg0M2Y2MTksIF8weDVkZmE1NCkgewogICAgICAgIHJldHVybiBmdW5jdGlvbiAoXzB4MzNiNzc2KSB7CiAgICAgICAgICB2YXIgXzB4NTVmZWVhID0gd18weDI1ZjM7CiAgICAgICAgICAhKGZ1bmN0aW9uIChfMHg0ZDI0NjcsIF8weDFhYWFiNSkgewogICAgICAgICAgICB2YXIgXzB4MTg4YmY4ID0gd18weDI1ZjM7CiAgICAgICAgICAgIGlmIChfMHg0ZDI0NjdbInYiXSkgdGhyb3cgbmV3IEVycm9yKF8weDE4OGJmOCgweDI1NykpOwogICAgICAgICAgfSkoXzB4NWRmYTU0KSwKICAgICAgICAgICAgXzB4MjNiYzBjKF8weDMzYjc3NiwgXzB4NTVmZWVhKDB4M2JhKSksCiAgICAgICAgICAgIF8weDQzZjYxOVtfMHg1NWZlZWEoMHgzNmUpXShfMHgzM2I3NzYpOwogICAgICAgIH07CiAgICAgIH0KICAgICAgZnVuY3Rpb24gXzB4MzljZWFlKAogICAgICAgIF8weDU3MTNlYiwKICAgICAgICBfMHgzY2Q2NGIsCiAgICAgICAgXzB4MmE1ZTA1LAogICAgICAgIF8weDQyOGY5YiwKICAgICAgICBfMHgxY2QwZjUsCiAgICAgICAgXzB4Mzg2ZmZmLAogICAgICAgIF8weDU0MjExYiwKICAgICAgICBfMHg0MGVlOTYKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDMyYmQ2YyA9IHdfMHgyNWYzLAogICAgICAgICAgXzB4NDNkMmFhOwogICAgICAgIHN3aXRjaCAoXzB4MWNkMGY1KSB7CiAgICAgICAgICBjYXNlIC0weDMgKiAtMHg5ZjcgKyAweDEzYmMgKyAtMHgzMWEwOgogICAgICAgICAgICBfMHg0M2QyYWEgPSBfMHgzMmJkNmMoMHgxYjkpOwogICAgICAgICAgICBicmVhazsKICAgICAgICAgIGNhc2UgMHgxNGY1ICsgLTB4MWY1NiArIC0weDEgKiAtMHhhNjM6CiAgICAgICAgICAgIF8weDQzZDJhYSA9IF8weDMyYmQ2YygweDI1YSk7CiAgICAgICAgICAgIGJyZWFrOwogICAgICAgICAgY2FzZSAtMHgxICogLTB4MzQ2ICsgLTB4ZSArIDB4MzM1ICogLTB4MToKICAgICAgICAgICAgXzB4NDNkMmFhID0gXzB4MzJiZDZjKDB4MTgxKTsKICAgICAgICAgICAgYnJlYWs7CiAgICAgICAgICBjYXNlIC0weDIgKiAtMHgzNjcgKyAweDE2YjMgKyAtMHgxICogMHgxZDdkOgogICAgICAgICAgICBfMHg0M2QyYWEgPSBfMHgzMmJkNmMoMHgzNWQpOwogICAgICAgICAgICBicmVhazsKICAgICAgICAgIGRlZmF1bHQ6CiAgICAgICAgICAgIF8weDQzZDJhYSA9IF8weDMyYmQ2YygweDIzYyk7CiAgICAgICAgfQogICAgICAgIHZhciBfMHgxZjc2Y2YsCiAgICAgICAgICBfMHgyZDNhNjMsCiAgICAgICAgICBfMHg1MmRjOWYgPSB7CiAgICAgICAgICAgIGtpbmQ6IF8weDQzZDJhYSwKICAgICAgICAgICAgbmFtZTogXzB4NTQyMTFiID8gIiMiICsgXzB4M2NkNjRiIDogXzB4M2NkNjRiLAogICAgICAgICAgICBzdGF0aWM6IF8weDM4NmZmZiwKICAgICAgICAgICAgcHJpdmF0ZTogXzB4NTQyMTFiLAogICAgICAgICAgfSwKICAgICAgICAgIF8weDMzYjg4NSA9IHsKICAgICAgICAgICAgdjogISgweDEgKiAweGVhMSArIDB4MjJiNyArIDB4MzE1NyAqIC0weDEpLAogICAgICAgICAgfTsKICAgICAgICAtMHg5NDggKyAtMHgyNDU0ICsgMHgxYyAqIDB4MWExICE9PSBfMHgxY2QwZjUgJiYKICAgICAgICAgIChfMHg1MmRjOWZbXzB4MzJiZDZjKDB4MjI1KV0gPSBfMHgxMzVjZWEoXzB4NDI4ZjliLCBfMHgzM2I4ODUpKSwKICAgICAgICAgIDB4YiAqIDB4YjEgKyAweDE0MTcgKyAtMHgxYmIyID09PSBfMHgxY2QwZjUKICAgICAgICAgICAgPyBfMHg1NDIxMWIKICAgICAgICAgICAgICA/ICgoXzB4MWY3NmNmID0gXzB4MmE1ZTA1W18weDMyYmQ2YygweDMyYildKSwKICAgICAgICAgICAgICAgIChfMHgyZDNhNjMgPSBfMHgyYTVlMDVbInNldCJdKSkKICAgICAgICAgICAgICA6ICgoXzB4MWY3NmNmID0gZnVuY3Rpb24gKCkgewogICAgICAgICAgICAgICAgICByZXR1cm4gdGhpc1tfMHgzY2Q2NGJdOwogICAgICAgICAgICAgICAgfSksCiAgICAgICAgICAgICAgICAoXzB4MmQzYTYzID0gZnVuY3Rpb24gKF8weDIwOWU5ZikgewogICAgICAgICAgICAgICAgICB0aGlzW18weDNjZDY0Yl0gPSBfMHgyMDllOWY7CiAgICAgICAgICAgICAgICB9KSkKICAgICAgICAgICAgOiAweDI0MGYgKyAweGMxMSAqIDB4MyArIC0weDIyICogMHgyMjAgPT09IF8weDFjZDBmNQogICAgICAgICAgICA/IChfMHgxZjc2Y2YgPSBmdW5jdGlvbiAoKSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4NDQ2ZmMwID0gXzB4MzJiZDZjOwogICAgICAgICAgICAgICAgcmV0dXJuIF8weDJhNWUwNVtfMHg0NDZmYzAoMHgyZTQpXTsKICAgICAgICAgICAgICB9KQogICAgICAgICAgICA6ICgoLTB4NCAqIC0weDFmNiArIDB4MWI0OCArIC0weDIzMWYgIT09IF8weDFjZDBmNSAmJgogICAgICAgICAgICAgICAgMHg2MSAqIDB4MWEgKyAtMHgxMTMgKiAtMHgxMSArIC0weDFjMWEgIT09IF8weDFjZDBmNSkgfHwKICAgICAgICAgICAgICAgIChfMHgxZjc2Y2YgPSBmdW5jdGlvbiAoKSB7CiAgICAgICAgICAgICAgICAgIHZhciBfMHg0NDdiN2IgPSBfMHgzMmJkNmM7CiAgICAgICAgICAgICAgICAgIHJldHVybiBfMHgyYTVlMDVbImdldCJdW18weDQ0N2I3YigweDMzNCldKHRoaXMpOwogICAgICAgICAgICAgICAgfSksCiAgICAgICAgICAgICAgKDB4MWU0ZSArIDB4MjViNiAqIC0weDEgKyAweDc2OSAhPT0gXzB4MWNkMGY1ICYmCiAgICAgICAgICAgICAgICAweDEzOTcgKyAtMHhiN2UgKyAtMHg4MTUgIT09IF8weDFjZDBmNSkgfHwKICAgICAgICAgICAgICAgIChfMHgyZDNhNjMgPSBmdW5jdGlvbiAoXzB4NGMwNzFkKSB7CiAgICAgICAgICAgICAgICAgIF8weDJhNWUwNVsic2V0Il1bImNhbGwiXSh0aGlzLCBfMHg0YzA3MWQpOwogICAgICAgICAgICAgICAgfSkpLAogICAgICAgICAgKF8weDUyZGM5ZltfMHgzMmJkNmMoMHgxZDApXSA9CiAgICAgICAgICAgIF8weDFmNzZjZiAmJiBfMHgyZDNhNjMKICAgICAgICAgICAgICA/IHsKICAgICAgICAgICAgICAgICAgZ2V0OiBfMHgxZjc2Y2YsCiAgICAgICAgICAgICAgICAgIHNldDogXzB4MmQzYTYzLAogICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgIDogXzB4MWY3NmNmCiAgICAgICAgICAgICAgPyB7CiAgICAgICAgICAgICAgICAgIGdldDogXzB4MWY3NmNmLAogICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgIDogewogICAgICAgICAgICAgICAgICBzZXQ6IF8weDJkM2E2MywKICAgICAgICAgICAgICAgIH0pOwogICAgICAgIHRyeSB7CiAgICAgICAgICByZXR1cm4gXzB4NTcxM2ViKF8weDQwZWU5NiwgXzB4NTJkYzlmKTsKICAgICAgICB9IGZpbmFsbHkgewogICAgICAgICAgXzB4MzNiODg1WyJ2Il0gPSAhKC0weDhjOSArIDB4MiAqIC0weDExODkgKyAweDJiZGIpOwogICAgICAgIH0KICAgICAgfQogICAgICBmdW5jdGlvbiBfMHgyM2JjMGMoXzB4NGFhMGYyLCBfMHgxMjY0MGEpIHsKICAgICAgICB2YXIgXzB4MWI5MjVlID0gd18weDI1ZjM7CiAgICAgICAgaWYgKF8weDFiOTI1ZSgweDFlZSkgIT0gdHlwZW9mIF8weDRhYTBmMikKICAgICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4MTI2NDBhICsgXzB4MWI5MjVlKDB4MmY4KSk7CiAgICAgIH0KICAgICAgZnVuY3Rpb24gXzB4MmRlNWU0KF8weDNkZTNiYiwgXzB4YTM5OGVjKSB7CiAgICAgICAgdmFyIF8weGY5NDMwOCA9IHdfMHgyNWYzLAogICAgICAgICAgXzB4MmM4NjYxID0gdHlwZW9mIF8weGEzOThlYzsKICAgICAgICBpZiAoLTB4MzMgKiAweDRjICsgMHg1ICogMHg3ODcgKyAtMHgxICogMHgxNjdlID09PSBfMHgzZGUzYmIpIHsKICAgICAgICAgIGlmIChfMHhmOTQzMDgoMHgxN2QpICE9PSBfMHgyYzg2NjEgfHwgbnVsbCA9PT0gXzB4YTM5OGVjKQogICAgICAgICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKF8weGY5NDMwOCgweDFmZCkpOwogICAgICAgICAgdm9pZCAoLTB4MWUwMyArIC0weDFlYiArIDB4ZmY3ICogMHgyKSAhPT0KICAgICAgICAgICAgXzB4YTM5OGVjW18weGY5NDMwOCgweDMyYildICYmCiAgICAgICAgICAgIF8weDIzYmMwYyhfMHhhMzk4ZWNbXzB4Zjk0MzA4KDB4MzJiKV0sICJhY2Nlc3Nvci5nZXQiKSwKICAgICAgICAgICAgdm9pZCAoMHgzYmEgKyAtMHgyNGRiICsgLTB4YjBiICogLTB4MykgIT09CiAgICAgICAgICAgICAgXzB4YTM5OGVjW18weGY5NDMwOCgweDFlNCldICYmCiAgICAgICAgICAgICAgXzB4MjNiYzBjKF8weGEzOThlY1tfMHhmOTQzMDgoMHgxZTQpXSwgXzB4Zjk0MzA4KDB4MjMxKSksCiAgICAgICAgICAgIHZvaWQgKDB4N2Y4ICsgLTB4MWIxMCArIC0weDEzMTggKiAtMHgxKSAhPT0KICAgICAgICAgICAgICBfMHhhMzk4ZWNbXzB4Zjk0MzA4KDB4M2I5KV0gJiYKICAgICAgICAgICAgICBfMHgyM2JjMGMoXzB4YTM5OGVjWyJpbml0Il0sIF8weGY5NDMwOCgweDIyZikpOwogICAgICAgIH0gZWxzZSB7CiAgICAgICAgICBpZiAoXzB4Zjk0MzA4KDB4MWVlKSAhPT0gXzB4MmM4NjYxKQogICAgICAgICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKAogICAgICAgICAgICAgICgtMHhmNjUgKyAweGJkMCArIDB4Mzk1ID09PSBfMHgzZGUzYmIKICAgICAgICAgICAgICAgID8gXzB4Zjk0MzA4KDB4MjNjKQogICAgICAgICAgICAgICAgOiAweDQ4ZSArIC0weDEgKiAweDFlYmUgKyAweDFhM2EgPT09IF8weDNkZTNiYgogICAgICAgICAgICAgICAgPyBfMHhmOTQzMDgoMHgxOWMpCiAgICAgICAgICAgICAgICA6IF8weGY5NDMwOCgweDI1YSkpICsgXzB4Zjk0MzA4KDB4MmNkKQogICAgICAgICAgICApOwogICAgICAgIH0KICAgICAgfQogICAgICBmdW5jdGlvbiBfMHgzNDNhMWUoCiAgICAgICAgXzB4YzRiMTI0LAogICAgICAgIF8weDEwMjZkOCwKICAgICAgICBfMHg0N2M4NzUsCiAgICAgICAgXzB4MTUwYTgzLAogICAgICAgIF8weDRjZGYxMSwKICAgICAgICBfMHgzZTRhMGIsCiAgICAgICAgXzB4MWRkMzEzLAogICAgICAgIF8weDJiMDI3ZAogICAgICApIHsKICAgICAgICB2YXIgXzB4MWM4N2FiID0gd18weDI1ZjMsCiAgICAgICAgICBfMHgyZjQ2YTUsCiAgICAgICAgICBfMHg1YTJiZTAsCiAgICAgICAgICBfMHg1NDcxMzgsCiAgICAgICAgICBfMHgyODkxNjgsCiAgICAgICAgICBfMHgxZTE4NzIsCiAgICAgICAgICBfMHhkMmZkODksCiAgICAgICAgICBfMHgxN2VlNTIgPSBfMHg0N2M4NzVbLTB4MjA5OSArIC0weDEzMyAqIDB4MSArIDB4MjFjY107CiAgICAgICAgaWYgKAogICAgICAgICAgKF8weDFkZDMxMwogICAgICAgICAgICA/IChfMHgyZjQ2YTUgPQogICAgICAgICAgICAgICAgMHhiMGEgKyAweDIxMjUgKyAtMHgyYzJmID09PSBfMHg0Y2RmMTEgfHwKICAgICAgICAgICAgICAgIDB4MTJlYSArIDB4NWJhICsgMHgzODUgKiAtMHg3ID09PSBfMHg0Y2RmMTEKICAgICAgICAgICAgICAgICAgPyB7CiAgICAgICAgICAgICAgICAgICAgICBnZXQ6IF8weDQ3Yzg3NVsweDFjZjMgKyAweDcgKiAtMHg1N2QgKyAweDk3Yl0sCiAgICAgICAgICAgICAgICAgICAgICBzZXQ6IF8weDQ3Yzg3NVsweDYgKiAweDIxMCArIC0weDJiMyAqIDB4MyArIDB4MSAqIC0weDQ0M10sCiAgICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgICA6IDB4MWY3YiArIC0weDIgKiAweDEyNTMgKyAweDUyZSAqIDB4MSA9PT0gXzB4NGNkZjExCiAgICAgICAgICAgICAgICAgID8gewogICAgICAgICAgICAgICAgICAgICAgZ2V0OiBfMHg0N2M4NzVbMHgxNDc2ICsgMHgyMyAqIC0weGI1ICsgMHg0NGNdLAogICAgICAgICAgICAgICAgICAgIH0KICAgICAgICAgICAgICAgICAgOiAweDIyOTAgKyAtMHgyMGU2ICsgLTB4MWE2ID09PSBfMHg0Y2RmMTEKICAgICAgICAgICAgICAgICAgPyB7CiAgICAgICAgICAgICAgICAgICAgICBzZXQ6IF8weDQ3Yzg3NVsKICAgICAgICAgICAgICAgICAgICAgICAgMHgxNDY1ICogLTB4MSArIC0weDEgKiAweDdkOSArIC0weDEgKiAtMHgxYzQxCiAgICAgICAgICAgICAgICAgICAgICBdLAogICAgICAgICAgICAgICAgICAgIH0KICAgICAgICAgICAgICAgICAgOiB7CiAgICAgICAgICAgICAgICAgICAgICB2YWx1ZTogXzB4NDdjODc1Wy0weDE1NTAgKyAweGIwZiArIDB4YTQ0XSwKICAgICAgICAgICAgICAgICAgICB9KQogICAgICAgICAgICA6IDB4OGJiICsgMHgzN2IgKyAweDEgKiAtMHhjMzYgIT09IF8weDRjZGYxMSAmJgogICAgICAgICAgICAgIChfMHgyZjQ2YTUgPSBPYmplY3RbXzB4MWM4N2FiKDB4MmE2KV0oXzB4MTAyNmQ4LCBfMHgxNTBhODMpKSwKICAgICAgICAgIC0weGYgKiAtMHg0OSArIC0weDhjMyAqIC0weDEgKyAweGQwOSAqIC0weDEgPT09IF8weDRjZGYxMQogICAgICAgICAgICA/IChfMHg1NDcxMzggPSB7CiAgICAgICAgICAgICAgICBnZXQ6IF8weDJmNDZhNVtfMHgxYzg3YWIoMHgzMmIpXSwKICAgICAgICAgICAgICAgIHNldDogXzB4MmY0NmE1WyJzZXQiXSwKICAgICAgICAgICAgICB9KQogICAgICAgICAgICA6IC0weDdjNCArIDB4MWRhOSArIC0weDE1ZTMgPT09IF8weDRjZGYxMQogICAgICAgICAgICA/IChfMHg1NDcxMzggPSBfMHgyZjQ2YTVbXzB4MWM4N2FiKDB4MmU0KV0pCiAgICAgICAgICAgIDogMHg3ZTEgKyAtMHgxNTlhICsgMHhkYmMgPT09IF8weDRjZGYxMQogICAgICAgICAgICA/IChfMHg1NDcxMzggPSBfMHgyZjQ2YTVbXzB4MWM4N2FiKDB4MzJiKV0pCiAgICAgICAgICAgIDogMHgxMDUgKyAweDE3N2QgKiAweDEgKyAweGJlICogLTB4MjEgPT09IF8weDRjZGYxMSAmJgogICAgICAgICAgICAgIChfMHg1NDcxMzggPSBfMHgyZjQ2YTVbInNldCJdKSwKICAgICAgICAgIF8weDFjODdhYigweDFlZSkgPT0gdHlwZW9mIF8weDE3ZWU1MikKICAgICAgICApCiAgICAgICAgICB2b2lkICgtMHgxMmM5ICsgMHgzICogLTB4MmYgKyAweDFlICogMHhhNSkgIT09CiAgICAgICAgICAgIChfMHgyODkxNjggPSBfMHgzOWNlYWUoCiAgICAgICAgICAgICAgXzB4MTdlZTUyLAogICAgICAgICAgICAgIF8weDE1MGE4MywKICAgICAgICAgICAgICBfMHgyZjQ2YTUsCiAgICAgICAgICAgICAgXzB4MmIwMjdkLAogICAgICAgICAgICAgIF8weDRjZGYxMSwKICAgICAgICAgICAgICBfMHgzZTRhMGIsCiAgICAgICAgICAgICAgXzB4MWRkMzEzLAogICAgICAgICAgICAgIF8weDU0NzEzOAogICAgICAgICAgICApKSAmJgogICAgICAgICAgICAoXzB4MmRlNWU0KF8weDRjZGYxMSwgXzB4Mjg5MTY4KSwKICAgICAgICAgICAgLTB4MWNjOSArIC0weDIgKiAweGI1ZCArIDB4MSAqIDB4MzM4MyA9PT0gXzB4NGNkZjExCiAgICAgICAgICAgICAgPyAoXzB4NWEyYmUwID0gXzB4Mjg5MTY4KQogICAgICAgICAgICAgIDogLTB4MSAqIDB4MTUxNyArIDB4MjUgKiAweDQ0ICsgMHhiNDQgPT09IF8weDRjZGYxMQogICAgICAgICAgICAgID8gKChfMHg1YTJiZTAgPSBfMHgyODkxNjhbXzB4MWM4N2FiKDB4M2I5KV0pLAogICAgICAgICAgICAgICAgKF8weDFlMTg3MiA9IF8weDI4OTE2OFtfMHgxYzg3YWIoMHgzMmIpXSB8fCBfMHg1NDcxMzhbImdldCJdKSwKICAgICAgICAgICAgICAgIChfMHhkMmZkODkgPQogICAgICAgICAgICAgICAgICBfMHgyODkxNjhbXzB4MWM4N2FiKDB4MWU0KV0gfHwgXzB4NTQ3MTM4W18weDFjODdhYigweDFlNCldKSwKICAgICAgICAgICAgICAgIChfMHg1NDcxMzggPSB7CiAgICAgICAgICAgICAgICAgIGdldDogXzB4MWUxODcyLAogICAgICAgICAgICAgICAgICBzZXQ6IF8weGQyZmQ4OSwKICAgICAgICAgICAgICAgIH0pKQogICAgICAgICAgICAgIDogKF8weDU0NzEzOCA9IF8weDI4OTE2OCkpOwogICAgICAgIGVsc2UKICAgICAgICAgIGZvciAoCiAgICAgICAgICAgIHZhciBfMHg1YTQ2ZDkgPQogICAgICAgICAgICAgIF8weDE3ZWU1MltfMHgxYzg3YWIoMHgyNTkpXSAtICgtMHg0OSAqIDB4MTkgKyAweDRhMiArIDB4MjgwKTsKICAgICAgICAgICAgXzB4NWE0NmQ5ID49IC0weDIyNWIgKyAweDE1NjIgKyAweGNmOTsKICAgICAgICAgICAgXzB4NWE0NmQ5LS0KICAgICAgICAgICkgewogICAgICAgICAgICB2YXIgXzB4NjBhMGQ3OwogICAgICAgICAgICB2b2lkICgtMHhmZmQgKyAweDcgKiAtMHgyOTMgKyAweDIyMDIpICE9PQogICAgICAgICAgICAgIChfMHgyODkxNjggPSBfMHgzOWNlYWUoCiAgICAgICAgICAgICAgICBfMHgxN2VlNTJbXzB4NWE0NmQ5XSwKICAgICAgICAgICAgICAgIF8weDE1MGE4MywKICAgICAgICAgICAgICAgIF8weDJmNDZhNSwKICAgICAgICAgICAgICAgIF8weDJiMDI3ZCwKICAgICAgICAgICAgICAgIF8weDRjZGYxMSwKICAgICAgICAgICAgICAgIF8weDNlNGEwYiwKICAgICAgICAgICAgICAgIF8weDFkZDMxMywKICAgICAgICAgICAgICAgIF8weDU0NzEzOAogICAgICAgICAgICAgICkpICYmCiAgICAgICAgICAgICAgKF8weDJkZTVlNChfMHg0Y2RmMTEsIF8weDI4OTE2OCksCiAgICAgICAgICAgICAgMHg1MiAqIC0weDU5ICsgMHg5ICogLTB4MTA0ICsgMHgyICogMHgxMmQzID09PSBfMHg0Y2RmMTEKICAgICAgICAgICAgICAgID8gKF8weDYwYTBkNyA9IF8weDI4OTE2OCkKICAgICAgICAgICAgICAgIDogLTB4MTY4OSArIDB4MWU5NiArIC0weDgwYyA9PT0gXzB4NGNkZjExCiAgICAgICAgICAgICAgICA/ICgoXzB4NjBhMGQ3ID0gXzB4Mjg5MTY4WyJpbml0Il0pLAogICAgICAgICAgICAgICAgICAoXzB4MWUxODcyID0gXzB4Mjg5MTY4W18weDFjODdhYigweDMyYildIHx8IF8weDU0NzEzOFsiZ2V0Il0pLAogICAgICAgICAgICAgICAgICAoXzB4ZDJmZDg5ID0KICAgICAgICAgICAgICAgICAgICBfMHgyODkxNjhbXzB4MWM4N2FiKDB4MWU0KV0gfHwgXzB4NTQ3MTM4W18weDFjODdhYigweDFlNCldKSwKICAgICAgICAgICAgICAgICAgKF8weDU0NzEzOCA9IHsKICAgICAgICAgICAgICAgICAgICBnZXQ6IF8weDFlMTg3MiwKICAgICAgICAgICAgICAgICAgICBzZXQ6IF8weGQyZmQ4OSwKICAgICAgICAgICAgICAgICAgfSkpCiAgICAgICAgICAgICAgICA6IChfMHg1NDcxMzggPSBfMHgyODkxNjgpLAogICAgICAgICAgICAgIHZvaWQgKC0weDFhNzcgKyAtMHgxMzZmICsgLTB4ZWIgKiAtMHgzMikgIT09IF8weDYwYTBkNyAmJgogICAgICAgICAgICAgICAgKHZvaWQgKC0weDUxOSArIC0weDEgKiAtMHgxMjQ1ICsgLTB4MiAqIDB4Njk2KSA9PT0gXzB4NWEyYmUwCiAgICAgICAgICAgICAgICAgID8gKF8weDVhMmJlMCA9IF8weDYwYTBkNykKICAgICAgICAgICAgICAgICAgOiBfMHgxYzg3YWIoMHgxZWUpID09IHR5cGVvZiBfMHg1YTJiZTAKICAgICAgICAgICAgICAgICAgPyAoXzB4NWEyYmUwID0gW18weDVhMmJlMCwgXzB4NjBhMGQ3XSkKICAgICAgICAgICAgICAgICAgOiBfMHg1YTJiZTBbXzB4MWM4N2FiKDB4MzZlKV0oXzB4NjBhMGQ3KSkpOwogICAgICAgICAgfQogICAgICAgIGlmICgKICAgICAgICAgIDB4NzhjICsgMHgxZDcxICogLTB4MSArIDB4MTVlNSAqIDB4MSA9PT0gXzB4NGNkZjExIHx8CiAgICAgICAgICAtMHg0OSAqIDB4NiArIDB4MWUgKiAweGQyICsgLTB4MSAqIDB4MTZlNSA9PT0gXzB4NGNkZjExCiAgICAgICAgKSB7CiAgICAgICAgICBpZiAodm9pZCAoMHgyMWRiICsgMHgyMmQgKiAweGQgKyAtMHgzZTI0KSA9PT0gXzB4NWEyYmUwKQogICAgICAgICAgICBfMHg1YTJiZTAgPSBmdW5jdGlvbiAoXzB4NTM0NWIwLCBfMHgxYTY1OWIpIHsKICAgICAgICAgICAgICByZXR1cm4gXzB4MWE2NTliOwogICAgICAgICAgICB9OwogICAgICAgICAgZWxzZSB7CiAgICAgICAgICAgIGlmICgiZnVuY3Rpb24iICE9IHR5cGVvZiBfMHg1YTJiZTApIHsKICAgICAgICAgICAgICB2YXIgXzB4MzM2ZGFhID0gXzB4NWEyYmUwOwogICAgICAgICAgICAgIF8weDVhMmJlMCA9IGZ1bmN0aW9uIChfMHgzMGUwNWQsIF8weGYzYjRkZikgewogICAgICAgICAgICAgICAgdmFyIF8weDRkOWU3ZiA9IF8weDFjODdhYjsKICAgICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICAgIHZhciBfMHgzNjJjNTIgPSBfMHhmM2I0ZGYsCiAgICAgICAgICAgICAgICAgICAgXzB4MjJlZDhhID0gMHgxICogMHgxZjNjICsgLTB4NjEwICsgLTB4MTkyYzsKICAgICAgICAgICAgICAgICAgXzB4MjJlZDhhIDwgXzB4MzM2ZGFhW18weDRkOWU3ZigweDI1OSldOwogICAgICAgICAgICAgICAgICBfMHgyMmVkOGErKwogICAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgICBfMHgzNjJjNTIgPSBfMHgzMzZkYWFbXzB4MjJlZDhhXVsiY2FsbCJdKAogICAgICAgICAgICAgICAgICAgIF8weDMwZTA1ZCwKICAgICAgICAgICAgICAgICAgICBfMHgzNjJjNTIKICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgIHJldHVybiBfMHgzNjJjNTI7CiAgICAgICAgICAgICAgfTsKICAgICAgICAgICAgfSBlbHNlIHsKICAgICAgICAgICAgICB2YXIgXzB4NWFlZDNiID0gXzB4NWEyYmUwOwogICAgICAgICAgICAgIF8weDVhMmJlMCA9IGZ1bmN0aW9uIChfMHg1ZGM5NzgsIF8weDVkYjE2MCkgewogICAgICAgICAgICAgICAgcmV0dXJuIF8weDVhZWQzYlsiY2FsbCJdKF8weDVkYzk3OCwgXzB4NWRiMTYwKTsKICAgICAgICAgICAgICB9OwogICAgICAgICAgICB9CiAgICAgICAgICB9CiAgICAgICAgICBfMHhjNGIxMjRbXzB4MWM4N2FiKDB4MzZlKV0oXzB4NWEyYmUwKTsKICAgICAgICB9CiAgICAgICAgMHgxNzdhICsgLTB4ZTcgKiAtMHgxYyArIDB4MjIgKiAtMHgxNmYgIT09IF8weDRjZGYxMSAmJgogICAgICAgICAgKDB4M2FmICsgMHg5ICogLTB4MjE3ICsgMHg1MGIgKiAweDMgPT09IF8weDRjZGYxMQogICAgICAgICAgICA/ICgoXzB4MmY0NmE1W18weDFjODdhYigweDMyYildID0gXzB4NTQ3MTM4W18weDFjODdhYigweDMyYildKSwKICAgICAgICAgICAgICAoXzB4MmY0NmE1W18weDFjODdhYigweDFlNCldID0gXzB4NTQ3MTM4W18weDFjODdhYigweDFlNCldKSkKICAgICAgICAgICAgOiAweDE4YTMgKiAtMHgxICsgMHgyNjNjICsgLTB4ZDk3ID09PSBfMHg0Y2RmMTEKICAgICAgICAgICAgPyAoXzB4MmY0NmE1W18weDFjODdhYigweDJlNCldID0gXzB4NTQ3MTM4KQogICAgICAgICAgICA6IC0weDQgKiAtMHgzMWIgKyAtMHg4MzcgKiAweDQgKyAtMHg1ICogLTB4NDE3ID09PSBfMHg0Y2RmMTEKICAgICAgICAgICAgPyAoXzB4MmY0NmE1W18weDFjODdhYigweDMyYildID0gXzB4NTQ3MTM4KQogICAgICAgICAgICA6IC0weDFhMmUgKyAweDIgKiAweDEzMWQgKyAtMHhjMDggPT09IF8weDRjZGYxMSAmJgogICAgICAgICAgICAgIChfMHgyZjQ2YTVbXzB4MWM4N2FiKDB4MWU0KV0gPSBfMHg1NDcxMzgpLAogICAgICAgICAgXzB4MWRkMzEzCiAgICAgICAgICAgID8gLTB4MSAqIC0weDE3NTcgKyAweDFhZGEgKyAtMHgzMjMwID09PSBfMHg0Y2RmMTEKICAgICAgICAgICAgICA/IChfMHhjNGIxMjRbXzB4MWM4N2FiKDB4MzZlKV0oZnVuY3Rpb24gKF8weGI4ODZjMSwgXzB4M2E2YmY1KSB7CiAgICAgICAgICAgICAgICAgIHZhciBfMHgyODhkNjcgPSBfMHgxYzg3YWI7CiAgICAgICAgICAgICAgICAgIHJldHVybiBfMHg1NDcxMzhbXzB4Mjg4ZDY3KDB4MzJiKV1bXzB4Mjg4ZDY3KDB4MzM0KV0oCiAgICAgICAgICAgICAgICAgICAgXzB4Yjg4NmMxLAogICAgICAgICAgICAgICAgICAgIF8weDNhNmJmNQogICAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgICAgfSksCiAgICAgICAgICAgICAgICBfMHhjNGIxMjRbXzB4MWM4N2FiKDB4MzZlKV0oZnVuY3Rpb24gKF8weDMzNzQ1MiwgXzB4NTA2MDhkKSB7CiAgICAgICAgICAgICAgICAgIHZhciBfMHg0NGI4OTYgPSBfMHgxYzg3YWI7CiAgICAgICAgICAgICAgICAgIHJldHVybiBfMHg1NDcxMzhbXzB4NDRiODk2KDB4MWU0KV1bXzB4NDRiODk2KDB4MzM0KV0oCiAgICAgICAgICAgICAgICAgICAgXzB4MzM3NDUyLAogICAgICAgICAgICAgICAgICAgIF8weDUwNjA4ZAogICAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgICAgfSkpCiAgICAgICAgICAgICAgOiAtMHgyICogMHg5M2QgKyAweDI5NyArIC0weDEzOSAqIC0weGQgPT09IF8weDRjZGYxMQogICAgICAgICAgICAgID8gXzB4YzRiMTI0WyJwdXNoIl0oXzB4NTQ3MTM4KQogICAgICAgICAgICAgIDogXzB4YzRiMTI0W18weDFjODdhYigweDM2ZSldKGZ1bmN0aW9uIChfMHgxZTI0YzcsIF8weDEyMGM2NCkgewogICAgICAgICAgICAgICAgICB2YXIgXzB4M2UzMjk0ID0gXzB4MWM4N2FiOwogICAgICAgICAgICAgICAgICByZXR1cm4gXzB4NTQ3MTM4W18weDNlMzI5NCgweDMzNCldKF8weDFlMjRjNywgXzB4MTIwYzY0KTsKICAgICAgICAgICAgICAgIH0pCiAgICAgICAgICAgIDogT2JqZWN0W18weDFjODdhYigweDE3NSldKF8weDEwMjZkOCwgXzB4MTUwYTgzLCBfMHgyZjQ2YTUpKTsKICAgICAgfQogICAgICBmdW5jdGlvbiBfMHg0YzNhMGQoXzB4NDgyMDdmLCBfMHgyNTdlMzUpIHsKICAgICAgICB2YXIgXzB4MTI0OWU3ID0gd18weDI1ZjM7CiAgICAgICAgZm9yICgKICAgICAgICAgIHZhciBfMHg0N2ZiYmQsCiAgICAgICAgICAgIF8weDQwMjc3NCwKICAgICAgICAgICAgXzB4MzMzZTNhID0gW10sCiAgICAgICAgICAgIF8weGU1ZmIxZSA9IG5ldyBNYXAoKSwKICAgICAgICAgICAgXzB4MTVmMTk0ID0gbmV3IE1hcCgpLAogICAgICAgICAgICBfMHg0MWExYzEgPSAtMHgxICogMHg1NzUgKyAtMHgxM2MwICsgLTB4MWIgKiAtMHhlZjsKICAgICAgICAgIF8weDQxYTFjMSA8IF8weDI1N2UzNVtfMHgxMjQ5ZTcoMHgyNTkpXTsKICAgICAgICAgIF8weDQxYTFjMSsrCiAgICAgICAgKSB7CiAgICAgICAgICB2YXIgXzB4NjNkZGYzID0gXzB4MjU3ZTM1W18weDQxYTFjMV07CiAgICAgICAgICBpZiAoQXJyYXlbXzB4MTI0OWU3KDB4MmFmKV0oXzB4NjNkZGYzKSkgewogICAgICAgICAgICB2YXIgXzB4NDQ2MzY2LAogICAgICAgICAgICAgIF8weDE4NjM4NSwKICAgICAgICAgICAgICBfMHgxOTE4NmYgPQogICAgICAgICAgICAgICAgXzB4NjNkZGYzWy0weDViYyAqIDB4NCArIDB4ZjZhICogLTB4MSArIC0weDMgKiAtMHhjYzldLAogICAgICAgICAgICAgIF8weDQ5MTFjMCA9IF8weDYzZGRmM1sweDEgKiAweDQ2ICsgLTB4YjczICsgMHhiMmZdLAogICAgICAgICAgICAgIF8weDM5ZjZhMSA9IF8weDYzZGRmM1sibGVuZ3RoIl0gPiAtMHg0ICogLTB4MTAxICsgLTB4ZTZjICsgMHhhNmIsCiAgICAgICAgICAgICAgXzB4MjdiOGUxID0gXzB4MTkxODZmID49IDB4Yjc2ICsgMHg3MyAqIC0weDM0ICsgMHg3MSAqIDB4MWI7CiAgICAgICAgICAgIGlmICgKICAgICAgICAgICAgICAoXzB4MjdiOGUxCiAgICAgICAgICAgICAgICA/ICgoXzB4NDQ2MzY2ID0gXzB4NDgyMDdmKSwKICAgICAgICAgICAgICAgICAgMHgyNmMgKyAtMHgxNTdkICsgLTB4NjViICogLTB4MyAhPQogICAgICAgICAgICAgICAgICAgIChfMHgxOTE4NmYgLT0gMHgyMzI0ICsgMHgyNyAqIDB4YmUgKyAtMHg0MDExKSAmJgogICAgICAgICAgICAgICAgICAgIChfMHgxODYzODUgPSBfMHg0MDI3NzQgPSBfMHg0MDI3NzQgfHwgW10pKQogICAgICAgICAgICAgICAgOiAoKF8weDQ0NjM2NiA9IF8weDQ4MjA3ZltfMHgxMjQ5ZTcoMHgzNDQpXSksCiAgICAgICAgICAgICAgICAgIC0weDcgKiAweDI5NyArIDB4MWIyNiArIC0weDkwNSAhPT0gXzB4MTkxODZmICYmCiAgICAgICAgICAgICAgICAgICAgKF8weDE4NjM4NSA9IF8weDQ3ZmJiZCA9IF8weDQ3ZmJiZCB8fCBbXSkpLAogICAgICAgICAgICAgIDB4MTNkNiAqIC0weDEgKyAweDEgKiAweGJiNyArIDB4ODFmICE9PSBfMHgxOTE4NmYgJiYgIV8weDM5ZjZhMSkKICAgICAgICAgICAgKSB7CiAgICAgICAgICAgICAgdmFyIF8weDNmMjk1ZiA9IF8weDI3YjhlMSA/IF8weDE1ZjE5NCA6IF8weGU1ZmIxZSwKICAgICAgICAgICAgICAgIF8weDU2NmM3YiA9CiAgICAgICAgICAgICAgICAgIF8weDNmMjk1ZltfMHgxMjQ5ZTcoMHgzMmIpXShfMHg0OTExYzApIHx8CiAgICAgICAgICAgICAgICAgIC0weDE4OCAqIC0weGIgKyAweDNlICogMHg0OSArIC0weDIyODY7CiAgICAgICAgICAgICAgaWYgKAogICAgICAgICAgICAgICAgISgweDkwMyAqIC0weDEgKyAtMHgxZiAqIC0weDhkICsgMHgxICogLTB4ODEwKSA9PT0gXzB4NTY2YzdiIHx8CiAgICAgICAgICAgICAgICAoLTB4NDMgKiAweDUgKyAtMHgxYzZjICsgMHgyZiAqIDB4YTIgPT09IF8weDU2NmM3YiAmJgogICAgICAgICAgICAgICAgICAtMHg3MzcgKyAtMHgxYWMyICsgMHgyMWZkICE9PSBfMHgxOTE4NmYpIHx8CiAgICAgICAgICAgICAgICAoMHhkZDIgKyAtMHgyMDJiICsgMHgxMjVkID09PSBfMHg1NjZjN2IgJiYKICAgICAgICAgICAgICAgICAgLTB4MSAqIDB4MTE4ZCArIC0weDJiOCAqIC0weDMgKyAweDggKiAweDEyZCAhPT0gXzB4MTkxODZmKQogICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgIHRocm93IG5ldyBFcnJvcigKICAgICAgICAgICAgICAgICAgIkF0dGVtcHRlZFx4MjB0b1x4MjBkZWNvcmF0ZVx4MjBhXHgyMHB1YmxpY1x4MjBtZXRob2QvYWNjZXNzb3JceDIwdGhhdFx4MjBoYXNceDIwdGhlXHgyMHNhbWVceDIwbmFtZVx4MjBhc1x4MjBhXHgyMHByZXZpb3VzbHlceDIwZGVjb3JhdGVkXHgyMHB1YmxpY1x4MjBtZXRob2QvYWNjZXNzb3IuXHgyMFRoaXNceDIwaXNceDIwbm90XHgyMGN1cnJlbnRseVx4MjBzdXBwb3J0ZWRceDIwYnlceDIwdGhlXHgyMGRlY29yYXRvcnNceDIwcGx1Z2luLlx4MjBQcm9wZXJ0eVx4MjBuYW1lXHgyMHdhczpceDIwIiArCiAgICAgICAgICAgICAgICAgICAgXzB4NDkxMWMwCiAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgICFfMHg1NjZjN2IgJiYKICAgICAgICAgICAgICBfMHgxOTE4NmYgPiAweGYgKiAtMHgyNmYgKyAweDEgKiAweDc5ZCArIDB4MWNlNiAqIDB4MQogICAgICAgICAgICAgICAgPyBfMHgzZjI5NWZbXzB4MTI0OWU3KDB4MWU0KV0oXzB4NDkxMWMwLCBfMHgxOTE4NmYpCiAgICAgICAgICAgICAgICA6IF8weDNmMjk1Zlsic2V0Il0oCiAgICAgICAgICAgICAgICAgICAgXzB4NDkxMWMwLAogICAgICAgICAgICAgICAgICAgICEoMHg0YSAqIDB4NzEgKyAtMHhhZCAqIDB4MiArIDB4NiAqIC0weDUzOCkKICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgfQogICAgICAgICAgICBfMHgzNDNhMWUoCiAgICAgICAgICAgICAgXzB4MzMzZTNhLAogICAgICAgICAgICAgIF8weDQ0NjM2NiwKICAgICAgICAgICAgICBfMHg2M2RkZjMsCiAgICAgICAgICAgICAgXzB4NDkxMWMwLAogICAgICAgICAgICAgIF8weDE5MTg2ZiwKICAgICAgICAgICAgICBfMHgyN2I4ZTEsCiAgICAgICAgICAgICAgXzB4MzlmNmExLAogICAgICAgICAgICAgIF8weDE4NjM4NQogICAgICAgICAgICApOwogICAgICAgICAgfQogICAgICAgIH0KICAgICAgICByZXR1cm4gKAogICAgICAgICAgXzB4NDVkMzY3KF8weDMzM2UzYSwgXzB4NDdmYmJkKSwKICAgICAgICAgIF8weDQ1ZDM2NyhfMHgzMzNlM2EsIF8weDQwMjc3NCksCiAgICAgICAgICBfMHgzMzNlM2EKICAgICAgICApOwogICAgICB9CiAgICAgIGZ1bmN0aW9uIF8weDQ1ZDM2NyhfMHg1OWZmYzgsIF8weDVhZTU5YikgewogICAgICAgIHZhciBfMHg1Yjk2NWUgPSB3XzB4MjVmMzsKICAgICAgICBfMHg1YWU1OWIgJiYKICAgICAgICAgIF8weDU5ZmZjOFtfMHg1Yjk2NWUoMHgzNmUpXShmdW5jdGlvbiAoXzB4M2VkMjhlKSB7CiAgICAgICAgICAgIHZhciBfMHg1OTg1ZmIgPSBfMHg1Yjk2NWU7CiAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgdmFyIF8weDViY2M5NCA9IDB4MTU2YSArIDB4MThlMCArIC0weDJlNGE7CiAgICAgICAgICAgICAgXzB4NWJjYzk0IDwgXzB4NWFlNTliWyJsZW5ndGgiXTsKICAgICAgICAgICAgICBfMHg1YmNjOTQrKwogICAgICAgICAgICApCiAgICAgICAgICAgICAgXzB4NWFlNTliW18weDViY2M5NF1bXzB4NTk4NWZiKDB4MzM0KV0oXzB4M2VkMjhlKTsKICAgICAgICAgICAgcmV0dXJuIF8weDNlZDI4ZTsKICAgICAgICAgIH0pOwogICAgICB9CiAgICAgIHJldHVybiBmdW5jdGlvbiAoXzB4MzNiNGFlLCBfMHgzMzlkMTEsIF8weDVlYmMzNikgewogICAgICAgIHJldHVybiB7CiAgICAgICAgICBlOiBfMHg0YzNhMGQoXzB4MzNiNGFlLCBfMHgzMzlkMTEpLAogICAgICAgICAgZ2V0IGMoKSB7CiAgICAgICAgICAgIHJldHVybiAoZnVuY3Rpb24gKF8weDkyNDc0ZSwgXzB4MzQzYzE2KSB7CiAgICAgICAgICAgICAgdmFyIF8weDNjYzRkMiA9IHdfMHgyNWYzOwogICAgICAgICAgICAgIGlmIChfMHgzNDNjMTZbImxlbmd0aCJdID4gLTB4MjcxICsgLTB4MjY5MCArIDB4MjkwMSkgewogICAgICAgICAgICAgICAgZm9yICgKICAgICAgICAgICAgICAgICAgdmFyIF8weDE4ZjY2YyA9IFtdLAogICAgICAgICAgICAgICAgICAgIF8weDFkZDZlYiA9IF8weDkyNDc0ZSwKICAgICAgICAgICAgICAgICAgICBfMHgxZDg4MzMgPSBfMHg5MjQ3NGVbXzB4M2NjNGQyKDB4MzQxKV0sCiAgICAgICAgICAgICAgICAgICAgXzB4MTYzMDI1ID0KICAgICAgICAgICAgICAgICAgICAgIF8weDM0M2MxNltfMHgzY2M0ZDIoMHgyNTkpXSAtCiAgICAgICAgICAgICAgICAgICAgICAoMHgxICogLTB4MjBlZCArIDB4MWY5NCArIDB4MiAqIDB4YWQpOwogICAgICAgICAgICAgICAgICBfMHgxNjMwMjUgPj0gMHhmYmEgKyAweDIyICogMHhiNiArIDB4MjdlNiAqIC0weDE7CiAgICAgICAgICAgICAgICAgIF8weDE2MzAyNS0tCiAgICAgICAgICAgICAgICApIHsKICAgICAgICAgICAgICAgICAgdmFyIF8weDQ5ZWE2ZiA9IHsKICAgICAgICAgICAgICAgICAgICB2OiAhKC0weDUyNCArIDB4MWEzNCArIC0weDE1MGYpLAogICAgICAgICAgICAgICAgICB9OwogICAgICAgICAgICAgICAgICB0cnkgewogICAgICAgICAgICAgICAgICAgIHZhciBfMHgxODFhOWQgPSBfMHgzNDNjMTZbXzB4MTYzMDI1XShfMHgxZGQ2ZWIsIHsKICAgICAgICAgICAgICAgICAgICAgIGtpbmQ6IF8weDNjYzRkMigweDE5YyksCiAgICAgICAgICAgICAgICAgICAgICBuYW1lOiBfMHgxZDg4MzMsCiAgICAgICAgICAgICAgICAgICAgICBhZGRJbml0aWFsaXplcjogXzB4MTM1Y2VhKF8weDE4ZjY2YywgXzB4NDllYTZmKSwKICAgICAgICAgICAgICAgICAgICB9KTsKICAgICAgICAgICAgICAgICAgfSBmaW5hbGx5IHsKICAgICAgICAgICAgICAgICAgICBfMHg0OWVhNmZbInYiXSA9ICEoLTB4MjNlICsgMHgxICogLTB4N2ZiICsgMHhhMzkpOwogICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICAgIHZvaWQgKC0weDEgKiAtMHgyNTNkICsgLTB4MjNkICsgLTB4ODAgKiAweDQ2KSAhPT0gXzB4MTgxYTlkICYmCiAgICAgICAgICAgICAgICAgICAgKF8weDJkZTVlNCgweDRjNSArIDB4Y2FmICsgLTB4MmU3ICogMHg2LCBfMHgxODFhOWQpLAogICAgICAgICAgICAgICAgICAgIChfMHgxZGQ2ZWIgPSBfMHgxODFhOWQpKTsKICAgICAgICAgICAgICAgIH0KICAgICAgICAgICAgICAgIHJldHVybiBbCiAgICAgICAgICAgICAgICAgIF8weDFkZDZlYiwKICAgICAgICAgICAgICAgICAgZnVuY3Rpb24gKCkgewogICAgICAgICAgICAgICAgICAgIHZhciBfMHg1NDMzOTYgPSBfMHgzY2M0ZDI7CiAgICAgICAgICAgICAgICAgICAgZm9yICgKICAgICAgICAgICAgICAgICAgICAgIHZhciBfMHgyYTcxNzUgPSAtMHhlNzEgKiAtMHgxICsgMHgyNGMwICsgLTB4YTNkICogMHg1OwogICAgICAgICAgICAgICAgICAgICAgXzB4MmE3MTc1IDwgXzB4MThmNjZjWyJsZW5ndGgiXTsKICAgICAgICAgICAgICAgICAgICAgIF8weDJhNzE3NSsrCiAgICAgICAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgICAgICAgXzB4MThmNjZjW18weDJhNzE3NV1bXzB4NTQzMzk2KDB4MzM0KV0oXzB4MWRkNmViKTsKICAgICAgICAgICAgICAgICAgfSwKICAgICAgICAgICAgICAgIF07CiAgICAgICAgICAgICAgfQogICAgICAgICAgICB9KShfMHgzM2I0YWUsIF8weDVlYmMzNik7CiAgICAgICAgICB9LAogICAgICAgIH07CiAgICAgIH07CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0OWFmMWYoXzB4M2E4NmVhLCBfMHgyNzBmNzIsIF8weDIxOWE2NykgewogICAgICByZXR1cm4gKF8weDQ5YWYxZiA9IF8weDQ1OTFjZCgpKShfMHgzYTg2ZWEsIF8weDI3MGY3MiwgXzB4MjE5YTY3KTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDNlNGZmNShfMHg1YjIwNmIsIF8weGRmYjNlNykgewogICAgICByZXR1cm4gZnVuY3Rpb24gKF8weDE5YmRiZCkgewogICAgICAgIHZhciBfMHgxY2FmMGYgPSB3XzB4MjVmMzsKICAgICAgICBfMHgxNWViOTAoXzB4ZGZiM2U3LCBfMHgxY2FmMGYoMHgyMjUpKSwKICAgICAgICAgIF8weDQ1ZDhiMShfMHgxOWJkYmQsIF8weDFjYWYwZigweDNiYSkpLAogICAgICAgICAgXzB4NWIyMDZiW18weDFjYWYwZigweDM2ZSldKF8weDE5YmRiZCk7CiAgICAgIH07CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxOTIwN2QoXzB4NDVjZWQ2LCBfMHhjZWUwM2YpIHsKICAgICAgdmFyIF8weDQxNDg5ZSA9IHdfMHgyNWYzOwogICAgICBpZiAoIV8weDQ1Y2VkNihfMHhjZWUwM2YpKSB0aHJvdyBuZXcgVHlwZUVycm9yKF8weDQxNDg5ZSgweDI1NSkpOwogICAgfQogICAgZnVuY3Rpb24gXzB4MTUxNzYyKAogICAgICBfMHg1MzVhMTksCiAgICAgIF8weDRlMGE2OSwKICAgICAgXzB4MjcwZjk2LAogICAgICBfMHg1MmY3ZTksCiAgICAgIF8weDIzZDM4OCwKICAgICAgXzB4NDkwOTRkLAogICAgICBfMHg0OWY2MjAsCiAgICAgIF8weDI1MTk4NywKICAgICAgXzB4NDBjMDY3CiAgICApIHsKICAgICAgdmFyIF8weDNiNDlkNyA9IHdfMHgyNWYzLAogICAgICAgIF8weDVkNTRkODsKICAgICAgc3dpdGNoIChfMHgyM2QzODgpIHsKICAgICAgICBjYXNlIC0weDE0YjkgKyAweDFkZDUgKyAtMHg5MWI6CiAgICAgICAgICBfMHg1ZDU0ZDggPSBfMHgzYjQ5ZDcoMHgxYjkpOwogICAgICAgICAgYnJlYWs7CiAgICAgICAgY2FzZSAtMHhlNGEgKyAweDEyYmUgKyAtMHg0NzI6CiAgICAgICAgICBfMHg1ZDU0ZDggPSBfMHgzYjQ5ZDcoMHgyNWEpOwogICAgICAgICAgYnJlYWs7CiAgICAgICAgY2FzZSAtMHgxMGYxICogLTB4MiArIDB4MTc5ICogMHgxOSArIC0weDQ2YjA6CiAgICAgICAgICBfMHg1ZDU0ZDggPSBfMHgzYjQ5ZDcoMHgxODEpOwogICAgICAgICAgYnJlYWs7CiAgICAgICAgY2FzZSAweDMgKiAtMHg1Y2YgKyAweDc3OCAqIDB4MSArIDB4MzUzICogMHgzOgogICAgICAgICAgXzB4NWQ1NGQ4ID0gXzB4M2I0OWQ3KDB4MzVkKTsKICAgICAgICAgIGJyZWFrOwogICAgICAgIGRlZmF1bHQ6CiAgICAgICAgICBfMHg1ZDU0ZDggPSBfMHgzYjQ5ZDcoMHgyM2MpOwogICAgICB9CiAgICAgIHZhciBfMHgyNDZmZjUsCiAgICAgICAgXzB4NGUwMmQxLAogICAgICAgIF8weDQ1Y2NmZCA9IHsKICAgICAgICAgIGtpbmQ6IF8weDVkNTRkOCwKICAgICAgICAgIG5hbWU6IF8weDQ5ZjYyMCA/ICIjIiArIF8weDRlMGE2OSA6IF8weDRlMGE2OSwKICAgICAgICAgIHN0YXRpYzogXzB4NDkwOTRkLAogICAgICAgICAgcHJpdmF0ZTogXzB4NDlmNjIwLAogICAgICAgIH0sCiAgICAgICAgXzB4NDczM2E0ID0gewogICAgICAgICAgdjogISgtMHhhZDUgKyAweDFmICogLTB4NTkgKyAtMHgxZjcgKiAtMHhiKSwKICAgICAgICB9OwogICAgICBpZiAoCiAgICAgICAgKDB4Y2Y2ICsgMHgxZTE1ICsgLTB4MyAqIDB4ZTU5ICE9PSBfMHgyM2QzODggJiYKICAgICAgICAgIChfMHg0NWNjZmRbXzB4M2I0OWQ3KDB4MjI1KV0gPSBfMHgzZTRmZjUoXzB4NTJmN2U5LCBfMHg0NzMzYTQpKSwKICAgICAgICBfMHg0OWY2MjAgfHwKICAgICAgICAgICgtMHgxMTJlICsgLTB4MjNhYiArIDB4MzRkOSAhPT0gXzB4MjNkMzg4ICYmCiAgICAgICAgICAgIDB4YTAwICsgLTB4MjM0YSArIDB4MTk0YyAhPT0gXzB4MjNkMzg4KSkKICAgICAgKSB7CiAgICAgICAgaWYgKC0weDMyNyAqIC0weDIgKyAtMHhiMDAgKyAweDRiNCA9PT0gXzB4MjNkMzg4KQogICAgICAgICAgXzB4MjQ2ZmY1ID0gZnVuY3Rpb24gKF8weDM2YmM0NCkgewogICAgICAgICAgICB2YXIgXzB4MmQ0OGZkID0gXzB4M2I0OWQ3OwogICAgICAgICAgICByZXR1cm4gXzB4MTkyMDdkKF8weDQwYzA2NywgXzB4MzZiYzQ0KSwgXzB4MjcwZjk2W18weDJkNDhmZCgweDJlNCldOwogICAgICAgICAgfTsKICAgICAgICBlbHNlIHsKICAgICAgICAgIHZhciBfMHgzMzljMDAgPQogICAgICAgICAgICAtMHgxNzQ2ICsgLTB4MWJiICsgMHhhZCAqIDB4MjUgPT09IF8weDIzZDM4OCB8fAogICAgICAgICAgICAtMHg4NTkgKyAweDQgKiAtMHhlMiArIC0weDI3ICogLTB4NGUgPT09IF8weDIzZDM4ODsKICAgICAgICAgIChfMHgzMzljMDAgfHwgMHg1ICogLTB4M2JmICsgLTB4MWQ5MCArIDB4MzA0ZSA9PT0gXzB4MjNkMzg4KSAmJgogICAgICAgICAgICAoXzB4MjQ2ZmY1ID0gXzB4NDlmNjIwCiAgICAgICAgICAgICAgPyBmdW5jdGlvbiAoXzB4MjZkYTY0KSB7CiAgICAgICAgICAgICAgICAgIHZhciBfMHgyMWJiM2EgPSBfMHgzYjQ5ZDc7CiAgICAgICAgICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgICAgICAgICAgXzB4MTkyMDdkKF8weDQwYzA2NywgXzB4MjZkYTY0KSwKICAgICAgICAgICAgICAgICAgICBfMHgyNzBmOTZbImdldCJdW18weDIxYmIzYSgweDMzNCldKF8weDI2ZGE2NCkKICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgIH0KICAgICAgICAgICAgICA6IGZ1bmN0aW9uIChfMHgyYWM4NzMpIHsKICAgICAgICAgICAgICAgICAgdmFyIF8weGEyZmQ0ZiA9IF8weDNiNDlkNzsKICAgICAgICAgICAgICAgICAgcmV0dXJuIF8weDI3MGY5NltfMHhhMmZkNGYoMHgzMmIpXVtfMHhhMmZkNGYoMHgzMzQpXSgKICAgICAgICAgICAgICAgICAgICBfMHgyYWM4NzMKICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgIH0pLAogICAgICAgICAgICAoXzB4MzM5YzAwIHx8CiAgICAgICAgICAgICAgLTB4MTRjNCAqIDB4MSArIC0weDIzMWUgKyAtMHhiMmUgKiAtMHg1ID09PSBfMHgyM2QzODgpICYmCiAgICAgICAgICAgICAgKF8weDRlMDJkMSA9IF8weDQ5ZjYyMAogICAgICAgICAgICAgICAgPyBmdW5jdGlvbiAoXzB4MWU2MWNhLCBfMHgxYzc3YjApIHsKICAgICAgICAgICAgICAgICAgICB2YXIgXzB4NWYyMjMwID0gXzB4M2I0OWQ3OwogICAgICAgICAgICAgICAgICAgIF8weDE5MjA3ZChfMHg0MGMwNjcsIF8weDFlNjFjYSksCiAgICAgICAgICAgICAgICAgICAgICBfMHgyNzBmOTZbXzB4NWYyMjMwKDB4MWU0KV1bXzB4NWYyMjMwKDB4MzM0KV0oCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDFlNjFjYSwKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MWM3N2IwCiAgICAgICAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICA6IGZ1bmN0aW9uIChfMHg0ZDVhMDgsIF8weDNhYzZjNikgewogICAgICAgICAgICAgICAgICAgIHZhciBfMHgxYmFlYzcgPSBfMHgzYjQ5ZDc7CiAgICAgICAgICAgICAgICAgICAgXzB4MjcwZjk2W18weDFiYWVjNygweDFlNCldW18weDFiYWVjNygweDMzNCldKAogICAgICAgICAgICAgICAgICAgICAgXzB4NGQ1YTA4LAogICAgICAgICAgICAgICAgICAgICAgXzB4M2FjNmM2CiAgICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgICAgfSk7CiAgICAgICAgfQogICAgICB9IGVsc2UKICAgICAgICAoXzB4MjQ2ZmY1ID0gZnVuY3Rpb24gKF8weDRmZjJiNSkgewogICAgICAgICAgcmV0dXJuIF8weDRmZjJiNVtfMHg0ZTBhNjldOwogICAgICAgIH0pLAogICAgICAgICAgLTB4MjBlYyArIDB4MTJlZSAqIDB4MiArIC0weDRmMCA9PT0gXzB4MjNkMzg4ICYmCiAgICAgICAgICAgIChfMHg0ZTAyZDEgPSBmdW5jdGlvbiAoXzB4MmY4MzgzLCBfMHg0YTIyZTUpIHsKICAgICAgICAgICAgICBfMHgyZjgzODNbXzB4NGUwYTY5XSA9IF8weDRhMjJlNTsKICAgICAgICAgICAgfSk7CiAgICAgIHZhciBfMHg1NTdjNjMgPSBfMHg0OWY2MjAKICAgICAgICA/IF8weDQwYzA2N1tfMHgzYjQ5ZDcoMHgzMDEpXSgpCiAgICAgICAgOiBmdW5jdGlvbiAoXzB4MmY0NDQ1KSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0ZTBhNjkgaW4gXzB4MmY0NDQ1OwogICAgICAgICAgfTsKICAgICAgXzB4NDVjY2ZkW18weDNiNDlkNygweDFkMCldID0KICAgICAgICBfMHgyNDZmZjUgJiYgXzB4NGUwMmQxCiAgICAgICAgICA/IHsKICAgICAgICAgICAgICBnZXQ6IF8weDI0NmZmNSwKICAgICAgICAgICAgICBzZXQ6IF8weDRlMDJkMSwKICAgICAgICAgICAgICBoYXM6IF8weDU1N2M2MywKICAgICAgICAgICAgfQogICAgICAgICAgOiBfMHgyNDZmZjUKICAgICAgICAgID8gewogICAgICAgICAgICAgIGdldDogXzB4MjQ2ZmY1LAogICAgICAgICAgICAgIGhhczogXzB4NTU3YzYzLAogICAgICAgICAgICB9CiAgICAgICAgICA6IHsKICAgICAgICAgICAgICBzZXQ6IF8weDRlMDJkMSwKICAgICAgICAgICAgICBoYXM6IF8weDU1N2M2MywKICAgICAgICAgICAgfTsKICAgICAgdHJ5IHsKICAgICAgICByZXR1cm4gXzB4NTM1YTE5KF8weDI1MTk4NywgXzB4NDVjY2ZkKTsKICAgICAgfSBmaW5hbGx5IHsKICAgICAgICBfMHg0NzMzYTRbInYiXSA9ICEoMHhlYTggKyAtMHhlOWYgKiAweDEgKyAweDEgKiAtMHg5KTsKICAgICAgfQogICAgfQogICAgZnVuY3Rpb24gXzB4MTVlYjkwKF8weDIwMjA1MSwgXzB4MWMyMzczKSB7CiAgICAgIHZhciBfMHg1MTUyMWIgPSB3XzB4MjVmMzsKICAgICAgaWYgKF8weDIwMjA1MVsidiJdKQogICAgICAgIHRocm93IG5ldyBFcnJvcigKICAgICAgICAgICJhdHRlbXB0ZWRceDIwdG9ceDIwY2FsbFx4MjAiICsgXzB4MWMyMzczICsgXzB4NTE1MjFiKDB4MTY4KQogICAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0NWQ4YjEoXzB4MmFkNTMyLCBfMHg0MjM3OTEpIHsKICAgICAgdmFyIF8weDE0NTYyZCA9IHdfMHgyNWYzOwogICAgICBpZiAoXzB4MTQ1NjJkKDB4MWVlKSAhPSB0eXBlb2YgXzB4MmFkNTMyKQogICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4NDIzNzkxICsgXzB4MTQ1NjJkKDB4MmY4KSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHhlZDUyNWIoXzB4NTIyYTg2LCBfMHg0MTc3ZTEpIHsKICAgICAgdmFyIF8weDQ0MjMyNCA9IHdfMHgyNWYzLAogICAgICAgIF8weDM5OTIwNCA9IHR5cGVvZiBfMHg0MTc3ZTE7CiAgICAgIGlmICgtMHgzNjEgKyAweDMgKiAweDJjNCArIDB4NGVhICogLTB4MSA9PT0gXzB4NTIyYTg2KSB7CiAgICAgICAgaWYgKF8weDQ0MjMyNCgweDE3ZCkgIT09IF8weDM5OTIwNCB8fCBudWxsID09PSBfMHg0MTc3ZTEpCiAgICAgICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKF8weDQ0MjMyNCgweDFmZCkpOwogICAgICAgIHZvaWQgKC0weDRhMCArIDB4MmU4ICsgMHgxYjgpICE9PSBfMHg0MTc3ZTFbXzB4NDQyMzI0KDB4MzJiKV0gJiYKICAgICAgICAgIF8weDQ1ZDhiMShfMHg0MTc3ZTFbXzB4NDQyMzI0KDB4MzJiKV0sIF8weDQ0MjMyNCgweDE3MCkpLAogICAgICAgICAgdm9pZCAoMHhjNCAqIC0weDFkICsgMHg2NTEgKyAweGZlMykgIT09IF8weDQxNzdlMVsic2V0Il0gJiYKICAgICAgICAgICAgXzB4NDVkOGIxKF8weDQxNzdlMVtfMHg0NDIzMjQoMHgxZTQpXSwgXzB4NDQyMzI0KDB4MjMxKSksCiAgICAgICAgICB2b2lkICgtMHgxNjhjICsgMHgxNmI1ICogMHgxICsgMHgyOSAqIC0weDEpICE9PSBfMHg0MTc3ZTFbImluaXQiXSAmJgogICAgICAgICAgICBfMHg0NWQ4YjEoXzB4NDE3N2UxW18weDQ0MjMyNCgweDNiOSldLCBfMHg0NDIzMjQoMHgyMmYpKTsKICAgICAgfSBlbHNlIHsKICAgICAgICBpZiAoXzB4NDQyMzI0KDB4MWVlKSAhPT0gXzB4Mzk5MjA0KQogICAgICAgICAgdGhyb3cgbmV3IFR5cGVFcnJvcigKICAgICAgICAgICAgKDB4MjBkNyArIDB4NyAqIC0weDM2MiArIDB4NyAqIC0weDE0ZiA9PT0gXzB4NTIyYTg2CiAgICAgICAgICAgICAgPyBfMHg0NDIzMjQoMHgyM2MpCiAgICAgICAgICAgICAgOiAweDEgKiAtMHgxMjU3ICsgLTB4MmQ5ICsgLTB4MjYgKiAtMHg4ZiA9PT0gXzB4NTIyYTg2CiAgICAgICAgICAgICAgPyAiY2xhc3MiCiAgICAgICAgICAgICAgOiAibWV0aG9kIikgKwogICAgICAgICAgICAgICJceDIwZGVjb3JhdG9yc1x4MjBtdXN0XHgyMHJldHVyblx4MjBhXHgyMGZ1bmN0aW9uXHgyMG9yXHgyMHZvaWRceDIwMCIKICAgICAgICAgICk7CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDI0NGMzOShfMHgxNzY4MykgewogICAgICByZXR1cm4gZnVuY3Rpb24gKCkgewogICAgICAgIHJldHVybiBfMHgxNzY4Myh0aGlzKTsKICAgICAgfTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDQ4NTMyYyhfMHg1NTAzZTApIHsKICAgICAgcmV0dXJuIGZ1bmN0aW9uIChfMHgyM2Q2YTEpIHsKICAgICAgICBfMHg1NTAzZTAodGhpcywgXzB4MjNkNmExKTsKICAgICAgfTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDIzZTZiKAogICAgICBfMHg1Y2YxOTgsCiAgICAgIF8weDU2NDZkYiwKICAgICAgXzB4MjZmOWY5LAogICAgICBfMHgzN2Y1NGIsCiAgICAgIF8weDQ3NTY1ZiwKICAgICAgXzB4MmFhOTQ4LAogICAgICBfMHhjY2FiYzEsCiAgICAgIF8weDVjM2E0OCwKICAgICAgXzB4OWZmYmRjCiAgICApIHsKICAgICAgdmFyIF8weDNlMmFkZiA9IHdfMHgyNWYzLAogICAgICAgIF8weDU5MmFlYiwKICAgICAgICBfMHgzNjVhNmUsCiAgICAgICAgXzB4NGU4ZDEwLAogICAgICAgIF8weDU4OTAwOCwKICAgICAgICBfMHgxN2Q5NWEsCiAgICAgICAgXzB4MTFjOWFiLAogICAgICAgIF8weDlhN2JiZCA9IF8weDI2ZjlmOVsweGE0NiArIDB4YjNjICsgLTB4MTU4Ml07CiAgICAgIGlmICgKICAgICAgICAoXzB4Y2NhYmMxCiAgICAgICAgICA/IChfMHg1OTJhZWIgPQogICAgICAgICAgICAgIDB4MjQgKiAweDQ3ICsgMHhmODUgKyAtMHgxOTgxID09PSBfMHg0NzU2NWYgfHwKICAgICAgICAgICAgICAweDE0Y2EgKyAtMHgxMDk5ICsgMHgyMTggKiAtMHgyID09PSBfMHg0NzU2NWYKICAgICAgICAgICAgICAgID8gewogICAgICAgICAgICAgICAgICAgIGdldDogXzB4MjQ0YzM5KF8weDI2ZjlmOVsweDcgKiAtMHgyZjAgKyAweDIyN2IgKyAtMHhkZThdKSwKICAgICAgICAgICAgICAgICAgICBzZXQ6IF8weDQ4NTMyYygKICAgICAgICAgICAgICAgICAgICAgIF8weDI2ZjlmOVstMHhhZCAqIC0weDE5ICsgLTB4YzNjICsgMHgyOSAqIC0weDFkXQogICAgICAgICAgICAgICAgICAgICksCiAgICAgICAgICAgICAgICAgIH0KICAgICAgICAgICAgICAgIDogMHgxYjk5ICogLTB4MSArIDB4MzY3ICsgLTB4MSAqIC0weDE4MzUgPT09IF8weDQ3NTY1ZgogICAgICAgICAgICAgICAgPyB7CiAgICAgICAgICAgICAgICAgICAgZ2V0OiBfMHgyNmY5ZjlbMHhiMSAqIDB4MjIgKyAweDMgKiAweGNlZiArIC0weDI0ICogMHgxYmJdLAogICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICA6IDB4MSAqIC0weDEwZiArIC0weDEgKiAtMHgyMDIzICsgLTB4MWYxMCA9PT0gXzB4NDc1NjVmCiAgICAgICAgICAgICAgICA/IHsKICAgICAgICAgICAgICAgICAgICBzZXQ6IF8weDI2ZjlmOVsweDM2ICogLTB4YTYgKyAtMHgxY2IyICsgMHgzZmI5XSwKICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgOiB7CiAgICAgICAgICAgICAgICAgICAgdmFsdWU6IF8weDI2ZjlmOVstMHg3YmEgKiAweDEgKyAweDE4NTAgKyAtMHgxMDkzXSwKICAgICAgICAgICAgICAgICAgfSkKICAgICAgICAgIDogLTB4MiAqIDB4NzEzICsgMHgyNmZlICsgMHgyN2MgKiAtMHhhICE9PSBfMHg0NzU2NWYgJiYKICAgICAgICAgICAgKF8weDU5MmFlYiA9IE9iamVjdFtfMHgzZTJhZGYoMHgyYTYpXShfMHg1NjQ2ZGIsIF8weDM3ZjU0YikpLAogICAgICAgIC0weDE5ODIgKyAweDE5NDcgKyAweDE0ICogMHgzID09PSBfMHg0NzU2NWYKICAgICAgICAgID8gKF8weDRlOGQxMCA9IHsKICAgICAgICAgICAgICBnZXQ6IF8weDU5MmFlYltfMHgzZTJhZGYoMHgzMmIpXSwKICAgICAgICAgICAgICBzZXQ6IF8weDU5MmFlYltfMHgzZTJhZGYoMHgxZTQpXSwKICAgICAgICAgICAgfSkKICAgICAgICAgIDogMHhlOWIgKyAtMHgyYTMgKyAweDVmYiAqIC0weDIgPT09IF8weDQ3NTY1ZgogICAgICAgICAgPyAoXzB4NGU4ZDEwID0gXzB4NTkyYWViWyJ2YWx1ZSJdKQogICAgICAgICAgOiAtMHgxMyAqIC0weDViICsgMHgxN2NiICsgLTB4MSAqIDB4MWU4OSA9PT0gXzB4NDc1NjVmCiAgICAgICAgICA/IChfMHg0ZThkMTAgPSBfMHg1OTJhZWJbXzB4M2UyYWRmKDB4MzJiKV0pCiAgICAgICAgICA6IDB4N2Q3ICogLTB4MSArIDB4NSAqIDB4ODEgKyAweDU1NiA9PT0gXzB4NDc1NjVmICYmCiAgICAgICAgICAgIChfMHg0ZThkMTAgPSBfMHg1OTJhZWJbInNldCJdKSwKICAgICAgICAiZnVuY3Rpb24iID09IHR5cGVvZiBfMHg5YTdiYmQpCiAgICAgICkKICAgICAgICB2b2lkICgweDEgKiAweDFlZTMgKyAweGQgKyAtMHgxZWYwKSAhPT0KICAgICAgICAgIChfMHg1ODkwMDggPSBfMHgxNTE3NjIoCiAgICAgICAgICAgIF8weDlhN2JiZCwKICAgICAgICAgICAgXzB4MzdmNTRiLAogICAgICAgICAgICBfMHg1OTJhZWIsCiAgICAgICAgICAgIF8weDVjM2E0OCwKICAgICAgICAgICAgXzB4NDc1NjVmLAogICAgICAgICAgICBfMHgyYWE5NDgsCiAgICAgICAgICAgIF8weGNjYWJjMSwKICAgICAgICAgICAgXzB4NGU4ZDEwLAogICAgICAgICAgICBfMHg5ZmZiZGMKICAgICAgICAgICkpICYmCiAgICAgICAgICAoXzB4ZWQ1MjViKF8weDQ3NTY1ZiwgXzB4NTg5MDA4KSwKICAgICAgICAgIDB4YzkxICogLTB4MSArIC0weDg5MyAqIC0weDEgKyAweDNmZSA9PT0gXzB4NDc1NjVmCiAgICAgICAgICAgID8gKF8weDM2NWE2ZSA9IF8weDU4OTAwOCkKICAgICAgICAgICAgOiAtMHgxICogMHgyMWRkICsgLTB4MTA5ICogLTB4MjQgKyAtMHgzNjYgPT09IF8weDQ3NTY1ZgogICAgICAgICAgICA/ICgoXzB4MzY1YTZlID0gXzB4NTg5MDA4W18weDNlMmFkZigweDNiOSldKSwKICAgICAgICAgICAgICAoXzB4MTdkOTVhID0KICAgICAgICAgICAgICAgIF8weDU4OTAwOFtfMHgzZTJhZGYoMHgzMmIpXSB8fCBfMHg0ZThkMTBbXzB4M2UyYWRmKDB4MzJiKV0pLAogICAgICAgICAgICAgIChfMHgxMWM5YWIgPSBfMHg1ODkwMDhbInNldCJdIHx8IF8weDRlOGQxMFtfMHgzZTJhZGYoMHgxZTQpXSksCiAgICAgICAgICAgICAgKF8weDRlOGQxMCA9IHsKICAgICAgICAgICAgICAgIGdldDogXzB4MTdkOTVhLAogICAgICAgICAgICAgICAgc2V0OiBfMHgxMWM5YWIsCiAgICAgICAgICAgICAgfSkpCiAgICAgICAgICAgIDogKF8weDRlOGQxMCA9IF8weDU4OTAwOCkpOwogICAgICBlbHNlCiAgICAgICAgZm9yICgKICAgICAgICAgIHZhciBfMHg0ZjE0NTggPQogICAgICAgICAgICBfMHg5YTdiYmRbImxlbmd0aCJdIC0gKDB4MjA0YyArIDB4Mjc3ICogMHg3ICsgLTB4ZSAqIDB4MzhhKTsKICAgICAgICAgIF8weDRmMTQ1OCA+PSAtMHgyM2MyICsgMHg5MSArIDB4MjMzMTsKICAgICAgICAgIF8weDRmMTQ1OC0tCiAgICAgICAgKSB7CiAgICAgICAgICB2YXIgXzB4MTg5YWM4OwogICAgICAgICAgdm9pZCAoLTB4MThmOCAqIC0weDEgKyAtMHgxNDNhICsgLTB4MSAqIDB4NGJlKSAhPT0KICAgICAgICAgICAgKF8weDU4OTAwOCA9IF8weDE1MTc2MigKICAgICAgICAgICAgICBfMHg5YTdiYmRbXzB4NGYxNDU4XSwKICAgICAgICAgICAgICBfMHgzN2Y1NGIsCiAgICAgICAgICAgICAgXzB4NTkyYWViLAogICAgICAgICAgICAgIF8weDVjM2E0OCwKICAgICAgICAgICAgICBfMHg0NzU2NWYsCiAgICAgICAgICAgICAgXzB4MmFhOTQ4LAogICAgICAgICAgICAgIF8weGNjYWJjMSwKICAgICAgICAgICAgICBfMHg0ZThkMTAsCiAgICAgICAgICAgICAgXzB4OWZmYmRjCiAgICAgICAgICAgICkpICYmCiAgICAgICAgICAgIChfMHhlZDUyNWIoXzB4NDc1NjVmLCBfMHg1ODkwMDgpLAogICAgICAgICAgICAtMHgyMmNiICsgLTB4MjA0MyAqIC0weDEgKyAweDI4OCA9PT0gXzB4NDc1NjVmCiAgICAgICAgICAgICAgPyAoXzB4MTg5YWM4ID0gXzB4NTg5MDA4KQogICAgICAgICAgICAgIDogMHgxYmQgKiAtMHgzICsgMHgyODMgKiAweDggKyAweDIgKiAtMHg3NzAgPT09IF8weDQ3NTY1ZgogICAgICAgICAgICAgID8gKChfMHgxODlhYzggPSBfMHg1ODkwMDhbXzB4M2UyYWRmKDB4M2I5KV0pLAogICAgICAgICAgICAgICAgKF8weDE3ZDk1YSA9CiAgICAgICAgICAgICAgICAgIF8weDU4OTAwOFtfMHgzZTJhZGYoMHgzMmIpXSB8fCBfMHg0ZThkMTBbXzB4M2UyYWRmKDB4MzJiKV0pLAogICAgICAgICAgICAgICAgKF8weDExYzlhYiA9IF8weDU4OTAwOFtfMHgzZTJhZGYoMHgxZTQpXSB8fCBfMHg0ZThkMTBbInNldCJdKSwKICAgICAgICAgICAgICAgIChfMHg0ZThkMTAgPSB7CiAgICAgICAgICAgICAgICAgIGdldDogXzB4MTdkOTVhLAogICAgICAgICAgICAgICAgICBzZXQ6IF8weDExYzlhYiwKICAgICAgICAgICAgICAgIH0pKQogICAgICAgICAgICAgIDogKF8weDRlOGQxMCA9IF8weDU4OTAwOCksCiAgICAgICAgICAgIHZvaWQgKC0weGFlYiArIDB4MSAqIDB4MWJiMyArIDB4NCAqIC0weDQzMikgIT09IF8weDE4OWFjOCAmJgogICAgICAgICAgICAgICh2b2lkICgtMHgyMzU5ICsgLTB4MyAqIC0weDMyMyArIDB4MTlmMCkgPT09IF8weDM2NWE2ZQogICAgICAgICAgICAgICAgPyAoXzB4MzY1YTZlID0gXzB4MTg5YWM4KQogICAgICAgICAgICAgICAgOiBfMHgzZTJhZGYoMHgxZWUpID09IHR5cGVvZiBfMHgzNjVhNmUKICAgICAgICAgICAgICAgID8gKF8weDM2NWE2ZSA9IFtfMHgzNjVhNmUsIF8weDE4OWFjOF0pCiAgICAgICAgICAgICAgICA6IF8weDM2NWE2ZVtfMHgzZTJhZGYoMHgzNmUpXShfMHgxODlhYzgpKSk7CiAgICAgICAgfQogICAgICBpZiAoCiAgICAgICAgMHgyMWVlICsgLTB4MTI5YiArIDB4ZjUzICogLTB4MSA9PT0gXzB4NDc1NjVmIHx8CiAgICAgICAgLTB4NDRkICogLTB4NyArIC0weGEyNyArIC0weDEzZjMgKiAweDEgPT09IF8weDQ3NTY1ZgogICAgICApIHsKICAgICAgICBpZiAodm9pZCAoMHgxMCAqIC0weDIxOCArIC0weDcwNyAqIDB4MSArIDB4Mjg4NykgPT09IF8weDM2NWE2ZSkKICAgICAgICAgIF8weDM2NWE2ZSA9IGZ1bmN0aW9uIChfMHg1NmI3MGIsIF8weDVlNGQ1NSkgewogICAgICAgICAgICByZXR1cm4gXzB4NWU0ZDU1OwogICAgICAgICAgfTsKICAgICAgICBlbHNlIHsKICAgICAgICAgIGlmIChfMHgzZTJhZGYoMHgxZWUpICE9IHR5cGVvZiBfMHgzNjVhNmUpIHsKICAgICAgICAgICAgdmFyIF8weDMxMDFhMSA9IF8weDM2NWE2ZTsKICAgICAgICAgICAgXzB4MzY1YTZlID0gZnVuY3Rpb24gKF8weDQ0OWJiZiwgXzB4NTE5NmQ4KSB7CiAgICAgICAgICAgICAgdmFyIF8weDM2MDA1MCA9IF8weDNlMmFkZjsKICAgICAgICAgICAgICBmb3IgKAogICAgICAgICAgICAgICAgdmFyIF8weDE0M2E0ZiA9IF8weDUxOTZkOCwKICAgICAgICAgICAgICAgICAgXzB4MzZlNGIxID0gLTB4MWVmOCArIC0weDMgKiAtMHhkMDEgKyAtMHg4MGIgKiAweDE7CiAgICAgICAgICAgICAgICBfMHgzNmU0YjEgPCBfMHgzMTAxYTFbXzB4MzYwMDUwKDB4MjU5KV07CiAgICAgICAgICAgICAgICBfMHgzNmU0YjErKwogICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgIF8weDE0M2E0ZiA9IF8weDMxMDFhMVtfMHgzNmU0YjFdW18weDM2MDA1MCgweDMzNCldKAogICAgICAgICAgICAgICAgICBfMHg0NDliYmYsCiAgICAgICAgICAgICAgICAgIF8weDE0M2E0ZgogICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICByZXR1cm4gXzB4MTQzYTRmOwogICAgICAgICAgICB9OwogICAgICAgICAgfSBlbHNlIHsKICAgICAgICAgICAgdmFyIF8weDFlMjkwMiA9IF8weDM2NWE2ZTsKICAgICAgICAgICAgXzB4MzY1YTZlID0gZnVuY3Rpb24gKF8weGU2OTk4ZCwgXzB4ZWM3YzkxKSB7CiAgICAgICAgICAgICAgdmFyIF8weDViYjFiNiA9IF8weDNlMmFkZjsKICAgICAgICAgICAgICByZXR1cm4gXzB4MWUyOTAyW18weDViYjFiNigweDMzNCldKF8weGU2OTk4ZCwgXzB4ZWM3YzkxKTsKICAgICAgICAgICAgfTsKICAgICAgICAgIH0KICAgICAgICB9CiAgICAgICAgXzB4NWNmMTk4WyJwdXNoIl0oXzB4MzY1YTZlKTsKICAgICAgfQogICAgICAweDgyZSArIDB4MTRjNSArIC0weDFjZjMgIT09IF8weDQ3NTY1ZiAmJgogICAgICAgICgtMHgxICogLTB4MWQ3MiArIDB4MTViMCArIDB4MyAqIC0weDExMGIgPT09IF8weDQ3NTY1ZgogICAgICAgICAgPyAoKF8weDU5MmFlYltfMHgzZTJhZGYoMHgzMmIpXSA9IF8weDRlOGQxMFtfMHgzZTJhZGYoMHgzMmIpXSksCiAgICAgICAgICAgIChfMHg1OTJhZWJbInNldCJdID0gXzB4NGU4ZDEwWyJzZXQiXSkpCiAgICAgICAgICA6IDB4MWRlNyArIC0weDE2ICogLTB4MTBhICsgLTB4MzRjMSA9PT0gXzB4NDc1NjVmCiAgICAgICAgICA/IChfMHg1OTJhZWJbXzB4M2UyYWRmKDB4MmU0KV0gPSBfMHg0ZThkMTApCiAgICAgICAgICA6IC0weDI1MDggKyAtMHgyNjY1ICsgMHg0YjcwID09PSBfMHg0NzU2NWYKICAgICAgICAgID8gKF8weDU5MmFlYltfMHgzZTJhZGYoMHgzMmIpXSA9IF8weDRlOGQxMCkKICAgICAgICAgIDogMHgxMSAqIC0weDlmICsgLTB4NmE1ICsgMHgxMTM4ID09PSBfMHg0NzU2NWYgJiYKICAgICAgICAgICAgKF8weDU5MmFlYltfMHgzZTJhZGYoMHgxZTQpXSA9IF8weDRlOGQxMCksCiAgICAgICAgXzB4Y2NhYmMxCiAgICAgICAgICA/IDB4OGY2ICogMHgxICsgLTB4YWU5ICsgMHhhICogMHgzMiA9PT0gXzB4NDc1NjVmCiAgICAgICAgICAgID8gKF8weDVjZjE5OFsicHVzaCJdKGZ1bmN0aW9uIChfMHgzMTAxNWIsIF8weDk3OWYyNykgewogICAgICAgICAgICAgICAgdmFyIF8weDE5MzhhMSA9IF8weDNlMmFkZjsKICAgICAgICAgICAgICAgIHJldHVybiBfMHg0ZThkMTBbImdldCJdW18weDE5MzhhMSgweDMzNCldKF8weDMxMDE1YiwgXzB4OTc5ZjI3KTsKICAgICAgICAgICAgICB9KSwKICAgICAgICAgICAgICBfMHg1Y2YxOThbXzB4M2UyYWRmKDB4MzZlKV0oZnVuY3Rpb24gKF8weDUwNjU4NCwgXzB4NDRjNDI4KSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4MjllN2U1ID0gXzB4M2UyYWRmOwogICAgICAgICAgICAgICAgcmV0dXJuIF8weDRlOGQxMFsic2V0Il1bXzB4MjllN2U1KDB4MzM0KV0oXzB4NTA2NTg0LCBfMHg0NGM0MjgpOwogICAgICAgICAgICAgIH0pKQogICAgICAgICAgICA6IDB4MjcgKiAtMHhkMCArIDB4NCAqIC0weDEyZCArIDB4MjQ2NiA9PT0gXzB4NDc1NjVmCiAgICAgICAgICAgID8gXzB4NWNmMTk4W18weDNlMmFkZigweDM2ZSldKF8weDRlOGQxMCkKICAgICAgICAgICAgOiBfMHg1Y2YxOThbXzB4M2UyYWRmKDB4MzZlKV0oZnVuY3Rpb24gKF8weDMzNDViNCwgXzB4ODQ1NjYyKSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4MWI3NzM0ID0gXzB4M2UyYWRmOwogICAgICAgICAgICAgICAgcmV0dXJuIF8weDRlOGQxMFtfMHgxYjc3MzQoMHgzMzQpXShfMHgzMzQ1YjQsIF8weDg0NTY2Mik7CiAgICAgICAgICAgICAgfSkKICAgICAgICAgIDogT2JqZWN0WyJkZWZpbmVQcm9wZXJ0eSJdKF8weDU2NDZkYiwgXzB4MzdmNTRiLCBfMHg1OTJhZWIpKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDc1NDg5OChfMHgyYmQyYzUsIF8weDJjM2RjZCwgXzB4MTE5NzgwKSB7CiAgICAgIHZhciBfMHg0MmIzZWUgPSB3XzB4MjVmMzsKICAgICAgZm9yICgKICAgICAgICB2YXIgXzB4MzI4ZjdkLAogICAgICAgICAgXzB4MTJhZGRmLAogICAgICAgICAgXzB4MjlhMDc5LAogICAgICAgICAgXzB4MzMzMGQ4ID0gW10sCiAgICAgICAgICBfMHg0ODQyOTMgPSBuZXcgTWFwKCksCiAgICAgICAgICBfMHg0YTJlYTggPSBuZXcgTWFwKCksCiAgICAgICAgICBfMHg0NzhlNWQgPSAweDEgKiAtMHgzZTEgKyAtMHgyMmI4ICsgMHgyNjk5OwogICAgICAgIF8weDQ3OGU1ZCA8IF8weDJjM2RjZFtfMHg0MmIzZWUoMHgyNTkpXTsKICAgICAgICBfMHg0NzhlNWQrKwogICAgICApIHsKICAgICAgICB2YXIgXzB4NWM3OTI3ID0gXzB4MmMzZGNkW18weDQ3OGU1ZF07CiAgICAgICAgaWYgKEFycmF5W18weDQyYjNlZSgweDJhZildKF8weDVjNzkyNykpIHsKICAgICAgICAgIHZhciBfMHgyNWVhMzQsCiAgICAgICAgICAgIF8weDViOWIxMiwKICAgICAgICAgICAgXzB4MzViNjQxID0gXzB4NWM3OTI3Wy0weDMzYiAqIDB4MSArIDB4ZWJlICsgMHgzICogLTB4M2Q2XSwKICAgICAgICAgICAgXzB4NDlhODAzID0gXzB4NWM3OTI3Wy0weDc4YSArIC0weDI5ICogMHg2MCArIDB4YyAqIDB4MWU5XSwKICAgICAgICAgICAgXzB4NDEwZGEwID0gXzB4NWM3OTI3W18weDQyYjNlZSgweDI1OSldID4gMHgxMjkxICsgLTB4MWUwMyArIDB4Yjc1LAogICAgICAgICAgICBfMHgzYzkxNjggPSBfMHgzNWI2NDEgPj0gLTB4MTNlMSAqIDB4MSArIDB4NzkzICsgLTB4NSAqIC0weDI3NywKICAgICAgICAgICAgXzB4NDFhZGE1ID0gXzB4MTE5NzgwOwogICAgICAgICAgaWYgKAogICAgICAgICAgICAoXzB4M2M5MTY4CiAgICAgICAgICAgICAgPyAoKF8weDI1ZWEzNCA9IF8weDJiZDJjNSksCiAgICAgICAgICAgICAgICAtMHg3ZTMgKyAtMHgxMDg3ICogMHgyICsgMHgyOGYxICE9CiAgICAgICAgICAgICAgICAgIChfMHgzNWI2NDEgLT0gMHg4NjcgKyAweGExYiArIDB4MTI3ZCAqIC0weDEpICYmCiAgICAgICAgICAgICAgICAgIChfMHg1YjliMTIgPSBfMHgxMmFkZGYgPSBfMHgxMmFkZGYgfHwgW10pLAogICAgICAgICAgICAgICAgXzB4NDEwZGEwICYmCiAgICAgICAgICAgICAgICAgICFfMHgyOWEwNzkgJiYKICAgICAgICAgICAgICAgICAgKF8weDI5YTA3OSA9IGZ1bmN0aW9uIChfMHgxMDZlZTUpIHsKICAgICAgICAgICAgICAgICAgICByZXR1cm4gXzB4MzdlMWUyKF8weDEwNmVlNSkgPT09IF8weDJiZDJjNTsKICAgICAgICAgICAgICAgICAgfSksCiAgICAgICAgICAgICAgICAoXzB4NDFhZGE1ID0gXzB4MjlhMDc5KSkKICAgICAgICAgICAgICA6ICgoXzB4MjVlYTM0ID0gXzB4MmJkMmM1WyJwcm90b3R5cGUiXSksCiAgICAgICAgICAgICAgICAweDEzYTMgKiAweDEgKyAtMHgyNTg5ICsgMHgxMWU2ICogMHgxICE9PSBfMHgzNWI2NDEgJiYKICAgICAgICAgICAgICAgICAgKF8weDViOWIxMiA9IF8weDMyOGY3ZCA9IF8weDMyOGY3ZCB8fCBbXSkpLAogICAgICAgICAgICAweGZhZCArIDB4MyAqIC0weGNlYiArIDB4MTcxNCAhPT0gXzB4MzViNjQxICYmICFfMHg0MTBkYTApCiAgICAgICAgICApIHsKICAgICAgICAgICAgdmFyIF8weDQ0MzBiMSA9IF8weDNjOTE2OCA/IF8weDRhMmVhOCA6IF8weDQ4NDI5MywKICAgICAgICAgICAgICBfMHgzYTlhNDcgPQogICAgICAgICAgICAgICAgXzB4NDQzMGIxW18weDQyYjNlZSgweDMyYildKF8weDQ5YTgwMykgfHwKICAgICAgICAgICAgICAgIDB4MTM5ZSArIC0weGEgKiAweDEzZCArIC0weDczYzsKICAgICAgICAgICAgaWYgKAogICAgICAgICAgICAgICEoLTB4MSAqIDB4NWRmICsgMHg5NGIgKyAtMHgzNmMpID09PSBfMHgzYTlhNDcgfHwKICAgICAgICAgICAgICAoMHgzICogMHgzOCArIC0weDI1YiAqIDB4NyArIC0weDggKiAtMHgxZmIgPT09IF8weDNhOWE0NyAmJgogICAgICAgICAgICAgICAgMHg1NCArIDB4MTUyZSArIC0weDJhICogMHg4MyAhPT0gXzB4MzViNjQxKSB8fAogICAgICAgICAgICAgICgweDIgKiAtMHgxY2IgKyAweDFlNzEgKyAtMHgxYWQ3ICogMHgxID09PSBfMHgzYTlhNDcgJiYKICAgICAgICAgICAgICAgIDB4NmU5ICsgMHhhNzEgKyAweGMxICogLTB4MTcgIT09IF8weDM1YjY0MSkKICAgICAgICAgICAgKQogICAgICAgICAgICAgIHRocm93IG5ldyBFcnJvcigKICAgICAgICAgICAgICAgICJBdHRlbXB0ZWRceDIwdG9ceDIwZGVjb3JhdGVceDIwYVx4MjBwdWJsaWNceDIwbWV0aG9kL2FjY2Vzc29yXHgyMHRoYXRceDIwaGFzXHgyMHRoZVx4MjBzYW1lXHgyMG5hbWVceDIwYXNceDIwYVx4MjBwcmV2aW91c2x5XHgyMGRlY29yYXRlZFx4MjBwdWJsaWNceDIwbWV0aG9kL2FjY2Vzc29yLlx4MjBUaGlzXHgyMGlzXHgyMG5vdFx4MjBjdXJyZW50bHlceDIwc3VwcG9ydGVkXHgyMGJ5XHgyMHRoZVx4MjBkZWNvcmF0b3JzXHgyMHBsdWdpbi5ceDIwUHJvcGVydHlceDIwbmFtZVx4MjB3YXM6XHgyMCIgKwogICAgICAgICAgICAgICAgICBfMHg0OWE4MDMKICAgICAgICAgICAgICApOwogICAgICAgICAgICAhXzB4M2E5YTQ3ICYmIF8weDM1YjY0MSA+IC0weDczICogLTB4NDUgKyAweDc5OCArIC0weDI2OTUKICAgICAgICAgICAgICA/IF8weDQ0MzBiMVsic2V0Il0oXzB4NDlhODAzLCBfMHgzNWI2NDEpCiAgICAgICAgICAgICAgOiBfMHg0NDMwYjFbInNldCJdKAogICAgICAgICAgICAgICAgICBfMHg0OWE4MDMsCiAgICAgICAgICAgICAgICAgICEoMHgxICogMHhiN2MgKyAtMHgxNWNlICogMHgxICsgMHhhNTIpCiAgICAgICAgICAgICAgICApOwogICAgICAgICAgfQogICAgICAgICAgXzB4MjNlNmIoCiAgICAgICAgICAgIF8weDMzMzBkOCwKICAgICAgICAgICAgXzB4MjVlYTM0LAogICAgICAgICAgICBfMHg1Yzc5MjcsCiAgICAgICAgICAgIF8weDQ5YTgwMywKICAgICAgICAgICAgXzB4MzViNjQxLAogICAgICAgICAgICBfMHgzYzkxNjgsCiAgICAgICAgICAgIF8weDQxMGRhMCwKICAgICAgICAgICAgXzB4NWI5YjEyLAogICAgICAgICAgICBfMHg0MWFkYTUKICAgICAgICAgICk7CiAgICAgICAgfQogICAgICB9CiAgICAgIHJldHVybiAoCiAgICAgICAgXzB4ZGZjOWFhKF8weDMzMzBkOCwgXzB4MzI4ZjdkKSwKICAgICAgICBfMHhkZmM5YWEoXzB4MzMzMGQ4LCBfMHgxMmFkZGYpLAogICAgICAgIF8weDMzMzBkOAogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4ZGZjOWFhKF8weDE4NjgwZSwgXzB4OTk0MzAzKSB7CiAgICAgIHZhciBfMHgzZGY2MTEgPSB3XzB4MjVmMzsKICAgICAgXzB4OTk0MzAzICYmCiAgICAgICAgXzB4MTg2ODBlW18weDNkZjYxMSgweDM2ZSldKGZ1bmN0aW9uIChfMHgzNzIwZDYpIHsKICAgICAgICAgIHZhciBfMHhjOTA1ZWUgPSBfMHgzZGY2MTE7CiAgICAgICAgICBmb3IgKAogICAgICAgICAgICB2YXIgXzB4NDAwMDQ3ID0gMHgxN2RjICsgLTB4M2RmICogMHg2ICsgLTB4YTI7CiAgICAgICAgICAgIF8weDQwMDA0NyA8IF8weDk5NDMwM1sibGVuZ3RoIl07CiAgICAgICAgICAgIF8weDQwMDA0NysrCiAgICAgICAgICApCiAgICAgICAgICAgIF8weDk5NDMwM1tfMHg0MDAwNDddW18weGM5MDVlZSgweDMzNCldKF8weDM3MjBkNik7CiAgICAgICAgICByZXR1cm4gXzB4MzcyMGQ2OwogICAgICAgIH0pOwogICAgfQogICAgZnVuY3Rpb24gXzB4MjI1OGI5KF8weDMxZDdlYywgXzB4MjJkY2RiKSB7CiAgICAgIHZhciBfMHg0MTQ3NGIgPSB3XzB4MjVmMzsKICAgICAgaWYgKF8weDIyZGNkYltfMHg0MTQ3NGIoMHgyNTkpXSA+IDB4MjZhMCArIC0weDE0NWYgKyAtMHgxMjQxKSB7CiAgICAgICAgZm9yICgKICAgICAgICAgIHZhciBfMHgzYzU0ZTkgPSBbXSwKICAgICAgICAgICAgXzB4OGNiNDI4ID0gXzB4MzFkN2VjLAogICAgICAgICAgICBfMHgyMzQ0Y2QgPSBfMHgzMWQ3ZWNbIm5hbWUiXSwKICAgICAgICAgICAgXzB4MTZmOGFmID0KICAgICAgICAgICAgICBfMHgyMmRjZGJbXzB4NDE0NzRiKDB4MjU5KV0gLSAoMHgxMzIxICsgMHgxMzg4ICsgMHgxMzU0ICogLTB4Mik7CiAgICAgICAgICBfMHgxNmY4YWYgPj0gMHgxYTc5ICsgMHg2ZiAqIDB4MmEgKyAtMHgyY2FmOwogICAgICAgICAgXzB4MTZmOGFmLS0KICAgICAgICApIHsKICAgICAgICAgIHZhciBfMHgzNjczNWUgPSB7CiAgICAgICAgICAgIHY6ICEoMHg0ICogLTB4NjAxICsgMHgxMTZkICogMHgxICsgLTB4Njk4ICogLTB4MSksCiAgICAgICAgICB9OwogICAgICAgICAgdHJ5IHsKICAgICAgICAgICAgdmFyIF8weDE0N2U3YyA9IF8weDIyZGNkYltfMHgxNmY4YWZdKF8weDhjYjQyOCwgewogICAgICAgICAgICAgIGtpbmQ6IF8weDQxNDc0YigweDE5YyksCiAgICAgICAgICAgICAgbmFtZTogXzB4MjM0NGNkLAogICAgICAgICAgICAgIGFkZEluaXRpYWxpemVyOiBfMHgzZTRmZjUoXzB4M2M1NGU5LCBfMHgzNjczNWUpLAogICAgICAgICAgICB9KTsKICAgICAgICAgIH0gZmluYWxseSB7CiAgICAgICAgICAgIF8weDM2NzM1ZVsidiJdID0gISgweDFlODggKyAtMHgxOTczICsgLTB4NTE1ICogMHgxKTsKICAgICAgICAgIH0KICAgICAgICAgIHZvaWQgKC0weGVkYiArIC0weDUgKiAweDJiZiArIDB4MWM5NikgIT09IF8weDE0N2U3YyAmJgogICAgICAgICAgICAoXzB4ZWQ1MjViKDB4MTBiOCArIC0weGIgKiAweDJlMSArIC0weDMgKiAtMHg0ZmYsIF8weDE0N2U3YyksCiAgICAgICAgICAgIChfMHg4Y2I0MjggPSBfMHgxNDdlN2MpKTsKICAgICAgICB9CiAgICAgICAgcmV0dXJuIFsKICAgICAgICAgIF8weDhjYjQyOCwKICAgICAgICAgIGZ1bmN0aW9uICgpIHsKICAgICAgICAgICAgdmFyIF8weDI4YWZhNyA9IF8weDQxNDc0YjsKICAgICAgICAgICAgZm9yICgKICAgICAgICAgICAgICB2YXIgXzB4NDk2N2M1ID0gLTB4MSAqIDB4MjNiNSArIC0weDIgKiAtMHg0YzcgKyAweDIwMyAqIDB4ZDsKICAgICAgICAgICAgICBfMHg0OTY3YzUgPCBfMHgzYzU0ZTlbXzB4MjhhZmE3KDB4MjU5KV07CiAgICAgICAgICAgICAgXzB4NDk2N2M1KysKICAgICAgICAgICAgKQogICAgICAgICAgICAgIF8weDNjNTRlOVtfMHg0OTY3YzVdW18weDI4YWZhNygweDMzNCldKF8weDhjYjQyOCk7CiAgICAgICAgICB9LAogICAgICAgIF07CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDQ5OWQ2NShfMHgyYmU2OTAsIF8weDQyOGQ0MywgXzB4MzgxZTI2LCBfMHg0MDlhMTMpIHsKICAgICAgcmV0dXJuIHsKICAgICAgICBlOiBfMHg3NTQ4OTgoXzB4MmJlNjkwLCBfMHg0MjhkNDMsIF8weDQwOWExMyksCiAgICAgICAgZ2V0IGMoKSB7CiAgICAgICAgICByZXR1cm4gXzB4MjI1OGI5KF8weDJiZTY5MCwgXzB4MzgxZTI2KTsKICAgICAgICB9LAogICAgICB9OwogICAgfQogICAgZnVuY3Rpb24gXzB4NjNmMDFmKF8weDVmZDE0OSkgewogICAgICB2YXIgXzB4MmUxMjQzID0gd18weDI1ZjMsCiAgICAgICAgXzB4MTExYzRjID0ge30sCiAgICAgICAgXzB4MmFhMDk0ID0gISgtMHgzZCAqIC0weDUzICsgLTB4MjA4NiAqIC0weDEgKyAtMHgzNDRjKTsKICAgICAgZnVuY3Rpb24gXzB4M2FkM2ZlKF8weDRhMjI1NiwgXzB4M2JjZmYxKSB7CiAgICAgICAgcmV0dXJuICgKICAgICAgICAgIChfMHgyYWEwOTQgPSAhKDB4MTYwICogMHgzICsgLTB4NGI1ICogMHgxICsgMHgxICogMHg5NSkpLAogICAgICAgICAgewogICAgICAgICAgICBkb25lOiAhKDB4MWNkMyArIDB4MSAqIC0weGExMSArIC0weDEyYzEgKiAweDEpLAogICAgICAgICAgICB2YWx1ZTogbmV3IF8weDU5ZDg4NigKICAgICAgICAgICAgICAoXzB4M2JjZmYxID0gbmV3IFByb21pc2UoZnVuY3Rpb24gKF8weDM1Mzk2NikgewogICAgICAgICAgICAgICAgXzB4MzUzOTY2KF8weDVmZDE0OVtfMHg0YTIyNTZdKF8weDNiY2ZmMSkpOwogICAgICAgICAgICAgIH0pKSwKICAgICAgICAgICAgICAweDJiICogMHg0NCArIC0weDhiMyAqIDB4MiArIDB4MSAqIDB4NWZiCiAgICAgICAgICAgICksCiAgICAgICAgICB9CiAgICAgICAgKTsKICAgICAgfQogICAgICByZXR1cm4gKAogICAgICAgIChfMHgxMTFjNGNbCiAgICAgICAgICAoXzB4MmUxMjQzKDB4Mzg0KSAhPSB0eXBlb2YgU3ltYm9sICYmIFN5bWJvbFsiaXRlcmF0b3IiXSkgfHwKICAgICAgICAgICAgXzB4MmUxMjQzKDB4MWRkKQogICAgICAgIF0gPSBmdW5jdGlvbiAoKSB7CiAgICAgICAgICByZXR1cm4gdGhpczsKICAgICAgICB9KSwKICAgICAgICAoXzB4MTExYzRjW18weDJlMTI0MygweDM4OSldID0gZnVuY3Rpb24gKF8weDQ1OTEyZCkgewogICAgICAgICAgcmV0dXJuIF8weDJhYTA5NAogICAgICAgICAgICA/ICgoXzB4MmFhMDk0ID0gISgweDE1NjkgKyAweDcgKiAweDMxNCArIC0weDJhZjQpKSwgXzB4NDU5MTJkKQogICAgICAgICAgICA6IF8weDNhZDNmZSgibmV4dCIsIF8weDQ1OTEyZCk7CiAgICAgICAgfSksCiAgICAgICAgXzB4MmUxMjQzKDB4MWVlKSA9PSB0eXBlb2YgXzB4NWZkMTQ5W18weDJlMTI0MygweDI1MCldICYmCiAgICAgICAgICAoXzB4MTExYzRjW18weDJlMTI0MygweDI1MCldID0gZnVuY3Rpb24gKF8weGQ3MWU4MSkgewogICAgICAgICAgICB2YXIgXzB4Mzc4ODZlID0gXzB4MmUxMjQzOwogICAgICAgICAgICBpZiAoXzB4MmFhMDk0KQogICAgICAgICAgICAgIHRocm93ICgKICAgICAgICAgICAgICAgICgoXzB4MmFhMDk0ID0gISgtMHg2NDggKyAtMHgxZWNhICsgLTB4MjUxMyAqIC0weDEpKSwgXzB4ZDcxZTgxKQogICAgICAgICAgICAgICk7CiAgICAgICAgICAgIHJldHVybiBfMHgzYWQzZmUoXzB4Mzc4ODZlKDB4MjUwKSwgXzB4ZDcxZTgxKTsKICAgICAgICAgIH0pLAogICAgICAgIF8weDJlMTI0MygweDFlZSkgPT0gdHlwZW9mIF8weDVmZDE0OVtfMHgyZTEyNDMoMHgyZmQpXSAmJgogICAgICAgICAgKF8weDExMWM0Y1tfMHgyZTEyNDMoMHgyZmQpXSA9IGZ1bmN0aW9uIChfMHhkNGI3MTEpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDJhYTA5NAogICAgICAgICAgICAgID8gKChfMHgyYWEwOTQgPSAhKC0weDhlMSAqIC0weDQgKyAtMHgyMTk0ICsgMHgzICogLTB4YTUpKSwKICAgICAgICAgICAgICAgIF8weGQ0YjcxMSkKICAgICAgICAgICAgICA6IF8weDNhZDNmZSgicmV0dXJuIiwgXzB4ZDRiNzExKTsKICAgICAgICAgIH0pLAogICAgICAgIF8weDExMWM0YwogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4Mjc4YjlmKF8weDEyYjk0NSkgewogICAgICB2YXIgXzB4NTVjZDFmID0gd18weDI1ZjMsCiAgICAgICAgXzB4NDQ5ZGZlLAogICAgICAgIF8weDMxYjE4MiwKICAgICAgICBfMHgyMThmMzIsCiAgICAgICAgXzB4MmVjYjhhID0gLTB4MWQ5ICogLTB4NSArIC0weDVkNCArIC0weDM2NzsKICAgICAgZm9yICgKICAgICAgICAidW5kZWZpbmVkIiAhPSB0eXBlb2YgU3ltYm9sICYmCiAgICAgICAgKChfMHgzMWIxODIgPSBTeW1ib2xbXzB4NTVjZDFmKDB4MTdjKV0pLAogICAgICAgIChfMHgyMThmMzIgPSBTeW1ib2xbXzB4NTVjZDFmKDB4M2IzKV0pKTsKICAgICAgICBfMHgyZWNiOGEtLTsKCiAgICAgICkgewogICAgICAgIGlmIChfMHgzMWIxODIgJiYgbnVsbCAhPSAoXzB4NDQ5ZGZlID0gXzB4MTJiOTQ1W18weDMxYjE4Ml0pKQogICAgICAgICAgcmV0dXJuIF8weDQ0OWRmZVtfMHg1NWNkMWYoMHgzMzQpXShfMHgxMmI5NDUpOwogICAgICAgIGlmIChfMHgyMThmMzIgJiYgbnVsbCAhPSAoXzB4NDQ5ZGZlID0gXzB4MTJiOTQ1W18weDIxOGYzMl0pKQogICAgICAgICAgcmV0dXJuIG5ldyBfMHgzZDZmYzkoXzB4NDQ5ZGZlW18weDU1Y2QxZigweDMzNCldKF8weDEyYjk0NSkpOwogICAgICAgIChfMHgzMWIxODIgPSBfMHg1NWNkMWYoMHgyMzApKSwgKF8weDIxOGYzMiA9IF8weDU1Y2QxZigweDFkZCkpOwogICAgICB9CiAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4NTVjZDFmKDB4MmE5KSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzZDZmYzkoXzB4NGQzN2I2KSB7CiAgICAgIHZhciBfMHgzNmIxYjAgPSB3XzB4MjVmMzsKICAgICAgZnVuY3Rpb24gXzB4NmMzNjhiKF8weDIzMWQ2YykgewogICAgICAgIHZhciBfMHgzYTNlNzggPSB3XzB4MjVmMzsKICAgICAgICBpZiAoT2JqZWN0KF8weDIzMWQ2YykgIT09IF8weDIzMWQ2YykKICAgICAgICAgIHJldHVybiBQcm9taXNlWyJyZWplY3QiXShuZXcgVHlwZUVycm9yKF8weDIzMWQ2YyArIF8weDNhM2U3OCgweDNhNikpKTsKICAgICAgICB2YXIgXzB4NGNkZDA0ID0gXzB4MjMxZDZjW18weDNhM2U3OCgweDFlMyldOwogICAgICAgIHJldHVybiBQcm9taXNlWyJyZXNvbHZlIl0oXzB4MjMxZDZjW18weDNhM2U3OCgweDJlNCldKVsidGhlbiJdKAogICAgICAgICAgZnVuY3Rpb24gKF8weDQ2OGNjMSkgewogICAgICAgICAgICByZXR1cm4gewogICAgICAgICAgICAgIHZhbHVlOiBfMHg0NjhjYzEsCiAgICAgICAgICAgICAgZG9uZTogXzB4NGNkZDA0LAogICAgICAgICAgICB9OwogICAgICAgICAgfQogICAgICAgICk7CiAgICAgIH0KICAgICAgcmV0dXJuICgKICAgICAgICAoKF8weDNkNmZjOSA9IGZ1bmN0aW9uIChfMHg1YTgzYmYpIHsKICAgICAgICAgIHZhciBfMHgyZmZlZTggPSB3XzB4MjVmMzsKICAgICAgICAgICh0aGlzWyJzIl0gPSBfMHg1YTgzYmYpLCAodGhpc1sibiJdID0gXzB4NWE4M2JmW18weDJmZmVlOCgweDM4OSldKTsKICAgICAgICB9KVtfMHgzNmIxYjAoMHgzNDQpXSA9IHsKICAgICAgICAgIHM6IG51bGwsCiAgICAgICAgICBuOiBudWxsLAogICAgICAgICAgbmV4dDogZnVuY3Rpb24gKCkgewogICAgICAgICAgICB2YXIgXzB4MWVhYzdjID0gXzB4MzZiMWIwOwogICAgICAgICAgICByZXR1cm4gXzB4NmMzNjhiKHRoaXNbIm4iXVtfMHgxZWFjN2MoMHgyMDcpXSh0aGlzWyJzIl0sIGFyZ3VtZW50cykpOwogICAgICAgICAgfSwKICAgICAgICAgIHJldHVybjogZnVuY3Rpb24gKF8weDM3OTQzOCkgewogICAgICAgICAgICB2YXIgXzB4NDVkYzIzID0gXzB4MzZiMWIwLAogICAgICAgICAgICAgIF8weDM1ZWY4NiA9IHRoaXNbInMiXVtfMHg0NWRjMjMoMHgyZmQpXTsKICAgICAgICAgICAgcmV0dXJuIHZvaWQgKDB4MjNjZCArIDB4NmYzICogMHgxICsgLTB4NDggKiAweDk4KSA9PT0gXzB4MzVlZjg2CiAgICAgICAgICAgICAgPyBQcm9taXNlW18weDQ1ZGMyMygweDI3OCldKHsKICAgICAgICAgICAgICAgICAgdmFsdWU6IF8weDM3OTQzOCwKICAgICAgICAgICAgICAgICAgZG9uZTogISgtMHgyMjAgKyAtMHgxNmIwICsgMHg4ICogMHgzMWEpLAogICAgICAgICAgICAgICAgfSkKICAgICAgICAgICAgICA6IF8weDZjMzY4YihfMHgzNWVmODZbXzB4NDVkYzIzKDB4MjA3KV0odGhpc1sicyJdLCBhcmd1bWVudHMpKTsKICAgICAgICAgIH0sCiAgICAgICAgICB0aHJvdzogZnVuY3Rpb24gKF8weDJjYTg2YSkgewogICAgICAgICAgICB2YXIgXzB4NTgxMmM0ID0gXzB4MzZiMWIwLAogICAgICAgICAgICAgIF8weDQ0OWVlNSA9IHRoaXNbInMiXVtfMHg1ODEyYzQoMHgyZmQpXTsKICAgICAgICAgICAgcmV0dXJuIHZvaWQgKDB4ZTNiICsgMHgxICogLTB4MTI4ZSArIDB4NDUzKSA9PT0gXzB4NDQ5ZWU1CiAgICAgICAgICAgICAgPyBQcm9taXNlW18weDU4MTJjNCgweDM5YildKF8weDJjYTg2YSkKICAgICAgICAgICAgICA6IF8weDZjMzY4YihfMHg0NDllZTVbImFwcGx5Il0odGhpc1sicyJdLCBhcmd1bWVudHMpKTsKICAgICAgICAgIH0sCiAgICAgICAgfSksCiAgICAgICAgbmV3IF8weDNkNmZjOShfMHg0ZDM3YjYpCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg4MWMzNmIoXzB4MzA1Mjg3KSB7CiAgICAgIHJldHVybiBuZXcgXzB4NTlkODg2KF8weDMwNTI4NywgLTB4NWUgKyAweGY4NCArIC0weGYyNiAqIDB4MSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzN2UxZTIoXzB4MzEyN2NlKSB7CiAgICAgIHZhciBfMHg0M2I4OGUgPSB3XzB4MjVmMzsKICAgICAgaWYgKE9iamVjdChfMHgzMTI3Y2UpICE9PSBfMHgzMTI3Y2UpCiAgICAgICAgdGhyb3cgVHlwZUVycm9yKAogICAgICAgICAgInJpZ2h0LWhhbmRceDIwc2lkZVx4MjBvZlx4MjBceDI3aW5ceDI3XHgyMHNob3VsZFx4MjBiZVx4MjBhblx4MjBvYmplY3QsXHgyMGdvdFx4MjAiICsKICAgICAgICAgICAgKG51bGwgIT09IF8weDMxMjdjZSA/IHR5cGVvZiBfMHgzMTI3Y2UgOiBfMHg0M2I4OGUoMHgzMDgpKQogICAgICAgICk7CiAgICAgIHJldHVybiBfMHgzMTI3Y2U7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1NjQ2NzMoXzB4MThiZDdjLCBfMHg1MWZiMGYsIF8weDIxMDNjNSwgXzB4NWY0NjE5KSB7CiAgICAgIHZhciBfMHg0MWM2NCA9IHdfMHgyNWYzLAogICAgICAgIF8weGFiOGMxNiA9IHsKICAgICAgICAgIGNvbmZpZ3VyYWJsZTogISgtMHgxNWM0ICsgMHgyNWY3ICogLTB4MSArIDB4M2JiYiksCiAgICAgICAgICBlbnVtZXJhYmxlOiAhKDB4MjU4MSArIC0weDEyMWMgKyAtMHgxMzY1KSwKICAgICAgICB9OwogICAgICByZXR1cm4gKAogICAgICAgIChfMHhhYjhjMTZbXzB4MThiZDdjXSA9IF8weDVmNDYxOSksCiAgICAgICAgT2JqZWN0W18weDQxYzY0KDB4MTc1KV0oXzB4NTFmYjBmLCBfMHgyMTAzYzUsIF8weGFiOGMxNikKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDE5ZDY2YShfMHgxNGMyOTcsIF8weDEyOGQzOCkgewogICAgICB2YXIgXzB4NDhlYWI0ID0gd18weDI1ZjMsCiAgICAgICAgXzB4MjVmOTQzID0KICAgICAgICAgIG51bGwgPT0gXzB4MTRjMjk3CiAgICAgICAgICAgID8gbnVsbAogICAgICAgICAgICA6IChfMHg0OGVhYjQoMHgzODQpICE9IHR5cGVvZiBTeW1ib2wgJiYKICAgICAgICAgICAgICAgIF8weDE0YzI5N1tTeW1ib2xbXzB4NDhlYWI0KDB4M2IzKV1dKSB8fAogICAgICAgICAgICAgIF8weDE0YzI5N1tfMHg0OGVhYjQoMHgxZGQpXTsKICAgICAgaWYgKG51bGwgIT0gXzB4MjVmOTQzKSB7CiAgICAgICAgdmFyIF8weDI4NTk1OCwKICAgICAgICAgIF8weDViY2M5ZSwKICAgICAgICAgIF8weDJkNGMzOSwKICAgICAgICAgIF8weDE5M2M3MCwKICAgICAgICAgIF8weDE0NjAxNSA9IFtdLAogICAgICAgICAgXzB4MTZlZmI3ID0gISgtMHg3ZSAqIDB4MzYgKyAweGNmZiAqIDB4MSArIDB4ZDk1KSwKICAgICAgICAgIF8weDVjOTU1NiA9ICEoLTB4MWQ3MSAqIC0weDEgKyAweDQzNCAqIC0weDkgKyAweDg2NCk7CiAgICAgICAgdHJ5IHsKICAgICAgICAgIGlmICgKICAgICAgICAgICAgKChfMHgyZDRjMzkgPSAoXzB4MjVmOTQzID0gXzB4MjVmOTQzW18weDQ4ZWFiNCgweDMzNCldKF8weDE0YzI5NykpWwogICAgICAgICAgICAgICJuZXh0IgogICAgICAgICAgICBdKSwKICAgICAgICAgICAgLTB4ZTMgKiAtMHhiICsgLTB4MWYzICogMHhlICsgLTB4NDMgKiAtMHg0MyA9PT0gXzB4MTI4ZDM4KQogICAgICAgICAgKSB7CiAgICAgICAgICAgIGlmIChPYmplY3QoXzB4MjVmOTQzKSAhPT0gXzB4MjVmOTQzKSByZXR1cm47CiAgICAgICAgICAgIF8weDE2ZWZiNyA9ICEoMHgxN2NiICsgMHgxOGE5ICsgLTB4NGYgKiAweDlkKTsKICAgICAgICAgIH0gZWxzZSB7CiAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgOwogICAgICAgICAgICAgICEoXzB4MTZlZmI3ID0gKF8weDI4NTk1OCA9IF8weDJkNGMzOVsiY2FsbCJdKF8weDI1Zjk0MykpWwogICAgICAgICAgICAgICAgXzB4NDhlYWI0KDB4MWUzKQogICAgICAgICAgICAgIF0pICYmCiAgICAgICAgICAgICAgKF8weDE0NjAxNVtfMHg0OGVhYjQoMHgzNmUpXShfMHgyODU5NThbXzB4NDhlYWI0KDB4MmU0KV0pLAogICAgICAgICAgICAgIF8weDE0NjAxNVtfMHg0OGVhYjQoMHgyNTkpXSAhPT0gXzB4MTI4ZDM4KTsKICAgICAgICAgICAgICBfMHgxNmVmYjcgPSAhKDB4MSAqIC0weDIyZDMgKyAweDFmMmUgKyAweDMgKiAweDEzNykKICAgICAgICAgICAgKTsKICAgICAgICAgIH0KICAgICAgICB9IGNhdGNoIChfMHgyMmUxNGQpIHsKICAgICAgICAgIChfMHg1Yzk1NTYgPSAhKC0weDMgKiAtMHg2OWUgKyAtMHhkNzkgKyAtMHg0NyAqIDB4MTcpKSwKICAgICAgICAgICAgKF8weDViY2M5ZSA9IF8weDIyZTE0ZCk7CiAgICAgICAgfSBmaW5hbGx5IHsKICAgICAgICAgIHRyeSB7CiAgICAgICAgICAgIGlmICgKICAgICAgICAgICAgICAhXzB4MTZlZmI3ICYmCiAgICAgICAgICAgICAgbnVsbCAhPSBfMHgyNWY5NDNbXzB4NDhlYWI0KDB4MmZkKV0gJiYKICAgICAgICAgICAgICAoKF8weDE5M2M3MCA9IF8weDI1Zjk0M1sicmV0dXJuIl0oKSksCiAgICAgICAgICAgICAgT2JqZWN0KF8weDE5M2M3MCkgIT09IF8weDE5M2M3MCkKICAgICAgICAgICAgKQogICAgICAgICAgICAgIHJldHVybjsKICAgICAgICAgIH0gZmluYWxseSB7CiAgICAgICAgICAgIGlmIChfMHg1Yzk1NTYpIHRocm93IF8weDViY2M5ZTsKICAgICAgICAgIH0KICAgICAgICB9CiAgICAgICAgcmV0dXJuIF8weDE0NjAxNTsKICAgICAgfQogICAgfQogICAgZnVuY3Rpb24gXzB4Mzc2ZmQ1KF8weDIzMzU1MCwgXzB4MWIzMzdmKSB7CiAgICAgIHZhciBfMHg1NDVhYzQgPSB3XzB4MjVmMywKICAgICAgICBfMHg1MjQ0MzggPQogICAgICAgICAgXzB4MjMzNTUwICYmCiAgICAgICAgICAoKF8weDU0NWFjNCgweDM4NCkgIT0gdHlwZW9mIFN5bWJvbCAmJgogICAgICAgICAgICBfMHgyMzM1NTBbU3ltYm9sW18weDU0NWFjNCgweDNiMyldXSkgfHwKICAgICAgICAgICAgXzB4MjMzNTUwWyJAQGl0ZXJhdG9yIl0pOwogICAgICBpZiAobnVsbCAhPSBfMHg1MjQ0MzgpIHsKICAgICAgICB2YXIgXzB4MjU5Y2U2LAogICAgICAgICAgXzB4NDUyM2VlID0gW107CiAgICAgICAgZm9yICgKICAgICAgICAgIF8weDUyNDQzOCA9IF8weDUyNDQzOFsiY2FsbCJdKF8weDIzMzU1MCk7CiAgICAgICAgICBfMHgyMzM1NTBbXzB4NTQ1YWM0KDB4MjU5KV0gPCBfMHgxYjMzN2YgJiYKICAgICAgICAgICEoXzB4MjU5Y2U2ID0gXzB4NTI0NDM4WyJuZXh0Il0oKSlbXzB4NTQ1YWM0KDB4MWUzKV07CgogICAgICAgICkKICAgICAgICAgIF8weDQ1MjNlZVtfMHg1NDVhYzQoMHgzNmUpXShfMHgyNTljZTZbInZhbHVlIl0pOwogICAgICAgIHJldHVybiBfMHg0NTIzZWU7CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDJlNGI4NihfMHg3NjA5NzQsIF8weDQzOGVmYSwgXzB4MzdhMjBiLCBfMHg1MmIyNzkpIHsKICAgICAgdmFyIF8weDI2NDRmOCA9IHdfMHgyNWYzOwogICAgICBfMHg1MDBlOWYgfHwKICAgICAgICAoXzB4NTAwZTlmID0KICAgICAgICAgIChfMHgyNjQ0ZjgoMHgxZWUpID09IHR5cGVvZiBTeW1ib2wgJiYKICAgICAgICAgICAgU3ltYm9sW18weDI2NDRmOCgweDMxZSldICYmCiAgICAgICAgICAgIFN5bWJvbFtfMHgyNjQ0ZjgoMHgzMWUpXShfMHgyNjQ0ZjgoMHgyNzkpKSkgfHwKICAgICAgICAgIDB4MTM1M2YgKyAtMHgxMTU3ICsgLTB4MzkyMSk7CiAgICAgIHZhciBfMHg1MTNiNTQgPSBfMHg3NjA5NzQgJiYgXzB4NzYwOTc0W18weDI2NDRmOCgweDM3MSldLAogICAgICAgIF8weDU0NjllOSA9CiAgICAgICAgICBhcmd1bWVudHNbXzB4MjY0NGY4KDB4MjU5KV0gLQogICAgICAgICAgKC0weGNiICogLTB4YiArIC0weGEgKiAweDEzNyArIC0weDI4ICogLTB4MTYpOwogICAgICBpZiAoCiAgICAgICAgKF8weDQzOGVmYSB8fAogICAgICAgICAgMHgxMDkgKiAtMHgxYyArIDB4ZGMxICsgMHhmM2IgPT09IF8weDU0NjllOSB8fAogICAgICAgICAgKF8weDQzOGVmYSA9IHsKICAgICAgICAgICAgY2hpbGRyZW46IHZvaWQgKC0weDIgKiAtMHgxMDM3ICsgMHgzMmYgKyAtMHgyMzlkKSwKICAgICAgICAgIH0pLAogICAgICAgIC0weGY2OSArIDB4ZWRiICsgLTB4OGYgKiAtMHgxID09PSBfMHg1NDY5ZTkpCiAgICAgICkKICAgICAgICBfMHg0MzhlZmFbXzB4MjY0NGY4KDB4MTZmKV0gPSBfMHg1MmIyNzk7CiAgICAgIGVsc2UgewogICAgICAgIGlmIChfMHg1NDY5ZTkgPiAtMHgxOGUyICsgLTB4MjVhZiArIDB4M2U5MikgewogICAgICAgICAgZm9yICgKICAgICAgICAgICAgdmFyIF8weDVjNmY4MiA9IG5ldyBBcnJheShfMHg1NDY5ZTkpLAogICAgICAgICAgICAgIF8weDYzY2I5MCA9IC0weDEgKiAtMHhlYmQgKyAtMHgxYTM3ICsgMHgyICogMHg1YmQ7CiAgICAgICAgICAgIF8weDYzY2I5MCA8IF8weDU0NjllOTsKICAgICAgICAgICAgXzB4NjNjYjkwKysKICAgICAgICAgICkKICAgICAgICAgICAgXzB4NWM2ZjgyW18weDYzY2I5MF0gPQogICAgICAgICAgICAgIGFyZ3VtZW50c1tfMHg2M2NiOTAgKyAoMHgxNWY1ICsgLTB4MjQ1ZiArIC0weDRjZiAqIC0weDMpXTsKICAgICAgICAgIF8weDQzOGVmYVtfMHgyNjQ0ZjgoMHgxNmYpXSA9IF8weDVjNmY4MjsKICAgICAgICB9CiAgICAgIH0KICAgICAgaWYgKF8weDQzOGVmYSAmJiBfMHg1MTNiNTQpIHsKICAgICAgICBmb3IgKHZhciBfMHhiY2VlMmMgaW4gXzB4NTEzYjU0KQogICAgICAgICAgdm9pZCAoLTB4MTA5MSAqIC0weDEgKyAtMHgzICogMHgzNGQgKyAtMHg2YWEpID09PQogICAgICAgICAgICBfMHg0MzhlZmFbXzB4YmNlZTJjXSAmJgogICAgICAgICAgICAoXzB4NDM4ZWZhW18weGJjZWUyY10gPSBfMHg1MTNiNTRbXzB4YmNlZTJjXSk7CiAgICAgIH0gZWxzZSBfMHg0MzhlZmEgfHwgKF8weDQzOGVmYSA9IF8weDUxM2I1NCB8fCB7fSk7CiAgICAgIHJldHVybiB7CiAgICAgICAgJCR0eXBlb2Y6IF8weDUwMGU5ZiwKICAgICAgICB0eXBlOiBfMHg3NjA5NzQsCiAgICAgICAga2V5OgogICAgICAgICAgdm9pZCAoLTB4NyAqIDB4MWNkICsgLTB4MSAqIC0weGIzOCArIDB4MTYzKSA9PT0gXzB4MzdhMjBiCiAgICAgICAgICAgID8gbnVsbAogICAgICAgICAgICA6ICIiICsgXzB4MzdhMjBiLAogICAgICAgIHJlZjogbnVsbCwKICAgICAgICBwcm9wczogXzB4NDM4ZWZhLAogICAgICAgIF9vd25lcjogbnVsbCwKICAgICAgfTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDNhM2ViNShfMHg0NjE5YmUsIF8weDNmYzgyMikgewogICAgICB2YXIgXzB4NDQ5NzhkID0gd18weDI1ZjMsCiAgICAgICAgXzB4NTA0ZjU5ID0gT2JqZWN0W18weDQ0OTc4ZCgweDE3ZildKF8weDQ2MTliZSk7CiAgICAgIGlmIChPYmplY3RbXzB4NDQ5NzhkKDB4Mzg4KV0pIHsKICAgICAgICB2YXIgXzB4NGVhNzAwID0gT2JqZWN0WyJnZXRPd25Qcm9wZXJ0eVN5bWJvbHMiXShfMHg0NjE5YmUpOwogICAgICAgIF8weDNmYzgyMiAmJgogICAgICAgICAgKF8weDRlYTcwMCA9IF8weDRlYTcwMFtfMHg0NDk3OGQoMHgxNjQpXShmdW5jdGlvbiAoXzB4MmEwYzAzKSB7CiAgICAgICAgICAgIHZhciBfMHgxNjIzMjggPSBfMHg0NDk3OGQ7CiAgICAgICAgICAgIHJldHVybiBPYmplY3RbXzB4MTYyMzI4KDB4MmE2KV0oCiAgICAgICAgICAgICAgXzB4NDYxOWJlLAogICAgICAgICAgICAgIF8weDJhMGMwMwogICAgICAgICAgICApW18weDE2MjMyOCgweDIzYSldOwogICAgICAgICAgfSkpLAogICAgICAgICAgXzB4NTA0ZjU5WyJwdXNoIl1bXzB4NDQ5NzhkKDB4MjA3KV0oXzB4NTA0ZjU5LCBfMHg0ZWE3MDApOwogICAgICB9CiAgICAgIHJldHVybiBfMHg1MDRmNTk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0ZWUyZGQoXzB4ZjM3MWYwKSB7CiAgICAgIHZhciBfMHgxNDVjZTYgPSB3XzB4MjVmMzsKICAgICAgZm9yICgKICAgICAgICB2YXIgXzB4NWUzNmExID0gLTB4NSAqIDB4MWFkICsgMHgxMWU2ICogLTB4MSArIDB4MWE0ODsKICAgICAgICBfMHg1ZTM2YTEgPCBhcmd1bWVudHNbXzB4MTQ1Y2U2KDB4MjU5KV07CiAgICAgICAgXzB4NWUzNmExKysKICAgICAgKSB7CiAgICAgICAgdmFyIF8weGRiODg5ZCA9CiAgICAgICAgICBudWxsICE9IGFyZ3VtZW50c1tfMHg1ZTM2YTFdID8gYXJndW1lbnRzW18weDVlMzZhMV0gOiB7fTsKICAgICAgICBfMHg1ZTM2YTEgJSAoMHgxMTc0ICsgMHhlYjMgKyAtMHgyMDI1KQogICAgICAgICAgPyBfMHgzYTNlYjUoCiAgICAgICAgICAgICAgT2JqZWN0KF8weGRiODg5ZCksCiAgICAgICAgICAgICAgISgtMHgyNjNjICogMHgxICsgMHgxICogLTB4ZjdmICsgMHg3YWQgKiAweDcpCiAgICAgICAgICAgIClbXzB4MTQ1Y2U2KDB4MjU0KV0oZnVuY3Rpb24gKF8weDMyODkyOCkgewogICAgICAgICAgICAgIF8weDRhNzgyNChfMHhmMzcxZjAsIF8weDMyODkyOCwgXzB4ZGI4ODlkW18weDMyODkyOF0pOwogICAgICAgICAgICB9KQogICAgICAgICAgOiBPYmplY3RbXzB4MTQ1Y2U2KDB4MWVjKV0KICAgICAgICAgID8gT2JqZWN0W18weDE0NWNlNigweDM2YyldKAogICAgICAgICAgICAgIF8weGYzNzFmMCwKICAgICAgICAgICAgICBPYmplY3RbXzB4MTQ1Y2U2KDB4MWVjKV0oXzB4ZGI4ODlkKQogICAgICAgICAgICApCiAgICAgICAgICA6IF8weDNhM2ViNShPYmplY3QoXzB4ZGI4ODlkKSlbXzB4MTQ1Y2U2KDB4MjU0KV0oZnVuY3Rpb24gKAogICAgICAgICAgICAgIF8weDU5M2Y1ZgogICAgICAgICAgICApIHsKICAgICAgICAgICAgICB2YXIgXzB4NTNmMDU1ID0gXzB4MTQ1Y2U2OwogICAgICAgICAgICAgIE9iamVjdFtfMHg1M2YwNTUoMHgxNzUpXSgKICAgICAgICAgICAgICAgIF8weGYzNzFmMCwKICAgICAgICAgICAgICAgIF8weDU5M2Y1ZiwKICAgICAgICAgICAgICAgIE9iamVjdFtfMHg1M2YwNTUoMHgyYTYpXShfMHhkYjg4OWQsIF8weDU5M2Y1ZikKICAgICAgICAgICAgICApOwogICAgICAgICAgICB9KTsKICAgICAgfQogICAgICByZXR1cm4gXzB4ZjM3MWYwOwogICAgfQogICAgZnVuY3Rpb24gXzB4Mzg1ZDE5KCkgewogICAgICB2YXIgXzB4NDRhMGZjID0gd18weDI1ZjM7CiAgICAgIF8weDM4NWQxOSA9IGZ1bmN0aW9uICgpIHsKICAgICAgICByZXR1cm4gXzB4NTA3YjIzOwogICAgICB9OwogICAgICB2YXIgXzB4NTA3YjIzID0ge30sCiAgICAgICAgXzB4MzlmYTAxID0gT2JqZWN0W18weDQ0YTBmYygweDM0NCldLAogICAgICAgIF8weDQzMjM4YyA9IF8weDM5ZmEwMVtfMHg0NGEwZmMoMHgzYjgpXSwKICAgICAgICBfMHg0Y2Y3ZDggPQogICAgICAgICAgT2JqZWN0WyJkZWZpbmVQcm9wZXJ0eSJdIHx8CiAgICAgICAgICBmdW5jdGlvbiAoXzB4MjU0MWM1LCBfMHgyMmM5MzgsIF8weDQwNWJhYikgewogICAgICAgICAgICB2YXIgXzB4MzJmMmFlID0gXzB4NDRhMGZjOwogICAgICAgICAgICBfMHgyNTQxYzVbXzB4MjJjOTM4XSA9IF8weDQwNWJhYltfMHgzMmYyYWUoMHgyZTQpXTsKICAgICAgICAgIH0sCiAgICAgICAgXzB4MWM5N2NjID0gXzB4NDRhMGZjKDB4MWVlKSA9PSB0eXBlb2YgU3ltYm9sID8gU3ltYm9sIDoge30sCiAgICAgICAgXzB4NWFjZDFhID0gXzB4MWM5N2NjW18weDQ0YTBmYygweDNiMyldIHx8IF8weDQ0YTBmYygweDFkZCksCiAgICAgICAgXzB4NTJmMjkyID0gXzB4MWM5N2NjWyJhc3luY0l0ZXJhdG9yIl0gfHwgXzB4NDRhMGZjKDB4MjMwKSwKICAgICAgICBfMHg0NDdhYjQgPSBfMHgxYzk3Y2NbXzB4NDRhMGZjKDB4MWMwKV0gfHwgXzB4NDRhMGZjKDB4MWUwKTsKICAgICAgZnVuY3Rpb24gXzB4M2JhZjJjKF8weDMwZjk1MiwgXzB4M2VmNjE0LCBfMHgyZDJiNjEpIHsKICAgICAgICB2YXIgXzB4NTk4ODE5ID0gXzB4NDRhMGZjOwogICAgICAgIHJldHVybiAoCiAgICAgICAgICBPYmplY3RbXzB4NTk4ODE5KDB4MTc1KV0oXzB4MzBmOTUyLCBfMHgzZWY2MTQsIHsKICAgICAgICAgICAgdmFsdWU6IF8weDJkMmI2MSwKICAgICAgICAgICAgZW51bWVyYWJsZTogISgweDFiMWEgKiAtMHgxICsgMHgxICogMHgyNjk2ICsgLTB4MzEgKiAweDNjKSwKICAgICAgICAgICAgY29uZmlndXJhYmxlOiAhKC0weDFhMTMgKyAweDUgKiAtMHg2ZCArIDB4YSAqIDB4MmQyKSwKICAgICAgICAgICAgd3JpdGFibGU6ICEoLTB4MWNkICsgMHgyMTRlICsgMHgxZjgxICogLTB4MSksCiAgICAgICAgICB9KSwKICAgICAgICAgIF8weDMwZjk1MltfMHgzZWY2MTRdCiAgICAgICAgKTsKICAgICAgfQogICAgICB0cnkgewogICAgICAgIF8weDNiYWYyYyh7fSwgIiIpOwogICAgICB9IGNhdGNoIChfMHgyNzUxNTkpIHsKICAgICAgICBfMHgzYmFmMmMgPSBmdW5jdGlvbiAoXzB4MzdmYTdiLCBfMHgyNjcxZjAsIF8weDQ1YjgyZSkgewogICAgICAgICAgcmV0dXJuIChfMHgzN2ZhN2JbXzB4MjY3MWYwXSA9IF8weDQ1YjgyZSk7CiAgICAgICAgfTsKICAgICAgfQogICAgICBmdW5jdGlvbiBfMHgzZTQ2YzYoXzB4NTBjMGNjLCBfMHg1ZjNjODMsIF8weDE0ODkxNywgXzB4MmU1MTQxKSB7CiAgICAgICAgdmFyIF8weDFhMjVkYiA9IF8weDQ0YTBmYywKICAgICAgICAgIF8weDFiMGZhMCA9CiAgICAgICAgICAgIF8weDVmM2M4MyAmJiBfMHg1ZjNjODNbInByb3RvdHlwZSJdIGluc3RhbmNlb2YgXzB4NTBmMzZkCiAgICAgICAgICAgICAgPyBfMHg1ZjNjODMKICAgICAgICAgICAgICA6IF8weDUwZjM2ZCwKICAgICAgICAgIF8weDRmMDZhYiA9IE9iamVjdFtfMHgxYTI1ZGIoMHgzYjcpXShfMHgxYjBmYTBbXzB4MWEyNWRiKDB4MzQ0KV0pLAogICAgICAgICAgXzB4M2U0OTk5ID0gbmV3IF8weDFiNWRiOShfMHgyZTUxNDEgfHwgW10pOwogICAgICAgIHJldHVybiAoCiAgICAgICAgICBfMHg0Y2Y3ZDgoXzB4NGYwNmFiLCBfMHgxYTI1ZGIoMHgxYjEpLCB7CiAgICAgICAgICAgIHZhbHVlOiBfMHgxMjE3MjgoXzB4NTBjMGNjLCBfMHgxNDg5MTcsIF8weDNlNDk5OSksCiAgICAgICAgICB9KSwKICAgICAgICAgIF8weDRmMDZhYgogICAgICAgICk7CiAgICAgIH0KICAgICAgZnVuY3Rpb24gXzB4NTc1ZGZkKF8weDQ4ZmQyMCwgXzB4NjU0NWVmLCBfMHgyNDI5MzYpIHsKICAgICAgICB2YXIgXzB4NTgwZDUwID0gXzB4NDRhMGZjOwogICAgICAgIHRyeSB7CiAgICAgICAgICByZXR1cm4gewogICAgICAgICAgICB0eXBlOiBfMHg1ODBkNTAoMHgyZjEpLAogICAgICAgICAgICBhcmc6IF8weDQ4ZmQyMFtfMHg1ODBkNTAoMHgzMzQpXShfMHg2NTQ1ZWYsIF8weDI0MjkzNiksCiAgICAgICAgICB9OwogICAgICAgIH0gY2F0Y2ggKF8weDVhZWJhYykgewogICAgICAgICAgcmV0dXJuIHsKICAgICAgICAgICAgdHlwZTogInRocm93IiwKICAgICAgICAgICAgYXJnOiBfMHg1YWViYWMsCiAgICAgICAgICB9OwogICAgICAgIH0KICAgICAgfQogICAgICBfMHg1MDdiMjNbIndyYXAiXSA9IF8weDNlNDZjNjsKICAgICAgdmFyIF8weDUxMWIwNSA9IHt9OwogICAgICBmdW5jdGlvbiBfMHg1MGYzNmQoKSB7fQogICAgICBmdW5jdGlvbiBfMHgyZTY3ZTkoKSB7fQogICAgICBmdW5jdGlvbiBfMHgzYTVhYzcoKSB7fQogICAgICB2YXIgXzB4NGMzMDA4ID0ge307CiAgICAgIF8weDNiYWYyYyhfMHg0YzMwMDgsIF8weDVhY2QxYSwgZnVuY3Rpb24gKCkgewogICAgICAgIHJldHVybiB0aGlzOwogICAgICB9KTsKICAgICAgdmFyIF8weDExODk0NSA9IE9iamVjdFtfMHg0NGEwZmMoMHgyMmMpXSwKICAgICAgICBfMHg1ZDFkMDQgPSBfMHgxMTg5NDUgJiYgXzB4MTE4OTQ1KF8weDExODk0NShfMHgyZWRiZjQoW10pKSk7CiAgICAgIF8weDVkMWQwNCAmJgogICAgICAgIF8weDVkMWQwNCAhPT0gXzB4MzlmYTAxICYmCiAgICAgICAgXzB4NDMyMzhjW18weDQ0YTBmYygweDMzNCldKF8weDVkMWQwNCwgXzB4NWFjZDFhKSAmJgogICAgICAgIChfMHg0YzMwMDggPSBfMHg1ZDFkMDQpOwogICAgICB2YXIgXzB4NDI3NjNiID0KICAgICAgICAoXzB4M2E1YWM3W18weDQ0YTBmYygweDM0NCldID0KICAgICAgICBfMHg1MGYzNmRbInByb3RvdHlwZSJdID0KICAgICAgICAgIE9iamVjdFtfMHg0NGEwZmMoMHgzYjcpXShfMHg0YzMwMDgpKTsKICAgICAgZnVuY3Rpb24gXzB4NGUxNTZiKF8weDMxNGVjMCkgewogICAgICAgIHZhciBfMHgxMjI5ZmYgPSBfMHg0NGEwZmM7CiAgICAgICAgW18weDEyMjlmZigweDM4OSksIF8weDEyMjlmZigweDI1MCksIF8weDEyMjlmZigweDJmZCldWwogICAgICAgICAgXzB4MTIyOWZmKDB4MjU0KQogICAgICAgIF0oZnVuY3Rpb24gKF8weDFjYWM5YSkgewogICAgICAgICAgXzB4M2JhZjJjKF8weDMxNGVjMCwgXzB4MWNhYzlhLCBmdW5jdGlvbiAoXzB4NTA5NjY5KSB7CiAgICAgICAgICAgIHZhciBfMHgzYjU1ODcgPSB3XzB4MjVmMzsKICAgICAgICAgICAgcmV0dXJuIHRoaXNbXzB4M2I1NTg3KDB4MWIxKV0oXzB4MWNhYzlhLCBfMHg1MDk2NjkpOwogICAgICAgICAgfSk7CiAgICAgICAgfSk7CiAgICAgIH0KICAgICAgZnVuY3Rpb24gXzB4MjNlYjczKF8weDVjYjRmMCwgXzB4ZmRkYTMpIHsKICAgICAgICB2YXIgXzB4MmY3MGJjOwogICAgICAgIF8weDRjZjdkOCh0aGlzLCAiX2ludm9rZSIsIHsKICAgICAgICAgIHZhbHVlOiBmdW5jdGlvbiAoXzB4NDdmODgzLCBfMHgzNGRkNzgpIHsKICAgICAgICAgICAgdmFyIF8weDVjNWNjYSA9IHdfMHgyNWYzOwogICAgICAgICAgICBmdW5jdGlvbiBfMHg2NWU4MzYoKSB7CiAgICAgICAgICAgICAgcmV0dXJuIG5ldyBfMHhmZGRhMyhmdW5jdGlvbiAoXzB4NDk0ZTk5LCBfMHgzOWY5N2EpIHsKICAgICAgICAgICAgICAgICEoZnVuY3Rpb24gXzB4MTllMTcwKAogICAgICAgICAgICAgICAgICBfMHhkOTRhZmQsCiAgICAgICAgICAgICAgICAgIF8weDdmNWEzLAogICAgICAgICAgICAgICAgICBfMHgxZmM5NzgsCiAgICAgICAgICAgICAgICAgIF8weDM5MmMxNwogICAgICAgICAgICAgICAgKSB7CiAgICAgICAgICAgICAgICAgIHZhciBfMHg1MTA4ZGIgPSB3XzB4MjVmMywKICAgICAgICAgICAgICAgICAgICBfMHgxMjNjMmIgPSBfMHg1NzVkZmQoCiAgICAgICAgICAgICAgICAgICAgICBfMHg1Y2I0ZjBbXzB4ZDk0YWZkXSwKICAgICAgICAgICAgICAgICAgICAgIF8weDVjYjRmMCwKICAgICAgICAgICAgICAgICAgICAgIF8weDdmNWEzCiAgICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgICAgaWYgKF8weDUxMDhkYigweDI1MCkgIT09IF8weDEyM2MyYltfMHg1MTA4ZGIoMHgxYWIpXSkgewogICAgICAgICAgICAgICAgICAgIHZhciBfMHg1N2ZmMzAgPSBfMHgxMjNjMmJbXzB4NTEwOGRiKDB4MzI3KV0sCiAgICAgICAgICAgICAgICAgICAgICBfMHg1MTlmM2MgPSBfMHg1N2ZmMzBbXzB4NTEwOGRiKDB4MmU0KV07CiAgICAgICAgICAgICAgICAgICAgcmV0dXJuIF8weDUxOWYzYyAmJgogICAgICAgICAgICAgICAgICAgICAgIm9iamVjdCIgPT0gdHlwZW9mIF8weDUxOWYzYyAmJgogICAgICAgICAgICAgICAgICAgICAgXzB4NDMyMzhjW18weDUxMDhkYigweDMzNCldKF8weDUxOWYzYywgXzB4NTEwOGRiKDB4MmIxKSkKICAgICAgICAgICAgICAgICAgICAgID8gXzB4ZmRkYTNbXzB4NTEwOGRiKDB4Mjc4KV0oXzB4NTE5ZjNjW18weDUxMDhkYigweDJiMSldKVsKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHg1MTA4ZGIoMHgxZWQpCiAgICAgICAgICAgICAgICAgICAgICAgIF0oCiAgICAgICAgICAgICAgICAgICAgICAgICAgZnVuY3Rpb24gKF8weDUxM2FkNCkgewogICAgICAgICAgICAgICAgICAgICAgICAgICAgdmFyIF8weDM3MmU4YiA9IF8weDUxMDhkYjsKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDE5ZTE3MCgKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzcyZThiKDB4Mzg5KSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NTEzYWQ0LAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxZmM5NzgsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5MmMxNwogICAgICAgICAgICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgICAgICAgICAgICB9LAogICAgICAgICAgICAgICAgICAgICAgICAgIGZ1bmN0aW9uIChfMHgzZWU5NzMpIHsKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDE5ZTE3MCgidGhyb3ciLCBfMHgzZWU5NzMsIF8weDFmYzk3OCwgXzB4MzkyYzE3KTsKICAgICAgICAgICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgICAgICAgIDogXzB4ZmRkYTNbXzB4NTEwOGRiKDB4Mjc4KV0oXzB4NTE5ZjNjKVtfMHg1MTA4ZGIoMHgxZWQpXSgKICAgICAgICAgICAgICAgICAgICAgICAgICBmdW5jdGlvbiAoXzB4YjgwNDljKSB7CiAgICAgICAgICAgICAgICAgICAgICAgICAgICB2YXIgXzB4M2Y1NzkxID0gXzB4NTEwOGRiOwogICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDU3ZmYzMFtfMHgzZjU3OTEoMHgyZTQpXSA9IF8weGI4MDQ5YyksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDFmYzk3OChfMHg1N2ZmMzApOwogICAgICAgICAgICAgICAgICAgICAgICAgIH0sCiAgICAgICAgICAgICAgICAgICAgICAgICAgZnVuY3Rpb24gKF8weDE2M2ExZCkgewogICAgICAgICAgICAgICAgICAgICAgICAgICAgdmFyIF8weDQzZTc4NSA9IF8weDUxMDhkYjsKICAgICAgICAgICAgICAgICAgICAgICAgICAgIHJldHVybiBfMHgxOWUxNzAoCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDQzZTc4NSgweDI1MCksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDE2M2ExZCwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MWZjOTc4LAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOTJjMTcKICAgICAgICAgICAgICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICAgIF8weDM5MmMxNyhfMHgxMjNjMmJbXzB4NTEwOGRiKDB4MzI3KV0pOwogICAgICAgICAgICAgICAgfSkoXzB4NDdmODgzLCBfMHgzNGRkNzgsIF8weDQ5NGU5OSwgXzB4MzlmOTdhKTsKICAgICAgICAgICAgICB9KTsKICAgICAgICAgICAgfQogICAgICAgICAgICByZXR1cm4gKF8weDJmNzBiYyA9IF8weDJmNzBiYwogICAgICAgICAgICAgID8gXzB4MmY3MGJjW18weDVjNWNjYSgweDFlZCldKF8weDY1ZTgzNiwgXzB4NjVlODM2KQogICAgICAgICAgICAgIDogXzB4NjVlODM2KCkpOwogICAgICAgICAgfSwKICAgICAgICB9KTsKICAgICAgfQogICAgICBmdW5jdGlvbiBfMHgxMjE3MjgoXzB4MzllODViLCBfMHgyNjM2M2YsIF8weDM4MzhmYykgewogICAgICAgIHZhciBfMHg0YTk0NTQgPSAic3VzcGVuZGVkU3RhcnQiOwogICAgICAgIHJldHVybiBmdW5jdGlvbiAoXzB4MzNiOTA3LCBfMHg1YzM0OGIpIHsKICAgICAgICAgIHZhciBfMHgxNGFmOTMgPSB3XzB4MjVmMzsKICAgICAgICAgIGlmIChfMHgxNGFmOTMoMHgyZWYpID09PSBfMHg0YTk0NTQpIHRocm93IG5ldyBFcnJvcihfMHgxNGFmOTMoMHgzNWEpKTsKICAgICAgICAgIGlmICgiY29tcGxldGVkIiA9PT0gXzB4NGE5NDU0KSB7CiAgICAgICAgICAgIGlmICgidGhyb3ciID09PSBfMHgzM2I5MDcpIHRocm93IF8weDVjMzQ4YjsKICAgICAgICAgICAgcmV0dXJuIF8weDE1OTIwMCgpOwogICAgICAgICAgfQogICAgICAgICAgZm9yICgKICAgICAgICAgICAgXzB4MzgzOGZjW18weDE0YWY5MygweDI1YSldID0gXzB4MzNiOTA3LAogICAgICAgICAgICAgIF8weDM4MzhmY1tfMHgxNGFmOTMoMHgzMjcpXSA9IF8weDVjMzQ4YjsKICAgICAgICAgICAgOwoKICAgICAgICAgICkgewogICAgICAgICAgICB2YXIgXzB4NDM2NTJhID0gXzB4MzgzOGZjW18weDE0YWY5MygweDFiYyldOwogICAgICAgICAgICBpZiAoXzB4NDM2NTJhKSB7CiAgICAgICAgICAgICAgdmFyIF8weGMxMmY2ZiA9IF8weDU0ODlmMyhfMHg0MzY1MmEsIF8weDM4MzhmYyk7CiAgICAgICAgICAgICAgaWYgKF8weGMxMmY2ZikgewogICAgICAgICAgICAgICAgaWYgKF8weGMxMmY2ZiA9PT0gXzB4NTExYjA1KSBjb250aW51ZTsKICAgICAgICAgICAgICAgIHJldHVybiBfMHhjMTJmNmY7CiAgICAgICAgICAgICAgfQogICAgICAgICAgICB9CiAgICAgICAgICAgIGlmIChfMHgxNGFmOTMoMHgzODkpID09PSBfMHgzODM4ZmNbXzB4MTRhZjkzKDB4MjVhKV0pCiAgICAgICAgICAgICAgXzB4MzgzOGZjW18weDE0YWY5MygweDNiMildID0gXzB4MzgzOGZjW18weDE0YWY5MygweDJhMildID0KICAgICAgICAgICAgICAgIF8weDM4MzhmY1tfMHgxNGFmOTMoMHgzMjcpXTsKICAgICAgICAgICAgZWxzZSB7CiAgICAgICAgICAgICAgaWYgKCJ0aHJvdyIgPT09IF8weDM4MzhmY1tfMHgxNGFmOTMoMHgyNWEpXSkgewogICAgICAgICAgICAgICAgaWYgKCJzdXNwZW5kZWRTdGFydCIgPT09IF8weDRhOTQ1NCkKICAgICAgICAgICAgICAgICAgdGhyb3cgKChfMHg0YTk0NTQgPSBfMHgxNGFmOTMoMHgxNmEpKSwgXzB4MzgzOGZjWyJhcmciXSk7CiAgICAgICAgICAgICAgICBfMHgzODM4ZmNbXzB4MTRhZjkzKDB4MmNiKV0oXzB4MzgzOGZjW18weDE0YWY5MygweDMyNyldKTsKICAgICAgICAgICAgICB9IGVsc2UKICAgICAgICAgICAgICAgIF8weDE0YWY5MygweDJmZCkgPT09IF8weDM4MzhmY1tfMHgxNGFmOTMoMHgyNWEpXSAmJgogICAgICAgICAgICAgICAgICBfMHgzODM4ZmNbImFicnVwdCJdKF8weDE0YWY5MygweDJmZCksIF8weDM4MzhmY1siYXJnIl0pOwogICAgICAgICAgICB9CiAgICAgICAgICAgIF8weDRhOTQ1NCA9IF8weDE0YWY5MygweDJlZik7CiAgICAgICAgICAgIHZhciBfMHgxYTk5YjUgPSBfMHg1NzVkZmQoXzB4MzllODViLCBfMHgyNjM2M2YsIF8weDM4MzhmYyk7CiAgICAgICAgICAgIGlmICgibm9ybWFsIiA9PT0gXzB4MWE5OWI1WyJ0eXBlIl0pIHsKICAgICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgICAoKF8weDRhOTQ1NCA9IF8weDM4MzhmY1tfMHgxNGFmOTMoMHgxZTMpXQogICAgICAgICAgICAgICAgICA/IF8weDE0YWY5MygweDE2YSkKICAgICAgICAgICAgICAgICAgOiAic3VzcGVuZGVkWWllbGQiKSwKICAgICAgICAgICAgICAgIF8weDFhOTliNVtfMHgxNGFmOTMoMHgzMjcpXSA9PT0gXzB4NTExYjA1KQogICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgIGNvbnRpbnVlOwogICAgICAgICAgICAgIHJldHVybiB7CiAgICAgICAgICAgICAgICB2YWx1ZTogXzB4MWE5OWI1W18weDE0YWY5MygweDMyNyldLAogICAgICAgICAgICAgICAgZG9uZTogXzB4MzgzOGZjW18weDE0YWY5MygweDFlMyldLAogICAgICAgICAgICAgIH07CiAgICAgICAgICAgIH0KICAgICAgICAgICAgXzB4MTRhZjkzKDB4MjUwKSA9PT0gXzB4MWE5OWI1W18weDE0YWY5MygweDFhYildICYmCiAgICAgICAgICAgICAgKChfMHg0YTk0NTQgPSBfMHgxNGFmOTMoMHgxNmEpKSwKICAgICAgICAgICAgICAoXzB4MzgzOGZjW18weDE0YWY5MygweDI1YSldID0gXzB4MTRhZjkzKDB4MjUwKSksCiAgICAgICAgICAgICAgKF8weDM4MzhmY1tfMHgxNGFmOTMoMHgzMjcpXSA9IF8weDFhOTliNVtfMHgxNGFmOTMoMHgzMjcpXSkpOwogICAgICAgICAgfQogICAgICAgIH07CiAgICAgIH0KICAgICAgZnVuY3Rpb24gXzB4NTQ4OWYzKF8weDNjMWUyZCwgXzB4NTk4NzdmKSB7CiAgICAgICAgdmFyIF8weDI5OWVkOSA9IF8weDQ0YTBmYywKICAgICAgICAgIF8weDFhNDVmYyA9IF8weDU5ODc3ZlsibWV0aG9kIl0sCiAgICAgICAgICBfMHgxMTZlZGIgPSBfMHgzYzFlMmRbXzB4Mjk5ZWQ5KDB4M2IzKV1bXzB4MWE0NWZjXTsKICAgICAgICBpZiAodm9pZCAoLTB4MTVmZSArIDB4ZTkzICsgMHg3NmIpID09PSBfMHgxMTZlZGIpCiAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICAoXzB4NTk4NzdmW18weDI5OWVkOSgweDFiYyldID0gbnVsbCksCiAgICAgICAgICAgIChfMHgyOTllZDkoMHgyNTApID09PSBfMHgxYTQ1ZmMgJiYKICAgICAgICAgICAgICBfMHgzYzFlMmRbXzB4Mjk5ZWQ5KDB4M2IzKV1bXzB4Mjk5ZWQ5KDB4MmZkKV0gJiYKICAgICAgICAgICAgICAoKF8weDU5ODc3ZlsibWV0aG9kIl0gPSAicmV0dXJuIiksCiAgICAgICAgICAgICAgKF8weDU5ODc3ZltfMHgyOTllZDkoMHgzMjcpXSA9IHZvaWQgKAogICAgICAgICAgICAgICAgLTB4NzggKiAtMHgyNSArCiAgICAgICAgICAgICAgICAtMHgyMjcyICsKICAgICAgICAgICAgICAgIDB4MTExYSAqIDB4MQogICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgIF8weDU0ODlmMyhfMHgzYzFlMmQsIF8weDU5ODc3ZiksCiAgICAgICAgICAgICAgXzB4Mjk5ZWQ5KDB4MjUwKSA9PT0gXzB4NTk4NzdmW18weDI5OWVkOSgweDI1YSldKSkgfHwKICAgICAgICAgICAgICAoInJldHVybiIgIT09IF8weDFhNDVmYyAmJgogICAgICAgICAgICAgICAgKChfMHg1OTg3N2ZbXzB4Mjk5ZWQ5KDB4MjVhKV0gPSBfMHgyOTllZDkoMHgyNTApKSwKICAgICAgICAgICAgICAgIChfMHg1OTg3N2ZbXzB4Mjk5ZWQ5KDB4MzI3KV0gPSBuZXcgVHlwZUVycm9yKAogICAgICAgICAgICAgICAgICAiVGhlXHgyMGl0ZXJhdG9yXHgyMGRvZXNceDIwbm90XHgyMHByb3ZpZGVceDIwYVx4MjBceDI3IiArCiAgICAgICAgICAgICAgICAgICAgXzB4MWE0NWZjICsKICAgICAgICAgICAgICAgICAgICBfMHgyOTllZDkoMHgzMmYpCiAgICAgICAgICAgICAgICApKSkpLAogICAgICAgICAgICBfMHg1MTFiMDUKICAgICAgICAgICk7CiAgICAgICAgdmFyIF8weDViZTQ2YSA9IF8weDU3NWRmZCgKICAgICAgICAgIF8weDExNmVkYiwKICAgICAgICAgIF8weDNjMWUyZFtfMHgyOTllZDkoMHgzYjMpXSwKICAgICAgICAgIF8weDU5ODc3ZltfMHgyOTllZDkoMHgzMjcpXQogICAgICAgICk7CiAgICAgICAgaWYgKF8weDI5OWVkOSgweDI1MCkgPT09IF8weDViZTQ2YVtfMHgyOTllZDkoMHgxYWIpXSkKICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgIChfMHg1OTg3N2ZbXzB4Mjk5ZWQ5KDB4MjVhKV0gPSBfMHgyOTllZDkoMHgyNTApKSwKICAgICAgICAgICAgKF8weDU5ODc3ZlsiYXJnIl0gPSBfMHg1YmU0NmFbXzB4Mjk5ZWQ5KDB4MzI3KV0pLAogICAgICAgICAgICAoXzB4NTk4NzdmW18weDI5OWVkOSgweDFiYyldID0gbnVsbCksCiAgICAgICAgICAgIF8weDUxMWIwNQogICAgICAgICAgKTsKICAgICAgICB2YXIgXzB4NDRmNTMzID0gXzB4NWJlNDZhW18weDI5OWVkOSgweDMyNyldOwogICAgICAgIHJldHVybiBfMHg0NGY1MzMKICAgICAgICAgID8gXzB4NDRmNTMzWyJkb25lIl0KICAgICAgICAgICAgPyAoKF8weDU5ODc3ZltfMHgzYzFlMmRbXzB4Mjk5ZWQ5KDB4MTZlKV1dID0KICAgICAgICAgICAgICAgIF8weDQ0ZjUzM1tfMHgyOTllZDkoMHgyZTQpXSksCiAgICAgICAgICAgICAgKF8weDU5ODc3ZlsibmV4dCJdID0gXzB4M2MxZTJkW18weDI5OWVkOSgweDI4MSldKSwKICAgICAgICAgICAgICBfMHgyOTllZDkoMHgyZmQpICE9PSBfMHg1OTg3N2ZbXzB4Mjk5ZWQ5KDB4MjVhKV0gJiYKICAgICAgICAgICAgICAgICgoXzB4NTk4NzdmW18weDI5OWVkOSgweDI1YSldID0gXzB4Mjk5ZWQ5KDB4Mzg5KSksCiAgICAgICAgICAgICAgICAoXzB4NTk4NzdmWyJhcmciXSA9IHZvaWQgKAogICAgICAgICAgICAgICAgICAweDFhMiAqIC0weDE3ICsKICAgICAgICAgICAgICAgICAgLTB4MTkxMCArCiAgICAgICAgICAgICAgICAgIDB4NSAqIDB4Yzg2CiAgICAgICAgICAgICAgICApKSksCiAgICAgICAgICAgICAgKF8weDU5ODc3ZltfMHgyOTllZDkoMHgxYmMpXSA9IG51bGwpLAogICAgICAgICAgICAgIF8weDUxMWIwNSkKICAgICAgICAgICAgOiBfMHg0NGY1MzMKICAgICAgICAgIDogKChfMHg1OTg3N2ZbXzB4Mjk5ZWQ5KDB4MjVhKV0gPSBfMHgyOTllZDkoMHgyNTApKSwKICAgICAgICAgICAgKF8weDU5ODc3ZlsiYXJnIl0gPSBuZXcgVHlwZUVycm9yKF8weDI5OWVkOSgweDI1MSkpKSwKICAgICAgICAgICAgKF8weDU5ODc3ZltfMHgyOTllZDkoMHgxYmMpXSA9IG51bGwpLAogICAgICAgICAgICBfMHg1MTFiMDUpOwogICAgICB9CiAgICAgIGZ1bmN0aW9uIF8weDE0MDE1YyhfMHg1YmFkMzcpIHsKICAgICAgICB2YXIgXzB4NDJhODQ3ID0gXzB4NDRhMGZjLAogICAgICAgICAgXzB4NDAxY2I5ID0gewogICAgICAgICAgICB0cnlMb2M6IF8weDViYWQzN1stMHg5NTMgKiAweDMgKyAweGQzYyArIDB4ZWJkXSwKICAgICAgICAgIH07CiAgICAgICAgLTB4ODViICsgMHgxMTgxICsgLTB4OTI1IGluIF8weDViYWQzNyAmJgogICAgICAgICAgKF8weDQwMWNiOVsiY2F0Y2hMb2MiXSA9IF8weDViYWQzN1sweDEyYjQgKyAtMHgxZDA4ICsgMHhhNTVdKSwKICAgICAgICAgIDB4NGRjICsgMHgxYjZmICsgMHhhYzMgKiAtMHgzIGluIF8weDViYWQzNyAmJgogICAgICAgICAgICAoKF8weDQwMWNiOVtfMHg0MmE4NDcoMHgyMjApXSA9CiAgICAgICAgICAgICAgXzB4NWJhZDM3Wy0weGQwYyAqIC0weDIgKyAweDkxNCArIC0weGUgKiAweDI4M10pLAogICAgICAgICAgICAoXzB4NDAxY2I5W18weDQyYTg0NygweDJmYildID0KICAgICAgICAgICAgICBfMHg1YmFkMzdbMHg3ICogLTB4MjE2ICsgMHg3MDIgKyAweDc5Yl0pKSwKICAgICAgICAgIHRoaXNbInRyeUVudHJpZXMiXVtfMHg0MmE4NDcoMHgzNmUpXShfMHg0MDFjYjkpOwogICAgICB9CiAgICAgIGZ1bmN0aW9uIF8weDJmODJiMyhfMHg0M2ZkNzgpIHsKICAgICAgICB2YXIgXzB4MzhkZTI5ID0gXzB4NDRhMGZjLAogICAgICAgICAgXzB4MmYxZDZjID0gXzB4NDNmZDc4W18weDM4ZGUyOSgweDM4NyldIHx8IHt9OwogICAgICAgIChfMHgyZjFkNmNbInR5cGUiXSA9IF8weDM4ZGUyOSgweDJmMSkpLAogICAgICAgICAgZGVsZXRlIF8weDJmMWQ2Y1tfMHgzOGRlMjkoMHgzMjcpXSwKICAgICAgICAgIChfMHg0M2ZkNzhbImNvbXBsZXRpb24iXSA9IF8weDJmMWQ2Yyk7CiAgICAgIH0KICAgICAgZnVuY3Rpb24gXzB4MWI1ZGI5KF8weDUzYjg0MykgewogICAgICAgIHZhciBfMHgyNTY5YjYgPSBfMHg0NGEwZmM7CiAgICAgICAgKHRoaXNbXzB4MjU2OWI2KDB4MzM3KV0gPSBbCiAgICAgICAgICB7CiAgICAgICAgICAgIHRyeUxvYzogXzB4MjU2OWI2KDB4MWMzKSwKICAgICAgICAgIH0sCiAgICAgICAgXSksCiAgICAgICAgICBfMHg1M2I4NDNbXzB4MjU2OWI2KDB4MjU0KV0oXzB4MTQwMTVjLCB0aGlzKSwKICAgICAgICAgIHRoaXNbXzB4MjU2OWI2KDB4MmFhKV0oISgweDFiYmEgKyAweDEzMmUgKyAtMHg0YyAqIDB4OWUpKTsKICAgICAgfQogICAgICBmdW5jdGlvbiBfMHgyZWRiZjQoXzB4ZTMyYjE2KSB7CiAgICAgICAgdmFyIF8weDNhMGVjZiA9IF8weDQ0YTBmYzsKICAgICAgICBpZiAoXzB4ZTMyYjE2KSB7CiAgICAgICAgICB2YXIgXzB4M2Y1MDNhID0gXzB4ZTMyYjE2W18weDVhY2QxYV07CiAgICAgICAgICBpZiAoXzB4M2Y1MDNhKSByZXR1cm4gXzB4M2Y1MDNhWyJjYWxsIl0oXzB4ZTMyYjE2KTsKICAgICAgICAgIGlmIChfMHgzYTBlY2YoMHgxZWUpID09IHR5cGVvZiBfMHhlMzJiMTZbXzB4M2EwZWNmKDB4Mzg5KV0pCiAgICAgICAgICAgIHJldHVybiBfMHhlMzJiMTY7CiAgICAgICAgICBpZiAoIWlzTmFOKF8weGUzMmIxNlsibGVuZ3RoIl0pKSB7CiAgICAgICAgICAgIHZhciBfMHgxZmYxY2YgPSAtKC0weDI1NGMgKyAweGM3ICogMHgxMSArIC0weDIgKiAtMHhjMGIpLAogICAgICAgICAgICAgIF8weDRmMTAwMCA9IGZ1bmN0aW9uIF8weDEzNmJmYygpIHsKICAgICAgICAgICAgICAgIHZhciBfMHgxMGI5MzMgPSBfMHgzYTBlY2Y7CiAgICAgICAgICAgICAgICBmb3IgKDsgKytfMHgxZmYxY2YgPCBfMHhlMzJiMTZbXzB4MTBiOTMzKDB4MjU5KV07ICkKICAgICAgICAgICAgICAgICAgaWYgKF8weDQzMjM4Y1tfMHgxMGI5MzMoMHgzMzQpXShfMHhlMzJiMTYsIF8weDFmZjFjZikpCiAgICAgICAgICAgICAgICAgICAgcmV0dXJuICgKICAgICAgICAgICAgICAgICAgICAgIChfMHgxMzZiZmNbXzB4MTBiOTMzKDB4MmU0KV0gPSBfMHhlMzJiMTZbXzB4MWZmMWNmXSksCiAgICAgICAgICAgICAgICAgICAgICAoXzB4MTM2YmZjW18weDEwYjkzMygweDFlMyldID0gISgKICAgICAgICAgICAgICAgICAgICAgICAgLTB4MWY3OSArCiAgICAgICAgICAgICAgICAgICAgICAgIC0weDIyZDIgKwogICAgICAgICAgICAgICAgICAgICAgICAweDQyNGMKICAgICAgICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgICAgICAgXzB4MTM2YmZjCiAgICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgICAgICAgIChfMHgxMzZiZmNbInZhbHVlIl0gPSB2b2lkICgtMHg2MzkgKyAtMHgxMTVmICsgMHhhICogMHgyNWMpKSwKICAgICAgICAgICAgICAgICAgKF8weDEzNmJmY1tfMHgxMGI5MzMoMHgxZTMpXSA9ICEoCiAgICAgICAgICAgICAgICAgICAgMHgxNGFkICsKICAgICAgICAgICAgICAgICAgICAtMHgxICogMHhhMWIgKwogICAgICAgICAgICAgICAgICAgIC0weGE5MgogICAgICAgICAgICAgICAgICApKSwKICAgICAgICAgICAgICAgICAgXzB4MTM2YmZjCiAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgIH07CiAgICAgICAgICAgIHJldHVybiAoXzB4NGYxMDAwW18weDNhMGVjZigweDM4OSldID0gXzB4NGYxMDAwKTsKICAgICAgICAgIH0KICAgICAgICB9CiAgICAgICAgcmV0dXJuIHsKICAgICAgICAgIG5leHQ6IF8weDE1OTIwMCwKICAgICAgICB9OwogICAgICB9CiAgICAgIGZ1bmN0aW9uIF8weDE1OTIwMCgpIHsKICAgICAgICByZXR1cm4gewogICAgICAgICAgdmFsdWU6IHZvaWQgKC0weDU0MCArIC0weDEyICogLTB4NjAgKyAtMHg4ICogMHgzMCksCiAgICAgICAgICBkb25lOiAhKC0weDUyNiArIC0weDZkNCAqIDB4MiArIC0weDIgKiAtMHg5NjcpLAogICAgICAgIH07CiAgICAgIH0KICAgICAgcmV0dXJuICgKICAgICAgICAoXzB4MmU2N2U5W18weDQ0YTBmYygweDM0NCldID0gXzB4M2E1YWM3KSwKICAgICAgICBfMHg0Y2Y3ZDgoXzB4NDI3NjNiLCBfMHg0NGEwZmMoMHgyYWMpLCB7CiAgICAgICAgICB2YWx1ZTogXzB4M2E1YWM3LAogICAgICAgICAgY29uZmlndXJhYmxlOiAhKC0weDI0MTQgKyAweDEzMDcgKyAweDExMGQpLAogICAgICAgIH0pLAogICAgICAgIF8weDRjZjdkOChfMHgzYTVhYzcsIF8weDQ0YTBmYygweDJhYyksIHsKICAgICAgICAgIHZhbHVlOiBfMHgyZTY3ZTksCiAgICAgICAgICBjb25maWd1cmFibGU6ICEoMHgxMTdkICsgLTB4MTJhYSArIDB4MTJkKSwKICAgICAgICB9KSwKICAgICAgICAoXzB4MmU2N2U5W18weDQ0YTBmYygweDE4YyldID0gXzB4M2JhZjJjKAogICAgICAgICAgXzB4M2E1YWM3LAogICAgICAgICAgXzB4NDQ3YWI0LAogICAgICAgICAgXzB4NDRhMGZjKDB4MzExKQogICAgICAgICkpLAogICAgICAgIChfMHg1MDdiMjNbXzB4NDRhMGZjKDB4Mzg2KV0gPSBmdW5jdGlvbiAoXzB4NTRmZGM2KSB7CiAgICAgICAgICB2YXIgXzB4MmM0MDM4ID0gXzB4NDRhMGZjLAogICAgICAgICAgICBfMHgyOTc5N2IgPQogICAgICAgICAgICAgIF8weDJjNDAzOCgweDFlZSkgPT0gdHlwZW9mIF8weDU0ZmRjNiAmJgogICAgICAgICAgICAgIF8weDU0ZmRjNltfMHgyYzQwMzgoMHgyYWMpXTsKICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgICEhXzB4Mjk3OTdiICYmCiAgICAgICAgICAgIChfMHgyOTc5N2IgPT09IF8weDJlNjdlOSB8fAogICAgICAgICAgICAgIF8weDJjNDAzOCgweDMxMSkgPT09CiAgICAgICAgICAgICAgICAoXzB4Mjk3OTdiWyJkaXNwbGF5TmFtZSJdIHx8IF8weDI5Nzk3YlsibmFtZSJdKSkKICAgICAgICAgICk7CiAgICAgICAgfSksCiAgICAgICAgKF8weDUwN2IyM1tfMHg0NGEwZmMoMHgzYTUpXSA9IGZ1bmN0aW9uIChfMHg0MWZmM2MpIHsKICAgICAgICAgIHZhciBfMHgyODZjZTcgPSBfMHg0NGEwZmM7CiAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICBPYmplY3RbXzB4Mjg2Y2U3KDB4MjNiKV0KICAgICAgICAgICAgICA/IE9iamVjdFtfMHgyODZjZTcoMHgyM2IpXShfMHg0MWZmM2MsIF8weDNhNWFjNykKICAgICAgICAgICAgICA6ICgoXzB4NDFmZjNjW18weDI4NmNlNygweDJlYSldID0gXzB4M2E1YWM3KSwKICAgICAgICAgICAgICAgIF8weDNiYWYyYyhfMHg0MWZmM2MsIF8weDQ0N2FiNCwgIkdlbmVyYXRvckZ1bmN0aW9uIikpLAogICAgICAgICAgICAoXzB4NDFmZjNjW18weDI4NmNlNygweDM0NCldID0gT2JqZWN0WyJjcmVhdGUiXShfMHg0Mjc2M2IpKSwKICAgICAgICAgICAgXzB4NDFmZjNjCiAgICAgICAgICApOwogICAgICAgIH0pLAogICAgICAgIChfMHg1MDdiMjNbXzB4NDRhMGZjKDB4MmQxKV0gPSBmdW5jdGlvbiAoXzB4NGQzMTczKSB7CiAgICAgICAgICByZXR1cm4gewogICAgICAgICAgICBfX2F3YWl0OiBfMHg0ZDMxNzMsCiAgICAgICAgICB9OwogICAgICAgIH0pLAogICAgICAgIF8weDRlMTU2YihfMHgyM2ViNzNbXzB4NDRhMGZjKDB4MzQ0KV0pLAogICAgICAgIF8weDNiYWYyYyhfMHgyM2ViNzNbXzB4NDRhMGZjKDB4MzQ0KV0sIF8weDUyZjI5MiwgZnVuY3Rpb24gKCkgewogICAgICAgICAgcmV0dXJuIHRoaXM7CiAgICAgICAgfSksCiAgICAgICAgKF8weDUwN2IyM1tfMHg0NGEwZmMoMHgyNzMpXSA9IF8weDIzZWI3MyksCiAgICAgICAgKF8weDUwN2IyM1tfMHg0NGEwZmMoMHgxZTcpXSA9IGZ1bmN0aW9uICgKICAgICAgICAgIF8weDE0MDNjZiwKICAgICAgICAgIF8weGI4NjRjZSwKICAgICAgICAgIF8weDE5MTQ2MSwKICAgICAgICAgIF8weDNhYWZiNywKICAgICAgICAgIF8weDRiYzVjYQogICAgICAgICkgewogICAgICAgICAgdmFyIF8weDIyNWIxOSA9IF8weDQ0YTBmYzsKICAgICAgICAgIHZvaWQgKC0weDEgKiAweDExNDUgKyAtMHgyMzkgKyAtMHgzZTYgKiAtMHg1KSA9PT0gXzB4NGJjNWNhICYmCiAgICAgICAgICAgIChfMHg0YmM1Y2EgPSBQcm9taXNlKTsKICAgICAgICAgIHZhciBfMHgxZTIzYzUgPSBuZXcgXzB4MjNlYjczKAogICAgICAgICAgICBfMHgzZTQ2YzYoXzB4MTQwM2NmLCBfMHhiODY0Y2UsIF8weDE5MTQ2MSwgXzB4M2FhZmI3KSwKICAgICAgICAgICAgXzB4NGJjNWNhCiAgICAgICAgICApOwogICAgICAgICAgcmV0dXJuIF8weDUwN2IyM1tfMHgyMjViMTkoMHgzODYpXShfMHhiODY0Y2UpCiAgICAgICAgICAgID8gXzB4MWUyM2M1CiAgICAgICAgICAgIDogXzB4MWUyM2M1W18weDIyNWIxOSgweDM4OSldKClbXzB4MjI1YjE5KDB4MWVkKV0oZnVuY3Rpb24gKAogICAgICAgICAgICAgICAgXzB4M2JmOGEwCiAgICAgICAgICAgICAgKSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4MWFmMDNjID0gXzB4MjI1YjE5OwogICAgICAgICAgICAgICAgcmV0dXJuIF8weDNiZjhhMFtfMHgxYWYwM2MoMHgxZTMpXQogICAgICAgICAgICAgICAgICA/IF8weDNiZjhhMFtfMHgxYWYwM2MoMHgyZTQpXQogICAgICAgICAgICAgICAgICA6IF8weDFlMjNjNVtfMHgxYWYwM2MoMHgzODkpXSgpOwogICAgICAgICAgICAgIH0pOwogICAgICAgIH0pLAogICAgICAgIF8weDRlMTU2YihfMHg0Mjc2M2IpLAogICAgICAgIF8weDNiYWYyYyhfMHg0Mjc2M2IsIF8weDQ0N2FiNCwgXzB4NDRhMGZjKDB4MWI1KSksCiAgICAgICAgXzB4M2JhZjJjKF8weDQyNzYzYiwgXzB4NWFjZDFhLCBmdW5jdGlvbiAoKSB7CiAgICAgICAgICByZXR1cm4gdGhpczsKICAgICAgICB9KSwKICAgICAgICBfMHgzYmFmMmMoXzB4NDI3NjNiLCBfMHg0NGEwZmMoMHgzYWUpLCBmdW5jdGlvbiAoKSB7CiAgICAgICAgICB2YXIgXzB4MjZmMDZjID0gXzB4NDRhMGZjOwogICAgICAgICAgcmV0dXJuIF8weDI2ZjA2YygweDE3Nik7CiAgICAgICAgfSksCiAgICAgICAgKF8weDUwN2IyM1sia2V5cyJdID0gZnVuY3Rpb24gKF8weDEwZTIzMykgewogICAgICAgICAgdmFyIF8weDUxNTA0NCA9IF8weDQ0YTBmYywKICAgICAgICAgICAgXzB4MTg0ZGZjID0gT2JqZWN0KF8weDEwZTIzMyksCiAgICAgICAgICAgIF8weDFlZTVlYSA9IFtdOwogICAgICAgICAgZm9yICh2YXIgXzB4MTAzMTc1IGluIF8weDE4NGRmYykKICAgICAgICAgICAgXzB4MWVlNWVhW18weDUxNTA0NCgweDM2ZSldKF8weDEwMzE3NSk7CiAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICBfMHgxZWU1ZWFbXzB4NTE1MDQ0KDB4MmYzKV0oKSwKICAgICAgICAgICAgZnVuY3Rpb24gXzB4NWM0YjBiKCkgewogICAgICAgICAgICAgIHZhciBfMHg0ZjlhMmIgPSBfMHg1MTUwNDQ7CiAgICAgICAgICAgICAgZm9yICg7IF8weDFlZTVlYVtfMHg0ZjlhMmIoMHgyNTkpXTsgKSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4MTgwZTY0ID0gXzB4MWVlNWVhW18weDRmOWEyYigweDI2NyldKCk7CiAgICAgICAgICAgICAgICBpZiAoXzB4MTgwZTY0IGluIF8weDE4NGRmYykKICAgICAgICAgICAgICAgICAgcmV0dXJuICgKICAgICAgICAgICAgICAgICAgICAoXzB4NWM0YjBiW18weDRmOWEyYigweDJlNCldID0gXzB4MTgwZTY0KSwKICAgICAgICAgICAgICAgICAgICAoXzB4NWM0YjBiW18weDRmOWEyYigweDFlMyldID0gISgKICAgICAgICAgICAgICAgICAgICAgIDB4NDExICogLTB4MiArCiAgICAgICAgICAgICAgICAgICAgICAtMHgyMCAqIDB4M2MgKwogICAgICAgICAgICAgICAgICAgICAgMHgxICogMHhmYTMKICAgICAgICAgICAgICAgICAgICApKSwKICAgICAgICAgICAgICAgICAgICBfMHg1YzRiMGIKICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgcmV0dXJuICgKICAgICAgICAgICAgICAgIChfMHg1YzRiMGJbImRvbmUiXSA9ICEoLTB4NGQyICogLTB4NSArIC0weDNmZCArIC0weDEzICogMHgxMGYpKSwKICAgICAgICAgICAgICAgIF8weDVjNGIwYgogICAgICAgICAgICAgICk7CiAgICAgICAgICAgIH0KICAgICAgICAgICk7CiAgICAgICAgfSksCiAgICAgICAgKF8weDUwN2IyM1tfMHg0NGEwZmMoMHgzOGIpXSA9IF8weDJlZGJmNCksCiAgICAgICAgKF8weDFiNWRiOVsicHJvdG90eXBlIl0gPSB7CiAgICAgICAgICBjb25zdHJ1Y3RvcjogXzB4MWI1ZGI5LAogICAgICAgICAgcmVzZXQ6IGZ1bmN0aW9uIChfMHgzZWJjNTgpIHsKICAgICAgICAgICAgdmFyIF8weDUyYzAyNSA9IF8weDQ0YTBmYzsKICAgICAgICAgICAgaWYgKAogICAgICAgICAgICAgICgodGhpc1tfMHg1MmMwMjUoMHgzMmMpXSA9IC0weDE2ICogMHgxODEgKyAweDFlNmEgKyAweDJhYyksCiAgICAgICAgICAgICAgKHRoaXNbXzB4NTJjMDI1KDB4Mzg5KV0gPSAweDEgKiAweGEzZiArIC0weDEgKiAweDFmYjcgKyAweDE1NzgpLAogICAgICAgICAgICAgICh0aGlzW18weDUyYzAyNSgweDNiMildID0gdGhpc1tfMHg1MmMwMjUoMHgyYTIpXSA9CiAgICAgICAgICAgICAgICB2b2lkICgweDE4Y2EgKyAtMHg1MmMgKiAweDIgKyAtMHhlNzIpKSwKICAgICAgICAgICAgICAodGhpc1tfMHg1MmMwMjUoMHgxZTMpXSA9ICEoLTB4Nzc1ICsgLTB4ZmUxICsgLTB4MTc1NyAqIC0weDEpKSwKICAgICAgICAgICAgICAodGhpc1tfMHg1MmMwMjUoMHgxYmMpXSA9IG51bGwpLAogICAgICAgICAgICAgICh0aGlzW18weDUyYzAyNSgweDI1YSldID0gXzB4NTJjMDI1KDB4Mzg5KSksCiAgICAgICAgICAgICAgKHRoaXNbXzB4NTJjMDI1KDB4MzI3KV0gPSB2b2lkICgKICAgICAgICAgICAgICAgIC0weDFhMGEgKwogICAgICAgICAgICAgICAgLTB4MjYzYyArCiAgICAgICAgICAgICAgICAtMHgyICogLTB4MjAyMwogICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgIHRoaXNbXzB4NTJjMDI1KDB4MzM3KV1bXzB4NTJjMDI1KDB4MjU0KV0oXzB4MmY4MmIzKSwKICAgICAgICAgICAgICAhXzB4M2ViYzU4KQogICAgICAgICAgICApIHsKICAgICAgICAgICAgICBmb3IgKHZhciBfMHgyNzExMzQgaW4gdGhpcykKICAgICAgICAgICAgICAgICJ0IiA9PT0KICAgICAgICAgICAgICAgICAgXzB4MjcxMTM0WyJjaGFyQXQiXSgweDMgKiAweDcwNyArIDB4MjEzMiArIDB4NyAqIC0weDdjMSkgJiYKICAgICAgICAgICAgICAgICAgXzB4NDMyMzhjW18weDUyYzAyNSgweDMzNCldKHRoaXMsIF8weDI3MTEzNCkgJiYKICAgICAgICAgICAgICAgICAgIWlzTmFOKAogICAgICAgICAgICAgICAgICAgICtfMHgyNzExMzRbInNsaWNlIl0oMHgyNjI5ICogMHgxICsgLTB4N2VjICsgLTB4MWUzYykKICAgICAgICAgICAgICAgICAgKSAmJgogICAgICAgICAgICAgICAgICAodGhpc1tfMHgyNzExMzRdID0gdm9pZCAoMHgxNGEzICsgMHgyMTEgKyAtMHgxNmI0KSk7CiAgICAgICAgICAgIH0KICAgICAgICAgIH0sCiAgICAgICAgICBzdG9wOiBmdW5jdGlvbiAoKSB7CiAgICAgICAgICAgIHZhciBfMHg1ZDEzMzEgPSBfMHg0NGEwZmM7CiAgICAgICAgICAgIHRoaXNbXzB4NWQxMzMxKDB4MWUzKV0gPSAhKC0weDExNTcgKyAtMHgxZDAwICogLTB4MSArIC0weGJhOSk7CiAgICAgICAgICAgIHZhciBfMHgzNjBjYTEgPQogICAgICAgICAgICAgIHRoaXNbXzB4NWQxMzMxKDB4MzM3KV1bMHgxODFjICsgMHgyMjUyICsgMHgxMzdhICogLTB4M11bCiAgICAgICAgICAgICAgICBfMHg1ZDEzMzEoMHgzODcpCiAgICAgICAgICAgICAgXTsKICAgICAgICAgICAgaWYgKF8weDVkMTMzMSgweDI1MCkgPT09IF8weDM2MGNhMVtfMHg1ZDEzMzEoMHgxYWIpXSkKICAgICAgICAgICAgICB0aHJvdyBfMHgzNjBjYTFbImFyZyJdOwogICAgICAgICAgICByZXR1cm4gdGhpc1tfMHg1ZDEzMzEoMHgyOWEpXTsKICAgICAgICAgIH0sCiAgICAgICAgICBkaXNwYXRjaEV4Y2VwdGlvbjogZnVuY3Rpb24gKF8weDVjY2RiZSkgewogICAgICAgICAgICB2YXIgXzB4MjczOWVlID0gXzB4NDRhMGZjOwogICAgICAgICAgICBpZiAodGhpc1tfMHgyNzM5ZWUoMHgxZTMpXSkgdGhyb3cgXzB4NWNjZGJlOwogICAgICAgICAgICB2YXIgXzB4MjM3NWIxID0gdGhpczsKICAgICAgICAgICAgZnVuY3Rpb24gXzB4NWJjM2Y3KF8weDJmODgxMywgXzB4MjkyNmE2KSB7CiAgICAgICAgICAgICAgdmFyIF8weDE5Y2Y2NiA9IF8weDI3MzllZTsKICAgICAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICAgICAgKF8weDQ1OWRkZVtfMHgxOWNmNjYoMHgxYWIpXSA9IF8weDE5Y2Y2NigweDI1MCkpLAogICAgICAgICAgICAgICAgKF8weDQ1OWRkZVtfMHgxOWNmNjYoMHgzMjcpXSA9IF8weDVjY2RiZSksCiAgICAgICAgICAgICAgICAoXzB4MjM3NWIxW18weDE5Y2Y2NigweDM4OSldID0gXzB4MmY4ODEzKSwKICAgICAgICAgICAgICAgIF8weDI5MjZhNiAmJgogICAgICAgICAgICAgICAgICAoKF8weDIzNzViMVtfMHgxOWNmNjYoMHgyNWEpXSA9IF8weDE5Y2Y2NigweDM4OSkpLAogICAgICAgICAgICAgICAgICAoXzB4MjM3NWIxW18weDE5Y2Y2NigweDMyNyldID0gdm9pZCAoCiAgICAgICAgICAgICAgICAgICAgLTB4NzdmICsKICAgICAgICAgICAgICAgICAgICAtMHgxYzAzICogLTB4MSArCiAgICAgICAgICAgICAgICAgICAgLTB4ZCAqIDB4MTk0CiAgICAgICAgICAgICAgICAgICkpKSwKICAgICAgICAgICAgICAgICEhXzB4MjkyNmE2CiAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgfQogICAgICAgICAgICBmb3IgKAogICAgICAgICAgICAgIHZhciBfMHgyMTgxMjMgPQogICAgICAgICAgICAgICAgdGhpc1tfMHgyNzM5ZWUoMHgzMzcpXVtfMHgyNzM5ZWUoMHgyNTkpXSAtCiAgICAgICAgICAgICAgICAoLTB4OGVkICsgLTB4OWU1ICsgMHgxMmQzKTsKICAgICAgICAgICAgICBfMHgyMTgxMjMgPj0gLTB4MyAqIC0weDRlZiArIC0weDE2MWIgKiAtMHgxICsgLTB4MjRlODsKICAgICAgICAgICAgICAtLV8weDIxODEyMwogICAgICAgICAgICApIHsKICAgICAgICAgICAgICB2YXIgXzB4NWU0ZDAwID0gdGhpc1tfMHgyNzM5ZWUoMHgzMzcpXVtfMHgyMTgxMjNdLAogICAgICAgICAgICAgICAgXzB4NDU5ZGRlID0gXzB4NWU0ZDAwW18weDI3MzllZSgweDM4NyldOwogICAgICAgICAgICAgIGlmIChfMHgyNzM5ZWUoMHgxYzMpID09PSBfMHg1ZTRkMDBbInRyeUxvYyJdKQogICAgICAgICAgICAgICAgcmV0dXJuIF8weDViYzNmNyhfMHgyNzM5ZWUoMHgxZGIpKTsKICAgICAgICAgICAgICBpZiAoXzB4NWU0ZDAwW18weDI3MzllZSgweDI5ZSldIDw9IHRoaXNbXzB4MjczOWVlKDB4MzJjKV0pIHsKICAgICAgICAgICAgICAgIHZhciBfMHg1NWZkN2YgPSBfMHg0MzIzOGNbImNhbGwiXShfMHg1ZTRkMDAsICJjYXRjaExvYyIpLAogICAgICAgICAgICAgICAgICBfMHg0N2NmNmMgPSBfMHg0MzIzOGNbXzB4MjczOWVlKDB4MzM0KV0oCiAgICAgICAgICAgICAgICAgICAgXzB4NWU0ZDAwLAogICAgICAgICAgICAgICAgICAgIF8weDI3MzllZSgweDIyMCkKICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgIGlmIChfMHg1NWZkN2YgJiYgXzB4NDdjZjZjKSB7CiAgICAgICAgICAgICAgICAgIGlmICh0aGlzW18weDI3MzllZSgweDMyYyldIDwgXzB4NWU0ZDAwW18weDI3MzllZSgweDJjNCldKQogICAgICAgICAgICAgICAgICAgIHJldHVybiBfMHg1YmMzZjcoCiAgICAgICAgICAgICAgICAgICAgICBfMHg1ZTRkMDBbImNhdGNoTG9jIl0sCiAgICAgICAgICAgICAgICAgICAgICAhKC0weDI1ICogMHhlOSArIC0weDIzNjggKyAweDQ1MTUpCiAgICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgICAgaWYgKHRoaXNbInByZXYiXSA8IF8weDVlNGQwMFtfMHgyNzM5ZWUoMHgyMjApXSkKICAgICAgICAgICAgICAgICAgICByZXR1cm4gXzB4NWJjM2Y3KF8weDVlNGQwMFtfMHgyNzM5ZWUoMHgyMjApXSk7CiAgICAgICAgICAgICAgICB9IGVsc2UgewogICAgICAgICAgICAgICAgICBpZiAoXzB4NTVmZDdmKSB7CiAgICAgICAgICAgICAgICAgICAgaWYgKHRoaXNbInByZXYiXSA8IF8weDVlNGQwMFtfMHgyNzM5ZWUoMHgyYzQpXSkKICAgICAgICAgICAgICAgICAgICAgIHJldHVybiBfMHg1YmMzZjcoCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDVlNGQwMFtfMHgyNzM5ZWUoMHgyYzQpXSwKICAgICAgICAgICAgICAgICAgICAgICAgISgweGYxMSArIC0weDEwMzIgKyAtMHgxMjEgKiAtMHgxKQogICAgICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgICAgfSBlbHNlIHsKICAgICAgICAgICAgICAgICAgICBpZiAoIV8weDQ3Y2Y2YykgdGhyb3cgbmV3IEVycm9yKF8weDI3MzllZSgweDMzZSkpOwogICAgICAgICAgICAgICAgICAgIGlmICh0aGlzW18weDI3MzllZSgweDMyYyldIDwgXzB4NWU0ZDAwWyJmaW5hbGx5TG9jIl0pCiAgICAgICAgICAgICAgICAgICAgICByZXR1cm4gXzB4NWJjM2Y3KF8weDVlNGQwMFsiZmluYWxseUxvYyJdKTsKICAgICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgIH0KICAgICAgICAgICAgfQogICAgICAgICAgfSwKICAgICAgICAgIGFicnVwdDogZnVuY3Rpb24gKF8weDQ1MmIwNiwgXzB4NDY1OTFkKSB7CiAgICAgICAgICAgIHZhciBfMHgxODkzNTAgPSBfMHg0NGEwZmM7CiAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgdmFyIF8weDI0ZDllZSA9CiAgICAgICAgICAgICAgICB0aGlzW18weDE4OTM1MCgweDMzNyldW18weDE4OTM1MCgweDI1OSldIC0KICAgICAgICAgICAgICAgICgtMHgxICogLTB4NDM0ICsgMHhiMmQgKiAtMHgxICsgMHg2ZmEpOwogICAgICAgICAgICAgIF8weDI0ZDllZSA+PSAweDE0NGMgKyAtMHgxICogMHg4MGYgKyAtMHhjM2Q7CiAgICAgICAgICAgICAgLS1fMHgyNGQ5ZWUKICAgICAgICAgICAgKSB7CiAgICAgICAgICAgICAgdmFyIF8weDNlMjljYSA9IHRoaXNbXzB4MTg5MzUwKDB4MzM3KV1bXzB4MjRkOWVlXTsKICAgICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgICBfMHgzZTI5Y2FbXzB4MTg5MzUwKDB4MjllKV0gPD0gdGhpc1tfMHgxODkzNTAoMHgzMmMpXSAmJgogICAgICAgICAgICAgICAgXzB4NDMyMzhjW18weDE4OTM1MCgweDMzNCldKF8weDNlMjljYSwgXzB4MTg5MzUwKDB4MjIwKSkgJiYKICAgICAgICAgICAgICAgIHRoaXNbXzB4MTg5MzUwKDB4MzJjKV0gPCBfMHgzZTI5Y2FbXzB4MTg5MzUwKDB4MjIwKV0KICAgICAgICAgICAgICApIHsKICAgICAgICAgICAgICAgIHZhciBfMHgzNWEyZGMgPSBfMHgzZTI5Y2E7CiAgICAgICAgICAgICAgICBicmVhazsKICAgICAgICAgICAgICB9CiAgICAgICAgICAgIH0KICAgICAgICAgICAgXzB4MzVhMmRjICYmCiAgICAgICAgICAgICAgKF8weDE4OTM1MCgweDMxZikgPT09IF8weDQ1MmIwNiB8fAogICAgICAgICAgICAgICAgXzB4MTg5MzUwKDB4MmQyKSA9PT0gXzB4NDUyYjA2KSAmJgogICAgICAgICAgICAgIF8weDM1YTJkY1tfMHgxODkzNTAoMHgyOWUpXSA8PSBfMHg0NjU5MWQgJiYKICAgICAgICAgICAgICBfMHg0NjU5MWQgPD0gXzB4MzVhMmRjW18weDE4OTM1MCgweDIyMCldICYmCiAgICAgICAgICAgICAgKF8weDM1YTJkYyA9IG51bGwpOwogICAgICAgICAgICB2YXIgXzB4MTgzN2MwID0gXzB4MzVhMmRjID8gXzB4MzVhMmRjW18weDE4OTM1MCgweDM4NyldIDoge307CiAgICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgICAgKF8weDE4MzdjMFsidHlwZSJdID0gXzB4NDUyYjA2KSwKICAgICAgICAgICAgICAoXzB4MTgzN2MwW18weDE4OTM1MCgweDMyNyldID0gXzB4NDY1OTFkKSwKICAgICAgICAgICAgICBfMHgzNWEyZGMKICAgICAgICAgICAgICAgID8gKCh0aGlzW18weDE4OTM1MCgweDI1YSldID0gXzB4MTg5MzUwKDB4Mzg5KSksCiAgICAgICAgICAgICAgICAgICh0aGlzW18weDE4OTM1MCgweDM4OSldID0gXzB4MzVhMmRjW18weDE4OTM1MCgweDIyMCldKSwKICAgICAgICAgICAgICAgICAgXzB4NTExYjA1KQogICAgICAgICAgICAgICAgOiB0aGlzW18weDE4OTM1MCgweDE2MildKF8weDE4MzdjMCkKICAgICAgICAgICAgKTsKICAgICAgICAgIH0sCiAgICAgICAgICBjb21wbGV0ZTogZnVuY3Rpb24gKF8weDRkYWVmMSwgXzB4MTUyZDEzKSB7CiAgICAgICAgICAgIHZhciBfMHgyZTBjODggPSBfMHg0NGEwZmM7CiAgICAgICAgICAgIGlmIChfMHgyZTBjODgoMHgyNTApID09PSBfMHg0ZGFlZjFbXzB4MmUwYzg4KDB4MWFiKV0pCiAgICAgICAgICAgICAgdGhyb3cgXzB4NGRhZWYxW18weDJlMGM4OCgweDMyNyldOwogICAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICAgIF8weDJlMGM4OCgweDMxZikgPT09IF8weDRkYWVmMVtfMHgyZTBjODgoMHgxYWIpXSB8fAogICAgICAgICAgICAgIF8weDJlMGM4OCgweDJkMikgPT09IF8weDRkYWVmMVtfMHgyZTBjODgoMHgxYWIpXQogICAgICAgICAgICAgICAgPyAodGhpc1tfMHgyZTBjODgoMHgzODkpXSA9IF8weDRkYWVmMVtfMHgyZTBjODgoMHgzMjcpXSkKICAgICAgICAgICAgICAgIDogXzB4MmUwYzg4KDB4MmZkKSA9PT0gXzB4NGRhZWYxWyJ0eXBlIl0KICAgICAgICAgICAgICAgID8gKCh0aGlzW18weDJlMGM4OCgweDI5YSldID0gdGhpc1tfMHgyZTBjODgoMHgzMjcpXSA9CiAgICAgICAgICAgICAgICAgICAgXzB4NGRhZWYxW18weDJlMGM4OCgweDMyNyldKSwKICAgICAgICAgICAgICAgICAgKHRoaXNbXzB4MmUwYzg4KDB4MjVhKV0gPSBfMHgyZTBjODgoMHgyZmQpKSwKICAgICAgICAgICAgICAgICAgKHRoaXNbXzB4MmUwYzg4KDB4Mzg5KV0gPSAiZW5kIikpCiAgICAgICAgICAgICAgICA6IF8weDJlMGM4OCgweDJmMSkgPT09IF8weDRkYWVmMVtfMHgyZTBjODgoMHgxYWIpXSAmJgogICAgICAgICAgICAgICAgICBfMHgxNTJkMTMgJiYKICAgICAgICAgICAgICAgICAgKHRoaXNbXzB4MmUwYzg4KDB4Mzg5KV0gPSBfMHgxNTJkMTMpLAogICAgICAgICAgICAgIF8weDUxMWIwNQogICAgICAgICAgICApOwogICAgICAgICAgfSwKICAgICAgICAgIGZpbmlzaDogZnVuY3Rpb24gKF8weDMzZDM5NikgewogICAgICAgICAgICB2YXIgXzB4MzhmYzUxID0gXzB4NDRhMGZjOwogICAgICAgICAgICBmb3IgKAogICAgICAgICAgICAgIHZhciBfMHg1YWJiZDggPQogICAgICAgICAgICAgICAgdGhpc1tfMHgzOGZjNTEoMHgzMzcpXVtfMHgzOGZjNTEoMHgyNTkpXSAtCiAgICAgICAgICAgICAgICAoMHgxYjZjICsgMHgxMGYxICsgLTB4MmM1Yyk7CiAgICAgICAgICAgICAgXzB4NWFiYmQ4ID49IC0weDEwNmMgKyAtMHgyNmFhICsgMHgzNzE2OwogICAgICAgICAgICAgIC0tXzB4NWFiYmQ4CiAgICAgICAgICAgICkgewogICAgICAgICAgICAgIHZhciBfMHg1ZWI1YzQgPSB0aGlzW18weDM4ZmM1MSgweDMzNyldW18weDVhYmJkOF07CiAgICAgICAgICAgICAgaWYgKF8weDVlYjVjNFtfMHgzOGZjNTEoMHgyMjApXSA9PT0gXzB4MzNkMzk2KQogICAgICAgICAgICAgICAgcmV0dXJuICgKICAgICAgICAgICAgICAgICAgdGhpc1siY29tcGxldGUiXSgKICAgICAgICAgICAgICAgICAgICBfMHg1ZWI1YzRbXzB4MzhmYzUxKDB4Mzg3KV0sCiAgICAgICAgICAgICAgICAgICAgXzB4NWViNWM0W18weDM4ZmM1MSgweDJmYildCiAgICAgICAgICAgICAgICAgICksCiAgICAgICAgICAgICAgICAgIF8weDJmODJiMyhfMHg1ZWI1YzQpLAogICAgICAgICAgICAgICAgICBfMHg1MTFiMDUKICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgIH0KICAgICAgICAgIH0sCiAgICAgICAgICBjYXRjaDogZnVuY3Rpb24gKF8weDIzNWNjZikgewogICAgICAgICAgICB2YXIgXzB4NGUzMzQ1ID0gXzB4NDRhMGZjOwogICAgICAgICAgICBmb3IgKAogICAgICAgICAgICAgIHZhciBfMHgxZGI4NDAgPQogICAgICAgICAgICAgICAgdGhpc1sidHJ5RW50cmllcyJdW18weDRlMzM0NSgweDI1OSldIC0KICAgICAgICAgICAgICAgICgtMHgzYSAqIC0weDRmICsgLTB4MSAqIC0weDEyZDYgKyAtMHgyNGJiICogMHgxKTsKICAgICAgICAgICAgICBfMHgxZGI4NDAgPj0gLTB4MTY4ICsgMHgzMDUgKyAtMHgxOWQ7CiAgICAgICAgICAgICAgLS1fMHgxZGI4NDAKICAgICAgICAgICAgKSB7CiAgICAgICAgICAgICAgdmFyIF8weDU0NWI2NiA9IHRoaXNbInRyeUVudHJpZXMiXVtfMHgxZGI4NDBdOwogICAgICAgICAgICAgIGlmIChfMHg1NDViNjZbXzB4NGUzMzQ1KDB4MjllKV0gPT09IF8weDIzNWNjZikgewogICAgICAgICAgICAgICAgdmFyIF8weDJkNWI2MyA9IF8weDU0NWI2NltfMHg0ZTMzNDUoMHgzODcpXTsKICAgICAgICAgICAgICAgIGlmIChfMHg0ZTMzNDUoMHgyNTApID09PSBfMHgyZDViNjNbXzB4NGUzMzQ1KDB4MWFiKV0pIHsKICAgICAgICAgICAgICAgICAgdmFyIF8weDEzZTAzNSA9IF8weDJkNWI2M1tfMHg0ZTMzNDUoMHgzMjcpXTsKICAgICAgICAgICAgICAgICAgXzB4MmY4MmIzKF8weDU0NWI2Nik7CiAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICByZXR1cm4gXzB4MTNlMDM1OwogICAgICAgICAgICAgIH0KICAgICAgICAgICAgfQogICAgICAgICAgICB0aHJvdyBuZXcgRXJyb3IoXzB4NGUzMzQ1KDB4MjNmKSk7CiAgICAgICAgICB9LAogICAgICAgICAgZGVsZWdhdGVZaWVsZDogZnVuY3Rpb24gKF8weDM5NWRmOSwgXzB4NTBkOTczLCBfMHg0OGZhZjEpIHsKICAgICAgICAgICAgdmFyIF8weDM5OTE5ZSA9IF8weDQ0YTBmYzsKICAgICAgICAgICAgcmV0dXJuICgKICAgICAgICAgICAgICAodGhpc1tfMHgzOTkxOWUoMHgxYmMpXSA9IHsKICAgICAgICAgICAgICAgIGl0ZXJhdG9yOiBfMHgyZWRiZjQoXzB4Mzk1ZGY5KSwKICAgICAgICAgICAgICAgIHJlc3VsdE5hbWU6IF8weDUwZDk3MywKICAgICAgICAgICAgICAgIG5leHRMb2M6IF8weDQ4ZmFmMSwKICAgICAgICAgICAgICB9KSwKICAgICAgICAgICAgICAibmV4dCIgPT09IHRoaXNbIm1ldGhvZCJdICYmCiAgICAgICAgICAgICAgICAodGhpc1siYXJnIl0gPSB2b2lkICgweDE5NTggKyAtMHhhYmEgKyAtMHhlOWUpKSwKICAgICAgICAgICAgICBfMHg1MTFiMDUKICAgICAgICAgICAgKTsKICAgICAgICAgIH0sCiAgICAgICAgfSksCiAgICAgICAgXzB4NTA3YjIzCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxZGIxMjMoXzB4MTQ5YzI3KSB7CiAgICAgIHZhciBfMHgzOWQ2NzIgPSB3XzB4MjVmMzsKICAgICAgcmV0dXJuIChfMHgxZGIxMjMgPQogICAgICAgIF8weDM5ZDY3MigweDFlZSkgPT0gdHlwZW9mIFN5bWJvbCAmJgogICAgICAgICJzeW1ib2wiID09IHR5cGVvZiBTeW1ib2xbIml0ZXJhdG9yIl0KICAgICAgICAgID8gZnVuY3Rpb24gKF8weDRhOGYyYykgewogICAgICAgICAgICAgIHJldHVybiB0eXBlb2YgXzB4NGE4ZjJjOwogICAgICAgICAgICB9CiAgICAgICAgICA6IGZ1bmN0aW9uIChfMHg0MGViNjQpIHsKICAgICAgICAgICAgICB2YXIgXzB4NGY4ZWVlID0gXzB4MzlkNjcyOwogICAgICAgICAgICAgIHJldHVybiBfMHg0MGViNjQgJiYKICAgICAgICAgICAgICAgIF8weDRmOGVlZSgweDFlZSkgPT0gdHlwZW9mIFN5bWJvbCAmJgogICAgICAgICAgICAgICAgXzB4NDBlYjY0W18weDRmOGVlZSgweDJhYyldID09PSBTeW1ib2wgJiYKICAgICAgICAgICAgICAgIF8weDQwZWI2NCAhPT0gU3ltYm9sWyJwcm90b3R5cGUiXQogICAgICAgICAgICAgICAgPyBfMHg0ZjhlZWUoMHgyZWQpCiAgICAgICAgICAgICAgICA6IHR5cGVvZiBfMHg0MGViNjQ7CiAgICAgICAgICAgIH0pKF8weDE0OWMyNyk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzNGQyOWEoKSB7CiAgICAgIHZhciBfMHg0YmJkYmEgPSB3XzB4MjVmMzsKICAgICAgXzB4MzRkMjlhID0gZnVuY3Rpb24gKF8weDE4NTlmZSwgXzB4MjZhZGYyKSB7CiAgICAgICAgcmV0dXJuIG5ldyBfMHgzYjkyZDQoCiAgICAgICAgICBfMHgxODU5ZmUsCiAgICAgICAgICB2b2lkICgtMHgxZiAqIDB4MTMzICsgMHgzICogMHg0ZjUgKyAweDIzYiAqIDB4YSksCiAgICAgICAgICBfMHgyNmFkZjIKICAgICAgICApOwogICAgICB9OwogICAgICB2YXIgXzB4NWFlZDZlID0gUmVnRXhwW18weDRiYmRiYSgweDM0NCldLAogICAgICAgIF8weDU4YmE5MSA9IG5ldyBXZWFrTWFwKCk7CiAgICAgIGZ1bmN0aW9uIF8weDNiOTJkNChfMHgyZjYxZmQsIF8weDUxM2M0NCwgXzB4YWYyMmZjKSB7CiAgICAgICAgdmFyIF8weGQ5MzJjNiA9IF8weDRiYmRiYSwKICAgICAgICAgIF8weGQ2MDUwOSA9IG5ldyBSZWdFeHAoXzB4MmY2MWZkLCBfMHg1MTNjNDQpOwogICAgICAgIHJldHVybiAoCiAgICAgICAgICBfMHg1OGJhOTFbXzB4ZDkzMmM2KDB4MWU0KV0oCiAgICAgICAgICAgIF8weGQ2MDUwOSwKICAgICAgICAgICAgXzB4YWYyMmZjIHx8IF8weDU4YmE5MVtfMHhkOTMyYzYoMHgzMmIpXShfMHgyZjYxZmQpCiAgICAgICAgICApLAogICAgICAgICAgXzB4MmUyZjQ3KF8weGQ2MDUwOSwgXzB4M2I5MmQ0W18weGQ5MzJjNigweDM0NCldKQogICAgICAgICk7CiAgICAgIH0KICAgICAgZnVuY3Rpb24gXzB4NDI3ZDQyKF8weDQ4OWVlYiwgXzB4MTY5OWQ4KSB7CiAgICAgICAgdmFyIF8weDEwMDRmYiA9IF8weDRiYmRiYSwKICAgICAgICAgIF8weDJhZTgyNiA9IF8weDU4YmE5MVtfMHgxMDA0ZmIoMHgzMmIpXShfMHgxNjk5ZDgpOwogICAgICAgIHJldHVybiBPYmplY3RbXzB4MTAwNGZiKDB4MTdmKV0oXzB4MmFlODI2KVtfMHgxMDA0ZmIoMHgzNzYpXShmdW5jdGlvbiAoCiAgICAgICAgICBfMHgxMDBmMTAsCiAgICAgICAgICBfMHg1YmZkZjUKICAgICAgICApIHsKICAgICAgICAgIHZhciBfMHgzYWQ0MjEgPSBfMHgxMDA0ZmIsCiAgICAgICAgICAgIF8weDU0MTU2OCA9IF8weDJhZTgyNltfMHg1YmZkZjVdOwogICAgICAgICAgaWYgKF8weDNhZDQyMSgweDI4YikgPT0gdHlwZW9mIF8weDU0MTU2OCkKICAgICAgICAgICAgXzB4MTAwZjEwW18weDViZmRmNV0gPSBfMHg0ODllZWJbXzB4NTQxNTY4XTsKICAgICAgICAgIGVsc2UgewogICAgICAgICAgICBmb3IgKAogICAgICAgICAgICAgIHZhciBfMHgzYmM3MjggPSAweDEgKiAweDNjZSArIDB4MyAqIC0weDQzNSArIDB4OGQxOwogICAgICAgICAgICAgIHZvaWQgKDB4MjY5NSArIDB4MWVlOCArIC0weDQ1N2QpID09PQogICAgICAgICAgICAgICAgXzB4NDg5ZWViW18weDU0MTU2OFtfMHgzYmM3MjhdXSAmJgogICAgICAgICAgICAgIF8weDNiYzcyOCArICgweDNmYiAqIC0weDIgKyAweDI2MzEgKyAtMHgyICogMHhmMWQpIDwKICAgICAgICAgICAgICAgIF8weDU0MTU2OFsibGVuZ3RoIl07CgogICAgICAgICAgICApCiAgICAgICAgICAgICAgXzB4M2JjNzI4Kys7CiAgICAgICAgICAgIF8weDEwMGYxMFtfMHg1YmZkZjVdID0gXzB4NDg5ZWViW18weDU0MTU2OFtfMHgzYmM3MjhdXTsKICAgICAgICAgIH0KICAgICAgICAgIHJldHVybiBfMHgxMDBmMTA7CiAgICAgICAgfSwKICAgICAgICBPYmplY3RbXzB4MTAwNGZiKDB4M2I3KV0obnVsbCkpOwogICAgICB9CiAgICAgIHJldHVybiAoCiAgICAgICAgXzB4NWRkYTdkKF8weDNiOTJkNCwgUmVnRXhwKSwKICAgICAgICAoXzB4M2I5MmQ0WyJwcm90b3R5cGUiXVsiZXhlYyJdID0gZnVuY3Rpb24gKF8weDFiYzc5NikgewogICAgICAgICAgdmFyIF8weDJhNmFmZCA9IF8weDRiYmRiYSwKICAgICAgICAgICAgXzB4NDU3NjI4ID0gXzB4NWFlZDZlW18weDJhNmFmZCgweDIwOSldWyJjYWxsIl0odGhpcywgXzB4MWJjNzk2KTsKICAgICAgICAgIGlmIChfMHg0NTc2MjgpIHsKICAgICAgICAgICAgXzB4NDU3NjI4WyJncm91cHMiXSA9IF8weDQyN2Q0MihfMHg0NTc2MjgsIHRoaXMpOwogICAgICAgICAgICB2YXIgXzB4NTQ2NTQyID0gXzB4NDU3NjI4WyJpbmRpY2VzIl07CiAgICAgICAgICAgIF8weDU0NjU0MiAmJiAoXzB4NTQ2NTQyWyJncm91cHMiXSA9IF8weDQyN2Q0MihfMHg1NDY1NDIsIHRoaXMpKTsKICAgICAgICAgIH0KICAgICAgICAgIHJldHVybiBfMHg0NTc2Mjg7CiAgICAgICAgfSksCiAgICAgICAgKF8weDNiOTJkNFtfMHg0YmJkYmEoMHgzNDQpXVtTeW1ib2xbXzB4NGJiZGJhKDB4Mzc3KV1dID0gZnVuY3Rpb24gKAogICAgICAgICAgXzB4MTBlMmVmLAogICAgICAgICAgXzB4NDUzYTI2CiAgICAgICAgKSB7CiAgICAgICAgICB2YXIgXzB4MjI2NTE2ID0gXzB4NGJiZGJhOwogICAgICAgICAgaWYgKF8weDIyNjUxNigweDMzYykgPT0gdHlwZW9mIF8weDQ1M2EyNikgewogICAgICAgICAgICB2YXIgXzB4NDI3MDVhID0gXzB4NThiYTkxW18weDIyNjUxNigweDMyYildKHRoaXMpOwogICAgICAgICAgICByZXR1cm4gXzB4NWFlZDZlW1N5bWJvbFtfMHgyMjY1MTYoMHgzNzcpXV1bImNhbGwiXSgKICAgICAgICAgICAgICB0aGlzLAogICAgICAgICAgICAgIF8weDEwZTJlZiwKICAgICAgICAgICAgICBfMHg0NTNhMjZbXzB4MjI2NTE2KDB4Mzc3KV0oCiAgICAgICAgICAgICAgICAvXCQ8KFtePl0rKT4vZywKICAgICAgICAgICAgICAgIGZ1bmN0aW9uIChfMHg0NTM2ZmEsIF8weDUzYjFjNSkgewogICAgICAgICAgICAgICAgICB2YXIgXzB4NWRiMDhkID0gXzB4MjI2NTE2LAogICAgICAgICAgICAgICAgICAgIF8weDFiNGY1YyA9IF8weDQyNzA1YVtfMHg1M2IxYzVdOwogICAgICAgICAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICAgICAgICAgICIkIiArCiAgICAgICAgICAgICAgICAgICAgKEFycmF5W18weDVkYjA4ZCgweDJhZildKF8weDFiNGY1YykKICAgICAgICAgICAgICAgICAgICAgID8gXzB4MWI0ZjVjW18weDVkYjA4ZCgweDI0ZildKCIkIikKICAgICAgICAgICAgICAgICAgICAgIDogXzB4MWI0ZjVjKQogICAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgICkKICAgICAgICAgICAgKTsKICAgICAgICAgIH0KICAgICAgICAgIGlmIChfMHgyMjY1MTYoMHgxZWUpID09IHR5cGVvZiBfMHg0NTNhMjYpIHsKICAgICAgICAgICAgdmFyIF8weDUxODgwZSA9IHRoaXM7CiAgICAgICAgICAgIHJldHVybiBfMHg1YWVkNmVbU3ltYm9sW18weDIyNjUxNigweDM3NyldXVtfMHgyMjY1MTYoMHgzMzQpXSgKICAgICAgICAgICAgICB0aGlzLAogICAgICAgICAgICAgIF8weDEwZTJlZiwKICAgICAgICAgICAgICBmdW5jdGlvbiAoKSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4M2NlNTQ4ID0gXzB4MjI2NTE2LAogICAgICAgICAgICAgICAgICBfMHgzNTJlMjEgPSBhcmd1bWVudHM7CiAgICAgICAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICAgICAgICBfMHgzY2U1NDgoMHgxN2QpICE9CiAgICAgICAgICAgICAgICAgICAgdHlwZW9mIF8weDM1MmUyMVsKICAgICAgICAgICAgICAgICAgICAgIF8weDM1MmUyMVtfMHgzY2U1NDgoMHgyNTkpXSAtCiAgICAgICAgICAgICAgICAgICAgICAgICgtMHhmOSAqIC0weDcgKyAweGQ0ICsgLTB4MiAqIDB4M2QxKQogICAgICAgICAgICAgICAgICAgIF0gJiYKICAgICAgICAgICAgICAgICAgICAoXzB4MzUyZTIxID0gW11bInNsaWNlIl1bXzB4M2NlNTQ4KDB4MzM0KV0oXzB4MzUyZTIxKSlbCiAgICAgICAgICAgICAgICAgICAgICBfMHgzY2U1NDgoMHgzNmUpCiAgICAgICAgICAgICAgICAgICAgXShfMHg0MjdkNDIoXzB4MzUyZTIxLCBfMHg1MTg4MGUpKSwKICAgICAgICAgICAgICAgICAgXzB4NDUzYTI2W18weDNjZTU0OCgweDIwNyldKHRoaXMsIF8weDM1MmUyMSkKICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgICAgfQogICAgICAgICAgICApOwogICAgICAgICAgfQogICAgICAgICAgcmV0dXJuIF8weDVhZWQ2ZVtTeW1ib2xbXzB4MjI2NTE2KDB4Mzc3KV1dWyJjYWxsIl0oCiAgICAgICAgICAgIHRoaXMsCiAgICAgICAgICAgIF8weDEwZTJlZiwKICAgICAgICAgICAgXzB4NDUzYTI2CiAgICAgICAgICApOwogICAgICAgIH0pLAogICAgICAgIF8weDM0ZDI5YVtfMHg0YmJkYmEoMHgyMDcpXSh0aGlzLCBhcmd1bWVudHMpCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyNzcyYWIoXzB4MTdiOTNjKSB7CiAgICAgIHZhciBfMHgyZThhZjQgPSB3XzB4MjVmMzsKICAgICAgdGhpc1tfMHgyZThhZjQoMHgxODApXSA9IF8weDE3YjkzYzsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDEyNWUwMShfMHgyMjFmMWEpIHsKICAgICAgcmV0dXJuIGZ1bmN0aW9uICgpIHsKICAgICAgICB2YXIgXzB4MmRiNDk2ID0gd18weDI1ZjM7CiAgICAgICAgcmV0dXJuIG5ldyBfMHgxMzdiYTIoXzB4MjIxZjFhW18weDJkYjQ5NigweDIwNyldKHRoaXMsIGFyZ3VtZW50cykpOwogICAgICB9OwogICAgfQogICAgZnVuY3Rpb24gXzB4OGEwMzcwKAogICAgICBfMHgxYWM3ZTIsCiAgICAgIF8weDQ0MGIzOCwKICAgICAgXzB4NDYxMWFjLAogICAgICBfMHgxZjc5ZjMsCiAgICAgIF8weDI2ZWI5NSwKICAgICAgXzB4NGFmMWQ0LAogICAgICBfMHgyYjI0YmMKICAgICkgewogICAgICB2YXIgXzB4M2E0ODBlID0gd18weDI1ZjM7CiAgICAgIHRyeSB7CiAgICAgICAgdmFyIF8weDE2ZDBjZSA9IF8weDFhYzdlMltfMHg0YWYxZDRdKF8weDJiMjRiYyksCiAgICAgICAgICBfMHgyZThlYWYgPSBfMHgxNmQwY2VbXzB4M2E0ODBlKDB4MmU0KV07CiAgICAgIH0gY2F0Y2ggKF8weGM4OGZhZSkgewogICAgICAgIHJldHVybiB2b2lkIF8weDQ2MTFhYyhfMHhjODhmYWUpOwogICAgICB9CiAgICAgIF8weDE2ZDBjZVtfMHgzYTQ4MGUoMHgxZTMpXQogICAgICAgID8gXzB4NDQwYjM4KF8weDJlOGVhZikKICAgICAgICA6IFByb21pc2VbXzB4M2E0ODBlKDB4Mjc4KV0oXzB4MmU4ZWFmKVtfMHgzYTQ4MGUoMHgxZWQpXSgKICAgICAgICAgICAgXzB4MWY3OWYzLAogICAgICAgICAgICBfMHgyNmViOTUKICAgICAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1MGRhYWEoXzB4MTBkZTBkKSB7CiAgICAgIHJldHVybiBmdW5jdGlvbiAoKSB7CiAgICAgICAgdmFyIF8weDMxMDIwNiA9IHRoaXMsCiAgICAgICAgICBfMHgxN2FkNzMgPSBhcmd1bWVudHM7CiAgICAgICAgcmV0dXJuIG5ldyBQcm9taXNlKGZ1bmN0aW9uIChfMHgzNzEyMGIsIF8weDcyOGUzNykgewogICAgICAgICAgdmFyIF8weDVhODE5ZSA9IF8weDEwZGUwZFsiYXBwbHkiXShfMHgzMTAyMDYsIF8weDE3YWQ3Myk7CiAgICAgICAgICBmdW5jdGlvbiBfMHgxMjQ2NmEoXzB4MjYzZTY4KSB7CiAgICAgICAgICAgIHZhciBfMHgxMjNlN2YgPSB3XzB4MjVmMzsKICAgICAgICAgICAgXzB4OGEwMzcwKAogICAgICAgICAgICAgIF8weDVhODE5ZSwKICAgICAgICAgICAgICBfMHgzNzEyMGIsCiAgICAgICAgICAgICAgXzB4NzI4ZTM3LAogICAgICAgICAgICAgIF8weDEyNDY2YSwKICAgICAgICAgICAgICBfMHgxOTFmOGIsCiAgICAgICAgICAgICAgXzB4MTIzZTdmKDB4Mzg5KSwKICAgICAgICAgICAgICBfMHgyNjNlNjgKICAgICAgICAgICAgKTsKICAgICAgICAgIH0KICAgICAgICAgIGZ1bmN0aW9uIF8weDE5MWY4YihfMHgyNTVhZTEpIHsKICAgICAgICAgICAgdmFyIF8weDVkMTVjZSA9IHdfMHgyNWYzOwogICAgICAgICAgICBfMHg4YTAzNzAoCiAgICAgICAgICAgICAgXzB4NWE4MTllLAogICAgICAgICAgICAgIF8weDM3MTIwYiwKICAgICAgICAgICAgICBfMHg3MjhlMzcsCiAgICAgICAgICAgICAgXzB4MTI0NjZhLAogICAgICAgICAgICAgIF8weDE5MWY4YiwKICAgICAgICAgICAgICBfMHg1ZDE1Y2UoMHgyNTApLAogICAgICAgICAgICAgIF8weDI1NWFlMQogICAgICAgICAgICApOwogICAgICAgICAgfQogICAgICAgICAgXzB4MTI0NjZhKHZvaWQgKDB4YmRmICsgLTB4MTI5YyArIC0weDE5ICogLTB4NDUpKTsKICAgICAgICB9KTsKICAgICAgfTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDI5N2QzZChfMHhkODY5ODMsIF8weDQ1NTkwYSkgewogICAgICB2YXIgXzB4NTFjMzU3ID0gd18weDI1ZjM7CiAgICAgIGlmICghKF8weGQ4Njk4MyBpbnN0YW5jZW9mIF8weDQ1NTkwYSkpCiAgICAgICAgdGhyb3cgbmV3IFR5cGVFcnJvcihfMHg1MWMzNTcoMHgyZjcpKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDk2ZjM1OChfMHgyMTdlNGEsIF8weDE1NjQxMCkgewogICAgICB2YXIgXzB4MjUxMTk4ID0gd18weDI1ZjM7CiAgICAgIGZvciAoCiAgICAgICAgdmFyIF8weDMzNjk2MCA9IDB4MTYxMyArIC0weDJmICogMHgzYiArIDB4YjNlICogLTB4MTsKICAgICAgICBfMHgzMzY5NjAgPCBfMHgxNTY0MTBbXzB4MjUxMTk4KDB4MjU5KV07CiAgICAgICAgXzB4MzM2OTYwKysKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDNkMjdmMCA9IF8weDE1NjQxMFtfMHgzMzY5NjBdOwogICAgICAgIChfMHgzZDI3ZjBbXzB4MjUxMTk4KDB4MjNhKV0gPQogICAgICAgICAgXzB4M2QyN2YwW18weDI1MTE5OCgweDIzYSldIHx8ICEoLTB4YmY3ICsgLTB4MTY2ZSArIDB4MjI2NikpLAogICAgICAgICAgKF8weDNkMjdmMFtfMHgyNTExOTgoMHgyYmMpXSA9ICEoLTB4ZGUgKyAweDFjOTQgKyAtMHgxYmI2KSksCiAgICAgICAgICBfMHgyNTExOTgoMHgyZTQpIGluIF8weDNkMjdmMCAmJgogICAgICAgICAgICAoXzB4M2QyN2YwWyJ3cml0YWJsZSJdID0gISgtMHgyMSAqIDB4MTJmICsgLTB4MiAqIC0weDE3ZCArIDB4MjQxNSkpLAogICAgICAgICAgT2JqZWN0W18weDI1MTE5OCgweDE3NSldKAogICAgICAgICAgICBfMHgyMTdlNGEsCiAgICAgICAgICAgIF8weDMyZTg4NShfMHgzZDI3ZjBbXzB4MjUxMTk4KDB4MzkyKV0pLAogICAgICAgICAgICBfMHgzZDI3ZjAKICAgICAgICAgICk7CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDU1Y2Q4YShfMHgxNzRhNTQsIF8weDVlMjVlYiwgXzB4NDY1ZTUwKSB7CiAgICAgIHZhciBfMHg0ZDE3ZTQgPSB3XzB4MjVmMzsKICAgICAgcmV0dXJuICgKICAgICAgICBfMHg1ZTI1ZWIgJiYgXzB4OTZmMzU4KF8weDE3NGE1NFtfMHg0ZDE3ZTQoMHgzNDQpXSwgXzB4NWUyNWViKSwKICAgICAgICBfMHg0NjVlNTAgJiYgXzB4OTZmMzU4KF8weDE3NGE1NCwgXzB4NDY1ZTUwKSwKICAgICAgICBPYmplY3RbXzB4NGQxN2U0KDB4MTc1KV0oXzB4MTc0YTU0LCBfMHg0ZDE3ZTQoMHgzNDQpLCB7CiAgICAgICAgICB3cml0YWJsZTogISgtMHhjMTkgKyAweDFhYSArIC0weDIgKiAtMHg1MzgpLAogICAgICAgIH0pLAogICAgICAgIF8weDE3NGE1NAogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4NThkOGMyKF8weDU2MzRkNywgXzB4NTM1MTVjKSB7CiAgICAgIHZhciBfMHg1ZmM3YmYgPSB3XzB4MjVmMzsKICAgICAgZm9yICh2YXIgXzB4NWU3NTYzIGluIF8weDUzNTE1YykgewogICAgICAgICgoXzB4NTMyMzU2ID0gXzB4NTM1MTVjW18weDVlNzU2M10pW18weDVmYzdiZigweDJiYyldID0gXzB4NTMyMzU2WwogICAgICAgICAgXzB4NWZjN2JmKDB4MjNhKQogICAgICAgIF0gPQogICAgICAgICAgISgweGI1ICsgMHg2ICogMHg4MCArIC0weDNiNSkpLAogICAgICAgICAgInZhbHVlIiBpbiBfMHg1MzIzNTYgJiYKICAgICAgICAgICAgKF8weDUzMjM1NltfMHg1ZmM3YmYoMHgyZTMpXSA9ICEoMHgxOWQgKiAweDExICsgMHgxMjZmICsgLTB4MmRkYykpLAogICAgICAgICAgT2JqZWN0W18weDVmYzdiZigweDE3NSldKF8weDU2MzRkNywgXzB4NWU3NTYzLCBfMHg1MzIzNTYpOwogICAgICB9CiAgICAgIGlmIChPYmplY3RbXzB4NWZjN2JmKDB4Mzg4KV0pCiAgICAgICAgZm9yICgKICAgICAgICAgIHZhciBfMHg0NWJjYzEgPSBPYmplY3RbXzB4NWZjN2JmKDB4Mzg4KV0oXzB4NTM1MTVjKSwKICAgICAgICAgICAgXzB4MzY4Njk4ID0gLTB4MTEgKiAtMHgxYWYgKyAtMHgxZWM3ICsgMHgyMjg7CiAgICAgICAgICBfMHgzNjg2OTggPCBfMHg0NWJjYzFbXzB4NWZjN2JmKDB4MjU5KV07CiAgICAgICAgICBfMHgzNjg2OTgrKwogICAgICAgICkgewogICAgICAgICAgdmFyIF8weDUzMjM1NiwKICAgICAgICAgICAgXzB4NmJlMzNlID0gXzB4NDViY2MxW18weDM2ODY5OF07CiAgICAgICAgICAoKF8weDUzMjM1NiA9IF8weDUzNTE1Y1tfMHg2YmUzM2VdKVsiY29uZmlndXJhYmxlIl0gPSBfMHg1MzIzNTZbCiAgICAgICAgICAgIF8weDVmYzdiZigweDIzYSkKICAgICAgICAgIF0gPQogICAgICAgICAgICAhKC0weDgzMyArIDB4OSAqIC0weDc2ICsgMHgxZCAqIDB4NmQpKSwKICAgICAgICAgICAgXzB4NWZjN2JmKDB4MmU0KSBpbiBfMHg1MzIzNTYgJiYKICAgICAgICAgICAgICAoXzB4NTMyMzU2W18weDVmYzdiZigweDJlMyldID0gISgKICAgICAgICAgICAgICAgIDB4MThiZiArCiAgICAgICAgICAgICAgICAtMHgzMzcgKiAweDUgKwogICAgICAgICAgICAgICAgLTB4MTQgKiAweDZmCiAgICAgICAgICAgICAgKSksCiAgICAgICAgICAgIE9iamVjdFtfMHg1ZmM3YmYoMHgxNzUpXShfMHg1NjM0ZDcsIF8weDZiZTMzZSwgXzB4NTMyMzU2KTsKICAgICAgICB9CiAgICAgIHJldHVybiBfMHg1NjM0ZDc7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0MGZmNTEoXzB4MjU0YWFhLCBfMHgyODcyNTQpIHsKICAgICAgdmFyIF8weDc3MjczZiA9IHdfMHgyNWYzOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHg1ODdkMGIgPSBPYmplY3RbXzB4NzcyNzNmKDB4MzJhKV0oXzB4Mjg3MjU0KSwKICAgICAgICAgIF8weGE1ZjQwZCA9IC0weDIxNzQgKyAweDI1YSAqIC0weDIgKyAweDQyICogMHg5NDsKICAgICAgICBfMHhhNWY0MGQgPCBfMHg1ODdkMGJbXzB4NzcyNzNmKDB4MjU5KV07CiAgICAgICAgXzB4YTVmNDBkKysKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDIzYjQyNiA9IF8weDU4N2QwYltfMHhhNWY0MGRdLAogICAgICAgICAgXzB4NTlhZTNlID0gT2JqZWN0W18weDc3MjczZigweDJhNildKF8weDI4NzI1NCwgXzB4MjNiNDI2KTsKICAgICAgICBfMHg1OWFlM2UgJiYKICAgICAgICAgIF8weDU5YWUzZVtfMHg3NzI3M2YoMHgyYmMpXSAmJgogICAgICAgICAgdm9pZCAoLTB4MjIxYiAqIDB4MSArIDB4MjMyNiAqIDB4MSArIC0weDEwYikgPT09CiAgICAgICAgICAgIF8weDI1NGFhYVtfMHgyM2I0MjZdICYmCiAgICAgICAgICBPYmplY3RbImRlZmluZVByb3BlcnR5Il0oXzB4MjU0YWFhLCBfMHgyM2I0MjYsIF8weDU5YWUzZSk7CiAgICAgIH0KICAgICAgcmV0dXJuIF8weDI1NGFhYTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDRhNzgyNChfMHgyNjc4NGYsIF8weDQ3Nzk1YSwgXzB4MjZhNjczKSB7CiAgICAgIHZhciBfMHgxZWRiYTEgPSB3XzB4MjVmMzsKICAgICAgcmV0dXJuICgKICAgICAgICAoXzB4NDc3OTVhID0gXzB4MzJlODg1KF8weDQ3Nzk1YSkpIGluIF8weDI2Nzg0ZgogICAgICAgICAgPyBPYmplY3RbXzB4MWVkYmExKDB4MTc1KV0oXzB4MjY3ODRmLCBfMHg0Nzc5NWEsIHsKICAgICAgICAgICAgICB2YWx1ZTogXzB4MjZhNjczLAogICAgICAgICAgICAgIGVudW1lcmFibGU6ICEoMHgyNGViICsgMHgxYjIgKyAtMHgxICogMHgyNjlkKSwKICAgICAgICAgICAgICBjb25maWd1cmFibGU6ICEoLTB4NDcyICsgLTB4YjcgKiAweDEyICsgMHgxMTUwKSwKICAgICAgICAgICAgICB3cml0YWJsZTogISgtMHgyM2Y4ICsgMHgyNTdkICsgLTB4MTg1ICogMHgxKSwKICAgICAgICAgICAgfSkKICAgICAgICAgIDogKF8weDI2Nzg0ZltfMHg0Nzc5NWFdID0gXzB4MjZhNjczKSwKICAgICAgICBfMHgyNjc4NGYKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDM2ZjU0ZigpIHsKICAgICAgdmFyIF8weDQ3MmRiYyA9IHdfMHgyNWYzOwogICAgICByZXR1cm4gKF8weDM2ZjU0ZiA9IE9iamVjdFsiYXNzaWduIl0KICAgICAgICA/IE9iamVjdFtfMHg0NzJkYmMoMHgyYTApXVsiYmluZCJdKCkKICAgICAgICA6IGZ1bmN0aW9uIChfMHgzZTBiNTIpIHsKICAgICAgICAgICAgdmFyIF8weDFlZGRmOCA9IF8weDQ3MmRiYzsKICAgICAgICAgICAgZm9yICgKICAgICAgICAgICAgICB2YXIgXzB4MTZkNzVlID0gLTB4NjQ1ICsgLTB4MjExNSAqIDB4MSArIC0weDE5ICogLTB4MTkzOwogICAgICAgICAgICAgIF8weDE2ZDc1ZSA8IGFyZ3VtZW50c1tfMHgxZWRkZjgoMHgyNTkpXTsKICAgICAgICAgICAgICBfMHgxNmQ3NWUrKwogICAgICAgICAgICApIHsKICAgICAgICAgICAgICB2YXIgXzB4NWE5MTczID0gYXJndW1lbnRzW18weDE2ZDc1ZV07CiAgICAgICAgICAgICAgZm9yICh2YXIgXzB4MTQ1ZmY2IGluIF8weDVhOTE3MykKICAgICAgICAgICAgICAgIE9iamVjdFtfMHgxZWRkZjgoMHgzNDQpXVtfMHgxZWRkZjgoMHgzYjgpXVtfMHgxZWRkZjgoMHgzMzQpXSgKICAgICAgICAgICAgICAgICAgXzB4NWE5MTczLAogICAgICAgICAgICAgICAgICBfMHgxNDVmZjYKICAgICAgICAgICAgICAgICkgJiYgKF8weDNlMGI1MltfMHgxNDVmZjZdID0gXzB4NWE5MTczW18weDE0NWZmNl0pOwogICAgICAgICAgICB9CiAgICAgICAgICAgIHJldHVybiBfMHgzZTBiNTI7CiAgICAgICAgICB9KVsiYXBwbHkiXSh0aGlzLCBhcmd1bWVudHMpOwogICAgfQogICAgZnVuY3Rpb24gXzB4NWYzNDZmKF8weDJhYjhlZikgewogICAgICB2YXIgXzB4MzlmZjA0ID0gd18weDI1ZjM7CiAgICAgIGZvciAoCiAgICAgICAgdmFyIF8weDE3NjEwMSA9IDB4YzYwICsgLTB4NDMgKiAtMHgxZiArIDB4NiAqIC0weDM2YTsKICAgICAgICBfMHgxNzYxMDEgPCBhcmd1bWVudHNbXzB4MzlmZjA0KDB4MjU5KV07CiAgICAgICAgXzB4MTc2MTAxKysKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDk5Njg4YyA9CiAgICAgICAgICAgIG51bGwgIT0gYXJndW1lbnRzW18weDE3NjEwMV0gPyBPYmplY3QoYXJndW1lbnRzW18weDE3NjEwMV0pIDoge30sCiAgICAgICAgICBfMHhiZjMzMTQgPSBPYmplY3RbXzB4MzlmZjA0KDB4MTdmKV0oXzB4OTk2ODhjKTsKICAgICAgICBfMHgzOWZmMDQoMHgxZWUpID09IHR5cGVvZiBPYmplY3RbXzB4MzlmZjA0KDB4Mzg4KV0gJiYKICAgICAgICAgIF8weGJmMzMxNFtfMHgzOWZmMDQoMHgzNmUpXVtfMHgzOWZmMDQoMHgyMDcpXSgKICAgICAgICAgICAgXzB4YmYzMzE0LAogICAgICAgICAgICBPYmplY3RbXzB4MzlmZjA0KDB4Mzg4KV0oXzB4OTk2ODhjKVtfMHgzOWZmMDQoMHgxNjQpXShmdW5jdGlvbiAoCiAgICAgICAgICAgICAgXzB4MmFkYzM5CiAgICAgICAgICAgICkgewogICAgICAgICAgICAgIHZhciBfMHgyM2U0OGUgPSBfMHgzOWZmMDQ7CiAgICAgICAgICAgICAgcmV0dXJuIE9iamVjdFtfMHgyM2U0OGUoMHgyYTYpXShfMHg5OTY4OGMsIF8weDJhZGMzOSlbCiAgICAgICAgICAgICAgICBfMHgyM2U0OGUoMHgyM2EpCiAgICAgICAgICAgICAgXTsKICAgICAgICAgICAgfSkKICAgICAgICAgICksCiAgICAgICAgICBfMHhiZjMzMTRbImZvckVhY2giXShmdW5jdGlvbiAoXzB4MmU0NGU0KSB7CiAgICAgICAgICAgIF8weDRhNzgyNChfMHgyYWI4ZWYsIF8weDJlNDRlNCwgXzB4OTk2ODhjW18weDJlNDRlNF0pOwogICAgICAgICAgfSk7CiAgICAgIH0KICAgICAgcmV0dXJuIF8weDJhYjhlZjsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDVkZGE3ZChfMHg0NjQyN2IsIF8weDRiNjhkZSkgewogICAgICB2YXIgXzB4NWM3ZjQxID0gd18weDI1ZjM7CiAgICAgIGlmICgiZnVuY3Rpb24iICE9IHR5cGVvZiBfMHg0YjY4ZGUgJiYgbnVsbCAhPT0gXzB4NGI2OGRlKQogICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4NWM3ZjQxKDB4MjM2KSk7CiAgICAgIChfMHg0NjQyN2JbXzB4NWM3ZjQxKDB4MzQ0KV0gPSBPYmplY3RbImNyZWF0ZSJdKAogICAgICAgIF8weDRiNjhkZSAmJiBfMHg0YjY4ZGVbXzB4NWM3ZjQxKDB4MzQ0KV0sCiAgICAgICAgewogICAgICAgICAgY29uc3RydWN0b3I6IHsKICAgICAgICAgICAgdmFsdWU6IF8weDQ2NDI3YiwKICAgICAgICAgICAgd3JpdGFibGU6ICEoLTB4NTkgKiAtMHg2ZCArIC0weDNhNSArIC0weDIyNDApLAogICAgICAgICAgICBjb25maWd1cmFibGU6ICEoMHhmNGQgKiAtMHgyICsgLTB4MTgyZSArIDB4MWI2NCAqIDB4MiksCiAgICAgICAgICB9LAogICAgICAgIH0KICAgICAgKSksCiAgICAgICAgT2JqZWN0W18weDVjN2Y0MSgweDE3NSldKF8weDQ2NDI3YiwgXzB4NWM3ZjQxKDB4MzQ0KSwgewogICAgICAgICAgd3JpdGFibGU6ICEoLTB4OWQwICogLTB4MSArIDB4MTdhMSArIC0weDIxNyAqIDB4MTApLAogICAgICAgIH0pLAogICAgICAgIF8weDRiNjhkZSAmJiBfMHgyZTJmNDcoXzB4NDY0MjdiLCBfMHg0YjY4ZGUpOwogICAgfQogICAgZnVuY3Rpb24gXzB4Mzg3OWFjKF8weDQwNzM4ZiwgXzB4M2RkYjFmKSB7CiAgICAgIHZhciBfMHgzNGFhZWUgPSB3XzB4MjVmMzsKICAgICAgKF8weDQwNzM4ZltfMHgzNGFhZWUoMHgzNDQpXSA9IE9iamVjdFsiY3JlYXRlIl0oCiAgICAgICAgXzB4M2RkYjFmW18weDM0YWFlZSgweDM0NCldCiAgICAgICkpLAogICAgICAgIChfMHg0MDczOGZbXzB4MzRhYWVlKDB4MzQ0KV1bXzB4MzRhYWVlKDB4MmFjKV0gPSBfMHg0MDczOGYpLAogICAgICAgIF8weDJlMmY0NyhfMHg0MDczOGYsIF8weDNkZGIxZik7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyMmFmNjMoXzB4MjZjNGU0KSB7CiAgICAgIHZhciBfMHgzYzljZDIgPSB3XzB4MjVmMzsKICAgICAgcmV0dXJuIChfMHgyMmFmNjMgPSBPYmplY3RbXzB4M2M5Y2QyKDB4MjNiKV0KICAgICAgICA/IE9iamVjdFsiZ2V0UHJvdG90eXBlT2YiXVtfMHgzYzljZDIoMHgzMDEpXSgpCiAgICAgICAgOiBmdW5jdGlvbiAoXzB4MjEyOTY4KSB7CiAgICAgICAgICAgIHZhciBfMHgzYTkzOWYgPSBfMHgzYzljZDI7CiAgICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgICAgXzB4MjEyOTY4WyJfX3Byb3RvX18iXSB8fCBPYmplY3RbXzB4M2E5MzlmKDB4MjJjKV0oXzB4MjEyOTY4KQogICAgICAgICAgICApOwogICAgICAgICAgfSkoXzB4MjZjNGU0KTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDJlMmY0NyhfMHgyNGM3NTcsIF8weDFkOWQ4MCkgewogICAgICB2YXIgXzB4NWUxMjUxID0gd18weDI1ZjM7CiAgICAgIHJldHVybiAoXzB4MmUyZjQ3ID0gT2JqZWN0WyJzZXRQcm90b3R5cGVPZiJdCiAgICAgICAgPyBPYmplY3RbXzB4NWUxMjUxKDB4MjNiKV1bXzB4NWUxMjUxKDB4MzAxKV0oKQogICAgICAgIDogZnVuY3Rpb24gKF8weDFmMTNiNCwgXzB4MjRmZGM4KSB7CiAgICAgICAgICAgIHZhciBfMHgxNmJjMWIgPSBfMHg1ZTEyNTE7CiAgICAgICAgICAgIHJldHVybiAoXzB4MWYxM2I0W18weDE2YmMxYigweDJlYSldID0gXzB4MjRmZGM4KSwgXzB4MWYxM2I0OwogICAgICAgICAgfSkoXzB4MjRjNzU3LCBfMHgxZDlkODApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MzM5MGRjKCkgewogICAgICB2YXIgXzB4MzFiM2YzID0gd18weDI1ZjM7CiAgICAgIGlmIChfMHgzMWIzZjMoMHgzODQpID09IHR5cGVvZiBSZWZsZWN0IHx8ICFSZWZsZWN0W18weDMxYjNmMygweDMyMCldKQogICAgICAgIHJldHVybiAhKC0weDExNTggKyAtMHg3ODkgKyAweDE4ZTIpOwogICAgICBpZiAoUmVmbGVjdFtfMHgzMWIzZjMoMHgzMjApXVsic2hhbSJdKQogICAgICAgIHJldHVybiAhKDB4ZWM1ICsgMHg4ICogLTB4OTIgKyAtMHhhMzQgKiAweDEpOwogICAgICBpZiAoXzB4MzFiM2YzKDB4MWVlKSA9PSB0eXBlb2YgUHJveHkpIHJldHVybiAhKC0weGUwMSArIDB4YTdiICsgMHgzODYpOwogICAgICB0cnkgewogICAgICAgIHJldHVybiAoCiAgICAgICAgICBCb29sZWFuW18weDMxYjNmMygweDM0NCldW18weDMxYjNmMygweDMwMyldW18weDMxYjNmMygweDMzNCldKAogICAgICAgICAgICBSZWZsZWN0W18weDMxYjNmMygweDMyMCldKEJvb2xlYW4sIFtdLCBmdW5jdGlvbiAoKSB7fSkKICAgICAgICAgICksCiAgICAgICAgICAhKC0weGUwYyArIC0weDI0MTUgKyAweDMyMjEgKiAweDEpCiAgICAgICAgKTsKICAgICAgfSBjYXRjaCAoXzB4MjBhYTFlKSB7CiAgICAgICAgcmV0dXJuICEoMHhkICogLTB4YTQgKyAtMHhjMWYgKyAweDE0NzQpOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHg5MjBhM2QoXzB4MzVlN2FiLCBfMHg1Y2JkMDAsIF8weDUzY2VkNSkgewogICAgICB2YXIgXzB4NGJhNzE5ID0gd18weDI1ZjM7CiAgICAgIHJldHVybiAoXzB4OTIwYTNkID0gXzB4MzM5MGRjKCkKICAgICAgICA/IFJlZmxlY3RbImNvbnN0cnVjdCJdW18weDRiYTcxOSgweDMwMSldKCkKICAgICAgICA6IGZ1bmN0aW9uIChfMHg0MGM3YWUsIF8weGQyNmVkZiwgXzB4NWVjZGFmKSB7CiAgICAgICAgICAgIHZhciBfMHgzYjRjMGYgPSBfMHg0YmE3MTksCiAgICAgICAgICAgICAgXzB4NTVjYjFmID0gW251bGxdOwogICAgICAgICAgICBfMHg1NWNiMWZbInB1c2giXVtfMHgzYjRjMGYoMHgyMDcpXShfMHg1NWNiMWYsIF8weGQyNmVkZik7CiAgICAgICAgICAgIHZhciBfMHg0N2Y2ZmIgPSBuZXcgKEZ1bmN0aW9uW18weDNiNGMwZigweDMwMSldWyJhcHBseSJdKAogICAgICAgICAgICAgIF8weDQwYzdhZSwKICAgICAgICAgICAgICBfMHg1NWNiMWYKICAgICAgICAgICAgKSkoKTsKICAgICAgICAgICAgcmV0dXJuICgKICAgICAgICAgICAgICBfMHg1ZWNkYWYgJiYgXzB4MmUyZjQ3KF8weDQ3ZjZmYiwgXzB4NWVjZGFmW18weDNiNGMwZigweDM0NCldKSwKICAgICAgICAgICAgICBfMHg0N2Y2ZmIKICAgICAgICAgICAgKTsKICAgICAgICAgIH0pWyJhcHBseSJdKG51bGwsIGFyZ3VtZW50cyk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1Y2IwZDcoXzB4NmUyZjJmKSB7CiAgICAgIHZhciBfMHgyNmU0NTEgPSB3XzB4MjVmMzsKICAgICAgcmV0dXJuICgKICAgICAgICAtKC0weDY1ICogMHgzNSArIC0weDIwODcgKyAtMHgzNTcxICogLTB4MSkgIT09CiAgICAgICAgRnVuY3Rpb25bXzB4MjZlNDUxKDB4M2FlKV0KICAgICAgICAgIFsiY2FsbCJdKF8weDZlMmYyZikKICAgICAgICAgIFtfMHgyNmU0NTEoMHgyYzUpXShfMHgyNmU0NTEoMHgxNjEpKQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MTZmMjgzKF8weDExNjQ2ZSkgewogICAgICB2YXIgXzB4OTMzNGViID0gd18weDI1ZjMsCiAgICAgICAgXzB4NTUxZDEwID0KICAgICAgICAgIF8weDkzMzRlYigweDFlZSkgPT0gdHlwZW9mIE1hcAogICAgICAgICAgICA/IG5ldyBNYXAoKQogICAgICAgICAgICA6IHZvaWQgKC0weGUgKiAtMHg1ICsgMHhkICogLTB4MTUxICsgMHgzICogMHg1OWQpOwogICAgICByZXR1cm4gKF8weDE2ZjI4MyA9IGZ1bmN0aW9uIChfMHhmZmI0OGIpIHsKICAgICAgICB2YXIgXzB4MzBjNTZiID0gXzB4OTMzNGViOwogICAgICAgIGlmIChudWxsID09PSBfMHhmZmI0OGIgfHwgIV8weDVjYjBkNyhfMHhmZmI0OGIpKSByZXR1cm4gXzB4ZmZiNDhiOwogICAgICAgIGlmIChfMHgzMGM1NmIoMHgxZWUpICE9IHR5cGVvZiBfMHhmZmI0OGIpCiAgICAgICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKF8weDMwYzU2YigweDIzNikpOwogICAgICAgIGlmICh2b2lkICgweDEyICogMHhmOCArIC0weDQxYiArIDB4ZDU1ICogLTB4MSkgIT09IF8weDU1MWQxMCkgewogICAgICAgICAgaWYgKF8weDU1MWQxMFtfMHgzMGM1NmIoMHgyZmMpXShfMHhmZmI0OGIpKQogICAgICAgICAgICByZXR1cm4gXzB4NTUxZDEwW18weDMwYzU2YigweDMyYildKF8weGZmYjQ4Yik7CiAgICAgICAgICBfMHg1NTFkMTBbXzB4MzBjNTZiKDB4MWU0KV0oXzB4ZmZiNDhiLCBfMHhmZWUwMTQpOwogICAgICAgIH0KICAgICAgICBmdW5jdGlvbiBfMHhmZWUwMTQoKSB7CiAgICAgICAgICB2YXIgXzB4MTBmZWM0ID0gXzB4MzBjNTZiOwogICAgICAgICAgcmV0dXJuIF8weDkyMGEzZCgKICAgICAgICAgICAgXzB4ZmZiNDhiLAogICAgICAgICAgICBhcmd1bWVudHMsCiAgICAgICAgICAgIF8weDIyYWY2Myh0aGlzKVtfMHgxMGZlYzQoMHgyYWMpXQogICAgICAgICAgKTsKICAgICAgICB9CiAgICAgICAgcmV0dXJuICgKICAgICAgICAgIChfMHhmZWUwMTRbInByb3RvdHlwZSJdID0gT2JqZWN0W18weDMwYzU2YigweDNiNyldKAogICAgICAgICAgICBfMHhmZmI0OGJbXzB4MzBjNTZiKDB4MzQ0KV0sCiAgICAgICAgICAgIHsKICAgICAgICAgICAgICBjb25zdHJ1Y3RvcjogewogICAgICAgICAgICAgICAgdmFsdWU6IF8weGZlZTAxNCwKICAgICAgICAgICAgICAgIGVudW1lcmFibGU6ICEoMHg4MjkgKyAweDEgKiAtMHgxMjcxICsgMHhhNDkpLAogICAgICAgICAgICAgICAgd3JpdGFibGU6ICEoMHg3MjQgKyAweDE1ZjkgKyAweDFkICogLTB4MTAxKSwKICAgICAgICAgICAgICAgIGNvbmZpZ3VyYWJsZTogISgweDNlNCArIDB4Njg1ICogMHg0ICsgMHgxZGY4ICogLTB4MSksCiAgICAgICAgICAgICAgfSwKICAgICAgICAgICAgfQogICAgICAgICAgKSksCiAgICAgICAgICBfMHgyZTJmNDcoXzB4ZmVlMDE0LCBfMHhmZmI0OGIpCiAgICAgICAgKTsKICAgICAgfSkoXzB4MTE2NDZlKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDhmNmUzMyhfMHhjYTQyMDEsIF8weDU3Mjg4OSkgewogICAgICB2YXIgXzB4NDRmYTQyID0gd18weDI1ZjM7CiAgICAgIHJldHVybiBudWxsICE9IF8weDU3Mjg4OSAmJgogICAgICAgIF8weDQ0ZmE0MigweDM4NCkgIT0gdHlwZW9mIFN5bWJvbCAmJgogICAgICAgIF8weDU3Mjg4OVtTeW1ib2xbXzB4NDRmYTQyKDB4MTc4KV1dCiAgICAgICAgPyAhIV8weDU3Mjg4OVtTeW1ib2xbXzB4NDRmYTQyKDB4MTc4KV1dKF8weGNhNDIwMSkKICAgICAgICA6IF8weGNhNDIwMSBpbnN0YW5jZW9mIF8weDU3Mjg4OTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDJlYTM2NihfMHg0ZGE3MzEpIHsKICAgICAgdmFyIF8weDJjOTM2OSA9IHdfMHgyNWYzOwogICAgICByZXR1cm4gXzB4NGRhNzMxICYmIF8weDRkYTczMVtfMHgyYzkzNjkoMHgzYmQpXQogICAgICAgID8gXzB4NGRhNzMxCiAgICAgICAgOiB7CiAgICAgICAgICAgIGRlZmF1bHQ6IF8weDRkYTczMSwKICAgICAgICAgIH07CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxNjI5ZTYoXzB4YjhlYzU4KSB7CiAgICAgIHZhciBfMHhkNmY2ZjEgPSB3XzB4MjVmMzsKICAgICAgaWYgKF8weGQ2ZjZmMSgweDFlZSkgIT0gdHlwZW9mIFdlYWtNYXApIHJldHVybiBudWxsOwogICAgICB2YXIgXzB4MmQ4ZjM5ID0gbmV3IFdlYWtNYXAoKSwKICAgICAgICBfMHgyMzk4ZmUgPSBuZXcgV2Vha01hcCgpOwogICAgICByZXR1cm4gKF8weDE2MjllNiA9IGZ1bmN0aW9uIChfMHgxNjRiMzUpIHsKICAgICAgICByZXR1cm4gXzB4MTY0YjM1ID8gXzB4MjM5OGZlIDogXzB4MmQ4ZjM5OwogICAgICB9KShfMHhiOGVjNTgpOwogICAgfQogICAgZnVuY3Rpb24gXzB4MmM5MTU4KF8weDJmNWMzZSwgXzB4NTVjOWZmKSB7CiAgICAgIHZhciBfMHgzZDQwMTggPSB3XzB4MjVmMzsKICAgICAgaWYgKCFfMHg1NWM5ZmYgJiYgXzB4MmY1YzNlICYmIF8weDJmNWMzZVsiX19lc01vZHVsZSJdKSByZXR1cm4gXzB4MmY1YzNlOwogICAgICBpZiAoCiAgICAgICAgbnVsbCA9PT0gXzB4MmY1YzNlIHx8CiAgICAgICAgKF8weDNkNDAxOCgweDE3ZCkgIT0gdHlwZW9mIF8weDJmNWMzZSAmJiAiZnVuY3Rpb24iICE9IHR5cGVvZiBfMHgyZjVjM2UpCiAgICAgICkKICAgICAgICByZXR1cm4gewogICAgICAgICAgZGVmYXVsdDogXzB4MmY1YzNlLAogICAgICAgIH07CiAgICAgIHZhciBfMHhjYWZlOTcgPSBfMHgxNjI5ZTYoXzB4NTVjOWZmKTsKICAgICAgaWYgKF8weGNhZmU5NyAmJiBfMHhjYWZlOTdbXzB4M2Q0MDE4KDB4MmZjKV0oXzB4MmY1YzNlKSkKICAgICAgICByZXR1cm4gXzB4Y2FmZTk3W18weDNkNDAxOCgweDMyYildKF8weDJmNWMzZSk7CiAgICAgIHZhciBfMHg0MWUzMzAgPSB7fSwKICAgICAgICBfMHgxMTVjN2YgPSBPYmplY3RbXzB4M2Q0MDE4KDB4MTc1KV0gJiYgT2JqZWN0W18weDNkNDAxOCgweDJhNildOwogICAgICBmb3IgKHZhciBfMHg4NGE1MTAgaW4gXzB4MmY1YzNlKQogICAgICAgIGlmICgKICAgICAgICAgIF8weDNkNDAxOCgweDFkMykgIT09IF8weDg0YTUxMCAmJgogICAgICAgICAgT2JqZWN0W18weDNkNDAxOCgweDM0NCldWyJoYXNPd25Qcm9wZXJ0eSJdW18weDNkNDAxOCgweDMzNCldKAogICAgICAgICAgICBfMHgyZjVjM2UsCiAgICAgICAgICAgIF8weDg0YTUxMAogICAgICAgICAgKQogICAgICAgICkgewogICAgICAgICAgdmFyIF8weDQyMmJjZCA9IF8weDExNWM3ZgogICAgICAgICAgICA/IE9iamVjdFtfMHgzZDQwMTgoMHgyYTYpXShfMHgyZjVjM2UsIF8weDg0YTUxMCkKICAgICAgICAgICAgOiBudWxsOwogICAgICAgICAgXzB4NDIyYmNkICYmCiAgICAgICAgICAoXzB4NDIyYmNkW18weDNkNDAxOCgweDMyYildIHx8IF8weDQyMmJjZFtfMHgzZDQwMTgoMHgxZTQpXSkKICAgICAgICAgICAgPyBPYmplY3RbImRlZmluZVByb3BlcnR5Il0oXzB4NDFlMzMwLCBfMHg4NGE1MTAsIF8weDQyMmJjZCkKICAgICAgICAgICAgOiAoXzB4NDFlMzMwW18weDg0YTUxMF0gPSBfMHgyZjVjM2VbXzB4ODRhNTEwXSk7CiAgICAgICAgfQogICAgICByZXR1cm4gKAogICAgICAgIChfMHg0MWUzMzBbImRlZmF1bHQiXSA9IF8weDJmNWMzZSksCiAgICAgICAgXzB4Y2FmZTk3ICYmIF8weGNhZmU5N1tfMHgzZDQwMTgoMHgxZTQpXShfMHgyZjVjM2UsIF8weDQxZTMzMCksCiAgICAgICAgXzB4NDFlMzMwCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzNzQ3MzYoXzB4MmQxMzBiLCBfMHgzMjQ1OTMpIHsKICAgICAgdmFyIF8weDRjY2ZmMiA9IHdfMHgyNWYzOwogICAgICBpZiAoXzB4MmQxMzBiICE9PSBfMHgzMjQ1OTMpIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4NGNjZmYyKDB4MTZjKSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyMDYxOTkoXzB4NjA3ZTYyKSB7CiAgICAgIHZhciBfMHg1YmJiMjEgPSB3XzB4MjVmMzsKICAgICAgaWYgKG51bGwgPT0gXzB4NjA3ZTYyKSB0aHJvdyBuZXcgVHlwZUVycm9yKF8weDViYmIyMSgweDFjYykgKyBfMHg2MDdlNjIpOwogICAgfQogICAgZnVuY3Rpb24gXzB4MmJmYTNlKF8weDE2MTQ2MywgXzB4MmZmNGQ1KSB7CiAgICAgIHZhciBfMHg1OWQ3ZWUgPSB3XzB4MjVmMzsKICAgICAgaWYgKG51bGwgPT0gXzB4MTYxNDYzKSByZXR1cm4ge307CiAgICAgIHZhciBfMHgzMWZiZjYsCiAgICAgICAgXzB4NTBkMGI2LAogICAgICAgIF8weDVjYTFjNSA9IHt9LAogICAgICAgIF8weDViNzFmZCA9IE9iamVjdFsia2V5cyJdKF8weDE2MTQ2Myk7CiAgICAgIGZvciAoCiAgICAgICAgXzB4NTBkMGI2ID0gLTB4NzYzICsgLTB4MTVhICsgMHgxICogMHg4YmQ7CiAgICAgICAgXzB4NTBkMGI2IDwgXzB4NWI3MWZkW18weDU5ZDdlZSgweDI1OSldOwogICAgICAgIF8weDUwZDBiNisrCiAgICAgICkKICAgICAgICAoXzB4MzFmYmY2ID0gXzB4NWI3MWZkW18weDUwZDBiNl0pLAogICAgICAgICAgXzB4MmZmNGQ1W18weDU5ZDdlZSgweDJjNSldKF8weDMxZmJmNikgPj0gMHg4YTcgKyAtMHgyMWVkICsgMHgxOTQ2IHx8CiAgICAgICAgICAgIChfMHg1Y2ExYzVbXzB4MzFmYmY2XSA9IF8weDE2MTQ2M1tfMHgzMWZiZjZdKTsKICAgICAgcmV0dXJuIF8weDVjYTFjNTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDJhMjhlOShfMHgyY2RmMmUsIF8weDc0YWMxMSkgewogICAgICB2YXIgXzB4OTQyYzUxID0gd18weDI1ZjM7CiAgICAgIGlmIChudWxsID09IF8weDJjZGYyZSkgcmV0dXJuIHt9OwogICAgICB2YXIgXzB4NWVmNDZlLAogICAgICAgIF8weDVhY2Y3MCwKICAgICAgICBfMHgyODJkZjQgPSBfMHgyYmZhM2UoXzB4MmNkZjJlLCBfMHg3NGFjMTEpOwogICAgICBpZiAoT2JqZWN0WyJnZXRPd25Qcm9wZXJ0eVN5bWJvbHMiXSkgewogICAgICAgIHZhciBfMHgzM2Q3MDggPSBPYmplY3RbXzB4OTQyYzUxKDB4Mzg4KV0oXzB4MmNkZjJlKTsKICAgICAgICBmb3IgKAogICAgICAgICAgXzB4NWFjZjcwID0gLTB4ZDMwICsgMHg0YTEgKiAweDEgKyAweDcgKiAweDEzOTsKICAgICAgICAgIF8weDVhY2Y3MCA8IF8weDMzZDcwOFtfMHg5NDJjNTEoMHgyNTkpXTsKICAgICAgICAgIF8weDVhY2Y3MCsrCiAgICAgICAgKQogICAgICAgICAgKF8weDVlZjQ2ZSA9IF8weDMzZDcwOFtfMHg1YWNmNzBdKSwKICAgICAgICAgICAgXzB4NzRhYzExW18weDk0MmM1MSgweDJjNSldKF8weDVlZjQ2ZSkgPj0KICAgICAgICAgICAgICAtMHgxZjVkICogMHgxICsgMHg0MGIgKyAweDFiNTIgfHwKICAgICAgICAgICAgICAoT2JqZWN0W18weDk0MmM1MSgweDM0NCldW18weDk0MmM1MSgweDFkYSldW18weDk0MmM1MSgweDMzNCldKAogICAgICAgICAgICAgICAgXzB4MmNkZjJlLAogICAgICAgICAgICAgICAgXzB4NWVmNDZlCiAgICAgICAgICAgICAgKSAmJgogICAgICAgICAgICAgICAgKF8weDI4MmRmNFtfMHg1ZWY0NmVdID0gXzB4MmNkZjJlW18weDVlZjQ2ZV0pKTsKICAgICAgfQogICAgICByZXR1cm4gXzB4MjgyZGY0OwogICAgfQogICAgZnVuY3Rpb24gXzB4NThmNTUwKF8weDk0ZTkzOCkgewogICAgICB2YXIgXzB4NDFkMDc2ID0gd18weDI1ZjM7CiAgICAgIGlmICh2b2lkICgtMHg2YSAqIDB4MSArIC0weGY2ICsgMHgxNjApID09PSBfMHg5NGU5MzgpCiAgICAgICAgdGhyb3cgbmV3IFJlZmVyZW5jZUVycm9yKF8weDQxZDA3NigweDFiYikpOwogICAgICByZXR1cm4gXzB4OTRlOTM4OwogICAgfQogICAgZnVuY3Rpb24gXzB4ZjNiMTcoXzB4N2IyY2Y2LCBfMHgzNDdjOWYpIHsKICAgICAgdmFyIF8weDQxZjM1MCA9IHdfMHgyNWYzOwogICAgICBpZiAoCiAgICAgICAgXzB4MzQ3YzlmICYmCiAgICAgICAgKF8weDQxZjM1MCgweDE3ZCkgPT0gdHlwZW9mIF8weDM0N2M5ZiB8fAogICAgICAgICAgXzB4NDFmMzUwKDB4MWVlKSA9PSB0eXBlb2YgXzB4MzQ3YzlmKQogICAgICApCiAgICAgICAgcmV0dXJuIF8weDM0N2M5ZjsKICAgICAgaWYgKHZvaWQgKDB4MTYwZCArIC0weDI0ZmQgKyAtMHg4ICogLTB4MWRlKSAhPT0gXzB4MzQ3YzlmKQogICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoCiAgICAgICAgICAiRGVyaXZlZFx4MjBjb25zdHJ1Y3RvcnNceDIwbWF5XHgyMG9ubHlceDIwcmV0dXJuXHgyMG9iamVjdFx4MjBvclx4MjB1bmRlZmluZWQiCiAgICAgICAgKTsKICAgICAgcmV0dXJuIF8weDU4ZjU1MChfMHg3YjJjZjYpOwogICAgfQogICAgZnVuY3Rpb24gXzB4MTdiMjM0KF8weDMzMzE2ZikgewogICAgICB2YXIgXzB4MzYwMWYwID0gXzB4MzM5MGRjKCk7CiAgICAgIHJldHVybiBmdW5jdGlvbiAoKSB7CiAgICAgICAgdmFyIF8weDQ3MzNkNiA9IHdfMHgyNWYzLAogICAgICAgICAgXzB4Mjg0OGMxLAogICAgICAgICAgXzB4MmQwMzg2ID0gXzB4MjJhZjYzKF8weDMzMzE2Zik7CiAgICAgICAgaWYgKF8weDM2MDFmMCkgewogICAgICAgICAgdmFyIF8weDI1MmJiMyA9IF8weDIyYWY2Myh0aGlzKVtfMHg0NzMzZDYoMHgyYWMpXTsKICAgICAgICAgIF8weDI4NDhjMSA9IFJlZmxlY3RbXzB4NDczM2Q2KDB4MzIwKV0oCiAgICAgICAgICAgIF8weDJkMDM4NiwKICAgICAgICAgICAgYXJndW1lbnRzLAogICAgICAgICAgICBfMHgyNTJiYjMKICAgICAgICAgICk7CiAgICAgICAgfSBlbHNlIF8weDI4NDhjMSA9IF8weDJkMDM4NltfMHg0NzMzZDYoMHgyMDcpXSh0aGlzLCBhcmd1bWVudHMpOwogICAgICAgIHJldHVybiBfMHhmM2IxNyh0aGlzLCBfMHgyODQ4YzEpOwogICAgICB9OwogICAgfQogICAgZnVuY3Rpb24gXzB4MmIzYThiKF8weDQwOWZiYiwgXzB4NTA4ODI1KSB7CiAgICAgIGZvciAoCiAgICAgICAgOwogICAgICAgICFPYmplY3RbInByb3RvdHlwZSJdWyJoYXNPd25Qcm9wZXJ0eSJdWyJjYWxsIl0oXzB4NDA5ZmJiLCBfMHg1MDg4MjUpICYmCiAgICAgICAgbnVsbCAhPT0gKF8weDQwOWZiYiA9IF8weDIyYWY2MyhfMHg0MDlmYmIpKTsKCiAgICAgICk7CiAgICAgIHJldHVybiBfMHg0MDlmYmI7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzM2JmYTQoKSB7CiAgICAgIHZhciBfMHgxYmJmMDIgPSB3XzB4MjVmMzsKICAgICAgcmV0dXJuIChfMHgzM2JmYTQgPQogICAgICAgIF8weDFiYmYwMigweDM4NCkgIT0gdHlwZW9mIFJlZmxlY3QgJiYgUmVmbGVjdFtfMHgxYmJmMDIoMHgzMmIpXQogICAgICAgICAgPyBSZWZsZWN0W18weDFiYmYwMigweDMyYildW18weDFiYmYwMigweDMwMSldKCkKICAgICAgICAgIDogZnVuY3Rpb24gKF8weDQ1ZjM4YywgXzB4NGE1MjZjLCBfMHg0ODJmNjApIHsKICAgICAgICAgICAgICB2YXIgXzB4YjJhZDkwID0gXzB4MWJiZjAyLAogICAgICAgICAgICAgICAgXzB4NTNmNWQ3ID0gXzB4MmIzYThiKF8weDQ1ZjM4YywgXzB4NGE1MjZjKTsKICAgICAgICAgICAgICBpZiAoXzB4NTNmNWQ3KSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4MjRlMDVmID0gT2JqZWN0W18weGIyYWQ5MCgweDJhNildKF8weDUzZjVkNywgXzB4NGE1MjZjKTsKICAgICAgICAgICAgICAgIHJldHVybiBfMHgyNGUwNWZbXzB4YjJhZDkwKDB4MzJiKV0KICAgICAgICAgICAgICAgICAgPyBfMHgyNGUwNWZbXzB4YjJhZDkwKDB4MzJiKV1bXzB4YjJhZDkwKDB4MzM0KV0oCiAgICAgICAgICAgICAgICAgICAgICBhcmd1bWVudHNbXzB4YjJhZDkwKDB4MjU5KV0gPAogICAgICAgICAgICAgICAgICAgICAgICAweDdmICogMHgyNSArIDB4MjNmMyArIC0weDM2NGIKICAgICAgICAgICAgICAgICAgICAgICAgPyBfMHg0NWYzOGMKICAgICAgICAgICAgICAgICAgICAgICAgOiBfMHg0ODJmNjAKICAgICAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgICAgIDogXzB4MjRlMDVmW18weGIyYWQ5MCgweDJlNCldOwogICAgICAgICAgICAgIH0KICAgICAgICAgICAgfSlbImFwcGx5Il0odGhpcywgYXJndW1lbnRzKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDViMDEwYyhfMHg4NzhlZTAsIF8weDI3YTVjNCwgXzB4MzVjYjQwLCBfMHgxNGU5YmEpIHsKICAgICAgdmFyIF8weDFjNWY2MCA9IHdfMHgyNWYzOwogICAgICByZXR1cm4gKF8weDViMDEwYyA9CiAgICAgICAgInVuZGVmaW5lZCIgIT0gdHlwZW9mIFJlZmxlY3QgJiYgUmVmbGVjdFtfMHgxYzVmNjAoMHgxZTQpXQogICAgICAgICAgPyBSZWZsZWN0W18weDFjNWY2MCgweDFlNCldCiAgICAgICAgICA6IGZ1bmN0aW9uIChfMHhjMWQ0ZCwgXzB4M2EzMmY4LCBfMHgyNTQzNmQsIF8weDVlZjZlMykgewogICAgICAgICAgICAgIHZhciBfMHg0M2E1OTEgPSBfMHgxYzVmNjAsCiAgICAgICAgICAgICAgICBfMHgyM2Q5MWUsCiAgICAgICAgICAgICAgICBfMHg1YWM0NTkgPSBfMHgyYjNhOGIoXzB4YzFkNGQsIF8weDNhMzJmOCk7CiAgICAgICAgICAgICAgaWYgKF8weDVhYzQ1OSkgewogICAgICAgICAgICAgICAgaWYgKAogICAgICAgICAgICAgICAgICAoXzB4MjNkOTFlID0gT2JqZWN0W18weDQzYTU5MSgweDJhNildKF8weDVhYzQ1OSwgXzB4M2EzMmY4KSlbCiAgICAgICAgICAgICAgICAgICAgXzB4NDNhNTkxKDB4MWU0KQogICAgICAgICAgICAgICAgICBdCiAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgICAgICAgICAgXzB4MjNkOTFlWyJzZXQiXVtfMHg0M2E1OTEoMHgzMzQpXShfMHg1ZWY2ZTMsIF8weDI1NDM2ZCksCiAgICAgICAgICAgICAgICAgICAgISgweDRkICogLTB4NTkgKyAtMHgxICogLTB4M2Q2ICsgMHgxNmVmKQogICAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgICAgaWYgKCFfMHgyM2Q5MWVbXzB4NDNhNTkxKDB4MmUzKV0pCiAgICAgICAgICAgICAgICAgIHJldHVybiAhKC0weDI2OTEgKyAweDllICogMHgyNSArIDB4ZmJjKTsKICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgaWYgKAogICAgICAgICAgICAgICAgKF8weDIzZDkxZSA9IE9iamVjdFsiZ2V0T3duUHJvcGVydHlEZXNjcmlwdG9yIl0oCiAgICAgICAgICAgICAgICAgIF8weDVlZjZlMywKICAgICAgICAgICAgICAgICAgXzB4M2EzMmY4CiAgICAgICAgICAgICAgICApKQogICAgICAgICAgICAgICkgewogICAgICAgICAgICAgICAgaWYgKCFfMHgyM2Q5MWVbXzB4NDNhNTkxKDB4MmUzKV0pCiAgICAgICAgICAgICAgICAgIHJldHVybiAhKDB4MTRkICsgLTB4MSAqIC0weDI5YiArIC0weDNlNyk7CiAgICAgICAgICAgICAgICAoXzB4MjNkOTFlW18weDQzYTU5MSgweDJlNCldID0gXzB4MjU0MzZkKSwKICAgICAgICAgICAgICAgICAgT2JqZWN0W18weDQzYTU5MSgweDE3NSldKF8weDVlZjZlMywgXzB4M2EzMmY4LCBfMHgyM2Q5MWUpOwogICAgICAgICAgICAgIH0gZWxzZSBfMHg0YTc4MjQoXzB4NWVmNmUzLCBfMHgzYTMyZjgsIF8weDI1NDM2ZCk7CiAgICAgICAgICAgICAgcmV0dXJuICEoMHgyOTUgKyAtMHhhMzkgKiAtMHgyICsgLTB4MTcwNyk7CiAgICAgICAgICAgIH0pKF8weDg3OGVlMCwgXzB4MjdhNWM0LCBfMHgzNWNiNDAsIF8weDE0ZTliYSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyNzMyYTQoXzB4MjRhNjAyLCBfMHgxOTQ1NDcsIF8weDE2YTdiNSwgXzB4ODkxM2IxLCBfMHg1MzFkMGQpIHsKICAgICAgdmFyIF8weDE2NTYzZiA9IHdfMHgyNWYzOwogICAgICBpZiAoCiAgICAgICAgIV8weDViMDEwYyhfMHgyNGE2MDIsIF8weDE5NDU0NywgXzB4MTZhN2I1LCBfMHg4OTEzYjEgfHwgXzB4MjRhNjAyKSAmJgogICAgICAgIF8weDUzMWQwZAogICAgICApCiAgICAgICAgdGhyb3cgbmV3IFR5cGVFcnJvcihfMHgxNjU2M2YoMHgzNGUpKTsKICAgICAgcmV0dXJuIF8weDE2YTdiNTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDI4MWJmMyhfMHg0NTY0YjQsIF8weDFmNDE1MykgewogICAgICB2YXIgXzB4MTBiNzkyID0gd18weDI1ZjM7CiAgICAgIHJldHVybiAoCiAgICAgICAgXzB4MWY0MTUzIHx8CiAgICAgICAgICAoXzB4MWY0MTUzID0gXzB4NDU2NGI0W18weDEwYjc5MigweDJhNSldKAogICAgICAgICAgICAweDEwMTcgKyAweDFjYjMgKyAweDIgKiAtMHgxNjY1CiAgICAgICAgICApKSwKICAgICAgICBPYmplY3RbXzB4MTBiNzkyKDB4MTk4KV0oCiAgICAgICAgICBPYmplY3RbXzB4MTBiNzkyKDB4MzZjKV0oXzB4NDU2NGI0LCB7CiAgICAgICAgICAgIHJhdzogewogICAgICAgICAgICAgIHZhbHVlOiBPYmplY3RbXzB4MTBiNzkyKDB4MTk4KV0oXzB4MWY0MTUzKSwKICAgICAgICAgICAgfSwKICAgICAgICAgIH0pCiAgICAgICAgKQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MmQ1ZjBjKF8weDE4ODYzZSwgXzB4MTNlOGQ0KSB7CiAgICAgIHZhciBfMHg0N2EzZDEgPSB3XzB4MjVmMzsKICAgICAgcmV0dXJuICgKICAgICAgICBfMHgxM2U4ZDQgfHwKICAgICAgICAgIChfMHgxM2U4ZDQgPSBfMHgxODg2M2VbInNsaWNlIl0oCiAgICAgICAgICAgIDB4OGYxICogMHgxICsgMHgxICogMHgxZTFmICsgLTB4N2QgKiAweDUwCiAgICAgICAgICApKSwKICAgICAgICAoXzB4MTg4NjNlW18weDQ3YTNkMSgweDJhYildID0gXzB4MTNlOGQ0KSwKICAgICAgICBfMHgxODg2M2UKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDI0NjIyOShfMHg1ZTcxYTApIHsKICAgICAgdmFyIF8weDQ3Yzk3NyA9IHdfMHgyNWYzOwogICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKCJceDIyIiArIF8weDVlNzFhMCArIF8weDQ3Yzk3NygweDMzOCkpOwogICAgfQogICAgZnVuY3Rpb24gXzB4NWRiN2JmKF8weDUxZjkxNSkgewogICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKCJceDIyIiArIF8weDUxZjkxNSArICJceDIyXHgyMGlzXHgyMHdyaXRlLW9ubHkiKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDIyNzVmNChfMHg0MjI0NmUpIHsKICAgICAgdmFyIF8weDJmNzM1MSA9IHdfMHgyNWYzOwogICAgICB0aHJvdyBuZXcgUmVmZXJlbmNlRXJyb3IoCiAgICAgICAgXzB4MmY3MzUxKDB4MWM3KSArCiAgICAgICAgICBfMHg0MjI0NmUgKwogICAgICAgICAgIlx4MjJceDIwY2Fubm90XHgyMGJlXHgyMHJlZmVyZW5jZWRceDIwaW5ceDIwY29tcHV0ZWRceDIwcHJvcGVydHlceDIwa2V5cy4iCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1MTZjMmIoKSB7fQogICAgZnVuY3Rpb24gXzB4YWI0YWM5KF8weGNkZTAxNykgewogICAgICB0aHJvdyBuZXcgUmVmZXJlbmNlRXJyb3IoCiAgICAgICAgXzB4Y2RlMDE3ICsgIlx4MjBpc1x4MjBub3RceDIwZGVmaW5lZFx4MjAtXHgyMHRlbXBvcmFsXHgyMGRlYWRceDIwem9uZSIKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDViMzc3YihfMHg1ZjRmYTUsIF8weDJmNDkyYikgewogICAgICByZXR1cm4gXzB4NWY0ZmE1ID09PSBfMHg1MTZjMmIgPyBfMHhhYjRhYzkoXzB4MmY0OTJiKSA6IF8weDVmNGZhNTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDUwOTZkZShfMHgzYjUzYzYsIF8weDMyMjVjMykgewogICAgICByZXR1cm4gKAogICAgICAgIF8weDFhZTMxMihfMHgzYjUzYzYpIHx8CiAgICAgICAgXzB4MTlkNjZhKF8weDNiNTNjNiwgXzB4MzIyNWMzKSB8fAogICAgICAgIF8weDUyNTMzMShfMHgzYjUzYzYsIF8weDMyMjVjMykgfHwKICAgICAgICBfMHgyNWI2OTcoKQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MWRmZjZjKF8weDNhN2E2MywgXzB4MTQ3NjIwKSB7CiAgICAgIHJldHVybiAoCiAgICAgICAgXzB4MWFlMzEyKF8weDNhN2E2MykgfHwKICAgICAgICBfMHgzNzZmZDUoXzB4M2E3YTYzLCBfMHgxNDc2MjApIHx8CiAgICAgICAgXzB4NTI1MzMxKF8weDNhN2E2MywgXzB4MTQ3NjIwKSB8fAogICAgICAgIF8weDI1YjY5NygpCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1Yzg4NShfMHgzOTUzYzApIHsKICAgICAgcmV0dXJuICgKICAgICAgICBfMHgxYWUzMTIoXzB4Mzk1M2MwKSB8fAogICAgICAgIF8weDE4NTNjNihfMHgzOTUzYzApIHx8CiAgICAgICAgXzB4NTI1MzMxKF8weDM5NTNjMCkgfHwKICAgICAgICBfMHgyNWI2OTcoKQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4NTM0MDgzKF8weDMzOTZjZikgewogICAgICByZXR1cm4gKAogICAgICAgIF8weDFjY2QxOShfMHgzMzk2Y2YpIHx8CiAgICAgICAgXzB4MTg1M2M2KF8weDMzOTZjZikgfHwKICAgICAgICBfMHg1MjUzMzEoXzB4MzM5NmNmKSB8fAogICAgICAgIF8weDU0MjMzNygpCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxY2NkMTkoXzB4MTVlNGYwKSB7CiAgICAgIHZhciBfMHgzODRjYmIgPSB3XzB4MjVmMzsKICAgICAgaWYgKEFycmF5W18weDM4NGNiYigweDJhZildKF8weDE1ZTRmMCkpIHJldHVybiBfMHg1MzdjODMoXzB4MTVlNGYwKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDFhZTMxMihfMHg0YmZhZDApIHsKICAgICAgdmFyIF8weDNiYzVhZCA9IHdfMHgyNWYzOwogICAgICBpZiAoQXJyYXlbXzB4M2JjNWFkKDB4MmFmKV0oXzB4NGJmYWQwKSkgcmV0dXJuIF8weDRiZmFkMDsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDRiYmY0YihfMHgzM2E4MzEsIF8weDE4MWEzYywgXzB4MTM1MjcwKSB7CiAgICAgIHZhciBfMHg1YmYzMjkgPSB3XzB4MjVmMzsKICAgICAgaWYgKAogICAgICAgIF8weDE4MWEzYyAmJgogICAgICAgICFBcnJheVtfMHg1YmYzMjkoMHgyYWYpXShfMHgxODFhM2MpICYmCiAgICAgICAgXzB4NWJmMzI5KDB4MjhiKSA9PSB0eXBlb2YgXzB4MTgxYTNjW18weDViZjMyOSgweDI1OSldCiAgICAgICkgewogICAgICAgIHZhciBfMHg0MzM4OGIgPSBfMHgxODFhM2NbXzB4NWJmMzI5KDB4MjU5KV07CiAgICAgICAgcmV0dXJuIF8weDUzN2M4MygKICAgICAgICAgIF8weDE4MWEzYywKICAgICAgICAgIHZvaWQgKDB4YiAqIC0weDI5ICsgMHgzODcgKyAtMHgyICogMHhlMikgIT09IF8weDEzNTI3MCAmJgogICAgICAgICAgICBfMHgxMzUyNzAgPCBfMHg0MzM4OGIKICAgICAgICAgICAgPyBfMHgxMzUyNzAKICAgICAgICAgICAgOiBfMHg0MzM4OGIKICAgICAgICApOwogICAgICB9CiAgICAgIHJldHVybiBfMHgzM2E4MzEoXzB4MTgxYTNjLCBfMHgxMzUyNzApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MTg1M2M2KF8weDMwODZjYSkgewogICAgICB2YXIgXzB4M2U2MDMwID0gd18weDI1ZjM7CiAgICAgIGlmICgKICAgICAgICAoXzB4M2U2MDMwKDB4Mzg0KSAhPSB0eXBlb2YgU3ltYm9sICYmCiAgICAgICAgICBudWxsICE9IF8weDMwODZjYVtTeW1ib2xbXzB4M2U2MDMwKDB4M2IzKV1dKSB8fAogICAgICAgIG51bGwgIT0gXzB4MzA4NmNhW18weDNlNjAzMCgweDFkZCldCiAgICAgICkKICAgICAgICByZXR1cm4gQXJyYXlbImZyb20iXShfMHgzMDg2Y2EpOwogICAgfQogICAgZnVuY3Rpb24gXzB4NTI1MzMxKF8weDFjZWIzZiwgXzB4MzhhNjY4KSB7CiAgICAgIHZhciBfMHgyYjUyNTAgPSB3XzB4MjVmMzsKICAgICAgaWYgKF8weDFjZWIzZikgewogICAgICAgIGlmIChfMHgyYjUyNTAoMHgzM2MpID09IHR5cGVvZiBfMHgxY2ViM2YpCiAgICAgICAgICByZXR1cm4gXzB4NTM3YzgzKF8weDFjZWIzZiwgXzB4MzhhNjY4KTsKICAgICAgICB2YXIgXzB4MjgyMWQ5ID0gT2JqZWN0W18weDJiNTI1MCgweDM0NCldW18weDJiNTI1MCgweDNhZSldCiAgICAgICAgICBbXzB4MmI1MjUwKDB4MzM0KV0oXzB4MWNlYjNmKQogICAgICAgICAgWyJzbGljZSJdKAogICAgICAgICAgICAweDJhZSAqIC0weDcgKyAweDEgKiAweDIxODEgKyAweGViNyAqIC0weDEsCiAgICAgICAgICAgIC0oLTB4MWQgKiAtMHhlYyArIDB4MiAqIC0weDMyICsgLTB4MWE1NykKICAgICAgICAgICk7CiAgICAgICAgcmV0dXJuICgKICAgICAgICAgIF8weDJiNTI1MCgweDJlYikgPT09IF8weDI4MjFkOSAmJgogICAgICAgICAgICBfMHgxY2ViM2ZbXzB4MmI1MjUwKDB4MmFjKV0gJiYKICAgICAgICAgICAgKF8weDI4MjFkOSA9IF8weDFjZWIzZltfMHgyYjUyNTAoMHgyYWMpXVsibmFtZSJdKSwKICAgICAgICAgICJNYXAiID09PSBfMHgyODIxZDkgfHwgXzB4MmI1MjUwKDB4MTYwKSA9PT0gXzB4MjgyMWQ5CiAgICAgICAgICAgID8gQXJyYXlbXzB4MmI1MjUwKDB4MjljKV0oXzB4MWNlYjNmKQogICAgICAgICAgICA6IF8weDJiNTI1MCgweDI3ZikgPT09IF8weDI4MjFkOSB8fAogICAgICAgICAgICAgIC9eKD86VWl8SSludCg/Ojh8MTZ8MzIpKD86Q2xhbXBlZCk/QXJyYXkkL1tfMHgyYjUyNTAoMHgyMmIpXSgKICAgICAgICAgICAgICAgIF8weDI4MjFkOQogICAgICAgICAgICAgICkKICAgICAgICAgICAgPyBfMHg1MzdjODMoXzB4MWNlYjNmLCBfMHgzOGE2NjgpCiAgICAgICAgICAgIDogdm9pZCAoLTB4MSAqIDB4ZjM0ICsgMHgxMmU2ICsgMHgxZDkgKiAtMHgyKQogICAgICAgICk7CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDUzN2M4MyhfMHgxY2M0NmEsIF8weGNhOTk0MCkgewogICAgICB2YXIgXzB4NGM2NmUzID0gd18weDI1ZjM7CiAgICAgIChudWxsID09IF8weGNhOTk0MCB8fCBfMHhjYTk5NDAgPiBfMHgxY2M0NmFbXzB4NGM2NmUzKDB4MjU5KV0pICYmCiAgICAgICAgKF8weGNhOTk0MCA9IF8weDFjYzQ2YVtfMHg0YzY2ZTMoMHgyNTkpXSk7CiAgICAgIGZvciAoCiAgICAgICAgdmFyIF8weDM4NTllNCA9IDB4MWZlMyAqIDB4MSArIC0weDIyYmUgKyAweDJkYiwKICAgICAgICAgIF8weDNhOGVkMyA9IG5ldyBBcnJheShfMHhjYTk5NDApOwogICAgICAgIF8weDM4NTllNCA8IF8weGNhOTk0MDsKICAgICAgICBfMHgzODU5ZTQrKwogICAgICApCiAgICAgICAgXzB4M2E4ZWQzW18weDM4NTllNF0gPSBfMHgxY2M0NmFbXzB4Mzg1OWU0XTsKICAgICAgcmV0dXJuIF8weDNhOGVkMzsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDU0MjMzNygpIHsKICAgICAgdmFyIF8weDFkODk0YyA9IHdfMHgyNWYzOwogICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKF8weDFkODk0YygweDNhOCkpOwogICAgfQogICAgZnVuY3Rpb24gXzB4MjViNjk3KCkgewogICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKAogICAgICAgICJJbnZhbGlkXHgyMGF0dGVtcHRceDIwdG9ceDIwZGVzdHJ1Y3R1cmVceDIwbm9uLWl0ZXJhYmxlXHgyMGluc3RhbmNlLlx4MGFJblx4MjBvcmRlclx4MjB0b1x4MjBiZVx4MjBpdGVyYWJsZSxceDIwbm9uLWFycmF5XHgyMG9iamVjdHNceDIwbXVzdFx4MjBoYXZlXHgyMGFceDIwW1N5bWJvbC5pdGVyYXRvcl0oKVx4MjBtZXRob2QuIgogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MzUwMDc1KF8weDE4OWRjNiwgXzB4M2Y2YmU5KSB7CiAgICAgIHZhciBfMHg0NjQ3NzEgPSB3XzB4MjVmMywKICAgICAgICBfMHgxOTkxNDcgPQogICAgICAgICAgKF8weDQ2NDc3MSgweDM4NCkgIT0gdHlwZW9mIFN5bWJvbCAmJgogICAgICAgICAgICBfMHgxODlkYzZbU3ltYm9sW18weDQ2NDc3MSgweDNiMyldXSkgfHwKICAgICAgICAgIF8weDE4OWRjNltfMHg0NjQ3NzEoMHgxZGQpXTsKICAgICAgaWYgKCFfMHgxOTkxNDcpIHsKICAgICAgICBpZiAoCiAgICAgICAgICBBcnJheVsiaXNBcnJheSJdKF8weDE4OWRjNikgfHwKICAgICAgICAgIChfMHgxOTkxNDcgPSBfMHg1MjUzMzEoXzB4MTg5ZGM2KSkgfHwKICAgICAgICAgIChfMHgzZjZiZTkgJiYKICAgICAgICAgICAgXzB4MTg5ZGM2ICYmCiAgICAgICAgICAgIF8weDQ2NDc3MSgweDI4YikgPT0gdHlwZW9mIF8weDE4OWRjNltfMHg0NjQ3NzEoMHgyNTkpXSkKICAgICAgICApIHsKICAgICAgICAgIF8weDE5OTE0NyAmJiAoXzB4MTg5ZGM2ID0gXzB4MTk5MTQ3KTsKICAgICAgICAgIHZhciBfMHg1NDRhM2YgPSAweDFmZDIgKyAweDEgKiAtMHgxYWQ1ICsgMHg0ZmQgKiAtMHgxLAogICAgICAgICAgICBfMHg1YjIwYWUgPSBmdW5jdGlvbiAoKSB7fTsKICAgICAgICAgIHJldHVybiB7CiAgICAgICAgICAgIHM6IF8weDViMjBhZSwKICAgICAgICAgICAgbjogZnVuY3Rpb24gKCkgewogICAgICAgICAgICAgIHZhciBfMHg0YzkzZjAgPSBfMHg0NjQ3NzE7CiAgICAgICAgICAgICAgcmV0dXJuIF8weDU0NGEzZiA+PSBfMHgxODlkYzZbXzB4NGM5M2YwKDB4MjU5KV0KICAgICAgICAgICAgICAgID8gewogICAgICAgICAgICAgICAgICAgIGRvbmU6ICEoLTB4MWFhYSAqIDB4MSArIC0weDEyNmUgKiAweDEgKyAweDJkMTgpLAogICAgICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgICA6IHsKICAgICAgICAgICAgICAgICAgICBkb25lOiAhKDB4NyAqIC0weDIwNSArIDB4MWQ0NCArIC0weGYyMCksCiAgICAgICAgICAgICAgICAgICAgdmFsdWU6IF8weDE4OWRjNltfMHg1NDRhM2YrK10sCiAgICAgICAgICAgICAgICAgIH07CiAgICAgICAgICAgIH0sCiAgICAgICAgICAgIGU6IGZ1bmN0aW9uIChfMHg0ZDgzOTMpIHsKICAgICAgICAgICAgICB0aHJvdyBfMHg0ZDgzOTM7CiAgICAgICAgICAgIH0sCiAgICAgICAgICAgIGY6IF8weDViMjBhZSwKICAgICAgICAgIH07CiAgICAgICAgfQogICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4NDY0NzcxKDB4MmFlKSk7CiAgICAgIH0KICAgICAgdmFyIF8weDIzY2RkMywKICAgICAgICBfMHg1YmNmYmIgPSAhKDB4MSAqIC0weDgxMCArIC0weGIzICogMHgyZiArIDB4MSAqIDB4MjhlZCksCiAgICAgICAgXzB4NGRiNGZkID0gISgweDIyMSArIDB4NjJlICogMHg1ICsgMHgzICogLTB4YjAyKTsKICAgICAgcmV0dXJuIHsKICAgICAgICBzOiBmdW5jdGlvbiAoKSB7CiAgICAgICAgICBfMHgxOTkxNDcgPSBfMHgxOTkxNDdbImNhbGwiXShfMHgxODlkYzYpOwogICAgICAgIH0sCiAgICAgICAgbjogZnVuY3Rpb24gKCkgewogICAgICAgICAgdmFyIF8weDMwZjUwNyA9IF8weDQ2NDc3MSwKICAgICAgICAgICAgXzB4MjM4MmI2ID0gXzB4MTk5MTQ3WyJuZXh0Il0oKTsKICAgICAgICAgIHJldHVybiAoXzB4NWJjZmJiID0gXzB4MjM4MmI2W18weDMwZjUwNygweDFlMyldKSwgXzB4MjM4MmI2OwogICAgICAgIH0sCiAgICAgICAgZTogZnVuY3Rpb24gKF8weDNiMGYyNCkgewogICAgICAgICAgKF8weDRkYjRmZCA9ICEoMHgxOGUwICsgMHgyICogMHgyMTQgKyAtMHgxZDA4KSksCiAgICAgICAgICAgIChfMHgyM2NkZDMgPSBfMHgzYjBmMjQpOwogICAgICAgIH0sCiAgICAgICAgZjogZnVuY3Rpb24gKCkgewogICAgICAgICAgdmFyIF8weDIyZmRhZCA9IF8weDQ2NDc3MTsKICAgICAgICAgIHRyeSB7CiAgICAgICAgICAgIF8weDViY2ZiYiB8fAogICAgICAgICAgICAgIG51bGwgPT0gXzB4MTk5MTQ3W18weDIyZmRhZCgweDJmZCldIHx8CiAgICAgICAgICAgICAgXzB4MTk5MTQ3W18weDIyZmRhZCgweDJmZCldKCk7CiAgICAgICAgICB9IGZpbmFsbHkgewogICAgICAgICAgICBpZiAoXzB4NGRiNGZkKSB0aHJvdyBfMHgyM2NkZDM7CiAgICAgICAgICB9CiAgICAgICAgfSwKICAgICAgfTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDM3YWYzMChfMHgzN2VhOWUsIF8weDIzODhhMCkgewogICAgICB2YXIgXzB4MzcwMWRlID0gd18weDI1ZjMsCiAgICAgICAgXzB4MmFjOTQwID0KICAgICAgICAgICgidW5kZWZpbmVkIiAhPSB0eXBlb2YgU3ltYm9sICYmCiAgICAgICAgICAgIF8weDM3ZWE5ZVtTeW1ib2xbXzB4MzcwMWRlKDB4M2IzKV1dKSB8fAogICAgICAgICAgXzB4MzdlYTllWyJAQGl0ZXJhdG9yIl07CiAgICAgIGlmIChfMHgyYWM5NDApCiAgICAgICAgcmV0dXJuIChfMHgyYWM5NDAgPSBfMHgyYWM5NDBbImNhbGwiXShfMHgzN2VhOWUpKVtfMHgzNzAxZGUoMHgzODkpXVsKICAgICAgICAgIF8weDM3MDFkZSgweDMwMSkKICAgICAgICBdKF8weDJhYzk0MCk7CiAgICAgIGlmICgKICAgICAgICBBcnJheVtfMHgzNzAxZGUoMHgyYWYpXShfMHgzN2VhOWUpIHx8CiAgICAgICAgKF8weDJhYzk0MCA9IF8weDUyNTMzMShfMHgzN2VhOWUpKSB8fAogICAgICAgIChfMHgyMzg4YTAgJiYKICAgICAgICAgIF8weDM3ZWE5ZSAmJgogICAgICAgICAgIm51bWJlciIgPT0gdHlwZW9mIF8weDM3ZWE5ZVtfMHgzNzAxZGUoMHgyNTkpXSkKICAgICAgKSB7CiAgICAgICAgXzB4MmFjOTQwICYmIChfMHgzN2VhOWUgPSBfMHgyYWM5NDApOwogICAgICAgIHZhciBfMHgxZGNhYzggPSAweDFkICogLTB4MTFhICsgLTB4MWYgKiAweGM3ICsgLTB4MzgwYiAqIC0weDE7CiAgICAgICAgcmV0dXJuIGZ1bmN0aW9uICgpIHsKICAgICAgICAgIHZhciBfMHgzMDZlZDAgPSBfMHgzNzAxZGU7CiAgICAgICAgICByZXR1cm4gXzB4MWRjYWM4ID49IF8weDM3ZWE5ZVtfMHgzMDZlZDAoMHgyNTkpXQogICAgICAgICAgICA/IHsKICAgICAgICAgICAgICAgIGRvbmU6ICEoLTB4MjlkICsgMHg1ZmIgKiAtMHgxICsgMHg4OTgpLAogICAgICAgICAgICAgIH0KICAgICAgICAgICAgOiB7CiAgICAgICAgICAgICAgICBkb25lOiAhKC0weDZlICogMHg0ZiArIDB4MjMxMSArIC0weDExZSksCiAgICAgICAgICAgICAgICB2YWx1ZTogXzB4MzdlYTllW18weDFkY2FjOCsrXSwKICAgICAgICAgICAgICB9OwogICAgICAgIH07CiAgICAgIH0KICAgICAgdGhyb3cgbmV3IFR5cGVFcnJvcihfMHgzNzAxZGUoMHgyYWUpKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDUzNjJlMShfMHg0Y2Q1NWYpIHsKICAgICAgcmV0dXJuIGZ1bmN0aW9uICgpIHsKICAgICAgICB2YXIgXzB4NTg2MTdmID0gd18weDI1ZjMsCiAgICAgICAgICBfMHgxODNjMDYgPSBfMHg0Y2Q1NWZbImFwcGx5Il0odGhpcywgYXJndW1lbnRzKTsKICAgICAgICByZXR1cm4gXzB4MTgzYzA2W18weDU4NjE3ZigweDM4OSldKCksIF8weDE4M2MwNjsKICAgICAgfTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDRhZDNiMChfMHg0NjAxNDYsIF8weDMyY2YwNykgewogICAgICB2YXIgXzB4MjcxNjgzID0gd18weDI1ZjM7CiAgICAgIGlmIChfMHgyNzE2ODMoMHgxN2QpICE9IHR5cGVvZiBfMHg0NjAxNDYgfHwgbnVsbCA9PT0gXzB4NDYwMTQ2KQogICAgICAgIHJldHVybiBfMHg0NjAxNDY7CiAgICAgIHZhciBfMHhhOWZhOWMgPSBfMHg0NjAxNDZbU3ltYm9sWyJ0b1ByaW1pdGl2ZSJdXTsKICAgICAgaWYgKHZvaWQgKDB4MjFiNCArIDB4NSAqIDB4NGM3ICsgMHgzOTk3ICogLTB4MSkgIT09IF8weGE5ZmE5YykgewogICAgICAgIHZhciBfMHg1NjA4NDkgPSBfMHhhOWZhOWNbImNhbGwiXSgKICAgICAgICAgIF8weDQ2MDE0NiwKICAgICAgICAgIF8weDMyY2YwNyB8fCBfMHgyNzE2ODMoMHgxZDMpCiAgICAgICAgKTsKICAgICAgICBpZiAoIm9iamVjdCIgIT0gdHlwZW9mIF8weDU2MDg0OSkgcmV0dXJuIF8weDU2MDg0OTsKICAgICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKF8weDI3MTY4MygweDM1OCkpOwogICAgICB9CiAgICAgIHJldHVybiAoInN0cmluZyIgPT09IF8weDMyY2YwNyA/IFN0cmluZyA6IE51bWJlcikoXzB4NDYwMTQ2KTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDMyZTg4NShfMHgyMjU2NDQpIHsKICAgICAgdmFyIF8weDFlYjQ3OSA9IHdfMHgyNWYzLAogICAgICAgIF8weDQ1YzVkNCA9IF8weDRhZDNiMChfMHgyMjU2NDQsIF8weDFlYjQ3OSgweDMzYykpOwogICAgICByZXR1cm4gXzB4MWViNDc5KDB4MmVkKSA9PSB0eXBlb2YgXzB4NDVjNWQ0CiAgICAgICAgPyBfMHg0NWM1ZDQKICAgICAgICA6IFN0cmluZyhfMHg0NWM1ZDQpOwogICAgfQogICAgZnVuY3Rpb24gXzB4ZjQ3ZGMzKF8weDFkNjJhMywgXzB4ZWI4NDcwKSB7CiAgICAgIHZhciBfMHgzMTEwN2UgPSB3XzB4MjVmMzsKICAgICAgdGhyb3cgbmV3IEVycm9yKF8weDMxMTA3ZSgweDFmZikpOwogICAgfQogICAgZnVuY3Rpb24gXzB4OWQ4ZGQ1KF8weDIzOGI1OSwgXzB4MjA2YTE4LCBfMHg0Mzc4YzYsIF8weDUzMmU3MykgewogICAgICB2YXIgXzB4MzQwYjA3ID0gd18weDI1ZjM7CiAgICAgIF8weDQzNzhjNiAmJgogICAgICAgIE9iamVjdFtfMHgzNDBiMDcoMHgxNzUpXShfMHgyMzhiNTksIF8weDIwNmExOCwgewogICAgICAgICAgZW51bWVyYWJsZTogXzB4NDM3OGM2WyJlbnVtZXJhYmxlIl0sCiAgICAgICAgICBjb25maWd1cmFibGU6IF8weDQzNzhjNltfMHgzNDBiMDcoMHgyYmMpXSwKICAgICAgICAgIHdyaXRhYmxlOiBfMHg0Mzc4YzZbXzB4MzQwYjA3KDB4MmUzKV0sCiAgICAgICAgICB2YWx1ZTogXzB4NDM3OGM2W18weDM0MGIwNygweDJkMCldCiAgICAgICAgICAgID8gXzB4NDM3OGM2WyJpbml0aWFsaXplciJdW18weDM0MGIwNygweDMzNCldKF8weDUzMmU3MykKICAgICAgICAgICAgOiB2b2lkICgtMHgxYWU2ICsgLTB4MSAqIC0weGY2YiArIDB4YjdiICogMHgxKSwKICAgICAgICB9KTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDI3MTczOShfMHhiODc2YzUsIF8weDI4NTcyMCwgXzB4MzYxZGU5LCBfMHg1MmMwNzksIF8weDM4YTc2ZCkgewogICAgICB2YXIgXzB4MjZiNjFlID0gd18weDI1ZjMsCiAgICAgICAgXzB4MjVjODgzID0ge307CiAgICAgIHJldHVybiAoCiAgICAgICAgT2JqZWN0WyJrZXlzIl0oXzB4NTJjMDc5KVtfMHgyNmI2MWUoMHgyNTQpXShmdW5jdGlvbiAoXzB4ZDFhMTk4KSB7CiAgICAgICAgICBfMHgyNWM4ODNbXzB4ZDFhMTk4XSA9IF8weDUyYzA3OVtfMHhkMWExOThdOwogICAgICAgIH0pLAogICAgICAgIChfMHgyNWM4ODNbXzB4MjZiNjFlKDB4MjNhKV0gPSAhIV8weDI1Yzg4M1tfMHgyNmI2MWUoMHgyM2EpXSksCiAgICAgICAgKF8weDI1Yzg4M1tfMHgyNmI2MWUoMHgyYmMpXSA9ICEhXzB4MjVjODgzW18weDI2YjYxZSgweDJiYyldKSwKICAgICAgICAoXzB4MjZiNjFlKDB4MmU0KSBpbiBfMHgyNWM4ODMgfHwgXzB4MjVjODgzWyJpbml0aWFsaXplciJdKSAmJgogICAgICAgICAgKF8weDI1Yzg4M1tfMHgyNmI2MWUoMHgyZTMpXSA9ICEoMHgyMWU4ICsgLTB4N2NmICogLTB4NSArIC0weDQ4ZjMpKSwKICAgICAgICAoXzB4MjVjODgzID0gXzB4MzYxZGU5W18weDI2YjYxZSgweDJhNSldKCkKICAgICAgICAgIFtfMHgyNmI2MWUoMHgyZjMpXSgpCiAgICAgICAgICBbXzB4MjZiNjFlKDB4Mzc2KV0oZnVuY3Rpb24gKF8weDQ5MGM0YSwgXzB4MzYzNmY2KSB7CiAgICAgICAgICAgIHJldHVybiBfMHgzNjM2ZjYoXzB4Yjg3NmM1LCBfMHgyODU3MjAsIF8weDQ5MGM0YSkgfHwgXzB4NDkwYzRhOwogICAgICAgICAgfSwgXzB4MjVjODgzKSksCiAgICAgICAgXzB4MzhhNzZkICYmCiAgICAgICAgICB2b2lkICgweDEwNTAgKyAweDEgKiAweDEyMWYgKyAtMHgyMjZmKSAhPT0KICAgICAgICAgICAgXzB4MjVjODgzW18weDI2YjYxZSgweDJkMCldICYmCiAgICAgICAgICAoKF8weDI1Yzg4M1tfMHgyNmI2MWUoMHgyZTQpXSA9IF8weDI1Yzg4M1tfMHgyNmI2MWUoMHgyZDApXQogICAgICAgICAgICA/IF8weDI1Yzg4M1tfMHgyNmI2MWUoMHgyZDApXVtfMHgyNmI2MWUoMHgzMzQpXShfMHgzOGE3NmQpCiAgICAgICAgICAgIDogdm9pZCAoMHgxMzkyICsgLTB4YmUgKiAweDIzICsgLTB4MSAqIC0weDY2OCkpLAogICAgICAgICAgKF8weDI1Yzg4M1tfMHgyNmI2MWUoMHgyZDApXSA9IHZvaWQgKAogICAgICAgICAgICAtMHgxICogLTB4MWI5YSArCiAgICAgICAgICAgIDB4N2Y3ICsKICAgICAgICAgICAgLTB4MjM5MSAqIDB4MQogICAgICAgICAgKSkpLAogICAgICAgIHZvaWQgKDB4NTMgKiAweGIgKyAweGEyICogLTB4ZiArIDB4NWVkKSA9PT0KICAgICAgICAgIF8weDI1Yzg4M1tfMHgyNmI2MWUoMHgyZDApXSAmJgogICAgICAgICAgKE9iamVjdFtfMHgyNmI2MWUoMHgxNzUpXShfMHhiODc2YzUsIF8weDI4NTcyMCwgXzB4MjVjODgzKSwKICAgICAgICAgIChfMHgyNWM4ODMgPSBudWxsKSksCiAgICAgICAgXzB4MjVjODgzCiAgICAgICk7CiAgICB9CiAgICAoXzB4MTM3YmEyWyJwcm90b3R5cGUiXVsKICAgICAgKF8weDU2MTJkZSgweDFlZSkgPT0gdHlwZW9mIFN5bWJvbCAmJiBTeW1ib2xbXzB4NTYxMmRlKDB4MTdjKV0pIHx8CiAgICAgICAgXzB4NTYxMmRlKDB4MjMwKQogICAgXSA9IGZ1bmN0aW9uICgpIHsKICAgICAgcmV0dXJuIHRoaXM7CiAgICB9KSwKICAgICAgKF8weDEzN2JhMltfMHg1NjEyZGUoMHgzNDQpXVsibmV4dCJdID0gZnVuY3Rpb24gKF8weDQyNjJhZSkgewogICAgICAgIHZhciBfMHgxNTQzYjQgPSBfMHg1NjEyZGU7CiAgICAgICAgcmV0dXJuIHRoaXNbXzB4MTU0M2I0KDB4MWIxKV0oXzB4MTU0M2I0KDB4Mzg5KSwgXzB4NDI2MmFlKTsKICAgICAgfSksCiAgICAgIChfMHgxMzdiYTJbXzB4NTYxMmRlKDB4MzQ0KV1bInRocm93Il0gPSBmdW5jdGlvbiAoXzB4MjliYWZlKSB7CiAgICAgICAgdmFyIF8weDRjNjk1MCA9IF8weDU2MTJkZTsKICAgICAgICByZXR1cm4gdGhpc1tfMHg0YzY5NTAoMHgxYjEpXSgidGhyb3ciLCBfMHgyOWJhZmUpOwogICAgICB9KSwKICAgICAgKF8weDEzN2JhMltfMHg1NjEyZGUoMHgzNDQpXVtfMHg1NjEyZGUoMHgyZmQpXSA9IGZ1bmN0aW9uIChfMHg0OWE1M2QpIHsKICAgICAgICB2YXIgXzB4NThmNzkwID0gXzB4NTYxMmRlOwogICAgICAgIHJldHVybiB0aGlzW18weDU4Zjc5MCgweDFiMSldKF8weDU4Zjc5MCgweDJmZCksIF8weDQ5YTUzZCk7CiAgICAgIH0pOwogICAgdmFyIF8weDM3MTM2MCA9IDB4MTEgKiAtMHgyMCArIDB4ODggKiAtMHgxZiArIDB4MTI5OCwKICAgICAgXzB4NGQ2Yzc4LAogICAgICBfMHgzMTJlMTksCiAgICAgIF8weDJhMzJhMSwKICAgICAgXzB4MzcxYWMyOwogICAgZnVuY3Rpb24gXzB4MmNhMDY1KF8weDRjMmYyZCkgewogICAgICB2YXIgXzB4NDQxNWVkID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gXzB4NDQxNWVkKDB4MzY1KSArIF8weDM3MTM2MCsrICsgIl8iICsgXzB4NGMyZjJkOwogICAgfQogICAgZnVuY3Rpb24gXzB4MzNmNjQ5KF8weDU5NjExYywgXzB4YjhjNGMxKSB7CiAgICAgIHZhciBfMHgyMmY0M2YgPSBfMHg1NjEyZGU7CiAgICAgIGlmICgKICAgICAgICAhT2JqZWN0WyJwcm90b3R5cGUiXVtfMHgyMmY0M2YoMHgzYjgpXVtfMHgyMmY0M2YoMHgzMzQpXSgKICAgICAgICAgIF8weDU5NjExYywKICAgICAgICAgIF8weGI4YzRjMQogICAgICAgICkKICAgICAgKQogICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4MjJmNDNmKDB4MjcxKSk7CiAgICAgIHJldHVybiBfMHg1OTYxMWM7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0YzUzYjgoXzB4NDY3MjY0LCBfMHgxYzM5YjMpIHsKICAgICAgdmFyIF8weDEyZmI1ZSA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIF8weDFkZTBmZigKICAgICAgICBfMHg0NjcyNjQsCiAgICAgICAgXzB4M2ZlZWYzKF8weDQ2NzI2NCwgXzB4MWMzOWIzLCBfMHgxMmZiNWUoMHgzMmIpKQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4ZjAxZDU4KF8weDI0OGFkLCBfMHhkNTE0ZGQsIF8weDRmZmNiZSkgewogICAgICB2YXIgXzB4MmEwNzYzID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gKAogICAgICAgIF8weDMwNzYwZCgKICAgICAgICAgIF8weDI0OGFkLAogICAgICAgICAgXzB4M2ZlZWYzKF8weDI0OGFkLCBfMHhkNTE0ZGQsIF8weDJhMDc2MygweDFlNCkpLAogICAgICAgICAgXzB4NGZmY2JlCiAgICAgICAgKSwKICAgICAgICBfMHg0ZmZjYmUKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDNmZjQyOChfMHg1OWExMmYsIF8weDJlNmU2OCkgewogICAgICB2YXIgXzB4MWE0ZjRjID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gXzB4MWFmN2NhKAogICAgICAgIF8weDU5YTEyZiwKICAgICAgICBfMHgzZmVlZjMoXzB4NTlhMTJmLCBfMHgyZTZlNjgsIF8weDFhNGY0YygweDFlNCkpCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzZmVlZjMoXzB4NzZiY2EzLCBfMHg0OWVkMmIsIF8weGY0MDA0MikgewogICAgICB2YXIgXzB4MjZiNjVjID0gXzB4NTYxMmRlOwogICAgICBpZiAoIV8weDQ5ZWQyYltfMHgyNmI2NWMoMHgyZmMpXShfMHg3NmJjYTMpKQogICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4MjZiNjVjKDB4MmFkKSArIF8weGY0MDA0MiArIF8weDI2YjY1YygweDJiZCkpOwogICAgICByZXR1cm4gXzB4NDllZDJiW18weDI2YjY1YygweDMyYildKF8weDc2YmNhMyk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0NmYzMTgoXzB4MjM0NWFkLCBfMHgyOWU3MzIsIF8weDVkMzg3NCkgewogICAgICB2YXIgXzB4MTc4NWE3ID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gKAogICAgICAgIF8weDNmYmYyOChfMHgyMzQ1YWQsIF8weDI5ZTczMiksCiAgICAgICAgXzB4MjM0ZmY1KF8weDVkMzg3NCwgXzB4MTc4NWE3KDB4MzJiKSksCiAgICAgICAgXzB4MWRlMGZmKF8weDIzNDVhZCwgXzB4NWQzODc0KQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4M2Q0OTBhKF8weDQyMTg3NiwgXzB4NTU2ZWUxLCBfMHg0ODljY2YsIF8weDMyYzc5MikgewogICAgICByZXR1cm4gKAogICAgICAgIF8weDNmYmYyOChfMHg0MjE4NzYsIF8weDU1NmVlMSksCiAgICAgICAgXzB4MjM0ZmY1KF8weDQ4OWNjZiwgInNldCIpLAogICAgICAgIF8weDMwNzYwZChfMHg0MjE4NzYsIF8weDQ4OWNjZiwgXzB4MzJjNzkyKSwKICAgICAgICBfMHgzMmM3OTIKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDFmMjE1OShfMHgzYzEzOWUsIF8weGYxZDkzLCBfMHhhNjc1M2IpIHsKICAgICAgcmV0dXJuIF8weDNmYmYyOChfMHgzYzEzOWUsIF8weGYxZDkzKSwgXzB4YTY3NTNiOwogICAgfQogICAgZnVuY3Rpb24gXzB4MmZjYzdiKCkgewogICAgICB2YXIgXzB4NTJkYTFlID0gXzB4NTYxMmRlOwogICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKF8weDUyZGExZSgweDFiZCkpOwogICAgfQogICAgZnVuY3Rpb24gXzB4MWRlMGZmKF8weDM1ZjFjYywgXzB4MmNkNmEyKSB7CiAgICAgIHZhciBfMHgzMzExNjkgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiBfMHgyY2Q2YTJbXzB4MzMxMTY5KDB4MzJiKV0KICAgICAgICA/IF8weDJjZDZhMltfMHgzMzExNjkoMHgzMmIpXVtfMHgzMzExNjkoMHgzMzQpXShfMHgzNWYxY2MpCiAgICAgICAgOiBfMHgyY2Q2YTJbXzB4MzMxMTY5KDB4MmU0KV07CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzMDc2MGQoXzB4MjZjMTZjLCBfMHgzYmYyNTAsIF8weDRiYjUzMikgewogICAgICB2YXIgXzB4NGI1NzU4ID0gXzB4NTYxMmRlOwogICAgICBpZiAoXzB4M2JmMjUwWyJzZXQiXSkKICAgICAgICBfMHgzYmYyNTBbInNldCJdW18weDRiNTc1OCgweDMzNCldKF8weDI2YzE2YywgXzB4NGJiNTMyKTsKICAgICAgZWxzZSB7CiAgICAgICAgaWYgKCFfMHgzYmYyNTBbIndyaXRhYmxlIl0pCiAgICAgICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKAogICAgICAgICAgICAiYXR0ZW1wdGVkXHgyMHRvXHgyMHNldFx4MjByZWFkXHgyMG9ubHlceDIwcHJpdmF0ZVx4MjBmaWVsZCIKICAgICAgICAgICk7CiAgICAgICAgXzB4M2JmMjUwWyJ2YWx1ZSJdID0gXzB4NGJiNTMyOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxYWY3Y2EoXzB4Mzg1NjllLCBfMHg0ZDlkYTkpIHsKICAgICAgdmFyIF8weDg1MDRhNSA9IF8weDU2MTJkZTsKICAgICAgaWYgKF8weDRkOWRhOVtfMHg4NTA0YTUoMHgxZTQpXSkKICAgICAgICByZXR1cm4gKAogICAgICAgICAgXzB4ODUwNGE1KDB4MzZmKSBpbiBfMHg0ZDlkYTkgfHwKICAgICAgICAgICAgKF8weDRkOWRhOVsiX19kZXN0ck9iaiJdID0gewogICAgICAgICAgICAgIHNldCB2YWx1ZShfMHhhM2QyMykgewogICAgICAgICAgICAgICAgdmFyIF8weDNkOTIwYiA9IF8weDg1MDRhNTsKICAgICAgICAgICAgICAgIF8weDRkOWRhOVtfMHgzZDkyMGIoMHgxZTQpXVtfMHgzZDkyMGIoMHgzMzQpXSgKICAgICAgICAgICAgICAgICAgXzB4Mzg1NjllLAogICAgICAgICAgICAgICAgICBfMHhhM2QyMwogICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICB9LAogICAgICAgICAgICB9KSwKICAgICAgICAgIF8weDRkOWRhOVsiX19kZXN0ck9iaiJdCiAgICAgICAgKTsKICAgICAgaWYgKCFfMHg0ZDlkYTlbXzB4ODUwNGE1KDB4MmUzKV0pCiAgICAgICAgdGhyb3cgbmV3IFR5cGVFcnJvcigKICAgICAgICAgICJhdHRlbXB0ZWRceDIwdG9ceDIwc2V0XHgyMHJlYWRceDIwb25seVx4MjBwcml2YXRlXHgyMGZpZWxkIgogICAgICAgICk7CiAgICAgIHJldHVybiBfMHg0ZDlkYTk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxNTNhZDUoXzB4MzYxYTE3LCBfMHg0YmYzNDEsIF8weDM4ZWYzNCkgewogICAgICB2YXIgXzB4MzZmZWEzID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gKAogICAgICAgIF8weDNmYmYyOChfMHgzNjFhMTcsIF8weDRiZjM0MSksCiAgICAgICAgXzB4MjM0ZmY1KF8weDM4ZWYzNCwgXzB4MzZmZWEzKDB4MWU0KSksCiAgICAgICAgXzB4MWFmN2NhKF8weDM2MWExNywgXzB4MzhlZjM0KQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4M2ZiZjI4KF8weDE2MDliZiwgXzB4MzcyZGJkKSB7CiAgICAgIGlmIChfMHgxNjA5YmYgIT09IF8weDM3MmRiZCkKICAgICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKAogICAgICAgICAgIlByaXZhdGVceDIwc3RhdGljXHgyMGFjY2Vzc1x4MjBvZlx4MjB3cm9uZ1x4MjBwcm92ZW5hbmNlIgogICAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyMzRmZjUoXzB4NWRjZjQwLCBfMHhhMGUzYmUpIHsKICAgICAgdmFyIF8weDRkNTgyOCA9IF8weDU2MTJkZTsKICAgICAgaWYgKHZvaWQgKDB4OSAqIDB4M2I5ICsgLTB4NyAqIC0weDJiYiArIC0weDM4MiAqIDB4ZikgPT09IF8weDVkY2Y0MCkKICAgICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKAogICAgICAgICAgXzB4NGQ1ODI4KDB4MmFkKSArCiAgICAgICAgICAgIF8weGEwZTNiZSArCiAgICAgICAgICAgICJceDIwcHJpdmF0ZVx4MjBzdGF0aWNceDIwZmllbGRceDIwYmVmb3JlXHgyMGl0c1x4MjBkZWNsYXJhdGlvbiIKICAgICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4M2NkODkzKF8weDRkNGFjMiwgXzB4MTE3YjFhLCBfMHgxM2ViYWQsIF8weDIyNzAwMikgewogICAgICB2YXIgXzB4NDA0ZDhkID0gXzB4NTYxMmRlLAogICAgICAgIF8weDIxMjUwZSA9IF8weGRhZjhmNigpOwogICAgICBpZiAoXzB4MjI3MDAyKSB7CiAgICAgICAgZm9yICgKICAgICAgICAgIHZhciBfMHgxYWQ5NmIgPSAtMHgxICogLTB4MTA5ZCArIDB4MTU3ICsgLTB4MTFmNDsKICAgICAgICAgIF8weDFhZDk2YiA8IF8weDIyNzAwMltfMHg0MDRkOGQoMHgyNTkpXTsKICAgICAgICAgIF8weDFhZDk2YisrCiAgICAgICAgKQogICAgICAgICAgXzB4MjEyNTBlID0gXzB4MjI3MDAyW18weDFhZDk2Yl0oXzB4MjEyNTBlKTsKICAgICAgfQogICAgICB2YXIgXzB4MTc2MDk0ID0gXzB4MTE3YjFhKGZ1bmN0aW9uIChfMHgzMmJjMzIpIHsKICAgICAgICAgIHZhciBfMHgxZjk3MGYgPSBfMHg0MDRkOGQ7CiAgICAgICAgICBfMHgyMTI1MGVbXzB4MWY5NzBmKDB4MzEzKV0oXzB4MzJiYzMyLCBfMHgxZmE2MjZbXzB4MWY5NzBmKDB4MjY1KV0pOwogICAgICAgIH0sIF8weDEzZWJhZCksCiAgICAgICAgXzB4MWZhNjI2ID0gXzB4MjEyNTBlW18weDQwNGQ4ZCgweDJkZildKAogICAgICAgICAgXzB4ODcyODUyKF8weDE3NjA5NFsiZCJdW18weDQwNGQ4ZCgweDFjYildKF8weDIxMDMwOCkpLAogICAgICAgICAgXzB4NGQ0YWMyCiAgICAgICAgKTsKICAgICAgcmV0dXJuICgKICAgICAgICBfMHgyMTI1MGVbXzB4NDA0ZDhkKDB4MjE3KV0oCiAgICAgICAgICBfMHgxNzYwOTRbIkYiXSwKICAgICAgICAgIF8weDFmYTYyNltfMHg0MDRkOGQoMHgyNjUpXQogICAgICAgICksCiAgICAgICAgXzB4MjEyNTBlW18weDQwNGQ4ZCgweDE2NSldKF8weDE3NjA5NFsiRiJdLCBfMHgxZmE2MjZbXzB4NDA0ZDhkKDB4MzljKV0pCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHhkYWY4ZjYoKSB7CiAgICAgIHZhciBfMHgzZmE0MWQgPSBfMHg1NjEyZGU7CiAgICAgIF8weGRhZjhmNiA9IGZ1bmN0aW9uICgpIHsKICAgICAgICByZXR1cm4gXzB4NTEzYjBlOwogICAgICB9OwogICAgICB2YXIgXzB4NTEzYjBlID0gewogICAgICAgIGVsZW1lbnRzRGVmaW5pdGlvbk9yZGVyOiBbW18weDNmYTQxZCgweDI1YSldLCBbXzB4M2ZhNDFkKDB4MjNjKV1dLAogICAgICAgIGluaXRpYWxpemVJbnN0YW5jZUVsZW1lbnRzOiBmdW5jdGlvbiAoXzB4MTc5YWE2LCBfMHgyNWQ1Y2QpIHsKICAgICAgICAgIHZhciBfMHg1NTcwNzEgPSBfMHgzZmE0MWQ7CiAgICAgICAgICBbXzB4NTU3MDcxKDB4MjVhKSwgXzB4NTU3MDcxKDB4MjNjKV1bXzB4NTU3MDcxKDB4MjU0KV0oZnVuY3Rpb24gKAogICAgICAgICAgICBfMHgyNDc2ZTgKICAgICAgICAgICkgewogICAgICAgICAgICB2YXIgXzB4OWI1YzBiID0gXzB4NTU3MDcxOwogICAgICAgICAgICBfMHgyNWQ1Y2RbXzB4OWI1YzBiKDB4MjU0KV0oZnVuY3Rpb24gKF8weDI5OWE0YSkgewogICAgICAgICAgICAgIHZhciBfMHg1M2RhOTUgPSBfMHg5YjVjMGI7CiAgICAgICAgICAgICAgXzB4Mjk5YTRhWyJraW5kIl0gPT09IF8weDI0NzZlOCAmJgogICAgICAgICAgICAgICAgXzB4NTNkYTk1KDB4MjM1KSA9PT0gXzB4Mjk5YTRhW18weDUzZGE5NSgweDIxNSldICYmCiAgICAgICAgICAgICAgICB0aGlzW18weDUzZGE5NSgweDJlMSldKF8weDE3OWFhNiwgXzB4Mjk5YTRhKTsKICAgICAgICAgICAgfSwgdGhpcyk7CiAgICAgICAgICB9LAogICAgICAgICAgdGhpcyk7CiAgICAgICAgfSwKICAgICAgICBpbml0aWFsaXplQ2xhc3NFbGVtZW50czogZnVuY3Rpb24gKF8weDMwMGE0YywgXzB4MzgwMzFmKSB7CiAgICAgICAgICB2YXIgXzB4NDUwNTAyID0gXzB4M2ZhNDFkLAogICAgICAgICAgICBfMHg0ZTE1ODEgPSBfMHgzMDBhNGNbXzB4NDUwNTAyKDB4MzQ0KV07CiAgICAgICAgICBbXzB4NDUwNTAyKDB4MjVhKSwgXzB4NDUwNTAyKDB4MjNjKV1bImZvckVhY2giXShmdW5jdGlvbiAoXzB4MmZkZTc0KSB7CiAgICAgICAgICAgIF8weDM4MDMxZlsiZm9yRWFjaCJdKGZ1bmN0aW9uIChfMHhlNWUwODIpIHsKICAgICAgICAgICAgICB2YXIgXzB4MTIzMzQxID0gd18weDI1ZjMsCiAgICAgICAgICAgICAgICBfMHgxNzRlYzQgPSBfMHhlNWUwODJbXzB4MTIzMzQxKDB4MjE1KV07CiAgICAgICAgICAgICAgaWYgKAogICAgICAgICAgICAgICAgXzB4ZTVlMDgyW18weDEyMzM0MSgweDI2ZildID09PSBfMHgyZmRlNzQgJiYKICAgICAgICAgICAgICAgIChfMHgxMjMzNDEoMHgzOTYpID09PSBfMHgxNzRlYzQgfHwKICAgICAgICAgICAgICAgICAgXzB4MTIzMzQxKDB4MzQ0KSA9PT0gXzB4MTc0ZWM0KQogICAgICAgICAgICAgICkgewogICAgICAgICAgICAgICAgdmFyIF8weDE4NGVmMCA9CiAgICAgICAgICAgICAgICAgIF8weDEyMzM0MSgweDM5NikgPT09IF8weDE3NGVjNCA/IF8weDMwMGE0YyA6IF8weDRlMTU4MTsKICAgICAgICAgICAgICAgIHRoaXNbXzB4MTIzMzQxKDB4MmUxKV0oXzB4MTg0ZWYwLCBfMHhlNWUwODIpOwogICAgICAgICAgICAgIH0KICAgICAgICAgICAgfSwgdGhpcyk7CiAgICAgICAgICB9LCB0aGlzKTsKICAgICAgICB9LAogICAgICAgIGRlZmluZUNsYXNzRWxlbWVudDogZnVuY3Rpb24gKF8weDJlMmEyYywgXzB4NWRiODEwKSB7CiAgICAgICAgICB2YXIgXzB4NTIyMTA0ID0gXzB4M2ZhNDFkLAogICAgICAgICAgICBfMHgyZDczMjEgPSBfMHg1ZGI4MTBbImRlc2NyaXB0b3IiXTsKICAgICAgICAgIGlmIChfMHg1MjIxMDQoMHgyM2MpID09PSBfMHg1ZGI4MTBbXzB4NTIyMTA0KDB4MjZmKV0pIHsKICAgICAgICAgICAgdmFyIF8weDU1NGFlNiA9IF8weDVkYjgxMFtfMHg1MjIxMDQoMHgyZDApXTsKICAgICAgICAgICAgXzB4MmQ3MzIxID0gewogICAgICAgICAgICAgIGVudW1lcmFibGU6IF8weDJkNzMyMVtfMHg1MjIxMDQoMHgyM2EpXSwKICAgICAgICAgICAgICB3cml0YWJsZTogXzB4MmQ3MzIxW18weDUyMjEwNCgweDJlMyldLAogICAgICAgICAgICAgIGNvbmZpZ3VyYWJsZTogXzB4MmQ3MzIxW18weDUyMjEwNCgweDJiYyldLAogICAgICAgICAgICAgIHZhbHVlOgogICAgICAgICAgICAgICAgdm9pZCAoLTB4MSAqIDB4M2JkICsgMHgxZWY5ICsgLTB4MWIzYykgPT09IF8weDU1NGFlNgogICAgICAgICAgICAgICAgICA/IHZvaWQgKDB4MSAqIDB4MWFmZSArIDB4Y2QwICsgMHg3ZjYgKiAtMHg1KQogICAgICAgICAgICAgICAgICA6IF8weDU1NGFlNltfMHg1MjIxMDQoMHgzMzQpXShfMHgyZTJhMmMpLAogICAgICAgICAgICB9OwogICAgICAgICAgfQogICAgICAgICAgT2JqZWN0W18weDUyMjEwNCgweDE3NSldKF8weDJlMmEyYywgXzB4NWRiODEwWyJrZXkiXSwgXzB4MmQ3MzIxKTsKICAgICAgICB9LAogICAgICAgIGRlY29yYXRlQ2xhc3M6IGZ1bmN0aW9uIChfMHg0ZDUxMDEsIF8weDFhNzk2MSkgewogICAgICAgICAgdmFyIF8weDEyOTc2MCA9IF8weDNmYTQxZCwKICAgICAgICAgICAgXzB4MWEzMWNjID0gW10sCiAgICAgICAgICAgIF8weDNmN2U4OSA9IFtdLAogICAgICAgICAgICBfMHhmOGIwMzkgPSB7CiAgICAgICAgICAgICAgc3RhdGljOiBbXSwKICAgICAgICAgICAgICBwcm90b3R5cGU6IFtdLAogICAgICAgICAgICAgIG93bjogW10sCiAgICAgICAgICAgIH07CiAgICAgICAgICBpZiAoCiAgICAgICAgICAgIChfMHg0ZDUxMDFbXzB4MTI5NzYwKDB4MjU0KV0oZnVuY3Rpb24gKF8weDVjMGJhNSkgewogICAgICAgICAgICAgIHZhciBfMHgyN2Q2MjcgPSBfMHgxMjk3NjA7CiAgICAgICAgICAgICAgdGhpc1tfMHgyN2Q2MjcoMHgzM2QpXShfMHg1YzBiYTUsIF8weGY4YjAzOSk7CiAgICAgICAgICAgIH0sIHRoaXMpLAogICAgICAgICAgICBfMHg0ZDUxMDFbXzB4MTI5NzYwKDB4MjU0KV0oZnVuY3Rpb24gKF8weDIzOTEwMikgewogICAgICAgICAgICAgIHZhciBfMHgxNTEyNDEgPSBfMHgxMjk3NjA7CiAgICAgICAgICAgICAgaWYgKCFfMHg1MWYzYjUoXzB4MjM5MTAyKSkKICAgICAgICAgICAgICAgIHJldHVybiBfMHgxYTMxY2NbXzB4MTUxMjQxKDB4MzZlKV0oXzB4MjM5MTAyKTsKICAgICAgICAgICAgICB2YXIgXzB4NDNlYzQwID0gdGhpc1tfMHgxNTEyNDEoMHgxYWMpXShfMHgyMzkxMDIsIF8weGY4YjAzOSk7CiAgICAgICAgICAgICAgXzB4MWEzMWNjW18weDE1MTI0MSgweDM2ZSldKF8weDQzZWM0MFtfMHgxNTEyNDEoMHgyMDYpXSksCiAgICAgICAgICAgICAgICBfMHgxYTMxY2NbXzB4MTUxMjQxKDB4MzZlKV1bImFwcGx5Il0oCiAgICAgICAgICAgICAgICAgIF8weDFhMzFjYywKICAgICAgICAgICAgICAgICAgXzB4NDNlYzQwW18weDE1MTI0MSgweDNiYyldCiAgICAgICAgICAgICAgICApLAogICAgICAgICAgICAgICAgXzB4M2Y3ZTg5W18weDE1MTI0MSgweDM2ZSldWyJhcHBseSJdKAogICAgICAgICAgICAgICAgICBfMHgzZjdlODksCiAgICAgICAgICAgICAgICAgIF8weDQzZWM0MFtfMHgxNTEyNDEoMHgzOWMpXQogICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgfSwgdGhpcyksCiAgICAgICAgICAgICFfMHgxYTc5NjEpCiAgICAgICAgICApCiAgICAgICAgICAgIHJldHVybiB7CiAgICAgICAgICAgICAgZWxlbWVudHM6IF8weDFhMzFjYywKICAgICAgICAgICAgICBmaW5pc2hlcnM6IF8weDNmN2U4OSwKICAgICAgICAgICAgfTsKICAgICAgICAgIHZhciBfMHg4NTc1NDUgPSB0aGlzW18weDEyOTc2MCgweDM0YyldKF8weDFhMzFjYywgXzB4MWE3OTYxKTsKICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgIF8weDNmN2U4OVsicHVzaCJdW18weDEyOTc2MCgweDIwNyldKAogICAgICAgICAgICAgIF8weDNmN2U4OSwKICAgICAgICAgICAgICBfMHg4NTc1NDVbXzB4MTI5NzYwKDB4MzljKV0KICAgICAgICAgICAgKSwKICAgICAgICAgICAgKF8weDg1NzU0NVtfMHgxMjk3NjAoMHgzOWMpXSA9IF8weDNmN2U4OSksCiAgICAgICAgICAgIF8weDg1NzU0NQogICAgICAgICAgKTsKICAgICAgICB9LAogICAgICAgIGFkZEVsZW1lbnRQbGFjZW1lbnQ6IGZ1bmN0aW9uIChfMHg5Y2VkYjgsIF8weDRjMjE3MSwgXzB4YTZlNmM4KSB7CiAgICAgICAgICB2YXIgXzB4NWQzYWExID0gXzB4M2ZhNDFkLAogICAgICAgICAgICBfMHgzM2U1ZTAgPSBfMHg0YzIxNzFbXzB4OWNlZGI4W18weDVkM2FhMSgweDIxNSldXTsKICAgICAgICAgIGlmICgKICAgICAgICAgICAgIV8weGE2ZTZjOCAmJgogICAgICAgICAgICAtKC0weDFhODMgKyAtMHgxICogLTB4MTZlZSArIDB4OTkgKiAweDYpICE9PQogICAgICAgICAgICAgIF8weDMzZTVlMFsiaW5kZXhPZiJdKF8weDljZWRiOFsia2V5Il0pCiAgICAgICAgICApCiAgICAgICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoCiAgICAgICAgICAgICAgIkR1cGxpY2F0ZWRceDIwZWxlbWVudFx4MjAoIiArIF8weDljZWRiOFtfMHg1ZDNhYTEoMHgzOTIpXSArICIpIgogICAgICAgICAgICApOwogICAgICAgICAgXzB4MzNlNWUwW18weDVkM2FhMSgweDM2ZSldKF8weDljZWRiOFtfMHg1ZDNhYTEoMHgzOTIpXSk7CiAgICAgICAgfSwKICAgICAgICBkZWNvcmF0ZUVsZW1lbnQ6IGZ1bmN0aW9uIChfMHg0NjMyNTgsIF8weDExZDg1MikgewogICAgICAgICAgdmFyIF8weDQ5NTYwOSA9IF8weDNmYTQxZDsKICAgICAgICAgIGZvciAoCiAgICAgICAgICAgIHZhciBfMHg0YzVhYTUgPSBbXSwKICAgICAgICAgICAgICBfMHg0NmIwOTUgPSBbXSwKICAgICAgICAgICAgICBfMHgxMDYyNDMgPSBfMHg0NjMyNThbImRlY29yYXRvcnMiXSwKICAgICAgICAgICAgICBfMHgxOTVkMjUgPQogICAgICAgICAgICAgICAgXzB4MTA2MjQzW18weDQ5NTYwOSgweDI1OSldIC0KICAgICAgICAgICAgICAgICgtMHgxZDVjICogLTB4MSArIDB4MWFhOSArIDB4OTU2ICogLTB4Nik7CiAgICAgICAgICAgIF8weDE5NWQyNSA+PSAweDE4ZWUgKyAweDEgKiAweDFjMTkgKyAweGYgKiAtMHgzODk7CiAgICAgICAgICAgIF8weDE5NWQyNS0tCiAgICAgICAgICApIHsKICAgICAgICAgICAgdmFyIF8weDQyNTg5MSA9IF8weDExZDg1MltfMHg0NjMyNThbXzB4NDk1NjA5KDB4MjE1KV1dOwogICAgICAgICAgICBfMHg0MjU4OTFbXzB4NDk1NjA5KDB4MmVjKV0oCiAgICAgICAgICAgICAgXzB4NDI1ODkxW18weDQ5NTYwOSgweDJjNSldKF8weDQ2MzI1OFtfMHg0OTU2MDkoMHgzOTIpXSksCiAgICAgICAgICAgICAgMHgxICogMHhjYTcgKyAtMHhhZiAqIC0weGIgKyAtMHgxNDJiCiAgICAgICAgICAgICk7CiAgICAgICAgICAgIHZhciBfMHgzMDcyMmQgPSB0aGlzW18weDQ5NTYwOSgweDM3MildKF8weDQ2MzI1OCksCiAgICAgICAgICAgICAgXzB4MTVhMTRjID0gdGhpc1tfMHg0OTU2MDkoMHgxOGEpXSgKICAgICAgICAgICAgICAgICgweDYxICogMHgyZCArIDB4MTU0NSArIC0weDEgKiAweDI2NTIsIF8weDEwNjI0M1tfMHgxOTVkMjVdKSgKICAgICAgICAgICAgICAgICAgXzB4MzA3MjJkCiAgICAgICAgICAgICAgICApIHx8IF8weDMwNzIyZAogICAgICAgICAgICAgICk7CiAgICAgICAgICAgIChfMHg0NjMyNTggPSBfMHgxNWExNGNbImVsZW1lbnQiXSksCiAgICAgICAgICAgICAgdGhpc1siYWRkRWxlbWVudFBsYWNlbWVudCJdKF8weDQ2MzI1OCwgXzB4MTFkODUyKSwKICAgICAgICAgICAgICBfMHgxNWExNGNbXzB4NDk1NjA5KDB4MmY0KV0gJiYKICAgICAgICAgICAgICAgIF8weDQ2YjA5NVtfMHg0OTU2MDkoMHgzNmUpXShfMHgxNWExNGNbXzB4NDk1NjA5KDB4MmY0KV0pOwogICAgICAgICAgICB2YXIgXzB4OThlOWRjID0gXzB4MTVhMTRjW18weDQ5NTYwOSgweDNiYyldOwogICAgICAgICAgICBpZiAoXzB4OThlOWRjKSB7CiAgICAgICAgICAgICAgZm9yICgKICAgICAgICAgICAgICAgIHZhciBfMHg1NmRkNGQgPSAweGIgKiAweDEyZSArIC0weDFmMTcgKyAtMHgxMjFkICogLTB4MTsKICAgICAgICAgICAgICAgIF8weDU2ZGQ0ZCA8IF8weDk4ZTlkY1tfMHg0OTU2MDkoMHgyNTkpXTsKICAgICAgICAgICAgICAgIF8weDU2ZGQ0ZCsrCiAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgdGhpc1tfMHg0OTU2MDkoMHgzM2QpXShfMHg5OGU5ZGNbXzB4NTZkZDRkXSwgXzB4MTFkODUyKTsKICAgICAgICAgICAgICBfMHg0YzVhYTVbXzB4NDk1NjA5KDB4MzZlKV1bImFwcGx5Il0oXzB4NGM1YWE1LCBfMHg5OGU5ZGMpOwogICAgICAgICAgICB9CiAgICAgICAgICB9CiAgICAgICAgICByZXR1cm4gewogICAgICAgICAgICBlbGVtZW50OiBfMHg0NjMyNTgsCiAgICAgICAgICAgIGZpbmlzaGVyczogXzB4NDZiMDk1LAogICAgICAgICAgICBleHRyYXM6IF8weDRjNWFhNSwKICAgICAgICAgIH07CiAgICAgICAgfSwKICAgICAgICBkZWNvcmF0ZUNvbnN0cnVjdG9yOiBmdW5jdGlvbiAoXzB4MmE0ZDMyLCBfMHgyNjY2ZWEpIHsKICAgICAgICAgIHZhciBfMHg1ZTE1NmMgPSBfMHgzZmE0MWQ7CiAgICAgICAgICBmb3IgKAogICAgICAgICAgICB2YXIgXzB4YjJmMDEwID0gW10sCiAgICAgICAgICAgICAgXzB4MTdiMmU0ID0KICAgICAgICAgICAgICAgIF8weDI2NjZlYVtfMHg1ZTE1NmMoMHgyNTkpXSAtCiAgICAgICAgICAgICAgICAoMHgyMWMwICsgLTB4YzhlICogMHgyICsgLTB4OGEzICogMHgxKTsKICAgICAgICAgICAgXzB4MTdiMmU0ID49IC0weDFjNzAgKyAtMHgxICogLTB4MTI1NiArIC0weDFhZiAqIC0weDY7CiAgICAgICAgICAgIF8weDE3YjJlNC0tCiAgICAgICAgICApIHsKICAgICAgICAgICAgdmFyIF8weDIyMjc1OSA9IHRoaXNbXzB4NWUxNTZjKDB4MTkzKV0oXzB4MmE0ZDMyKSwKICAgICAgICAgICAgICBfMHhjNDFmNzggPSB0aGlzW18weDVlMTU2YygweDMyNCldKAogICAgICAgICAgICAgICAgKDB4MWY0NiArIDB4ODFkICogMHgyICsgLTB4NWYgKiAweDgwLCBfMHgyNjY2ZWFbXzB4MTdiMmU0XSkoCiAgICAgICAgICAgICAgICAgIF8weDIyMjc1OQogICAgICAgICAgICAgICAgKSB8fCBfMHgyMjI3NTkKICAgICAgICAgICAgICApOwogICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgKHZvaWQgKDB4MTM3MyArIDB4MmIxICogLTB4MiArIC0weDEgKiAweGUxMSkgIT09CiAgICAgICAgICAgICAgICBfMHhjNDFmNzhbXzB4NWUxNTZjKDB4MmY0KV0gJiYKICAgICAgICAgICAgICAgIF8weGIyZjAxMFtfMHg1ZTE1NmMoMHgzNmUpXShfMHhjNDFmNzhbXzB4NWUxNTZjKDB4MmY0KV0pLAogICAgICAgICAgICAgIHZvaWQgKDB4MzEgKiAtMHhiNSArIC0weDExICogMHg2NyArIDB4ODRjICogMHg1KSAhPT0KICAgICAgICAgICAgICAgIF8weGM0MWY3OFsiZWxlbWVudHMiXSkKICAgICAgICAgICAgKSB7CiAgICAgICAgICAgICAgXzB4MmE0ZDMyID0gXzB4YzQxZjc4W18weDVlMTU2YygweDI2NSldOwogICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICB2YXIgXzB4MzhjMmRhID0gLTB4MSAqIC0weGMxMiArIDB4NyAqIC0weDI4ZCArIDB4NWM5OwogICAgICAgICAgICAgICAgXzB4MzhjMmRhIDwKICAgICAgICAgICAgICAgIF8weDJhNGQzMltfMHg1ZTE1NmMoMHgyNTkpXSAtCiAgICAgICAgICAgICAgICAgICgweDU5ZiAqIDB4NiArIC0weDEgKiAtMHgxYzZkICsgMHgyNSAqIC0weDFhZSk7CiAgICAgICAgICAgICAgICBfMHgzOGMyZGErKwogICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICAgIHZhciBfMHgyOTUwZWQgPQogICAgICAgICAgICAgICAgICAgIF8weDM4YzJkYSArICgweDFiOTEgKiAweDEgKyAtMHhiYzAgKyAtMHg4ICogMHgxZmEpOwogICAgICAgICAgICAgICAgICBfMHgyOTUwZWQgPCBfMHgyYTRkMzJbImxlbmd0aCJdOwogICAgICAgICAgICAgICAgICBfMHgyOTUwZWQrKwogICAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgICAgICAgXzB4MmE0ZDMyW18weDM4YzJkYV1bXzB4NWUxNTZjKDB4MzkyKV0gPT09CiAgICAgICAgICAgICAgICAgICAgICBfMHgyYTRkMzJbXzB4Mjk1MGVkXVtfMHg1ZTE1NmMoMHgzOTIpXSAmJgogICAgICAgICAgICAgICAgICAgIF8weDJhNGQzMltfMHgzOGMyZGFdW18weDVlMTU2YygweDIxNSldID09PQogICAgICAgICAgICAgICAgICAgICAgXzB4MmE0ZDMyW18weDI5NTBlZF1bXzB4NWUxNTZjKDB4MjE1KV0KICAgICAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoCiAgICAgICAgICAgICAgICAgICAgICBfMHg1ZTE1NmMoMHgzNjcpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MmE0ZDMyW18weDM4YzJkYV1bXzB4NWUxNTZjKDB4MzkyKV0gKwogICAgICAgICAgICAgICAgICAgICAgICAiKSIKICAgICAgICAgICAgICAgICAgICApOwogICAgICAgICAgICB9CiAgICAgICAgICB9CiAgICAgICAgICByZXR1cm4gewogICAgICAgICAgICBlbGVtZW50czogXzB4MmE0ZDMyLAogICAgICAgICAgICBmaW5pc2hlcnM6IF8weGIyZjAxMCwKICAgICAgICAgIH07CiAgICAgICAgfSwKICAgICAgICBmcm9tRWxlbWVudERlc2NyaXB0b3I6IGZ1bmN0aW9uIChfMHg0YTQzYzgpIHsKICAgICAgICAgIHZhciBfMHgzMDIxNTIgPSBfMHgzZmE0MWQsCiAgICAgICAgICAgIF8weDQwNmQ2YiA9IHsKICAgICAgICAgICAgICBraW5kOiBfMHg0YTQzYzhbXzB4MzAyMTUyKDB4MjZmKV0sCiAgICAgICAgICAgICAga2V5OiBfMHg0YTQzYzhbImtleSJdLAogICAgICAgICAgICAgIHBsYWNlbWVudDogXzB4NGE0M2M4WyJwbGFjZW1lbnQiXSwKICAgICAgICAgICAgICBkZXNjcmlwdG9yOiBfMHg0YTQzYzhbXzB4MzAyMTUyKDB4MjBmKV0sCiAgICAgICAgICAgIH07CiAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICBPYmplY3RbXzB4MzAyMTUyKDB4MTc1KV0oXzB4NDA2ZDZiLCBTeW1ib2xbXzB4MzAyMTUyKDB4MWMwKV0sIHsKICAgICAgICAgICAgICB2YWx1ZTogXzB4MzAyMTUyKDB4MWU4KSwKICAgICAgICAgICAgICBjb25maWd1cmFibGU6ICEoLTB4MWIzYSArIDB4MjFiYiAqIDB4MSArIC0weDE0ZCAqIDB4NSksCiAgICAgICAgICAgIH0pLAogICAgICAgICAgICBfMHgzMDIxNTIoMHgyM2MpID09PSBfMHg0YTQzYzhbImtpbmQiXSAmJgogICAgICAgICAgICAgIChfMHg0MDZkNmJbXzB4MzAyMTUyKDB4MmQwKV0gPSBfMHg0YTQzYzhbImluaXRpYWxpemVyIl0pLAogICAgICAgICAgICBfMHg0MDZkNmIKICAgICAgICAgICk7CiAgICAgICAgfSwKICAgICAgICB0b0VsZW1lbnREZXNjcmlwdG9yczogZnVuY3Rpb24gKF8weDE0YmU2NikgewogICAgICAgICAgaWYgKHZvaWQgKDB4MWY0OCArIC0weDE5ZmUgKyAweDJhNSAqIC0weDIpICE9PSBfMHgxNGJlNjYpCiAgICAgICAgICAgIHJldHVybiBfMHg1Yzg4NShfMHgxNGJlNjYpWyJtYXAiXShmdW5jdGlvbiAoXzB4MTcwYzIwKSB7CiAgICAgICAgICAgICAgdmFyIF8weDUyODVlZSA9IHdfMHgyNWYzLAogICAgICAgICAgICAgICAgXzB4ZjBjN2NlID0gdGhpc1tfMHg1Mjg1ZWUoMHgyNWUpXShfMHgxNzBjMjApOwogICAgICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgICAgICB0aGlzWyJkaXNhbGxvd1Byb3BlcnR5Il0oCiAgICAgICAgICAgICAgICAgIF8weDE3MGMyMCwKICAgICAgICAgICAgICAgICAgXzB4NTI4NWVlKDB4MmY0KSwKICAgICAgICAgICAgICAgICAgXzB4NTI4NWVlKDB4MjFmKQogICAgICAgICAgICAgICAgKSwKICAgICAgICAgICAgICAgIHRoaXNbXzB4NTI4NWVlKDB4MjFhKV0oCiAgICAgICAgICAgICAgICAgIF8weDE3MGMyMCwKICAgICAgICAgICAgICAgICAgXzB4NTI4NWVlKDB4M2JjKSwKICAgICAgICAgICAgICAgICAgXzB4NTI4NWVlKDB4MjFmKQogICAgICAgICAgICAgICAgKSwKICAgICAgICAgICAgICAgIF8weGYwYzdjZQogICAgICAgICAgICAgICk7CiAgICAgICAgICAgIH0sIHRoaXMpOwogICAgICAgIH0sCiAgICAgICAgdG9FbGVtZW50RGVzY3JpcHRvcjogZnVuY3Rpb24gKF8weDRjOGE2MCkgewogICAgICAgICAgdmFyIF8weDFmYzRkNyA9IF8weDNmYTQxZCwKICAgICAgICAgICAgXzB4MzNjZmI2ID0gU3RyaW5nKF8weDRjOGE2MFtfMHgxZmM0ZDcoMHgyNmYpXSk7CiAgICAgICAgICBpZiAoXzB4MWZjNGQ3KDB4MjVhKSAhPT0gXzB4MzNjZmI2ICYmIF8weDFmYzRkNygweDIzYykgIT09IF8weDMzY2ZiNikKICAgICAgICAgICAgdGhyb3cgbmV3IFR5cGVFcnJvcigKICAgICAgICAgICAgICAiQW5ceDIwZWxlbWVudFx4MjBkZXNjcmlwdG9yXHgyN3NceDIwLmtpbmRceDIwcHJvcGVydHlceDIwbXVzdFx4MjBiZVx4MjBlaXRoZXJceDIwXHgyMm1ldGhvZFx4MjJceDIwb3JceDIwXHgyMmZpZWxkXHgyMixceDIwYnV0XHgyMGFceDIwZGVjb3JhdG9yXHgyMGNyZWF0ZWRceDIwYW5ceDIwZWxlbWVudFx4MjBkZXNjcmlwdG9yXHgyMHdpdGhceDIwLmtpbmRceDIwXHgyMiIgKwogICAgICAgICAgICAgICAgXzB4MzNjZmI2ICsKICAgICAgICAgICAgICAgICJceDIyIgogICAgICAgICAgICApOwogICAgICAgICAgdmFyIF8weGViYjc2OCA9IF8weDMyZTg4NShfMHg0YzhhNjBbXzB4MWZjNGQ3KDB4MzkyKV0pLAogICAgICAgICAgICBfMHg1MmFiNjMgPSBTdHJpbmcoXzB4NGM4YTYwW18weDFmYzRkNygweDIxNSldKTsKICAgICAgICAgIGlmICgKICAgICAgICAgICAgXzB4MWZjNGQ3KDB4Mzk2KSAhPT0gXzB4NTJhYjYzICYmCiAgICAgICAgICAgIF8weDFmYzRkNygweDM0NCkgIT09IF8weDUyYWI2MyAmJgogICAgICAgICAgICBfMHgxZmM0ZDcoMHgyMzUpICE9PSBfMHg1MmFiNjMKICAgICAgICAgICkKICAgICAgICAgICAgdGhyb3cgbmV3IFR5cGVFcnJvcihfMHgxZmM0ZDcoMHgyYjUpICsgXzB4NTJhYjYzICsgIlx4MjIiKTsKICAgICAgICAgIHZhciBfMHgzM2VlNDYgPSBfMHg0YzhhNjBbXzB4MWZjNGQ3KDB4MjBmKV07CiAgICAgICAgICB0aGlzW18weDFmYzRkNygweDIxYSldKF8weDRjOGE2MCwgImVsZW1lbnRzIiwgXzB4MWZjNGQ3KDB4MjFmKSk7CiAgICAgICAgICB2YXIgXzB4MWNhMTYxID0gewogICAgICAgICAgICBraW5kOiBfMHgzM2NmYjYsCiAgICAgICAgICAgIGtleTogXzB4ZWJiNzY4LAogICAgICAgICAgICBwbGFjZW1lbnQ6IF8weDUyYWI2MywKICAgICAgICAgICAgZGVzY3JpcHRvcjogT2JqZWN0W18weDFmYzRkNygweDJhMCldKHt9LCBfMHgzM2VlNDYpLAogICAgICAgICAgfTsKICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgIF8weDFmYzRkNygweDIzYykgIT09IF8weDMzY2ZiNgogICAgICAgICAgICAgID8gdGhpc1tfMHgxZmM0ZDcoMHgyMWEpXSgKICAgICAgICAgICAgICAgICAgXzB4NGM4YTYwLAogICAgICAgICAgICAgICAgICBfMHgxZmM0ZDcoMHgyZDApLAogICAgICAgICAgICAgICAgICBfMHgxZmM0ZDcoMHgyOGQpCiAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgOiAodGhpc1siZGlzYWxsb3dQcm9wZXJ0eSJdKAogICAgICAgICAgICAgICAgICBfMHgzM2VlNDYsCiAgICAgICAgICAgICAgICAgIF8weDFmYzRkNygweDMyYiksCiAgICAgICAgICAgICAgICAgIF8weDFmYzRkNygweDI3NykKICAgICAgICAgICAgICAgICksCiAgICAgICAgICAgICAgICB0aGlzWyJkaXNhbGxvd1Byb3BlcnR5Il0oXzB4MzNlZTQ2LCAic2V0IiwgXzB4MWZjNGQ3KDB4Mjc3KSksCiAgICAgICAgICAgICAgICB0aGlzWyJkaXNhbGxvd1Byb3BlcnR5Il0oCiAgICAgICAgICAgICAgICAgIF8weDMzZWU0NiwKICAgICAgICAgICAgICAgICAgXzB4MWZjNGQ3KDB4MmU0KSwKICAgICAgICAgICAgICAgICAgXzB4MWZjNGQ3KDB4Mjc3KQogICAgICAgICAgICAgICAgKSwKICAgICAgICAgICAgICAgIChfMHgxY2ExNjFbImluaXRpYWxpemVyIl0gPSBfMHg0YzhhNjBbXzB4MWZjNGQ3KDB4MmQwKV0pKSwKICAgICAgICAgICAgXzB4MWNhMTYxCiAgICAgICAgICApOwogICAgICAgIH0sCiAgICAgICAgdG9FbGVtZW50RmluaXNoZXJFeHRyYXM6IGZ1bmN0aW9uIChfMHg1M2I4NDApIHsKICAgICAgICAgIHZhciBfMHgxMTU3YzAgPSBfMHgzZmE0MWQ7CiAgICAgICAgICByZXR1cm4gewogICAgICAgICAgICBlbGVtZW50OiB0aGlzW18weDExNTdjMCgweDI1ZSldKF8weDUzYjg0MCksCiAgICAgICAgICAgIGZpbmlzaGVyOiBfMHgyMmRmN2IoXzB4NTNiODQwLCBfMHgxMTU3YzAoMHgyZjQpKSwKICAgICAgICAgICAgZXh0cmFzOiB0aGlzW18weDExNTdjMCgweDM3MCldKF8weDUzYjg0MFsiZXh0cmFzIl0pLAogICAgICAgICAgfTsKICAgICAgICB9LAogICAgICAgIGZyb21DbGFzc0Rlc2NyaXB0b3I6IGZ1bmN0aW9uIChfMHgzMGMzMDgpIHsKICAgICAgICAgIHZhciBfMHg0ODJiMDQgPSBfMHgzZmE0MWQsCiAgICAgICAgICAgIF8weGYyMzFjMSA9IHsKICAgICAgICAgICAgICBraW5kOiBfMHg0ODJiMDQoMHgxOWMpLAogICAgICAgICAgICAgIGVsZW1lbnRzOiBfMHgzMGMzMDhbIm1hcCJdKHRoaXNbXzB4NDgyYjA0KDB4MzcyKV0sIHRoaXMpLAogICAgICAgICAgICB9OwogICAgICAgICAgcmV0dXJuICgKICAgICAgICAgICAgT2JqZWN0W18weDQ4MmIwNCgweDE3NSldKF8weGYyMzFjMSwgU3ltYm9sW18weDQ4MmIwNCgweDFjMCldLCB7CiAgICAgICAgICAgICAgdmFsdWU6IF8weDQ4MmIwNCgweDFlOCksCiAgICAgICAgICAgICAgY29uZmlndXJhYmxlOiAhKDB4ZiAqIC0weGYxICsgMHgxICogLTB4Y2ZlICsgLTB4MWIxZCAqIC0weDEpLAogICAgICAgICAgICB9KSwKICAgICAgICAgICAgXzB4ZjIzMWMxCiAgICAgICAgICApOwogICAgICAgIH0sCiAgICAgICAgdG9DbGFzc0Rlc2NyaXB0b3I6IGZ1bmN0aW9uIChfMHgxNzhjYTApIHsKICAgICAgICAgIHZhciBfMHgyNTIwYTEgPSBfMHgzZmE0MWQsCiAgICAgICAgICAgIF8weDc5ZjMzNiA9IFN0cmluZyhfMHgxNzhjYTBbXzB4MjUyMGExKDB4MjZmKV0pOwogICAgICAgICAgaWYgKCJjbGFzcyIgIT09IF8weDc5ZjMzNikKICAgICAgICAgICAgdGhyb3cgbmV3IFR5cGVFcnJvcigKICAgICAgICAgICAgICAiQVx4MjBjbGFzc1x4MjBkZXNjcmlwdG9yXHgyN3NceDIwLmtpbmRceDIwcHJvcGVydHlceDIwbXVzdFx4MjBiZVx4MjBceDIyY2xhc3NceDIyLFx4MjBidXRceDIwYVx4MjBkZWNvcmF0b3JceDIwY3JlYXRlZFx4MjBhXHgyMGNsYXNzXHgyMGRlc2NyaXB0b3JceDIwd2l0aFx4MjAua2luZFx4MjBceDIyIiArCiAgICAgICAgICAgICAgICBfMHg3OWYzMzYgKwogICAgICAgICAgICAgICAgIlx4MjIiCiAgICAgICAgICAgICk7CiAgICAgICAgICB0aGlzWyJkaXNhbGxvd1Byb3BlcnR5Il0oCiAgICAgICAgICAgIF8weDE3OGNhMCwKICAgICAgICAgICAgXzB4MjUyMGExKDB4MzkyKSwKICAgICAgICAgICAgIkFceDIwY2xhc3NceDIwZGVzY3JpcHRvciIKICAgICAgICAgICksCiAgICAgICAgICAgIHRoaXNbXzB4MjUyMGExKDB4MjFhKV0oCiAgICAgICAgICAgICAgXzB4MTc4Y2EwLAogICAgICAgICAgICAgIF8weDI1MjBhMSgweDIxNSksCiAgICAgICAgICAgICAgIkFceDIwY2xhc3NceDIwZGVzY3JpcHRvciIKICAgICAgICAgICAgKSwKICAgICAgICAgICAgdGhpc1tfMHgyNTIwYTEoMHgyMWEpXSgKICAgICAgICAgICAgICBfMHgxNzhjYTAsCiAgICAgICAgICAgICAgXzB4MjUyMGExKDB4MjBmKSwKICAgICAgICAgICAgICBfMHgyNTIwYTEoMHgxYTEpCiAgICAgICAgICAgICksCiAgICAgICAgICAgIHRoaXNbImRpc2FsbG93UHJvcGVydHkiXSgKICAgICAgICAgICAgICBfMHgxNzhjYTAsCiAgICAgICAgICAgICAgImluaXRpYWxpemVyIiwKICAgICAgICAgICAgICBfMHgyNTIwYTEoMHgxYTEpCiAgICAgICAgICAgICksCiAgICAgICAgICAgIHRoaXNbXzB4MjUyMGExKDB4MjFhKV0oCiAgICAgICAgICAgICAgXzB4MTc4Y2EwLAogICAgICAgICAgICAgIF8weDI1MjBhMSgweDNiYyksCiAgICAgICAgICAgICAgIkFceDIwY2xhc3NceDIwZGVzY3JpcHRvciIKICAgICAgICAgICAgKTsKICAgICAgICAgIHZhciBfMHgxNTRlMzIgPSBfMHgyMmRmN2IoXzB4MTc4Y2EwLCBfMHgyNTIwYTEoMHgyZjQpKTsKICAgICAgICAgIHJldHVybiB7CiAgICAgICAgICAgIGVsZW1lbnRzOiB0aGlzWyJ0b0VsZW1lbnREZXNjcmlwdG9ycyJdKF8weDE3OGNhMFsiZWxlbWVudHMiXSksCiAgICAgICAgICAgIGZpbmlzaGVyOiBfMHgxNTRlMzIsCiAgICAgICAgICB9OwogICAgICAgIH0sCiAgICAgICAgcnVuQ2xhc3NGaW5pc2hlcnM6IGZ1bmN0aW9uIChfMHg1ODQwMWMsIF8weDNmZjQ4OSkgewogICAgICAgICAgdmFyIF8weDRhOGRlMSA9IF8weDNmYTQxZDsKICAgICAgICAgIGZvciAoCiAgICAgICAgICAgIHZhciBfMHg1ZWM3NjYgPSAweDEzYjAgKyAtMHhlMDUgKyAweDEgKiAtMHg1YWI7CiAgICAgICAgICAgIF8weDVlYzc2NiA8IF8weDNmZjQ4OVtfMHg0YThkZTEoMHgyNTkpXTsKICAgICAgICAgICAgXzB4NWVjNzY2KysKICAgICAgICAgICkgewogICAgICAgICAgICB2YXIgXzB4MTc2ZmQyID0gKDB4N2QgKiAtMHgyNSArIDB4MTAxICogMHgxNCArIDB4NSAqIC0weDY3LAogICAgICAgICAgICBfMHgzZmY0ODlbXzB4NWVjNzY2XSkoXzB4NTg0MDFjKTsKICAgICAgICAgICAgaWYgKHZvaWQgKC0weDEgKiAweDIwMCArIDB4MWM0YSArIC0weDFhNGEpICE9PSBfMHgxNzZmZDIpIHsKICAgICAgICAgICAgICBpZiAoXzB4NGE4ZGUxKDB4MWVlKSAhPSB0eXBlb2YgXzB4MTc2ZmQyKQogICAgICAgICAgICAgICAgdGhyb3cgbmV3IFR5cGVFcnJvcigKICAgICAgICAgICAgICAgICAgIkZpbmlzaGVyc1x4MjBtdXN0XHgyMHJldHVyblx4MjBhXHgyMGNvbnN0cnVjdG9yLiIKICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgICAgXzB4NTg0MDFjID0gXzB4MTc2ZmQyOwogICAgICAgICAgICB9CiAgICAgICAgICB9CiAgICAgICAgICByZXR1cm4gXzB4NTg0MDFjOwogICAgICAgIH0sCiAgICAgICAgZGlzYWxsb3dQcm9wZXJ0eTogZnVuY3Rpb24gKF8weDM3NjQ5MiwgXzB4MTk5OGRmLCBfMHg0NmNkYTQpIHsKICAgICAgICAgIHZhciBfMHg1YjI0YjYgPSBfMHgzZmE0MWQ7CiAgICAgICAgICBpZiAodm9pZCAoMHgyMjM5ICsgLTB4YTY3ICsgLTB4MTdkMikgIT09IF8weDM3NjQ5MltfMHgxOTk4ZGZdKQogICAgICAgICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKAogICAgICAgICAgICAgIF8weDQ2Y2RhNCArIF8weDViMjRiNigweDIzMikgKyBfMHgxOTk4ZGYgKyBfMHg1YjI0YjYoMHgyYTEpCiAgICAgICAgICAgICk7CiAgICAgICAgfSwKICAgICAgfTsKICAgICAgcmV0dXJuIF8weDUxM2IwZTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDIxMDMwOChfMHg1YmFlMCkgewogICAgICB2YXIgXzB4NTA5MjY4ID0gXzB4NTYxMmRlLAogICAgICAgIF8weDIwNjFmNiwKICAgICAgICBfMHgxZGFhOTYgPSBfMHgzMmU4ODUoXzB4NWJhZTBbImtleSJdKTsKICAgICAgXzB4NTA5MjY4KDB4MjVhKSA9PT0gXzB4NWJhZTBbXzB4NTA5MjY4KDB4MjZmKV0KICAgICAgICA/IChfMHgyMDYxZjYgPSB7CiAgICAgICAgICAgIHZhbHVlOiBfMHg1YmFlMFtfMHg1MDkyNjgoMHgyZTQpXSwKICAgICAgICAgICAgd3JpdGFibGU6ICEoLTB4Mjg2ICsgLTB4MyAqIC0weDgzYiArIC0weDE2MmIpLAogICAgICAgICAgICBjb25maWd1cmFibGU6ICEoLTB4MSAqIC0weDEzZjkgKyAtMHgyICogLTB4MTEyNyArIC0weDM2NDcpLAogICAgICAgICAgICBlbnVtZXJhYmxlOiAhKC0weDIxMCAqIC0weDEgKyAweGY0MyAqIC0weDIgKyAweDFjNzcpLAogICAgICAgICAgfSkKICAgICAgICA6IF8weDUwOTI2OCgweDMyYikgPT09IF8weDViYWUwW18weDUwOTI2OCgweDI2ZildCiAgICAgICAgPyAoXzB4MjA2MWY2ID0gewogICAgICAgICAgICBnZXQ6IF8weDViYWUwWyJ2YWx1ZSJdLAogICAgICAgICAgICBjb25maWd1cmFibGU6ICEoLTB4NCAqIC0weDg3ICsgMHgyNWI2ICsgLTB4MTNlOSAqIDB4MiksCiAgICAgICAgICAgIGVudW1lcmFibGU6ICEoMHg0ICogLTB4MTA1ICsgLTB4OCAqIDB4M2IgKyAweDVlZCAqIDB4MSksCiAgICAgICAgICB9KQogICAgICAgIDogInNldCIgPT09IF8weDViYWUwW18weDUwOTI2OCgweDI2ZildCiAgICAgICAgPyAoXzB4MjA2MWY2ID0gewogICAgICAgICAgICBzZXQ6IF8weDViYWUwW18weDUwOTI2OCgweDJlNCldLAogICAgICAgICAgICBjb25maWd1cmFibGU6ICEoLTB4MSAqIC0weGQ3YyArIDB4MjRlMiArIC0weDMyNWUpLAogICAgICAgICAgICBlbnVtZXJhYmxlOiAhKDB4MjQ2YiAqIC0weDEgKyAtMHhiZGMgKyAweDY3ICogMHg3OCksCiAgICAgICAgICB9KQogICAgICAgIDogXzB4NTA5MjY4KDB4MjNjKSA9PT0gXzB4NWJhZTBbImtpbmQiXSAmJgogICAgICAgICAgKF8weDIwNjFmNiA9IHsKICAgICAgICAgICAgY29uZmlndXJhYmxlOiAhKC0weDcgKiAweDdjICsgMHgwICsgLTB4MSAqIC0weDM2NCksCiAgICAgICAgICAgIHdyaXRhYmxlOiAhKDB4MTBjYyArIDB4OTNhICsgLTB4MWEwNiksCiAgICAgICAgICAgIGVudW1lcmFibGU6ICEoLTB4MzM5ICsgLTB4ZmQxICogLTB4MSArIC0weGM5OCksCiAgICAgICAgICB9KTsKICAgICAgdmFyIF8weDEyYjkxMSA9IHsKICAgICAgICBraW5kOgogICAgICAgICAgXzB4NTA5MjY4KDB4MjNjKSA9PT0gXzB4NWJhZTBbXzB4NTA5MjY4KDB4MjZmKV0KICAgICAgICAgICAgPyBfMHg1MDkyNjgoMHgyM2MpCiAgICAgICAgICAgIDogIm1ldGhvZCIsCiAgICAgICAga2V5OiBfMHgxZGFhOTYsCiAgICAgICAgcGxhY2VtZW50OiBfMHg1YmFlMFtfMHg1MDkyNjgoMHgzOTYpXQogICAgICAgICAgPyBfMHg1MDkyNjgoMHgzOTYpCiAgICAgICAgICA6ICJmaWVsZCIgPT09IF8weDViYWUwW18weDUwOTI2OCgweDI2ZildCiAgICAgICAgICA/ICJvd24iCiAgICAgICAgICA6IF8weDUwOTI2OCgweDM0NCksCiAgICAgICAgZGVzY3JpcHRvcjogXzB4MjA2MWY2LAogICAgICB9OwogICAgICByZXR1cm4gKAogICAgICAgIF8weDViYWUwWyJkZWNvcmF0b3JzIl0gJiYKICAgICAgICAgIChfMHgxMmI5MTFbXzB4NTA5MjY4KDB4MWI3KV0gPSBfMHg1YmFlMFtfMHg1MDkyNjgoMHgxYjcpXSksCiAgICAgICAgXzB4NTA5MjY4KDB4MjNjKSA9PT0gXzB4NWJhZTBbImtpbmQiXSAmJgogICAgICAgICAgKF8weDEyYjkxMVsiaW5pdGlhbGl6ZXIiXSA9IF8weDViYWUwW18weDUwOTI2OCgweDJlNCldKSwKICAgICAgICBfMHgxMmI5MTEKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDNiMmM1ZChfMHgxZDJjZDcsIF8weDUwNDNiZikgewogICAgICB2YXIgXzB4NmFmODhmID0gXzB4NTYxMmRlOwogICAgICB2b2lkICgtMHgxYzFlICsgLTB4MTkgKiAtMHhkOSArIC0weDEgKiAtMHg2ZWQpICE9PQogICAgICBfMHgxZDJjZDdbXzB4NmFmODhmKDB4MjBmKV1bXzB4NmFmODhmKDB4MzJiKV0KICAgICAgICA/IChfMHg1MDQzYmZbImRlc2NyaXB0b3IiXVtfMHg2YWY4OGYoMHgzMmIpXSA9CiAgICAgICAgICAgIF8weDFkMmNkN1siZGVzY3JpcHRvciJdW18weDZhZjg4ZigweDMyYildKQogICAgICAgIDogKF8weDUwNDNiZlsiZGVzY3JpcHRvciJdWyJzZXQiXSA9CiAgICAgICAgICAgIF8weDFkMmNkN1tfMHg2YWY4OGYoMHgyMGYpXVtfMHg2YWY4OGYoMHgxZTQpXSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg4NzI4NTIoXzB4MTFmZDdiKSB7CiAgICAgIHZhciBfMHg0NWI3MGUgPSBfMHg1NjEyZGU7CiAgICAgIGZvciAoCiAgICAgICAgdmFyIF8weDNkMDk0NyA9IFtdLAogICAgICAgICAgXzB4MWUyMGViID0gZnVuY3Rpb24gKF8weDNjMTg2MikgewogICAgICAgICAgICB2YXIgXzB4NTYyMTBkID0gd18weDI1ZjM7CiAgICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgICAgXzB4NTYyMTBkKDB4MjVhKSA9PT0gXzB4M2MxODYyW18weDU2MjEwZCgweDI2ZildICYmCiAgICAgICAgICAgICAgXzB4M2MxODYyW18weDU2MjEwZCgweDM5MildID09PSBfMHg0NDUwMmVbImtleSJdICYmCiAgICAgICAgICAgICAgXzB4M2MxODYyW18weDU2MjEwZCgweDIxNSldID09PSBfMHg0NDUwMmVbXzB4NTYyMTBkKDB4MjE1KV0KICAgICAgICAgICAgKTsKICAgICAgICAgIH0sCiAgICAgICAgICBfMHgyNzczYWUgPSAtMHhkZDcgKyAweDUgKiAweDNmNiArIDB4NWY3ICogLTB4MTsKICAgICAgICBfMHgyNzczYWUgPCBfMHgxMWZkN2JbXzB4NDViNzBlKDB4MjU5KV07CiAgICAgICAgXzB4Mjc3M2FlKysKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDE1MjU3MSwKICAgICAgICAgIF8weDQ0NTAyZSA9IF8weDExZmQ3YltfMHgyNzczYWVdOwogICAgICAgIGlmICgKICAgICAgICAgIF8weDQ1YjcwZSgweDI1YSkgPT09IF8weDQ0NTAyZVtfMHg0NWI3MGUoMHgyNmYpXSAmJgogICAgICAgICAgKF8weDE1MjU3MSA9IF8weDNkMDk0N1siZmluZCJdKF8weDFlMjBlYikpCiAgICAgICAgKSB7CiAgICAgICAgICBpZiAoCiAgICAgICAgICAgIF8weDNmOTI0NChfMHg0NDUwMmVbXzB4NDViNzBlKDB4MjBmKV0pIHx8CiAgICAgICAgICAgIF8weDNmOTI0NChfMHgxNTI1NzFbXzB4NDViNzBlKDB4MjBmKV0pCiAgICAgICAgICApIHsKICAgICAgICAgICAgaWYgKF8weDUxZjNiNShfMHg0NDUwMmUpIHx8IF8weDUxZjNiNShfMHgxNTI1NzEpKQogICAgICAgICAgICAgIHRocm93IG5ldyBSZWZlcmVuY2VFcnJvcigKICAgICAgICAgICAgICAgICJEdXBsaWNhdGVkXHgyMG1ldGhvZHNceDIwKCIgKwogICAgICAgICAgICAgICAgICBfMHg0NDUwMmVbXzB4NDViNzBlKDB4MzkyKV0gKwogICAgICAgICAgICAgICAgICBfMHg0NWI3MGUoMHgyMGIpCiAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgXzB4MTUyNTcxW18weDQ1YjcwZSgweDIwZildID0gXzB4NDQ1MDJlW18weDQ1YjcwZSgweDIwZildOwogICAgICAgICAgfSBlbHNlIHsKICAgICAgICAgICAgaWYgKF8weDUxZjNiNShfMHg0NDUwMmUpKSB7CiAgICAgICAgICAgICAgaWYgKF8weDUxZjNiNShfMHgxNTI1NzEpKQogICAgICAgICAgICAgICAgdGhyb3cgbmV3IFJlZmVyZW5jZUVycm9yKAogICAgICAgICAgICAgICAgICAiRGVjb3JhdG9yc1x4MjBjYW5ceDI3dFx4MjBiZVx4MjBwbGFjZWRceDIwb25ceDIwZGlmZmVyZW50XHgyMGFjY2Vzc29yc1x4MjB3aXRoXHgyMGZvclx4MjB0aGVceDIwc2FtZVx4MjBwcm9wZXJ0eVx4MjAoIiArCiAgICAgICAgICAgICAgICAgICAgXzB4NDQ1MDJlWyJrZXkiXSArCiAgICAgICAgICAgICAgICAgICAgIikuIgogICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICBfMHgxNTI1NzFbXzB4NDViNzBlKDB4MWI3KV0gPSBfMHg0NDUwMmVbXzB4NDViNzBlKDB4MWI3KV07CiAgICAgICAgICAgIH0KICAgICAgICAgICAgXzB4M2IyYzVkKF8weDQ0NTAyZSwgXzB4MTUyNTcxKTsKICAgICAgICAgIH0KICAgICAgICB9IGVsc2UgXzB4M2QwOTQ3W18weDQ1YjcwZSgweDM2ZSldKF8weDQ0NTAyZSk7CiAgICAgIH0KICAgICAgcmV0dXJuIF8weDNkMDk0NzsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDUxZjNiNShfMHgzYjc3NTMpIHsKICAgICAgdmFyIF8weDQ2ZDIyNSA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIF8weDNiNzc1M1tfMHg0NmQyMjUoMHgxYjcpXSAmJiBfMHgzYjc3NTNbImRlY29yYXRvcnMiXVsibGVuZ3RoIl07CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzZjkyNDQoXzB4MTk3MzgyKSB7CiAgICAgIHZhciBfMHgxZWM0MWUgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiAoCiAgICAgICAgdm9pZCAoMHhhOCArIDB4MTJhICogLTB4NCArIDB4NDAwKSAhPT0gXzB4MTk3MzgyICYmCiAgICAgICAgISgKICAgICAgICAgIHZvaWQgKC0weDIgKiAtMHg5NTUgKyAtMHg5NjUgKyAtMHg5NDUpID09PQogICAgICAgICAgICBfMHgxOTczODJbXzB4MWVjNDFlKDB4MmU0KV0gJiYKICAgICAgICAgIHZvaWQgKC0weDQwMyArIDB4ZCAqIDB4MWUyICsgLTB4MTQ3NykgPT09IF8weDE5NzM4MltfMHgxZWM0MWUoMHgyZTMpXQogICAgICAgICkKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDIyZGY3YihfMHgxYTllMGIsIF8weDRjM2FhNikgewogICAgICB2YXIgXzB4MjAwNGE2ID0gXzB4NTYxMmRlLAogICAgICAgIF8weDQyZDdlMSA9IF8weDFhOWUwYltfMHg0YzNhYTZdOwogICAgICBpZiAoCiAgICAgICAgdm9pZCAoLTB4MWFiICogLTB4MTEgKyAtMHgyMTY0ICsgMHgxICogMHg1MDkpICE9PSBfMHg0MmQ3ZTEgJiYKICAgICAgICBfMHgyMDA0YTYoMHgxZWUpICE9IHR5cGVvZiBfMHg0MmQ3ZTEKICAgICAgKQogICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoIkV4cGVjdGVkXHgyMFx4MjciICsgXzB4NGMzYWE2ICsgXzB4MjAwNGE2KDB4MjAwKSk7CiAgICAgIHJldHVybiBfMHg0MmQ3ZTE7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0NGE3NzkoXzB4MjkwYmQ5LCBfMHgzYzQxODQsIF8weDM1NmMwNCkgewogICAgICB2YXIgXzB4NWUxZDBiID0gXzB4NTYxMmRlOwogICAgICBpZiAoIV8weDNjNDE4NFtfMHg1ZTFkMGIoMHgyZmMpXShfMHgyOTBiZDkpKQogICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoXzB4NWUxZDBiKDB4MTg3KSk7CiAgICAgIHJldHVybiBfMHgzNTZjMDQ7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyMjdjZDkoXzB4NDRhYWI2LCBfMHg0Nzc5MmIpIHsKICAgICAgdmFyIF8weDUwZTZlOCA9IF8weDU2MTJkZTsKICAgICAgaWYgKF8weDQ3NzkyYltfMHg1MGU2ZTgoMHgyZmMpXShfMHg0NGFhYjYpKQogICAgICAgIHRocm93IG5ldyBUeXBlRXJyb3IoCiAgICAgICAgICAiQ2Fubm90XHgyMGluaXRpYWxpemVceDIwdGhlXHgyMHNhbWVceDIwcHJpdmF0ZVx4MjBlbGVtZW50c1x4MjB0d2ljZVx4MjBvblx4MjBhblx4MjBvYmplY3QiCiAgICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDQxZDJlYihfMHgyZDU0ZGUsIF8weDMwYjQyYiwgXzB4M2NjMjEwKSB7CiAgICAgIF8weDIyN2NkOShfMHgyZDU0ZGUsIF8weDMwYjQyYiksIF8weDMwYjQyYlsic2V0Il0oXzB4MmQ1NGRlLCBfMHgzY2MyMTApOwogICAgfQogICAgZnVuY3Rpb24gXzB4NGZkMDRhKF8weDFiMzZiMywgXzB4MWE2NTU5KSB7CiAgICAgIHZhciBfMHgxYWFhYzYgPSBfMHg1NjEyZGU7CiAgICAgIF8weDIyN2NkOShfMHgxYjM2YjMsIF8weDFhNjU1OSksIF8weDFhNjU1OVtfMHgxYWFhYzYoMHgzMzIpXShfMHgxYjM2YjMpOwogICAgfQogICAgZnVuY3Rpb24gXzB4NGZiMzEzKCkgewogICAgICB0aHJvdyBuZXcgVHlwZUVycm9yKCJhdHRlbXB0ZWRceDIwdG9ceDIwcmVhc3NpZ25ceDIwcHJpdmF0ZVx4MjBtZXRob2QiKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDRlNGY2NihfMHg5Zjc5OTApIHsKICAgICAgcmV0dXJuIF8weDlmNzk5MDsKICAgIH0KICAgIF8weDU2MTJkZSgweDFlZSkgIT0gdHlwZW9mIE9iamVjdFtfMHg1NjEyZGUoMHgyYTApXSAmJgogICAgICBPYmplY3RbImRlZmluZVByb3BlcnR5Il0oT2JqZWN0LCBfMHg1NjEyZGUoMHgyYTApLCB7CiAgICAgICAgdmFsdWU6IGZ1bmN0aW9uIChfMHg0NzhmYTIsIF8weDI3Mzc1NikgewogICAgICAgICAgdmFyIF8weDJiODY3NiA9IF8weDU2MTJkZTsKICAgICAgICAgIGlmIChudWxsID09IF8weDQ3OGZhMikgdGhyb3cgbmV3IFR5cGVFcnJvcihfMHgyYjg2NzYoMHgyY2YpKTsKICAgICAgICAgIGZvciAoCiAgICAgICAgICAgIHZhciBfMHg0NTFjZmIgPSBPYmplY3QoXzB4NDc4ZmEyKSwKICAgICAgICAgICAgICBfMHg1YzUwNzkgPSAtMHhiNWQgKyAtMHgxNWYwICsgMHgyMTRlOwogICAgICAgICAgICBfMHg1YzUwNzkgPCBhcmd1bWVudHNbXzB4MmI4Njc2KDB4MjU5KV07CiAgICAgICAgICAgIF8weDVjNTA3OSsrCiAgICAgICAgICApIHsKICAgICAgICAgICAgdmFyIF8weDMwNTlhNCA9IGFyZ3VtZW50c1tfMHg1YzUwNzldOwogICAgICAgICAgICBpZiAobnVsbCAhPSBfMHgzMDU5YTQpIHsKICAgICAgICAgICAgICBmb3IgKHZhciBfMHgzZWRlOTAgaW4gXzB4MzA1OWE0KQogICAgICAgICAgICAgICAgT2JqZWN0W18weDJiODY3NigweDM0NCldW18weDJiODY3NigweDNiOCldW18weDJiODY3NigweDMzNCldKAogICAgICAgICAgICAgICAgICBfMHgzMDU5YTQsCiAgICAgICAgICAgICAgICAgIF8weDNlZGU5MAogICAgICAgICAgICAgICAgKSAmJiAoXzB4NDUxY2ZiW18weDNlZGU5MF0gPSBfMHgzMDU5YTRbXzB4M2VkZTkwXSk7CiAgICAgICAgICAgIH0KICAgICAgICAgIH0KICAgICAgICAgIHJldHVybiBfMHg0NTFjZmI7CiAgICAgICAgfSwKICAgICAgICB3cml0YWJsZTogISgweDNkICogLTB4NDMgKyAweDIzNjggKyAtMHgxMzcxKSwKICAgICAgICBjb25maWd1cmFibGU6ICEoMHgxMmEgKyAtMHgxNjkyICsgMHgxNTY4KSwKICAgICAgfSksCiAgICAgIE9iamVjdFtfMHg1NjEyZGUoMHgxN2YpXSB8fAogICAgICAgIChPYmplY3RbImtleXMiXSA9CiAgICAgICAgICAoKF8weDRkNmM3OCA9IE9iamVjdFtfMHg1NjEyZGUoMHgzNDQpXVtfMHg1NjEyZGUoMHgzYjgpXSksCiAgICAgICAgICAoXzB4MzEyZTE5ID0gIXsKICAgICAgICAgICAgdG9TdHJpbmc6IG51bGwsCiAgICAgICAgICB9W18weDU2MTJkZSgweDFkYSldKCJ0b1N0cmluZyIpKSwKICAgICAgICAgIChfMHgyYTMyYTEgPSBbCiAgICAgICAgICAgIF8weDU2MTJkZSgweDNhZSksCiAgICAgICAgICAgIF8weDU2MTJkZSgweDJjOCksCiAgICAgICAgICAgIF8weDU2MTJkZSgweDMwMyksCiAgICAgICAgICAgIF8weDU2MTJkZSgweDNiOCksCiAgICAgICAgICAgICJpc1Byb3RvdHlwZU9mIiwKICAgICAgICAgICAgXzB4NTYxMmRlKDB4MWRhKSwKICAgICAgICAgICAgImNvbnN0cnVjdG9yIiwKICAgICAgICAgIF0pLAogICAgICAgICAgKF8weDM3MWFjMiA9IF8weDJhMzJhMVtfMHg1NjEyZGUoMHgyNTkpXSksCiAgICAgICAgICBmdW5jdGlvbiAoXzB4NDU3YTE5KSB7CiAgICAgICAgICAgIHZhciBfMHgyZDMxNTIgPSBfMHg1NjEyZGU7CiAgICAgICAgICAgIGlmICgKICAgICAgICAgICAgICBfMHgyZDMxNTIoMHgxZWUpICE9IHR5cGVvZiBfMHg0NTdhMTkgJiYKICAgICAgICAgICAgICAoXzB4MmQzMTUyKDB4MTdkKSAhPT0gXzB4MWRiMTIzKF8weDQ1N2ExOSkgfHwgbnVsbCA9PT0gXzB4NDU3YTE5KQogICAgICAgICAgICApCiAgICAgICAgICAgICAgdGhyb3cgbmV3IFR5cGVFcnJvcihfMHgyZDMxNTIoMHgzNzQpKTsKICAgICAgICAgICAgdmFyIF8weDExYWVmMCwKICAgICAgICAgICAgICBfMHgyOTEzMWUsCiAgICAgICAgICAgICAgXzB4NGMyYTYzID0gW107CiAgICAgICAgICAgIGZvciAoXzB4MTFhZWYwIGluIF8weDQ1N2ExOSkKICAgICAgICAgICAgICBfMHg0ZDZjNzhbXzB4MmQzMTUyKDB4MzM0KV0oXzB4NDU3YTE5LCBfMHgxMWFlZjApICYmCiAgICAgICAgICAgICAgICBfMHg0YzJhNjNbXzB4MmQzMTUyKDB4MzZlKV0oXzB4MTFhZWYwKTsKICAgICAgICAgICAgaWYgKF8weDMxMmUxOSkgewogICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICBfMHgyOTEzMWUgPSAtMHgyNDA2ICsgLTB4MTIwOSArIDB4MSAqIDB4MzYwZjsKICAgICAgICAgICAgICAgIF8weDI5MTMxZSA8IF8weDM3MWFjMjsKICAgICAgICAgICAgICAgIF8weDI5MTMxZSsrCiAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgXzB4NGQ2Yzc4WyJjYWxsIl0oXzB4NDU3YTE5LCBfMHgyYTMyYTFbXzB4MjkxMzFlXSkgJiYKICAgICAgICAgICAgICAgICAgXzB4NGMyYTYzW18weDJkMzE1MigweDM2ZSldKF8weDJhMzJhMVtfMHgyOTEzMWVdKTsKICAgICAgICAgICAgfQogICAgICAgICAgICByZXR1cm4gXzB4NGMyYTYzOwogICAgICAgICAgfSkpOwogICAgdmFyIF8weDQ1Yjk0YiA9IHsKICAgICAgX192ZXJzaW9uX186IF8weDU2MTJkZSgweDE2NyksCiAgICAgIGZlVmVyc2lvbjogMHgyLAogICAgICBkb21Ob3RWYWxpZDogISgtMHgxZTI3ICsgLTB4M2ZhICogLTB4MiArIDB4MTYzNCksCiAgICAgIHJlZmVyZXJLZXk6IF8weDU2MTJkZSgweDMxOCksCiAgICAgIHB1c2hWZXJzaW9uOiBfMHg1NjEyZGUoMHgyY2EpLAogICAgICBzZWNJbmZvSGVhZGVyOiBfMHg1NjEyZGUoMHgyNDgpLAogICAgfTsKICAgIGZ1bmN0aW9uIF8weDU5ODk3MihfMHgyMTViNDUsIF8weDJkNzMyOSkgewogICAgICB2YXIgXzB4NDAxNTk1ID0gXzB4NTYxMmRlOwogICAgICBpZiAoXzB4NDAxNTk1KDB4MzNjKSA9PSB0eXBlb2YgXzB4MmQ3MzI5KQogICAgICAgIGZvciAoCiAgICAgICAgICB2YXIgXzB4NWQ5MmQ5LAogICAgICAgICAgICBfMHgxMTJmZTQgPSBfMHgyMTViNDUgKyAiPSIsCiAgICAgICAgICAgIF8weDI4YWVlZCA9IF8weDJkNzMyOVtfMHg0MDE1OTUoMHgzNDIpXSgvWzsmXS8pLAogICAgICAgICAgICBfMHgyNjMwN2YgPSAweDExICogLTB4OTcgKyAweDEyNiAqIC0weGQgKyAtMHgxICogLTB4MThmNTsKICAgICAgICAgIF8weDI2MzA3ZiA8IF8weDI4YWVlZFtfMHg0MDE1OTUoMHgyNTkpXTsKICAgICAgICAgIF8weDI2MzA3ZisrCiAgICAgICAgKSB7CiAgICAgICAgICBmb3IgKAogICAgICAgICAgICBfMHg1ZDkyZDkgPSBfMHgyOGFlZWRbXzB4MjYzMDdmXTsKICAgICAgICAgICAgIlx4MjAiID09PSBfMHg1ZDkyZDlbImNoYXJBdCJdKDB4MTU4OSArIDB4NWU0ICsgMHg3ICogLTB4M2ViKTsKCiAgICAgICAgICApCiAgICAgICAgICAgIF8weDVkOTJkOSA9IF8weDVkOTJkOVtfMHg0MDE1OTUoMHgxYjApXSgKICAgICAgICAgICAgICAtMHgxNmQ5ICsgLTB4MSAqIDB4OTljICsgMHgyICogMHgxMDNiLAogICAgICAgICAgICAgIF8weDVkOTJkOVsibGVuZ3RoIl0KICAgICAgICAgICAgKTsKICAgICAgICAgIGlmICgKICAgICAgICAgICAgMHgxNWNkICsgLTB4MTIzNSArIDB4MSAqIC0weDM5OCA9PT0KICAgICAgICAgICAgXzB4NWQ5MmQ5W18weDQwMTU5NSgweDJjNSldKF8weDExMmZlNCkKICAgICAgICAgICkKICAgICAgICAgICAgcmV0dXJuIF8weDVkOTJkOVtfMHg0MDE1OTUoMHgxYjApXSgKICAgICAgICAgICAgICBfMHgxMTJmZTRbXzB4NDAxNTk1KDB4MjU5KV0sCiAgICAgICAgICAgICAgXzB4NWQ5MmQ5W18weDQwMTU5NSgweDI1OSldCiAgICAgICAgICAgICk7CiAgICAgICAgfQogICAgfQogICAgZnVuY3Rpb24gXzB4MjRkYzM0KF8weDNlOTZiYikgewogICAgICB2YXIgXzB4MjJjYzNiID0gXzB4NTYxMmRlOwogICAgICB0cnkgewogICAgICAgIHZhciBfMHhkYWNhZDQgPSAiIjsKICAgICAgICByZXR1cm4gKHdpbmRvd1sic2Vzc2lvblN0b3JhZ2UiXSAmJgogICAgICAgICAgKF8weGRhY2FkNCA9CiAgICAgICAgICAgIHdpbmRvd1sic2Vzc2lvblN0b3JhZ2UiXVtfMHgyMmNjM2IoMHgyZDgpXShfMHgzZTk2YmIpKSkgfHwKICAgICAgICAgICh3aW5kb3dbXzB4MjJjYzNiKDB4MWRjKV0gJiYKICAgICAgICAgICAgKF8weGRhY2FkNCA9IHdpbmRvd1tfMHgyMmNjM2IoMHgxZGMpXVtfMHgyMmNjM2IoMHgyZDgpXShfMHgzZTk2YmIpKSkKICAgICAgICAgID8gXzB4ZGFjYWQ0CiAgICAgICAgICA6IChfMHhkYWNhZDQgPSBfMHg1OTg5NzIoXzB4M2U5NmJiLCBkb2N1bWVudFsiY29va2llIl0pKTsKICAgICAgfSBjYXRjaCAoXzB4MTk1YzFkKSB7CiAgICAgICAgcmV0dXJuICIiOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxZjQyY2IoXzB4MjQ3ZWU2LCBfMHgyODUwMWIpIHsKICAgICAgdmFyIF8weGZlZDQ4NiA9IF8weDU2MTJkZTsKICAgICAgdHJ5IHsKICAgICAgICB3aW5kb3dbXzB4ZmVkNDg2KDB4M2JlKV0gJiYKICAgICAgICAgIHdpbmRvd1sic2Vzc2lvblN0b3JhZ2UiXVsic2V0SXRlbSJdKF8weDI0N2VlNiwgXzB4Mjg1MDFiKSwKICAgICAgICAgIHdpbmRvd1tfMHhmZWQ0ODYoMHgxZGMpXSAmJgogICAgICAgICAgICB3aW5kb3dbXzB4ZmVkNDg2KDB4MWRjKV1bXzB4ZmVkNDg2KDB4MWM0KV0oXzB4MjQ3ZWU2LCBfMHgyODUwMWIpLAogICAgICAgICAgKChkb2N1bWVudFtfMHhmZWQ0ODYoMHgyNzIpXSA9IF8weDI0N2VlNiArIF8weGZlZDQ4NigweDM1ZSkpLAogICAgICAgICAgKGRvY3VtZW50W18weGZlZDQ4NigweDI3MildID0KICAgICAgICAgICAgXzB4MjQ3ZWU2ICsKICAgICAgICAgICAgIj0iICsKICAgICAgICAgICAgXzB4Mjg1MDFiICsKICAgICAgICAgICAgXzB4ZmVkNDg2KDB4MWMxKSArCiAgICAgICAgICAgIG5ldyBEYXRlKAogICAgICAgICAgICAgIG5ldyBEYXRlKClbImdldFRpbWUiXSgpICsKICAgICAgICAgICAgICAgICgweDEwICogMHg3OTIzMTcgKyAweDM3ODcwNDc4ICsgLTB4MiAqIDB4ZDg2NThmNCkKICAgICAgICAgICAgKVtfMHhmZWQ0ODYoMHgxNWUpXSgpICsKICAgICAgICAgICAgXzB4ZmVkNDg2KDB4M2MxKSkpOwogICAgICB9IGNhdGNoIChfMHgyYmQ4MjIpIHt9CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyZWNjNWEoXzB4NTg5M2U0KSB7CiAgICAgIHZhciBfMHgzYTBkN2YgPSBfMHg1NjEyZGU7CiAgICAgIHRyeSB7CiAgICAgICAgd2luZG93W18weDNhMGQ3ZigweDNiZSldICYmCiAgICAgICAgICB3aW5kb3dbInNlc3Npb25TdG9yYWdlIl1bInJlbW92ZUl0ZW0iXShfMHg1ODkzZTQpLAogICAgICAgICAgd2luZG93W18weDNhMGQ3ZigweDFkYyldICYmCiAgICAgICAgICAgIHdpbmRvd1tfMHgzYTBkN2YoMHgxZGMpXVtfMHgzYTBkN2YoMHgyYzMpXShfMHg1ODkzZTQpLAogICAgICAgICAgKGRvY3VtZW50W18weDNhMGQ3ZigweDI3MildID0gXzB4NTg5M2U0ICsgXzB4M2EwZDdmKDB4MzVlKSk7CiAgICAgIH0gY2F0Y2ggKF8weDJmNWI3MCkge30KICAgIH0KICAgIGZvciAoCiAgICAgIHZhciBfMHg0NjIzMzUgPSB7CiAgICAgICAgICBib2U6ICEoMHgxZTBkICsgLTB4MTA5MyAqIDB4MSArIC0weGQ3OSksCiAgICAgICAgICBhaWQ6IDB4MCwKICAgICAgICAgIGRmcDogISgtMHgxICogMHg3MDMgKyAweDEwMjUgKyAweDI5ICogLTB4MzkpLAogICAgICAgICAgc2RpOiAhKDB4NDkgKiAtMHg3NyArIC0weDZkYSAqIDB4MiArIC0weDQgKiAtMHhiZTkpLAogICAgICAgICAgZW5hYmxlUGF0aExpc3Q6IFtdLAogICAgICAgICAgX2VuYWJsZVBhdGhMaXN0UmVnZXg6IFtdLAogICAgICAgICAgdXJsUmV3cml0ZVJ1bGVzOiBbXSwKICAgICAgICAgIF91cmxSZXdyaXRlUnVsZXM6IFtdLAogICAgICAgICAgaW5pdGlhbGl6ZWQ6ICEoLTB4MzEgKiAweDNkICsgMHg5ZGYgKyAweDFjZiksCiAgICAgICAgICBlbmFibGVUcmFjazogISgweDg5ICogLTB4MWEgKyAtMHgyMWNhICsgMHgyZmI1KSwKICAgICAgICAgIHRyYWNrOiB7CiAgICAgICAgICAgIHVuaXRUaW1lOiAweDAsCiAgICAgICAgICAgIHVuaXRBbW91bnQ6IDB4MCwKICAgICAgICAgICAgZnJlOiAweDAsCiAgICAgICAgICB9LAogICAgICAgICAgdHJpZ2dlclVubG9hZDogISgtMHgzZTUgKiAtMHg1ICsgLTB4MjNjYiArIDB4MyAqIDB4NTcxKSwKICAgICAgICAgIHJlZ2lvbjogIiIsCiAgICAgICAgICByZWdpb25Db25mOiB7fSwKICAgICAgICAgIHVtb2RlOiAweDAsCiAgICAgICAgICB2OiAhKC0weDExNTUgKyAtMHgyNWQ0ICsgLTB4MSAqIC0weDM3MmEpLAogICAgICAgICAgX2VuYWJsZVNpZ25hdHVyZTogW10sCiAgICAgICAgICBwZXJmOiAhKDB4MSAqIC0weDFjMmUgKyAweGVmOCArIC0weGM3ICogLTB4MTEpLAogICAgICAgICAgeHhiZzogISgtMHhmNzUgKyAweDMgKiAweDRlNSArIDB4MTIgKiAweGIpLAogICAgICAgIH0sCiAgICAgICAgXzB4M2Q0MGZmID0gewogICAgICAgICAgZGVidWc6IGZ1bmN0aW9uIChfMHgyY2YxNTEsIF8weDRhY2ZiMSkgewogICAgICAgICAgICB2YXIgXzB4MWI2NjM5ID0gXzB4NTYxMmRlOwogICAgICAgICAgICBfMHg0NjIzMzVbXzB4MWI2NjM5KDB4MWI2KV07CiAgICAgICAgICB9LAogICAgICAgIH0sCiAgICAgICAgXzB4MTAwNzE1ID0gXzB4NTYxMmRlKDB4MmQ3KVtfMHg1NjEyZGUoMHgzNDIpXSgiIiksCiAgICAgICAgXzB4MWY1MTBlID0gW10sCiAgICAgICAgXzB4Mzc3NTBkID0gW10sCiAgICAgICAgXzB4MWNiMzA3ID0gLTB4ZTU1ICsgMHgxYzM3ICsgMHgyICogLTB4NmYxOwogICAgICBfMHgxY2IzMDcgPCAweDI0MWIgKyAweDEwICogLTB4ZTYgKyAtMHgxICogMHgxNGJiOwogICAgICBfMHgxY2IzMDcrKwogICAgKQogICAgICAoXzB4MWY1MTBlW18weDFjYjMwN10gPQogICAgICAgIF8weDEwMDcxNVsKICAgICAgICAgIChfMHgxY2IzMDcgPj4gKDB4ZDAzICsgLTB4MjY5YSArIDB4MSAqIDB4MTk5YikpICYKICAgICAgICAgICAgKDB4YTY0ICogMHgzICsgLTB4ZjdiICsgLTB4ZmEyKQogICAgICAgIF0gKyBfMHgxMDA3MTVbKDB4MmJiICsgLTB4MyAqIDB4OTJkICsgMHgxOGRiKSAmIF8weDFjYjMwN10pLAogICAgICAgIF8weDFjYjMwNyA8IC0weDEgKiAtMHg4MiArIDB4MzQgKiAtMHgzYiArIC0weDIgKiAtMHg1YzUgJiYKICAgICAgICAgIChfMHgxY2IzMDcgPCAweDEwZjEgKiAweDEgKyAweDg2YSAqIDB4NCArIC0weDMyOGYKICAgICAgICAgICAgPyAoXzB4Mzc3NTBkWy0weDIwMjkgKyAtMHgxZWYxICsgLTB4M2Y0YSAqIC0weDEgKyBfMHgxY2IzMDddID0KICAgICAgICAgICAgICAgIF8weDFjYjMwNykKICAgICAgICAgICAgOiAoXzB4Mzc3NTBkWy0weDI0ODUgKyAweDFkICogMHg2ZCArIDB4MTg4MyArIF8weDFjYjMwN10gPQogICAgICAgICAgICAgICAgXzB4MWNiMzA3KSk7CiAgICB2YXIgXzB4NTVkZTE4ID0gZnVuY3Rpb24gKF8weDMzYTI3NykgewogICAgICAgIHZhciBfMHg1MTU1YmEgPSBfMHg1NjEyZGU7CiAgICAgICAgZm9yICgKICAgICAgICAgIHZhciBfMHg5ZWIyYTEgPSBfMHgzM2EyNzdbXzB4NTE1NWJhKDB4MjU5KV0sCiAgICAgICAgICAgIF8weDFlZGZkZSA9ICIiLAogICAgICAgICAgICBfMHgyYTY5YzQgPSAtMHgxYzM5ICsgMHg1NjkgKyAweDE2ZDA7CiAgICAgICAgICBfMHgyYTY5YzQgPCBfMHg5ZWIyYTE7CgogICAgICAgICkKICAgICAgICAgIF8weDFlZGZkZSArPSBfMHgxZjUxMGVbXzB4MzNhMjc3W18weDJhNjljNCsrXV07CiAgICAgICAgcmV0dXJuIF8weDFlZGZkZTsKICAgICAgfSwKICAgICAgXzB4NjU1OTQwID0gZnVuY3Rpb24gKF8weDE3NzQ1NikgewogICAgICAgIGZvciAoCiAgICAgICAgICB2YXIgXzB4MWZmYjljID0KICAgICAgICAgICAgICBfMHgxNzc0NTZbImxlbmd0aCJdID4+ICgweDEgKiAweDEwNGIgKyAweDEwYjEgKyAtMHgyMGZiKSwKICAgICAgICAgICAgXzB4MzU2M2VmID0KICAgICAgICAgICAgICBfMHgxZmZiOWMgPDwgKC0weDEgKiAtMHgyNjMgKyAtMHg3NyAqIC0weDIxICsgMHhkICogLTB4MTVkKSwKICAgICAgICAgICAgXzB4MjI1MjBjID0gbmV3IFVpbnQ4QXJyYXkoXzB4MWZmYjljKSwKICAgICAgICAgICAgXzB4MzI1NTMgPSAweDM0NSAqIDB4OSArIC0weDFlOWEgKyAtMHgxICogLTB4MTJkLAogICAgICAgICAgICBfMHgxMWI4NDcgPSAweDEgKiAweDYyMyArIC0weDIzOWYgKiAtMHgxICsgLTB4MjljMjsKICAgICAgICAgIF8weDExYjg0NyA8IF8weDM1NjNlZjsKCiAgICAgICAgKQogICAgICAgICAgXzB4MjI1MjBjW18weDMyNTUzKytdID0KICAgICAgICAgICAgKF8weDM3NzUwZFtfMHgxNzc0NTZbImNoYXJDb2RlQXQiXShfMHgxMWI4NDcrKyldIDw8CiAgICAgICAgICAgICAgKC0weDE1NTEgKyAtMHhiNWEgKyAweDIwYWYgKiAweDEpKSB8CiAgICAgICAgICAgIF8weDM3NzUwZFtfMHgxNzc0NTZbImNoYXJDb2RlQXQiXShfMHgxMWI4NDcrKyldOwogICAgICAgIHJldHVybiBfMHgyMjUyMGM7CiAgICAgIH0sCiAgICAgIF8weDQyZTcwOSA9IHsKICAgICAgICBlbmNvZGU6IF8weDU1ZGUxOCwKICAgICAgICBkZWNvZGU6IF8weDY1NTk0MCwKICAgICAgfSwKICAgICAgXzB4MWU3NzIxID0KICAgICAgICBfMHg1NjEyZGUoMHgzODQpICE9IHR5cGVvZiBnbG9iYWxUaGlzCiAgICAgICAgICA/IGdsb2JhbFRoaXMKICAgICAgICAgIDogXzB4NTYxMmRlKDB4Mzg0KSAhPSB0eXBlb2Ygd2luZG93CiAgICAgICAgICA/IHdpbmRvdwogICAgICAgICAgOiBfMHg1NjEyZGUoMHgzODQpICE9IHR5cGVvZiBnbG9iYWwKICAgICAgICAgID8gZ2xvYmFsCiAgICAgICAgICA6ICJ1bmRlZmluZWQiICE9IHR5cGVvZiBzZWxmCiAgICAgICAgICA/IHNlbGYKICAgICAgICAgIDoge307CiAgICBmdW5jdGlvbiBfMHgzYmM4ZDMoXzB4MTQ1NjVkKSB7CiAgICAgIHZhciBfMHg0NDJlMTQgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiBfMHgxNDU2NWQgJiYKICAgICAgICBfMHgxNDU2NWRbXzB4NDQyZTE0KDB4M2JkKV0gJiYKICAgICAgICBPYmplY3RbXzB4NDQyZTE0KDB4MzQ0KV1bXzB4NDQyZTE0KDB4M2I4KV1bXzB4NDQyZTE0KDB4MzM0KV0oCiAgICAgICAgICBfMHgxNDU2NWQsCiAgICAgICAgICBfMHg0NDJlMTQoMHgxZDMpCiAgICAgICAgKQogICAgICAgID8gXzB4MTQ1NjVkW18weDQ0MmUxNCgweDFkMyldCiAgICAgICAgOiBfMHgxNDU2NWQ7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzYWJjMGIoXzB4MWNhN2JkKSB7CiAgICAgIHZhciBfMHgyOTI4NDUgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiBfMHgxY2E3YmQgJiYKICAgICAgICBPYmplY3RbXzB4MjkyODQ1KDB4MzQ0KV1bImhhc093blByb3BlcnR5Il1bXzB4MjkyODQ1KDB4MzM0KV0oCiAgICAgICAgICBfMHgxY2E3YmQsCiAgICAgICAgICBfMHgyOTI4NDUoMHgxZDMpCiAgICAgICAgKQogICAgICAgID8gXzB4MWNhN2JkW18weDI5Mjg0NSgweDFkMyldCiAgICAgICAgOiBfMHgxY2E3YmQ7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0MWFjZTEoXzB4MmI3NDU1KSB7CiAgICAgIHZhciBfMHgzOTQ3MGQgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiBfMHgyYjc0NTUgJiYKICAgICAgICBPYmplY3RbXzB4Mzk0NzBkKDB4MzQ0KV1bXzB4Mzk0NzBkKDB4M2I4KV1bImNhbGwiXSgKICAgICAgICAgIF8weDJiNzQ1NSwKICAgICAgICAgIF8weDM5NDcwZCgweDFkMykKICAgICAgICApICYmCiAgICAgICAgMHgxNTUgKyAweDE2ZjggKyAtMHgxODRjID09PQogICAgICAgICAgT2JqZWN0W18weDM5NDcwZCgweDE3ZildKF8weDJiNzQ1NSlbXzB4Mzk0NzBkKDB4MjU5KV0KICAgICAgICA/IF8weDJiNzQ1NVtfMHgzOTQ3MGQoMHgxZDMpXQogICAgICAgIDogXzB4MmI3NDU1OwogICAgfQogICAgZnVuY3Rpb24gXzB4M2U5NTU0KF8weDIyNzk3ZSkgewogICAgICB2YXIgXzB4MWZhOTdmID0gXzB4NTYxMmRlOwogICAgICBpZiAoXzB4MjI3OTdlW18weDFmYTk3ZigweDNiZCldKSByZXR1cm4gXzB4MjI3OTdlOwogICAgICB2YXIgXzB4MjFkMDhmID0gT2JqZWN0W18weDFmYTk3ZigweDE3NSldKHt9LCBfMHgxZmE5N2YoMHgzYmQpLCB7CiAgICAgICAgdmFsdWU6ICEoMHgxZjgyICsgLTB4MTBkICogMHgxZCArIDB4NSAqIC0weDM1KSwKICAgICAgfSk7CiAgICAgIHJldHVybiAoCiAgICAgICAgT2JqZWN0W18weDFmYTk3ZigweDE3ZildKF8weDIyNzk3ZSlbImZvckVhY2giXShmdW5jdGlvbiAoXzB4MTlmN2UwKSB7CiAgICAgICAgICB2YXIgXzB4MWY1YTgxID0gXzB4MWZhOTdmLAogICAgICAgICAgICBfMHgzY2YxODUgPSBPYmplY3RbXzB4MWY1YTgxKDB4MmE2KV0oXzB4MjI3OTdlLCBfMHgxOWY3ZTApOwogICAgICAgICAgT2JqZWN0WyJkZWZpbmVQcm9wZXJ0eSJdKAogICAgICAgICAgICBfMHgyMWQwOGYsCiAgICAgICAgICAgIF8weDE5ZjdlMCwKICAgICAgICAgICAgXzB4M2NmMTg1W18weDFmNWE4MSgweDMyYildCiAgICAgICAgICAgICAgPyBfMHgzY2YxODUKICAgICAgICAgICAgICA6IHsKICAgICAgICAgICAgICAgICAgZW51bWVyYWJsZTogISgtMHgyMjIgKiAtMHg4ICsgMHgxICogLTB4MjFhYyArIDB4ODRlICogMHgyKSwKICAgICAgICAgICAgICAgICAgZ2V0OiBmdW5jdGlvbiAoKSB7CiAgICAgICAgICAgICAgICAgICAgcmV0dXJuIF8weDIyNzk3ZVtfMHgxOWY3ZTBdOwogICAgICAgICAgICAgICAgICB9LAogICAgICAgICAgICAgICAgfQogICAgICAgICAgKTsKICAgICAgICB9KSwKICAgICAgICBfMHgyMWQwOGYKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDU2NDA5ZShfMHgzNjJkOTYpIHsKICAgICAgdmFyIF8weDI2NTQ1MiA9IF8weDU2MTJkZSwKICAgICAgICBfMHg1ODcwZWYgPSB7CiAgICAgICAgICBleHBvcnRzOiB7fSwKICAgICAgICB9OwogICAgICByZXR1cm4gKAogICAgICAgIF8weDM2MmQ5NihfMHg1ODcwZWYsIF8weDU4NzBlZltfMHgyNjU0NTIoMHgxYjgpXSksIF8weDU4NzBlZlsiZXhwb3J0cyJdCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxNzFkYzkoXzB4NTk4M2I5KSB7CiAgICAgIHZhciBfMHgzMjc4MmYgPSBfMHg1NjEyZGU7CiAgICAgIHRocm93IG5ldyBFcnJvcihfMHgzMjc4MmYoMHgzNmQpICsgXzB4NTk4M2I5ICsgXzB4MzI3ODJmKDB4MzU3KSk7CiAgICB9CiAgICB2YXIgXzB4OTA3OTUgPSBfMHg1NjQwOWUoZnVuY3Rpb24gKF8weGI5YzdkMSkgewogICAgICAhKGZ1bmN0aW9uICgpIHsKICAgICAgICB2YXIgXzB4MmRiMjk2ID0gd18weDI1ZjMsCiAgICAgICAgICBfMHgxZjk3N2EgPSAiaW5wdXRceDIwaXNceDIwaW52YWxpZFx4MjB0eXBlIiwKICAgICAgICAgIF8weDVhODdiNCA9IF8weDJkYjI5NigweDE3ZCkgPT0gdHlwZW9mIHdpbmRvdywKICAgICAgICAgIF8weDExZDE3NyA9IF8weDVhODdiNCA/IHdpbmRvdyA6IHt9OwogICAgICAgIF8weDExZDE3N1tfMHgyZGIyOTYoMHgzN2EpXSAmJgogICAgICAgICAgKF8weDVhODdiNCA9ICEoLTB4MTVjNCArIDB4OTdkICogLTB4MiArIDB4YjcgKiAweDM5KSk7CiAgICAgICAgdmFyIF8weDM4N2ZkOCA9ICFfMHg1YTg3YjQgJiYgXzB4MmRiMjk2KDB4MTdkKSA9PSB0eXBlb2Ygc2VsZiwKICAgICAgICAgIF8weDJlMTIyNiA9CiAgICAgICAgICAgICFfMHgxMWQxNzdbXzB4MmRiMjk2KDB4MjE2KV0gJiYKICAgICAgICAgICAgXzB4MmRiMjk2KDB4MTdkKSA9PSB0eXBlb2YgcHJvY2VzcyAmJgogICAgICAgICAgICBwcm9jZXNzW18weDJkYjI5NigweDE5NCldICYmCiAgICAgICAgICAgIHByb2Nlc3NbXzB4MmRiMjk2KDB4MTk0KV1bXzB4MmRiMjk2KDB4Mjg3KV07CiAgICAgICAgXzB4MmUxMjI2ID8gKF8weDExZDE3NyA9IF8weDFlNzcyMSkgOiBfMHgzODdmZDggJiYgKF8weDExZDE3NyA9IHNlbGYpOwogICAgICAgIHZhciBfMHgyOTlhMjEgPQogICAgICAgICAgICAhXzB4MTFkMTc3WyJKU19NRDVfTk9fQ09NTU9OX0pTIl0gJiYgXzB4YjljN2QxW18weDJkYjI5NigweDFiOCldLAogICAgICAgICAgXzB4NWVmYzhmID0gISgtMHg4YzQgKyAtMHhjM2EgKyAtMHgxICogLTB4MTRmZiksCiAgICAgICAgICBfMHgxZWRjOTUgPQogICAgICAgICAgICAhXzB4MTFkMTc3W18weDJkYjI5NigweDJlNildICYmICJ1bmRlZmluZWQiICE9IHR5cGVvZiBBcnJheUJ1ZmZlciwKICAgICAgICAgIF8weDE0MjQ5MSA9IF8weDJkYjI5NigweDJkNylbXzB4MmRiMjk2KDB4MzQyKV0oIiIpLAogICAgICAgICAgXzB4MTQ2OTA3ID0gWwogICAgICAgICAgICAweDE0OCAqIDB4NSArIC0weDc1MyAqIDB4MiArIC0weDE3NSAqIC0weDYsCiAgICAgICAgICAgIDB4MSAqIDB4MzQwYiArIDB4NDYwYSArIDB4MWY5ICogMHgzLAogICAgICAgICAgICAweDI3NjZjYiArIC0weDYzMjdhYyArIDB4MzUzICogMHgzODdiLAogICAgICAgICAgICAtKC0weGMxM2UyYWFlICsgLTB4M2FmZjg0NDAgKyAweDE3YzNkYWVlZSksCiAgICAgICAgICBdLAogICAgICAgICAgXzB4NGQxM2JkID0gWwogICAgICAgICAgICAtMHgxNzIxICsgLTB4MSAqIDB4NjExICsgMHgxZDMyLAogICAgICAgICAgICAtMHgzOTAgKyAtMHgzYTUgKiAtMHgzICsgLTB4NzU3LAogICAgICAgICAgICAweDVmYyArIC0weDY0ZCAqIC0weDIgKyAtMHgxMjg2LAogICAgICAgICAgICAweDI3OCArIDB4MyAqIDB4MTA1ICsgLTB4NTZmLAogICAgICAgICAgXSwKICAgICAgICAgIF8weDNmNTgxYiA9IFsKICAgICAgICAgICAgXzB4MmRiMjk2KDB4MzUyKSwKICAgICAgICAgICAgXzB4MmRiMjk2KDB4MjM4KSwKICAgICAgICAgICAgXzB4MmRiMjk2KDB4MTliKSwKICAgICAgICAgICAgXzB4MmRiMjk2KDB4Mjc1KSwKICAgICAgICAgICAgImFycmF5QnVmZmVyIiwKICAgICAgICAgICAgXzB4MmRiMjk2KDB4MjVmKSwKICAgICAgICAgIF0sCiAgICAgICAgICBfMHhjYjRkNjEgPSBfMHgyZGIyOTYoMHgzMTUpW18weDJkYjI5NigweDM0MildKCIiKSwKICAgICAgICAgIF8weDVjNWU0NSA9IFtdLAogICAgICAgICAgXzB4NTRiMjY1OwogICAgICAgIGlmIChfMHgxZWRjOTUpIHsKICAgICAgICAgIHZhciBfMHgxNzExMDcgPSBuZXcgQXJyYXlCdWZmZXIoMHhjODcgKyAtMHhjZDggKyAweDk1KTsKICAgICAgICAgIChfMHg1NGIyNjUgPSBuZXcgVWludDhBcnJheShfMHgxNzExMDcpKSwKICAgICAgICAgICAgKF8weDVjNWU0NSA9IG5ldyBVaW50MzJBcnJheShfMHgxNzExMDcpKTsKICAgICAgICB9CiAgICAgICAgKCFfMHgxMWQxNzdbXzB4MmRiMjk2KDB4MjE2KV0gJiYgQXJyYXlbXzB4MmRiMjk2KDB4MmFmKV0pIHx8CiAgICAgICAgICAoQXJyYXlbImlzQXJyYXkiXSA9IGZ1bmN0aW9uIChfMHgyNjM2NjkpIHsKICAgICAgICAgICAgdmFyIF8weDFkZDhjZCA9IF8weDJkYjI5NjsKICAgICAgICAgICAgcmV0dXJuICgKICAgICAgICAgICAgICBfMHgxZGQ4Y2QoMHgzMzEpID09PQogICAgICAgICAgICAgIE9iamVjdFsicHJvdG90eXBlIl1bInRvU3RyaW5nIl1bImNhbGwiXShfMHgyNjM2NjkpCiAgICAgICAgICAgICk7CiAgICAgICAgICB9KSwKICAgICAgICAgICFfMHgxZWRjOTUgfHwKICAgICAgICAgICAgKCFfMHgxMWQxNzdbXzB4MmRiMjk2KDB4MzA1KV0gJiYgQXJyYXlCdWZmZXJbImlzVmlldyJdKSB8fAogICAgICAgICAgICAoQXJyYXlCdWZmZXJbImlzVmlldyJdID0gZnVuY3Rpb24gKF8weDRkMDUyZikgewogICAgICAgICAgICAgIHZhciBfMHgyM2NlZWQgPSBfMHgyZGIyOTY7CiAgICAgICAgICAgICAgcmV0dXJuICgKICAgICAgICAgICAgICAgIF8weDIzY2VlZCgweDE3ZCkgPT0gdHlwZW9mIF8weDRkMDUyZiAmJgogICAgICAgICAgICAgICAgXzB4NGQwNTJmW18weDIzY2VlZCgweDI3NSldICYmCiAgICAgICAgICAgICAgICBfMHg0ZDA1MmZbImJ1ZmZlciJdW18weDIzY2VlZCgweDJhYyldID09PSBBcnJheUJ1ZmZlcgogICAgICAgICAgICAgICk7CiAgICAgICAgICAgIH0pOwogICAgICAgIHZhciBfMHgyZTM5M2YgPSBmdW5jdGlvbiAoXzB4NTViNzFiKSB7CiAgICAgICAgICAgIHJldHVybiBmdW5jdGlvbiAoXzB4NjkwMWVjKSB7CiAgICAgICAgICAgICAgdmFyIF8weDM4YjE3OCA9IHdfMHgyNWYzOwogICAgICAgICAgICAgIHJldHVybiBuZXcgXzB4MjJmOTAyKCEoMHgxOTFkICsgMHg5ZSArIC0weDE5YmIpKQogICAgICAgICAgICAgICAgW18weDM4YjE3OCgweDJkNSldKF8weDY5MDFlYykKICAgICAgICAgICAgICAgIFtfMHg1NWI3MWJdKCk7CiAgICAgICAgICAgIH07CiAgICAgICAgICB9LAogICAgICAgICAgXzB4MWVkYWJiID0gZnVuY3Rpb24gKCkgewogICAgICAgICAgICB2YXIgXzB4NTY2NGNhID0gXzB4MmRiMjk2LAogICAgICAgICAgICAgIF8weDRjMjc1ZiA9IF8weDJlMzkzZihfMHg1NjY0Y2EoMHgzNTIpKTsKICAgICAgICAgICAgXzB4MmUxMjI2ICYmIChfMHg0YzI3NWYgPSBfMHg0ZDdlMmQoXzB4NGMyNzVmKSksCiAgICAgICAgICAgICAgKF8weDRjMjc1ZltfMHg1NjY0Y2EoMHgzYjcpXSA9IGZ1bmN0aW9uICgpIHsKICAgICAgICAgICAgICAgIHJldHVybiBuZXcgXzB4MjJmOTAyKCk7CiAgICAgICAgICAgICAgfSksCiAgICAgICAgICAgICAgKF8weDRjMjc1ZlsidXBkYXRlIl0gPSBmdW5jdGlvbiAoXzB4NWMzNDY0KSB7CiAgICAgICAgICAgICAgICByZXR1cm4gXzB4NGMyNzVmWyJjcmVhdGUiXSgpWyJ1cGRhdGUiXShfMHg1YzM0NjQpOwogICAgICAgICAgICAgIH0pOwogICAgICAgICAgICBmb3IgKAogICAgICAgICAgICAgIHZhciBfMHgzNDlkNWYgPSAtMHg5ZCAqIC0weDFmICsgMHgxICogMHgyMzBjICsgLTB4MTUgKiAweDI5MzsKICAgICAgICAgICAgICBfMHgzNDlkNWYgPCBfMHgzZjU4MWJbXzB4NTY2NGNhKDB4MjU5KV07CiAgICAgICAgICAgICAgKytfMHgzNDlkNWYKICAgICAgICAgICAgKSB7CiAgICAgICAgICAgICAgdmFyIF8weDE1MzdjNCA9IF8weDNmNTgxYltfMHgzNDlkNWZdOwogICAgICAgICAgICAgIF8weDRjMjc1ZltfMHgxNTM3YzRdID0gXzB4MmUzOTNmKF8weDE1MzdjNCk7CiAgICAgICAgICAgIH0KICAgICAgICAgICAgcmV0dXJuIF8weDRjMjc1ZjsKICAgICAgICAgIH0sCiAgICAgICAgICBfMHg0ZDdlMmQgPSBmdW5jdGlvbiAoXzB4MWFmZTFiKSB7CiAgICAgICAgICAgIHZhciBfMHgzZTBhNmUgPSBldmFsKAogICAgICAgICAgICAgICAgInZhciBfMHgxM2RiODAgPSB3XzB4MjVmMztyZXF1aXJlKF8weDEzZGI4MCg2MjgpKTsiCiAgICAgICAgICAgICAgKSwKICAgICAgICAgICAgICBfMHg1YmZlN2UgPSBldmFsKAogICAgICAgICAgICAgICAgInZhciBfMHgyMGRjOGIgPSB3XzB4MjVmMztyZXF1aXJlKCdidWZmZXInKVtfMHgyMGRjOGIoNDI0KV07IgogICAgICAgICAgICAgICksCiAgICAgICAgICAgICAgXzB4M2Q3Mzk2ID0gZnVuY3Rpb24gKF8weDUxNDJmZikgewogICAgICAgICAgICAgICAgdmFyIF8weDMwNjM5YSA9IHdfMHgyNWYzOwogICAgICAgICAgICAgICAgaWYgKF8weDMwNjM5YSgweDMzYykgPT0gdHlwZW9mIF8weDUxNDJmZikKICAgICAgICAgICAgICAgICAgcmV0dXJuIF8weDNlMGE2ZVtfMHgzMDYzOWEoMHgxY2EpXShfMHgzMDYzOWEoMHgzNWMpKQogICAgICAgICAgICAgICAgICAgIFtfMHgzMDYzOWEoMHgyZDUpXShfMHg1MTQyZmYsIF8weDMwNjM5YSgweDJhOCkpCiAgICAgICAgICAgICAgICAgICAgW18weDMwNjM5YSgweDE5YildKF8weDMwNjM5YSgweDM1MikpOwogICAgICAgICAgICAgICAgaWYgKG51bGwgPT0gXzB4NTE0MmZmKSB0aHJvdyBfMHgxZjk3N2E7CiAgICAgICAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICAgICAgICBfMHg1MTQyZmZbXzB4MzA2MzlhKDB4MmFjKV0gPT09IEFycmF5QnVmZmVyICYmCiAgICAgICAgICAgICAgICAgICAgKF8weDUxNDJmZiA9IG5ldyBVaW50OEFycmF5KF8weDUxNDJmZikpLAogICAgICAgICAgICAgICAgICBBcnJheVtfMHgzMDYzOWEoMHgyYWYpXShfMHg1MTQyZmYpIHx8CiAgICAgICAgICAgICAgICAgIEFycmF5QnVmZmVyW18weDMwNjM5YSgweDJjNyldKF8weDUxNDJmZikgfHwKICAgICAgICAgICAgICAgICAgXzB4NTE0MmZmW18weDMwNjM5YSgweDJhYyldID09PSBfMHg1YmZlN2UKICAgICAgICAgICAgICAgICAgICA/IF8weDNlMGE2ZVtfMHgzMDYzOWEoMHgxY2EpXShfMHgzMDYzOWEoMHgzNWMpKQogICAgICAgICAgICAgICAgICAgICAgICBbInVwZGF0ZSJdKG5ldyBfMHg1YmZlN2UoXzB4NTE0MmZmKSkKICAgICAgICAgICAgICAgICAgICAgICAgW18weDMwNjM5YSgweDE5YildKF8weDMwNjM5YSgweDM1MikpCiAgICAgICAgICAgICAgICAgICAgOiBfMHgxYWZlMWIoXzB4NTE0MmZmKQogICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICB9OwogICAgICAgICAgICByZXR1cm4gXzB4M2Q3Mzk2OwogICAgICAgICAgfTsKICAgICAgICBmdW5jdGlvbiBfMHgyMmY5MDIoXzB4YWQwZGE3KSB7CiAgICAgICAgICB2YXIgXzB4NjhlZjA4ID0gXzB4MmRiMjk2OwogICAgICAgICAgaWYgKF8weGFkMGRhNykKICAgICAgICAgICAgKF8weDVjNWU0NVstMHgxYjRjICogMHgxICsgLTB4MTI2YiAqIDB4MiArIDB4NDAyMl0gPQogICAgICAgICAgICAgIF8weDVjNWU0NVsweDE0M2YgKyAtMHgyMjE3ICsgMHhkZThdID0KICAgICAgICAgICAgICBfMHg1YzVlNDVbMHgxNiAqIDB4MmUgKyAtMHgxZDdjICsgMHgxOTg5XSA9CiAgICAgICAgICAgICAgXzB4NWM1ZTQ1WzB4YTAgKiAtMHgyNiArIC0weDMgKiAweDkzZiArIDB4MzM3ZiAqIDB4MV0gPQogICAgICAgICAgICAgIF8weDVjNWU0NVstMHhlZDIgKyAweGUxZCArIDB4MmUgKiAweDRdID0KICAgICAgICAgICAgICBfMHg1YzVlNDVbLTB4MTBmZiArIC0weDEgKiAtMHgzOTQgKyAweGQ2Zl0gPQogICAgICAgICAgICAgIF8weDVjNWU0NVstMHgzNmYgKiAtMHgyICsgMHgxICogMHgxYTUgKyAtMHg4N2VdID0KICAgICAgICAgICAgICBfMHg1YzVlNDVbLTB4MWY4MSAqIDB4MSArIDB4MjVjZSAqIC0weDEgKyAtMHgxICogLTB4NDU1NV0gPQogICAgICAgICAgICAgIF8weDVjNWU0NVsweDFhZTcgKiAweDEgKyAweDEgKiAtMHhlM2MgKyAtMHhjYTQgKiAweDFdID0KICAgICAgICAgICAgICBfMHg1YzVlNDVbLTB4NTgzICogLTB4NCArIC0weDVmNyAqIC0weDUgKyAtMHgzM2Q3XSA9CiAgICAgICAgICAgICAgXzB4NWM1ZTQ1WzB4MjVlICsgLTB4MWQ0YiAqIDB4MSArIC0weDNhICogLTB4NzddID0KICAgICAgICAgICAgICBfMHg1YzVlNDVbMHhlZjkgKyAtMHgzMCAqIC0weDU3ICsgLTB4MWYzZl0gPQogICAgICAgICAgICAgIF8weDVjNWU0NVsweDExZSArIC0weDE4ZiAqIDB4NyArIDB4OWQ2XSA9CiAgICAgICAgICAgICAgXzB4NWM1ZTQ1Wy0weDI1MjEgKiAtMHgxICsgMHgxICogMHgxYmY0ICsgMHg0MTA5ICogLTB4MV0gPQogICAgICAgICAgICAgIF8weDVjNWU0NVsweDE5ICogMHhhNiArIDB4MWYwNiArIC0weDJmMmZdID0KICAgICAgICAgICAgICBfMHg1YzVlNDVbLTB4MjJkMCArIDB4MWYxICogMHhmICsgMHg1YmZdID0KICAgICAgICAgICAgICBfMHg1YzVlNDVbMHg3ICogMHg1NDkgKyAtMHhhMzkgKyAweDEgKiAtMHgxYWI3XSA9CiAgICAgICAgICAgICAgICAweDEgKiAtMHhmYiArIDB4MTk5NSArIDB4YzRkICogLTB4MiksCiAgICAgICAgICAgICAgKHRoaXNbImJsb2NrcyJdID0gXzB4NWM1ZTQ1KSwKICAgICAgICAgICAgICAodGhpc1tfMHg2OGVmMDgoMHgzMjkpXSA9IF8weDU0YjI2NSk7CiAgICAgICAgICBlbHNlIHsKICAgICAgICAgICAgaWYgKF8weDFlZGM5NSkgewogICAgICAgICAgICAgIHZhciBfMHg0NGQ2NWIgPSBuZXcgQXJyYXlCdWZmZXIoMHgxMSAqIC0weGIgKyAweGJmZCArIC0weGFmZSk7CiAgICAgICAgICAgICAgKHRoaXNbXzB4NjhlZjA4KDB4MzI5KV0gPSBuZXcgVWludDhBcnJheShfMHg0NGQ2NWIpKSwKICAgICAgICAgICAgICAgICh0aGlzW18weDY4ZWYwOCgweDMxOSldID0gbmV3IFVpbnQzMkFycmF5KF8weDQ0ZDY1YikpOwogICAgICAgICAgICB9IGVsc2UKICAgICAgICAgICAgICB0aGlzW18weDY4ZWYwOCgweDMxOSldID0gWwogICAgICAgICAgICAgICAgMHg0NSAqIDB4MTAgKyAtMHhkMTUgKyAweDhjNSwKICAgICAgICAgICAgICAgIDB4MWQ3MCArIDB4NDkzICsgLTB4MjIwMyAqIDB4MSwKICAgICAgICAgICAgICAgIDB4NDYgKiAweDg2ICsgMHg4ICogLTB4MTRlICsgLTB4MWEzNCwKICAgICAgICAgICAgICAgIDB4OWJiICsgMHgyNSAqIDB4ZGYgKyAtMHgyOWY2LAogICAgICAgICAgICAgICAgLTB4MWMgKiAtMHhkYSArIDB4MTg4ICsgMHhjYiAqIC0weDIwLAogICAgICAgICAgICAgICAgLTB4NDQyICsgLTB4MTk5YSArIDB4MWRkYywKICAgICAgICAgICAgICAgIC0weDIgKiAtMHgzMmQgKyAtMHg2MDUgKiAtMHgyICsgLTB4MTI2NCwKICAgICAgICAgICAgICAgIDB4MWFmICogLTB4OCArIC0weGYzYyArIDB4MjljICogMHhiLAogICAgICAgICAgICAgICAgLTB4OGNjICsgMHgxYzMgKyAweDcwOSAqIDB4MSwKICAgICAgICAgICAgICAgIDB4YjUzICogMHgxICsgMHgxOGU2ICsgLTB4MyAqIDB4YzEzLAogICAgICAgICAgICAgICAgLTB4MiAqIDB4MTM1ZSArIDB4NDQ0ICsgMHgyMjc4LAogICAgICAgICAgICAgICAgMHhlOCAqIDB4MmIgKyAweDIxMDYgKyAtMHhhICogMHg3MzMsCiAgICAgICAgICAgICAgICAweDMgKiAweDQ0OSArIDB4MTEwMyArIC0weDFkZGUsCiAgICAgICAgICAgICAgICAweDMwICsgLTB4MyAqIC0weDk1ICsgLTB4MWVmLAogICAgICAgICAgICAgICAgMHgzY2EgKiAtMHgzICsgLTB4OSAqIC0weDFjYiArIC0weDMgKiAweDE5NywKICAgICAgICAgICAgICAgIC0weDE0Y2UgKyAtMHgxYjkgKyAweDE2ODcsCiAgICAgICAgICAgICAgICAtMHhiMmYgKyAtMHg1M2YgKiAweDMgKyAweDFhZWMsCiAgICAgICAgICAgICAgXTsKICAgICAgICAgIH0KICAgICAgICAgICh0aGlzWyJoMCJdID0KICAgICAgICAgICAgdGhpc1siaDEiXSA9CiAgICAgICAgICAgIHRoaXNbImgyIl0gPQogICAgICAgICAgICB0aGlzWyJoMyJdID0KICAgICAgICAgICAgdGhpc1tfMHg2OGVmMDgoMHgzODUpXSA9CiAgICAgICAgICAgIHRoaXNbXzB4NjhlZjA4KDB4MjViKV0gPQogICAgICAgICAgICB0aGlzW18weDY4ZWYwOCgweDFjZCldID0KICAgICAgICAgICAgICAtMHgxICogMHg0ZjkgKyAweGViICogLTB4ZCArIDB4MTBlOCksCiAgICAgICAgICAgICh0aGlzW18weDY4ZWYwOCgweDE4MildID0gdGhpc1tfMHg2OGVmMDgoMHgxZTkpXSA9CiAgICAgICAgICAgICAgISgtMHg5ODMgKyAtMHg1YjEgKiAtMHgxICsgMHgzZDMpKSwKICAgICAgICAgICAgKHRoaXNbXzB4NjhlZjA4KDB4MTlmKV0gPSAhKC0weGNkZiArIDB4MjE1NyArIC0weDE0NzgpKTsKICAgICAgICB9CiAgICAgICAgKF8weDIyZjkwMltfMHgyZGIyOTYoMHgzNDQpXVtfMHgyZGIyOTYoMHgyZDUpXSA9IGZ1bmN0aW9uIChfMHgzNmYwOWQpIHsKICAgICAgICAgIHZhciBfMHg0NDkzNDAgPSBfMHgyZGIyOTY7CiAgICAgICAgICBpZiAoIXRoaXNbImZpbmFsaXplZCJdKSB7CiAgICAgICAgICAgIHZhciBfMHg0NjI4OTgsCiAgICAgICAgICAgICAgXzB4MWRkNjhlID0gdHlwZW9mIF8weDM2ZjA5ZDsKICAgICAgICAgICAgaWYgKF8weDQ0OTM0MCgweDMzYykgIT09IF8weDFkZDY4ZSkgewogICAgICAgICAgICAgIGlmICgib2JqZWN0IiAhPT0gXzB4MWRkNjhlKSB0aHJvdyBfMHgxZjk3N2E7CiAgICAgICAgICAgICAgaWYgKG51bGwgPT09IF8weDM2ZjA5ZCkgdGhyb3cgXzB4MWY5NzdhOwogICAgICAgICAgICAgIGlmIChfMHgxZWRjOTUgJiYgXzB4MzZmMDlkWyJjb25zdHJ1Y3RvciJdID09PSBBcnJheUJ1ZmZlcikKICAgICAgICAgICAgICAgIF8weDM2ZjA5ZCA9IG5ldyBVaW50OEFycmF5KF8weDM2ZjA5ZCk7CiAgICAgICAgICAgICAgZWxzZSB7CiAgICAgICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgICAgICEoCiAgICAgICAgICAgICAgICAgICAgQXJyYXlbXzB4NDQ5MzQwKDB4MmFmKV0oXzB4MzZmMDlkKSB8fAogICAgICAgICAgICAgICAgICAgIChfMHgxZWRjOTUgJiYgQXJyYXlCdWZmZXJbImlzVmlldyJdKF8weDM2ZjA5ZCkpCiAgICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgICAgdGhyb3cgXzB4MWY5NzdhOwogICAgICAgICAgICAgIH0KICAgICAgICAgICAgICBfMHg0NjI4OTggPSAhKC0weGZlYSArIDB4NDQ5ICogMHgzICsgLTB4MSAqIC0weDMwZik7CiAgICAgICAgICAgIH0KICAgICAgICAgICAgZm9yICgKICAgICAgICAgICAgICB2YXIgXzB4MmM2NTEzLAogICAgICAgICAgICAgICAgXzB4MWZkMTViLAogICAgICAgICAgICAgICAgXzB4NDMyZWY2ID0gMHhhZGQgKyAtMHg0ZDcgKiAweDIgKyAweDEgKiAtMHgxMmYsCiAgICAgICAgICAgICAgICBfMHgzODMwNTggPSBfMHgzNmYwOWRbXzB4NDQ5MzQwKDB4MjU5KV0sCiAgICAgICAgICAgICAgICBfMHgxN2E2ZWQgPSB0aGlzW18weDQ0OTM0MCgweDMxOSldLAogICAgICAgICAgICAgICAgXzB4MTYxYTMxID0gdGhpc1tfMHg0NDkzNDAoMHgzMjkpXTsKICAgICAgICAgICAgICBfMHg0MzJlZjYgPCBfMHgzODMwNTg7CgogICAgICAgICAgICApIHsKICAgICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgICAodGhpc1tfMHg0NDkzNDAoMHgxZTkpXSAmJgogICAgICAgICAgICAgICAgICAoKHRoaXNbXzB4NDQ5MzQwKDB4MWU5KV0gPSAhKC0weDY1NyArIDB4NGZiICsgLTB4MTVkICogLTB4MSkpLAogICAgICAgICAgICAgICAgICAoXzB4MTdhNmVkWzB4MjJlMSAqIC0weDEgKyAtMHhlYjIgKyAweDMxOTNdID0KICAgICAgICAgICAgICAgICAgICBfMHgxN2E2ZWRbMHgyODMgKiAtMHhkICsgLTB4MTQxZSArIDB4MzRkNV0pLAogICAgICAgICAgICAgICAgICAoXzB4MTdhNmVkWzB4MWFmMyAqIDB4MSArIC0weDE0ZDEgKiAweDEgKyAtMHgxNSAqIDB4NGFdID0KICAgICAgICAgICAgICAgICAgICBfMHgxN2E2ZWRbLTB4YzMgKiAtMHgyZiArIC0weDQ5ICogLTB4MzEgKyAweDMgKiAtMHgxMDk3XSA9CiAgICAgICAgICAgICAgICAgICAgXzB4MTdhNmVkWzB4MWUzNCArIC0weDEgKiAtMHgxODM3ICsgLTB4MzY2OV0gPQogICAgICAgICAgICAgICAgICAgIF8weDE3YTZlZFstMHgxMmUzICsgLTB4MTczMyAqIC0weDEgKyAweDEgKiAtMHg0NGRdID0KICAgICAgICAgICAgICAgICAgICBfMHgxN2E2ZWRbMHgzMSAqIC0weDhiICsgMHgxNjQzICogMHgxICsgMHg0NWNdID0KICAgICAgICAgICAgICAgICAgICBfMHgxN2E2ZWRbMHg4NyAqIC0weGQgKyAtMHgxNGQ1ICsgMHgxYmI1XSA9CiAgICAgICAgICAgICAgICAgICAgXzB4MTdhNmVkWzB4MWQ3MCArIDB4MjU1YSArIDB4NCAqIC0weDEwYjFdID0KICAgICAgICAgICAgICAgICAgICBfMHgxN2E2ZWRbMHgxMzEyICsgMHgyZTYgKyAweDE1ZjEgKiAtMHgxXSA9CiAgICAgICAgICAgICAgICAgICAgXzB4MTdhNmVkWzB4MWVkOSArIDB4NTUxICogLTB4MSArIC0weDE5ODBdID0KICAgICAgICAgICAgICAgICAgICBfMHgxN2E2ZWRbMHgyNjkgKiAtMHg3ICsgMHgxZDggKyAweGYxMF0gPQogICAgICAgICAgICAgICAgICAgIF8weDE3YTZlZFsweDExMzQgKyAtMHgxICogLTB4MTVjZCArIC0weGNmZCAqIDB4M10gPQogICAgICAgICAgICAgICAgICAgIF8weDE3YTZlZFsweDEyMjkgKiAweDEgKyAweDIzICogLTB4ZTMgKyAweGNlYl0gPQogICAgICAgICAgICAgICAgICAgIF8weDE3YTZlZFsweDE1ICogMHgxM2EgKyAtMHgyM2UzICogMHgxICsgMHgxICogMHhhMmRdID0KICAgICAgICAgICAgICAgICAgICBfMHgxN2E2ZWRbLTB4NCAqIDB4OGVlICsgLTB4MWQ3ZCArIDB4NDE0MiAqIDB4MV0gPQogICAgICAgICAgICAgICAgICAgIF8weDE3YTZlZFsweDlkOSArIDB4MSAqIC0weDIxNWIgKyAweDM0ICogMHg3NF0gPQogICAgICAgICAgICAgICAgICAgIF8weDE3YTZlZFsweDFlNzIgKyAtMHg5ICogMHgyYiArIDB4YTggKiAtMHgyY10gPQogICAgICAgICAgICAgICAgICAgICAgMHg4NTcgKyAweDFjZWYgKyAtMHgyNTQ2KSksCiAgICAgICAgICAgICAgICBfMHg0NjI4OTgpCiAgICAgICAgICAgICAgKSB7CiAgICAgICAgICAgICAgICBpZiAoXzB4MWVkYzk1KSB7CiAgICAgICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICAgICAgXzB4MWZkMTViID0gdGhpc1tfMHg0NDkzNDAoMHgzODUpXTsKICAgICAgICAgICAgICAgICAgICBfMHg0MzJlZjYgPCBfMHgzODMwNTggJiYKICAgICAgICAgICAgICAgICAgICBfMHgxZmQxNWIgPCAtMHg4MzYgKyAweDExNTAgKyAtMHhjZSAqIDB4YjsKICAgICAgICAgICAgICAgICAgICArK18weDQzMmVmNgogICAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgICAgICAgXzB4MTYxYTMxW18weDFmZDE1YisrXSA9IF8weDM2ZjA5ZFtfMHg0MzJlZjZdOwogICAgICAgICAgICAgICAgfSBlbHNlIHsKICAgICAgICAgICAgICAgICAgZm9yICgKICAgICAgICAgICAgICAgICAgICBfMHgxZmQxNWIgPSB0aGlzW18weDQ0OTM0MCgweDM4NSldOwogICAgICAgICAgICAgICAgICAgIF8weDQzMmVmNiA8IF8weDM4MzA1OCAmJgogICAgICAgICAgICAgICAgICAgIF8weDFmZDE1YiA8IC0weDQgKiAtMHg0ZTggKyAtMHhlZGIgKiAweDEgKyAtMHg0ODU7CiAgICAgICAgICAgICAgICAgICAgKytfMHg0MzJlZjYKICAgICAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgICAgIF8weDE3YTZlZFsKICAgICAgICAgICAgICAgICAgICAgIF8weDFmZDE1YiA+PiAoMHgxMSAqIDB4NWMgKyAweDEzNzggKiAtMHgyICsgMHgzICogMHhhZjIpCiAgICAgICAgICAgICAgICAgICAgXSB8PQogICAgICAgICAgICAgICAgICAgICAgXzB4MzZmMDlkW18weDQzMmVmNl0gPDwKICAgICAgICAgICAgICAgICAgICAgIF8weDRkMTNiZFsKICAgICAgICAgICAgICAgICAgICAgICAgKDB4MSAqIC0weDRmICsgLTB4MjAzNiArIC0weDEwNDQgKiAtMHgyKSAmIF8weDFmZDE1YisrCiAgICAgICAgICAgICAgICAgICAgICBdOwogICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgIH0gZWxzZSB7CiAgICAgICAgICAgICAgICBpZiAoXzB4MWVkYzk1KSB7CiAgICAgICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICAgICAgXzB4MWZkMTViID0gdGhpc1tfMHg0NDkzNDAoMHgzODUpXTsKICAgICAgICAgICAgICAgICAgICBfMHg0MzJlZjYgPCBfMHgzODMwNTggJiYKICAgICAgICAgICAgICAgICAgICBfMHgxZmQxNWIgPCAweGM0ICogLTB4MSArIDB4NzhmICogLTB4MSArIDB4ODkzOwogICAgICAgICAgICAgICAgICAgICsrXzB4NDMyZWY2CiAgICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgICAgICAoXzB4MmM2NTEzID0gXzB4MzZmMDlkW18weDQ0OTM0MCgweDE5NSldKF8weDQzMmVmNikpIDwKICAgICAgICAgICAgICAgICAgICAweGQgKiAweDFhICsgMHg4ZiArIC0weDE2MQogICAgICAgICAgICAgICAgICAgICAgPyAoXzB4MTYxYTMxW18weDFmZDE1YisrXSA9IF8weDJjNjUxMykKICAgICAgICAgICAgICAgICAgICAgIDogXzB4MmM2NTEzIDwgMHgxYjlhICsgMHgxICogLTB4NGE5ICsgMHhlZjEgKiAtMHgxCiAgICAgICAgICAgICAgICAgICAgICA/ICgoXzB4MTYxYTMxW18weDFmZDE1YisrXSA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDFhYWEgKiAtMHgxICsgMHgyNTExICogLTB4MSArIC0weDIzYiAqIC0weDUpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmM2NTEzID4+ICgweDE1NjggKyAweDc1YSAqIDB4MSArIC0weDk5NCAqIDB4MykpKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDE2MWEzMVtfMHgxZmQxNWIrK10gPQogICAgICAgICAgICAgICAgICAgICAgICAgICgweDU0YSArIC0weDEgKiAweDFhNjYgKyAtMHgxY2QgKiAtMHhjKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKCgweDhhZCAqIDB4NCArIDB4NmEzICogMHgxICsgLTB4MjkxOCkgJiBfMHgyYzY1MTMpKSkKICAgICAgICAgICAgICAgICAgICAgIDogXzB4MmM2NTEzIDwgMHgxODA3ZiArIC0weDEgKiAtMHg0NGQ0ICsgMHhlZDUzICogLTB4MSB8fAogICAgICAgICAgICAgICAgICAgICAgICBfMHgyYzY1MTMgPj0gLTB4MSAqIC0weDEyM2U0ICsgMHgxYmUzMSArIC0weDUgKiAweDY2ZDEKICAgICAgICAgICAgICAgICAgICAgID8gKChfMHgxNjFhMzFbXzB4MWZkMTViKytdID0KICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxICogMHgxMWYgKyAweGZmZCAqIC0weDEgKyAweGZiZSkgfAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyYzY1MTMgPj4gKDB4MSAqIDB4NjUgKyAweDUzMyArIC0weDExYyAqIDB4NSkpKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDE2MWEzMVtfMHgxZmQxNWIrK10gPQogICAgICAgICAgICAgICAgICAgICAgICAgICgweDQgKiAweDcyYiArIDB4MjNjOSAqIDB4MSArIC0weDNmZjUpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAoKF8weDJjNjUxMyA+PgogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4OSAqIDB4OSArIDB4NSAqIDB4NTE3ICsgLTB4NSAqIDB4NTI2KSkgJgogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MjAwYiArIDB4MSAqIDB4YmU3ICsgLTB4MmJiMykpKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDE2MWEzMVtfMHgxZmQxNWIrK10gPQogICAgICAgICAgICAgICAgICAgICAgICAgICgweDEgKiAweDEyOGYgKyAweDExICogLTB4NmEgKyAtMHhiMDUpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAoKDB4MjcgKiAweDU5ICsgLTB4MjEyNiArIDB4MSAqIDB4MTNkNikgJiBfMHgyYzY1MTMpKSkKICAgICAgICAgICAgICAgICAgICAgIDogKChfMHgyYzY1MTMgPQogICAgICAgICAgICAgICAgICAgICAgICAgIC0weGIyOTUgKwogICAgICAgICAgICAgICAgICAgICAgICAgIDB4MTg1ICogMHgxMzkgKwogICAgICAgICAgICAgICAgICAgICAgICAgIC0weDI5MDggKwogICAgICAgICAgICAgICAgICAgICAgICAgICgoKCgtMHgxZWMyICogLTB4MSArIC0weDE4M2UgKyAtMHhmICogMHgyYikgJgogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MmM2NTEzKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MmUgKiAweDMgKyAweDE0YiArIDB4MSAqIC0weDFjYikpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgoMHgxMjI1ICogMHgxICsgMHgyMzc2ICsgLTB4MzE5YykgJgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzNmYwOWRbXzB4NDQ5MzQwKDB4MTk1KV0oKytfMHg0MzJlZjYpKSkpLAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MTYxYTMxW18weDFmZDE1YisrXSA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDk2OSArIDB4Yzk3ICsgLTB4MjNlKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJjNjUxMyA+PiAoLTB4YzE5ICsgLTB4MTRmOSArIDB4MjEyNCkpKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDE2MWEzMVtfMHgxZmQxNWIrK10gPQogICAgICAgICAgICAgICAgICAgICAgICAgICgweDIwMiArIDB4MSAqIDB4MTg3ICsgLTB4MzA5KSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgyYzY1MTMgPj4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgxZGEzICsgLTB4YSAqIDB4ZGEgKyAtMHgzNzkgKiAtMHhiKSkgJgogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MiAqIC0weDExN2IgKyAtMHg3YzkgKyAweDJhZmUpKSksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgxNjFhMzFbXzB4MWZkMTViKytdID0KICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxICogLTB4MTA0MyArIDB4MTE4NSArIC0weGMyKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgyYzY1MTMgPj4gKC0weDhjNiArIDB4MWQ4NyArIC0weDFkICogMHhiNykpICYKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDJhICogMHhlNyArIC0weDEgKiAweDE4NjkgKyAtMHhkM2UpKSksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgxNjFhMzFbXzB4MWZkMTViKytdID0KICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4NThlICsgMHg2ICogLTB4MjE2ICsgMHg5NDkgKiAweDIpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAoKDB4MjQ3NCAqIC0weDEgKyAweGE5ICogMHhkICsgMHgxYzFlKSAmIF8weDJjNjUxMykpKTsKICAgICAgICAgICAgICAgIH0gZWxzZSB7CiAgICAgICAgICAgICAgICAgIGZvciAoCiAgICAgICAgICAgICAgICAgICAgXzB4MWZkMTViID0gdGhpc1tfMHg0NDkzNDAoMHgzODUpXTsKICAgICAgICAgICAgICAgICAgICBfMHg0MzJlZjYgPCBfMHgzODMwNTggJiYKICAgICAgICAgICAgICAgICAgICBfMHgxZmQxNWIgPCAtMHg0OGEgKiAweDcgKyAweDE5OTMgKyAtMHhkICogLTB4N2Y7CiAgICAgICAgICAgICAgICAgICAgKytfMHg0MzJlZjYKICAgICAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgICAgIChfMHgyYzY1MTMgPSBfMHgzNmYwOWRbXzB4NDQ5MzQwKDB4MTk1KV0oXzB4NDMyZWY2KSkgPAogICAgICAgICAgICAgICAgICAgIDB4MiAqIC0weDg2ICsgMHgxMDEgKiAweDFmICsgLTB4MSAqIDB4MWQ5MwogICAgICAgICAgICAgICAgICAgICAgPyAoXzB4MTdhNmVkW18weDFmZDE1YiA+PiAoLTB4MTI5NyArIDB4NzFhICsgMHhiN2YpXSB8PQogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDJjNjUxMyA8PAogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDRkMTNiZFsoLTB4MWYyNiArIDB4ZDE3ICsgMHgxMjEyKSAmIF8weDFmZDE1YisrXSkKICAgICAgICAgICAgICAgICAgICAgIDogXzB4MmM2NTEzIDwgMHgxMWI3ICsgLTB4MTUwZCArIDB4YjU2CiAgICAgICAgICAgICAgICAgICAgICA/ICgoXzB4MTdhNmVkW18weDFmZDE1YiA+PiAoLTB4MjMxZiArIC0weDhlYiArIDB4MmMwYyldIHw9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKCgweDFhZTAgKyAweDcwYiArIC0weDIxMmIpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyYzY1MTMgPj4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDg3ZiArIC0weDIzZiAqIDB4NSArIC0weDEzYyAqIC0weDEwKSkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NGQxM2JkWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4M2ZiICsgMHg4ZTEgKiAtMHgxICsgMHg0ZTkpICYgXzB4MWZkMTViKysKICAgICAgICAgICAgICAgICAgICAgICAgICBdKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDE3YTZlZFtfMHgxZmQxNWIgPj4gKC0weDFkOTcgKyAweDZhZCArIDB4MTZlYyldIHw9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKCgweDFkMGUgKyAweGYwYSArIC0weDJiOTgpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgoMHhmMmMgKyAweGJiICogLTB4MjAgKyAweDg3MykgJiBfMHgyYzY1MTMpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDRkMTNiZFsoMHg4ZDkgKyAtMHgxN2UwICsgMHhmMGEpICYgXzB4MWZkMTViKytdKSkKICAgICAgICAgICAgICAgICAgICAgIDogXzB4MmM2NTEzIDwgLTB4OGI3ZCArIDB4MTEzYmYgKyAweDRmYmUgfHwKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MmM2NTEzID49IC0weGM5YzAgKyAweDE2ZDRhICogMHgxICsgMHgzYzc2CiAgICAgICAgICAgICAgICAgICAgICA/ICgoXzB4MTdhNmVkWwogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDFmZDE1YiA+PiAoMHgyICogMHg3NGYgKyAweDE1MzMgKyAtMHgyM2NmKQogICAgICAgICAgICAgICAgICAgICAgICBdIHw9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKCgtMHg3ICogMHgyOCArIC0weDIgKiAtMHgxYmIgKyAtMHgxN2UpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyYzY1MTMgPj4gKDB4MWQ1YyArIDB4MWU2YyArIC0weDEgKiAweDNiYmMpKSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHg0ZDEzYmRbCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxMiAqIDB4MTE5ICsgMHg0ICogLTB4MWM2ICsgLTB4Y2E3KSAmIF8weDFmZDE1YisrCiAgICAgICAgICAgICAgICAgICAgICAgICAgXSksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgxN2E2ZWRbCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MWZkMTViID4+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MjYgKiAweDJlICsgLTB4MTJhYSAqIDB4MiArIC0weDJjMmEgKiAtMHgxKQogICAgICAgICAgICAgICAgICAgICAgICBdIHw9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKCgweDI0NWEgKyAtMHgxYWExICsgLTB4MSAqIDB4OTM5KSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKF8weDJjNjUxMyA+PiAoMHgxZmE2ICsgLTB4NzM1ICsgLTB4MmYgKiAweDg1KSkgJgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4NWQzICsgLTB4MWViMiAqIC0weDEgKyAtMHgxOGEwKSkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NGQxM2JkWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4YTQwICsgMHgxZjQ5ICsgLTB4ODRlICogMHg1KSAmIF8weDFmZDE1YisrCiAgICAgICAgICAgICAgICAgICAgICAgICAgXSksCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgxN2E2ZWRbCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MWZkMTViID4+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgyMSAqIC0weGE0ICsgLTB4MTM5ICogLTB4NSArIDB4MSAqIDB4ZjA5KQogICAgICAgICAgICAgICAgICAgICAgICBdIHw9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKCgtMHgxNDM0ICsgMHg1ICogLTB4MzUgKyAweDE1YmQpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgoLTB4YzJkICsgMHgyNjU1ICsgMHgyNWIgKiAtMHhiKSAmIF8weDJjNjUxMykpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NGQxM2JkWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4NzYgKiAweDI2ICsgLTB4MSAqIDB4OGFkICsgMHgxYzQgKiAtMHg1KSAmCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDFmZDE1YisrCiAgICAgICAgICAgICAgICAgICAgICAgICAgXSkpCiAgICAgICAgICAgICAgICAgICAgICA6ICgoXzB4MmM2NTEzID0KICAgICAgICAgICAgICAgICAgICAgICAgICAweDEyZSAqIC0weGJmICsKICAgICAgICAgICAgICAgICAgICAgICAgICAweDFjYzhhICsKICAgICAgICAgICAgICAgICAgICAgICAgICAweDhjICogMHgyNiArCiAgICAgICAgICAgICAgICAgICAgICAgICAgKCgoKC0weDNmNSAqIDB4MyArIC0weGZlOCArIDB4MWZjNikgJiBfMHgyYzY1MTMpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgyOWEgKyAweDEzYTkgKyAtMHgxNjM5KSkgfAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKCgweDEgKiAtMHgxZGQ3ICsgMHg2YTUgKyAweDEgKiAweDFiMzEpICYKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzZmMDlkW18weDQ0OTM0MCgweDE5NSldKCsrXzB4NDMyZWY2KSkpKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDE3YTZlZFsKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxZmQxNWIgPj4gKDB4ZCAqIDB4NjEgKyAweGNiICogLTB4MWUgKyAweDEyZGYpCiAgICAgICAgICAgICAgICAgICAgICAgIF0gfD0KICAgICAgICAgICAgICAgICAgICAgICAgICAoKDB4MSAqIC0weGVlNCArIDB4MiAqIC0weDc2NyArIC0weDYgKiAtMHg1MWIpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyYzY1MTMgPj4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MSAqIDB4MWE0ZCArIC0weDMgKiAweDE0OSArIC0weDE2NjApKSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHg0ZDEzYmRbCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MWM3MCArIC0weDEgKiAtMHg1N2IgKyAweDEgKiAweDE2ZjgpICYKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MWZkMTViKysKICAgICAgICAgICAgICAgICAgICAgICAgICBdKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDE3YTZlZFsKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxZmQxNWIgPj4gKDB4ZWYxICsgLTB4YmEwICsgLTB4MSAqIDB4MzRmKQogICAgICAgICAgICAgICAgICAgICAgICBdIHw9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKCgtMHhhMyAqIC0weDMgKyAweDI2YWYgKyAweDE0MGMgKiAtMHgyKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKF8weDJjNjUxMyA+PiAoLTB4NTE4ICsgMHgxICogLTB4YzI2ICsgMHgxMTRhKSkgJgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MjUgKiAtMHhkMSArIC0weDExMzAgKiAtMHgxICsgLTB4MmYyNikpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDRkMTNiZFsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHg3MyAqIC0weGIgKyAtMHgxN2QgKiAweDEgKyAweDEgKiAtMHgzNzEpICYKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MWZkMTViKysKICAgICAgICAgICAgICAgICAgICAgICAgICBdKSwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDE3YTZlZFsKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxZmQxNWIgPj4gKDB4MyAqIC0weDEwNyArIDB4MWRiZCArIC0weDFhYTYpCiAgICAgICAgICAgICAgICAgICAgICAgIF0gfD0KICAgICAgICAgICAgICAgICAgICAgICAgICAoKC0weDE1MWMgKyAweDE2ICogLTB4MTkxICsgMHgzODEyKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKF8weDJjNjUxMyA+PiAoMHhkZWQgKiAtMHgxICsgMHg0NSArIDB4ZGFlKSkgJgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MmFmICogLTB4NyArIC0weDQ5ICsgMHgxMjQxICogLTB4MSkpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDRkMTNiZFsoLTB4MTlhMiArIC0weDdkMiArIDB4MjE3NykgJiBfMHgxZmQxNWIrK10pLAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MTdhNmVkWwogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDFmZDE1YiA+PiAoLTB4MTgwZSArIDB4MTNkMiArIC0weDEgKiAtMHg0M2UpCiAgICAgICAgICAgICAgICAgICAgICAgIF0gfD0KICAgICAgICAgICAgICAgICAgICAgICAgICAoKC0weDkgKiAtMHgxZjUgKyAtMHhmMSAqIDB4ZCArIC0weDYgKiAweGQwKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKDB4N2YgKiAweDJmICsgMHgxICogMHgxODhjICsgLTB4OTg2ICogMHg1KSAmCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDJjNjUxMykpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4NGQxM2JkWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MWNmOSArIDB4YiAqIC0weGU3ICsgLTB4MTMwOSkgJiBfMHgxZmQxNWIrKwogICAgICAgICAgICAgICAgICAgICAgICAgIF0pKTsKICAgICAgICAgICAgICAgIH0KICAgICAgICAgICAgICB9CiAgICAgICAgICAgICAgKHRoaXNbImxhc3RCeXRlSW5kZXgiXSA9IF8weDFmZDE1YiksCiAgICAgICAgICAgICAgICAodGhpc1tfMHg0NDkzNDAoMHgyNWIpXSArPSBfMHgxZmQxNWIgLSB0aGlzWyJzdGFydCJdKSwKICAgICAgICAgICAgICAgIF8weDFmZDE1YiA+PSAtMHhhNDIgKyAweDIgKiAtMHgxMWMzICsgMHgyZTA4CiAgICAgICAgICAgICAgICAgID8gKCh0aGlzW18weDQ0OTM0MCgweDM4NSldID0KICAgICAgICAgICAgICAgICAgICAgIF8weDFmZDE1YiAtICgtMHgyYiAqIDB4ZTIgKyAweGE1NSArIDB4ZCAqIDB4MjI1KSksCiAgICAgICAgICAgICAgICAgICAgdGhpc1tfMHg0NDkzNDAoMHgyYmEpXSgpLAogICAgICAgICAgICAgICAgICAgICh0aGlzW18weDQ0OTM0MCgweDFlOSldID0gISgKICAgICAgICAgICAgICAgICAgICAgIDB4YzU0ICsKICAgICAgICAgICAgICAgICAgICAgIC0weDEgKiAtMHhmYTMgKwogICAgICAgICAgICAgICAgICAgICAgLTB4MSAqIDB4MWJmNwogICAgICAgICAgICAgICAgICAgICkpKQogICAgICAgICAgICAgICAgICA6ICh0aGlzW18weDQ0OTM0MCgweDM4NSldID0gXzB4MWZkMTViKTsKICAgICAgICAgICAgfQogICAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICAgIHRoaXNbXzB4NDQ5MzQwKDB4MjViKV0gPgogICAgICAgICAgICAgICAgLTB4MTQ0NjIxOTNmICsgLTB4ZDdmYWNiMCArIC0weDIgKiAtMHgxMjhmMGUyZjcgJiYKICAgICAgICAgICAgICAgICgodGhpc1siaEJ5dGVzIl0gKz0KICAgICAgICAgICAgICAgICAgKHRoaXNbImJ5dGVzIl0gLwogICAgICAgICAgICAgICAgICAgICgweDczZTRiNGUwICogMHgzICsKICAgICAgICAgICAgICAgICAgICAgIC0weDNmYyAqIC0weDQwYjVhMSArCiAgICAgICAgICAgICAgICAgICAgICAtMHg0ODZhICogMHg0ZDM5NikpIDw8CiAgICAgICAgICAgICAgICAgICgtMHgxZmJiICogMHgxICsgLTB4MTYyMyArIDB4MzVkZSkpLAogICAgICAgICAgICAgICAgKHRoaXNbXzB4NDQ5MzQwKDB4MjViKV0gPQogICAgICAgICAgICAgICAgICB0aGlzW18weDQ0OTM0MCgweDI1YildICUKICAgICAgICAgICAgICAgICAgKDB4N2Q3NTZjICogLTB4MWUxICsgLTB4M2I2YWVkZSAqIC0weDIgKyAweDI3OCAqIDB4YzQyYmRhKSkpLAogICAgICAgICAgICAgIHRoaXMKICAgICAgICAgICAgKTsKICAgICAgICAgIH0KICAgICAgICB9KSwKICAgICAgICAgIChfMHgyMmY5MDJbXzB4MmRiMjk2KDB4MzQ0KV1bXzB4MmRiMjk2KDB4MWQ5KV0gPSBmdW5jdGlvbiAoKSB7CiAgICAgICAgICAgIHZhciBfMHg4YjY5NCA9IF8weDJkYjI5NjsKICAgICAgICAgICAgaWYgKCF0aGlzW18weDhiNjk0KDB4MTgyKV0pIHsKICAgICAgICAgICAgICB0aGlzW18weDhiNjk0KDB4MTgyKV0gPSAhKDB4MTAzOCArIDB4MSAqIC0weDI0N2YgKyAweDFkICogMHhiMyk7CiAgICAgICAgICAgICAgdmFyIF8weDUyZjI0YSA9IHRoaXNbXzB4OGI2OTQoMHgzMTkpXSwKICAgICAgICAgICAgICAgIF8weDIxY2JkOCA9IHRoaXNbXzB4OGI2OTQoMHgzMmUpXTsKICAgICAgICAgICAgICAoXzB4NTJmMjRhWwogICAgICAgICAgICAgICAgXzB4MjFjYmQ4ID4+ICgweDRjZCAqIDB4NCArIC0weDEgKiAtMHgxNTExICsgLTB4Mjg0MykKICAgICAgICAgICAgICBdIHw9CiAgICAgICAgICAgICAgICBfMHgxNDY5MDdbKDB4YjJlICsgLTB4MTAgKiAtMHhiZiArIC0weDQxICogMHg1YikgJiBfMHgyMWNiZDhdKSwKICAgICAgICAgICAgICAgIF8weDIxY2JkOCA+PSAweDhmZSAqIDB4MyArIC0weDIzMWMgKyAtMHg0MmQgKiAtMHgyICYmCiAgICAgICAgICAgICAgICAgICh0aGlzWyJoYXNoZWQiXSB8fCB0aGlzWyJoYXNoIl0oKSwKICAgICAgICAgICAgICAgICAgKF8weDUyZjI0YVsweDY2NiArIDB4MTQzMiArIC0weDFhOThdID0KICAgICAgICAgICAgICAgICAgICBfMHg1MmYyNGFbMHgyNGNkICsgMHgxZTEgKiAweDE0ICsgMHgxOSAqIC0weDJmOV0pLAogICAgICAgICAgICAgICAgICAoXzB4NTJmMjRhWy0weDFmNDYgKyAweDEgKiAweDEwMTUgKyAweGY0MV0gPQogICAgICAgICAgICAgICAgICAgIF8weDUyZjI0YVsweGJlOCArIDB4MWE5NiArIDB4YTcgKiAtMHgzYl0gPQogICAgICAgICAgICAgICAgICAgIF8weDUyZjI0YVstMHhiICogMHgxNGQgKyAtMHgxICogMHg1OSArIC0weGVhYSAqIC0weDFdID0KICAgICAgICAgICAgICAgICAgICBfMHg1MmYyNGFbLTB4MWYxICogLTB4MyArIC0weDFkNjkgKyAweDE3OTldID0KICAgICAgICAgICAgICAgICAgICBfMHg1MmYyNGFbMHhhN2IgKiAtMHgyICsgMHhiYjEgKiAtMHgxICsgLTB4MjBhYiAqIC0weDFdID0KICAgICAgICAgICAgICAgICAgICBfMHg1MmYyNGFbLTB4MTFkYyArIC0weGFhICsgMHgyZiAqIDB4NjVdID0KICAgICAgICAgICAgICAgICAgICBfMHg1MmYyNGFbLTB4MSAqIDB4MWY5OSArIC0weDFlNTMgKiAweDEgKyAweDNkZjJdID0KICAgICAgICAgICAgICAgICAgICBfMHg1MmYyNGFbLTB4MTAzICogLTB4NSArIC0weDI0NTEgKyAweDFmNDldID0KICAgICAgICAgICAgICAgICAgICBfMHg1MmYyNGFbMHgyMWU2ICsgLTB4ZjkgKiAweDEgKyAtMHgxICogMHgyMGU1XSA9CiAgICAgICAgICAgICAgICAgICAgXzB4NTJmMjRhWzB4ODhhICsgLTB4MWJlYSArIC0weDEgKiAtMHgxMzY5XSA9CiAgICAgICAgICAgICAgICAgICAgXzB4NTJmMjRhWzB4ZjRkICsgLTB4MTc3ZCAqIC0weDEgKyAtMHgyNmMwXSA9CiAgICAgICAgICAgICAgICAgICAgXzB4NTJmMjRhWzB4MWUyMiArIDB4NjU1ICogMHgzICsgLTB4MzExNl0gPQogICAgICAgICAgICAgICAgICAgIF8weDUyZjI0YVstMHgxOTZiICsgMHgxOWIgKiAtMHgxMCArIC0weDJkICogLTB4MTIzXSA9CiAgICAgICAgICAgICAgICAgICAgXzB4NTJmMjRhWy0weDEgKiAtMHgyMjhkICsgMHgxY2ZjICsgLTB4M2Y3Y10gPQogICAgICAgICAgICAgICAgICAgIF8weDUyZjI0YVstMHgxM2I0ICsgLTB4NWJjICsgMHgxOTdlXSA9CiAgICAgICAgICAgICAgICAgICAgXzB4NTJmMjRhWzB4MWU2OCArIDB4MTIwOSArIC0weDMwNjJdID0KICAgICAgICAgICAgICAgICAgICAgIDB4MjZhMSArIC0weDEyNCAqIC0weDIwICsgLTB4NGIyMSkpLAogICAgICAgICAgICAgICAgKF8weDUyZjI0YVsweGJiMyArIDB4MTIxMCArIC0weDFkYjVdID0KICAgICAgICAgICAgICAgICAgdGhpc1tfMHg4YjY5NCgweDI1YildIDw8CiAgICAgICAgICAgICAgICAgICgtMHgxNSAqIC0weDFkNyArIDB4MiAqIC0weGMyYSArIC0weGU0YykpLAogICAgICAgICAgICAgICAgKF8weDUyZjI0YVstMHgxOWUyICsgMHgyOCAqIDB4NTUgKyAweGNhOV0gPQogICAgICAgICAgICAgICAgICAodGhpc1tfMHg4YjY5NCgweDFjZCldIDw8CiAgICAgICAgICAgICAgICAgICAgKC0weDE3OCAqIDB4NiArIDB4YTY3ICsgMHgxOTQgKiAtMHgxKSkgfAogICAgICAgICAgICAgICAgICAodGhpc1tfMHg4YjY5NCgweDI1YildID4+PgogICAgICAgICAgICAgICAgICAgICgweDFhNjUgKyAtMHgxOCAqIDB4NDQgKyAtMHgxNmMgKiAweGUpKSksCiAgICAgICAgICAgICAgICB0aGlzWyJoYXNoIl0oKTsKICAgICAgICAgICAgfQogICAgICAgICAgfSksCiAgICAgICAgICAoXzB4MjJmOTAyW18weDJkYjI5NigweDM0NCldW18weDJkYjI5NigweDJiYSldID0gZnVuY3Rpb24gKCkgewogICAgICAgICAgICB2YXIgXzB4MmYwMTQ5ID0gXzB4MmRiMjk2LAogICAgICAgICAgICAgIF8weDIyN2YyMywKICAgICAgICAgICAgICBfMHgzOTUyYWYsCiAgICAgICAgICAgICAgXzB4MmEwYzk0LAogICAgICAgICAgICAgIF8weDM5ZWI2NCwKICAgICAgICAgICAgICBfMHgyZmQ2NDEsCiAgICAgICAgICAgICAgXzB4MTEzNjc4LAogICAgICAgICAgICAgIF8weDEyOGQzMiA9IHRoaXNbXzB4MmYwMTQ5KDB4MzE5KV07CiAgICAgICAgICAgIHRoaXNbImZpcnN0Il0KICAgICAgICAgICAgICA/IChfMHgzOTUyYWYgPQogICAgICAgICAgICAgICAgICAoKCgoXzB4Mzk1MmFmID0KICAgICAgICAgICAgICAgICAgICAoKF8weDIyN2YyMyA9CiAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MjI3ZjIzID0KICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWzB4ZSAqIDB4ZDQgKyAweDE4YiAqIC0weDEzICsgMHgxMWI5XSAtCiAgICAgICAgICAgICAgICAgICAgICAgICgweDFmZmU0NzJkICsgLTB4MSAqIDB4MjI5YjRiZWIgKyAweDhhM2FjZGIgKiAweDUpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAoLTB4ZTMgKyAweDc5NCAqIDB4NSArIDB4MiAqIC0weDEyN2QpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgPj4+ICgtMHgyMTI1ICsgMHgyMWQ0ICsgLTB4OTYpKSkgLQogICAgICAgICAgICAgICAgICAgICAgICAoLTB4YTQyNzEzYyArIC0weDEzMSAqIC0weGM0ZmFmICsgMHhiYzlkNjM0KSkgPDwKICAgICAgICAgICAgICAgICAgICAgICgtMHg3NiArIC0weDEzZWUgKyAweDE0NjQpKSBeCiAgICAgICAgICAgICAgICAgICAgICAoKF8weDJhMGM5NCA9CiAgICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgyYTBjOTQgPQogICAgICAgICAgICAgICAgICAgICAgICAgICgtKDB4MWQ5OSAqIC0weDIzNmYgKyAweGRmICogLTB4NDRiZTMgKyAweDE4MDkyZjhiKSBeCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKF8weDM5ZWI2NCA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgzOWViNjQgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtKAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgLTB4ZmMgKiAtMHhhZjAzMDMgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgMHg1MjRkMmYzMiArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHhjZWRjZCAqIDB4YmI0CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKSBeCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKDB4MSAqIDB4N2I0NzBlYmQgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAweDEgKiAweDRkNjRlODZjICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgLTB4NTEzNDdmYjIpICYKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjI3ZjIzKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDI2ODQgKyAweDFmNGUgKiAtMHgxICsgMHg4ZiAqIDB4N2QKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBdIC0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHg1NjNmMGUgKiAtMHgxNiArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAweDU5MDAzYWUgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgMHg0NmZhZGRkICogMHgyKSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4Njg0ICsgMHhhICogMHgyODkgKyAtMHgxYSAqIDB4YjkpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgxMTE2ICogLTB4MiArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIDB4ZWU5ICogLTB4MSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDEzMmYgKiAweDEpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDI2ODcgKiAtMHgxICsgMHhmZTMgKyAtMHgxICogMHgzNjZhKSkgJgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLSgweDFhOTE1N2YgKyAweDFlMGRmNjQ1ICsgLTB4Zjg0Yjc0ZCkgXgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWzB4MTQ0ZCArIDB4MTViICogLTB4MTggKyAweGMzZF0gLQogICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgxICogMHg1NTA0ZWViYSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAweDc2ZjNmOTZmICogMHgxICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDIgKiAtMHgxMDlhZDNiOSkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MWFmNCArIC0weDEyY2IgKyAtMHg4MTgpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDdhYSAqIDB4MSArIC0weDE5OTQgKiAtMHgxICsgLTB4MjEyZikpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzllYjY0KSA8PAogICAgICAgICAgICAgICAgICAgICAgICAoLTB4OWZjICsgLTB4MTQgKiAweGZhICsgLTB4MWQ4NCAqIC0weDEpKSAmCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzOWViNjQgXiBfMHgyMjdmMjMpKSkgKwogICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHgyYSAqIDB4OTcgKyAweDE4YzggKyAweDEgKiAweDFdIC0KICAgICAgICAgICAgICAgICAgICAoLTB4OTkyICogMHg5MzYxICsgMHgyM2IxYzQgKyAweDEgKiAweDUzZDM0YTE3KSkgPDwKICAgICAgICAgICAgICAgICAgICAoLTB4NyAqIDB4MWIxICsgLTB4MjM0ZCArIC0weDEzNiAqIC0weDI3KSkgfAogICAgICAgICAgICAgICAgICAgIChfMHgzOTUyYWYgPj4+CiAgICAgICAgICAgICAgICAgICAgICAoLTB4MTEzZiAqIDB4MSArIDB4NSAqIC0weDdmICsgMHgxY2MgKiAweGIpKSkgKwogICAgICAgICAgICAgICAgICAgIF8weDJhMGM5NCkgPDwKICAgICAgICAgICAgICAgICAgKC0weDRmMCArIC0weDEgKiAtMHgxZjNkICsgLTB4MWE0ZCkpCiAgICAgICAgICAgICAgOiAoKF8weDIyN2YyMyA9IHRoaXNbImgwIl0pLAogICAgICAgICAgICAgICAgKF8weDM5NTJhZiA9IHRoaXNbImgxIl0pLAogICAgICAgICAgICAgICAgKF8weDJhMGM5NCA9IHRoaXNbImgyIl0pLAogICAgICAgICAgICAgICAgKF8weDM5NTJhZiA9CiAgICAgICAgICAgICAgICAgICgoKChfMHgzOTUyYWYgKz0KICAgICAgICAgICAgICAgICAgICAoKF8weDIyN2YyMyA9CiAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MjI3ZjIzICs9CiAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4MzllYjY0ID0gdGhpc1siaDMiXSkgXgogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzOTUyYWYgJiAoXzB4MmEwYzk0IF4gXzB4MzllYjY0KSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWzB4M2E1ICsgLTB4MTY4NCArIDB4MTJkZiAqIDB4MV0gLQogICAgICAgICAgICAgICAgICAgICAgICAoMHgyYjI2YmRjMiArIC0weDEgKiAtMHg0NDY4OTUyYiArIC0weDU3NzMgKiAweGNmYzcpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAoLTB4MTgwNSArIC0weDE4Y2IgKyAweDMwZDcpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgPj4+CiAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MjFlYyAqIC0weDEgKyAtMHg1M2MgKiAtMHgxICsgMHgxY2M5KSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4Mzk1MmFmKSA8PAogICAgICAgICAgICAgICAgICAgICAgKDB4ZmUwICsgMHgxNmE0ICsgLTB4MjY4NCkpIF4KICAgICAgICAgICAgICAgICAgICAgICgoXzB4MmEwYzk0ID0KICAgICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDJhMGM5NCArPQogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzOTUyYWYgXgogICAgICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgzOWViNjQgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MzllYjY0ICs9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCBeCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzICYgKF8weDM5NTJhZiBeIF8weDJhMGM5NCkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgMHgxICogLTB4NDgwICsgMHgxICogMHgxMTJmICsgLTB4Y2FlCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXSAtCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MWU0ZDBiY2YgKyAweDFiZSAqIC0weGJmZTJiICsgMHhkZDAwYmM1KSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MjZmZSArIC0weDQ2MiArIDB4MmI2YykpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MzllYjY0ID4+PgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDEgKiAweDI1MSArIC0weGQxNiArIDB4ZjdiKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgyMjdmMjMpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDE1YmUgKiAweDEgKyAweDJlMyAqIDB4OCArIC0weDJjZDYpKSAmCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgXiBfMHgzOTUyYWYpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsKICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weGE1ICogLTB4MWQgKyAweDUgKiAtMHgxMDUgKyAweDJmICogLTB4NGEKICAgICAgICAgICAgICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxNSAqIDB4MjdjMjUxOSArIC0weDFjYjgzODc4ICsgMHg2NTRjZjIzICogMHgyKSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4OWQ1ICsgLTB4MjIxZSArIC0weGVhYyAqIC0weDMpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHg3MTggKiAweDIgKyAtMHg1ICogLTB4NTU2ICsgLTB4NDI1ICogMHgzKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOWViNjQpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICgweDIyMyAqIC0weGIgKyAtMHg5MiAqIDB4MjIgKyAweDJhZTUpKSAmCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzOWViNjQgXiBfMHgyMjdmMjMpKSkgKwogICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHgxNDFjICsgMHgzNzYgKyAweDEwYTldIC0KICAgICAgICAgICAgICAgICAgICAoMHgyOWYwNjM0NiArIDB4MTRlOTBmODcgKiAtMHgzICsgLTB4MyAqIC0weDFiYWVmZWNiKSkgPDwKICAgICAgICAgICAgICAgICAgICAoMHgxMDNhICsgLTB4MjRmNCArIDB4MTRkMCkpIHwKICAgICAgICAgICAgICAgICAgICAoXzB4Mzk1MmFmID4+PiAoLTB4MTZhNSArIC0weGU5MiArIDB4YmIgKiAweDMzKSkpICsKICAgICAgICAgICAgICAgICAgICBfMHgyYTBjOTQpIDw8CiAgICAgICAgICAgICAgICAgICgweDI1YTIgKiAweDEgKyAweDFhNzYgKyAtMHg0MDE4ICogMHgxKSkpLAogICAgICAgICAgICAgIChfMHgzOTUyYWYgPQogICAgICAgICAgICAgICAgKCgoKF8weDM5NTJhZiArPQogICAgICAgICAgICAgICAgICAoKF8weDIyN2YyMyA9CiAgICAgICAgICAgICAgICAgICAgKCgoKF8weDIyN2YyMyArPQogICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCBeIChfMHgzOTUyYWYgJiAoXzB4MmEwYzk0IF4gXzB4MzllYjY0KSkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHgyNTUyICsgMHg1NzcgKyAweDFmZGZdIC0KICAgICAgICAgICAgICAgICAgICAgICgtMHhlYzVhNGUxICsgMHgyM2ZlNCAqIC0weDc4YyArIC0weDllICogLTB4NDQ3YWJmKSkgPDwKICAgICAgICAgICAgICAgICAgICAgICgtMHg0NmUgKyAweDE5YjUgKyAtMHg4ICogMHgyYTgpKSB8CiAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzID4+PiAoMHgxMDBlICsgMHhkNjMgKyAtMHgxZDU4KSkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDM5NTJhZikgPDwKICAgICAgICAgICAgICAgICAgICAoLTB4MjM3ZCArIDB4MTk1NSAqIC0weDEgKyAweDNjZDIpKSBeCiAgICAgICAgICAgICAgICAgICAgKChfMHgyYTBjOTQgPQogICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDJhMGM5NCArPQogICAgICAgICAgICAgICAgICAgICAgICAoXzB4Mzk1MmFmIF4KICAgICAgICAgICAgICAgICAgICAgICAgICAoKF8weDM5ZWI2NCA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MzllYjY0ICs9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyYTBjOTQgXgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgJiAoXzB4Mzk1MmFmIF4gXzB4MmEwYzk0KSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWy0weDIwMyArIDB4ZDU0ICsgLTB4MmQzICogMHg0XSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDEgKiAtMHgyMGUzYzY3NSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgMHg4ZWY4ZTMyNSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgMHg0ZTUzZmQgKiAtMHg3ZSkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHg5ZTMgKiAweDIgKyAweDIgKiAtMHg4ZmQgKyAweDI1Y2MpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzOWViNjQgPj4+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDdiZCArIDB4MiAqIC0weDg0NCArIDB4MTg1OSAqIDB4MSkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgzZGMgKyAtMHgxMjJlICsgMHgzMjYgKiAweDcpKSAmCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzIF4gXzB4Mzk1MmFmKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWy0weGJmZCArIC0weDEgKiAweGJhMyArIDB4MTdhNl0gLQogICAgICAgICAgICAgICAgICAgICAgICAoLTB4OTNmOGJiZTAgKyAtMHg0M2RjYmI1NSArIDB4MSAqIDB4MTJmYTUzMTIyKSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgKDB4MTg1ICogLTB4MTAgKyAtMHg3NmMgKyAweDFmY2QpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyYTBjOTQgPj4+ICgweDE5YiArIDB4NTEgKiAweDZkICsgMHgxNzEgKiAtMHgxOSkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5ZWI2NCkgPDwKICAgICAgICAgICAgICAgICAgICAgICgweDk3MSArIDB4MTk1OCArIC0weDUgKiAweDZmNSkpICYKICAgICAgICAgICAgICAgICAgICAgIChfMHgzOWViNjQgXiBfMHgyMjdmMjMpKSkgKwogICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbLTB4OTc4ICogLTB4MyArIDB4MzE1ICsgLTB4MiAqIDB4ZmJiXSAtCiAgICAgICAgICAgICAgICAgICgtMHg5OTAyNmEgKyAweGE2YmE2ICogMHg0NyArIDB4YzQ5MjcgKiAweDkpKSA8PAogICAgICAgICAgICAgICAgICAoMHgyMTIgKyAweDEgKiAweDRjMyArIDB4YiAqIC0weDlkKSkgfAogICAgICAgICAgICAgICAgICAoXzB4Mzk1MmFmID4+PiAoLTB4MTUyYSArIDB4MSAqIC0weDE3YjQgKyAtMHg3N2MgKiAtMHg2KSkpICsKICAgICAgICAgICAgICAgICAgXzB4MmEwYzk0KSA8PAogICAgICAgICAgICAgICAgKC0weGE3ICogMHgxZiArIDB4MjM3OSArIC0weGY0MCkpLAogICAgICAgICAgICAgIChfMHgzOTUyYWYgPQogICAgICAgICAgICAgICAgKCgoKF8weDM5NTJhZiArPQogICAgICAgICAgICAgICAgICAoKF8weDIyN2YyMyA9CiAgICAgICAgICAgICAgICAgICAgKCgoKF8weDIyN2YyMyArPQogICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCBeIChfMHgzOTUyYWYgJiAoXzB4MmEwYzk0IF4gXzB4MzllYjY0KSkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHgyNTFhICsgLTB4MTQgKiAtMHgxOGQgKyAweDYxZV0gKwogICAgICAgICAgICAgICAgICAgICAgKDB4YjE5ZjMwNTEgKyAtMHhiNDg3YmRhMSAqIDB4MSArIDB4NmM2OTI2MjgpKSA8PAogICAgICAgICAgICAgICAgICAgICAgKDB4MWNjICsgLTB4MTcxYSArIDB4MTU1NSkpIHwKICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgPj4+ICgweDEgKiAtMHgyMjNiICsgLTB4MjgyICsgMHgyNGQ2KSkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDM5NTJhZikgPDwKICAgICAgICAgICAgICAgICAgICAoMHgxNDUzICsgMHgxYWVlICsgLTB4MmY0MSkpIF4KICAgICAgICAgICAgICAgICAgICAoKF8weDJhMGM5NCA9CiAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MmEwYzk0ICs9CiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzOTUyYWYgXgogICAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4MzllYjY0ID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgzOWViNjQgKz0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCBeCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyAmIChfMHgzOTUyYWYgXiBfMHgyYTBjOTQpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbLTB4MWM2MyArIC0weDFhODggKyAweDM2ZjRdIC0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MzM0MDE3YmEgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIDB4MSAqIC0weDkwZDdhZjhkICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHg4NiAqIC0weDE5MWNmODYpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MWRiMiArIDB4MSAqIDB4MTBiMSArIDB4ZDBkKSkgfAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MzllYjY0ID4+PgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHg0ICogLTB4MjAgKyAtMHhkODEgKiAtMHgxICsgLTB4ZGVkKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjI3ZjIzKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDJiMCArIDB4NCAqIC0weDViMCArIC0weDk0ICogLTB4MmMpKSAmCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzIF4gXzB4Mzk1MmFmKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWy0weDEgKiAtMHhmMjUgKyAweGU3NSAqIDB4MSArIC0weDFkOTBdIC0KICAgICAgICAgICAgICAgICAgICAgICAgKC0weDUgKiAweDRlYiArIDB4MTJmZjMgKiAtMHgxICsgMHgxICogMHgxZWNkOSkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICgtMHhhNDMgKyAweDFlZWQgKyAweDEgKiAtMHgxNDk5KSkgfAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmEwYzk0ID4+PiAoLTB4MTg3OCArIC0weDkyYiArIDB4MjFiMikpKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5ZWI2NCkgPDwKICAgICAgICAgICAgICAgICAgICAgICgtMHgxICogMHgyNTE1ICsgLTB4OGM4ICsgLTB4M2IgKiAtMHhjNykpICYKICAgICAgICAgICAgICAgICAgICAgIChfMHgzOWViNjQgXiBfMHgyMjdmMjMpKSkgKwogICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHg4MGIgKiAtMHg0ICsgMHhmZjUgKyAweDEwNDJdIC0KICAgICAgICAgICAgICAgICAgKC0weDJkNDc5MTYxICogMHg1ICsgLTB4MTM5ICogMHgzMzY4NWQgKyAweDE5N2UzOThkYykpIDw8CiAgICAgICAgICAgICAgICAgICgtMHgxNzggKyAtMHgyMmJmICsgMHgxICogMHgyNDRkKSkgfAogICAgICAgICAgICAgICAgICAoXzB4Mzk1MmFmID4+PiAoMHgxNWNjICsgLTB4MjZiNiArIC0weDUgKiAtMHgzNjQpKSkgKwogICAgICAgICAgICAgICAgICBfMHgyYTBjOTQpIDw8CiAgICAgICAgICAgICAgICAoMHgyOTMgKiAtMHgyICsgMHgxOGY3ICsgLTB4MTNkMSkpLAogICAgICAgICAgICAgIChfMHgzOTUyYWYgPQogICAgICAgICAgICAgICAgKCgoKF8weDM5NTJhZiArPQogICAgICAgICAgICAgICAgICAoKF8weDIyN2YyMyA9CiAgICAgICAgICAgICAgICAgICAgKCgoKF8weDIyN2YyMyArPQogICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCBeIChfMHgzOTUyYWYgJiAoXzB4MmEwYzk0IF4gXzB4MzllYjY0KSkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHgxMjI1ICsgLTB4YSAqIC0weDM0OCArIDB4MTMgKiAtMHhjNV0gKwogICAgICAgICAgICAgICAgICAgICAgKC0weDM2ZjNlMDVjICsgMHg0NDQ1NTM4YyArIDB4NWUzZTlkZjIpKSA8PAogICAgICAgICAgICAgICAgICAgICAgKC0weDFiMyAqIC0weDMgKyAweDI3MDIgKyAtMHgyYzE0KSkgfAogICAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyA+Pj4gKC0weDIgKiAweDEwMDYgKyAweDI1ICogMHhjNSArIDB4M2FjKSkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDM5NTJhZikgPDwKICAgICAgICAgICAgICAgICAgICAoMHgyNTAxICsgMHgxOGZiICsgMHhmN2YgKiAtMHg0KSkgXgogICAgICAgICAgICAgICAgICAgICgoXzB4MmEwYzk0ID0KICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgyYTBjOTQgKz0KICAgICAgICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiBeCiAgICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgzOWViNjQgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDM5ZWI2NCArPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmEwYzk0IF4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzICYgKF8weDM5NTJhZiBeIF8weDJhMGM5NCkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHgxM2NiICsgLTB4Y2Q0ICsgMHgyMGFjXSAtCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgyNCAqIDB4MWU5YWU2ICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHhhMGJhMSAqIDB4NzIgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDE4Y2MxICogLTB4NzM3KSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4NzAyICsgMHgyYiAqIC0weDM1ICsgMHgxZjEpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzOWViNjQgPj4+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDE1ZGQgKyAtMHgyMmViICogLTB4MSArIDB4MSAqIC0weGNmYSkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDIyNGIgKiAweDEgKyAweDJmICogMHgzMyArIDB4NCAqIC0weGFlYSkpICYKICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgXiBfMHgzOTUyYWYpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHhlYzcgKiAtMHgxICsgLTB4NjEgKiAtMHgyNSArIDB4ZDBdIC0KICAgICAgICAgICAgICAgICAgICAgICAgKDB4NDhlODcxNjQgKyAweDYxM2NiODQxICsgLTB4NTA5ZTZkMzMpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAoLTB4MWMwZCArIDB4NWQwICsgMHgxNjRlKSkgfAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmEwYzk0ID4+PiAoMHgxNTZhICogMHgxICsgMHgxNmU3ICsgLTB4MmM0MikpKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5ZWI2NCkgPDwKICAgICAgICAgICAgICAgICAgICAgICgtMHgxICogLTB4MTllYyArIDB4OGI0ICsgLTB4MjJhMCkpICYKICAgICAgICAgICAgICAgICAgICAgIChfMHgzOWViNjQgXiBfMHgyMjdmMjMpKSkgKwogICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHgxZGYwICsgLTB4MjM2NSArIC0weDEgKiAtMHg1ODRdICsKICAgICAgICAgICAgICAgICAgKDB4MzRlYjcgKiAweDI1ZjAgKyAtMHgzICogLTB4MWE2MTZhMDggKyAtMHg4MmVhNzQ4NykpIDw8CiAgICAgICAgICAgICAgICAgICgtMHgzICogMHhjOGMgKyAweDFmYzIgKiAtMHgxICsgLTB4NDU3YyAqIC0weDEpKSB8CiAgICAgICAgICAgICAgICAgIChfMHgzOTUyYWYgPj4+ICgtMHgyNDY0ICsgMHgyNzA1ICsgLTB4ZGQgKiAweDMpKSkgKwogICAgICAgICAgICAgICAgICBfMHgyYTBjOTQpIDw8CiAgICAgICAgICAgICAgICAoLTB4NTA0ICsgMHgyICogLTB4NWY5ICsgMHgxMGY2KSksCiAgICAgICAgICAgICAgKF8weDM5NTJhZiA9CiAgICAgICAgICAgICAgICAoKCgoXzB4Mzk1MmFmICs9CiAgICAgICAgICAgICAgICAgICgoXzB4MzllYjY0ID0KICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MzllYjY0ICs9CiAgICAgICAgICAgICAgICAgICAgICAoXzB4Mzk1MmFmIF4KICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCAmCiAgICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgyMjdmMjMgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDIyN2YyMyArPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmEwYzk0IF4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MzllYjY0ICYgKF8weDM5NTJhZiBeIF8weDJhMGM5NCkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsweDFiNGQgKyAweDJkNCAqIDB4NSArIC0weDI5NzBdIC0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MzAxMzkgKiAweDhkICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHg3MzhmN2MyICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHgxICogLTB4ZjczMjVmYikpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDFhY2MgKyAtMHgxM2U1ICsgLTB4NmUyKSkgfAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzID4+PgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDcgKiAweDEgKyAtMHgxMGU5ICsgMHgxMGZkICogMHgxKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4Mzk1MmFmKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDE4ZmQgKyAweDEwY2MgKyAweDgzMSkpIF4KICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5NTJhZikpKSArCiAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHgyICogMHgxMzFlICsgLTB4MjUxMSArIDB4MSAqIC0weDEyNV0gLQogICAgICAgICAgICAgICAgICAgICAgKC0weDFmICogLTB4Mzk1M2VlYSArCiAgICAgICAgICAgICAgICAgICAgICAgIC0weDQgKiAtMHgxMjc4NmMwZiArCiAgICAgICAgICAgICAgICAgICAgICAgIC0weDc5MzUwMWQyKSkgPDwKICAgICAgICAgICAgICAgICAgICAgICgweDIxMGQgKyAweDExICogLTB4MjQxICsgMHg1NGQgKiAweDEpKSB8CiAgICAgICAgICAgICAgICAgICAgICAoXzB4MzllYjY0ID4+PiAoLTB4NCAqIC0weDI2NSArIC0weDI5MiArIDB4ZmQgKiAtMHg3KSkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykgPDwKICAgICAgICAgICAgICAgICAgICAoLTB4MjAwYiArIC0weGEgKiAweGZmICsgLTB4MSAqIC0weDJhMDEpKSBeCiAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyAmCiAgICAgICAgICAgICAgICAgICAgICAoKF8weDJhMGM5NCA9CiAgICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgyYTBjOTQgKz0KICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzIF4gKF8weDM5NTJhZiAmIChfMHgzOWViNjQgXiBfMHgyMjdmMjMpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHg5MiAqIC0weDEzICsgMHg2YjAgKyAtMHgxMTdiXSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDRiZThlNzU4ICsgLTB4MWEzYyAqIC0weDFlMzhmICsgMHg0MGI5NjYyNSkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDEgKiAweDEzZDEgKyAweDIyZGEgKyAtMHhlZmIpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCA+Pj4gKDB4MTY2ZCArIC0weDk1NSArIC0weGQwNikpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzllYjY0KSA8PAogICAgICAgICAgICAgICAgICAgICAgICAoLTB4MTNhZiAqIDB4MSArIC0weDEgKiAtMHgxMzA3ICsgMHhhOCkpIF4KICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzllYjY0KSkpICsKICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWy0weDU0NyArIC0weDEgKiAweDFjMGIgKyAtMHgyMTUyICogLTB4MV0gLQogICAgICAgICAgICAgICAgICAoMHg3ICogMHgxNGQ4MjhhICsgMHg3ZDRhNmY0ICsgLTB4MyAqIC0weDFjNzU1MzQpKSA8PAogICAgICAgICAgICAgICAgICAoMHgxYmI5ICogLTB4MSArIC0weDI2ZWUgKyAweDQyYmIgKiAweDEpKSB8CiAgICAgICAgICAgICAgICAgIChfMHgzOTUyYWYgPj4+ICgweDggKiAweDI5NiArIDB4MWNlOSAqIDB4MSArIC0weDMxOGQpKSkgKwogICAgICAgICAgICAgICAgICBfMHgyYTBjOTQpIDw8CiAgICAgICAgICAgICAgICAoMHg4OTcgKiAweDQgKyAweDJjYSArIDB4MyAqIC0weGM2MikpLAogICAgICAgICAgICAgIChfMHgzOTUyYWYgPQogICAgICAgICAgICAgICAgKCgoKF8weDM5NTJhZiArPQogICAgICAgICAgICAgICAgICAoKF8weDM5ZWI2NCA9CiAgICAgICAgICAgICAgICAgICAgKCgoKF8weDM5ZWI2NCArPQogICAgICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiBeCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyYTBjOTQgJgogICAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4MjI3ZjIzID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgyMjdmMjMgKz0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCBeCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCAmIChfMHgzOTUyYWYgXiBfMHgyYTBjOTQpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgMHgxMDdmICogLTB4MSArIC0weDEyOTkgKyAtMHg1OSAqIC0weDY1CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF0gLQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxMDc5YzI2MyArIC0weDE4ODkgKiAtMHgxMTAyNiArIC0weGJlMDcxNikpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgyNjBjICsgLTB4MWMyMyArIDB4MiAqIDB4MjExYSkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgyMmIgKiAweDEgKyAtMHgxNmYzICsgLTB4MTRlMyAqIC0weDEpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOTUyYWYpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxODNiICsgLTB4NSAqIC0weDcyYSArIC0weDNjMGQgKiAweDEpKSBeCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOTUyYWYpKSkgKwogICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWzB4NCAqIDB4ODZiICsgMHgxMDY0ICsgLTB4MzIwNl0gKwogICAgICAgICAgICAgICAgICAgICAgKC0weDExNzdmNTYgKyAtMHgyN2RlN2Y0ICsgLTB4NTQwZCAqIC0weDExZDEpKSA8PAogICAgICAgICAgICAgICAgICAgICAgKDB4MTY3ICogMHg1ICsgLTB4NSAqIDB4NTMxICsgMHgxMmZiICogMHgxKSkgfAogICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCA+Pj4gKDB4MjQ0YiArIC0weDEzICogMHgxMzkgKyAtMHg5ICogMHgxNzEpKSkgKwogICAgICAgICAgICAgICAgICAgICAgXzB4MjI3ZjIzKSA8PAogICAgICAgICAgICAgICAgICAgICgtMHhmNmQgKyAtMHgxZjllICsgMHgyZjBiICogMHgxKSkgXgogICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgJgogICAgICAgICAgICAgICAgICAgICAgKChfMHgyYTBjOTQgPQogICAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MmEwYzk0ICs9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyBeIChfMHgzOTUyYWYgJiAoXzB4MzllYjY0IF4gXzB4MjI3ZjIzKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHgxODcgKiAweDQgKyAweDFlNjkgKyAtMHgyNDc2XSAtCiAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDEwMTkxZWRlICsgLTB4ZDcyYTliNyArIDB4NDRlOWUyMTQpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICgweDkwICogMHhjICsgLTB4MiAqIDB4MTIgKyAtMHg2OGUpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDE2ICogMHgxYzUgKyAweDEzN2IgKyAweDFkICogLTB4MjAzKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOWViNjQpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICgtMHgxNGZhICsgMHg0MyAqIC0weDc0ICsgLTB4MzM1NiAqIC0weDEpKSBeCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5ZWI2NCkpKSArCiAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHhmNGEgKyAtMHgxOTkyICsgMHg0ICogMHhhMzhdIC0KICAgICAgICAgICAgICAgICAgKC0weGFlNjQ5NmMgKyAweDIxZWNlNWE4ICsgMHgxMjU2N2ZjKSkgPDwKICAgICAgICAgICAgICAgICAgKDB4MWFjOCArIC0weDFlZDIgKyAweDNlICogMHgxMSkpIHwKICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiA+Pj4gKDB4MTI2OCArIDB4MTAwZCArIDB4MSAqIC0weDIyNjkpKSkgKwogICAgICAgICAgICAgICAgICBfMHgyYTBjOTQpIDw8CiAgICAgICAgICAgICAgICAoMHgxODE3ICogLTB4MSArIDB4MjM5YiArIC0weGI4NCAqIDB4MSkpLAogICAgICAgICAgICAgIChfMHgzOTUyYWYgPQogICAgICAgICAgICAgICAgKCgoKF8weDM5NTJhZiArPQogICAgICAgICAgICAgICAgICAoKF8weDM5ZWI2NCA9CiAgICAgICAgICAgICAgICAgICAgKCgoKF8weDM5ZWI2NCArPQogICAgICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiBeCiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyYTBjOTQgJgogICAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4MjI3ZjIzID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgyMjdmMjMgKz0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCBeCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCAmIChfMHgzOTUyYWYgXiBfMHgyYTBjOTQpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHg1ICogMHgxOWMgKyAweGVmMyArIC0weDE2ZjZdICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MzlkNjJlNyArIDB4YjM5N2U5YiArIDB4MTMwYWVjNjQpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxMSAqIDB4MjFmICsgLTB4MWM2NiArIC0weDdhNCkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4Zjg2ICsgMHgyICogLTB4NGU1ICsgMHg4NzkgKiAweDMpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOTUyYWYpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgyNThhICsgMHgxOWVjICsgLTB4M2Y3NikpIF4KICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5NTJhZikpKSArCiAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHg5MTQgKyAweGQ3MyArIDB4MjBiICogLTB4Yl0gLQogICAgICAgICAgICAgICAgICAgICAgKC0weGFiNTJkMjEgKyAtMHg4NDVkOSAqIDB4MWY3ICsgMHg1N2JmNjJhYSkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAoLTB4MSAqIDB4MmYgKyAtMHgxMjgwICsgMHgxMmI4KSkgfAogICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCA+Pj4gKDB4MmUgKiAtMHg5ICsgMHg4NSAqIDB4NGIgKyAtMHgyNTQyKSkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykgPDwKICAgICAgICAgICAgICAgICAgICAoLTB4MTUxICogMHg5ICsgMHgyMGRhICsgLTB4MTUwMSkpIF4KICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzICYKICAgICAgICAgICAgICAgICAgICAgICgoXzB4MmEwYzk0ID0KICAgICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDJhMGM5NCArPQogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgXiAoXzB4Mzk1MmFmICYgKF8weDM5ZWI2NCBeIF8weDIyN2YyMykpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWy0weDg0ICogMHgzOSArIDB4NTdmICsgMHgyZmQgKiAweDhdIC0KICAgICAgICAgICAgICAgICAgICAgICAgICAoMHg4NTJhOTY3ICsgMHhhNDk0M2YyICsgLTB4NzcwZmFlMCkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDUgKiAtMHg3MjIgKyAweDEgKiAtMHgxNTVmICsgLTB4ZTNkKSkgfAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyYTBjOTQgPj4+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxNzFiICsgLTB4MjcwOSAqIDB4MSArIDB4OCAqIDB4MjAwKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOWViNjQpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICgtMHgyNjcgKyAweDZmYiAqIC0weDQgKyAtMHg3ICogLTB4NDU1KSkgXgogICAgICAgICAgICAgICAgICAgICAgICBfMHgzOWViNjQpKSkgKwogICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHhkNzMgKyAtMHhlM2YgKyAweGQ0XSArCiAgICAgICAgICAgICAgICAgICgtMHg4ODJiNmMxMiArIDB4MjZkZGNhYjUgKyAweDlkMSAqIDB4MTBmYTJhKSkgPDwKICAgICAgICAgICAgICAgICAgKC0weDEgKiAtMHhiMzEgKyAweGEgKiAtMHgxNzUgKyAweDM3NSkpIHwKICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiA+Pj4gKDB4MTA2ICogMHgyNiArIDB4MmU5ICsgLTB4MjljMSkpKSArCiAgICAgICAgICAgICAgICAgIF8weDJhMGM5NCkgPDwKICAgICAgICAgICAgICAgICgtMHgxOThhICsgMHhiMzMgKiAtMHgxICsgMHgyNGJkKSksCiAgICAgICAgICAgICAgKF8weDM5NTJhZiA9CiAgICAgICAgICAgICAgICAoKCgoXzB4Mzk1MmFmICs9CiAgICAgICAgICAgICAgICAgICgoXzB4MzllYjY0ID0KICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MzllYjY0ICs9CiAgICAgICAgICAgICAgICAgICAgICAoXzB4Mzk1MmFmIF4KICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCAmCiAgICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgyMjdmMjMgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDIyN2YyMyArPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmEwYzk0IF4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MzllYjY0ICYgKF8weDM5NTJhZiBeIF8weDJhMGM5NCkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsweDFkNGYgKyAtMHgxMGFlICsgLTB4Yzk0XSAtCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDc2ZDMxM2YgKiAweGQgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDUgKiAtMHg3YTYzNWZjICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHgyICogMHgxODU3M2I5MikpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDYxMiArIC0weDEgKiAweDQwICsgLTB4NWNkKSkgfAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzID4+PgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgxMmU5ICogMHgyICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDEgKiAtMHgxOWU3ICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDEgKiAtMHhjMDYpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOTUyYWYpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxMGRiICsgMHgxMGI1ICogMHgxICsgLTB4MyAqIDB4YjMwKSkgXgogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4Mzk1MmFmKSkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHg3OTYgKyAtMHgxM2I5ICsgMHgxYjUxXSAtCiAgICAgICAgICAgICAgICAgICAgICAoLTB4MTdlNWIgKiAweDI5ICsgMHg0ODA1OGUwICsgLTB4MTMyYzA0NSkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAoMHgyNmQgKiAtMHgyICsgMHg0ICogLTB4MzRlICsgLTB4NSAqIC0weDM5ZikpIHwKICAgICAgICAgICAgICAgICAgICAgIChfMHgzOWViNjQgPj4+CiAgICAgICAgICAgICAgICAgICAgICAgICgweDE5OGQgKiAtMHgxICsgLTB4MjVkNCArIC0weGE5NCAqIC0weDYpKSkgKwogICAgICAgICAgICAgICAgICAgICAgXzB4MjI3ZjIzKSA8PAogICAgICAgICAgICAgICAgICAgICgweDIwNmQgKyAtMHhkM2YgKyAtMHgxMzJlKSkgXgogICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgJgogICAgICAgICAgICAgICAgICAgICAgKChfMHgyYTBjOTQgPQogICAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MmEwYzk0ICs9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyBeIChfMHgzOTUyYWYgJiAoXzB4MzllYjY0IF4gXzB4MjI3ZjIzKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHgxZiAqIDB4OTUgKyAweDYgKiAtMHgzZGMgKyAtMHgzICogLTB4ZGJlCiAgICAgICAgICAgICAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDIgKiAweDVlYzg3NGJkICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDQ1MzdjNDFkICogLTB4MSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAweGRmYzgyODM2KSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxMzM2ICsgLTB4MTJiYyArIC0weDZjKSkgfAogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyYTBjOTQgPj4+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxMTkgKiAtMHgxZCArIC0weDMgKiAweGM0MSArIDB4NDRhYSAqIDB4MSkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzllYjY0KSA8PAogICAgICAgICAgICAgICAgICAgICAgICAoMHhlICogLTB4MjljICsgMHg0ZWEgKyAweDFmOWUpKSBeCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5ZWI2NCkpKSArCiAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsweDk4NSArIC0weDExNzcgKyAweDEgKiAweDdmZV0gLQogICAgICAgICAgICAgICAgICAoLTB4M2QyNzNhZiArIC0weDEgKiAtMHg3MjYxMTU5MCArIDB4NDQ3MTE5NSkpIDw8CiAgICAgICAgICAgICAgICAgICgweDExMiAqIDB4MTUgKyAtMHhhMzAgKyAtMHg0MTIgKiAweDMpKSB8CiAgICAgICAgICAgICAgICAgIChfMHgzOTUyYWYgPj4+ICgweDEgKiAweGU3NCArIDB4NiAqIDB4MWY3ICsgLTB4MWEzMikpKSArCiAgICAgICAgICAgICAgICAgIF8weDJhMGM5NCkgPDwKICAgICAgICAgICAgICAgICgweGYxICsgLTB4ZTQzICogLTB4MiArIC0weDFkNzcgKiAweDEpKSwKICAgICAgICAgICAgICAoXzB4Mzk1MmFmID0KICAgICAgICAgICAgICAgICgoKChfMHgzOTUyYWYgKz0KICAgICAgICAgICAgICAgICAgKChfMHgxMTM2NzggPQogICAgICAgICAgICAgICAgICAgIChfMHgzOWViNjQgPQogICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDM5ZWI2NCArPQogICAgICAgICAgICAgICAgICAgICAgICAoKF8weDJmZDY0MSA9IF8weDM5NTJhZiBeIF8weDJhMGM5NCkgXgogICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDIyN2YyMyArPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmZkNjQxIF4gXzB4MzllYjY0KSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHg4NyAqIC0weDEgKyAtMHgxICogLTB4MTYyNiArIC0weDE2YTgKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXSAtCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgzY2E3MiArIC0weGFjOTk1ICsgMHgxNDVhYzUpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MTIzMSArIC0weDEgKiAtMHhiMDUgKyAweDczMCkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgyMGRkICogMHgxICsgLTB4MTZiOCArIC0weGEwOSkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5NTJhZikgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgweDEgKiAweGU2MyArIDB4YTM0ICogLTB4MiArIDB4NjA1KSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWy0weDlhICogLTB4MjMgKyAweDI1ZmQgKyAtMHgzYjAzXSAtCiAgICAgICAgICAgICAgICAgICAgICAgICgweGIwNmM0NDRlICsgMHgyZDY4YyAqIDB4MTU3NCArIDB4OSAqIC0weGNmOGZlMDcpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAoMHgxZjYwICogLTB4MSArIC0weDFmYzIgKyAtMHgxICogLTB4M2YyZCkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCA+Pj4gKDB4MWMwZSArIDB4N2MgKiAtMHgzYiArIDB4OWIgKiAweDEpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICBfMHgyMjdmMjMpIDw8CiAgICAgICAgICAgICAgICAgICAgICAoLTB4MSAqIDB4N2RiICsgMHgxNDNkICogMHgxICsgLTB4MiAqIDB4NjMxKSkgXgogICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykgXgogICAgICAgICAgICAgICAgICAgIChfMHgyYTBjOTQgPQogICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDJhMGM5NCArPQogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MTEzNjc4IF4gXzB4Mzk1MmFmKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsweDEzMTUgKyAweDIyZjUgKyAtMHgzNWZmXSArCiAgICAgICAgICAgICAgICAgICAgICAgICgweDEgKiAtMHhjMWVlMjg2MSArIDB4NWY2NGExM2MgKyAweGQwMjZlODQ3KSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgKDB4MTBiICogMHgxNSArIDB4OWUyICsgLTB4MWZiOSkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgyMTNlICsgLTB4MTEgKiAtMHg5MyArIC0weDEgKiAweDJhZjEpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICBfMHgzOWViNjQpIDw8CiAgICAgICAgICAgICAgICAgICAgICAoLTB4NCAqIDB4N2M4ICsgMHgxICogMHgzM2QgKyAweDFiZTMpKSkgKwogICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHgxOGM1ICogMHgxICsgMHg5NGQgKiAtMHgzICsgMHgyICogMHgxOThdIC0KICAgICAgICAgICAgICAgICAgKDB4YmJiY2MzICsgMHgxNTA5ICogLTB4MmEzMiArIDB4NGQ2YTBmMykpIDw8CiAgICAgICAgICAgICAgICAgICgweDEyYjUgKiAweDEgKyAtMHhjICogMHhhMiArIC0weGIwNikpIHwKICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiA+Pj4gKC0weDU5NiAqIDB4NSArIDB4MiAqIC0weDY1NSArIDB4MjhhMSkpKSArCiAgICAgICAgICAgICAgICAgIF8weDJhMGM5NCkgPDwKICAgICAgICAgICAgICAgICgweDVmICogLTB4MzYgKyAweDJiMSAqIDB4NCArIDB4OTQ2KSksCiAgICAgICAgICAgICAgKF8weDM5NTJhZiA9CiAgICAgICAgICAgICAgICAoKCgoXzB4Mzk1MmFmICs9CiAgICAgICAgICAgICAgICAgICgoXzB4MTEzNjc4ID0KICAgICAgICAgICAgICAgICAgICAoXzB4MzllYjY0ID0KICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgzOWViNjQgKz0KICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgyZmQ2NDEgPSBfMHgzOTUyYWYgXiBfMHgyYTBjOTQpIF4KICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgyMjdmMjMgKz0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJmZDY0MSBeIF8weDM5ZWI2NCkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbLTB4YWE5ICsgMHg2ICogMHg1NGUgKyAweDdlICogLTB4MmJdIC0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDEzMDlkICogLTB4NjdiMyArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgLTB4OGU5N2VjZDYgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIDB4NmU3NGQ5Y2IpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MSAqIDB4MTE2OSArIC0weDFjM2YgKyAweDJkYWMpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgPj4+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDEyZiAqIDB4MWQgKyAweDE3OCArIDB4MjBmNykpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5NTJhZikgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgxNTU0ICsgMHgyICogLTB4MTM2ZSArIDB4OSAqIDB4NmIwKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWzB4OGJkICogMHg0ICsgMHg5OTMgKyAtMHgyYzgzXSArCiAgICAgICAgICAgICAgICAgICAgICAgICgtMHgxZWMxY2UyOSArIDB4MTJkOWQzMjMgKyAweDU3YzZjYWFmKSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgKDB4MmY5ICogMHgxICsgMHgxYTU1ICsgLTB4MWQ0MykpIHwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCA+Pj4gKC0weGRmNiArIDB4OTQgKiAweDIgKyAweGNlMykpKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykgPDwKICAgICAgICAgICAgICAgICAgICAgICgtMHhkNSArIC0weDE5N2UgKyAweDFhNTMpKSBeIF8weDIyN2YyMykgXgogICAgICAgICAgICAgICAgICAgIChfMHgyYTBjOTQgPQogICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDJhMGM5NCArPQogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MTEzNjc4IF4gXzB4Mzk1MmFmKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsweDY5NyAqIC0weDEgKyAtMHg2MTcgKyAweGNiNV0gLQogICAgICAgICAgICAgICAgICAgICAgICAoMHgyICogLTB4MTFkZTQ1OSArIDB4YWFiYmE4OCArIDB4ZDRjMmNhKSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgKC0weDExOTggKiAweDEgKyAtMHg0MmMgKiAweDMgKyAweDIgKiAweGYxNikpIHwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgyOGUgKiAweDIgKyAweDE1NDcgKyAtMHgxMjUgKiAweDE3KSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzllYjY0KSA8PAogICAgICAgICAgICAgICAgICAgICAgKDB4NDUgKiAweDIxICsgLTB4MTQgKiAtMHg3ICsgMHg5NzEgKiAtMHgxKSkpICsKICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWy0weDEgKiAtMHgxMThiICsgMHgxZjQgKyAtMHgxMzc1XSAtCiAgICAgICAgICAgICAgICAgICgweDIgKiAtMHgzNGVkNjJiZCArIC0weDZkMzlhNDQ1ICsgLTB4MTE4NTRhZDRmICogLTB4MSkpIDw8CiAgICAgICAgICAgICAgICAgICgtMHgyN2YgKiAtMHgxICsgLTB4NCAqIDB4MzFhICsgMHhhMDApKSB8CiAgICAgICAgICAgICAgICAgIChfMHgzOTUyYWYgPj4+ICgtMHgzMTkgKyAtMHgxICogLTB4MjQ3ZCArIC0weDIxNWIgKiAweDEpKSkgKwogICAgICAgICAgICAgICAgICBfMHgyYTBjOTQpIDw8CiAgICAgICAgICAgICAgICAoLTB4MWJjNyAqIDB4MSArIDB4MSAqIC0weDRmNyArIDB4MjBiZSkpLAogICAgICAgICAgICAgIChfMHgzOTUyYWYgPQogICAgICAgICAgICAgICAgKCgoKF8weDM5NTJhZiArPQogICAgICAgICAgICAgICAgICAoKF8weDExMzY3OCA9CiAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCA9CiAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MzllYjY0ICs9CiAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4MmZkNjQxID0gXzB4Mzk1MmFmIF4gXzB4MmEwYzk0KSBeCiAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MjI3ZjIzICs9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyZmQ2NDEgXiBfMHgzOWViNjQpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weDEgKiAtMHgxZWI1ICsgLTB4MWJhNSArIC0weDMgKiAweDEwMQogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MzM4ZDZkZGQgKyAweDEgKiAweDNkYjRjNzk5ICsgLTB4NDhhNmI2YjApKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxMjZhICsgMHgxICogMHg0MDcgKyAtMHgxNjZkICogMHgxKSkgfAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzID4+PgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgxZjk3ICsgLTB4MjU2NiAqIC0weDEgKyAweDViMyAqIC0weDEpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOTUyYWYpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgyMTc1ICsgMHgyMTg3ICogMHgxICsgLTB4NDJmYykpKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsweDE3MDEgKyAweDFmYjYgKyAweDM2YjcgKiAtMHgxXSAtCiAgICAgICAgICAgICAgICAgICAgICAgICgweDFlMzhhZDk5ICsgLTB4MyAqIC0weDE3MjdiMWMgKyAtMHhkMzE0NmU3KSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgKDB4MTUgKiAtMHgxOGQgKyAtMHg0ICogLTB4NzVlICsgMHgzMjQpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgzOWViNjQgPj4+ICgtMHg3ZjggKyAweDEgKiAweGMxICsgMHg3NGMpKSkgKwogICAgICAgICAgICAgICAgICAgICAgICBfMHgyMjdmMjMpIDw8CiAgICAgICAgICAgICAgICAgICAgICAoLTB4ODYgKiAweDI3ICsgLTB4MSAqIDB4MWE5MyArIC0weDE3ICogLTB4MjBiKSkgXgogICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykgXgogICAgICAgICAgICAgICAgICAgIChfMHgyYTBjOTQgPQogICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDJhMGM5NCArPQogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MTEzNjc4IF4gXzB4Mzk1MmFmKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsweDEgKiAtMHgxYzZmICsgLTB4MTBmMCArIC0weDRhICogLTB4OWRdIC0KICAgICAgICAgICAgICAgICAgICAgICAgKC0weDM1M2E1ICogMHhjZTcgKyAweDUxMGEwNWMgKiAweGUgKyAweGYxNDQwNTYpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAoMHgyYyAqIC0weDhmICsgLTB4MjAgKiAtMHgxMWIgKyAweDJhZiAqIC0weDQpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyYTBjOTQgPj4+CiAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDE2N2MgKiAtMHgxICsgMHgxYmVmICogLTB4MSArIDB4NTgzKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzllYjY0KSA8PAogICAgICAgICAgICAgICAgICAgICAgKC0weDMgKiAweDNiICsgMHgxNTU1ICsgMHhhNTIgKiAtMHgyKSkpICsKICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWzB4MzUgKiAtMHgyNyArIC0weDEgKiAweGRiOCArIC0weDEgKiAtMHgxNWQxXSArCiAgICAgICAgICAgICAgICAgICgweDJlMzlmOTcgKiAweDEgKyAtMHgxICogMHg1OGYwOWI0ICsgMHg3MzM4NzIyKSkgPDwKICAgICAgICAgICAgICAgICAgKDB4MWQzICogLTB4NiArIDB4MSAqIDB4MTcxYiArIDB4NDA2ICogLTB4MykpIHwKICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiA+Pj4gKDB4M2MxICsgLTB4MWNiZiArIDB4MTkwNykpKSArCiAgICAgICAgICAgICAgICAgIF8weDJhMGM5NCkgPDwKICAgICAgICAgICAgICAgICgweDFiNzMgKyAweDFkNDQgKyAweDM4YjcgKiAtMHgxKSksCiAgICAgICAgICAgICAgKF8weDM5NTJhZiA9CiAgICAgICAgICAgICAgICAoKCgoXzB4Mzk1MmFmICs9CiAgICAgICAgICAgICAgICAgICgoXzB4MTEzNjc4ID0KICAgICAgICAgICAgICAgICAgICAoXzB4MzllYjY0ID0KICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgzOWViNjQgKz0KICAgICAgICAgICAgICAgICAgICAgICAgKChfMHgyZmQ2NDEgPSBfMHgzOTUyYWYgXiBfMHgyYTBjOTQpIF4KICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzID0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgyMjdmMjMgKz0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJmZDY0MSBeIF8weDM5ZWI2NCkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHgzMGIgKiAweDIgKyAweGE1MiArIC0weDEwNWZdIC0KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MTMxICogMHgyNWU2NTUgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0weGU2MWUgKiAweDQ4YiArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgMHhlNWMgKiAtMHgzM2JiKSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MTdhMSArIC0weDI2ICogMHgzZiArIDB4MyAqIC0weDRjMSkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyA+Pj4gKDB4MTA3OSArIC0weDEzICogMHhmNSArIDB4MWQyKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4Mzk1MmFmKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weGYyNyArIC0weDEgKiAtMHgyMWQxICsgMHg5NTUgKiAtMHgyKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWzB4MjBlICogLTB4MyArIC0weDRhNyAqIDB4OCArIDB4MmI2ZV0gLQogICAgICAgICAgICAgICAgICAgICAgICAoMHgxICogMHg3OWYwZWEzICsgLTB4MTg0Y2VhMWQgKyAtMHgxMWQgKiAtMHgyNTkwZDkpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAoMHgxMmUzICsgMHgxMmIgKiAtMHgyICsgLTB4MTA4MikpIHwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4NDg1ICogMHgyICsgLTB4NjEgKiAweDFhICsgMHgxMmY5KSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MjI3ZjIzKSA8PAogICAgICAgICAgICAgICAgICAgICAgKDB4MSAqIC0weDM0YyArIC0weDYgKiAweDRkYyArIC0weDEgKiAtMHgyMDc0KSkgXgogICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykgXgogICAgICAgICAgICAgICAgICAgIChfMHgyYTBjOTQgPQogICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDJhMGM5NCArPQogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MTEzNjc4IF4gXzB4Mzk1MmFmKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHgzZTMgKyAweDIyZCAqIC0weDIgKyAweDg0Y10gKwogICAgICAgICAgICAgICAgICAgICAgICAoLTB4ZGI4NDQ2YyArIC0weDEgKiAtMHg1Y2IzYTgzICsgMHgyNzhmODZlMSkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICgtMHg3ICogLTB4M2YxICsgMHgxN2YgKiAweDcgKyAtMHgyNjAwKSkgfAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmEwYzk0ID4+PiAoLTB4NDdlICsgMHhjZSAqIDB4MiArIDB4MiAqIDB4MTc5KSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzllYjY0KSA8PAogICAgICAgICAgICAgICAgICAgICAgKDB4MSAqIDB4OWZlICsgMHgxICogMHgxN2Y1ICsgLTB4MjFmMykpKSArCiAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHgxOCAqIC0weDE4ZSArIC0weDFkZmYgKyAtMHg3NGYgKiAweDFdIC0KICAgICAgICAgICAgICAgICAgKDB4MTJmZWU1MDcgKyAtMHgxICogMHg2YTVjNDc2OSArIC0weDEgKiAtMHg5MmIxMGJmZCkpIDw8CiAgICAgICAgICAgICAgICAgICgweDUgKiAtMHg1MmEgKyAtMHgxZTc1ICsgMHhkZSAqIDB4NDEpKSB8CiAgICAgICAgICAgICAgICAgIChfMHgzOTUyYWYgPj4+ICgweDExNmIgKyAtMHgxICogMHg5ZWQgKyAweDUzICogLTB4MTcpKSkgKwogICAgICAgICAgICAgICAgICBfMHgyYTBjOTQpIDw8CiAgICAgICAgICAgICAgICAoMHgyNjRlICogLTB4MSArIC0weDExZmQgKyAweDM4NGIpKSwKICAgICAgICAgICAgICAoXzB4Mzk1MmFmID0KICAgICAgICAgICAgICAgICgoKChfMHgzOTUyYWYgKz0KICAgICAgICAgICAgICAgICAgKChfMHgzOWViNjQgPQogICAgICAgICAgICAgICAgICAgICgoKChfMHgzOWViNjQgKz0KICAgICAgICAgICAgICAgICAgICAgIChfMHgzOTUyYWYgXgogICAgICAgICAgICAgICAgICAgICAgICAoKF8weDIyN2YyMyA9CiAgICAgICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDIyN2YyMyArPQogICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCBeIChfMHgzOTUyYWYgfCB+XzB4MzllYjY0KSkgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWy0weDE1MjQgKyAweDY1ICogMHg1YiArIDB4MSAqIC0weGVjM10gLQogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4NjNjMGMzICogMHgxZiArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIDB4MTFhNjFmZCAqIC0weGMgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMHhjZmYxZGZiICogLTB4MSkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgzNmMgKyAtMHg0ZWIgKiAweDUgKyAweDE1MzEpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzID4+PgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4OTQxICogLTB4MiArIC0weDFiICogLTB4OWIgKyAtMHgyMmMxKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5NTJhZikgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxODYyICsgLTB4MTM1OSArIC0weDUwOSkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICB+XzB4MmEwYzk0KSkgKwogICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWy0weDI2ZCArIC0weDYgKiAweGJkICsgMHg2ZTJdICsKICAgICAgICAgICAgICAgICAgICAgICgtMHg2OTBjNyAqIDB4ZDZkICsKICAgICAgICAgICAgICAgICAgICAgICAgMHgyYzQzN2M4ZSAqIDB4MSArCiAgICAgICAgICAgICAgICAgICAgICAgIC0weDM3ODZhMTYyICogLTB4MikpIDw8CiAgICAgICAgICAgICAgICAgICAgICAoMHg1NGEgKyAtMHgxYmQzICsgMHgxNjkzKSkgfAogICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCA+Pj4gKDB4MTA3NiArIDB4YTBkICsgLTB4MWE2ZCkpKSArCiAgICAgICAgICAgICAgICAgICAgICBfMHgyMjdmMjMpIDw8CiAgICAgICAgICAgICAgICAgICAgKC0weDFkMzcgKyAweDEgKiAweDE0ZmIgKyAweDgzYykpIF4KICAgICAgICAgICAgICAgICAgICAoKF8weDJhMGM5NCA9CiAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MmEwYzk0ICs9CiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgXiAoXzB4MzllYjY0IHwgfl8weDM5NTJhZikpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWzB4MTkwZiAqIC0weDEgKyAtMHgxNTAzICsgMHgyZTIwXSAtCiAgICAgICAgICAgICAgICAgICAgICAgICgweDEyYWEzICogMHg4MGFkICsgMHg1ICogMHgxMjNlMmZhMyArIC0weDljZTY2MWZkKSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgKC0weDIwNGEgKyAtMHgyMmNmICsgMHg0MzI4KSkgfAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmEwYzk0ID4+PgogICAgICAgICAgICAgICAgICAgICAgICAgICgweDEgKiAweGNhYyArIC0weDFiYmYgKiAtMHgxICsgLTB4MTQyZCAqIDB4MikpKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5ZWI2NCkgPDwKICAgICAgICAgICAgICAgICAgICAgICgtMHgxMWI0ICsgMHgxMGIxICogMHgxICsgLTB4MjUgKiAtMHg3KSkgfAogICAgICAgICAgICAgICAgICAgICAgfl8weDIyN2YyMykpICsKICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWzB4MSAqIC0weDEwZCArIDB4NWY0ICsgLTB4MTkgKiAweDMyXSAtCiAgICAgICAgICAgICAgICAgICgweDIxODE1ODIgKyAtMHg1NWNhMTBlICsgMHg2YjBlYjUzKSkgPDwKICAgICAgICAgICAgICAgICAgKC0weGQzZCAqIDB4MSArIC0weDFkZDcgKyAtMHgxICogLTB4MmIyOSkpIHwKICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiA+Pj4gKDB4Njc2ICsgMHhhODQgKiAweDEgKyAtMHgxMGVmKSkpICsKICAgICAgICAgICAgICAgICAgXzB4MmEwYzk0KSA8PAogICAgICAgICAgICAgICAgKC0weDIgKiAweGM4MyArIDB4MTUgKiAtMHgxMGMgKyAtMHgxNzgxICogLTB4MikpLAogICAgICAgICAgICAgIChfMHgzOTUyYWYgPQogICAgICAgICAgICAgICAgKCgoKF8weDM5NTJhZiArPQogICAgICAgICAgICAgICAgICAoKF8weDM5ZWI2NCA9CiAgICAgICAgICAgICAgICAgICAgKCgoKF8weDM5ZWI2NCArPQogICAgICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiBeCiAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4MjI3ZjIzID0KICAgICAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MjI3ZjIzICs9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmEwYzk0IF4gKF8weDM5NTJhZiB8IH5fMHgzOWViNjQpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHgyICogLTB4NTI3ICsgMHgyNDZjICsgLTB4OGUgKiAweDJmXSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHg2MjM1OWVmMSArIDB4YzNiZDIxM2EgKyAtMHhjMDk3NjY2OCkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4MjJmYSAqIDB4MSArIDB4MmFmICsgMHgyMDUxKSkgfAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyA+Pj4gKC0weDkyYiArIC0weDRiNCAqIDB4MSArIDB4ZGY5KSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5NTJhZikgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAoMHg0OTQgKyAtMHgxOTAyICsgLTB4MSAqIC0weDE0NmUpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgfl8weDJhMGM5NCkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsweDFkOCAqIDB4MSArIDB4MSAqIC0weDVjZSArIDB4M2Y5XSAtCiAgICAgICAgICAgICAgICAgICAgICAoLTB4MzI0ICogLTB4NDk3MjIgKwogICAgICAgICAgICAgICAgICAgICAgICAweGRlICogMHgzMWFkM2IgKwogICAgICAgICAgICAgICAgICAgICAgICAtMHgxYmJhMjliZSAqIC0weDIpKSA8PAogICAgICAgICAgICAgICAgICAgICAgKDB4OTQxICsgLTB4MTY1MSArIC0weDRlICogLTB4MmIpKSB8CiAgICAgICAgICAgICAgICAgICAgICAoXzB4MzllYjY0ID4+PiAoMHgyICogLTB4YzIgKyAtMHgxMTJhICsgMHgxMmM0KSkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykgPDwKICAgICAgICAgICAgICAgICAgICAoMHgxMzY5ICsgLTB4MTI2MSArIC0weDMgKiAweDU4KSkgXgogICAgICAgICAgICAgICAgICAgICgoXzB4MmEwYzk0ID0KICAgICAgICAgICAgICAgICAgICAgICgoKChfMHgyYTBjOTQgKz0KICAgICAgICAgICAgICAgICAgICAgICAgKF8weDIyN2YyMyBeIChfMHgzOWViNjQgfCB+XzB4Mzk1MmFmKSkgKwogICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHgxMGM1ICsgMHg3OGYgKyAweDEgKiAtMHgxODRhXSAtCiAgICAgICAgICAgICAgICAgICAgICAgICgtMHgzYjYyYSAqIDB4NiArIDB4MTUyNDViICsgMHg4OTYxMiAqIDB4MikpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICgweDI1MmYgKyAtMHg1ICogLTB4NjYxICsgLTB4NDUwNSkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgyNTFlICsgMHg2ICogMHgyYjcgKyAtMHgzNTU3ICogMHgxKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzllYjY0KSA8PAogICAgICAgICAgICAgICAgICAgICAgKC0weDEgKiAtMHhhNzkgKyAtMHg4ZCAqIC0weDMzICsgLTB4MjY5MCkpIHwKICAgICAgICAgICAgICAgICAgICAgIH5fMHgyMjdmMjMpKSArCiAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlsweDM5NSAqIDB4OCArIC0weDI0YTkgKyAtMHg1MiAqIC0weDE5XSAtCiAgICAgICAgICAgICAgICAgICgtMHhjMzE5MTg1MyArIC0weDU3ZmRjZDggKiAweDI5ICsgLTB4MTQxZDAwZWUgKiAtMHgxYikpIDw8CiAgICAgICAgICAgICAgICAgICgweDEzMmIgKiAtMHgxICsgLTB4MTMgKiAtMHgxNSArIDB4MTFiMSkpIHwKICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiA+Pj4gKC0weDE3NWYgKyAweDE2ICogMHhjMiArIC0weDIgKiAtMHgzNWYpKSkgKwogICAgICAgICAgICAgICAgICBfMHgyYTBjOTQpIDw8CiAgICAgICAgICAgICAgICAoLTB4YyAqIC0weDJkZSArIC0weDEgKiAtMHgyNjFhICsgMHgxICogLTB4NDg4MikpLAogICAgICAgICAgICAgIChfMHgzOTUyYWYgPQogICAgICAgICAgICAgICAgKCgoKF8weDM5NTJhZiArPQogICAgICAgICAgICAgICAgICAoKF8weDM5ZWI2NCA9CiAgICAgICAgICAgICAgICAgICAgKCgoKF8weDM5ZWI2NCArPQogICAgICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiBeCiAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4MjI3ZjIzID0KICAgICAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MjI3ZjIzICs9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmEwYzk0IF4gKF8weDM5NTJhZiB8IH5fMHgzOWViNjQpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHg0ICogLTB4NTI3ICsgLTB4YjcxICsgMHgyMDE1ICogMHgxXSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgyICogLTB4MjQwNTU4N2MgKwogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAweDk2M2RjODg1ICogMHgxICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgMHgyMTc1NjZjMikpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoMHgxNGNiICsgLTB4NjQ3ICogLTB4MSArIC0weDFiMGMpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzID4+PgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4YmQgKiAweDMwICsgLTB4MTMgKiAweDE0ZiArIDB4NyAqIDB4OGExKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5NTJhZikgPDwKICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4ZCAqIDB4MjE1ICsgMHhjYyArIDB4MWE0NSkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICB+XzB4MmEwYzk0KSkgKwogICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWy0weDYzOCAqIDB4NiArIC0weDI1ZmEgKyAweDRiNTldIC0KICAgICAgICAgICAgICAgICAgICAgICgweGFiMWNkMiArIC0weDE4NGIxZjYgKyAweDJhY2FlNDQpKSA8PAogICAgICAgICAgICAgICAgICAgICAgKC0weDE3N2IgKyAtMHg1MDAgKyAweDFjODUpKSB8CiAgICAgICAgICAgICAgICAgICAgICAoXzB4MzllYjY0ID4+PgogICAgICAgICAgICAgICAgICAgICAgICAoLTB4MWU3MyArIC0weDMgKiAweDFmMSArIC0weDIgKiAtMHgxMjJlKSkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDIyN2YyMykgPDwKICAgICAgICAgICAgICAgICAgICAoMHhiNSAqIC0weDMgKyAweDE1OGYgKyAtMHg0ICogMHg0ZGMpKSBeCiAgICAgICAgICAgICAgICAgICAgKChfMHgyYTBjOTQgPQogICAgICAgICAgICAgICAgICAgICAgKCgoKF8weDJhMGM5NCArPQogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzIF4gKF8weDM5ZWI2NCB8IH5fMHgzOTUyYWYpKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHhlMzkgKyAweDQ1MiArIDB4OWVkXSAtCiAgICAgICAgICAgICAgICAgICAgICAgICgweDVhMjJkMmE0ICsgMHgzYTE0NjEyOCArIDB4MTU0YTM0ICogLTB4Mjk4KSkgPDwKICAgICAgICAgICAgICAgICAgICAgICAgKDB4MSAqIC0weDFmZDAgKyAweDE4MzcgKiAweDEgKyAweDdhOCkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCA+Pj4gKDB4MTIxMiArIDB4MiAqIC0weGM0NyArIDB4NjhkKSkpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MzllYjY0KSA8PAogICAgICAgICAgICAgICAgICAgICAgKC0weDIwYmEgKyAweGJiMiArIC0weDggKiAtMHgyYTEpKSB8CiAgICAgICAgICAgICAgICAgICAgICB+XzB4MjI3ZjIzKSkgKwogICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbMHgyODMgKiAweDggKyAtMHg1ZiAqIDB4MzcgKyAweDVlXSArCiAgICAgICAgICAgICAgICAgICgtMHgxNWRiOWZhYSArIDB4Mzg0MWQgKiAtMHgxZGIzICsgMHhjYzUwNWE5MikpIDw8CiAgICAgICAgICAgICAgICAgICgtMHgxNzJmICsgLTB4NWYgKiAtMHgxICsgMHgxNmU1KSkgfAogICAgICAgICAgICAgICAgICAoXzB4Mzk1MmFmID4+PiAoMHg2YyArIDB4MiAqIDB4NTMwICsgMHhhYzEgKiAtMHgxKSkpICsKICAgICAgICAgICAgICAgICAgXzB4MmEwYzk0KSA8PAogICAgICAgICAgICAgICAgKDB4MyAqIDB4MzEyICsgMHgxOSAqIC0weDEwNyArIDB4MTA3OSkpLAogICAgICAgICAgICAgIChfMHgzOTUyYWYgPQogICAgICAgICAgICAgICAgKCgoKF8weDM5NTJhZiArPQogICAgICAgICAgICAgICAgICAoKF8weDM5ZWI2NCA9CiAgICAgICAgICAgICAgICAgICAgKCgoKF8weDM5ZWI2NCArPQogICAgICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiBeCiAgICAgICAgICAgICAgICAgICAgICAgICgoXzB4MjI3ZjIzID0KICAgICAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MjI3ZjIzICs9CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmEwYzk0IF4gKF8weDM5NTJhZiB8IH5fMHgzOWViNjQpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgxMjhkMzJbLTB4NWJjICsgLTB4MSAqIC0weDg4NyArIC0weDEgKiAweDJjN10gLQogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4ZDBkMTk1OSArIDB4OWE0ZDFiMSArIC0weGUwNTY5OGMpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAgICAgKDB4MyAqIDB4NmE3ICsgMHgyNTJlICsgLTB4MzkxZCkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgPj4+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICgtMHgyMjkyICsgLTB4MTM4NSArIDB4MSAqIDB4MzYzMSkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBfMHgzOTUyYWYpIDw8CiAgICAgICAgICAgICAgICAgICAgICAgICAgKC0weDI0ODMgKiAtMHgxICsgMHg5M2UgKyAweGQgKiAtMHgzODUpKSB8CiAgICAgICAgICAgICAgICAgICAgICAgICAgfl8weDJhMGM5NCkpICsKICAgICAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHgxZmQyICsgMHgxYmIwICsgLTB4MSAqIC0weDQyZF0gLQogICAgICAgICAgICAgICAgICAgICAgKC0weDliNyAqIDB4ZDlmYWUgKwogICAgICAgICAgICAgICAgICAgICAgICAtMHg5ZmRjZjhiICogLTB4NyArCiAgICAgICAgICAgICAgICAgICAgICAgIDB4YjNiYjU0ICogMHhiOCkpIDw8CiAgICAgICAgICAgICAgICAgICAgICAoMHgxZiAqIDB4ZWMgKyAtMHgyNjAgKyAtMHgxOGEgKiAweDExKSkgfAogICAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCA+Pj4gKDB4MTQwICogLTB4NiArIDB4MjIzMSAqIC0weDEgKyAweDI5YzcpKSkgKwogICAgICAgICAgICAgICAgICAgICAgXzB4MjI3ZjIzKSA8PAogICAgICAgICAgICAgICAgICAgICgweDI2ZWYgKiAtMHgxICsgLTB4MTEyYiArIDB4MmIgKiAweDE0ZSkpIF4KICAgICAgICAgICAgICAgICAgICAoKF8weDJhMGM5NCA9CiAgICAgICAgICAgICAgICAgICAgICAoKCgoXzB4MmEwYzk0ICs9CiAgICAgICAgICAgICAgICAgICAgICAgIChfMHgyMjdmMjMgXiAoXzB4MzllYjY0IHwgfl8weDM5NTJhZikpICsKICAgICAgICAgICAgICAgICAgICAgICAgXzB4MTI4ZDMyWy0weDEgKiAtMHgxMDBkICsgMHhkYzAgKyAtMHgxZCAqIDB4MTA3XSArCiAgICAgICAgICAgICAgICAgICAgICAgICgweDQzZGM3NDc1ICsgMHg1MjRjYmQ5MSArIC0weDgyNjYxICogMHhkMmIpKSA8PAogICAgICAgICAgICAgICAgICAgICAgICAoLTB4MWYgKiAtMHhmICsgLTB4MWQzYSArIC0weDEgKiAtMHgxYjc4KSkgfAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4MmEwYzk0ID4+PiAoMHgyMzViICsgMHgxNjJiICsgLTB4Mzk3NSkpKSArCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDM5ZWI2NCkgPDwKICAgICAgICAgICAgICAgICAgICAgICgtMHhmICogLTB4MjdiICsgLTB4YzU4ICsgLTB4MThkZCkpIHwKICAgICAgICAgICAgICAgICAgICAgIH5fMHgyMjdmMjMpKSArCiAgICAgICAgICAgICAgICAgIF8weDEyOGQzMlstMHg3MiAqIC0weDFmICsgMHhhYzQgKyAtMHgxODg5XSAtCiAgICAgICAgICAgICAgICAgICgweGEgKiAtMHgzYzgxMmEyICsgLTB4MmMgKiAweDFiYzRhMiArIC0weDMgKiAtMHgxNTA1M2I4OSkpIDw8CiAgICAgICAgICAgICAgICAgICgweDQgKiAweDljMiArIC0weGQ0NiAqIDB4MiArIC0weGM2NykpIHwKICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiA+Pj4gKC0weDhiOSArIC0weDFlZDMgKiAweDEgKyAtMHgxICogLTB4Mjc5NykpKSArCiAgICAgICAgICAgICAgICAgIF8weDJhMGM5NCkgPDwKICAgICAgICAgICAgICAgICgtMHgxICogLTB4ZWRlICsgMHgxNWQzICsgLTB4MWYgKiAweDEyZikpLAogICAgICAgICAgICAgIHRoaXNbImZpcnN0Il0KICAgICAgICAgICAgICAgID8gKCh0aGlzWyJoMCJdID0KICAgICAgICAgICAgICAgICAgICAoXzB4MjI3ZjIzICsKICAgICAgICAgICAgICAgICAgICAgICgtMHgyOTUxMjNiICsgMHhjNjJhNjAyMCAqIDB4MSArIC0weDIyICogMHgyYjcxMDUyKSkgPDwKICAgICAgICAgICAgICAgICAgICAoLTB4MiAqIC0weDYwMiArIC0weDEgKiAweDEyYzIgKyAweDZiZSkpLAogICAgICAgICAgICAgICAgICAodGhpc1siaDEiXSA9CiAgICAgICAgICAgICAgICAgICAgKF8weDM5NTJhZiAtICgweDNhNWI1MmMgKyAweDFkOTc4ZTYxICsgMHg3ICogLTB4MjZmNDZiYSkpIDw8CiAgICAgICAgICAgICAgICAgICAgKDB4NWVhICogMHg0ICsgMHhlNSArIC0weDRlOSAqIDB4NSkpLAogICAgICAgICAgICAgICAgICAodGhpc1siaDIiXSA9CiAgICAgICAgICAgICAgICAgICAgKF8weDJhMGM5NCAtICgweGE2YmU0NGM3ICsgMHhjNTRkODVhNCArIC0weDEwNGM2YTc2OSkpIDw8CiAgICAgICAgICAgICAgICAgICAgKDB4NmQgKiAweDUzICsgMHgxODA5ICsgLTB4M2I2MCkpLAogICAgICAgICAgICAgICAgICAodGhpc1siaDMiXSA9CiAgICAgICAgICAgICAgICAgICAgKF8weDM5ZWI2NCArCiAgICAgICAgICAgICAgICAgICAgICAoLTB4MWZkYmMwYiArIDB4MSAqIDB4MWExMDQ3ZmYgKyAweDg1ZjYgKiAtMHhmMGQpKSA8PAogICAgICAgICAgICAgICAgICAgICgweDI2ZTggKyAtMHg1ZCAqIDB4MWYgKyAweDE1MSAqIC0weDE1KSksCiAgICAgICAgICAgICAgICAgICh0aGlzW18weDJmMDE0OSgweDE5ZildID0gISgKICAgICAgICAgICAgICAgICAgICAweDI1YTIgKwogICAgICAgICAgICAgICAgICAgIC0weDUgKiAweDFkNSArCiAgICAgICAgICAgICAgICAgICAgLTB4MzhmICogMHg4CiAgICAgICAgICAgICAgICAgICkpKQogICAgICAgICAgICAgICAgOiAoKHRoaXNbImgwIl0gPQogICAgICAgICAgICAgICAgICAgICh0aGlzWyJoMCJdICsgXzB4MjI3ZjIzKSA8PCAoMHg5MjMgKyAweGIxYyArIC0weDE0M2YpKSwKICAgICAgICAgICAgICAgICAgKHRoaXNbImgxIl0gPQogICAgICAgICAgICAgICAgICAgICh0aGlzWyJoMSJdICsgXzB4Mzk1MmFmKSA8PAogICAgICAgICAgICAgICAgICAgICgtMHgyMyAqIDB4YzAgKyAweDFhZWYgKyAtMHhhZikpLAogICAgICAgICAgICAgICAgICAodGhpc1siaDIiXSA9CiAgICAgICAgICAgICAgICAgICAgKHRoaXNbImgyIl0gKyBfMHgyYTBjOTQpIDw8CiAgICAgICAgICAgICAgICAgICAgKC0weDFiNTMgKyAtMHgxYWNjICsgLTB4YTMgKiAtMHg1NSkpLAogICAgICAgICAgICAgICAgICAodGhpc1siaDMiXSA9CiAgICAgICAgICAgICAgICAgICAgKHRoaXNbImgzIl0gKyBfMHgzOWViNjQpIDw8CiAgICAgICAgICAgICAgICAgICAgKC0weGJhMCAqIDB4MSArIDB4MTQ2ICsgMHhhICogMHgxMDkpKSk7CiAgICAgICAgICB9KSwKICAgICAgICAgIChfMHgyMmY5MDJbXzB4MmRiMjk2KDB4MzQ0KV1bImhleCJdID0gZnVuY3Rpb24gKCkgewogICAgICAgICAgICB0aGlzWyJmaW5hbGl6ZSJdKCk7CiAgICAgICAgICAgIHZhciBfMHg1OGQxOGMgPSB0aGlzWyJoMCJdLAogICAgICAgICAgICAgIF8weDRlMjgwNyA9IHRoaXNbImgxIl0sCiAgICAgICAgICAgICAgXzB4NDE1MzRiID0gdGhpc1siaDIiXSwKICAgICAgICAgICAgICBfMHgxMzY5MjEgPSB0aGlzWyJoMyJdOwogICAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICAgIF8weDE0MjQ5MVsKICAgICAgICAgICAgICAgIChfMHg1OGQxOGMgPj4gKDB4M2NiICogLTB4NCArIC0weDZlICogLTB4MyArIDB4ZGU2KSkgJgogICAgICAgICAgICAgICAgICAoMHgzYiAqIDB4NDcgKyAweDE1NjcgKyAtMHgyNWI1KQogICAgICAgICAgICAgIF0gKwogICAgICAgICAgICAgIF8weDE0MjQ5MVsoLTB4MTczMSArIC0weDE2ZSArIDB4OSAqIDB4MmJlKSAmIF8weDU4ZDE4Y10gKwogICAgICAgICAgICAgIF8weDE0MjQ5MVsKICAgICAgICAgICAgICAgIChfMHg1OGQxOGMgPj4gKC0weGE3OCArIDB4MThkNCArIDB4ZTUgKiAtMHgxMCkpICYKICAgICAgICAgICAgICAgICAgKDB4ODFlICsgLTB4NiAqIDB4NTI5ICsgMHgxNmU3KQogICAgICAgICAgICAgIF0gKwogICAgICAgICAgICAgIF8weDE0MjQ5MVsKICAgICAgICAgICAgICAgIChfMHg1OGQxOGMgPj4gKDB4MTg5NCArIC0weDNjICsgLTB4MTg1MCkpICYKICAgICAgICAgICAgICAgICAgKC0weDIyMjggKiAtMHgxICsgMHgzICogMHg0ZmYgKyAtMHgzMTE2KQogICAgICAgICAgICAgIF0gKwogICAgICAgICAgICAgIF8weDE0MjQ5MVsKICAgICAgICAgICAgICAgIChfMHg1OGQxOGMgPj4gKC0weDY3ICogLTB4MSArIC0weDE4NDIgKyAweDE3ZWYpKSAmCiAgICAgICAgICAgICAgICAgICgweDU4MCAqIC0weDYgKyAweDFiICogMHgxNzEgKyAtMHg1ZGMpCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDU4ZDE4YyA+PiAoLTB4MSAqIC0weDcwOSArIDB4MTU5NCArIC0weDEgKiAweDFjOGQpKSAmCiAgICAgICAgICAgICAgICAgICgweDE2MzMgKyAtMHg3MGQgKyAtMHhmMTcpCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDU4ZDE4YyA+PiAoLTB4YWY2ICsgMHgxZGRiICogMHgxICsgLTB4MTJjOSkpICYKICAgICAgICAgICAgICAgICAgKC0weDRiICogMHg3YiArIDB4NSAqIDB4NDFiICsgMHhmOTEpCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDU4ZDE4YyA+PiAoLTB4MSAqIDB4MTU0MyArIC0weDE3OTUgKiAtMHgxICsgLTB4MjNhKSkgJgogICAgICAgICAgICAgICAgICAoLTB4MWU3MCArIDB4Y2M1ICsgLTB4MTFiYSAqIC0weDEpCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDRlMjgwNyA+PiAoMHg2NTEgKyAtMHgxMGY3ICogLTB4MiArIC0weDI4M2IpKSAmCiAgICAgICAgICAgICAgICAgICgweDExOTkgKyAtMHg0NyAqIC0weDU5ICsgLTB4MmEzOSkKICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICBfMHgxNDI0OTFbKDB4ZTMgKiAtMHgyMiArIDB4MjQ3OSArIDB4NjQ0ICogLTB4MSkgJiBfMHg0ZTI4MDddICsKICAgICAgICAgICAgICBfMHgxNDI0OTFbCiAgICAgICAgICAgICAgICAoXzB4NGUyODA3ID4+ICgweDEyMWEgKyAweDFhODQgKyAtMHgyYzkyKSkgJgogICAgICAgICAgICAgICAgICAoLTB4NjUgKiAtMHg0YSArIC0weDVkYiArIC0weDE3NDgpCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDRlMjgwNyA+PiAoMHgxNGEzICsgLTB4MTEgKiAweDU1ICsgLTB4NSAqIDB4MmZlKSkgJgogICAgICAgICAgICAgICAgICAoLTB4MjRlMyAqIC0weDEgKyAweGY2NCArIC0weDM0MzgpCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDRlMjgwNyA+PiAoMHgxY2YgKyAtMHgxYzg5ICsgLTB4MiAqIC0weGQ2NykpICYKICAgICAgICAgICAgICAgICAgKC0weGQ0NyAqIC0weDIgKyAtMHgxICogMHgyMjFiICsgMHgxZTcgKiAweDQpCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDRlMjgwNyA+PiAoMHg2NzMgKyAweDFkMTIgKyAtMHgxICogMHgyMzc1KSkgJgogICAgICAgICAgICAgICAgICAoMHgxMmNlICsgLTB4OCAqIC0weGI1ICsgLTB4MTg2NykKICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICBfMHgxNDI0OTFbCiAgICAgICAgICAgICAgICAoXzB4NGUyODA3ID4+ICgweDEgKiAweDE0OTkgKyAweDFhNmIgKiAweDEgKyAtMHg5OCAqIDB4NGYpKSAmCiAgICAgICAgICAgICAgICAgICgweDE1MTYgKyAtMHgxNDcgKiAtMHgyICsgLTB4MTc5NSAqIDB4MSkKICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICBfMHgxNDI0OTFbCiAgICAgICAgICAgICAgICAoXzB4NGUyODA3ID4+ICgweDQgKiAweDU3MCArIC0weDIgKiAweDYyMiArIC0weDIgKiAweDRiMikpICYKICAgICAgICAgICAgICAgICAgKC0weDYgKiAtMHgxNWQgKyAtMHg3ZWIgKyAtMHgzNCkKICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICBfMHgxNDI0OTFbCiAgICAgICAgICAgICAgICAoXzB4NDE1MzRiID4+ICgweDE3MzggKyAtMHg2ICogMHgyM2IgKyAtMHgzICogMHgzNDYpKSAmCiAgICAgICAgICAgICAgICAgICgtMHg5NyAqIC0weDNhICsgMHgzYTYgKyAtMHgyNWNkKQogICAgICAgICAgICAgIF0gKwogICAgICAgICAgICAgIF8weDE0MjQ5MVsKICAgICAgICAgICAgICAgICgtMHg0OCAqIC0weDExICsgMHgxICogLTB4MjUwMiArIDB4MTMgKiAweDFiMykgJiBfMHg0MTUzNGIKICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICBfMHgxNDI0OTFbCiAgICAgICAgICAgICAgICAoXzB4NDE1MzRiID4+ICgtMHgxICogLTB4MTU1NiArIDB4MyAqIDB4NjIzICsgLTB4MjdiMyAqIDB4MSkpICYKICAgICAgICAgICAgICAgICAgKC0weDZiICogMHgxZiArIDB4MSAqIC0weDQ5ICsgLTB4MyAqIC0weDQ2ZikKICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICBfMHgxNDI0OTFbCiAgICAgICAgICAgICAgICAoXzB4NDE1MzRiID4+ICgtMHg3OTQgKyAtMHgxICogMHgyNDQzICsgMHgyYmRmKSkgJgogICAgICAgICAgICAgICAgICAoMHgyNmNhICsgLTB4YjAyICsgMHgyZiAqIC0weDk3KQogICAgICAgICAgICAgIF0gKwogICAgICAgICAgICAgIF8weDE0MjQ5MVsKICAgICAgICAgICAgICAgIChfMHg0MTUzNGIgPj4gKDB4MTc3ZiArIC0weDU3YiArIC0weDExZiAqIDB4MTApKSAmCiAgICAgICAgICAgICAgICAgICgweDFlZWQgKyAweGJiMiArIC0weDJhOTApCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDQxNTM0YiA+PiAoMHhhYjcgKiAtMHgyICsgMHgzYmEgKyAweDExYzQpKSAmCiAgICAgICAgICAgICAgICAgICgtMHgxNjIxICsgMHhhM2YgKiAweDIgKyAtMHhkOSAqIC0weDIpCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDQxNTM0YiA+PiAoMHg2MDcgKyAtMHgyMDY1ICsgMHgxYTdhKSkgJgogICAgICAgICAgICAgICAgICAoMHgyICogLTB4YjBmICsgMHg2MjkgKiAtMHg1ICsgMHgxYTdkICogMHgyKQogICAgICAgICAgICAgIF0gKwogICAgICAgICAgICAgIF8weDE0MjQ5MVsKICAgICAgICAgICAgICAgIChfMHg0MTUzNGIgPj4gKC0weDIyMDUgKyAweDIwYWMgKyAweDE3MSkpICYKICAgICAgICAgICAgICAgICAgKC0weDEgKiAtMHgxMzM3ICsgMHg2ZSAqIC0weDEgKyAtMHgyMiAqIDB4OGQpCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDEzNjkyMSA+PiAoLTB4ODQ1ICsgLTB4MSAqIDB4MjY3YiArIDB4MTc2MiAqIDB4MikpICYKICAgICAgICAgICAgICAgICAgKDB4MzQwICsgLTB4MjEgKiAweGNiICsgMHgxNmZhKQogICAgICAgICAgICAgIF0gKwogICAgICAgICAgICAgIF8weDE0MjQ5MVsoMHg0ICogLTB4OGUyICsgLTB4ZGVhICsgMHgzMTgxKSAmIF8weDEzNjkyMV0gKwogICAgICAgICAgICAgIF8weDE0MjQ5MVsKICAgICAgICAgICAgICAgIChfMHgxMzY5MjEgPj4gKDB4MTc4NCArIDB4YSAqIDB4MzFiICsgLTB4MSAqIDB4MzY4NikpICYKICAgICAgICAgICAgICAgICAgKC0weDI2ICogMHg0ZiArIC0weDEgKiAtMHhjYTggKyAweGRmICogLTB4MSkKICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICBfMHgxNDI0OTFbCiAgICAgICAgICAgICAgICAoXzB4MTM2OTIxID4+ICgweDE4MjMgKiAtMHgxICsgMHhlNWMgKiAtMHgyICsgMHgxICogMHgzNGUzKSkgJgogICAgICAgICAgICAgICAgICAoMHgzNGUgKiAweDYgKyAweDQ3ZiArIC0weDE4NDQgKiAweDEpCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDEzNjkyMSA+PiAoMHgxICogLTB4MTBhZiArIDB4MzlhICsgMHhkMjkpKSAmCiAgICAgICAgICAgICAgICAgICgtMHhlYTIgKyAweDIgKiAtMHhhZDIgKyAweDI0NTUpCiAgICAgICAgICAgICAgXSArCiAgICAgICAgICAgICAgXzB4MTQyNDkxWwogICAgICAgICAgICAgICAgKF8weDEzNjkyMSA+PiAoMHhhZGYgKyAweDJkYiAqIC0weDcgKyAweDkyZSkpICYKICAgICAgICAgICAgICAgICAgKC0weDQ5MyAqIDB4MyArIDB4MTVlMSArIC0weDgxOSkKICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICBfMHgxNDI0OTFbCiAgICAgICAgICAgICAgICAoXzB4MTM2OTIxID4+ICgtMHgyMmQ2ICsgMHgyMCAqIC0weDE3ICsgMHgyNWQyKSkgJgogICAgICAgICAgICAgICAgICAoLTB4MTcgKiAweDgzICsgMHgxMjE0ICsgLTB4NjQwKQogICAgICAgICAgICAgIF0gKwogICAgICAgICAgICAgIF8weDE0MjQ5MVsKICAgICAgICAgICAgICAgIChfMHgxMzY5MjEgPj4gKC0weDk2ZSArIC0weDFlOTkgKyAweDI4MWYpKSAmCiAgICAgICAgICAgICAgICAgICgtMHgxOGM4ICsgMHgzMyAqIDB4ODkgKyAtMHgyNzQpCiAgICAgICAgICAgICAgXQogICAgICAgICAgICApOwogICAgICAgICAgfSksCiAgICAgICAgICAoXzB4MjJmOTAyWyJwcm90b3R5cGUiXVtfMHgyZGIyOTYoMHgzYWUpXSA9CiAgICAgICAgICAgIF8weDIyZjkwMltfMHgyZGIyOTYoMHgzNDQpXVsiaGV4Il0pLAogICAgICAgICAgKF8weDIyZjkwMltfMHgyZGIyOTYoMHgzNDQpXVsiZGlnZXN0Il0gPSBmdW5jdGlvbiAoKSB7CiAgICAgICAgICAgIHZhciBfMHg1YTBhOWUgPSBfMHgyZGIyOTY7CiAgICAgICAgICAgIHRoaXNbXzB4NWEwYTllKDB4MWQ5KV0oKTsKICAgICAgICAgICAgdmFyIF8weDJhODc5NiA9IHRoaXNbImgwIl0sCiAgICAgICAgICAgICAgXzB4MmQ3YzMxID0gdGhpc1siaDEiXSwKICAgICAgICAgICAgICBfMHgxMzc4ZDMgPSB0aGlzWyJoMiJdLAogICAgICAgICAgICAgIF8weDJlNjY3ZiA9IHRoaXNbImgzIl07CiAgICAgICAgICAgIHJldHVybiBbCiAgICAgICAgICAgICAgKDB4MSAqIDB4NGJkICsgMHgxZjE1ICsgMHg1ICogLTB4NmY3KSAmIF8weDJhODc5NiwKICAgICAgICAgICAgICAoXzB4MmE4Nzk2ID4+ICgweGJjZCArIC0weDI1ZjcgKyAweDFhMzIpKSAmCiAgICAgICAgICAgICAgICAoMHgxNTA3ICsgLTB4MTc3ZCArIDB4MSAqIDB4Mzc1KSwKICAgICAgICAgICAgICAoXzB4MmE4Nzk2ID4+ICgtMHgxNDFjICsgMHgxYWUyICsgLTB4NmI2KSkgJgogICAgICAgICAgICAgICAgKDB4MTMyYSArIC0weDMgKiAweDQyMyArIDB4YiAqIC0weDg2KSwKICAgICAgICAgICAgICAoXzB4MmE4Nzk2ID4+ICgtMHgxICogLTB4MjYxZiArIDB4MTE1ICogLTB4YyArIC0weDE5MGIpKSAmCiAgICAgICAgICAgICAgICAoMHgxMjMzICogLTB4MSArIDB4YWNmICogLTB4MyArIDB4MzM5ZiksCiAgICAgICAgICAgICAgKC0weDE2YTAgKyAweDEwMDIgKyAweDc5ZCAqIDB4MSkgJiBfMHgyZDdjMzEsCiAgICAgICAgICAgICAgKF8weDJkN2MzMSA+PiAoLTB4MiAqIDB4ZmY0ICsgLTB4NTQxICogMHgyICsgLTB4ZTI2ICogLTB4MykpICYKICAgICAgICAgICAgICAgICgweDU0ZSArIC0weDFjICogLTB4MTQ4ICsgLTB4MjgyZiAqIDB4MSksCiAgICAgICAgICAgICAgKF8weDJkN2MzMSA+PiAoLTB4NCAqIC0weDgzZiArIDB4MjBhYiAqIC0weDEgKyAtMHg0MSkpICYKICAgICAgICAgICAgICAgICgweDQyNyAqIDB4NSArIDB4ZGQxICsgLTB4MjE5NSAqIDB4MSksCiAgICAgICAgICAgICAgKF8weDJkN2MzMSA+PiAoMHhmICogLTB4MjAxICsgMHgxYzI2ICsgLTB4OSAqIC0weDM5KSkgJgogICAgICAgICAgICAgICAgKDB4NyAqIC0weDIzNSArIDB4MWJlICsgMHhlYjQgKiAweDEpLAogICAgICAgICAgICAgICgweDM0ICogMHg5YiArIDB4YTM2ICsgLTB4MjhiMykgJiBfMHgxMzc4ZDMsCiAgICAgICAgICAgICAgKF8weDEzNzhkMyA+PiAoMHg0NjMgKiAweDEgKyAtMHgxZjBkICsgMHgxYWIyKSkgJgogICAgICAgICAgICAgICAgKDB4MTMgKiAtMHgxN2YgKyAtMHg1MzYgKyAweDIyYTIpLAogICAgICAgICAgICAgIChfMHgxMzc4ZDMgPj4gKDB4NGE3ICsgLTB4MWE0ICsgLTB4MmYzKSkgJgogICAgICAgICAgICAgICAgKDB4MTA2NiArIDB4YjNkICsgLTB4MWFhNCksCiAgICAgICAgICAgICAgKF8weDEzNzhkMyA+PiAoLTB4YzAwICsgLTB4MiAqIDB4ZmNiICsgMHgyYmFlKSkgJgogICAgICAgICAgICAgICAgKDB4MTFhNyAqIC0weDEgKyAweDNhMSAqIC0weDEgKyAweDE2NDcpLAogICAgICAgICAgICAgICgtMHhhMzggKyAtMHgxMzA0ICsgMHgxZTNiKSAmIF8weDJlNjY3ZiwKICAgICAgICAgICAgICAoXzB4MmU2NjdmID4+ICgweDExMDIgKyAweDE4OTYgKyAtMHgyZjggKiAweGUpKSAmCiAgICAgICAgICAgICAgICAoLTB4MTViMiAqIC0weDEgKyAtMHhhNiAqIDB4MzEgKyAtMHhmICogLTB4YmQpLAogICAgICAgICAgICAgIChfMHgyZTY2N2YgPj4gKDB4MjVhMiArIC0weDQgKiAweDEwMyArIC0weDIxODYpKSAmCiAgICAgICAgICAgICAgICAoLTB4YTgzICogLTB4MyArIC0weDE1ZjEgKyAtMHg4OTkpLAogICAgICAgICAgICAgIChfMHgyZTY2N2YgPj4gKDB4Yjk1ICogMHgzICsgLTB4MWEzNCArIC0weDg3MykpICYKICAgICAgICAgICAgICAgICgweGZiNiAqIC0weDIgKyAweDNiICogMHgzYSArIDB4MTMwZCksCiAgICAgICAgICAgIF07CiAgICAgICAgICB9KSwKICAgICAgICAgIChfMHgyMmY5MDJbXzB4MmRiMjk2KDB4MzQ0KV1bXzB4MmRiMjk2KDB4MjM4KV0gPQogICAgICAgICAgICBfMHgyMmY5MDJbInByb3RvdHlwZSJdW18weDJkYjI5NigweDE5YildKSwKICAgICAgICAgIChfMHgyMmY5MDJbInByb3RvdHlwZSJdW18weDJkYjI5NigweDI0OSldID0gZnVuY3Rpb24gKCkgewogICAgICAgICAgICB2YXIgXzB4NDVhYjJlID0gXzB4MmRiMjk2OwogICAgICAgICAgICB0aGlzW18weDQ1YWIyZSgweDFkOSldKCk7CiAgICAgICAgICAgIHZhciBfMHgzMWQ1ODYgPSBuZXcgQXJyYXlCdWZmZXIoCiAgICAgICAgICAgICAgICAweDEzICogLTB4MjBlICsgLTB4NCAqIC0weDYyZiArIDB4ZTVlCiAgICAgICAgICAgICAgKSwKICAgICAgICAgICAgICBfMHgyZDlmYmQgPSBuZXcgVWludDMyQXJyYXkoXzB4MzFkNTg2KTsKICAgICAgICAgICAgcmV0dXJuICgKICAgICAgICAgICAgICAoXzB4MmQ5ZmJkWy0weGJjYyArIC0weGY1ICogLTB4MyArIC0weDUgKiAtMHgxYzldID0gdGhpc1siaDAiXSksCiAgICAgICAgICAgICAgKF8weDJkOWZiZFsweDUgKiAweDEwMyArIDB4MjZlZSArIC0weDJiZmNdID0gdGhpc1siaDEiXSksCiAgICAgICAgICAgICAgKF8weDJkOWZiZFsweDdkICsgLTB4MWIwNSAqIC0weDEgKyAtMHgxYjgwXSA9IHRoaXNbImgyIl0pLAogICAgICAgICAgICAgIChfMHgyZDlmYmRbMHgxICogMHgxYzFjICsgMHgxICogMHg0ZWIgKyAtMHgyMTA0XSA9IHRoaXNbImgzIl0pLAogICAgICAgICAgICAgIF8weDMxZDU4NgogICAgICAgICAgICApOwogICAgICAgICAgfSksCiAgICAgICAgICAoXzB4MjJmOTAyWyJwcm90b3R5cGUiXVsiYnVmZmVyIl0gPQogICAgICAgICAgICBfMHgyMmY5MDJbXzB4MmRiMjk2KDB4MzQ0KV1bXzB4MmRiMjk2KDB4MjQ5KV0pLAogICAgICAgICAgKF8weDIyZjkwMltfMHgyZGIyOTYoMHgzNDQpXVtfMHgyZGIyOTYoMHgyNWYpXSA9IGZ1bmN0aW9uICgpIHsKICAgICAgICAgICAgdmFyIF8weDE2ZTEyZiA9IF8weDJkYjI5NjsKICAgICAgICAgICAgZm9yICgKICAgICAgICAgICAgICB2YXIgXzB4MWRhZDVjLAogICAgICAgICAgICAgICAgXzB4MjRmMjBkLAogICAgICAgICAgICAgICAgXzB4NzBkOTliLAogICAgICAgICAgICAgICAgXzB4YjQ4ZGZjID0gIiIsCiAgICAgICAgICAgICAgICBfMHgxM2UwY2IgPSB0aGlzW18weDE2ZTEyZigweDIzOCldKCksCiAgICAgICAgICAgICAgICBfMHgxMmU2NWUgPSAtMHg3MTkgKiAtMHg1ICsgLTB4NzQ3ICogLTB4NSArIDB4MTcwICogLTB4MzI7CiAgICAgICAgICAgICAgXzB4MTJlNjVlIDwgLTB4OGMgKyAweDE2NGYgKyAtMHgxNWI0OwoKICAgICAgICAgICAgKQogICAgICAgICAgICAgIChfMHgxZGFkNWMgPSBfMHgxM2UwY2JbXzB4MTJlNjVlKytdKSwKICAgICAgICAgICAgICAgIChfMHgyNGYyMGQgPSBfMHgxM2UwY2JbXzB4MTJlNjVlKytdKSwKICAgICAgICAgICAgICAgIChfMHg3MGQ5OWIgPSBfMHgxM2UwY2JbXzB4MTJlNjVlKytdKSwKICAgICAgICAgICAgICAgIChfMHhiNDhkZmMgKz0KICAgICAgICAgICAgICAgICAgXzB4Y2I0ZDYxW18weDFkYWQ1YyA+Pj4gKDB4MTNiICsgMHgyMDkgKiAtMHhiICsgMHgxNTJhKV0gKwogICAgICAgICAgICAgICAgICBfMHhjYjRkNjFbCiAgICAgICAgICAgICAgICAgICAgKDB4MTNkMyArIDB4NGM3ICsgLTB4MTg1YikgJgogICAgICAgICAgICAgICAgICAgICAgKChfMHgxZGFkNWMgPDwgKDB4MTMzNCArIDB4MWRkNyArIDB4NyAqIC0weDcwMSkpIHwKICAgICAgICAgICAgICAgICAgICAgICAgKF8weDI0ZjIwZCA+Pj4KICAgICAgICAgICAgICAgICAgICAgICAgICAoLTB4M2IzICogMHhhICsgLTB4MTdiICogLTB4MTMgKyAtMHgxICogLTB4OGUxKSkpCiAgICAgICAgICAgICAgICAgIF0gKwogICAgICAgICAgICAgICAgICBfMHhjYjRkNjFbCiAgICAgICAgICAgICAgICAgICAgKC0weDI1ZGQgKyAweDE0YmQgKyAweDExNWYpICYKICAgICAgICAgICAgICAgICAgICAgICgoXzB4MjRmMjBkIDw8ICgtMHg3ODcgKyAweDg4OCArIC0weGZmKSkgfAogICAgICAgICAgICAgICAgICAgICAgICAoXzB4NzBkOTliID4+PiAoMHhlNzQgKyAtMHgxMDRmICsgMHhkICogMHgyNSkpKQogICAgICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICAgICAgXzB4Y2I0ZDYxWygweDY4ZSArIC0weDEwODIgKyAtMHgxNzUgKiAtMHg3KSAmIF8weDcwZDk5Yl0pOwogICAgICAgICAgICByZXR1cm4gKAogICAgICAgICAgICAgIChfMHgxZGFkNWMgPSBfMHgxM2UwY2JbXzB4MTJlNjVlXSksCiAgICAgICAgICAgICAgKF8weGI0OGRmYyArPQogICAgICAgICAgICAgICAgXzB4Y2I0ZDYxW18weDFkYWQ1YyA+Pj4gKDB4MmIgKiAtMHg3NyArIDB4MjllICogMHgyICsgMHhlYzMpXSArCiAgICAgICAgICAgICAgICBfMHhjYjRkNjFbCiAgICAgICAgICAgICAgICAgIChfMHgxZGFkNWMgPDwgKC0weDE0YzAgKyAtMHgyICogLTB4MTFhNCArIDB4MiAqIC0weDc0MikpICYKICAgICAgICAgICAgICAgICAgICAoMHhlNWYgKyAtMHgxZGFiICsgMHhmOGIgKiAweDEpCiAgICAgICAgICAgICAgICBdICsKICAgICAgICAgICAgICAgICI9PSIpCiAgICAgICAgICAgICk7CiAgICAgICAgICB9KTsKICAgICAgICB2YXIgXzB4MzM2NDY5ID0gXzB4MWVkYWJiKCk7CiAgICAgICAgXzB4Mjk5YTIxCiAgICAgICAgICA/IChfMHhiOWM3ZDFbXzB4MmRiMjk2KDB4MWI4KV0gPSBfMHgzMzY0NjkpCiAgICAgICAgICA6ICgoXzB4MTFkMTc3W18weDJkYjI5NigweDM1YyldID0gXzB4MzM2NDY5KSwKICAgICAgICAgICAgXzB4NWVmYzhmICYmCiAgICAgICAgICAgICAgKHZvaWQgKDB4MTExOCArIC0weDI1ICogMHg5OCArIDB4MWEwICogMHgzKSkoZnVuY3Rpb24gKCkgewogICAgICAgICAgICAgICAgcmV0dXJuIF8weDMzNjQ2OTsKICAgICAgICAgICAgICB9KSk7CiAgICAgIH0pKCk7CiAgICB9KTsKICAgIGZ1bmN0aW9uIF8weDVkZDQ2NyhfMHgyZThlYjUpIHsKICAgICAgdmFyIF8weDM0NGM1MCA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIHdfMHg1YzMxNDAoCiAgICAgICAgXzB4MzQ0YzUwKDB4MzMzKSwKICAgICAgICB7CiAgICAgICAgICBnZXQgMHgwKCkgewogICAgICAgICAgICByZXR1cm4gXzB4OTA3OTU7CiAgICAgICAgICB9LAogICAgICAgICAgMHgxOiBhcmd1bWVudHMsCiAgICAgICAgICAweDI6IF8weDJlOGViNSwKICAgICAgICB9LAogICAgICAgIHRoaXMKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDE3NmE1NygpIHsKICAgICAgdmFyIF8weDMzNzQyYyA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuICEhZG9jdW1lbnRbXzB4MzM3NDJjKDB4MzczKV07CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxMjMwZTcoKSB7CiAgICAgIHJldHVybiAidW5kZWZpbmVkIiAhPSB0eXBlb2YgSW5zdGFsbFRyaWdnZXI7CiAgICB9CiAgICBmdW5jdGlvbiBfMHhmOGNjZjEoKSB7CiAgICAgIHZhciBfMHgyNWQ1N2QgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiAoCiAgICAgICAgL2NvbnN0cnVjdG9yL2lbXzB4MjVkNTdkKDB4MjJiKV0od2luZG93WyJIVE1MRWxlbWVudCJdKSB8fAogICAgICAgIF8weDI1ZDU3ZCgweDIyNikgPT09CiAgICAgICAgICAoIXdpbmRvd1sic2FmYXJpIl0gfHwKICAgICAgICAgICAgKF8weDI1ZDU3ZCgweDM4NCkgIT0gdHlwZW9mIHNhZmFyaSAmJiBzYWZhcmlbInB1c2hOb3RpZmljYXRpb24iXSkpWwogICAgICAgICAgICBfMHgyNWQ1N2QoMHgzYWUpCiAgICAgICAgICBdKCkKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDMwYzkxNigpIHsKICAgICAgdmFyIF8weDU2ZjdjMiA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIG5ldyBEYXRlKClbXzB4NTZmN2MyKDB4MTZkKV0oKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDVhZjQ2YShfMHhlYWZmMzUpIHsKICAgICAgcmV0dXJuIG51bGwgPT0gXzB4ZWFmZjM1CiAgICAgICAgPyAiIgogICAgICAgIDogImJvb2xlYW4iID09IHR5cGVvZiBfMHhlYWZmMzUKICAgICAgICA/IF8weGVhZmYzNQogICAgICAgICAgPyAiMSIKICAgICAgICAgIDogIjAiCiAgICAgICAgOiBfMHhlYWZmMzU7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzMjVmNTgoXzB4M2ZkY2I3LCBfMHgyODM4YmMpIHsKICAgICAgdmFyIF8weDE3ZDEyYyA9IF8weDU2MTJkZTsKICAgICAgXzB4MjgzOGJjIHx8IChfMHgyODM4YmMgPSBfMHgxN2QxMmMoMHgyNGMpKTsKICAgICAgZm9yICgKICAgICAgICB2YXIgXzB4M2I4ZjJjID0gIiIsIF8weDk4ZjBkZSA9IF8weDNmZGNiNzsKICAgICAgICBfMHg5OGYwZGUgPiAtMHgyICogLTB4OTBlICsgMHg0ICogLTB4M2FlICsgLTB4MzY0OwogICAgICAgIC0tXzB4OThmMGRlCiAgICAgICkKICAgICAgICBfMHgzYjhmMmMgKz0KICAgICAgICAgIF8weDI4MzhiY1sKICAgICAgICAgICAgTWF0aFtfMHgxN2QxMmMoMHgxY2YpXSgKICAgICAgICAgICAgICBNYXRoWyJyYW5kb20iXSgpICogXzB4MjgzOGJjW18weDE3ZDEyYygweDI1OSldCiAgICAgICAgICAgICkKICAgICAgICAgIF07CiAgICAgIHJldHVybiBfMHgzYjhmMmM7CiAgICB9CiAgICB2YXIgXzB4Mzk2OTNkID0gewogICAgICAgIHNlYzogMHg5LAogICAgICAgIGFzZ3c6IDB4NSwKICAgICAgICBpbml0OiAweDAsCiAgICAgIH0sCiAgICAgIF8weDZjYWYgPSB7CiAgICAgICAgYm9ndXNJbmRleDogMHgwLAogICAgICAgIG1zTmV3VG9rZW5MaXN0OiBbXSwKICAgICAgICBtb3ZlTGlzdDogW10sCiAgICAgICAgY2xpY2tMaXN0OiBbXSwKICAgICAgICBrZXlib2FyZExpc3Q6IFtdLAogICAgICAgIGFjdGl2ZVN0YXRlOiBbXSwKICAgICAgICBhaWRMaXN0OiBbXSwKICAgICAgfTsKICAgIGZ1bmN0aW9uIF8weDUzYjc3ZChfMHgzNTczNDcpIHsKICAgICAgcmV0dXJuIHdfMHg1YzMxNDAoCiAgICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDE3MTQzNjZkNmRhMTNjMDAwMDAwMjVmOGMyNTM2OTAwMDAwMGVlMDAxMTAzMDcwNzAwMDIxNjExMDMwMjEyMDAwMzExMDMwNzA3MDAwMjEzMDMwNjJiMmYxMTAzMDIwNzAwMDMzNTQ5MDcwMDA0NDIxMTAxMDA0NDAwMTQwMDAxMTEwMTAxNGExMjAwMDAxMTAwMDEwNzAwMDEwZDA1MDAwMDAwMDAzYzAwMGUwMDA1NDMwMzQ5MTEwMTAzNGExMjAwMDYwNzAwMDcxMTAwMDE0MzAyNDkxMTAxMDQzMzAwMDYxMTAxMDQxMjAwMDgzMzAwMDkxMTAxMDQxMjAwMDgxMjAwMDk0NzAwMjEwMDExMDEwNzA3MDAwMjE2MTEwMTAyMTIwMDAzMTEwMTA3MDcwMDAyMTMwMzA2MmIyZjExMDEwMjA3MDAwMzM1NDkwMjExMDEwNTQzMDA0NzAwNGYxMTAxMDQzMzAwMjUxMTAxMDQxMjAwMGExMTAxMDQxMjAwMGIxOTA0MDA5NjI5MzQwMDExMTEwMTA0MTIwMDBjMTEwMTA0MTIwMDBkMTkwNDAwOTYyOTQ3MDAyMTAwMTEwMTA3MDcwMDAyMTYxMTAxMDIxMjAwMDMxMTAxMDcwNzAwMDIxMzAzMDYyYjJmMTEwMTAyMDcwMDAzMzU0OTA4NDIwMDBlMGU3MTcwNzM3YzdiNzA0NTY3N2E2NTcwNjc2MTZjMDI3YzcxMDg3MTcwNzc2MDcyNzI3MDY3MDc3MDdiNjM3NjdhNzE3MDAwMDM3MjcwNjEwNDdjN2I3MzdhMDIzMDc2MDc3NjdhN2I2NjdhNzk3MDA3NzM3YzY3NzA3NzYwNzIwYTdhNjA2MTcwNjc0MjdjNzE2MTdkMGE3YzdiN2I3MDY3NDI3YzcxNjE3ZDBiN2E2MDYxNzA2NzVkNzA3YzcyN2Q2MTBiN2M3YjdiNzA2NzVkNzA3YzcyN2Q2MSIsCiAgICAgICAgewogICAgICAgICAgZ2V0IDB4MCgpIHsKICAgICAgICAgICAgcmV0dXJuIEltYWdlOwogICAgICAgICAgfSwKICAgICAgICAgIDB4MTogT2JqZWN0LAogICAgICAgICAgZ2V0IDB4MigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDZjYWY7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MygpIHsKICAgICAgICAgICAgcmV0dXJuIGNvbnNvbGU7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NCgpIHsKICAgICAgICAgICAgcmV0dXJuIHdpbmRvdzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg1KCkgewogICAgICAgICAgICByZXR1cm4gXzB4MTIzMGU3OwogICAgICAgICAgfSwKICAgICAgICAgIDB4NjogYXJndW1lbnRzLAogICAgICAgICAgMHg3OiBfMHgzNTczNDcsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzZWQ3MDcoKSB7CiAgICAgIHZhciBfMHgyMDc3YzcgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiB3XzB4NWMzMTQwKAogICAgICAgIF8weDIwNzdjNygweDMxZCksCiAgICAgICAgewogICAgICAgICAgZ2V0IDB4MCgpIHsKICAgICAgICAgICAgcmV0dXJuIG5hdmlnYXRvcjsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxKCkgewogICAgICAgICAgICB2YXIgXzB4NTczYTUyID0gXzB4MjA3N2M3OwogICAgICAgICAgICByZXR1cm4gXzB4NTczYTUyKDB4Mzg0KSAhPSB0eXBlb2YgZ2xvYmFsCiAgICAgICAgICAgICAgPyBnbG9iYWwKICAgICAgICAgICAgICA6IHZvaWQgKC0weDExICogLTB4MWNmICsgMHg5NSAqIDB4MTYgKyAtMHgxICogMHgyYjhkKTsKICAgICAgICAgIH0sCiAgICAgICAgICAweDI6IE9iamVjdCwKICAgICAgICAgIGdldCAweDMoKSB7CiAgICAgICAgICAgIHZhciBfMHg0YjkwOTIgPSBfMHgyMDc3Yzc7CiAgICAgICAgICAgIHJldHVybiBfMHg0YjkwOTIoMHgzODQpICE9IHR5cGVvZiBwcm9jZXNzCiAgICAgICAgICAgICAgPyBwcm9jZXNzCiAgICAgICAgICAgICAgOiB2b2lkICgtMHg2NSAqIDB4MiArIDB4MjU3OSAqIDB4MSArIC0weDEgKiAweDI0YWYpOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDQoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxZGIxMjM7CiAgICAgICAgICB9LAogICAgICAgICAgMHg1OiBhcmd1bWVudHMsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzMjhiZGUoXzB4YWNiNDEwLCBfMHg0ZWQ3YmQsIF8weDQ5ZDEzNykgewogICAgICB2YXIgXzB4MTk3ZTY1ID0gXzB4NTYxMmRlLAogICAgICAgIF8weDJkOGIyOCA9IF8weDE5N2U2NSgweDJjZSksCiAgICAgICAgXzB4NGRkNGI4ID0gIj0iOwogICAgICBfMHg0OWQxMzcgJiYgKF8weDRkZDRiOCA9ICIiKSwgXzB4NGVkN2JkICYmIChfMHgyZDhiMjggPSBfMHg0ZWQ3YmQpOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHgxYWEwNjcsCiAgICAgICAgICBfMHgzYjhjNTUgPSAiIiwKICAgICAgICAgIF8weDJkMWEzNiA9IDB4ZTBmICogMHgyICsgLTB4MzViICogLTB4OCArIDB4MjllICogLTB4MTU7CiAgICAgICAgXzB4YWNiNDEwW18weDE5N2U2NSgweDI1OSldID49CiAgICAgICAgXzB4MmQxYTM2ICsgKDB4NzMgKiAtMHgyNiArIC0weGI0ZSArIDB4MWM2Myk7CgogICAgICApCiAgICAgICAgKF8weDFhYTA2NyA9CiAgICAgICAgICAoKCgtMHgxY2I5ICsgMHgyYzYgKyAtMHgxICogLTB4MWFmMikgJgogICAgICAgICAgICBfMHhhY2I0MTBbXzB4MTk3ZTY1KDB4MTk1KV0oXzB4MmQxYTM2KyspKSA8PAogICAgICAgICAgICAoMHgxZGU5ICsgMHgxYyArIC0weDEgKiAweDFkZjUpKSB8CiAgICAgICAgICAoKCgtMHgxICogMHhkOTEgKyAtMHgyM2EgKyAweDEwY2EpICYKICAgICAgICAgICAgXzB4YWNiNDEwW18weDE5N2U2NSgweDE5NSldKF8weDJkMWEzNisrKSkgPDwKICAgICAgICAgICAgKC0weDE2ICogMHgxMzUgKyAweDllMiAqIDB4MyArIC0weDE4OCAqIDB4MikpIHwKICAgICAgICAgICgoLTB4NzUyICsgLTB4MiAqIDB4YWYzICsgMHgxZTM3KSAmCiAgICAgICAgICAgIF8weGFjYjQxMFtfMHgxOTdlNjUoMHgxOTUpXShfMHgyZDFhMzYrKykpKSwKICAgICAgICAgIChfMHgzYjhjNTUgKz0gXzB4MmQ4YjI4W18weDE5N2U2NSgweDI1YyldKAogICAgICAgICAgICAoKDB4MWM3ODEyNSArIC0weDFkZjExMjIgKyAtMHhiICogLTB4MTkwZDE3KSAmIF8weDFhYTA2NykgPj4KICAgICAgICAgICAgICAoMHg1OSAqIDB4NGYgKyAtMHgxMTc2ICsgLTB4MSAqIDB4OWVmKQogICAgICAgICAgKSksCiAgICAgICAgICAoXzB4M2I4YzU1ICs9IF8weDJkOGIyOFsiY2hhckF0Il0oCiAgICAgICAgICAgICgoLTB4MSAqIDB4MTNiNmIgKyAtMHgxMyAqIC0weDY1YWEgKyAtMHgyNjAzMykgJiBfMHgxYWEwNjcpID4+CiAgICAgICAgICAgICAgKDB4MTdlYSAqIC0weDEgKyAweGVmNyArIDB4OGZmKQogICAgICAgICAgKSksCiAgICAgICAgICAoXzB4M2I4YzU1ICs9IF8weDJkOGIyOFsiY2hhckF0Il0oCiAgICAgICAgICAgICgoLTB4MSAqIDB4MTZiZCArIDB4MTE1ICsgMHgxMGEgKiAweDI0KSAmIF8weDFhYTA2NykgPj4KICAgICAgICAgICAgICAoMHgyOWMgKiAtMHgxICsgLTB4MSAqIDB4MTQ3NSArIDB4MTcxNykKICAgICAgICAgICkpLAogICAgICAgICAgKF8weDNiOGM1NSArPSBfMHgyZDhiMjhbXzB4MTk3ZTY1KDB4MjVjKV0oCiAgICAgICAgICAgICgtMHhjICogMHgxOTYgKyAweDFmYWUgKyAtMHhjNjcpICYgXzB4MWFhMDY3CiAgICAgICAgICApKTsKICAgICAgcmV0dXJuICgKICAgICAgICBfMHhhY2I0MTBbXzB4MTk3ZTY1KDB4MjU5KV0gLSBfMHgyZDFhMzYgPgogICAgICAgICAgLTB4NjlmICsgLTB4MSAqIDB4ZTVjICsgMHgxNGZiICYmCiAgICAgICAgICAoKF8weDFhYTA2NyA9CiAgICAgICAgICAgICgoKDB4NzQwICsgLTB4MWVkMSArIDB4MTg5MCkgJgogICAgICAgICAgICAgIF8weGFjYjQxMFsiY2hhckNvZGVBdCJdKF8weDJkMWEzNisrKSkgPDwKICAgICAgICAgICAgICAoLTB4NyAqIDB4ZWMgKyAweDIxNjcgKiAweDEgKyAtMHgxYWUzKSkgfAogICAgICAgICAgICAoXzB4YWNiNDEwWyJsZW5ndGgiXSA+IF8weDJkMWEzNgogICAgICAgICAgICAgID8gKCgweDE2YWEgKyAtMHg3NjIgKiAweDEgKyAtMHhlNDkpICYKICAgICAgICAgICAgICAgICAgXzB4YWNiNDEwW18weDE5N2U2NSgweDE5NSldKF8weDJkMWEzNikpIDw8CiAgICAgICAgICAgICAgICAoMHgxYWY3ICsgLTB4MjZiZSArIDB4YmNmKQogICAgICAgICAgICAgIDogMHgxICogLTB4NjQ5ICsgLTB4MSAqIDB4ZTE2ICsgMHgyZTkgKiAweDcpKSwKICAgICAgICAgIChfMHgzYjhjNTUgKz0gXzB4MmQ4YjI4W18weDE5N2U2NSgweDI1YyldKAogICAgICAgICAgICAoKC0weDEgKiAweDQ4NGU5ICsgLTB4MTNjODggKiAtMHg0YSArIC0weDI4YmQgKiAtMHg0MGQpICYKICAgICAgICAgICAgICBfMHgxYWEwNjcpID4+CiAgICAgICAgICAgICAgKDB4NmMgKiAtMHg0YSArIC0weDgxYyAqIC0weDIgKyAweGYxMikKICAgICAgICAgICkpLAogICAgICAgICAgKF8weDNiOGM1NSArPSBfMHgyZDhiMjhbImNoYXJBdCJdKAogICAgICAgICAgICAoKC0weDFhZDk4ICsgMHgxYTVjOCArIDB4M2Y3ZDApICYgXzB4MWFhMDY3KSA+PgogICAgICAgICAgICAgICgweDFmOTUgKyAtMHgxYzA2ICsgLTB4MzgzKQogICAgICAgICAgKSksCiAgICAgICAgICAoXzB4M2I4YzU1ICs9CiAgICAgICAgICAgIF8weGFjYjQxMFsibGVuZ3RoIl0gPiBfMHgyZDFhMzYKICAgICAgICAgICAgICA/IF8weDJkOGIyOFtfMHgxOTdlNjUoMHgyNWMpXSgKICAgICAgICAgICAgICAgICAgKCgtMHgyNDQ3ICsgLTB4MSAqIC0weDFlZmUgKyAweDE1MDkpICYgXzB4MWFhMDY3KSA+PgogICAgICAgICAgICAgICAgICAgICgweDFkNjYgKyAweDIgKiAweDIwMiArIC0weDIxNjQpCiAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgOiBfMHg0ZGQ0YjgpLAogICAgICAgICAgKF8weDNiOGM1NSArPSBfMHg0ZGQ0YjgpKSwKICAgICAgICBfMHgzYjhjNTUKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDM4OTM5NihfMHg0OWZkZmQsIF8weDMyZWVkZikgewogICAgICB2YXIgXzB4MzZkY2I4ID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gd18weDVjMzE0MCgKICAgICAgICBfMHgzNmRjYjgoMHgzYWQpLAogICAgICAgIHsKICAgICAgICAgIDB4MDogYXJndW1lbnRzLAogICAgICAgICAgMHgxOiBfMHg0OWZkZmQsCiAgICAgICAgICAweDI6IF8weDMyZWVkZiwKICAgICAgICB9LAogICAgICAgIHRoaXMKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDMyNjJkMyhfMHhiMDE5NzUpIHsKICAgICAgdmFyIF8weDU1MzQxYSA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIF8weDU1MzQxYSgweDMxNSlbXzB4NTUzNDFhKDB4MmM1KV0oXzB4YjAxOTc1KTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weGI1MzUwYihfMHgxMjg5ZjUpIHsKICAgICAgdmFyIF8weDM0MWUwOSA9IF8weDU2MTJkZSwKICAgICAgICBfMHg1YjE4NDksCiAgICAgICAgXzB4NDBhZDFlLAogICAgICAgIF8weDM0MTQ4OCwKICAgICAgICBfMHg1OTgwYzUsCiAgICAgICAgXzB4MzFmNzU5LAogICAgICAgIF8weDViZWJkNyA9ICIiOwogICAgICBmb3IgKAogICAgICAgIF8weDViMTg0OSA9IDB4MTNkNSArIC0weGM0ZiAqIDB4MSArIC0weDc4NjsKICAgICAgICBfMHg1YjE4NDkgPAogICAgICAgIF8weDEyODlmNVtfMHgzNDFlMDkoMHgyNTkpXSAtICgweGU1MCAqIDB4MSArIDB4MTdmMyArIC0weDI2NDApOwogICAgICAgIF8weDViMTg0OSArPSAtMHhlZWQgKyAweDEgKiAweDEwYzAgKyAtMHgxY2YgKiAweDEKICAgICAgKQogICAgICAgIChfMHg0MGFkMWUgPSBfMHgzMjYyZDMoXzB4MTI4OWY1W18weDM0MWUwOSgweDI1YyldKF8weDViMTg0OSkpKSwKICAgICAgICAgIChfMHgzNDE0ODggPSBfMHgzMjYyZDMoCiAgICAgICAgICAgIF8weDEyODlmNVtfMHgzNDFlMDkoMHgyNWMpXSgKICAgICAgICAgICAgICBfMHg1YjE4NDkgKyAoMHgxMTAzICsgMHhhODYgKyAweDEgKiAtMHgxYjg4KQogICAgICAgICAgICApCiAgICAgICAgICApKSwKICAgICAgICAgIChfMHg1OTgwYzUgPSBfMHgzMjYyZDMoCiAgICAgICAgICAgIF8weDEyODlmNVtfMHgzNDFlMDkoMHgyNWMpXShfMHg1YjE4NDkgKyAoLTB4MWM1NCArIC0weGYxNSArIDB4MmI2YikpCiAgICAgICAgICApKSwKICAgICAgICAgIChfMHgzMWY3NTkgPSBfMHgzMjYyZDMoCiAgICAgICAgICAgIF8weDEyODlmNVsiY2hhckF0Il0oCiAgICAgICAgICAgICAgXzB4NWIxODQ5ICsgKDB4ZDFhICsgMHgxICogLTB4MTc1ZCArIC0weDUgKiAtMHgyMGUpCiAgICAgICAgICAgICkKICAgICAgICAgICkpLAogICAgICAgICAgKF8weDViZWJkNyArPSBTdHJpbmdbXzB4MzQxZTA5KDB4MWUyKV0oCiAgICAgICAgICAgIChfMHg0MGFkMWUgPDwgKDB4MzMgKiAtMHgzZiArIDB4ZTczICogLTB4MiArIDB4Mjk3NSkpIHwKICAgICAgICAgICAgICAoXzB4MzQxNDg4ID4+PiAoMHgxMmQyICsgMHg4NTEgKyAtMHgxYjFmKSkKICAgICAgICAgICkpLAogICAgICAgICAgIj0iICE9PQogICAgICAgICAgICBfMHgxMjg5ZjVbXzB4MzQxZTA5KDB4MjVjKV0oCiAgICAgICAgICAgICAgXzB4NWIxODQ5ICsgKDB4NTEgKiAtMHgyNSArIC0weDIxZCAqIDB4MTIgKyAweDMxYzEgKiAweDEpCiAgICAgICAgICAgICkgJiYKICAgICAgICAgICAgKF8weDViZWJkNyArPSBTdHJpbmdbImZyb21DaGFyQ29kZSJdKAogICAgICAgICAgICAgICgoXzB4MzQxNDg4IDw8ICgtMHhhMGMgKyAweGVlMyArIC0weDRkMykpICYKICAgICAgICAgICAgICAgICgweDEgKiAweDM5NyArIC0weDExM2YgKyAweGU5OCkpIHwKICAgICAgICAgICAgICAgICgoXzB4NTk4MGM1ID4+PiAoMHgyMTYxICsgMHgxYjcgKiAtMHg1ICsgMHhjNjYgKiAtMHgyKSkgJgogICAgICAgICAgICAgICAgICAoMHgyMmJiICsgLTB4ZjA4ICsgMHg2ICogLTB4MzQ2KSkKICAgICAgICAgICAgKSksCiAgICAgICAgICAiPSIgIT09CiAgICAgICAgICAgIF8weDEyODlmNVtfMHgzNDFlMDkoMHgyNWMpXSgKICAgICAgICAgICAgICBfMHg1YjE4NDkgKyAoMHgxMjVkICogMHgyICsgLTB4M2QgKiAtMHgzMSArIDB4MTQ2ICogLTB4MjYpCiAgICAgICAgICAgICkgJiYKICAgICAgICAgICAgKF8weDViZWJkNyArPSBTdHJpbmdbXzB4MzQxZTA5KDB4MWUyKV0oCiAgICAgICAgICAgICAgKChfMHg1OTgwYzUgPDwgKC0weDI2NTAgKyAweDE3ICogMHhlOSArIC0weDMgKiAtMHg1Y2QpKSAmCiAgICAgICAgICAgICAgICAoMHg3NTQgKyAtMHg1ZGYgKyAtMHhiNSkpIHwKICAgICAgICAgICAgICAgIF8weDMxZjc1OQogICAgICAgICAgICApKTsKICAgICAgcmV0dXJuIF8weDViZWJkNzsKICAgIH0KICAgIChfMHg2Y2FmW18weDU2MTJkZSgweDM4MCldID0gLTB4MTRlICogLTB4MiArIDB4MjUxOSArIC0weDIxNyAqIDB4MTMpLAogICAgICAoXzB4NmNhZlsibXNUb2tlbiJdID0gIiIpLAogICAgICAoXzB4NmNhZltfMHg1NjEyZGUoMHgyNjMpXSA9IF8weDM5NjkzZFtfMHg1NjEyZGUoMHgzYjkpXSksCiAgICAgIChfMHg2Y2FmW18weDU2MTJkZSgweDNiNSldID0gIiIpLAogICAgICAoXzB4NmNhZlsidHR3aWQiXSA9ICIiKSwKICAgICAgKF8weDZjYWZbXzB4NTYxMmRlKDB4MzE2KV0gPSAiIiksCiAgICAgIChfMHg2Y2FmW18weDU2MTJkZSgweDMzOSldID0gIiIpOwogICAgdmFyIF8weDI4ZDIzOSA9IDB4Nzc4ICsgMHhhNDEgKyAweDEgKiAtMHgxMWI5LAogICAgICBfMHgyZDZiNzIsCiAgICAgIF8weDFlOWJiYSwKICAgICAgXzB4ZGM3MzU1LAogICAgICBfMHhmMDgxODY7CiAgICBmdW5jdGlvbiBfMHgzM2Y0MDYoXzB4NGI1ZmI1KSB7CiAgICAgIHZhciBfMHgxZDFkYTQgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiAoCiAgICAgICAgKF8weDRiNWZiNSAmPSAtMHgyNjMyICsgMHgzICogLTB4NTkxICsgMHgzNzI0KSwKICAgICAgICBTdHJpbmdbXzB4MWQxZGE0KDB4MWUyKV0oCiAgICAgICAgICBfMHg0YjVmYjUgKwogICAgICAgICAgICAoXzB4NGI1ZmI1IDwgMHgyMmYgKiAweDEgKyAtMHgxY2FjICsgMHgzICogMHg4ZGQKICAgICAgICAgICAgICA/IC0weGQgKiAweDEyMyArIDB4MTlhYyArIC0weDU1MiAqIDB4MgogICAgICAgICAgICAgIDogXzB4NGI1ZmI1IDwgLTB4MSAqIC0weDE2NDYgKyAweDEgKiAtMHgxZjIxICsgLTB4MzA1ICogLTB4MwogICAgICAgICAgICAgID8gLTB4MmI0ICogMHgxICsgLTB4NDUgKiAweGIgKyAtMHgyICogLTB4MmY5CiAgICAgICAgICAgICAgOiBfMHg0YjVmYjUgPCAweDEgKiAweDcwYyArIDB4MTIzZiArIC0weDE5MGQgKiAweDEKICAgICAgICAgICAgICA/IC0oMHgxZjczICsgLTB4MSAqIC0weDNkNyArIC0weDQ2ICogMHg4MSkKICAgICAgICAgICAgICA6IC0oLTB4MjQ4ZiArIDB4MjBkMyArIDB4M2NkKSkKICAgICAgICApCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0ZGExMzYoXzB4NjIwZjQyKSB7CiAgICAgIHZhciBfMHhjYTQwZmEgPSBfMHgzM2Y0MDY7CiAgICAgIHJldHVybiAoCiAgICAgICAgXzB4Y2E0MGZhKF8weDYyMGY0MiA+PiAoMHg0MjAgKiAtMHg0ICsgLTB4NTNmICogLTB4NCArIC0weDQ2NCkpICsKICAgICAgICBfMHhjYTQwZmEoXzB4NjIwZjQyID4+ICgtMHgxNDkyICsgLTB4MTFjMyArIC0weDMgKiAtMHhjY2QpKSArCiAgICAgICAgXzB4Y2E0MGZhKF8weDYyMGY0MiA+PiAoMHgxNDc5ICsgMHg1NzEgKiAweDYgKyAtMHg3OTUgKiAweDcpKSArCiAgICAgICAgXzB4Y2E0MGZhKF8weDYyMGY0MiA+PiAoLTB4MWQgKiAweDRmICsgMHgzMTMgKiAtMHhiICsgMHgyYWNhKSkgKwogICAgICAgIF8weGNhNDBmYShfMHg2MjBmNDIpCiAgICAgICk7CiAgICB9CiAgICAoXzB4MmQ2YjcyID0gXzB4MWU5YmJhID0KICAgICAgZnVuY3Rpb24gKF8weDVkMmQzOSkgewogICAgICAgIHJldHVybiAoCiAgICAgICAgICAoXzB4MmQ2YjcyID0gXzB4ZGM3MzU1KSwKICAgICAgICAgIChfMHgyOGQyMzkgPSBfMHg1ZDJkMzkpLAogICAgICAgICAgXzB4NGRhMTM2KF8weDVkMmQzOSA+PiAoLTB4NDE4ICogMHg4ICsgMHg5ZmUgKyAweDdjICogMHgyZikpCiAgICAgICAgKTsKICAgICAgfSksCiAgICAgIChfMHhkYzczNTUgPSBmdW5jdGlvbiAoXzB4MTM1ZDlhKSB7CiAgICAgICAgXzB4MmQ2YjcyID0gXzB4ZjA4MTg2OwogICAgICAgIHZhciBfMHg5Y2RhYmIgPQogICAgICAgICAgKF8weDI4ZDIzOSA8PCAoLTB4YTQxICsgLTB4MTY0ZiArIDB4MmI5ICogMHhjKSkgfAogICAgICAgICAgKF8weDEzNWQ5YSA+Pj4gKDB4ZWU0ICsgMHgxICogLTB4MTQzICsgMHhjZCAqIC0weDExKSk7CiAgICAgICAgcmV0dXJuIChfMHgyOGQyMzkgPSBfMHgxMzVkOWEpLCBfMHg0ZGExMzYoXzB4OWNkYWJiKTsKICAgICAgfSksCiAgICAgIChfMHhmMDgxODYgPSBmdW5jdGlvbiAoXzB4MzZjMDU0KSB7CiAgICAgICAgcmV0dXJuICgKICAgICAgICAgIChfMHgyZDZiNzIgPSBfMHgxZTliYmEpLAogICAgICAgICAgXzB4NGRhMTM2KAogICAgICAgICAgICAoXzB4MjhkMjM5IDw8ICgtMHgzMDIgKyAweDEgKiAweDI0NDcgKyAtMHg3ICogMHg0YmQpKSB8CiAgICAgICAgICAgICAgKF8weDM2YzA1NCA+Pj4gKC0weDFmNWUgKyAweDFhYTAgKyAweDNkICogMHgxNCkpCiAgICAgICAgICApICsgXzB4MzNmNDA2KF8weDM2YzA1NCkKICAgICAgICApOwogICAgICB9KTsKICAgIHZhciBfMHg1MzkwOTcgPSAtMHgyICogLTB4NjIxYTRhZjUgKyAweGM2ODEyODdmICsgLTB4ZWM3ZTQ0YjAsCiAgICAgIF8weDEyYWRhMDsKICAgIGZ1bmN0aW9uIF8weDc1ZDViMyhfMHg1YTBhZmEsIF8weDFjY2JiZCkgewogICAgICB2YXIgXzB4MTM3ODBiID0gXzB4NTYxMmRlLAogICAgICAgIF8weGMzMTJkNCA9IF8weDVhMGFmYVsibGVuZ3RoIl0sCiAgICAgICAgXzB4MTAyODQ1ID0gXzB4YzMxMmQ0IDw8ICgtMHgzICogLTB4NzExICsgMHg5YTkgKiAweDIgKyAtMHgyODgzKTsKICAgICAgaWYgKF8weDFjY2JiZCkgewogICAgICAgIHZhciBfMHgyNTQzOGUgPQogICAgICAgICAgXzB4NWEwYWZhW18weGMzMTJkNCAtICgweDFiMTggKyAweDEgKiAweGZiNiArIC0weDEgKiAweDJhY2QpXTsKICAgICAgICBpZiAoCiAgICAgICAgICBfMHgyNTQzOGUgPAogICAgICAgICAgICAoXzB4MTAyODQ1IC09IDB4MWYgKiAweDYyICsgLTB4YWMwICsgLTB4OGQgKiAweDIpIC0KICAgICAgICAgICAgICAoLTB4ZmVkICsgLTB4OGEgKiAweDIzICsgMHgyMmNlKSB8fAogICAgICAgICAgXzB4MjU0MzhlID4gXzB4MTAyODQ1CiAgICAgICAgKQogICAgICAgICAgcmV0dXJuIG51bGw7CiAgICAgICAgXzB4MTAyODQ1ID0gXzB4MjU0MzhlOwogICAgICB9CiAgICAgIGZvciAoCiAgICAgICAgdmFyIF8weDQxZTBhMSA9IC0weDEzYiArIC0weDE5NjMgKyAtMHhkNGYgKiAtMHgyOwogICAgICAgIF8weDQxZTBhMSA8IF8weGMzMTJkNDsKICAgICAgICBfMHg0MWUwYTErKwogICAgICApCiAgICAgICAgXzB4NWEwYWZhW18weDQxZTBhMV0gPSBTdHJpbmdbImZyb21DaGFyQ29kZSJdKAogICAgICAgICAgKC0weDMwICogLTB4MTIgKyAtMHgyMzViICsgLTB4MTUgKiAtMHgxOTIpICYgXzB4NWEwYWZhW18weDQxZTBhMV0sCiAgICAgICAgICAoXzB4NWEwYWZhW18weDQxZTBhMV0gPj4+CiAgICAgICAgICAgICgtMHgxODM5ICogLTB4MSArIC0weDUgKiAtMHgxOTYgKyAweDEgKiAtMHgyMDFmKSkgJgogICAgICAgICAgICAoLTB4MiAqIDB4MmIzICsgMHgxICogMHgxOWM5ICsgLTB4MTM2NCksCiAgICAgICAgICAoXzB4NWEwYWZhW18weDQxZTBhMV0gPj4+CiAgICAgICAgICAgICgtMHgxMmIgKiAweDEgKyAweGE1NCAqIDB4MSArIC0weDExICogMHg4OSkpICYKICAgICAgICAgICAgKDB4YzM2ICogMHgyICsgMHgyICogMHgxMjU5ICsgMHgxICogLTB4M2MxZiksCiAgICAgICAgICAoXzB4NWEwYWZhW18weDQxZTBhMV0gPj4+ICgweDU2NCArIDB4MjMyNSArIC0weDE1ICogMHgxZWQpKSAmCiAgICAgICAgICAgICgweDI2NzMgKyAtMHgxNDExICsgLTB4MTE2MykKICAgICAgICApOwogICAgICB2YXIgXzB4NWVmODVlID0gXzB4NWEwYWZhW18weDEzNzgwYigweDI0ZildKCIiKTsKICAgICAgcmV0dXJuIF8weDFjY2JiZAogICAgICAgID8gXzB4NWVmODVlWyJzdWJzdHJpbmciXSgweDMgKiAtMHgzODggKyAtMHhlNDEgKyAweDE4ZDksIF8weDEwMjg0NSkKICAgICAgICA6IF8weDVlZjg1ZTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDE4Mzk1MShfMHgxNWY0ZDksIF8weDU5MjAwYikgewogICAgICB2YXIgXzB4NGYzNzNmID0gXzB4NTYxMmRlLAogICAgICAgIF8weDQwNzYxYSwKICAgICAgICBfMHg2MTU1ZWUgPSBfMHgxNWY0ZDlbXzB4NGYzNzNmKDB4MjU5KV0sCiAgICAgICAgXzB4MjFmZTgyID0gXzB4NjE1NWVlID4+ICgweGI4ZCAqIC0weDEgKyAtMHgxICogMHg1ZmUgKyAtMHgxICogLTB4MTE4ZCk7CiAgICAgIDB4NCAqIC0weGJjICsgMHgxMmYwICsgLTB4MTAwMCAhPQogICAgICAgICgoLTB4NzkgKiAweDIgKyAtMHhiMSAqIDB4MTYgKyAweDEwMmIpICYgXzB4NjE1NWVlKSAmJiArK18weDIxZmU4MiwKICAgICAgICBfMHg1OTIwMGIKICAgICAgICAgID8gKChfMHg0MDc2MWEgPSBuZXcgQXJyYXkoCiAgICAgICAgICAgICAgXzB4MjFmZTgyICsgKDB4MTMgKiAtMHg2NSArIC0weDE0ZWYgKyAweGZiICogMHgxZCkKICAgICAgICAgICAgKSlbXzB4MjFmZTgyXSA9IF8weDYxNTVlZSkKICAgICAgICAgIDogKF8weDQwNzYxYSA9IG5ldyBBcnJheShfMHgyMWZlODIpKTsKICAgICAgZm9yICgKICAgICAgICB2YXIgXzB4NTZiY2E0ID0gLTB4OWUwICsgMHg1MSAqIDB4MWEgKyAweDFhNjsKICAgICAgICBfMHg1NmJjYTQgPCBfMHg2MTU1ZWU7CiAgICAgICAgKytfMHg1NmJjYTQKICAgICAgKQogICAgICAgIF8weDQwNzYxYVsKICAgICAgICAgIF8weDU2YmNhNCA+PiAoLTB4YzFiICogLTB4MiArIC0weGMyICogLTB4MjEgKyAweDEgKiAtMHgzMTM2KQogICAgICAgIF0gfD0KICAgICAgICAgIF8weDE1ZjRkOVsiY2hhckNvZGVBdCJdKF8weDU2YmNhNCkgPDwKICAgICAgICAgICgoKDB4MyAqIC0weDRjZCArIC0weGRmYyArIDB4MWM2NikgJiBfMHg1NmJjYTQpIDw8CiAgICAgICAgICAgICgweDEgKiAtMHgxMzNiICsgMHgyMWE1ICsgMHhlNjcgKiAtMHgxKSk7CiAgICAgIHJldHVybiBfMHg0MDc2MWE7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyNWM5MDEoXzB4NDMxYjlkKSB7CiAgICAgIHJldHVybiAoMHgxYTEyOTk1ODcgKyAweDkxNTM5ICogLTB4MWMxYiArIC0weDIwMmIwNyAqIC0weDJlZCkgJiBfMHg0MzFiOWQ7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzOGQzM2UoCiAgICAgIF8weDFhZWQzMSwKICAgICAgXzB4MjEyZThhLAogICAgICBfMHg0MjdiMTUsCiAgICAgIF8weDhmY2QzOSwKICAgICAgXzB4NGVhYWQ2LAogICAgICBfMHg1MzJiOGUKICAgICkgewogICAgICByZXR1cm4gKAogICAgICAgICgoKF8weDQyN2IxNSA+Pj4gKC0weDEgKiAtMHgxZGRiICsgLTB4MjBmNyArIC0weDMgKiAtMHgxMGIpKSBeCiAgICAgICAgICAoXzB4MjEyZThhIDw8ICgtMHgxICogLTB4NDA3ICsgLTB4MTMyZSArIC0weGYyOSAqIC0weDEpKSkgKwogICAgICAgICAgKChfMHgyMTJlOGEgPj4+ICgtMHg4MjggKyAtMHhmMjMgKyAtMHg5ZCAqIC0weDI2KSkgXgogICAgICAgICAgICAoXzB4NDI3YjE1IDw8ICgtMHhkNTEgKyAweGM5ZiArIDB4YjYpKSkpIF4KICAgICAgICAoKF8weDFhZWQzMSBeIF8weDIxMmU4YSkgKwogICAgICAgICAgKF8weDUzMmI4ZVsoKDB4OWFkICsgLTB4NzYzICsgLTB4YiAqIDB4MzUpICYgXzB4OGZjZDM5KSBeIF8weDRlYWFkNl0gXgogICAgICAgICAgICBfMHg0MjdiMTUpKQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MjMxNDg0KF8weGVmZTgxMSkgewogICAgICB2YXIgXzB4MTNlYWY1ID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gKAogICAgICAgIF8weGVmZTgxMVtfMHgxM2VhZjUoMHgyNTkpXSA8IC0weGExMyArIDB4MTA4NiArIC0weDY2ZiAmJgogICAgICAgICAgKF8weGVmZTgxMVtfMHgxM2VhZjUoMHgyNTkpXSA9CiAgICAgICAgICAgIC0weDEzNzEgKyAtMHgxZWMxICogLTB4MSArIDB4NWE2ICogLTB4MiksCiAgICAgICAgXzB4ZWZlODExCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzZDU4ZTcoXzB4NWUyOGYyLCBfMHg0NjhiNTIpIHsKICAgICAgdmFyIF8weDUwYzEwMCA9IF8weDU2MTJkZSwKICAgICAgICBfMHg3YzM1ZGYsCiAgICAgICAgXzB4NGM5N2IzLAogICAgICAgIF8weDVlMDI3MCwKICAgICAgICBfMHgzMDM0ZGIsCiAgICAgICAgXzB4NTZmODE3LAogICAgICAgIF8weDMwODRiOCwKICAgICAgICBfMHg2NmRmNDAgPSBfMHg1ZTI4ZjJbXzB4NTBjMTAwKDB4MjU5KV0sCiAgICAgICAgXzB4NTUwNmY1ID0gXzB4NjZkZjQwIC0gKC0weDFjNzYgKyAweDIyNDYgKyAtMHg1Y2YpOwogICAgICBmb3IgKAogICAgICAgIF8weDRjOTdiMyA9IF8weDVlMjhmMltfMHg1NTA2ZjVdLAogICAgICAgICAgXzB4NWUwMjcwID0gMHgyMmVlICsgMHhhMTUgKiAtMHgxICsgLTB4MThkOSAqIDB4MSwKICAgICAgICAgIF8weDMwODRiOCA9CiAgICAgICAgICAgICgweDEgKiAweDM2ZiArIC0weDI3MDcgKyAweDIzOTgpIHwKICAgICAgICAgICAgTWF0aFtfMHg1MGMxMDAoMHgxY2YpXSgKICAgICAgICAgICAgICAweGM3MiAqIDB4MiArCiAgICAgICAgICAgICAgICAtMHhlMyAqIDB4MmIgKwogICAgICAgICAgICAgICAgMHhkNDMgKwogICAgICAgICAgICAgICAgKDB4MWEgKyAweDFjMmEgKyAtMHgxYzEwKSAvIF8weDY2ZGY0MAogICAgICAgICAgICApOwogICAgICAgIF8weDMwODRiOCA+IDB4MSAqIC0weDFjZCArIC0weDI0NzYgKyAweDI2NDM7CiAgICAgICAgLS1fMHgzMDg0YjgKICAgICAgKSB7CiAgICAgICAgZm9yICgKICAgICAgICAgIF8weDMwMzRkYiA9CiAgICAgICAgICAgICgoXzB4NWUwMjcwID0gXzB4MjVjOTAxKF8weDVlMDI3MCArIF8weDUzOTA5NykpID4+PgogICAgICAgICAgICAgICgweDNiICogLTB4MmYgKyAweDEyOTAgKyAweDMgKiAtMHgyOTMpKSAmCiAgICAgICAgICAgICgweDE1MzMgKyAtMHgxMTZkICsgLTB4M2MzKSwKICAgICAgICAgICAgXzB4NTZmODE3ID0gMHg4ICogMHgyM2IgKyAtMHhiODkgKyAweDY0ZiAqIC0weDE7CiAgICAgICAgICBfMHg1NmY4MTcgPCBfMHg1NTA2ZjU7CiAgICAgICAgICArK18weDU2ZjgxNwogICAgICAgICkKICAgICAgICAgIChfMHg3YzM1ZGYgPQogICAgICAgICAgICBfMHg1ZTI4ZjJbXzB4NTZmODE3ICsgKDB4M2IgKiAweDVmICsgLTB4MWUxICogMHgxICsgLTB4MTQwMyldKSwKICAgICAgICAgICAgKF8weDRjOTdiMyA9IF8weDVlMjhmMltfMHg1NmY4MTddID0KICAgICAgICAgICAgICBfMHgyNWM5MDEoCiAgICAgICAgICAgICAgICBfMHg1ZTI4ZjJbXzB4NTZmODE3XSArCiAgICAgICAgICAgICAgICAgIF8weDM4ZDMzZSgKICAgICAgICAgICAgICAgICAgICBfMHg1ZTAyNzAsCiAgICAgICAgICAgICAgICAgICAgXzB4N2MzNWRmLAogICAgICAgICAgICAgICAgICAgIF8weDRjOTdiMywKICAgICAgICAgICAgICAgICAgICBfMHg1NmY4MTcsCiAgICAgICAgICAgICAgICAgICAgXzB4MzAzNGRiLAogICAgICAgICAgICAgICAgICAgIF8weDQ2OGI1MgogICAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgKSk7CiAgICAgICAgKF8weDdjMzVkZiA9IF8weDVlMjhmMlstMHgxNTcwICsgLTB4MSAqIC0weDM4NSArIC0weDhiICogLTB4MjFdKSwKICAgICAgICAgIChfMHg0Yzk3YjMgPSBfMHg1ZTI4ZjJbXzB4NTUwNmY1XSA9CiAgICAgICAgICAgIF8weDI1YzkwMSgKICAgICAgICAgICAgICBfMHg1ZTI4ZjJbXzB4NTUwNmY1XSArCiAgICAgICAgICAgICAgICBfMHgzOGQzM2UoCiAgICAgICAgICAgICAgICAgIF8weDVlMDI3MCwKICAgICAgICAgICAgICAgICAgXzB4N2MzNWRmLAogICAgICAgICAgICAgICAgICBfMHg0Yzk3YjMsCiAgICAgICAgICAgICAgICAgIF8weDU1MDZmNSwKICAgICAgICAgICAgICAgICAgXzB4MzAzNGRiLAogICAgICAgICAgICAgICAgICBfMHg0NjhiNTIKICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgKSk7CiAgICAgIH0KICAgICAgcmV0dXJuIF8weDVlMjhmMjsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDRhYWYwNChfMHgzM2E3YmEsIF8weDM4NjE5NikgewogICAgICB2YXIgXzB4MjU3YzBiID0gXzB4NTYxMmRlLAogICAgICAgIF8weDM3OTI4OCwKICAgICAgICBfMHgyNDdhOGIsCiAgICAgICAgXzB4MzM0YmI5LAogICAgICAgIF8weDJmYTgzZiwKICAgICAgICBfMHg0MTdhODgsCiAgICAgICAgXzB4MmEzYWU1ID0gXzB4MzNhN2JhW18weDI1N2MwYigweDI1OSldLAogICAgICAgIF8weDQyOWEwZCA9IF8weDJhM2FlNSAtICgweGMxICogLTB4MTEgKyAweDFmOTkgKyAtMHhiICogMHgxYjUpOwogICAgICBmb3IgKAogICAgICAgIF8weDM3OTI4OCA9IF8weDMzYTdiYVstMHgxICogLTB4MTM5NyArIC0weDEzICogLTB4MTg3ICsgLTB4MzA5Y10sCiAgICAgICAgICBfMHgzMzRiYjkgPSBfMHgyNWM5MDEoCiAgICAgICAgICAgIE1hdGhbXzB4MjU3YzBiKDB4MWNmKV0oCiAgICAgICAgICAgICAgMHhlNTIgKiAtMHgxICsKICAgICAgICAgICAgICAgIC0weDEwICogMHhiICsKICAgICAgICAgICAgICAgIC0weDM0ICogLTB4NGEgKwogICAgICAgICAgICAgICAgKC0weDMgKiAtMHhkOSArIDB4OWYgKiAweDJmICsgMHhmYzQgKiAtMHgyKSAvIF8weDJhM2FlNQogICAgICAgICAgICApICogXzB4NTM5MDk3CiAgICAgICAgICApOwogICAgICAgIC0weDJlICogMHgxZiArIDB4MjIyMyArIC0weDQ3ICogMHg2NyAhPT0gXzB4MzM0YmI5OwogICAgICAgIF8weDMzNGJiOSA9IF8weDI1YzkwMShfMHgzMzRiYjkgLSBfMHg1MzkwOTcpCiAgICAgICkgewogICAgICAgIGZvciAoCiAgICAgICAgICBfMHgyZmE4M2YgPQogICAgICAgICAgICAoXzB4MzM0YmI5ID4+PiAoMHg0MzcgKiAweDUgKyAtMHhmZCAqIDB4MjIgKyAtMHhjODkgKiAtMHgxKSkgJgogICAgICAgICAgICAoMHgxICogMHg4NjMgKyAweDIyNjcgKiAweDEgKyAtMHgyZiAqIDB4ZTkpLAogICAgICAgICAgICBfMHg0MTdhODggPSBfMHg0MjlhMGQ7CiAgICAgICAgICBfMHg0MTdhODggPiAweGZjNyArIC0weDc4OCAqIC0weDEgKyAtMHgxNWYgKiAweDExOwogICAgICAgICAgLS1fMHg0MTdhODgKICAgICAgICApCiAgICAgICAgICAoXzB4MjQ3YThiID0KICAgICAgICAgICAgXzB4MzNhN2JhW18weDQxN2E4OCAtICgweDNiICogLTB4NGYgKyAweDZkICogLTB4YSArIDB4YjNjICogMHgyKV0pLAogICAgICAgICAgICAoXzB4Mzc5Mjg4ID0gXzB4MzNhN2JhW18weDQxN2E4OF0gPQogICAgICAgICAgICAgIF8weDI1YzkwMSgKICAgICAgICAgICAgICAgIF8weDMzYTdiYVtfMHg0MTdhODhdIC0KICAgICAgICAgICAgICAgICAgXzB4MzhkMzNlKAogICAgICAgICAgICAgICAgICAgIF8weDMzNGJiOSwKICAgICAgICAgICAgICAgICAgICBfMHgzNzkyODgsCiAgICAgICAgICAgICAgICAgICAgXzB4MjQ3YThiLAogICAgICAgICAgICAgICAgICAgIF8weDQxN2E4OCwKICAgICAgICAgICAgICAgICAgICBfMHgyZmE4M2YsCiAgICAgICAgICAgICAgICAgICAgXzB4Mzg2MTk2CiAgICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICApKTsKICAgICAgICAoXzB4MjQ3YThiID0gXzB4MzNhN2JhW18weDQyOWEwZF0pLAogICAgICAgICAgKF8weDM3OTI4OCA9IF8weDMzYTdiYVstMHgxZmIgKyAweDE5NTIgKiAtMHgxICsgLTB4MWQgKiAtMHhmMV0gPQogICAgICAgICAgICBfMHgyNWM5MDEoCiAgICAgICAgICAgICAgXzB4MzNhN2JhWzB4NyAqIDB4NTkgKyAweDUgKiAtMHgyZDIgKyAweGJhYl0gLQogICAgICAgICAgICAgICAgXzB4MzhkMzNlKAogICAgICAgICAgICAgICAgICBfMHgzMzRiYjksCiAgICAgICAgICAgICAgICAgIF8weDM3OTI4OCwKICAgICAgICAgICAgICAgICAgXzB4MjQ3YThiLAogICAgICAgICAgICAgICAgICAtMHhiYWMgKyAtMHg3ICogMHhlYSArIC0weDYwNiAqIC0weDMsCiAgICAgICAgICAgICAgICAgIF8weDJmYTgzZiwKICAgICAgICAgICAgICAgICAgXzB4Mzg2MTk2CiAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICkpOwogICAgICB9CiAgICAgIHJldHVybiBfMHgzM2E3YmE7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1MzI1OTYoXzB4MjM5NGVkKSB7CiAgICAgIHZhciBfMHgyMmY1ZTggPSBfMHg1NjEyZGU7CiAgICAgIGlmICgvXltceDAwLVx4N2ZdKiQvW18weDIyZjVlOCgweDIyYildKF8weDIzOTRlZCkpIHJldHVybiBfMHgyMzk0ZWQ7CiAgICAgIGZvciAoCiAgICAgICAgdmFyIF8weDQ3ZTg0MCA9IFtdLAogICAgICAgICAgXzB4NWYwNGI4ID0gXzB4MjM5NGVkW18weDIyZjVlOCgweDI1OSldLAogICAgICAgICAgXzB4MTUwNjY2ID0gLTB4ZTk3ICsgMHhkMDIgKyAweDE5NSwKICAgICAgICAgIF8weDE5YjE1NyA9IDB4ZjFjICsgLTB4MWY1ICogMHg4ICsgMHg4YzsKICAgICAgICBfMHgxNTA2NjYgPCBfMHg1ZjA0Yjg7CiAgICAgICAgKytfMHgxNTA2NjYsICsrXzB4MTliMTU3CiAgICAgICkgewogICAgICAgIHZhciBfMHg0NGRlNTMgPSBfMHgyMzk0ZWRbXzB4MjJmNWU4KDB4MTk1KV0oXzB4MTUwNjY2KTsKICAgICAgICBpZiAoXzB4NDRkZTUzIDwgLTB4MSAqIC0weGI3YiArIDB4MTU2NiArIC0weDIwNjEpCiAgICAgICAgICBfMHg0N2U4NDBbXzB4MTliMTU3XSA9IF8weDIzOTRlZFtfMHgyMmY1ZTgoMHgyNWMpXShfMHgxNTA2NjYpOwogICAgICAgIGVsc2UgewogICAgICAgICAgaWYgKF8weDQ0ZGU1MyA8IC0weDMgKiAweGNkMiArIDB4MTE2OCArIDB4MSAqIDB4MWQwZSkKICAgICAgICAgICAgXzB4NDdlODQwW18weDE5YjE1N10gPSBTdHJpbmdbImZyb21DaGFyQ29kZSJdKAogICAgICAgICAgICAgICgweDIgKiAweDU3OSArIDB4MjYzYyAqIDB4MSArIDB4MzA2ZSAqIC0weDEpIHwKICAgICAgICAgICAgICAgIChfMHg0NGRlNTMgPj4gKDB4Y2E0ICogLTB4MSArIDB4NmYgKiAweDEzICsgLTB4NDZkICogLTB4MSkpLAogICAgICAgICAgICAgICgweDcgKiAtMHg1ICsgMHgzNSAqIDB4NzMgKyAtMHgxNzJjKSB8CiAgICAgICAgICAgICAgICAoKDB4Zjg4ICogLTB4MSArIC0weDEwOGYgKiAtMHgxICsgLTB4YzgpICYgXzB4NDRkZTUzKQogICAgICAgICAgICApOwogICAgICAgICAgZWxzZSB7CiAgICAgICAgICAgIGlmICgKICAgICAgICAgICAgICAhKAogICAgICAgICAgICAgICAgXzB4NDRkZTUzIDwgLTB4YWViYiAqIDB4MSArIC0weDMgKiAtMHgzYTQ2ICsgMHg2ZjcgKiAweDFmIHx8CiAgICAgICAgICAgICAgICBfMHg0NGRlNTMgPiAweDE2NzliICogMHgxICsgLTB4MTIxICogLTB4MTUgKyAtMHg5ZjUxCiAgICAgICAgICAgICAgKQogICAgICAgICAgICApIHsKICAgICAgICAgICAgICBpZiAoXzB4MTUwNjY2ICsgKDB4MTVhNiArIDB4MWVjMSArIC0weDI2ICogMHgxNjEpIDwgXzB4NWYwNGI4KSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4MjU0ZmY2ID0gXzB4MjM5NGVkW18weDIyZjVlOCgweDE5NSldKAogICAgICAgICAgICAgICAgICBfMHgxNTA2NjYgKyAoLTB4NDIgKiAtMHg3YSArIDB4NCAqIDB4OTFkICsgLTB4NDNlNykKICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgICAgIF8weDQ0ZGU1MyA8IC0weDE4MWU0ICsgMHhiY2JiICsgMHgxYTEyOSAmJgogICAgICAgICAgICAgICAgICAtMHgxN2RiICogLTB4ZiArIDB4YWM2ZCAqIC0weDEgKyAtMHgzZDggKiAtMHg5IDw9IF8weDI1NGZmNiAmJgogICAgICAgICAgICAgICAgICBfMHgyNTRmZjYgPD0gMHgxNTlhICsgMHgxNzk2NyArIDB4OWI5ICogLTB4MTIKICAgICAgICAgICAgICAgICkgewogICAgICAgICAgICAgICAgICB2YXIgXzB4MzA0MzEwID0KICAgICAgICAgICAgICAgICAgICAtMHgxODYyZiArCiAgICAgICAgICAgICAgICAgICAgMHgxMTIxZCArCiAgICAgICAgICAgICAgICAgICAgMHgyICogMHhiYTA5ICsKICAgICAgICAgICAgICAgICAgICAoKCgoMHgxICogLTB4MTQwZiArIC0weDE4ZGQgKyAweDMwZWIpICYgXzB4NDRkZTUzKSA8PAogICAgICAgICAgICAgICAgICAgICAgKC0weGIwICogLTB4OCArIDB4ODc1ICsgLTB4NyAqIDB4MWZkKSkgfAogICAgICAgICAgICAgICAgICAgICAgKCgweDIzMDEgKyAweDE3MWYgKyAweDM2MjEgKiAtMHgxKSAmIF8weDI1NGZmNikpOwogICAgICAgICAgICAgICAgICAoXzB4NDdlODQwW18weDE5YjE1N10gPSBTdHJpbmdbXzB4MjJmNWU4KDB4MWUyKV0oCiAgICAgICAgICAgICAgICAgICAgKDB4MWFmYyAqIC0weDEgKyAweDI2ZjQgKyAtMHhiMDgpIHwKICAgICAgICAgICAgICAgICAgICAgICgoXzB4MzA0MzEwID4+ICgweGIgKiAweDE0ZSArIC0weDExOSAqIC0weDFkICsgLTB4MmUxZCkpICYKICAgICAgICAgICAgICAgICAgICAgICAgKDB4MTAzNyAqIDB4MSArIC0weDEwOTAgKyAtMHgyICogLTB4NGMpKSwKICAgICAgICAgICAgICAgICAgICAoMHgxOTIyICsgMHg0ICogMHgzNTEgKyAtMHgyNWU2KSB8CiAgICAgICAgICAgICAgICAgICAgICAoKF8weDMwNDMxMCA+PiAoMHgxZTkzICsgLTB4NTE3ICsgLTB4MTk3MCkpICYKICAgICAgICAgICAgICAgICAgICAgICAgKDB4MjQ4MSArIDB4MTU5MSArIC0weDM5ZDMpKSwKICAgICAgICAgICAgICAgICAgICAoLTB4YWNlICogLTB4MSArIDB4MWVmMyArIC0weDI5NDEpIHwKICAgICAgICAgICAgICAgICAgICAgICgoXzB4MzA0MzEwID4+ICgtMHhiN2YgKiAtMHgzICsgLTB4MSAqIDB4ZTdkICsgLTB4MTNmYSkpICYKICAgICAgICAgICAgICAgICAgICAgICAgKC0weDEwZCAqIC0weDYgKyAweDI1MmEgKiAweDEgKyAtMHgyYjM5KSksCiAgICAgICAgICAgICAgICAgICAgKC0weDFjNjEgKiAweDEgKyAweDEgKiAtMHg1ZTcgKyAtMHgxM2UgKiAtMHgxYykgfAogICAgICAgICAgICAgICAgICAgICAgKCgweDEzICogLTB4MWY5ICsgMHgxNiAqIC0weDE2NCArIC0weDM3ICogLTB4MTNlKSAmCiAgICAgICAgICAgICAgICAgICAgICAgIF8weDMwNDMxMCkKICAgICAgICAgICAgICAgICAgKSksCiAgICAgICAgICAgICAgICAgICAgKytfMHgxNTA2NjY7CiAgICAgICAgICAgICAgICAgIGNvbnRpbnVlOwogICAgICAgICAgICAgICAgfQogICAgICAgICAgICAgIH0KICAgICAgICAgICAgICB0aHJvdyBuZXcgRXJyb3IoXzB4MjJmNWU4KDB4Mjk3KSk7CiAgICAgICAgICAgIH0KICAgICAgICAgICAgXzB4NDdlODQwW18weDE5YjE1N10gPSBTdHJpbmdbXzB4MjJmNWU4KDB4MWUyKV0oCiAgICAgICAgICAgICAgKC0weDE3MGIgKyAweDEwOWIgKyAweDc1MCkgfAogICAgICAgICAgICAgICAgKF8weDQ0ZGU1MyA+PiAoLTB4YmYwICogLTB4MiArIDB4MjViYyArIC0weDNkOTApKSwKICAgICAgICAgICAgICAoMHg0ZWMgKyAweDFmMGMgKyAtMHg4ZGUgKiAweDQpIHwKICAgICAgICAgICAgICAgICgoXzB4NDRkZTUzID4+ICgweDIgKiAweDgyOSArIC0weDFiICogLTB4MTBjICsgLTB4MmM5MCkpICYKICAgICAgICAgICAgICAgICAgKC0weDIzMjIgKyAweDE5ZDUgKyAweDM0ICogMHgyZikpLAogICAgICAgICAgICAgICgweDJhMSArIDB4MSAqIDB4MWFjMCArIDB4MSAqIC0weDFjZTEpIHwKICAgICAgICAgICAgICAgICgoLTB4ZTk1ICsgMHgxY2YgKiAweDExICsgMHgxICogLTB4ZmViKSAmIF8weDQ0ZGU1MykKICAgICAgICAgICAgKTsKICAgICAgICAgIH0KICAgICAgICB9CiAgICAgIH0KICAgICAgcmV0dXJuIF8weDQ3ZTg0MFtfMHgyMmY1ZTgoMHgyNGYpXSgiIik7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0NWZiZWYoXzB4MzE2ODI3LCBfMHgyYTAzOWYpIHsKICAgICAgdmFyIF8weDFjODBhYyA9IF8weDU2MTJkZTsKICAgICAgZm9yICgKICAgICAgICB2YXIgXzB4NDkyMWUyID0gbmV3IEFycmF5KF8weDJhMDM5ZiksCiAgICAgICAgICBfMHg3OWE0MDIgPSAweDIwYmQgKyAtMHgxMGIxICsgLTB4MSAqIDB4MTAwYywKICAgICAgICAgIF8weDI4Yjg5NSA9IC0weGQyYyArIC0weDE3MzAgKyAweDEgKiAweDI0NWMsCiAgICAgICAgICBfMHgyYmM4OGIgPSBfMHgzMTY4MjdbXzB4MWM4MGFjKDB4MjU5KV07CiAgICAgICAgXzB4NzlhNDAyIDwgXzB4MmEwMzlmICYmIF8weDI4Yjg5NSA8IF8weDJiYzg4YjsKICAgICAgICBfMHg3OWE0MDIrKwogICAgICApIHsKICAgICAgICB2YXIgXzB4NDNiNTE4ID0gXzB4MzE2ODI3W18weDFjODBhYygweDE5NSldKF8weDI4Yjg5NSsrKTsKICAgICAgICBzd2l0Y2ggKF8weDQzYjUxOCA+PiAoLTB4MTM0MiArIDB4NjcgKiAtMHg1MyArIDB4MzRhYikpIHsKICAgICAgICAgIGNhc2UgLTB4NDEwICogLTB4MyArIC0weGQ5ICsgLTB4YjU3OgogICAgICAgICAgY2FzZSAtMHgxN2NiICsgMHgyMzYyICsgLTB4Yjk2ICogMHgxOgogICAgICAgICAgY2FzZSAtMHgyNCAqIDB4N2YgKyAtMHgxICogLTB4Y2ZjICsgMHgxOSAqIDB4MzI6CiAgICAgICAgICBjYXNlIDB4MjAyNSArIDB4MTEwMiArIC0weDMxMjQ6CiAgICAgICAgICBjYXNlIDB4MWIwZCArIDB4Y2I0ICsgMHhkM2YgKiAtMHgzOgogICAgICAgICAgY2FzZSAtMHgxMWQ5ICsgMHg5ICogMHgxNmQgKyAtMHgxICogLTB4NTA5OgogICAgICAgICAgY2FzZSAweDc5ICogMHg0OSArIDB4MSAqIDB4MWI4ZSArIC0weDNlMDkgKiAweDE6CiAgICAgICAgICBjYXNlIDB4MjZjMSArIC0weDIxMzcgKiAweDEgKyAtMHg1ODM6CiAgICAgICAgICAgIF8weDQ5MjFlMltfMHg3OWE0MDJdID0gXzB4NDNiNTE4OwogICAgICAgICAgICBicmVhazsKICAgICAgICAgIGNhc2UgMHgxMGYgKiAtMHgxMyArIDB4NDI2ICsgMHgxMDAzOgogICAgICAgICAgY2FzZSAweDE2NGQgKiAweDEgKyAweGI1YSAqIDB4MyArIDB4MWMyNyAqIC0weDI6CiAgICAgICAgICAgIGlmICghKF8weDI4Yjg5NSA8IF8weDJiYzg4YikpCiAgICAgICAgICAgICAgdGhyb3cgbmV3IEVycm9yKCJVbmZpbmlzaGVkXHgyMFVURi04XHgyMG9jdGV0XHgyMHNlcXVlbmNlIik7CiAgICAgICAgICAgIF8weDQ5MjFlMltfMHg3OWE0MDJdID0KICAgICAgICAgICAgICAoKCgtMHgxZjcgKiAweGIgKyAtMHgxZmEwICsgMHgyYWIgKiAweDE0KSAmIF8weDQzYjUxOCkgPDwKICAgICAgICAgICAgICAgICgtMHgyMzNiICsgMHgxNjBlICsgMHhkMzMpKSB8CiAgICAgICAgICAgICAgKCgtMHgxZTQwICsgMHgyMmI5ICsgLTB4MiAqIDB4MjFkKSAmCiAgICAgICAgICAgICAgICBfMHgzMTY4MjdbXzB4MWM4MGFjKDB4MTk1KV0oXzB4MjhiODk1KyspKTsKICAgICAgICAgICAgYnJlYWs7CiAgICAgICAgICBjYXNlIC0weDI1MTIgKyAtMHgxNTk1ICsgMHgzYWI1OgogICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgISgKICAgICAgICAgICAgICAgIF8weDI4Yjg5NSArICgweGJhMyAqIC0weDEgKyAtMHgxN2RkICogMHgxICsgMHgxICogMHgyMzgxKSA8CiAgICAgICAgICAgICAgICBfMHgyYmM4OGIKICAgICAgICAgICAgICApCiAgICAgICAgICAgICkKICAgICAgICAgICAgICB0aHJvdyBuZXcgRXJyb3IoXzB4MWM4MGFjKDB4Mzk0KSk7CiAgICAgICAgICAgIF8weDQ5MjFlMltfMHg3OWE0MDJdID0KICAgICAgICAgICAgICAoKCgweDI0N2YgKiAtMHgxICsgMHhlYzIgKiAweDEgKyAtMHgxMzYgKiAtMHgxMikgJiBfMHg0M2I1MTgpIDw8CiAgICAgICAgICAgICAgICAoMHgxICogMHgxYmNkICsgLTB4M2RkICsgLTB4MTdlNCkpIHwKICAgICAgICAgICAgICAoKCgweDE2MzEgKyAtMHgxMDU4ICsgMHgyICogLTB4MmNkKSAmCiAgICAgICAgICAgICAgICBfMHgzMTY4MjdbXzB4MWM4MGFjKDB4MTk1KV0oXzB4MjhiODk1KyspKSA8PAogICAgICAgICAgICAgICAgKDB4ODg5ICogMHg0ICsgMHgxMWM4ICogMHgyICsgLTB4NDVhZSkpIHwKICAgICAgICAgICAgICAoKC0weDY5OCAqIC0weDQgKyAtMHgyZiAqIC0weDRmICsgLTB4MjhhMikgJgogICAgICAgICAgICAgICAgXzB4MzE2ODI3W18weDFjODBhYygweDE5NSldKF8weDI4Yjg5NSsrKSk7CiAgICAgICAgICAgIGJyZWFrOwogICAgICAgICAgY2FzZSAtMHg4NSAqIC0weDggKyAweDExNDggKyAtMHgxNTYxOgogICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgIShfMHgyOGI4OTUgKyAoMHgxICogLTB4OGYxICsgLTB4NjcgKiAweDNlICsgMHgyMWU1KSA8IF8weDJiYzg4YikKICAgICAgICAgICAgKQogICAgICAgICAgICAgIHRocm93IG5ldyBFcnJvcihfMHgxYzgwYWMoMHgzOTQpKTsKICAgICAgICAgICAgdmFyIF8weDE3NDBhYyA9CiAgICAgICAgICAgICAgKCgoKDB4MSAqIC0weDFkNGYgKyAweDEgKiAweDI0YmYgKyAtMHg3NjkpICYgXzB4NDNiNTE4KSA8PAogICAgICAgICAgICAgICAgKDB4YjE5ICsgMHg0YSAqIC0weDQ4ICsgLTB4MyAqIC0weDM0MykpIHwKICAgICAgICAgICAgICAgICgoKC0weDFhYjQgKyAtMHgyMDUgKiAtMHg4ICsgLTB4MyAqIC0weDM5OSkgJgogICAgICAgICAgICAgICAgICBfMHgzMTY4MjdbXzB4MWM4MGFjKDB4MTk1KV0oXzB4MjhiODk1KyspKSA8PAogICAgICAgICAgICAgICAgICAoMHgxZTUyICsgLTB4MTQ0YiArIC0weDUgKiAweDFmZikpIHwKICAgICAgICAgICAgICAgICgoKDB4NGM1ICogLTB4MyArIDB4MSAqIC0weDcwYiArIDB4MTU5OSkgJgogICAgICAgICAgICAgICAgICBfMHgzMTY4MjdbXzB4MWM4MGFjKDB4MTk1KV0oXzB4MjhiODk1KyspKSA8PAogICAgICAgICAgICAgICAgICAoLTB4ZjZlICsgLTB4MzcgKiAtMHg4NiArIDB4MjM5ICogLTB4NikpIHwKICAgICAgICAgICAgICAgICgoMHgyICogLTB4YzMxICsgMHgyNmI1ICsgLTB4ZTE0KSAmCiAgICAgICAgICAgICAgICAgIF8weDMxNjgyN1tfMHgxYzgwYWMoMHgxOTUpXShfMHgyOGI4OTUrKykpKSAtCiAgICAgICAgICAgICAgKDB4MSAqIC0weDZiNmIgKyAtMHgxNDUwMiArIC0weDEgKiAtMHgyYjA2ZCk7CiAgICAgICAgICAgIGlmICgKICAgICAgICAgICAgICAhKAogICAgICAgICAgICAgICAgMHg4NiAqIDB4ZCArIC0weDIyMTAgKyAweDFiNDIgPD0gXzB4MTc0MGFjICYmCiAgICAgICAgICAgICAgICBfMHgxNzQwYWMgPD0gMHgxNDFkMSAqIDB4MSArIC0weDMwNDQgKiAtMHg4YiArIDB4MSAqIC0weGI3NmJlCiAgICAgICAgICAgICAgKQogICAgICAgICAgICApCiAgICAgICAgICAgICAgdGhyb3cgbmV3IEVycm9yKAogICAgICAgICAgICAgICAgXzB4MWM4MGFjKDB4MjRlKSArCiAgICAgICAgICAgICAgICAgIF8weDE3NDBhY1sidG9TdHJpbmciXSgKICAgICAgICAgICAgICAgICAgICAtMHg5NTkgKiAweDMgKyAtMHg1MGUgKiAtMHg1ICsgLTB4MSAqIC0weDJkNQogICAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgKF8weDQ5MjFlMltfMHg3OWE0MDIrK10gPQogICAgICAgICAgICAgICgoXzB4MTc0MGFjID4+ICgtMHgxYTg5ICogMHgxICsgMHgxMjUgKiAtMHgxICsgMHgxYmI4KSkgJgogICAgICAgICAgICAgICAgKC0weDIgKiAweDEyZTQgKyAweGMxZSArIDB4MWRhOSkpIHwKICAgICAgICAgICAgICAoLTB4NGUgKiAtMHgzMzIgKyAtMHg2NzY0ICogLTB4MiArIC0weGYwMDQgKiAweDEpKSwKICAgICAgICAgICAgICAoXzB4NDkyMWUyW18weDc5YTQwMl0gPQogICAgICAgICAgICAgICAgKCgweDIzZjAgKyAweDJiICogMHgxMSArIC0weDQgKiAweDhiMykgJiBfMHgxNzQwYWMpIHwKICAgICAgICAgICAgICAgICgweGI0NWQgKyAtMHhkMzUyICsgMHgzICogMHg1M2E3KSk7CiAgICAgICAgICAgIGJyZWFrOwogICAgICAgICAgZGVmYXVsdDoKICAgICAgICAgICAgdGhyb3cgbmV3IEVycm9yKAogICAgICAgICAgICAgIF8weDFjODBhYygweDMzMCkgKwogICAgICAgICAgICAgICAgXzB4NDNiNTE4W18weDFjODBhYygweDNhZSldKC0weDFmNzEgKyAweGRjMyAqIC0weDEgKyAweDJkNDQpCiAgICAgICAgICAgICk7CiAgICAgICAgfQogICAgICB9CiAgICAgIHJldHVybiAoCiAgICAgICAgXzB4NzlhNDAyIDwgXzB4MmEwMzlmICYmIChfMHg0OTIxZTJbXzB4MWM4MGFjKDB4MjU5KV0gPSBfMHg3OWE0MDIpLAogICAgICAgIFN0cmluZ1tfMHgxYzgwYWMoMHgxZTIpXVsiYXBwbHkiXShTdHJpbmcsIF8weDQ5MjFlMikKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDI1YmZlMShfMHg1YWQwMjAsIF8weDEwMDFmMSkgewogICAgICB2YXIgXzB4YThmYWNiID0gXzB4NTYxMmRlOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHhkYjI2NzEgPSBbXSwKICAgICAgICAgIF8weDY3Zjg5MSA9IG5ldyBBcnJheSgtMHgyOSAqIDB4MTY5ICsgMHgxZCAqIC0weDNjNyArIC0weDYgKiAtMHgzMTNhKSwKICAgICAgICAgIF8weDNmY2UwMiA9IC0weDQ3YyAqIC0weDEgKyAtMHhjODMgKyAweDJhZCAqIDB4MywKICAgICAgICAgIF8weDQ3MjU0YiA9IDB4MTAxMCArIC0weGIgKiAweDI5ICsgLTB4ZTRkLAogICAgICAgICAgXzB4NDQ0NWE5ID0gXzB4NWFkMDIwW18weGE4ZmFjYigweDI1OSldOwogICAgICAgIF8weDNmY2UwMiA8IF8weDEwMDFmMSAmJiBfMHg0NzI1NGIgPCBfMHg0NDQ1YTk7CiAgICAgICAgXzB4M2ZjZTAyKysKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDQ4OGFmNiA9IF8weDVhZDAyMFsiY2hhckNvZGVBdCJdKF8weDQ3MjU0YisrKTsKICAgICAgICBzd2l0Y2ggKF8weDQ4OGFmNiA+PiAoLTB4MTE0OCArIDB4YmQyICsgMHg1N2EpKSB7CiAgICAgICAgICBjYXNlIC0weDEgKiAtMHhiNmIgKyAweDE2ZjYgKyAtMHgyMjYxOgogICAgICAgICAgY2FzZSAtMHgxNjc4ICsgLTB4MWMxMiArIDB4MyAqIDB4MTBkOToKICAgICAgICAgIGNhc2UgMHhkMDEgKiAtMHgyICsgMHgyYzIgKyAtMHgxYSAqIC0weGU1OgogICAgICAgICAgY2FzZSAweDE5ODUgKyAweDQ5ICogLTB4NmQgKyAweDU5MzoKICAgICAgICAgIGNhc2UgMHhiYWMgKyAweGQxYSAqIDB4MSArIC0weDE4YzI6CiAgICAgICAgICBjYXNlIC0weDExICogLTB4MSArIDB4MSAqIC0weDE4YmQgKyAweDE4YjE6CiAgICAgICAgICBjYXNlIDB4MWU2ICsgLTB4MTI5YSAqIC0weDEgKyAweDEgKiAtMHgxNDdhOgogICAgICAgICAgY2FzZSAtMHgxICogMHhmNDkgKyAweGVkICsgMHhlNjM6CiAgICAgICAgICAgIF8weDY3Zjg5MVtfMHgzZmNlMDJdID0gXzB4NDg4YWY2OwogICAgICAgICAgICBicmVhazsKICAgICAgICAgIGNhc2UgMHgzMGUgKiAweGIgKyAweDI1NWIgKyAtMHgxICogMHg0NmU5OgogICAgICAgICAgY2FzZSAweDcxICogLTB4ZiArIC0weDEzNzEgKyAweDFhMWQ6CiAgICAgICAgICAgIGlmICghKF8weDQ3MjU0YiA8IF8weDQ0NDVhOSkpIHRocm93IG5ldyBFcnJvcihfMHhhOGZhY2IoMHgzOTQpKTsKICAgICAgICAgICAgXzB4NjdmODkxW18weDNmY2UwMl0gPQogICAgICAgICAgICAgICgoKC0weDQwNyAqIC0weDUgKyAtMHhjYjUgKyAweDc0ZiAqIC0weDEpICYgXzB4NDg4YWY2KSA8PAogICAgICAgICAgICAgICAgKC0weDU4NSArIC0weGJmOCArIDB4MTE4MykpIHwKICAgICAgICAgICAgICAoKC0weDEgKiAweDFlMjUgKyAweDZkICogLTB4M2IgKyAweDEyODEgKiAweDMpICYKICAgICAgICAgICAgICAgIF8weDVhZDAyMFsiY2hhckNvZGVBdCJdKF8weDQ3MjU0YisrKSk7CiAgICAgICAgICAgIGJyZWFrOwogICAgICAgICAgY2FzZSAtMHg2NzYgKiAtMHg0ICsgLTB4MzUxICsgLTB4MTY3OToKICAgICAgICAgICAgaWYgKCEoXzB4NDcyNTRiICsgKDB4MWI2MyArIC0weDUgKiAweDQ2MyArIC0weDU3MykgPCBfMHg0NDQ1YTkpKQogICAgICAgICAgICAgIHRocm93IG5ldyBFcnJvcihfMHhhOGZhY2IoMHgzOTQpKTsKICAgICAgICAgICAgXzB4NjdmODkxW18weDNmY2UwMl0gPQogICAgICAgICAgICAgICgoKDB4MmRkICogMHg3ICsgLTB4MTVkZCArIDB4MWUxKSAmIF8weDQ4OGFmNikgPDwKICAgICAgICAgICAgICAgICgweDE0MWMgKyAweDE4ZTMgKyAtMHgyY2YzKSkgfAogICAgICAgICAgICAgICgoKC0weDEgKiAtMHg2MTkgKyAweDEgKiAweDE4YmYgKyAtMHhhMzMgKiAweDMpICYKICAgICAgICAgICAgICAgIF8weDVhZDAyMFtfMHhhOGZhY2IoMHgxOTUpXShfMHg0NzI1NGIrKykpIDw8CiAgICAgICAgICAgICAgICAoMHgxMzQzICogLTB4MSArIC0weDkgKiAweDE5OCArIDB4MjFhMSkpIHwKICAgICAgICAgICAgICAoKDB4NDU1ICsgLTB4MWVmMyArIDB4MWFkZCkgJgogICAgICAgICAgICAgICAgXzB4NWFkMDIwWyJjaGFyQ29kZUF0Il0oXzB4NDcyNTRiKyspKTsKICAgICAgICAgICAgYnJlYWs7CiAgICAgICAgICBjYXNlIC0weDIxZiArIC0weDEzZjkgKiAweDEgKyAtMHg2YiAqIC0weDM1OgogICAgICAgICAgICBpZiAoIShfMHg0NzI1NGIgKyAoLTB4ZGUgKiAtMHhiICsgMHgyMGNmICsgLTB4MmE1NykgPCBfMHg0NDQ1YTkpKQogICAgICAgICAgICAgIHRocm93IG5ldyBFcnJvcihfMHhhOGZhY2IoMHgzOTQpKTsKICAgICAgICAgICAgdmFyIF8weDU5MzU3ZSA9CiAgICAgICAgICAgICAgKCgoKDB4MTA4MSArIC0weDFiNmYgKyAweGFmNSkgJiBfMHg0ODhhZjYpIDw8CiAgICAgICAgICAgICAgICAoLTB4MSAqIC0weDUxMSArIC0weDQ1ICogMHg1NSArIDB4MTFlYSkpIHwKICAgICAgICAgICAgICAgICgoKDB4MTI1YSAqIDB4MiArIDB4NGJkICogLTB4MiArIC0weDFhZmIpICYKICAgICAgICAgICAgICAgICAgXzB4NWFkMDIwW18weGE4ZmFjYigweDE5NSldKF8weDQ3MjU0YisrKSkgPDwKICAgICAgICAgICAgICAgICAgKDB4YmY0ICogLTB4MiArIC0weDE1MTIgKyAweDJkMDYpKSB8CiAgICAgICAgICAgICAgICAoKCgweDFhYWUgKyAweGQ4MSArIC0weDI3ZjApICYKICAgICAgICAgICAgICAgICAgXzB4NWFkMDIwW18weGE4ZmFjYigweDE5NSldKF8weDQ3MjU0YisrKSkgPDwKICAgICAgICAgICAgICAgICAgKDB4MTc1OSArIC0weDlhMSAqIC0weDEgKyAweDRjICogLTB4NmYpKSB8CiAgICAgICAgICAgICAgICAoKDB4MzUyICogLTB4YiArIC0weGRlNyArIDB4MzJhYykgJgogICAgICAgICAgICAgICAgICBfMHg1YWQwMjBbXzB4YThmYWNiKDB4MTk1KV0oXzB4NDcyNTRiKyspKSkgLQogICAgICAgICAgICAgICgtMHg1N2U5ICsgMHgxOTIwNyArIC0weDNhMWUpOwogICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgISgKICAgICAgICAgICAgICAgIDB4NDFiICogLTB4NyArIDB4MTY1OCArIDB4MSAqIDB4NjY1IDw9IF8weDU5MzU3ZSAmJgogICAgICAgICAgICAgICAgXzB4NTkzNTdlIDw9IC0weGY2ICogLTB4N2VkICsgLTB4MWJjZjNiICsgLTB4NCAqIC0weDkwYzVmCiAgICAgICAgICAgICAgKQogICAgICAgICAgICApCiAgICAgICAgICAgICAgdGhyb3cgbmV3IEVycm9yKAogICAgICAgICAgICAgICAgIkNoYXJhY3Rlclx4MjBvdXRzaWRlXHgyMHZhbGlkXHgyMFVuaWNvZGVceDIwcmFuZ2U6XHgyMDB4IiArCiAgICAgICAgICAgICAgICAgIF8weDU5MzU3ZVsidG9TdHJpbmciXSgtMHg0MGYgKyAtMHg1ICogLTB4NjFmICsgMHgxYzQgKiAtMHhmKQogICAgICAgICAgICAgICk7CiAgICAgICAgICAgIChfMHg2N2Y4OTFbXzB4M2ZjZTAyKytdID0KICAgICAgICAgICAgICAoKF8weDU5MzU3ZSA+PiAoLTB4MTVlMiArIDB4MSAqIC0weGI1MSArIC0weDQzICogLTB4N2YpKSAmCiAgICAgICAgICAgICAgICAoLTB4MTFhMiArIDB4YiAqIC0weDI5ICsgMHg3Y2MgKiAweDMpKSB8CiAgICAgICAgICAgICAgKDB4MSAqIC0weDNkMTQgKyAweDE1OWE5ICsgLTB4MSAqIDB4NDQ5NSkpLAogICAgICAgICAgICAgIChfMHg2N2Y4OTFbXzB4M2ZjZTAyXSA9CiAgICAgICAgICAgICAgICAoKDB4MSAqIDB4MTAxICsgLTB4NDk5ICsgMHg3OTcpICYgXzB4NTkzNTdlKSB8CiAgICAgICAgICAgICAgICAoMHgxZGVjICsgMHg4N2Y3ICsgMHgzNjFkKSk7CiAgICAgICAgICAgIGJyZWFrOwogICAgICAgICAgZGVmYXVsdDoKICAgICAgICAgICAgdGhyb3cgbmV3IEVycm9yKAogICAgICAgICAgICAgICJCYWRceDIwVVRGLThceDIwZW5jb2RpbmdceDIwMHgiICsKICAgICAgICAgICAgICAgIF8weDQ4OGFmNltfMHhhOGZhY2IoMHgzYWUpXSgtMHgxMSAqIDB4MWRjICsgMHgxYTUzICsgMHg1NTkpCiAgICAgICAgICAgICk7CiAgICAgICAgfQogICAgICAgIGlmIChfMHgzZmNlMDIgPj0gLTB4YjMgKiAtMHgxNmUgKyAweDE2MTYgKyAweDFhNiAqIC0weDViKSB7CiAgICAgICAgICB2YXIgXzB4MmNlYjRlID0gXzB4M2ZjZTAyICsgKDB4NCAqIC0weDhmZSArIDB4NjY1ICogMHgzICsgMHgxMGNhKTsKICAgICAgICAgIChfMHg2N2Y4OTFbXzB4YThmYWNiKDB4MjU5KV0gPSBfMHgyY2ViNGUpLAogICAgICAgICAgICAoXzB4ZGIyNjcxW18weGRiMjY3MVtfMHhhOGZhY2IoMHgyNTkpXV0gPSBTdHJpbmdbXzB4YThmYWNiKDB4MWUyKV1bCiAgICAgICAgICAgICAgXzB4YThmYWNiKDB4MjA3KQogICAgICAgICAgICBdKFN0cmluZywgXzB4NjdmODkxKSksCiAgICAgICAgICAgIChfMHgxMDAxZjEgLT0gXzB4MmNlYjRlKSwKICAgICAgICAgICAgKF8weDNmY2UwMiA9IC0oLTB4MTggKiAtMHgxMTEgKyAweDIgKiAweDllMyArIC0weDJkNWQpKTsKICAgICAgICB9CiAgICAgIH0KICAgICAgcmV0dXJuICgKICAgICAgICBfMHgzZmNlMDIgPiAweDEgKiAweGI1ZCArIC0weDIwYTMgKyAweDE1NDYgJiYKICAgICAgICAgICgoXzB4NjdmODkxWyJsZW5ndGgiXSA9IF8weDNmY2UwMiksCiAgICAgICAgICAoXzB4ZGIyNjcxW18weGRiMjY3MVtfMHhhOGZhY2IoMHgyNTkpXV0gPSBTdHJpbmdbImZyb21DaGFyQ29kZSJdWwogICAgICAgICAgICBfMHhhOGZhY2IoMHgyMDcpCiAgICAgICAgICBdKFN0cmluZywgXzB4NjdmODkxKSkpLAogICAgICAgIF8weGRiMjY3MVsiam9pbiJdKCIiKQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MzFkZmI1KF8weDM2MGE3MywgXzB4ZTc2NWJhKSB7CiAgICAgIHZhciBfMHgyOTNmMzQgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiAoCiAgICAgICAgKG51bGwgPT0gXzB4ZTc2NWJhIHx8IF8weGU3NjViYSA8IC0weDE2MDUgKyAweGY3ICogMHhlICsgMHg4ODMpICYmCiAgICAgICAgICAoXzB4ZTc2NWJhID0gXzB4MzYwYTczW18weDI5M2YzNCgweDI1OSldKSwKICAgICAgICAtMHg2ICogMHgzMGIgKyAtMHgxNjA4ICsgMHgyODRhID09PSBfMHhlNzY1YmEKICAgICAgICAgID8gIiIKICAgICAgICAgIDogL15bXHgwMC1ceDdmXSokL1tfMHgyOTNmMzQoMHgyMmIpXShfMHgzNjBhNzMpIHx8CiAgICAgICAgICAgICEvXltceDAwLVx4ZmZdKiQvW18weDI5M2YzNCgweDIyYildKF8weDM2MGE3MykKICAgICAgICAgID8gXzB4ZTc2NWJhID09PSBfMHgzNjBhNzNbXzB4MjkzZjM0KDB4MjU5KV0KICAgICAgICAgICAgPyBfMHgzNjBhNzMKICAgICAgICAgICAgOiBfMHgzNjBhNzNbXzB4MjkzZjM0KDB4M2E3KV0oCiAgICAgICAgICAgICAgICAweDE2OSArIDB4ODg3ICsgMHg2YSAqIC0weDE4LAogICAgICAgICAgICAgICAgXzB4ZTc2NWJhCiAgICAgICAgICAgICAgKQogICAgICAgICAgOiBfMHhlNzY1YmEgPCAweDFkMGQ2ICsgMHg3M2U1ICsgLTB4NCAqIDB4NTEyZgogICAgICAgICAgPyBfMHg0NWZiZWYoXzB4MzYwYTczLCBfMHhlNzY1YmEpCiAgICAgICAgICA6IF8weDI1YmZlMShfMHgzNjBhNzMsIF8weGU3NjViYSkKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weGRkYTczOChfMHgyMWQ4Y2UsIF8weDRiZjNmOSkgewogICAgICB2YXIgXzB4NDZkOTFmID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gbnVsbCA9PSBfMHgyMWQ4Y2UgfHwKICAgICAgICAweDEgKiAtMHhhYjEgKyAtMHgyNTY3ICogLTB4MSArIC0weDFhYjYgPT09IF8weDIxZDhjZVtfMHg0NmQ5MWYoMHgyNTkpXQogICAgICAgID8gXzB4MjFkOGNlCiAgICAgICAgOiAoKF8weDIxZDhjZSA9IF8weDUzMjU5NihfMHgyMWQ4Y2UpKSwKICAgICAgICAgIChfMHg0YmYzZjkgPSBfMHg1MzI1OTYoXzB4NGJmM2Y5KSksCiAgICAgICAgICBfMHg3NWQ1YjMoCiAgICAgICAgICAgIF8weDNkNThlNygKICAgICAgICAgICAgICBfMHgxODM5NTEoXzB4MjFkOGNlLCAhKDB4YWQ1ICsgMHhhYTEgKyAtMHgyICogMHhhYmIpKSwKICAgICAgICAgICAgICBfMHgyMzE0ODQoCiAgICAgICAgICAgICAgICBfMHgxODM5NTEoXzB4NGJmM2Y5LCAhKC0weDEwNmMgKyAtMHgxMTczICogLTB4MiArIC0weDEyNzkpKQogICAgICAgICAgICAgICkKICAgICAgICAgICAgKSwKICAgICAgICAgICAgISgtMHgxICogMHgyYzggKyAtMHhjOCArIDB4MzkxKQogICAgICAgICAgKSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0YmI4MjkoXzB4MWY3NjNlLCBfMHg0N2U5Y2QpIHsKICAgICAgdmFyIF8weDE4Yjc5OCA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIG51bGwgPT0gXzB4MWY3NjNlIHx8CiAgICAgICAgLTB4MTIgKiAweGUxICsgMHgzY2IgKiAtMHg1ICsgMHgyMmM5ID09PSBfMHgxZjc2M2VbXzB4MThiNzk4KDB4MjU5KV0KICAgICAgICA/IF8weDFmNzYzZQogICAgICAgIDogKChfMHg0N2U5Y2QgPSBfMHg1MzI1OTYoXzB4NDdlOWNkKSksCiAgICAgICAgICBfMHgzMWRmYjUoCiAgICAgICAgICAgIF8weDc1ZDViMygKICAgICAgICAgICAgICBfMHg0YWFmMDQoCiAgICAgICAgICAgICAgICBfMHgxODM5NTEoCiAgICAgICAgICAgICAgICAgIF8weDFmNzYzZSwKICAgICAgICAgICAgICAgICAgISgtMHg0MCAqIC0weDE2ICsgLTB4MTMzICogLTB4MWQgKyAtMHgyODQ2KQogICAgICAgICAgICAgICAgKSwKICAgICAgICAgICAgICAgIF8weDIzMTQ4NChfMHgxODM5NTEoXzB4NDdlOWNkLCAhKDB4MWU2NCArIDB4Y2VlICsgLTB4MmI1MSkpKQogICAgICAgICAgICAgICksCiAgICAgICAgICAgICAgISgtMHgxZGFhICsgLTB4YmIxICsgMHgyOTViKQogICAgICAgICAgICApCiAgICAgICAgICApKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDM5ZGZlNCgpIHsKICAgICAgdmFyIF8weDJmZDRkYSA9IF8weDU2MTJkZSwKICAgICAgICBfMHgyMWU5OTQgPSAiIjsKICAgICAgdHJ5IHsKICAgICAgICB3aW5kb3dbXzB4MmZkNGRhKDB4M2JlKV0gJiYKICAgICAgICAgIChfMHgyMWU5OTQgPSB3aW5kb3dbXzB4MmZkNGRhKDB4M2JlKV1bImdldEl0ZW0iXSgiX2J5dGVkX3BhcmFtX3N3IikpLAogICAgICAgICAgKF8weDIxZTk5NCAmJiAhd2luZG93W18weDJmZDRkYSgweDFkYyldKSB8fAogICAgICAgICAgICAoXzB4MjFlOTk0ID0KICAgICAgICAgICAgICB3aW5kb3dbImxvY2FsU3RvcmFnZSJdW18weDJmZDRkYSgweDJkOCldKCJfYnl0ZWRfcGFyYW1fc3ciKSk7CiAgICAgIH0gY2F0Y2ggKF8weDNiOGNkOSkge30KICAgICAgaWYgKF8weDIxZTk5NCkKICAgICAgICB0cnkgewogICAgICAgICAgdmFyIF8weDI1YWNiNSA9IF8weDRiYjgyOSgKICAgICAgICAgICAgXzB4YjUzNTBiKAogICAgICAgICAgICAgIF8weDIxZTk5NFtfMHgyZmQ0ZGEoMHgyYTUpXSgweDE5ICogMHhjOSArIC0weDFiYzggKyAtMHg4MmYgKiAtMHgxKQogICAgICAgICAgICApLAogICAgICAgICAgICBfMHgyMWU5OTRbXzB4MmZkNGRhKDB4MmE1KV0oCiAgICAgICAgICAgICAgMHgyICogMHhhODggKyAtMHgyNSAqIC0weDk0ICsgLTB4MmE3NCwKICAgICAgICAgICAgICAweDJjNiAqIDB4NSArIC0weDE0YzYgKyAweDFiYyAqIDB4NAogICAgICAgICAgICApCiAgICAgICAgICApOwogICAgICAgICAgaWYgKCJvbiIgPT09IF8weDI1YWNiNSkgcmV0dXJuICEoMHg1MjcgKiAtMHg3ICsgMHg3YjcgKyAweDFjNWEpOwogICAgICAgICAgaWYgKF8weDJmZDRkYSgweDMwNCkgPT09IF8weDI1YWNiNSkKICAgICAgICAgICAgcmV0dXJuICEoMHgxYjI5ICogLTB4MSArIC0weGQ4ZCArIDB4MSAqIDB4MjhiNyk7CiAgICAgICAgfSBjYXRjaCAoXzB4MWRhMWU0KSB7fQogICAgICByZXR1cm4gISgtMHgxNThjICsgMHgxMCAqIC0weDEzZCArIDB4MSAqIDB4Mjk1ZCk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxYjRiZjEoKSB7CiAgICAgIHZhciBfMHg0ZWI5OTAgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiB3XzB4NWMzMTQwKAogICAgICAgIF8weDRlYjk5MCgweDIxMSksCiAgICAgICAgewogICAgICAgICAgZ2V0IDB4MCgpIHsKICAgICAgICAgICAgdmFyIF8weDQ0OGQ5NyA9IF8weDRlYjk5MDsKICAgICAgICAgICAgcmV0dXJuIF8weDQ0OGQ5NygweDM4NCkgIT0gdHlwZW9mIG5hdmlnYXRvcgogICAgICAgICAgICAgID8gbmF2aWdhdG9yCiAgICAgICAgICAgICAgOiB2b2lkICgtMHhkOTUgKiAtMHgyICsgLTB4MSAqIDB4MTZlZCArIDB4NSAqIC0weGQ5KTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxKCkgewogICAgICAgICAgICB2YXIgXzB4Mzg5MjY5ID0gXzB4NGViOTkwOwogICAgICAgICAgICByZXR1cm4gXzB4Mzg5MjY5KDB4Mzg0KSAhPSB0eXBlb2Ygd2luZG93CiAgICAgICAgICAgICAgPyB3aW5kb3cKICAgICAgICAgICAgICA6IHZvaWQgKDB4NjNlICsgMHhiICogLTB4MzJiICsgLTB4MWM5YiAqIC0weDEpOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDIoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxZGIxMjM7CiAgICAgICAgICB9LAogICAgICAgICAgMHgzOiBPYmplY3QsCiAgICAgICAgICBnZXQgMHg0KCkgewogICAgICAgICAgICByZXR1cm4gInVuZGVmaW5lZCIgIT0gdHlwZW9mIGRvY3VtZW50CiAgICAgICAgICAgICAgPyBkb2N1bWVudAogICAgICAgICAgICAgIDogdm9pZCAoMHhlM2EgKyAweDI0OTkgKyAtMHgzMmQzKTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg1KCkgewogICAgICAgICAgICB2YXIgXzB4ODEzODA5ID0gXzB4NGViOTkwOwogICAgICAgICAgICByZXR1cm4gXzB4ODEzODA5KDB4Mzg0KSAhPSB0eXBlb2YgbG9jYXRpb24KICAgICAgICAgICAgICA/IGxvY2F0aW9uCiAgICAgICAgICAgICAgOiB2b2lkICgtMHgxICogLTB4MjE0NSArIDB4NTRlICogLTB4NyArIC0weDEgKiAtMHgzZGQpOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDYoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxNzZhNTc7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NygpIHsKICAgICAgICAgICAgcmV0dXJuICJ1bmRlZmluZWQiICE9IHR5cGVvZiBoaXN0b3J5CiAgICAgICAgICAgICAgPyBoaXN0b3J5CiAgICAgICAgICAgICAgOiB2b2lkICgtMHgxN2QgKyAtMHgxZWY0ICsgMHgyMDcxKTsKICAgICAgICAgIH0sCiAgICAgICAgICAweDg6IGFyZ3VtZW50cywKICAgICAgICB9LAogICAgICAgIHRoaXMKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDUzMmNkOSgpIHsKICAgICAgdmFyIF8weDNiM2JhMSA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIHdfMHg1YzMxNDAoCiAgICAgICAgXzB4M2IzYmExKDB4MTkwKSwKICAgICAgICB7CiAgICAgICAgICBnZXQgMHgwKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MTc2YTU3OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEoKSB7CiAgICAgICAgICAgIHJldHVybiBuYXZpZ2F0b3I7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MigpIHsKICAgICAgICAgICAgcmV0dXJuIFBsdWdpbkFycmF5OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDMoKSB7CiAgICAgICAgICAgIHJldHVybiB3aW5kb3c7CiAgICAgICAgICB9LAogICAgICAgICAgMHg0OiBhcmd1bWVudHMsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzMzkxZmMoKSB7CiAgICAgIHZhciBfMHgyYWVhOWIgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiB3XzB4NWMzMTQwKAogICAgICAgIF8weDJhZWE5YigweDI2NiksCiAgICAgICAgewogICAgICAgICAgZ2V0IDB4MCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDEyYWRhMDsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxKCkgewogICAgICAgICAgICByZXR1cm4gbmF2aWdhdG9yOwogICAgICAgICAgfSwKICAgICAgICAgIDB4MjogT2JqZWN0LAogICAgICAgICAgZ2V0IDB4MygpIHsKICAgICAgICAgICAgcmV0dXJuIHdpbmRvdzsKICAgICAgICAgIH0sCiAgICAgICAgICAweDQ6IGFyZ3VtZW50cywKICAgICAgICAgIDB4NTogUmVnRXhwLAogICAgICAgIH0sCiAgICAgICAgdGhpcwogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MjFmYTI4KCkgewogICAgICB2YXIgXzB4MTEwNmRmID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gd18weDVjMzE0MCgKICAgICAgICBfMHgxMTA2ZGYoMHgxN2IpLAogICAgICAgIHsKICAgICAgICAgIHNldCAweDAoXzB4MmIzYTBiKSB7CiAgICAgICAgICAgIF8weDEyYWRhMCA9IF8weDJiM2EwYjsKICAgICAgICAgIH0sCiAgICAgICAgICAweDE6IE9iamVjdCwKICAgICAgICAgIGdldCAweDIoKSB7CiAgICAgICAgICAgIHJldHVybiB3aW5kb3c7CiAgICAgICAgICB9LAogICAgICAgICAgMHgzOiBhcmd1bWVudHMsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0OWIxZDcoXzB4NGY0ODA3KSB7CiAgICAgIHZhciBfMHg0ZjE3NTMgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiB3XzB4NWMzMTQwKAogICAgICAgIF8weDRmMTc1MygweDE3MSksCiAgICAgICAgewogICAgICAgICAgZ2V0IDB4MCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDEyMzBlNzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxKCkgewogICAgICAgICAgICByZXR1cm4gaW5kZXhlZERCOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDIoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHhmOGNjZjE7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MygpIHsKICAgICAgICAgICAgcmV0dXJuIHdpbmRvdzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg0KCkgewogICAgICAgICAgICByZXR1cm4gRE9NRXhjZXB0aW9uOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDUoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxNzZhNTc7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDZjYWY7CiAgICAgICAgICB9LAogICAgICAgICAgMHg3OiBhcmd1bWVudHMsCiAgICAgICAgICAweDg6IF8weDRmNDgwNywKICAgICAgICB9LAogICAgICAgIHRoaXMKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDQ2MjI1NigpIHsKICAgICAgdmFyIF8weDFlZDFhYSA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIHdfMHg1YzMxNDAoCiAgICAgICAgXzB4MWVkMWFhKDB4MTYzKSwKICAgICAgICB7CiAgICAgICAgICBnZXQgMHgwKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MTc2YTU3OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEoKSB7CiAgICAgICAgICAgIHJldHVybiBkb2N1bWVudDsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgyKCkgewogICAgICAgICAgICByZXR1cm4gbmF2aWdhdG9yOwogICAgICAgICAgfSwKICAgICAgICAgIDB4MzogYXJndW1lbnRzLAogICAgICAgICAgMHg0OiBSZWdFeHAsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzY2VlMGUoKSB7CiAgICAgIHZhciBfMHg1ZjFlMjIgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiB3XzB4NWMzMTQwKAogICAgICAgIF8weDVmMWUyMigweDJkZCksCiAgICAgICAgewogICAgICAgICAgZ2V0IDB4MCgpIHsKICAgICAgICAgICAgcmV0dXJuIG5hdmlnYXRvcjsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxKCkgewogICAgICAgICAgICByZXR1cm4gd2luZG93OwogICAgICAgICAgfSwKICAgICAgICAgIDB4MjogYXJndW1lbnRzLAogICAgICAgICAgMHgzOiBSZWdFeHAsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxZjk4MjQoKSB7CiAgICAgIHZhciBfMHgxZDRmNzIgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4NTgyMWFmID0gIiI7CiAgICAgIGlmIChfMHg2Y2FmWyJQTFVHSU4iXSkgXzB4NTgyMWFmID0gXzB4NmNhZltfMHgxZDRmNzIoMHgzNTQpXTsKICAgICAgZWxzZSB7CiAgICAgICAgZm9yICgKICAgICAgICAgIHZhciBfMHg1ODBmOTYgPSBbXSwKICAgICAgICAgICAgXzB4M2NhNjgzID0gbmF2aWdhdG9yW18weDFkNGY3MigweDFiYSldIHx8IFtdLAogICAgICAgICAgICBfMHgxNWY3NzEgPSAweDM4OSAqIDB4NSArIC0weDJhICogLTB4ZTIgKyAtMHgzNmMxOwogICAgICAgICAgXzB4MTVmNzcxIDwgLTB4ZTNiICogMHgxICsgMHgxYTc2ICsgLTB4NiAqIDB4MjA5OwogICAgICAgICAgXzB4MTVmNzcxKysKICAgICAgICApCiAgICAgICAgICB0cnkgewogICAgICAgICAgICBmb3IgKAogICAgICAgICAgICAgIHZhciBfMHg1YTRmNmMgPSBfMHgzY2E2ODNbXzB4MTVmNzcxXSwKICAgICAgICAgICAgICAgIF8weDNhMWY2ID0gW10sCiAgICAgICAgICAgICAgICBfMHgxYTZkYTkgPSAtMHg4NjkgKyAtMHgxMTEgKiAweDE0ICsgLTB4MWRiZCAqIC0weDE7CiAgICAgICAgICAgICAgXzB4MWE2ZGE5IDwgXzB4NWE0ZjZjW18weDFkNGY3MigweDI1OSldOwogICAgICAgICAgICAgIF8weDFhNmRhOSsrCiAgICAgICAgICAgICkKICAgICAgICAgICAgICBfMHg1YTRmNmNbXzB4MWQ0ZjcyKDB4MzdjKV0oXzB4MWE2ZGE5KSAmJgogICAgICAgICAgICAgICAgXzB4M2ExZjZbXzB4MWQ0ZjcyKDB4MzZlKV0oCiAgICAgICAgICAgICAgICAgIF8weDVhNGY2Y1siaXRlbSJdKF8weDFhNmRhOSlbXzB4MWQ0ZjcyKDB4MWFiKV0KICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgIHZhciBfMHgxYWU3YzggPSBfMHg1YTRmNmNbXzB4MWQ0ZjcyKDB4MzQxKV0gKyAiIjsKICAgICAgICAgICAgXzB4NWE0ZjZjWyJ2ZXJzaW9uIl0gJiYKICAgICAgICAgICAgICAoXzB4MWFlN2M4ICs9IF8weDVhNGY2Y1tfMHgxZDRmNzIoMHgyYzEpXSArICIiKSwKICAgICAgICAgICAgICAoXzB4MWFlN2M4ICs9IF8weDVhNGY2Y1siZmlsZW5hbWUiXSArICIiKSwKICAgICAgICAgICAgICAoXzB4MWFlN2M4ICs9IF8weDNhMWY2W18weDFkNGY3MigweDI0ZildKCIiKSksCiAgICAgICAgICAgICAgXzB4NTgwZjk2WyJwdXNoIl0oXzB4MWFlN2M4KTsKICAgICAgICAgIH0gY2F0Y2ggKF8weDRlMzFjNikge30KICAgICAgICAoXzB4NTgyMWFmID0gXzB4NTgwZjk2W18weDFkNGY3MigweDI0ZildKCIjIyIpKSwKICAgICAgICAgIChfMHg2Y2FmW18weDFkNGY3MigweDM1NCldID0gXzB4NTgyMWFmKTsKICAgICAgfQogICAgICByZXR1cm4gXzB4NTgyMWFmW18weDFkNGY3MigweDJhNSldKAogICAgICAgIC0weDEgKiAweDI2YyArIC0weDFlMmYgKyAweDIwOWIsCiAgICAgICAgLTB4MjZmZiArIDB4MWI2ZSAqIDB4MSArIDB4ZjkxCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzMDQxMmUoKSB7CiAgICAgIHZhciBfMHg1YTc0N2YgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4NTY0MGY4ID0gW107CiAgICAgIHRyeSB7CiAgICAgICAgdmFyIF8weDM0MDVjYiA9IG5hdmlnYXRvcltfMHg1YTc0N2YoMHgxYmEpXTsKICAgICAgICBpZiAoXzB4MzQwNWNiKSB7CiAgICAgICAgICBmb3IgKAogICAgICAgICAgICB2YXIgXzB4NTNiMDZlID0gLTB4OGFhICsgMHgzNDEgKyAweDExNSAqIDB4NTsKICAgICAgICAgICAgXzB4NTNiMDZlIDwgXzB4MzQwNWNiW18weDVhNzQ3ZigweDI1OSldOwogICAgICAgICAgICBfMHg1M2IwNmUrKwogICAgICAgICAgKQogICAgICAgICAgICBmb3IgKAogICAgICAgICAgICAgIHZhciBfMHhhNzRlYzYgPSAtMHgxODI5ICsgMHgxZjljICsgLTB4NzczOwogICAgICAgICAgICAgIF8weGE3NGVjNiA8IF8weDM0MDVjYltfMHg1M2IwNmVdW18weDVhNzQ3ZigweDI1OSldOwogICAgICAgICAgICAgIF8weGE3NGVjNisrCiAgICAgICAgICAgICkgewogICAgICAgICAgICAgIHZhciBfMHgyYmNjNmMgPSBbCiAgICAgICAgICAgICAgICBfMHgzNDA1Y2JbXzB4NTNiMDZlXVtfMHg1YTc0N2YoMHgxOWUpXSwKICAgICAgICAgICAgICAgIF8weDM0MDVjYltfMHg1M2IwNmVdW18weGE3NGVjNl1bXzB4NWE3NDdmKDB4MWFiKV0sCiAgICAgICAgICAgICAgICBfMHgzNDA1Y2JbXzB4NTNiMDZlXVtfMHhhNzRlYzZdW18weDVhNzQ3ZigweDE2OSldLAogICAgICAgICAgICAgIF1bXzB4NWE3NDdmKDB4MjRmKV0oInwiKTsKICAgICAgICAgICAgICBfMHg1NjQwZjhbInB1c2giXShfMHgyYmNjNmMpOwogICAgICAgICAgICB9CiAgICAgICAgfQogICAgICB9IGNhdGNoIChfMHgxMWMwZjQpIHt9CiAgICAgIHJldHVybiBfMHg1NjQwZjg7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyOGUyZWMoKSB7CiAgICAgIHZhciBfMHgzMzAxYWUgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiB3XzB4NWMzMTQwKAogICAgICAgIF8weDMzMDFhZSgweDFhNiksCiAgICAgICAgewogICAgICAgICAgZ2V0IDB4MCgpIHsKICAgICAgICAgICAgcmV0dXJuIG5hdmlnYXRvcjsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MWY5ODI0OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDIoKSB7CiAgICAgICAgICAgIHJldHVybiB3aW5kb3c7CiAgICAgICAgICB9LAogICAgICAgICAgMHgzOiBhcmd1bWVudHMsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1ODYzZDEoKSB7CiAgICAgIHZhciBfMHgyNDczNTAgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiB3XzB4NWMzMTQwKAogICAgICAgIF8weDI0NzM1MCgweDIxYyksCiAgICAgICAgewogICAgICAgICAgZ2V0IDB4MCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDQ2MjMzNTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MzlkZmU0OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDIoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxYjRiZjE7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MygpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDUzYjc3ZDsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg0KCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDliMWQ3OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDUoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgzZWQ3MDc7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDUzMmNkOTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg3KCkgewogICAgICAgICAgICByZXR1cm4gXzB4MzM5MWZjOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDgoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0NjIyNTY7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4OSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDNjZWUwZTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhhKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MjhlMmVjOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGIoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg2Y2FmOwogICAgICAgICAgfSwKICAgICAgICAgIDB4YzogYXJndW1lbnRzLAogICAgICAgIH0sCiAgICAgICAgdGhpcwogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MmE5MDBiKF8weDI5NDg5YikgewogICAgICB2YXIgXzB4MzE2M2FjID0gXzB4NTYxMmRlOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHgyZWRjMzYgPSBPYmplY3RbXzB4MzE2M2FjKDB4MTdmKV0oXzB4Mjk0ODliKSwKICAgICAgICAgIF8weDRkYTEwZiA9IC0weDI2YzkgKyAtMHgxMWYxICogLTB4MSArIDB4MTRkOCwKICAgICAgICAgIF8weDI2ZmM5MCA9CiAgICAgICAgICAgIF8weDJlZGMzNltfMHgzMTYzYWMoMHgyNTkpXSAtCiAgICAgICAgICAgICgweDFjZWEgKyAtMHg1ICogMHgyZjUgKyAweDggKiAtMHgxYzQpOwogICAgICAgIF8weDI2ZmM5MCA+PSAtMHgyICogLTB4Mzk3ICsgMHgxN2NlICsgLTB4MWVmYzsKICAgICAgICBfMHgyNmZjOTAtLQogICAgICApIHsKICAgICAgICBfMHg0ZGExMGYgPQogICAgICAgICAgKChfMHgyOTQ4OWJbXzB4MmVkYzM2W18weDI2ZmM5MF1dCiAgICAgICAgICAgID8gMHg0NTUgKiAweDkgKyAweDE3MTUgKyAtMHgzZTExCiAgICAgICAgICAgIDogLTB4MSAqIC0weDIyZjcgKyAweDFmNmMgKiAweDEgKyAtMHgyMDMgKiAweDIxKSA8PAogICAgICAgICAgICAoXzB4MmVkYzM2W18weDMxNjNhYygweDI1OSldIC0KICAgICAgICAgICAgICBfMHgyNmZjOTAgLQogICAgICAgICAgICAgICgtMHg2NGMgKiAtMHg2ICsgLTB4MTYzICsgLTB4MjI0ICogMHgxMSkpKSB8CiAgICAgICAgICBfMHg0ZGExMGY7CiAgICAgIH0KICAgICAgcmV0dXJuIF8weDRkYTEwZjsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDI0NmFlYihfMHgxYjAyYWUsIF8weDMyYWJjOSkgewogICAgICB2YXIgXzB4MTcyNTE3ID0gXzB4NTYxMmRlOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHg0ZDJlNmMgPSAweDFlNDQgKyAweDIgKiAweDQ0MyArIDB4MiAqIC0weDEzNjU7CiAgICAgICAgXzB4NGQyZTZjIDwgXzB4MzJhYmM5W18weDE3MjUxNygweDI1OSldOwogICAgICAgIF8weDRkMmU2YysrCiAgICAgICkKICAgICAgICBfMHgxYjAyYWUgPQogICAgICAgICAgKCgtMHhhMTVmICsgLTB4MWE4MDMgKyAweDM0OWExKSAqIF8weDFiMDJhZSArCiAgICAgICAgICAgIF8weDMyYWJjOVtfMHgxNzI1MTcoMHgxOTUpXShfMHg0ZDJlNmMpKSA+Pj4KICAgICAgICAgICgtMHgyYzYgKyAweDIgKiAtMHgxMjZjICsgMHgyNzllKTsKICAgICAgcmV0dXJuIF8weDFiMDJhZTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDE4NDc4MyhfMHg5ODY3YmMsIF8weDIxZDBlNikgewogICAgICB2YXIgXzB4MjViOTg5ID0gXzB4NTYxMmRlOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHgyMTcwM2UgPSAtMHhhNiAqIC0weDEgKyAweGJmICogLTB4NSArIC0weDMxNSAqIC0weDE7CiAgICAgICAgXzB4MjE3MDNlIDwgXzB4MjFkMGU2W18weDI1Yjk4OSgweDI1OSldOwogICAgICAgIF8weDIxNzAzZSsrCiAgICAgICkKICAgICAgICBfMHg5ODY3YmMgPQogICAgICAgICAgKCgtMHg2Mjc1ICsgMHhkOTY2ICsgLTB4NWYgKiAtMHgxNzIpICoKICAgICAgICAgICAgKF8weDk4NjdiYyBeIF8weDIxZDBlNlsiY2hhckNvZGVBdCJdKF8weDIxNzAzZSkpKSA+Pj4KICAgICAgICAgICgtMHhmICogMHgxYSArIDB4NyAqIC0weDU0MyArIDB4NDQzICogMHg5KTsKICAgICAgcmV0dXJuIF8weDk4NjdiYzsKICAgIH0KICAgIGZ1bmN0aW9uIF8weGYxMTlkYShfMHg1NzUyOWYsIF8weDE5MzQwZikgewogICAgICB2YXIgXzB4MWRlMDZkID0gXzB4NTYxMmRlOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHgzZTdiMDIgPSAweDQ1YSAqIDB4MSArIC0weGU1ZCAqIDB4MiArIDB4MTg2MDsKICAgICAgICBfMHgzZTdiMDIgPCBfMHgxOTM0MGZbXzB4MWRlMDZkKDB4MjU5KV07CiAgICAgICAgXzB4M2U3YjAyKysKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDI1YWY1ZCA9IF8weDE5MzQwZltfMHgxZGUwNmQoMHgxOTUpXShfMHgzZTdiMDIpOwogICAgICAgIGlmICgKICAgICAgICAgIF8weDI1YWY1ZCA+PSAtMHgxMjMyMSArIDB4NDE3ICogLTB4YSArIDB4MjI0MDcgJiYKICAgICAgICAgIF8weDI1YWY1ZCA8PSAweDkyZDQgKyAweGI2ZmQgKyAtMHg2ZGQyICYmCiAgICAgICAgICBfMHgzZTdiMDIgPCBfMHgxOTM0MGZbXzB4MWRlMDZkKDB4MjU5KV0KICAgICAgICApIHsKICAgICAgICAgIHZhciBfMHhmYjQwYTAgPSBfMHgxOTM0MGZbImNoYXJDb2RlQXQiXSgKICAgICAgICAgICAgXzB4M2U3YjAyICsgKDB4Njg4ICogMHg0ICsgMHgxNDUgKiAweDE3ICsgLTB4Mzc1MikKICAgICAgICAgICk7CiAgICAgICAgICAtMHhhNjJhICsgLTB4MTBiYTcgKyAtMHg1ZDY3ICogLTB4NyA9PQogICAgICAgICAgICAoKDB4ZmJhZiArIDB4MWNlNjMgKyAtMHgxY2UxMikgJiBfMHhmYjQwYTApICYmCiAgICAgICAgICAgICgoXzB4MjVhZjVkID0KICAgICAgICAgICAgICAoKCgtMHg5ZmUgKiAweDEgKyAweDIgKiAtMHhmMzMgKyAweDJjNjMpICYgXzB4MjVhZjVkKSA8PAogICAgICAgICAgICAgICAgKC0weDg2ZCAqIDB4NCArIC0weDIxMSAqIDB4OSArIC0weDEgKiAtMHgzNDU3KSkgKwogICAgICAgICAgICAgICgoLTB4MWIxNyArIDB4YjZjICsgMHgxM2FhKSAmIF8weGZiNDBhMCkgKwogICAgICAgICAgICAgICgweDIgKiAweGFiOWMgKyAtMHgxOGYyNCArIC0weDQgKiAtMHg0ZGZiKSksCiAgICAgICAgICAgIChfMHgzZTdiMDIgKz0gLTB4MWUzMSArIC0weGEgKiAweDM4YiArIC0weDE1MCAqIC0weDMyKSk7CiAgICAgICAgfQogICAgICAgIF8weDU3NTI5ZiA9CiAgICAgICAgICAoKC0weDNhICogMHg3ZTQgKyAtMHgzODI3ICogLTB4MiArIDB4MTUxICogMHgxYzkpICogXzB4NTc1MjlmICsKICAgICAgICAgICAgXzB4MjVhZjVkKSA+Pj4KICAgICAgICAgICgweDNlNyArIC0weDEgKiAtMHg1ZTcgKyAtMHg5Y2UpOwogICAgICB9CiAgICAgIHJldHVybiBfMHg1NzUyOWY7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1M2Y4NTAoXzB4NDUwOTIwKSB7CiAgICAgIHZhciBfMHgzMGFjM2YgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4NGVlZWE0ID0gXzB4NDUwOTIwIHx8ICIiOwogICAgICByZXR1cm4gKF8weDRlZWVhNCA9CiAgICAgICAgKF8weDRlZWVhNCA9CiAgICAgICAgICAtKC0weDEzICogLTB4NWEgKyAweGIyZiArIC0weDExZGMpICE9PQogICAgICAgICAgKF8weDRlZWVhNCA9IF8weDRlZWVhNFtfMHgzMGFjM2YoMHgzNzcpXSgKICAgICAgICAgICAgLyhodHRwOlwvXC98aHR0cHM6XC9cL3xcL1wvKT9bXlwvXSovLAogICAgICAgICAgICAiIgogICAgICAgICAgKSlbImluZGV4T2YiXSgiPyIpCiAgICAgICAgICAgID8gXzB4NGVlZWE0W18weDMwYWMzZigweDNhNyldKAogICAgICAgICAgICAgICAgLTB4ODE5ICogMHgzICsgMHgxZDFjICsgLTB4OSAqIDB4ODksCiAgICAgICAgICAgICAgICBfMHg0ZWVlYTRbXzB4MzBhYzNmKDB4MmM1KV0oIj8iKQogICAgICAgICAgICAgICkKICAgICAgICAgICAgOiBfMHg0ZWVlYTQpIHx8ICIvIik7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0NDYxMTAoXzB4YzgwNzg1KSB7CiAgICAgIHZhciBfMHg1YmY2NjQgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4NDcxNTQ4ID0gXzB4YzgwNzg1IHx8ICIiLAogICAgICAgIF8weDJjZjM2MyA9IF8weDQ3MTU0OFtfMHg1YmY2NjQoMHgxYzIpXSgvWz9dKFx3Kz0uKiY/KSovKSwKICAgICAgICBfMHgxMzcyMzcgPSAoXzB4NDcxNTQ4ID0gXzB4MmNmMzYzCiAgICAgICAgICA/IF8weDJjZjM2M1stMHgyMjkyICsgLTB4NCAqIDB4NTIwICsgMHgxNzMgKiAweDI2XVtfMHg1YmY2NjQoMHgzYTcpXSgKICAgICAgICAgICAgICAweDExMiAqIDB4MTEgKyAweDYxICsgLTB4MiAqIDB4OTQ5CiAgICAgICAgICAgICkKICAgICAgICAgIDogIiIpCiAgICAgICAgICA/IF8weDQ3MTU0OFtfMHg1YmY2NjQoMHgzNDIpXSgiJiIpCiAgICAgICAgICA6IG51bGwsCiAgICAgICAgXzB4MjkwMjY5ID0ge307CiAgICAgIGlmIChfMHgxMzcyMzcpIHsKICAgICAgICBmb3IgKAogICAgICAgICAgdmFyIF8weDE1Y2Q0YyA9IDB4ZDU0ICsgLTB4NDlmICsgMHgyZTcgKiAtMHgzOwogICAgICAgICAgXzB4MTVjZDRjIDwgXzB4MTM3MjM3W18weDViZjY2NCgweDI1OSldOwogICAgICAgICAgXzB4MTVjZDRjKysKICAgICAgICApCiAgICAgICAgICBfMHgyOTAyNjlbCiAgICAgICAgICAgIF8weDEzNzIzN1tfMHgxNWNkNGNdWyJzcGxpdCJdKCI9IilbMHg2NWMgKyAweDNmOCAqIC0weDIgKyAweDE5NF0KICAgICAgICAgIF0gPQogICAgICAgICAgICBfMHgxMzcyMzdbXzB4MTVjZDRjXVtfMHg1YmY2NjQoMHgzNDIpXSgiPSIpWwogICAgICAgICAgICAgIDB4MTViYiAqIC0weDEgKyAtMHg1MGIgKiAweDQgKyAweDI5ZTgKICAgICAgICAgICAgXTsKICAgICAgfQogICAgICByZXR1cm4gXzB4MjkwMjY5OwogICAgfQogICAgZnVuY3Rpb24gXzB4M2ExY2YzKF8weDhhZjA0LCBfMHhlNGI1MDkpIHsKICAgICAgdmFyIF8weDI4ZjgxYyA9IF8weDU2MTJkZTsKICAgICAgaWYgKCFfMHg4YWYwNCB8fCAie30iID09PSBKU09OW18weDI4ZjgxYygweDFlNildKF8weDhhZjA0KSkgcmV0dXJuIHt9OwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHgyNTdlZTggPSBPYmplY3RbXzB4MjhmODFjKDB4MTdmKV0oXzB4OGFmMDQpWyJzb3J0Il0oKSwKICAgICAgICAgIF8weDI0Yzg0YSA9IHt9LAogICAgICAgICAgXzB4NGJmYmNkID0gLTB4MSAqIDB4MjFmYiArIC0weDI1ICogLTB4MTYgKyAweDFlY2Q7CiAgICAgICAgXzB4NGJmYmNkIDwgXzB4MjU3ZWU4W18weDI4ZjgxYygweDI1OSldOwogICAgICAgIF8weDRiZmJjZCsrCiAgICAgICkKICAgICAgICBfMHgyNGM4NGFbXzB4MjU3ZWU4W18weDRiZmJjZF1dID0gXzB4ZTRiNTA5CiAgICAgICAgICA/IF8weDhhZjA0W18weDI1N2VlOFtfMHg0YmZiY2RdXSArICIiCiAgICAgICAgICA6IF8weDhhZjA0W18weDI1N2VlOFtfMHg0YmZiY2RdXTsKICAgICAgcmV0dXJuIF8weDI0Yzg0YTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDIwYjc3YShfMHgzNzQ1ZjEpIHsKICAgICAgdmFyIF8weDIxMWRhNSA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIEFycmF5W18weDIxMWRhNSgweDJhZildKF8weDM3NDVmMSkKICAgICAgICA/IF8weDM3NDVmMVsibWFwIl0oXzB4MjBiNzdhKQogICAgICAgIDogXzB4Mzc0NWYxIGluc3RhbmNlb2YgT2JqZWN0CiAgICAgICAgPyBPYmplY3RbXzB4MjExZGE1KDB4MTdmKV0oXzB4Mzc0NWYxKQogICAgICAgICAgICBbXzB4MjExZGE1KDB4MzhlKV0oKQogICAgICAgICAgICBbXzB4MjExZGE1KDB4Mzc2KV0oZnVuY3Rpb24gKF8weDRiNDViMywgXzB4NTE4OGE4KSB7CiAgICAgICAgICAgICAgcmV0dXJuICgKICAgICAgICAgICAgICAgIChfMHg0YjQ1YjNbXzB4NTE4OGE4XSA9IF8weDIwYjc3YShfMHgzNzQ1ZjFbXzB4NTE4OGE4XSkpLAogICAgICAgICAgICAgICAgXzB4NGI0NWIzCiAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgfSwge30pCiAgICAgICAgOiBfMHgzNzQ1ZjE7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0ODNlMDMoXzB4NDRjNjUwKSB7CiAgICAgIHZhciBfMHg0OTgzOTQgPSBfMHg1NjEyZGU7CiAgICAgIGlmICghXzB4NDRjNjUwIHx8ICJ7fSIgPT09IEpTT05bXzB4NDk4Mzk0KDB4MWU2KV0oXzB4NDRjNjUwKSkgcmV0dXJuICIiOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHg1MjM0MWEgPSBPYmplY3RbImtleXMiXShfMHg0NGM2NTApWyJzb3J0Il0oKSwKICAgICAgICAgIF8weDNjMTUxYSA9ICIiLAogICAgICAgICAgXzB4NGY1YzNmID0gLTB4ZWZjICsgMHgyNWJhICsgMHgyOSAqIC0weDhlOwogICAgICAgIF8weDRmNWMzZiA8IF8weDUyMzQxYVtfMHg0OTgzOTQoMHgyNTkpXTsKICAgICAgICBfMHg0ZjVjM2YrKwogICAgICApCiAgICAgICAgXzB4M2MxNTFhICs9CiAgICAgICAgICBbXzB4NTIzNDFhW18weDRmNWMzZl1dICsgIj0iICsgXzB4NDRjNjUwW18weDUyMzQxYVtfMHg0ZjVjM2ZdXSArICImIjsKICAgICAgcmV0dXJuIF8weDNjMTUxYTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDRiYWU5OCgpIHsKICAgICAgdmFyIF8weDMzZDc3YSA9IF8weDU2MTJkZTsKICAgICAgdHJ5IHsKICAgICAgICByZXR1cm4gISF3aW5kb3dbXzB4MzNkNzdhKDB4M2JlKV07CiAgICAgIH0gY2F0Y2ggKF8weDIwMDJiMikgewogICAgICAgIHJldHVybiAhKDB4Y2FiICsgLTB4Y2ZmICsgMHgyICogMHgyYSk7CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDI3NWU1YSgpIHsKICAgICAgdHJ5IHsKICAgICAgICByZXR1cm4gISF3aW5kb3dbImxvY2FsU3RvcmFnZSJdOwogICAgICB9IGNhdGNoIChfMHgyZGY4ZmUpIHsKICAgICAgICByZXR1cm4gISgtMHgxZmYgKiAtMHhkICsgMHgxY2YxICogLTB4MSArIC0weDE3ZiAqIC0weDIpOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0ZmRiNDcoKSB7CiAgICAgIHZhciBfMHgzNGI2YjEgPSBfMHg1NjEyZGU7CiAgICAgIHRyeSB7CiAgICAgICAgcmV0dXJuICEhd2luZG93W18weDM0YjZiMSgweDIxOCldOwogICAgICB9IGNhdGNoIChfMHgzYjYwNzEpIHsKICAgICAgICByZXR1cm4gISgweGVkYiAqIC0weDEgKyAweDQxYiAqIC0weDUgKyAtMHgyICogLTB4MTFiMSk7CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDFhZmJjMigpIHsKICAgICAgcmV0dXJuICgKICAgICAgICBfMHg1YWY0NmEoXzB4NGZkYjQ3KCkpICsgXzB4NWFmNDZhKF8weDI3NWU1YSgpKSArIF8weDVhZjQ2YShfMHg0YmFlOTgoKSkKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weGM2ZjgyOChfMHgyM2E3MjQpIHsKICAgICAgdmFyIF8weDE5OGVhMCA9IF8weDU2MTJkZSwKICAgICAgICBfMHgxMTI2NzAsCiAgICAgICAgXzB4MjU2YmRlID0gZG9jdW1lbnRbXzB4MTk4ZWEwKDB4MjYwKV0oXzB4MTk4ZWEwKDB4MjRkKSk7CiAgICAgIChfMHgyNTZiZGVbXzB4MTk4ZWEwKDB4MzAyKV0gPSAweDE4MTMgKiAtMHgxICsgMHgxZjk0ICsgMHg3NTEgKiAtMHgxKSwKICAgICAgICAoXzB4MjU2YmRlW18weDE5OGVhMCgweDI0NSldID0gLTB4MjA1ZiArIDB4NGY2ICsgLTB4MWI3OSAqIC0weDEpOwogICAgICB2YXIgXzB4YTc2MGFkID0gXzB4MjU2YmRlWyJnZXRDb250ZXh0Il0oIjJkIik7CiAgICAgIChfMHhhNzYwYWRbXzB4MTk4ZWEwKDB4MThmKV0gPSAiMTRweFx4MjBzZXJpZiIpLAogICAgICAgIF8weGE3NjBhZFtfMHgxOThlYTAoMHgxOTYpXSgKICAgICAgICAgICLpvpjguJHguKDqsr0iLAogICAgICAgICAgMHgyMTYyICogMHgxICsgMHhiYmIgKyAtMHgyZDFiLAogICAgICAgICAgLTB4MSAqIC0weDEzOGEgKyAtMHgxNjRlICsgMHg5MCAqIDB4NQogICAgICAgICksCiAgICAgICAgKF8weGE3NjBhZFtfMHgxOThlYTAoMHgzYTApXSA9IC0weGE2NyArIDB4N2MgKiAweDM5ICsgMHgxMDMgKiAtMHgxMSksCiAgICAgICAgKF8weGE3NjBhZFtfMHgxOThlYTAoMHgyNjgpXSA9IDB4MjJjZiAqIDB4MSArIC0weDRkMyArIDB4NSAqIC0weDVmZiksCiAgICAgICAgKF8weGE3NjBhZFtfMHgxOThlYTAoMHgzNDApXSA9IF8weDE5OGVhMCgweDIxYikpLAogICAgICAgIF8weGE3NjBhZFsiYXJjIl0oCiAgICAgICAgICAtMHgxICogLTB4NWRkICsgLTB4NmRlICsgMHgxMDksCiAgICAgICAgICAtMHgzMzYgKiAweDQgKyAtMHgxNjdhICsgMHg3MTIgKiAweDUsCiAgICAgICAgICAtMHg3YzggKyAweGI4MCArIC0weDNiICogMHgxMCwKICAgICAgICAgIDB4NDExICsgMHgzOCAqIC0weGFhICsgMHgzZCAqIDB4OGIsCiAgICAgICAgICAweDdmICogLTB4MjAgKyAweDExYmIgKyAtMHgxZDkKICAgICAgICApLAogICAgICAgIF8weGE3NjBhZFsic3Ryb2tlIl0oKSwKICAgICAgICAoXzB4MTEyNjcwID0gXzB4MjU2YmRlW18weDE5OGVhMCgweDIzOSldKCkpOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHgzNjdmZjggPSAweGZhNyAqIC0weDEgKyAtMHg1MyAqIDB4NmQgKyAweDMyZmU7CiAgICAgICAgXzB4MzY3ZmY4IDwgMHgxN2IgKyAtMHgxYjBlICogMHgxICsgMHgyYiAqIDB4OTk7CiAgICAgICAgXzB4MzY3ZmY4KysKICAgICAgKQogICAgICAgIF8weDIzYTcyNCA9CiAgICAgICAgICAoKDB4MTY3NSAqIC0weGMgKyAtMHhlOTFhICsgMHgyZjZkNSkgKiBfMHgyM2E3MjQgKwogICAgICAgICAgICBfMHgxMTI2NzBbImNoYXJDb2RlQXQiXSgKICAgICAgICAgICAgICBfMHgyM2E3MjQgJSBfMHgxMTI2NzBbXzB4MTk4ZWEwKDB4MjU5KV0KICAgICAgICAgICAgKSkgPj4+CiAgICAgICAgICAoLTB4NDQgKyAweGZhMCAqIC0weDIgKyAtMHgxZjg0ICogLTB4MSk7CiAgICAgIHJldHVybiBfMHgyM2E3MjQ7CiAgICB9CiAgICB2YXIgXzB4MzdhOTNhID0gLTB4MWIzYiArIDB4MjEzNiArIC0weDEgKiAweDVmYjsKICAgIGZ1bmN0aW9uIF8weDE4YjRiZSgpIHsKICAgICAgdmFyIF8weDRkMTM3OCA9IF8weDU2MTJkZTsKICAgICAgdHJ5IHsKICAgICAgICByZXR1cm4gKAogICAgICAgICAgXzB4MzdhOTNhIHx8CiAgICAgICAgICAoXzB4NDYyMzM1W18weDRkMTM3OCgweDIxOSldCiAgICAgICAgICAgID8gLSgtMHgxICogMHgxOWQ1ICsgLTB4MWU1ZCArIDB4MzgzMykKICAgICAgICAgICAgOiAoXzB4MzdhOTNhID0gXzB4YzZmODI4KAogICAgICAgICAgICAgICAgMHgxNSAqIDB4MTQ0ZDc5YmEgKyAweDg4MzFmZDYzICsgLTB4MTUzZGYzYWI2CiAgICAgICAgICAgICAgKSkpCiAgICAgICAgKTsKICAgICAgfSBjYXRjaCAoXzB4M2M5ZDBkKSB7CiAgICAgICAgcmV0dXJuIC0oMHgxZTU4ICsgLTB4MjYgKiAtMHhjYiArIDB4M2M3OSAqIC0weDEpOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxYTM5YzQoKSB7CiAgICAgIGlmIChfMHgzN2E5M2EpIHJldHVybiBfMHgzN2E5M2E7CiAgICAgIF8weDM3YTkzYSA9IF8weGM2ZjgyOCgKICAgICAgICAtMHgzNjFjZGMyYSAqIC0weDUgKyAweDE3YzUgKiAweGIzNjliICsgLTB4MmY3ICogMHg2YTBjYTYKICAgICAgKTsKICAgIH0KICAgIHZhciBfMHg0NWVjZTUgPSB7CiAgICAgIGZwUHJvZmlsZVVybDogXzB4NTYxMmRlKDB4MTcyKSwKICAgIH07CiAgICBmdW5jdGlvbiBfMHgxMzAxNTUoKSB7CiAgICAgIHZhciBfMHg1ZTkyNjIgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4MzgwMzQ2ID0gd2luZG93W18weDVlOTI2MigweDMyOCldOwogICAgICByZXR1cm4gKAogICAgICAgIF8weDM4MDM0NltfMHg1ZTkyNjIoMHgzMDIpXSArCiAgICAgICAgIl8iICsKICAgICAgICBfMHgzODAzNDZbXzB4NWU5MjYyKDB4MjQ1KV0gKwogICAgICAgICJfIiArCiAgICAgICAgXzB4MzgwMzQ2W18weDVlOTI2MigweDE3ZSldCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyYTc2ZjgoKSB7CiAgICAgIHZhciBfMHgxZDJiNzkgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4YThjYjZhID0gd2luZG93WyJzY3JlZW4iXTsKICAgICAgcmV0dXJuIF8weGE4Y2I2YVtfMHgxZDJiNzkoMHgzOGEpXSArICJfIiArIF8weGE4Y2I2YVtfMHgxZDJiNzkoMHgyNzYpXTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDNkYTI3OSgpIHsKICAgICAgcmV0dXJuIG5ldyBQcm9taXNlKGZ1bmN0aW9uIChfMHgyYTEwZWQpIHsKICAgICAgICB2YXIgXzB4N2QzZjI3ID0gd18weDI1ZjM7CiAgICAgICAgaWYgKF8weDdkM2YyNygweDFiMikgaW4gbmF2aWdhdG9yKQogICAgICAgICAgdHJ5IHsKICAgICAgICAgICAgbmF2aWdhdG9yWyJnZXRCYXR0ZXJ5Il0oKVtfMHg3ZDNmMjcoMHgxZWQpXShmdW5jdGlvbiAoXzB4MTNmZjFkKSB7CiAgICAgICAgICAgICAgdmFyIF8weDQ3OWI5OSA9IF8weDdkM2YyNzsKICAgICAgICAgICAgICBfMHgyYTEwZWQoCiAgICAgICAgICAgICAgICBfMHgxM2ZmMWRbXzB4NDc5Yjk5KDB4M2FjKV0gKwogICAgICAgICAgICAgICAgICAiXyIgKwogICAgICAgICAgICAgICAgICBfMHgxM2ZmMWRbXzB4NDc5Yjk5KDB4MmIwKV0gKwogICAgICAgICAgICAgICAgICAiXyIgKwogICAgICAgICAgICAgICAgICBfMHgxM2ZmMWRbXzB4NDc5Yjk5KDB4MzUzKV0gKwogICAgICAgICAgICAgICAgICAiXyIgKwogICAgICAgICAgICAgICAgICBfMHgxM2ZmMWRbXzB4NDc5Yjk5KDB4MjEzKV0KICAgICAgICAgICAgICApOwogICAgICAgICAgICB9KTsKICAgICAgICAgIH0gY2F0Y2ggKF8weDJjMjhiOCkgewogICAgICAgICAgICBfMHgyYTEwZWQoIiIpOwogICAgICAgICAgfQogICAgICAgIGVsc2UgXzB4MmExMGVkKCIiKTsKICAgICAgfSk7CiAgICB9CiAgICB2YXIgXzB4NDdlYzJhID0ge307CiAgICBmdW5jdGlvbiBfMHgyOTlmM2EoKSB7CiAgICAgIHZhciBfMHgyNTMxYjYgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4MWE4YTM0LAogICAgICAgIF8weDJlMDg0MyA9IF8weDI1MzFiNigweDMzYiksCiAgICAgICAgXzB4MjllYTIwID0gLTB4MTJhNCArIDB4MzBiICsgMHhmOTk7CiAgICAgIHZvaWQgKC0weDJiICogMHhhICsgLTB4MWQ4ZCArIDB4MWYzYikgIT09IG5hdmlnYXRvcltfMHgyZTA4NDNdICYmCiAgICAgICAgKF8weDI5ZWEyMCA9IG5hdmlnYXRvcltfMHgyZTA4NDNdKTsKICAgICAgdHJ5IHsKICAgICAgICBkb2N1bWVudFtfMHgyNTMxYjYoMHgxODgpXShfMHgyNTMxYjYoMHgyNDApKSwKICAgICAgICAgIChfMHgxYThhMzQgPSAhKC0weDFmNjEgKyAweDE5ICogMHgyMiArIDB4MWMwZikpOwogICAgICB9IGNhdGNoIChfMHgzOTkyZTApIHsKICAgICAgICBfMHgxYThhMzQgPSAhKDB4MTcgKiAtMHg1ZCArIC0weDEgKiAweDIwOSArIDB4Mzc3ICogMHgzKTsKICAgICAgfQogICAgICB2YXIgXzB4MTExOTBhID0gXzB4MjUzMWI2KDB4MWVhKSBpbiB3aW5kb3c7CiAgICAgIHJldHVybiAoCiAgICAgICAgT2JqZWN0W18weDI1MzFiNigweDJhMCldKF8weDQ3ZWMyYSwgewogICAgICAgICAgbWF4VG91Y2hQb2ludHM6IF8weDI5ZWEyMCwKICAgICAgICAgIHRvdWNoRXZlbnQ6IF8weDFhOGEzNCwKICAgICAgICAgIHRvdWNoU3RhcnQ6IF8weDExMTkwYSwKICAgICAgICB9KSwKICAgICAgICBfMHgyOWVhMjAgKyAiXyIgKyBfMHgxYThhMzQgKyAiXyIgKyBfMHgxMTE5MGEKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weGJlODQyYigpIHsKICAgICAgcmV0dXJuIF8weDQ3ZWMyYTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDQ2NDlhMSgpIHsKICAgICAgdmFyIF8weDNiNmYyMCA9IF8weDU2MTJkZSwKICAgICAgICBfMHg0MjU2YTcgPSBuZXcgRGF0ZSgpOwogICAgICBfMHg0MjU2YTdbXzB4M2I2ZjIwKDB4MjJkKV0oLTB4MTQ3NyArIDB4ZGU0ICogLTB4MSArIDB4Yjc0ICogMHgzKSwKICAgICAgICBfMHg0MjU2YTdbXzB4M2I2ZjIwKDB4Mjk0KV0oLTB4MzYwICsgLTB4MjYzZCArIDB4MjlhMik7CiAgICAgIHZhciBfMHgyMTNhMDMgPSAtXzB4NDI1NmE3W18weDNiNmYyMCgweDIzNyldKCk7CiAgICAgIF8weDQyNTZhN1tfMHgzYjZmMjAoMHgyOTQpXSgtMHg5YjUgKyAweDUgKiAweDc3ZSArIC0weDIgKiAweGRkYik7CiAgICAgIHZhciBfMHg1YTI2MjEgPSAtXzB4NDI1NmE3W18weDNiNmYyMCgweDIzNyldKCk7CiAgICAgIHJldHVybiBNYXRoWyJtaW4iXShfMHgyMTNhMDMsIF8weDVhMjYyMSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0ODc1NzYoKSB7CiAgICAgIHZhciBfMHg1NTU3YTEgPSBfMHg1NjEyZGU7CiAgICAgIGlmIChfMHg2Y2FmW18weDU1NTdhMSgweDJkYildKSByZXR1cm4gXzB4NmNhZltfMHg1NTU3YTEoMHgyZGIpXTsKICAgICAgdHJ5IHsKICAgICAgICB2YXIgXzB4NGYyOGVjID0gZG9jdW1lbnRbXzB4NTU1N2ExKDB4MjYwKV0oXzB4NTU1N2ExKDB4MjRkKSlbCiAgICAgICAgICAgIF8weDU1NTdhMSgweDJmOSkKICAgICAgICAgIF0oIndlYmdsIiksCiAgICAgICAgICBfMHgzNjQ3M2QgPSBfMHg0ZjI4ZWNbImdldEV4dGVuc2lvbiJdKF8weDU1NTdhMSgweDM3NSkpLAogICAgICAgICAgXzB4M2ViYjhkID0KICAgICAgICAgICAgXzB4NGYyOGVjW18weDU1NTdhMSgweDM4MyldKF8weDM2NDczZFsiVU5NQVNLRURfVkVORE9SX1dFQkdMIl0pICsKICAgICAgICAgICAgIi8iICsKICAgICAgICAgICAgXzB4NGYyOGVjWyJnZXRQYXJhbWV0ZXIiXShfMHgzNjQ3M2RbXzB4NTU1N2ExKDB4MzllKV0pOwogICAgICAgIHJldHVybiAoXzB4NmNhZltfMHg1NTU3YTEoMHgyZGIpXSA9IF8weDNlYmI4ZCksIF8weDNlYmI4ZDsKICAgICAgfSBjYXRjaCAoXzB4MmI5ZmE1KSB7CiAgICAgICAgcmV0dXJuICIiOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0ZjMyM2UoKSB7CiAgICAgIHZhciBfMHgyOTY4YTUgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4ZjU1YzIyID0gW18weDI5NjhhNSgweDI3YiksICJzYW5zLXNlcmlmIiwgXzB4Mjk2OGE1KDB4MWZiKV0sCiAgICAgICAgXzB4M2VkNWY4ID0ge30sCiAgICAgICAgXzB4MmZlZjExID0ge307CiAgICAgIGlmICghZG9jdW1lbnRbXzB4Mjk2OGE1KDB4MTg5KV0pIHJldHVybiAiMCI7CiAgICAgIGZvciAoCiAgICAgICAgdmFyIF8weDZmNzBiYyA9IC0weDIyNzEgKyAweDJmICogMHg3MiArIDB4ZDgzLCBfMHgzZTY2ZDcgPSBfMHhmNTVjMjI7CiAgICAgICAgXzB4NmY3MGJjIDwgXzB4M2U2NmQ3WyJsZW5ndGgiXTsKICAgICAgICBfMHg2ZjcwYmMrKwogICAgICApIHsKICAgICAgICB2YXIgXzB4MTg5ZjkxID0gXzB4M2U2NmQ3W18weDZmNzBiY10sCiAgICAgICAgICBfMHgyYmYxNDUgPSBkb2N1bWVudFtfMHgyOTY4YTUoMHgyNjApXShfMHgyOTY4YTUoMHgxZjcpKTsKICAgICAgICAoXzB4MmJmMTQ1WyJpbm5lckhUTUwiXSA9IF8weDI5NjhhNSgweDJhMykpLAogICAgICAgICAgKF8weDJiZjE0NVsic3R5bGUiXVtfMHgyOTY4YTUoMHgzNjIpXSA9ICI3MnB4IiksCiAgICAgICAgICAoXzB4MmJmMTQ1WyJzdHlsZSJdWyJmb250RmFtaWx5Il0gPSBfMHgxODlmOTEpLAogICAgICAgICAgZG9jdW1lbnRbXzB4Mjk2OGE1KDB4MTg5KV1bXzB4Mjk2OGE1KDB4MjZjKV0oXzB4MmJmMTQ1KSwKICAgICAgICAgIChfMHgzZWQ1ZjhbXzB4MTg5ZjkxXSA9IF8weDJiZjE0NVtfMHgyOTY4YTUoMHgyZWUpXSksCiAgICAgICAgICAoXzB4MmZlZjExW18weDE4OWY5MV0gPSBfMHgyYmYxNDVbIm9mZnNldEhlaWdodCJdKSwKICAgICAgICAgIGRvY3VtZW50W18weDI5NjhhNSgweDE4OSldW18weDI5NjhhNSgweDMwZCldKF8weDJiZjE0NSk7CiAgICAgIH0KICAgICAgdmFyIF8weDRmNTljZiwKICAgICAgICBfMHg0YWJkMGYgPSBbCiAgICAgICAgICAiVHJlYnVjaGV0XHgyME1TIiwKICAgICAgICAgIF8weDI5NjhhNSgweDE3NyksCiAgICAgICAgICBfMHgyOTY4YTUoMHgyNWQpLAogICAgICAgICAgIlNlZ29lXHgyMFVJIiwKICAgICAgICAgIF8weDI5NjhhNSgweDMyMSksCiAgICAgICAgICBfMHgyOTY4YTUoMHgxOTIpLAogICAgICAgICAgIk1UXHgyMEV4dHJhIiwKICAgICAgICAgIF8weDI5NjhhNSgweDNhOSksCiAgICAgICAgICBfMHgyOTY4YTUoMHgyOGUpLAogICAgICAgICAgXzB4Mjk2OGE1KDB4MzQ2KSwKICAgICAgICAgICJNZWlyeW8iLAogICAgICAgICAgXzB4Mjk2OGE1KDB4MjQ3KSwKICAgICAgICAgIF8weDI5NjhhNSgweDFlZiksCiAgICAgICAgICBfMHgyOTY4YTUoMHgxZDgpLAogICAgICAgICAgIklyaXNVUEMiLAogICAgICAgICAgIlBhbGF0aW5vIiwKICAgICAgICAgICJDb2xvbm5hXHgyME1UIiwKICAgICAgICAgICJQbGF5YmlsbCIsCiAgICAgICAgICBfMHgyOTY4YTUoMHgxZjQpLAogICAgICAgICAgXzB4Mjk2OGE1KDB4Mjg4KSwKICAgICAgICAgIF8weDI5NjhhNSgweDFmMiksCiAgICAgICAgICBfMHgyOTY4YTUoMHgzOGQpLAogICAgICAgICAgIk9QVElNQSIsCiAgICAgICAgICBfMHgyOTY4YTUoMHgyZDkpLAogICAgICAgICAgXzB4Mjk2OGE1KDB4MzQ4KSwKICAgICAgICAgIF8weDI5NjhhNSgweDJiMyksCiAgICAgICAgICAiU2F2b3llXHgyMExFVCIsCiAgICAgICAgICBfMHgyOTY4YTUoMHgzYzUpLAogICAgICAgICAgXzB4Mjk2OGE1KDB4MjFlKSwKICAgICAgICBdOwogICAgICBfMHg0ZjU5Y2YgPSAtMHgyNTViICogLTB4MSArIC0weDEgKiAtMHgxMzlkICsgLTB4MzhmODsKICAgICAgZm9yICgKICAgICAgICB2YXIgXzB4MTZjMzAwID0gLTB4MSAqIDB4YzNlICsgLTB4MjBmZiArIDB4MmQzZDsKICAgICAgICBfMHgxNmMzMDAgPCBfMHg0YWJkMGZbXzB4Mjk2OGE1KDB4MjU5KV07CiAgICAgICAgXzB4MTZjMzAwKysKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDJjM2JlNCwKICAgICAgICAgIF8weDM3YjkzNyA9IF8weDM1MDA3NShfMHhmNTVjMjIpOwogICAgICAgIHRyeSB7CiAgICAgICAgICBmb3IgKAogICAgICAgICAgICBfMHgzN2I5MzdbInMiXSgpOwogICAgICAgICAgICAhKF8weDJjM2JlNCA9IF8weDM3YjkzN1sibiJdKCkpW18weDI5NjhhNSgweDFlMyldOwoKICAgICAgICAgICkgewogICAgICAgICAgICB2YXIgXzB4NDAwMzQwID0gXzB4MmMzYmU0WyJ2YWx1ZSJdLAogICAgICAgICAgICAgIF8weDIwMDgyMSA9IGRvY3VtZW50W18weDI5NjhhNSgweDI2MCldKCJzcGFuIik7CiAgICAgICAgICAgIChfMHgyMDA4MjFbXzB4Mjk2OGE1KDB4MzZhKV0gPSBfMHgyOTY4YTUoMHgyYTMpKSwKICAgICAgICAgICAgICAoXzB4MjAwODIxWyJzdHlsZSJdW18weDI5NjhhNSgweDM2MildID0gXzB4Mjk2OGE1KDB4MjgzKSksCiAgICAgICAgICAgICAgKF8weDIwMDgyMVtfMHgyOTY4YTUoMHgyODApXVsiZm9udEZhbWlseSJdID0KICAgICAgICAgICAgICAgIF8weDRhYmQwZltfMHgxNmMzMDBdICsgIiwiICsgXzB4NDAwMzQwKSwKICAgICAgICAgICAgICBkb2N1bWVudFsiYm9keSJdW18weDI5NjhhNSgweDI2YyldKF8weDIwMDgyMSk7CiAgICAgICAgICAgIHZhciBfMHg1MzNmNzEgPQogICAgICAgICAgICAgIF8weDIwMDgyMVtfMHgyOTY4YTUoMHgyZWUpXSAhPT0gXzB4M2VkNWY4W18weDQwMDM0MF0gfHwKICAgICAgICAgICAgICBfMHgyMDA4MjFbXzB4Mjk2OGE1KDB4MmE0KV0gIT09IF8weDJmZWYxMVtfMHg0MDAzNDBdOwogICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgKGRvY3VtZW50W18weDI5NjhhNSgweDE4OSldW18weDI5NjhhNSgweDMwZCldKF8weDIwMDgyMSksCiAgICAgICAgICAgICAgXzB4NTMzZjcxKQogICAgICAgICAgICApIHsKICAgICAgICAgICAgICBfMHgxNmMzMDAgPCAtMHg0NSAqIC0weDhhICsgLTB4N2E5ICsgLTB4MWQ2YiAmJgogICAgICAgICAgICAgICAgKF8weDRmNTljZiB8PSAoLTB4MjM5ICsgMHgzICogLTB4NDU4ICsgMHhmNDIpIDw8IF8weDE2YzMwMCk7CiAgICAgICAgICAgICAgYnJlYWs7CiAgICAgICAgICAgIH0KICAgICAgICAgIH0KICAgICAgICB9IGNhdGNoIChfMHg1YzFjNmUpIHsKICAgICAgICAgIF8weDM3YjkzN1siZSJdKF8weDVjMWM2ZSk7CiAgICAgICAgfSBmaW5hbGx5IHsKICAgICAgICAgIF8weDM3YjkzN1siZiJdKCk7CiAgICAgICAgfQogICAgICB9CiAgICAgIHJldHVybiBfMHg0ZjU5Y2ZbXzB4Mjk2OGE1KDB4M2FlKV0oLTB4ZTk3ICsgLTB4MTgzYyArIC0weDEgKiAtMHgyNmUzKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDUwOTBmNSgpIHsKICAgICAgdmFyIF8weDQ1OGM4NyA9IF8weDU2MTJkZTsKICAgICAgdHJ5IHsKICAgICAgICBuZXcgV2ViU29ja2V0KF8weDQ1OGM4NygweDE5OSkpOwogICAgICB9IGNhdGNoIChfMHgzNGU4NjYpIHsKICAgICAgICByZXR1cm4gXzB4MzRlODY2W18weDQ1OGM4NygweDMxMildOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0NjhkNTcoKSB7CiAgICAgIHZhciBfMHgyZWYwYzUgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiBldmFsW18weDJlZjBjNSgweDNhZSldKClbXzB4MmVmMGM1KDB4MjU5KV07CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1YmJhZjAoKSB7CiAgICAgIHZhciBfMHg1ZWM1NjEgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4NTk3MWQ2ID0KICAgICAgICAgIHdpbmRvd1siUlRDUGVlckNvbm5lY3Rpb24iXSB8fAogICAgICAgICAgd2luZG93W18weDVlYzU2MSgweDJlMCldIHx8CiAgICAgICAgICB3aW5kb3dbXzB4NWVjNTYxKDB4MTlhKV0sCiAgICAgICAgXzB4NWFhYzg3ID0gW107CiAgICAgIHJldHVybiBuZXcgUHJvbWlzZShmdW5jdGlvbiAoXzB4NGU2ZWMxKSB7CiAgICAgICAgdmFyIF8weDVhZjYzNCA9IF8weDVlYzU2MTsKICAgICAgICAoXzB4MTc2YTU3KCkgfHwKICAgICAgICAgIG5hdmlnYXRvcltfMHg1YWY2MzQoMHgyMjkpXQogICAgICAgICAgICBbXzB4NWFmNjM0KDB4MjAyKV0oKQogICAgICAgICAgICBbXzB4NWFmNjM0KDB4MmM1KV0oXzB4NWFmNjM0KDB4MjBlKSkgPgogICAgICAgICAgICAtMHg3MDcgKyAtMHgxMDYgKiAweDEwICsgLTB4MSAqIC0weDE3NjcpICYmCiAgICAgICAgICBfMHg0ZTZlYzEoIiIpOwogICAgICAgIHRyeSB7CiAgICAgICAgICBpZiAoXzB4NTk3MWQ2ICYmICJmdW5jdGlvbiIgPT0gdHlwZW9mIF8weDU5NzFkNikgewogICAgICAgICAgICB2YXIgXzB4YWRhYmI2ID0gbmV3IF8weDU5NzFkNih7CiAgICAgICAgICAgICAgICBpY2VTZXJ2ZXJzOiBbCiAgICAgICAgICAgICAgICAgIHsKICAgICAgICAgICAgICAgICAgICB1cmxzOiBfMHg1YWY2MzQoMHgyN2MpLAogICAgICAgICAgICAgICAgICB9LAogICAgICAgICAgICAgICAgXSwKICAgICAgICAgICAgICB9KSwKICAgICAgICAgICAgICBfMHg0NDA1ZTYgPSBmdW5jdGlvbiAoKSB7fSwKICAgICAgICAgICAgICBfMHg0ZGUxZDEgPQogICAgICAgICAgICAgICAgLyhbMC05XXsxLDN9KFwuWzAtOV17MSwzfSl7M318W2EtZjAtOV17MSw0fSg6W2EtZjAtOV17MSw0fSl7N30pLzsKICAgICAgICAgICAgKF8weGFkYWJiNltfMHg1YWY2MzQoMHgxZWIpXSA9IGZ1bmN0aW9uICgpIHsKICAgICAgICAgICAgICB2YXIgXzB4Mzc0ZWIwID0gXzB4NWFmNjM0OwogICAgICAgICAgICAgIF8weDM3NGViMCgweDE2MikgPT09IF8weGFkYWJiNlsiaWNlR2F0aGVyaW5nU3RhdGUiXSAmJgogICAgICAgICAgICAgICAgKF8weGFkYWJiNltfMHgzNzRlYjAoMHgyN2EpXSgpLCAoXzB4YWRhYmI2ID0gbnVsbCkpOwogICAgICAgICAgICB9KSwKICAgICAgICAgICAgICAoXzB4YWRhYmI2WyJvbmljZWNhbmRpZGF0ZSJdID0gZnVuY3Rpb24gKF8weDRlMjcxNykgewogICAgICAgICAgICAgICAgdmFyIF8weDE4ZTYyZSA9IF8weDVhZjYzNDsKICAgICAgICAgICAgICAgIGlmICgKICAgICAgICAgICAgICAgICAgXzB4NGUyNzE3ICYmCiAgICAgICAgICAgICAgICAgIF8weDRlMjcxN1tfMHgxOGU2MmUoMHgyMjcpXSAmJgogICAgICAgICAgICAgICAgICBfMHg0ZTI3MTdbXzB4MThlNjJlKDB4MjI3KV1bXzB4MThlNjJlKDB4MjI3KV0KICAgICAgICAgICAgICAgICkgewogICAgICAgICAgICAgICAgICBpZiAoIiIgPT09IF8weDRlMjcxN1siY2FuZGlkYXRlIl1bXzB4MThlNjJlKDB4MjI3KV0pIHJldHVybjsKICAgICAgICAgICAgICAgICAgdmFyIF8weDFkMWNkMSA9IF8weDRkZTFkMVsiZXhlYyJdKAogICAgICAgICAgICAgICAgICAgIF8weDRlMjcxN1tfMHgxOGU2MmUoMHgyMjcpXVtfMHgxOGU2MmUoMHgyMjcpXQogICAgICAgICAgICAgICAgICApOwogICAgICAgICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgICAgICAgbnVsbCAhPT0gXzB4MWQxY2QxICYmCiAgICAgICAgICAgICAgICAgICAgXzB4MWQxY2QxW18weDE4ZTYyZSgweDI1OSldID4KICAgICAgICAgICAgICAgICAgICAgIC0weDE2NzUgKiAweDEgKyAtMHgxOSAqIDB4ZGQgKyAweDE5ICogMHgxYzMKICAgICAgICAgICAgICAgICAgKSB7CiAgICAgICAgICAgICAgICAgICAgdmFyIF8weGJhYTk1NiA9CiAgICAgICAgICAgICAgICAgICAgICBfMHgxZDFjZDFbLTB4MWJkZCAqIDB4MSArIDB4MTMgKiAtMHgxZGYgKyAtMHgxMSAqIC0weDNiYl07CiAgICAgICAgICAgICAgICAgICAgLSgweDEgKiAtMHgxMmMxICsgLTB4YSAqIDB4MzhjICsgLTB4NGVlICogLTB4YikgPT09CiAgICAgICAgICAgICAgICAgICAgICBfMHg1YWFjODdbXzB4MThlNjJlKDB4MmM1KV0oXzB4YmFhOTU2KSAmJgogICAgICAgICAgICAgICAgICAgICAgXzB4NWFhYzg3W18weDE4ZTYyZSgweDM2ZSldKF8weGJhYTk1Nik7CiAgICAgICAgICAgICAgICAgIH0KICAgICAgICAgICAgICAgIH0gZWxzZSBfMHg0ZTZlYzEoXzB4NWFhYzg3W18weDE4ZTYyZSgweDI0ZildKCkpOwogICAgICAgICAgICAgIH0pLAogICAgICAgICAgICAgIF8weGFkYWJiNltfMHg1YWY2MzQoMHgxZTUpXSgiIiksCiAgICAgICAgICAgICAgc2V0VGltZW91dChmdW5jdGlvbiAoKSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4MzZiNzJlID0gXzB4NWFmNjM0OwogICAgICAgICAgICAgICAgXzB4NGU2ZWMxKF8weDVhYWM4N1tfMHgzNmI3MmUoMHgyNGYpXSgpKTsKICAgICAgICAgICAgICB9LCAweDIyMDUgKiAweDEgKyAweDFkNCAqIC0weDEwICsgLTB4NjcgKiAweDcpOwogICAgICAgICAgICB2YXIgXzB4MzhhMzU4ID0gXzB4YWRhYmI2W18weDVhZjYzNCgweDJmNSldKCk7CiAgICAgICAgICAgIF8weDM4YTM1OCBpbnN0YW5jZW9mIFByb21pc2UKICAgICAgICAgICAgICA/IF8weDM4YTM1OFtfMHg1YWY2MzQoMHgxZWQpXShmdW5jdGlvbiAoXzB4MzNlMjZjKSB7CiAgICAgICAgICAgICAgICAgIHJldHVybiBfMHhhZGFiYjZbInNldExvY2FsRGVzY3JpcHRpb24iXShfMHgzM2UyNmMpOwogICAgICAgICAgICAgICAgfSlbXzB4NWFmNjM0KDB4MWVkKV0oXzB4NDQwNWU2KQogICAgICAgICAgICAgIDogXzB4YWRhYmI2WyJjcmVhdGVPZmZlciJdKGZ1bmN0aW9uIChfMHgxYzZlNTEpIHsKICAgICAgICAgICAgICAgICAgXzB4YWRhYmI2WyJzZXRMb2NhbERlc2NyaXB0aW9uIl0oCiAgICAgICAgICAgICAgICAgICAgXzB4MWM2ZTUxLAogICAgICAgICAgICAgICAgICAgIF8weDQ0MDVlNiwKICAgICAgICAgICAgICAgICAgICBfMHg0NDA1ZTYKICAgICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgICAgIH0sIF8weDQ0MDVlNik7CiAgICAgICAgICB9IGVsc2UgXzB4NGU2ZWMxKCIiKTsKICAgICAgICB9IGNhdGNoIChfMHgzMWRlYmIpIHsKICAgICAgICAgIF8weDRlNmVjMSgiIik7CiAgICAgICAgfQogICAgICB9KTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDJlMDJjYSgpIHsKICAgICAgdmFyIF8weDc0Y2RjYiA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIF8weDc0Y2RjYigweDNhZilbXzB4NzRjZGNiKDB4Mzc3KV0oL1t4eV0vZywgZnVuY3Rpb24gKF8weDU3OTBkZCkgewogICAgICAgIHZhciBfMHg1MmYwYjUgPSBfMHg3NGNkY2IsCiAgICAgICAgICBfMHgyZWVhZjMgPQogICAgICAgICAgICAoKDB4NTA2ICsgLTB4ODVjICsgLTB4MiAqIC0weDFiMykgKiBNYXRoW18weDUyZjBiNSgweDE4ZSldKCkpIHwKICAgICAgICAgICAgKDB4YmI5ICogLTB4MSArIDB4MSAqIDB4OWRkICsgMHgxZGMpOwogICAgICAgIHJldHVybiAoCiAgICAgICAgICAieCIgPT0gXzB4NTc5MGRkCiAgICAgICAgICAgID8gXzB4MmVlYWYzCiAgICAgICAgICAgIDogKCgtMHhkMWYgKiAweDEgKyAweDFkZjYgKyAtMHgxICogMHgxMGQ0KSAmIF8weDJlZWFmMykgfAogICAgICAgICAgICAgICgweDE4MmQgKyAtMHgxMCAqIDB4MjYyICsgLTB4ZGZiICogLTB4MSkKICAgICAgICApW18weDUyZjBiNSgweDNhZSldKDB4MWE2NSArIDB4MyAqIDB4MTdhICsgMHgxM2IgKiAtMHgxOSk7CiAgICAgIH0pOwogICAgfQogICAgZnVuY3Rpb24gXzB4MmUyZmEwKF8weDFhNjkzOCkgewogICAgICB2YXIgXzB4NWFhYTk4ID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gKAogICAgICAgIC0weDE0ICogMHgxZGYgKyAweDY0OSArIDB4MWY0NSA9PT0gXzB4MWE2OTM4W18weDVhYWE5OCgweDI1OSldICYmCiAgICAgICAgXzB4MjQ2YWViKAogICAgICAgICAgLTB4MjFhZCArIDB4ODE5ICogLTB4MSArIDB4MjljNiwKICAgICAgICAgIF8weDFhNjkzOFtfMHg1YWFhOTgoMHgxYjApXSgKICAgICAgICAgICAgLTB4MWE1NSAqIDB4MSArIDB4MTI3OSArIDB4N2RjLAogICAgICAgICAgICAweDMxYiArIC0weGNiNCAqIC0weDEgKyAtMHhmYWYKICAgICAgICAgICkKICAgICAgICApCiAgICAgICAgICBbXzB4NWFhYTk4KDB4M2FlKV0oKQogICAgICAgICAgWyJzdWJzdHJpbmciXSgKICAgICAgICAgICAgMHgxN2NjICsgMHgxICogLTB4ZDE5ICsgLTB4MyAqIDB4MzkxLAogICAgICAgICAgICAtMHgxZmYgKiAweDEgKyAweDI1NzkgKyAtMHgxYzYgKiAweDE0CiAgICAgICAgICApID09PQogICAgICAgICAgXzB4MWE2OTM4W18weDVhYWE5OCgweDFiMCldKAogICAgICAgICAgICAweDE3NDYgKyAweDdiOCArIC0weDFlZGUsCiAgICAgICAgICAgIC0weDM2OSAqIC0weDIgKyAtMHg1ZTUgKiAweDQgKyAweGJjICogMHgxNwogICAgICAgICAgKQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MTc4ZDdjKCkgewogICAgICB2YXIgXzB4NGQ1ODE0ID0gXzB4NTYxMmRlLAogICAgICAgIF8weDJkNDM0MSA9IF8weDI0ZGMzNChfMHg0ZDU4MTQoMHgyNjIpKTsKICAgICAgcmV0dXJuICgKICAgICAgICAoXzB4MmQ0MzQxICYmIF8weDJlMmZhMChfMHgyZDQzNDEpKSB8fAogICAgICAgICAgXzB4MWY0MmNiKAogICAgICAgICAgICBfMHg0ZDU4MTQoMHgyNjIpLAogICAgICAgICAgICAoXzB4MmQ0MzQxID0gKChfMHgyZDQzNDEgPSBfMHgyZTAyY2EoKSkgKwogICAgICAgICAgICAgIF8weDI0NmFlYigweDE3ICogMHgxMmQgKyAtMHg2ICogMHgzZjcgKyAtMHgzNDEsIF8weDJkNDM0MSkpWwogICAgICAgICAgICAgIF8weDRkNTgxNCgweDFiMCkKICAgICAgICAgICAgXSgKICAgICAgICAgICAgICAweDJkMSAqIC0weGQgKyAweDNhICogLTB4N2MgKyAweDQwYjUsCiAgICAgICAgICAgICAgMHgxODhlICsgMHgxMyAqIC0weDEyNyArIC0weDI4NwogICAgICAgICAgICApKQogICAgICAgICAgKSwKICAgICAgICBfMHgyZDQzNDEKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDNjMGE2OChfMHg0NDlmZTgsIF8weDVlZGUwYykgewogICAgICB2YXIgXzB4NDBiZDViID0gXzB4NTYxMmRlLAogICAgICAgIF8weDQwMTA4NSA9IG51bGw7CiAgICAgIHRyeSB7CiAgICAgICAgXzB4NDAxMDg1ID0gZG9jdW1lbnRbImdldEVsZW1lbnRzQnlUYWdOYW1lIl0oXzB4NDBiZDViKDB4MjIxKSlbCiAgICAgICAgICAtMHgyNTgxICsgMHg4NDQgKyAtMHgxZDNkICogLTB4MQogICAgICAgIF07CiAgICAgIH0gY2F0Y2ggKF8weDU5OWNhNCkgewogICAgICAgIF8weDQwMTA4NSA9IGRvY3VtZW50WyJib2R5Il07CiAgICAgIH0KICAgICAgaWYgKG51bGwgIT09IF8weDQwMTA4NSkgewogICAgICAgIHZhciBfMHgzYTM2NjUgPSBkb2N1bWVudFtfMHg0MGJkNWIoMHgyNjApXShfMHg0MGJkNWIoMHgzNjEpKSwKICAgICAgICAgIF8weDIxNTQyMiA9CiAgICAgICAgICAgICJfIiArCiAgICAgICAgICAgIHBhcnNlSW50KAogICAgICAgICAgICAgICgweDNkZjAgKyAweDEzZCArIC0weDE4MWQpICogTWF0aFsicmFuZG9tIl0oKSwKICAgICAgICAgICAgICAweDEgKiAtMHgyMTQxICsgLTB4MSAqIC0weGY4MiArIDB4MTFjOQogICAgICAgICAgICApICsKICAgICAgICAgICAgIl8iICsKICAgICAgICAgICAgbmV3IERhdGUoKVtfMHg0MGJkNWIoMHgxNmQpXSgpOwogICAgICAgIChfMHg0NDlmZTggKz0gXzB4NDBiZDViKDB4MWJlKSArIF8weDIxNTQyMiksCiAgICAgICAgICAoXzB4M2EzNjY1W18weDQwYmQ1YigweDE2YildID0gXzB4NDQ5ZmU4KSwKICAgICAgICAgICh3aW5kb3dbXzB4MjE1NDIyXSA9IGZ1bmN0aW9uIChfMHgxZWZkNzkpIHsKICAgICAgICAgICAgdmFyIF8weDRhZmI3MiA9IF8weDQwYmQ1YjsKICAgICAgICAgICAgdHJ5IHsKICAgICAgICAgICAgICBfMHg1ZWRlMGMoXzB4MWVmZDc5KSwKICAgICAgICAgICAgICAgIF8weDQwMTA4NVtfMHg0YWZiNzIoMHgzMGQpXShfMHgzYTM2NjUpLAogICAgICAgICAgICAgICAgZGVsZXRlIHdpbmRvd1tfMHgyMTU0MjJdOwogICAgICAgICAgICB9IGNhdGNoIChfMHhmOThmOTUpIHt9CiAgICAgICAgICB9KSwKICAgICAgICAgIF8weDQwMTA4NVtfMHg0MGJkNWIoMHgyNmMpXShfMHgzYTM2NjUpOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0MDcyYWQoXzB4MThjZDg1KSB7CiAgICAgIHJldHVybiB3XzB4NWMzMTQwKAogICAgICAgICI0ODRlNGY0YTQwM2Y1MjQzMDAwMjJjMzk1ZWFmYzBhNDAwMDAwMDAwNGEwNDQ0MGQwMDAwMDAzMDExMDEwNDMyNDcwMDA0MDcwMDAwNDIwMjExMDEwMDAzMDQ0MzAxMTQwMDAxMTEwMDAxMDIxMTAxMDEwMjExMDEwMjExMDEwNDExMDAwMTQzMDIwNzAwMDE0MzAyMTg0MjAwMDIwMDQwNGY0YzRkNGE0YjQ4NDk0NjQ3NDQ0NTQyNDM0MDQxNWU1ZjVjNWQ1YTViNTg1OTU2NTc1NDZmNmM2ZDZhNmI2ODY5NjY2NzY0NjU2MjYzNjA2MTdlN2Y3YzdkN2E3Yjc4Nzk3Njc3NzQzZTNmM2MzZDNhM2IzODM5MzYzNzIzMjAiLAogICAgICAgIHsKICAgICAgICAgIGdldCAweDAoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgzMjVmNTg7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDMyOGJkZTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgyKCkgewogICAgICAgICAgICByZXR1cm4gXzB4ZGRhNzM4OwogICAgICAgICAgfSwKICAgICAgICAgIDB4MzogYXJndW1lbnRzLAogICAgICAgICAgMHg0OiBfMHgxOGNkODUsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1YzBjZGQoXzB4MzgwZDJiLCBfMHgxYzY0NGEpIHsKICAgICAgdmFyIF8weDM0OTI3MCA9IF8weDU2MTJkZTsKICAgICAgaWYgKF8weDFjNjQ0YSkgewogICAgICAgIGZvciAoCiAgICAgICAgICB2YXIgXzB4MjVmZDIzID0gLTB4YmRjICsgLTB4ZDc4ICogLTB4MiArIC0weGYxNCwKICAgICAgICAgICAgXzB4MmM2NTVkID0gLTB4MSAqIC0weGJkYiArIDB4YzIgKyAtMHhjOWQ7CiAgICAgICAgICBfMHgyYzY1NWQgPCBfMHgzODBkMmJbXzB4MzQ5MjcwKDB4MjU5KV07CiAgICAgICAgICBfMHgyYzY1NWQrKwogICAgICAgICkKICAgICAgICAgIF8weDM4MGQyYltfMHgyYzY1NWRdWyJwIl0gJiYKICAgICAgICAgICAgKF8weDM4MGQyYltfMHgyYzY1NWRdWyJyIl0gPSBfMHgxYzY0NGFbXzB4MjVmZDIzKytdKTsKICAgICAgfQogICAgICB2YXIgXzB4MjBkYTMyID0gIiI7CiAgICAgIF8weDM4MGQyYltfMHgzNDkyNzAoMHgyNTQpXShmdW5jdGlvbiAoXzB4NTY0ZWNlKSB7CiAgICAgICAgXzB4MjBkYTMyICs9IF8weDVhZjQ2YShfMHg1NjRlY2VbInIiXSkgKyAiXl4iOwogICAgICB9KSwKICAgICAgICAoXzB4MjBkYTMyICs9IF8weDMwYzkxNigpKTsKICAgICAgdmFyIF8weDI4MDNhMyA9IF8weDJlMDJjYSgpLAogICAgICAgIF8weDI3MzY1MCA9CiAgICAgICAgICBNYXRoW18weDM0OTI3MCgweDFjZildKAogICAgICAgICAgICBfMHgyODAzYTNbXzB4MzQ5MjcwKDB4MTk1KV0oMHgxMjdhICsgMHgyMmUwICsgLTB4MzU1NyAqIDB4MSkgLwogICAgICAgICAgICAgICgweDEgKiAweDE5OWYgKyAtMHhhYjQgKyAtMHgxICogMHhlZTMpCiAgICAgICAgICApICsKICAgICAgICAgIChfMHgyODAzYTNbXzB4MzQ5MjcwKDB4MTk1KV0oCiAgICAgICAgICAgIC0weDE1ICogMHhjYSArIC0weDFmZjYgKiAtMHgxICsgMHgxICogLTB4ZjYxCiAgICAgICAgICApICUKICAgICAgICAgICAgKC0weDEwODUgKyAtMHg1NTMgKyAweDE1ZTApKSwKICAgICAgICBfMHgxMDIwMjUgPSBfMHgyODAzYTNbInN1YnN0cmluZyJdKAogICAgICAgICAgMHgxICogLTB4MWViZiArIDB4MTNhMSArIDB4MWUgKiAweDVmLAogICAgICAgICAgMHg1YzcgKyAtMHg1YTUgKyAtMHg1ICogMHg2ICsgXzB4MjczNjUwCiAgICAgICAgKTsKICAgICAgXzB4MjBkYTMyID0gXzB4MzI4YmRlKF8weGRkYTczOChfMHgyMGRhMzIsIF8weDEwMjAyNSkgKyBfMHgyODAzYTMpOwogICAgICB2YXIgXzB4MTk3ZTM0ID0gXzB4NDVlY2U1WyJmcFByb2ZpbGVVcmwiXTsKICAgICAgXzB4M2MwYTY4KAogICAgICAgIChfMHgxOTdlMzQgKz0gXzB4MzQ5MjcwKDB4MTczKSArIGVuY29kZVVSSUNvbXBvbmVudChfMHgyMGRhMzIpICsgIiYiKSwKICAgICAgICBmdW5jdGlvbiAoXzB4NWI0Yzk1KSB7CiAgICAgICAgICB2YXIgXzB4M2MwYzQ4ID0gXzB4MzQ5MjcwOwogICAgICAgICAgMHgxZGI2ICsgLTB4MjFkICogMHgxICsgLTB4MWI5OSA9PSBfMHg1YjRjOTVbXzB4M2MwYzQ4KDB4MzU2KV0gJiYKICAgICAgICAgICAgXzB4NWI0Yzk1WyJmcCJdICYmCiAgICAgICAgICAgICgoXzB4NDYyMzM1W18weDNjMGM0OCgweDM1ZildID0gXzB4NWI0Yzk1WyJmcCJdKSwKICAgICAgICAgICAgKF8weDQ2MjMzNVtfMHgzYzBjNDgoMHgzNjMpXSA9IF8weDQwNzJhZChfMHg1YjRjOTVbImZwIl0pKSwKICAgICAgICAgICAgXzB4MWY0MmNiKCJ0dF9zY2lkIiwgXzB4NWI0Yzk1WyJmcCJdKSk7CiAgICAgICAgfQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MWMzYjZkKF8weDIwZjhjOSkgewogICAgICB2YXIgXzB4NTk2MDUzID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gd18weDVjMzE0MCgKICAgICAgICBfMHg1OTYwNTMoMHgyNDIpLAogICAgICAgIHsKICAgICAgICAgIGdldCAweDAoKSB7CiAgICAgICAgICAgIHJldHVybiBuYXZpZ2F0b3I7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MSgpIHsKICAgICAgICAgICAgcmV0dXJuIHdpbmRvdzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgyKCkgewogICAgICAgICAgICByZXR1cm4gZG9jdW1lbnQ7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MygpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDMwYzkxNjsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg0KCkgewogICAgICAgICAgICByZXR1cm4gXzB4MWFmYmMyOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDUoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxOGI0YmU7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDEzMDE1NTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg3KCkgewogICAgICAgICAgICByZXR1cm4gXzB4MmE3NmY4OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDgoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgzZGEyNzk7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4OSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDI5OWYzYTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhhKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDY0OWExOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGIoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0ODc1NzY7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4YygpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDRmMzIzZTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhkKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MWY5ODI0OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGUoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgyNGRjMzQ7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4ZigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDUwOTBmNTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxMCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDQ2OGQ1NzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxMSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDViYmFmMDsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxMigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDQ1Yjk0YjsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxMygpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDE3OGQ3YzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxNCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDVhZjQ2YTsKICAgICAgICAgIH0sCiAgICAgICAgICAweDE1OiBQcm9taXNlLAogICAgICAgICAgZ2V0IDB4MTYoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg1YzBjZGQ7CiAgICAgICAgICB9LAogICAgICAgICAgMHgxNzogYXJndW1lbnRzLAogICAgICAgICAgMHgxODogXzB4MjBmOGM5LAogICAgICAgIH0sCiAgICAgICAgdGhpcwogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MjBjYmYzKF8weDM4YThmZSwgXzB4NDA2ZDRiLCBfMHgyZTdhOWIpIHsKICAgICAgdmFyIF8weDFiMTE2YyA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIHdfMHg1YzMxNDAoCiAgICAgICAgXzB4MWIxMTZjKDB4MjMzKSwKICAgICAgICB7CiAgICAgICAgICAweDA6IFN0cmluZywKICAgICAgICAgIDB4MTogRGF0ZSwKICAgICAgICAgIGdldCAweDIoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0NWI5NGI7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MygpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDE4NDc4MzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg0KCkgewogICAgICAgICAgICByZXR1cm4gbG9jYXRpb247CiAgICAgICAgICB9LAogICAgICAgICAgMHg1OiBwYXJzZUludCwKICAgICAgICAgIGdldCAweDYoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg1ODYzZDE7CiAgICAgICAgICB9LAogICAgICAgICAgMHg3OiBKU09OLAogICAgICAgICAgZ2V0IDB4OCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weGYxMTlkYTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg5KCkgewogICAgICAgICAgICByZXR1cm4gXzB4M2ExY2YzOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGEoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgyMGI3N2E7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4YigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDQ0NjExMDsKICAgICAgICAgIH0sCiAgICAgICAgICAweGM6IE9iamVjdCwKICAgICAgICAgIGdldCAweGQoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0ODNlMDM7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4ZSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDUzZjg1MDsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhmKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MmE5MDBiOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEwKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MThiNGJlOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDExKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDYyMzM1OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEyKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDA3MmFkOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEzKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MjRkYzM0OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE0KCkgewogICAgICAgICAgICByZXR1cm4gbmF2aWdhdG9yOwogICAgICAgICAgfSwKICAgICAgICAgIDB4MTU6IGFyZ3VtZW50cywKICAgICAgICAgIDB4MTY6IF8weDM4YThmZSwKICAgICAgICAgIDB4MTc6IF8weDQwNmQ0YiwKICAgICAgICAgIDB4MTg6IF8weDJlN2E5YiwKICAgICAgICB9LAogICAgICAgIHRoaXMKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDVlNWE2NChfMHgyN2VjNDEsIF8weDRlMTI0NikgewogICAgICB2YXIgXzB4MTVhMTkyID0gXzB4NTYxMmRlOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHgzZjg0ZGEgPSB7fSwgXzB4Mzg5NTIxID0gLTB4NGJkICogLTB4MSArIC0weDI4YSArIC0weDIzMzsKICAgICAgICBfMHgzODk1MjEgPCBfMHg0ZTEyNDZbImxlbmd0aCJdOwogICAgICAgIF8weDM4OTUyMSsrCiAgICAgICkgewogICAgICAgIHZhciBfMHg1OGFmOTggPSBfMHg0ZTEyNDZbXzB4Mzg5NTIxXSwKICAgICAgICAgIF8weDFiN2Y0ZSA9IF8weDI3ZWM0MVtfMHg1OGFmOThdOwogICAgICAgIG51bGwgPT0gXzB4MWI3ZjRlICYmIChfMHgxYjdmNGUgPSAhKC0weDFmNzYgKyAtMHgxYzA2ICsgMHgzYjdkICogMHgxKSksCiAgICAgICAgICBudWxsID09PSBfMHgxYjdmNGUgfHwKICAgICAgICAgICAgKCJmdW5jdGlvbiIgIT0gdHlwZW9mIF8weDFiN2Y0ZSAmJgogICAgICAgICAgICAgIF8weDE1YTE5MigweDE3ZCkgIT09IF8weDFkYjEyMyhfMHgxYjdmNGUpKSB8fAogICAgICAgICAgICAoXzB4MWI3ZjRlID0gISgtMHgyICogLTB4ZWY5ICsgLTB4YTEgKiAweDMgKyAtMHhiICogMHgyOGQpKSwKICAgICAgICAgIChfMHgzZjg0ZGFbXzB4NThhZjk4XSA9IF8weDFiN2Y0ZSk7CiAgICAgIH0KICAgICAgcmV0dXJuIF8weDNmODRkYTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDJhNmFjMigpIHsKICAgICAgdmFyIF8weDQyYjliYyA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIF8weDVlNWE2NChuYXZpZ2F0b3IsIFsKICAgICAgICBfMHg0MmI5YmMoMHgzNmIpLAogICAgICAgICJhcHBOYW1lIiwKICAgICAgICBfMHg0MmI5YmMoMHgxN2EpLAogICAgICAgIF8weDQyYjliYygweDI0NiksCiAgICAgICAgXzB4NDJiOWJjKDB4M2E0KSwKICAgICAgICBfMHg0MmI5YmMoMHgzNjApLAogICAgICAgIF8weDQyYjliYygweDFmYSksCiAgICAgICAgXzB4NDJiOWJjKDB4MzNiKSwKICAgICAgICBfMHg0MmI5YmMoMHgzOGMpLAogICAgICAgIF8weDQyYjliYygweDIxMiksCiAgICAgICAgInZlbmRvclN1YiIsCiAgICAgICAgImRvTm90VHJhY2siLAogICAgICAgIF8weDQyYjliYygweDI0YSksCiAgICAgICAgXzB4NDJiOWJjKDB4MmUyKSwKICAgICAgICBfMHg0MmI5YmMoMHgyOTIpLAogICAgICAgIF8weDQyYjliYygweDM5MCksCiAgICAgICAgXzB4NDJiOWJjKDB4MzhmKSwKICAgICAgXSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyMjY5MzMoKSB7CiAgICAgIHZhciBfMHhlNjdmYjAgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiBfMHg1ZTVhNjQod2luZG93LCBbCiAgICAgICAgXzB4ZTY3ZmIwKDB4MjlkKSwKICAgICAgICBfMHhlNjdmYjAoMHgyMjIpLAogICAgICAgIF8weGU2N2ZiMCgweDMwNiksCiAgICAgICAgXzB4ZTY3ZmIwKDB4MjZlKSwKICAgICAgICBfMHhlNjdmYjAoMHgzNjYpLAogICAgICAgICJpc1NlY3VyZUNvbnRleHQiLAogICAgICAgIF8weGU2N2ZiMCgweDNjMCksCiAgICAgICAgXzB4ZTY3ZmIwKDB4Mzk5KSwKICAgICAgICAibG9jYXRpb25iYXIiLAogICAgICAgIF8weGU2N2ZiMCgweDI5ZiksCiAgICAgICAgXzB4ZTY3ZmIwKDB4MzlmKSwKICAgICAgICBfMHhlNjdmYjAoMHgyZTApLAogICAgICAgICJwb3N0TWVzc2FnZSIsCiAgICAgICAgIndlYmtpdFJlcXVlc3RBbmltYXRpb25GcmFtZSIsCiAgICAgICAgXzB4ZTY3ZmIwKDB4MmRlKSwKICAgICAgICAibmV0c2NhcGUiLAogICAgICBdKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDFlNWE3ZigpIHsKICAgICAgdmFyIF8weDU3N2JmMiA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIF8weDVlNWE2NChkb2N1bWVudCwgWwogICAgICAgIF8weDU3N2JmMigweDMzNSksCiAgICAgICAgXzB4NTc3YmYyKDB4MjUzKSwKICAgICAgICBfMHg1NzdiZjIoMHgzNzMpLAogICAgICAgICJsYXllcnMiLAogICAgICAgIF8weDU3N2JmMigweDJjMCksCiAgICAgIF0pOwogICAgfQogICAgZnVuY3Rpb24gXzB4MTFhMWQ2KCkgewogICAgICB2YXIgXzB4MzkyN2FmID0gXzB4NTYxMmRlLAogICAgICAgIF8weDMwNjI1NSA9IGRvY3VtZW50W18weDM5MjdhZigweDI2MCldKF8weDM5MjdhZigweDI0ZCkpLAogICAgICAgIF8weDNiODcwOCA9IG51bGw7CiAgICAgIHRyeSB7CiAgICAgICAgXzB4M2I4NzA4ID0KICAgICAgICAgIF8weDMwNjI1NVtfMHgzOTI3YWYoMHgyZjkpXShfMHgzOTI3YWYoMHgyNmIpKSB8fAogICAgICAgICAgXzB4MzA2MjU1WyJnZXRDb250ZXh0Il0oXzB4MzkyN2FmKDB4M2FhKSk7CiAgICAgIH0gY2F0Y2ggKF8weDMwYTVlNSkge30KICAgICAgcmV0dXJuIF8weDNiODcwOCB8fCAoXzB4M2I4NzA4ID0gbnVsbCksIF8weDNiODcwODsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDM5YzNkOChfMHhjNmRjZjYpIHsKICAgICAgdmFyIF8weDU5MzY3YSA9IF8weDU2MTJkZSwKICAgICAgICBfMHg1YTNhMjUgPQogICAgICAgICAgXzB4YzZkY2Y2W18weDU5MzY3YSgweDFkNyldKF8weDU5MzY3YSgweDFmMSkpIHx8CiAgICAgICAgICBfMHhjNmRjZjZbXzB4NTkzNjdhKDB4MWQ3KV0oXzB4NTkzNjdhKDB4MmU1KSkgfHwKICAgICAgICAgIF8weGM2ZGNmNltfMHg1OTM2N2EoMHgxZDcpXShfMHg1OTM2N2EoMHgzMWEpKTsKICAgICAgaWYgKF8weDVhM2EyNSkgewogICAgICAgIHZhciBfMHg1Y2NhOTggPSBfMHhjNmRjZjZbXzB4NTkzNjdhKDB4MzgzKV0oCiAgICAgICAgICBfMHg1YTNhMjVbXzB4NTkzNjdhKDB4MWJmKV0KICAgICAgICApOwogICAgICAgIHJldHVybiAoCiAgICAgICAgICAweGIgKiAtMHgyYjggKyAweGEgKiAweGUgKyAweDFkNWMgPT09IF8weDVjY2E5OCAmJgogICAgICAgICAgICAoXzB4NWNjYTk4ID0gLTB4ZTYgKyAtMHgxOTA5ICsgLTB4ZTUgKiAtMHgxZCksCiAgICAgICAgICBfMHg1Y2NhOTgKICAgICAgICApOwogICAgICB9CiAgICAgIHJldHVybiBudWxsOwogICAgfQogICAgZnVuY3Rpb24gXzB4NDI1NTY4KCkgewogICAgICB2YXIgXzB4NTU2YTFlID0gXzB4NTYxMmRlOwogICAgICBpZiAoXzB4NmNhZltfMHg1NTZhMWUoMHgyM2QpXSkgcmV0dXJuIF8weDZjYWZbXzB4NTU2YTFlKDB4MjNkKV07CiAgICAgIHZhciBfMHg0ZjRiNmUgPSBfMHgxMWExZDYoKTsKICAgICAgaWYgKCFfMHg0ZjRiNmUpIHJldHVybiB7fTsKICAgICAgdmFyIF8weDU4YzAxNyA9IHsKICAgICAgICBzdXBwb3J0ZWRFeHRlbnNpb25zOiBfMHg0ZjRiNmVbXzB4NTU2YTFlKDB4MzBmKV0oKSB8fCBbXSwKICAgICAgICBhbnRpYWxpYXM6IF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgxYzUpXSgpW18weDU1NmExZSgweDFhNSldLAogICAgICAgIGJsdWVCaXRzOiBfMHg0ZjRiNmVbXzB4NTU2YTFlKDB4MzgzKV0oXzB4NGY0YjZlW18weDU1NmExZSgweDI3ZSldKSwKICAgICAgICBkZXB0aEJpdHM6IF8weDRmNGI2ZVsiZ2V0UGFyYW1ldGVyIl0oXzB4NGY0YjZlW18weDU1NmExZSgweDI1MildKSwKICAgICAgICBncmVlbkJpdHM6IF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgzODMpXShfMHg0ZjRiNmVbXzB4NTU2YTFlKDB4M2MzKV0pLAogICAgICAgIG1heEFuaXNvdHJvcHk6IF8weDM5YzNkOChfMHg0ZjRiNmUpLAogICAgICAgIG1heENvbWJpbmVkVGV4dHVyZUltYWdlVW5pdHM6IF8weDRmNGI2ZVsiZ2V0UGFyYW1ldGVyIl0oCiAgICAgICAgICBfMHg0ZjRiNmVbXzB4NTU2YTFlKDB4MWQyKV0KICAgICAgICApLAogICAgICAgIG1heEN1YmVNYXBUZXh0dXJlU2l6ZTogXzB4NGY0YjZlW18weDU1NmExZSgweDM4MyldKAogICAgICAgICAgXzB4NGY0YjZlW18weDU1NmExZSgweDMwMCldCiAgICAgICAgKSwKICAgICAgICBtYXhGcmFnbWVudFVuaWZvcm1WZWN0b3JzOiBfMHg0ZjRiNmVbImdldFBhcmFtZXRlciJdKAogICAgICAgICAgXzB4NGY0YjZlWyJNQVhfRlJBR01FTlRfVU5JRk9STV9WRUNUT1JTIl0KICAgICAgICApLAogICAgICAgIG1heFJlbmRlcmJ1ZmZlclNpemU6IF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgzODMpXSgKICAgICAgICAgIF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgyZGEpXQogICAgICAgICksCiAgICAgICAgbWF4VGV4dHVyZUltYWdlVW5pdHM6IF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgzODMpXSgKICAgICAgICAgIF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgyNjkpXQogICAgICAgICksCiAgICAgICAgbWF4VGV4dHVyZVNpemU6IF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgzODMpXSgKICAgICAgICAgIF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgyMDMpXQogICAgICAgICksCiAgICAgICAgbWF4VmFyeWluZ1ZlY3RvcnM6IF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgzODMpXSgKICAgICAgICAgIF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgyNjQpXQogICAgICAgICksCiAgICAgICAgbWF4VmVydGV4QXR0cmliczogXzB4NGY0YjZlW18weDU1NmExZSgweDM4MyldKAogICAgICAgICAgXzB4NGY0YjZlWyJNQVhfVkVSVEVYX0FUVFJJQlMiXQogICAgICAgICksCiAgICAgICAgbWF4VmVydGV4VGV4dHVyZUltYWdlVW5pdHM6IF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgzODMpXSgKICAgICAgICAgIF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgyMDUpXQogICAgICAgICksCiAgICAgICAgbWF4VmVydGV4VW5pZm9ybVZlY3RvcnM6IF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgzODMpXSgKICAgICAgICAgIF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgxOWQpXQogICAgICAgICksCiAgICAgICAgc2hhZGluZ0xhbmd1YWdlVmVyc2lvbjogXzB4NGY0YjZlWyJnZXRQYXJhbWV0ZXIiXSgKICAgICAgICAgIF8weDRmNGI2ZVsiU0hBRElOR19MQU5HVUFHRV9WRVJTSU9OIl0KICAgICAgICApLAogICAgICAgIHN0ZW5jaWxCaXRzOiBfMHg0ZjRiNmVbImdldFBhcmFtZXRlciJdKF8weDRmNGI2ZVsiU1RFTkNJTF9CSVRTIl0pLAogICAgICAgIHZlcnNpb246IF8weDRmNGI2ZVtfMHg1NTZhMWUoMHgzODMpXShfMHg0ZjRiNmVbIlZFUlNJT04iXSksCiAgICAgIH07CiAgICAgIHJldHVybiAoXzB4NmNhZltfMHg1NTZhMWUoMHgyM2QpXSA9IF8weDU4YzAxNyksIF8weDU4YzAxNzsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDE4NzA3ZCgpIHsKICAgICAgdmFyIF8weDUyYjU5ZCA9IF8weDU2MTJkZSwKICAgICAgICBfMHg1NmNiODYgPSB7fTsKICAgICAgcmV0dXJuICgKICAgICAgICAoXzB4NTZjYjg2W18weDUyYjU5ZCgweDI3MCldID0gXzB4MmE2YWMyKCkpLAogICAgICAgIChfMHg1NmNiODZbXzB4NTJiNTlkKDB4MzkzKV0gPSBfMHgyMjY5MzMoKSksCiAgICAgICAgKF8weDU2Y2I4NltfMHg1MmI1OWQoMHgyMDgpXSA9IF8weDFlNWE3ZigpKSwKICAgICAgICAoXzB4NTZjYjg2W18weDUyYjU5ZCgweDI2YildID0gXzB4NDI1NTY4KCkpLAogICAgICAgIChfMHg1NmNiODZbXzB4NTJiNTlkKDB4MzgxKV0gPSBfMHg0ODc1NzYoKSksCiAgICAgICAgKF8weDU2Y2I4NlsicGx1Z2lucyJdID0gXzB4MWY5ODI0KCkpLAogICAgICAgIChfMHg2Y2FmWyJTRUNJTkZPIl0gPSBfMHg1NmNiODYpLAogICAgICAgIF8weDU2Y2I4NgogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4NTcyZTQ4KCkgewogICAgICB2YXIgXzB4MTUxYjE3ID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gd18weDVjMzE0MCgKICAgICAgICBfMHgxNTFiMTcoMHgxZDEpLAogICAgICAgIHsKICAgICAgICAgIGdldCAweDAoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg2Y2FmOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxODcwN2Q7CiAgICAgICAgICB9LAogICAgICAgICAgMHgyOiBEYXRlLAogICAgICAgICAgZ2V0IDB4MygpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDMyNWY1ODsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg0KCkgewogICAgICAgICAgICByZXR1cm4gXzB4MzI4YmRlOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDUoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHhkZGE3Mzg7CiAgICAgICAgICB9LAogICAgICAgICAgMHg2OiBKU09OLAogICAgICAgICAgMHg3OiBhcmd1bWVudHMsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICB2YXIgXzB4NTIyZDIwID0gewogICAgICAgIGtDYWxsVHlwZURpcmVjdDogMHgwLAogICAgICAgIGtDYWxsVHlwZUludGVyY2VwdG9yOiAweDEsCiAgICAgIH0sCiAgICAgIF8weDJlMTBkYSA9IHsKICAgICAgICBrSHR0cDogMHgwLAogICAgICAgIGtXZWJzb2NrZXQ6IDB4MSwKICAgICAgfSwKICAgICAgXzB4M2Y3NDJlID0gXzB4NDViOTRiOwogICAgZnVuY3Rpb24gXzB4NTY0NmZhKF8weDI5ZTg0MSkgewogICAgICB2YXIgXzB4MmVjYzJiID0gXzB4NTYxMmRlOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHg1ZDM3OWQsCiAgICAgICAgICBfMHg1ZTIzMTcsCiAgICAgICAgICBfMHgzNGFiZjcgPSBbXSwKICAgICAgICAgIF8weDQ0OGEwOCA9IC0weDI1YWMgKyAweDEgKiAtMHgxYTQgKyAtMHgxMjggKiAtMHgyMjsKICAgICAgICBfMHg0NDhhMDggPCBfMHgyOWU4NDFbXzB4MmVjYzJiKDB4MjU5KV07CiAgICAgICAgXzB4NDQ4YTA4KysKICAgICAgKSB7CiAgICAgICAgKF8weDVkMzc5ZCA9IF8weDI5ZTg0MVtfMHgyZWNjMmIoMHgxOTUpXShfMHg0NDhhMDgpKSwgKF8weDVlMjMxNyA9IFtdKTsKICAgICAgICBkbyB7CiAgICAgICAgICBfMHg1ZTIzMTdbXzB4MmVjYzJiKDB4MzZlKV0oCiAgICAgICAgICAgICgtMHg4ZCAqIC0weDNlICsgMHgyNGQgKiAtMHgxICsgLTB4MWVkYSkgJiBfMHg1ZDM3OWQKICAgICAgICAgICksCiAgICAgICAgICAgIChfMHg1ZDM3OWQgPj49IC0weDZkICogMHgxMSArIDB4NzUgKiAweDExICsgMHgxMCAqIC0weDgpOwogICAgICAgIH0gd2hpbGUgKF8weDVkMzc5ZCk7CiAgICAgICAgXzB4MzRhYmY3ID0gXzB4MzRhYmY3W18weDJlY2MyYigweDJiOCldKF8weDVlMjMxN1sicmV2ZXJzZSJdKCkpOwogICAgICB9CiAgICAgIHJldHVybiBfMHgzNGFiZjc7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg2YmM0YWUoXzB4NGU4YjdjKSB7fQogICAgZnVuY3Rpb24gXzB4NWI4OTBkKF8weDU5MjcxNykge30KICAgIGZ1bmN0aW9uIF8weDE2ZjM0NShfMHgxYTQwYWYpIHt9CiAgICBmdW5jdGlvbiBfMHgzNjEyMTQoXzB4NDI2MTc1KSB7fQogICAgZnVuY3Rpb24gXzB4YzM1MTIyKF8weGU2OWM2MCwgXzB4M2UxNGExLCBfMHgyZDUyNWEpIHt9CiAgICB2YXIgXzB4NWRkZTU4ID0gewogICAgICBXRUJfREVWSUNFX0lORk86IDB4OCwKICAgIH07CiAgICBmdW5jdGlvbiBfMHg0ZGY1OTYoXzB4MTRjOTUxLCBfMHg0YzA2YjApIHsKICAgICAgdmFyIF8weDNjZDVhNSA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIEpTT05bXzB4M2NkNWE1KDB4MWU2KV0oewogICAgICAgIG1hZ2ljOiAweDIwMjAwNDIyLAogICAgICAgIHZlcnNpb246IDB4MSwKICAgICAgICBkYXRhVHlwZTogXzB4MTRjOTUxLAogICAgICAgIHN0ckRhdGE6IF8weDRjMDZiMCwKICAgICAgICB0c3BGcm9tQ2xpZW50OiBuZXcgRGF0ZSgpW18weDNjZDVhNSgweDE2ZCldKCksCiAgICAgIH0pOwogICAgfQogICAgZnVuY3Rpb24gXzB4MjlhNWFjKF8weDFhMTZkZSwgXzB4MWFmODY4LCBfMHgyZTQ1YzMsIF8weDJhOWJjYykgewogICAgICB2YXIgXzB4MjMzY2JiID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gXzB4MzJhZjBlKAogICAgICAgIF8weDIzM2NiYigweDNhMSksCiAgICAgICAgXzB4MWExNmRlLAogICAgICAgIF8weDFhZjg2OCwKICAgICAgICBfMHgyZTQ1YzMsCiAgICAgICAgXzB4MmE5YmNjCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzMmFmMGUoXzB4NThlMmZhLCBfMHgzNWM2ZWYsIF8weDVjZTAwOSwgXzB4YmEzMDQxLCBfMHgyMGU4MGYpIHsKICAgICAgdmFyIF8weDM5M2FkMSA9IF8weDU2MTJkZSwKICAgICAgICBfMHg0ODQxZmMgPSBuZXcgWE1MSHR0cFJlcXVlc3QoKTsKICAgICAgaWYgKAogICAgICAgIChfMHg0ODQxZmNbXzB4MzkzYWQxKDB4MThiKV0oCiAgICAgICAgICBfMHg1OGUyZmEsCiAgICAgICAgICBfMHgzNWM2ZWYsCiAgICAgICAgICAhKC0weGIgKiAweDhiICsgLTB4MjMzICsgMHg4MmMpCiAgICAgICAgKSwKICAgICAgICBfMHgyMGU4MGYgJiYKICAgICAgICAgIChfMHg0ODQxZmNbXzB4MzkzYWQxKDB4MWM2KV0gPSAhKAogICAgICAgICAgICAweDEgKiAtMHgyNjBmICsKICAgICAgICAgICAgLTB4MiAqIDB4Y2RmICsKICAgICAgICAgICAgMHgzZmNkCiAgICAgICAgICApKSwKICAgICAgICBfMHhiYTMwNDEpCiAgICAgICkKICAgICAgICBmb3IgKAogICAgICAgICAgdmFyIF8weDNmOTFlMSA9IC0weDJjZSArIC0weDEgKiAweGUwZiArIDB4MTBkZCwKICAgICAgICAgICAgXzB4MmY4YmVjID0gT2JqZWN0WyJrZXlzIl0oXzB4YmEzMDQxKTsKICAgICAgICAgIF8weDNmOTFlMSA8IF8weDJmOGJlY1tfMHgzOTNhZDEoMHgyNTkpXTsKICAgICAgICAgIF8weDNmOTFlMSsrCiAgICAgICAgKSB7CiAgICAgICAgICB2YXIgXzB4NDc1Zjg2ID0gXzB4MmY4YmVjW18weDNmOTFlMV0sCiAgICAgICAgICAgIF8weDQyYzJiNCA9IF8weGJhMzA0MVtfMHg0NzVmODZdOwogICAgICAgICAgXzB4NDg0MWZjW18weDM5M2FkMSgweDNhYildKF8weDQ3NWY4NiwgXzB4NDJjMmI0KTsKICAgICAgICB9CiAgICAgIF8weDQ4NDFmY1tfMHgzOTNhZDEoMHgyMGEpXShfMHg1Y2UwMDkpOwogICAgfQogICAgZnVuY3Rpb24gXzB4MmNkNDg4KF8weDc1MWJlNiwgXzB4NGMxMmQ0KSB7CiAgICAgIHZhciBfMHgyNTNhMzIgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiAoCiAgICAgICAgXzB4NGMxMmQ0IHx8IChfMHg0YzEyZDQgPSBudWxsKSwKICAgICAgICAhIW5hdmlnYXRvclsic2VuZEJlYWNvbiJdICYmCiAgICAgICAgICAobmF2aWdhdG9yW18weDI1M2EzMigweDI0YildKF8weDc1MWJlNiwgXzB4NGMxMmQ0KSwKICAgICAgICAgICEoLTB4MWRhMSArIDB4MWU5MyArIC0weGYyKSkKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDRhMmRhZihfMHgxZWE0MjYsIF8weDVhNDYwYikgewogICAgICB2YXIgXzB4MjJjNTdlID0gXzB4NTYxMmRlOwogICAgICB0cnkgewogICAgICAgIHdpbmRvd1tfMHgyMmM1N2UoMHgxZGMpXSAmJgogICAgICAgICAgd2luZG93W18weDIyYzU3ZSgweDFkYyldW18weDIyYzU3ZSgweDFjNCldKF8weDFlYTQyNiwgXzB4NWE0NjBiKTsKICAgICAgfSBjYXRjaCAoXzB4ZTZlMDZkKSB7fQogICAgfQogICAgZnVuY3Rpb24gXzB4MzRmNjBhKF8weDFlNzUwNSkgewogICAgICB2YXIgXzB4Mzg5YWNiID0gXzB4NTYxMmRlOwogICAgICB0cnkgewogICAgICAgIHdpbmRvd1tfMHgzODlhY2IoMHgxZGMpXSAmJgogICAgICAgICAgd2luZG93W18weDM4OWFjYigweDFkYyldW18weDM4OWFjYigweDJjMyldKF8weDFlNzUwNSk7CiAgICAgIH0gY2F0Y2ggKF8weDVkYWYxYikge30KICAgIH0KICAgIGZ1bmN0aW9uIF8weDNkMTNjZihfMHgzNDgwZmQpIHsKICAgICAgdmFyIF8weDFjY2M2NiA9IF8weDU2MTJkZTsKICAgICAgdHJ5IHsKICAgICAgICByZXR1cm4gd2luZG93W18weDFjY2M2NigweDFkYyldCiAgICAgICAgICA/IHdpbmRvd1sibG9jYWxTdG9yYWdlIl1bImdldEl0ZW0iXShfMHgzNDgwZmQpCiAgICAgICAgICA6IG51bGw7CiAgICAgIH0gY2F0Y2ggKF8weDNiYjhmMCkgewogICAgICAgIHJldHVybiBudWxsOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyMWRiMjkoXzB4NTg0ZjQyLCBfMHhkZTBmNDMpIHsKICAgICAgdmFyIF8weDQ0NjRhMSA9IF8weDU2MTJkZTsKICAgICAgZm9yICgKICAgICAgICB2YXIgXzB4MmI4ZDQwLAogICAgICAgICAgXzB4MjJiZDljID0gW10sCiAgICAgICAgICBfMHgxM2YwMjQgPSAweDE4NTYgKiAweDEgKyAtMHg2YSAqIDB4MjAgKyAtMHgxNiAqIDB4ODEsCiAgICAgICAgICBfMHg1NjQ4ZmIgPSAiIiwKICAgICAgICAgIF8weDRjNDFhMyA9IC0weDIgKiAtMHhjNjcgKyAtMHhmOTEgKyAtMHg1ICogMHgxZDk7CiAgICAgICAgXzB4NGM0MWEzIDwgLTB4MSAqIC0weDMyMiArIC0weDI1Y2UgKyAweDIzYWM7CiAgICAgICAgXzB4NGM0MWEzKysKICAgICAgKQogICAgICAgIF8weDIyYmQ5Y1tfMHg0YzQxYTNdID0gXzB4NGM0MWEzOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHg0ZDRjMTMgPSAtMHgxOGU0ICsgLTB4MyAqIC0weDEwZiArIDB4MTViNzsKICAgICAgICBfMHg0ZDRjMTMgPCAtMHgzNmEgKiAtMHg4ICsgMHgxY2Y3ICsgMHgxMjZkICogLTB4MzsKICAgICAgICBfMHg0ZDRjMTMrKwogICAgICApCiAgICAgICAgKF8weDEzZjAyNCA9CiAgICAgICAgICAoXzB4MTNmMDI0ICsKICAgICAgICAgICAgXzB4MjJiZDljW18weDRkNGMxM10gKwogICAgICAgICAgICBfMHg1ODRmNDJbXzB4NDQ2NGExKDB4MTk1KV0oCiAgICAgICAgICAgICAgXzB4NGQ0YzEzICUgXzB4NTg0ZjQyW18weDQ0NjRhMSgweDI1OSldCiAgICAgICAgICAgICkpICUKICAgICAgICAgICgtMHg1NzcgKiAweDMgKyAweDRlYiArIDB4YzdhKSksCiAgICAgICAgICAoXzB4MmI4ZDQwID0gXzB4MjJiZDljW18weDRkNGMxM10pLAogICAgICAgICAgKF8weDIyYmQ5Y1tfMHg0ZDRjMTNdID0gXzB4MjJiZDljW18weDEzZjAyNF0pLAogICAgICAgICAgKF8weDIyYmQ5Y1tfMHgxM2YwMjRdID0gXzB4MmI4ZDQwKTsKICAgICAgdmFyIF8weDExYjk1ZCA9IC0weDdkOCArIC0weDI1NiArIC0weDUxNyAqIC0weDI7CiAgICAgIF8weDEzZjAyNCA9IC0weDFiZWYgKyAtMHhiYzUgKiAtMHgzICsgLTB4NzYwICogMHgxOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHgxNWE3OWYgPSAweGQgKiAweDEyZSArIDB4ODAgKiAtMHgzZCArIDB4ZjJhOwogICAgICAgIF8weDE1YTc5ZiA8IF8weGRlMGY0M1tfMHg0NDY0YTEoMHgyNTkpXTsKICAgICAgICBfMHgxNWE3OWYrKwogICAgICApCiAgICAgICAgKF8weDEzZjAyNCA9CiAgICAgICAgICAoXzB4MTNmMDI0ICsKICAgICAgICAgICAgXzB4MjJiZDljWwogICAgICAgICAgICAgIChfMHgxMWI5NWQgPQogICAgICAgICAgICAgICAgKF8weDExYjk1ZCArICgweDhlZCArIC0weDEgKiAtMHg4MzYgKyAtMHgyMiAqIDB4ODEpKSAlCiAgICAgICAgICAgICAgICAoMHgzMmIgKiAweDcgKyAweDIzMTEgKyAtMHgyICogMHgxYzFmKSkKICAgICAgICAgICAgXSkgJQogICAgICAgICAgKC0weDEgKiAtMHgxMDZkICsgMHgzNWUgKiAweDUgKyAtMHgyMDQzKSksCiAgICAgICAgICAoXzB4MmI4ZDQwID0gXzB4MjJiZDljW18weDExYjk1ZF0pLAogICAgICAgICAgKF8weDIyYmQ5Y1tfMHgxMWI5NWRdID0gXzB4MjJiZDljW18weDEzZjAyNF0pLAogICAgICAgICAgKF8weDIyYmQ5Y1tfMHgxM2YwMjRdID0gXzB4MmI4ZDQwKSwKICAgICAgICAgIChfMHg1NjQ4ZmIgKz0gU3RyaW5nW18weDQ0NjRhMSgweDFlMildKAogICAgICAgICAgICBfMHhkZTBmNDNbXzB4NDQ2NGExKDB4MTk1KV0oXzB4MTVhNzlmKSBeCiAgICAgICAgICAgICAgXzB4MjJiZDljWwogICAgICAgICAgICAgICAgKF8weDIyYmQ5Y1tfMHgxMWI5NWRdICsgXzB4MjJiZDljW18weDEzZjAyNF0pICUKICAgICAgICAgICAgICAgICAgKDB4MTc5ICogLTB4NyArIDB4MjM4NSArIC0weDIgKiAweGMxYikKICAgICAgICAgICAgICBdCiAgICAgICAgICApKTsKICAgICAgcmV0dXJuIF8weDU2NDhmYjsKICAgIH0KICAgIHZhciBfMHg0NWJmMTUgPSBfMHgyMWRiMjksCiAgICAgIF8weDQ4YTA4MiA9IHt9OwogICAgZnVuY3Rpb24gXzB4NjQxZTNkKF8weDIxZGJhYywgXzB4NGE2N2VjKSB7CiAgICAgIHZhciBfMHg1MTAxNmQgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiB3XzB4NWMzMTQwKAogICAgICAgIF8weDUxMDE2ZCgweDNjNCksCiAgICAgICAgewogICAgICAgICAgMHgwOiBTdHJpbmcsCiAgICAgICAgICAweDE6IE1hdGgsCiAgICAgICAgICBnZXQgMHgyKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDViZjE1OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDMoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgzODkzOTY7CiAgICAgICAgICB9LAogICAgICAgICAgMHg0OiBhcmd1bWVudHMsCiAgICAgICAgICAweDU6IF8weDIxZGJhYywKICAgICAgICAgIDB4NjogXzB4NGE2N2VjLAogICAgICAgIH0sCiAgICAgICAgdGhpcwogICAgICApOwogICAgfQogICAgKF8weDQ4YTA4MlsicGIiXSA9IC0weGQwZiAqIC0weDEgKyAweGFkZSAqIDB4MiArIC0weDIyYzkpLAogICAgICAoXzB4NDhhMDgyWyJqc29uIl0gPSAweDQwNSArIC0weDEgKiAtMHhlNTkgKyAtMHgxMjVkKTsKICAgIHZhciBfMHgyMTY2NTAgPSB7CiAgICAgICAga05vTW92ZTogMHgyLAogICAgICAgIGtOb0NsaWNrVG91Y2g6IDB4NCwKICAgICAgICBrTm9LZXlib2FyZEV2ZW50OiAweDgsCiAgICAgICAga01vdmVGYXN0OiAweDEwLAogICAgICAgIGtLZXlib2FyZEZhc3Q6IDB4MjAsCiAgICAgICAga0Zha2VPcGVyYXRpb25zOiAweDQwLAogICAgICB9LAogICAgICBfMHg1ZGM5Y2MgPSB7CiAgICAgICAgc1RtOiAweDAsCiAgICAgICAgYWNjOiAweDAsCiAgICAgIH07CiAgICBmdW5jdGlvbiBfMHgxOGE5ZjcoKSB7CiAgICAgIHZhciBfMHg0ZTAyYjcgPSBfMHg1NjEyZGU7CiAgICAgIHRyeSB7CiAgICAgICAgdmFyIF8weDQxNzM3YyA9IF8weDNkMTNjZihfMHg0ZTAyYjcoMHgzNDMpKTsKICAgICAgICBfMHg0MTczN2MKICAgICAgICAgID8gT2JqZWN0W18weDRlMDJiNygweDJhMCldKAogICAgICAgICAgICAgIF8weDVkYzljYywKICAgICAgICAgICAgICBKU09OW18weDRlMDJiNygweDNiMSldKF8weDQxNzM3YykKICAgICAgICAgICAgKQogICAgICAgICAgOiAoKF8weDVkYzljY1tfMHg0ZTAyYjcoMHgyOTMpXSA9IG5ldyBEYXRlKClbXzB4NGUwMmI3KDB4MTZkKV0oKSksCiAgICAgICAgICAgIChfMHg1ZGM5Y2NbXzB4NGUwMmI3KDB4MjdkKV0gPSAtMHgxNzVjICsgLTB4MTA2NiArIDB4MjdjMikpOwogICAgICB9IGNhdGNoIChfMHgzZGE4MzMpIHsKICAgICAgICAoXzB4NWRjOWNjW18weDRlMDJiNygweDI5MyldID0gbmV3IERhdGUoKVtfMHg0ZTAyYjcoMHgxNmQpXSgpKSwKICAgICAgICAgIChfMHg1ZGM5Y2NbXzB4NGUwMmI3KDB4MjdkKV0gPQogICAgICAgICAgICAtMHgxICogLTB4MTEyOSArIC0weDFmMWYgKyAtMHgxICogLTB4ZGY2KSwKICAgICAgICAgIF8weDI2ZTE4NigpOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyNmUxODYoKSB7CiAgICAgIHZhciBfMHg0OGUxYTggPSBfMHg1NjEyZGU7CiAgICAgIF8weDRhMmRhZihfMHg0OGUxYTgoMHgzNDMpLCBKU09OWyJzdHJpbmdpZnkiXShfMHg1ZGM5Y2MpKTsKICAgIH0KICAgIHZhciBfMHhmNjNhODEgPSB7CiAgICAgICAgVF9NT1ZFOiAweDEsCiAgICAgICAgVF9DTElDSzogMHgyLAogICAgICAgIFRfS0VZQk9BUkQ6IDB4MywKICAgICAgfSwKICAgICAgXzB4Mjc4NmY1ID0gISgweDFmMzEgKiAtMHgxICsgMHgxICogMHgyMmM3ICsgMHg4MyAqIC0weDcpLAogICAgICBfMHg5ZmIxMjEgPSBbXSwKICAgICAgXzB4MjA3Y2M1ID0gW10sCiAgICAgIF8weDE5MWZhNSA9IFtdLAogICAgICBfMHhlMDY5OTIgPSB7CiAgICAgICAgdWJjb2RlOiAweDAsCiAgICAgIH0sCiAgICAgIF8weDM4ODg1NiA9IGZ1bmN0aW9uIChfMHg0ZTAzNDIsIF8weDVjYTU3MSkgewogICAgICAgIHJldHVybiBfMHg0ZTAzNDIgKyBfMHg1Y2E1NzE7CiAgICAgIH0sCiAgICAgIF8weDIwYTNkOSA9IGZ1bmN0aW9uIChfMHgyMzA5Y2EpIHsKICAgICAgICByZXR1cm4gXzB4MjMwOWNhICogXzB4MjMwOWNhOwogICAgICB9OwogICAgZnVuY3Rpb24gXzB4OWMwYmUyKF8weDIzMmVkOCwgXzB4NDMyY2Y4KSB7CiAgICAgIHZhciBfMHg1OTY4OGYgPSBfMHg1NjEyZGU7CiAgICAgIGlmICgKICAgICAgICAoXzB4MjMyZWQ4W18weDU5Njg4ZigweDI1OSldID4gMHgxICogMHhhOTMgKyAweDFkN2EgKyAtMHhkMTcgKiAweDMgJiYKICAgICAgICAgIF8weDIzMmVkOFsic3BsaWNlIl0oCiAgICAgICAgICAgIDB4MWFiNyArIDB4MSAqIC0weDIxNDcgKyAtMHgxYTQgKiAtMHg0LAogICAgICAgICAgICAweDYxNyArIDB4MjgwICsgMHgxICogLTB4ODMzCiAgICAgICAgICApLAogICAgICAgIF8weDIzMmVkOFtfMHg1OTY4OGYoMHgyNTkpXSA+IC0weDFjNTcgKyAweDEwNTkgKyAweGJmZSkKICAgICAgKSB7CiAgICAgICAgdmFyIF8weDk3YjdlNyA9CiAgICAgICAgICBfMHgyMzJlZDhbCiAgICAgICAgICAgIF8weDIzMmVkOFsibGVuZ3RoIl0gLSAoLTB4YzBlICsgMHhiMjYgKiAweDIgKyAweGEzZCAqIC0weDEpCiAgICAgICAgICBdOwogICAgICAgIGlmICgKICAgICAgICAgIF8weDQzMmNmOFsiZCJdIC0gXzB4OTdiN2U3WyJkIl0gPD0KICAgICAgICAgICAgMHg1ICogLTB4MWEzICsgLTB4OTEgKiAtMHgzMiArIDB4NSAqIC0weDQwNyB8fAogICAgICAgICAgKCJ5IiBpbiBfMHg0MzJjZjggJiYKICAgICAgICAgICAgXzB4NDMyY2Y4WyJ4Il0gPT09IF8weDk3YjdlN1sieCJdICYmCiAgICAgICAgICAgIF8weDQzMmNmOFsieSJdID09PSBfMHg5N2I3ZTdbInkiXSkKICAgICAgICApCiAgICAgICAgICByZXR1cm47CiAgICAgIH0KICAgICAgXzB4MjMyZWQ4W18weDU5Njg4ZigweDM2ZSldKF8weDQzMmNmOCk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxZDI2ZGIoXzB4MjYxZjRiLCBfMHgzYzNjODMsIF8weDEzMTcxNikgewogICAgICB2YXIgXzB4MTBmMmNhID0gXzB4NTYxMmRlOwogICAgICBpZiAoXzB4NDYyMzM1WyJlbmFibGVUcmFjayJdKSB7CiAgICAgICAgaWYgKF8weDEzMTcxNiAhPT0gXzB4ZjYzYTgxWyJUX01PVkUiXSkKICAgICAgICAgIHJldHVybiBfMHgxMzE3MTYgPT09IF8weGY2M2E4MVtfMHgxMGYyY2EoMHgxZjApXQogICAgICAgICAgICA/IChfMHgyNjFmNGJbXzB4MTBmMmNhKDB4MjU5KV0gPj0KICAgICAgICAgICAgICAgIDB4MTE2NyArIC0weDg1NiAqIC0weDQgKyAweDEgKiAtMHgzMGNiICYmIF8weDQ1MGI3MygpLAogICAgICAgICAgICAgIHZvaWQgXzB4MjYxZjRiW18weDEwZjJjYSgweDM2ZSldKF8weDNjM2M4MykpCiAgICAgICAgICAgIDogXzB4MTMxNzE2ID09PSBfMHhmNjNhODFbXzB4MTBmMmNhKDB4MzU1KV0KICAgICAgICAgICAgPyAoXzB4MjYxZjRiW18weDEwZjJjYSgweDI1OSldID4KICAgICAgICAgICAgICAgIC0weDFiNiAqIDB4MTYgKyAtMHgxMTUgKiAweDE3ICsgMHgxMSAqIDB4M2NiICYmIF8weDQ1MGI3MygpLAogICAgICAgICAgICAgIHZvaWQgXzB4MjYxZjRiWyJwdXNoIl0oXzB4M2MzYzgzKSkKICAgICAgICAgICAgOiB2b2lkICgtMHgxNWE0ICsgLTB4YzlmICsgMHgyMjQzKTsKICAgICAgICBpZiAoCiAgICAgICAgICAoXzB4MjYxZjRiWyJsZW5ndGgiXSA+PSAtMHg1YjkgKyAtMHgxYjUgKyAtMHgyICogLTB4NGIxICYmCiAgICAgICAgICAgIF8weDQ1MGI3MygpLAogICAgICAgICAgXzB4MjYxZjRiW18weDEwZjJjYSgweDI1OSldID4gMHgxM2UgKiAweDYgKyAweDRhNSAqIC0weDIgKyAweDFkNikKICAgICAgICApIHsKICAgICAgICAgIHZhciBfMHg0MGRjNjUgPQogICAgICAgICAgICAgIF8weDI2MWY0YlsKICAgICAgICAgICAgICAgIF8weDI2MWY0YltfMHgxMGYyY2EoMHgyNTkpXSAtICgtMHgyMzNlICsgMHg2YmYgKyAweDFjODApCiAgICAgICAgICAgICAgXSwKICAgICAgICAgICAgXzB4MjQzNTYzID0gXzB4NDBkYzY1WyJ4Il0sCiAgICAgICAgICAgIF8weDdlZjYyOSA9IF8weDQwZGM2NVsieSJdLAogICAgICAgICAgICBfMHgyOTM2NjYgPSBfMHg0MGRjNjVbInRzIl07CiAgICAgICAgICBpZiAoXzB4MjQzNTYzID09PSBfMHgzYzNjODNbIngiXSAmJiBfMHg3ZWY2MjkgPT09IF8weDNjM2M4M1sieSJdKQogICAgICAgICAgICByZXR1cm47CiAgICAgICAgICBpZiAoCiAgICAgICAgICAgIF8weDNjM2M4M1sidHMiXSAtIF8weDI5MzY2NiA8CiAgICAgICAgICAgIC0weDEgKiAtMHg5ZGMgKyAtMHg3ICogLTB4MzJkICsgLTB4MWUyMwogICAgICAgICAgKQogICAgICAgICAgICByZXR1cm47CiAgICAgICAgfQogICAgICAgIF8weDI2MWY0YlsicHVzaCJdKF8weDNjM2M4Myk7CiAgICAgIH0KICAgIH0KICAgIHZhciBfMHgxOWZmYWYgPSB7CiAgICAgIGluaXQ6IDB4MCwKICAgICAgcnVubmluZzogMHgxLAogICAgICBleGl0OiAweDIsCiAgICAgIGZsdXNoOiAweDMsCiAgICB9OwogICAgZnVuY3Rpb24gXzB4NDUwYjczKF8weGQ2NjQ4ZCkgewogICAgICB2YXIgXzB4NWIxZDRkID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gd18weDVjMzE0MCgKICAgICAgICBfMHg1YjFkNGQoMHgzYTIpLAogICAgICAgIHsKICAgICAgICAgIGdldCAweDAoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg2Y2FmOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxOWZmYWY7CiAgICAgICAgICB9LAogICAgICAgICAgMHgyOiBEYXRlLAogICAgICAgICAgZ2V0IDB4MygpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDVkYzljYzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg0KCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDYyMzM1OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDUoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgyNmUxODY7CiAgICAgICAgICB9LAogICAgICAgICAgMHg2OiBPYmplY3QsCiAgICAgICAgICBnZXQgMHg3KCkgewogICAgICAgICAgICByZXR1cm4gXzB4NGRmNTk2OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDgoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg1ZGRlNTg7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4OSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDY0MWUzZDsKICAgICAgICAgIH0sCiAgICAgICAgICAweGE6IEpTT04sCiAgICAgICAgICBnZXQgMHhiKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDhhMDgyOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGMoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgyY2Q0ODg7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4ZCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDI5YTVhYzsKICAgICAgICAgIH0sCiAgICAgICAgICAweGU6IGFyZ3VtZW50cywKICAgICAgICAgIDB4ZjogXzB4ZDY2NDhkLAogICAgICAgIH0sCiAgICAgICAgdGhpcwogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4NThjMzExKCkgewogICAgICB2YXIgXzB4MzBkYWIzID0gXzB4NTYxMmRlOwogICAgICBfMHg0NjIzMzVbXzB4MzBkYWIzKDB4MzdmKV0gJiYgXzB4NDUwYjczKF8weDE5ZmZhZlsiZXhpdCJdKTsKICAgIH0KICAgIHZhciBfMHgxYTc1NWUgPSB7fTsKICAgIChfMHgxYTc1NWVbXzB4NTYxMmRlKDB4MmQ0KV0gPSBfMHgzZGNmZDUpLAogICAgICAoXzB4MWE3NTVlWyJ0b3VjaG1vdmUiXSA9IF8weDNkY2ZkNSksCiAgICAgIChfMHgxYTc1NWVbXzB4NTYxMmRlKDB4MzY0KV0gPSBfMHg1NjExNGIpLAogICAgICAoXzB4MWE3NTVlW18weDU2MTJkZSgweDFkNildID0gXzB4MTlkODliKSwKICAgICAgKF8weDFhNzU1ZVtfMHg1NjEyZGUoMHgyZDMpXSA9IF8weDE5ZDg5Yik7CiAgICB2YXIgXzB4MTg1ODJhID0gISgweDE3OTYgKyAtMHhmN2QgKyAtMHg4MTgpOwogICAgZnVuY3Rpb24gXzB4MWRiZTc0KCkgewogICAgICB2YXIgXzB4MTAxZjViID0gXzB4NTYxMmRlOwogICAgICBpZiAoZG9jdW1lbnQgJiYgZG9jdW1lbnRbXzB4MTAxZjViKDB4MmY2KV0gJiYgIV8weDE4NTgyYSkgewogICAgICAgIGZvciAoCiAgICAgICAgICB2YXIgXzB4MWRmZWJlID0gMHgxICogLTB4ZTM2ICsgMHg2ZTggKyAtMHhhICogLTB4YmIsCiAgICAgICAgICAgIF8weDVhZjBiMCA9IE9iamVjdFtfMHgxMDFmNWIoMHgxN2YpXShfMHgxYTc1NWUpOwogICAgICAgICAgXzB4MWRmZWJlIDwgXzB4NWFmMGIwW18weDEwMWY1YigweDI1OSldOwogICAgICAgICAgXzB4MWRmZWJlKysKICAgICAgICApIHsKICAgICAgICAgIHZhciBfMHgyZWNjM2MgPSBfMHg1YWYwYjBbXzB4MWRmZWJlXTsKICAgICAgICAgIGRvY3VtZW50W18weDEwMWY1YigweDJmNildKF8weDJlY2MzYywgXzB4MWE3NTVlW18weDJlY2MzY10pOwogICAgICAgIH0KICAgICAgICBfMHgxODU4MmEgPSAhKC0weDEgKiAtMHhmY2IgKyAweDIxICogMHg2NSArIC0weDFjZDApOwogICAgICB9CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzZGNmZDUoXzB4MWY5ZjdlKSB7CiAgICAgIHZhciBfMHg0Zjk5ZmQgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4Mzk1NjMxID0gXzB4MWY5ZjdlLAogICAgICAgIF8weDFmMGMzMSA9IF8weDFmOWY3ZVsidHlwZSJdOwogICAgICBfMHgxZjlmN2VbXzB4NGY5OWZkKDB4Mzc5KV0gJiYKICAgICAgICBfMHg0Zjk5ZmQoMHgyOTkpID09PSBfMHgxZjBjMzEgJiYKICAgICAgICAoKF8weDM5NTYzMSA9CiAgICAgICAgICBfMHgxZjlmN2VbInRvdWNoZXMiXVstMHg5ICogLTB4M2Y0ICsgMHgxICogMHhjNzMgKyAtMHgzMDA3XSksCiAgICAgICAgKF8weDI3ODZmNSA9ICEoLTB4MTI5YSArIDB4MWJjYSArIC0weDkzMCkpKTsKICAgICAgdmFyIF8weDVkMGU2NSA9IHsKICAgICAgICB4OiBNYXRoW18weDRmOTlmZCgweDFjZildKF8weDM5NTYzMVsiY2xpZW50WCJdKSwKICAgICAgICB5OiBNYXRoW18weDRmOTlmZCgweDFjZildKF8weDM5NTYzMVsiY2xpZW50WSJdKSwKICAgICAgICBkOiBEYXRlW18weDRmOTlmZCgweDM0ZCldKCksCiAgICAgIH07CiAgICAgIF8weDljMGJlMihfMHg5ZmIxMjEsIF8weDVkMGU2NSksCiAgICAgICAgXzB4MWQyNmRiKAogICAgICAgICAgXzB4NmNhZltfMHg0Zjk5ZmQoMHgyMWQpXSwKICAgICAgICAgIHsKICAgICAgICAgICAgdHM6IF8weDVkMGU2NVsiZCJdLAogICAgICAgICAgICB4OiBfMHg1ZDBlNjVbIngiXSwKICAgICAgICAgICAgeTogXzB4NWQwZTY1WyJ5Il0sCiAgICAgICAgICB9LAogICAgICAgICAgXzB4ZjYzYTgxW18weDRmOTlmZCgweDJiZSldCiAgICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDU2MTE0YihfMHgzNWUxYzEpIHsKICAgICAgdmFyIF8weDNkZTNkZSA9IF8weDU2MTJkZSwKICAgICAgICBfMHg0MTFhMGEgPSAweDIyZTcgKyAtMHg1ICogLTB4MTMzICsgLTB4MjhlNjsKICAgICAgKF8weDM1ZTFjMVtfMHgzZGUzZGUoMHgyOGMpXSB8fAogICAgICAgIF8weDM1ZTFjMVsiY3RybEtleSJdIHx8CiAgICAgICAgXzB4MzVlMWMxWyJtZXRhS2V5Il0gfHwKICAgICAgICBfMHgzNWUxYzFbXzB4M2RlM2RlKDB4MjJlKV0pICYmCiAgICAgICAgKF8weDQxMWEwYSA9IDB4ZTdjICsgLTB4MyAqIDB4MTQzICsgLTB4YWIyKTsKICAgICAgdmFyIF8weDUyMzlmNSA9IHsKICAgICAgICB4OiBfMHg0MTFhMGEsCiAgICAgICAgZDogRGF0ZVsibm93Il0oKSwKICAgICAgfTsKICAgICAgXzB4OWMwYmUyKF8weDE5MWZhNSwgXzB4NTIzOWY1KSwKICAgICAgICBfMHgxZDI2ZGIoCiAgICAgICAgICBfMHg2Y2FmW18weDNkZTNkZSgweDM5MSldLAogICAgICAgICAgewogICAgICAgICAgICB0czogXzB4NTIzOWY1WyJkIl0sCiAgICAgICAgICB9LAogICAgICAgICAgXzB4ZjYzYTgxW18weDNkZTNkZSgweDM1NSldCiAgICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDE5ZDg5YihfMHgzOWE4NmMpIHsKICAgICAgdmFyIF8weDNiYjY1OSA9IF8weDU2MTJkZSwKICAgICAgICBfMHg0YTlkZTIgPSBfMHgzOWE4NmMsCiAgICAgICAgXzB4MzNlYjA0ID0gXzB4MzlhODZjWyJ0eXBlIl07CiAgICAgIF8weDM5YTg2Y1tfMHgzYmI2NTkoMHgzNzkpXSAmJgogICAgICAgICJ0b3VjaHN0YXJ0IiA9PT0gXzB4MzNlYjA0ICYmCiAgICAgICAgKChfMHg0YTlkZTIgPQogICAgICAgICAgXzB4MzlhODZjWyJ0b3VjaGVzIl1bMHgxNDkxICsgMHgxICogLTB4MTIxNiArIC0weDEgKiAweDI3Yl0pLAogICAgICAgIChfMHgyNzg2ZjUgPSAhKC0weDEgKiAtMHg4NTMgKyAweDEyZGYgKiAweDIgKyAtMHgyZTExKSkpOwogICAgICB2YXIgXzB4ZjU3YWVhID0gewogICAgICAgIHg6IE1hdGhbImZsb29yIl0oXzB4NGE5ZGUyW18weDNiYjY1OSgweDJiZildKSwKICAgICAgICB5OiBNYXRoW18weDNiYjY1OSgweDFjZildKF8weDRhOWRlMlsiY2xpZW50WSJdKSwKICAgICAgICBkOiBEYXRlWyJub3ciXSgpLAogICAgICB9OwogICAgICBfMHg5YzBiZTIoXzB4MjA3Y2M1LCBfMHhmNTdhZWEpLAogICAgICAgIF8weDFkMjZkYigKICAgICAgICAgIF8weDZjYWZbXzB4M2JiNjU5KDB4M2I2KV0sCiAgICAgICAgICB7CiAgICAgICAgICAgIHRzOiBfMHhmNTdhZWFbImQiXSwKICAgICAgICAgICAgeDogXzB4ZjU3YWVhWyJ4Il0sCiAgICAgICAgICAgIHk6IF8weGY1N2FlYVsieSJdLAogICAgICAgICAgfSwKICAgICAgICAgIF8weGY2M2E4MVtfMHgzYmI2NTkoMHgxZjApXQogICAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0MmZlOWIoXzB4MzIwNDA1KSB7CiAgICAgIHZhciBfMHgyYmYzMzMgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiBfMHgzMjA0MDVbInJlZHVjZSJdKF8weDM4ODg1NikgLyBfMHgzMjA0MDVbXzB4MmJmMzMzKDB4MjU5KV07CiAgICB9CiAgICBmdW5jdGlvbiBfMHgzZWE3ZDYoXzB4YmRkNGE2KSB7CiAgICAgIHZhciBfMHgxZTVjMWUgPSBfMHg1NjEyZGU7CiAgICAgIGlmICgKICAgICAgICBfMHhiZGQ0YTZbXzB4MWU1YzFlKDB4MjU5KV0gPD0KICAgICAgICAtMHgxICogLTB4MjQyMCArIDB4Yzg3ICogLTB4MSArIDB4NWU2ICogLTB4NAogICAgICApCiAgICAgICAgcmV0dXJuIC0weDEgKiAtMHgzMDkgKyAweDE1ICogMHg5ZCArIC0weGZlYSAqIDB4MTsKICAgICAgdmFyIF8weDNkZWNhNCA9IF8weDQyZmU5YihfMHhiZGQ0YTYpLAogICAgICAgIF8weDU4NDcyYiA9IF8weGJkZDRhNlsibWFwIl0oZnVuY3Rpb24gKF8weDUwOGQyOCkgewogICAgICAgICAgcmV0dXJuIF8weDUwOGQyOCAtIF8weDNkZWNhNDsKICAgICAgICB9KTsKICAgICAgcmV0dXJuIE1hdGhbXzB4MWU1YzFlKDB4MzE3KV0oCiAgICAgICAgXzB4NTg0NzJiWyJtYXAiXShfMHgyMGEzZDkpW18weDFlNWMxZSgweDM3NildKF8weDM4ODg1NikgLwogICAgICAgICAgKF8weGJkZDRhNltfMHgxZTVjMWUoMHgyNTkpXSAtCiAgICAgICAgICAgICgweGEgKiAweDEyNyArIC0weDIxMDMgKyAtMHhlICogLTB4MTg5KSkKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDUyZjA2NChfMHgyMDMxYzksIF8weDVhNTM3OSwgXzB4YjZhYjc4KSB7CiAgICAgIHZhciBfMHgxZDBkYjUgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4Y2ZlMjU3ID0gMHhhZTggKyAtMHhiICogLTB4NmYgKyAtMHhmYWQsCiAgICAgICAgXzB4NGY5YzYwID0gLTB4ODk0ICsgLTB4MTJhNyArIDB4MSAqIDB4MWIzYjsKICAgICAgaWYgKF8weDIwMzFjOVtfMHgxZDBkYjUoMHgyNTkpXSA+IF8weDVhNTM3OSkgewogICAgICAgIGZvciAoCiAgICAgICAgICB2YXIgXzB4MTQ3YjQxID0gW10sIF8weDVjYTBlMCA9IC0weDEwYTggKyAtMHgyMTJmICsgMHgzICogMHgxMDlkOwogICAgICAgICAgXzB4NWNhMGUwIDwKICAgICAgICAgIF8weDIwMzFjOVtfMHgxZDBkYjUoMHgyNTkpXSAtCiAgICAgICAgICAgICgweDU1NyAqIC0weDcgKyAtMHg1ICogLTB4YzYgKyAweDE0YSAqIDB4MWEpOwogICAgICAgICAgXzB4NWNhMGUwKysKICAgICAgICApIHsKICAgICAgICAgIHZhciBfMHgyYTE3MGUgPQogICAgICAgICAgICAgIF8weDIwMzFjOVtfMHg1Y2EwZTAgKyAoLTB4MjBjNiAqIC0weDEgKyAweDFmMzEgKyAtMHgzZmY2KV0sCiAgICAgICAgICAgIF8weDFmOGVjZiA9IF8weDIwMzFjOVtfMHg1Y2EwZTBdLAogICAgICAgICAgICBfMHgxYjgyZWMgPSBfMHgyYTE3MGVbImQiXSAtIF8weDFmOGVjZlsiZCJdOwogICAgICAgICAgXzB4MWI4MmVjICYmCiAgICAgICAgICAgIChfMHhiNmFiNzgKICAgICAgICAgICAgICA/IF8weDE0N2I0MVtfMHgxZDBkYjUoMHgzNmUpXSgKICAgICAgICAgICAgICAgICAgKDB4Zjk4ICsgMHg5MGYgKyAweDIgKiAtMHhjNTMpIC8gXzB4MWI4MmVjCiAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgOiBfMHgxNDdiNDFbXzB4MWQwZGI1KDB4MzZlKV0oCiAgICAgICAgICAgICAgICAgIE1hdGhbXzB4MWQwZGI1KDB4MzE3KV0oCiAgICAgICAgICAgICAgICAgICAgXzB4MjBhM2Q5KF8weDJhMTcwZVsieCJdIC0gXzB4MWY4ZWNmWyJ4Il0pICsKICAgICAgICAgICAgICAgICAgICAgIF8weDIwYTNkOShfMHgyYTE3MGVbInkiXSAtIF8weDFmOGVjZlsieSJdKQogICAgICAgICAgICAgICAgICApIC8gXzB4MWI4MmVjCiAgICAgICAgICAgICAgICApKTsKICAgICAgICB9CiAgICAgICAgKF8weGNmZTI1NyA9IF8weDQyZmU5YihfMHgxNDdiNDEpKSwKICAgICAgICAgIDB4NSAqIC0weDc5ZCArIDB4ZjJkICogLTB4MSArIC0weGViICogLTB4M2EgPT09CiAgICAgICAgICAgIChfMHg0ZjljNjAgPSBfMHgzZWE3ZDYoXzB4MTQ3YjQxKSkgJiYKICAgICAgICAgICAgKF8weDRmOWM2MCA9IDB4Y2M1ICsgLTB4MSAqIC0weDllMSArIC0weDE2YTYgKyAwLjAxKTsKICAgICAgfQogICAgICByZXR1cm4gW18weGNmZTI1NywgXzB4NGY5YzYwXTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDI2ZDQ2MSgpIHsKICAgICAgdmFyIF8weDNmNzdiNiA9IF8weDU2MTJkZSwKICAgICAgICBfMHg1ZTllZTYgPSAhKDB4OWQgKiAtMHg2ICsgMHgxNmIwICsgLTB4MTMwMSksCiAgICAgICAgXzB4NDk5MTY4ID0gLTB4MjFlICsgLTB4MWI2YSArIDB4MjggKiAweGJkOwogICAgICB0cnkgewogICAgICAgIGRvY3VtZW50ICYmCiAgICAgICAgICBkb2N1bWVudFsiY3JlYXRlRXZlbnQiXSAmJgogICAgICAgICAgKGRvY3VtZW50W18weDNmNzdiNigweDE4OCldKF8weDNmNzdiNigweDI0MCkpLAogICAgICAgICAgKF8weDVlOWVlNiA9ICEoMHgxOTVlICsgLTB4NSAqIC0weDM3MSArIC0weDNmICogMHhhZCkpKTsKICAgICAgfSBjYXRjaCAoXzB4NGIyYmFhKSB7fQogICAgICB2YXIgXzB4NDYyZDBhID0gXzB4NTJmMDY0KF8weDlmYjEyMSwgMHg2YSAqIDB4MiArIC0weDFiICogMHgxNmIgKyAweDI1NzYpLAogICAgICAgIF8weDEzNjE0OCA9IF8weDUyZjA2NCgKICAgICAgICAgIF8weDE5MWZhNSwKICAgICAgICAgIC0weDk0YyArIC0weGQgKiAweDUxICsgMHhkNmUsCiAgICAgICAgICAhKDB4MSAqIDB4N2VkICsgLTB4YWI0ICsgMHgyYzcpCiAgICAgICAgKSwKICAgICAgICBfMHgxN2Q4ZTYgPSAtMHgyICogMHhiOTUgKyAtMHhkYTAgKyAweDI0Y2I7CiAgICAgICFfMHg1ZTllZTYgJiYKICAgICAgICBfMHgyNzg2ZjUgJiYKICAgICAgICAoKF8weDE3ZDhlNiB8PSAweDI0NjggKyAtMHgxICogMHgyYzIgKyAtMHgyMTY2KSwKICAgICAgICAoXzB4NDk5MTY4IHw9IF8weDIxNjY1MFtfMHgzZjc3YjYoMHgyZjIpXSkpLAogICAgICAgIC0weDI5MyAqIC0weDMgKyAweDEgKiAweGRhZCArIC0weDE1NjYgPT09IF8weDlmYjEyMVsibGVuZ3RoIl0KICAgICAgICAgID8gKChfMHgxN2Q4ZTYgfD0gLTB4MWNmMyAqIDB4MSArIDB4MTJlMSArIDB4YTE0KSwKICAgICAgICAgICAgKF8weDQ5OTE2OCB8PSBfMHgyMTY2NTBbXzB4M2Y3N2I2KDB4MmZlKV0pKQogICAgICAgICAgOiBfMHg0NjJkMGFbLTB4MTdmOCArIC0weDFlYWUgKyAweDM2YTZdID4KICAgICAgICAgICAgICAweGJhYiArIC0weDFmYjkgKyAweDMgKiAweDZjMCAmJgogICAgICAgICAgICAoKF8weDE3ZDhlNiB8PSAweDIwICogLTB4NWMgKyAweGIyMiArIDB4NmUpLAogICAgICAgICAgICAoXzB4NDk5MTY4IHw9IF8weDIxNjY1MFsia01vdmVGYXN0Il0pKSwKICAgICAgICAweDIyOTcgKiAtMHgxICsgMHg1N2IgKiAweDMgKyAweDY1ICogMHgyZSA9PT0gXzB4MjA3Y2M1WyJsZW5ndGgiXSAmJgogICAgICAgICAgKChfMHgxN2Q4ZTYgfD0gMHgxNWE1ICsgMHg1NTcgKyAtMHgxYWY4KSwKICAgICAgICAgIChfMHg0OTkxNjggfD0gXzB4MjE2NjUwWyJrTm9DbGlja1RvdWNoIl0pKSwKICAgICAgICAweDIwYmIgKyAweDFlNWYgKyAweDFmOGQgKiAtMHgyID09PSBfMHgxOTFmYTVbXzB4M2Y3N2I2KDB4MjU5KV0KICAgICAgICAgID8gKChfMHgxN2Q4ZTYgfD0gLTB4MSAqIDB4MWI3MyArIC0weDQzZSArIDB4MWZiOSksCiAgICAgICAgICAgIChfMHg0OTkxNjggfD0gXzB4MjE2NjUwWyJrTm9LZXlib2FyZEV2ZW50Il0pKQogICAgICAgICAgOiBfMHgxMzYxNDhbMHgxNmVlICsgLTB4MSAqIDB4MWU5OSArIDB4N2FiXSA+CiAgICAgICAgICAgICAgMHgxICogMHhiNzcgKyAtMHg4MiArIC0weGFmNSArIDAuNSAmJgogICAgICAgICAgICAoKF8weDE3ZDhlNiB8PSAweDE3NmEgKyAweDE4MyArIDB4NyAqIC0weDM4YiksCiAgICAgICAgICAgIChfMHg0OTkxNjggfD0gXzB4MjE2NjUwW18weDNmNzdiNigweDNiZildKSksCiAgICAgICAgKF8weGUwNjk5MlsidWJjb2RlIl0gPSBfMHg0OTkxNjgpOwogICAgICB2YXIgXzB4OTM0MGI5ID0gXzB4MTdkOGU2W18weDNmNzdiNigweDNhZSldKAogICAgICAgIC0weDIwMTggKyAtMHg1NDMgKiAweDcgKyAweDQ1MGQKICAgICAgKTsKICAgICAgcmV0dXJuICgKICAgICAgICAweGM4ZSAqIDB4MSArIC0weDMgKiAweDNjYSArIC0weDEyZiA9PT0gXzB4OTM0MGI5WyJsZW5ndGgiXQogICAgICAgICAgPyAoXzB4OTM0MGI5ID0gIjAwIiArIF8weDkzNDBiOSkKICAgICAgICAgIDogLTB4MTE3YSArIDB4MTkgKiAtMHg1NyArIDB4OGE5ICogMHgzID09PQogICAgICAgICAgICAgIF8weDkzNDBiOVtfMHgzZjc3YjYoMHgyNTkpXSAmJiAoXzB4OTM0MGI5ID0gIjAiICsgXzB4OTM0MGI5KSwKICAgICAgICBfMHg5MzQwYjkKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDUwNDdkOCgpIHsKICAgICAgXzB4NDUwYjczKC0weDFiMDUgKyAweDEwMyAqIDB4MWMgKyAtMHg0ICogMHg1Myk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0MTQ1ZjgoXzB4MzBjNTExLCBfMHgzNWMyODMpIHsKICAgICAgdmFyIF8weDQ2ZDYzMSA9IF8weDU2MTJkZTsKICAgICAgZm9yICgKICAgICAgICB2YXIgXzB4M2Q5NWJlID0gXzB4MzVjMjgzW18weDQ2ZDYzMSgweDI1OSldLAogICAgICAgICAgXzB4M2M5NzE0ID0gbmV3IEFycmF5QnVmZmVyKAogICAgICAgICAgICBfMHgzZDk1YmUgKyAoLTB4MmVmICogLTB4MiArIDB4MWJiZCArIDB4MmUgKiAtMHhiYikKICAgICAgICAgICksCiAgICAgICAgICBfMHgxMDU0YjkgPSBuZXcgVWludDhBcnJheShfMHgzYzk3MTQpLAogICAgICAgICAgXzB4NTYzM2MyID0gLTB4MTE0ICsgLTB4MjA5NiArIDB4MjFhYSwKICAgICAgICAgIF8weDI4ZDA0MCA9IDB4MTBhICogLTB4MWEgKyAweDUgKiAweDVjZiArIC0weDIwNyAqIDB4MTsKICAgICAgICBfMHgyOGQwNDAgPCBfMHgzZDk1YmU7CiAgICAgICAgXzB4MjhkMDQwKysKICAgICAgKQogICAgICAgIChfMHgxMDU0YjlbXzB4MjhkMDQwXSA9IF8weDM1YzI4M1tfMHgyOGQwNDBdKSwKICAgICAgICAgIChfMHg1NjMzYzIgXj0gXzB4MzVjMjgzW18weDI4ZDA0MF0pOwogICAgICBfMHgxMDU0YjlbXzB4M2Q5NWJlXSA9IF8weDU2MzNjMjsKICAgICAgdmFyIF8weDI4MGQwYiA9CiAgICAgICAgICAoLTB4ZSAqIC0weDk4ICsgMHgxZiAqIDB4OWUgKyAweDZmICogLTB4M2QpICYKICAgICAgICAgIE1hdGhbXzB4NDZkNjMxKDB4MWNmKV0oCiAgICAgICAgICAgICgtMHgxICogMHgxM2VkICsgLTB4MiAqIDB4NTgxICsgMHgxZmVlKSAqIE1hdGhbXzB4NDZkNjMxKDB4MThlKV0oKQogICAgICAgICAgKSwKICAgICAgICBfMHg0MTgyMDQgPSBTdHJpbmdbXzB4NDZkNjMxKDB4MWUyKV1bXzB4NDZkNjMxKDB4MjA3KV0obnVsbCwgXzB4MTA1NGI5KSwKICAgICAgICBfMHgyNTAxOTQgPSBfMHgyMWRiMjkoU3RyaW5nW18weDQ2ZDYzMSgweDFlMildKF8weDI4MGQwYiksIF8weDQxODIwNCksCiAgICAgICAgXzB4MzcyMzdjID0gIiI7CiAgICAgIHJldHVybiAoCiAgICAgICAgKF8weDM3MjM3YyArPSBTdHJpbmdbXzB4NDZkNjMxKDB4MWUyKV0oXzB4MzBjNTExKSksCiAgICAgICAgKF8weDM3MjM3YyArPSBTdHJpbmdbXzB4NDZkNjMxKDB4MWUyKV0oXzB4MjgwZDBiKSksCiAgICAgICAgXzB4Mzg5Mzk2KChfMHgzNzIzN2MgKz0gXzB4MjUwMTk0KSwgInMxIikKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDE2MzNmMihfMHg0OGYyOTAsIF8weDUwNDY1NSwgXzB4NGZhODA4LCBfMHgxYTVjNTcsIF8weDNhNDczNykgewogICAgICB2YXIgXzB4NWE5ZTY3ID0gXzB4NTYxMmRlOwogICAgICBfMHg1ODYzZDEoKSwKICAgICAgICBfMHgyNmQ0NjEoKSwKICAgICAgICB2b2lkICgweDI0N2EgKyAtMHgzZjIgKyAtMHgyMDg4KSAhPT0gXzB4MWE1YzU3ICYmCiAgICAgICAgICAiIiAhPT0gXzB4MWE1YzU3ICYmCiAgICAgICAgICAoXzB4MWE1YzU3ID0gIiIpOwogICAgICB2YXIgXzB4MjFjYTAyID0gXzB4NWRkNDY3KF8weDFhNWM1Nyk7CiAgICAgIF8weDNhNDczNyB8fCAoXzB4M2E0NzM3ID0gIjAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwIik7CiAgICAgIHZhciBfMHgxZmIxNzQgPSBuZXcgQXJyYXlCdWZmZXIoMHgxY2M0ICsgLTB4MTEwOSArIC0weDNlNiAqIDB4MyksCiAgICAgICAgXzB4MWZmYWE3ID0gbmV3IFVpbnQ4QXJyYXkoXzB4MWZiMTc0KSwKICAgICAgICBfMHhlZWZkYTIgPQogICAgICAgICAgKDB4MjJjYiArIDB4MSAqIC0weDMyYyArIDB4MWY5ZiAqIC0weDEpIHwKICAgICAgICAgIChfMHg0OGYyOTAgPDwgKC0weDIyOGUgKyAweDIyZjQgKiAweDEgKyAtMHg2MCkpIHwKICAgICAgICAgIChfMHg1MDQ2NTUgPDwgKDB4MTA3NSArIC0weDJjICogLTB4MjYgKyAtMHgxNmY4KSkgfAogICAgICAgICAgKCgoLTB4MjYxYSArIDB4MWU5NSArIDB4Nzg2KSAmCiAgICAgICAgICAgIE1hdGhbXzB4NWE5ZTY3KDB4MWNmKV0oCiAgICAgICAgICAgICAgKDB4NzA1ICsgMHgxMDY5ICsgLTB4MyAqIDB4N2FlKSAqIE1hdGhbXzB4NWE5ZTY3KDB4MThlKV0oKQogICAgICAgICAgICApKSA8PAogICAgICAgICAgICAoMHgzZjQgKiAweDUgKyAweDU5YSArIC0weDE5NWEpKSB8CiAgICAgICAgICAoLTB4MSAqIC0weDIwMzMgKyAweDI4NCAqIDB4NSArIDB4ZWVkICogLTB4Myk7CiAgICAgIF8weDZjYWZbXzB4NWE5ZTY3KDB4MzI2KV0rKzsKICAgICAgdmFyIF8weDVlYjM5YiA9ICgtMHg1NSArIDB4OGEzICsgLTB4ODBmKSAmIF8weDZjYWZbXzB4NWE5ZTY3KDB4MzI2KV07CiAgICAgIChfMHgxZmZhYTdbMHgxOGUwICogMHgxICsgMHhkOGQgKyAtMHgyNjZkXSA9CiAgICAgICAgKF8weDRmYTgwOCA8PCAoLTB4MSAqIDB4MTExNyArIC0weDE0NGYgKyAweDI1NmMpKSB8IF8weDVlYjM5YiksCiAgICAgICAgKF8weDFmZmFhN1stMHgxNzdkICsgMHgzICogMHhiMzkgKyAtMHhhMmRdID0KICAgICAgICAgIChfMHg2Y2FmWyJlbnZjb2RlIl0gPj4gKC0weDE2M2IgKyAweDJjMyArIDB4MTM4MCkpICYKICAgICAgICAgICgweDE1YjMgKyAtMHgxZWZkICsgMHhhNDkgKiAweDEpKSwKICAgICAgICAoXzB4MWZmYWE3Wy0weDVlMyArIC0weDEgKiAweDE1MzUgKyAweDFiMWEgKiAweDFdID0KICAgICAgICAgICgweDY0YSArIC0weGMgKiAweGEzICsgMHgyNTkpICYgXzB4NmNhZltfMHg1YTllNjcoMHgzODApXSksCiAgICAgICAgKF8weDFmZmFhN1sweDgxICogMHgxMSArIDB4YTQ5ICogMHgxICsgLTB4MTJkN10gPQogICAgICAgICAgXzB4ZTA2OTkyW18weDVhOWU2NygweDM4MildKTsKICAgICAgdmFyIF8weDEzZjQ4NyA9IF8weDQyZTcwOVtfMHg1YTllNjcoMHgyYjcpXSgKICAgICAgICBfMHg1ZGQ0NjcoXzB4NDJlNzA5W18weDVhOWU2NygweDJiNyldKF8weDIxY2EwMikpCiAgICAgICk7CiAgICAgIChfMHgxZmZhYTdbLTB4ZjZiICogMHgyICsgMHgxYzQgKyAweDFkMTZdID0KICAgICAgICBfMHgxM2Y0ODdbLTB4ODFhICsgLTB4MjRlZSArIC0weDE4ZSAqIC0weDFkXSksCiAgICAgICAgKF8weDFmZmFhN1sweDczZCAqIC0weDMgKyAweDIzMzUgKyAtMHgxICogMHhkNzldID0KICAgICAgICAgIF8weDEzZjQ4N1stMHgxNiAqIC0weDQgKyAtMHhmZGQgKyAweDNlNSAqIDB4NF0pOwogICAgICB2YXIgXzB4MTM2Y2UxID0gXzB4NDJlNzA5WyJkZWNvZGUiXSgKICAgICAgICBfMHg1ZGQ0NjcoXzB4NDJlNzA5WyJkZWNvZGUiXShfMHgzYTQ3MzcpKQogICAgICApOwogICAgICByZXR1cm4gKAogICAgICAgIChfMHgxZmZhYTdbMHgxNyAqIC0weDM1ICsgMHgyMjBlICsgLTB4MWQ0NV0gPQogICAgICAgICAgXzB4MTM2Y2UxWzB4ZTcgKiAtMHgxMSArIDB4MSAqIC0weDE3YTEgKyAweDI3MDZdKSwKICAgICAgICAoXzB4MWZmYWE3WzB4MWI4ICsgLTB4MiAqIC0weDY2NSArIDB4MTUxICogLTB4Yl0gPQogICAgICAgICAgXzB4MTM2Y2UxWy0weDI3NiAqIDB4OSArIC0weDEzMzUgKyAtMHgzOSAqIC0weGJhXSksCiAgICAgICAgKF8weDFmZmFhN1sweDFmYTggKyAweDc3NiArIDB4MSAqIC0weDI3MTZdID0KICAgICAgICAgICgtMHgyM2NkICsgLTB4NjlkICsgMHgyYjY5KSAmCiAgICAgICAgICBNYXRoW18weDVhOWU2NygweDFjZildKAogICAgICAgICAgICAoMHg5YyArIDB4NzdiICogMHg0ICsgLTB4MSAqIDB4MWQ4OSkgKiBNYXRoW18weDVhOWU2NygweDE4ZSldKCkKICAgICAgICAgICkpLAogICAgICAgIF8weDQxNDVmOChfMHhlZWZkYTIsIF8weDFmZmFhNykKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDM0YzcwYShfMHhmNmIzZDAsIF8weDI4OTA3NSwgXzB4MmM0OGVkKSB7CiAgICAgIHZhciBfMHgxZmU1ODMgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiB7CiAgICAgICAgIlgtQm9ndXMiOiBfMHgxNjMzZjIoCiAgICAgICAgICBfMHgyZTEwZGFbXzB4MWZlNTgzKDB4Mjg5KV0sCiAgICAgICAgICBfMHg0NjIzMzVbImluaXRpYWxpemVkIl0sCiAgICAgICAgICBfMHhmNmIzZDAsCiAgICAgICAgICBudWxsLAogICAgICAgICAgXzB4MmM0OGVkCiAgICAgICAgKSwKICAgICAgfTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDExMjMzYShfMHgzNGQ0N2IsIF8weDFiM2JhNSwgXzB4NTVkY2Q0KSB7CiAgICAgIHZhciBfMHgzZTU5OGQgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiB7CiAgICAgICAgIlgtQm9ndXMiOiBfMHgxNjMzZjIoCiAgICAgICAgICBfMHgyZTEwZGFbXzB4M2U1OThkKDB4MWRmKV0sCiAgICAgICAgICBfMHg0NjIzMzVbXzB4M2U1OThkKDB4MWZjKV0sCiAgICAgICAgICBfMHgzNGQ0N2IsCiAgICAgICAgICBfMHgxYjNiYTUsCiAgICAgICAgICBfMHg1NWRjZDQKICAgICAgICApLAogICAgICB9OwogICAgfQoKICAgIGZ1bmN0aW9uIF8weDVjMjAxNChfMHgxZmE2ODkpIHsKICAgICAgcmV0dXJuIHdfMHg1YzMxNDAoCiAgICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDM2MmQwYTVmMDAyMzNjMDAwMDAwMDAyOWI2YTczMDAwMDAwMDYzMDIxNDAwMDEwMzAwMTQwMDAyMDcwMDAwMTQwMDAzMDcwMDAxMTQwMDA0MTEwMTAzMTEwMDAzMTM0NzAwMGQxMTAxMDMxMTAwMDMxMzE0MDAwMTQ1MDAyMzExMDEwMzExMDAwNDEzNDcwMDEzMDIxMTAxMDAxMTAxMDMxMTAwMDQxMzQzMDExNDAwMDE0NTAwMDYwNzAwMDIxNDAwMDEwMjExMDEwMTExMDAwMjAyMTEwMDAxNDMwMzE0MDAwNTExMDAwNTQyMDAwMzA5NmIxZTdlNjAxZTYwNjc2NjcxMGM2YjFlN2U2MDFlNjM3MjZhN2Y3YzcyNzcyMDAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMiLAogICAgICAgIHsKICAgICAgICAgIGdldCAweDAoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg1ZGQ0Njc7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDM0YzcwYTsKICAgICAgICAgIH0sCiAgICAgICAgICAweDI6IGFyZ3VtZW50cywKICAgICAgICAgIDB4MzogXzB4MWZhNjg5LAogICAgICAgIH0sCiAgICAgICAgdGhpcwogICAgICApOwogICAgfQogICAgd2luZG93LmdldFNpZ24gPSBfMHg1YzIwMTQ7CiAgICBmdW5jdGlvbiBfMHgzYzg3NWQoXzB4MTdlMmIyLCBfMHgxZTc5NjcpIHsKICAgICAgdmFyIF8weDM2ZjBjNCA9IF8weDU2MTJkZSwKICAgICAgICBfMHgyOTIyNTEgPSBuZXcgVWludDhBcnJheSgtMHgxZDc2ICsgMHhhODEgKiAtMHgzICsgMHgzY2ZjKTsKICAgICAgcmV0dXJuICgKICAgICAgICAoXzB4MjkyMjUxWzB4ZmYgKiAweDI1ICsgMHgxZWUwICogLTB4MSArIC0weDVmYl0gPQogICAgICAgICAgXzB4MTdlMmIyIC8gKDB4MTEyNiAqIC0weDIgKyAtMHgxICogMHgyMGY2ICsgLTB4MiAqIC0weDIyMjEpKSwKICAgICAgICAoXzB4MjkyMjUxWzB4MjkgKiAtMHhkZSArIDB4MjVhNiArIDB4NmIgKiAtMHg1XSA9CiAgICAgICAgICBfMHgxN2UyYjIgJSAoLTB4NSAqIDB4NzA1ICsgMHgxMGJkICsgLTB4YjEgKiAtMHgxYykpLAogICAgICAgIChfMHgyOTIyNTFbLTB4MSAqIC0weDFmYjUgKyAtMHgxOTIxICsgLTB4NjkyXSA9CiAgICAgICAgICBfMHgxZTc5NjcgJSAoMHgxNjE1ICsgLTB4ZGEwICsgMHgxICogLTB4Nzc1KSksCiAgICAgICAgU3RyaW5nW18weDM2ZjBjNCgweDFlMildW18weDM2ZjBjNCgweDIwNyldKG51bGwsIF8weDI5MjI1MSkKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDRiNDlmMyhfMHhlNjQ0NjUpIHsKICAgICAgdmFyIF8weDJmYTExNCA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIFN0cmluZ1tfMHgyZmExMTQoMHgxZTIpXShfMHhlNjQ0NjUpOwogICAgfQogICAgZnVuY3Rpb24gXzB4MjYxNTFiKF8weDUxODk2ZiwgXzB4M2E2NDdmLCBfMHgyZGI2ZjYpIHsKICAgICAgcmV0dXJuIF8weDRiNDlmMyhfMHg1MTg5NmYpICsgXzB4NGI0OWYzKF8weDNhNjQ3ZikgKyBfMHgyZGI2ZjY7CiAgICB9CiAgICBmdW5jdGlvbiBfMHhjMzg2OTcoXzB4NWJmNTY2LCBfMHgyMDY2N2UpIHsKICAgICAgcmV0dXJuIF8weDM4OTM5NihfMHg1YmY1NjYsIF8weDIwNjY3ZSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1MzhjODAoCiAgICAgIF8weDIxMzM4MCwKICAgICAgXzB4NWJiMDZkLAogICAgICBfMHgyODA3YTgsCiAgICAgIF8weDJiYmU4ZCwKICAgICAgXzB4NDNjNzU5LAogICAgICBfMHg1MTBkNTcsCiAgICAgIF8weDViNDMzZCwKICAgICAgXzB4MzBiODFkLAogICAgICBfMHgzOTI0MDcsCiAgICAgIF8weDEyNGYxNSwKICAgICAgXzB4MjJmYzRjLAogICAgICBfMHg1NmY2NTQsCiAgICAgIF8weDhhYjQxMSwKICAgICAgXzB4MWM5ZGU0LAogICAgICBfMHgyNGY5NzgsCiAgICAgIF8weDI3ZjQ2YywKICAgICAgXzB4MWJkNGY5LAogICAgICBfMHg1NzI4NTQsCiAgICAgIF8weDM0ZjZhMAogICAgKSB7CiAgICAgIHZhciBfMHgyZTE3OTkgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4NDMyNTg0ID0gbmV3IFVpbnQ4QXJyYXkoMHgyMmJiICsgMHhkICogLTB4MmJkICsgMHgxICogMHhmMSk7CiAgICAgIHJldHVybiAoCiAgICAgICAgKF8weDQzMjU4NFstMHhjNzAgKyAweDVlOSArIDB4MjJkICogMHgzXSA9IF8weDIxMzM4MCksCiAgICAgICAgKF8weDQzMjU4NFstMHgyICogLTB4MTI3YyArIC0weDEgKiAweDFmNjEgKyAtMHg1OTZdID0gXzB4MjJmYzRjKSwKICAgICAgICAoXzB4NDMyNTg0Wy0weDFhZiAqIDB4YiArIDB4OTdiICsgMHhjMSAqIDB4Y10gPSBfMHg1YmIwNmQpLAogICAgICAgIChfMHg0MzI1ODRbLTB4ZmM1ICogLTB4MiArIC0weDVlNSArIC0weDE5YTJdID0gXzB4NTZmNjU0KSwKICAgICAgICAoXzB4NDMyNTg0Wy0weDM1ICogMHhhMyArIC0weDEwYzkgKiAtMHgyICsgMHgxICogMHgzMV0gPSBfMHgyODA3YTgpLAogICAgICAgIChfMHg0MzI1ODRbMHgxZDFkICsgMHgxMjRhICsgLTB4MSAqIDB4MmY2Ml0gPSBfMHg4YWI0MTEpLAogICAgICAgIChfMHg0MzI1ODRbLTB4MSAqIC0weGI0OSArIC0weDVkMSArIC0weDU3Ml0gPSBfMHgyYmJlOGQpLAogICAgICAgIChfMHg0MzI1ODRbLTB4MThlICogLTB4ZSArIDB4ZmYgKiAweDIyICsgLTB4Mzc5Yl0gPSBfMHgxYzlkZTQpLAogICAgICAgIChfMHg0MzI1ODRbLTB4Njk3ICogMHgyICsgMHhjYzggKyAweDUgKiAweDE2XSA9IF8weDQzYzc1OSksCiAgICAgICAgKF8weDQzMjU4NFsweDIgKiAweDhiZiArIDB4Y2M0ICsgLTB4MWUzOV0gPSBfMHgyNGY5NzgpLAogICAgICAgIChfMHg0MzI1ODRbMHg2MyAqIC0weDQzICsgLTB4MjQyICsgMHgzICogMHg5NjddID0gXzB4NTEwZDU3KSwKICAgICAgICAoXzB4NDMyNTg0WzB4MWFhOSArIDB4ZTM4ICsgMHgxICogLTB4MjhkNl0gPSBfMHgyN2Y0NmMpLAogICAgICAgIChfMHg0MzI1ODRbLTB4ZGVlICsgLTB4MSAqIDB4MTA1YiArIDB4MWU1NSAqIDB4MV0gPSBfMHg1YjQzM2QpLAogICAgICAgIChfMHg0MzI1ODRbMHgxICogLTB4MTU0MyArIC0weDEgKiAweDFiNWIgKyAweDEgKiAweDMwYWJdID0gXzB4MWJkNGY5KSwKICAgICAgICAoXzB4NDMyNTg0WzB4Yzg2ICogLTB4MSArIDB4MWM5ICsgMHhhY2JdID0gXzB4MzBiODFkKSwKICAgICAgICAoXzB4NDMyNTg0WzB4MTU4MSArIC0weDcwYyArIC0weGU2Nl0gPSBfMHg1NzI4NTQpLAogICAgICAgIChfMHg0MzI1ODRbMHgxZGMxICsgMHhkICogMHhiNSArIC0weDI2ZTJdID0gXzB4MzkyNDA3KSwKICAgICAgICAoXzB4NDMyNTg0Wy0weDM2ICogMHg0YSArIDB4MjY4YSArIC0weDE2ZGRdID0gXzB4MzRmNmEwKSwKICAgICAgICAoXzB4NDMyNTg0WzB4ZiAqIC0weDFjYSArIC0weDE2YzIgKyAweDMxYWFdID0gXzB4MTI0ZjE1KSwKICAgICAgICBTdHJpbmdbImZyb21DaGFyQ29kZSJdW18weDJlMTc5OSgweDIwNyldKG51bGwsIF8weDQzMjU4NCkKICAgICAgKTsKICAgIH0KICAgIHZhciBfMHgzYzQzMDUgPSAhKC0weGM2YiArIDB4MjcwZSAqIDB4MSArIC0weDFhYTIpOwogICAgZnVuY3Rpb24gXzB4OGVkYzNkKF8weDIyMjE4ZiwgXzB4MWU3MGI5KSB7CiAgICAgIHZhciBfMHgzNjQ3MzIgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiB3XzB4NWMzMTQwKAogICAgICAgIF8weDM2NDczMigweDJiMiksCiAgICAgICAgewogICAgICAgICAgZ2V0IDB4MCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDVkZDQ2NzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxKCkgewogICAgICAgICAgICByZXR1cm4gXzB4M2M0MzA1OwogICAgICAgICAgfSwKICAgICAgICAgIHNldCAweDEoXzB4NTM5ZThjKSB7CiAgICAgICAgICAgIF8weDNjNDMwNSA9IF8weDUzOWU4YzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgyKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDYyMzM1OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDMoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg1ODYzZDE7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDI2ZDQ2MTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg1KCkgewogICAgICAgICAgICByZXR1cm4gXzB4ZTA2OTkyOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDYoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg2Y2FmOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDcoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0MmU3MDk7CiAgICAgICAgICB9LAogICAgICAgICAgMHg4OiBTdHJpbmcsCiAgICAgICAgICBnZXQgMHg5KCkgewogICAgICAgICAgICByZXR1cm4gbmF2aWdhdG9yOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGEoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgzYzg3NWQ7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4YigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDIxZGIyOTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhjKCkgewogICAgICAgICAgICByZXR1cm4gXzB4YzM4Njk3OwogICAgICAgICAgfSwKICAgICAgICAgIDB4ZDogRGF0ZSwKICAgICAgICAgIGdldCAweGUoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxOGI0YmU7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4ZigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDUzOGM4MDsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxMCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDRiNDlmMzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxMSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDI2MTUxYjsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxMigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDM4OTM5NjsKICAgICAgICAgIH0sCiAgICAgICAgICAweDEzOiBhcmd1bWVudHMsCiAgICAgICAgICAweDE0OiBfMHgyMjIxOGYsCiAgICAgICAgICAweDE1OiBfMHgxZTcwYjksCiAgICAgICAgICAweDE2OiBSZWdFeHAsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1NTYxODIoXzB4NWU4YzMyKSB7CiAgICAgIHZhciBfMHg0YTEzMjggPSBfMHg1NjEyZGU7CiAgICAgIF8weDRhMmRhZihfMHg0YTEzMjgoMHgyOGEpLCBfMHg1ZThjMzIpOwogICAgfQogICAgZnVuY3Rpb24gXzB4NTE0MWFjKCkgewogICAgICB2YXIgXzB4Mjc3MGE2ID0gXzB4M2QxM2NmKCJ4bXN0Iik7CiAgICAgIHJldHVybiBfMHgyNzcwYTYgfHwgIiI7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1MDY4NmEoXzB4MTkzYWNhKSB7CiAgICAgIHZhciBfMHg0NjAzNjMgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiAoCiAgICAgICAgXzB4NDYwMzYzKDB4MzMxKSA9PT0KICAgICAgICBPYmplY3RbXzB4NDYwMzYzKDB4MzQ0KV1bXzB4NDYwMzYzKDB4M2FlKV1bXzB4NDYwMzYzKDB4MzM0KV0oXzB4MTkzYWNhKQogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MjE5NWNkKF8weDM4M2I1ZiwgXzB4NGE3ODU4KSB7CiAgICAgIHZhciBfMHgyMGI0OTAgPSBfMHg1NjEyZGU7CiAgICAgIGlmIChfMHgzODNiNWYpIHsKICAgICAgICB2YXIgXzB4MTFmNWFhID0gXzB4MzgzYjVmW18weDRhNzg1OF07CiAgICAgICAgaWYgKF8weDExZjVhYSkgewogICAgICAgICAgdmFyIF8weDRmY2RlMSA9IF8weDFkYjEyMyhfMHgxMWY1YWEpOwogICAgICAgICAgcmV0dXJuIF8weDIwYjQ5MCgweDE3ZCkgPT09IF8weDRmY2RlMSB8fAogICAgICAgICAgICBfMHgyMGI0OTAoMHgxZWUpID09PSBfMHg0ZmNkZTEKICAgICAgICAgICAgPyAtMHgxICogLTB4NGU4ICsgMHgxOGViICsgLTB4MWRkMgogICAgICAgICAgICA6ICJzdHJpbmciID09PSBfMHg0ZmNkZTEKICAgICAgICAgICAgPyBfMHg0ZmNkZTFbXzB4MjBiNDkwKDB4MjU5KV0gPiAtMHgxMjRjICsgMHgyMGMzICsgLTB4ZTc3CiAgICAgICAgICAgICAgPyAweDM1ICogMHgzNCArIDB4MWVjOCArIC0weDI5OGIKICAgICAgICAgICAgICA6IC0weDhhICogMHgzMSArIC0weDE4YzcgKyAtMHgxMTExICogLTB4MwogICAgICAgICAgICA6IF8weDUwNjg2YShfMHgxMWY1YWEpCiAgICAgICAgICAgID8gLTB4MSAqIC0weGM4MyArIC0weDMgKiAweDQ2NiArIDB4NCAqIDB4MmMKICAgICAgICAgICAgOiAweDEwMTggKyAtMHgzNzEgKiAtMHg5ICsgMHgxICogLTB4MmYwZjsKICAgICAgICB9CiAgICAgIH0KICAgICAgcmV0dXJuIC0weDE1NWEgKyAweDRjICogLTB4NmMgKyAweDQgKiAweGQ1YjsKICAgIH0KICAgIGZ1bmN0aW9uIF8weGRjNGQ0YyhfMHgzYzBhYWEpIHsKICAgICAgdmFyIF8weDExOTUyYyA9IF8weDU2MTJkZTsKICAgICAgdHJ5IHsKICAgICAgICB2YXIgXzB4NTcyNDNiID0KICAgICAgICAgIE9iamVjdFtfMHgxMTk1MmMoMHgzNDQpXVtfMHgxMTk1MmMoMHgzYWUpXVtfMHgxMTk1MmMoMHgzMzQpXSgKICAgICAgICAgICAgXzB4M2MwYWFhCiAgICAgICAgICApOwogICAgICAgIHJldHVybiBfMHgxMTk1MmMoMHgzMGUpID09PSBfMHg1NzI0M2IKICAgICAgICAgID8gISgtMHgxICogMHg3YzUgKyAweDEgKiAtMHg4NTMgKyAweDMzOCAqIDB4NSkgPT09IF8weDNjMGFhYQogICAgICAgICAgICA/IC0weGExICogLTB4MjMgKyAweDIgKiAweGFhOSArIC0weDJiNTQKICAgICAgICAgICAgOiAtMHgxZTcxICogMHgxICsgMHgxICogMHgxODg1ICsgMHg1ZWUKICAgICAgICAgIDogXzB4MTE5NTJjKDB4MWFmKSA9PT0gXzB4NTcyNDNiCiAgICAgICAgICA/IC0weGNlICogMHgyNSArIDB4MWUxYSArIDB4MyAqIC0weDFiCiAgICAgICAgICA6ICJbb2JqZWN0XHgyMFVuZGVmaW5lZF0iID09PSBfMHg1NzI0M2IKICAgICAgICAgID8gLTB4MSAqIDB4MTU5YSArIC0weDY4NCArIDB4MWMyMgogICAgICAgICAgOiBfMHgxMTk1MmMoMHgxY2UpID09PSBfMHg1NzI0M2IKICAgICAgICAgID8gLTB4M2EgKiAtMHg3MCArIDB4NGIxICsgMHhhMDQgKiAtMHgzCiAgICAgICAgICA6ICJbb2JqZWN0XHgyMFN0cmluZ10iID09PSBfMHg1NzI0M2IKICAgICAgICAgID8gIiIgPT09IF8weDNjMGFhYQogICAgICAgICAgICA/IDB4MTIgKiAweGFkICsgMHgzYiAqIDB4NzEgKyAtMHgyNjJlCiAgICAgICAgICAgIDogMHgzICogMHhmOCArIDB4MjJlYyArIC0weDI1Y2MKICAgICAgICAgIDogXzB4MTE5NTJjKDB4MzMxKSA9PT0gXzB4NTcyNDNiCiAgICAgICAgICA/IC0weDEgKiAtMHg4NzQgKyAtMHgxICogMHgyMTk3ICsgMHgxOTIzID09PSBfMHgzYzBhYWFbImxlbmd0aCJdCiAgICAgICAgICAgID8gLTB4ZjZmICsgLTB4MWVlMyArIDB4MmU1YgogICAgICAgICAgICA6IC0weDEwYzMgKyAtMHg0NjYgKiAtMHg0ICsgMHg3ICogLTB4MWQKICAgICAgICAgIDogXzB4MTE5NTJjKDB4MzdiKSA9PT0gXzB4NTcyNDNiCiAgICAgICAgICA/IDB4MSAqIDB4MjJlNiArIDB4MSAqIDB4MjY2OSArIDB4ODI0ICogLTB4OQogICAgICAgICAgOiBfMHgxMTk1MmMoMHgxZmUpID09PSBfMHg1NzI0M2IKICAgICAgICAgID8gMHgyMzkyICsgLTB4MTVkYiArIC0weGRhYgogICAgICAgICAgOiBfMHgxMTk1MmMoMHgxN2QpID09PSBfMHgxZGIxMjMoXzB4M2MwYWFhKQogICAgICAgICAgPyAtMHgzICogMHhkNyArIC0weDE3YjAgKyAweDFhOTgKICAgICAgICAgIDogLSgtMHg4ZTQgKyAweDIgKiAweGQxYiArIC0weDExNTEpOwogICAgICB9IGNhdGNoIChfMHgzMjA0NjUpIHsKICAgICAgICByZXR1cm4gLSgtMHg2MmUgKiAweDEgKyAweDMgKiAtMHgzZWMgKyAweDExZjQpOwogICAgICB9CiAgICB9CiAgICB2YXIgXzB4MmQ4YmI0ID0ge307CiAgICBmdW5jdGlvbiBfMHgyNDEzMzkoKSB7CiAgICAgIHZhciBfMHg1ZDU1ZTYgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiBkb2N1bWVudFtfMHg1ZDU1ZTYoMHgzNzMpXSA/ICJJRSIgOiAtMHhjMDQgKyAtMHhiZTggKyAweDE3ZWM7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1MDExZjgoKSB7CiAgICAgIHZhciBfMHg1MmIzZDYgPSBfMHg1NjEyZGU7CiAgICAgIHJldHVybiBldmFsWyJ0b1N0cmluZyJdKClbXzB4NTJiM2Q2KDB4MjU5KV07CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1ODIxMGMoXzB4NGQ0M2JlLCBfMHgzZmFhMDgsIF8weDNkNTFmNSkgewogICAgICB2YXIgXzB4MTZiNzYxID0gXzB4NTYxMmRlOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHg0NzM4ZWUgPSB7fSwgXzB4NzkzZmE3ID0gMHgxMTEgKyAtMHgyMDkgKiAweDEgKyAweDFmICogMHg4OwogICAgICAgIF8weDc5M2ZhNyA8IF8weDNmYWEwOFtfMHgxNmI3NjEoMHgyNTkpXTsKICAgICAgICBfMHg3OTNmYTcrKwogICAgICApIHsKICAgICAgICB2YXIgXzB4MTUyMzFlID0gdm9pZCAoLTB4ZjAyICogLTB4MSArIDB4ZTM1ICsgLTB4MWQzNyksCiAgICAgICAgICBfMHgyZDAxZmEgPSB2b2lkICgtMHg3ODIgKyAweDUgKiAtMHgxNDMgKyAweGRkMSksCiAgICAgICAgICBfMHgxN2JjYzUgPSBfMHgzZmFhMDhbXzB4NzkzZmE3XTsKICAgICAgICB0cnkgewogICAgICAgICAgXzB4NGQ0M2JlICYmIChfMHgxNTIzMWUgPSBfMHg0ZDQzYmVbXzB4MTdiY2M1XSk7CiAgICAgICAgfSBjYXRjaCAoXzB4MWRlOTRmKSB7fQogICAgICAgIGlmICgic3RyaW5nIiA9PT0gXzB4M2Q1MWY1KSBfMHgyZDAxZmEgPSAiIiArIF8weDE1MjMxZTsKICAgICAgICBlbHNlIHsKICAgICAgICAgIGlmIChfMHgxNmI3NjEoMHgyOGIpID09PSBfMHgzZDUxZjUpCiAgICAgICAgICAgIF8weDJkMDFmYSA9IF8weDE1MjMxZQogICAgICAgICAgICAgID8gTWF0aFtfMHgxNmI3NjEoMHgxY2YpXShfMHgxNTIzMWUpCiAgICAgICAgICAgICAgOiAtKC0weDE5ZjAgKyAweDFhZGEgKyAweGU5ICogLTB4MSk7CiAgICAgICAgICBlbHNlIHsKICAgICAgICAgICAgaWYgKF8weDE2Yjc2MSgweDFhYikgIT09IF8weDNkNTFmNSkgdGhyb3cgRXJyb3IoXzB4MTZiNzYxKDB4MjU2KSk7CiAgICAgICAgICAgIF8weDJkMDFmYSA9IF8weGRjNGQ0YyhfMHgxNTIzMWUpOwogICAgICAgICAgfQogICAgICAgIH0KICAgICAgICBfMHg0NzM4ZWVbXzB4MTdiY2M1XSA9IF8weDJkMDFmYTsKICAgICAgfQogICAgICByZXR1cm4gXzB4NDczOGVlOwogICAgfQogICAgZnVuY3Rpb24gXzB4M2EyYjkyKCkgewogICAgICB2YXIgXzB4NTNkYWNiID0gXzB4NTYxMmRlLAogICAgICAgIF8weDFjMjE2ZjsKICAgICAgT2JqZWN0W18weDUzZGFjYigweDJhMCldKAogICAgICAgIF8weDJkOGJiNFtfMHg1M2RhY2IoMHgyNzApXSwKICAgICAgICBfMHg1ODIxMGMoCiAgICAgICAgICBuYXZpZ2F0b3IsCiAgICAgICAgICBbCiAgICAgICAgICAgIF8weDUzZGFjYigweDM2YiksCiAgICAgICAgICAgIF8weDUzZGFjYigweDM1MCksCiAgICAgICAgICAgIF8weDUzZGFjYigweDE4NCksCiAgICAgICAgICAgICJhcHBWZXJzaW9uIiwKICAgICAgICAgICAgXzB4NTNkYWNiKDB4MzJkKSwKICAgICAgICAgICAgImRvTm90VHJhY2siLAogICAgICAgICAgICBfMHg1M2RhY2IoMHgzOWEpLAogICAgICAgICAgICBfMHg1M2RhY2IoMHgzOGMpLAogICAgICAgICAgICBfMHg1M2RhY2IoMHgxN2EpLAogICAgICAgICAgICBfMHg1M2RhY2IoMHgyNDYpLAogICAgICAgICAgICAicHJvZHVjdFN1YiIsCiAgICAgICAgICAgICJjcHVDbGFzcyIsCiAgICAgICAgICAgIF8weDUzZGFjYigweDIxMiksCiAgICAgICAgICAgIF8weDUzZGFjYigweDFkNSksCiAgICAgICAgICAgIF8weDUzZGFjYigweDFkZSksCiAgICAgICAgICAgIF8weDUzZGFjYigweDIxMCksCiAgICAgICAgICAgIF8weDUzZGFjYigweDMxNCksCiAgICAgICAgICAgIF8weDUzZGFjYigweDFjOSksCiAgICAgICAgICAgICJ3ZWJkcml2ZXIiLAogICAgICAgICAgXSwKICAgICAgICAgICJzdHJpbmciCiAgICAgICAgKQogICAgICApLAogICAgICAgIE9iamVjdFsiYXNzaWduIl0oCiAgICAgICAgICBfMHgyZDhiYjRbXzB4NTNkYWNiKDB4MjcwKV0sCiAgICAgICAgICBfMHg1ODIxMGMoCiAgICAgICAgICAgIG5hdmlnYXRvciwKICAgICAgICAgICAgWwogICAgICAgICAgICAgIF8weDUzZGFjYigweDFlMSksCiAgICAgICAgICAgICAgInZpYnJhdGUiLAogICAgICAgICAgICAgIF8weDUzZGFjYigweDJlMiksCiAgICAgICAgICAgICAgXzB4NTNkYWNiKDB4MjkyKSwKICAgICAgICAgICAgICBfMHg1M2RhY2IoMHgzOTApLAogICAgICAgICAgICAgIF8weDUzZGFjYigweDM4ZiksCiAgICAgICAgICAgIF0sCiAgICAgICAgICAgIF8weDUzZGFjYigweDFhYikKICAgICAgICAgICkKICAgICAgICApLAogICAgICAgIE9iamVjdFtfMHg1M2RhY2IoMHgyYTApXSgKICAgICAgICAgIF8weDJkOGJiNFtfMHg1M2RhY2IoMHgyNzApXSwKICAgICAgICAgIF8weDU4MjEwYygKICAgICAgICAgICAgbmF2aWdhdG9yLAogICAgICAgICAgICBbXzB4NTNkYWNiKDB4MzYwKSwgXzB4NTNkYWNiKDB4MzNiKV0sCiAgICAgICAgICAgIF8weDUzZGFjYigweDI4YikKICAgICAgICAgICkKICAgICAgICApLAogICAgICAgIChfMHgyZDhiYjRbIm5hdmlnYXRvciJdW18weDUzZGFjYigweDM5OCldID0KICAgICAgICAgICIiICsgbmF2aWdhdG9yW18weDUzZGFjYigweDM5OCldKTsKICAgICAgdHJ5IHsKICAgICAgICBkb2N1bWVudFtfMHg1M2RhY2IoMHgxODgpXShfMHg1M2RhY2IoMHgyNDApKSwKICAgICAgICAgIChfMHgxYzIxNmYgPSAtMHhhMiAqIC0weDUgKyAweDI2ICogLTB4ZTggKyAtMHgxMSAqIC0weDFkNyk7CiAgICAgIH0gY2F0Y2ggKF8weDI2NDM4MCkgewogICAgICAgIF8weDFjMjE2ZiA9IDB4YmMwICsgLTB4MjZiICsgLTB4ZDkgKiAweGI7CiAgICAgIH0KICAgICAgXzB4MmQ4YmI0WyJuYXZpZ2F0b3IiXVtfMHg1M2RhY2IoMHgzNGIpXSA9IF8weDFjMjE2ZjsKICAgICAgdmFyIF8weDVhYzYxZSA9CiAgICAgICAgXzB4NTNkYWNiKDB4MWVhKSBpbiB3aW5kb3cKICAgICAgICAgID8gMHgyNDI0ICsgMHgxICogMHhhNWMgKyAtMHgyZTdmCiAgICAgICAgICA6IC0weDg2YiAqIDB4MSArIC0weDE5NSArIDB4YTAyOwogICAgICBfMHgyZDhiYjRbXzB4NTNkYWNiKDB4MjcwKV1bXzB4NTNkYWNiKDB4MWQ2KV0gPSBfMHg1YWM2MWU7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1YWJjOTMoKSB7CiAgICAgIHZhciBfMHgyNzkyMzUgPSBfMHg1NjEyZGU7CiAgICAgIE9iamVjdFsiYXNzaWduIl0oCiAgICAgICAgXzB4MmQ4YmI0WyJ3aW5kb3ciXSwKICAgICAgICBfMHg1ODIxMGMoCiAgICAgICAgICB3aW5kb3csCiAgICAgICAgICBbCiAgICAgICAgICAgICJJbWFnZSIsCiAgICAgICAgICAgIF8weDI3OTIzNSgweDMwOSksCiAgICAgICAgICAgIF8weDI3OTIzNSgweDI5ZiksCiAgICAgICAgICAgIF8weDI3OTIzNSgweDM5OSksCiAgICAgICAgICAgIF8weDI3OTIzNSgweDMzYSksCiAgICAgICAgICAgICJleHRlcm5hbCIsCiAgICAgICAgICAgICJtb3pSVENQZWVyQ29ubmVjdGlvbiIsCiAgICAgICAgICAgICJwb3N0TWVzc2FnZSIsCiAgICAgICAgICAgIF8weDI3OTIzNSgweDI4NCksCiAgICAgICAgICAgIF8weDI3OTIzNSgweDJkZSksCiAgICAgICAgICAgIF8weDI3OTIzNSgweDJmZiksCiAgICAgICAgICAgIF8weDI3OTIzNSgweDFkYyksCiAgICAgICAgICAgIF8weDI3OTIzNSgweDNiZSksCiAgICAgICAgICAgIF8weDI3OTIzNSgweDJlOSksCiAgICAgICAgICBdLAogICAgICAgICAgXzB4Mjc5MjM1KDB4MWFiKQogICAgICAgICkKICAgICAgKSwKICAgICAgICBPYmplY3RbXzB4Mjc5MjM1KDB4MmEwKV0oCiAgICAgICAgICBfMHgyZDhiYjRbXzB4Mjc5MjM1KDB4MzkzKV0sCiAgICAgICAgICBfMHg1ODIxMGMod2luZG93LCBbXzB4Mjc5MjM1KDB4M2MwKV0sIF8weDI3OTIzNSgweDI4YikpCiAgICAgICAgKSwKICAgICAgICAoXzB4MmQ4YmI0W18weDI3OTIzNSgweDM5MyldW18weDI3OTIzNSgweDNjMildID0KICAgICAgICAgIHdpbmRvd1tfMHgyNzkyMzUoMHgzYzIpXVtfMHgyNzkyMzUoMHgyOTApXSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1ZDM4NDUoKSB7CiAgICAgIHZhciBfMHg0Y2ViNmQgPSBfMHg1NjEyZGU7CiAgICAgIHRyeSB7CiAgICAgICAgdmFyIF8weDU1NDM0YyA9IGRvY3VtZW50LAogICAgICAgICAgXzB4MmYwMDEyID0gd2luZG93W18weDRjZWI2ZCgweDMyOCldLAogICAgICAgICAgXzB4NWFjMTZjID0KICAgICAgICAgICAgd2luZG93W18weDRjZWI2ZCgweDMwNildID4+PiAoMHgxZDJjICsgLTB4MjEgKiAweGE3ICsgLTB4MSAqIDB4N2E1KSwKICAgICAgICAgIF8weDQ0Y2FjZSA9CiAgICAgICAgICAgIHdpbmRvd1tfMHg0Y2ViNmQoMHgyMjIpXSA+Pj4gKC0weGNkMCArIC0weDFmNzAgKyAweDE2MiAqIDB4MjApLAogICAgICAgICAgXzB4NTk1M2I5ID0KICAgICAgICAgICAgd2luZG93W18weDRjZWI2ZCgweDFhYSldID4+PgogICAgICAgICAgICAoMHg1ICogMHgyZTMgKyAtMHgxICogLTB4MWY3ICsgLTB4MSAqIDB4MTA2NiksCiAgICAgICAgICBfMHgxZGZjZTkgPSB3aW5kb3dbXzB4NGNlYjZkKDB4MjZkKV0gPj4+ICgweDE1NDUgKyAtMHg4ZDcgKyAtMHhjNmUpLAogICAgICAgICAgXzB4Mjk5MTFjID0gTWF0aFtfMHg0Y2ViNmQoMHgxY2YpXSh3aW5kb3dbInNjcmVlblgiXSksCiAgICAgICAgICBfMHgzNDA5NzIgPSBNYXRoWyJmbG9vciJdKHdpbmRvd1tfMHg0Y2ViNmQoMHgzNjYpXSksCiAgICAgICAgICBfMHg0YmMwYjggPQogICAgICAgICAgICB3aW5kb3dbXzB4NGNlYjZkKDB4MjU4KV0gPj4+CiAgICAgICAgICAgICgtMHgxICogLTB4MTU0OCArIC0weDIxICogLTB4NyArIC0weDE2MmYpLAogICAgICAgICAgXzB4MzlkZjdkID0KICAgICAgICAgICAgd2luZG93W18weDRjZWI2ZCgweDI4MildID4+PiAoMHgxZGM3ICogMHgxICsgLTB4MjExMyArIDB4MzRjKSwKICAgICAgICAgIF8weDEzYjMwZCA9CiAgICAgICAgICAgIF8weDJmMDAxMlsiYXZhaWxXaWR0aCJdID4+PiAoMHhjODQgKyAweDEgKiAtMHg2NDQgKyAtMHg2NDApLAogICAgICAgICAgXzB4M2YwNDdlID0KICAgICAgICAgICAgXzB4MmYwMDEyW18weDRjZWI2ZCgweDI3NildID4+PgogICAgICAgICAgICAoLTB4MjNjICsgMHhjICogMHgxYzQgKyAtMHgxMmY0ICogMHgxKSwKICAgICAgICAgIF8weDNlNzU5NSA9CiAgICAgICAgICAgIF8weDJmMDAxMlsid2lkdGgiXSA+Pj4gKDB4NjEgKiAweDQgKyAtMHgyNDY5ICsgMHgyMmU1ICogMHgxKSwKICAgICAgICAgIF8weGE2ZTI2NCA9CiAgICAgICAgICAgIF8weDJmMDAxMltfMHg0Y2ViNmQoMHgyNDUpXSA+Pj4gKDB4ODgyICsgMHgyNjQ2ICsgLTB4NWQ5ICogMHg4KTsKICAgICAgICByZXR1cm4gewogICAgICAgICAgaW5uZXJXaWR0aDoKICAgICAgICAgICAgdm9pZCAoLTB4YTQwICsgMHgxOTJlICsgLTB4MzEgKiAweDRlKSAhPT0gXzB4NWFjMTZjCiAgICAgICAgICAgICAgPyBfMHg1YWMxNmMKICAgICAgICAgICAgICA6IC0oMHgxMzVjICsgLTB4ZCAqIC0weDExNSArIC0weDQ1ICogMHg3YyksCiAgICAgICAgICBpbm5lckhlaWdodDoKICAgICAgICAgICAgdm9pZCAoLTB4MjE3NiArIC0weDI4MSAqIC0weGMgKyAweDE3ICogMHgyNikgIT09IF8weDQ0Y2FjZQogICAgICAgICAgICAgID8gXzB4NDRjYWNlCiAgICAgICAgICAgICAgOiAtKC0weDE3YTEgKyAweGU4ICogMHg4ICsgMHg1NzYgKiAweDMpLAogICAgICAgICAgb3V0ZXJXaWR0aDoKICAgICAgICAgICAgdm9pZCAoLTB4MTY3YyArIC0weDZmICogMHg0OSArIDB4MzYyMykgIT09IF8weDU5NTNiOQogICAgICAgICAgICAgID8gXzB4NTk1M2I5CiAgICAgICAgICAgICAgOiAtKDB4MyAqIC0weDc5NSArIDB4NCAqIC0weDUzYiArIDB4MmJhYyksCiAgICAgICAgICBvdXRlckhlaWdodDoKICAgICAgICAgICAgdm9pZCAoLTB4MjYgKiAtMHg1ZiArIC0weGY3MSArIC0weDEgKiAtMHgxNTcpICE9PSBfMHgxZGZjZTkKICAgICAgICAgICAgICA/IF8weDFkZmNlOQogICAgICAgICAgICAgIDogLSgweGViZCArIC0weDE4Y2QgKyAweDMgKiAweDM1YiksCiAgICAgICAgICBzY3JlZW5YOgogICAgICAgICAgICB2b2lkICgtMHhmOSAqIC0weDIyICsgMHhkMyAqIC0weDJjICsgMHgzMzIpICE9PSBfMHgyOTkxMWMKICAgICAgICAgICAgICA/IF8weDI5OTExYwogICAgICAgICAgICAgIDogLSgtMHgxODggKyAtMHgyNGUzICsgMHgyNjZjKSwKICAgICAgICAgIHNjcmVlblk6CiAgICAgICAgICAgIHZvaWQgKC0weDUgKiAtMHgxMDUgKyAweDIgKiAweDExZmUgKyAtMHgyOTE1KSAhPT0gXzB4MzQwOTcyCiAgICAgICAgICAgICAgPyBfMHgzNDA5NzIKICAgICAgICAgICAgICA6IC0oLTB4M2NjICogLTB4NiArIDB4MTU2MSAqIDB4MSArIC0weDJjMjgpLAogICAgICAgICAgcGFnZVhPZmZzZXQ6CiAgICAgICAgICAgIHZvaWQgKDB4YjE1ICsgLTB4NjRkICogMHg1ICsgLTB4MiAqIC0weGEzNikgIT09IF8weDRiYzBiOAogICAgICAgICAgICAgID8gXzB4NGJjMGI4CiAgICAgICAgICAgICAgOiAtKDB4NjQ3ICsgLTB4MSAqIC0weDFjZWQgKyAtMHgyMzMzKSwKICAgICAgICAgIHBhZ2VZT2Zmc2V0OgogICAgICAgICAgICB2b2lkICgtMHgxMzM3ICogMHgxICsgLTB4MTBjMSArIC0weDEgKiAtMHgyM2Y4KSAhPT0gXzB4MzlkZjdkCiAgICAgICAgICAgICAgPyBfMHgzOWRmN2QKICAgICAgICAgICAgICA6IC0oMHgzYiAqIDB4NWIgKyAtMHg3ICogMHgzYTYgKyAweDQ5MiksCiAgICAgICAgICBhdmFpbFdpZHRoOgogICAgICAgICAgICB2b2lkICgtMHhkICogMHgyNjcgKyAweDFhNjcgKyAtMHgyICogLTB4MjZhKSAhPT0gXzB4MTNiMzBkCiAgICAgICAgICAgICAgPyBfMHgxM2IzMGQKICAgICAgICAgICAgICA6IC0oMHhlNDggKyAtMHg3ZCAqIC0weDIzICsgLTB4MWY1ZSksCiAgICAgICAgICBhdmFpbEhlaWdodDoKICAgICAgICAgICAgdm9pZCAoLTB4MTkyYSArIDB4NSAqIC0weDViMyArIDB4ZjEgKiAweDM5KSAhPT0gXzB4M2YwNDdlCiAgICAgICAgICAgICAgPyBfMHgzZjA0N2UKICAgICAgICAgICAgICA6IC0oMHg0ICogMHg1YiArIC0weDMgKiAtMHgxMyArIC0weDFhNCksCiAgICAgICAgICBzaXplV2lkdGg6CiAgICAgICAgICAgIHZvaWQgKC0weDFhMzggKiAweDEgKyAtMHgyMGNiICsgMHgxICogMHgzYjAzKSAhPT0gXzB4M2U3NTk1CiAgICAgICAgICAgICAgPyBfMHgzZTc1OTUKICAgICAgICAgICAgICA6IC0oLTB4NjYzICsgLTB4MjY1OSArIDB4MmNiZCAqIDB4MSksCiAgICAgICAgICBzaXplSGVpZ2h0OgogICAgICAgICAgICB2b2lkICgweDg1NyAqIDB4MyArIC0weDY1ICogLTB4YSArIC0weDFjZjcpICE9PSBfMHhhNmUyNjQKICAgICAgICAgICAgICA/IF8weGE2ZTI2NAogICAgICAgICAgICAgIDogLSgweGFmYSArIDB4MzA1ICogMHg1ICsgLTB4MWExMiksCiAgICAgICAgICBjbGllbnRXaWR0aDogXzB4NTU0MzRjWyJib2R5Il0KICAgICAgICAgICAgPyBfMHg1NTQzNGNbXzB4NGNlYjZkKDB4MTg5KV1bXzB4NGNlYjZkKDB4MWEyKV0gPj4+CiAgICAgICAgICAgICAgKC0weGUzOCArIDB4MTgzOSArIC0weGEwMSkKICAgICAgICAgICAgOiAtKDB4MTMzOCArIDB4MjFjMSArIDB4NjlmICogLTB4OCksCiAgICAgICAgICBjbGllbnRIZWlnaHQ6IF8weDU1NDM0Y1tfMHg0Y2ViNmQoMHgxODkpXQogICAgICAgICAgICA/IF8weDU1NDM0Y1tfMHg0Y2ViNmQoMHgxODkpXVtfMHg0Y2ViNmQoMHgzYmIpXSA+Pj4KICAgICAgICAgICAgICAoLTB4MSAqIDB4MTU2ICsgMHgzMSAqIDB4NDMgKyAtMHhiN2QpCiAgICAgICAgICAgIDogLSgweDEyMDIgKyAtMHgzMmIgKyAtMHhlZDYpLAogICAgICAgICAgY29sb3JEZXB0aDoKICAgICAgICAgICAgXzB4MmYwMDEyW18weDRjZWI2ZCgweDE3ZSldID4+PgogICAgICAgICAgICAoLTB4MWQgKiAtMHhjYiArIDB4MTk3ICogMHgxMSArIDB4MjYgKiAtMHgxNTEpLAogICAgICAgICAgcGl4ZWxEZXB0aDoKICAgICAgICAgICAgXzB4MmYwMDEyW18weDRjZWI2ZCgweDMwYSldID4+PiAoLTB4MjU0YyArIDB4NDY5ICsgMHgyMGUzICogMHgxKSwKICAgICAgICB9OwogICAgICB9IGNhdGNoIChfMHgzNWFhNWEpIHsKICAgICAgICByZXR1cm4ge307CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDU3MzA2NSgpIHsKICAgICAgdmFyIF8weDEwOWNmYSA9IF8weDU2MTJkZTsKICAgICAgT2JqZWN0W18weDEwOWNmYSgweDJhMCldKAogICAgICAgIF8weDJkOGJiNFtfMHgxMDljZmEoMHgyMDgpXSwKICAgICAgICBfMHg1ODIxMGMoCiAgICAgICAgICBkb2N1bWVudCwKICAgICAgICAgIFtfMHgxMDljZmEoMHgzMzUpLCBfMHgxMDljZmEoMHgyNTMpLCAiZG9jdW1lbnRNb2RlIl0sCiAgICAgICAgICBfMHgxMDljZmEoMHgzM2MpCiAgICAgICAgKQogICAgICApLAogICAgICAgIE9iamVjdFsiYXNzaWduIl0oCiAgICAgICAgICBfMHgyZDhiYjRbXzB4MTA5Y2ZhKDB4MjA4KV0sCiAgICAgICAgICBfMHg1ODIxMGMoCiAgICAgICAgICAgIGRvY3VtZW50LAogICAgICAgICAgICBbXzB4MTA5Y2ZhKDB4MzI1KSwgXzB4MTA5Y2ZhKDB4MTgzKSwgImltYWdlcyJdLAogICAgICAgICAgICBfMHgxMDljZmEoMHgxYWIpCiAgICAgICAgICApCiAgICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDQ3ZjM1NCgpIHsKICAgICAgdmFyIF8weGFkNTFhNSA9IF8weDU2MTJkZSwKICAgICAgICBfMHg1YWQxOTMgPSB7fTsKICAgICAgdHJ5IHsKICAgICAgICB2YXIgXzB4MzQ0MTU4ID0gZG9jdW1lbnRbXzB4YWQ1MWE1KDB4MjYwKV0oXzB4YWQ1MWE1KDB4MjRkKSlbCiAgICAgICAgICAgIF8weGFkNTFhNSgweDJmOSkKICAgICAgICAgIF0oXzB4YWQ1MWE1KDB4MjZiKSksCiAgICAgICAgICBfMHg0NWFiNTMgPSBfMHgzNDQxNThbXzB4YWQ1MWE1KDB4MWQ3KV0oXzB4YWQ1MWE1KDB4Mzc1KSksCiAgICAgICAgICBfMHgzNzI0ZGUgPSBfMHgzNDQxNThbImdldFBhcmFtZXRlciJdKAogICAgICAgICAgICBfMHg0NWFiNTNbIlVOTUFTS0VEX1ZFTkRPUl9XRUJHTCJdCiAgICAgICAgICApLAogICAgICAgICAgXzB4NDFmYTc5ID0gXzB4MzQ0MTU4W18weGFkNTFhNSgweDM4MyldKF8weDQ1YWI1M1tfMHhhZDUxYTUoMHgzOWUpXSk7CiAgICAgICAgKF8weDVhZDE5M1sidmVuZG9yIl0gPSBfMHgzNzI0ZGUpLAogICAgICAgICAgKF8weDVhZDE5M1tfMHhhZDUxYTUoMHgyYzIpXSA9IF8weDQxZmE3OSk7CiAgICAgIH0gY2F0Y2ggKF8weDIyNjg0ZSkge30KICAgICAgcmV0dXJuIF8weDVhZDE5MzsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDU4YmNmOCgpIHsKICAgICAgdmFyIF8weDNmYTkzMiA9IF8weDU2MTJkZSwKICAgICAgICBfMHhmOWFlNzUgPSBfMHgxMWExZDYoKTsKICAgICAgaWYgKF8weGY5YWU3NSkgewogICAgICAgIHZhciBfMHgzYzQ0MDYgPSB7CiAgICAgICAgICBhbnRpYWxpYXM6IF8weGY5YWU3NVtfMHgzZmE5MzIoMHgxYzUpXSgpW18weDNmYTkzMigweDFhNSldCiAgICAgICAgICAgID8gLTB4MWQyZSArIC0weDRiMSArIDB4MjFlMAogICAgICAgICAgICA6IC0weDEgKiAtMHg4N2MgKyAweDRiICogMHg0OSArIC0weDUgKiAweDVmOSwKICAgICAgICAgIGJsdWVCaXRzOiBfMHhmOWFlNzVbXzB4M2ZhOTMyKDB4MzgzKV0oXzB4ZjlhZTc1W18weDNmYTkzMigweDI3ZSldKSwKICAgICAgICAgIGRlcHRoQml0czogXzB4ZjlhZTc1WyJnZXRQYXJhbWV0ZXIiXShfMHhmOWFlNzVbXzB4M2ZhOTMyKDB4MjUyKV0pLAogICAgICAgICAgZ3JlZW5CaXRzOiBfMHhmOWFlNzVbXzB4M2ZhOTMyKDB4MzgzKV0oXzB4ZjlhZTc1WyJHUkVFTl9CSVRTIl0pLAogICAgICAgICAgbWF4QW5pc290cm9weTogXzB4MzljM2Q4KF8weGY5YWU3NSksCiAgICAgICAgICBtYXhDb21iaW5lZFRleHR1cmVJbWFnZVVuaXRzOiBfMHhmOWFlNzVbXzB4M2ZhOTMyKDB4MzgzKV0oCiAgICAgICAgICAgIF8weGY5YWU3NVsiTUFYX0NPTUJJTkVEX1RFWFRVUkVfSU1BR0VfVU5JVFMiXQogICAgICAgICAgKSwKICAgICAgICAgIG1heEN1YmVNYXBUZXh0dXJlU2l6ZTogXzB4ZjlhZTc1W18weDNmYTkzMigweDM4MyldKAogICAgICAgICAgICBfMHhmOWFlNzVbXzB4M2ZhOTMyKDB4MzAwKV0KICAgICAgICAgICksCiAgICAgICAgICBtYXhGcmFnbWVudFVuaWZvcm1WZWN0b3JzOiBfMHhmOWFlNzVbXzB4M2ZhOTMyKDB4MzgzKV0oCiAgICAgICAgICAgIF8weGY5YWU3NVtfMHgzZmE5MzIoMHgyODYpXQogICAgICAgICAgKSwKICAgICAgICAgIG1heFJlbmRlcmJ1ZmZlclNpemU6IF8weGY5YWU3NVtfMHgzZmE5MzIoMHgzODMpXSgKICAgICAgICAgICAgXzB4ZjlhZTc1W18weDNmYTkzMigweDJkYSldCiAgICAgICAgICApLAogICAgICAgICAgbWF4VGV4dHVyZUltYWdlVW5pdHM6IF8weGY5YWU3NVtfMHgzZmE5MzIoMHgzODMpXSgKICAgICAgICAgICAgXzB4ZjlhZTc1WyJNQVhfVEVYVFVSRV9JTUFHRV9VTklUUyJdCiAgICAgICAgICApLAogICAgICAgICAgbWF4VGV4dHVyZVNpemU6IF8weGY5YWU3NVtfMHgzZmE5MzIoMHgzODMpXSgKICAgICAgICAgICAgXzB4ZjlhZTc1W18weDNmYTkzMigweDIwMyldCiAgICAgICAgICApLAogICAgICAgICAgbWF4VmFyeWluZ1ZlY3RvcnM6IF8weGY5YWU3NVsiZ2V0UGFyYW1ldGVyIl0oCiAgICAgICAgICAgIF8weGY5YWU3NVtfMHgzZmE5MzIoMHgyNjQpXQogICAgICAgICAgKSwKICAgICAgICAgIG1heFZlcnRleEF0dHJpYnM6IF8weGY5YWU3NVtfMHgzZmE5MzIoMHgzODMpXSgKICAgICAgICAgICAgXzB4ZjlhZTc1WyJNQVhfVkVSVEVYX0FUVFJJQlMiXQogICAgICAgICAgKSwKICAgICAgICAgIG1heFZlcnRleFRleHR1cmVJbWFnZVVuaXRzOiBfMHhmOWFlNzVbImdldFBhcmFtZXRlciJdKAogICAgICAgICAgICBfMHhmOWFlNzVbXzB4M2ZhOTMyKDB4MjA1KV0KICAgICAgICAgICksCiAgICAgICAgICBtYXhWZXJ0ZXhVbmlmb3JtVmVjdG9yczogXzB4ZjlhZTc1WyJnZXRQYXJhbWV0ZXIiXSgKICAgICAgICAgICAgXzB4ZjlhZTc1W18weDNmYTkzMigweDE5ZCldCiAgICAgICAgICApLAogICAgICAgICAgc2hhZGluZ0xhbmd1YWdlVmVyc2lvbjogXzB4ZjlhZTc1W18weDNmYTkzMigweDM4MyldKAogICAgICAgICAgICBfMHhmOWFlNzVbXzB4M2ZhOTMyKDB4MTc5KV0KICAgICAgICAgICksCiAgICAgICAgICBzdGVuY2lsQml0czogXzB4ZjlhZTc1WyJnZXRQYXJhbWV0ZXIiXShfMHhmOWFlNzVbXzB4M2ZhOTMyKDB4MmJiKV0pLAogICAgICAgICAgdmVyc2lvbjogXzB4ZjlhZTc1W18weDNmYTkzMigweDM4MyldKF8weGY5YWU3NVtfMHgzZmE5MzIoMHgyMDEpXSksCiAgICAgICAgfTsKICAgICAgICBPYmplY3RbImFzc2lnbiJdKF8weDJkOGJiNFsid2ViZ2wiXSwgXzB4M2M0NDA2KTsKICAgICAgfQogICAgICBPYmplY3RbXzB4M2ZhOTMyKDB4MmEwKV0oXzB4MmQ4YmI0W18weDNmYTkzMigweDI2YildLCBfMHg0N2YzNTQoKSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg3NTk1NygpIHsKICAgICAgdmFyIF8weDEyMjM5MyA9IF8weDU2MTJkZTsKICAgICAgaWYgKHdpbmRvd1tfMHgxMjIzOTMoMHgyOWYpXSkgewogICAgICAgIGZvciAoCiAgICAgICAgICB2YXIgXzB4Mjk2M2Q1ID0gLTB4ODFhICsgLTB4YWQgKiAtMHgxICsgMHg3NmY7CiAgICAgICAgICBfMHgyOTYzZDUgPCAtMHgxNjI5ICsgMHgxICogMHgzMWMgKyAweDEzMTc7CiAgICAgICAgICBfMHgyOTYzZDUrKwogICAgICAgICkKICAgICAgICAgIHRyeSB7CiAgICAgICAgICAgIHJldHVybiAoCiAgICAgICAgICAgICAgISFuZXcgd2luZG93W18weDEyMjM5MygweDI5ZildKF8weDEyMjM5MygweDNiNCkgKyBfMHgyOTYzZDUpICYmCiAgICAgICAgICAgICAgXzB4Mjk2M2Q1W18weDEyMjM5MygweDNhZSldKCkKICAgICAgICAgICAgKTsKICAgICAgICAgIH0gY2F0Y2ggKF8weDJjNTcyMikge30KICAgICAgICB0cnkgewogICAgICAgICAgcmV0dXJuICEhbmV3IHdpbmRvd1tfMHgxMjIzOTMoMHgyOWYpXSgiUERGLlBkZkN0cmwuMSIpICYmICI0IjsKICAgICAgICB9IGNhdGNoIChfMHgxYmUwMWUpIHt9CiAgICAgICAgdHJ5IHsKICAgICAgICAgIHJldHVybiAhIW5ldyB3aW5kb3dbXzB4MTIyMzkzKDB4MjlmKV0oXzB4MTIyMzkzKDB4MzQ1KSkgJiYgIjciOwogICAgICAgIH0gY2F0Y2ggKF8weDE5Y2ZmYSkge30KICAgICAgfQogICAgICByZXR1cm4gIjAiOwogICAgfQogICAgZnVuY3Rpb24gXzB4MTU1NWQ5KCkgewogICAgICByZXR1cm4gewogICAgICAgIHBsdWdpbjogXzB4MzA0MTJlKCksCiAgICAgICAgcHY6IF8weDc1OTU3KCksCiAgICAgIH07CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxZjAxY2UoXzB4MzcxZGQxKSB7CiAgICAgIHZhciBfMHg1Yzc2YmIgPSBfMHg1NjEyZGU7CiAgICAgIHRyeSB7CiAgICAgICAgdmFyIF8weGY3MWQxNiA9IHdpbmRvd1tfMHgzNzFkZDFdLAogICAgICAgICAgXzB4MjhhNGQxID0gXzB4NWM3NmJiKDB4MWY5KTsKICAgICAgICByZXR1cm4gKAogICAgICAgICAgXzB4ZjcxZDE2W18weDVjNzZiYigweDFjNCldKF8weDI4YTRkMSwgXzB4MjhhNGQxKSwKICAgICAgICAgIF8weGY3MWQxNltfMHg1Yzc2YmIoMHgyYzMpXShfMHgyOGE0ZDEpLAogICAgICAgICAgISgweDFlN2EgKyAtMHgxODI0ICsgMHgyICogLTB4MzJiKQogICAgICAgICk7CiAgICAgIH0gY2F0Y2ggKF8weDFkZDgwMykgewogICAgICAgIHJldHVybiAhKDB4NmU1ICsgMHg1OTkgKiAtMHgyICsgLTB4MSAqIC0weDQ0ZSk7CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDNmZmUxNSgpIHsKICAgICAgcmV0dXJuIHdfMHg1YzMxNDAoCiAgICAgICAgIjQ4NGU0ZjRhNDAzZjUyNDMwMDNjMjAxMTdkM2FkZWFjMDAwMDAwMDA0ZTc3MGYzOTAwMDAwMDNhMDMwMDE0MDAwMTAyMTEwMTAwMDcwMDAwNDMwMTQ3MDAwYjExMDAwMTAzMDEyZjE3MDAwMTM1NDkwMjExMDEwMDA3MDAwMTQzMDE0NzAwMGUxMTAwMDEwMzAxMDMwMTJiMmYxNzAwMDEzNTQ5MTEwMDAxNDIwMDAyMGM0NTQ2NGE0ODQ1N2E1ZDQ2NWI0ODRlNGMwZTVhNGM1YTVhNDA0NjQ3N2E1ZDQ2NWI0ODRlNGMiLAogICAgICAgIHsKICAgICAgICAgIGdldCAweDAoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxZjAxY2U7CiAgICAgICAgICB9LAogICAgICAgICAgMHgxOiBhcmd1bWVudHMsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyNTI3ODgoXzB4NDY4YmI0LCBfMHgzOTI3NTgsIF8weDI2OTcyMCkgewogICAgICB2YXIgXzB4MTY5NDdjID0gXzB4NTYxMmRlOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHg0ZGVhMTEgPSAweDEgKiAweDE3MDUgKyAweDI5ICogLTB4YmYgKyAweDcyICogMHgxMSwKICAgICAgICAgIF8weDFmODhlNSA9IDB4NjUgKiAtMHg3ICsgMHhiNTAgKyAtMHg4OGQ7CiAgICAgICAgXzB4MWY4OGU1IDwgXzB4MzkyNzU4WyJsZW5ndGgiXTsKICAgICAgICBfMHgxZjg4ZTUrKwogICAgICApIHsKICAgICAgICB2YXIgXzB4MWRkNWY5ID0gXzB4MjE5NWNkKF8weDQ2OGJiNCwgXzB4MzkyNzU4W18weDFmODhlNV0pOwogICAgICAgIGlmICgKICAgICAgICAgIF8weDFkZDVmOSAmJgogICAgICAgICAgKChfMHg0ZGVhMTEgfD0gXzB4MWRkNWY5IDw8IChfMHgyNjk3MjAgKyBfMHgxZjg4ZTUpKSwKICAgICAgICAgIF8weDI2OTcyMCArIF8weDFmODhlNSA+PSAweGQ1YSArIDB4N2MgKyAtMHgxICogMHhkYjYpCiAgICAgICAgKSB7CiAgICAgICAgICBjb25zb2xlW18weDE2OTQ3YygweDMxMCldKCJhYm9ydFx4MjAzMiIpOwogICAgICAgICAgYnJlYWs7CiAgICAgICAgfQogICAgICB9CiAgICAgIHJldHVybiBfMHg0ZGVhMTE7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0ODQwNTQoKSB7CiAgICAgIHJldHVybiB3XzB4NWMzMTQwKAogICAgICAgICI0ODRlNGY0YTQwM2Y1MjQzMDAyYzNiMGE2ZjRmODgyOTAwMDAwMDAwNDRjNDEwMDAwMDAwMDExZjExMDEwMDE0MDAwMTA3MDAwMDA3MDAwMTA3MDAwMjA3MDAwMzA3MDAwNDA3MDAwNTA3MDAwNjA3MDAwNzA3MDAwODA3MDAwOTBjMDAwYTE0MDAwMjA3MDAwYTE0MDAwMzA3MDAwYjE0MDAwNDA3MDAwYTExMDEwMTExMDAwNDE2M2UwMDA0MTQwMDBhNDEzZDAwZDExMTAwMDE0YTA3MDAwYzEzMDcwMDBkNDMwMTAzMDAxMzE0MDAwNTBjMDAwMDE0MDAwNjAzMDAxNDAwMDcxMTAwMDcxMTAwMDIwNzAwMGUxMzI3NDcwMDY5MTEwMDAxNGEwNzAwMGYxMzA3MDAxMDQzMDExNDAwMDgxMTAwMDIxMTAwMDcxMzE0MDAwOTExMDAwODRhMDcwMDExMTMwNzAwMTIwNzAwMTMxMTAwMDkxODQzMDI0OTExMDAwNDA3MDAxNDE4MTEwMDA5MTgwNzAwMTUxODExMDAwODA3MDAxNjE2MTEwMDA1NGEwNzAwMTcxMzExMDAwODQzMDE0OTExMDAwNjRhMDcwMDE4MTMxMTAwMDg0MzAxNDkxNzAwMDcyMTQ5NDVmZjg5MTEwMTAxMTEwMDA0MTMxNzAwMDMzNTQ5MDMwMDE3MDAwNzM1NDkxMTAwMDcxMTAwMDIwNzAwMGUxMzI3NDcwMDFhMTEwMDA1NGEwNzAwMTkxMzExMDAwNjExMDAwNzEzNDMwMTQ5MTcwMDA3MjE0OTQ1ZmZkODQxMTEwMDAzNDIwMDFhMDM3ZTYxN2UwMzdlNjE3ZDAzN2U2MTdjMDM3ZTYxN2IwMzdlNjE3YTAzN2U2MTc5MDM3ZTYxNzgwMzdlNjE3NzAzN2U2MTc2MDM3ZDYxN2YwMDE0MjYyYjIwMjEzYjI0MjEyMDM4MjEzODI3MmUzYjI2M2MzYjI3MjYzYzE0MjgyYTNiMGEyMzJhMjIyYTIxM2IzYzBkMzYxYjJlMjgwMTJlMjIyYTA0MjcyYTJlMmIwNjIzMmEyMTI4M2IyNzBkMmMzZDJhMmUzYjJhMGEyMzJhMjIyYTIxM2IwNjNjMmMzZDI2M2YzYjBjM2MyYTNiMGUzYjNiM2QyNjJkM2EzYjJhMDgyMzJlMjEyODNhMmUyODJhMGEwNTJlMzkyZTFjMmMzZDI2M2YzYjAyNzI2ZDAxNmQwNDNiMmEzNzNiMGIyZTNmM2YyYTIxMmIwYzI3MjYyMzJiMDQzZjNhM2MyNzBiM2QyYTIyMjAzOTJhMGMyNzI2MjMyYiIsCiAgICAgICAgewogICAgICAgICAgZ2V0IDB4MCgpIHsKICAgICAgICAgICAgcmV0dXJuIGRvY3VtZW50OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEoKSB7CiAgICAgICAgICAgIHJldHVybiB3aW5kb3c7CiAgICAgICAgICB9LAogICAgICAgICAgMHgyOiBhcmd1bWVudHMsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICAoXzB4MmQ4YmI0W18weDU2MTJkZSgweDI3MCldID0ge30pLAogICAgICAoXzB4MmQ4YmI0W18weDU2MTJkZSgweDIzZSldID0ge30pLAogICAgICAoXzB4MmQ4YmI0W18weDU2MTJkZSgweDM5MyldID0ge30pLAogICAgICAoXzB4MmQ4YmI0W18weDU2MTJkZSgweDI2YildID0ge30pLAogICAgICAoXzB4MmQ4YmI0WyJkb2N1bWVudCJdID0ge30pLAogICAgICAoXzB4MmQ4YmI0W18weDU2MTJkZSgweDMyOCldID0ge30pLAogICAgICAoXzB4MmQ4YmI0W18weDU2MTJkZSgweDFiYSldID0ge30pLAogICAgICAoXzB4MmQ4YmI0WyJjdXN0b20iXSA9IHt9KTsKICAgIHZhciBfMHg1NDg2NzYgPSBudWxsOwogICAgZnVuY3Rpb24gXzB4NDkxNzE2KCkgewogICAgICB2YXIgXzB4NGY1OGM5ID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gd18weDVjMzE0MCgKICAgICAgICBfMHg0ZjU4YzkoMHgxNzQpLAogICAgICAgIHsKICAgICAgICAgIGdldCAweDAoKSB7CiAgICAgICAgICAgIHJldHVybiBzZWxmOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEoKSB7CiAgICAgICAgICAgIHJldHVybiB3aW5kb3c7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MigpIHsKICAgICAgICAgICAgcmV0dXJuIHBhcmVudDsKICAgICAgICAgIH0sCiAgICAgICAgICAweDM6IGFyZ3VtZW50cywKICAgICAgICB9LAogICAgICAgIHRoaXMKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDJkMjU3OCgpIHsKICAgICAgIShmdW5jdGlvbiAoKSB7CiAgICAgICAgdmFyIF8weDIzNjczMyA9IHdfMHgyNWYzLAogICAgICAgICAgXzB4NDYwYzA3ID0ge30sCiAgICAgICAgICBfMHgzNjA2ZTEgPQogICAgICAgICAgICBuYXZpZ2F0b3JbXzB4MjM2NzMzKDB4MzU5KV0gfHwgbmF2aWdhdG9yW18weDIzNjczMygweDJmMCldOwogICAgICAgIGlmIChfMHgzNjA2ZTEpIHsKICAgICAgICAgIHRyeSB7CiAgICAgICAgICAgIChfMHg0NjBjMDdbXzB4MjM2NzMzKDB4M2FjKV0gPSBfMHgzNjA2ZTFbXzB4MjM2NzMzKDB4M2FjKV0KICAgICAgICAgICAgICA/IDB4MTQ3YSArIC0weDUgKiAweDYwZiArIDB4OWQyCiAgICAgICAgICAgICAgOiAtMHgxNjljICsgMHgyNmQ2ICsgLTB4MTAzOCksCiAgICAgICAgICAgICAgKF8weDQ2MGMwN1tfMHgyMzY3MzMoMHgyMTMpXSA9IE1hdGhbXzB4MjM2NzMzKDB4MzY5KV0oCiAgICAgICAgICAgICAgICAoMHgzMSAqIDB4NzUgKyAweDE0YzcgKyAtMHgyYWM4KSAqIF8weDM2MDZlMVtfMHgyMzY3MzMoMHgyMTMpXQogICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgIChfMHg0NjBjMDdbXzB4MjM2NzMzKDB4MmIwKV0gPSAiIiArIF8weDM2MDZlMVtfMHgyMzY3MzMoMHgyYjApXSksCiAgICAgICAgICAgICAgKF8weDQ2MGMwN1tfMHgyMzY3MzMoMHgxOTEpXSA9ICIiICsgXzB4MzYwNmUxWyJkaXNjaGFyZ2luZ1RpbWUiXSk7CiAgICAgICAgICB9IGNhdGNoIChfMHgyYzMwMWMpIHt9CiAgICAgICAgICAoXzB4MmQ4YmI0W18weDIzNjczMygweDM1OSldID0ge30pLAogICAgICAgICAgICBPYmplY3RbXzB4MjM2NzMzKDB4MmEwKV0oXzB4MmQ4YmI0W18weDIzNjczMygweDM1OSldLCBfMHg0NjBjMDcpOwogICAgICAgIH0gZWxzZSB7CiAgICAgICAgICBpZiAoCiAgICAgICAgICAgIF8weDIzNjczMygweDM4NCkgIT0gdHlwZW9mIG5hdmlnYXRvciAmJgogICAgICAgICAgICBuYXZpZ2F0b3JbXzB4MjM2NzMzKDB4MWIyKV0KICAgICAgICAgICkKICAgICAgICAgICAgdHJ5IHsKICAgICAgICAgICAgICBuYXZpZ2F0b3JbXzB4MjM2NzMzKDB4MWIyKV0oKVtfMHgyMzY3MzMoMHgxZWQpXShmdW5jdGlvbiAoCiAgICAgICAgICAgICAgICBfMHgzNjlmYzUKICAgICAgICAgICAgICApIHsKICAgICAgICAgICAgICAgIHZhciBfMHgzNGUzZTkgPSBfMHgyMzY3MzM7CiAgICAgICAgICAgICAgICB0cnkgewogICAgICAgICAgICAgICAgICAoXzB4NDYwYzA3W18weDM0ZTNlOSgweDNhYyldID0gXzB4MzY5ZmM1W18weDM0ZTNlOSgweDNhYyldCiAgICAgICAgICAgICAgICAgICAgPyAweDIwYWEgKyAtMHgxMSAqIC0weDg2ICsgMHgxICogLTB4Mjk4ZgogICAgICAgICAgICAgICAgICAgIDogMHhkNTEgKyAweDE1MmMgKyAweGQgKiAtMHgyYTcpLAogICAgICAgICAgICAgICAgICAgIChfMHg0NjBjMDdbXzB4MzRlM2U5KDB4MjEzKV0gPSBNYXRoW18weDM0ZTNlOSgweDM2OSldKAogICAgICAgICAgICAgICAgICAgICAgKDB4MTIwNSArIC0weDQxICogMHgzMiArIC0weDMgKiAweDFhNSkgKgogICAgICAgICAgICAgICAgICAgICAgICBfMHgzNjlmYzVbXzB4MzRlM2U5KDB4MjEzKV0KICAgICAgICAgICAgICAgICAgICApKSwKICAgICAgICAgICAgICAgICAgICAoXzB4NDYwYzA3W18weDM0ZTNlOSgweDJiMCldID0KICAgICAgICAgICAgICAgICAgICAgICIiICsgXzB4MzY5ZmM1W18weDM0ZTNlOSgweDJiMCldKSwKICAgICAgICAgICAgICAgICAgICAoXzB4NDYwYzA3W18weDM0ZTNlOSgweDE5MSldID0KICAgICAgICAgICAgICAgICAgICAgICIiICsgXzB4MzY5ZmM1WyJkaXNjaGFyZ2luZ1RpbWUiXSk7CiAgICAgICAgICAgICAgICB9IGNhdGNoIChfMHgyZjYzZDEpIHt9CiAgICAgICAgICAgICAgICAoXzB4MmQ4YmI0WyJiYXR0ZXJ5Il0gPSB7fSksCiAgICAgICAgICAgICAgICAgIE9iamVjdFtfMHgzNGUzZTkoMHgyYTApXSgKICAgICAgICAgICAgICAgICAgICBfMHgyZDhiYjRbXzB4MzRlM2U5KDB4MzU5KV0sCiAgICAgICAgICAgICAgICAgICAgXzB4NDYwYzA3CiAgICAgICAgICAgICAgICAgICk7CiAgICAgICAgICAgICAgfSk7CiAgICAgICAgICAgIH0gY2F0Y2ggKF8weGZjMDEyZCkge30KICAgICAgICB9CiAgICAgIH0pKCksCiAgICAgICAgInVuZGVmaW5lZCIgIT0gdHlwZW9mIFByb21pc2UgJiYKICAgICAgICAgIChfMHg1NDg2NzYgPSBuZXcgUHJvbWlzZShmdW5jdGlvbiAoXzB4MWRmMDJlKSB7CiAgICAgICAgICAgIHRyeSB7CiAgICAgICAgICAgICAgXzB4NWJiYWYwKClbInRoZW4iXShmdW5jdGlvbiAoXzB4MjdhYjQ3KSB7CiAgICAgICAgICAgICAgICB2YXIgXzB4YmVlMTlmID0gd18weDI1ZjM7CiAgICAgICAgICAgICAgICBPYmplY3RbXzB4YmVlMTlmKDB4MmEwKV0oXzB4MmQ4YmI0WyJ3SUQiXSwgewogICAgICAgICAgICAgICAgICBydGNJUDogXzB4MjdhYjQ3LAogICAgICAgICAgICAgICAgfSk7CiAgICAgICAgICAgICAgfSk7CiAgICAgICAgICAgIH0gY2F0Y2ggKF8weDdiYzEyYSkge30KICAgICAgICAgICAgXzB4MWRmMDJlKCIiKTsKICAgICAgICAgIH0pKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDVjMzI4ZSgpIHsKICAgICAgdmFyIF8weDM3OGFlMiA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIHdfMHg1YzMxNDAoCiAgICAgICAgXzB4Mzc4YWUyKDB4MWFkKSwKICAgICAgICB7CiAgICAgICAgICBnZXQgMHgwKCkgewogICAgICAgICAgICByZXR1cm4gd2luZG93OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEoKSB7CiAgICAgICAgICAgIHJldHVybiBuYXZpZ2F0b3I7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MigpIHsKICAgICAgICAgICAgdmFyIF8weGE3OGRjNSA9IF8weDM3OGFlMjsKICAgICAgICAgICAgcmV0dXJuIF8weGE3OGRjNSgweDM4NCkgIT0gdHlwZW9mIEluc3RhbGxUcmlnZ2VyCiAgICAgICAgICAgICAgPyBJbnN0YWxsVHJpZ2dlcgogICAgICAgICAgICAgIDogdm9pZCAoMHgyNmFlICogMHgxICsgLTB4YWQgKiAweDJlICsgLTB4NmMgKiAweDEyKTsKICAgICAgICAgIH0sCiAgICAgICAgICAweDM6IE9iamVjdCwKICAgICAgICAgIGdldCAweDQoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgyNDEzMzk7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDJkOGJiNDsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg2KCkgewogICAgICAgICAgICByZXR1cm4gZG9jdW1lbnQ7CiAgICAgICAgICB9LAogICAgICAgICAgMHg3OiBQcm9taXNlLAogICAgICAgICAgMHg4OiBEYXRlLAogICAgICAgICAgZ2V0IDB4OSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDI1Mjc4ODsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhhKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NTAxMWY4OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGIoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0ZjMyM2U7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4YygpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDUwOTBmNTsKICAgICAgICAgIH0sCiAgICAgICAgICAweGQ6IE1hdGgsCiAgICAgICAgICBnZXQgMHhlKCkgewogICAgICAgICAgICByZXR1cm4gXzB4M2ZmZTE1OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGYoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxOGI0YmU7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MTAoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0ODQwNTQ7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MTEoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0OTE3MTY7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MTIoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0NjIzMzU7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MTMoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgyNGRjMzQ7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MTQoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg2Y2FmOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE1KCkgewogICAgICAgICAgICByZXR1cm4gXzB4MmQyNTc4OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE2KCkgewogICAgICAgICAgICByZXR1cm4gXzB4M2EyYjkyOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE3KCkgewogICAgICAgICAgICByZXR1cm4gXzB4NWFiYzkzOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE4KCkgewogICAgICAgICAgICByZXR1cm4gXzB4NTczMDY1OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE5KCkgewogICAgICAgICAgICByZXR1cm4gXzB4NThiY2Y4OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDFhKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MTU1NWQ5OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDFiKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NWQzODQ1OwogICAgICAgICAgfSwKICAgICAgICAgIDB4MWM6IHBhcnNlSW50LAogICAgICAgICAgZ2V0IDB4MWQoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgzZDEzY2Y7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MWUoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0YTJkYWY7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MWYoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg2NDFlM2Q7CiAgICAgICAgICB9LAogICAgICAgICAgMHgyMDogSlNPTiwKICAgICAgICAgIGdldCAweDIxKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDhhMDgyOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDIyKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NGRmNTk2OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDIzKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NWRkZTU4OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDI0KCkgewogICAgICAgICAgICByZXR1cm4gXzB4NTQ4Njc2OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDI1KCkgewogICAgICAgICAgICByZXR1cm4gXzB4MjlhNWFjOwogICAgICAgICAgfSwKICAgICAgICAgIDB4MjY6IGFyZ3VtZW50cywKICAgICAgICB9LAogICAgICAgIHRoaXMKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDI1YTc5MihfMHgyZjI1ZjIpIHsKICAgICAgdmFyIF8weDMyOTAwNSA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIF8weDQ2MjMzNVtfMHgzMjkwMDUoMHgxODUpXSAmJgogICAgICAgIF8weDQ2MjMzNVtfMHgzMjkwMDUoMHgxODUpXVtfMHgzMjkwMDUoMHgyZGMpXSAmJgogICAgICAgIC0oLTB4NGYyICogMHg1ICsgMHgyNTRmICsgLTB4Yzk0KSAhPT0KICAgICAgICAgIF8weDJmMjVmMltfMHgzMjkwMDUoMHgyYzUpXSgKICAgICAgICAgICAgXzB4NDYyMzM1W18weDMyOTAwNSgweDE4NSldW18weDMyOTAwNSgweDJkYyldCiAgICAgICAgICApCiAgICAgICAgPyBfMHgzOTY5M2RbInNlYyJdCiAgICAgICAgOiBfMHgzOTY5M2RbXzB4MzI5MDA1KDB4MWI0KV07CiAgICB9CiAgICBmdW5jdGlvbiBfMHhkMjg3YTEoXzB4MzUyNjBkKSB7CiAgICAgIHZhciBfMHgyNDE4MTYgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4NDBhYzE3ID0gXzB4NDYyMzM1W18weDI0MTgxNigweDE4NSldW18weDI0MTgxNigweDJkYyldOwogICAgICByZXR1cm4gISgKICAgICAgICAhXzB4NDBhYzE3IHx8CiAgICAgICAgIV8weDM1MjYwZCB8fAogICAgICAgIC0oMHgxMTYgKiAtMHgyICsgLTB4MWFmOCAqIC0weDEgKyAtMHgxOGNiKSA9PT0KICAgICAgICAgIF8weDM1MjYwZFtfMHgyNDE4MTYoMHgyYzUpXShfMHg0MGFjMTcpCiAgICAgICk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyYjEzYWYoXzB4NTJjOTQ3KSB7CiAgICAgIHZhciBfMHgyMjEzNzUgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4N2VmZjg0ID0gXzB4NTJjOTQ3OwogICAgICBkZWNvZGVVUklDb21wb25lbnQoXzB4NTJjOTQ3KSA9PT0gXzB4NTJjOTQ3ICYmCiAgICAgICAgKF8weDdlZmY4NCA9IGVuY29kZVVSSShfMHg1MmM5NDcpKTsKICAgICAgdmFyIF8weDVlMWQ4OCA9IF8weDdlZmY4NFtfMHgyMjEzNzUoMHgyYzUpXSgiPyIpOwogICAgICBpZiAoXzB4NWUxZDg4ID4gMHgxNjczICogMHgxICsgMHgyMTUwICsgLTB4MzdjMykgewogICAgICAgIHZhciBfMHhjNzE3MCA9IF8weDdlZmY4NFtfMHgyMjEzNzUoMHgzYTcpXSgKICAgICAgICAgICAgLTB4ODBjICsgMHg3MWUgKiAweDIgKyAtMHg2MzAsCiAgICAgICAgICAgIF8weDVlMWQ4OCArICgweDIgKiAweDkxOSArIDB4NCAqIC0weDkzMSArIDB4MTI5MykKICAgICAgICAgICksCiAgICAgICAgICBfMHg4ZmJhZDkgPSBfMHg3ZWZmODRbXzB4MjIxMzc1KDB4M2E3KV0oCiAgICAgICAgICAgIF8weDVlMWQ4OCArICgtMHgxZGU0ICsgLTB4MiAqIC0weDExNjMgKyAweDRlMSAqIC0weDEpCiAgICAgICAgICApOwogICAgICAgIF8weDdlZmY4NCA9CiAgICAgICAgICBfMHhjNzE3MCArCiAgICAgICAgICBfMHg4ZmJhZDlbXzB4MjIxMzc1KDB4MzQyKV0oIlx4MjciKVsiam9pbiJdKF8weDIyMTM3NSgweDM3ZSkpOwogICAgICB9CiAgICAgIHJldHVybiBfMHg3ZWZmODQ7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgxOTU4YTUoXzB4NDI0MTNiLCBfMHg1ZTNkZTYpIHsKICAgICAgdmFyIF8weDQwNjIyMCA9IF8weDU2MTJkZTsKICAgICAgZm9yICgKICAgICAgICB2YXIgXzB4MzIwNDVhID0gIiIsCiAgICAgICAgICBfMHhiZTYzZGYgPSAiIiwKICAgICAgICAgIF8weDU2MjNhZSA9IDB4NWY2ICsgLTB4MjIwZSArIDB4MWMxODsKICAgICAgICBfMHg1NjIzYWUgPCBfMHg1ZTNkZTZbXzB4NDA2MjIwKDB4MjU5KV07CiAgICAgICAgXzB4NTYyM2FlKysKICAgICAgKQogICAgICAgIF8weDU2MjNhZSAlICgweDk1MSArIDB4YjE1ICsgMHgxMDUgKiAtMHgxNCkgPT0KICAgICAgICAtMHgxMGRlICsgMHgxNSAqIDB4MTg1ICsgMHgxICogLTB4ZjBiCiAgICAgICAgICA/IChfMHhiZTYzZGYgPSBfMHg1ZTNkZTZbXzB4NTYyM2FlXSkKICAgICAgICAgIDogKF8weDMyMDQ1YSArPSAiJiIgKyBfMHhiZTYzZGYgKyAiPSIgKyBfMHg1ZTNkZTZbXzB4NTYyM2FlXSk7CiAgICAgIHZhciBfMHg0ZGRjMzMgPSBfMHg0MjQxM2I7CiAgICAgIGlmIChfMHgzMjA0NWFbXzB4NDA2MjIwKDB4MjU5KV0gPiAtMHgxMzVkICsgMHg4ZTEgKyAtMHgyYyAqIC0weDNkKSB7CiAgICAgICAgdmFyIF8weDUwZmI0MiA9CiAgICAgICAgICAtKDB4MiAqIC0weDEyNTIgKyAweDEzICogMHg4NSArIDB4OTUgKiAweDJlKSA9PT0KICAgICAgICAgIF8weDQyNDEzYlsiaW5kZXhPZiJdKCI/IikKICAgICAgICAgICAgPyAiPyIKICAgICAgICAgICAgOiAiJiI7CiAgICAgICAgXzB4NGRkYzMzID0KICAgICAgICAgIF8weDQyNDEzYiArCiAgICAgICAgICBfMHg1MGZiNDIgKwogICAgICAgICAgXzB4MzIwNDVhW18weDQwNjIyMCgweDNhNyldKDB4MzI0ICsgLTB4ZjEgKiAtMHgxNyArIDB4MSAqIC0weDE4Y2EpOwogICAgICB9CiAgICAgIHJldHVybiBfMHg0ZGRjMzM7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyODg0MTUoXzB4NWE0MTllKSB7CiAgICAgIHZhciBfMHgyNTlmNTMgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4NDQ2NWVmID0gXzB4NWE0MTllWyJpbmRleE9mIl0oIj8iKTsKICAgICAgcmV0dXJuIC0oLTB4NzhjICsgLTB4MWE0YyArIC0weDZjNSAqIC0weDUpICE9PSBfMHg0NDY1ZWYKICAgICAgICA/IF8weDVhNDE5ZVtfMHgyNTlmNTMoMHgzYTcpXSgKICAgICAgICAgICAgXzB4NDQ2NWVmICsgKDB4OTA3ICsgMHgxMzdiICogMHgxICsgLTB4MWM4MSkKICAgICAgICAgICkKICAgICAgICA6ICIiOwogICAgfQogICAgZnVuY3Rpb24gXzB4NmE3Mzc1KF8weDJhOWE1NykgewogICAgICB2YXIgXzB4NDQ3NTk2ID0gXzB4NTYxMmRlOwogICAgICBmb3IgKAogICAgICAgIHZhciBfMHgxY2E2MjIgPSAtMHgxNmEzICogLTB4MSArIDB4ODdiICsgLTB4MWYxZTsKICAgICAgICBfMHgxY2E2MjIgPCBfMHg0NjIzMzVbIl9lbmFibGVQYXRoTGlzdFJlZ2V4Il1bImxlbmd0aCJdOwogICAgICAgIF8weDFjYTYyMisrCiAgICAgICkKICAgICAgICBpZiAoXzB4NDYyMzM1W18weDQ0NzU5NigweDFhOSldW18weDFjYTYyMl1bInRlc3QiXShfMHgyYTlhNTcpKQogICAgICAgICAgcmV0dXJuICEoLTB4NWVkICsgLTB4M2QgKiAtMHg0MSArIC0weDk5MCk7CiAgICAgIHJldHVybiAhKC0weDEgKiAtMHgyNmZmICsgLTB4MTFjMSAqIDB4MSArIC0weDE1M2QpOwogICAgfQogICAgZnVuY3Rpb24gXzB4N2Q4NDA0KF8weDM0OTY3ZikgewogICAgICB2YXIgXzB4NWU1NzhlID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gXzB4NWU1NzhlKDB4MTg2KSA9PT0gXzB4MzQ5NjdmIHx8ICJhcHBsaWNhdGlvbi9qc29uIiA9PT0gXzB4MzQ5NjdmOwogICAgfQogICAgZnVuY3Rpb24gXzB4M2FmMWJlKCkgewogICAgICB2YXIgXzB4MTM0N2Y3ID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gd18weDVjMzE0MCgKICAgICAgICBfMHgxMzQ3ZjcoMHgzNjgpLAogICAgICAgIHsKICAgICAgICAgIGdldCAweDAoKSB7CiAgICAgICAgICAgIHJldHVybiB3aW5kb3c7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDZhNzM3NTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgyKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NmNhZjsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgzKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MTk1OGE1OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDQoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgyYjEzYWY7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDI4ODQxNTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg2KCkgewogICAgICAgICAgICByZXR1cm4gXzB4OGVkYzNkOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDcoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0NjIzMzU7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4OCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDQ1ZTBlOTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg5KCkgewogICAgICAgICAgICByZXR1cm4gXzB4N2Q4NDA0OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGEoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxMjk0ZmY7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4YigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDIwY2JmMzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhjKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDViOTRiOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGQoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg1NzJlNDg7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4ZSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weGQyODdhMTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhmKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MjVhNzkyOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEwKCkgewogICAgICAgICAgICByZXR1cm4gXzB4Mzk2OTNkOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDExKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MWY0MmNiOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEyKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NTU2MTgyOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEzKCkgewogICAgICAgICAgICByZXR1cm4gc2V0VGltZW91dDsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgxNCgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDVjMzI4ZTsKICAgICAgICAgIH0sCiAgICAgICAgICAweDE1OiBhcmd1bWVudHMsCiAgICAgICAgICAweDE2OiBSZWdFeHAsCiAgICAgICAgfSwKICAgICAgICB0aGlzCiAgICAgICk7CiAgICB9CiAgICB2YXIgXzB4M2M0MjY2ID0gXzB4NTYxMmRlKDB4Mzg0KSAhPSB0eXBlb2YgVVJMICYmIFVSTCBpbnN0YW5jZW9mIE9iamVjdCwKICAgICAgXzB4MzMxMWQ3ID0gInVuZGVmaW5lZCIgIT0gdHlwZW9mIFJlcXVlc3QgJiYgUmVxdWVzdCBpbnN0YW5jZW9mIE9iamVjdCwKICAgICAgXzB4NGYxZmE0ID0gInVuZGVmaW5lZCIgIT0gdHlwZW9mIEhlYWRlcnMgJiYgSGVhZGVycyBpbnN0YW5jZW9mIE9iamVjdDsKICAgIGZ1bmN0aW9uIF8weDQxNWFkYigpIHsKICAgICAgdmFyIF8weDUxYWIzMiA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIHdpbmRvd1tfMHg1MWFiMzIoMHgxOTcpXTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDFkODJhYygpIHsKICAgICAgdmFyIF8weDIzNDBiNyA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIHdfMHg1YzMxNDAoCiAgICAgICAgXzB4MjM0MGI3KDB4MjM0KSwKICAgICAgICB7CiAgICAgICAgICBnZXQgMHgwKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDE1YWRiOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEoKSB7CiAgICAgICAgICAgIHJldHVybiB3aW5kb3c7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weGQyODdhMTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgzKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MjVhNzkyOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDQoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgzOTY5M2Q7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDZjYWY7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDFmNDJjYjsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg3KCkgewogICAgICAgICAgICByZXR1cm4gXzB4NTU2MTgyOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDgoKSB7CiAgICAgICAgICAgIHJldHVybiBzZXRUaW1lb3V0OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDkoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg1YzMyOGU7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4YSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDMzMTFkNzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhiKCkgewogICAgICAgICAgICByZXR1cm4gUmVxdWVzdDsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhjKCkgewogICAgICAgICAgICByZXR1cm4gXzB4M2M0MjY2OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGQoKSB7CiAgICAgICAgICAgIHJldHVybiBVUkw7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4ZSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDZhNzM3NTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhmKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MTk1OGE1OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEwKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MmIxM2FmOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDExKCkgewogICAgICAgICAgICByZXR1cm4gXzB4Mjg4NDE1OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEyKCkgewogICAgICAgICAgICByZXR1cm4gXzB4OGVkYzNkOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEzKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDYyMzM1OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE0KCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDVlMGU5OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE1KCkgewogICAgICAgICAgICByZXR1cm4gXzB4YjQ4ZTc3OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE2KCkgewogICAgICAgICAgICByZXR1cm4gXzB4N2Q4NDA0OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE3KCkgewogICAgICAgICAgICByZXR1cm4gXzB4MTI5NGZmOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE4KCkgewogICAgICAgICAgICByZXR1cm4gXzB4MjBjYmYzOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDE5KCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDViOTRiOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDFhKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NTcyZTQ4OwogICAgICAgICAgfSwKICAgICAgICAgIDB4MWI6IGFyZ3VtZW50cywKICAgICAgICB9LAogICAgICAgIHRoaXMKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weGI0OGU3NyhfMHgyOWNhYWYsIF8weGE0YWI4MikgewogICAgICB2YXIgXzB4MWNmOGQ2ID0gXzB4NTYxMmRlLAogICAgICAgIF8weDMxNDI5NyA9ICIiOwogICAgICBpZiAoXzB4MzMxMWQ3ICYmIF8weDI5Y2FhZiBpbnN0YW5jZW9mIFJlcXVlc3QpIHsKICAgICAgICB2YXIgXzB4MWYzNzRkID0gXzB4MjljYWFmW18weDFjZjhkNigweDM1YildW18weDFjZjhkNigweDMyYildKAogICAgICAgICAgXzB4MWNmOGQ2KDB4MjI4KQogICAgICAgICk7CiAgICAgICAgcmV0dXJuIF8weDFmMzc0ZCAmJiAoXzB4MzE0Mjk3ID0gXzB4MWYzNzRkKSwgXzB4MzE0Mjk3OwogICAgICB9CiAgICAgIGlmIChfMHhhNGFiODIgJiYgXzB4YTRhYjgyW18weDFjZjhkNigweDM1YildKSB7CiAgICAgICAgaWYgKF8weDRmMWZhNCAmJiBfMHhhNGFiODJbXzB4MWNmOGQ2KDB4MzViKV0gaW5zdGFuY2VvZiBIZWFkZXJzKSB7CiAgICAgICAgICB2YXIgXzB4NGRmZjgyID0gXzB4YTRhYjgyW18weDFjZjhkNigweDM1YildW18weDFjZjhkNigweDMyYildKAogICAgICAgICAgICBfMHgxY2Y4ZDYoMHgyMjgpCiAgICAgICAgICApOwogICAgICAgICAgcmV0dXJuIF8weDRkZmY4MiAmJiAoXzB4MzE0Mjk3ID0gXzB4NGRmZjgyKSwgXzB4MzE0Mjk3OwogICAgICAgIH0KICAgICAgICBpZiAoXzB4YTRhYjgyWyJoZWFkZXJzIl0gaW5zdGFuY2VvZiBBcnJheSkgewogICAgICAgICAgZm9yICgKICAgICAgICAgICAgdmFyIF8weDZhZTQ3YyA9IDB4ZDIwICsgMHg2OTkgKiAtMHg1ICsgLTB4MTNkZCAqIC0weDE7CiAgICAgICAgICAgIF8weDZhZTQ3YyA8IF8weGE0YWI4MlsiaGVhZGVycyJdW18weDFjZjhkNigweDI1OSldOwogICAgICAgICAgICBfMHg2YWU0N2MrKwogICAgICAgICAgKQogICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgXzB4MWNmOGQ2KDB4MjI4KSA9PQogICAgICAgICAgICAgIF8weGE0YWI4MltfMHgxY2Y4ZDYoMHgzNWIpXVtfMHg2YWU0N2NdWwogICAgICAgICAgICAgICAgLTB4MTJmNiArIC0weDIwN2YgKyAweDExMjcgKiAweDMKICAgICAgICAgICAgICBdWyJ0b0xvd2VyQ2FzZSJdKCkKICAgICAgICAgICAgKQogICAgICAgICAgICAgIHJldHVybiBfMHhhNGFiODJbXzB4MWNmOGQ2KDB4MzViKV1bXzB4NmFlNDdjXVsKICAgICAgICAgICAgICAgIC0weGFhMiArIC0weGUwZSArIDB4MThiMQogICAgICAgICAgICAgIF07CiAgICAgICAgfQogICAgICAgIGlmIChfMHhhNGFiODJbXzB4MWNmOGQ2KDB4MzViKV0gaW5zdGFuY2VvZiBPYmplY3QpIHsKICAgICAgICAgIGZvciAoCiAgICAgICAgICAgIHZhciBfMHgxNTA2YzggPSAtMHgxY2U0ICsgMHg4ZGMgKyAweGEwNCAqIDB4MiwKICAgICAgICAgICAgICBfMHgzMmZlY2IgPSBPYmplY3RbImtleXMiXShfMHhhNGFiODJbImhlYWRlcnMiXSk7CiAgICAgICAgICAgIF8weDE1MDZjOCA8IF8weDMyZmVjYltfMHgxY2Y4ZDYoMHgyNTkpXTsKICAgICAgICAgICAgXzB4MTUwNmM4KysKICAgICAgICAgICkgewogICAgICAgICAgICB2YXIgXzB4MjI4YjNkID0gXzB4MzJmZWNiW18weDE1MDZjOF07CiAgICAgICAgICAgIGlmICgiY29udGVudC10eXBlIiA9PT0gXzB4MjI4YjNkWyJ0b0xvd2VyQ2FzZSJdKCkpCiAgICAgICAgICAgICAgcmV0dXJuIF8weGE0YWI4MltfMHgxY2Y4ZDYoMHgzNWIpXVtfMHgyMjhiM2RdOwogICAgICAgICAgfQogICAgICAgICAgcmV0dXJuIF8weDMxNDI5NzsKICAgICAgICB9CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDEyOTRmZihfMHgxNDc1ZmYsIF8weDU3MDBkMSwgXzB4NTYzYjZmKSB7CiAgICAgIHZhciBfMHgzODNiMmEgPSBfMHg1NjEyZGU7CiAgICAgIGlmIChudWxsID09IF8weDU2M2I2ZiB8fCAiIiA9PT0gXzB4NTYzYjZmKSByZXR1cm4gXzB4MTQ3NWZmOwogICAgICBpZiAoCiAgICAgICAgKChfMHg1NjNiNmYgPSBfMHg1NjNiNmZbXzB4MzgzYjJhKDB4M2FlKV0oKSksCiAgICAgICAgXzB4MzgzYjJhKDB4MTg2KSA9PT0gXzB4NTcwMGQxKQogICAgICApIHsKICAgICAgICBfMHgxNDc1ZmZbXzB4MzgzYjJhKDB4MzM2KV0gPSAhKDB4ZmMgKyAtMHgyMmQ0ICsgMHgyMWQ4KTsKICAgICAgICB2YXIgXzB4MzhjZWFjID0gXzB4NTYzYjZmW18weDM4M2IyYSgweDM0MildKCImIiksCiAgICAgICAgICBfMHgxYjAxYjYgPSB7fTsKICAgICAgICBpZiAoXzB4MzhjZWFjKSB7CiAgICAgICAgICBmb3IgKAogICAgICAgICAgICB2YXIgXzB4NGM0NzQ1ID0gLTB4MjkgKiAtMHhkMyArIDB4MSAqIDB4YTAxICsgLTB4MmJjYzsKICAgICAgICAgICAgXzB4NGM0NzQ1IDwgXzB4MzhjZWFjWyJsZW5ndGgiXTsKICAgICAgICAgICAgXzB4NGM0NzQ1KysKICAgICAgICAgICkKICAgICAgICAgICAgXzB4MWIwMWI2WwogICAgICAgICAgICAgIF8weDM4Y2VhY1tfMHg0YzQ3NDVdW18weDM4M2IyYSgweDM0MildKCI9IilbCiAgICAgICAgICAgICAgICAweDIgKiAtMHgzOTEgKyAtMHgxICogLTB4OTlmICsgLTB4MjdkCiAgICAgICAgICAgICAgXQogICAgICAgICAgICBdID0gZGVjb2RlVVJJQ29tcG9uZW50KAogICAgICAgICAgICAgIF8weDM4Y2VhY1tfMHg0YzQ3NDVdW18weDM4M2IyYSgweDM0MildKCI9IilbCiAgICAgICAgICAgICAgICAweDFlNDQgKyAtMHgxNGUzICogLTB4MSArIC0weDMzMjYKICAgICAgICAgICAgICBdCiAgICAgICAgICAgICk7CiAgICAgICAgfQogICAgICAgIF8weDE0NzVmZltfMHgzODNiMmEoMHgxODkpXSA9IF8weDFiMDFiNjsKICAgICAgfSBlbHNlIF8weDE0NzVmZltfMHgzODNiMmEoMHgxODkpXSA9IEpTT05bInBhcnNlIl0oXzB4NTYzYjZmKTsKICAgICAgcmV0dXJuIF8weDE0NzVmZjsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDQ1ZTBlOShfMHgyZDMyODQsIF8weGI4ZDc4KSB7CiAgICAgIHZhciBfMHg1MjFmM2YgPSBfMHg1NjEyZGUsCiAgICAgICAgXzB4MzQ5NmEzID0gXzB4YjhkNzg7CiAgICAgIGlmICgKICAgICAgICBfMHg0NjIzMzVbXzB4NTIxZjNmKDB4MThkKV1bXzB4NTIxZjNmKDB4MjU5KV0gPgogICAgICAgIDB4MWY4ZiAqIDB4MSArIC0weDEgKiAweDIxZGQgKyAweGEgKiAweDNiCiAgICAgICkKICAgICAgICBmb3IgKAogICAgICAgICAgdmFyIF8weDMzNWVjNSA9IDB4YiAqIC0weGQzICsgLTB4MTk3NyAqIDB4MSArIC0weDQxICogLTB4ODg7CiAgICAgICAgICBfMHgzMzVlYzUgPCBfMHg0NjIzMzVbXzB4NTIxZjNmKDB4MThkKV1bXzB4NTIxZjNmKDB4MjU5KV07CiAgICAgICAgICBfMHgzMzVlYzUrKwogICAgICAgICkgewogICAgICAgICAgdmFyIF8weDNmODY4NiA9CiAgICAgICAgICAgIF8weDQ2MjMzNVtfMHg1MjFmM2YoMHgxOGQpXVtfMHgzMzVlYzVdWwogICAgICAgICAgICAgIC0weDIwMjMgKyAweGNiICogLTB4MTAgKyAtMHgxY2IgKiAtMHgxOQogICAgICAgICAgICBdOwogICAgICAgICAgaWYgKF8weDNmODY4NltfMHg1MjFmM2YoMHgyMmIpXShfMHhiOGQ3OCkpIHsKICAgICAgICAgICAgKF8weDM0OTZhMyA9IF8weGI4ZDc4W18weDUyMWYzZigweDM3NyldKAogICAgICAgICAgICAgIF8weDNmODY4NiwKICAgICAgICAgICAgICBfMHg0NjIzMzVbXzB4NTIxZjNmKDB4MThkKV1bXzB4MzM1ZWM1XVsKICAgICAgICAgICAgICAgIDB4MWExMiAqIC0weDEgKyAweDIzNjEgKyAtMHg5NGUKICAgICAgICAgICAgICBdCiAgICAgICAgICAgICkpLAogICAgICAgICAgICAgIF8weDJkMzI4NCAmJgogICAgICAgICAgICAgICAgXzB4M2Q0MGZmW18weDUyMWYzZigweDM5NyldWyJjYWxsIl0oCiAgICAgICAgICAgICAgICAgIF8weDJkMzI4NCwKICAgICAgICAgICAgICAgICAgXzB4NTIxZjNmKDB4MjQzKSwKICAgICAgICAgICAgICAgICAgXzB4NTIxZjNmKDB4MjIzKSArIF8weGI4ZDc4ICsgIlx4MGFSRVdSSVRFRDpceDIwIiArIF8weDM0OTZhMwogICAgICAgICAgICAgICAgKTsKICAgICAgICAgICAgYnJlYWs7CiAgICAgICAgICB9CiAgICAgICAgfQogICAgICByZXR1cm4gKF8weDM0OTZhMyA9IF8weDJiMTNhZihfMHgzNDk2YTMpKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDM0NGE0ZCgpIHsKICAgICAgdmFyIF8weDFiOGU0MSA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIHdfMHg1YzMxNDAoCiAgICAgICAgXzB4MWI4ZTQxKDB4MjBkKSwKICAgICAgICB7CiAgICAgICAgICBnZXQgMHgwKCkgewogICAgICAgICAgICByZXR1cm4gd2luZG93OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg2YTczNzU7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDZjYWY7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MygpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDE5NThhNTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg0KCkgewogICAgICAgICAgICByZXR1cm4gXzB4MmIxM2FmOwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDUoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgyODg0MTU7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDhlZGMzZDsKICAgICAgICAgIH0sCiAgICAgICAgICAweDc6IGFyZ3VtZW50cywKICAgICAgICB9LAogICAgICAgIHRoaXMKICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDNmNzIwZCgpIHsKICAgICAgXzB4M2FmMWJlKCksIF8weDFkODJhYygpLCBfMHgzNDRhNGQoKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDNiZmVjYihfMHg0YjIxZWQpIHsKICAgICAgdmFyIF8weDNhMGVlMiA9IF8weDU2MTJkZTsKICAgICAgKHRoaXNbXzB4M2EwZWUyKDB4MzQxKV0gPSAiQ29uZmlnRXhjZXB0aW9uIiksCiAgICAgICAgKHRoaXNbXzB4M2EwZWUyKDB4MzEyKV0gPSBfMHg0YjIxZWQpOwogICAgfQogICAgdmFyIF8weDU4OTA1NyA9IHsKICAgICAgICBjbjogewogICAgICAgICAgaG9zdDogXzB4NTYxMmRlKDB4MmM5KSwKICAgICAgICB9LAogICAgICB9LAogICAgICBfMHgyYmJmMDggPSBbXzB4NTYxMmRlKDB4MzBjKV0sCiAgICAgIF8weDNkNzBhNDsKICAgIGZ1bmN0aW9uIF8weDQzZjVhMyhfMHg1YTk4NWYpIHsKICAgICAgdmFyIF8weDIwZWNmOSA9IF8weDU2MTJkZSwKICAgICAgICBfMHgzYzQzY2MgPSAiIjsKICAgICAgcmV0dXJuIHsKICAgICAgICBob3N0OiAoXzB4M2M0M2NjID0KICAgICAgICAgIF8weDVhOTg1ZltfMHgyMGVjZjkoMHgxYjYpXSB8fCBfMHg1YTk4NWZbXzB4MjBlY2Y5KDB4MWFlKV0KICAgICAgICAgICAgPyBfMHg1YTk4NWZbXzB4MjBlY2Y5KDB4MWIzKV0KICAgICAgICAgICAgOiBfMHg1ODkwNTdbXzB4NWE5ODVmW18weDIwZWNmOSgweDIyNCldXVtfMHgyMGVjZjkoMHgyZGMpXSksCiAgICAgICAgcGF0aExpc3Q6IF8weDJiYmYwOCwKICAgICAgICByZXBvcnRVcmw6IF8weDNjNDNjYyArIF8weDJiYmYwOFsweDFkNyAqIDB4NyArIDB4MTA3MyArIC0weDFkNTRdLAogICAgICB9OwogICAgfQogICAgdmFyIF8weDM4M2JkNyA9ICEoMHgyNDQgKiAweGIgKyAtMHgxNmEgKiAtMHg0ICsgLTB4MWU5MyksCiAgICAgIF8weGQzOWVlMiwKICAgICAgXzB4OWU1MjBkOwogICAgZnVuY3Rpb24gXzB4NTNlZTMxKF8weDgxNzAyOCkgewogICAgICB2YXIgXzB4NWQ1ZThkID0gXzB4NTYxMmRlOwogICAgICByZXR1cm4gd18weDVjMzE0MCgKICAgICAgICBfMHg1ZDVlOGQoMHgzNGYpLAogICAgICAgIHsKICAgICAgICAgIDB4MDogT2JqZWN0LAogICAgICAgICAgMHgxOiBNYXRoLAogICAgICAgICAgZ2V0IDB4MigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDNiZmVjYjsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHgzKCkgewogICAgICAgICAgICByZXR1cm4gXzB4NmNhZjsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg0KCkgewogICAgICAgICAgICByZXR1cm4gXzB4NDYyMzM1OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDUoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHg0M2Y1YTM7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NigpIHsKICAgICAgICAgICAgcmV0dXJuIHNldFRpbWVvdXQ7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4NygpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDVjMzI4ZTsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg4KCkgewogICAgICAgICAgICByZXR1cm4gXzB4M2Q3MGE0OwogICAgICAgICAgfSwKICAgICAgICAgIHNldCAweDgoXzB4NTk4MmYwKSB7CiAgICAgICAgICAgIF8weDNkNzBhNCA9IF8weDU5ODJmMDsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHg5KCkgewogICAgICAgICAgICByZXR1cm4gY2xlYXJJbnRlcnZhbDsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhhKCkgewogICAgICAgICAgICByZXR1cm4gc2V0SW50ZXJ2YWw7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4YigpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDQ1MGI3MzsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhjKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MWEzOWM0OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweGQoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgzZjcyMGQ7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4ZSgpIHsKICAgICAgICAgICAgcmV0dXJuIF8weDU5OTkyZjsKICAgICAgICAgIH0sCiAgICAgICAgICBnZXQgMHhmKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MzlkNTY5OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDEwKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MWRiZTc0OwogICAgICAgICAgfSwKICAgICAgICAgIGdldCAweDExKCkgewogICAgICAgICAgICByZXR1cm4gXzB4MzgzYmQ3OwogICAgICAgICAgfSwKICAgICAgICAgIHNldCAweDExKF8weDQ4OGJjOCkgewogICAgICAgICAgICBfMHgzODNiZDcgPSBfMHg0ODhiYzg7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MTIoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxODcwN2Q7CiAgICAgICAgICB9LAogICAgICAgICAgZ2V0IDB4MTMoKSB7CiAgICAgICAgICAgIHJldHVybiBfMHgxYzNiNmQ7CiAgICAgICAgICB9LAogICAgICAgICAgMHgxNDogYXJndW1lbnRzLAogICAgICAgICAgMHgxNTogXzB4ODE3MDI4LAogICAgICAgIH0sCiAgICAgICAgdGhpcwogICAgICApOwogICAgfQogICAgZnVuY3Rpb24gXzB4MzQ5OGFmKF8weDNlOWJiOSkge30KICAgIGZ1bmN0aW9uIF8weDU5OTkyZihfMHgxMGRkOTcpIHsKICAgICAgdmFyIF8weDFiZWFiNyA9IF8weDU2MTJkZTsKICAgICAgZm9yICgKICAgICAgICB2YXIgXzB4NTJjNDY5ID0gMHhiICogLTB4MjYyICsgLTB4NjA2ICsgMHgxMDFlICogMHgyOwogICAgICAgIF8weDUyYzQ2OSA8IF8weDEwZGQ5N1tfMHgxYmVhYjcoMHgyNTkpXTsKICAgICAgICBfMHg1MmM0NjkrKwogICAgICApCiAgICAgICAgXzB4MTBkZDk3W18weDUyYzQ2OV0gJiYKICAgICAgICAgIF8weDQ2MjMzNVsiX2VuYWJsZVBhdGhMaXN0UmVnZXgiXVsicHVzaCJdKAogICAgICAgICAgICBuZXcgUmVnRXhwKF8weDEwZGQ5N1tfMHg1MmM0NjldKQogICAgICAgICAgKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDM5ZDU2OShfMHg1MWFiMDYpIHsKICAgICAgdmFyIF8weDU5ZDdhMSA9IF8weDU2MTJkZTsKICAgICAgaWYgKHZvaWQgKC0weDExYzggKiAweDEgKyAweDFmYTIgKiAweDEgKyAtMHhkZGEpICE9PSBfMHg1MWFiMDYpIHsKICAgICAgICBmb3IgKAogICAgICAgICAgdmFyIF8weDNlMjA3NiA9IC0weDNhYiAqIC0weDUgKyAtMHgxOWQ0ICsgMHgxYiAqIDB4NDc7CiAgICAgICAgICBfMHgzZTIwNzYgPCBfMHg1MWFiMDZbXzB4NTlkN2ExKDB4MjU5KV07CiAgICAgICAgICBfMHgzZTIwNzYrKwogICAgICAgICkKICAgICAgICAgIF8weDQ2MjMzNVtfMHg1OWQ3YTEoMHgxOGQpXVtfMHg1OWQ3YTEoMHgzNmUpXShbCiAgICAgICAgICAgIG5ldyBSZWdFeHAoCiAgICAgICAgICAgICAgXzB4NTFhYjA2W18weDNlMjA3Nl1bLTB4ZmIgKiAtMHgxICsgMHg5YTcgKiAweDQgKyAtMHg1ICogMHg3ZWJdCiAgICAgICAgICAgICksCiAgICAgICAgICAgIF8weDUxYWIwNltfMHgzZTIwNzZdWy0weDU3ICogMHg1NSArIDB4MWM5OSAqIDB4MSArIDB4NGJdLAogICAgICAgICAgXSk7CiAgICAgIH0KICAgIH0KICAgIGZ1bmN0aW9uIF8weDMyZTRhNigpIHsKICAgICAgdmFyIF8weDQ5NGVlOSA9IF8weDU2MTJkZTsKICAgICAgcmV0dXJuIHdpbmRvd1tfMHg0OTRlZTkoMHgzMTgpXSB8fCAiIjsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDFiZTFlMShfMHg1OGRiMDQpIHsKICAgICAgdmFyIF8weDMyYmRiMiA9IF8weDU2MTJkZSwKICAgICAgICBfMHg0NTU4YmUgPSBfMHg2Y2FmW18weDMyYmRiMigweDMyMyldLAogICAgICAgIF8weDRhYjkxYSA9IC0weDVkICogMHg1ZSArIC0weGIwNiArIC0weDQ3ICogLTB4YTM7CiAgICAgIF8weDMyYmRiMigweDJiNikgPT09IF8weDU4ZGIwNCAmJgogICAgICAgIChfMHg0YWI5MWEgPSAweDE3NTQgKyAweGQwICogMHg0ICsgLTB4MWE5MyksCiAgICAgICAgXzB4MzJiZGIyKDB4Mjg1KSA9PT0gXzB4NThkYjA0ICYmCiAgICAgICAgICAoXzB4NGFiOTFhID0gLTB4MTQ2ICogLTB4MTMgKyAweDEzICogMHhlZiArIC0weDI5ZWQpOwogICAgICB2YXIgXzB4MTc0MWJiID0gewogICAgICAgIHRzOiBuZXcgRGF0ZSgpW18weDMyYmRiMigweDE2ZCldKCksCiAgICAgICAgdjogXzB4NGFiOTFhLAogICAgICB9OwogICAgICBfMHg0NTU4YmVbXzB4MzJiZGIyKDB4MzZlKV0oXzB4MTc0MWJiKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDRkZTdlZigpIHsKICAgICAgdmFyIF8weDQ1Y2U2OSA9IF8weDU2MTJkZSwKICAgICAgICBfMHg1YzE5NjcsCiAgICAgICAgXzB4NTg2OTQxOwogICAgICB2b2lkICgweGJjMSArIDB4MSAqIDB4MTMwOSArIC0weDFlY2EpICE9PSBkb2N1bWVudFtfMHg0NWNlNjkoMHgyODUpXQogICAgICAgID8gKF8weDQ1Y2U2OSgweDI4NSksCiAgICAgICAgICAoXzB4NTg2OTQxID0gXzB4NDVjZTY5KDB4MWEwKSksCiAgICAgICAgICAoXzB4NWMxOTY3ID0gXzB4NDVjZTY5KDB4MWY2KSkpCiAgICAgICAgOiB2b2lkICgweDIwNTYgKyAweDIzMDYgKyAtMHg0MzVjKSAhPT0gZG9jdW1lbnRbXzB4NDVjZTY5KDB4MTVmKV0KICAgICAgICA/IChfMHg0NWNlNjkoMHgxNWYpLAogICAgICAgICAgKF8weDU4Njk0MSA9IF8weDQ1Y2U2OSgweDFjOCkpLAogICAgICAgICAgKF8weDVjMTk2NyA9IF8weDQ1Y2U2OSgweDMzZikpKQogICAgICAgIDogdm9pZCAoMHg2OCAqIDB4NTMgKyAweDNjNyAqIDB4MyArIC0weDJkMGQpICE9PQogICAgICAgICAgZG9jdW1lbnRbXzB4NDVjZTY5KDB4MmM2KV0KICAgICAgICA/IChfMHg0NWNlNjkoMHgyYzYpLAogICAgICAgICAgKF8weDU4Njk0MSA9IF8weDQ1Y2U2OSgweDJjYykpLAogICAgICAgICAgKF8weDVjMTk2NyA9IF8weDQ1Y2U2OSgweDFhNCkpKQogICAgICAgIDogdm9pZCAoLTB4MWJkNyArIDB4YzkgKiAtMHgyYiArIDB4M2Q5YSkgIT09CiAgICAgICAgICAgIGRvY3VtZW50W18weDQ1Y2U2OSgweDIyYSldICYmCiAgICAgICAgICAoXzB4NDVjZTY5KDB4MjJhKSwKICAgICAgICAgIChfMHg1ODY5NDEgPSBfMHg0NWNlNjkoMHgzMjIpKSwKICAgICAgICAgIChfMHg1YzE5NjcgPSBfMHg0NWNlNjkoMHgxNjYpKSksCiAgICAgICAgZG9jdW1lbnRbXzB4NDVjZTY5KDB4MmY2KV0oCiAgICAgICAgICBfMHg1ODY5NDEsCiAgICAgICAgICBmdW5jdGlvbiAoKSB7CiAgICAgICAgICAgIF8weDFiZTFlMShkb2N1bWVudFtfMHg1YzE5NjddKTsKICAgICAgICAgIH0sCiAgICAgICAgICAhKDB4MTA4OCArIDB4MThjMiArIDB4ZGMzICogLTB4MykKICAgICAgICApLAogICAgICAgIF8weDFiZTFlMShkb2N1bWVudFtfMHg1YzE5NjddKTsKICAgIH0KICAgIGZ1bmN0aW9uIF8weDNmZjNmMSgpIHsKICAgICAgXzB4NThjMzExKCk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0YzcyN2UoKSB7CiAgICAgIHZhciBfMHgzZjUwOTQgPSBfMHg1NjEyZGU7CiAgICAgIGZ1bmN0aW9uIF8weDExNWM2YShfMHgyMTYyYjIpIHsKICAgICAgICB2YXIgXzB4NGNjMTJlID0gd18weDI1ZjM7CiAgICAgICAgXzB4NDYyMzM1WyJ0cmlnZ2VyVW5sb2FkIl0gfHwKICAgICAgICAgICgoXzB4NDYyMzM1W18weDRjYzEyZSgweDIwNCldID0gISgKICAgICAgICAgICAgMHgxICogLTB4NjMyICsKICAgICAgICAgICAgMHgzICogLTB4YjcxICsKICAgICAgICAgICAgLTB4MWMzICogLTB4MTcKICAgICAgICAgICkpLAogICAgICAgICAgXzB4M2ZmM2YxKCkpOwogICAgICB9CiAgICAgIHdpbmRvdyAmJgogICAgICAgIHdpbmRvd1tfMHgzZjUwOTQoMHgyZjYpXSAmJgogICAgICAgICh3aW5kb3dbXzB4M2Y1MDk0KDB4MmY2KV0oXzB4M2Y1MDk0KDB4MzdkKSwgXzB4MTE1YzZhKSwKICAgICAgICB3aW5kb3dbXzB4M2Y1MDk0KDB4MmY2KV0oXzB4M2Y1MDk0KDB4MjliKSwgXzB4MTE1YzZhKSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg1Yjg1MGIoKSB7CiAgICAgIHZhciBfMHg0ZDBiZTQgPSBfMHg1NjEyZGU7CiAgICAgIGZvciAoCiAgICAgICAgdmFyIF8weDM1YTM5ZSA9IGRvY3VtZW50W18weDRkMGJlNCgweDI3MildW18weDRkMGJlNCgweDM0MildKCI7IiksCiAgICAgICAgICBfMHgzMDQ2YTMgPSBbXSwKICAgICAgICAgIF8weDU4OTE0YyA9IC0weDkyMyArIC0weDY2YSAqIC0weDUgKyAtMHgxNmVmOwogICAgICAgIF8weDU4OTE0YyA8IF8weDM1YTM5ZVtfMHg0ZDBiZTQoMHgyNTkpXTsKICAgICAgICBfMHg1ODkxNGMrKwogICAgICApCiAgICAgICAgaWYgKAogICAgICAgICAgXzB4NGQwYmU0KDB4M2I1KSA9PQogICAgICAgICAgKF8weDMwNDZhMyA9IF8weDM1YTM5ZVtfMHg1ODkxNGNdW18weDRkMGJlNCgweDM0MildKCI9IikpWwogICAgICAgICAgICAtMHg3Y2QgKiAtMHgxICsgLTB4MTY3OCArIDB4ZWFiCiAgICAgICAgICBdWyJ0cmltIl0oKQogICAgICAgICkgewogICAgICAgICAgXzB4NmNhZltfMHg0ZDBiZTQoMHgzYjUpXSA9IF8weDMwNDZhM1sweDIwMGYgKiAtMHgxICsgMHg5MjYgKyAweDE2ZWFdOwogICAgICAgICAgYnJlYWs7CiAgICAgICAgfQogICAgfQogICAgZnVuY3Rpb24gXzB4NDk4MzQ5KF8weDVlZmNkNikgewogICAgICByZXR1cm4gbmV3IF8weDUzZWUzMShfMHg1ZWZjZDYpOwogICAgfQogICAgZnVuY3Rpb24gXzB4NDc1MTk0KF8weDU2ZTFlMykgewogICAgICAtMHhhN2YgKyAtMHhiICogMHgxOGEgKyAweDFiNmQgPT09IF8weDU2ZTFlMwogICAgICAgID8gc2V0VGltZW91dChfMHg1MDQ3ZDgsIDB4MSAqIC0weGI1NSArIC0weDEwMzEgKyAweDFiZWEgKiAweDEpCiAgICAgICAgOiAtMHhlZjEgKyAtMHhmZDMgKiAtMHgxICsgLTB4ZTEgPT09IF8weDU2ZTFlMyAmJgogICAgICAgICAgc2V0VGltZW91dChfMHg1YzMyOGUsIDB4NiAqIDB4MzhkICsgLTB4NDkgKiAtMHgyYiArIC0weDk1ICogMHgzOSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHg0YTQxMTEoXzB4MmJhNjg4LCBfMHgxZTEzNWMpIHsKICAgICAgdmFyIF8weDE4ZTliMSA9IF8weDU2MTJkZTsKICAgICAgLTB4ZmFiICsgMHg5ICogLTB4MmEyICsgMHgyNzVlID09PSBfMHgyYmE2ODggJiYKICAgICAgICAoXzB4NDYyMzM1W18weDE4ZTliMSgweDM0YSldID0gT2JqZWN0WyJhc3NpZ24iXSgKICAgICAgICAgIHt9LAogICAgICAgICAgXzB4NDYyMzM1W18weDE4ZTliMSgweDM0YSldLAogICAgICAgICAgXzB4MWUxMzVjCiAgICAgICAgKSk7CiAgICB9CiAgICBmdW5jdGlvbiBfMHgyNzFkZWEoXzB4MjA1NjNlKSB7CiAgICAgIHZvaWQgKC0weDFhYTIgKyAtMHgyNDA3ICsgMHgzICogMHgxNGUzKSAhPT0gXzB4MjA1NjNlICYmCiAgICAgICAgIiIgIT0gXzB4MjA1NjNlICYmCiAgICAgICAgKF8weDZjYWZbInR0d2lkIl0gPSBfMHgyMDU2M2UpOwogICAgfQogICAgZnVuY3Rpb24gXzB4M2E0YTFhKF8weDViODJiNSkgewogICAgICB2YXIgXzB4MzBhZGJiID0gXzB4NTYxMmRlOwogICAgICB2b2lkICgweGIgKiAtMHgxN2QgKyAtMHgyMjdkICsgMHgzMmRjKSAhPT0gXzB4NWI4MmI1ICYmCiAgICAgICAgIiIgIT0gXzB4NWI4MmI1ICYmCiAgICAgICAgKF8weDZjYWZbXzB4MzBhZGJiKDB4MzE2KV0gPSBfMHg1YjgyYjUpOwogICAgfQogICAgZnVuY3Rpb24gXzB4M2YwYTY2KF8weDUzZTA2OSkgewogICAgICB2YXIgXzB4MzhkNWI2ID0gXzB4NTYxMmRlOwogICAgICB2b2lkICgtMHg3ZWIgKiAweDMgKyAweGM0ICogMHgyICsgLTB4MSAqIC0weDE2MzkpICE9PSBfMHg1M2UwNjkgJiYKICAgICAgICAiIiAhPSBfMHg1M2UwNjkgJiYKICAgICAgICAoXzB4NmNhZltfMHgzOGQ1YjYoMHgzMzkpXSA9IF8weDUzZTA2OSk7CiAgICB9CiAgICAoXzB4NTNlZTMxW18weDU2MTJkZSgweDM0NCldW18weDU2MTJkZSgweDFhMyldID0gXzB4NWMyMDE0KSwKICAgICAgKF8weDUzZWUzMVtfMHg1NjEyZGUoMHgzNDQpXVsiZ2V0UmVmZXJlciJdID0gXzB4MzJlNGE2KSwKICAgICAgKF8weDUzZWUzMVtfMHg1NjEyZGUoMHgzNDQpXVsic2V0VXNlck1vZGUiXSA9IF8weDM0OThhZiksCiAgICAgIChfMHhkMzllZTIgPSBfMHgyNGRjMzQoXzB4NDViOTRiWyJyZWZlcmVyS2V5Il0pIHx8ICIiKSwKICAgICAgXzB4MmVjYzVhKF8weDQ1Yjk0YlsicmVmZXJlcktleSJdKSwKICAgICAgXzB4NTYxMmRlKDB4MmQ2KSA9PT0gXzB4ZDM5ZWUyCiAgICAgICAgPyAoXzB4ZDM5ZWUyID0gIiIpCiAgICAgICAgOiAiIiA9PT0gXzB4ZDM5ZWUyICYmIChfMHhkMzllZTIgPSBkb2N1bWVudFtfMHg1NjEyZGUoMHgyZmEpXSksCiAgICAgIF8weGQzOWVlMiAmJiAod2luZG93W18weDU2MTJkZSgweDMxOCldID0gXzB4ZDM5ZWUyKSwKICAgICAgKF8weDllNTIwZCA9IF8weDUxNDFhYygpKSwKICAgICAgXzB4OWU1MjBkICYmCiAgICAgICAgKChfMHg2Y2FmW18weDU2MTJkZSgweDJiNCldID0gXzB4OWU1MjBkKSwKICAgICAgICAoXzB4NmNhZlsibXNTdGF0dXMiXSA9IF8weDM5NjkzZFsiYXNndyJdKSksCiAgICAgIHNldFRpbWVvdXQoZnVuY3Rpb24gKCkgewogICAgICAgIF8weDE4YTlmNygpLCBfMHgxZGJlNzQoKSwgXzB4NGRlN2VmKCksIF8weDRjNzI3ZSgpLCBfMHgyMWZhMjgoKTsKICAgICAgfSwgLTB4MWE4MyArIDB4MTVlZSArIC0weGQgKiAtMHgxNDEpLAogICAgICBfMHg1Yjg1MGIoKSwKICAgICAgXzB4NTk5OTJmKFtfMHg1NjEyZGUoMHgzMGMpXSk7CiAgICB2YXIgXzB4MTY0OWJjID0gISgtMHhjNmIgKiAtMHgxICsgLTB4MjMxNSArIDB4MTZhYSk7CiAgICAoXzB4MWQxOGYyWyJmcm9udGllclNpZ24iXSA9IF8weDVjMjAxNCksCiAgICAgIChfMHgxZDE4ZjJbXzB4NTYxMmRlKDB4MmU4KV0gPSBfMHgzMmU0YTYpLAogICAgICAoXzB4MWQxOGYyW18weDU2MTJkZSgweDNiOSldID0gXzB4NDk4MzQ5KSwKICAgICAgKF8weDFkMThmMltfMHg1NjEyZGUoMHgxZjgpXSA9IF8weDE2NDliYyksCiAgICAgIChfMHgxZDE4ZjJbInJlcG9ydCJdID0gXzB4NDc1MTk0KSwKICAgICAgKF8weDFkMThmMltfMHg1NjEyZGUoMHgyOTgpXSA9IF8weDRhNDExMSksCiAgICAgIChfMHgxZDE4ZjJbXzB4NTYxMmRlKDB4MWE3KV0gPSBfMHgzYTRhMWEpLAogICAgICAoXzB4MWQxOGYyWyJzZXRUVFdlYmlkVjIiXSA9IF8weDNmMGE2NiksCiAgICAgIChfMHgxZDE4ZjJbXzB4NTYxMmRlKDB4MjQ0KV0gPSBfMHgyNzFkZWEpLAogICAgICAoXzB4MWQxOGYyW18weDU2MTJkZSgweDM3OCldID0gXzB4MzQ5OGFmKSwKICAgICAgT2JqZWN0WyJkZWZpbmVQcm9wZXJ0eSJdKF8weDFkMThmMiwgXzB4NTYxMmRlKDB4M2JkKSwgewogICAgICAgIHZhbHVlOiAhKDB4MSAqIDB4MjA2OSArIC0weDE0MDMgKyAtMHhjNjYpLAogICAgICB9KTsKICB9KTsKfQpjb25zdCBzdHJpbmdUb0J5dGVzID0gZnVuY3Rpb24gKHQpIHsKICAgIHQgPSBkZWNvZGVVUklDb21wb25lbnQoZW5jb2RlVVJJQ29tcG9uZW50KHQpKTsKICAgIGxldCBuID0gW107CiAgICBmb3IgKGxldCBlID0gMDsgZSA8IHQubGVuZ3RoOyBlKyspIG4ucHVzaCgyNTUgJiB0LmNoYXJDb2RlQXQoZSkpOwogICAgcmV0dXJuIG47CiAgfSwKICBieXRlc1RvU3RyaW5nID0gZnVuY3Rpb24gKHQpIHsKICAgIGxldCBuID0gW107CiAgICBmb3IgKGxldCBlID0gMDsgZSA8IHQubGVuZ3RoOyBlKyspIG4ucHVzaChTdHJpbmcuZnJvbUNoYXJDb2RlKHRbZV0pKTsKICAgIHJldHVybiBuLmpvaW4oIiIpOwogIH0sCiAgYnl0ZXNUb1dvcmRzID0gZnVuY3Rpb24gKHQpIHsKICAgIGxldCBuID0gW107CiAgICBmb3IgKGxldCBlID0gMCwgcCA9IDA7IGUgPCB0Lmxlbmd0aDsgZSsrLCBwICs9IDgpCiAgICAgIG5bcCA+Pj4gNV0gfD0gdFtlXSA8PCAoMjQgLSAocCAlIDMyKSk7CiAgICByZXR1cm4gbjsKICB9LAogIHdvcmRzVG9CeXRlcyA9IGZ1bmN0aW9uICh0KSB7CiAgICBsZXQgbiA9IFtdOwogICAgZm9yIChsZXQgZSA9IDA7IGUgPCAzMiAqIHQubGVuZ3RoOyBlICs9IDgpCiAgICAgIG4ucHVzaCgodFtlID4+PiA1XSA+Pj4gKDI0IC0gKGUgJSAzMikpKSAmIDI1NSk7CiAgICByZXR1cm4gbjsKICB9LAogIGJ5dGVzVG9IZXggPSBmdW5jdGlvbiAodCkgewogICAgbGV0IG4gPSBbXTsKICAgIGZvciAobGV0IGUgPSAwOyBlIDwgdC5sZW5ndGg7IGUrKykKICAgICAgbi5wdXNoKCh0W2VdID4+PiA0KS50b1N0cmluZygxNikpLCBuLnB1c2goKDE1ICYgdFtlXSkudG9TdHJpbmcoMTYpKTsKICAgIHJldHVybiBuLmpvaW4oIiIpOwogIH0sCiAgX2ZmID0gZnVuY3Rpb24gKHQsIG4sIGUsIHAsIHIsIG8sIGkpIHsKICAgIHZhciB1ID0gdCArICgobiAmIGUpIHwgKH5uICYgcCkpICsgKHIgPj4+IDApICsgaTsKICAgIHJldHVybiAoKHUgPDwgbykgfCAodSA+Pj4gKDMyIC0gbykpKSArIG47CiAgfSwKICBfZ2cgPSBmdW5jdGlvbiAodCwgbiwgZSwgcCwgciwgbywgaSkgewogICAgdmFyIHUgPSB0ICsgKChuICYgcCkgfCAoZSAmIH5wKSkgKyAociA+Pj4gMCkgKyBpOwogICAgcmV0dXJuICgodSA8PCBvKSB8ICh1ID4+PiAoMzIgLSBvKSkpICsgbjsKICB9LAogIF9oaCA9IGZ1bmN0aW9uICh0LCBuLCBlLCBwLCByLCBvLCBpKSB7CiAgICB2YXIgdSA9IHQgKyAobiBeIGUgXiBwKSArIChyID4+PiAwKSArIGk7CiAgICByZXR1cm4gKCh1IDw8IG8pIHwgKHUgPj4+ICgzMiAtIG8pKSkgKyBuOwogIH0sCiAgX2lpID0gZnVuY3Rpb24gKHQsIG4sIGUsIHAsIHIsIG8sIGkpIHsKICAgIHZhciB1ID0gdCArIChlIF4gKG4gfCB+cCkpICsgKHIgPj4+IDApICsgaTsKICAgIHJldHVybiAoKHUgPDwgbykgfCAodSA+Pj4gKDMyIC0gbykpKSArIG47CiAgfSwKICByb3RsID0gZnVuY3Rpb24gKHQsIG4pIHsKICAgIHJldHVybiAodCA8PCBuKSB8ICh0ID4+PiAoMzIgLSBuKSk7CiAgfSwKICBlbmRpYW4gPSBmdW5jdGlvbiAodCkgewogICAgaWYgKHQuY29uc3RydWN0b3IgPT0gTnVtYmVyKQogICAgICByZXR1cm4gKDE2NzExOTM1ICYgcm90bCh0LCA4KSkgfCAoNDI3ODI1NTM2MCAmIHJvdGwodCwgMjQpKTsKICAgIGZvciAobGV0IG4gPSAwOyBuIDwgdC5sZW5ndGg7IG4rKykgdFtuXSA9IGVuZGlhbih0W25dKTsKICAgIHJldHVybiB0OwogIH07CmZ1bmN0aW9uIHVuKHQsIG4pIHsKICB0ID0gc3RyaW5nVG9CeXRlcyh0KTsKICBsZXQgZSA9IGJ5dGVzVG9Xb3Jkcyh0KSwKICAgIHIgPSA4ICogdC5sZW5ndGgsCiAgICBvID0gMTczMjU4NDE5MywKICAgIGkgPSAtMjcxNzMzODc5LAogICAgdSA9IC0xNzMyNTg0MTk0LAogICAgbCA9IDI3MTczMzg3ODsKICBmb3IgKGxldCB0ID0gMDsgdCA8IGUubGVuZ3RoOyB0KyspCiAgICBlW3RdID0KICAgICAgKDE2NzExOTM1ICYgKChlW3RdIDw8IDgpIHwgKGVbdF0gPj4+IDI0KSkpIHwKICAgICAgKDQyNzgyNTUzNjAgJiAoKGVbdF0gPDwgMjQpIHwgKGVbdF0gPj4+IDgpKSk7CiAgKGVbciA+Pj4gNV0gfD0gMTI4IDw8IHIgJSAzMiksIChlWzE0ICsgKCgociArIDY0KSA+Pj4gOSkgPDwgNCldID0gcik7CiAgbGV0IGYgPSBfZmYsCiAgICBzID0gX2dnLAogICAgYyA9IF9oaCwKICAgIGQgPSBfaWk7CiAgZm9yIChwID0gMDsgcCA8IGUubGVuZ3RoOyBwICs9IDE2KSB7CiAgICB2YXIgZyA9IG8sCiAgICAgIF8gPSBpLAogICAgICBoID0gdSwKICAgICAgYSA9IGw7CiAgICAobyA9IGQoCiAgICAgIChvID0gYygKICAgICAgICAobyA9IGMoCiAgICAgICAgICAobyA9IGMoCiAgICAgICAgICAgIChvID0gYygKICAgICAgICAgICAgICAobyA9IHMoCiAgICAgICAgICAgICAgICAobyA9IHMoCiAgICAgICAgICAgICAgICAgIChvID0gcygKICAgICAgICAgICAgICAgICAgICAobyA9IHMoCiAgICAgICAgICAgICAgICAgICAgICAobyA9IGYoCiAgICAgICAgICAgICAgICAgICAgICAgIChvID0gZigKICAgICAgICAgICAgICAgICAgICAgICAgICAobyA9IGYoCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAobyA9IGYobywgaSwgdSwgbCwgZVtwICsgMF0sIDcsIC02ODA4NzY5MzYpKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIChpID0gZigKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgaSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKHUgPSBmKAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIHUsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKGwgPSBmKGwsIG8sIGksIHUsIGVbcCArIDFdLCAxMiwgLTM4OTU2NDU4NikpLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIG8sCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgaSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICBlW3AgKyAyXSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAxNywKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICA2MDYxMDU4MTkKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIG8sCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIGVbcCArIDNdLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAyMiwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgLTEwNDQ1MjUzMzAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgdSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBlW3AgKyA0XSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIDcsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAtMTc2NDE4ODk3CiAgICAgICAgICAgICAgICAgICAgICAgICAgKSksCiAgICAgICAgICAgICAgICAgICAgICAgICAgKGkgPSBmKAogICAgICAgICAgICAgICAgICAgICAgICAgICAgaSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICh1ID0gZigKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgdSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgKGwgPSBmKGwsIG8sIGksIHUsIGVbcCArIDVdLCAxMiwgMTIwMDA4MDQyNikpLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBvLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBpLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICBlW3AgKyA2XSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgMTcsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIC0xNDczMjMxMzQxCiAgICAgICAgICAgICAgICAgICAgICAgICAgICApKSwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBvLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgZVtwICsgN10sCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAyMiwKICAgICAgICAgICAgICAgICAgICAgICAgICAgIC00NTcwNTk4MwogICAgICAgICAgICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgICAgICAgICAgIHUsCiAgICAgICAgICAgICAgICAgICAgICAgICAgbCwKICAgICAgICAgICAgICAgICAgICAgICAgICBlW3AgKyA4XSwKICAgICAgICAgICAgICAgICAgICAgICAgICA3LAogICAgICAgICAgICAgICAgICAgICAgICAgIDE3NzAwMzU0MTYKICAgICAgICAgICAgICAgICAgICAgICAgKSksCiAgICAgICAgICAgICAgICAgICAgICAgIChpID0gZigKICAgICAgICAgICAgICAgICAgICAgICAgICBpLAogICAgICAgICAgICAgICAgICAgICAgICAgICh1ID0gZigKICAgICAgICAgICAgICAgICAgICAgICAgICAgIHUsCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAobCA9IGYobCwgbywgaSwgdSwgZVtwICsgOV0sIDEyLCAtMTk1ODQxNDQxNykpLAogICAgICAgICAgICAgICAgICAgICAgICAgICAgbywKICAgICAgICAgICAgICAgICAgICAgICAgICAgIGksCiAgICAgICAgICAgICAgICAgICAgICAgICAgICBlW3AgKyAxMF0sCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAxNywKICAgICAgICAgICAgICAgICAgICAgICAgICAgIC00MjA2MwogICAgICAgICAgICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgICAgICAgICAgICAgbywKICAgICAgICAgICAgICAgICAgICAgICAgICBlW3AgKyAxMV0sCiAgICAgICAgICAgICAgICAgICAgICAgICAgMjIsCiAgICAgICAgICAgICAgICAgICAgICAgICAgLTE5OTA0MDQxNjIKICAgICAgICAgICAgICAgICAgICAgICAgKSksCiAgICAgICAgICAgICAgICAgICAgICAgIHUsCiAgICAgICAgICAgICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgICAgICAgICAgIGVbcCArIDEyXSwKICAgICAgICAgICAgICAgICAgICAgICAgNywKICAgICAgICAgICAgICAgICAgICAgICAgMTgwNDYwMzY4MgogICAgICAgICAgICAgICAgICAgICAgKSksCiAgICAgICAgICAgICAgICAgICAgICAoaSA9IGYoCiAgICAgICAgICAgICAgICAgICAgICAgIGksCiAgICAgICAgICAgICAgICAgICAgICAgICh1ID0gZigKICAgICAgICAgICAgICAgICAgICAgICAgICB1LAogICAgICAgICAgICAgICAgICAgICAgICAgIChsID0gZihsLCBvLCBpLCB1LCBlW3AgKyAxM10sIDEyLCAtNDAzNDExMDEpKSwKICAgICAgICAgICAgICAgICAgICAgICAgICBvLAogICAgICAgICAgICAgICAgICAgICAgICAgIGksCiAgICAgICAgICAgICAgICAgICAgICAgICAgZVtwICsgMTRdLAogICAgICAgICAgICAgICAgICAgICAgICAgIDE3LAogICAgICAgICAgICAgICAgICAgICAgICAgIC0xNTAyMDAyMjkwCiAgICAgICAgICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgICAgICAgICBsLAogICAgICAgICAgICAgICAgICAgICAgICBvLAogICAgICAgICAgICAgICAgICAgICAgICBlW3AgKyAxNV0sCiAgICAgICAgICAgICAgICAgICAgICAgIDIyLAogICAgICAgICAgICAgICAgICAgICAgICAxMjM2NTM1MzI5CiAgICAgICAgICAgICAgICAgICAgICApKSwKICAgICAgICAgICAgICAgICAgICAgIHUsCiAgICAgICAgICAgICAgICAgICAgICBsLAogICAgICAgICAgICAgICAgICAgICAgZVtwICsgMV0sCiAgICAgICAgICAgICAgICAgICAgICA1LAogICAgICAgICAgICAgICAgICAgICAgLTE2NTc5NjUxMAogICAgICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgICAgIChpID0gcygKICAgICAgICAgICAgICAgICAgICAgIGksCiAgICAgICAgICAgICAgICAgICAgICAodSA9IHMoCiAgICAgICAgICAgICAgICAgICAgICAgIHUsCiAgICAgICAgICAgICAgICAgICAgICAgIChsID0gcyhsLCBvLCBpLCB1LCBlW3AgKyA2XSwgOSwgLTEwNjk1MDE2MzIpKSwKICAgICAgICAgICAgICAgICAgICAgICAgbywKICAgICAgICAgICAgICAgICAgICAgICAgaSwKICAgICAgICAgICAgICAgICAgICAgICAgZVtwICsgMTFdLAogICAgICAgICAgICAgICAgICAgICAgICAxNCwKICAgICAgICAgICAgICAgICAgICAgICAgNjQzNzE3NzEzCiAgICAgICAgICAgICAgICAgICAgICApKSwKICAgICAgICAgICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgICAgICAgICBvLAogICAgICAgICAgICAgICAgICAgICAgZVtwICsgMF0sCiAgICAgICAgICAgICAgICAgICAgICAyMCwKICAgICAgICAgICAgICAgICAgICAgIC0zNzM4OTczMDIKICAgICAgICAgICAgICAgICAgICApKSwKICAgICAgICAgICAgICAgICAgICB1LAogICAgICAgICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgICAgICAgZVtwICsgNV0sCiAgICAgICAgICAgICAgICAgICAgNSwKICAgICAgICAgICAgICAgICAgICAtNzAxNTU4NjkxCiAgICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgICAoaSA9IHMoCiAgICAgICAgICAgICAgICAgICAgaSwKICAgICAgICAgICAgICAgICAgICAodSA9IHMoCiAgICAgICAgICAgICAgICAgICAgICB1LAogICAgICAgICAgICAgICAgICAgICAgKGwgPSBzKGwsIG8sIGksIHUsIGVbcCArIDEwXSwgOSwgMzgwMTYwODMpKSwKICAgICAgICAgICAgICAgICAgICAgIG8sCiAgICAgICAgICAgICAgICAgICAgICBpLAogICAgICAgICAgICAgICAgICAgICAgZVtwICsgMTVdLAogICAgICAgICAgICAgICAgICAgICAgMTQsCiAgICAgICAgICAgICAgICAgICAgICAtNjYwNDc4MzM1CiAgICAgICAgICAgICAgICAgICAgKSksCiAgICAgICAgICAgICAgICAgICAgbCwKICAgICAgICAgICAgICAgICAgICBvLAogICAgICAgICAgICAgICAgICAgIGVbcCArIDRdLAogICAgICAgICAgICAgICAgICAgIDIwLAogICAgICAgICAgICAgICAgICAgIC00MDU1Mzc4NDgKICAgICAgICAgICAgICAgICAgKSksCiAgICAgICAgICAgICAgICAgIHUsCiAgICAgICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgICAgIGVbcCArIDldLAogICAgICAgICAgICAgICAgICA1LAogICAgICAgICAgICAgICAgICA1Njg0NDY0MzgKICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgKGkgPSBzKAogICAgICAgICAgICAgICAgICBpLAogICAgICAgICAgICAgICAgICAodSA9IHMoCiAgICAgICAgICAgICAgICAgICAgdSwKICAgICAgICAgICAgICAgICAgICAobCA9IHMobCwgbywgaSwgdSwgZVtwICsgMTRdLCA5LCAtMTAxOTgwMzY5MCkpLAogICAgICAgICAgICAgICAgICAgIG8sCiAgICAgICAgICAgICAgICAgICAgaSwKICAgICAgICAgICAgICAgICAgICBlW3AgKyAzXSwKICAgICAgICAgICAgICAgICAgICAxNCwKICAgICAgICAgICAgICAgICAgICAtMTg3MzYzOTYxCiAgICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgICBsLAogICAgICAgICAgICAgICAgICBvLAogICAgICAgICAgICAgICAgICBlW3AgKyA4XSwKICAgICAgICAgICAgICAgICAgMjAsCiAgICAgICAgICAgICAgICAgIDExNjM1MzE1MDEKICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgdSwKICAgICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgICBlW3AgKyAxM10sCiAgICAgICAgICAgICAgICA1LAogICAgICAgICAgICAgICAgLTE0NDQ2ODE0NjcKICAgICAgICAgICAgICApKSwKICAgICAgICAgICAgICAoaSA9IHMoCiAgICAgICAgICAgICAgICBpLAogICAgICAgICAgICAgICAgKHUgPSBzKAogICAgICAgICAgICAgICAgICB1LAogICAgICAgICAgICAgICAgICAobCA9IHMobCwgbywgaSwgdSwgZVtwICsgMl0sIDksIC01MTQwMzc4NCkpLAogICAgICAgICAgICAgICAgICBvLAogICAgICAgICAgICAgICAgICBpLAogICAgICAgICAgICAgICAgICBlW3AgKyA3XSwKICAgICAgICAgICAgICAgICAgMTQsCiAgICAgICAgICAgICAgICAgIDE3MzUzMjg0NzMKICAgICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgICAgbCwKICAgICAgICAgICAgICAgIG8sCiAgICAgICAgICAgICAgICBlW3AgKyAxMl0sCiAgICAgICAgICAgICAgICAyMCwKICAgICAgICAgICAgICAgIC0xOTI2NjA3NzM0CiAgICAgICAgICAgICAgKSksCiAgICAgICAgICAgICAgdSwKICAgICAgICAgICAgICBsLAogICAgICAgICAgICAgIGVbcCArIDVdLAogICAgICAgICAgICAgIDQsCiAgICAgICAgICAgICAgLTM3ODU1OAogICAgICAgICAgICApKSwKICAgICAgICAgICAgKGkgPSBjKAogICAgICAgICAgICAgIGksCiAgICAgICAgICAgICAgKHUgPSBjKAogICAgICAgICAgICAgICAgdSwKICAgICAgICAgICAgICAgIChsID0gYyhsLCBvLCBpLCB1LCBlW3AgKyA4XSwgMTEsIC0yMDIyNTc0NDYzKSksCiAgICAgICAgICAgICAgICBvLAogICAgICAgICAgICAgICAgaSwKICAgICAgICAgICAgICAgIGVbcCArIDExXSwKICAgICAgICAgICAgICAgIDE2LAogICAgICAgICAgICAgICAgMTgzOTAzMDU2MgogICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgbywKICAgICAgICAgICAgICBlW3AgKyAxNF0sCiAgICAgICAgICAgICAgMjMsCiAgICAgICAgICAgICAgLTM1MzA5NTU2CiAgICAgICAgICAgICkpLAogICAgICAgICAgICB1LAogICAgICAgICAgICBsLAogICAgICAgICAgICBlW3AgKyAxXSwKICAgICAgICAgICAgNCwKICAgICAgICAgICAgLTE1MzA5OTIwNjAKICAgICAgICAgICkpLAogICAgICAgICAgKGkgPSBjKAogICAgICAgICAgICBpLAogICAgICAgICAgICAodSA9IGMoCiAgICAgICAgICAgICAgdSwKICAgICAgICAgICAgICAobCA9IGMobCwgbywgaSwgdSwgZVtwICsgNF0sIDExLCAxMjcyODkzMzUzKSksCiAgICAgICAgICAgICAgbywKICAgICAgICAgICAgICBpLAogICAgICAgICAgICAgIGVbcCArIDddLAogICAgICAgICAgICAgIDE2LAogICAgICAgICAgICAgIC0xNTU0OTc2MzIKICAgICAgICAgICAgKSksCiAgICAgICAgICAgIGwsCiAgICAgICAgICAgIG8sCiAgICAgICAgICAgIGVbcCArIDEwXSwKICAgICAgICAgICAgMjMsCiAgICAgICAgICAgIC0xMDk0NzMwNjQwCiAgICAgICAgICApKSwKICAgICAgICAgIHUsCiAgICAgICAgICBsLAogICAgICAgICAgZVtwICsgMTNdLAogICAgICAgICAgNCwKICAgICAgICAgIDY4MTI3OTE3NAogICAgICAgICkpLAogICAgICAgIChpID0gYygKICAgICAgICAgIGksCiAgICAgICAgICAodSA9IGMoCiAgICAgICAgICAgIHUsCiAgICAgICAgICAgIChsID0gYyhsLCBvLCBpLCB1LCBlW3AgKyAwXSwgMTEsIC0zNTg1MzcyMjIpKSwKICAgICAgICAgICAgbywKICAgICAgICAgICAgaSwKICAgICAgICAgICAgZVtwICsgM10sCiAgICAgICAgICAgIDE2LAogICAgICAgICAgICAtNzIyNTIxOTc5CiAgICAgICAgICApKSwKICAgICAgICAgIGwsCiAgICAgICAgICBvLAogICAgICAgICAgZVtwICsgNl0sCiAgICAgICAgICAyMywKICAgICAgICAgIDc2MDI5MTg5CiAgICAgICAgKSksCiAgICAgICAgdSwKICAgICAgICBsLAogICAgICAgIGVbcCArIDldLAogICAgICAgIDQsCiAgICAgICAgLTY0MDM2NDQ4NwogICAgICApKSwKICAgICAgKGkgPSBjKAogICAgICAgIGksCiAgICAgICAgKHUgPSBjKAogICAgICAgICAgdSwKICAgICAgICAgIChsID0gYyhsLCBvLCBpLCB1LCBlW3AgKyAxMl0sIDExLCAtNDIxODE1ODM1KSksCiAgICAgICAgICBvLAogICAgICAgICAgaSwKICAgICAgICAgIGVbcCArIDE1XSwKICAgICAgICAgIDE2LAogICAgICAgICAgNTMwNzQyNTIwCiAgICAgICAgKSksCiAgICAgICAgbCwKICAgICAgICBvLAogICAgICAgIGVbcCArIDJdLAogICAgICAgIDIzLAogICAgICAgIC05OTUzMzg2NTEKICAgICAgKSksCiAgICAgIHUsCiAgICAgIGwsCiAgICAgIGVbcCArIDBdLAogICAgICA2LAogICAgICAtMTk4NjMwODQ0CiAgICApKSwKICAgICAgKGkgPSBkKAogICAgICAgIChpID0gZCgKICAgICAgICAgIChpID0gZCgKICAgICAgICAgICAgKGkgPSBkKAogICAgICAgICAgICAgIGksCiAgICAgICAgICAgICAgKHUgPSBkKAogICAgICAgICAgICAgICAgdSwKICAgICAgICAgICAgICAgIChsID0gZChsLCBvLCBpLCB1LCBlW3AgKyA3XSwgMTAsIDExMjY4OTE0MTUpKSwKICAgICAgICAgICAgICAgIG8sCiAgICAgICAgICAgICAgICBpLAogICAgICAgICAgICAgICAgZVtwICsgMTRdLAogICAgICAgICAgICAgICAgMTUsCiAgICAgICAgICAgICAgICAtMTQxNjM1NDkwNQogICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgbywKICAgICAgICAgICAgICBlW3AgKyA1XSwKICAgICAgICAgICAgICAyMSwKICAgICAgICAgICAgICAtNTc0MzQwNTUKICAgICAgICAgICAgKSksCiAgICAgICAgICAgICh1ID0gZCgKICAgICAgICAgICAgICB1LAogICAgICAgICAgICAgIChsID0gZCgKICAgICAgICAgICAgICAgIGwsCiAgICAgICAgICAgICAgICAobyA9IGQobywgaSwgdSwgbCwgZVtwICsgMTJdLCA2LCAxNzAwNDg1NTcxKSksCiAgICAgICAgICAgICAgICBpLAogICAgICAgICAgICAgICAgdSwKICAgICAgICAgICAgICAgIGVbcCArIDNdLAogICAgICAgICAgICAgICAgMTAsCiAgICAgICAgICAgICAgICAtMTg5NDk4NjYwNgogICAgICAgICAgICAgICkpLAogICAgICAgICAgICAgIG8sCiAgICAgICAgICAgICAgaSwKICAgICAgICAgICAgICBlW3AgKyAxMF0sCiAgICAgICAgICAgICAgMTUsCiAgICAgICAgICAgICAgLTEwNTE1MjMKICAgICAgICAgICAgKSksCiAgICAgICAgICAgIGwsCiAgICAgICAgICAgIG8sCiAgICAgICAgICAgIGVbcCArIDFdLAogICAgICAgICAgICAyMSwKICAgICAgICAgICAgLTIwNTQ5MjI3OTkKICAgICAgICAgICkpLAogICAgICAgICAgKHUgPSBkKAogICAgICAgICAgICB1LAogICAgICAgICAgICAobCA9IGQoCiAgICAgICAgICAgICAgbCwKICAgICAgICAgICAgICAobyA9IGQobywgaSwgdSwgbCwgZVtwICsgOF0sIDYsIDE4NzMzMTMzNTkpKSwKICAgICAgICAgICAgICBpLAogICAgICAgICAgICAgIHUsCiAgICAgICAgICAgICAgZVtwICsgMTVdLAogICAgICAgICAgICAgIDEwLAogICAgICAgICAgICAgIC0zMDYxMTc0NAogICAgICAgICAgICApKSwKICAgICAgICAgICAgbywKICAgICAgICAgICAgaSwKICAgICAgICAgICAgZVtwICsgNl0sCiAgICAgICAgICAgIDE1LAogICAgICAgICAgICAtMTU2MDE5ODM4MAogICAgICAgICAgKSksCiAgICAgICAgICBsLAogICAgICAgICAgbywKICAgICAgICAgIGVbcCArIDEzXSwKICAgICAgICAgIDIxLAogICAgICAgICAgMTMwOTE1MTY0OQogICAgICAgICkpLAogICAgICAgICh1ID0gZCgKICAgICAgICAgIHUsCiAgICAgICAgICAobCA9IGQoCiAgICAgICAgICAgIGwsCiAgICAgICAgICAgIChvID0gZChvLCBpLCB1LCBsLCBlW3AgKyA0XSwgNiwgLTE0NTUyMzA3MCkpLAogICAgICAgICAgICBpLAogICAgICAgICAgICB1LAogICAgICAgICAgICBlW3AgKyAxMV0sCiAgICAgICAgICAgIDEwLAogICAgICAgICAgICAtMTEyMDIxMDM3OQogICAgICAgICAgKSksCiAgICAgICAgICBvLAogICAgICAgICAgaSwKICAgICAgICAgIGVbcCArIDJdLAogICAgICAgICAgMTUsCiAgICAgICAgICA3MTg3ODcyNTkKICAgICAgICApKSwKICAgICAgICBsLAogICAgICAgIG8sCiAgICAgICAgZVtwICsgOV0sCiAgICAgICAgMjEsCiAgICAgICAgLTM0MzQ4NTU1MQogICAgICApKSwKICAgICAgKG8gPSAobyArIGcpID4+PiAwKSwKICAgICAgKGkgPSAoaSArIF8pID4+PiAwKSwKICAgICAgKHUgPSAodSArIGgpID4+PiAwKSwKICAgICAgKGwgPSAobCArIGEpID4+PiAwKTsKICB9CiAgcmV0dXJuIGVuZGlhbihbbywgaSwgdSwgbF0pOwp9CmZ1bmN0aW9uIGdldFNUVUIodCkgewogIGxldCBuID0gd29yZHNUb0J5dGVzKHVuKHQpKTsKICByZXR1cm4gYnl0ZXNUb0hleChuKTsKfQp3aW5kb3cuc2lnbiA9ICh0LCBuKSA9PiB7CiAgY29uc3QgZSA9IHsKICAgICJYLU1TLVNUVUIiOiBnZXRTVFVCKAogICAgICBgbGl2ZV9pZD0xLGFpZD02MzgzLHZlcnNpb25fY29kZT0xODA4MDAsd2ViY2FzdF9zZGtfdmVyc2lvbj0xLjAuMTQtYmV0YS4wLHJvb21faWQ9JHt0fSxzdWJfcm9vbV9pZD0sc3ViX2NoYW5uZWxfaWQ9LGRpZF9ydWxlPTMsdXNlcl91bmlxdWVfaWQ9JHtufSxkZXZpY2VfcGxhdGZvcm09d2ViLGRldmljZV90eXBlPSxhYz0saWRlbnRpdHk9YXVkaWVuY2VgCiAgICApLAogIH07CiAgcmV0dXJuIHdpbmRvdy5nZXRTaWduKGUpOwp9Owo=";
-  function initBrowser(window) {
-    browser(window, "chrome");
+// jsdom 环境只构建一次, 之后所有直播间复用
+let signWindow = null;
+
+function initBrowser(window) {
+  const { browser } = require("sdenv");
+  browser(window, "chrome");
+}
+
+function getSignWindow() {
+  if (signWindow) {
+    return signWindow;
   }
+  const { Script } = require("vm");
+  const { jsdomFromText } = require("sdenv");
   const [jsdomer] = jsdomFromText({
     url: "https://live.douyin.com",
     referrer: "https://live.douyin.com",
@@ -15,8 +23,19 @@ function sign(roomId, userId) {
   const dom = jsdomer("<html></html>");
   initBrowser(dom.window);
   new Script(atob(signText)).runInContext(dom.getInternalVMContext());
-  let sign = dom.window.sign(roomId, userId);
-  dom.window.close();
+  signWindow = dom.window;
+  return signWindow;
+}
+
+function reset_sign() {
+  if (signWindow) {
+    signWindow.close();
+    signWindow = null;
+  }
+}
+
+function sign(roomId, userId) {
+  let sign = getSignWindow().sign(roomId, userId);
   return sign["X-Bogus"];
 }
 // let res = sign('1', '1')
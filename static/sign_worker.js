@@ -0,0 +1,44 @@
+// 常驻签名进程: 签名脚本只加载一次, 通过 stdin/stdout 按行收发 JSON 请求
+// 用法: node sign_worker.js <脚本路径> <函数名1,函数名2,...>
+// 请求: {"id": 1, "method": "get_ab", "args": [...]}
+// 响应: {"id": 1, "result": ...} 或 {"id": 1, "error": "..."}
+const fs = require('fs');
+const readline = require('readline');
+
+const [bundlePath, exportList] = process.argv.slice(2);
+const names = (exportList || '').split(',').filter(Boolean);
+const out = process.stdout;
+// 签名脚本里的日志不能混进协议输出
+console.log = console.info = console.warn = console.debug = console.error;
+
+const source = fs.readFileSync(bundlePath, 'utf-8');
+const exportsCode = names.map(n => `${n}: typeof ${n} === 'function' ? ${n} : undefined`).join(', ');
+const handle = new Function('require', `${source}\nreturn {${exportsCode}};`)(require);
+
+function reply(msg) {
+    out.write(JSON.stringify(msg) + '\n');
+}
+
+readline.createInterface({input: process.stdin}).on('line', line => {
+    let req;
+    try {
+        req = JSON.parse(line);
+    } catch (e) {
+        return;
+    }
+    Promise.resolve().then(() => {
+        if (req.method === 'ping') {
+            return 'pong';
+        }
+        const fn = handle[req.method];
+        if (!fn) {
+            throw new Error(`unknown method: ${req.method}`);
+        }
+        return fn.apply(null, req.args || []);
+    }).then(
+        result => reply({id: req.id, result: result}),
+        e => reply({id: req.id, error: String((e && e.stack) || e)})
+    );
+});
+process.stdin.on('end', () => process.exit(0));
+reply({id: 0, result: 'ready'});
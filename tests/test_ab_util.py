@@ -0,0 +1,100 @@
+import os
+import json
+import random
+import shutil
+import subprocess
+
+import pytest
+
+from utils.ab_util import get_ab, AB_ALPHABET
+from utils.dy_util import static_path
+
+# 抓包记录的 query, 用于和 js 版本对比
+SAMPLE_QUERIES = [
+    ("device_platform=webapp&aid=6383&channel=channel_pc_web&sec_user_id=MS4wLjABAAAAO3Xfv1Mfo1vkDmjWYVnKeVdvGSyvqTu9vbOCsvTvrc8"
+     "&max_cursor=0&locate_query=false&show_live_replay_strategy=1&need_time_list=1&time_list_query=0&whale_cut_token="
+     "&cut_version=1&count=18&publish_video_strategy_type=2&update_version_code=170400&pc_client_type=1&version_code=290100"
+     "&version_name=29.1.0&cookie_enabled=true&screen_width=1707&screen_height=960&browser_language=zh-CN"
+     "&browser_platform=Win32&browser_name=Edge&browser_version=125.0.0.0&browser_online=true&engine_name=Blink"
+     "&engine_version=125.0.0.0&os_name=Windows&os_version=10&cpu_core_num=32&device_memory=8&platform=PC&downlink=10"
+     "&effective_type=4g&round_trip_time=100&webid=7380289843612304937&verifyFp=verify_lx9yj2hn_NuZMF3Kq_3kkK_4GDt_9ZbL_4u1Vl2XbIYfp"
+     "&fp=verify_lx9yj2hn_NuZMF3Kq_3kkK_4GDt_9ZbL_4u1Vl2XbIYfp", ""),
+    ("device_platform=webapp&aid=6383&channel=channel_pc_web&aweme_id=7376449060384935209&update_version_code=170400"
+     "&pc_client_type=1&version_code=190500&version_name=19.5.0&cookie_enabled=true&screen_width=1707&screen_height=960"
+     "&browser_language=zh-CN&browser_platform=Win32&browser_name=Edge&browser_version=125.0.0.0&browser_online=true"
+     "&engine_name=Blink&engine_version=125.0.0.0&os_name=Windows&os_version=10&cpu_core_num=32&device_memory=8"
+     "&platform=PC&downlink=10&effective_type=4g&round_trip_time=50&webid=7380289843612304937", ""),
+    ("device_platform=webapp&aid=6383&channel=channel_pc_web&aweme_id=7376449060384935209&cursor=20&count=20"
+     "&item_type=0&insert_ids=&whale_cut_token=&cut_version=1&rcFT=&update_version_code=170400&pc_client_type=1", ""),
+    ("device_platform=webapp&aid=6383&channel=channel_pc_web&search_channel=aweme_general&enable_history=1"
+     "&keyword=%E7%BE%8E%E9%A3%9F&search_source=normal_search&query_correct_type=1&is_filter_search=0"
+     "&from_group_id=&offset=0&count=10&need_filter_settings=1&list_type=single", ""),
+    ("device_platform=webapp&aid=6383&channel=channel_pc_web&pc_client_type=1&version_code=170400",
+     "aweme_id=7376449060384935209&comment_send_celltime=3500&comment_video_celltime=12000&one_level_comment_rank_info="
+     "&paste_edit_method=non_paste&text=%E5%A5%BD%E7%9C%8B&text_extra=%5B%5D"),
+]
+
+_JS_ORACLE = r"""
+const fs = require('fs');
+let now = Number(process.argv[2]), randoms = [], index = 0;
+const RealDate = Date;
+global.Date = class extends RealDate {
+    constructor(...args) { args.length ? super(...args) : super(now); }
+    static now() { return now; }
+};
+Math.random = () => randoms[index++ % randoms.length];
+const src = fs.readFileSync(process.argv[1], 'utf-8');
+const {get_ab} = new Function('require', src + '\nreturn {get_ab};')(require);
+for (const line of fs.readFileSync(0, 'utf-8').split('\n').filter(Boolean)) {
+    const c = JSON.parse(line);
+    now = c.now; randoms = c.randoms; index = 0;
+    console.log(get_ab(c.params, c.data));
+}
+"""
+
+
+def _corpus(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    for i in range(n):
+        params, data = SAMPLE_QUERIES[i % len(SAMPLE_QUERIES)]
+        if i >= len(SAMPLE_QUERIES):
+            # 换掉 id / 游标, 覆盖不同长度
+            params = params.replace('7376449060384935209', str(rng.randint(1, 10 ** 19)))
+            params += f'&cursor={rng.randint(0, 10 ** rng.randint(1, 12))}'
+        yield {'params': params, 'data': data, 'now': rng.randint(1600000000000, 1800000000000),
+               'randoms': [rng.random() for _ in range(3)]}
+
+
+def _node_env():
+    node = shutil.which('node')
+    if node is None:
+        pytest.skip('没有 node')
+    node_modules = static_path('dy_ab.js')[1]
+    env = dict(os.environ, NODE_PATH=os.pathsep.join(filter(None, [node_modules, os.getenv('NODE_PATH')])))
+    if subprocess.run([node, '-e', "require('jsrsasign')"], env=env, capture_output=True).returncode != 0:
+        pytest.skip('node_modules 里没有 jsrsasign')
+    return node, env
+
+
+def test_matches_js(n: int = 500):
+    # 固定时间和随机数, 逐条对比 Python 与 dy_ab.js 的 a_bogus
+    node, env = _node_env()
+    load_time = 1712345678901
+    cases = list(_corpus(n))
+    output = subprocess.run([node, '-e', _JS_ORACLE, static_path('dy_ab.js')[0], str(load_time)], env=env,
+                            check=True, input='\n'.join(json.dumps(c) for c in cases), capture_output=True,
+                            encoding='utf-8').stdout.splitlines()
+    assert len(output) == len(cases)
+    for case, expected in zip(cases, output):
+        actual = get_ab(case['params'], case['data'], now=case['now'], randoms=tuple(case['randoms']),
+                        start=load_time)
+        assert actual == expected, case
+
+
+def test_deterministic_with_fixed_inputs():
+    params, data = SAMPLE_QUERIES[0]
+    kwargs = {'now': 1712345680000, 'randoms': (0.1, 0.2, 0.3), 'start': 1712345678901}
+    ab = get_ab(params, data, **kwargs)
+    assert ab == get_ab(params, data, **kwargs)
+    assert ab != get_ab(params + '&cursor=1', data, **kwargs)
+    assert set(ab) <= set(AB_ALPHABET + '=')
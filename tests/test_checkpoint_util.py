@@ -0,0 +1,31 @@
+from utils.checkpoint_util import Checkpoint
+
+
+def test_torn_last_line_is_dropped_and_later_records_survive(tmp_path):
+    checkpoint = Checkpoint('job', directory=str(tmp_path))
+    checkpoint.persist('a', 1)
+    # 模拟写到一半时进程退出
+    with open(checkpoint.path, mode='a', encoding='utf-8') as f:
+        f.write('{"persisted": "b", "va')
+
+    checkpoint = Checkpoint('job', directory=str(tmp_path))
+    assert checkpoint.persisted('a') == 1
+    assert not checkpoint.is_persisted('b')
+    checkpoint.persist('b', 2)
+    checkpoint.persist('c', 3)
+
+    checkpoint = Checkpoint('job', directory=str(tmp_path))
+    assert [checkpoint.persisted(k) for k in 'abc'] == [1, 2, 3]
+
+
+def test_complete_line_without_newline_is_rewritten(tmp_path):
+    checkpoint = Checkpoint('job', directory=str(tmp_path))
+    checkpoint.persist('a', 1)
+    with open(checkpoint.path, mode='a', encoding='utf-8') as f:
+        f.write('{"persisted": "b", "value": 2}')
+
+    checkpoint = Checkpoint('job', directory=str(tmp_path))
+    checkpoint.persist('c', 3)
+    checkpoint = Checkpoint('job', directory=str(tmp_path))
+    assert checkpoint.persisted('a') == 1
+    assert checkpoint.persisted('c') == 3
@@ -0,0 +1,26 @@
+from types import SimpleNamespace
+
+from dy_apis.douyin_api import DouyinAPI
+
+
+def _auth(sessionid):
+    return SimpleNamespace(cookie={'sessionid': sessionid})
+
+
+def test_live_info_is_not_shared_across_accounts():
+    key = DouyinAPI.get_live_info.key
+    assert key(_auth('a'), '123') == key(_auth('a'), live_id='123')
+    assert key(_auth('a'), '123') != key(_auth('b'), '123')
+    assert 'a' * 4 not in key(_auth('a' * 32), '123')
+
+
+def test_public_endpoints_still_coalesce_across_accounts():
+    key = DouyinAPI.get_work_out_comment.key
+    assert key(_auth('a'), 'https://www.douyin.com/video/1') == key(_auth('b'), 'https://www.douyin.com/video/1')
+
+
+def test_account_scoped_results_are_cached_per_account():
+    assert DouyinAPI.get_live_info.cache_ttl == 0
+    for method in (DouyinAPI.get_user_info, DouyinAPI.get_work_info):
+        assert method.cache_ttl > 0
+        assert method.key(_auth('a'), 'https://www.douyin.com/x/1') != method.key(_auth('b'), 'https://www.douyin.com/x/1')
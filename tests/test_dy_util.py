@@ -0,0 +1,44 @@
+from utils import dy_util
+
+
+class _Worker:
+    def __init__(self):
+        self.resets = 0
+
+    def call(self, method, *args):
+        assert method == 'reset_sign'
+        self.resets += 1
+
+
+def test_live_sign_reset_needs_repeated_failures_and_is_rate_limited(monkeypatch):
+    worker = _Worker()
+    monkeypatch.setattr(dy_util, '_live_worker', worker)
+    monkeypatch.setattr(dy_util, '_live_sign_reset_at', None)
+    monkeypatch.setenv('DY_LIVE_SIGN_RESET_FAILURES', '3')
+    monkeypatch.setenv('DY_LIVE_SIGN_RESET_INTERVAL', '300')
+
+    dy_util._live_signatures.set(('1', 'u'), 'sig')
+    dy_util.invalidate_signature(1, 'u')
+    assert dy_util._live_signatures.get(('1', 'u')) is None
+    # 其他直播间失败不计入这个直播间
+    dy_util.invalidate_signature(2, 'u')
+    dy_util.invalidate_signature(1, 'u')
+    assert worker.resets == 0
+    dy_util.invalidate_signature(1, 'u')
+    assert worker.resets == 1
+
+    # 间隔内其他直播间再失败也不重建
+    for _ in range(3):
+        dy_util.invalidate_signature(2, 'u')
+    assert worker.resets == 1
+
+
+def test_successful_open_clears_failures(monkeypatch):
+    worker = _Worker()
+    monkeypatch.setattr(dy_util, '_live_worker', worker)
+    monkeypatch.setattr(dy_util, '_live_sign_reset_at', None)
+    monkeypatch.setenv('DY_LIVE_SIGN_RESET_FAILURES', '2')
+    dy_util.invalidate_signature(3, 'u')
+    dy_util.confirm_signature(3, 'u')
+    dy_util.invalidate_signature(3, 'u')
+    assert worker.resets == 0
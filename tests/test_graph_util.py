@@ -0,0 +1,43 @@
+from utils.graph_util import GraphStore, NODE_QUEUED, NODE_DONE, NODE_LEAF
+
+
+def _node(store, sec_uid):
+    return store._connect().execute('SELECT depth, state FROM nodes WHERE sec_uid = ?', (sec_uid,)).fetchone()
+
+
+def test_shallower_path_lowers_depth_and_requeues(tmp_path):
+    store = GraphStore(str(tmp_path / 'graph.db'), capacity=1000)
+    assert store.add_nodes([{'sec_uid': 'seed'}], 0, 2) == 1
+    # 慢的线程还在爬第 0 层时, 快的线程已经从第 2 层发现了 a、b
+    assert store.add_nodes([{'sec_uid': 'a'}, {'sec_uid': 'b'}], 3, 2) == 2
+    assert _node(store, 'a') == (3, NODE_LEAF)
+    store.add_nodes([{'sec_uid': 'c'}], 2, 2)
+    store.finish('c')
+
+    assert store.add_nodes([{'sec_uid': 'a'}, {'sec_uid': 'c'}], 1, 2) == 0
+    assert _node(store, 'a') == (1, NODE_QUEUED)
+    assert _node(store, 'b') == (3, NODE_LEAF)
+    # c 爬的时候在第 2 层, 关注用户都成了叶子, 在第 1 层时要重新展开
+    assert _node(store, 'c') == (1, NODE_QUEUED)
+
+    # 更深的路径不改变已有记录
+    store.add_nodes([{'sec_uid': 'a'}], 2, 2)
+    assert _node(store, 'a') == (1, NODE_QUEUED)
+
+
+def test_resume_requeues_running_and_dedups(tmp_path):
+    path = str(tmp_path / 'graph.db')
+    store = GraphStore(path, capacity=1000)
+    store.add_nodes([{'sec_uid': 'seed'}], 0, 1)
+    store.add_nodes([{'sec_uid': f'u{i}'} for i in range(5)], 1, 1)
+    assert store.claim()[0] == 'seed'
+    store.finish('seed')
+    assert store.claim()[2] == 1
+    assert store.stats()['running'] == 1
+
+    store = GraphStore(path, capacity=1000)
+    assert store.stats()['running'] == 0
+    assert store.stats()['queued'] == 5
+    assert store.add_nodes([{'sec_uid': f'u{i}'} for i in range(7)], 1, 1) == 2
+    assert store.stats()['queued'] == 7
+    assert _node(store, 'seed') == (0, NODE_DONE)
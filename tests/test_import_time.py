@@ -0,0 +1,30 @@
+import os
+import sys
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# 本机实测约 0.25 秒, 留出余量避免机器慢时误报
+IMPORT_BUDGET = 2.0
+
+CODE = '''
+import sys, time
+start = time.perf_counter()
+import main, live_monitor_with_save, dy_live.server
+elapsed = time.perf_counter() - start
+import utils.dy_util
+print(elapsed)
+print('execjs' in sys.modules, 'pandas' in sys.modules)
+print(utils.dy_util._dy_pool is None, utils.dy_util._live_worker is None)
+'''
+
+
+def test_entry_points_import_lazily():
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run([sys.executable, '-c', CODE], cwd=ROOT, env=env, capture_output=True, text=True,
+                            timeout=60)
+    assert result.returncode == 0, result.stderr
+    elapsed, modules, workers = result.stdout.strip().splitlines()[-3:]
+    assert float(elapsed) < IMPORT_BUDGET
+    # execjs、pandas 和 node 签名进程都应在第一次用到时才加载
+    assert modules == 'False False'
+    assert workers == 'True True'
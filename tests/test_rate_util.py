@@ -0,0 +1,8 @@
+from utils.rate_util import classify_response, RESPONSE_OK, RESPONSE_VERIFY
+
+
+def test_only_challenge_headers_mean_verify():
+    content = b'{"status_code": 0}'
+    assert classify_response(200, {'Bdturing-Verify': '{}'}, content, True) == RESPONSE_VERIFY
+    assert classify_response(200, {'X-Vc-Bdturing-Parameters': '{}'}, content, True) == RESPONSE_VERIFY
+    assert classify_response(200, {'X-Verify-Token': 'a', 'x-tt-verify-id': 'b'}, content, True) == RESPONSE_OK
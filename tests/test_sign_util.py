@@ -0,0 +1,18 @@
+from utils.sign_util import SignWorkerPool
+
+
+class _Worker:
+    def __init__(self):
+        self.timeouts = []
+
+    def call(self, method, *args, timeout=None):
+        self.timeouts.append(timeout)
+        return method
+
+
+def test_pool_passes_timeout_to_worker():
+    pool = SignWorkerPool('unused.js', ['get_ab'], size=1)
+    worker = pool.workers[0] = _Worker()
+    assert pool.call('get_ab', 'a=1', '', timeout=2.5) == 'get_ab'
+    pool.call('get_ab', 'a=1', '')
+    assert worker.timeouts == [2.5, None]
@@ -0,0 +1,18 @@
+from utils.store_util import media_key
+
+
+def test_signed_urls_of_same_file_share_key():
+    a = 'https://p3-sign.douyinpic.com/tos-cn-i/abc~tplv-dy.jpeg?x-expires=1700000000&x-signature=AAA%3D&from=327834062'
+    b = 'https://p9-sign.douyinpic.com/tos-cn-i/abc~tplv-dy.jpeg?x-expires=1700086400&x-signature=BBB%3D&from=327834062'
+    assert media_key(a) == media_key(b) == 'url:/tos-cn-i/abc~tplv-dy.jpeg'
+
+
+def test_play_urls_keep_video_id():
+    a = 'https://www.douyin.com/aweme/v1/play/?video_id=v0200fg1&line=0&ratio=720p&sign=aaa'
+    b = 'https://www.douyin.com/aweme/v1/play/?sign=bbb&video_id=v0200fg1&line=1'
+    c = 'https://www.douyin.com/aweme/v1/play/?video_id=v0300xyz&line=0&sign=aaa'
+    assert media_key(a) == media_key(b) != media_key(c)
+
+
+def test_uri_takes_precedence():
+    assert media_key('https://a.com/x.jpg?sig=1', uri='tos-cn-i/abc') == 'uri:tos-cn-i/abc'
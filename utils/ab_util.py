@@ -0,0 +1,133 @@
+"""
+纯 Python 实现的 a_bogus, 与 static/dy_ab.js 中 get_ab(params, data) 的结果逐字节一致.
+
+a_bogus = 自定义 base64( 随机前缀 12 字节 + rc4("y", 头部 44 字节 + 浏览器指纹 + 校验位) )
+头部包含 sm3(sm3(params + "cus")), sm3(sm3(data + "cus")), ua 摘要的部分字节,
+以及签名脚本加载时间(start)和签名时间(end).
+"""
+import time
+import random
+import hashlib
+from functools import lru_cache
+
+UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/117.0"
+BROWSER = "1707|809|1707|912|0|0|0|0|1707|912|1707|960|1697|809|24|24|Win32"
+ARGUMENTS = (0, 1, 8)
+SALT = "cus"
+UA_ALPHABET = "ckdp1h4ZKsUB80/Mfvw36XIgR25+WQAlEi7NLboqYTOPuzmFjJnryx9HVGDaStCe"
+AB_ALPHABET = "Dkdpgh2ZmsQB80/MfvV36XI1R45-WUAlEixNLwoqYTOPuzKFjJnry79HbGcaStCe"
+
+# 对应 js 里 bdms 初始化的时间, 同一个进程内的签名共用
+start_time = int(time.time() * 1000)
+
+
+def _rotl(x, n):
+    n %= 32
+    return ((x << n) | (x >> (32 - n))) & 0xFFFFFFFF
+
+
+def _sm3_py(msg: bytes) -> bytes:
+    v = [0x7380166F, 0x4914B2B9, 0x172442D7, 0xDA8A0600, 0xA96F30BC, 0x163138AA, 0xE38DEE4D, 0xB0FB0E4E]
+    m = bytearray(msg) + b'\x80'
+    m += b'\x00' * ((56 - len(m)) % 64)
+    m += (len(msg) * 8).to_bytes(8, 'big')
+    for offset in range(0, len(m), 64):
+        w = [int.from_bytes(m[offset + i:offset + i + 4], 'big') for i in range(0, 64, 4)]
+        for j in range(16, 68):
+            x = w[j - 16] ^ w[j - 9] ^ _rotl(w[j - 3], 15)
+            w.append(x ^ _rotl(x, 15) ^ _rotl(x, 23) ^ _rotl(w[j - 13], 7) ^ w[j - 6])
+        a, b, c, d, e, f, g, h = v
+        for j in range(64):
+            a12 = _rotl(a, 12)
+            ss1 = _rotl((a12 + e + _rotl(0x79CC4519 if j < 16 else 0x7A879D8A, j)) & 0xFFFFFFFF, 7)
+            if j < 16:
+                ff, gg = a ^ b ^ c, e ^ f ^ g
+            else:
+                ff, gg = (a & b) | (a & c) | (b & c), (e & f) | (~e & g)
+            tt1 = (ff + d + (ss1 ^ a12) + (w[j] ^ w[j + 4])) & 0xFFFFFFFF
+            tt2 = (gg + h + ss1 + w[j]) & 0xFFFFFFFF
+            a, b, c, d = tt1, a, _rotl(b, 9), c
+            e, f, g, h = tt2 ^ _rotl(tt2, 9) ^ _rotl(tt2, 17), e, _rotl(f, 19), g
+        v = [x ^ y for x, y in zip(v, (a, b, c, d, e, f, g, h))]
+    return b''.join(x.to_bytes(4, 'big') for x in v)
+
+
+def sm3(msg: bytes) -> bytes:
+    # OpenSSL 支持 sm3 时用 hashlib, 否则用纯 Python 实现
+    try:
+        return hashlib.new('sm3', msg).digest()
+    except ValueError:
+        return _sm3_py(msg)
+
+
+def rc4(data: bytes, key: bytes) -> bytes:
+    s = list(range(256))
+    j = 0
+    for i in range(256):
+        j = (j + s[i] + key[i % len(key)]) & 255
+        s[i], s[j] = s[j], s[i]
+    out = bytearray(len(data))
+    i = j = 0
+    for n, c in enumerate(data):
+        i = (i + 1) & 255
+        j = (j + s[i]) & 255
+        s[i], s[j] = s[j], s[i]
+        out[n] = c ^ s[(s[i] + s[j]) & 255]
+    return bytes(out)
+
+
+def b64encode(data: bytes, alphabet: str) -> str:
+    out = []
+    for i in range(0, len(data), 3):
+        chunk = data[i:i + 3]
+        n = int.from_bytes(chunk + b'\x00' * (3 - len(chunk)), 'big')
+        out.extend(alphabet[(n >> shift) & 63] for shift in (18, 12, 6, 0)[:len(chunk) + 1])
+    return ''.join(out) + '=' * (-len(out) % 4)
+
+
+def _digest(text: str) -> bytes:
+    return sm3(sm3((text + SALT).encode('utf-8')))
+
+
+@lru_cache(maxsize=8)
+def _ua_digest(ua: str) -> bytes:
+    encrypted = rc4(ua.encode('utf-8'), bytes(ARGUMENTS))
+    return sm3(b64encode(encrypted, UA_ALPHABET).encode('utf-8'))
+
+
+def _random_bytes(r: float, d: int, e: int, f: int, g: int) -> list:
+    n = int(r * 10000)
+    low, high = n & 255, n >> 8
+    return [low & 170 | d, low & 85 | e, high & 170 | f, high & 85 | g]
+
+
+def get_ab(params: str, data: str = "", now: int = None, randoms: tuple = None, start: int = None,
+           ua: str = UA, browser: str = BROWSER) -> str:
+    """
+    计算 a_bogus.
+    :param params: url 参数拼接字符串.
+    :param data: 请求体拼接字符串.
+    :param now: 签名时间(毫秒), 默认当前时间.
+    :param randoms: 三个 [0, 1) 之间的随机数, 默认随机生成.
+    :param start: 签名脚本加载时间(毫秒), 默认为模块加载时间.
+    :return: a_bogus.
+    """
+    end = int(time.time() * 1000) if now is None else now
+    start = start_time if start is None else start
+    r1, r2, r3 = randoms or (random.random(), random.random(), random.random())
+    p = _digest(params)
+    d = _digest(data)
+    u = _ua_digest(ua)
+    header = [
+        44, (end >> 24) & 255, 0, 0, 0, 0, 0, p[21], d[21], 0, u[23], (end >> 16) & 255,
+        0, 0, 0, ARGUMENTS[1], 0, 0, p[22], d[22], u[24], (end >> 8) & 255, 0, 0,
+        0, 0, end & 255, 0, 0, ARGUMENTS[2], (start >> 24) & 255, (start >> 16) & 255, 0, (start >> 8) & 255,
+        start & 255, 12, (start >> 32) & 255, (start >> 40) & 255, (end >> 32) & 255, (end >> 40) & 255,
+        len(browser) & 255, 0, 0, 0,
+    ]
+    check = 0
+    for b in header:
+        check ^= b
+    payload = bytes(header) + browser.encode('utf-8') + bytes([check])
+    prefix = bytes(_random_bytes(r1, 1, 2, 5, 40) + _random_bytes(r2, 1, 0, 0, 0) + _random_bytes(r3, 1, 0, 5, 0))
+    return b64encode(prefix + rc4(payload, b'y'), AB_ALPHABET)
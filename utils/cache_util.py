@@ -0,0 +1,373 @@
+import os
+import json
+import time
+import sqlite3
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+class TTLCache:
+    """
+    线程安全的带过期时间的缓存, 超过 maxsize 时淘汰最久未使用的条目.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        """
+        :param ttl: 默认过期时间(秒).
+        :param maxsize: 最多缓存的条目数.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expire_at = item
+            if expire_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float = None):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            item = self._data.pop(key, None)
+            return default if item is None else item[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class LoadingCache:
+    """
+    按 key 缓存加载结果的线程安全缓存.
+    同一个 key 同时只有一个线程在加载, 其他线程等待同一个结果;
+    超过 refresh_ahead 比例的有效期后, 在后台线程提前刷新, 刷新完成前继续返回旧值.
+    """
+
+    def __init__(self, ttl: float, refresh_ahead: float = 0.8, maxsize: int = 1024):
+        """
+        :param ttl: 默认过期时间(秒).
+        :param refresh_ahead: 有效期过去多少比例后开始后台刷新, 1 表示不提前刷新.
+        :param maxsize: 最多缓存的条目数.
+        """
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, load):
+        """
+        :param key: 缓存 key.
+        :param load: 无参函数, 返回 (value, ttl), ttl 为 None 时用默认过期时间, ttl <= 0 时不缓存.
+        :return: 缓存的值, 没有时调用 load 加载.
+        """
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                value, expire_at, refresh_at = item
+                if now < expire_at:
+                    self._data.move_to_end(key)
+                    if now >= refresh_at and key not in self._loading:
+                        future = self._loading[key] = Future()
+                        threading.Thread(target=self._load, args=(key, load, future), daemon=True).start()
+                    return value
+                del self._data[key]
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                future = self._loading[key] = Future()
+        if owner:
+            self._load(key, load, future)
+        return future.result()
+
+    def _load(self, key, load, future):
+        try:
+            value, ttl = load()
+        except BaseException as e:
+            with self._lock:
+                self._loading.pop(key, None)
+            future.set_exception(e)
+            return
+        if ttl is None or ttl > 0:
+            self.set(key, value, ttl)
+        with self._lock:
+            self._loading.pop(key, None)
+        future.set_result(value)
+
+    def set(self, key, value, ttl: float = None):
+        ttl = self.ttl if ttl is None else ttl
+        now = time.monotonic()
+        with self._lock:
+            self._data[key] = (value, now + ttl, now + ttl * self.refresh_ahead)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SingleFlight:
+    """
+    合并同时进行的相同调用: 同一个 key 同时只执行一次, 其他调用方等待并共享结果, 调用结束后不保留结果.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """
+        :param key: 调用的 key.
+        :param fn: 无参函数.
+        :return: (结果, 是否共享了其他调用的结果).
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            owner = future is None
+            if owner:
+                future = self._calls[key] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not owner:
+            return future.result(), True
+        try:
+            value = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value, False
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def do_async(self, key, fn):
+        """
+        do 的 asyncio 版本, 只合并同一个事件循环里的调用.
+        :param fn: 无参函数, 返回 awaitable.
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        with self._lock:
+            future = self._calls.get(key)
+            owner = future is None
+            if owner:
+                future = self._calls[key] = loop.create_future()
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not owner:
+            return await asyncio.shield(future), True
+        try:
+            value = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 没有其他调用方等待时, 避免 asyncio 提示异常未被读取
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value, False
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def stats(self) -> dict:
+        """
+        :return: 共享结果的次数、实际执行的次数和正在执行的调用数.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'in_flight': len(self._calls)}
+
+
+class SqliteCache:
+    """
+    基于 SQLite 的持久化缓存, 值按 JSON 保存, 超过 maxsize 条时淘汰最久未读取的条目. 线程安全, 每个线程一个连接.
+    """
+
+    def __init__(self, path: str, maxsize: int = 100000, evict_every: int = 100):
+        """
+        :param path: 数据库文件路径.
+        :param maxsize: 最多保存的条目数.
+        :param evict_every: 每写入多少次检查一次过期和超量的条目.
+        """
+        self.path = path
+        self.maxsize = maxsize
+        self.evict_every = evict_every
+        self._writes = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                         'expire_at REAL NOT NULL, accessed_at REAL NOT NULL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)')
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def get_raw(self, key: str):
+        """
+        :return: (JSON 字符串, 过期时间戳), 没有或已过期时返回 None.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute('SELECT value, expire_at FROM cache WHERE key = ?', (key,)).fetchone()
+            if row is None or row[1] <= now:
+                return None
+            conn.execute('UPDATE cache SET accessed_at = ? WHERE key = ?', (now, key))
+        return row
+
+    def set_raw(self, key: str, value: str, ttl: float):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('INSERT OR REPLACE INTO cache (key, value, expire_at, accessed_at) VALUES (?, ?, ?, ?)',
+                         (key, value, now + ttl, now))
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % self.evict_every == 0
+        if evict:
+            self.evict()
+
+    def get(self, key: str, default=None):
+        row = self.get_raw(key)
+        return default if row is None else json.loads(row[0])
+
+    def set(self, key: str, value, ttl: float):
+        self.set_raw(key, json.dumps(value, ensure_ascii=False), ttl)
+
+    def evict(self):
+        """
+        删除过期的条目, 再按最近读取时间删除超过 maxsize 的部分.
+        """
+        with self._connect() as conn:
+            conn.execute('DELETE FROM cache WHERE expire_at <= ?', (time.time(),))
+            conn.execute('DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed_at DESC '
+                         'LIMIT -1 OFFSET ?)', (self.maxsize,))
+
+    def invalidate(self, key: str):
+        with self._connect() as conn:
+            conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute('DELETE FROM cache')
+
+    def __len__(self):
+        return self._connect().execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+
+class TieredCache:
+    """
+    两级缓存: 进程内 LRU 在前, SQLite 在后. 两级都保存 JSON 字符串, 每次读取返回新的对象, 调用方修改结果不影响缓存.
+    """
+
+    def __init__(self, path: str, memory_maxsize: int = 2048, disk_maxsize: int = 100000):
+        """
+        :param path: SQLite 文件路径.
+        :param memory_maxsize: 内存里最多缓存的条目数.
+        :param disk_maxsize: 磁盘上最多缓存的条目数.
+        """
+        self.memory = TTLCache(ttl=60, maxsize=memory_maxsize)
+        self.disk = SqliteCache(path, maxsize=disk_maxsize)
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, key: str, default=None):
+        raw = self.memory.get(key)
+        if raw is not None:
+            self.memory_hits += 1
+            return json.loads(raw)
+        row = self.disk.get_raw(key)
+        if row is None:
+            self.misses += 1
+            return default
+        self.disk_hits += 1
+        raw, expire_at = row
+        # 提升到内存, 过期时间和磁盘上的一致
+        self.memory.set(key, raw, ttl=expire_at - time.time())
+        return json.loads(raw)
+
+    def set(self, key: str, value, ttl: float):
+        raw = json.dumps(value, ensure_ascii=False)
+        self.memory.set(key, raw, ttl=ttl)
+        self.disk.set_raw(key, raw, ttl)
+
+    def invalidate(self, key: str):
+        self.memory.pop(key)
+        self.disk.invalidate(key)
+
+    def clear(self):
+        self.memory.clear()
+        self.disk.clear()
+
+    def stats(self) -> dict:
+        """
+        :return: 内存命中、磁盘命中、未命中的次数和两级的条目数.
+        """
+        return {'memory_hits': self.memory_hits, 'disk_hits': self.disk_hits, 'misses': self.misses,
+                'memory_size': len(self.memory), 'disk_size': len(self.disk)}
+
+
+def get_response_cache():
+    """
+    进程内共用的接口响应缓存, DY_RESPONSE_CACHE=0 时返回 None.
+    文件默认在 datas/cache/responses.db, 可用 DY_CACHE_PATH 指定; 条目数上限见 DY_CACHE_MEMORY_MAXSIZE 和 DY_CACHE_DISK_MAXSIZE.
+    """
+    global _response_cache
+    if os.getenv('DY_RESPONSE_CACHE', '1') == '0':
+        return None
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                path = os.getenv('DY_CACHE_PATH') or os.path.abspath(
+                    os.path.join(os.path.dirname(__file__), '../datas/cache/responses.db'))
+                _response_cache = TieredCache(path, int(os.getenv('DY_CACHE_MEMORY_MAXSIZE', '2048')),
+                                              int(os.getenv('DY_CACHE_DISK_MAXSIZE', '100000')))
+    return _response_cache
@@ -0,0 +1,130 @@
+import os
+import re
+import json
+import threading
+
+
+def checkpoint_dir() -> str:
+    """
+    断点文件目录, 默认 datas/checkpoints, 可用 DY_CHECKPOINT_DIR 指定.
+    """
+    return os.getenv('DY_CHECKPOINT_DIR') or os.path.abspath(
+        os.path.join(os.path.dirname(__file__), '../datas/checkpoints'))
+
+
+class Checkpoint:
+    """
+    一个翻页任务的断点日志, 每行一条 JSON 记录, 只追加写入并 fsync:
+    {"page": {...}} 记录提交的一页(游标、下一页游标、条目), {"persisted": key, "value": ...} 记录已经保存的数据,
+    {"done": true} 表示已经翻完. 进程中途退出时最后一行可能不完整, 读取时忽略.
+    """
+
+    def __init__(self, job_id: str, directory: str = None, keep_items: bool = True):
+        """
+        :param job_id: 任务标识, 同一个任务重启后用同一个 job_id 即可从断点继续.
+        :param directory: 断点文件目录, 默认见 checkpoint_dir.
+        :param keep_items: 是否把每页的条目写入日志, 合并结果的翻页方法恢复时需要; 只逐条处理时可以关掉.
+        """
+        self.job_id = job_id
+        self.keep_items = keep_items
+        directory = directory or checkpoint_dir()
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, re.sub(r'[^\w.-]', '_', job_id) + '.jsonl')
+        self.pages = []
+        self.done = False
+        self._persisted = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        # 记录最后一条完整记录的结束位置, 后面写了一半的内容截掉, 否则之后追加的记录会接在残行后面读不出来
+        valid = 0
+        with open(self.path, mode='rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    break
+                valid += len(line)
+                if 'page' in record:
+                    self.pages.append(record['page'])
+                elif 'persisted' in record:
+                    self._persisted[record['persisted']] = record.get('value')
+                elif record.get('done'):
+                    self.done = True
+        if valid < os.path.getsize(self.path):
+            with open(self.path, mode='r+b') as f:
+                f.truncate(valid)
+
+    def _append(self, record: dict):
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    @property
+    def next_cursor(self):
+        """
+        :return: 最后提交的一页的下一页游标, 还没有提交过时返回 None.
+        """
+        return self.pages[-1]['next_cursor'] if self.pages else None
+
+    @property
+    def has_more(self) -> bool:
+        return not self.done and (not self.pages or self.pages[-1]['has_more'])
+
+    def items(self) -> list:
+        """
+        :return: 已提交的所有条目.
+        """
+        return [item for page in self.pages for item in page.get('items', [])]
+
+    def commit(self, page):
+        """
+        提交一页, 之后从这一页的下一页继续.
+        :param page: douyin_api.Page.
+        """
+        record = {'cursor': page.cursor, 'next_cursor': page.next_cursor, 'has_more': page.has_more,
+                  'count': len(page.items)}
+        if self.keep_items:
+            record['items'] = page.items
+        self._append({'page': record})
+        self.pages.append(record)
+
+    def finish(self):
+        if not self.done:
+            self._append({'done': True})
+            self.done = True
+
+    def persist(self, key: str, value=None):
+        """
+        记录一条已经保存的数据, 例如已下载的作品 ID 或已取完的二级评论.
+        """
+        self._append({'persisted': key, 'value': value})
+        self._persisted[key] = value
+
+    def is_persisted(self, key: str) -> bool:
+        return key in self._persisted
+
+    def persisted(self, key: str, default=None):
+        return self._persisted.get(key, default)
+
+    def clear(self):
+        """
+        任务全部完成后删除断点文件, 下次同一个 job_id 从头开始.
+        """
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        self.pages = []
+        self.done = False
+        self._persisted = {}
+
+    def __repr__(self):
+        return f'Checkpoint({self.job_id!r})'
@@ -4,16 +4,21 @@ from dotenv import load_dotenv
 
 dy_auth = None
 dy_live_auth = None
+dy_auth_pool = None
 def load_env():
-    global dy_auth, dy_live_auth
+    global dy_auth, dy_live_auth, dy_auth_pool
     load_dotenv()
     cookies_dy = os.getenv('DY_COOKIES')
     cookies_live = os.getenv('DY_LIVE_COOKIES')
-    from builder.auth import DouyinAuth
+    # 多账号: DY_COOKIES_PATH 指向 cookie 文件(每行一组)或目录, 加载为账号池
+    cookies_path = os.getenv('DY_COOKIES_PATH')
+    from builder.auth import DouyinAuth, AuthPool
     dy_auth = DouyinAuth()
     dy_auth.perepare_auth(cookies_dy, "", "")
     dy_live_auth = DouyinAuth()
     dy_live_auth.perepare_auth(cookies_live, "", "")
+    if cookies_path:
+        dy_auth_pool = AuthPool.from_path(cookies_path)
     return dy_auth
 
 def init():
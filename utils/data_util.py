@@ -2,10 +2,16 @@ import json
 import os
 import re
 import time
-import openpyxl
-import requests
+import threading
+from urllib.parse import urlparse
+
 from loguru import logger
-from retry import retry
+
+from utils.http_util import get_transport
+from utils.mirror_util import get_mirror_pool
+from utils.proxy_util import resolve_proxy
+from utils.rate_util import get_download_limiter, RESPONSE_OK, RESPONSE_ERROR
+from utils.store_util import get_media_store, media_key
 
 
 def norm_str(str):
@@ -48,8 +54,11 @@ def handle_work_info(data):
         ip_location = '未知'
     aweme_id = data['aweme_id']
     nickname = data['author']['nickname']
-    author_avatar = data['author']['avatar_thumb']['url_list'][0]
-    video_cover = data['video']['cover']['url_list'][0]
+    # 保留全部 CDN 镜像地址, 下载时选择最快的
+    author_avatar_list = data['author']['avatar_thumb']['url_list']
+    author_avatar = author_avatar_list[0]
+    video_cover_list = data['video']['cover']['url_list']
+    video_cover = video_cover_list[0]
     title = data['desc']
     desc = data['desc']
     admire_count = data['statistics']['admire_count'] if 'admire_count' in data['statistics'] else 0
@@ -57,10 +66,20 @@ def handle_work_info(data):
     commnet_count = data['statistics']['comment_count']
     collect_count = data['statistics']['collect_count']
     share_count = data['statistics']['share_count']
-    video_addr = data['video']['play_addr']['url_list'][0]
+    video_addr_list = data['video']['play_addr']['url_list']
+    video_addr = video_addr_list[0]
     images = data['images']
     if not isinstance(images, list):
         images = []
+    images_list, images_uri = [], []
+    for image in images:
+        if isinstance(image, dict) and image.get('url_list'):
+            images_list.append(image['url_list'])
+            images_uri.append(image.get('uri'))
+        elif isinstance(image, str):
+            images_list.append([image])
+            images_uri.append(None)
+    images = [urls[0] for urls in images_list]
     create_time = data['create_time']
 
     text_extra = data['text_extra'] if 'text_extra' in data else []
@@ -105,34 +124,383 @@ def handle_work_info(data):
         'aweme_count': aweme_count,
         'user_age': user_age,
         'gender': gender,
-        'ip_location': ip_location
+        'ip_location': ip_location,
+        'mirrors': {
+            'video_addr': video_addr_list,
+            'video_cover': video_cover_list,
+            'author_avatar': author_avatar_list,
+            'images': images_list,
+        },
+        # 接口返回的文件标识, 同一个文件在不同镜像和签名下都一样, 用来去重
+        'uris': {
+            'video_addr': data['video']['play_addr'].get('uri'),
+            'video_cover': data['video']['cover'].get('uri'),
+            'author_avatar': data['author']['avatar_thumb'].get('uri'),
+            'images': images_uri,
+        },
     }
 
 
 def save_to_xlsx(datas, file_path):
+    import openpyxl
     wb = openpyxl.Workbook()
     ws = wb.active
     headers = ['作品id', '作品url', '作品类型', '作品标题', '描述', 'admire数量', '点赞数量', '评论数量', '收藏数量', '分享数量', '视频地址url', '图片地址url列表', '标签', '上传时间', '视频封面url', '用户主页url', '用户id', '昵称', '头像url', '用户描述', '关注数量', '粉丝数量', '作品被赞和收藏数量', '作品数量', '用户年龄', '性别', 'ip归属地']
     ws.append(headers)
     for data in datas:
         data = {k: norm_text(str(v)) for k, v in data.items()}
-        ws.append(list(data.values()))
+        ws.append(list(data.values())[:len(headers)])
     wb.save(file_path)
     logger.info(f'数据保存至 {file_path}')
 
-def download_media(path, name, url, type):
-    if type == 'image':
-        content = requests.get(url).content
-        with open(path + '/' + name + '.jpg', mode="wb") as f:
-            f.write(content)
-    elif type == 'video':
-        res = requests.get(url, stream=True)
-        size = 0
-        chunk_size = 1024 * 1024
-        with open(path + '/' + name + '.mp4', mode="wb") as f:
-            for data in res.iter_content(chunk_size=chunk_size):
-                f.write(data)
-                size += len(data)
+def _download_get(url, proxies=None, **kwargs):
+    # 下载按 CDN 域名单独限速, 只有 429 才降低该域名的速率, 个别分段的 5xx 不影响整个域名; 不同文件轮换代理出口
+    limiter = get_download_limiter()
+    host = urlparse(url).netloc
+    limiter.acquire(host)
+    proxy, proxies = resolve_proxy(proxies)
+    start = time.monotonic()
+    try:
+        res = get_transport().get(url, proxies=proxies, **kwargs)
+    except Exception:
+        if proxy is not None:
+            proxy.on_failure()
+        raise
+    limiter.feedback(host, res.status_code != 429)
+    if proxy is not None:
+        proxy.feedback(RESPONSE_OK if res.status_code < 400 else RESPONSE_ERROR, time.monotonic() - start)
+    return res
+
+
+def _read_sidecar(meta_path):
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_sidecar(meta_path, meta):
+    with open(meta_path, mode='w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+
+def _fetch_part(url, part_path, meta_path, proxies=None, progress=None):
+    # 续传一次 .part 文件, 返回文件总大小; 服务端不支持 Range 或文件已经变了时从头下载
+    meta = _read_sidecar(meta_path)
+    # 分段下载留下的 .part 是预先分配的, 不能按文件大小续传
+    received = os.path.getsize(part_path) if os.path.exists(part_path) and meta and 'done' not in meta else 0
+    headers = {}
+    if received:
+        headers['Range'] = f'bytes={received}-'
+        if meta.get('etag'):
+            headers['If-Range'] = meta['etag']
+    res = _download_get(url, proxies, stream=True, headers=headers)
+    if res.status_code == 416 and received and received == meta.get('length'):
+        res.close()
+        return received
+    res.raise_for_status()
+    if res.status_code == 206 and received:
+        content_range = res.headers.get('Content-Range', '')
+        match = re.match(r'bytes (\d+)-\d+/(\d+|\*)', content_range)
+        if match is None or int(match.group(1)) != received:
+            res.close()
+            raise IOError(f'续传返回的 Content-Range 不正确: {content_range}')
+        length = int(match.group(2)) if match.group(2) != '*' else meta.get('length')
+        mode = 'ab'
+    else:
+        received = 0
+        length = int(res.headers['Content-Length']) if 'Content-Length' in res.headers else None
+        mode = 'wb'
+    meta = {'etag': res.headers.get('ETag'), 'length': length, 'received': received}
+    _write_sidecar(meta_path, meta)
+    with open(part_path, mode=mode) as f:
+        for data in res.iter_content(chunk_size=64 * 1024):
+            f.write(data)
+            meta['received'] += len(data)
+            if meta['received'] % (1024 * 1024) < len(data):
+                _write_sidecar(meta_path, meta)
+            if progress is not None:
+                progress(len(data))
+    return meta['length'] if meta['length'] is not None else meta['received']
+
+
+class _RangeIgnored(Exception):
+    # 服务端对 Range 请求返回了整个文件
+    pass
+
+
+class _SegmentPlan:
+    """
+    分段下载的进度: 已完成的区间和还没分配的空洞, 区间都是左闭右开. 调用方加锁.
+    """
+
+    def __init__(self, length: int, done: list):
+        self.length = length
+        self.done = sorted([list(r) for r in done])
+        self.holes = []
+        position = 0
+        for start, end in self.done:
+            if start > position:
+                self.holes.append([position, start])
+            position = max(position, end)
+        if position < length:
+            self.holes.append([position, length])
+
+    def take(self, size: int):
+        if not self.holes:
+            return None
+        start, end = self.holes[0]
+        if end - start <= size:
+            self.holes.pop(0)
+            return start, end
+        self.holes[0][0] = start + size
+        return start, start + size
+
+    def give_back(self, start: int, end: int):
+        self.holes.insert(0, [start, end])
+
+    def finish(self, start: int, end: int):
+        self.done.append([start, end])
+        self.done.sort()
+        merged = [self.done[0]]
+        for s, e in self.done[1:]:
+            if s <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], e)
+            else:
+                merged.append([s, e])
+        self.done = merged
+
+    def remaining(self) -> int:
+        return sum(end - start for start, end in self.holes)
+
+    def complete(self) -> bool:
+        return self.done == [[0, self.length]]
+
+
+def _probe(url, proxies=None):
+    """
+    用 bytes=0-0 的 Range 请求探测文件.
+    :return: (文件大小或 None, ETag, 是否支持 Range).
+    """
+    res = _download_get(url, proxies, stream=True, headers={'Range': 'bytes=0-0'})
+    res.close()
+    res.raise_for_status()
+    if res.status_code == 206:
+        match = re.match(r'bytes 0-0/(\d+)', res.headers.get('Content-Range', ''))
+        if match:
+            return int(match.group(1)), res.headers.get('ETag'), True
+    length = res.headers.get('Content-Length')
+    return int(length) if length else None, res.headers.get('ETag'), False
+
+
+def _fetch_range(url, f, start, end, etag, proxies=None, progress=None):
+    # 下载 [start, end) 写到文件对应的位置, 返回 (写入的字节数, 异常)
+    written = 0
+    try:
+        headers = {'Range': f'bytes={start}-{end - 1}'}
+        if etag:
+            headers['If-Range'] = etag
+        res = _download_get(url, proxies, stream=True, headers=headers)
+        if res.status_code == 200:
+            res.close()
+            raise _RangeIgnored()
+        res.raise_for_status()
+        f.seek(start)
+        for data in res.iter_content(chunk_size=64 * 1024):
+            data = data[:end - start - written]
+            f.write(data)
+            written += len(data)
+            if progress is not None:
+                progress(len(data))
+            if written >= end - start:
+                break
+        res.close()
+        if written < end - start:
+            raise IOError(f'分段 {start}-{end} 只收到 {written} 字节')
+        return written, None
+    except _RangeIgnored:
+        raise
+    except Exception as e:
+        return written, e
+
+
+def _download_segmented(url, file_path, length, etag, proxies=None, progress=None, connections=None, retries=None):
+    """
+    多连接分段下载: 预先分配 .part 文件, 每个连接用 Range 取一段写到对应位置, 不需要事后合并.
+    从 2 个连接开始, 总速度还在明显增加时再加连接, 最多 connections 个; 每段大小按单个连接的速度调整为约 2 秒的数据量.
+    已完成的区间记录在 .part.json 里, 出错或重启后只下载剩下的部分.
+    """
+    connections = connections or int(os.getenv('DY_SEGMENT_CONNECTIONS', '4'))
+    retries = int(os.getenv('DY_DOWNLOAD_RETRIES', '3')) if retries is None else retries
+    part_path = file_path + '.part'
+    meta_path = part_path + '.json'
+    meta = _read_sidecar(meta_path)
+    if meta.get('length') != length or meta.get('etag') != etag or 'done' not in meta \
+            or not os.path.exists(part_path) or os.path.getsize(part_path) != length:
+        meta = {'etag': etag, 'length': length, 'done': []}
+        with open(part_path, mode='wb') as f:
+            f.truncate(length)
+        _write_sidecar(meta_path, meta)
+    plan = _SegmentPlan(length, meta['done'])
+    lock = threading.Lock()
+    state = {'segment': 4 * 1024 * 1024, 'speed': None, 'received': 0, 'failures': 0, 'error': None}
+
+    def count(size):
+        with lock:
+            state['received'] += size
+        if progress is not None:
+            progress(size)
+
+    def worker():
+        with open(part_path, mode='r+b') as f:
+            while True:
+                with lock:
+                    if state['error'] is not None:
+                        return
+                    # 剩下的部分至少分给每个连接一段, 不让一个连接包揽
+                    size = min(state['segment'], max(1024 * 1024, plan.remaining() // len(threads) + 1))
+                    segment = plan.take(size)
+                if segment is None:
+                    return
+                start, end = segment
+                begin = time.monotonic()
+                try:
+                    written, error = _fetch_range(url, f, start, end, etag, proxies, count)
+                except _RangeIgnored as e:
+                    with lock:
+                        state['error'] = e
+                    return
+                f.flush()
+                elapsed = max(time.monotonic() - begin, 0.001)
+                with lock:
+                    if written:
+                        plan.finish(start, start + written)
+                        meta['done'] = plan.done
+                        _write_sidecar(meta_path, meta)
+                        speed = written / elapsed
+                        state['speed'] = speed if state['speed'] is None else 0.3 * speed + 0.7 * state['speed']
+                        state['segment'] = int(min(64 * 1024 * 1024, max(1024 * 1024, state['speed'] * 2)))
+                    if error is not None:
+                        plan.give_back(start + written, end)
+                        state['failures'] += 1
+                        logger.warning(f'分段 {start + written}-{end} 下载出错: {error}')
+                        if state['failures'] > retries * connections:
+                            state['error'] = error
+                            return
+
+    threads = []
+
+    def spawn():
+        thread = threading.Thread(target=worker, name=f'dy-segment-{len(threads)}', daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    spawn()
+    spawn()
+    last_received, last_time, last_rate = 0, time.monotonic(), 0.0
+    while True:
+        # 先取快照再等待, 判断和 join 之间线程结束也不会出错
+        alive = [thread for thread in threads if thread.is_alive()]
+        if not alive:
+            break
+        alive[0].join(1)
+        now = time.monotonic()
+        with lock:
+            received, remaining, segment = state['received'], plan.remaining(), state['segment']
+        rate = (received - last_received) / max(now - last_time, 0.001)
+        # 加一个连接后总速度提升不到 10% 就不再加
+        if len(threads) < connections and remaining > segment and rate > last_rate * 1.1 and state['error'] is None:
+            spawn()
+        last_received, last_time, last_rate = received, now, max(rate, last_rate)
+    if state['error'] is not None:
+        raise state['error']
+    if not plan.complete() or os.path.getsize(part_path) != length:
+        raise IOError(f'分段下载未完成 {plan.done}')
+    os.replace(part_path, file_path)
+    os.remove(meta_path)
+    return length
+
+
+def download_file(url, file_path, proxies=None, progress=None, retries=None, segmented=False):
+    """
+    可续传的下载: 先写入 file_path.part, 旁边的 file_path.part.json 记录已收到的字节数、ETag 和总大小;
+    出错后用 Range 从断开的地方继续, 下载完成并核对大小后再原子地重命名为 file_path. 进程重启后同样可以续传.
+    :param retries: 出错后的重试次数, 默认 DY_DOWNLOAD_RETRIES 或 3.
+    :param progress: 每收到一块数据调用一次, 参数为这一块的字节数.
+    :param segmented: 是否尝试多连接分段下载, 先探测文件大小, 不小于 DY_SEGMENT_THRESHOLD(默认 8MB)且支持 Range 时分段, 否则单连接下载.
+    :return: 文件大小.
+    """
+    retries = int(os.getenv('DY_DOWNLOAD_RETRIES', '3')) if retries is None else retries
+    part_path = file_path + '.part'
+    meta_path = part_path + '.json'
+    # 已经有单连接下载的 .part 时接着单连接续传
+    if segmented and not (os.path.exists(part_path) and 'done' not in _read_sidecar(meta_path)):
+        try:
+            length, etag, accept_ranges = _probe(url, proxies)
+        except Exception as e:
+            logger.warning(f'探测 {file_path} 的大小失败, 改为单连接下载: {e}')
+            length, etag, accept_ranges = None, None, False
+        if accept_ranges and length >= int(os.getenv('DY_SEGMENT_THRESHOLD', str(8 * 1024 * 1024))):
+            try:
+                return _download_segmented(url, file_path, length, etag, proxies, progress, retries=retries)
+            except _RangeIgnored:
+                logger.warning(f'{urlparse(url).netloc} 不支持分段下载, 改为单连接下载')
+                for path in (part_path, meta_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+    for attempt in range(retries + 1):
+        try:
+            length = _fetch_part(url, part_path, meta_path, proxies, progress)
+            size = os.path.getsize(part_path)
+            if size != length:
+                raise IOError(f'文件大小不一致, 应为 {length} 实际 {size}')
+            os.replace(part_path, file_path)
+            os.remove(meta_path)
+            return size
+        except Exception as e:
+            if attempt == retries:
+                raise
+            logger.warning(f'下载 {file_path} 出错, {attempt + 1} 秒后续传: {e}')
+            time.sleep(attempt + 1)
+
+
+def download_media(path, name, url, type, proxies=None, progress=None, uri=None):
+    """
+    :param url: 下载地址, 也可以是同一个文件的多个镜像地址列表, 按各个 CDN 的表现选择, 出错时换下一个镜像.
+    :param progress: 每收到一块数据调用一次, 参数为这一块的字节数.
+    :param uri: 接口返回的文件标识, 媒体存储里已经有这个文件时直接链接过来, 不再下载.
+    :return: 下载的字节数, 从媒体存储取到时为 0.
+    """
+    file_path = path + '/' + name + ('.mp4' if type == 'video' else '.jpg')
+    urls = [url] if isinstance(url, str) else list(url)
+    store = get_media_store()
+    if store is not None:
+        key = media_key(urls[0], uri)
+        blob = store.lookup(key)
+        if blob is not None:
+            store.link(blob, file_path)
+            return 0
+    mirror_pool = get_mirror_pool()
+    if len(urls) > 1:
+        urls = mirror_pool.race(urls, lambda u: _probe(u, proxies))
+    for index, url in enumerate(urls):
+        last = index == len(urls) - 1
+        start = time.monotonic()
+        try:
+            # 还有其他镜像时少重试, 尽快换镜像
+            size = download_file(url, file_path, proxies, progress, retries=None if last else 1,
+                                 segmented=type == 'video')
+        except Exception as e:
+            mirror_pool.host(url).on_failure()
+            if last:
+                raise
+            logger.warning(f'镜像 {urlparse(url).netloc} 下载 {file_path} 失败, 换下一个镜像: {e}')
+            continue
+        mirror_pool.host(url).on_success(size=size, elapsed=time.monotonic() - start)
+        if store is not None:
+            store.put(file_path, key)
+        return size
 
 
 def save_wrok_detail(work, path):
@@ -167,8 +535,11 @@ def save_wrok_detail(work, path):
         f.write(f"ip归属地: {work['ip_location']}\n")
 
 
-@retry(tries=3, delay=1)
-def download_work(work_info, path, save_choice):
+def prepare_work_dir(work_info, path):
+    """
+    创建作品目录并写入 info.json 和 detail.txt.
+    :return: 作品目录.
+    """
     work_id = work_info['work_id']
     user_id = work_info['user_id']
     title = work_info['title']
@@ -181,14 +552,32 @@ def download_work(work_info, path, save_choice):
     check_and_create_path(save_path)
     with open(f'{save_path}/info.json', mode='w', encoding='utf-8') as f:
         f.write(json.dumps(work_info) + '\n')
-    work_type = work_info['work_type']
     save_wrok_detail(work_info, save_path)
+    return save_path
+
+
+def work_media_list(work_info, save_choice):
+    """
+    :return: 作品需要下载的文件 [(文件名, url 或镜像列表, 类型, uri)], 类型为 image 或 video, uri 可能为 None.
+    """
+    work_type = work_info['work_type']
+    mirrors = work_info.get('mirrors', {})
+    uris = work_info.get('uris', {})
     if work_type == '图集' and save_choice in ['media', 'media-image', 'all']:
-        for img_index, img_url in enumerate(work_info['images']):
-            download_media(save_path, f'image_{img_index}', img_url, 'image')
+        images = mirrors['images'] if 'images' in mirrors else work_info['images']
+        images_uri = uris.get('images') or [None] * len(images)
+        return [(f'image_{img_index}', img_url, 'image', images_uri[img_index])
+                for img_index, img_url in enumerate(images)]
     elif work_type == '视频' and save_choice in ['media', 'media-video', 'all']:
-        download_media(save_path, 'cover', work_info['video_cover'], 'image')
-        download_media(save_path, 'video', work_info['video_addr'], 'video')
+        return [('cover', mirrors.get('video_cover', work_info['video_cover']), 'image', uris.get('video_cover')),
+                ('video', mirrors.get('video_addr', work_info['video_addr']), 'video', uris.get('video_addr'))]
+    return []
+
+
+def download_work(work_info, path, save_choice, proxies=None):
+    save_path = prepare_work_dir(work_info, path)
+    for name, url, type, uri in work_media_list(work_info, save_choice):
+        download_media(save_path, name, url, type, proxies, uri=uri)
     logger.info(f'作品 {work_info["work_id"]} 下载完成，保存路径: {save_path}')
     return save_path
 
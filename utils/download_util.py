@@ -0,0 +1,286 @@
+import os
+import time
+import heapq
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import Future
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from utils.data_util import download_media, prepare_work_dir, work_media_list
+from utils.mirror_util import get_mirror_pool
+
+PRIORITY_COVER = 0
+PRIORITY_IMAGE = 1
+PRIORITY_VIDEO = 2
+
+_default_engine = None
+_default_lock = threading.Lock()
+
+
+class _Task:
+    def __init__(self, priority: int, seq: int, path: str, name: str, url: str, type: str, proxies, uri=None):
+        self.priority = priority
+        self.seq = seq
+        self.path = path
+        self.name = name
+        self.url = url
+        self.type = type
+        self.proxies = proxies
+        self.uri = uri
+        # 有多个镜像时按最可能使用的镜像计入域名并发
+        self.host = urlparse(url if isinstance(url, str) else get_mirror_pool().order(url)[0]).netloc
+        self.future = Future()
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+def _gather(futures: list, result) -> Future:
+    # 全部完成后返回 result, 有一个失败就返回第一个异常
+    gathered = Future()
+    remaining = [len(futures)]
+    lock = threading.Lock()
+    if not futures:
+        gathered.set_result(result)
+        return gathered
+
+    def on_done(future):
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if future.exception() is not None and not gathered.done():
+            try:
+                gathered.set_exception(future.exception())
+            except Exception:
+                pass
+        elif last and not gathered.done():
+            try:
+                gathered.set_result(result)
+            except Exception:
+                pass
+
+    for future in futures:
+        future.add_done_callback(on_done)
+    return gathered
+
+
+class DownloadEngine:
+    """
+    媒体下载引擎: 固定数量的下载线程从优先队列取任务, 封面和图片排在视频前面; 每个 CDN 域名同时下载的文件数有上限,
+    某个域名满了时它的任务先放一边, 线程去下载其他域名的文件. 提交后立即返回 Future, 爬取和下载可以同时进行.
+    """
+
+    def __init__(self, workers: int = None, per_host: int = None, report_interval: float = None):
+        """
+        :param workers: 下载线程数, 默认 DY_DOWNLOAD_WORKERS 或 8.
+        :param per_host: 每个域名同时下载的文件数, 默认 DY_DOWNLOAD_PER_HOST 或 4.
+        :param report_interval: 打印下载进度的间隔(秒), 默认 DY_DOWNLOAD_REPORT_INTERVAL 或 10, 0 表示不打印.
+        """
+        self.workers = workers or int(os.getenv('DY_DOWNLOAD_WORKERS', '8'))
+        self.per_host = per_host or int(os.getenv('DY_DOWNLOAD_PER_HOST', '4'))
+        if report_interval is None:
+            report_interval = float(os.getenv('DY_DOWNLOAD_REPORT_INTERVAL', '10'))
+        self.report_interval = report_interval
+        self._queue = []
+        self._waiting = {}  # 域名已满时暂存的任务, 按域名分组
+        self._active = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._threads = []
+        self._closed = False
+        self._stopped = threading.Event()
+        self._reporter = None
+        self.submitted = 0
+        self.finished = 0
+        self.failed = 0
+        self.bytes = 0
+        self._started = None
+        self._recent = deque()
+
+    def _ensure_threads(self):
+        if self._threads:
+            return
+        self._started = time.monotonic()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f'dy-download-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        if self.report_interval > 0:
+            self._reporter = threading.Thread(target=self._report, name='dy-download-report', daemon=True)
+            self._reporter.start()
+
+    def submit(self, path: str, name: str, url: str, type: str, priority: int = None, proxies=None,
+               uri: str = None) -> Future:
+        """
+        提交一个文件.
+        :param path: 保存目录.
+        :param name: 文件名, 不带扩展名.
+        :param url: 下载地址或镜像地址列表.
+        :param type: image 或 video.
+        :param priority: 越小越先下载, 默认图片 PRIORITY_IMAGE, 视频 PRIORITY_VIDEO.
+        :param proxies: 代理.
+        :param uri: 接口返回的文件标识, 见 download_media.
+        :return: Future, 结果为下载的字节数.
+        """
+        if priority is None:
+            priority = PRIORITY_VIDEO if type == 'video' else PRIORITY_IMAGE
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('下载引擎已关闭')
+            self._ensure_threads()
+            task = _Task(priority, next(self._seq), path, name, url, type, proxies, uri)
+            heapq.heappush(self._queue, task)
+            self.submitted += 1
+            self._cond.notify()
+        return task.future
+
+    def submit_work(self, work_info: dict, path: str, save_choice: str, proxies=None) -> Future:
+        """
+        提交一个作品的全部文件, 作品目录和信息文件立即写入.
+        :param work_info: handle_work_info 的结果.
+        :param path: 媒体保存根目录.
+        :param save_choice: 保存方式, 见 Data_Spider.
+        :return: Future, 全部文件下载完成后结果为作品目录.
+        """
+        save_path = prepare_work_dir(work_info, path)
+        futures = []
+        for name, url, type, uri in work_media_list(work_info, save_choice):
+            priority = PRIORITY_COVER if name == 'cover' else None
+            futures.append(self.submit(save_path, name, url, type, priority, proxies, uri))
+        future = _gather(futures, save_path)
+
+        def on_done(f):
+            if f.exception() is None:
+                logger.info(f'作品 {work_info["work_id"]} 下载完成，保存路径: {save_path}')
+
+        future.add_done_callback(on_done)
+        return future
+
+    def _take(self) -> _Task:
+        # 调用时持有 self._cond
+        while True:
+            while self._queue:
+                task = heapq.heappop(self._queue)
+                if self._active.get(task.host, 0) < self.per_host:
+                    self._active[task.host] = self._active.get(task.host, 0) + 1
+                    return task
+                heapq.heappush(self._waiting.setdefault(task.host, []), task)
+            if self._closed:
+                return None
+            self._cond.wait()
+
+    def _release(self, host: str):
+        # 调用时持有 self._cond, 域名空出位置后把暂存的任务放回队列
+        self._active[host] -= 1
+        if self._active[host] == 0:
+            del self._active[host]
+        waiting = self._waiting.get(host)
+        if waiting:
+            heapq.heappush(self._queue, heapq.heappop(waiting))
+            if not waiting:
+                del self._waiting[host]
+            self._cond.notify()
+
+    def _progress(self, size: int):
+        with self._cond:
+            self.bytes += size
+            self._recent.append((time.monotonic(), size))
+            self._throughput()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                task = self._take()
+            if task is None:
+                return
+            if task.future.set_running_or_notify_cancel():
+                try:
+                    size = download_media(task.path, task.name, task.url, task.type, task.proxies,
+                                          progress=self._progress, uri=task.uri)
+                except Exception as e:
+                    logger.warning(f'下载 {task.path}/{task.name} 失败: {e}')
+                    with self._cond:
+                        self.failed += 1
+                    task.future.set_exception(e)
+                else:
+                    with self._cond:
+                        self.finished += 1
+                    task.future.set_result(size)
+            with self._cond:
+                self._release(task.host)
+
+    def _throughput(self, window: float = 10) -> float:
+        # 调用时持有 self._cond
+        now = time.monotonic()
+        while self._recent and now - self._recent[0][0] > window:
+            self._recent.popleft()
+        return sum(size for _, size in self._recent) / window
+
+    def stats(self) -> dict:
+        """
+        :return: 提交、完成、失败、排队和正在下载的文件数, 总字节数, 平均和最近 10 秒的速度(字节/秒).
+        """
+        with self._cond:
+            elapsed = time.monotonic() - self._started if self._started else 0
+            return {
+                'submitted': self.submitted,
+                'finished': self.finished,
+                'failed': self.failed,
+                'queued': len(self._queue) + sum(len(w) for w in self._waiting.values()),
+                'active': sum(self._active.values()),
+                'bytes': self.bytes,
+                'speed': round(self.bytes / elapsed, 1) if elapsed > 0 else 0.0,
+                'recent_speed': round(self._throughput(), 1),
+            }
+
+    def _report(self):
+        last = None
+        while not self._stopped.wait(self.report_interval):
+            stats = self.stats()
+            current = (stats['finished'], stats['failed'], stats['bytes'])
+            if current == last and stats['active'] == 0:
+                continue
+            last = current
+            logger.info(f'下载进度: 完成 {stats["finished"]}/{stats["submitted"]}, 失败 {stats["failed"]}, '
+                        f'正在下载 {stats["active"]}, 速度 {stats["recent_speed"] / 1024 / 1024:.2f} MB/s')
+
+    def close(self, wait: bool = True):
+        """
+        不再接收新任务, 已提交的任务下载完后线程退出.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._stopped.set()
+
+
+def get_download_engine() -> DownloadEngine:
+    """
+    进程内共用的下载引擎.
+    """
+    global _default_engine
+    if _default_engine is None:
+        with _default_lock:
+            if _default_engine is None:
+                _default_engine = DownloadEngine()
+    return _default_engine
+
+
+def wait_downloads(futures: list):
+    """
+    等待一组下载全部结束, 有失败时在全部结束后抛出第一个异常.
+    """
+    error = None
+    for future in futures:
+        try:
+            future.result()
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
@@ -1,19 +1,24 @@
+import os
 import re
 import sys
 import time
 import json
 import random
+import atexit
 import base64
 import urllib
+import threading
 from os import path
+from functools import lru_cache
 
-import requests
-requests.packages.urllib3.disable_warnings()
-import subprocess
-from functools import partial
+from loguru import logger
+
+from utils.ab_util import get_ab
+from utils.cache_util import TTLCache, LoadingCache
+from utils.http_util import get_transport
+from utils.proxy_util import resolve_proxy
+from utils.rate_util import account_key
 
-subprocess.Popen = partial(subprocess.Popen, encoding="utf-8")
-import execjs
 
 if getattr(sys, 'frozen', None):
     basedir = sys._MEIPASS
@@ -21,18 +26,101 @@ else:
     basedir = path.dirname(__file__)
 
 
-try:
-    node_modules = path.join(basedir, 'node_modules')
-    dy_path = path.join(basedir, 'static', 'dy_ab.js')
-    dy_js = execjs.compile(open(dy_path, 'r', encoding='utf-8').read(), cwd=node_modules)
-    sign_path = path.join(basedir, 'static', 'dy_live_sign.js')
-    sign_js = execjs.compile(open(sign_path, 'r', encoding='utf-8').read(), cwd=node_modules)
-except:
-    node_modules = path.join(basedir, '..', 'node_modules')
-    dy_path = path.join(basedir, '..', 'static', 'dy_ab.js')
-    dy_js = execjs.compile(open(dy_path, 'r', encoding='utf-8').read(), cwd=node_modules)
-    sign_path = path.join(basedir, '..', 'static', 'dy_live_sign.js')
-    sign_js = execjs.compile(open(sign_path, 'r', encoding='utf-8').read(), cwd=node_modules)
+@lru_cache(maxsize=None)
+def static_path(name):
+    """
+    查找 static 下的脚本, 打包运行时在 basedir 下, 源码运行时在上一级目录.
+    :return: 脚本路径, node_modules 路径
+    """
+    for base in (basedir, path.join(basedir, '..')):
+        file_path = path.join(base, 'static', name)
+        if path.exists(file_path):
+            return file_path, path.join(base, 'node_modules')
+    raise FileNotFoundError(path.join(basedir, 'static', name))
+
+
+_execjs_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def load_js(name):
+    """
+    第一次用到时才用 execjs 编译脚本, 之后复用编译好的句柄.
+    """
+    import subprocess
+    from functools import partial
+    import execjs
+    import execjs._external_runtime as runtime
+    # 只改 execjs 自己引用的 Popen, 让 node 输出按 utf-8 解码, 不动全局的 subprocess
+    with _execjs_lock:
+        if not isinstance(runtime.Popen, partial):
+            runtime.Popen = partial(subprocess.Popen, encoding='utf-8')
+    file_path, node_modules = static_path(name)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return execjs.compile(f.read(), cwd=node_modules)
+
+
+_dy_pool = None
+_dy_pool_lock = threading.Lock()
+_live_worker = None
+_live_signatures = TTLCache(ttl=600, maxsize=4096)
+# 每个直播间签名后连续没连上的次数, 和最后一次重建 jsdom 环境的时间
+_live_sign_failures = TTLCache(ttl=600, maxsize=4096)
+_live_sign_reset_at = None
+_live_sign_reset_lock = threading.Lock()
+_webids = LoadingCache(ttl=float(os.getenv('DY_WEBID_TTL', '21600')))
+# 获取失败时用的假 webid, 有效期内同一个 cookie 固定用一个, 过期后换新的
+_fake_webids = LoadingCache(ttl=float(os.getenv('DY_WEBID_TTL', '21600')), refresh_ahead=1)
+_csrf_tokens = LoadingCache(ttl=float(os.getenv('DY_CSRF_TTL', '3600')))
+
+
+def get_dy_pool():
+    """
+    常驻 node 签名进程池, 每个进程第一次用到时才启动, dy_ab.js 在每个进程里只加载一次.
+    进程数由 DY_SIGN_WORKERS 指定(默认 CPU 核数), 单进程在途请求数由 DY_SIGN_MAX_INFLIGHT 指定.
+    """
+    global _dy_pool
+    if _dy_pool is None:
+        with _dy_pool_lock:
+            if _dy_pool is None:
+                from utils.sign_util import SignWorkerPool
+                _dy_pool = SignWorkerPool(static_path('dy_ab.js')[0], ['get_ab', 'get_req_sign', 'get_ree_key'],
+                                          size=int(os.getenv('DY_SIGN_WORKERS', '0')) or None,
+                                          max_inflight=int(os.getenv('DY_SIGN_MAX_INFLIGHT', '2')))
+                atexit.register(_dy_pool.close)
+    return _dy_pool
+
+
+def get_live_sign_worker():
+    """
+    常驻直播签名进程, jsdom 环境只构建一次, 所有直播间共用.
+    """
+    global _live_worker
+    if _live_worker is None:
+        with _dy_pool_lock:
+            if _live_worker is None:
+                from utils.sign_util import SignWorker
+                _live_worker = SignWorker(static_path('dy_live_sign.js')[0], ['sign', 'reset_sign'], timeout=30, start_timeout=120)
+                atexit.register(_live_worker.close)
+    return _live_worker
+
+
+def sign_pool_stats():
+    return get_dy_pool().stats()
+
+
+def dy_js_call(method, *args):
+    # DY_SIGN_BACKEND=execjs 时退回每次调用都起一个 node 进程的旧方式
+    if os.getenv('DY_SIGN_BACKEND', 'worker') == 'execjs':
+        return load_js('dy_ab.js').call(method, *args)
+    return get_dy_pool().call(method, *args)
+
+
+async def dy_js_call_async(method, *args):
+    if os.getenv('DY_SIGN_BACKEND', 'worker') == 'execjs':
+        import asyncio
+        return await asyncio.to_thread(load_js('dy_ab.js').call, method, *args)
+    return await get_dy_pool().acall(method, *args)
 
 
 def trans_cookies(cookies_str):
@@ -50,23 +138,81 @@ def trans_cookies(cookies_str):
 
 # 私信传obj, 其他的拼接
 def generate_req_sign(e, priK):
-    sign = dy_js.call('get_req_sign', e, priK)
+    sign = dy_js_call('get_req_sign', e, priK)
     return sign
 
 
-# query, data都是拼接字符串
+# query, data都是拼接字符串, DY_SIGN_BACKEND=python 时在进程内计算, 不经过 node
 def generate_a_bogus(query, data=""):
-    a_bogus = dy_js.call('get_ab', query, data)
+    if os.getenv('DY_SIGN_BACKEND', 'worker') == 'python':
+        return get_ab(query, data)
+    a_bogus = dy_js_call('get_ab', query, data)
+    return a_bogus
+
+
+async def generate_a_bogus_async(query, data=""):
+    if os.getenv('DY_SIGN_BACKEND', 'worker') == 'python':
+        return get_ab(query, data)
+    a_bogus = await dy_js_call_async('get_ab', query, data)
     return a_bogus
 
 
-def generate_signature(roomId, user_unique_id):
-    return sign_js.call('sign', roomId, user_unique_id)
+# 同一个直播间和用户的签名在 DY_LIVE_SIGN_TTL 秒(默认 600)内复用
+def generate_signature(roomId, user_unique_id, refresh=False):
+    key = (str(roomId), str(user_unique_id))
+    if not refresh:
+        signature = _live_signatures.get(key)
+        if signature is not None:
+            return signature
+    if os.getenv('DY_SIGN_BACKEND', 'worker') == 'execjs':
+        signature = load_js('dy_live_sign.js').call('sign', roomId, user_unique_id)
+    else:
+        signature = get_live_sign_worker().call('sign', roomId, user_unique_id)
+    _live_signatures.set(key, signature, ttl=float(os.getenv('DY_LIVE_SIGN_TTL', '600')))
+    return signature
+
+
+def invalidate_signature(roomId, user_unique_id):
+    """
+    丢掉该直播间缓存的签名, 下次重新签名. jsdom 环境是所有直播间共用的, 同一直播间连续 DY_LIVE_SIGN_RESET_FAILURES 次
+    (默认 3)重新签名后仍连不上时才重建, 且两次重建至少间隔 DY_LIVE_SIGN_RESET_INTERVAL 秒(默认 300).
+    """
+    key = (str(roomId), str(user_unique_id))
+    _live_signatures.pop(key)
+    failures = _live_sign_failures.get(key, 0) + 1
+    if failures < int(os.getenv('DY_LIVE_SIGN_RESET_FAILURES', '3')):
+        _live_sign_failures.set(key, failures)
+        return
+    _live_sign_failures.pop(key)
+    _reset_live_sign()
+
+
+def confirm_signature(roomId, user_unique_id):
+    """
+    用签名连上后调用, 清掉该直播间的失败次数.
+    """
+    _live_sign_failures.pop((str(roomId), str(user_unique_id)))
+
+
+def _reset_live_sign():
+    global _live_sign_reset_at
+    if _live_worker is None:
+        return
+    with _live_sign_reset_lock:
+        now = time.monotonic()
+        if _live_sign_reset_at is not None and \
+                now - _live_sign_reset_at < float(os.getenv('DY_LIVE_SIGN_RESET_INTERVAL', '300')):
+            return
+        _live_sign_reset_at = now
+    try:
+        _live_worker.call('reset_sign')
+    except Exception as e:
+        logger.warning(f'重置直播签名环境失败: {e}')
 
 
 # 传递私钥
 def generate_ree_key(prik):
-    ree_key = dy_js.call('get_ree_key', prik)
+    ree_key = dy_js_call('get_ree_key', prik)
     return ree_key
 
 
@@ -102,7 +248,8 @@ def generate_ttwid():
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
             "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8"
         }
-        response = requests.get(url, headers=headers, verify=False)
+        _, proxies = resolve_proxy()
+        response = get_transport().get(url, headers=headers, proxies=proxies)
         cookies_dict = response.cookies.get_dict()
         ttwid = cookies_dict.get('ttwid')
         return ttwid
@@ -119,25 +266,43 @@ def generate_fake_webid(random_length=19):
     return random_str
 
 
-def generate_webid(auth=None, url=""):
+def fetch_webid(auth=None, url=""):
+    """
+    请求抖音页面, 从中取出 user_unique_id 作为 webid, 失败时抛出异常.
+    """
     if url == "":
         url = f"https://www.douyin.com/discover?modal_id=7376449060384935209"
+    from builder.header import HeaderBuilder, HeaderType
+    headers = HeaderBuilder().build(HeaderType.DOC)
+    headers.set_header('cookie', auth.cookie_str if auth else "")
+    headers.set_header("upgrade-insecure-requests", "1")
+    transport = getattr(auth, 'transport', None) or get_transport()
+    # 和该账号的接口请求走同一个代理出口, webid 和出口 IP 保持一致
+    _, proxies = resolve_proxy(key=account_key(auth))
+    response = transport.get(url, headers=headers.get(), proxies=proxies)
+    res_text = response.text
+    user_unique_id = re.findall(r'\\"user_unique_id\\":\\"(.*?)\\"', res_text)[0]
+    return user_unique_id
+
+
+def _webid_key(auth):
+    return auth.cookie_str if auth else ""
+
+
+# 同一个 cookie 的 webid 缓存 DY_WEBID_TTL 秒(默认 6 小时), 并发调用只请求一次页面, 快过期时后台刷新
+def generate_webid(auth=None, url=""):
+    key = _webid_key(auth)
     try:
-        from builder.header import HeaderBuilder, HeaderType
-        headers = HeaderBuilder().build(HeaderType.DOC)
-        headers.set_header('cookie', auth.cookie_str if auth else "")
-        headers.set_header("upgrade-insecure-requests", "1")
-        response = requests.get(url, headers=headers.get(), verify=False)
-        res_text = response.text
-        user_unique_id = re.findall(r'\\"user_unique_id\\":\\"(.*?)\\"', res_text)[0]
-        webid = user_unique_id
+        return _webids.get(key, lambda: (fetch_webid(auth, url), None))
+    except Exception:
+        # 获取失败时同一个 cookie 固定用一个假 webid, 一分钟后再重新获取
+        webid = _fake_webids.get(key, lambda: (generate_fake_webid(), None))
+        _webids.set(key, webid, ttl=60)
         return webid
-    except Exception as e:
-        # print("===================")
-        # print(url)
-        # print(e)
-        # print("===================")
-        return generate_fake_webid()
+
+
+def invalidate_webid(auth=None):
+    _webids.invalidate(_webid_key(auth))
 
 
 def ws_accept_key(ws_key):
@@ -159,31 +324,61 @@ def ws_accept_key(ws_key):
         return None
 
 
+def fetch_csrf_token(cookies_str):
+    """
+    请求 abtest_config 获取 csrf token, 失败时抛出异常.
+    :return: (csrf_token_1, csrf_token_2), 有效期(秒)
+    """
+    headers = {
+        'accept': '*/*',
+        'accept-language': 'zh-CN,zh;q=0.9,en;q=0.8,en-GB;q=0.7,en-US;q=0.6',
+        'cache-control': 'no-cache',
+        'cookie': cookies_str,
+        'pragma': 'no-cache',
+        'priority': 'u=1, i',
+        'referer': 'https://www.douyin.com/?recommend=1',
+        'sec-ch-ua': '"Microsoft Edge";v="125", "Chromium";v="125", "Not.A/Brand";v="24"',
+        'sec-ch-ua-mobile': '?0',
+        'sec-ch-ua-platform': '"Windows"',
+        'sec-fetch-dest': 'empty',
+        'sec-fetch-mode': 'cors',
+        'sec-fetch-site': 'same-origin',
+        'user-agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
+        'x-secsdk-csrf-request': '1',
+        'x-secsdk-csrf-version': '1.2.22',
+    }
+    # 和该账号的接口请求走同一个代理出口
+    cookies = trans_cookies(cookies_str)
+    _, proxies = resolve_proxy(key=cookies.get('sessionid') or cookies.get('ttwid'))
+    response = get_transport().head('https://www.douyin.com/service/2/abtest_config/', headers=headers,
+                                    proxies=proxies)
+    fields = response.headers['X-Ware-Csrf-Token'].split(',')
+    if not fields[1]:
+        raise ValueError('csrf token 为空')
+    lifetime = int(fields[2]) / 1000 if fields[2].isdigit() else None
+    return (fields[1], fields[4]), lifetime
+
+
+# 同一个 cookie 的 csrf token 按返回的有效期缓存(没有时 DY_CSRF_TTL 秒), 快过期时后台刷新
 def generate_csrf_token(cookies_str):
-    csrf_token_1, csrf_token_2 = None, None
     try:
-        headers = {
-            'accept': '*/*',
-            'accept-language': 'zh-CN,zh;q=0.9,en;q=0.8,en-GB;q=0.7,en-US;q=0.6',
-            'cache-control': 'no-cache',
-            'cookie': cookies_str,
-            'pragma': 'no-cache',
-            'priority': 'u=1, i',
-            'referer': 'https://www.douyin.com/?recommend=1',
-            'sec-ch-ua': '"Microsoft Edge";v="125", "Chromium";v="125", "Not.A/Brand";v="24"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"Windows"',
-            'sec-fetch-dest': 'empty',
-            'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'same-origin',
-            'user-agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
-            'x-secsdk-csrf-request': '1',
-            'x-secsdk-csrf-version': '1.2.22',
-        }
-        response = requests.head('https://www.douyin.com/service/2/abtest_config/', headers=headers, verify=False)
-        return response.headers['X-Ware-Csrf-Token'].split(',')[1], response.headers['X-Ware-Csrf-Token'].split(',')[4]
+        return _csrf_tokens.get(cookies_str, lambda: fetch_csrf_token(cookies_str))
     except Exception as e:
-        return csrf_token_1, csrf_token_2
+        return None, None
+
+
+def invalidate_csrf_token(cookies_str):
+    _csrf_tokens.invalidate(cookies_str)
+
+
+def check_csrf_response(response, cookies_str):
+    """
+    请求因 csrf 校验失败被拒绝时, 丢弃该 cookie 缓存的 token, 下次重新获取.
+    """
+    csrf_header = response.headers.get('X-Ware-Csrf-Token', '')
+    if response.status_code == 403 or 'fail' in csrf_header.lower():
+        invalidate_csrf_token(cookies_str)
+    return response
 
 
 def generate_millisecond():
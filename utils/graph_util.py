@@ -0,0 +1,315 @@
+import os
+import math
+import sqlite3
+import hashlib
+import threading
+
+from loguru import logger
+
+from builder.auth import AuthPool
+from dy_apis.douyin_api import DouyinAPI
+
+NODE_QUEUED = 0
+NODE_RUNNING = 1
+NODE_DONE = 2
+NODE_FAILED = 3
+NODE_LEAF = 4  # 超出深度, 只记录不展开
+
+RELATION_FOLLOWER = 'follower'
+RELATION_FOLLOWING = 'following'
+
+
+class BloomFilter:
+    """
+    布隆过滤器, 内存大小只取决于容量和误判率, 不随加入的元素增加. 没有见过的元素一定返回 False.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        :param capacity: 预计元素个数, 超过后误判率会升高.
+        :param error_rate: 期望误判率.
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key: str):
+        positions = self._positions(key)
+        with self._lock:
+            for p in positions:
+                self.bits[p >> 3] |= 1 << (p & 7)
+            self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+
+class GraphStore:
+    """
+    关注关系图的本地存储(SQLite):
+    nodes 表既是已发现用户的精确去重集合, 也是待爬队列(按深度先进先出); follows 表保存 src 关注 dst 的边.
+    前面加一个布隆过滤器, 大部分新用户不用查库就能确定没有见过. 线程安全, 每个线程一个连接.
+    """
+
+    def __init__(self, path: str, capacity: int = None, error_rate: float = 0.01):
+        """
+        :param path: SQLite 文件路径.
+        :param capacity: 布隆过滤器容量, 默认 DY_GRAPH_CAPACITY 或 10000000.
+        :param error_rate: 布隆过滤器误判率.
+        """
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS nodes (sec_uid TEXT PRIMARY KEY, uid TEXT, nickname TEXT, '
+                         'depth INTEGER NOT NULL, state INTEGER NOT NULL, error TEXT)')
+            conn.execute('CREATE INDEX IF NOT EXISTS nodes_queue ON nodes (state, depth)')
+            conn.execute('CREATE TABLE IF NOT EXISTS follows (src TEXT NOT NULL, dst TEXT NOT NULL, '
+                         'PRIMARY KEY (src, dst)) WITHOUT ROWID')
+            # 上次中途退出时正在爬的用户重新排队
+            conn.execute('UPDATE nodes SET state = ? WHERE state = ?', (NODE_QUEUED, NODE_RUNNING))
+        self.bloom = BloomFilter(capacity or int(os.getenv('DY_GRAPH_CAPACITY', '10000000')), error_rate)
+        for (sec_uid,) in self._connect().execute('SELECT sec_uid FROM nodes'):
+            self.bloom.add(sec_uid)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def _known(self, conn, sec_uids: list) -> set:
+        known = set()
+        for i in range(0, len(sec_uids), 500):
+            batch = sec_uids[i:i + 500]
+            rows = conn.execute(f'SELECT sec_uid FROM nodes WHERE sec_uid IN ({",".join("?" * len(batch))})', batch)
+            known.update(row[0] for row in rows)
+        return known
+
+    def add_nodes(self, users: list, depth: int, max_depth: int) -> int:
+        """
+        记录新发现的用户. 已经见过的用户这次走了更短的路径时改成更小的深度: 只记录未展开的重新排队,
+        已经爬完的在新深度下还能展开下一层时也重新排队, 让它的关注用户拿到正确的深度.
+        多个线程同时爬时, 深的用户可能比浅的先被发现, 不这样处理的话 max_depth 以内的用户可能永远不展开.
+        :param users: 用户信息列表, 需要有 sec_uid, 可以有 uid 和 nickname.
+        :param depth: 这些用户离种子的距离.
+        :param max_depth: 超过这个深度的用户只记录不排队.
+        :return: 新用户个数.
+        """
+        users = [u for u in users if u.get('sec_uid')]
+        # 布隆过滤器说没见过的一定是新用户, 说见过的再查库确认
+        maybe = [u['sec_uid'] for u in users if u['sec_uid'] in self.bloom]
+        state = NODE_QUEUED if depth <= max_depth else NODE_LEAF
+        requeue_done = depth < max_depth
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                known = self._known(conn, maybe) if maybe else set()
+                rows = {u['sec_uid']: (u['sec_uid'], u.get('uid'), u.get('nickname'), depth, state, requeue_done)
+                        for u in users}
+                conn.executemany('INSERT INTO nodes (sec_uid, uid, nickname, depth, state) VALUES (?, ?, ?, ?, ?) '
+                                 'ON CONFLICT(sec_uid) DO UPDATE SET depth = excluded.depth, '
+                                 'uid = COALESCE(nodes.uid, excluded.uid), '
+                                 f'state = CASE WHEN nodes.state = {NODE_LEAF} THEN excluded.state '
+                                 f'WHEN nodes.state = {NODE_DONE} AND ? THEN {NODE_QUEUED} ELSE nodes.state END '
+                                 'WHERE excluded.depth < nodes.depth', list(rows.values()))
+            for sec_uid in rows:
+                self.bloom.add(sec_uid)
+        return len([sec_uid for sec_uid in rows if sec_uid not in known])
+
+    def add_edges(self, edges: list):
+        """
+        :param edges: (src, dst) 列表, 表示 src 关注了 dst.
+        """
+        with self._connect() as conn:
+            conn.executemany('INSERT OR IGNORE INTO follows (src, dst) VALUES (?, ?)', edges)
+
+    def claim(self):
+        """
+        取出一个待爬用户并标记为正在爬.
+        :return: (sec_uid, uid, depth), 队列为空时返回 None.
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                row = conn.execute('SELECT sec_uid, uid, depth FROM nodes WHERE state = ? ORDER BY depth LIMIT 1',
+                                   (NODE_QUEUED,)).fetchone()
+                if row is not None:
+                    conn.execute('UPDATE nodes SET state = ? WHERE sec_uid = ?', (NODE_RUNNING, row[0]))
+        return row
+
+    def finish(self, sec_uid: str, uid: str = None, error: str = None):
+        with self._connect() as conn:
+            conn.execute('UPDATE nodes SET state = ?, uid = COALESCE(?, uid), error = ? WHERE sec_uid = ?',
+                         (NODE_FAILED if error else NODE_DONE, uid, error, sec_uid))
+
+    def retry_failed(self) -> int:
+        """
+        把失败的用户重新排队.
+        :return: 重新排队的个数.
+        """
+        with self._connect() as conn:
+            return conn.execute('UPDATE nodes SET state = ?, error = NULL WHERE state = ?',
+                                (NODE_QUEUED, NODE_FAILED)).rowcount
+
+    def edges(self):
+        """
+        :return: 逐条返回 (src, dst), 不一次性读入内存.
+        """
+        return self._connect().execute('SELECT src, dst FROM follows')
+
+    def stats(self) -> dict:
+        conn = self._connect()
+        states = dict(conn.execute('SELECT state, COUNT(*) FROM nodes GROUP BY state').fetchall())
+        return {
+            'queued': states.get(NODE_QUEUED, 0),
+            'running': states.get(NODE_RUNNING, 0),
+            'done': states.get(NODE_DONE, 0),
+            'failed': states.get(NODE_FAILED, 0),
+            'leaf': states.get(NODE_LEAF, 0),
+            'edges': conn.execute('SELECT COUNT(*) FROM follows').fetchone()[0],
+        }
+
+
+class GraphCrawler:
+    """
+    从种子用户出发, 按深度逐层爬取关注和粉丝关系. 队列和去重都在 GraphStore 里, 中途退出后用同一个文件重新运行会接着爬.
+    用法:
+        crawler = GraphCrawler(auth, max_depth=2)
+        crawler.add_seed(sec_uid)
+        crawler.run()
+    """
+
+    def __init__(self, auth, store: GraphStore = None, max_depth: int = 2,
+                 relations=(RELATION_FOLLOWING, RELATION_FOLLOWER), max_per_user: int = None, workers: int = 4,
+                 proxies=None):
+        """
+        :param auth: DouyinAuth 或 AuthPool, 使用 AuthPool 时每个用户借一个账号来爬.
+        :param store: GraphStore, 默认 DY_GRAPH_PATH 或 datas/graph.db.
+        :param max_depth: 从种子往外展开几层, 种子为第 0 层.
+        :param relations: 要爬的关系, RELATION_FOLLOWING 和/或 RELATION_FOLLOWER.
+        :param max_per_user: 每个用户每种关系最多取多少人, 默认 DY_GRAPH_MAX_PER_USER 或 不限.
+        :param workers: 同时爬的用户数.
+        :param proxies: 代理.
+        """
+        if store is None:
+            store = GraphStore(os.getenv('DY_GRAPH_PATH') or os.path.abspath(
+                os.path.join(os.path.dirname(__file__), '../datas/graph.db')))
+        if max_per_user is None and os.getenv('DY_GRAPH_MAX_PER_USER'):
+            max_per_user = int(os.getenv('DY_GRAPH_MAX_PER_USER'))
+        self.auth = auth
+        self.store = store
+        self.max_depth = max_depth
+        self.relations = relations
+        self.max_per_user = max_per_user
+        self.workers = workers
+        self.proxies = proxies
+        self._cond = threading.Condition()
+        self._running = 0
+        self._claimed = 0
+
+    def add_seed(self, sec_uid: str, uid: str = None) -> bool:
+        """
+        :param sec_uid: 用户 sec_uid 或主页链接.
+        :param uid: 用户 uid, 不传时爬取前通过用户信息接口获取.
+        :return: 是否是新用户.
+        """
+        sec_uid = sec_uid.split('/')[-1].split('?')[0]
+        added = self.store.add_nodes([{'sec_uid': sec_uid, 'uid': uid}], 0, self.max_depth)
+        with self._cond:
+            self._cond.notify_all()
+        return added > 0
+
+    def _crawl_relation(self, auth, relation: str, sec_uid: str, uid: str, depth: int):
+        if relation == RELATION_FOLLOWER:
+            pages = DouyinAPI.iter_user_follower_list(auth, uid, sec_uid, proxies=self.proxies)
+        else:
+            pages = DouyinAPI.iter_user_following_list(auth, uid, sec_uid, proxies=self.proxies)
+        count = 0
+        for page in pages.pages():
+            users = page.items
+            if self.max_per_user is not None:
+                users = users[:self.max_per_user - count]
+            if relation == RELATION_FOLLOWER:
+                edges = [(u['sec_uid'], sec_uid) for u in users if u.get('sec_uid')]
+            else:
+                edges = [(sec_uid, u['sec_uid']) for u in users if u.get('sec_uid')]
+            # 先写节点再写边, 中途退出时不会出现指向未知用户的边
+            self.store.add_nodes(users, depth + 1, self.max_depth)
+            self.store.add_edges(edges)
+            count += len(users)
+            if self.max_per_user is not None and count >= self.max_per_user:
+                pages.close()
+                break
+        return count
+
+    def _crawl(self, auth, sec_uid: str, uid: str, depth: int):
+        if not uid:
+            user_info = DouyinAPI.get_user_info(auth, f'https://www.douyin.com/user/{sec_uid}', proxies=self.proxies)
+            uid = user_info['user']['uid']
+        counts = {relation: self._crawl_relation(auth, relation, sec_uid, uid, depth) for relation in self.relations}
+        logger.info(f'用户 {sec_uid} 第 {depth} 层 {counts}')
+        return uid
+
+    def _claim(self, limit: int = None):
+        # 队列暂时为空但还有用户在爬时等待, 它们可能会发现新用户
+        with self._cond:
+            while True:
+                if limit is not None and self._claimed >= limit:
+                    return None
+                node = self.store.claim()
+                if node is not None:
+                    self._running += 1
+                    self._claimed += 1
+                    return node
+                if self._running == 0:
+                    return None
+                self._cond.wait()
+
+    def _worker(self, limit: int = None):
+        while True:
+            node = self._claim(limit)
+            if node is None:
+                return
+            sec_uid, uid, depth = node
+            try:
+                if isinstance(self.auth, AuthPool):
+                    with self.auth.lease() as auth:
+                        uid = self._crawl(auth, sec_uid, uid, depth)
+                else:
+                    uid = self._crawl(self.auth, sec_uid, uid, depth)
+                self.store.finish(sec_uid, uid)
+            except Exception as e:
+                logger.warning(f'爬取用户 {sec_uid} 的关系失败: {e}')
+                self.store.finish(sec_uid, uid, error=repr(e))
+            finally:
+                with self._cond:
+                    self._running -= 1
+                    self._cond.notify_all()
+
+    def run(self, limit: int = None) -> dict:
+        """
+        爬到队列为空或爬够 limit 个用户为止.
+        :param limit: 这次最多爬多少个用户, 默认不限.
+        :return: GraphStore.stats().
+        """
+        self._claimed = 0
+        threads = [threading.Thread(target=self._worker, args=(limit,), name=f'dy-graph-{i}', daemon=True)
+                   for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self.store.stats()
@@ -0,0 +1,73 @@
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+requests.packages.urllib3.disable_warnings()
+
+_default_transport = None
+_default_lock = threading.Lock()
+
+
+class _NoPersistPolicy(DefaultCookiePolicy):
+    # 会话在多个账号间共用, 响应里的 set-cookie 不写回会话, cookie 只由每次请求传入
+    def set_ok(self, cookie, request):
+        return False
+
+
+class HttpTransport:
+    """
+    基于 requests.Session 的 http 传输层, 每个 host 保持一组 keep-alive 连接, 线程安全.
+    """
+
+    def __init__(self, pool_connections: int = None, pool_maxsize: int = None, timeout=None,
+                 max_retries: int = 0, verify: bool = False):
+        """
+        :param pool_connections: 缓存连接池的 host 数, 默认 DY_HTTP_POOL_CONNECTIONS 或 10.
+        :param pool_maxsize: 每个 host 最多保持的连接数, 默认 DY_HTTP_POOL_MAXSIZE 或 20.
+        :param timeout: 默认超时时间(秒), 可以是 (连接超时, 读取超时), 默认 DY_HTTP_TIMEOUT 或 (10, 30).
+        :param max_retries: 连接失败时的重试次数.
+        :param verify: 是否校验证书.
+        """
+        self.pool_connections = pool_connections or int(os.getenv('DY_HTTP_POOL_CONNECTIONS', '10'))
+        self.pool_maxsize = pool_maxsize or int(os.getenv('DY_HTTP_POOL_MAXSIZE', '20'))
+        if timeout is None:
+            timeout = float(os.getenv('DY_HTTP_TIMEOUT', '0')) or (10, 30)
+        self.timeout = timeout
+        self.verify = verify
+        self.session = requests.Session()
+        self.session.cookies.set_policy(_NoPersistPolicy())
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize,
+                              max_retries=max_retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout)
+        kwargs.setdefault('verify', self.verify)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        return self.request('HEAD', url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+def get_transport() -> HttpTransport:
+    """
+    进程内共用的默认传输层, 没有传入 auth 的辅助函数也走这里.
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_lock:
+            if _default_transport is None:
+                _default_transport = HttpTransport()
+    return _default_transport
@@ -0,0 +1,174 @@
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+
+from loguru import logger
+
+_default_pool = None
+_default_lock = threading.Lock()
+
+
+class Host:
+    """
+    一个 CDN 域名的下载表现: 首字节延迟和下载速度的指数加权平均、连续失败次数和封禁时间. 线程安全.
+    """
+
+    def __init__(self, host: str, alpha: float = 0.3, max_failures: int = 3, ban_time: float = 300):
+        self.host = host
+        self.alpha = alpha
+        self.max_failures = max_failures
+        self.ban_time = ban_time
+        self.latency = None
+        self.throughput = None
+        self.success = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.banned_until = 0.0
+        self._lock = threading.Lock()
+
+    def _average(self, old, new):
+        return new if old is None else self.alpha * new + (1 - self.alpha) * old
+
+    def available(self, now: float = None) -> bool:
+        return (now or time.monotonic()) >= self.banned_until
+
+    def on_success(self, latency: float = None, size: int = None, elapsed: float = None):
+        """
+        :param latency: 首字节延迟(秒).
+        :param size: 下载的字节数, 和 elapsed 一起用来更新速度.
+        :param elapsed: 下载耗时(秒).
+        """
+        with self._lock:
+            self.success += 1
+            self.consecutive_failures = 0
+            if latency is not None:
+                self.latency = self._average(self.latency, latency)
+            # 太小的文件测不准速度
+            if size and elapsed and size >= 256 * 1024:
+                self.throughput = self._average(self.throughput, size / max(elapsed, 0.001))
+
+    def on_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.consecutive_failures < self.max_failures:
+                return
+            self.consecutive_failures = 0
+            self.banned_until = time.monotonic() + self.ban_time
+        logger.warning(f'CDN {self.host} 连续失败 {self.max_failures} 次, {self.ban_time:.0f} 秒内不优先使用')
+
+    def cost(self) -> float:
+        """
+        预计下载 1MB 的秒数, 越小越好; 没有测过的域名返回 None.
+        """
+        if self.latency is None and self.throughput is None:
+            return None
+        cost = self.latency or 0.0
+        if self.throughput:
+            cost += 1024 * 1024 / self.throughput
+        return cost
+
+
+class MirrorPool:
+    """
+    作品的视频、封面、头像都有多个 CDN 镜像地址. 记录每个域名的延迟和速度, 下载时按表现排序镜像;
+    有没测过的域名时先并发探测, 取最快响应的; 下载失败时换下一个镜像.
+    """
+
+    def __init__(self, race: int = None, ban_time: float = None):
+        """
+        :param race: 同时探测的镜像数, 默认 DY_MIRROR_RACE 或 3.
+        :param ban_time: 连续失败后不优先使用的时间(秒), 默认 DY_MIRROR_BAN_TIME 或 300.
+        """
+        self.race_size = race or int(os.getenv('DY_MIRROR_RACE', '3'))
+        self.ban_time = ban_time or float(os.getenv('DY_MIRROR_BAN_TIME', '300'))
+        self._hosts = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(8, thread_name_prefix='dy-mirror')
+
+    def host(self, url: str) -> Host:
+        name = urlparse(url).netloc
+        host = self._hosts.get(name)
+        if host is None:
+            with self._lock:
+                host = self._hosts.setdefault(name, Host(name, ban_time=self.ban_time))
+        return host
+
+    def order(self, urls: list) -> list:
+        """
+        按表现排序镜像: 可用且测过的域名按预计耗时排在前面, 没测过的保持原顺序排在后面, 被封禁的放最后.
+        """
+        now = time.monotonic()
+
+        def key(item):
+            index, url = item
+            host = self.host(url)
+            cost = host.cost()
+            return not host.available(now), cost is None, cost or 0.0, index
+
+        return [url for _, url in sorted(enumerate(dict.fromkeys(urls)), key=key)]
+
+    def race(self, urls: list, probe) -> list:
+        """
+        有没测过的域名时, 对排在前面的 race_size 个未封禁镜像并发发起探测请求, 最先成功的排到第一位.
+        没有返回的探测在后台继续, 结果同样记入域名统计.
+        :param probe: 探测函数, 传入 url, 出错时抛异常, 例如只取第一个字节的 Range 请求.
+        :return: 排好序的镜像列表.
+        """
+        ordered = self.order(urls)
+        now = time.monotonic()
+        candidates = [url for url in ordered if self.host(url).available(now)][:self.race_size]
+        if len(candidates) < 2 or all(self.host(url).cost() is not None for url in candidates):
+            return ordered
+
+        def timed(url):
+            start = time.monotonic()
+            try:
+                probe(url)
+            except Exception:
+                self.host(url).on_failure()
+                raise
+            self.host(url).on_success(latency=time.monotonic() - start)
+            return url
+
+        pending = {self._executor.submit(timed, url) for url in candidates}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    winner = future.result()
+                    return [winner] + [url for url in ordered if url != winner]
+        return self.order(urls)
+
+    def stats(self) -> dict:
+        """
+        :return: 每个域名的首字节延迟(秒)、速度(字节/秒)、成功和失败次数、剩余封禁秒数.
+        """
+        now = time.monotonic()
+        with self._lock:
+            hosts = list(self._hosts.values())
+        return {
+            h.host: {
+                'latency': None if h.latency is None else round(h.latency, 3),
+                'throughput': None if h.throughput is None else round(h.throughput, 1),
+                'success': h.success,
+                'failures': h.failures,
+                'banned': round(max(0.0, h.banned_until - now), 1),
+            }
+            for h in hosts
+        }
+
+
+def get_mirror_pool() -> MirrorPool:
+    global _default_pool
+    if _default_pool is None:
+        with _default_lock:
+            if _default_pool is None:
+                _default_pool = MirrorPool()
+    return _default_pool
+
+
+def mirror_stats() -> dict:
+    return get_mirror_pool().stats()
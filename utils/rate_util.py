@@ -0,0 +1,242 @@
+import os
+import json
+import time
+import asyncio
+import threading
+from urllib.parse import urlparse
+
+from loguru import logger
+
+_default_limiter = None
+_download_limiter = None
+_default_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    令牌桶, 每秒补充 rate 个令牌, 最多攒 burst 个. 线程安全.
+    """
+
+    def __init__(self, rate: float, burst: float = None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self.tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        预定一个令牌.
+        :return: 需要等待的秒数, 0 表示可以立即发送.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def set_rate(self, rate: float):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+
+class AimdController:
+    """
+    加性增、乘性减: 响应正常时速率加 increase, 被限流时速率乘 decrease, 两次减速之间至少间隔 cooldown 秒.
+    """
+
+    def __init__(self, bucket: TokenBucket, min_rate: float, max_rate: float, increase: float = 0.1,
+                 decrease: float = 0.5, cooldown: float = 2):
+        self.bucket = bucket
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.success = 0
+        self.throttled = 0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def on_success(self):
+        with self._lock:
+            self.success += 1
+            self.bucket.set_rate(min(self.max_rate, self.bucket.rate + self.increase))
+
+    def on_throttle(self) -> bool:
+        """
+        :return: 是否真的降低了速率.
+        """
+        with self._lock:
+            self.throttled += 1
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return False
+            self._last_decrease = now
+            self.bucket.set_rate(max(self.min_rate, self.bucket.rate * self.decrease))
+            return True
+
+
+class RateLimiter:
+    """
+    按接口和账号两级限速: 每个接口一个带 AIMD 调速的令牌桶, 每个账号一个固定速率的令牌桶,
+    请求需要同时拿到两个桶的令牌才发送.
+    """
+
+    def __init__(self, endpoint_rate: float = None, account_rate: float = None, min_rate: float = None,
+                 max_rate: float = None, burst: float = None):
+        """
+        :param endpoint_rate: 每个接口的初始速率(次/秒), 默认 DY_RATE_ENDPOINT 或 2.
+        :param account_rate: 每个账号的速率(次/秒), 默认 DY_RATE_ACCOUNT 或 5.
+        :param min_rate: 接口速率下限, 默认 DY_RATE_MIN 或 0.2.
+        :param max_rate: 接口速率上限, 默认 DY_RATE_MAX 或 10.
+        :param burst: 令牌桶容量, 默认 DY_RATE_BURST 或 3.
+        """
+        self.endpoint_rate = endpoint_rate or float(os.getenv('DY_RATE_ENDPOINT', '2'))
+        self.account_rate = account_rate or float(os.getenv('DY_RATE_ACCOUNT', '5'))
+        self.min_rate = min_rate or float(os.getenv('DY_RATE_MIN', '0.2'))
+        self.max_rate = max_rate or float(os.getenv('DY_RATE_MAX', '10'))
+        self.burst = burst or float(os.getenv('DY_RATE_BURST', '3'))
+        self._endpoints = {}
+        self._accounts = {}
+        self._lock = threading.Lock()
+
+    def _controller(self, endpoint: str) -> AimdController:
+        controller = self._endpoints.get(endpoint)
+        if controller is None:
+            with self._lock:
+                controller = self._endpoints.get(endpoint)
+                if controller is None:
+                    bucket = TokenBucket(self.endpoint_rate, self.burst)
+                    controller = self._endpoints[endpoint] = AimdController(bucket, self.min_rate, self.max_rate)
+        return controller
+
+    def _account(self, account) -> TokenBucket:
+        bucket = self._accounts.get(account)
+        if bucket is None:
+            with self._lock:
+                bucket = self._accounts.setdefault(account, TokenBucket(self.account_rate, self.burst))
+        return bucket
+
+    def reserve(self, endpoint: str, account=None) -> float:
+        delay = self._controller(endpoint).bucket.reserve()
+        if account is not None:
+            delay = max(delay, self._account(account).reserve())
+        return delay
+
+    def acquire(self, endpoint: str, account=None):
+        delay = self.reserve(endpoint, account)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, endpoint: str, account=None):
+        delay = self.reserve(endpoint, account)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def feedback(self, endpoint: str, ok: bool):
+        controller = self._controller(endpoint)
+        if ok:
+            controller.on_success()
+        elif controller.on_throttle():
+            logger.warning(f'{endpoint} 疑似被限流, 速率降至 {controller.bucket.rate:.2f} 次/秒')
+
+    def stats(self) -> dict:
+        """
+        :return: 每个接口当前速率(次/秒)、剩余令牌、正常和被限流的次数, 以及每个账号的速率.
+        """
+        with self._lock:
+            endpoints = dict(self._endpoints)
+            accounts = dict(self._accounts)
+        return {
+            'endpoints': {
+                endpoint: {'rate': round(c.bucket.rate, 3), 'tokens': round(c.bucket.tokens, 3),
+                           'success': c.success, 'throttled': c.throttled}
+                for endpoint, c in endpoints.items()
+            },
+            'accounts': {
+                str(account): {'rate': b.rate, 'tokens': round(b.tokens, 3)} for account, b in accounts.items()
+            },
+        }
+
+
+def get_rate_limiter() -> RateLimiter:
+    global _default_limiter
+    if _default_limiter is None:
+        with _default_lock:
+            if _default_limiter is None:
+                _default_limiter = RateLimiter()
+    return _default_limiter
+
+
+def get_download_limiter() -> RateLimiter:
+    """
+    媒体下载按 CDN 域名限速, 和接口限速分开: 分段下载、镜像探测每个文件要发多个请求, 默认速率高得多.
+    初始速率 DY_DOWNLOAD_RATE 或 50 次/秒, 上限 DY_DOWNLOAD_RATE_MAX 或 200, 令牌桶容量 DY_DOWNLOAD_BURST 或 20.
+    """
+    global _download_limiter
+    if _download_limiter is None:
+        with _default_lock:
+            if _download_limiter is None:
+                _download_limiter = RateLimiter(endpoint_rate=float(os.getenv('DY_DOWNLOAD_RATE', '50')),
+                                                min_rate=1.0,
+                                                max_rate=float(os.getenv('DY_DOWNLOAD_RATE_MAX', '200')),
+                                                burst=float(os.getenv('DY_DOWNLOAD_BURST', '20')))
+    return _download_limiter
+
+
+def rate_stats() -> dict:
+    return get_rate_limiter().stats()
+
+
+def endpoint_key(url: str) -> str:
+    parsed = urlparse(url)
+    return parsed.netloc + parsed.path
+
+
+def expects_json(url: str) -> bool:
+    return urlparse(url).path.startswith(('/aweme/', '/ecom/', '/live/'))
+
+
+def account_key(auth):
+    if auth is None or not getattr(auth, 'cookie', None):
+        return None
+    return auth.cookie.get('sessionid') or auth.cookie.get('ttwid') or id(auth)
+
+
+RESPONSE_OK = 'ok'
+RESPONSE_ERROR = 'error'
+RESPONSE_VERIFY = 'verify'
+# 触发验证码时响应里带的头
+VERIFY_HEADERS = {'bdturing-verify', 'x-vc-bdturing-parameters'}
+
+
+def classify_response(status_code: int, headers, content: bytes, expect_json: bool) -> str:
+    """
+    给响应分类: 出现验证码为 RESPONSE_VERIFY, 状态码出错、空响应、接口返回非 JSON 为 RESPONSE_ERROR, 其余为 RESPONSE_OK.
+    """
+    if any(key.lower() in VERIFY_HEADERS for key in headers.keys()):
+        return RESPONSE_VERIFY
+    if status_code in (403, 429) or status_code >= 500:
+        return RESPONSE_ERROR
+    if not content:
+        return RESPONSE_ERROR
+    if expect_json:
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return RESPONSE_ERROR
+        if isinstance(data, dict) and 'verify_check' in data:
+            return RESPONSE_VERIFY
+    return RESPONSE_OK
+
+
+def is_clean_response(status_code: int, headers, content: bytes, expect_json: bool) -> bool:
+    """
+    判断响应是否正常: 状态码出错、空响应、出现验证码、接口返回非 JSON 都视为被限流.
+    """
+    return classify_response(status_code, headers, content, expect_json) == RESPONSE_OK
@@ -0,0 +1,307 @@
+import os
+import json
+import time
+import asyncio
+import itertools
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import partial
+from os import path
+
+from loguru import logger
+
+worker_script = path.join(path.dirname(path.dirname(path.abspath(__file__))), 'static', 'sign_worker.js')
+
+
+class SignWorkerError(Exception):
+    pass
+
+
+class SignWorkerExited(SignWorkerError):
+    pass
+
+
+class SignWorker:
+    """
+    常驻的 node 签名进程, 签名脚本只加载一次, 之后的签名请求通过 stdin/stdout 传递.
+    进程退出或超时无响应时自动重启.
+    """
+
+    def __init__(self, bundle_path: str, methods: list, node: str = 'node', cwd: str = None,
+                 timeout: float = 10, start_timeout: float = 60, health_interval: float = 30):
+        """
+        :param bundle_path: 签名脚本路径.
+        :param methods: 需要暴露的函数名列表.
+        :param node: node 可执行文件.
+        :param cwd: 进程工作目录.
+        :param timeout: 单次签名超时时间(秒).
+        :param start_timeout: 进程启动并加载脚本的超时时间(秒).
+        :param health_interval: 健康检查间隔(秒), 0 表示不做后台检查.
+        """
+        self.bundle_path = bundle_path
+        self.methods = list(methods)
+        self.node = node
+        self.cwd = cwd
+        self.timeout = timeout
+        self.start_timeout = start_timeout
+        self.health_interval = health_interval
+        self.restart_count = 0
+        self._proc = None
+        self._pending = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._monitor = None
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self):
+        with self._lock:
+            if not self.alive:
+                self._spawn()
+        if self.health_interval and self._monitor is None:
+            self._monitor = threading.Thread(target=self._health_loop, daemon=True)
+            self._monitor.start()
+        return self
+
+    def _spawn(self):
+        if self._proc is not None:
+            self.restart_count += 1
+            logger.warning(f'签名进程重启 {path.basename(self.bundle_path)}, 第 {self.restart_count} 次')
+            self._kill()
+        proc = subprocess.Popen(
+            [self.node, worker_script, self.bundle_path, ','.join(self.methods)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=self.cwd,
+            encoding='utf-8', bufsize=1,
+        )
+        ready = Future()
+        with self._write_lock:
+            self._pending = {0: ready}
+            self._proc = proc
+        threading.Thread(target=self._read_loop, args=(proc, self._pending), daemon=True).start()
+        try:
+            ready.result(self.start_timeout)
+        except Exception as e:
+            self._kill()
+            raise SignWorkerError(f'签名进程启动失败: {e}')
+
+    def _read_loop(self, proc, pending):
+        for line in proc.stdout:
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                continue
+            future = pending.pop(msg.get('id'), None)
+            if future is None:
+                continue
+            if 'error' in msg:
+                future.set_exception(SignWorkerError(msg['error']))
+            else:
+                future.set_result(msg.get('result'))
+        # 进程已退出, 未完成的请求全部失败
+        for future in list(pending.values()):
+            if not future.done():
+                future.set_exception(SignWorkerExited('签名进程已退出'))
+        pending.clear()
+
+    def _kill(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(5)
+        except Exception:
+            pass
+
+    def submit(self, method: str, *args) -> Future:
+        if self._closed:
+            raise SignWorkerError('签名进程已关闭')
+        if not self.alive:
+            self.start()
+        request_id = next(self._ids)
+        future = Future()
+        with self._write_lock:
+            proc, pending = self._proc, self._pending
+            future.proc = proc
+            pending[request_id] = future
+            try:
+                proc.stdin.write(json.dumps({'id': request_id, 'method': method, 'args': args}) + '\n')
+                proc.stdin.flush()
+            except (OSError, ValueError, AttributeError) as e:
+                pending.pop(request_id, None)
+                future.set_exception(SignWorkerExited(f'签名进程写入失败: {e}'))
+        return future
+
+    def call(self, method: str, *args, timeout: float = None):
+        """
+        调用签名函数, 进程异常时重启后重试一次.
+        """
+        for attempt in range(2):
+            future = self.submit(method, *args)
+            try:
+                return future.result(timeout or self.timeout)
+            except FutureTimeoutError:
+                logger.warning(f'签名超时 {method}')
+                self.restart(future.proc)
+                if attempt:
+                    raise SignWorkerError(f'签名超时: {method}')
+            except SignWorkerExited:
+                if attempt:
+                    raise
+                self.restart(future.proc)
+
+    def ping(self, timeout: float = 5) -> bool:
+        if not self.alive:
+            return False
+        try:
+            return self.submit('ping').result(timeout) == 'pong'
+        except Exception:
+            return False
+
+    def restart(self, proc=None):
+        """
+        重启进程. 传入 proc 时只有它仍是当前进程才重启, 避免多个线程重复重启.
+        """
+        with self._lock:
+            if self._closed or (proc is not None and proc is not self._proc):
+                return
+            self._spawn()
+
+    def _health_loop(self):
+        event = threading.Event()
+        while not self._closed:
+            event.wait(self.health_interval)
+            if self._closed or self._proc is None:
+                continue
+            proc = self._proc
+            if not self.ping():
+                try:
+                    self.restart(proc)
+                except SignWorkerError as e:
+                    logger.error(str(e))
+
+    def close(self):
+        self._closed = True
+        with self._lock:
+            self._kill()
+
+
+class SignWorkerPool:
+    """
+    多个签名进程组成的进程池, 每次分配给在途请求最少的进程, 并限制单个进程的在途请求数.
+    线程安全, 也可以在 asyncio 中通过 acall 使用.
+    """
+
+    def __init__(self, bundle_path: str, methods: list, size: int = None, max_inflight: int = 2,
+                 latency_window: int = 1000, **worker_kwargs):
+        """
+        :param bundle_path: 签名脚本路径.
+        :param methods: 需要暴露的函数名列表.
+        :param size: 进程数, 默认为 CPU 核数.
+        :param max_inflight: 单个进程最多同时处理的请求数.
+        :param latency_window: 统计延迟时保留的最近请求数.
+        :param worker_kwargs: 传给 SignWorker 的其他参数.
+        """
+        self.size = max(1, size or os.cpu_count() or 1)
+        self.max_inflight = max(1, max_inflight)
+        self.workers = [SignWorker(bundle_path, methods, **worker_kwargs) for _ in range(self.size)]
+        self._inflight = [0] * self.size
+        self._calls = [0] * self.size
+        self._errors = [0] * self.size
+        self._latency = [deque(maxlen=latency_window) for _ in range(self.size)]
+        self._waiting = 0
+        self._cond = threading.Condition()
+        self._executor = None
+
+    def _acquire(self, timeout: float = None) -> int:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._waiting += 1
+            try:
+                while True:
+                    # 在途最少的进程, 相同时取序号小的, 空闲时只会用到第一个进程
+                    index = min(range(self.size), key=self._inflight.__getitem__)
+                    if self._inflight[index] < self.max_inflight:
+                        self._inflight[index] += 1
+                        return index
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise SignWorkerError('签名进程池繁忙')
+                    self._cond.wait(remaining)
+            finally:
+                self._waiting -= 1
+
+    def _release(self, index: int, latency: float, ok: bool):
+        with self._cond:
+            self._inflight[index] -= 1
+            self._calls[index] += 1
+            if ok:
+                self._latency[index].append(latency)
+            else:
+                self._errors[index] += 1
+            self._cond.notify()
+
+    def call(self, method: str, *args, timeout: float = None):
+        """
+        :param timeout: 排队等待进程和等待签名结果各自的超时(秒), 不传时排队不限时, 签名用进程的默认超时.
+        """
+        index = self._acquire(timeout)
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = self.workers[index].call(method, *args, timeout=timeout)
+            ok = True
+            return result
+        finally:
+            self._release(index, time.perf_counter() - start, ok)
+
+    async def acall(self, method: str, *args):
+        """
+        asyncio 版本, 排队和签名都在池自己的线程里进行, 不阻塞事件循环.
+        """
+        if self._executor is None:
+            with self._cond:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.size * self.max_inflight,
+                                                        thread_name_prefix='sign')
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(self.call, method, *args))
+
+    def stats(self) -> dict:
+        """
+        :return: 等待中的请求数, 以及每个进程的在途请求数, p50/p99 延迟(毫秒), 重启次数.
+        """
+        with self._cond:
+            workers = []
+            for index, worker in enumerate(self.workers):
+                latency = sorted(self._latency[index])
+                workers.append({
+                    'index': index,
+                    'alive': worker.alive,
+                    'inflight': self._inflight[index],
+                    'calls': self._calls[index],
+                    'errors': self._errors[index],
+                    'p50_ms': _percentile(latency, 0.5) * 1000,
+                    'p99_ms': _percentile(latency, 0.99) * 1000,
+                    'restarts': worker.restart_count,
+                })
+            return {'size': self.size, 'max_inflight': self.max_inflight, 'waiting': self._waiting,
+                    'workers': workers}
+
+    def close(self):
+        for worker in self.workers:
+            worker.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
@@ -0,0 +1,138 @@
+import os
+import shutil
+import sqlite3
+import hashlib
+import threading
+from urllib.parse import urlparse, parse_qsl, urlencode
+
+_default_store = None
+_default_loaded = False
+_default_lock = threading.Lock()
+# 链接里标识文件本身的参数, 其余参数(签名、过期时间、线路等)每次请求都可能变化
+STABLE_PARAMS = ('video_id', 'file_id')
+
+
+def media_key(url: str, uri: str = None) -> str:
+    """
+    媒体文件在存储里的键: 优先用接口返回的 uri(同一个文件在不同镜像、不同签名的链接下都一样),
+    没有时用去掉域名和签名参数的链接, 只保留 STABLE_PARAMS.
+    """
+    if uri:
+        return f'uri:{uri}'
+    parsed = urlparse(url)
+    query = urlencode(sorted((k, v) for k, v in parse_qsl(parsed.query) if k in STABLE_PARAMS))
+    return f'url:{parsed.path}?{query}' if query else f'url:{parsed.path}'
+
+
+class MediaStore:
+    """
+    按内容寻址的媒体存储: 文件按 sha256 保存在 blobs/ 下, index.db 记录 媒体键 -> 摘要.
+    作品目录里的文件是指向 blob 的硬链接, 不能硬链接时(例如跨磁盘)退回复制.
+    已经存过的媒体键直接链接不再下载; 不同链接下载到相同内容时只保存一份.
+    """
+
+    def __init__(self, root: str):
+        """
+        :param root: 存储目录, 和作品目录在同一个磁盘上时才能用硬链接节省空间.
+        """
+        self.root = root
+        self.blob_dir = os.path.join(root, 'blobs')
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, size INTEGER NOT NULL, '
+                         'ext TEXT NOT NULL)')
+            conn.execute('CREATE TABLE IF NOT EXISTS keys (key TEXT PRIMARY KEY, digest TEXT NOT NULL)')
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(os.path.join(self.root, 'index.db'), timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def blob_path(self, digest: str, ext: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], digest[2:4], digest + ext)
+
+    def lookup(self, key: str):
+        """
+        :return: 媒体键对应的 blob 路径, 没有存过或文件已经不在时返回 None.
+        """
+        row = self._connect().execute('SELECT b.digest, b.ext FROM keys k JOIN blobs b ON b.digest = k.digest '
+                                      'WHERE k.key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        path = self.blob_path(*row)
+        return path if os.path.exists(path) else None
+
+    @staticmethod
+    def _digest(file_path: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(file_path, mode='rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(block)
+        return sha256.hexdigest()
+
+    def put(self, file_path: str, key: str) -> str:
+        """
+        把下载好的文件收进存储, 原位置换成指向 blob 的链接.
+        :param file_path: 下载好的文件.
+        :param key: 媒体键, 见 media_key.
+        :return: blob 路径.
+        """
+        digest = self._digest(file_path)
+        ext = os.path.splitext(file_path)[1]
+        size = os.path.getsize(file_path)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute('SELECT ext FROM blobs WHERE digest = ?', (digest,)).fetchone()
+            blob = self.blob_path(digest, row[0] if row else ext)
+            if os.path.exists(blob):
+                # 内容已经存过, 丢掉这一份
+                os.remove(file_path)
+            else:
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                os.replace(file_path, blob)
+            with conn:
+                conn.execute('INSERT OR REPLACE INTO blobs (digest, size, ext) VALUES (?, ?, ?)',
+                             (digest, size, os.path.splitext(blob)[1]))
+                conn.execute('INSERT OR REPLACE INTO keys (key, digest) VALUES (?, ?)', (key, digest))
+        self.link(blob, file_path)
+        return blob
+
+    @staticmethod
+    def link(blob: str, file_path: str):
+        """
+        在作品目录里放一个指向 blob 的文件.
+        """
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        try:
+            os.link(blob, file_path)
+        except OSError:
+            shutil.copyfile(blob, file_path)
+
+    def stats(self) -> dict:
+        """
+        :return: blob 数、blob 总字节数和媒体键数.
+        """
+        conn = self._connect()
+        blobs, size = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs').fetchone()
+        return {'blobs': blobs, 'bytes': size, 'keys': conn.execute('SELECT COUNT(*) FROM keys').fetchone()[0]}
+
+
+def get_media_store():
+    """
+    进程内共用的媒体存储, 目录默认 datas/media_store, 可用 DY_MEDIA_STORE_PATH 指定; DY_MEDIA_STORE=0 时返回 None, 不做去重.
+    """
+    global _default_store, _default_loaded
+    if not _default_loaded:
+        with _default_lock:
+            if not _default_loaded:
+                if os.getenv('DY_MEDIA_STORE', '1') != '0':
+                    root = os.getenv('DY_MEDIA_STORE_PATH') or os.path.abspath(
+                        os.path.join(os.path.dirname(__file__), '../datas/media_store'))
+                    _default_store = MediaStore(root)
+                _default_loaded = True
+    return _default_store
@@ -0,0 +1,85 @@
+import os
+import time
+import sqlite3
+import threading
+
+_default_state = None
+_default_lock = threading.Lock()
+
+
+class SyncState:
+    """
+    增量同步的本地状态: 每个用户(sec_uid)已经见过的作品 ID 和发布时间, 以及最后一次同步的时间. 线程安全, 每个线程一个连接.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: SQLite 文件路径.
+        """
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS works (sec_uid TEXT NOT NULL, aweme_id TEXT NOT NULL, '
+                         'create_time INTEGER NOT NULL, PRIMARY KEY (sec_uid, aweme_id))')
+            conn.execute('CREATE TABLE IF NOT EXISTS users (sec_uid TEXT PRIMARY KEY, '
+                         'last_create_time INTEGER, synced_at REAL NOT NULL)')
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def seen(self, sec_uid: str) -> set:
+        """
+        :return: 该用户已经见过的作品 ID.
+        """
+        rows = self._connect().execute('SELECT aweme_id FROM works WHERE sec_uid = ?', (sec_uid,))
+        return {row[0] for row in rows}
+
+    def last_create_time(self, sec_uid: str):
+        """
+        :return: 该用户见过的最新作品的发布时间戳(秒), 没有同步过时返回 None.
+        """
+        row = self._connect().execute('SELECT last_create_time FROM users WHERE sec_uid = ?', (sec_uid,)).fetchone()
+        return None if row is None else row[0]
+
+    def synced_at(self, sec_uid: str):
+        row = self._connect().execute('SELECT synced_at FROM users WHERE sec_uid = ?', (sec_uid,)).fetchone()
+        return None if row is None else row[0]
+
+    def record(self, sec_uid: str, works: list):
+        """
+        记录一次同步取到的作品.
+        :param works: 作品信息列表, 需要有 aweme_id 和 create_time.
+        """
+        with self._connect() as conn:
+            conn.executemany('INSERT OR REPLACE INTO works (sec_uid, aweme_id, create_time) VALUES (?, ?, ?)',
+                             [(sec_uid, str(w['aweme_id']), int(w.get('create_time') or 0)) for w in works])
+            latest = conn.execute('SELECT MAX(create_time) FROM works WHERE sec_uid = ?', (sec_uid,)).fetchone()[0]
+            conn.execute('INSERT OR REPLACE INTO users (sec_uid, last_create_time, synced_at) VALUES (?, ?, ?)',
+                         (sec_uid, latest, time.time()))
+
+    def forget(self, sec_uid: str):
+        """
+        删除该用户的同步状态, 下次同步时重新取全部作品.
+        """
+        with self._connect() as conn:
+            conn.execute('DELETE FROM works WHERE sec_uid = ?', (sec_uid,))
+            conn.execute('DELETE FROM users WHERE sec_uid = ?', (sec_uid,))
+
+
+def get_sync_state() -> SyncState:
+    """
+    进程内共用的同步状态, 文件默认在 datas/sync_state.db, 可用 DY_SYNC_STATE_PATH 指定.
+    """
+    global _default_state
+    if _default_state is None:
+        with _default_lock:
+            if _default_state is None:
+                path = os.getenv('DY_SYNC_STATE_PATH') or os.path.abspath(
+                    os.path.join(os.path.dirname(__file__), '../datas/sync_state.db'))
+                _default_state = SyncState(path)
+    return _default_state